@@ -14,7 +14,9 @@ import rabbitmark.gui.main_window
 
 def main():
     if len(sys.argv) > 1:
-        print(rabbitmark.cli.call())
+        result = rabbitmark.cli.call()
+        if result:
+            print(result)
     else:
         rabbitmark.gui.main_window.start()
 
@@ -3,6 +3,7 @@ parse.py - parse command-line options
 """
 
 import argparse
+import sys
 from typing import Optional, Sequence
 import webbrowser
 
@@ -10,24 +11,31 @@ import webbrowser
 import pyperclip
 from tabulate import tabulate
 
-from rabbitmark.definitions import SearchMode
+from rabbitmark.definitions import MatchMode, SearchMode
+from rabbitmark.librm import backup
 from rabbitmark.librm import bookmark
 from rabbitmark.librm import database
+from rabbitmark.librm import dedupe
+from rabbitmark.librm import interchange
+from rabbitmark.librm import search
 
 
 def find_handler(session, args: argparse.Namespace) -> str:
-    if args.filter:
-        filter_text = '%' + args.filter + '%'
-    else:
-        filter_text = '%'
-
+    filter_text = args.filter or ""
     tags = args.tag or []
     mode = SearchMode.And if getattr(args, 'and') else SearchMode.Or
-
-    marks = bookmark.find_bookmarks(session, filter_text, tags, True, mode)
-    result_rows = sorted(
-        ((i.id, i.name, ', '.join(str(j) for j in i.tags)) for i in marks),
-        key=lambda i: i[1])  # type: ignore[arg-type, return-value]
+    match_mode = MatchMode.Substring if args.substring else MatchMode.FullText
+
+    params = search.SearchParams(filter_text, tuple(tags), True, mode, match_mode)
+    if args.ranked and search.can_rank(session, params):
+        marks, _ = search.fetch_page(session, params, search.PageOrder(search.RANK),
+                                     limit=args.limit)
+    elif args.limit is not None:
+        marks, _ = search.fetch_page(session, params, search.PageOrder('name'),
+                                     limit=args.limit)
+    else:
+        marks = sorted(params.find(session), key=lambda i: i.name)
+    result_rows = [(i.id, i.name, ', '.join(str(j) for j in i.tags)) for i in marks]
     headers = ["ID", "Name", "Tags"]
     return tabulate(result_rows, headers)
 
@@ -59,6 +67,64 @@ def copy_handler(session, args: argparse.Namespace) -> None:
     _act_on_id(session, args.id, on_mark)
 
 
+def export_handler(session, args: argparse.Namespace) -> str:
+    "Export all bookmarks as CSV, to a file or standard output."
+    if args.file == '-':
+        interchange.write_bookmarks_csv(session, sys.stdout)
+        return ""
+    count = interchange.export_bookmarks_to_csv(session, args.file)
+    return f"Exported {_plural(count, 'bookmark')} to {args.file}."
+
+
+def _plural(count: int, noun: str) -> str:
+    return f"{count} {noun}{'' if count == 1 else 's'}"
+
+
+def backup_handler(session, args: argparse.Namespace) -> str:
+    "Save a snapshot of every bookmark and tag."
+    counts = backup.save(session, args.file)
+    return (f"Saved {_plural(counts[backup.BOOKMARKS], 'bookmark')} and "
+            f"{_plural(counts[backup.TAGS], 'tag')} to {args.file}.")
+
+
+def restore_handler(session, args: argparse.Namespace) -> str:
+    "Replace every bookmark and tag with those in a snapshot."
+    if not args.replace and bookmark.any_bookmarks(session):
+        return ("The database already has bookmarks, which restoring would replace. "
+                "Use --replace if that's what you want.")
+    try:
+        counts = backup.restore(session, args.file)
+    except backup.SnapshotError as e:
+        return f"Could not restore {args.file}: {e}"
+    return (f"Restored {_plural(counts[backup.BOOKMARKS], 'bookmark')} and "
+            f"{_plural(counts[backup.TAGS], 'tag')} from {args.file}.")
+
+
+def dupes_handler(session, args: argparse.Namespace) -> str:
+    "List groups of bookmarks that are probably of the same page."
+    groups = list(dedupe.find_duplicates(session, args.threshold))
+    sections = []
+    merged = 0
+    for group in groups:
+        marks = [bookmark.get_bookmark_by_id(session, i) for i in group.ids]
+        heading = ("Same URL:" if group.exact
+                   else f"Similar ({group.similarity:.0%}):")
+        rows = [(i.id, i.name, i.url) for i in marks]
+        if args.merge_exact and group.exact:
+            dedupe.merge_duplicates(session, marks[0], marks[1:])
+            merged += len(marks) - 1
+            heading = f"Same URL, merged into {marks[0].id}:"
+        sections.append(f"{heading}\n{tabulate(rows, ['ID', 'Name', 'URL'])}")
+    if merged:
+        session.commit()
+
+    summary = f"Found {_plural(len(groups), 'group')} of duplicates."
+    if args.merge_exact:
+        summary += (f" Merged {_plural(merged, 'bookmark')} into others "
+                    f"with the same URL.")
+    return '\n\n'.join(sections + [summary])
+
+
 def get_parser() -> argparse.ArgumentParser:
     "Create the command-line parser."
     parser = argparse.ArgumentParser(
@@ -68,12 +134,25 @@ def get_parser() -> argparse.ArgumentParser:
 
     find = subparsers.add_parser('find', help="List bookmarks matching a search query")
     find.add_argument('-f', '--filter', type=str,
-                      help="Filter string (like the box at the top of the GUI).")
+                      help="Filter string (like the box at the top of the GUI). "
+                           "Each word matches the beginning of a word, "
+                           "so 'book' doesn't find 'notebook'.")
     find.add_argument('-t', '--tag', type=str, action="append",
                       help="Include bookmarks with the specified tag. "
                            "Can be used multiple times.")
     find.add_argument('-a', '--and', action='store_true',
                       help="Rather than ORing together tags, AND them together.")
+    find.add_argument('-s', '--substring', action='store_true',
+                      help="Match the filter string as a substring of the name, "
+                           "URL, or description, rather than as the beginnings "
+                           "of words. Slower, but finds fragments in the middle "
+                           "of words.")
+    find.add_argument('-r', '--ranked', action='store_true',
+                      help="List the best matches for the filter string first, "
+                           "rather than sorting by name. Names count the most, "
+                           "then URLs, then descriptions.")
+    find.add_argument('-n', '--limit', type=int, metavar='N',
+                      help="List only the first N bookmarks found.")
     find.set_defaults(func=find_handler)
 
     go = subparsers.add_parser('go', help="Browse to bookmark with a given ID")
@@ -85,6 +164,39 @@ def get_parser() -> argparse.ArgumentParser:
     copy.add_argument('id', type=int)
     copy.set_defaults(func=copy_handler)
 
+    export = subparsers.add_parser('export', help="Export all bookmarks to a CSV file")
+    export.add_argument('file', type=str,
+                        help="File to write (overwriting it if it exists), "
+                             "or - for standard output.")
+    export.set_defaults(func=export_handler)
+
+    backup_ = subparsers.add_parser(
+        'backup', help="Save a snapshot of all bookmarks and tags, for restoring later")
+    backup_.add_argument('file', type=str,
+                         help="File to write (overwriting it if it exists).")
+    backup_.set_defaults(func=backup_handler)
+
+    restore = subparsers.add_parser(
+        'restore', help="Replace all bookmarks and tags with those in a snapshot")
+    restore.add_argument('file', type=str,
+                         help="Snapshot written by 'rabbitmark backup'.")
+    restore.add_argument('--replace', action='store_true',
+                         help="Restore even if the database already has bookmarks, "
+                              "deleting them.")
+    restore.set_defaults(func=restore_handler)
+
+    dupes = subparsers.add_parser(
+        'dupes', help="List bookmarks that are probably of the same page")
+    dupes.add_argument('-t', '--threshold', type=float, metavar='T',
+                       default=dedupe.SIMILARITY_THRESHOLD,
+                       help="How alike the names and URLs, or descriptions, of two "
+                            "bookmarks must be for them to be listed, from 0 to 1 "
+                            f"(default {dedupe.SIMILARITY_THRESHOLD}).")
+    dupes.add_argument('--merge-exact', action='store_true',
+                       help="Merge each group of bookmarks with the same URL into "
+                            "the oldest of them, which gets all of their tags.")
+    dupes.set_defaults(func=dupes_handler)
+
     return parser
 
 
@@ -13,3 +13,9 @@ class SearchMode(Enum):
     "When doing a tag search with multiple tags selected, how are they combined?"
     Or = 0
     And = 1
+
+@unique
+class MatchMode(Enum):
+    "How is the text in the filter box matched against bookmarks?"
+    FullText = 0   #: words anywhere in name/URL/description, using the full-text index
+    Substring = 1  #: exact substring of name, URL, or description
@@ -2,18 +2,30 @@
 bookmark_table - model for a table showing all (or filtered) bookmarks
 """
 
+from difflib import SequenceMatcher
 from enum import Enum, unique
-from typing import Any, Callable, Optional, List
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, List, Set, Tuple
 
 # pylint: disable=no-name-in-module
-from PyQt5.QtCore import Qt, QAbstractTableModel, pyqtSignal
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
 
+from rabbitmark.librm import search
 from rabbitmark.librm.bookmark import Bookmark
 
 class BookmarkTableModel(QAbstractTableModel):
-    "Handles the display of the main table of bookmarks."
-    dataChanged = pyqtSignal()
+    """
+    Handles the display of the main table of bookmarks.
 
+    The model works in one of two modes. Normally, it holds every bookmark
+    matching the current search, set with updateContents(), and sorts them
+    itself. A search matching too many bookmarks to load at once is instead
+    set with updatePaged(), after which the model holds only the bookmarks
+    fetched so far, fetches more from the database as the view scrolls down
+    (Qt's canFetchMore()/fetchMore()), and sorts by asking the database to
+    start over in the new order. Paged results may also be ranked by relevance
+    rather than sorted by a column, until the user sorts them.
+    """
     @unique
     class ModelColumn(Enum):
         """
@@ -53,9 +65,21 @@ class BookmarkTableModel(QAbstractTableModel):
         self._parent = parent
         self.headerdata = ("Name", "Tags")
         self.L: List[Bookmark] = []  # pylint: disable=invalid-name
+        self._rows: Dict[int, int] = {}  # primary key -> row in self.L
+        # What the view has been shown, by (primary key, column), so that
+        # updates can tell it which rows it needs to redraw.
+        self._shown: Dict[Tuple[int, int], Any] = {}
         self._sort_col = 0
         self._sort_order = Qt.AscendingOrder
 
+        # Paged mode only: where to get more bookmarks, how many there are
+        # in all, and where the last page fetched ended.
+        self._paging: Optional[Tuple[Any, search.SearchParams]] = None
+        self._total = 0
+        self._after: Optional[search.Position] = None
+        self._pinned: Set[int] = set()
+        self._ranked = False
+
     ### Standard reimplemented methods ###
     def rowCount(self, _parent: Any = None) -> int:
         return len(self.L)
@@ -83,35 +107,227 @@ class BookmarkTableModel(QAbstractTableModel):
 
         col = self.ModelColumn(index.column())
         mark = self.L[index.row()]
-        return col.data(mark)
+        value = col.data(mark)
+        self._shown[(mark.id, index.column())] = value
+        return value
 
     def sort(self, col, order=Qt.AscendingOrder):
         "Re-sort the model data by the given column and ordering."
+        if self._paging is not None:
+            if self._ranked or (col, order) != (self._sort_col, self._sort_order):
+                self._sort_col = col
+                self._sort_order = order
+                self._ranked = False
+                self._refetch()
+            return
+
         self._sort_col = col
         self._sort_order = order
         rev = order != Qt.AscendingOrder
         self.layoutAboutToBeChanged.emit()
         self.L.sort(key=self.ModelColumn(col).sort_function(), reverse=rev)
+        self._reindex()
         self.layoutChanged.emit()
 
+    def canFetchMore(self, parent) -> bool:
+        "In paged mode, return True if there are bookmarks left to fetch."
+        return (not parent.isValid()
+                and self._paging is not None
+                and self._after is not None)
+
+    def fetchMore(self, parent) -> None:
+        "In paged mode, fetch the next page of bookmarks from the database."
+        if not self.canFetchMore(parent):
+            return
+        assert self._paging is not None
+        session, params = self._paging
+        marks, after = search.fetch_page(session, params, self.pageOrder(), self._after)
+        if not marks:
+            self._after = None
+            return
+        if self._pinned:
+            marks = [i for i in marks if i.id not in self._pinned]
+        self._after = after
+        if not marks:
+            return
+        first = len(self.L)
+        self.beginInsertRows(QModelIndex(), first, first + len(marks) - 1)
+        self.L.extend(marks)
+        self._reindex(first)
+        self.endInsertRows()
+
 
     ### Custom methods ###
+    def _reindex(self, start: int = 0) -> None:
+        "Update the rows of the primary keys at row /start/ and below."
+        rows = self._rows
+        if start == 0:
+            rows.clear()
+        for row in range(start, len(self.L)):
+            rows[self.L[row].id] = row
+
+    @property
+    def pkRows(self) -> Mapping[int, int]:
+        "Read-only map from the primary keys of the bookmarks shown to their rows."
+        return MappingProxyType(self._rows)
+
     def indexFromPk(self, pk):
-        "Return the model index of a given primary key."
-        for row, obj in enumerate(self.L):
-            if obj.id == pk:
-                return self.index(row, 0)
-        return None
+        "Return the model index of a given primary key, or None if it isn't shown."
+        row = self._rows.get(pk)
+        return None if row is None else self.index(row, 0)
 
     def updateContents(self, marks) -> None:
         """
         Replace the current set of bookmarks held by the model with /marks/,
-        for instance when the filter is changed.
+        for instance when the filter is changed, sorted by the current sort
+        column. /marks/ itself is left as it is, as callers (the result cache,
+        for instance) may keep it.
+
+        Rather than resetting the model, the old and new lists are compared
+        and only the rows that were removed, inserted, or display something
+        different now are reported to the view, so the selection and scroll
+        position are kept and the work done is proportional to the change.
+        (Switching out of paged mode, or to a list with nothing in common
+        with the old one, still resets the model.)
         """
+        rev = self._sort_order != Qt.AscendingOrder
+        marks = sorted(marks, key=self.ModelColumn(self._sort_col).sort_function(),
+                       reverse=rev)
+
+        old_pks = [i.id for i in self.L]
+        new_pks = [i.id for i in marks]
+        if self._paging is not None or self._rows.keys().isdisjoint(new_pks):
+            self._reset(marks)
+            return
+
+        root = QModelIndex()
+        matcher = SequenceMatcher(None, old_pks, new_pks, autojunk=False)
+        # Work from the bottom up, so rows above each change keep their numbers.
+        for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+            if tag == 'equal':
+                # Same bookmarks, but possibly different objects for them.
+                self.L[i1:i2] = marks[j1:j2]
+                continue
+            if i2 > i1:
+                self.beginRemoveRows(root, i1, i2 - 1)
+                self._forget(old_pks[i1:i2])
+                del self.L[i1:i2]
+                self.endRemoveRows()
+            if j2 > j1:
+                self.beginInsertRows(root, i1, i1 + (j2 - j1) - 1)
+                self.L[i1:i1] = marks[j1:j2]
+                self.endInsertRows()
+        self._reindex()
+        self._total = len(self.L)
+        self._emitChanges()
+
+    def _reset(self, marks) -> None:
+        "Replace the contents with /marks/ (leaving paged mode) by resetting the model."
         self.beginResetModel()
         self.L = marks
+        self._reindex()
+        self._shown.clear()
+        self._paging = None
+        self._total = len(marks)
+        self._after = None
+        self._pinned = set()
+        self._ranked = False
+        self.endResetModel()
+
+    def _forget(self, pks) -> None:
+        "Drop what the view was shown for rows with primary keys /pks/."
+        for pk in pks:
+            for col in range(self.columnCount()):
+                self._shown.pop((pk, col), None)
+
+    def _emitChanges(self) -> None:
+        """
+        Emit dataChanged for the rows whose contents differ from what the
+        view was last shown. Only rows the view has asked about are checked.
+        """
+        changed = []
+        for (pk, col), shown in self._shown.items():
+            row = self._rows[pk]
+            if self.ModelColumn(col).data(self.L[row]) != shown:
+                changed.append(row)
+
+        last_col = self.columnCount() - 1
+        for row in sorted(set(changed)):
+            self.dataChanged.emit(self.index(row, 0), self.index(row, last_col))
+
+    def updatePaged(self, session, params: search.SearchParams,
+                    page: search.Page) -> None:
+        """
+        Switch to paged mode, showing the bookmarks matching /params/
+        starting with the first /page/ of them (see search.find_page()).
+        Further pages are fetched with /session/ as they're scrolled to.
+        A /page/ ranked by relevance keeps its order even if it's complete.
+        """
+        assert page.order is not None, "Page doesn't say what order it's in"
+        self.beginResetModel()
+        self.L = page.marks
+        self._reindex()
+        self._shown.clear()
+        self._paging = (session, params)
+        self._total = page.total
+        self._after = page.after
+        self._pinned = set()
+        self._ranked = page.order.key == search.RANK
+        if not self._ranked:
+            self._sort_col = self.ModelColumn[page.order.key.capitalize()].value
+            self._sort_order = (Qt.DescendingOrder if page.order.descending
+                                else Qt.AscendingOrder)
+        self.endResetModel()
+
+    def _refetch(self) -> None:
+        "In paged mode, start over from the first page in the current order."
+        assert self._paging is not None
+        session, params = self._paging
+        self.beginResetModel()
+        self.L, self._after = search.fetch_page(session, params, self.pageOrder())
+        self._reindex()
+        self._shown.clear()
+        self._pinned = set()
         self.endResetModel()
 
+    def isPaged(self) -> bool:
+        return self._paging is not None
+
+    def matchCount(self) -> int:
+        """
+        Return the number of bookmarks matching the search, including those
+        not fetched yet in paged mode.
+        """
+        return self._total
+
+    def isRanked(self) -> bool:
+        "Are the bookmarks shown ranked by relevance rather than sorted?"
+        return self._ranked
+
+    def columnOrder(self) -> search.PageOrder:
+        "Return the sort order of the current (or last) sort column."
+        return search.PageOrder(str(self.ModelColumn(self._sort_col)).lower(),
+                                self._sort_order != Qt.AscendingOrder)
+
+    def pageOrder(self) -> search.PageOrder:
+        "Return the current order, for fetching pages in."
+        return search.PageOrder(search.RANK) if self._ranked else self.columnOrder()
+
+    def pin(self, mark) -> None:
+        """
+        In paged mode, show /mark/, which matches the search but hasn't been
+        fetched yet (say, a bookmark that was just added), at the top of the
+        table, so it can be selected without fetching every page before it.
+        It's left out of later pages so it isn't shown twice.
+        """
+        if self._paging is None or mark.id in self._rows:
+            return
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self.L.insert(0, mark)
+        self._reindex()
+        self._pinned.add(mark.id)
+        self.endInsertRows()
+
     def nextAfterDelete(self, index):
         """
         Return the index of the item that should be selected after deleting the
@@ -135,9 +351,14 @@ class BookmarkTableModel(QAbstractTableModel):
         Update the model to show that the item at /index/ has been deleted
         from the database.
         """
-        self.beginResetModel()
-        del self.L[index.row()]
-        self.endResetModel()
+        row = index.row()
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._forget([self.L[row].id])
+        del self._rows[self.L[row].id]
+        del self.L[row]
+        self._reindex(row)
+        self._total -= 1
+        self.endRemoveRows()
 
     def getObj(self, index):
         "Return an object from the list by its model index."
@@ -0,0 +1,170 @@
+"""
+duplicates_dialog.py -- find bookmarks of the same page and merge them
+"""
+
+from typing import List, Optional
+
+# pylint: disable=no-name-in-module
+from PyQt5.QtWidgets import QDialog, QTreeWidgetItem
+from PyQt5.QtCore import pyqtSignal, Qt, QThread
+
+from rabbitmark.librm import bookmark
+from rabbitmark.librm import dedupe
+from rabbitmark.librm.dedupe import DuplicateGroup
+
+from .forms.duplicates import Ui_Dialog as Ui_DuplicatesDialog
+
+
+class DuplicateSearchThread(QThread):
+    """
+    Worker thread to look for duplicates, which means reading every bookmark.
+    """
+    progress_update = pyqtSignal(int, int)
+    group_found = pyqtSignal(object)
+
+    def __init__(self, sessionmaker) -> None:
+        super().__init__()
+        self.exception: Optional[Exception] = None
+        self.sessionmaker = sessionmaker
+
+    def run(self) -> None:
+        "Create a database session for this thread and search with it."
+        try:
+            session = self.sessionmaker()
+            for group in dedupe.find_duplicates(session,
+                                                progress=self.progress_update.emit,
+                                                canceled=self.isInterruptionRequested):
+                self.group_found.emit(group)
+            session.close()
+        except Exception as e:  # pylint: disable=broad-except
+            self.exception = e
+
+
+class DuplicatesDialog(QDialog):
+    """
+    Show the groups of duplicates found as they come in, and let the user
+    merge each group into one of its bookmarks or pass over it.
+    """
+    def __init__(self, parent, sessionmaker, session) -> None:
+        "Set up the dialog and start searching."
+        QDialog.__init__(self)
+        self.form = Ui_DuplicatesDialog()
+        self.form.setupUi(self)
+        self._parent = parent
+        self.session = session
+        self.merged = False
+        self.groupCount = 0
+
+        self.form.groupTree.setColumnWidth(0, 280)
+        self.form.groupTree.setColumnWidth(1, 300)
+        self.form.groupTree.itemSelectionChanged.connect(self.updateButtons)
+        self.form.mergeButton.clicked.connect(self.onMerge)
+        self.form.dismissButton.clicked.connect(self.onDismiss)
+        self.form.closeButton.clicked.connect(self.accept)
+        self.updateButtons()
+
+        self.dst = DuplicateSearchThread(sessionmaker)
+        self.dst.progress_update.connect(self.updateProgress)
+        self.dst.group_found.connect(self.addGroup)
+        self.dst.finished.connect(self.joinThread)
+        self.dst.start()
+
+    def accept(self):
+        "Stop the search if it's still going and close the dialog."
+        self.dst.requestInterruption()
+        self.dst.wait()
+        super().accept()
+
+    def reject(self):
+        "Redirect to standard accept() if Esc pressed or X button clicked."
+        return self.accept()
+
+    def updateProgress(self, at: int, tot: int) -> None:
+        "Update the progress bar as bookmarks are read."
+        self.form.progressBar.setValue(int(at * 100 / tot) if tot else 100)
+
+    def addGroup(self, group: DuplicateGroup) -> None:
+        "Add a group of duplicates to the tree, skipping bookmarks since deleted."
+        marks = [i for i in (bookmark.get_bookmark_by_id(self.session, j)
+                             for j in group.ids)
+                 if i is not None]
+        if len(marks) < 2:
+            return
+
+        heading = ("Same URL" if group.exact
+                   else f"Similar ({group.similarity:.0%})")
+        groupItem = QTreeWidgetItem([f"{heading}: {len(marks)} bookmarks"])
+        for mark in marks:
+            tags = ', '.join(i.text for i in mark.tags)
+            item = QTreeWidgetItem([mark.name, mark.url, tags])
+            item.setData(0, Qt.UserRole, mark.id)
+            item.setToolTip(1, mark.url)
+            groupItem.addChild(item)
+        self.form.groupTree.addTopLevelItem(groupItem)
+        groupItem.setFirstColumnSpanned(True)
+        groupItem.setExpanded(True)
+
+        self.groupCount += 1
+        if self.groupCount == 1:
+            self.form.groupTree.setCurrentItem(groupItem.child(0))
+
+    def joinThread(self) -> None:
+        """
+        Clean up when the worker thread terminates, raising any exception
+        that happened in it.
+        """
+        if self.dst.exception:
+            raise self.dst.exception
+        if self.dst.isInterruptionRequested():
+            return
+        self.form.progressBar.hide()
+        if self.groupCount:
+            self.form.statusLabel.setText(
+                f"Found {self.groupCount} group{'' if self.groupCount == 1 else 's'} "
+                f"of bookmarks that are probably of the same page. Select the one "
+                f"to keep from each group and merge the others into it.")
+        else:
+            self.form.statusLabel.setText("No duplicates found.")
+
+    def _selectedItems(self):
+        """
+        Return the selected item, or None if nothing is, and the item for the
+        group it's in (which may be the same item).
+        """
+        selected = self.form.groupTree.selectedItems()
+        if not selected:
+            return None, None
+        item = selected[0]
+        return item, item.parent() or item
+
+    def updateButtons(self) -> None:
+        "Only allow merging when a bookmark to merge into is selected."
+        item, groupItem = self._selectedItems()
+        self.form.mergeButton.setEnabled(item is not None and item is not groupItem)
+        self.form.dismissButton.setEnabled(item is not None)
+
+    def _removeGroup(self, groupItem: QTreeWidgetItem) -> None:
+        tree = self.form.groupTree
+        tree.takeTopLevelItem(tree.indexOfTopLevelItem(groupItem))
+        if tree.topLevelItemCount():
+            tree.setCurrentItem(tree.topLevelItem(0).child(0))
+
+    def onMerge(self) -> None:
+        "Merge the other bookmarks in the selected one's group into it."
+        item, groupItem = self._selectedItems()
+        keep = bookmark.get_bookmark_by_id(self.session, item.data(0, Qt.UserRole))
+        duplicates: List = []
+        for i in range(groupItem.childCount()):
+            mark = bookmark.get_bookmark_by_id(self.session,
+                                               groupItem.child(i).data(0, Qt.UserRole))
+            if mark is not None:
+                duplicates.append(mark)
+        dedupe.merge_duplicates(self.session, keep, duplicates)
+        self.session.commit()
+        self.merged = True
+        self._removeGroup(groupItem)
+
+    def onDismiss(self) -> None:
+        "Remove the selected group from the list (as it isn't really duplicates)."
+        _, groupItem = self._selectedItems()
+        self._removeGroup(groupItem)
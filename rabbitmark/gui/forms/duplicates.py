@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'designer/duplicates.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(760, 480)
+        self.verticalLayout = QtWidgets.QVBoxLayout(Dialog)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.statusLabel = QtWidgets.QLabel(Dialog)
+        self.statusLabel.setObjectName("statusLabel")
+        self.verticalLayout.addWidget(self.statusLabel)
+        self.progressBar = QtWidgets.QProgressBar(Dialog)
+        self.progressBar.setProperty("value", 0)
+        self.progressBar.setObjectName("progressBar")
+        self.verticalLayout.addWidget(self.progressBar)
+        self.groupTree = QtWidgets.QTreeWidget(Dialog)
+        self.groupTree.setAlternatingRowColors(True)
+        self.groupTree.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.groupTree.setUniformRowHeights(True)
+        self.groupTree.setObjectName("groupTree")
+        self.verticalLayout.addWidget(self.groupTree)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.mergeButton = QtWidgets.QPushButton(Dialog)
+        self.mergeButton.setObjectName("mergeButton")
+        self.horizontalLayout.addWidget(self.mergeButton)
+        self.dismissButton = QtWidgets.QPushButton(Dialog)
+        self.dismissButton.setObjectName("dismissButton")
+        self.horizontalLayout.addWidget(self.dismissButton)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem)
+        self.closeButton = QtWidgets.QPushButton(Dialog)
+        self.closeButton.setObjectName("closeButton")
+        self.horizontalLayout.addWidget(self.closeButton)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+
+        self.retranslateUi(Dialog)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+        Dialog.setTabOrder(self.groupTree, self.mergeButton)
+        Dialog.setTabOrder(self.mergeButton, self.dismissButton)
+        Dialog.setTabOrder(self.dismissButton, self.closeButton)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Find Duplicates"))
+        self.statusLabel.setText(_translate("Dialog", "RabbitMark is looking for bookmarks of the same page."))
+        self.groupTree.headerItem().setText(0, _translate("Dialog", "Name"))
+        self.groupTree.headerItem().setText(1, _translate("Dialog", "URL"))
+        self.groupTree.headerItem().setText(2, _translate("Dialog", "Tags"))
+        self.mergeButton.setToolTip(_translate("Dialog", "Delete the other bookmarks in this group, giving the selected one all of their tags"))
+        self.mergeButton.setText(_translate("Dialog", "&Merge into Selected"))
+        self.dismissButton.setToolTip(_translate("Dialog", "Remove this group from the list, leaving its bookmarks alone"))
+        self.dismissButton.setText(_translate("Dialog", "&Not Duplicates"))
+        self.closeButton.setText(_translate("Dialog", "&Close"))
@@ -0,0 +1,11243 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x02\xbb\x1c\
+\xff\
+\xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x01\x01\x2c\x01\
+\x2c\x00\x00\xff\xe1\x2f\x80\x45\x78\x69\x66\x00\x00\x49\x49\x2a\
+\x00\x08\x00\x00\x00\x07\x00\x0e\x01\x02\x00\x52\x00\x00\x00\x62\
+\x00\x00\x00\x1a\x01\x05\x00\x01\x00\x00\x00\xb4\x00\x00\x00\x1b\
+\x01\x05\x00\x01\x00\x00\x00\xbc\x00\x00\x00\x28\x01\x03\x00\x01\
+\x00\x00\x00\x02\x00\x00\x00\x31\x01\x02\x00\x0d\x00\x00\x00\xc4\
+\x00\x00\x00\x32\x01\x02\x00\x14\x00\x00\x00\xd2\x00\x00\x00\x69\
+\x87\x04\x00\x01\x00\x00\x00\xe6\x00\x00\x00\x5e\x01\x00\x00\x46\
+\x69\x6c\x65\x20\x73\x6f\x75\x72\x63\x65\x3a\x20\x68\x74\x74\x70\
+\x3a\x2f\x2f\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x77\x69\x6b\x69\x6d\
+\x65\x64\x69\x61\x2e\x6f\x72\x67\x2f\x77\x69\x6b\x69\x2f\x46\x69\
+\x6c\x65\x3a\x4a\x61\x63\x6b\x5f\x52\x61\x62\x62\x69\x74\x5f\x28\
+\x31\x34\x33\x39\x38\x36\x32\x39\x35\x30\x38\x29\x2e\x6a\x70\x67\
+\x00\x2c\x01\x00\x00\x01\x00\x00\x00\x2c\x01\x00\x00\x01\x00\x00\
+\x00\x47\x49\x4d\x50\x20\x32\x2e\x31\x30\x2e\x32\x30\x00\x00\x32\
+\x30\x32\x30\x3a\x30\x39\x3a\x31\x31\x20\x31\x39\x3a\x33\x37\x3a\
+\x30\x35\x00\x02\x00\x86\x92\x07\x00\x59\x00\x00\x00\x04\x01\x00\
+\x00\x01\xa0\x03\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x46\x69\x6c\x65\x20\x73\x6f\
+\x75\x72\x63\x65\x3a\x20\x68\x74\x74\x70\x3a\x2f\x2f\x63\x6f\x6d\
+\x6d\x6f\x6e\x73\x2e\x77\x69\x6b\x69\x6d\x65\x64\x69\x61\x2e\x6f\
+\x72\x67\x2f\x77\x69\x6b\x69\x2f\x46\x69\x6c\x65\x3a\x4a\x61\x63\
+\x6b\x5f\x52\x61\x62\x62\x69\x74\x5f\x28\x31\x34\x33\x39\x38\x36\
+\x32\x39\x35\x30\x38\x29\x2e\x6a\x70\x67\x00\x08\x00\x00\x01\x04\
+\x00\x01\x00\x00\x00\x99\x00\x00\x00\x01\x01\x04\x00\x01\x00\x00\
+\x00\x00\x01\x00\x00\x02\x01\x03\x00\x03\x00\x00\x00\xc4\x01\x00\
+\x00\x03\x01\x03\x00\x01\x00\x00\x00\x06\x00\x00\x00\x06\x01\x03\
+\x00\x01\x00\x00\x00\x06\x00\x00\x00\x15\x01\x03\x00\x01\x00\x00\
+\x00\x03\x00\x00\x00\x01\x02\x04\x00\x01\x00\x00\x00\xca\x01\x00\
+\x00\x02\x02\x04\x00\x01\x00\x00\x00\xad\x2d\x00\x00\x00\x00\x00\
+\x00\x08\x00\x08\x00\x08\x00\xff\xd8\xff\xe0\x00\x10\x4a\x46\x49\
+\x46\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00\xff\xdb\x00\x43\x00\
+\x08\x06\x06\x07\x06\x05\x08\x07\x07\x07\x09\x09\x08\x0a\x0c\x14\
+\x0d\x0c\x0b\x0b\x0c\x19\x12\x13\x0f\x14\x1d\x1a\x1f\x1e\x1d\x1a\
+\x1c\x1c\x20\x24\x2e\x27\x20\x22\x2c\x23\x1c\x1c\x28\x37\x29\x2c\
+\x30\x31\x34\x34\x34\x1f\x27\x39\x3d\x38\x32\x3c\x2e\x33\x34\x32\
+\xff\xdb\x00\x43\x01\x09\x09\x09\x0c\x0b\x0c\x18\x0d\x0d\x18\x32\
+\x21\x1c\x21\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\
+\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\
+\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\x32\
+\x32\x32\x32\x32\x32\xff\xc0\x00\x11\x08\x01\x00\x00\x99\x03\x01\
+\x22\x00\x02\x11\x01\x03\x11\x01\xff\xc4\x00\x1f\x00\x00\x01\x05\
+\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\
+\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\xff\xc4\x00\xb5\x10\x00\x02\
+\x01\x03\x03\x02\x04\x03\x05\x05\x04\x04\x00\x00\x01\x7d\x01\x02\
+\x03\x00\x04\x11\x05\x12\x21\x31\x41\x06\x13\x51\x61\x07\x22\x71\
+\x14\x32\x81\x91\xa1\x08\x23\x42\xb1\xc1\x15\x52\xd1\xf0\x24\x33\
+\x62\x72\x82\x09\x0a\x16\x17\x18\x19\x1a\x25\x26\x27\x28\x29\x2a\
+\x34\x35\x36\x37\x38\x39\x3a\x43\x44\x45\x46\x47\x48\x49\x4a\x53\
+\x54\x55\x56\x57\x58\x59\x5a\x63\x64\x65\x66\x67\x68\x69\x6a\x73\
+\x74\x75\x76\x77\x78\x79\x7a\x83\x84\x85\x86\x87\x88\x89\x8a\x92\
+\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\
+\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\
+\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\
+\xe5\xe6\xe7\xe8\xe9\xea\xf1\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\
+\xff\xc4\x00\x1f\x01\x00\x03\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\
+\x0b\xff\xc4\x00\xb5\x11\x00\x02\x01\x02\x04\x04\x03\x04\x07\x05\
+\x04\x04\x00\x01\x02\x77\x00\x01\x02\x03\x11\x04\x05\x21\x31\x06\
+\x12\x41\x51\x07\x61\x71\x13\x22\x32\x81\x08\x14\x42\x91\xa1\xb1\
+\xc1\x09\x23\x33\x52\xf0\x15\x62\x72\xd1\x0a\x16\x24\x34\xe1\x25\
+\xf1\x17\x18\x19\x1a\x26\x27\x28\x29\x2a\x35\x36\x37\x38\x39\x3a\
+\x43\x44\x45\x46\x47\x48\x49\x4a\x53\x54\x55\x56\x57\x58\x59\x5a\
+\x63\x64\x65\x66\x67\x68\x69\x6a\x73\x74\x75\x76\x77\x78\x79\x7a\
+\x82\x83\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\
+\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\
+\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\
+\xd5\xd6\xd7\xd8\xd9\xda\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf2\
+\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xda\x00\x0c\x03\x01\x00\x02\
+\x11\x03\x11\x00\x3f\x00\xad\x70\xaa\x62\xca\x01\x9e\xb5\x56\x2b\
+\xa3\x0a\x9f\x90\x86\xab\x64\x93\x1e\x54\x75\xaa\xcf\xb9\xe2\x2c\
+\x50\x66\xbc\x2f\x42\x53\xb9\x7a\xd2\xfb\xcc\x07\xcc\xc6\x71\xde\
+\x96\x49\x5a\x56\xc0\xe1\x7b\x56\x2c\x66\x46\x6f\x94\x11\xcd\x69\
+\x41\x0d\xd4\xc8\x0c\x6a\x78\xa2\xec\x51\x6d\xe8\x2c\xce\x38\x53\
+\xc1\x02\xa0\x8c\x33\x48\xc5\xba\x1e\x05\x3c\xc1\x2c\x97\x61\x24\
+\x18\xc1\xc1\xa9\xe7\xb7\x2a\x9f\x21\xe7\xda\x9b\xd4\x2d\x7d\x58\
+\x49\x1e\xd8\xb8\x39\xf6\xab\x36\x51\xef\x8c\xe7\x8a\x2c\x2d\x19\
+\x90\x99\x0e\x70\x29\x64\x7f\x24\xb8\x03\x14\x24\x69\x6b\x2e\x66\
+\x5b\x92\x25\xf2\x42\xaf\x24\xd5\x5c\x32\x26\xd3\xfc\x55\x59\x35\
+\x02\xc3\x6f\x71\x52\x25\xc6\xfb\xb8\xa3\x3d\x49\x02\x93\xb2\x1f\
+\x3a\x6a\xc5\xcb\x58\x0b\x47\xc9\x19\x3d\x01\xab\x6b\x1b\xa4\x78\
+\xdb\x9a\xb2\xf6\xcb\x12\xa6\xd2\x32\x4d\x69\xdb\x5b\x03\x0f\x2b\
+\x56\xa2\x6b\xb5\x8e\x52\x78\x1a\x56\x27\x69\x06\xab\x34\x13\x86\
+\x00\xa6\x05\x6f\x6a\xc9\xf6\x38\x83\xa8\xea\x7a\x55\x3f\xb6\xa3\
+\x44\x37\x26\x1b\x15\x50\x4b\x54\xc2\x52\x57\xb8\xc5\x97\xcb\x08\
+\x3d\x07\x35\xa5\x68\xbf\x68\x03\x03\x8a\xc2\x96\x65\x6c\xb1\x20\
+\x28\xe7\x3e\x95\x63\x4d\xf1\x2e\x8c\x81\x61\x17\xf1\x89\x4f\x03\
+\x27\x00\xfe\x3d\x2a\xe1\x07\x2d\x91\x2a\x77\x66\xdd\xc4\x62\x35\
+\xc0\xeb\x58\xb7\x56\xd2\xb3\x1d\xbf\x76\xaf\xde\x5e\xb1\xc1\x1d\
+\x45\x11\x5c\xa4\xb0\x80\x40\xdc\x3a\x8a\x4e\xd7\x2b\xda\x6b\xa9\
+\x8f\x28\x29\x82\xca\x71\x4c\xfb\x5a\x7a\x0a\xe8\x1a\xde\x29\xa0\
+\xe8\x33\x55\x3f\xb3\x23\xf4\x15\xa2\xa6\x86\xda\x33\x36\x00\xde\
+\x5a\x8e\x4f\x6a\xad\x35\x9d\xc2\xa9\xe7\x03\xad\x3d\x2e\x84\xb3\
+\xab\x74\x6c\x70\x2a\xf1\x90\x5c\xda\xb8\x62\x03\x62\xb1\xe5\xba\
+\x30\xb1\x95\x60\xaa\x66\xd8\xc0\x1a\xea\x60\x96\x0b\x28\xf6\xe0\
+\x12\x7b\xd7\x1b\x6d\x1c\xb1\xcf\x29\x27\x38\x39\x15\x6e\x19\xa7\
+\x9a\x75\x42\xc7\xaf\x19\xa2\x2e\xc2\x57\x5b\x1a\x9a\x83\x23\x33\
+\x48\x98\x07\x35\x97\x1c\xc6\x36\xcb\x1d\xdc\xe2\xa7\xbc\x66\x89\
+\xb6\x9c\x91\x8e\xb5\x9b\x6e\xe9\x25\xc1\x04\xf4\xa2\x44\xc9\xb4\
+\xce\x83\x4e\x98\x39\x3b\xb8\xf6\xa6\x6a\x31\xab\x13\xb0\x73\x8c\
+\x9a\xa0\x92\xb2\x4d\xb9\x06\x47\x61\xeb\x4d\x17\xce\xb2\x31\x91\
+\x70\x3a\x11\x4a\xca\xc5\x73\x5f\x46\x54\xb5\x8d\xbc\xd7\x67\xe0\
+\x03\x52\xa8\xbb\x91\xe5\x96\xcd\x63\x1e\x50\xe6\x49\x73\xb7\x3d\
+\x70\x31\xd6\x91\xa4\x8a\x52\xcc\xa4\x00\x06\x4f\xd2\xb7\x3c\x88\
+\xac\xb4\xb1\x0b\x10\x5f\x66\xe6\x3e\xac\x79\xcd\x6d\x87\xa5\x1a\
+\x8e\xef\xa1\x10\x8e\xa7\x2d\x07\x8b\x75\x6b\x5b\xb8\xde\xfe\xd6\
+\x39\x6d\xc0\xcc\x9e\x50\x2a\xca\x33\xd4\x64\x9c\xfd\x3f\x5a\xf4\
+\x3b\x7d\x56\x2b\xab\x28\xa7\xb5\x70\xf0\xca\xa1\xd1\x87\x70\x6b\
+\xca\xf5\x2b\xa7\xb6\xbc\x72\x50\x34\x0d\xf7\x94\xf7\x15\xa7\xa0\
+\x5f\xc7\xa7\xdc\x0b\x51\x27\xfa\x24\xf9\x92\x12\x4f\xdd\x27\x92\
+\x3e\x95\xb5\x5a\x2a\xd7\x89\xbe\xb6\xb9\xd6\x6a\x17\x62\x59\x52\
+\x37\x6e\x01\xe9\x59\x97\x8e\xae\xfb\x10\xe0\xfa\x54\x1e\x60\x9b\
+\x56\x00\xfd\xde\xd5\xa2\x2c\x51\xa7\xde\x3b\x57\x22\x46\x7c\xee\
+\x5b\x1c\xaf\x8a\x5e\x7b\x2f\x0e\x5c\x3e\xec\x19\x48\x84\x1f\xaf\
+\x5f\xd0\x1a\xe3\x2c\xac\x9e\x5b\x6f\xb4\xae\xe2\x17\x86\x5f\x51\
+\xde\xba\xdf\x88\xb3\xe2\xd7\x4f\xb4\x56\xfb\xf2\x3b\x90\x0f\xa0\
+\x00\x1f\xfc\x78\xd4\xba\x5e\x88\xd6\x9a\x1c\x2f\x34\x67\xf7\xca\
+\x18\xfe\x23\x3e\xbf\xce\xbd\x1c\x3a\xe5\xa6\x11\x8a\x35\xbc\x35\
+\x7a\xf7\xb6\x31\xc6\xcf\xe6\x08\x94\x00\x49\xc9\x2b\xef\xf4\xe9\
+\xf9\x56\xcc\x67\xcb\xb8\x75\x39\xcd\x71\x9e\x1e\x9b\xec\x5a\xb8\
+\x11\xf1\x1b\x36\xc7\x52\x72\x7d\xab\xaa\xbf\xba\x58\x25\x12\x1e\
+\xa4\x71\x5c\xd8\x88\xa8\xbb\xf7\x29\xad\x0b\xd0\x5d\x48\x1c\xa1\
+\xe9\x56\xfe\xda\x3f\xba\x2b\x12\x0b\x97\x2a\x59\xb8\xcf\x41\x47\
+\x9e\xdf\xdf\xac\x14\xd9\x95\x9b\x30\xcb\x49\x05\xe2\x31\x18\x51\
+\xd6\xae\x3d\xc3\x39\xdf\x1b\x60\x01\xda\x96\xed\x63\x69\x38\x20\
+\x67\xf5\xaa\x60\x98\xd4\xe3\x14\x5c\xb5\xa6\x84\xd1\xdf\x00\x4e\
+\xfc\x1e\x79\x38\xa5\x37\xab\x0c\x88\xe0\x75\xe7\x02\xa1\x59\xe3\
+\x40\x04\xc8\x42\x9f\xe2\xab\x91\xd8\x5b\x87\x59\xd0\x86\x18\xe9\
+\xda\x9a\xbb\x40\xee\x98\xc9\x2e\x64\xba\x2e\x15\x4e\x71\x59\x32\
+\xc3\x71\x6c\xe5\x9c\x63\x27\xad\x69\xcf\x34\x91\xcd\xba\x28\xb0\
+\xbe\xb5\x65\xae\x52\x6b\x52\xb2\xc7\x86\xc7\x5c\x54\xb1\xb8\x39\
+\x14\xf4\xfb\xe2\x97\x09\xb8\x65\x40\xe6\xa7\xbc\x91\x66\x6c\xae\
+\x33\xd3\x02\xa9\x59\xda\x96\x91\xf8\x20\x1e\x99\xad\x4d\x3f\x4b\
+\x8d\xae\x09\x96\x4c\x77\x00\xd0\xaf\x6b\x13\x18\x68\x52\xb3\xb5\
+\x79\x6f\xa1\x80\x6e\x52\xed\x82\x54\x72\x07\x72\x3f\x0a\xd7\xbe\
+\xbd\xf3\x27\x97\x04\x05\x6c\x85\x20\x71\x9f\xeb\x57\xb4\x98\x62\
+\x37\xb7\x72\xa3\xe0\xdb\x5a\xcb\x26\x7f\x00\x3f\xad\x72\x29\x7e\
+\x6e\x26\x75\x72\x77\x64\x9e\x30\x6b\xb7\x0b\x1e\x58\x17\x14\x43\
+\xa9\x5b\x09\x77\x16\x07\x8c\x83\xd3\x9f\x5a\xa0\xf6\xb2\x42\x82\
+\x35\x2c\x11\x4e\xf4\x23\xb1\xf4\xad\xde\x1c\x73\xc9\x23\x3c\xfa\
+\xd2\x43\x10\x68\x99\x1c\x13\x8e\x3a\x75\x15\xa4\xa5\xa9\xd3\x08\
+\xe9\xa9\x2c\x2a\xf0\x5e\xaa\x19\x12\x40\xe8\x24\x8d\xd7\x3b\x5d\
+\x0f\x4c\x67\xb8\xe7\x23\xa8\xef\x5b\x49\x38\xc7\xcf\xc7\x6a\xa3\
+\xaa\xc3\x23\x78\x46\xca\xee\xde\x47\x33\x69\xd2\xe5\x43\x60\xe1\
+\x4f\xde\x50\x7a\xe3\xbf\x7e\x95\x1b\x5e\x25\xe6\x9e\x97\x11\x70\
+\x25\x50\x71\xe8\x6b\x9e\xad\x3e\x57\xcc\xb6\x67\x2c\xa3\x6b\x98\
+\x77\xba\x6b\xf8\x8b\xe2\x05\xad\x9c\x40\xbc\x30\x46\xad\x29\xec\
+\x01\x39\x3f\xa1\x15\xd8\xeb\x9b\x11\x56\x34\x07\x6a\xa6\x40\x0b\
+\xe9\xed\x52\xf8\x13\x4a\x36\xf3\x6b\xfa\xac\xab\xf3\xc9\xe4\xa4\
+\x6d\xec\x10\x83\xfa\xe2\xb3\xfc\x48\xfb\x6e\x32\xac\x41\xc0\x03\
+\x27\x1f\xe7\xae\x6b\xb2\x9a\xf7\x22\x38\x6c\x73\xd6\xc1\x46\xab\
+\x16\x24\x24\x09\x97\x80\xd9\xc9\xc8\x07\x81\xef\x9f\xcf\xb7\x5a\
+\xe8\x6e\xe0\x49\x75\x49\x63\x62\x0a\xc3\x23\x28\xc1\xc8\xe0\xe2\
+\xb9\xbb\x19\x1b\xed\xf6\x8a\x43\x65\xae\x55\x41\x3e\xb9\x19\xfe\
+\x60\xff\x00\x91\x9d\xef\xb5\x85\xba\x9c\x84\x18\x67\x62\x31\xd3\
+\xad\x73\xe3\x2d\x64\x44\xd8\xf9\x9d\x77\x14\x5e\x2a\xb7\x96\xff\
+\x00\xdd\x3f\x9d\x6b\xcf\x1d\xac\x56\xf1\xc8\xe7\x12\x37\x6a\x83\
+\x74\x7f\xe4\xd7\x13\x4b\xa9\x51\x83\xb6\xa6\x2e\xa1\x1b\xc7\x2e\
+\xe4\xfb\xa3\x83\x9a\xcd\x73\x72\x5f\x38\x3b\x47\xa7\x4a\xea\x64\
+\xd3\xde\xf7\x4e\x31\xc5\x91\x28\x1d\x7d\x6a\xad\xb5\x84\xd0\xc3\
+\xe5\x49\x18\x2e\x38\xce\x29\xa4\x8e\x98\x45\x3d\xce\x76\xf2\x67\
+\x78\x00\x56\x03\xde\xaf\xe8\xa9\x32\x00\xac\xd9\x43\xd0\x1e\xd5\
+\x62\xe7\xc2\xf7\x33\xa1\x2b\x95\xcf\x38\x15\xa9\xa6\xe9\x2d\xa7\
+\xc2\xa6\x50\x73\xef\x43\xd8\x72\x86\xba\x17\xed\x6d\x85\xcc\x2c\
+\x92\xc5\xb7\x1d\x09\x15\x48\x98\x23\x9c\xc0\xeb\x80\x0f\x5a\xb7\
+\x79\x7f\x20\x4f\x2e\x28\xf6\xfb\xd6\x74\xf0\xbd\xca\x1c\x0e\x47\
+\x7a\x2d\x72\x26\xdd\xf4\x12\xfd\x96\x30\x3c\x80\x01\x15\x15\xbc\
+\xa2\x5c\x87\x7d\xa7\xb5\x39\xf4\xf6\x9a\xd4\x20\x72\x1c\x1e\xb5\
+\x12\xda\x34\x23\x69\xe5\xa8\x66\x3c\xae\xd7\x67\x4f\xa3\x58\x0b\
+\x7b\x2d\x51\x91\x83\x49\x26\x9f\x38\x19\xe7\x9c\x03\xc7\xe5\x5e\
+\x55\x67\x29\x8e\xe0\x6f\x45\x04\x9c\xe4\x9c\x0f\xd6\xbd\x1f\xc2\
+\x46\xe5\xf5\x9f\xb1\xc8\xd8\x86\x78\xa5\x8b\xe6\x3d\x37\x23\x01\
+\xfa\xe2\xbc\xe5\x81\x8a\xf1\xa3\x65\x3b\xd1\xbe\x6f\xad\x76\x51\
+\x7f\xbb\x34\x86\xe6\xf1\x75\x00\xb7\x38\xc6\x70\x7f\xcf\xf9\xc7\
+\x7a\xb3\x0b\x80\xc1\x81\xce\x46\x2a\x9a\xb7\xee\xf7\x16\x04\x11\
+\xdf\x93\x4e\xb5\x6d\xad\xe5\x67\xe6\xfe\x12\x7b\xd3\x96\xe7\x54\
+\x36\x3b\x1d\x19\x45\xce\x95\xa8\x59\x16\x20\x3a\x1c\x2b\x65\x80\
+\xe3\xae\x3f\x99\xae\x17\xc3\x37\x00\x45\x73\x65\x37\x0d\x13\x65\
+\x47\xa6\x73\x9a\xef\xbc\x38\xc6\x5b\x2b\x85\x2e\xa0\xb0\x38\xc9\
+\x07\xb7\x5c\x7f\x5c\x71\x5e\x57\xa7\x49\xf6\x5f\x14\xcb\x0b\x80\
+\x5e\x42\x57\x3e\xa7\x39\xce\x7f\x0a\xba\x91\xe6\xa6\x72\x55\xdd\
+\x9e\xdd\x66\x16\xd3\xc2\x60\xa0\xc0\x7d\xac\x7d\xc6\xd5\xfe\xa0\
+\xd7\x9e\x78\x9e\xe7\xf7\x8c\x32\x8b\x19\x18\x66\xcf\x40\x46\x3a\
+\x7f\x87\xbd\x77\x46\x72\x9e\x13\xb5\x5c\x7c\xfe\x58\xe3\xd7\xa9\
+\x1f\xa1\xaf\x31\xf1\x34\xa4\xdc\x28\x89\x73\x81\x92\x14\x83\x9f\
+\x6f\xeb\xc7\xa7\x6a\xd5\x3d\x85\x05\xee\x95\x74\xc6\x13\x6b\x7a\
+\x7e\xd7\x56\x26\xe4\x48\xec\x0e\x70\x77\x63\x03\xb0\x18\x03\xd3\
+\xd7\xbd\x75\x56\x71\x2c\x8f\x1e\xee\x00\x39\x24\xd7\x1d\xa0\xa9\
+\x1e\x26\x84\x05\x61\x02\x2c\x92\x8e\x0f\xcb\xc3\x90\x39\xf7\xc7\
+\x5e\x7f\x90\xeb\xe1\xda\x16\x44\x77\xc6\x57\x8a\xe7\xc4\x25\x26\
+\x91\x8c\xdd\x9a\x1f\xaa\xce\xd7\x13\x87\x88\x29\x54\x3b\x45\x37\
+\x37\x1f\xdd\x5a\xaf\xa3\x46\xf7\x02\x44\x63\xf2\xc6\xdd\xeb\x67\
+\x60\xf5\xfe\x55\xc8\xa1\x73\x48\x4a\xea\xe6\x9e\x9f\x1f\x91\x89\
+\x18\xe0\x30\xc1\x15\x38\x30\xac\xcd\xbb\x15\x56\x05\x59\x9d\x43\
+\xbf\xca\x06\x40\x15\x15\xe5\xac\x8b\x28\x2b\x92\xa7\xde\x86\xac\
+\x8b\xe6\x76\x2d\x1b\xb0\x93\x9c\x28\x2b\x8e\xe6\xa5\x9f\x13\xbc\
+\x5c\x02\x0f\x61\x59\x30\x32\x6e\x2a\xc7\x0d\x9c\x1a\xb6\xb7\x62\
+\xce\x58\xb2\x73\x9e\xd4\x6e\x57\x3b\x25\xbe\x82\x3c\x05\x09\xcf\
+\xd2\xa9\x43\x6a\xd1\xbb\x03\xc6\x7b\x1a\xdb\x6b\x98\x5f\x12\x32\
+\x06\x27\x92\x45\x36\x49\xad\x19\xf9\x18\x7e\xd4\xec\x8a\x6e\xe7\
+\x3e\xd1\x7e\xf8\xb8\xc8\xc5\x55\x96\x55\x57\xe3\xef\x13\x5b\x72\
+\xc7\x0c\xb2\xe0\x1c\x06\xac\xd9\xf4\xff\x00\x2e\x66\x28\xc0\x8c\
+\x54\xbb\x23\x19\x2b\x92\xe9\x61\xed\xef\x62\xbb\x56\x19\x8f\x0e\
+\x07\xb8\x39\xae\x33\xc7\x36\x7f\xd9\xde\x2d\xbc\x11\x06\x6b\x79\
+\x5f\xce\x8f\x77\x42\x1f\xe6\x1f\xce\xba\x08\xa6\x96\x06\x39\x24\
+\xa8\x27\x23\xda\x99\xe2\x9b\x4f\xed\xcf\x0c\xc3\xa9\x42\xb9\xb8\
+\xd3\x7f\x71\x3e\x7a\xf9\x64\xe5\x1b\xe8\x39\x5f\xc2\xb7\xc3\xcd\
+\x3b\xc4\x20\xec\xd2\x30\x2d\xd9\xee\x2c\xc3\x60\x12\xbc\x13\x8f\
+\xcb\xeb\xf8\xff\x00\x5a\x9a\xd9\x8b\xe0\x3a\xf2\x07\x04\x7e\x95\
+\x43\x42\xbb\x1e\x7f\x93\x32\xee\xdc\x30\x47\xbf\xb7\xa5\x6b\x2d\
+\xab\x41\x77\x90\xdf\x29\x19\x1e\xf5\xbc\x97\x53\xaa\x9b\xe8\x75\
+\x9e\x1c\x2e\x34\xf9\xdc\x95\x09\xb4\xee\x56\x3d\xf1\xd8\x7d\x73\
+\xcd\x78\xed\xdd\xc1\x4d\x76\x49\xd1\x98\x6d\x9b\x20\xe7\x1d\x0e\
+\x79\xff\x00\x3e\xb5\xea\xf6\x73\xb4\x1a\x25\xdb\xe0\x0c\x7c\xc3\
+\x07\x83\xfe\x07\xfa\x57\x8e\xde\xb1\x79\xd8\xe4\xed\xdd\x93\xfe\
+\x15\xaf\x44\x61\x3d\xd9\xed\x93\xea\x31\xcd\xa3\x59\x04\x6f\x94\
+\xc1\x1b\x64\xf7\x1b\x07\xff\x00\x5a\xbc\xf7\x5e\xb9\x84\x4a\x59\
+\xc6\xf3\xca\x95\xdd\xb4\xe3\x19\xce\x79\x1d\x33\xf5\xab\xd6\x17\
+\xc6\x6f\x0e\xdb\x85\x90\x96\x89\x19\x32\xde\xa0\x9f\xe9\x8f\x5f\
+\xc6\xb1\x1a\xe1\x67\x2d\x2c\xac\x7c\xb0\xc0\x3f\x03\x24\x1e\x0f\
+\x7f\x43\xdb\xd8\x53\x5b\x92\xf4\x44\xfe\x1c\x8e\x4b\x7b\xb9\x64\
+\x90\x3b\x7e\xe1\x42\xb3\x1c\x64\x12\x39\xc7\xe0\x7a\xf6\xc7\x5c\
+\xf1\xd5\x48\xa9\xe5\x17\x61\x8c\x74\xae\x6b\x4d\xc4\x21\x89\x4d\
+\xa5\xd8\x09\x06\x7f\x89\x78\x6c\xf3\xc1\xcd\x74\x98\x7b\x8b\x6d\
+\xb1\x72\x3b\x13\x5c\x75\xa5\xef\xb3\x96\xa5\xdb\xb1\x53\x4e\x9d\
+\xac\xef\xa5\x1b\xff\x00\x77\x28\xcf\x15\xab\xf6\x88\xfd\x7f\x5a\
+\xe7\x2e\x96\xe2\xd6\xe9\xa1\x2a\x03\xb1\xce\x7b\x0a\xb7\xe6\x9f\
+\x5a\xc2\xfd\x8c\xe3\x39\x25\x63\xad\xbd\x26\xde\xe1\x1b\x94\x59\
+\x0f\xca\x7f\xcf\xe3\x57\xc4\xb2\x65\x58\xf2\x3f\x9d\x55\xd6\x1c\
+\x4d\x69\x12\x82\x08\x85\x83\x1c\xfd\x6a\xc4\x77\x51\xc9\x6d\x14\
+\x28\xd9\x63\x4b\x99\x49\xea\x7a\x4b\x46\x47\xe4\xc3\x25\xce\xe5\
+\x19\x66\x3d\x05\x2d\xdd\x80\xb8\x9d\x48\x3b\x4a\x0c\xe0\xd3\x96\
+\x07\xb6\x9b\xcc\x8c\x64\xe7\xad\x56\x91\xa6\xbe\xb9\x25\x59\x96\
+\x2e\x85\x87\xf1\x7b\x0a\x14\x39\x85\x3b\x2d\xc9\xed\x23\x90\xb3\
+\x22\x10\x47\xbf\xaf\xb5\x32\xe7\xcc\x33\x08\xfc\xae\x7b\x91\x55\
+\xe0\x59\x53\x50\x84\x79\xca\xb1\x1e\x0e\x4f\x41\x57\x65\x2a\x93\
+\xbb\x23\xe5\x8f\x03\xd8\x55\x59\xa4\x2b\xad\x8c\x88\x9d\x9b\x52\
+\xf2\xb9\xcf\x38\xab\x65\x3c\x99\x1d\x58\xee\x6c\x52\xb6\x9b\x71\
+\xf6\x94\x96\x3c\x16\x6e\x72\x69\xb7\xfa\x6d\xc4\xce\xa4\x39\x47\
+\x6e\xb8\x3d\x28\x74\xd8\xe2\x96\xec\xcb\xb8\x6d\x8a\xdb\x14\x9e\
+\xe7\x15\x3e\x9d\x7a\x6c\x1e\x3b\xa3\x13\x4b\x6d\x2a\x98\xae\x61\
+\x1d\x24\x8c\xf0\x47\xf5\xfa\x8a\xd5\x8f\x4e\x16\xf0\x00\xce\xac\
+\x08\xc1\xdd\xd4\x55\x09\x08\xb6\x8d\xe0\x18\x61\xd4\x54\x5b\x96\
+\x57\x45\x4e\x28\xe7\xf5\x9f\x08\xcb\xa4\x6a\x31\x5d\x59\x1f\x3f\
+\x4b\x9b\xe7\x86\xe0\x63\x91\xfd\xd3\xef\xea\x0f\xff\x00\xaa\xc4\
+\x11\xbc\x96\x8e\xec\x3e\x54\x63\xed\x8a\xde\xd1\x7c\x41\x6d\x6a\
+\x93\x58\x5f\x26\xfb\x39\x8e\x24\x8d\xbf\x84\xff\x00\x79\x7d\xe9\
+\xcf\x63\x15\xa4\x33\xac\x4e\xb2\xdb\xb3\x6e\x49\x17\x90\xea\x47\
+\x1f\x8f\x6f\xc2\xbd\x0a\x73\x8d\x45\x74\x44\x27\xad\x8c\x4b\x8b\
+\x83\x07\x86\x6e\x8a\x7c\xa1\xce\xc3\xcf\x51\xfe\x4f\xb7\xe3\xdb\
+\xcb\x6f\x54\x46\x48\x5f\xef\x9e\x08\xe4\x0a\xf4\x5b\xe8\x8c\xde\
+\x1a\x9e\xd9\x37\x17\x46\xcb\x81\xfc\x41\x4e\x37\x7b\x76\xaf\x38\
+\xbc\xe1\xde\x30\x32\x40\x04\x02\x4e\x41\xc6\x71\xfd\x2b\x44\x3a\
+\x8b\x56\x74\xb6\x6e\x53\x44\x8d\x73\xf3\xc8\x5d\xc1\xe0\x96\xe4\
+\xf5\xc7\x7e\x2b\x12\x69\x16\x2b\x90\x0a\x13\xb9\x70\x78\x20\x73\
+\x8c\xe0\x73\x9c\x8e\x38\xe7\xad\x6c\xcb\x6e\xf1\xe8\xf6\x81\x40\
+\x24\x40\xae\xcf\x9c\x60\xb7\xcd\xfd\x4d\x73\x92\x2b\xc3\x78\x85\
+\x18\xb1\x4c\x39\xce\x73\x8e\xb8\xe3\xe9\xd6\x85\xb9\x0f\x63\xb0\
+\xd0\x2d\x87\xf6\x3e\xfd\x84\xa8\x62\x37\x7d\x30\x33\xec\x38\xad\
+\xd4\xbd\x78\xec\xc2\xa4\x60\x0c\x63\x3e\xb5\x4f\x47\x73\x69\xe1\
+\xd8\xd1\xc6\xd8\x64\x1b\xcf\x73\xf3\x73\x8f\xd6\x9e\xbb\x04\x8b\
+\x1a\x36\x57\x1d\x2b\xcb\xab\x2b\xd4\x6c\xe6\x9b\xd7\x42\xb1\x85\
+\xee\x5c\x30\x62\x4e\x72\x79\xe9\x4e\xf2\x26\xf4\x34\xeb\x68\x6e\
+\x1a\x72\x90\x12\x1c\x93\x8c\x55\xbf\xec\x8d\x63\xfe\x79\xbf\xe7\
+\x53\x16\xba\x89\x53\xd0\xd5\xbe\x25\x1d\x96\x32\xc4\x38\xc3\x02\
+\x6a\x28\xee\x45\xae\xd0\x83\x71\x03\x00\x8e\xd4\x97\x71\x4e\x5d\
+\xcb\x16\x6e\x71\xc7\x6a\x2d\x2d\x19\x51\xa4\xdb\xf2\x29\xe3\x34\
+\xf9\x75\xd0\xea\xe6\x6a\x5a\x9a\xbf\xda\x53\x4d\x0a\x40\xd1\x9f\
+\x2f\x77\xce\xfd\x32\x3d\x29\x2e\x35\x35\x8f\x22\x01\x85\xc7\xc8\
+\x07\x40\x6a\x7b\x6d\xd3\xc0\x02\x20\x11\x63\x1b\xb1\xf7\xab\x9f\
+\xba\x05\x59\xa4\x00\xf9\x64\x95\x5e\x7b\xfa\xd6\x9a\xa8\x99\x4a\
+\x7e\xf6\xa4\xb0\x4d\x14\xac\x04\xb2\x93\x26\xe2\xc5\x89\xf7\xae\
+\x8b\x4f\xb8\xb6\x58\x19\xdd\xc1\x91\xb3\xc5\x72\x90\x5b\x49\xe6\
+\xa9\x52\xac\x64\x5c\x8f\x6a\x7c\x02\x55\x69\x00\x72\x65\x53\xd0\
+\x76\xac\xd4\xde\xc4\xa9\xb8\xa3\xa9\x86\xe8\x4f\x2a\x2c\x72\x6d\
+\x20\x91\xc7\x6a\x59\x04\xd0\x5f\x15\x46\x12\x64\x77\xed\x5c\xe6\
+\x9f\x74\xf0\x37\x99\x22\x92\x73\xcf\x15\x7d\x2f\x24\x37\x3e\x62\
+\x02\x77\x76\xad\x23\x27\x6d\x4d\x7d\xa4\x5a\x5d\xce\x88\xd8\xf9\
+\xb0\xed\x95\xb3\x9e\x70\x3b\x57\x35\xaa\xd9\x88\xee\x50\x86\x28\
+\x01\x00\x8f\x5a\xdc\x87\x50\x60\xc2\x34\x52\x0b\xf5\x24\xf1\x59\
+\xda\xda\x32\xe7\xcd\xf9\x8a\x8c\x8a\x26\xcd\xe5\xac\x6e\x8c\x3d\
+\x62\x18\x50\xf9\xaa\xa0\x10\x01\x03\xd6\xa6\xd2\x75\x20\xf0\x34\
+\x63\x3b\x15\x73\xb4\x91\x80\x4f\xd7\xb7\xf8\xd5\x19\x2d\xbe\xd4\
+\x05\xc7\x9b\xbd\x14\xf2\x84\xfe\x95\x3e\x9b\x1d\xb9\xbd\x91\x44\
+\x46\x30\xe8\x46\x31\x9f\x7a\x54\x5d\xaa\x5c\xe5\xda\x57\x44\xfa\
+\x60\x8a\x65\xd4\xcd\xc6\x57\x9d\xa0\x1f\xe2\x38\x19\xc7\xa1\xe3\
+\x38\xe7\xdf\x9a\xf3\x6b\xfd\x3c\x8b\xf9\xbe\x70\xd1\xa2\x8c\x96\
+\x1d\x40\x2b\x93\xc6\x0f\x4c\x9e\x99\xeb\x5e\x98\xf6\x32\x5c\xdb\
+\xa2\x45\x29\x55\xdc\x4a\x22\x14\x00\x13\xce\x71\x8c\x0f\xe5\xc9\
+\xac\x09\x74\x75\xfb\x49\x46\xca\xc6\xe5\x59\x99\xa4\x5d\xaa\x0f\
+\xcb\x80\x3f\xda\xc1\xe8\x01\xc5\x7a\x96\x34\x6e\xef\x51\xd7\x57\
+\x30\x2e\x9d\x61\x38\xb6\x56\x85\xa2\x54\x32\x81\x95\x8c\xe3\x1b\
+\x5f\xd3\x3d\xbb\x1e\x6b\x12\xff\x00\x48\xf3\x35\x00\x56\x21\x0b\
+\x49\xf3\x10\xd1\x15\x21\x10\x92\xc7\x04\xe0\xf0\x03\x67\xaf\xbd\
+\x75\xd6\xb3\x5b\xe9\x51\xcd\x1d\xc0\x05\x39\x8d\x46\xc6\x2e\x53\
+\x8d\xa4\xa9\xc6\x48\x6f\x94\x67\x8f\x9b\x03\x3d\x6a\x09\x2c\x9e\
+\x4b\xab\x8b\xa8\x6d\xae\x27\xd9\x16\x3c\xb7\x50\x1e\x3d\xca\x73\
+\xb8\x9c\xf0\x33\xfc\xb2\x2a\x84\x1a\xb0\x08\x8a\x85\x08\x89\x50\
+\x30\x07\x8c\x9f\xc3\x8a\xc7\x56\x90\x7c\xe0\x11\x22\x9c\x1f\xa5\
+\x6d\xea\x73\x41\x73\x63\x0d\xc4\x71\xb4\x5e\x52\x86\x74\x70\x06\
+\x54\xf4\x20\x0e\x98\x23\x04\x7d\x3b\x56\x2a\xdf\x17\xb9\x21\x62\
+\xe1\xba\x7d\x2b\xc9\xad\x07\x19\xb3\x9e\x71\xd4\xbd\x04\xed\x15\
+\xca\xca\xcc\x54\xe3\x39\xe9\x8a\xd5\xfe\xd0\xb8\xff\x00\xa0\x82\
+\xff\x00\xdf\x67\xfc\x6b\x9f\x9a\x09\xae\x23\x60\xa5\x8e\xd3\xd7\
+\xeb\xda\xa7\xfe\xc7\x7f\xf9\xe2\xbf\x95\x64\x95\xc9\x52\xb6\x8c\
+\xed\x4e\x34\xe8\x98\xc8\x37\x16\xe0\x02\x78\xcd\x51\x0f\x3d\xdc\
+\x01\x21\x1b\x63\xce\x58\x1e\x37\xf3\xfc\xa9\x57\x6d\xfd\xe4\x72\
+\xc8\xe4\xc3\xbb\xe4\x87\xa9\x3e\xe6\xac\xdc\xce\x96\x4c\x61\x55\
+\x32\xdc\x31\xf9\x62\x5e\x89\x9f\x5a\xdd\xbf\xb8\xe8\x72\x4d\x8e\
+\xbc\xba\x97\xfb\x3c\x42\x61\x58\xd1\x07\x2d\x1b\x76\xac\x12\xb1\
+\xb5\xbb\xec\x3b\x97\xa0\xab\xb3\xad\xd8\x22\x06\x6c\xbb\x7d\xec\
+\x8a\x82\xd2\xde\x54\x04\xbc\x64\xed\xe0\x8c\x62\xa1\xae\x6d\xcc\
+\xa4\xec\xf4\x46\x68\x75\xb7\x54\x91\xd8\x89\x10\xe4\x0c\xe3\x8a\
+\x9a\xd2\x49\xdf\xcf\xbb\x5f\x91\x71\x80\x08\xeb\x4b\x2d\xb4\x92\
+\x39\x91\xac\xc6\xdc\x13\x92\xd5\x7a\x08\x0c\x50\x08\xe6\x5d\x8a\
+\xc3\xe5\xda\x73\x93\xcf\xa6\x68\x8d\x29\x37\xa2\x26\x31\x6f\x42\
+\xb9\xb8\x63\x6a\x22\x8f\x2c\xec\xc3\x2d\xe9\x5a\xbb\xe1\x86\xee\
+\x20\x32\xff\x00\x28\xde\x07\xad\x51\x8a\xd2\x28\xa6\x29\xb9\x9f\
+\x71\xfe\xf0\xda\x46\x71\xd7\xb1\xe7\xde\xae\x45\x6a\x36\x19\x1f\
+\x72\xc2\x7a\x1c\x28\x2d\x9f\x42\x3a\xff\x00\x4a\xe9\x86\x16\x6d\
+\x7b\xcc\xda\x31\xb3\x26\xfb\x64\x53\x41\x39\x89\x0e\x63\xe8\x3a\
+\x1a\x89\x98\x5d\x59\x89\x27\x04\x2f\xdd\xf7\x5f\xad\x58\x86\xda\
+\x14\x2a\x84\xc8\x41\x19\xc8\x23\x9e\xdf\xe7\x8e\xf5\x3f\xd9\x19\
+\xa4\xcc\x70\x94\x53\xce\xd2\xdc\x63\x9e\xe7\xa5\x6d\xf5\x68\xdb\
+\x56\x68\xdb\xd6\xc7\x3d\x71\x00\xd3\xec\xfc\xe8\x0a\xba\x37\xde\
+\xcf\x6a\x8b\x4c\x9a\x18\xee\x5a\xe5\xc8\x20\x8f\x94\x37\x42\x7d\
+\x2b\xa4\x9b\x4d\xb5\x64\x68\xa4\x88\x0d\xeb\x90\x15\xbb\x0e\xbd\
+\x3a\x75\xaa\x0b\xa2\xda\xda\xc8\xb7\x2c\xa6\x44\x47\x02\x38\xdb\
+\xa0\x38\xc9\xcf\xd2\xb3\xfa\xb3\x4d\x58\x8b\x0c\x79\xa5\xb1\x59\
+\x5e\x30\x10\x36\x5c\xf0\x70\x0f\x3d\x48\x1c\x75\x3d\xaa\xa6\x9d\
+\x6e\xd7\xd6\x79\x37\xd3\x60\xee\x67\x64\x7d\xa5\xf8\x20\x16\x20\
+\xe7\x68\x38\x20\x74\xe3\xbf\x35\x63\x56\x9e\x1f\xb2\x08\x25\x57\
+\x66\x94\x16\x2c\xa4\x63\x07\xd4\x7e\x35\x9b\xa1\xdc\x26\x9d\x7e\
+\x89\x12\x06\x81\xf3\x19\x40\x3e\xf7\x3e\x98\xea\x38\xf5\xe9\x5d\
+\x51\x76\xdc\xb7\xa9\x4b\x5e\x81\x4d\xe4\xff\x00\x60\x16\xf1\xb0\
+\x54\x11\x4c\xf9\xc2\x11\x9c\x1c\x8c\xb1\xc6\x00\xdc\x79\xe1\x49\
+\xe9\xc3\x74\x6f\x13\xde\x68\x4f\x09\x8f\xc9\x9b\x04\xad\xc4\x6d\
+\xc8\xdb\x83\xb8\xe7\xf8\x8f\x2a\x7e\xb9\xfc\x7d\x27\x4c\xf1\x57\
+\x85\x26\x96\x4d\x14\x5b\xf9\x01\xe4\xf2\xb7\x49\x01\x11\xcc\xd9\
+\xc7\x0c\x46\x09\x24\x71\xdc\xf6\xaf\x31\xb8\x8f\xfb\x3f\xc5\xda\
+\x85\x8c\x56\xc5\x23\x8e\x60\xb6\xfb\x87\x2a\x0f\x38\xcf\x3c\x7c\
+\xd8\xe8\x73\x91\x4d\xc8\x56\x7d\x4d\x2f\xb3\xc7\x34\xcc\xc8\xbb\
+\x61\xb9\x04\xc6\x33\xc6\xdd\xaa\x73\x93\xd5\xb2\xb8\x3c\xe7\xf3\
+\x20\x51\x1a\x55\xd5\xad\xd1\x12\xc4\xd1\x18\xff\x00\x85\xc6\x32\
+\x3f\xc9\xab\x96\x10\xdd\xa6\x92\x19\x88\xf2\x94\x07\x40\xab\xb4\
+\xc5\x83\x84\x01\xbf\xdd\x04\xfd\x30\x71\xc1\xad\x39\x75\x1b\xbd\
+\x5b\x48\x89\xa6\xb6\x2f\xf6\x77\x58\xd2\x7c\x10\x42\xb0\x38\x53\
+\xf4\xc7\x1e\x99\xae\x6c\x45\x2e\x68\xf3\x76\x13\x56\x77\x32\xa3\
+\x13\xc7\x03\x47\x1c\x6d\x82\xc0\xe4\x0c\xd3\xff\x00\xb4\xaf\xbf\
+\xe7\xd8\xff\x00\xdf\x26\xaf\x5c\x41\x32\xcb\x6d\xe5\x16\x43\xb3\
+\x96\xcf\x14\x7e\xfb\xfe\x7f\xe2\xfc\x85\x79\xee\x2c\xce\x31\x95\
+\xaf\x73\x67\x7c\x16\x08\x62\xb5\x83\x69\xef\x20\xea\x3d\x81\xaa\
+\xf6\x2a\xda\x64\x92\xde\x4a\x3c\xe9\x9f\xf8\x5b\x92\x0d\x63\xc9\
+\xa8\x34\xb2\x3e\x65\xb8\x91\x63\x38\x5d\x88\x48\x6f\x5a\xb1\x63\
+\x77\xa7\x4b\x72\xf3\x5d\x5d\x4f\x1a\xe3\x05\x24\x6e\x01\xfc\x4d\
+\x6b\x15\xcc\x11\x76\xd5\xa2\xea\x2d\xd6\xa1\x39\xba\x56\x61\x2f\
+\x25\x23\x1f\xad\x43\x3c\xba\x8f\xdb\x55\xc4\x6e\x4f\xf1\x26\xdc\
+\x0a\x96\xff\x00\x58\xd3\x85\xdc\x46\xc6\xee\x47\x9c\xfc\xa5\x62\
+\xe3\x3e\xf9\xc6\x33\xfc\xea\x2b\x9d\x42\x67\x68\xe3\xf3\x5c\x32\
+\xae\xe6\x99\x87\x7e\xc3\x23\xf1\xe7\xda\xb5\x85\x1e\x67\xb9\x7a\
+\xb1\x6e\x25\x8d\x24\x77\xb8\x90\x3b\x82\x01\xc3\x60\x23\x67\xee\
+\xff\x00\x8f\x5a\x92\x69\x0b\x44\xca\x58\x46\x19\x4b\x3e\x1b\x19\
+\xc9\xef\xc9\x00\x7b\x73\x54\x62\x69\x6e\x11\x81\x8f\x32\xee\x2a\
+\x98\xc0\x03\x8f\x94\x9c\x71\xd8\x55\x8b\x64\x91\xd8\x24\xc3\x71\
+\xce\x5f\x77\x56\x3d\x39\xff\x00\x3f\xca\xbb\xe2\x94\x55\x91\x64\
+\xaa\xdb\xbc\xe9\xde\x14\x52\xca\x0a\xa9\x51\xca\x83\xfc\xfe\x86\
+\x94\x48\xbb\x82\xba\x80\xa0\x96\xc3\x0c\x38\xc9\xef\x9e\x3d\x7a\
+\xe7\x1c\x54\xf3\x21\x16\xa2\x4c\x23\xf9\xaf\x84\x55\x20\xe0\xff\
+\x00\xfa\xaa\x28\xec\xdf\xcb\x53\x2a\x10\xa3\x2c\x59\x5b\x24\x9f\
+\x6f\xc6\x9b\x01\xef\x7b\x0a\xaa\x1b\x4c\xac\x99\x23\x8c\x8e\xbe\
+\x9c\x7b\x7d\x6a\xba\xea\xae\x65\x45\x6d\xf9\xc9\xda\xca\xa7\xe6\
+\xc7\x51\x8c\xff\x00\x8f\x6a\x6b\xc0\x54\xc6\xb1\x2a\xc8\x65\x18\
+\xc7\x52\x38\xe7\xdf\xbf\xeb\x4c\x99\x25\xb7\x02\x39\x24\x7c\xe0\
+\xed\x3b\x14\x63\xf2\xfe\xb9\x3f\x9d\x4b\x63\x2b\x3d\xf7\x97\x7a\
+\x36\xf0\x59\xb9\x3c\x67\x27\xdf\x18\xe3\xa7\xeb\x5a\x16\xb7\xaf\
+\xa9\x08\x1e\x4f\x2c\xed\xdd\x90\x5c\x12\x58\xf1\xc6\x3a\xe4\x73\
+\x58\x17\x30\x34\x31\x3f\x9b\x13\x33\x21\xdb\x18\xee\x73\xc0\xe9\
+\x83\xfc\xc5\x6b\x68\x16\xb7\x56\x68\xf1\x4a\x8b\xb5\xe5\x05\x58\
+\x8f\x41\xd4\x7e\x39\xa9\xbd\xc6\x58\xbf\x85\x8c\xe8\x65\x41\xe6\
+\x2e\x23\x5c\x8e\x99\x1d\x47\xe7\xfa\x8a\xc0\xdc\x96\x5e\x21\xb4\
+\x97\x60\x6d\xd2\x88\xe4\x72\x7a\x06\xe3\xa7\xd4\xfe\x86\xba\xdd\
+\x5a\xc9\xa2\xb8\x46\xdb\xbf\x71\x50\x49\x24\x72\x3b\x7d\x31\x55\
+\xe4\xd3\xe2\x41\x30\x95\xd1\xf7\xf3\xb0\xa7\x03\x8e\x9c\xff\x00\
+\x3f\x7a\xae\x5b\x92\x9d\x99\xe5\xb3\x4b\xa9\xe8\x57\x77\x76\xcc\
+\xd3\x3c\x72\x47\xe5\x08\x59\x09\x4d\xe0\x00\x18\x1e\x9d\xb8\xe7\
+\x8c\xd7\xa7\xf8\x82\xf4\x5f\xe9\x1a\x75\xdd\xca\xc6\x25\x48\xc6\
+\xf2\xe8\xa4\x67\x8e\xb9\x04\x75\x03\xb5\x63\xbd\xa4\x71\x5d\x2c\
+\x82\x6b\x97\x2d\xf2\xc6\xae\xcf\xc9\x1f\xa7\x7a\xdb\x7b\x5b\x2b\
+\xdd\x2a\x7b\x89\xe3\x29\x1b\xfc\x81\x1c\xe0\x13\xdf\xb8\xf7\xe3\
+\xda\x94\x61\x2e\xa3\x9c\xd3\x38\x3b\x19\xf5\x2b\x85\x91\x6c\xbc\
+\xec\x2b\xbf\x9b\xb8\x05\xf3\x30\x70\xa7\x76\x41\x1f\x28\xff\x00\
+\x68\x0e\x7d\x4d\x74\x36\x97\xf7\x36\x36\x13\xe9\xee\xb1\xc5\x26\
+\xf4\x53\xb1\x8b\x2b\x2e\x09\x04\x7e\x2b\xd2\xaa\x48\x22\xb3\xbd\
+\x88\xc0\x0a\x07\x46\x66\x08\x09\xe0\x11\x8f\xc8\x8e\x3a\x64\x01\
+\xc1\x15\x61\x0a\x4d\x1d\xdc\x6e\xc0\x3e\x23\x74\x3b\x7a\x00\xe0\
+\x60\x7a\xf0\xf8\xeb\x4a\xa2\xbc\x1a\x21\xea\x8d\x84\x8a\x6b\x83\
+\x14\x45\x37\x29\xb7\x1b\xc9\x6c\x1c\xd5\x3f\xec\x09\x7f\xe7\xd3\
+\xff\x00\x1e\xab\x37\x57\x10\xdb\x22\x4d\x70\xee\x71\x18\x50\x88\
+\xa7\x8f\xad\x50\xff\x00\x84\xaa\x6f\x45\xfc\xab\x82\x4a\x37\xf7\
+\x8c\x6e\xe0\xb4\x1f\x25\xd4\x36\x8e\xa2\x24\x30\xc8\xa7\x39\x20\
+\x90\x48\xaa\x2f\xa9\x40\xf3\x2c\x11\xac\x7f\xbd\x1b\xa4\x62\xa7\
+\x2d\x9e\x98\xc8\xc7\xeb\x5d\x3d\xbd\x98\x56\xf2\xa6\xb2\xdc\x25\
+\x38\xde\x65\xc9\xc7\xd0\xd4\xf7\xba\x5e\x9f\x14\x7e\x62\xa4\x09\
+\xb7\x00\x8d\xd8\x20\x0f\x51\xf4\x15\xaa\x6a\xf6\x47\x42\x77\x8e\
+\xa7\x1d\x6d\x68\x9a\x74\xb2\x4c\xec\x59\xe5\x38\x0a\xc4\x6e\x54\
+\xe7\x91\x93\xc7\x38\xfc\xbe\x95\xa6\x2d\x58\x2f\x9b\x90\x99\x04\
+\x2e\x3e\x62\x14\x1e\x71\x9c\xf1\xfc\xf3\xed\x4d\x30\x2c\x92\x19\
+\xd5\xcb\x95\x5e\x02\x30\xf5\xe7\x03\x9c\x8f\xe7\xc5\x69\x3c\x2c\
+\xb6\xdb\x24\x70\xb1\x85\xcc\x4f\xc1\x62\xa7\x9c\x10\x31\xcd\x75\
+\xd3\x82\x8a\xb0\x36\x55\xb4\x49\x5c\xc5\xb3\x2f\x17\x12\x74\xe7\
+\xaf\x1f\xe7\xdb\xa7\x7a\xd6\xb7\x28\x91\x79\x44\x15\x66\xce\x49\
+\x6c\x11\xf8\xfb\xfb\x55\x48\x99\x63\xb7\xf9\x13\x01\x10\x86\x07\
+\x83\xc7\xf9\xeb\xcd\x4d\x6f\x1a\xc4\xcb\xe7\xed\x48\x99\x77\x04\
+\xea\xc4\x7e\x27\x03\xf1\xab\x11\x2c\xd0\xb4\xc1\x6d\x2d\xa1\xde\
+\x01\xde\xce\x49\x0a\xc7\xdc\xfe\x7f\xa5\x05\x6e\x2c\x58\x3c\xd1\
+\xb1\x5f\xba\xbb\x08\x62\xbc\xf2\x72\x3f\x1e\x95\x7d\x67\xb4\xb6\
+\x19\x5b\x7c\x01\xc6\xd6\x3d\x73\xf4\x27\x26\xb2\x2f\xaf\x61\xb8\
+\x22\x24\x89\xa3\x24\xfc\xb1\xaa\xe3\x3c\x75\xcf\xa7\xb9\xa1\x80\
+\xf4\x46\x66\x92\x58\xe2\x7c\xca\xa4\x6d\x20\x92\xdc\xf1\xb8\xfa\
+\x7a\x1f\xd7\x9a\x86\x4b\x69\x3c\xe0\x5e\x20\x8c\x08\x56\x5e\xa1\
+\xb1\xf9\xe5\xba\x73\x8a\xbd\x64\x93\x5c\xa1\xc1\x09\x8f\xee\xf2\
+\x40\xed\x83\x9c\x63\x1e\xff\x00\xe1\x53\x2d\x83\x6d\x2b\x2b\x4a\
+\xed\x8e\x84\xf6\xf4\xff\x00\x38\xa8\x63\x32\xa1\xb5\x8e\x49\xc0\
+\x58\x95\x9d\x38\x52\x49\x19\x27\x39\xfa\x71\x9f\x71\x9e\xb5\x70\
+\x5c\xa4\x65\x94\xb6\xee\x7b\x10\x32\x3d\x8f\xaf\xb5\x32\x74\xf3\
+\x19\xf6\xee\x45\x7c\xe4\x15\xe4\x03\xf4\xe9\xff\x00\xea\xeb\x55\
+\x6e\x5a\x58\xd7\x2f\x11\x23\x77\xc8\xac\x0f\x27\xd3\xeb\xd7\x8a\
+\xcd\xb3\x44\xb4\x2f\xea\x1a\x9a\xbd\xac\x1b\xc8\x3e\x51\x05\x76\
+\x0e\xa0\xe7\x18\xc7\x15\x50\x6a\xdf\x6c\x04\xc1\x00\xd8\x3e\x40\
+\xa1\xb9\x3f\x87\xa7\x7c\x56\x08\xd4\x57\x64\xd1\x2b\xc3\x23\xa9\
+\x19\xcf\x25\x41\xdc\x70\x31\xf4\xcf\xe5\xf8\x43\x06\xa7\x1c\x92\
+\xae\xe6\xfb\x34\x84\x63\x78\x00\xa9\xed\xc8\xe9\xd2\xb4\x53\x33\
+\x71\x2e\x5c\xc9\x1c\xc0\xbc\x9b\x56\x20\xc4\x6e\x39\xcb\x0e\xa4\
+\xaf\xa7\x4f\xf0\xc5\x3a\xef\xce\x6b\x38\x74\xe8\x1a\x48\x86\xd0\
+\xd8\x07\x62\x67\xa7\x3f\xcf\x9e\xa7\xd3\x8a\xa2\xb3\x45\x77\xab\
+\x41\xb2\xeb\xcc\x01\x80\xde\x98\xf2\xff\x00\x10\x7f\xcf\x4a\xb9\
+\xa8\x93\x65\x28\x17\x79\xda\x0f\xca\xdb\xd9\x4b\x73\xdc\x8f\xa7\
+\xe9\xdf\x9a\x7c\xda\x09\x22\x96\xb3\xe1\xa9\xad\x34\x97\xb8\xbb\
+\xbd\x67\x08\x17\x25\x41\x50\x07\x4e\x7d\xb9\xeb\x9f\xca\xab\xe9\
+\x51\xa5\xca\xa5\xb2\x95\x33\x12\xa1\x42\xe4\xe4\xf6\xc6\x2b\x77\
+\xfe\x12\xcd\x34\x40\x60\x9d\xc4\xb0\xb8\x31\xb2\x9f\xe2\x07\x82\
+\x3a\x0f\xd7\xad\x67\xf8\x62\x0d\x23\x48\xd5\xaf\xa6\xd3\xfe\xd9\
+\x20\x64\x02\xdb\xcf\x6f\x92\xdf\x83\xb8\x8e\x70\x70\x08\x23\xbf\
+\x6a\x4f\xcc\x4d\x8d\x78\x67\x99\x6d\xcc\x5e\x71\x44\x4c\x70\xbf\
+\x29\x23\x9e\x73\x50\xff\x00\x68\xcd\xff\x00\x3e\x43\xf4\xad\x7b\
+\x0b\x51\x18\x2b\x6f\x3b\x5c\xc5\x27\xcb\x26\x78\x23\xe9\xdf\xf3\
+\xad\x5f\xec\x68\x3f\xe7\x93\xfe\xb5\xe7\xc9\x5d\x99\x27\x1e\xa4\
+\x91\x69\x32\x6a\x73\x99\xa3\xd4\x9f\x00\xe5\xbc\xb2\x0b\x7d\x05\
+\x54\xbb\xb6\x45\xdd\x1c\xa5\xd9\x58\x84\x39\xc1\x69\x01\xf5\xee\
+\x07\x4f\xce\xad\x36\xa9\x2c\x70\xb9\x96\xd5\x55\x52\x32\x52\x68\
+\xe3\xd8\x4e\x7d\x47\x7a\xa2\x92\xee\x97\x33\xaa\xb3\xed\x18\x6c\
+\xf0\xde\xfd\x3d\x7a\x8f\xce\xbb\x29\xd3\xe5\xd4\xe9\x93\xe8\x45\
+\x65\x6e\x25\xf2\xa3\x8d\x08\x30\x8d\xd8\x3f\x75\xc0\xe3\x66\x06\
+\x72\x7b\xf5\xed\xdf\xad\x68\x32\x4b\xf6\x73\x1b\x2c\x91\x99\x4e\
+\x3e\x65\xe0\x03\x9e\xb8\xef\xd3\xe9\x5a\x10\xc4\x5a\x35\x86\x35\
+\x60\xc1\x72\x1b\x00\x71\xdc\x8e\xd5\x52\x62\x02\x8d\xd2\x93\x8c\
+\x70\x30\x30\x4b\x64\xff\x00\x20\x7f\x0a\xd9\x10\x54\x4e\x15\x15\
+\x8f\x2d\x80\x32\x4e\x47\xb9\xcf\xe1\x5a\x02\x58\x94\x01\x16\xe3\
+\x2b\x28\x1f\x2e\x49\x23\xd4\x9f\xa9\xac\xa9\x10\xa4\xe2\x22\x83\
+\x62\x64\xb7\xcd\x8e\x9d\xb0\x46\x7f\xa6\x06\x6a\xcd\xc4\xc6\x22\
+\x55\x03\x17\xea\x5b\x3f\x2a\x7b\x73\xff\x00\xeb\xa4\xd8\xec\x45\
+\x76\xca\x8c\x76\x88\x91\xce\x4f\xef\x30\x4e\x78\x3d\x87\x3c\x81\
+\xc1\xe3\x9a\x7c\x17\x24\x4f\xb4\xa4\xcf\x2c\x87\x25\x89\x55\x50\
+\x3b\xe7\x1d\x71\xe9\x83\xfa\xd7\x3e\xb7\x51\x4d\xa8\x15\x6b\x91\
+\x29\x07\x7a\x8c\x80\x15\x7a\x13\xc7\x3d\x71\xfa\x7b\x1a\xb6\xb7\
+\xf2\x5d\xdd\xa1\xc1\x48\xd9\x49\x04\x8d\xa1\xb9\x03\x8f\xd7\xfc\
+\xe6\xa6\xe3\xb1\xd5\x42\xa9\x0c\x4a\x61\x2d\x93\xd8\x8c\x54\xf3\
+\x4c\x92\x34\x6a\x84\x71\xc9\x5d\xbc\x1c\x73\xd0\x76\xac\x98\x66\
+\x13\x24\x47\x3c\x63\x03\x39\xe3\x8f\x4a\xd2\xb7\x1e\x66\x24\x28\
+\x81\x54\x60\xf6\xa7\x71\x19\xfa\x95\xfa\xc0\x3e\xcf\xb8\x86\x6c\
+\x3b\xb6\x7a\x63\xbf\x1d\x3f\x4f\xc6\xb9\xe4\x91\xaf\x1c\x6e\x06\
+\x28\x8f\xf7\x57\x86\xcf\x62\x7b\x8e\x9f\x5a\xd0\xbb\x99\x22\xba\
+\xcb\x46\x25\x12\xb6\x4e\x1c\x20\x03\xf2\xc9\xc0\x07\xd0\x7f\x46\
+\x2c\xc9\x24\x44\x92\x90\x44\x07\x0a\xa0\xe0\x81\xce\x37\x73\x93\
+\x8f\x4e\x83\xae\x32\x2b\x36\x99\x69\xa2\x86\xb0\x6d\x25\x42\x92\
+\xdb\xb8\x8d\x06\xc8\xdd\x0f\x03\xdf\x8e\xd9\xc7\x5f\xf1\xae\x76\
+\xfe\xcf\x7f\xef\xd1\xcb\x46\x49\x2d\xdf\x7e\x0f\x43\xf9\xd6\xef\
+\x9b\x6d\x36\xa5\x76\x23\x3e\x6c\xa4\x01\xf3\x36\x54\x01\xed\xdc\
+\xf7\xcf\x4f\x4c\xd5\x08\x64\xf3\xf7\x49\x1a\xe0\xbe\x5d\x90\x83\
+\x8c\xf1\xce\x29\x31\x18\xb6\xb6\x37\x2f\x7c\x8b\x6d\x2f\x96\x09\
+\x3f\x36\x78\x03\xae\x71\xd7\x81\xcd\x76\x56\xf6\xaf\xaa\xc8\xd0\
+\x4c\x0b\x5b\x9f\xf5\x4b\x2f\x2c\x01\x38\x19\xf7\xc7\xa5\x31\x23\
+\x8e\x1b\x61\x82\x37\x15\x00\x9c\x60\x81\xd7\x07\xf1\xfe\x42\xb6\
+\x34\xd8\x4a\xa1\x93\x0d\xc2\xf1\x8e\x4d\x38\x93\x7b\x94\xd3\x46\
+\xd2\x2c\x99\x21\x74\x2c\xe0\xe1\x14\x30\x1b\x8f\xe5\x9a\x8e\xfa\
+\xe5\x61\xb8\xf2\x59\x3c\x92\x17\x72\xc4\x14\xb1\xc8\xfc\x00\xe4\
+\x64\x55\xf7\xb1\xbe\xb8\x98\xcb\x14\x5b\x11\x48\xda\x4b\x7f\x2a\
+\xb9\x77\xa4\x1b\x0d\x15\xae\xe5\x77\x7b\xe9\x48\x08\xbf\xfd\x7e\
+\xb5\x3c\xb2\x93\xd0\x99\x5a\xda\x95\x04\x8e\xd6\x50\x86\x8f\xc9\
+\x71\xce\x37\x60\x10\x3d\x29\xfe\x6c\x3f\xdd\xb8\xff\x00\xc0\x93\
+\xfe\x14\x96\x36\x8d\x74\x9e\x65\xf4\xd2\xc6\xa8\x4e\xf9\x55\x73\
+\xec\x15\x73\xd4\xe3\x03\xf0\xa7\xec\xb1\xf4\xb9\xff\x00\xbe\x96\
+\xb0\x71\xd4\x3d\x9c\xfa\x0d\xbe\xb3\x92\x0c\x2c\xdb\xa3\x05\x94\
+\xe5\x81\xe0\x64\x67\x8f\x7f\xeb\x51\x5b\xc4\xad\x78\xae\xc8\x8e\
+\xc3\xa8\xce\x08\x1e\x9d\x33\xff\x00\xea\xad\x2d\x7f\x53\xb1\xd4\
+\x2d\xad\xd6\xd7\x50\x6b\x99\x14\xa8\x30\xb3\x72\xa7\xa7\xde\xfa\
+\xd6\x2c\x5e\x60\x85\x5a\x32\xc7\x70\xc8\x6e\xdf\x9e\x7f\xa5\x76\
+\xc6\x5c\xd1\xb9\x72\x56\x67\x5d\x05\xa0\xf2\x7c\xf5\x93\x0c\x0e\
+\x42\xee\xc8\x02\xaa\x6a\x36\xa0\x44\x04\x66\x15\x76\xe5\xb0\x79\
+\xff\x00\xf5\xd4\x3a\x75\xff\x00\xd9\xd0\x09\x19\xca\xb1\xc2\xe4\
+\x75\xf5\xfc\xaa\xd5\xd4\x91\x4a\x17\x11\xfc\xdd\x79\x38\x1f\x53\
+\x57\x7d\x08\xb1\xcd\xcd\x13\x43\x24\x6c\x5d\x95\x9c\x9c\xbf\x71\
+\x9e\x4f\xd3\x81\xdb\xd0\x7a\xd5\xab\xe8\x95\x34\xf0\x16\x5c\xbc\
+\x9c\x29\x6e\x71\xfe\x73\x4e\xbb\x92\x08\xdf\x77\x25\x14\x60\x9c\
+\x8c\x0e\xfc\x7e\x38\xcf\xff\x00\xaa\xa3\xba\x66\x9e\xd9\x09\x97\
+\x27\x1d\x07\x24\x9a\xc6\x4c\xd2\x27\x3d\x77\xe4\x40\x8c\xe8\xa1\
+\x5d\x50\x0f\x30\x28\x05\xb8\xef\xf5\xe7\xf3\xfa\x62\x84\x33\x33\
+\x6d\xc9\xd8\x9f\xc2\x1b\xf8\x14\x63\xae\x7d\xbd\x79\xad\x0b\xa9\
+\xd5\x50\x99\x57\x01\x49\x62\x5d\x79\xc0\x19\xce\x33\xec\x09\x18\
+\x3f\xd2\xb1\x6d\xff\x00\xd3\x6f\x70\x88\xd2\x30\x60\xa1\x19\x8e\
+\xd0\x41\xcb\x67\xd4\x8f\xe7\xdf\xa5\x4d\xee\x51\xdc\xd9\xdc\xc4\
+\x51\x42\x6e\x21\x06\x18\xf5\xfd\x08\xab\x3a\x9e\xab\x1d\xb5\x92\
+\xc7\x10\x67\x6c\x7d\xc0\x71\xd7\xd4\xd5\x4b\x20\xe2\x10\xd2\x4c\
+\xab\x12\xf4\x8e\x2c\x00\x4f\xae\x73\xcd\x56\xbe\xbb\x82\x28\x5a\
+\x28\xb9\x38\x27\x81\x93\x9f\xc7\xeb\x54\x99\x2c\xc8\x99\xec\x2f\
+\xae\x54\x5c\x45\xbc\xc4\x9b\xd5\x4e\x4f\x95\xee\x7b\x7a\x0f\x7a\
+\xa9\x3c\x10\x1b\x67\x33\x5d\x4f\x2a\x15\xda\x87\x71\xe8\x18\xb0\
+\xeb\xdc\xf1\xcf\xff\x00\xae\xa7\x68\x23\x92\xd1\x51\xd0\x34\xae\
+\x06\xe6\x5e\x37\x71\x93\xfe\x7d\xea\x5b\xd6\x99\xe1\x45\x5f\x2c\
+\x27\x95\xf3\x0e\xca\x3d\xbf\xc7\xd3\xeb\x55\x7e\xc4\xd8\xcd\xbd\
+\xb5\xf3\xbe\xcb\x3d\xac\xf2\x30\x89\xce\x58\xe7\x0d\xbb\x18\x6c\
+\x7e\x9f\x4a\xd2\xd3\xe0\xfd\xfb\xc4\xca\xd9\x24\xe5\x87\x6c\x0a\
+\x9b\xc9\x8e\x0b\x64\x68\xc6\x14\xc7\x1b\x64\x1e\x3a\x01\x8f\xc8\
+\x53\xb0\x12\xd1\x16\x26\x20\xca\x73\xc7\xf7\x46\x7f\x99\xfe\x55\
+\x9b\x77\x15\xf4\xd0\x85\xdd\xcd\xd9\xe4\x28\x62\x7d\xc6\xde\x83\
+\x1f\x4c\x7f\x3a\xea\x74\xdb\x79\x8e\x56\xd2\xd5\xae\xe5\x60\x3e\
+\x45\x60\xa0\x8c\x75\xc9\xe9\x59\x56\x56\x52\xdc\x5c\xa0\xda\x49\
+\xda\x3a\x0c\xf5\xe4\xff\x00\x3a\xde\x9f\x75\xb8\x16\xf6\x93\x2a\
+\x4b\x32\xed\x74\x90\x95\xc0\xc7\x5e\x05\x55\xd2\x45\x46\x37\x1b\
+\xe4\x6b\x9a\x75\xc8\xb8\x59\x2d\x60\x0e\xdf\x30\x64\xde\x18\xfa\
+\x6e\x07\x35\x7a\x3d\x7a\x0c\x4c\xba\x98\x87\xcb\x3c\x99\x63\xe4\
+\x31\xf4\xe7\xa5\x62\xc7\x6d\x6b\x6b\x14\x4a\xf7\x6b\x1b\x13\xf3\
+\x20\x73\xb7\x3e\xa7\x27\xde\xa4\xbf\x91\xef\x98\xa4\x22\xcf\x6c\
+\x27\x2d\x83\xcb\x73\xd8\x74\x34\x29\xb4\xac\x99\x5c\x89\xea\xc8\
+\xf5\x0b\xf8\xae\x67\x93\xec\xa6\x56\x81\x0f\x03\x04\x2c\x63\x8c\
+\x9c\x0e\x73\x55\x3f\xd1\x3f\xe7\xf6\xf3\xfe\xfa\x6a\xe8\x2c\x2f\
+\x66\xd3\x50\x98\xec\x97\xcd\x9c\x02\xd2\x34\x38\x56\x03\xd6\xae\
+\x7f\x6f\x6a\xdf\xf3\xeb\xa7\x7e\x62\xa6\xd1\x29\xb7\xd0\xe7\x6f\
+\xa4\xba\x89\x61\x8e\x6b\x18\x51\x43\x81\xbd\x54\x00\xe3\xb9\x38\
+\xfa\xd6\x6a\xdd\x93\x74\x23\x3b\x8a\x85\xda\x06\x39\xc8\x3c\x9e\
+\x7e\xb5\xd4\x78\x9e\xe5\xf5\x28\xed\xb7\x15\x51\x1b\xef\xdb\x18\
+\x03\x6a\xe3\x9c\x9f\xff\x00\x55\x73\xa2\x0c\x34\xf7\x05\x86\x08\
+\xc2\x00\x7e\x66\x1e\xa7\xda\xb5\x4a\xc8\xcd\xee\x28\x98\xf9\xc1\
+\x63\x90\xb6\xde\x0f\x23\x8f\xf3\xfd\x3e\x95\xb8\x92\x03\x1e\x64\
+\xc9\x38\xe0\xd7\x35\x60\xf9\xd5\xc4\x05\x10\x02\xdc\x2f\x01\x89\
+\xf4\x3f\xce\xba\x7b\xa8\xb6\x20\x07\x38\xe3\xf1\xa8\xbb\x4c\xab\
+\x23\x98\xd4\x59\xd2\x75\x31\x74\x53\xf2\x0c\xff\x00\x11\x3d\x4f\
+\xaf\xaf\xf8\xf7\x58\x9f\xcd\x94\x83\x21\xd8\x78\xc0\xe3\x77\xff\
+\x00\x5b\xa5\x52\xd7\x6e\x0a\x42\xeb\x0b\x00\x76\x95\x5e\xdc\x9f\
+\xe2\xfe\x63\xf5\xa5\x8c\x98\x6d\xa3\x2b\x9c\xaa\xa8\xa5\x6b\xb1\
+\x3d\x8c\xaf\x12\x5b\xb7\x9c\x23\x03\x6a\x1e\x73\x9c\x0f\xff\x00\
+\x57\xf2\xfc\x2b\x17\x4d\xd5\xe3\xb3\xbe\x2a\xa5\x76\x85\xc6\xf0\
+\xb9\xc9\xae\xa7\x5e\xb7\x7b\xcd\x14\x5c\x6d\xe5\x14\xe7\x8e\x71\
+\xc7\x40\x7f\x9f\xd7\xd2\xb8\x77\xb3\x91\xdc\xb8\x1b\x36\x8e\x14\
+\x2e\x06\x31\xfc\xe8\x51\xb0\xef\x75\x73\xb5\xd3\x35\xb1\x38\x04\
+\xe4\xa9\xc9\xf9\xbf\x87\xeb\xf9\x8f\xf2\x2b\x42\x4d\xb7\x19\x6c\
+\xaa\xa0\x5f\x94\x63\x92\x7f\xfd\x79\xae\x4b\x49\xb5\x92\x38\x0e\
+\x32\xa7\x3d\x3d\x2b\x76\x18\x88\x03\x74\x84\xe0\x74\x14\x2d\x49\
+\xb8\xdf\x2b\x6d\xc2\x16\x24\xab\xb6\x09\xce\x7f\x0a\xb3\x70\x63\
+\x7b\x48\x8a\x30\xde\x54\xa9\x3d\xdb\x07\x27\x3f\x99\xa8\xaf\xe3\
+\x2b\xa6\xbc\xd1\x64\x32\xf4\x27\xde\xb9\x65\xb9\x9a\x4b\x28\x8c\
+\x6e\xfe\x64\x73\xbf\x98\x0f\x20\x02\x17\x18\xf6\xe0\x9a\x96\x9a\
+\x64\xdd\xdc\xed\xd5\x56\x7b\x7b\x64\x04\x85\x54\x50\x39\xfc\x0f\
+\xf2\xa9\x5e\xde\x68\x66\x56\x8e\xdf\x3e\x78\xcc\x04\xf0\x0e\x3a\
+\xfe\x5f\xd6\xb1\xb4\xb9\xf6\xe9\xbf\x69\x94\x3b\x39\x4c\x22\x8c\
+\x70\x41\xc1\xe7\x3e\xf5\xa7\xfd\xaf\x3d\xd5\x9c\x2b\x6f\x22\xa4\
+\xf6\xff\x00\x29\x59\x97\xf7\x61\x49\xeb\x9c\x0f\x4c\x70\x4f\x5c\
+\xd4\x5d\x2b\x19\x36\xef\xa7\x43\x76\x07\x8a\x3b\xb4\x67\xc9\x81\
+\x0e\x19\xc7\xfb\x3c\x11\x5a\x57\x3a\xa6\x87\x72\xb2\x18\x15\xe7\
+\x2f\xf2\x89\x1c\x9c\x96\xf4\x1e\xb8\xac\x78\x2f\x21\x9e\x32\x7e\
+\xd2\xd3\xf9\x7f\x2b\x47\xf2\x85\x52\x72\x71\x81\xff\x00\xd7\xe9\
+\x5c\xb7\x88\x23\xd6\x92\xf1\xae\x74\xb4\x5b\xcb\x57\x51\x94\x8f\
+\x19\x8c\x71\x9e\x3b\xfe\x1d\x2b\x4b\x26\xf5\x67\x52\x93\xe5\xd0\
+\xea\xef\xad\x2d\xaf\x8c\x7b\xd4\x6f\x41\xd3\x8d\xae\x33\xd4\xe2\
+\xac\x68\xf6\xf6\x7a\x7a\x3c\x36\x97\x17\x2d\xab\xcc\x4f\x92\xa5\
+\x37\xa0\x1d\x86\x7d\x3d\xeb\x97\xd0\xa5\xd4\xee\x99\x55\xec\x2f\
+\x2d\x9a\x3e\xa2\x55\x60\x1b\x20\xe3\x93\xc1\xf5\xc1\xe7\x8e\x33\
+\x5d\x77\x9d\x15\xcb\x47\x6d\x15\x84\xb6\x93\x87\x0a\xb3\x44\x5b\
+\x9e\x3a\xfa\x7e\x3e\xd4\xe6\x92\xd9\x84\x64\xdb\xb0\x82\xf6\xf2\
+\xc6\xe4\x59\x5e\xd8\x33\x5c\xae\xd6\x61\xb7\x01\xc0\xce\x5b\x39\
+\x3d\xcf\x41\x53\xff\x00\xc2\x45\xa8\xff\x00\xd0\x26\xcf\xf3\xff\
+\x00\xeb\x53\xa3\xd0\xa3\x56\x92\x6b\xbb\xcb\x89\xe6\x42\x37\x49\
+\x8f\x35\x91\x7d\x3d\x07\xe3\x49\xb7\x40\xfe\xfd\xcf\xfd\xfa\x5f\
+\xf1\xac\xcb\xf5\x33\x5f\x55\xb4\xd6\x25\xdb\x6b\x74\xd3\x49\x83\
+\xba\x30\x80\x22\x72\x33\xce\x32\x3e\x84\xfa\x55\x2d\x52\xfa\x1b\
+\x32\x11\xf7\x00\x32\x3a\x64\x13\xe9\xc5\x6b\xdd\xdd\x3c\x50\xc3\
+\xb5\xa1\x45\x12\xfc\xef\x10\x20\x15\xe8\x72\x49\x3d\x33\x9c\xfb\
+\x57\x25\xe3\x5b\x73\xe7\xc6\x81\x57\x32\x0c\x00\x7b\xf6\xce\x3a\
+\x9a\xdd\x4a\xea\xc6\x2f\xe2\xb0\xed\x2b\x52\x32\x6b\x22\x4d\x9b\
+\x46\x70\x40\x6e\x31\xff\x00\xeb\xc5\x74\x57\x5a\xba\xb6\xfc\x1c\
+\x0c\x1c\x64\x7e\xb5\xc7\x78\x73\x4d\x75\x6f\x39\x94\x91\x0f\x2d\
+\xb9\xbe\x5c\xf5\xfc\x3b\xfb\xd5\xad\x75\x8a\x4c\x15\x5f\xf7\x3b\
+\x70\xbb\x7a\x67\xa6\x0f\xb8\xa9\x4c\x19\x4b\x57\xb9\xc3\x06\x07\
+\x27\xa0\xc7\x6e\xd9\xfe\x5f\x95\x5d\xb5\x99\x1b\x4c\x45\x66\x06\
+\x42\x77\x1c\x1e\xdf\xfe\xbc\xd6\x2c\xee\xbb\x87\x72\x14\x0f\xf3\
+\xf8\xd5\x78\x66\xfb\x30\x32\x3c\x9c\x67\x95\xcf\x6a\xa4\x84\xd9\
+\xdb\xc7\x0a\xbf\x86\x27\x91\x98\x00\x1d\x77\x1c\xf3\x5c\x5c\x11\
+\x31\xb9\x9d\x76\xef\x4e\x76\x20\x1c\x73\xcf\x5f\x4e\x07\xf9\xeb\
+\xd5\xe9\xf2\x7d\xb7\xc2\x17\x41\x18\x98\xda\x50\x58\x0c\x0e\x00\
+\xff\x00\x1c\x56\x3c\x56\xc8\x93\x94\x60\x44\xe0\xed\x2a\x57\x91\
+\xcf\xaf\xe3\x8c\x0e\x78\xf6\x34\x3d\xc1\x6c\x54\x85\xbe\xcb\x2f\
+\x93\xb4\xaf\x70\x0f\x6a\xd5\xb4\x47\x92\x62\xca\xa5\x91\xb9\x04\
+\xf6\xf6\xaa\x17\x2e\xc6\xf5\x61\x96\x31\x34\x1d\x50\x83\xf3\x21\
+\xcf\x66\x1f\xa8\xe9\xd7\xbf\x35\xd2\xc7\x68\x2d\x6d\x20\x55\x0c\
+\xe0\x90\x5c\x0e\x1b\x9c\xe0\x8f\x4e\x98\xfa\x9a\x87\x2e\x5d\x59\
+\x2d\xdb\x56\x36\x58\x62\x7d\x16\xec\x21\x24\xc6\x01\x24\xf7\xe7\
+\xa0\xae\x4a\x0b\x12\xb7\xb2\x46\x0e\x12\x46\xda\xa7\x1c\x72\x19\
+\x7f\xf6\x6a\xed\xa2\x92\xd6\x5b\x7b\x90\x55\xa7\x93\xe5\xda\xc8\
+\x0e\x10\x13\xc8\x27\x1c\x8c\xfa\xe3\x9e\xfc\x73\x84\xa0\x25\x92\
+\x7e\xe9\x5d\xc2\x6c\xdf\xc9\x2a\x43\x60\xfe\xa3\xf9\xd2\x94\x96\
+\xe1\x27\x66\x40\xd6\x9f\x6a\xf0\xe9\xb7\x89\x9c\x5c\x64\xa7\xc8\
+\x71\xb9\x89\x1b\x79\xed\x93\xfa\x53\x6c\x74\x0d\x76\xc2\xd7\xcc\
+\x94\xa2\x2a\xbf\xef\x23\x66\xcb\x2e\xc3\xfc\x27\xbf\x4e\xd5\xd1\
+\x59\xdb\xc4\xb0\xdd\x98\xe5\x00\x24\x80\x06\x38\x18\x24\x0c\x63\
+\xd7\x92\x3e\x9d\x6a\x7d\x48\x4c\x13\xed\x11\xa4\x92\xda\x81\x83\
+\x80\xa3\x18\x03\x39\xeb\xea\x3d\xab\x39\x34\xf4\x2a\x97\x2c\xdf\
+\x2b\x31\x66\xd3\x2c\xaf\x22\x8e\xe6\x66\xbb\x85\xc4\x89\x23\x2c\
+\x2c\x1b\xcd\x2b\x91\xd3\x1c\x02\x4b\xfe\x9e\xc2\xba\xd8\x75\x2d\
+\x3d\x47\x91\xa7\xe9\x68\x2d\xf8\x1e\x6c\xb1\x93\x27\x1d\xc8\x20\
+\x6d\xeb\xdb\xd6\xb9\x5b\x18\xc5\xd5\x9c\xb6\xf3\xca\x91\xb5\xb4\
+\x9b\x77\xb0\x04\x28\x05\x89\x63\xf8\xf1\xd7\xbd\x6f\x41\xf6\x94\
+\xd3\xe3\x89\xdf\xed\x22\x77\xc4\x68\xaa\x01\x7e\x3e\x5f\x94\x1c\
+\x8e\x39\xe7\xd3\x9c\x74\x0a\x15\x3d\xcb\xdb\x53\x38\x54\xf7\x6e\
+\xc7\x5d\x6b\x16\x9a\x7d\xd4\xa6\xf2\xe1\x40\xce\x15\x0e\x10\x06\
+\xc0\xe0\xf4\xe3\x8c\xfe\x7d\x2a\x4b\x7d\x51\x4e\x19\x2e\xa3\x5e\
+\x32\xca\x13\x69\x00\x9e\x9c\x72\x47\xb5\x49\x17\x85\x1a\xe2\x08\
+\x75\x78\xd5\xa6\x0f\x1f\x9a\x92\x46\x52\x4d\xad\xce\x54\x82\x32\
+\x3f\x0c\xe0\x8f\xad\x55\xfb\x5c\x56\x30\x86\x6d\x3a\x57\x42\xe3\
+\xfd\x53\x28\x69\x09\x20\x73\x8e\x40\x1c\x77\xfc\x07\x7b\x69\xe8\
+\x74\x42\x4a\xc8\x96\x78\x2d\xdb\xee\xbc\xb0\x46\xcb\x80\x60\x72\
+\x11\xff\x00\x11\xc7\x7e\xbd\x73\x57\x70\x9f\xf3\xe5\xff\x00\x8f\
+\x9f\xf1\xac\x69\x60\xb9\x77\x9e\x18\x4e\xec\xfe\xee\x35\xf2\xc9\
+\x66\xe0\x65\xb0\x07\x1d\x86\x3f\xd9\xc1\xe8\x6b\x03\xfe\x11\x9f\
+\x14\x7f\xd0\x66\x2f\xfb\xf6\x7f\xf8\x8a\x69\x0f\x9d\xb3\x4a\xfe\
+\xdf\x59\xb2\x1b\xcd\xb9\x63\x22\x14\x96\xd4\x82\xa6\x45\x20\xf3\
+\x96\xc0\xce\x3b\xfe\x5e\x94\xfc\xcd\xac\xda\x41\x3b\x47\xfb\xf8\
+\x9b\x63\x97\x18\xe4\xaf\x5f\x6e\x54\xfe\x75\x72\xea\x5f\x2b\x4d\
+\xb7\x6b\x59\x22\xbd\xb7\xdd\x84\x37\x4e\xf3\x94\xc8\x21\x95\x83\
+\x16\x27\x04\xae\x30\x48\x27\xa7\x71\x51\xd8\xce\xc2\x6b\x8f\x35\
+\x57\x33\x27\x9b\xb5\x46\xd1\x95\xc0\x3d\x79\xe9\xb4\xfe\x26\x87\
+\x35\x7d\x0e\x79\xbb\x4b\x52\xed\xad\x94\x70\xd8\x88\x63\xcb\xbc\
+\x8d\xb9\xcf\x70\xab\xc9\xfc\x38\x0a\x7f\xde\xae\x2f\x55\x69\x17\
+\x55\xb8\xb6\x99\x91\x6d\xbf\x74\x11\x9b\x8d\xb2\x30\x72\x1b\xe8\
+\x76\x90\x7f\x0f\x4a\xee\x20\x08\x93\x35\xc1\x96\x48\xb6\x3a\x28\
+\xc3\x8f\x95\x77\x80\xe7\x8e\xbd\xc6\x3d\xbb\xd6\xbd\x9c\x7a\x70\
+\xb7\xb4\xbe\x6b\x28\x1e\xe6\x48\x0b\xca\xac\x01\x3c\x63\x19\xcf\
+\xa7\xcd\xc7\xb9\xab\x52\x4f\x61\x37\x76\x78\x54\xf7\x72\x45\x2c\
+\x90\xc8\x9b\x64\x43\xb4\xa9\xe3\x91\xd6\xad\xdb\x5a\xc3\x71\x15\
+\xcc\x86\x51\x17\xd9\xd1\x58\xee\x19\x04\x13\x8f\x5e\xb5\xe8\xba\
+\xce\x9d\x67\xad\x32\xcb\x6d\x6b\x65\x34\x0e\x58\xa0\x64\xd9\x2e\
+\x3b\x85\x65\x3d\xba\x80\x72\x08\xe0\x74\xae\x3f\x58\xf0\x94\xb6\
+\xef\x3c\x9a\x7d\xec\x17\x56\xad\x6e\x6e\xbe\x62\x41\xc2\x0f\xba\
+\xc0\x0c\x9f\xbc\x4f\x6c\xe3\xb7\x35\x6e\x69\x21\xfa\x9d\x47\xc3\
+\xf8\x05\xd7\x84\x35\x01\xb8\x0c\x4f\x8c\x01\x8e\xdf\xad\x72\xfa\
+\xbc\xc2\xdf\xc4\x33\x2a\x1f\x90\x33\x00\xa0\x67\x01\xb3\xdf\xbf\
+\x61\xf8\x62\xba\x0f\x01\x93\xa4\x68\xba\x84\x2f\x20\x49\x19\x94\
+\xe4\x9c\xec\x6d\xa4\xe1\xbb\x03\xca\xf1\xd7\x9f\xcb\x37\xc4\x16\
+\xd6\xbf\x6f\xde\xcc\xe9\xe6\x20\x22\x4d\xbf\x29\x03\x8e\x40\xe7\
+\x8c\x7e\xb5\x32\x6b\x9b\x41\xf3\x24\x65\x0d\x42\xde\x09\xa3\x69\
+\x32\x31\x9c\x83\xc7\x7f\xd3\xa5\x6f\x5c\x6a\xd6\x17\xd1\xc5\x2a\
+\x49\x89\x91\x36\x02\x87\xe5\x03\x3d\xff\x00\xc2\xb9\x5d\x47\x4f\
+\x91\x22\x8e\xee\x76\x4f\xb2\xa2\x95\x67\x85\x81\xdc\x73\xc0\x1d\
+\x86\x72\x72\x4f\x40\x0f\x53\x80\x5b\xa7\xbc\x2b\x33\x40\xa1\xb6\
+\x32\x33\x32\x23\x60\xe0\x0c\xe5\x79\xfb\xdd\xc7\xe3\xda\x87\x69\
+\x45\xae\x81\xee\xc8\xed\xe0\x59\x25\xb7\x64\x8f\x50\x31\xc8\xed\
+\xb8\xa3\x27\x0c\x32\x0f\x6e\xb8\x21\x7d\x08\x1c\x1f\x7a\xd1\x08\
+\xe7\x4d\x42\x2d\x99\x22\x47\x64\x4f\x72\x37\x85\xfc\xc9\x15\x95\
+\x63\xaa\x49\x6f\x6b\x6d\x63\x2c\x8b\x2c\x2f\x0b\x5c\x5b\xdd\x31\
+\x20\x31\x59\x1c\xbf\x3d\x43\x6d\xc7\x1d\x8e\x7a\x8e\xba\x69\x78\
+\xd6\x9a\xbd\xd3\xdc\xdb\xee\x8c\xc7\xe6\x89\x21\xe1\x99\x55\x98\
+\x79\x9b\x7b\xf4\xc9\xc7\x41\xcf\x6a\xe5\xbf\x2b\xb3\x30\x7e\xeb\
+\x49\x97\x34\x89\xa4\x8b\x43\x86\x76\x40\xc5\xae\x44\x99\x23\xae\
+\xd5\x5e\x3f\x12\x71\xf8\x1a\xbf\x79\x77\xf6\x80\xb7\x72\x49\x22\
+\x22\xb1\x21\x51\x80\x53\xf7\x41\x07\x3d\xbe\x5f\xcb\x35\x8b\xa5\
+\x4e\x1b\x45\x8a\x05\x3e\x79\x8d\x77\x76\x24\x6e\x00\x90\x31\x91\
+\x80\x71\x92\x7a\x16\xe9\x52\x5d\x5c\xec\x48\x62\x11\xab\x85\x3b\
+\xdf\x7f\x20\x44\x30\xcc\x31\xc7\x04\x60\x75\x15\x9c\x25\xa1\x9c\
+\x66\xe3\x6b\x13\x43\x1c\x2b\xe2\x17\x82\xe6\x28\x5e\x29\x63\xdd\
+\xb5\x47\x52\x70\x09\xcf\xaf\x5f\xe9\xd4\xd2\x5c\x5d\x41\x6f\xa9\
+\xb2\xc5\x2f\x93\x1c\x07\x60\x78\x06\xd2\x31\xc1\x23\x1f\x85\x67\
+\x4b\x3b\x4a\xab\x7d\x10\x72\x11\x52\x36\x6d\xa4\xa8\x53\x10\x5e\
+\xbd\xbe\x65\x6e\xf5\x7a\x48\x67\x6b\xb9\xa4\xb7\x58\xc7\x95\x1c\
+\x92\x2b\x3f\xdc\xdf\xf2\xed\x0d\x9c\x7f\x11\x50\x47\xa5\x4f\x33\
+\x5e\xea\xee\x17\x6b\x63\x62\xce\x69\xaf\xed\x52\xf2\xde\x79\xa0\
+\xb7\x39\x8f\xcd\x4c\xe3\x03\xd7\xb7\x3c\x1c\xfa\x93\x48\xfa\x9c\
+\xd0\xc5\xb5\xfc\xa8\x2d\xe3\xdd\x87\x71\xcb\x95\xce\x48\x38\xe7\
+\xa1\x35\x83\xa9\x5e\xeb\xd3\x5c\x2d\x81\xbc\xe4\xc9\x9b\x84\x48\
+\xb0\x65\x94\x0d\xbe\x9b\x76\x2a\xae\x32\x3a\x90\x4f\x4c\x55\xfd\
+\x33\x51\xb8\x58\x1b\x4d\xb6\xf3\x26\x81\xe6\x53\xe5\xca\xa3\x63\
+\xaa\x92\x4e\xe1\xe9\xf2\x73\xcf\x46\xf4\xad\xe1\x59\x42\x5c\xab\
+\x63\x4e\x7b\x3b\x32\x5d\x03\x57\x29\x2d\xb5\xd4\x37\x2c\x1a\x39\
+\x1d\xc4\x85\xc9\x8d\x98\x83\xbb\x00\xf5\x4e\x5f\xa6\x39\x50\x79\
+\x1d\x7b\x4f\xf8\x49\x2e\x7f\xe7\xa4\xbf\xf7\xf4\x57\x9f\x6a\x6a\
+\xd6\x57\x9e\x45\xec\x70\xcc\x83\x70\xe1\x99\xd6\x63\x9c\x9e\x30\
+\x30\xa3\xe5\xe7\xa6\x4e\x01\xe0\x1a\x77\xf6\xc1\xff\x00\x9e\xb6\
+\x9f\xf7\xe2\x5f\xfe\x26\xaf\xda\xd8\xa8\xc6\xfa\x15\xed\x25\x25\
+\x6e\x26\xfd\xef\x98\x64\x49\x8b\xef\xc8\x90\xa8\xdc\x72\xa7\xbe\
+\x4f\xaf\xa0\xc8\xab\x96\xee\xb3\x3d\xb7\x94\x0a\xc6\x24\x48\xd0\
+\xb3\xe4\x39\x71\x8e\x00\x03\xa0\xc1\x27\xd5\x40\xae\x5c\x6b\xf1\
+\x5e\x5c\x4a\xb6\xd6\x63\xcb\x05\x98\x46\x25\x24\x46\x00\xe7\x92\
+\x01\x6e\xc7\x9e\x9e\xfd\x04\xfa\x66\xa8\xbe\x5c\x4d\x30\xd9\x0c\
+\x51\x31\x47\x55\xf9\x7c\xb2\xca\x0b\xe0\x1c\xe0\x16\x1f\x2f\x5e\
+\xe0\x64\x60\xf3\xb5\x2b\xea\x46\xad\xea\x6f\x5e\x5c\x08\xf4\xf9\
+\x61\x49\x99\xe5\x57\x58\x0c\x9b\xf2\x7e\x57\x04\x1c\x77\x25\x46\
+\x3e\xa2\x96\xc7\x53\xd4\xe3\x55\x70\xe8\x8b\x38\x23\x2f\xc9\x54\
+\xc3\x36\x71\xef\xb4\xf5\xf5\x15\x91\xfd\xa4\x97\x96\x31\xc5\x60\
+\xb0\x79\xa9\x22\x96\x94\xa6\x44\x8a\xac\x7a\xee\x5c\x80\x48\x53\
+\xc7\x23\x68\xeb\x93\x89\x22\xbd\xb8\x7f\xb4\xc9\x1c\xa2\x07\xc9\
+\x2d\x1a\xa0\x67\xcf\x56\xcb\x11\x81\x8f\x41\xd7\x20\xf5\xcd\x25\
+\x51\xc5\x7a\x0a\x52\xb1\xb7\x11\x8e\xda\x2b\xe8\xa6\x92\x21\x20\
+\x57\x7b\x64\x3d\x64\x55\x52\x50\xed\xec\x0f\xd3\x04\x11\xc6\x0f\
+\x0f\x8a\xfd\xad\x2d\xe3\x6b\x4b\x75\x2c\x59\xa4\x2d\xc7\x03\xef\
+\x60\xff\x00\xb2\x01\xff\x00\xf5\x66\xb9\xe8\x75\x14\x6b\x67\xdc\
+\xec\xe1\xd4\xfe\xf9\x98\x8c\xe3\x0a\x3e\x5e\x7a\x03\xd3\xb9\xc7\
+\x23\xa8\xd4\xbc\xd5\x90\x5d\x59\xc6\x21\xda\x65\xb7\x89\xc3\x02\
+\x3e\x5c\xa0\xe0\x7b\x02\x36\xf6\xfc\x68\x53\x6f\xa8\x73\xb6\x8a\
+\x76\x2f\x6b\xa1\xea\x3a\xae\x99\x6d\x1a\x82\x27\xf3\xa3\xf3\x49\
+\x21\x83\x8d\xca\x47\x3c\xe0\x30\xc9\xf7\x3f\x4a\xb3\x73\x39\x8e\
+\xd9\xb0\x41\x55\x70\xcd\x0b\xed\x21\x95\xbe\x5e\x41\xe8\x01\x03\
+\xfe\xfa\xc7\xd2\xcb\x42\x35\x17\xfb\x29\x61\x15\xcc\x90\x6e\x89\
+\x95\x17\x89\x06\xd1\xb4\x9c\x67\x6e\x03\x63\xd3\xe9\x80\x25\x83\
+\x45\x96\x25\xba\x13\x14\xf2\x62\x4f\x21\xae\x24\x50\x3e\x72\x41\
+\x0b\x85\x24\xf4\xc3\x03\xea\x3a\xfa\x6c\xa7\x75\xb1\x4a\x4e\x4b\
+\x63\x9b\xbc\xfb\x2c\xe1\x25\x37\x57\x1a\x54\xf1\x29\xdb\x25\xa2\
+\x19\x21\x55\xe0\x10\xe9\xd4\x8e\x3b\x71\xd6\xa1\x5d\x19\xa2\x11\
+\x6a\x02\x1b\x5b\xc2\x55\x8b\x5c\xe9\xe4\xf9\x60\x67\x00\x95\xe9\
+\xd8\xe7\x18\xc7\x23\x07\xad\x6f\xe9\x96\x1f\x62\xd4\x6e\x2c\xe5\
+\x59\x1a\x17\xda\x30\x02\xba\x80\x59\xba\x96\x61\xc7\x41\x80\x3d\
+\x7a\x63\x98\xef\x74\x88\x74\xb1\x7a\x96\x17\x26\xc7\x74\xbc\xc9\
+\x1a\x02\x42\xed\x04\x29\x4e\x14\x8c\x16\xee\x78\x20\xe7\x3c\x07\
+\x7f\x74\x6d\x2e\x5b\xa3\x3a\xd6\xca\x3f\xec\x76\xb7\xd4\x58\xa5\
+\xcd\x85\xcb\x2c\x2d\x9c\xfc\x85\x37\x0f\xc1\xd4\xaf\x3e\xcb\x52\
+\xde\x5d\x45\x73\x67\x8f\x2e\x48\xe5\x4b\x17\xb6\x65\x70\x3e\x62\
+\xbd\x46\x73\xd4\x1c\x1c\x63\xf9\x53\xa4\xfb\x64\x5a\x3c\xf7\x52\
+\x29\x82\xe5\x2d\xdd\x61\x92\x27\xff\x00\x59\x1f\x19\x04\x03\xdb\
+\xe6\xc1\xfe\x9c\x55\x2d\x53\x51\x92\x68\xd4\xb3\x79\x86\x74\x59\
+\x99\xd7\x8d\x99\x20\xf4\xef\x92\x3a\xfd\x6b\x9e\x53\x7d\x49\x72\
+\xe6\xdc\xb3\xa4\xda\x79\x73\xcd\x1a\xce\x36\x40\x42\xc9\x19\x03\
+\x63\xa3\x71\x9c\x8e\x84\x1c\x1f\x7f\xd6\xac\xda\xdd\x49\x71\x19\
+\xbd\x2e\xb1\x3b\x05\x29\xc6\x30\xb9\x3c\x0f\xc3\x69\x3f\x8d\x43\
+\x2c\x11\x7f\x65\xc3\x75\x6c\x4a\xad\xc2\x98\xae\x77\xfd\xe5\x60\
+\x06\x36\xe3\x8c\x15\x39\xe7\xbf\x7e\xd4\xfb\xd9\x63\xd4\x6d\xed\
+\x63\x88\x7d\x9d\x22\x42\x8b\x9c\x9c\x05\xc7\x1c\x7a\xf4\xff\x00\
+\xf5\xd6\x7c\xce\xd6\x31\xbd\xb6\x25\xd3\x67\x68\x74\x65\x43\x70\
+\x63\x3b\xbc\xf5\x46\x1b\x91\xbe\x65\xe0\x82\x70\x7b\x0f\xa6\x7b\
+\x0a\x7d\xab\xc9\x75\x69\x2d\xd8\x0e\xd3\x30\x24\x36\x38\x8d\x55\
+\xb3\x85\x3d\x72\x49\x27\xdf\x15\x42\xc6\xf5\x86\x9f\x37\xda\x36\
+\x98\x0c\x46\x18\x43\x0c\x85\x3b\x89\x38\x1e\xa7\xa8\x3e\xe3\xa7\
+\x38\x6c\x9a\xb4\x44\x41\x0c\xc5\x80\x2c\x76\x47\x9d\xa9\x18\xc7\
+\x21\x42\x83\x8c\xfa\xf5\xa2\xf6\xd0\x13\x34\x35\x7d\x4e\x5d\x43\
+\x59\xbb\xd4\x41\x65\xf3\x23\xdd\x1b\xae\x0f\xdf\x63\x8f\xfc\x77\
+\xf9\x63\xa5\x55\xb3\xbc\x3f\x67\x44\x0f\x2e\x62\x03\x2c\x4f\x54\
+\x3e\x9e\xbd\x49\xed\x50\xcb\xa9\xda\x5b\xeb\x92\x1b\x8b\x76\x78\
+\x50\xf9\x73\xa7\x46\xca\xf4\x0b\x83\x8c\x80\xcb\xed\xf5\xeb\x57\
+\x26\xb1\xb8\x59\xe2\xb2\x3b\x59\x26\xb7\x58\xa1\x93\x20\x1c\x38\
+\xc8\xec\x48\x39\x2d\xce\x7a\xf2\x00\xaa\xbb\xdf\xa8\x5f\x5b\x96\
+\xad\xe6\xfe\xd4\xb8\x65\xb9\x57\x09\x0b\x32\xec\x27\x80\xec\x78\
+\x19\x18\xfa\x63\x8e\x4e\x33\xd3\x13\x7f\xc2\x3b\xa8\xff\x00\x7e\
+\x6f\xfb\xf2\xff\x00\xe1\x50\xdb\x5f\xb6\x9b\x6e\xd6\xa6\xde\x34\
+\x62\xac\xa6\x5f\x2d\x5c\xbb\x64\x93\xb8\xf0\x48\xc9\x23\x19\x3f\
+\x8e\x6b\x37\x1a\xdf\xfc\xf5\xff\x00\xc8\xe6\x89\x59\x74\x34\xe7\
+\x7d\x0f\xff\xd9\x00\xff\xe2\x02\xb0\x49\x43\x43\x5f\x50\x52\x4f\
+\x46\x49\x4c\x45\x00\x01\x01\x00\x00\x02\xa0\x6c\x63\x6d\x73\x04\
+\x30\x00\x00\x6d\x6e\x74\x72\x52\x47\x42\x20\x58\x59\x5a\x20\x07\
+\xe4\x00\x09\x00\x0c\x00\x00\x00\x1e\x00\x1e\x61\x63\x73\x70\x41\
+\x50\x50\x4c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf6\xd6\x00\
+\x01\x00\x00\x00\x00\xd3\x2d\x6c\x63\x6d\x73\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0d\x64\x65\x73\x63\x00\
+\x00\x01\x20\x00\x00\x00\x40\x63\x70\x72\x74\x00\x00\x01\x60\x00\
+\x00\x00\x36\x77\x74\x70\x74\x00\x00\x01\x98\x00\x00\x00\x14\x63\
+\x68\x61\x64\x00\x00\x01\xac\x00\x00\x00\x2c\x72\x58\x59\x5a\x00\
+\x00\x01\xd8\x00\x00\x00\x14\x62\x58\x59\x5a\x00\x00\x01\xec\x00\
+\x00\x00\x14\x67\x58\x59\x5a\x00\x00\x02\x00\x00\x00\x00\x14\x72\
+\x54\x52\x43\x00\x00\x02\x14\x00\x00\x00\x20\x67\x54\x52\x43\x00\
+\x00\x02\x14\x00\x00\x00\x20\x62\x54\x52\x43\x00\x00\x02\x14\x00\
+\x00\x00\x20\x63\x68\x72\x6d\x00\x00\x02\x34\x00\x00\x00\x24\x64\
+\x6d\x6e\x64\x00\x00\x02\x58\x00\x00\x00\x24\x64\x6d\x64\x64\x00\
+\x00\x02\x7c\x00\x00\x00\x24\x6d\x6c\x75\x63\x00\x00\x00\x00\x00\
+\x00\x00\x01\x00\x00\x00\x0c\x65\x6e\x55\x53\x00\x00\x00\x24\x00\
+\x00\x00\x1c\x00\x47\x00\x49\x00\x4d\x00\x50\x00\x20\x00\x62\x00\
+\x75\x00\x69\x00\x6c\x00\x74\x00\x2d\x00\x69\x00\x6e\x00\x20\x00\
+\x73\x00\x52\x00\x47\x00\x42\x6d\x6c\x75\x63\x00\x00\x00\x00\x00\
+\x00\x00\x01\x00\x00\x00\x0c\x65\x6e\x55\x53\x00\x00\x00\x1a\x00\
+\x00\x00\x1c\x00\x50\x00\x75\x00\x62\x00\x6c\x00\x69\x00\x63\x00\
+\x20\x00\x44\x00\x6f\x00\x6d\x00\x61\x00\x69\x00\x6e\x00\x00\x58\
+\x59\x5a\x20\x00\x00\x00\x00\x00\x00\xf6\xd6\x00\x01\x00\x00\x00\
+\x00\xd3\x2d\x73\x66\x33\x32\x00\x00\x00\x00\x00\x01\x0c\x42\x00\
+\x00\x05\xde\xff\xff\xf3\x25\x00\x00\x07\x93\x00\x00\xfd\x90\xff\
+\xff\xfb\xa1\xff\xff\xfd\xa2\x00\x00\x03\xdc\x00\x00\xc0\x6e\x58\
+\x59\x5a\x20\x00\x00\x00\x00\x00\x00\x6f\xa0\x00\x00\x38\xf5\x00\
+\x00\x03\x90\x58\x59\x5a\x20\x00\x00\x00\x00\x00\x00\x24\x9f\x00\
+\x00\x0f\x84\x00\x00\xb6\xc4\x58\x59\x5a\x20\x00\x00\x00\x00\x00\
+\x00\x62\x97\x00\x00\xb7\x87\x00\x00\x18\xd9\x70\x61\x72\x61\x00\
+\x00\x00\x00\x00\x03\x00\x00\x00\x02\x66\x66\x00\x00\xf2\xa7\x00\
+\x00\x0d\x59\x00\x00\x13\xd0\x00\x00\x0a\x5b\x63\x68\x72\x6d\x00\
+\x00\x00\x00\x00\x03\x00\x00\x00\x00\xa3\xd7\x00\x00\x54\x7c\x00\
+\x00\x4c\xcd\x00\x00\x99\x9a\x00\x00\x26\x67\x00\x00\x0f\x5c\x6d\
+\x6c\x75\x63\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x0c\x65\
+\x6e\x55\x53\x00\x00\x00\x08\x00\x00\x00\x1c\x00\x47\x00\x49\x00\
+\x4d\x00\x50\x6d\x6c\x75\x63\x00\x00\x00\x00\x00\x00\x00\x01\x00\
+\x00\x00\x0c\x65\x6e\x55\x53\x00\x00\x00\x08\x00\x00\x00\x1c\x00\
+\x73\x00\x52\x00\x47\x00\x42\xff\xdb\x00\x43\x00\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\xff\xdb\x00\x43\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\xff\xfe\x00\x54\x46\x69\x6c\x65\x20\x73\x6f\x75\x72\x63\x65\
+\x3a\x20\x68\x74\x74\x70\x3a\x2f\x2f\x63\x6f\x6d\x6d\x6f\x6e\x73\
+\x2e\x77\x69\x6b\x69\x6d\x65\x64\x69\x61\x2e\x6f\x72\x67\x2f\x77\
+\x69\x6b\x69\x2f\x46\x69\x6c\x65\x3a\x4a\x61\x63\x6b\x5f\x52\x61\
+\x62\x62\x69\x74\x5f\x28\x31\x34\x33\x39\x38\x36\x32\x39\x35\x30\
+\x38\x29\x2e\x6a\x70\x67\x00\xff\xc2\x00\x11\x08\x01\xed\x01\x28\
+\x03\x01\x11\x00\x02\x11\x01\x03\x11\x01\xff\xc4\x00\x1d\x00\x00\
+\x02\x03\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x06\
+\x07\x04\x05\x08\x03\x09\x02\x01\x00\xff\xc4\x00\x1c\x01\x00\x02\
+\x03\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x04\
+\x01\x02\x05\x06\x00\x07\x08\xff\xda\x00\x0c\x03\x01\x00\x02\x10\
+\x03\x10\x00\x00\x01\x81\xf9\xfa\x03\x32\xc5\xcf\x5c\x66\x7e\x1d\
+\xd1\x2a\x54\xc3\xc3\xd4\xb8\xa4\x8e\x79\x28\x2b\x9b\x97\x4a\x15\
+\x49\x61\xbb\x4b\xea\xd2\x98\x07\x3e\xd1\xbc\xad\xef\x44\xd0\x0d\
+\x8f\x7e\xd2\x03\x29\x50\xb6\xfa\xf6\x2d\x8c\xa8\xb7\x19\x4b\x45\
+\x75\x45\xa2\xee\xe7\xc5\x03\x8c\xe9\xd1\x20\xb2\x04\x46\x56\xc0\
+\x9a\x16\xc4\x72\x85\x1a\xac\x88\x30\xa1\x45\xb7\x87\x1c\x89\x54\
+\x65\x62\x8b\xe7\xae\x1a\xd5\x79\xad\x5b\xa8\xcb\x62\x39\xab\x00\
+\x73\x3d\x8a\xd2\x33\x4a\x98\xcf\x8a\x9b\xa5\xd6\x3d\xe4\x98\x40\
+\x34\x65\x37\xa2\x63\xe6\x3e\x4b\x71\xb1\x5a\xa5\x4c\xfe\xc2\x1b\
+\x07\x47\xa0\x9e\xd2\x9d\x02\xc0\xc2\xfa\xf5\x97\x04\x3e\x83\x2e\
+\x89\x59\x25\xa1\xa0\x93\x20\xd3\xcc\xba\x8d\xa7\xde\xe4\x5e\xa6\
+\x90\xb1\x99\x1b\xb1\xeb\x08\x30\x9a\xaf\xcf\x0b\xe7\xb1\xc5\x35\
+\x3e\x7c\x7d\x22\x52\x1b\x2a\x50\x0a\x61\x7d\x0f\xa9\xa5\x3b\xb9\
+\x96\x34\x72\xfc\x8d\x08\x2c\xb9\xcd\xb5\xcd\xdc\xd7\x85\x6c\x58\
+\x2a\x2b\x66\x5d\x1e\x63\x9a\x6c\xfa\xb6\x34\xdb\xb6\x7b\x68\x82\
+\x73\x18\x8e\x5c\x3d\x23\xad\x54\x56\x67\x60\xaf\xdf\xaa\x1d\xcf\
+\x88\x50\x4b\xb1\x58\xd1\x74\xba\xcd\x70\x57\x5b\xaa\xb9\x64\x39\
+\x11\xe6\xbb\x6a\xb2\x0c\x52\x24\x7e\x73\xf3\x2f\xc2\x39\x49\xe6\
+\xa0\xd1\x90\xdb\xe0\x95\xde\x0d\x8b\xd3\xb0\xab\x2a\x7b\x63\x9d\
+\x0b\x63\xe6\x8a\x0f\x9d\x66\x61\x77\xae\x86\xea\xd6\xdc\xd8\x24\
+\xf3\xd1\x21\xb2\x95\xae\x39\x83\x7d\x99\xd2\xf4\xbf\x87\xd2\x24\
+\x2e\x73\x29\xd2\xd5\x00\xf9\x87\x2c\x20\x6d\x52\x73\x79\xf4\x6b\
+\x67\x54\xb8\x44\x77\xd6\x48\xc8\xcc\x7f\x4f\xfc\xf9\xa0\x84\x31\
+\xed\x46\x52\xc7\x1b\x2d\xdc\x77\xed\xa5\x73\x77\x15\x9d\x1e\xb6\
+\x0d\xf2\x94\x4a\x31\xf6\xd6\x43\x7d\xfd\x07\x5b\x7a\x86\xce\x95\
+\x18\xb6\x72\xa7\x24\x35\x6b\x58\xba\xa6\x2e\x2e\xab\x0e\xc7\x53\
+\x46\x02\x55\x5e\x7a\x9d\xc8\x61\xe6\x94\x35\xcd\x0a\xce\xc7\x6c\
+\x91\x42\x6f\xec\xcb\x5a\xd6\xc1\xa0\x2a\x45\x7f\x77\x3f\x95\x71\
+\x92\x2f\x5e\x77\x39\x7d\x0d\xec\x93\xdf\x32\x5e\x23\x6f\xce\x05\
+\xbd\x19\xcb\x82\xb4\x42\x31\xa4\xf2\x69\x63\x17\x55\x4d\x73\xfb\
+\xdf\xcc\x02\xf2\xc3\x06\xca\xb2\xd6\x32\xdd\x9a\x1a\xcc\xbd\x10\
+\x0e\x02\x60\x48\xd6\x4a\x28\x3a\x21\x7d\xa5\xa0\xc5\x2b\x4d\x1d\
+\x46\x43\x52\xa2\xa5\x5c\xca\xad\xac\x1e\x8b\x69\x9c\x7d\x07\x75\
+\x13\xa6\x64\xc1\x3c\xeb\xe6\xef\xbd\x38\x11\x0b\xcd\x94\x5e\xcc\
+\xb3\x76\x81\x6b\xdc\xd2\xd5\xf3\x9b\xe9\xcc\xac\x7a\x98\x7b\x64\
+\xb9\x3a\xd5\xf4\x67\xe6\x66\xa1\x5d\x0b\x24\xd2\xa5\x40\x45\xcc\
+\x89\x75\x6e\x83\xf8\xc8\x9c\x9f\x48\x4b\x38\x79\x85\x2c\xc6\xe6\
+\x93\x5c\xc2\x99\x29\x26\xcc\xe5\x12\xa6\x50\x72\x23\x61\x0d\xc8\
+\x3a\x01\x2a\x7e\xc3\xf9\x1a\x24\x34\xd1\x04\xaf\x2f\x33\xba\x77\
+\x4e\xf7\x3a\xd9\x42\xe6\xcc\x79\xcd\x5a\xd4\x5a\xd3\x85\x5c\x87\
+\x9e\xc8\x5a\x42\x4d\x97\xd8\xad\xa1\x8d\x08\xff\x00\x8d\x1f\x57\
+\x1b\x65\xe6\x34\x9a\x0e\xe7\x86\x16\xdc\xbc\xc3\x4c\x1e\x00\x82\
+\x08\x61\x70\x5f\x0c\x91\xf6\xd1\xe6\x70\xb8\x8e\x12\xd8\xf7\x2d\
+\x05\x3a\xbc\x5e\x48\xe8\x11\x96\xdb\x9a\x95\xf0\x35\x6a\x39\x01\
+\x02\xcd\x6a\x5d\x9e\xac\xcd\xa9\xa0\x33\x2e\x69\x42\xd4\xf5\xf3\
+\x74\x17\xd9\x9f\xb3\xe9\x34\x73\xa0\x49\x96\xd2\xd1\x90\xb1\x0a\
+\x6c\x9e\x89\xf9\xe7\x21\x17\x32\x9a\x01\xbd\xeb\x03\xd0\x7c\xc2\
+\xf1\x13\xea\xf3\xeb\x80\xb4\xea\x80\xc6\x58\xba\xef\xe5\xaa\xf3\
+\xf9\x30\x90\x78\xd9\x6d\x03\x8e\x49\x35\x12\x9a\x18\xf2\xbc\xf3\
+\x1c\xae\x8b\x4a\xff\x00\xb6\x60\xa6\xca\xd4\x12\xd6\x40\xd1\xe7\
+\x20\x5c\x25\x9c\xb8\x5f\x2e\xfe\x55\x33\x33\x8f\xcd\xdb\xae\xb2\
+\x1c\x00\xc5\x1c\x65\x8b\xaa\x7e\xea\xe0\x7e\xd3\x2b\x45\xee\xa1\
+\x4f\x4c\x03\x3b\x4f\xf0\xaa\xb4\x56\xc3\x67\x7c\xd3\x9a\x70\xea\
+\x38\x42\xd0\x51\x8e\xdf\x0b\xfd\x21\xff\x00\x6a\xd7\xd3\xcb\x55\
+\x94\x1b\xc1\x62\x24\xa3\x2f\xe3\xc8\x73\xcc\x5e\xff\x00\x47\xc1\
+\x6b\xb2\x34\xf5\xc2\xc5\x7b\xe2\x12\xc2\x7c\x27\x9b\x3d\x18\x04\
+\x67\x03\xd1\x66\x2f\x66\x87\x21\x62\x88\x2b\x28\x3d\x8b\xde\x5c\
+\x64\x39\xa5\x10\x42\xb7\x5c\x1c\xbd\xa5\xa4\xbe\xd6\x6c\xf4\x7b\
+\x7f\x0d\x81\x14\xb4\x87\xb3\x36\x62\x84\xda\x17\x7f\x99\x57\x71\
+\xb9\x0e\xae\x77\xdc\x4f\x97\x96\x37\x8b\xb2\x3e\x8e\xe3\x61\x2d\
+\x4c\x9c\x71\x29\x5a\x51\x9e\x9a\xe5\x7f\x1b\xcd\x31\x4e\x43\x02\
+\x8f\xeb\x3b\x73\x5c\x69\x6d\x09\x55\x08\x9f\x8a\xde\x41\xac\x5d\
+\xb6\x9f\xce\x68\xc8\x5c\x74\x1d\x00\xc2\x49\xe7\x10\xde\x56\xc6\
+\x50\x05\x94\x35\xb6\xad\xd0\x5c\x72\xeb\x67\x48\xd5\x08\x2f\xd1\
+\xb4\x13\x22\x35\x8d\x5c\x9c\x83\xc2\x99\xfb\x07\x41\xa9\x86\xb6\
+\x38\x06\xa7\x3a\xc2\xf9\xb3\x15\x48\xe4\x66\x4e\xa4\x1e\xe2\x7d\
+\x15\xdc\xc1\x93\xad\x8c\xf4\x02\xb9\x94\xda\x69\xd0\xaf\xe3\x58\
+\x46\xc1\xbb\x4f\x47\x40\x2d\x6d\xa5\x38\xa8\x23\x8f\x9d\x0f\x4e\
+\xd5\xcd\x6b\x4e\x09\x82\x21\x07\x7e\xfa\x64\x98\xbb\x15\xc0\x78\
+\x4a\x04\x44\x33\x52\x5d\x09\x27\xc2\x30\x23\x96\x75\x3d\x89\xc4\
+\xc2\xdc\x5b\x26\xf6\xda\x28\xf5\x9f\x6b\xdc\xd6\xc8\x69\x7f\x67\
+\xe9\xdf\x5e\x84\x8e\xe7\xe8\x6e\x97\x97\xf3\x63\x96\x5b\x48\xf0\
+\x59\xe6\x7d\xf5\xfd\x24\xec\x5a\xc4\x59\x5a\x98\xbd\xf0\x83\x5d\
+\x33\xac\xda\x19\xfc\x5b\x9e\x2c\x0e\xbb\xab\x73\x5d\x23\x9f\x68\
+\x42\xd2\x4e\xd1\x31\xf7\x74\x78\x43\xa5\xe2\xa2\x89\xec\x83\x5c\
+\xea\x69\xf8\xd6\x64\x3a\x7b\xf5\xd0\x5f\x24\x02\x5d\x2c\xc1\x17\
+\xf0\x93\xc1\x78\xd8\x42\x23\x5d\xad\x37\xd3\x9f\xcd\xfe\xdd\xc4\
+\x7a\x7a\x7a\x08\x97\xea\x86\x9c\xdc\xed\x2b\x9b\x54\x9d\xa4\xb7\
+\x27\x59\xc6\x78\x49\x98\x2f\x41\x3e\x6e\x86\xb2\xfa\x02\x8d\x6d\
+\xcd\xdc\x6d\x9d\xa1\x89\xf4\x55\x08\x22\x0d\x5c\xd1\x3a\xbe\x3d\
+\x9e\xce\x61\xfa\x61\x5d\x36\x36\xd8\xd6\x6d\x46\xde\xe4\x49\xd3\
+\xee\x39\x02\xa0\x81\xda\xcc\x77\x29\x97\xa1\x12\xd4\x6c\xeb\x5b\
+\xf5\x64\x33\xd2\x99\x51\x8d\x9b\xf9\x71\xaf\xa7\x42\xe8\x7e\x62\
+\x54\xda\x9b\x7e\x70\xaf\xd0\x8f\x91\xb3\x35\x9e\x85\xb9\x12\xba\
+\x95\x39\x9a\x85\x94\xf3\x0b\x4b\x3b\x69\xf5\x9c\x47\x8b\x4a\x51\
+\xa7\xf3\xf4\xfd\x49\xec\x10\xb9\xd8\xe9\x31\x1e\x6b\xb8\xc3\x51\
+\x10\x88\x4f\x48\x20\x9b\x8b\xe6\x38\x25\x7a\xc4\x0f\xe7\xf4\xa6\
+\xdb\xa3\x33\xa1\x17\xcf\x6a\x0c\x2a\xc1\xcc\x3e\xbf\xf5\x40\x25\
+\x57\xd2\xc1\x74\x8e\xdc\x5d\x4d\x5b\x39\x9d\x2d\x01\x2c\x58\xe8\
+\x4a\xac\xd3\xd4\x22\x16\x75\x12\x8a\x10\xba\xc9\x17\xd9\x3d\x82\
+\x70\xfa\x06\xe9\xfc\x5a\xbb\xd4\x79\xba\xe6\x43\x21\x6e\x86\x5e\
+\xf0\xeb\xf8\xbf\x14\x91\xad\x97\x36\x1f\x5c\xdd\x52\x6e\xce\xf6\
+\x39\x56\xfe\x7d\xbe\xad\x74\x27\xae\xb2\x73\x5a\x5c\x6f\x3e\x40\
+\xcb\xa9\x0c\x25\xf4\xc6\xcf\x51\xfb\xca\xef\x3e\xf4\x59\x5f\x82\
+\x93\x09\xad\x7b\x11\x6a\x20\x7c\xc4\x2e\x56\xa4\x76\x1b\x07\xae\
+\x57\x7b\x2b\x75\xa3\x51\xf5\x47\x75\x65\xc4\x14\xaf\xd9\x32\xbf\
+\x8d\xa2\xd5\xfa\xbf\xbc\xa2\xca\xe9\x5b\xa4\x83\x1a\xb3\x07\x23\
+\x6b\xef\xcc\x34\xdc\xcc\xde\x3d\x3f\x1d\xe3\xf2\x82\x47\x81\x3f\
+\x71\x6e\x21\xe2\x74\x38\xdc\x5e\xc9\x5a\x28\xaf\xfc\xae\xf5\xe2\
+\xf2\x89\xf9\xfc\x4a\xb7\xac\x0d\x8d\x3a\xed\xfe\xb6\xcf\x3f\x41\
+\xb9\xa2\xcd\x62\x29\xdd\x79\xa0\x36\xcd\x3a\x69\x77\x94\xc4\x09\
+\x8b\x03\xe9\xaa\xc5\x9d\x57\x7a\x11\x44\x05\xc6\x67\xf3\x59\x34\
+\x14\xcf\x8b\x1e\x29\xcf\xd5\xd1\x1f\x51\x37\x86\x26\xdb\x38\x09\
+\x9e\xc6\x30\x56\x3e\xd9\xe5\x18\xbe\xd5\xcd\xde\xbb\xbc\x9f\x8f\
+\x49\xce\x5f\x84\xbd\xcb\x21\xa9\x01\xa9\x98\xae\xbe\x45\xd1\xce\
+\x00\x05\x3d\x07\xf9\xbe\x21\xf2\xd9\x35\x2c\xe6\xa3\xf2\xab\xa3\
+\x03\xd1\x68\xc6\x3a\x68\x6f\x35\x1f\x35\x3a\x59\xa4\x5b\xe9\xd9\
+\xcc\x98\xa5\x2c\x3d\x2b\x56\xdb\x6a\xba\x15\xac\x2a\xb1\x54\x5c\
+\x0c\x81\x17\x14\x2f\x86\xb4\xf5\xd1\x61\x91\xe7\xa7\x49\x6f\x27\
+\x7a\xed\x15\xd0\x1d\xd3\xa7\x08\x96\x77\x41\x64\x83\x6d\x9d\xbc\
+\xbd\x89\xb5\xcb\xf8\xbe\x81\x73\x9d\xd2\xf4\xc4\xad\x16\xa0\xf6\
+\x71\x77\x35\x28\xea\x57\x8a\xc6\xa8\xf9\x6f\x36\xd0\xb2\xa0\x85\
+\x49\x7e\x14\x49\x46\xf6\xc5\xb7\xd1\x58\x6d\x30\x37\x9b\x55\x72\
+\x99\x93\xd8\xda\x29\x24\x7d\xeb\xa3\x3c\x24\x69\x83\x5b\x94\xd6\
+\x52\xd3\x58\x75\x57\xc1\x04\x95\x86\xa8\x5a\x43\x42\xad\x24\xc1\
+\x43\xe8\x17\xfd\x4b\x57\xca\x25\xba\x17\xf4\x0d\xe6\x46\x41\xb2\
+\xba\x03\xfd\x0c\xfd\x31\xb9\xc8\xf8\xdc\x81\x13\x04\x4f\x63\xdd\
+\x96\xaa\x2e\xe6\xb7\x73\x7f\x99\x01\x52\xa2\x6b\xfc\xbb\x95\x6d\
+\xda\x94\x99\xe7\x52\x0f\x0a\x0e\x89\x7d\x06\xdb\xfa\x5c\xcc\x52\
+\xb2\x45\xa5\x4a\xa2\xea\x70\x54\x8a\xd1\xf1\x7c\xa5\xe0\x25\xbf\
+\xb5\xa5\x7a\xd8\xc7\x83\xa1\x48\xaa\xa3\xc2\x5c\x98\xca\x56\x27\
+\x7a\x00\xeb\x0a\xa4\x1a\x40\xe4\x68\x5f\xa1\x0b\xcf\x5e\xbb\xa4\
+\x53\xa0\xde\xbc\xd1\x47\xbe\x7e\xe4\xd3\x91\xe1\xad\xca\xf8\xd8\
+\x9c\x06\xb0\xa3\xee\x8c\xba\xd3\x77\x32\xb1\x9d\x11\xc1\xb1\xf1\
+\xd4\x75\x7c\x8b\x9b\x79\x3f\xe2\x61\xbc\x80\x4b\x00\x43\x46\xfe\
+\x8b\xeb\x7d\x65\x5b\x9b\x9e\xd9\x63\x67\xb2\x40\xed\x5a\xf5\xb4\
+\x74\x12\x54\x05\xad\x4c\x58\xe1\xdd\x50\x09\x42\xb5\x64\x94\x56\
+\x55\xee\x0d\x1a\xf1\xe9\x54\xdd\xf5\xdd\x55\x18\x41\x0b\xb6\x90\
+\xd7\x3f\x58\x4b\xcc\x82\xed\x95\x41\x1c\x04\x6c\x58\x7a\x26\x3a\
+\x3c\xaf\x9a\x6a\x11\x56\xde\x7b\xd4\x2c\xb2\x93\x75\x20\x7c\xe0\
+\xe7\x06\xf9\xe7\x54\xd2\x9f\x2d\xe7\xac\x54\x25\x1e\xa2\x74\x2a\
+\x83\xa3\xa6\xf5\x03\x43\xea\x19\x09\x5c\x9d\x3f\xaf\xb1\x4e\xac\
+\x2f\xb3\x08\xe0\x35\x06\xd9\x50\x0d\x8a\xc7\x18\x9b\xd7\xd8\x06\
+\x4f\x22\xc4\x6d\xa0\x6d\x98\xf1\x67\x61\x58\x36\x86\x0a\x66\x0f\
+\xa4\x43\x29\x16\x53\xd5\x09\x26\x36\xe2\xfa\xbe\x7f\x9d\xa1\xdf\
+\x71\x90\xb9\xad\x1e\x82\x6b\x9c\xb7\x9d\xe0\xb0\x63\x99\xef\x70\
+\x33\x64\x93\x88\xc7\xb3\x21\x1a\x9b\x1f\x8c\x53\x49\xf0\x18\x6b\
+\x84\x05\xf7\xb5\x96\x19\x99\xa2\xc2\xd7\xd7\xde\x62\xed\x90\x0a\
+\xa4\xe1\x7c\xdf\x4c\x97\xa0\x58\xa1\x6c\x00\x1b\x3c\x81\xc9\x74\
+\x40\x71\xda\x77\xf4\xc9\xd5\x72\x82\xaa\xd9\xda\xa7\xb8\x6d\xa7\
+\x42\x20\xa2\x38\x8c\x79\x95\xac\x37\x97\x94\xb3\x9c\xd5\xd2\x2b\
+\x32\x3a\x8c\x4d\x07\xf5\x07\x96\xf5\xd4\xcd\xd9\xdd\x44\x53\x60\
+\x79\xed\x40\xac\x9f\xcc\xd7\x22\x35\x12\xee\x25\xcc\x88\x3b\x40\
+\xf4\x1b\xe6\xb9\xec\xee\x37\x1a\xae\xbe\xe7\x73\x03\x7b\x40\xc8\
+\xec\xe8\xa5\xbb\x31\xaa\xe6\x46\x6e\xad\x77\x5f\x6f\x15\xd5\xc6\
+\xb7\x1f\x66\xe8\xeb\xb2\x9c\x4c\x03\x24\x85\xd6\x99\x49\x32\x71\
+\xaf\xab\xcf\xc1\xfa\x74\x62\x20\x54\xce\x3a\x5a\xfc\xd6\x56\xa0\
+\x41\x24\xa6\x61\x11\x32\xd2\x5c\xdf\x3a\xc2\xe9\x1d\xd1\xff\x00\
+\x51\xe8\xb3\x3c\x74\x0c\x6b\x21\xe5\xd5\x52\x53\xb4\x9f\xa4\xcc\
+\xc0\xc4\x9b\x3e\xac\x25\xa9\x03\xea\x0f\xcd\x10\x47\x72\x3c\xfd\
+\x5b\x4b\x91\xa9\xa3\xd6\x61\xe8\xa6\xb9\x8f\x41\xd2\x28\xb2\x94\
+\xbd\xd5\xb5\x3a\xda\x25\xac\x63\x11\x69\x63\xf4\x26\x82\xef\x31\
+\x5e\x23\x44\xf0\xfb\xee\x71\xfb\xfa\x7c\x30\x3d\xb6\xde\xce\x8a\
+\x78\xfc\x91\xf1\xba\x66\x35\x4a\x24\x8c\x66\x8c\xdc\x1b\xba\x67\
+\xa9\x73\x46\xa8\x9c\x17\xd7\xd3\x7a\x55\x4e\xfe\xde\xbc\x6d\x0f\
+\x3a\xd3\xa6\x57\x2c\x6f\xa7\x42\x91\x2f\xa7\xc4\x0e\x0a\x36\xa7\
+\xcd\xb2\xd1\x7c\x4e\x48\x93\x63\x90\x35\xca\x26\x0d\x2b\xae\xcc\
+\xd4\xea\x43\x13\xe5\xa9\xd7\xe9\x18\x3b\x16\x73\x18\x35\xd7\xc9\
+\x47\x88\x74\xd8\x25\x15\x84\x8e\x3d\x7f\xe2\xd8\x8c\x05\xee\xff\
+\x00\x4b\xa0\xf7\xf6\x97\xe0\xe1\xdb\xe0\xed\x4e\x67\x5a\x8a\xa2\
+\xce\x98\xb8\x2b\x8b\xa0\x98\xf0\x6d\x2b\xcf\xb2\x7b\x8d\x59\x3d\
+\x86\xdd\x06\xae\x76\x72\x52\xc3\xe3\x65\xa0\xe0\x35\x15\x86\x9f\
+\xac\x84\x52\x75\xcf\x3b\x9f\x93\xfe\x5e\xac\x9c\xfa\xcc\x6b\x32\
+\xa8\x4b\xae\xcc\xfe\xd7\xd7\xfa\x20\x24\xe6\x59\x0f\x08\xd5\x8d\
+\x6b\xa5\xaa\x73\xd0\x72\x59\xdf\x3e\xc0\xbc\xe5\x8b\x65\xfb\x4c\
+\xf3\x8e\xb5\x97\xcd\xdc\xfb\x26\x77\x8b\x2d\xef\x9f\x67\x30\x0b\
+\xd9\x5b\x39\xb4\xd5\x47\x55\x30\xb6\x5a\x10\x5c\xb9\x2a\xd4\x03\
+\xf0\x0f\xfa\xcb\xdd\xf7\xdb\x57\xda\xb9\xeb\x25\xbc\xb5\x19\x0b\
+\xcf\x15\x84\xaf\x40\x97\xad\x22\xcc\x7e\x5e\x7c\xb7\x05\x3f\x8a\
+\x89\x51\x6e\x46\x86\x7c\x96\x85\xad\xb7\x7e\x84\xc7\xbe\xa0\x79\
+\x78\xb0\x31\x3d\xa7\x5a\x57\x3c\xa3\x8e\xb7\xc5\xd4\x18\x5b\x2a\
+\x0d\x42\x77\x5d\x00\x0b\x2a\xcd\x77\xc4\xfa\x4d\x8f\x5e\xe4\xc1\
+\x75\x9c\xb7\x51\xf7\xd3\x21\x4f\xce\xe9\xd1\x09\x64\x24\x73\xe4\
+\xcc\xf8\x5d\x46\x8a\xf4\x02\x61\xf4\x6d\xa2\xad\x70\x21\x60\x50\
+\x9d\x0c\xeb\x5b\x34\x2f\x27\x20\x37\xa3\x66\x0e\x1b\x50\xd5\xdc\
+\x66\x1a\xa7\xe7\xea\x9b\x39\xd3\x1d\x0b\x94\x22\xa6\xb6\xb3\xeb\
+\xfa\x75\x28\x30\x05\x33\x6e\x66\xe4\x5b\x02\x00\x72\x82\x3e\x4c\
+\xba\x2c\xbb\xc0\x77\x9f\x01\x45\xa6\x11\xaf\x38\xa6\x90\xc6\x81\
+\x91\xe2\x69\xb4\xa7\xdf\xa7\xb7\xe9\x30\x97\x4d\x34\xdb\x02\xc3\
+\x38\xcb\x88\x19\xd4\x66\x55\xdb\xba\xb8\x0c\x4e\xc7\x7c\x55\x9b\
+\xa8\xdd\x5f\x53\xe8\x01\x49\x5f\x66\x60\xd8\x01\x72\x70\xb5\xb5\
+\x80\xfd\x6a\x14\x86\xbe\x46\x1e\x79\xfa\xdd\xa9\xc0\xd5\x85\xdd\
+\x55\xd9\x76\xeb\xdc\x7e\x6d\x8e\xc9\xae\xcc\xe2\xb5\x10\x83\x03\
+\x06\x97\x4b\x39\x93\x75\xd4\xd9\xd5\x84\x86\x8b\x63\x5b\x52\xae\
+\x9a\xd4\xba\xaa\x96\x75\x57\x91\xae\xdd\xa6\x8b\x24\x72\x22\x56\
+\x62\x96\xd5\x99\x9e\x0a\xbc\xf9\x49\xf2\xd3\xf0\xd7\xb4\x1f\x45\
+\xa2\x15\x59\xc7\xcd\x0b\x66\x68\x29\xb1\x29\x2d\x45\x6f\xe0\x28\
+\xee\x5d\x63\xfd\x9a\xae\x1f\x0f\x5a\xe7\x0b\x1c\x7c\xaf\x08\xd4\
+\x70\x26\x86\xb1\x93\xb9\xcd\x7d\x56\x65\x06\x13\x38\xa6\x2c\xd3\
+\xa0\xed\xb3\x23\xd2\x64\xe9\x48\x75\xc9\x20\xd2\x69\xd5\x6a\x58\
+\xec\x37\x40\xff\x00\xae\x8b\x53\x4a\xd2\x35\x6d\x7c\x22\xd9\xd6\
+\x6c\x29\x32\xcc\x1a\xd1\xcc\x30\xcc\x4f\x10\x74\x24\xcd\xd4\x81\
+\x5f\x7a\xf4\x6c\x99\x05\xed\x06\xd6\x66\x37\x15\x96\x2d\xaa\xd0\
+\x2c\x99\x5e\x07\xac\x26\x67\xc8\x72\x48\xdb\xa0\xc6\x47\x48\xe0\
+\x7f\x9b\x2d\xf3\x19\x33\x0f\x37\x6d\xef\xf6\x99\xbc\x28\x76\x4c\
+\x90\x84\x09\x8f\xe7\xc0\xea\xf4\xac\xbb\x12\x5c\x35\xea\xca\xd2\
+\x04\x4d\xcf\xa9\xd2\xbe\xba\xf4\xc9\xa9\xc6\xc6\x5f\xe9\x1c\x5b\
+\x8c\x51\x43\x31\x81\x35\x55\xb1\x3b\x41\x49\x8f\xcb\xfa\x9f\xb6\
+\x7e\x96\x11\xf3\x8d\x2d\x6c\xcf\x6f\x51\x4f\xcc\xd6\x42\x80\x3d\
+\x0a\xcb\xed\x0e\x5a\x1c\xfc\x83\x2a\xcf\x63\x9e\x1d\xc2\xdd\x72\
+\xb1\x60\x4c\xfc\xf3\x0d\x1e\xa4\x1c\x2e\x7c\x53\x11\xa8\x67\x15\
+\x43\x52\x37\x62\x38\x7d\x4e\x8d\x71\x88\x4f\x7a\x8e\x4f\x98\xf3\
+\xe0\xda\xfb\xf4\x17\xfe\xf4\xc7\xad\xaa\x47\x51\xf9\x99\xcb\x11\
+\x7e\x32\x7c\x4f\xb4\x65\xa8\x7e\xd0\x14\x74\xa0\xb9\x3d\x9b\x00\
+\xc9\x5e\x07\x45\x8e\x0c\x0f\x5f\xf4\x72\xb3\xe3\x99\xf9\x30\x83\
+\xd3\x55\x2f\x16\x06\x49\xf2\xfc\xd7\x4b\x78\xa6\x79\xdb\x0a\x8c\
+\x1e\x72\xa2\xdd\x0f\xdf\x47\xe7\x66\x82\x86\x84\xaa\x81\x1d\x4b\
+\xfe\xb1\x95\x96\xfb\x7c\x26\xd1\xc7\x36\xf6\x19\xd5\xfd\xf7\x1e\
+\x0a\xac\xd8\x00\x9f\x71\xe8\x14\xf5\x47\xab\x64\x32\x2a\x40\x48\
+\xb5\x95\x0d\xa7\x6f\x9d\x66\x61\x21\x2a\xc0\x78\xcc\x15\x5a\xf9\
+\xe3\x29\x8f\x92\xdb\x4e\xbf\x9e\x32\x4a\x20\xc5\x6e\x6a\x97\xe8\
+\x95\x61\xf1\x08\xb0\x03\x9b\x3d\x19\xcd\xf8\x27\xbd\xe8\xb4\x07\
+\x5a\xc7\x6e\xb9\xa0\x29\x95\xad\x03\x62\x84\x7d\x9d\xbe\x49\x3d\
+\xfd\x7b\xe8\x89\x11\x43\x62\xf8\xba\x9e\x51\xc4\x32\xab\x5a\xf8\
+\xb0\x65\x0a\x55\x12\xae\x52\xf1\xa3\xc0\xf4\xb1\x08\xca\xf6\x30\
+\x5f\xac\xad\x9e\x59\x1b\x14\xf5\x12\xa5\x56\x55\x2a\xcc\xc1\x6e\
+\x3a\x02\xe9\x16\x54\xcb\x60\x1c\x2c\x95\x4d\x9a\x5c\x7f\x99\x48\
+\x60\xe6\x4c\x1a\x68\x2e\x87\xa8\x1b\x3b\xdf\x11\x8c\x24\x62\xa2\
+\x71\xb4\x74\xcf\xd0\xd1\xa8\x70\x5f\x76\x9b\x8a\xdc\x92\x21\xc1\
+\xea\x41\x24\x59\xfa\x15\x82\x21\x2c\x8c\xa6\x2c\x26\x23\xf0\xf4\
+\x05\x2d\x62\x41\xdf\xf2\x96\x29\x09\xcb\xaf\x42\xf7\x11\x5c\xb8\
+\x1b\x42\x8c\x30\x72\x0d\x69\x59\x56\xac\x76\xab\x9d\xd3\x28\xe2\
+\xa5\x59\x96\xcd\xab\xac\x69\x95\x36\xfc\x9f\x2c\x35\x88\xfb\x2f\
+\xad\x30\x55\x7a\x90\x45\xdc\x23\x84\xd8\xbb\x01\x19\xea\x00\xef\
+\xb8\xc4\x3d\x17\xfe\x82\xf8\x99\x34\x9b\xff\x00\x7a\xae\xfe\x64\
+\x4d\x42\xe9\x65\x60\x2c\xcf\xa9\xac\xbd\x02\xe2\x9a\xe0\x1a\xc1\
+\x72\xd8\x81\x80\xf8\x9b\x06\x91\x06\x79\x25\x49\xc4\xe8\xf7\x84\
+\x7d\xe1\x4b\x78\xf3\xd6\xa1\xcf\x6f\x5d\x19\x4c\x24\x33\x21\x2e\
+\x2d\x7b\x32\x2f\xc6\x62\x75\xe7\x36\x19\xdb\xe8\x39\x23\x72\xe4\
+\xeb\x2a\x1e\x0a\x6b\xa9\x6e\xe0\xb4\x31\x35\x2b\xfd\x06\x33\x1f\
+\x9e\x9a\x5a\x4b\xfe\x7d\x7f\x7a\xf5\x8a\xa8\x04\x45\x7a\xd6\x65\
+\xd4\xd5\x33\x52\x8a\x47\x45\xce\x1a\xb3\x22\xeb\x35\xf5\x5f\x2d\
+\x48\xb5\xc3\x2a\x8d\xb0\xb7\xe1\xc5\xf1\x15\x16\x62\x58\x21\x28\
+\xda\x87\xd1\x2f\xe7\x91\x2e\x5f\x31\x9d\x1f\xa7\x59\x09\x65\x9e\
+\x25\x66\xf0\x8c\xd5\x7c\xb5\xa3\xd6\x39\x06\x8a\x1f\xaf\x55\x6d\
+\xb8\xb9\x89\xe1\xb3\x7a\x04\x7b\xdd\xfd\xe9\x31\xe2\x01\xfa\x4c\
+\xfa\xaa\x3d\x5a\x2b\x09\xc1\x6c\x43\xe7\x24\xc9\xe4\xd6\xaa\xb5\
+\x13\x01\xc7\xd6\x64\x7d\x36\xc0\x3d\x55\x7b\x20\x0c\xb5\x42\x57\
+\x8e\x77\x57\xf5\xb1\x1f\xd2\x35\x81\xbd\x8d\x2f\x23\x6c\x8b\xec\
+\x74\x62\x83\xcd\xac\x04\x0b\x32\x40\x73\x0a\x50\x8b\xe8\x70\x2b\
+\x4b\x3e\xb7\x3a\x8b\x79\x78\x53\x69\x97\x82\x8b\xd0\x77\xde\x9f\
+\xe8\xbe\xf7\x99\xe3\xf0\x60\xec\x10\x36\x28\xc5\xe2\xeb\x78\xce\
+\x3d\x7d\x78\x26\xb5\x2a\xa6\x91\x92\x60\x04\x2d\xa6\x93\x60\x3c\
+\x50\xde\x64\x49\xf3\x28\xa3\x04\x26\xa7\xd5\x41\x2d\x3d\x56\xd9\
+\x0c\xcb\x2d\xe1\x14\xe5\x58\xa6\x2e\x21\x9b\x9c\x37\x18\xae\x3c\
+\xed\x91\x25\x9e\x67\x74\x3b\xae\xc3\xad\x9e\x7a\x24\x56\xcc\x8f\
+\xe2\x6a\xe5\x98\xfe\xbd\x00\xa3\xdf\x03\xbf\xdf\xbd\x73\x5f\x58\
+\x06\xcb\x31\x1f\xea\x91\x58\x5a\x37\x67\xc5\x97\xf7\x49\xac\x68\
+\x8f\xa4\xd8\xce\x60\x64\x04\x66\x61\x03\xd5\x84\xa2\x58\xea\x40\
+\xb0\xe4\x0e\xc1\xea\x43\x4c\x2b\x17\x6b\xdf\x4a\xb4\x0a\x0c\x8f\
+\x06\xa0\xed\x3a\x50\x38\x65\x9c\xd6\xcd\xa6\xae\x69\xff\x00\x49\
+\xdc\x72\xd0\x41\x54\x7a\xb0\x42\x56\x57\xab\x58\xc0\xab\xad\x41\
+\xa1\xd8\x2c\x76\xbe\xad\xca\x69\x65\x6a\xc7\x49\x48\xdc\x42\x20\
+\x31\x28\xe5\x28\x8b\xe6\x49\x3d\xeb\x7a\x7a\x86\x96\x44\x78\x85\
+\x6b\x35\x55\x03\xa8\xf5\x57\x77\x10\x6a\xb3\xca\x9e\x62\xdd\x3b\
+\xea\x0e\xdb\x50\xce\x7f\x55\x48\xb7\xa8\xf9\xc6\xb4\x17\x55\x8e\
+\xb3\x0c\x0d\x60\x6b\xbc\x33\x86\xbf\xef\x5d\x18\x6d\x3f\x8b\xd0\
+\x9c\x06\x70\xd8\x06\xed\x85\x53\x59\xa1\x11\x16\x02\xbb\x11\x13\
+\x42\x19\x55\x15\xb2\x30\x95\x3d\x11\x3f\x88\x36\x4d\x6c\xd8\x20\
+\x89\x26\x1b\x56\x1e\x7c\x9a\xe5\x26\xa9\x29\x6b\xc4\xb5\x47\x69\
+\xe8\xcb\xde\xb9\x03\x34\x6b\xe3\x2b\x64\xc3\xd4\x78\xfe\xd4\x74\
+\xd6\x20\xa2\x67\xfe\xc6\x79\xb7\x51\x95\x95\xb1\x76\x23\xf2\x9d\
+\x30\xfe\x5b\x7c\xbb\xde\x6e\x96\x91\x49\x7a\x9f\x87\xcf\x06\x56\
+\xfe\x38\xe5\x04\x99\xa4\x07\xa0\x50\xdd\x12\x3b\x74\x04\xcd\xde\
+\xbc\x1b\x79\x2d\x49\x8d\xe8\x75\x5e\x5e\xa4\x0b\x10\xe3\xa3\x91\
+\x67\x0b\x0a\x19\xaa\x2f\x59\xae\x19\x38\x45\x12\x2b\xdd\x88\xb5\
+\xdc\xc9\xaf\x5c\xea\xd4\x5a\x2e\xe8\xdb\x8c\x97\x3d\x80\x6a\xbf\
+\x66\xf2\xcd\xed\x3c\xbd\x15\x85\xa1\x93\x90\xd5\x5e\x90\x5b\x52\
+\x6b\x86\xba\x5c\xf8\xc4\x13\x25\x68\x74\x32\x23\xf2\x04\x28\x36\
+\x51\x00\xe3\xab\x1e\x99\x53\x1e\x26\xc2\x2c\x65\x07\x25\x14\x14\
+\xf5\x2c\xf9\xa8\xcc\x69\xcb\x0b\xf1\xb0\x8c\xd4\x69\x5b\x84\x20\
+\x96\x28\x0c\xf5\x8b\x01\x80\x6e\x1a\x96\x82\x2c\xc8\x47\x9a\xaa\
+\xd5\xe8\x2b\xfd\x6d\x0d\xe2\x69\x90\x3a\xa6\x35\x06\xeb\x37\x8a\
+\x30\x8b\x64\xe4\xf4\x0e\x88\x77\x2d\xa3\xc7\xef\xe0\xde\xd3\x9f\
+\x1c\x74\x3d\x57\x96\xc7\xac\xec\xb8\x27\x12\x8b\xe0\x5c\x49\x16\
+\x43\xc4\xc1\x32\x26\x49\x84\xe2\x52\x30\x06\x21\x63\xef\x3f\x7d\
+\x67\xc9\x96\x38\x64\x2b\xcb\x0f\x3b\x45\x49\x85\xe9\x27\xba\xf6\
+\x04\xcf\x45\x3f\x93\x33\x25\x24\xb8\x5f\xdf\x5a\x0f\xb1\x82\xce\
+\x9f\x3d\x92\xd9\xed\x92\xd2\xd2\x6e\x4f\x8b\x15\x41\xe0\x39\xcf\
+\xeb\x49\x12\xcb\x3d\xb0\xde\x8b\x12\xdd\x91\xf4\x5a\xf6\x6b\xb3\
+\x32\x57\x61\xba\x2a\xc0\xca\x83\x35\xa0\xd1\x9c\xe3\xc1\x0f\xcc\
+\x75\x37\x69\xcd\xae\x80\xda\xd3\xae\x2c\x33\xeb\x8a\x90\x94\x5e\
+\xaa\xd0\x58\xa9\xfa\x92\xa6\x1a\x13\x4c\xd4\x4e\xc4\xc6\x99\xbb\
+\xd0\x7e\x71\x5c\x4d\x87\x65\xd7\xb2\x3d\x66\x6e\x76\xa9\x95\x1c\
+\x01\x19\x63\x36\xae\x6d\xb5\x7b\xac\xce\xe8\x91\x73\xf1\x25\x5d\
+\x6c\xdc\xdd\x04\xfa\x0c\x31\xaa\xf8\xa9\x43\x4b\x5d\x8e\xc3\xf3\
+\xa8\xeb\xce\x20\xb3\x06\x73\xe3\x63\xb4\xb2\x01\x93\xe9\xc9\x39\
+\xcf\xa3\x5c\x5a\x88\xfe\x7a\xc0\x1a\x13\x46\xb9\x69\x55\x42\x0a\
+\x52\x04\xf0\xc0\xd5\x38\xaa\x2a\x2f\xa4\x47\x79\xbc\x59\xf8\x98\
+\x54\x4e\x9d\xe5\xbb\xd2\x5f\xa1\xb3\xa7\x31\x6e\xb5\x73\xcb\xdd\
+\xd4\x42\xc6\x66\x0e\x51\x69\x85\x65\xc9\x68\x45\x46\xf7\xe7\x57\
+\x87\xe5\xdb\x28\x89\x8e\x4a\xd1\x60\x59\x53\x37\x57\x65\xad\x5b\
+\x04\x36\xa2\xbe\x90\x8a\x09\x99\x8c\x28\x5e\xca\xcb\x0c\xdd\x5c\
+\x40\x4f\x2c\x98\x01\x1a\xe3\xd0\x62\x96\x8b\x01\x31\x3d\x3e\x07\
+\xea\xec\xf0\x2a\x96\x92\x11\x23\x70\xd1\x59\xf1\x89\xa2\x2e\xfa\
+\xe0\x19\x67\x3a\x3d\x9d\x6d\xb7\x12\xac\x67\xc1\xdb\xcc\x38\x98\
+\x2e\xc3\x65\x8b\x46\xbf\x30\xb6\x43\x48\x9d\xb9\xda\xd1\x1b\x58\
+\xd9\x49\xe4\xc6\xc8\x2b\xc4\x5b\x45\x28\x6d\x3c\x19\x6c\x8e\xeb\
+\x72\x01\x08\x7f\x67\xa1\x11\xf4\x45\x86\x1c\x5d\x84\x06\xb0\x22\
+\xce\x83\x9c\x12\x16\x5d\xfe\x29\x35\x65\x63\x16\x7d\x70\x7f\x72\
+\xcb\x06\x0f\x55\x82\x6b\xd4\xa8\x09\x6a\x6c\xdc\xa1\xa1\x5b\xbd\
+\x0b\xa0\x3a\x5d\x23\x26\x1f\xcf\x0a\x6c\xf9\xbb\xbf\x8a\xe3\x6c\
+\x7b\x9b\x9d\x13\xa0\xdb\x24\x48\xb8\x79\x02\xb4\x5c\xe2\x1b\xd9\
+\xc9\x9d\x5c\xdf\xc1\xd6\x95\x27\x93\x6a\x97\x4c\xd0\x4d\x92\xca\
+\x7e\x07\x97\xc0\x65\xbd\xea\xf6\x64\x02\x06\x5f\x41\x54\xb8\x91\
+\x27\xc0\xcc\x19\xab\x8d\x8a\xc8\x8b\x2e\xbc\xb9\x60\x9c\xd0\x60\
+\xa4\x60\x95\x46\x41\x23\x23\x40\x2c\x27\x4b\x9f\xb8\xe2\x69\x66\
+\x92\x1e\xd5\x6e\xba\x9a\x3b\x7f\x51\xe7\x29\xc2\xb1\x1d\x8e\x28\
+\xb5\x6e\x6b\x64\xe3\xd3\x5b\xac\xf5\x51\x07\xdb\xad\xc1\xa8\x77\
+\x27\xb5\x6b\x9d\x52\x71\x5c\x03\x6a\x88\xa1\x19\x68\x23\x71\x22\
+\x96\x61\x1f\x15\xd5\x9a\x89\x53\x50\x7a\xc6\xe4\xc4\xa8\xb8\x81\
+\xb5\x19\x01\xf5\x23\x55\x62\x64\xe7\xdc\xbd\xa4\xdd\xb5\x99\x03\
+\x26\x18\xce\xc3\xaf\xd2\x31\xf6\x35\x0f\xf4\x74\xb3\xe0\xce\xcb\
+\xcf\x69\xb5\x8b\xc2\x5f\x76\x3b\x2e\x27\xdf\xa1\xc9\x7a\xcf\x31\
+\x3a\x3f\x74\xbc\x17\x54\xc1\x97\x67\xde\x7b\x39\x9d\x4e\xd0\xe4\
+\x17\x15\x62\xe8\xfc\xf6\x4b\x4a\x38\xa7\x64\xc5\x6c\x6c\x24\x59\
+\xad\x4f\x30\x11\x65\xed\x1f\x0b\x0c\x31\xb5\x4a\x4c\x22\x83\x74\
+\xbe\xab\x38\x02\x05\xcd\x57\xed\xc3\x69\xcc\xf0\x48\xeb\x1a\x28\
+\xcf\x7f\x3a\x65\x72\x9f\x83\xd5\x80\x0c\xf7\xce\x8b\x4d\xac\xcd\
+\xc5\xaa\xff\x00\x4c\x5d\x70\x5f\x99\xb9\x7d\x4b\xa7\x6b\x37\xd8\
+\x1e\x73\x3c\x62\x07\x61\xc5\x91\xbb\x5d\x20\x8a\x25\x64\xd4\x1e\
+\x6b\x14\x16\x51\xd0\xac\xeb\x2b\x50\xe6\x2f\x7a\x4f\x79\x9f\x9b\
+\xb2\xc3\x01\x36\x01\xd5\x5a\x51\x44\x5b\x2e\xf3\x3a\xe2\x17\x0f\
+\x5b\x8e\x3c\x4e\xfc\x25\x91\xb9\x9a\x41\x64\x19\x1f\xa8\x86\x59\
+\x6d\x5b\x61\x9f\x72\x59\x91\xdc\xd7\x2c\xea\xb6\x52\x3c\x77\xcf\
+\xc7\x1f\xdb\x27\xcb\xc3\xd0\xbb\x5b\x1d\xb0\x6e\x9c\x7b\xeb\xc9\
+\x4e\x0f\xf3\xf6\xb3\xef\x7a\x58\xae\x8b\xe7\x96\xc3\xd3\xfd\xcf\
+\x57\x58\x5d\x6c\xfb\x88\xbd\x23\x0f\x7c\x5b\x10\x66\xfa\x56\x6d\
+\x68\x45\x8e\x65\xbd\x19\x99\x27\x4b\xa3\x6c\x1a\x4f\xb1\xb1\x73\
+\x43\x97\x4c\x92\xe3\xaf\x12\xb2\x62\xb6\xf5\xaa\xad\xbd\x4c\xad\
+\x79\xf3\x9a\x38\x5b\x4a\xc7\x25\x0c\x0b\x0f\x53\xba\xb0\x97\x12\
+\xa8\x6f\x3d\xcf\xb0\x18\xec\x83\x1c\xe4\x6f\x37\xf6\x95\xdc\x0f\
+\x2b\xad\xb4\x35\x59\xba\xba\x69\x4a\x75\xaa\xae\x73\xe6\x45\x7a\
+\x2a\x5c\xf6\x3d\xdc\x7e\x13\x95\x72\x57\x4e\x1f\xd2\xba\x82\x95\
+\xb9\x50\xdd\xad\x15\xee\x5a\x7a\xf2\x5e\xc7\x24\xdf\xce\x8b\x01\
+\xb7\xca\x72\xa6\xfd\x9e\xfb\xcd\x9f\x06\x85\x0c\x3c\x4b\x05\x28\
+\x8e\x79\xd9\x7e\xdc\x64\x6b\xa7\x1f\xb4\xf7\xa5\x1a\xf7\x2c\xe5\
+\xaf\xe4\x66\x83\x66\x15\x1f\x23\x78\xfe\xa3\x68\x1b\xdc\x38\x9e\
+\x65\xbd\x4a\xa5\x69\x9c\xe6\xe8\x7a\x9c\xc3\xf3\xce\x37\x5e\x34\
+\xc5\x27\x58\xcc\xfc\x06\x40\x17\x35\xed\x72\xb9\x95\x71\x3c\x63\
+\x16\xf5\x0d\x3a\xe9\x28\xff\x00\xa3\x6a\x0e\xd0\x14\x5c\x6a\x1a\
+\x81\xbd\x5f\xbe\x8f\x58\x33\x14\x42\x39\xc8\xbd\xf5\x9b\x5b\x49\
+\x1e\x33\x41\xa9\xbb\x35\x91\xe2\x79\xf6\x58\xd1\x71\x2f\x55\x40\
+\xab\x3e\xaf\x94\xda\x03\x92\x1f\x99\x5a\xc5\x0e\xb1\x83\xda\xa0\
+\xf2\x16\x72\xd5\xb9\x66\xcf\xd6\xbf\x36\xe6\xeb\x6d\x9b\xdf\xaf\
+\xde\x5f\xfc\xff\x00\x9a\x79\x69\x35\x58\xd8\xe8\x4c\x9f\x7c\xcd\
+\x05\x7a\xc8\x31\x73\xa8\x27\xa2\xdb\xf3\xe9\x3a\x39\x97\x85\x0e\
+\x8a\xb3\xb6\xfd\xc9\x95\xfc\xae\x75\x6e\xff\x00\x4f\xa0\x16\xea\
+\x10\xb9\x9c\x3c\x75\x86\xe9\x78\x37\x4e\xeb\xcd\xf0\x34\x86\xd0\
+\xd7\xad\x6c\x2b\x32\xc0\x3e\xe9\xd4\xb8\xd9\x99\xa6\xe6\xd2\xfa\
+\x80\x77\xe4\xce\x51\x6c\x4b\x82\xc7\xc2\x22\x43\x74\x9a\xb7\xeb\
+\xc3\x23\x25\xb1\x2c\xec\x5d\x24\x86\x50\x0e\x26\x64\x7e\x7d\x5d\
+\x21\xda\x68\x0e\xe7\x73\xca\xc3\xef\xcb\x5d\x49\x36\xd3\x67\xe3\
+\xa7\x03\x68\x83\xcd\xeb\x8c\xf1\x99\x17\x7a\x8c\xbc\x7a\x0c\xf0\
+\xed\xee\x99\x53\xc9\x2f\x3b\xae\xe8\x5b\x5c\xe7\x39\x72\x21\x85\
+\x57\xc5\xcc\xbf\x5b\xa8\x79\x67\xc6\x30\x7d\xa0\x0c\x66\x88\xf4\
+\xdb\x20\xca\x0a\xcc\x99\xeb\x6d\x5d\x57\x48\xa4\x59\x5c\x1a\x95\
+\x46\x8a\x23\x89\xde\x86\xf6\x09\xd6\xdb\x25\xdd\x1c\x1d\x16\x3f\
+\xb1\xd5\x18\x1c\xea\x11\x3c\xc7\xf7\x59\xa2\x61\xcf\x03\x8d\x76\
+\x47\x33\xb1\x19\x5b\x5d\x08\x58\xf0\x8f\x2a\xe9\xb6\xc3\x99\xcb\
+\x94\xe6\x6d\x36\x35\xd9\x96\xd7\xad\xf2\xe3\x18\xda\xcb\x30\x62\
+\xb4\xf6\x53\xa1\xcf\x23\xa7\x6f\x41\x7d\x89\x45\xa7\x48\x53\x70\
+\x86\xcd\x10\x48\x7b\x46\xcb\x9d\xcd\x96\xda\xd6\xda\xad\x62\x8e\
+\xc3\xa3\xd2\x85\x6a\x42\x39\xf9\xfb\x6b\x40\xf3\x8d\xc6\x17\xe8\
+\x04\x67\xcd\x28\xb6\xf1\x35\x77\x3b\xa5\x9d\x99\xce\xbb\xf3\x40\
+\x79\xfc\xc6\x95\x64\x89\x55\xe5\x8b\x4a\x07\x27\x56\x36\xa3\xa0\
+\xcc\x67\xb0\xd1\xdd\x53\x2f\x95\xf9\xd2\x0c\x5d\x4b\xb3\xf3\x4b\
+\x40\xde\x86\x95\xe9\xbc\x9a\xc8\xb8\x8d\x72\xab\x7d\xae\x6e\x36\
+\x8c\x05\x55\x6e\x98\xe3\xe3\xe5\x5c\x67\x67\xdd\x68\x69\x30\x19\
+\x62\xd3\xa7\x72\xab\x27\x06\xbc\x2c\xa5\x42\x66\xa3\xe4\x01\xd6\
+\x78\x83\x3b\x5a\x6f\x63\xb0\x3f\x85\xc7\x85\x61\x66\xb7\x6e\x15\
+\xee\x06\x8c\x21\x56\x50\x47\xf8\x4c\xd7\xf9\xcd\x96\x85\x9b\x3c\
+\xa4\x77\x6c\x9f\x9e\x04\x8a\xa9\xa1\xc3\x47\x32\xd3\x50\x41\xe2\
+\xd7\xe1\x95\x84\xf3\xeb\x7a\x4b\x5e\x69\x7f\x29\x7e\x81\xa6\xe3\
+\xc4\x42\xa1\xb9\x6a\xe6\x6a\x88\xe4\x8d\xb1\x5c\x1a\x5d\x40\xd8\
+\xf2\xd0\x33\xa8\xcd\xbc\xae\x6c\xce\x8f\x75\xf3\x4e\xcc\xce\x9f\
+\xea\x7a\x60\x86\xdd\xa2\xc4\xc2\x54\x2d\x6d\x5d\xd1\xf4\x39\xcf\
+\x9f\xe6\x97\xbe\xcf\x32\xcb\x06\x61\x13\x81\x08\x30\xf0\x8e\x7c\
+\xf7\x44\x61\x38\x44\xb7\xd4\xb2\xd0\xe0\x3a\xce\x20\x60\x60\x79\
+\xe6\x6d\xa0\x61\xe6\x06\xed\xd0\x70\x76\x04\xa9\x71\x6b\x2c\x56\
+\x3f\xff\xc4\x00\x2b\x10\x00\x02\x03\x00\x01\x04\x02\x02\x03\x00\
+\x02\x02\x03\x00\x00\x00\x03\x04\x01\x02\x05\x06\x00\x12\x13\x14\
+\x07\x11\x15\x22\x16\x21\x23\x08\x24\x25\x34\x26\x33\x42\xff\xda\
+\x00\x08\x01\x01\x00\x01\x05\x02\x95\xc7\xd3\x3d\xb5\x95\xbc\x76\
+\xb7\xb5\xe1\xe8\x4f\x8c\xf3\xf4\x1b\xd4\xec\xc5\x7a\xf2\x77\x49\
+\xe6\x3b\x2d\x69\xa7\x43\x24\x94\xd5\x1f\xed\xdb\x7e\xdf\xff\x00\
+\x4a\xd7\xc9\x03\x04\xcd\xcc\x2f\x1d\x2f\xfd\x12\xb7\xff\x00\x39\
+\xb5\xe0\x83\x1f\xeb\x4a\xf6\xda\x6d\x58\xa3\x31\xf7\x53\x02\x7e\
+\xe2\xd1\x4a\xcd\xfb\xac\x97\xf5\x41\x96\xb3\x6a\x7f\x7d\x54\x5d\
+\xdd\x54\x1f\x75\x3f\x6f\x4d\x5a\x47\x68\xbc\xc9\x49\xf5\x48\x0d\
+\x6b\xdf\xe7\xff\x00\x37\x03\xdf\x10\x13\x06\xe5\xb1\xbb\x95\x3f\
+\x8e\xfe\xdd\x66\xb3\x1d\xfd\x50\x75\xec\x6c\x9e\x1e\xad\x7a\x97\
+\xa0\x07\xb7\xa0\x4c\x74\x49\xaf\x64\x86\xde\x5c\xe8\xfa\x8a\x5a\
+\x94\xe9\x9b\x45\xa8\x55\xff\x00\xb3\xc7\xd5\xa8\xbf\x71\x47\xe3\
+\x9e\xbd\x5e\xee\xac\xa5\xba\x3a\xb6\xee\x94\xa6\x6b\x38\xd5\xb5\
+\x2b\x9b\x7a\xcc\x77\x84\x50\x4e\xd9\x42\xd2\x5b\x26\x18\xfa\x3c\
+\x44\x54\xf5\x8b\x49\xd1\xf3\x49\x50\xec\xe8\xab\x5f\xb4\x96\x20\
+\xfa\xfe\xa3\xa3\x5e\x3e\xbc\x82\x2c\xb3\x15\x8b\x79\x63\xb8\x2c\
+\x5b\xaa\xb3\xfe\x74\x7a\x7e\xda\x2f\x7d\x91\x5e\x6d\x5b\x82\x6b\
+\x5b\x98\x83\x94\xe8\x42\xf5\x74\xeb\x48\x0d\xe2\x3a\x2b\xb3\x17\
+\xf7\x22\xdd\x55\xcf\xb9\xb1\xfe\xee\x9a\x72\x51\x98\x1e\x29\x54\
+\x7e\x4e\xaa\xa5\x7e\x98\xcf\xff\x00\x47\x6f\xeb\xdd\x36\x40\x51\
+\x1b\xc3\x58\x64\xb5\xfb\xfb\x99\x9c\x6a\x77\x45\x09\x60\x51\x87\
+\x3e\xeb\x67\xab\xde\xb5\xc7\x71\x90\x63\xfb\x84\xeb\x7a\xbd\x9b\
+\x13\x2b\x47\xf6\x65\x7f\x55\x96\x8e\xe7\x03\x3d\x94\x04\xf7\xd1\
+\x2b\xfd\x67\x63\xf9\xad\x3c\x6e\xde\x33\xe7\x4d\x4e\x90\xc6\x35\
+\x8b\x23\xb8\xe1\x19\x9b\xe6\xaf\x11\x2d\xd2\x26\x26\x64\x7d\x38\
+\x5f\xab\xae\xcf\xdd\x69\x33\x03\xef\x21\x4d\x8b\x7a\x42\xae\xdc\
+\x77\x22\x42\xea\x05\x11\x4b\xd6\x9f\x7c\x9b\xff\x00\xb5\x58\xb8\
+\x29\x67\x26\xb5\xf6\x3e\xfa\x6f\x45\x7c\xf4\x87\xf2\xed\x83\x6c\
+\x8f\x99\xd6\x6e\xc5\x37\xf9\xb3\x16\x9b\xa8\xe4\x82\xfe\x6f\xed\
+\x66\x23\xe8\xde\x39\x98\x0c\x44\xdb\xf7\xea\x6f\x6a\x5c\xe4\x35\
+\xaa\x0b\x0e\x2e\x92\xb5\x2f\x59\x8a\xd5\x7e\x8e\x60\xde\xba\x03\
+\xa4\x95\x92\x5e\xbd\x00\xb3\x6b\x79\xe9\x15\x40\x93\x6e\xac\x11\
+\xd8\x5a\x0b\xd4\x5d\x68\xdb\xc7\xd6\x7f\x71\x2f\x78\x9a\x8c\xba\
+\x6a\x67\xda\x7e\x5b\x12\xd7\xc5\xf9\x4b\x8f\x68\x3e\xac\xd2\x06\
+\x57\x23\xa2\x3f\x3f\x6e\x16\xcc\x32\x6a\x0a\x83\x73\xef\xaa\x90\
+\xb1\x3f\x29\x69\x94\x19\x8b\x00\x8c\x81\x60\x48\xc9\xc2\x76\xc8\
+\xba\x2b\xc7\x9e\x97\xfd\x4b\x6b\x4d\x06\xbe\x8c\xf7\x81\xca\xda\
+\x5a\x89\x1f\x49\x56\xa7\xe8\xb9\xa2\x81\xba\xad\x04\x3f\x28\xfc\
+\xb8\xcc\x0b\xec\xcf\xd6\x22\x9a\x36\x2d\x8a\xcf\x7f\x4c\xdb\xea\
+\xde\x5a\xf6\x0b\xbc\x91\x9e\xc7\x8e\xfe\xe5\x7b\x4e\x48\x39\x35\
+\xd4\xfb\x94\x68\x31\xc3\xae\xd4\x40\xc0\xe3\x82\xce\x47\x7b\x28\
+\x64\x78\xbc\x6c\x0c\xc7\xc6\x1c\xe1\xbc\xe7\x7d\x9a\xda\x74\x1a\
+\xa8\xeb\xef\x77\x34\xeb\x7f\x74\x19\x3d\xb2\x09\x08\xb1\x3e\x5e\
+\x24\x4f\x2b\xe3\xa0\x8b\xbd\xab\x9f\x3e\x1e\x3f\xa7\x34\x22\x55\
+\xa1\x87\xa6\x3b\x08\xc2\xbf\x90\x36\x0f\x75\xe3\xea\x83\x61\xb1\
+\x9c\x6a\x5f\xc1\xd2\xed\xd4\xd1\xb8\x09\xed\xa4\x93\xdd\x19\xfc\
+\x75\x9d\x02\xcc\xa5\x25\x37\x4d\x92\x43\x66\x49\xf7\x48\x98\x9b\
+\x80\x3d\x95\x82\xf6\x90\x9a\x35\xa8\x43\xa3\x1e\x46\x0b\x42\x74\
+\x6a\x7d\xdb\x37\x32\x5e\xd4\x38\xe9\xdf\xc8\xc9\xfa\x46\xed\xd5\
+\x36\xb6\x28\xd9\x57\x88\x72\x3a\xec\xe7\xed\x1e\xb5\x1e\x3d\x3d\
+\x82\xb2\x97\x78\x14\xcd\x98\xe8\x7f\xa5\xb9\xab\x53\xa3\xcc\xb8\
+\x26\x3f\xb3\x77\xb3\x6a\xc8\xe5\x71\x22\xd7\x07\xd7\xb3\x69\x6a\
+\x4c\x4f\x5e\xed\x43\x45\x9b\xf2\x10\x8c\xff\x00\x9f\xb1\xda\x24\
+\x1a\xf6\x04\xb9\xa5\x6b\xb2\xdd\x5a\x0f\xa9\xf4\x72\x8f\xba\x90\
+\xb7\x58\xd5\xa7\x83\x46\x22\xe4\x6f\xec\x75\x03\x51\xe4\xa3\xd4\
+\xbc\x44\x47\xd9\xb2\xa7\xc5\x6a\x48\xba\xbb\x86\xa5\x96\x76\x2f\
+\x6e\x23\xdf\x5b\x5d\x9f\xb1\x6b\x41\x0d\x2f\x2d\x35\xb7\x18\xd1\
+\xbd\x48\x9b\xa7\xc4\xd7\x6d\xfa\xba\x1c\x5a\x58\x45\x9b\xf7\xd6\
+\xb7\x0f\xd3\x6e\x89\x6a\x8a\x6c\xf3\x5c\x2b\x8b\x87\x33\x8b\xec\
+\x24\xb8\x88\x7c\xf2\x8d\xee\x29\xe6\xa6\xae\x85\xeb\xeb\x50\x87\
+\x65\x80\x02\x43\x5b\x97\xb2\xae\xda\x46\x3c\x36\x67\xed\xb3\xc5\
+\x85\x27\x2d\x28\x27\x2d\xdf\x57\xab\x35\x21\x69\xda\xa6\x9c\x0c\
+\x2c\x3d\x52\xdb\x48\xb7\xbc\x56\xd6\x88\x55\x8b\x7d\xd3\x47\xb6\
+\x7d\xd1\xd9\x77\xff\x00\x63\x16\xbf\xbf\xf6\x19\xc4\x03\x78\xdc\
+\x7e\x8e\xd8\xa5\x6e\x4a\x48\x7d\x48\x99\x2e\x4d\x3b\x1e\xee\xd1\
+\x4c\x15\xd3\x49\x24\x09\x71\x5c\x0e\x75\x5f\x1d\xe9\xcf\xd9\x94\
+\x78\xbf\xc6\x9c\x70\x9b\xbc\x85\xe1\xc2\x88\x68\x5a\x82\xe9\xc5\
+\xc6\x59\xf8\xf9\x61\x57\x93\xe9\xcf\xfa\x65\xe7\xd4\x5d\x1c\x95\
+\xa5\x8f\xf7\x30\xea\x7f\x51\xe2\xb0\x24\x4c\x5a\xf2\x78\xaf\x6f\
+\x80\xf3\x7b\x4b\x4b\x43\x1a\x15\xf1\x28\xbb\x16\xe8\x6a\xde\x8c\
+\xd5\x01\x12\x5c\xc2\xfd\x4e\x13\x29\x70\xfd\x10\x90\xe7\x8e\x9e\
+\xfc\x17\xa0\x03\xc9\x41\xe4\x95\xc7\x79\x3a\xdf\x8c\xe9\x82\x76\
+\x8c\xd7\xa9\x57\x3a\xf5\x91\xac\xaf\x6d\x09\x9d\x6a\xcf\xc7\x2b\
+\x35\xbc\x86\x55\xaf\x93\xb3\x21\x98\x83\x31\x65\xba\xf9\x4f\x4e\
+\x6d\xc7\x3e\x16\xe1\x20\xcb\xe3\xdb\x66\xb2\xea\xbf\x70\x11\x5b\
+\xdf\xed\xbf\x8f\x7b\xff\x00\x95\x34\xd5\xb4\x74\xeb\xdd\x03\x6f\
+\xcd\x36\x18\xbc\xb0\xe5\x6b\x34\xb2\xf6\xea\x91\x34\xe8\xac\x7e\
+\xa3\x6c\x34\xe8\x54\x03\x35\x36\x18\xef\xd2\x81\xa2\xc3\xd1\x6c\
+\x43\xb2\xba\xf7\xee\x5d\xe1\x1a\xbb\x43\xaf\x59\xa1\x89\x21\x12\
+\xb5\xeb\x97\x85\xe5\x29\x72\xaa\xa8\xf8\xf6\x7d\x9c\xe4\x3f\x22\
+\xe9\x42\xfb\xc9\xb5\x04\xe8\x75\x24\xd6\x94\x88\xad\xe2\xc1\x6b\
+\xc5\x13\x4e\x26\x9e\x7c\xeb\xfc\xcd\x96\xf2\x1a\x58\xfa\xa3\xd9\
+\xce\xd3\xb7\x75\x39\x82\x07\xd2\x04\xa1\x4c\x4e\x3b\xc9\x29\x1e\
+\xb3\x91\x30\xc8\x6e\xc1\xa9\xc0\x9d\x11\x39\x8f\xb3\x48\x6a\x1f\
+\x8e\x85\x98\x1b\x2e\x50\x84\x7d\x32\xdc\x45\x68\xcd\xe6\x24\x94\
+\xa4\x49\x6b\x69\x90\xd3\xb2\x5e\xbe\x79\x73\x77\x40\xe8\x89\x12\
+\x7e\xaf\x83\xe7\x1f\xe2\xc8\x12\x0b\x36\xd7\xa1\x73\x4e\xc7\x4b\
+\xe6\x4a\xbd\x47\x64\x54\x0c\xfa\xe4\xd4\xdc\xa9\x85\xf1\x7d\xef\
+\xfc\x9f\xe5\x77\x3c\x1c\xa5\x26\x7c\x44\x1d\xe3\xcf\xf7\x4a\x90\
+\xa1\x93\x51\x6e\xd3\x0f\x26\xd5\x53\x4b\x9f\xf1\x82\x6f\x71\x7e\
+\x0f\xad\x65\x74\xdc\x8b\x96\x38\xfe\x10\xf5\x89\xcb\x09\x5a\x0f\
+\x90\x16\xb5\x5b\x40\xe5\x48\xa3\x25\x11\x73\xe3\x43\x76\x6f\x08\
+\x36\x25\x73\x94\xb3\x2d\xe9\x32\x4c\xe4\xd7\x69\x86\x0f\xa8\x1e\
+\xda\x45\x8b\x5b\xb0\x6b\xcc\xaa\x4b\xd0\xbe\xc5\xfc\x2c\x8c\xc5\
+\x2e\x68\x0c\x12\xa7\x6b\x78\x72\xda\xa9\xfa\x7b\x3e\xbd\xb0\x71\
+\x56\xc2\x18\x67\xad\x5b\xd7\xb0\x6d\x96\x25\x38\x83\x75\x19\x7e\
+\xc9\x3e\x3e\x46\xf9\xfc\x9f\xe5\x83\x30\x3e\x74\x9b\x5d\x04\x83\
+\x37\x5d\xb6\x88\x5e\x6d\xd2\xf3\xea\x93\xef\xea\x73\xd6\xf7\x71\
+\x74\xee\x6c\x7d\xe5\xca\x06\x13\xf8\xd5\x6a\x14\x7c\xbd\x9f\xdb\
+\x93\x34\x5a\x8f\x48\xe1\x73\xa5\x58\xa5\x3a\xf8\xdc\x17\x65\xc5\
+\xa6\xbe\x0c\x10\xf8\xed\xc8\x5d\xbb\x52\xab\x26\xab\x17\xa7\xbd\
+\x3a\x83\xa2\xb2\x04\xe1\xca\x1f\x1b\xb0\x53\x7b\x52\x0a\xc7\x8d\
+\x8c\x89\xf3\xf5\x9e\x95\xaf\x55\xf2\xc4\xbc\x3e\xe0\x7b\x1f\x0c\
+\xc1\x57\xd8\xb0\xee\xd3\x1e\x6a\x4b\x41\xbf\x4b\x92\xf5\xe9\x3d\
+\x89\x54\x9c\x3f\x4c\x2d\xef\x7c\xd6\x38\x1f\xc8\x15\xaf\x86\xf9\
+\xb6\xfa\x05\x69\x1e\x45\x0f\xe3\xb8\xfc\x96\xa8\xc7\x42\x57\x11\
+\x36\x7f\x19\xf2\x19\xbb\x39\x17\x0d\xd2\x29\xf1\xbe\x2b\x9a\x7e\
+\x33\x98\x7d\xcd\x77\x0c\xc4\x0f\x4c\xfe\x52\xa5\xa2\xdd\x41\xf1\
+\xbd\xa3\xc2\xa7\x64\x4b\x1a\x76\xcd\x55\x26\xa8\xe0\xd6\x07\x73\
+\x39\x11\x4a\x47\x24\xe3\xe4\x6a\xf9\x00\x6d\x4a\x12\xb7\x24\x13\
+\x04\x8c\x74\x5e\x22\x58\x2e\x3e\x2d\x81\x55\xee\x35\x7a\x73\x6e\
+\x7e\xaa\xd9\x8a\x72\x7d\x92\xb3\x9d\x6f\x2f\xa3\x04\x5e\x30\xc9\
+\x4b\xfa\xf1\x4a\xbb\xf7\xdb\xc5\x1d\x6b\x3f\x6b\xfe\x43\x27\x74\
+\xf9\xb7\x9a\x09\x39\x90\x26\x03\x5f\x25\xa8\x51\x40\x8a\xa9\xa0\
+\xa2\x47\xd8\xac\xe7\x56\x1b\x47\xe4\x50\x11\x5d\xce\x02\xf4\xc5\
+\x7e\x2f\x34\x57\x2b\x97\xb5\xf5\xd7\x23\x35\xe1\x07\x0c\xa1\x8d\
+\xae\xcf\xb0\x4f\x8e\x3e\xc9\xc4\xe8\x3e\xc3\x6e\x02\x2c\x86\x31\
+\x2f\x62\x2e\x97\x8a\x81\x0c\x56\x81\x48\x2c\xaa\xc6\x48\xbc\xa3\
+\xc3\xa7\xdc\x26\xb8\xfa\xfc\x38\x49\x0c\x67\x8c\x14\xf5\x2c\x42\
+\x37\x8f\xf7\xd5\xd3\xb8\x61\x1f\xaf\xb3\xaa\x39\x98\x62\xc2\xb5\
+\xbb\x6e\x3b\x8b\xbe\x48\xb0\xad\x39\xe1\x0c\x31\xf3\xa5\x2f\xa7\
+\xc6\xfe\xab\x41\xe2\xf6\x12\x8d\x59\x8a\x58\x15\x9b\x55\x71\xd9\
+\x52\xa8\x4b\x7b\x79\x96\x70\xd9\x9f\x2c\xb3\x2c\x6d\xf0\xc6\xaa\
+\x96\xdf\x02\xfb\x16\x27\x22\x6a\x2c\x6e\x48\x62\x78\x34\x2f\xe4\
+\xbb\xce\x2c\x5c\x8e\x35\x49\x07\x14\x2f\x7d\xc5\x77\x4e\x40\xe0\
+\xb0\x20\xea\xb2\xc8\xaa\x34\x54\xf2\x74\x8f\x68\xa8\x78\x8f\x35\
+\x0c\x28\x87\x1a\xbd\xa5\x4d\x02\xdb\xa7\x2c\x42\x03\x3a\x3a\x7e\
+\xc3\x88\x60\x31\x7b\x05\x4f\xa9\x2d\x6d\x4a\xd8\x1d\xf6\xb7\x65\
+\x6a\x43\xd6\x90\x19\xb9\xee\x8e\x6c\xc3\x5a\xc9\x07\x7f\xe3\x13\
+\x76\x81\x8c\xd6\x89\x63\xb4\x18\x9e\xab\x6b\x84\xaa\x1f\xba\xd9\
+\x75\xa1\x8b\x9e\xb9\x00\xbf\xca\x27\xee\xde\x05\x7c\x45\xe0\xfa\
+\x83\xbf\x10\xd4\x3f\xb0\xd6\xcb\x43\xed\x7d\xeb\xaa\xe1\x00\x35\
+\xa5\x0b\xca\xab\xd7\xee\x4a\xff\x00\x8e\x25\xa5\xae\xbb\x29\xbb\
+\x04\x5d\x63\x54\x23\xf7\x4a\x52\x34\xed\xe2\x23\x4c\x93\x37\x39\
+\x8b\xd7\xed\x11\x0d\x79\x43\x92\xa8\xa4\x2d\xa7\x69\xb0\x32\x6d\
+\x12\xce\x6c\xd2\x4a\x99\x2c\x2f\x0c\xd2\xee\xc9\x3a\xb5\x64\xf6\
+\x19\xa1\x68\x5f\x4b\xfd\x78\x6e\x8a\xff\x00\x9a\xe7\x78\x0d\x61\
+\xf2\x54\x2d\x6a\xf5\x9f\x6b\x3a\xb1\x84\x41\x13\x3c\xe2\xe9\x41\
+\x78\x5a\xf6\xc9\x38\xbc\xe4\x82\xbe\xf1\xa6\x02\x6f\x8a\x74\x49\
+\xfc\x5d\xd7\x2d\x6e\xb7\x9c\x09\x8a\x7c\x82\x33\x69\x89\x18\xef\
+\x6a\xc9\x56\xfd\xe5\xdf\xec\x85\x2c\x9c\xea\x9b\xc6\x4e\xc8\xb8\
+\x93\x08\xbc\x3a\x29\x5a\xd4\x18\x2f\x49\x52\xf4\xee\x14\x8e\xfd\
+\x1f\xe8\x0b\x66\x6b\xf7\x4f\xb7\xd9\x51\x69\xd7\xbb\xf2\x21\xee\
+\x3b\x23\xfa\x35\x47\x6b\x93\x3c\x47\x19\x33\x3c\x65\xd2\x52\x63\
+\xaa\xc5\xe9\xd0\xb6\x6e\xa1\x7e\x63\xc6\x07\x29\xc5\xa7\x7d\x0b\
+\xc7\x74\xae\x12\x3c\x9c\x3e\x24\x53\x88\x20\x28\xd7\x97\x45\x9f\
+\xfc\x5f\x21\x34\x1d\x8b\x57\xfd\xbe\x38\x7c\x10\xc6\xcd\xab\x74\
+\x67\x4e\x96\x83\xc0\xf2\xc7\x9d\x7f\xfa\xf9\xad\xd6\xa4\xa9\x3e\
+\xe1\xa4\x58\x35\xf4\x28\x7c\xe2\x67\x79\xcc\xdb\x14\xb2\x77\x4f\
+\x42\x63\xab\x9c\x76\x15\x14\x11\xe8\xf2\x04\x13\x49\x04\x9d\x6d\
+\x56\xe3\x16\x64\xde\xbd\x28\xd7\x9a\xdd\xa3\xee\x69\x7b\xf7\x11\
+\xab\xd2\x09\xa6\x5b\xde\x5f\x20\xc6\x03\xdc\xf6\xd4\x1d\xe7\xa8\
+\x15\x64\x72\x2e\xeb\x7c\x7f\xb9\x9c\xbf\x5f\x20\x71\x07\x38\xbf\
+\x21\x48\x9e\x93\x2b\xb5\x22\xb1\x01\x55\xee\x8f\xb1\x53\xee\x32\
+\x0f\xc1\x69\xd8\x92\xf3\x15\xf1\xdb\x81\x08\x74\xda\x7d\xbb\x80\
+\x46\xf6\x17\x74\xcd\x30\xd2\x9c\x55\xf6\x74\x74\x3d\x32\x0a\x99\
+\x08\xff\x00\xd7\x6d\x8a\x27\x3b\x0f\x46\x89\x12\x24\x47\x5a\x83\
+\x29\x86\xa9\x69\x76\x3e\xad\x10\x0b\x90\x72\x7b\xd2\xdd\x27\xfd\
+\xcb\xc2\xf6\x3a\x9c\x88\x5e\x06\x2e\xf2\x59\x22\xd6\xaf\x99\x91\
+\x75\x6a\x1b\xd5\xf6\x6d\xec\x51\x3f\x60\x74\x8a\x86\xee\x13\xfb\
+\x64\x96\xe9\x56\x6f\xed\x6c\x00\xbe\x3f\x02\x9f\x33\x71\x5d\x1e\
+\x24\xee\x46\x9c\x45\xe8\x3b\xa9\x6f\x0a\xd7\xee\x6b\x9c\xdc\xf7\
+\xcb\x6a\xf5\x3b\x0e\x7f\xed\x70\xca\xde\x35\x75\xaf\x46\xc2\xdf\
+\xa5\x55\x17\x7e\xfd\x9c\x1c\x73\x66\x18\x9e\xda\x28\xe3\x53\x46\
+\x98\x34\xf5\x01\x8b\x86\x88\x5e\x83\x42\x80\x2a\x65\x0c\x53\x77\
+\x34\x63\x38\x5a\xec\x17\x5d\xcc\x79\x72\xac\x0a\x07\x51\xb8\x83\
+\x31\xba\x47\x63\xf2\xa2\x5a\x8a\xbf\xec\x04\xe5\xf6\x9d\x7c\xa0\
+\x85\xee\xbf\xd3\x28\xb9\x16\x51\xe7\x6e\xbb\x31\xaf\x2f\x99\x2c\
+\xd0\x9e\x1e\xcc\xa2\xee\x11\x70\x9d\x74\x8e\xde\x33\xe5\x43\x13\
+\xe4\xcc\x5d\x5c\x26\xd2\x70\xab\xd7\xd5\x04\x31\x47\x3e\x4c\x76\
+\x61\x56\x5a\x62\x06\xfa\xf2\x2b\x70\xc1\x7b\x3d\x32\x56\x11\x23\
+\x3a\x07\x6a\x33\xaf\x4b\x1f\xe2\xf1\x8e\xec\xf2\x6a\x84\xb0\x02\
+\xd8\x4b\x9b\xe8\x83\x58\xd7\x8b\x5b\x59\x3f\x15\x99\x8a\x0b\x49\
+\x5f\x57\x41\x0d\x01\x81\x75\xe6\xae\x9d\x94\xff\x00\xd6\xb4\x2d\
+\x2c\xe9\x0d\xac\xc0\xd1\x12\xeb\xbf\x97\xe6\xaf\x1f\x58\x2a\xe4\
+\x5e\xc1\x05\xe8\x1f\x67\xa7\xf1\x2d\x68\x53\x10\xcb\xdb\x53\x1e\
+\x2d\xd6\x56\x1a\xe0\xe8\xf9\x20\x89\x75\x3a\xdc\x5e\x5b\x57\xa6\
+\x9c\x22\xf3\x83\xcb\x2d\x9c\x6e\x44\x4c\xae\x77\x8e\xcf\x6f\xae\
+\x4e\xc0\x72\x9e\x68\xac\x6b\xe4\x6b\x45\x88\x16\xac\x4e\xce\x0e\
+\x1b\x2f\xc4\x76\x13\x76\x9d\x6a\xd4\x22\x58\x03\xa0\xcf\xc3\x17\
+\x3d\x72\x59\x78\x6a\xd9\xbb\x0f\xb0\x3f\x52\xad\x01\xf5\xd0\xf0\
+\x9a\x70\x4f\xb2\xed\x63\x4d\xe9\x74\x29\x90\xd6\x49\x06\x61\x28\
+\xce\x3a\xcd\x09\x9b\x93\x49\x88\xaa\xf9\xe2\x7f\x4d\x74\x96\x13\
+\x8e\x68\x2f\x92\xc1\xe2\x73\x15\x97\x2c\x65\x42\xbd\x9d\x73\xea\
+\xa4\xd4\xfb\x00\x5f\xf6\x59\x2d\xc6\x38\x3c\xdc\xa1\x22\x8d\x57\
+\xad\x16\x8e\x89\x83\x9d\x67\x92\x71\x22\x2f\x6c\x56\x99\xcd\x3c\
+\xbd\x46\xc1\xc8\x2e\x00\x4e\x52\x35\x77\x13\x90\xf8\x2d\x50\x87\
+\xc8\x3e\x1f\x85\x52\xf1\x07\xb0\xe0\xa2\xe5\x9c\x5e\xea\x2f\x2a\
+\x1a\x97\x4f\x39\x3c\x95\xb4\x05\x76\xd9\x29\x2c\xc5\x10\x78\x75\
+\xa3\x17\x0c\x5f\x07\x6a\x50\x5f\x48\xd1\x61\x4c\x5a\xc7\x31\x05\
+\x40\x8d\xd6\x2f\x7a\xb6\xf4\x46\x49\xae\x85\xb4\x74\x60\xfd\x3c\
+\xd1\x1d\x90\x69\xd4\x2b\xd5\xc0\x50\x18\xda\x2b\x01\x4d\x3d\x8a\
+\x4d\x2a\xf8\x8b\x44\x16\x01\xc0\xe2\xdf\xf6\xb2\xb2\xef\x6e\xbd\
+\x6a\x8a\x34\x43\x31\x5d\x55\x01\x16\x48\x91\x09\x6a\xc5\x3c\x69\
+\xe9\x11\x53\x63\x68\x5e\x89\xf2\x63\x35\x79\xce\x78\x7f\xc7\x79\
+\x9d\x2a\x56\x87\x98\xbd\x38\xff\x00\x13\x7d\x1d\x44\x63\x90\xbe\
+\x1d\x0d\x20\x24\xfa\xf9\x78\x42\x3e\x9f\x20\xb3\x37\x43\x4e\x7c\
+\x61\x5b\xb9\x72\x48\xec\x36\x49\xdd\x5e\x90\x30\x49\xd6\x96\x98\
+\xa6\xc7\x39\xeb\x45\x6b\x6a\xdd\x45\xa9\x7e\x92\x5d\x61\x05\xea\
+\x08\xf0\xe1\x4c\xb5\x18\xb4\x88\x71\x68\xb9\x8c\x41\x52\x17\x78\
+\xcc\xd8\xfa\x94\x85\x33\x0d\x16\xea\x8e\x40\x80\xbb\xf6\xf6\x97\
+\x76\x4d\x44\x9a\xf0\xc3\x8f\x8a\xd3\xba\x38\x6a\x6e\xeb\x08\x01\
+\xc6\x98\x68\xc7\xe3\xb6\xa8\x78\xe2\xc4\x84\xff\x00\x16\x90\x89\
+\xab\xbc\x46\xdc\xd8\x1b\x95\xad\xd4\x30\xe9\xc6\xf2\x55\x81\xbe\
+\x8a\x1c\x9f\x8e\xf2\x47\x76\xc6\xb7\x1e\xc9\x55\x7c\xc6\x00\x52\
+\x63\xd4\x75\x3e\x83\x74\x04\x31\x48\x15\x62\x5c\xf3\x0e\x48\x76\
+\x5a\x75\x18\xa9\xca\xa9\xe8\x54\x90\xb3\x6d\x98\x10\xad\x90\xf3\
+\x68\xf4\xc2\xf0\xa2\x9e\x99\x1c\xea\xf6\xb1\x0c\xda\x42\x08\xbf\
+\x11\x12\xb6\x75\xe8\x3e\xb4\x92\x2f\x6a\x92\x51\xf5\x5d\x36\x2d\
+\xd7\xdd\xee\x4c\xf2\x32\x08\xbb\xcd\xdc\xb4\xcf\xab\x0b\x68\xd6\
+\x22\xf2\xec\x50\xe6\xcc\x56\xe0\xb9\x5e\xa8\xf8\xc3\x92\x26\xa4\
+\x35\x61\x87\xf3\xc8\xdd\xf5\xb2\x0e\x18\xcf\x05\xd4\x23\x2a\xaa\
+\x7d\x95\x79\x7c\xe7\x0f\x51\x83\x72\x0c\x6d\xbc\x9e\x65\xdb\x97\
+\xca\x36\xfd\x3e\x42\x35\xf0\x5f\x69\x83\x58\x99\xd6\x35\xad\x01\
+\xbd\xcc\x1c\x7b\xce\x82\xd5\x2f\x98\x89\xaf\x09\xa7\xe3\x0d\x0e\
+\xf5\x36\xde\xcf\x0e\x72\xd9\xdb\xec\xb4\xcf\x40\xf2\x8c\x7a\x43\
+\xf0\xf5\x6f\x61\xc5\x10\x6c\xf2\x80\xd9\xa5\x34\xde\xd2\x1d\xe5\
+\x28\x1c\xa9\x92\x4a\xba\xd5\xc5\x75\xda\xf4\x6b\x21\x90\xd2\xc1\
+\x5f\x40\xc1\xe9\xb1\x59\xd2\x39\x96\xd5\x9a\x58\x82\x55\x7d\x2b\
+\xd7\xc7\xc6\x17\xb5\x8d\xb0\x9a\xf0\xc0\x75\x44\x10\x37\xa4\xe6\
+\xf6\xb3\x6e\x6e\x35\xa1\xb3\x9c\xcf\xe1\x9c\x26\x57\x1f\x9c\x1e\
+\x47\x63\x87\x8d\x72\x9e\x3f\xc9\x32\xdd\x48\xb5\xd9\xd4\x58\x8d\
+\xe7\x5c\x7d\x81\xcd\xb5\x08\x96\x27\x60\x58\xae\x88\xa9\xab\x39\
+\xf4\x1f\x5a\x7a\x36\x21\x16\xf6\x74\x6f\x6c\x35\x09\x59\xcd\xec\
+\x9d\x12\x5b\x24\x8a\x1a\x87\x23\xd4\xb9\xed\x43\xd5\x0a\x32\xfc\
+\xcd\xb8\xfe\x67\x71\x1b\x9a\x89\xc6\x19\x39\x45\xc5\xc3\x44\x6f\
+\xa0\xfc\xb4\xfb\x5b\x2e\x00\x18\xfa\x16\x61\x58\xab\xe3\x7d\x8a\
+\xfa\xe0\x03\xcb\x1d\x9e\x50\x88\xaf\x55\x1c\xee\xeb\x3b\x49\x6c\
+\x70\xa8\x12\x18\x0c\x4b\x01\x16\x23\xd9\xbe\xca\xeb\x0a\x57\xe4\
+\xcf\x29\x65\x5d\xc6\xc9\x83\x2b\x08\xe1\xf4\xa1\x04\x96\x87\xfb\
+\x6d\xab\x94\xa8\x5a\xce\xd4\xe1\xfa\xb9\x8f\x9f\x3a\x94\x81\xa0\
+\xc5\xce\x5c\xed\x09\xae\xde\xa1\xf3\xba\xc0\xcd\x26\x9b\x23\xad\
+\xd7\x3b\xf0\x2c\xd5\x81\xb0\x73\x46\x86\xa0\x1d\xaa\xa5\xef\xa5\
+\x57\xa7\xae\xd2\x22\x2f\x5f\x8b\x56\x23\x3f\xc6\x30\x69\xa0\xdd\
+\x46\xa2\x5a\x83\xea\xc9\x9a\x83\x5c\x75\x80\x9f\x31\xfb\x18\x09\
+\xb8\x7e\xa3\x16\xc5\x5c\x74\x22\xdd\x4e\x1f\x9a\x18\xc0\xee\x54\
+\x9c\x55\xec\xfe\xb3\x38\xa9\xf6\x19\x34\x0a\xce\x72\x7c\xc6\xe4\
+\x48\xe1\x81\x06\x38\x1e\xa2\x0d\xaf\x81\xf1\xaf\x1f\xbb\x3c\x93\
+\x86\xe0\xf2\x04\x79\xc6\x3d\xb8\x0f\x24\xcc\x0a\xe8\x93\x8c\xf2\
+\x00\x65\xa8\x46\x46\xbe\xae\x57\x28\xcc\xe6\x39\x93\x4a\x76\xe9\
+\x85\x91\xa4\xa6\xd9\xc2\x24\x59\x59\xa3\xe4\xdd\x86\x8f\xb1\xa8\
+\x97\x1d\x1a\x68\x6a\xef\xe8\x69\x25\x64\xaa\xb6\x5d\xce\xaa\x39\
+\x6c\x79\xb4\x33\xda\xf5\xcf\xc6\xad\xdb\x5c\x38\x1b\x73\x98\x3c\
+\xb8\xa1\xeb\x1d\x0c\xd7\x13\x20\xfa\xad\x46\xad\x53\x2a\x8d\xda\
+\xf5\x29\xb4\x2c\xf9\x53\xf7\x7a\xfc\x4d\xa4\xd4\xcf\xca\x18\xbc\
+\xf5\x82\xdc\x55\x88\xd7\xa9\x43\x09\x14\x37\x86\xdb\x66\xed\x32\
+\x51\x68\x1b\x15\xa3\x1b\x47\x98\xfc\x97\xce\x29\xc8\x38\x47\xcd\
+\xba\x4c\xeb\xff\x00\xc8\x3e\x3f\xb6\xcf\x23\xc7\x5c\xba\x4e\xf1\
+\xdc\x7f\x5b\x23\x93\x66\x0f\x15\x6c\x04\xdb\xdc\x67\x4b\x19\x84\
+\x79\x56\xb2\x65\x26\x72\x8b\xa9\x9e\xbe\x67\x13\x45\x76\x5d\x7c\
+\x4b\x02\xf4\x6f\x43\x41\x06\x32\xf3\x51\xdf\xd3\x3b\x85\xce\x7d\
+\xbc\xcb\xec\x6d\x1b\xc9\x8f\xbc\x2a\xab\xec\x13\x4d\x80\xd1\x8c\
+\xa3\xcf\xaf\x9f\x54\xc0\x65\x5c\xce\xa2\x6e\x68\x19\x71\x9d\x6a\
+\x15\x0b\xd0\x59\xa3\x3f\x4c\x8e\x99\x96\x67\x91\xb1\x62\xdf\x4f\
+\xb3\xad\x92\x7b\x22\xfc\x92\x6b\x32\xa6\xb9\x2a\x53\x34\x36\x77\
+\xc2\x71\x2a\x1a\xaa\x30\x9f\x65\x03\x33\x1c\x2a\x33\x92\xe5\xdc\
+\x87\x53\x5d\x01\x87\x9b\x1b\x67\x88\x60\xef\xa7\xc8\xb8\x8b\x99\
+\xb5\x5a\x43\x15\x8e\x99\xe7\xb6\xd9\x07\x0e\x7b\x39\xa9\xe5\x3c\
+\x96\xcd\xec\x69\x35\xe3\xcd\xda\xcf\x1b\xab\xe8\x5d\x9b\x8a\xc3\
+\x24\x74\x25\xc0\x95\x35\x46\x76\xdb\xc8\x58\x8a\x0c\x9c\x76\xda\
+\x6b\x3b\xc7\xdf\x9b\x65\xf1\x80\xd2\x1b\xd5\x1e\x99\xd6\x6a\xcf\
+\x68\xd8\xe9\xcd\xdc\xb8\x74\x19\x08\x99\xcd\x2d\xa0\x8d\x17\xb4\
+\x3e\x7b\xe9\x19\x61\xbf\xab\x76\x97\x68\xde\xb4\x51\x8d\x44\x74\
+\x1d\x6c\x82\x21\x4d\x24\xb5\x9b\x59\x7d\xac\xfb\xe5\x00\x8c\x67\
+\x4c\x2e\xf0\xfc\x4c\x6f\x8a\x93\x55\xd5\x63\x17\x93\x73\xde\x25\
+\xa2\x4d\x27\x38\xf7\x32\x64\x9c\x20\x97\xcc\xe3\x9c\xb4\x89\x84\
+\xf9\x80\xd3\xfc\xb0\x38\x4a\x0f\x2b\xa1\x96\x86\x77\x27\xad\xa2\
+\xef\xea\xa3\x42\xad\x5c\x5c\xdb\x2e\xce\xce\xa0\x86\x3a\xbb\x05\
+\xd2\xcc\xd0\x31\xb2\x78\xcb\xde\xb6\xee\x3d\xda\x1a\xce\x6f\x09\
+\x36\xf6\xe6\x99\x72\xe6\x95\xac\xae\x95\xb6\x04\xf1\xef\x94\x55\
+\x8f\xe3\x02\xb4\x59\x75\x55\x1c\x5e\xba\x17\x15\xec\x41\xa9\xe0\
+\x26\x69\x03\x70\x5b\xc5\x71\xb7\xa1\x05\xf6\x74\xc8\x5d\x59\x76\
+\x0c\x70\x09\xd2\xba\x62\xac\x4c\xcd\x25\x0d\x90\xda\x45\xd5\x01\
+\x6a\x28\x9d\x15\x62\xf5\x3e\x77\x78\xb4\xb8\xce\xb4\x0b\x33\x32\
+\xa9\x0d\xcc\xa0\xe9\x53\x92\xf0\x64\xd8\x5d\xec\x6c\xbf\x5b\x00\
+\xa5\x3a\xec\x33\x06\x67\x79\x7b\x8f\x9e\xea\x90\xee\x54\x91\xf8\
+\x5a\x34\xd3\xda\xda\x45\xcd\xe4\xfa\x1d\x01\xfd\x5c\xd3\xff\x00\
+\x3c\xd2\xcd\x9d\x7f\x94\xb7\x27\xac\xd0\x35\xa7\x6d\x9f\x65\xba\
+\x10\x83\x64\x58\xc9\x48\xc5\x5c\xc5\x98\x51\x60\x79\xa6\xf4\xb0\
+\x86\xc4\xa4\x7c\x44\x84\x89\x22\xd9\xc8\xa3\xd1\x80\x74\xdb\x78\
+\x40\xd9\x9b\x66\xf7\x24\xcc\xd6\xd5\x3a\x60\x76\x35\xea\x71\xa3\
+\x9f\xc3\x7c\xd9\xe2\xce\x22\xb7\x10\x3d\xec\xed\xb4\x06\x06\x66\
+\xb0\x10\x30\xd1\x6c\x89\x68\xc1\x4b\x77\x8c\xc3\x3c\x2e\xd5\x6b\
+\x5b\x94\x6a\xa6\x21\x68\xb7\x7b\x28\xbb\x1e\xaa\xec\x34\x46\x2a\
+\x6d\x81\x6a\x38\xce\x84\x89\x4d\x37\x37\x0e\x61\xa1\x9b\x61\x57\
+\x46\xd9\xcc\xcd\xf3\x97\xea\xda\xbf\xc8\x80\xaf\x1d\x61\x8d\x71\
+\xdc\x6c\xd0\x74\xab\x5d\x12\x8f\xb0\x4a\x34\x4c\xcb\x20\xbd\x82\
+\x86\x67\xa6\x05\xcb\x9e\xa3\x26\x77\xf1\xa2\x41\x76\xe2\x65\x42\
+\xf9\x1b\x66\x57\x69\x6c\xca\x0e\xee\x13\x4d\x25\x9d\x60\x16\x5a\
+\x22\x83\x39\x57\x12\x2b\x4d\x64\x2b\xab\x36\x81\xdf\x2f\x4c\xb9\
+\x4c\xef\x97\xd8\xd2\xbe\x8e\x3e\x6a\xdf\x95\x05\xfa\x75\xa1\x56\
+\xdf\x46\x74\xdc\x7c\xb6\xcf\xc9\xe4\x52\xcd\x9a\x12\x1c\xa1\x95\
+\xb6\x38\xfb\xb9\xcd\x64\x54\x44\x87\x94\xa5\x2d\xa4\x23\x7e\x27\
+\x30\xda\x19\xd3\xa6\x9d\xbc\xc5\x9d\x95\x42\xf9\xf9\x11\xb3\xb2\
+\x63\x42\xb2\x42\x53\x18\x0a\xd2\x56\xb8\x83\x28\xe7\x6b\x79\x02\
+\xa8\x12\x01\x24\xab\x22\x97\x43\x63\xcb\x41\x6d\x78\xc7\xf8\xaa\
+\x68\xb7\x75\x78\xda\x40\xd5\x5f\x1e\xea\x2d\x9e\x53\x98\xca\xfb\
+\x12\x5c\x4c\xda\x2e\x54\x0a\x09\x6f\xbc\xe1\xcf\xa5\xc7\x46\x5a\
+\xa1\x2e\x56\x6f\x9f\x29\xbf\x07\xe9\xf7\xcc\xc4\x7b\x26\x59\x88\
+\x02\xba\x1d\x5c\x36\x7b\x41\x9d\x27\x22\x1f\x51\xc1\xe7\xe2\xa6\
+\x04\xae\x21\x84\xc1\xf9\x70\x6f\x71\xf2\xe6\xef\x2c\x6e\xb3\x12\
+\x77\x47\x09\x64\x43\xa5\x4d\x3e\x3a\xba\xd9\xc2\x0f\x1d\x0b\x35\
+\x8c\x3d\x9b\x37\x95\x97\x78\x65\x15\xd7\x26\x9e\x61\xce\x14\x71\
+\xc5\xe5\x47\x5e\xfd\xaf\x65\x9a\x0a\x4b\x83\xc2\xd9\xc0\x6b\x08\
+\xe4\xb1\x01\x90\x1f\xa2\x2a\x0e\x8d\xa7\x8f\x6e\xb5\x0c\x6d\x3e\
+\xbd\x95\x72\xa2\x96\x3b\xa0\x6f\x39\xce\xf1\xe1\xd0\x75\x61\x38\
+\x1a\x15\xf6\xc7\x13\x00\xce\x4c\xcd\x04\x22\x7d\xc3\x18\xee\xef\
+\x0c\x4b\x07\x7c\x57\xaa\xeb\x3b\x17\x7b\xde\x3a\xfc\x77\x31\xb0\
+\xea\x5c\x8d\x66\x15\x55\x78\xd5\x8a\xae\xb8\x55\x09\xc9\x91\xc8\
+\xf2\x76\xbe\x11\x06\x67\x29\xe5\xa1\xcd\xaf\x17\x5b\x8e\x68\x64\
+\x74\xac\x07\x90\xd5\xa4\xf2\x53\xa6\x4d\xb2\x3c\xe4\xe5\x1f\x8f\
+\x2f\x26\xe4\xfe\x8a\xc9\x3b\x62\x28\x4a\xd5\xfb\x5c\xca\x3c\x67\
+\x80\x4b\xb6\x05\xcc\x3a\x58\x50\xd6\x83\xd3\x03\xea\x42\x35\x66\
+\xaf\xab\xf7\x16\x2e\x95\xad\x97\xa9\x21\x2a\x79\x19\xf4\xc4\xec\
+\x90\xfa\xab\x92\x60\x30\xad\x99\xcf\x01\x2c\xce\x75\xa9\x27\x65\
+\x75\x65\xd6\x05\x4e\x9d\x16\xae\x84\x8f\x4d\xe0\xac\xe5\x2a\x11\
+\x0b\x90\x5f\x3a\xcc\x73\xa7\x35\xfa\xe3\x5a\x29\xa8\xde\x80\x73\
+\xb4\xd5\xd6\xd0\xd4\x43\x49\x2e\x45\xc8\x1d\xb8\x1f\xe4\xc7\x68\
+\x5c\x67\x61\xad\x14\xec\x44\x33\x73\x17\xdf\x61\x74\xc7\x98\x22\
+\x3d\x86\xcb\x56\x4b\x80\x6b\x36\x72\x2c\x1c\xaa\xb3\x9b\x7b\xd7\
+\x3b\xd5\x54\x58\x08\x5b\x20\x39\xd0\x8b\xdd\x3c\x02\x69\xd8\x7f\
+\x56\xe9\x71\xae\x73\x45\x2d\xde\x42\x7d\x4b\x8c\x0a\xc3\x0e\x8b\
+\x47\x95\x45\x94\x35\x53\x3a\x7b\xbd\x11\x08\x17\x48\x5c\x8d\x57\
+\x56\xbe\x4b\xf6\x31\xe4\xdc\xd3\x5e\xe3\x3e\xa4\x00\x94\x54\xda\
+\xb7\x82\xa6\xa6\x7b\xab\xe1\xe8\xa0\xfe\x48\x45\x0c\x22\x78\x7b\
+\x41\x1a\xa6\xd6\x68\x74\x24\xda\x04\xba\x3a\xab\xe4\xfe\x45\x14\
+\x78\xa2\x4b\x45\x71\xf8\xf6\x5d\x75\xf4\x44\xc8\xd9\xb9\x55\x2a\
+\x3a\x09\xb4\xb0\x20\x35\x65\x39\xe4\x6b\x4c\x69\xe6\xb4\xae\x8b\
+\xaa\xe7\xd8\x82\xf6\x19\x0f\x12\x93\xab\x60\x89\xf5\x6e\xba\xb0\
+\x91\xc1\x02\xcf\x29\xbc\xc1\xce\x68\x93\x46\x2e\x53\x75\x35\x50\
+\x6a\xbb\xaf\x7e\xc4\x0a\xc6\xcd\x9b\xc8\xce\x33\x4b\x3d\x46\x0c\
+\xe3\xab\x2c\x41\x1c\x96\xe8\x7e\x5b\xb4\xe3\x75\x41\x62\xac\x42\
+\xcc\xa0\xee\xa3\xc2\xc7\x95\x47\xb2\xe0\xbd\x46\x86\xae\xc0\x3c\
+\x8c\x64\x35\xa3\x9b\x52\xd9\x6c\x63\xd8\x38\xf9\xa4\x4e\x12\x41\
+\x75\x55\xc4\x8a\x08\x5a\x4c\x90\x91\x8e\x66\x4a\xc7\x28\xaf\xb3\
+\xd2\x9c\x79\xf2\x41\x57\xcd\xc9\x05\x0f\x72\x0c\x5c\xbb\x90\xe2\
+\x75\xa5\xb4\x13\xe4\xdf\x44\xc4\xea\xb6\x17\x4a\xfa\xa1\x1b\x35\
+\x92\x10\xe9\x5f\xeb\xb4\x5e\x67\x18\x02\x91\x91\x58\x12\xa7\xb2\
+\xd9\xa3\x6d\xa6\x1d\x08\x95\xaf\xb4\xa3\xbe\x92\x24\x76\x5c\xd1\
+\xcc\x37\xd1\x66\xe5\x0f\x4b\x30\x65\xfa\x1d\xed\x73\x72\x6a\xbe\
+\xf0\xaf\xa9\xc7\x73\x8e\x7d\xba\x83\xaf\xc5\xe8\x31\x2f\x8c\x7e\
+\x96\x1b\x08\x83\x08\x8d\x83\x58\x83\x82\xd0\x79\x4a\x19\xda\xb8\
+\x48\x64\xa9\x56\xa5\xe9\x61\x06\xaa\x6c\x38\x13\x1c\x61\x72\xc6\
+\xe2\x5c\x3a\xfa\x56\xe6\xfd\x98\xfa\x58\x34\xa5\xf3\x96\xe1\xa8\
+\x03\x3f\xc1\x8f\xeb\xbe\x45\xbb\xb4\x19\x2d\x95\xcb\xfc\x81\x48\
+\x65\xd5\x64\x55\xb0\x5a\xce\x90\x31\xe4\x05\x6a\x2d\x3b\x38\x19\
+\xe8\x66\x58\x65\x22\x8a\x3c\xc6\xfb\x0c\xd6\xbe\x96\xec\xbd\xb4\
+\x5b\xb2\xf4\xd9\x21\x37\x9e\xcf\xb4\x60\x56\x93\x41\xaf\xfe\xdf\
+\xfa\x42\xd6\xd5\xb3\x5a\x7c\x8b\x94\xd0\x1a\x99\xfc\x80\x4f\x3b\
+\x6e\x58\xba\xeb\x1f\x55\xed\xc5\xf1\xb9\x56\x72\x1b\x07\x10\xd5\
+\x3d\x15\x98\x1f\x74\x67\x67\x92\xe5\xb7\x49\x9e\x80\x19\xc1\x52\
+\x02\xa3\x5c\x2d\x0b\x8f\x09\xab\x0e\xb4\x4a\xba\xdc\x49\xd1\x6a\
+\xa3\x81\x95\x95\x1a\x9a\xb5\x68\xec\x28\x71\xd6\x54\xbb\x5a\x84\
+\x1d\x8f\x38\x66\xf0\xb0\x8e\x4d\x5c\xb5\xf3\xe5\x29\x68\x0e\x0d\
+\x67\x13\x7e\xf0\xd2\x81\x08\xf1\xb3\xeb\x7e\xbd\x2a\x89\x5b\xa3\
+\x0c\xeb\x15\xc1\x4c\x3e\xd0\x56\x91\xfd\xaf\x3c\x60\x33\x15\xf7\
+\x16\x21\x73\x2e\x1b\xb3\xbb\xa6\xaa\xc3\x0e\xfa\xda\x1d\x26\x64\
+\x95\xbe\xbe\x27\x9d\xe1\x62\x67\xc6\x6a\x49\x65\xa5\x7d\xac\x28\
+\x57\x76\xaa\x55\x7a\x67\x4d\x1b\xbe\xb1\xec\x57\x95\x11\x2e\xd2\
+\x8a\xd6\x90\xd7\x2c\x4f\x0e\xad\x57\x7d\xf1\xe1\xa3\xf2\x3e\x49\
+\x81\xcb\xf5\xb2\x99\xab\xd9\xb5\x07\x29\xae\x4d\xf4\x83\x41\x69\
+\x94\xd8\x9c\x61\xec\xfd\x13\x84\x1a\x35\x66\x0b\x0a\x3a\x21\x75\
+\x91\xa9\x16\xa9\xe6\x86\xe9\xd6\x9d\x91\x15\x92\x98\x3a\xd6\x18\
+\x83\x9b\x9f\x00\x3e\x91\x3b\xd2\xfb\xb5\xba\x2a\xc7\x35\x8e\x95\
+\x6b\x77\x34\x90\x45\x8c\x38\xd5\xd7\xa0\x51\x5f\x3d\x52\x1f\xd2\
+\xbb\xd9\x05\xd1\x1b\xc1\x2d\x0d\x9e\x9b\x59\x06\xc1\x4d\xbd\x4e\
+\x9f\xcc\xa9\xed\x88\x17\x3f\x1b\xa2\x9a\x8f\x90\x83\x93\x52\x9e\
+\x1c\x65\x0f\x4f\x27\x59\xf9\xa6\xe9\x61\x1a\x04\xb6\xb7\x1e\xe2\
+\xf9\xaa\x7c\xa6\x37\xba\x1b\xa1\x79\xe2\xe0\x6d\x09\x72\x2b\xb9\
+\xa1\xa1\x99\xc4\xf6\x0f\xc8\x5c\xf8\x82\xcc\x16\xa9\x71\xdd\x2c\
+\xad\x72\xfa\x7a\xa0\x18\x16\xa0\xe6\x18\xbe\x6c\x8c\x4c\x2b\xac\
+\x3f\xa3\x3c\x22\x8e\xec\x7b\x77\xd3\x61\x61\x18\xa4\x9a\x85\xc5\
+\xfb\xec\xf8\x46\xaf\x4d\xbb\x1e\x17\xdd\xa8\xfa\x41\xc4\x06\x4e\
+\x3f\xf9\x92\x0b\x3f\x12\x95\xb4\xdd\x7f\xb7\x9f\x1d\x8c\x09\x8b\
+\x6b\x39\x23\x20\x72\x6c\xc1\x60\xf0\xe4\xb5\xc7\x93\xb5\xb3\x0d\
+\x7a\x99\x55\x56\x1b\x76\xd4\xb8\xdb\xd3\x52\x97\x1e\x7e\x5e\x77\
+\xdd\x97\xce\x51\xc0\x38\xaf\x29\x7c\xd9\x58\xe4\x75\x65\xb3\x29\
+\x33\xa6\xfe\xe5\x66\xb9\xda\xe1\x32\x1b\x6b\x64\x47\xf2\x7d\xab\
+\x8c\x7c\x0f\x94\x3a\xbd\xf3\x8a\x26\xc7\x48\x55\x42\x58\x66\x18\
+\x99\x1a\x6b\x66\x10\x54\xe8\xd3\x42\x43\x67\x61\x50\x11\xca\xa6\
+\xba\xa4\x93\x52\xda\x77\x0d\x1b\x95\xef\x1a\x2f\xd5\x31\xb2\xf3\
+\xce\x13\x01\x42\xc1\x2e\x58\x5c\x20\xd3\xbd\xc4\xd0\x4b\x7e\x9b\
+\x5a\xe3\x63\xcb\xf8\xee\xaa\xfd\x26\xd9\x90\xcb\xad\xd2\xfd\xb5\
+\xe2\xdd\xc3\x59\xde\xe9\x32\x75\x36\x78\x11\xcf\x29\xa1\x74\xeb\
+\x0b\xe3\x18\x21\x6f\x6d\x60\xb1\xd0\x73\xb5\xf2\x3a\xd3\xa6\xb0\
+\x13\x5b\x63\x90\x05\xb5\xf9\x25\xf6\x5c\x8c\xa0\xe9\xac\x05\x17\
+\x79\x7c\xec\x59\x3b\x86\x36\xfe\x65\x82\xf3\x87\xda\xd4\x20\xce\
+\xba\x4e\x2a\xf4\x1f\xd1\x14\x67\x41\xaa\x45\x0d\x3d\xae\x1c\x32\
+\x3d\x9a\xc9\xd9\x42\xe5\x33\xcb\xd2\x87\x20\xeb\x4f\x53\x93\x54\
+\xb7\x2d\x57\xf5\xe8\x96\xad\x87\xa6\xc7\x20\x5e\x97\x47\x63\xb4\
+\xa1\x7e\xc4\xa2\x49\x77\xcb\xc9\xd6\xe5\xf0\x7f\xda\xcf\x62\x40\
+\xee\xc0\x29\x26\xc5\xbc\x42\xd2\x1a\x9a\xfa\xca\x10\xe9\x1b\x4d\
+\x86\x07\x21\xf5\xf2\xb8\xc3\xb4\x13\x3a\x1c\xa7\x8e\xaa\xb6\xc7\
+\x28\xf7\x56\xa3\x50\x31\xfa\x20\x0b\x1c\x41\x2e\x17\x8a\xd7\x35\
+\x47\x17\x92\x58\x7c\x8c\x39\xac\x0b\x9c\x68\xfa\xe4\xe2\xf9\x8b\
+\x08\xec\x8e\xbb\x7a\x69\xd4\x7d\x2c\x21\x81\x38\x0b\x46\x67\x2a\
+\x84\x62\xf2\x20\xd6\x8d\x96\xf6\x87\xed\xeb\xa8\xee\x84\x26\xc7\
+\xf7\xdc\x9b\x54\xbf\x5c\xc9\x69\xb5\x34\x06\xcb\xcd\xf8\x42\xb9\
+\xfc\x85\x83\xe1\x12\xd5\xe9\x77\xab\xdd\x3a\xd7\x93\x77\xde\xd4\
+\xd2\xfd\x3a\xd3\xe4\xc3\x49\xed\xad\xaf\x5f\x91\x65\xea\xc7\x7e\
+\x63\x32\x75\xf8\x5b\xa9\xa6\xc6\x60\x73\x94\x7a\x2b\x8f\x99\xa3\
+\x01\x13\xaa\x38\x34\x38\xb3\xa1\xdf\xa5\x28\x0d\xf6\xdc\x57\x37\
+\x6d\x66\xc2\xe7\x08\xd7\x6d\x4e\x2b\xca\xf1\xf8\x38\x39\x5f\x2c\
+\x53\x9d\xb6\xb3\x7a\x37\x55\x9b\x91\xc1\x9c\x1f\x7b\x4c\xe7\x13\
+\x55\xed\x9f\x10\x58\x76\xef\x19\xce\x2d\xfe\x81\x38\x47\x5e\x9b\
+\x9a\x40\xf5\xce\x36\x08\x01\x5b\x43\x91\xf7\xf7\xc5\x0b\x79\x26\
+\x80\x0d\xa1\x8b\xa4\x0f\x49\xb0\xa2\xb4\xcf\xa5\x21\x94\x12\x98\
+\x55\x74\xa3\xed\x75\x45\x5e\x87\x7a\xcf\x5b\xc1\x99\xcd\x62\xe6\
+\x55\xfe\x54\x6a\x37\xaf\xc7\x29\x6b\xe9\x17\x42\x31\xf2\xb2\xf9\
+\x50\x72\x27\x73\x1d\x6e\x50\xde\x28\xb3\x33\x93\xf6\xa8\x9c\x73\
+\x9e\x32\x0e\x56\xa3\xab\x73\x1c\xb6\x70\xf9\xc9\x6b\xd6\x25\x5d\
+\xac\x87\x9e\xeb\x66\xb9\x9e\x55\x79\x2e\x8e\x67\x19\x57\x3a\x46\
+\x7e\x0e\x85\xb6\x59\xc6\xca\xa9\xcf\x47\xd6\x08\x97\x59\x5b\xc4\
+\x9e\x37\x3c\x50\x7e\x16\x1c\xd0\x28\xd3\x1f\xd6\xa5\x84\x05\xf6\
+\xef\x11\x50\xb1\x54\xef\x9c\x39\x3a\x76\x9a\xf7\x64\xc5\xdc\xce\
+\xe4\x6b\x50\x2c\xaf\x65\x4f\xd3\x49\xb8\xa9\x13\x24\x45\x2c\x4e\
+\xc1\x28\x5b\x1f\xa8\x0c\xd6\xfa\xca\x7d\xe2\xed\x67\xc4\xdb\x31\
+\x71\xe8\x4f\x15\x5a\x4a\xff\x00\x2a\xd9\x67\x11\x75\x39\x3c\xcc\
+\x01\xe4\x45\x4e\x4a\xb3\x40\x57\x7f\xe4\x3d\x21\xfc\x87\xc7\x38\
+\x4f\x22\xd1\x1b\xdc\x2f\xd5\x97\xb3\xf8\xe0\x5a\x56\xed\x69\x5e\
+\x05\x92\x5e\x93\x7e\x89\x2e\xc6\xaf\x20\xc6\x60\xfc\xc1\x9e\x57\
+\xa2\xbf\x37\xe3\x16\x5c\x0c\xa7\xb9\x1b\x1a\x45\x4a\x8c\xf2\x35\
+\x21\x5f\xca\xb9\x2d\xf1\x17\x0e\x25\x99\xd9\x82\xdb\x47\x46\xa4\
+\x8d\x72\x8a\xb0\x32\x15\x97\x91\x72\x80\xcc\x35\xe9\xe7\xe3\xaa\
+\x95\x8c\x8e\x4a\x28\x80\xe5\x04\x2b\x16\xe2\x35\x4a\x06\x6d\x5b\
+\x82\xd5\x3d\x33\x46\xcd\x48\x09\x02\x94\xb7\x6e\x8e\x06\xaa\xd0\
+\x64\x73\x2b\x09\xf4\xa2\x34\xc8\xd7\xe5\x5e\x26\xd2\xce\xf8\xd7\
+\x7d\x4d\xab\x7c\x66\xfe\x33\x78\xba\xba\x22\xa3\xfa\x78\x58\xcc\
+\xe8\xfc\x93\x6e\x52\x05\x36\x19\x62\x36\x0e\xa0\xcc\xcf\x2d\x59\
+\x95\xf3\xd9\xc6\x63\x34\x5e\xb2\x85\x79\xa3\xac\x78\x71\x73\x59\
+\x7f\x88\x70\xa8\xd8\x8a\x8a\x95\xe4\xe3\xb8\x47\xac\x77\xe6\x73\
+\xd9\x6d\x90\xf1\xd0\x3e\xf0\x36\x99\x53\x39\x66\x35\x59\xbd\xb4\
+\x3e\xef\x66\x2b\x45\xe5\x0d\x62\xd9\xc5\x19\xf3\x2f\xc3\x1a\x5c\
+\x78\xda\x86\x3d\xd9\x02\x0d\x2e\x51\xb0\x41\x95\xbc\xe4\xb6\x21\
+\x01\x14\xe6\xf1\x78\x7a\x25\x68\x31\x89\x1d\x2b\x61\x2c\xaf\x93\
+\x6a\xd8\x06\xb2\xda\x03\xf2\x2e\xc6\x72\xcd\x2b\x4d\xab\xfa\xc6\
+\xd2\xf7\x27\x8b\x30\x3a\xdf\x57\xd9\x45\xec\x7d\x0c\x16\xdc\xd2\
+\x35\x0c\x5e\x44\xc1\x9f\x3e\x1f\x0c\xe3\x9e\xf6\x67\x0e\xab\x3d\
+\x5f\x21\x6b\x23\x4d\x62\xa9\x9b\xc9\xb9\x12\x5c\x63\xa0\xab\x9a\
+\xab\x2b\x4d\x29\xcb\x39\x5a\xfe\x44\xd9\xce\xf7\x98\xc7\x41\x9b\
+\xdd\x54\xec\x87\x5c\xb0\x42\xea\xc4\x8b\x1d\xc3\x56\x92\x6f\xb2\
+\xd5\x7a\xd0\x35\x06\xc0\xc1\x3c\x2c\x65\x3f\x16\xd7\x46\xe5\x6d\
+\x53\x07\xcb\x34\xbd\xd2\x6d\x5b\x07\x4f\x8c\xc9\x74\xaf\xc8\x47\
+\xfa\xcb\x71\x68\x17\x22\x95\xb3\xcb\x48\x0f\x2a\x2c\x19\x71\x49\
+\x45\x5c\x07\x40\x19\xe3\xc5\xb2\x67\x5b\x58\x5b\xd9\xe6\x29\x18\
+\x57\x5f\x45\x5c\xbd\x97\x38\xff\x00\x1c\xce\x68\x6f\xcb\x05\xb6\
+\x1f\x1a\xb7\x23\xe3\x1b\xb9\x9b\xa9\x23\x52\xf2\x88\xb5\x39\xce\
+\xc1\xf9\x3c\xac\x07\x39\x33\xdc\x6f\x3f\x70\x44\xd8\xf0\x2e\xce\
+\xfa\x5b\xfc\x6f\x55\x85\xf7\x31\x12\xce\x59\x70\x71\x5c\x6f\x2b\
+\xdb\x0b\xc5\xb4\xf5\x76\xf3\x31\xf4\x1d\x09\xf2\xd8\x21\xe8\x4e\
+\x98\xb5\xed\x72\x84\xd0\x62\x80\x53\x1f\x0e\x0c\x26\xe2\xfc\x99\
+\x33\xd7\x35\xc7\x7c\x3a\x0d\x1a\x6e\x42\x8a\xd2\xef\x0f\x5a\xb5\
+\xae\xc4\x6c\x2b\xb6\xdb\xa8\x4a\x53\xc9\x03\x9b\xc7\xf9\x03\x03\
+\xf6\x5e\x4e\xf5\xcb\xa9\xc9\x70\xee\xac\xa8\xba\xd6\x1e\x56\x1c\
+\xe9\x72\x0d\x87\x36\xf9\x56\x5a\x34\x22\x5c\x79\x9e\x51\x99\x09\
+\x8b\x2b\x2f\x8f\x72\x2d\x6c\x22\x87\x4d\xbe\x38\x91\xfe\x4e\x78\
+\x83\x4a\xb8\xc8\x85\x87\xf2\x96\xbf\x1d\x71\xd6\x94\xf8\xd3\x97\
+\xa6\xdf\x15\xa7\x10\x6b\x37\xad\x9e\x21\xb4\x06\xf8\x63\xcd\xd1\
+\xba\x71\xd1\xac\xe6\x44\x06\xb4\xaf\x90\xd9\xfc\xab\x02\x9a\xdc\
+\xf5\x3b\xdb\x94\x71\xf8\xd1\xbf\x7a\xc5\x98\x7b\x8e\x1c\x47\xe4\
+\x9c\xb2\xb9\x59\xfa\x1f\x00\x42\xf6\xe3\x3c\xb1\x6a\x84\x4e\x9a\
+\xa4\xb4\x69\x1a\xc2\x77\x63\xd4\x73\x1b\x95\x23\x4b\x9b\x98\x4b\
+\x14\xce\x75\x7b\x54\x47\xc5\xd7\x07\x35\x10\xd5\xcb\xcc\x38\x1b\
+\xbe\x52\xa7\xb4\xf2\x0b\xdc\xfb\x0a\xb8\xc3\xe3\xd1\xd5\x2e\x75\
+\xf9\x26\x62\x9f\x83\xe0\xaf\x1f\xd4\xe6\xef\xa8\x4d\x34\x39\x02\
+\xa8\x33\xc3\x9d\x27\x30\x74\x23\xb8\xd3\x70\x8d\x91\xbd\x9d\x5e\
+\x30\xae\x1e\x27\x21\xae\xf5\xf2\xf4\x21\xce\xb8\xd7\x2a\xf9\x1c\
+\x35\xff\x00\xe3\x71\x77\xad\x9c\x0e\x56\xc8\xae\xc9\xb4\xa3\x42\
+\x46\xb3\x4f\xc8\x59\xf8\xf4\x0e\x0d\x3f\x8a\x38\x46\x72\xfc\x87\
+\x83\xfc\x72\xc2\xcc\x70\x26\xd1\x12\x3a\x17\xcb\xd5\x62\x93\x5e\
+\xbf\xe3\xe9\x58\x16\x77\x23\x79\x43\xba\xfe\x53\x8a\x37\xda\x11\
+\xf5\xc8\xa6\x95\xd5\x16\x59\xd8\x0e\x45\xbe\xe1\x1d\xad\xd4\x39\
+\x7b\xce\xe0\x6a\xe1\xe9\x5f\x3b\x57\x27\x88\xa7\x2d\xe4\x46\x9c\
+\x2b\xcd\x35\xc1\x0d\x75\x9d\x62\x04\xfb\x73\x9c\xbb\x8f\xc1\xe3\
+\x8a\x65\xb0\x04\x46\xf2\x95\xae\x86\x41\xf8\xfa\x4b\x66\x73\xde\
+\x24\xb3\xef\xfc\xa5\x3c\xf1\xee\x0d\xc8\xb4\x71\x75\x75\xe3\x89\
+\xf3\x1d\xab\x56\xe1\xc8\x53\x2b\x38\xad\xa7\xa9\x85\xcd\x17\xd3\
+\xc8\xcd\xd1\xde\xf4\xa2\xa8\x50\x84\x73\x3d\x73\xf7\xe8\xea\x3f\
+\xf8\xd5\x1b\x79\x04\xf0\x76\xf9\x31\x70\x53\x60\xb9\xdb\x99\xa0\
+\xcd\xc5\xe1\xee\x7c\x8f\xc5\x38\x9e\x86\x97\x25\xe0\x91\x95\xf2\
+\x07\xc5\x8f\x67\xac\x93\x1a\x89\x12\xfc\x98\xed\x65\x6f\xdf\xf8\
+\xfe\xa8\xb6\xf8\xb2\xf9\xe5\x8d\x46\x34\x19\xca\x69\x77\x37\x51\
+\x62\x9a\xbb\x9c\x49\x96\xb1\x39\x02\xb9\x8b\x6f\xe7\x70\xaf\xcc\
+\x54\x39\x1c\x8a\x8d\xe8\xd0\xa6\x6d\x70\x77\x07\x30\x9f\x77\xd4\
+\x4f\x4e\x97\xae\xb2\xee\xe7\xe9\xea\x50\x8c\x9e\x30\x57\x2f\x10\
+\xe4\x79\x02\x02\x58\x98\x96\x69\xb5\xf4\x9d\x6b\x5b\x85\x60\xdf\
+\x65\xae\x47\x83\x85\x96\xea\x9a\xd7\x25\x4b\x4d\x4d\xd7\xf5\x4c\
+\xea\x9b\xc1\x53\x49\x3e\xb3\x8a\xc6\x76\x72\xd6\x39\x91\xe4\x9a\
+\x46\x5f\x61\x6e\x51\x07\x7b\x7b\x96\xe7\xf2\xa0\x71\xc3\x55\xb2\
+\x6c\x65\x67\xd8\x38\xe0\xce\xa6\x3f\xc9\x2a\x9b\x94\xf0\x8f\x89\
+\xd2\xae\x7f\x1f\x7a\xf9\x65\xbb\x9b\x04\x5b\x04\x78\xdc\x3d\xe7\
+\x39\x52\xff\x00\x22\xa6\xc0\xb9\x87\x15\xe4\xc3\x47\x87\x1a\x1f\
+\xd0\x6e\x10\xe4\xdc\xe3\x89\xe8\x9a\xbf\x1e\x8f\xe9\xae\x3e\x31\
+\xa6\xc6\x4d\x44\xa2\xdc\x63\x44\xf7\xd2\x7d\xc5\xc0\x05\x5a\xaa\
+\x20\xc3\x76\x23\x9a\xe9\xed\x0c\xdb\x9b\x2f\x31\xa6\x72\xd8\x58\
+\x2f\xfc\xb5\xb0\x9b\xfa\x94\xd4\x6f\x1f\x03\x8f\xd9\xcb\xe5\x65\
+\xe9\x1d\xbd\x57\x77\x8c\x2c\x73\x62\x9b\x2f\x36\x8b\x53\x41\x86\
+\xcc\x41\x67\xd6\xa6\xd9\x8e\x3e\xc6\x43\xbc\xb7\x3b\x58\x47\x7b\
+\x41\xa6\x3c\xb9\x9c\x71\x44\x83\xc3\xd8\x53\x1f\x1d\x62\x62\xf0\
+\x77\x37\xf4\xcb\xb9\xa4\xf9\x6e\xea\x9c\x3d\x31\xa5\xb3\xc5\x34\
+\xf4\xf3\x36\x83\x7f\x39\xbd\x80\xdf\xa0\x83\x2d\xb5\x13\xdc\xe4\
+\xa8\xeb\xdb\x97\x7c\x6f\xcd\x58\xdd\xe0\x0e\x6d\xea\xf2\x5e\x2c\
+\x6d\x7e\x3a\x1d\xa1\x2b\x98\x37\x74\xb1\xf4\x6a\xeb\x40\x74\xa1\
+\x81\x71\xc0\x48\x36\xf8\xce\x5d\xef\xa5\xc9\xaa\xda\x36\xcc\xc0\
+\x10\x8c\x3d\x3e\x49\x77\xf1\xf8\x83\x07\xf7\xcf\x9c\x71\x64\x6f\
+\x1c\xfb\x08\xef\x7b\x61\x43\xf2\x5a\x0b\xc3\x90\xc8\xde\xc4\x86\
+\x1a\xdb\xcd\x19\x9e\x27\x20\x50\x5c\x70\xce\x0a\x14\x8c\x8d\x7c\
+\xaf\xc1\xa7\x26\x1e\x6e\x32\x18\xf6\x47\x1f\x6d\x76\x75\x67\x51\
+\x3c\x42\x3f\xca\x76\x4f\x40\x35\x22\xeb\x05\x13\x2d\xf2\x03\x87\
+\x96\x6e\x1d\x15\x04\xcc\x20\xce\x8e\xa9\x8b\xa2\x9b\x99\x83\x15\
+\x36\xf9\x56\x45\x28\x2e\x1b\xa2\x59\x6b\x96\xf0\x65\xb4\x15\x16\
+\x1f\x21\xe0\xfc\x77\x03\x9c\x49\xd8\x00\x0b\xc5\x5c\xcf\xe5\xae\
+\xe8\xf1\xfd\xd2\x08\x8a\x61\x60\x6b\x72\x4c\xd9\xd2\xcf\xcf\xcf\
+\xe1\x48\x07\x17\x03\x5f\xba\x84\xcd\xe4\x26\xc5\x0e\x90\x90\xfe\
+\x25\x9a\xee\x8a\x4c\x05\x61\x43\x7c\x91\x60\xb6\x3c\xfc\xbc\xce\
+\x4d\x82\xe9\xaa\xd6\x26\xf4\x3a\x6b\x71\x25\x38\xba\x28\xf3\x1d\
+\xf0\x89\x00\x6d\x3f\xf9\x2c\x3c\xd5\xde\xc8\xcb\xb3\x8f\x63\xbf\
+\xc8\x5e\xc2\x57\x3f\x91\x38\xfd\xe3\x19\x27\x29\x94\xfd\x13\xd0\
+\xdf\x60\xb9\x80\x59\xa2\x59\x0d\x1d\x7a\x89\xef\x93\xc1\x4f\xe6\
+\x39\x57\x1b\x08\x6c\xe8\x36\x86\xc5\xf0\xd5\xd7\xaf\x0f\xe2\x8a\
+\xe9\xa9\xd9\x9d\xb6\xae\x48\x5d\x03\x2e\xb3\x71\x70\xed\x12\x04\
+\x28\x55\x35\x39\x7e\xca\xaa\x7a\x02\xe1\x2e\xcd\x59\xac\x8c\xc3\
+\xe1\x3a\xce\xe6\xe9\xf2\x95\x15\x57\x9b\x65\x34\xc5\xb5\x51\x2d\
+\x42\xce\x5a\xf0\xe6\xd6\x9e\x95\x92\x15\x4a\x60\x0b\x8f\x6d\x38\
+\xd3\x9c\x89\xf6\x49\xc8\x07\xb7\xab\x9e\xb7\x36\xc0\xce\x76\x9c\
+\x2b\x1f\x3f\x61\xf9\x40\x52\x84\xb4\x6d\x55\xff\x00\xff\xc4\x00\
+\x40\x11\x00\x01\x03\x03\x02\x02\x07\x07\x02\x04\x03\x09\x01\x01\
+\x00\x00\x01\x00\x02\x03\x04\x11\x21\x12\x31\x13\x41\x05\x22\x32\
+\x51\x61\x71\xf0\x10\x14\x23\x42\x81\x91\xa1\xb1\xc1\x33\x52\xd1\
+\xe1\x15\x20\x62\x06\x24\x43\x53\x72\x82\xa2\xc2\xf1\x92\xb2\xff\
+\xda\x00\x08\x01\x03\x01\x01\x3f\x01\xe0\x5f\xd7\x9a\x99\x9a\x5a\
+\x6c\x98\xf7\x0c\x65\x48\xdf\x9c\xf2\x4d\x9e\xc7\x0a\x32\x5d\xd6\
+\xe4\x8b\x90\x77\x59\x4a\x6e\xa7\x6d\xda\x6c\x9b\x19\x2a\x1a\x73\
+\xa9\xa5\x35\xba\x42\x2f\xeb\xe9\x51\x32\xe1\x70\x7a\xc9\x8c\xb2\
+\x7e\x58\x42\x7b\xf4\x28\xdd\xa9\xc1\x45\x17\x56\xea\x53\x6c\x28\
+\x73\xeb\xcd\x08\xae\xd5\x34\x2e\x5c\x33\xaa\xea\x26\xa6\x59\x83\
+\x51\x55\x32\x8b\xe1\x46\x5c\x5d\xe0\xa3\xf5\xf9\x4d\x4f\x98\x37\
+\x0a\xed\x7a\xe1\xfa\xf4\x14\xac\xb3\x09\x4e\x4c\xa8\x16\xe4\xa6\
+\x98\x3a\xfb\x26\x35\x87\x9a\x9e\xc6\x32\xce\xfe\x68\x00\xd7\x28\
+\xa5\xea\xdb\x92\x2f\x40\x85\x24\x8d\x1c\xd4\x92\x1d\xb0\xa9\x62\
+\x6b\x85\xdd\xf8\x4f\x22\x3d\x93\x0f\x10\x2f\x75\xf8\x81\xd9\x51\
+\x59\x9b\xa0\x5a\x4f\xb0\x67\x0a\xa1\x99\x50\xb5\xc1\xc3\x0a\x0d\
+\x5a\x36\x52\xb6\xf2\x7d\xd4\x0d\x02\xde\xbb\xd3\x1c\xd0\x14\xd2\
+\x35\x48\xf1\xe0\x99\x2d\xbb\x94\xb5\x07\x84\x76\x4f\x98\x93\xc9\
+\x44\xfd\xb6\x51\x69\xef\x4e\x94\x0b\xd9\x3d\xc0\xbb\x75\x16\x91\
+\x9b\xad\x7e\x49\xe7\x58\x2d\xb6\xe9\xd0\xe2\xe8\xcc\xe1\x85\xad\
+\xc4\x5d\x53\x82\x42\x95\x87\x4d\xd4\x98\x29\xb2\x75\x70\xa1\x88\
+\xbc\x5d\x4c\xc7\x32\xe9\xce\x24\xd9\x45\x4e\x5c\x35\x59\x0f\x86\
+\x13\xdc\x5e\x6c\x39\xaa\x28\x8e\x2e\x8c\x03\x4a\xab\x93\x84\x54\
+\x15\x97\x90\x65\x7b\xc8\xef\xf5\x9f\xec\x85\x48\xbe\xfe\xb2\x9d\
+\x30\x73\x94\x01\xb7\x05\x46\x5a\x18\xa6\x78\x32\x5b\x9a\x63\xec\
+\x8c\xdd\x5d\xd3\xde\xe3\xcd\x3a\xe3\x2b\x8b\xeb\xd1\x4f\x9e\xe0\
+\x8b\xa0\xfb\xb9\x30\x75\x3d\x78\xa6\x97\x00\x9f\x31\x06\xf7\x46\
+\xa0\xea\x51\x54\x61\x36\x5b\xf3\x51\x9b\x9c\xa9\x5c\xd0\xd5\x34\
+\x2e\xd5\xb2\x82\x0b\xb7\xad\x84\xd3\xc3\x36\x1f\x94\xe3\xc4\x8c\
+\xdf\xf1\xf5\x55\x23\x4b\xac\x14\x21\xc6\xd8\x54\x4c\xea\xe5\x4f\
+\x00\x76\x32\x9f\x4c\xd0\xfe\x6a\x9a\x28\xf8\x76\xbe\x6c\xaa\x62\
+\x02\xf6\x50\x43\x79\x5b\x75\x08\x2c\xd8\x22\xe7\x35\xb7\x5d\x22\
+\x1a\xfb\x92\x7e\xc9\xb2\x16\x48\x00\xf1\x42\x77\x15\xc6\x2d\x17\
+\x50\xcc\xe7\x38\x5d\x53\xe9\xd1\x7e\x69\xaf\xea\xee\xa4\x1f\x13\
+\x56\xe9\x99\x45\xa0\x36\xe3\x75\x73\xdd\xf8\x4e\x17\x69\x16\xfc\
+\x29\x86\x84\x66\x17\xb1\x4d\x7b\x77\x19\x28\x57\xcc\xd2\x1b\xa5\
+\x96\xf1\x50\xd6\xb9\xf8\x21\xa3\xc9\x39\x91\xc8\xd3\x93\x75\x50\
+\x34\x3b\xaa\xa2\x91\xda\x71\xba\x8e\x67\x0d\xec\x85\x50\x02\xf8\
+\xc2\x9a\xb8\x9b\x81\x64\xe8\x5a\xe3\x7c\x2d\x2d\x6b\x6c\x9d\xda\
+\xf5\xdc\xbf\xe1\x9f\x5d\xea\x56\xea\x7a\xa7\x83\x4b\x75\x15\x0c\
+\x8d\x62\x32\xb4\xe5\x4f\x63\x72\x14\x53\x3a\x37\x0b\xec\xa4\xa8\
+\x6b\xca\xa7\x2d\xd4\x0a\x8d\xe3\xc1\x48\xe0\xe8\xc8\x1b\xaa\xa8\
+\xdc\x6e\xa4\x84\xb5\xda\xf6\xb2\x6b\xbd\x7f\x55\xda\xea\xaa\x5a\
+\x62\x48\x2a\x3b\xb0\x0b\xae\x3e\x6d\xeb\x9a\xed\x65\x03\x65\xc4\
+\xc6\x57\x11\x9e\xbe\xbf\xd1\x19\x19\xeb\xea\xaa\xde\x08\x36\x52\
+\x6a\x2f\xc2\xa7\x63\xf9\xae\x15\xcd\x93\x63\x2c\x4c\x7b\xb0\x14\
+\xcd\xd4\x6e\x9a\xed\x3b\xa7\xca\x39\x27\x4a\xe3\x70\x11\x7b\x81\
+\xcd\xd3\x59\x8c\xa9\x6c\x2f\xa7\x25\x36\x1d\x79\x37\x4e\x61\x00\
+\xb7\x92\x91\xb6\x7e\x14\x26\xf1\x58\xa7\x9d\x27\x74\xe9\x07\x0c\
+\xd8\xe5\x07\xdc\x65\x4b\x27\x24\xcb\x3b\x24\x95\x0b\x85\xc0\xba\
+\xe3\x06\x1d\xd7\xbd\xb0\x30\x96\x9b\xbb\x18\x2b\x5f\x18\x67\xf0\
+\xaa\x20\xd4\x1c\x2d\x85\x2d\xe3\x7d\x86\xde\x2a\x92\x36\xbe\xce\
+\x3b\xa8\xbe\x1e\x00\x45\xd7\x6a\x6c\x2d\x39\x24\xa0\x4b\x4e\x91\
+\xb1\xff\x00\xea\x7c\xa4\x1d\x82\x6b\x83\xbb\x46\xca\x4a\xc7\x36\
+\x4d\x22\xd6\x4f\xad\x7b\x48\x18\xb1\x4d\x73\x66\x19\x28\x53\xb0\
+\x3e\xf9\x4d\x01\xbb\x2c\x87\x07\x6e\x9b\xd7\x19\x09\xe3\x4e\x42\
+\x64\x2d\x91\xbc\xee\xaa\x29\xc8\x26\xd7\xb2\x73\x2d\xb9\x2b\x88\
+\xd6\x9f\x5e\x2a\x47\x87\x22\xf0\x5b\x84\x6f\xc5\x17\xd9\x45\xa6\
+\xca\x7b\x68\x36\x5a\x35\x14\xde\xab\x54\xb7\x71\xc2\x64\x0f\x3d\
+\xe8\xc0\xe0\x14\xec\x21\x46\x1d\xea\xfe\x2a\x30\x46\x54\xa5\xe4\
+\xe1\x44\xd9\x49\xce\xca\x27\x10\x6c\x8b\x03\xe3\x3e\x4a\xb2\x2b\
+\x3d\x51\x8c\x04\x37\x43\x21\x31\xb8\x45\xbd\x75\x33\x70\x4a\x96\
+\xa7\x45\xc5\xd5\x3e\xa9\x65\xf3\x55\x74\xee\x1b\x2a\x48\x9c\x37\
+\x4f\xc3\x53\x4d\xd3\x59\x74\xc6\xd8\x29\x32\x6c\xa1\x78\x6e\xea\
+\x62\xc7\x30\xaa\xab\x58\xd9\x10\xe7\x49\x61\xcd\x45\x03\xf9\xa6\
+\xd4\x11\x8c\x26\x06\xc9\xb9\xcf\x82\x1d\x5d\x8a\x94\xdd\xa5\x31\
+\x82\xc9\xff\x00\xca\xa3\x84\x13\x9b\xa6\x46\x03\x6d\x65\x20\x00\
+\x15\x53\x1c\x7a\x5c\x79\xad\x61\x87\x92\x6c\xad\xd3\x7c\x21\xa0\
+\xe5\x3e\xa0\xb0\x59\xa1\xa9\x92\xb9\xd9\x20\x5d\x32\xad\xe0\xe9\
+\xb0\x55\x2e\x74\x8f\xc8\x54\x8c\x16\x0a\xc9\x9b\x80\xa3\x68\xf5\
+\xf5\x52\xd3\x00\xc2\xe6\xdc\xb9\x4b\x13\x74\x75\xaf\x7b\x2a\xc8\
+\xa5\x6c\x9a\xad\xd4\xef\x54\xb2\x98\x9f\x70\x07\xd5\x6a\x6c\xed\
+\xbb\xad\xf4\x51\x4a\xd0\xed\x22\xca\xa2\x7e\xb8\x8c\x5b\x2a\x2f\
+\x5f\x95\x18\xd9\x17\x5b\xb9\x1e\xd5\xd3\x8a\x2f\x16\x37\x2a\xa2\
+\x5b\xe0\x28\x18\x38\x8d\x73\x93\x74\x27\x30\x83\xcd\x53\x12\x1c\
+\x3b\x93\x9c\x9c\x6e\x14\x7d\x9f\x5d\xe5\x4a\xed\x3d\x65\x0d\x43\
+\x53\x6a\x05\xb7\x53\x4b\xab\x64\xf6\xb9\xd8\xca\xa8\x63\x98\x57\
+\x11\xc0\x59\x44\x49\x1e\xbc\x56\x82\x5d\x94\xc6\x58\x21\xfc\x40\
+\xb8\x3a\x8d\xd4\x2d\xd3\x61\xeb\x9f\xb1\x9d\xa0\xa3\xf5\xf9\x51\
+\x80\x48\x07\x65\x55\x4c\x4e\x46\xca\xba\x28\xcd\x3b\xe3\xb7\x5c\
+\xa3\x4e\x5a\xe4\x35\x36\x32\xa0\x24\xc8\xa5\x69\xf7\x86\xfd\x54\
+\x2d\x4c\x18\x4e\x4e\xe6\xa4\x7d\x94\xb2\x9b\x10\x0a\x00\xee\x57\
+\x17\x3a\x46\xea\x32\x4a\x2d\x27\x74\xd2\x1b\xd9\xdd\x6a\x27\xb4\
+\x8e\x8e\xf5\xc5\x0d\x09\xfa\x26\xea\x38\xef\xdc\xb8\x4d\x61\xc1\
+\x3f\x54\xde\xce\x49\x5a\xc0\x3b\xa6\x91\xa6\xe3\x75\x3c\x3c\x40\
+\x4d\xbe\xca\x68\x8b\x2f\x60\xa9\x45\xc0\xba\x11\x02\x54\xbc\x46\
+\x60\x37\xf0\xac\xe0\x75\x91\x9f\xea\x9a\x2c\xc0\xee\x7e\x2a\x16\
+\xeb\x1a\xbb\x91\xbd\xd3\x19\x8d\x5c\xd5\x3b\x75\x6e\x9b\x03\x74\
+\xde\xe6\xea\x30\x1f\x76\x39\x74\x9d\x23\x22\x97\x88\x1c\xef\x23\
+\xb2\xe1\xb1\xe5\x49\x4e\x04\x66\xca\xc6\x07\x5c\x0f\xba\x6b\x84\
+\xaf\x04\xda\xfe\x0a\x37\x10\x42\x66\x5b\xeb\xc5\x3c\xd9\x3a\x53\
+\x9d\x94\x99\x17\x58\xe2\x58\xf8\xa9\x1c\x00\x20\x26\xea\x32\x82\
+\x15\x33\x09\xed\x05\x33\x47\x25\x0b\x4f\x19\xb7\xdb\x2a\x67\x58\
+\xd8\x28\xa2\x74\x9b\x29\x69\x1e\x11\x8d\xd1\x9d\x46\xf8\x45\xf7\
+\x29\x8d\x2f\x66\x91\xbf\xf7\x29\xd4\xcf\xba\x86\x99\xc2\xd7\x18\
+\x5e\xed\x76\x9c\x2a\xaa\x3c\x38\xd9\x46\xcd\x18\x50\x32\xee\x17\
+\x4f\xa7\x6b\xb2\xa7\x8c\x00\x7d\x6c\xa4\x3a\x63\x01\x51\x37\x54\
+\x45\x18\xf2\x99\x1e\x14\x0c\xb2\x84\x5c\xd9\x37\xab\x21\x5d\x31\
+\x19\x74\x6e\x23\xc1\x31\xa5\xbb\xa2\xf6\xe9\x21\x54\x80\x49\x50\
+\x34\x89\x01\xe4\x9b\xda\x1e\xb9\x28\xfb\x07\xd7\xf3\x29\x3d\x7e\
+\x15\xae\x6c\xa4\x16\x1f\x7f\xd1\x4a\xe2\x1f\x85\x1b\x1c\xff\x00\
+\x15\x05\x25\x9e\x1c\xe1\x85\x1c\x22\xd8\x4e\x81\xc4\x65\x10\xe6\
+\xbf\x01\x36\x9c\xc8\xed\x46\xea\x9e\x3e\x15\xb1\x7b\x77\xa7\x97\
+\x3b\xe5\x0a\x78\x43\x98\xeb\xa8\xe8\x1a\xe3\xf3\x2a\x4a\x16\x87\
+\x8d\xd3\xa8\xe3\xdf\x2a\x46\xe8\x61\xd2\x02\x89\x9a\x9b\x95\x58\
+\xd0\x1a\xe0\x9e\x00\x2a\x09\x11\xaa\x2d\xc6\x13\xb4\xc8\x2e\xaa\
+\x63\x01\xbc\xd7\x47\x7f\x0c\x85\xa3\xcd\x47\xb8\x1c\x94\x4c\x51\
+\x37\x49\x07\x9a\x73\x6c\xed\x4a\xb1\xa2\x48\xdd\x74\xff\x00\xe2\
+\x68\x2a\xa1\xbc\x30\x4b\x49\x28\x9b\xee\xb5\xe9\x18\xb2\x81\x9a\
+\xec\x4f\xac\x20\x2c\x2c\x9e\x16\x1a\x6e\xaa\x88\x6c\x5a\x9b\xbd\
+\x96\x97\x3c\x97\x73\x54\x50\xde\xc5\xd8\x52\x69\x64\x66\xdc\x94\
+\x12\xe1\x4d\xa7\x60\x9b\x49\xad\xf7\x51\x50\xf8\x23\x47\x66\x5e\
+\xcb\xdd\x3a\xb7\xb2\xa8\x66\x92\x54\x5a\x54\x1a\x75\x0b\x27\xb5\
+\x4c\x2c\x09\x2b\xde\x43\x05\x95\x65\x40\x31\xb8\xa3\x2d\xca\x8c\
+\xe1\x3f\x55\xd4\x17\xb8\x55\x4d\xea\x2e\x8e\x6f\x53\xfa\x7d\x56\
+\x9f\x35\x1b\x7a\xc1\x44\x13\x1a\xa4\x6a\x91\x97\x04\x2a\xa3\xa2\
+\xa4\xf9\xa9\x7a\xff\x00\x55\x23\x74\xa6\xbe\xef\x0d\x54\x8d\x44\
+\x62\xe9\xfb\x29\x76\x3f\x45\x52\x08\x83\x3d\xca\x94\xb7\x55\x8f\
+\x8f\xee\xb8\xcd\x66\x02\x32\xf1\x05\x94\x11\x9b\x7a\xf1\x5a\xdc\
+\x5e\x15\x3c\x6d\xe1\xea\xe6\xa2\x0d\xb5\xd4\x92\x1d\x3a\x6c\x2d\
+\xf9\x41\xc6\xd6\xb2\xae\xa6\x6b\xa3\x73\xc5\xf5\x61\x45\x09\x54\
+\xec\xd2\xf6\x92\xa7\x9c\xb7\x02\xca\x59\x43\xd8\xe0\x54\xad\xbe\
+\xc4\xaa\x86\x49\xa1\xdb\xd9\x41\x46\xd9\x33\x72\x85\x31\x8f\x6d\
+\x97\x08\x1d\xd4\x6c\x60\x21\x56\x61\xaa\x81\xe5\xb1\x12\x37\xff\
+\x00\xea\x61\x2e\x19\x4d\x75\x9e\x14\x26\xe9\xbb\x5d\x38\x02\x2e\
+\xa6\x3a\x35\x5b\xc5\x56\x0d\x75\x04\x9e\xfe\x5f\x5f\xe8\x88\xd2\
+\x45\x94\xe0\xba\xf7\x0a\x38\xbe\x30\x26\xfc\xd5\x33\x02\x7d\xac\
+\x9f\xb2\x3b\xae\x91\x99\xcd\x86\xc0\x05\x47\x2b\x9c\xff\x00\xba\
+\x9a\x57\xb5\xdf\x55\x45\x33\x49\x6e\xa2\xa1\x7b\x2d\x84\xc6\x66\
+\xea\x27\xd9\xba\x53\x26\xcd\x93\x7a\xe1\x3c\x59\x48\x75\x02\xde\
+\xf4\x18\xd1\xc9\x12\x2d\x85\x23\x0b\x81\x2a\x4b\x8c\x26\xe9\xe6\
+\xa7\x63\x1f\x13\x80\xdc\xda\xca\x16\x88\xcd\x91\x0c\x74\x44\x62\
+\xea\x46\xe9\x42\x5e\xb8\x53\xe6\x2b\xaa\x13\xf2\xa8\x9b\x84\x45\
+\x8d\xd4\x0e\xf5\xf7\x4c\x38\x47\xb2\xaa\x3e\x6f\xfb\xbf\x75\x53\
+\xfc\x73\xe6\x7f\xf6\x47\xb6\xa6\x73\x54\x64\x19\x9a\x3c\xd4\x22\
+\xc3\xd7\x8a\x73\xaf\x84\xfd\x91\xdd\x74\x9f\xf0\x95\x2b\xf4\x1d\
+\x5e\x7f\xaa\x77\xc5\x17\x0a\x37\x39\xb2\x86\xaa\x42\xed\x37\x2a\
+\x0e\xb6\xe8\xd9\xbb\x26\xbf\xac\xa1\x9e\xcc\xe4\x9f\x35\xfb\x96\
+\xab\x94\x4a\x69\xbb\x96\x86\x96\xaa\xa8\x1b\x62\xe1\x7b\xa6\xc1\
+\x7e\xf4\x23\x21\xfc\xec\xa6\x63\x46\x72\x99\x54\x18\xeb\x5c\x59\
+\x4f\x50\xc7\x03\x94\xe9\x2c\xfb\xa6\x49\xc5\x8e\xc7\x6b\x2a\x67\
+\x68\xa8\x6b\x46\xc6\xea\x37\xe1\x3d\xe5\x40\xef\x5f\x75\x09\xb9\
+\x01\x38\xd8\x59\x54\xdb\x43\x8f\xac\xee\xaa\xd8\x04\x85\xde\xb9\
+\xa0\xde\x26\xea\x76\x5b\x65\x4f\x15\xa5\x6b\xb2\xa2\x1e\xbe\xe8\
+\xb5\xb7\x53\xbb\x46\x02\x69\xd4\xec\xae\x91\x71\x20\xb3\xcd\x70\
+\x9a\x23\x39\x3e\x8a\x6c\xfc\x21\x61\x9f\x35\x4f\x23\x5f\x52\xc2\
+\x7b\xd0\x7b\x63\x86\xed\xb6\xca\x9a\x44\xf9\x30\x51\x9e\xce\xdd\
+\x45\x55\xca\xe9\xd5\x1b\xe7\xd6\x53\x27\xbb\xc7\xae\xf4\xe9\x14\
+\x52\x5e\x40\x10\x76\x15\x4b\xec\xd2\xa1\x7b\x48\xe4\xa5\x20\x0b\
+\xa9\xee\xeb\xa7\xc1\x21\x76\x14\xc2\x46\x1b\x1b\xac\x96\x12\xa9\
+\x1a\xed\x28\x30\xb2\x56\xbd\x53\xbe\xe1\x48\xa0\x76\x55\x3b\xba\
+\xc1\x3d\xca\xa5\xdf\x0d\xca\xab\x2e\x4c\x16\x61\x2a\x41\x72\xa1\
+\x8f\x20\xa6\x8b\x05\x23\xec\x54\xef\xb9\x4c\xde\xfe\xb6\x5d\x20\
+\xee\xb2\x91\xdf\x09\xdb\xa7\x39\xca\x39\x4b\x1e\x1d\xdc\xbd\xf4\
+\x98\x37\x50\xc8\xe6\xa2\xf2\xe6\xa9\x07\x7a\x8e\x6b\x3c\x00\x98\
+\x35\x8b\x92\x98\xd0\xd7\xdd\x49\x31\x1d\xca\x19\x3a\xe0\xa8\xdc\
+\x08\x55\x31\xb5\xed\x23\x29\xb1\x86\x0c\x12\xa4\x95\xc4\xe9\xe4\
+\x89\xf2\x4c\x77\x5a\xd6\x0a\xa6\x99\x8f\xc9\xb8\xf2\x4e\x8d\xad\
+\x69\x01\x53\x48\x18\x14\xd3\x5c\x12\x2d\x7b\xaa\x17\x07\x0c\xa7\
+\xe7\x1d\xe8\x4a\xe8\xdd\x60\x07\xd5\x51\x3f\x59\x6e\xae\x7d\xca\
+\x60\x47\x65\x4f\xa8\xb1\xc0\xa9\x3a\xd2\x90\x53\x8e\x8e\xa0\xd8\
+\xff\x00\x74\xfd\xd4\x27\x21\x5f\xaa\xa6\x79\x08\xe5\x17\x16\x34\
+\xd9\x54\x4c\xe9\x64\xb3\xad\x65\x37\x54\x69\x1c\xd4\xec\xd1\x1e\
+\xa1\x94\xc2\x64\x07\x5e\x3c\x93\x24\xea\xe8\xbe\x10\x65\x94\x59\
+\x70\x6a\xa8\x80\x9b\xd9\x36\x07\xb6\x50\xe2\xa1\xec\xfa\xef\x28\
+\x9b\x5c\xa9\x64\xc9\x50\xc9\x90\xa3\x9b\x0a\x49\x6e\x9a\x6e\x13\
+\xc7\x5a\xe8\xec\x83\xb4\x3b\x57\x72\x7b\xc3\xf6\x4f\x80\x9b\x95\
+\xc3\x73\x41\x52\xbc\x87\x2a\x19\xf6\x09\x9d\x6b\x27\xc7\x9b\xaa\
+\x5a\x8e\x1c\x8d\xce\x32\x99\x20\x91\xaa\xae\xda\x5c\x9d\xfc\x62\
+\xa4\xed\x7a\xf1\x4f\xdd\x41\xba\x3d\x95\x36\xe7\xeb\xfa\xab\x78\
+\x29\x47\xc3\x76\x14\x9f\xc6\x53\xe4\x85\x2c\x1a\xa9\xf6\xe4\x8c\
+\x7a\x43\x80\xef\xc2\x64\x67\x4d\xd3\xf8\x8d\xe5\xf7\x50\x07\x6a\
+\x07\x9a\x0c\x2e\x19\x0a\x58\xb7\x1b\x26\xb7\x4e\xcb\x86\x1d\xba\
+\xa9\x66\x97\x59\xaa\x26\x9d\xd4\x5b\x27\x6b\xd5\x85\x0b\x5b\xa6\
+\xee\x2a\x67\x37\x55\x9b\x94\x6d\x6c\xa9\x43\x88\x3a\x54\x11\xbc\
+\xee\x9b\x05\xdb\x95\x2c\x02\xc4\x65\x4b\x46\xd7\x7f\x32\x60\xe0\
+\x3d\x52\xce\xd2\xd1\xb5\xd1\xeb\x04\x6e\x1e\xa9\x25\x3a\x6c\xaa\
+\x18\x0b\x5c\x6e\x9e\xd1\xc7\x36\x52\x76\xc7\xae\xf4\xfd\xd4\x1b\
+\xa3\xd9\x52\xf6\xbe\xff\x00\xaf\xb2\xb5\xe6\x3a\x77\xb8\x6e\x2c\
+\x83\x35\x9d\x67\x74\x23\x12\x4a\xd6\xba\xf6\xf0\x52\xb8\x32\x3d\
+\x1c\x94\xad\x02\xf6\x4c\x75\x9a\xa6\x85\xb6\xbd\x94\x6f\x02\x66\
+\xb7\xcd\x46\xe6\xd9\x3e\xce\x75\x97\x0b\xd7\xa0\x8b\x2c\x2e\x9f\
+\x0e\xb3\x74\xe8\x74\x34\xa8\x72\x6d\xeb\x9a\x6d\x2d\xd9\xaa\xca\
+\xa0\x98\xf0\x14\x71\xbd\xd2\x07\x1d\x95\x44\x9a\x64\xd2\xa9\xa1\
+\xe2\x33\x52\x8a\x06\x8e\x48\x46\x34\xd8\x29\xa1\x5c\x10\x5d\xb7\
+\x7a\xab\xa5\xdc\x85\x14\x8f\x85\xe2\xfb\x05\x0d\x50\x70\x45\xc1\
+\xc7\x0a\x19\x34\x9b\x29\x4f\xc0\x71\xf0\x44\xde\x73\xe6\xa6\x6e\
+\x41\x4f\xdd\x41\xba\x3d\x95\x2f\x6b\xef\xfa\xfb\x2b\x46\xaa\x77\
+\x8f\x24\x71\x8d\x93\x05\x8e\xae\xe5\x53\x3e\x53\x1b\xc5\xf3\x46\
+\x98\x80\xa4\x91\xc5\xaa\x36\x5e\xa9\x97\x26\xd9\x40\x01\xcf\xf2\
+\x9a\x06\xb0\xe2\x8b\x8f\x24\xe2\xe2\x2c\x9f\x53\x1c\x58\x24\x5d\
+\x09\x44\xfd\x51\xb1\x5a\x9d\x0b\xf1\xf9\x42\xba\xd4\xe7\xb3\x75\
+\x2c\xfc\x57\x75\xac\xa2\x2d\xd3\x6f\xca\xa8\xa6\x8d\xf2\x5e\xee\
+\xba\xa3\x66\x96\x06\xf2\x53\x3b\x82\xdb\x8f\xca\x82\x52\xf8\xcb\
+\xfe\x61\xb0\xe4\x9e\x5e\xe1\xb2\xb9\x12\x0b\xda\xca\x62\x0a\x9e\
+\x9f\x58\x3b\xa1\x2c\x90\xbf\x48\xdb\xc5\x52\xe9\x7b\x75\x13\xd6\
+\xee\xe4\xb5\x91\x20\x1e\x2b\x43\x5f\x46\xf3\xce\xc1\x18\xc0\x9b\
+\x9a\x9b\x70\x13\xc6\x54\x20\x02\x8d\xb4\xa9\x8d\x8f\xdf\xf5\x43\
+\x65\x3b\xae\xd2\xd3\xb1\x53\x30\x03\x8b\xa9\x1e\xf8\xe2\x71\xb0\
+\xc2\x73\x5d\x31\xb9\x54\x71\x68\x91\xba\xfb\x3c\xd3\xc4\x16\xe6\
+\x8b\x2e\xd4\x59\xa2\x4d\x5d\xc9\xaf\xba\x77\x67\x0a\x18\xae\x2e\
+\x55\x5c\xad\x82\x37\x3b\xbb\xf7\x55\x3c\x5a\x87\xdd\x97\xb2\xa1\
+\x0e\x88\xb7\x5f\x72\x9d\xc0\x94\xe9\x5d\xa4\xb5\x34\x92\xe5\x03\
+\x09\x6e\x14\xad\x2d\x7d\xca\x82\x66\xb5\x8a\xae\x60\xe6\x61\x74\
+\x7d\xf4\x67\x65\xd5\xb2\xaa\xb0\x06\xdb\xa7\x3c\xf3\x52\x4e\xd6\
+\xb4\x92\x54\xd5\x0d\x2e\xc7\x7a\xa3\xab\xeb\x35\xa9\x8e\xd4\xf5\
+\x4a\x75\xc7\xc3\xef\x0a\xa8\x68\xa8\x23\xc5\x4d\xb5\xd3\xdc\x98\
+\xfb\x77\xa6\xbe\xe1\x54\x6d\x74\xd7\x63\x75\x52\xfb\x02\x9f\x38\
+\x07\x2a\x59\xd8\xf8\x1c\xd1\xb9\xb7\xea\xa8\xe0\x07\x25\x39\xb1\
+\x8e\xae\x02\x6d\x23\x1e\xcb\x82\xa2\x21\xc4\xb5\x74\x83\xdd\x1b\
+\x88\x68\x16\x54\xce\xd5\xba\x71\xb3\x7a\xb9\x38\x51\xcd\x13\x63\
+\xeb\x9b\x1b\x2e\x99\xab\x73\xc3\xd9\x1d\xac\x4e\xff\x00\x55\xd1\
+\xd2\x38\x37\xac\xd6\x9f\x35\x51\x33\x18\x0b\x8e\x2c\xaa\x3a\x48\
+\x46\x3a\x96\x37\xef\x54\x8e\xf7\xb8\xf5\x5b\xad\xdc\x36\x42\x3d\
+\x07\x2a\x19\xf4\x37\x16\xba\xab\x2e\x73\x75\x00\x2e\xa0\x6b\xdf\
+\x19\xbe\x17\xbc\x3d\xd2\xf0\x9c\x05\xaf\x6f\x15\x4b\xa5\x8c\x0d\
+\x1c\xd3\x9e\x00\xdd\x4f\x6b\x12\x37\x52\x11\xcf\x0a\xa1\xac\x7b\
+\x1c\xdd\x47\xe8\xa6\x6b\xa3\x77\x56\xe5\x52\x3b\x4b\x9a\xe2\x72\
+\xa9\xdf\x7b\x10\xa8\x2a\x5c\xd9\xd8\xd2\x05\xac\xef\xd1\x74\x9b\
+\xad\x31\x73\x7b\xd7\x14\xc9\x1e\x6c\x9e\xd0\x83\xb9\x77\xa1\x29\
+\x6f\x72\x95\xda\x9a\x53\x7b\x3e\xbb\xd5\x40\x04\x1b\xec\xaa\x58\
+\xdb\xe0\x94\xd0\x1a\x2f\x7d\x94\x35\x65\x8d\xc5\x90\xa8\x33\x4a\
+\x1a\xe3\x6b\xf7\x28\xea\x0c\x4d\xb3\x4d\xfc\xd3\x2a\xc4\x72\x1c\
+\xaa\xfa\xd6\x38\xee\xa9\x26\x0e\xd9\x6b\xe1\xf5\xdd\xd9\x1b\xaa\
+\xca\xa7\xbe\xfa\x09\xb7\x82\x7b\xc9\x1d\x75\x4c\x46\x9c\x2a\xe7\
+\x17\x31\xc3\x92\x30\x35\xcd\x04\x95\xd1\xe6\x2a\x78\x0b\xee\x31\
+\xfb\xa9\x6b\x18\xf3\xd5\x28\x4a\x40\xd5\xc9\x46\x5b\x34\x21\x41\
+\x13\x5b\x0b\x8d\xb9\x29\xdc\x3d\xf2\xc3\xf9\x94\x2d\x77\x0c\x3b\
+\xc1\x75\x8f\xa2\x9c\xc3\xa4\x93\xb2\xac\xb8\x24\x04\xd8\xdc\x7a\
+\xc6\xf6\x53\xd2\xdc\x17\x59\x4b\x37\x05\xd6\x5d\x17\x27\x15\xa1\
+\x36\x43\x13\xc3\xbb\xaf\xfa\x2a\xa9\xb8\x8e\x4c\x38\xb2\x77\x34\
+\x79\x2b\xa7\x1c\x26\xf6\x7d\x77\xaa\xd3\x68\xdc\x7d\x6e\x9b\x13\
+\xa4\x55\x14\xee\x6c\x64\xd9\x46\x1d\xa5\x46\x1c\x27\x69\x4d\x0e\
+\x21\x56\xd2\xb9\x91\x19\x85\xf5\xef\x6e\x48\x19\xa6\x93\xe2\xe0\
+\x03\xcb\x0b\xa2\xd9\x1e\xc5\xc7\x1e\x2b\xa6\x6a\xa4\x8e\x17\x45\
+\x08\x06\xf6\xc9\xdf\x75\x41\x1f\x1a\x2d\x52\xef\x65\xd2\x1a\x63\
+\x79\x00\xec\xa9\xea\x9c\xcc\x0b\x5b\xc5\x55\xca\xd7\xd3\xb8\xbb\
+\x1b\x6c\x89\x6f\x08\x59\xce\x51\xc8\x5d\x03\x98\x1c\xec\xf8\xaa\
+\x66\x82\xee\xb3\x8f\xdd\x55\xd7\x18\xfe\x03\x2c\x6f\x6c\xf3\xc2\
+\xe8\x89\xf5\xc6\x04\x86\xca\x7a\xb8\xe1\x85\xc1\x8e\xbe\x39\x94\
+\x6a\x03\xeb\x2f\x7e\x6a\x9e\xa4\x70\xc3\x31\x65\x0c\x71\x3d\xb7\
+\x53\xde\xc5\xa0\x0b\x2a\xa8\x33\xa9\x71\x08\xea\x10\x2c\x7e\xf8\
+\x52\xcc\x74\xd8\x01\x65\x51\x48\xc9\x4e\xa7\x17\x0f\x25\xd1\xff\
+\x00\xee\xe3\x4b\x73\xe6\x9c\x78\x8c\xb9\xfc\x7d\x54\x98\x29\x8e\
+\x28\x34\x38\x65\x48\x00\x40\x5d\x39\xbd\x5b\xa6\x34\x11\x95\x5b\
+\x15\xe3\x75\xbc\x14\x0d\xd0\xdc\xa9\x8b\x24\xbb\x1d\x6d\x3e\x1b\
+\xa9\x74\xc6\x6d\x1e\x47\x8a\xd6\xe0\x35\x81\xd6\x0a\x9e\x67\xb8\
+\x64\x35\x4b\x2c\x73\xbb\x85\xf4\x55\x5d\x1e\x23\x69\xb0\xdd\x43\
+\x2b\xa2\x9f\x4f\x8a\x9a\x2e\x28\x0e\x76\x42\x33\xb6\x08\xc8\x18\
+\xc2\xae\x9c\xc9\x21\xf1\x2a\x06\x92\x2f\x95\x21\xb9\xd0\xed\x90\
+\x86\x23\x10\xc8\x51\x53\x46\x21\x73\x81\xca\xb9\x6c\x84\x05\x2e\
+\xb3\x52\xc2\x6f\x6c\xaa\x6a\xa3\x13\x70\x54\xb5\x92\x3c\x91\x73\
+\xcd\x52\xb6\x47\xd4\xdf\xc5\x46\x1e\xd0\xdd\xd5\x25\x43\x9b\x60\
+\x50\x7b\x5e\x15\x61\x00\x15\x55\x30\x68\x25\x47\xf1\x5b\x75\x3b\
+\x34\x82\xa9\xb7\xfb\xa1\xfc\x3f\xbf\xee\xa5\xdd\x47\xeb\xf2\xb8\
+\x96\x44\xea\x17\x4d\x40\x6a\x16\x47\xab\x84\xe8\xc3\x9a\x7b\x95\
+\x63\xc4\x67\x48\x4e\x0f\x73\x0b\x82\x65\x2b\x9e\xdb\x90\xa7\x69\
+\x69\xd0\xdd\xd3\x5f\x3c\x78\xb1\xfc\xaa\x56\xb9\xd2\x71\x9a\x49\
+\x3b\xe7\x65\x57\x50\xc1\x0b\x9d\x2d\x81\x01\x17\x35\xf5\x1a\x99\
+\x9c\xa9\x3a\x41\xc0\x08\x2c\xdc\xfd\xd5\x48\x71\x8f\x57\x34\xca\
+\x57\xca\x6e\x41\xba\x64\x6d\x8d\xb6\x76\xea\xa5\x92\x12\x48\x16\
+\x6f\x7a\x6d\x43\xc7\x52\xe9\x95\x2e\x8e\x23\x9b\xf9\xae\x2d\xdd\
+\xab\x9a\x16\x96\x41\x7c\x79\x20\xc0\x39\x94\xd6\x0d\x4a\x96\x26\
+\xb2\x50\xe1\x9f\x35\x8e\x01\x7d\xb2\x00\x5e\xf9\xa5\xd6\x6e\xfd\
+\xc5\x43\x35\x69\x6e\xb0\xd6\x68\xe7\x82\xaa\xa5\xa9\x70\xec\x8f\
+\xca\x92\x19\x65\x76\x97\x6d\x9f\x34\xd3\x34\x07\x48\x68\x23\xc5\
+\x49\x1b\xa5\x85\xce\xb7\x5b\xb9\x42\x5b\x19\xb3\xf0\x99\xd6\x66\
+\x36\xf5\xfd\x53\xe2\x69\xce\x56\x90\xcd\x91\x17\x37\x40\xd8\x59\
+\x0e\x69\x86\xd9\x52\x3d\xd7\xc5\x93\x1d\x76\x90\x55\x6d\x3b\x5c\
+\xe2\x6e\x50\x2e\x0d\xd0\xd1\x7d\xb7\x50\xd2\x37\xdd\x75\xbb\x07\
+\x4a\x22\x31\x5a\x0b\xb6\x04\xde\xe9\x90\xd2\x49\x93\x8f\xb2\xa5\
+\x6b\x69\xa2\xeb\xef\x6e\x6a\xbe\x73\x53\x21\x85\xa7\x0e\xfd\x97\
+\x47\x52\x44\x1d\x69\x08\xba\xaf\xa3\x63\x66\x12\x33\x92\x95\x80\
+\x42\x2e\xa9\xdf\x14\x6d\x2e\x75\xb1\xfd\xd5\x5d\x46\xa9\x3a\xa7\
+\x09\xf2\x46\xea\x37\xb7\xe7\xc7\xea\x9c\x6c\x53\x1d\xad\xba\x57\
+\x04\xfa\xfa\xff\x00\x45\x0c\x44\x48\x0a\xb7\x87\xe1\x1c\x65\x51\
+\x8b\xe5\x52\x35\x8f\x70\x8e\x4c\x34\x83\x7b\xfd\x57\x4a\x53\xb6\
+\x29\xb5\x43\x91\x7e\x4a\x9f\xa4\xdc\xca\x63\x11\x19\xc7\x25\x2d\
+\x71\x3c\x94\x15\x57\x9d\xba\x86\x0d\xd3\xcc\x4e\x38\x01\x6b\x64\
+\x6d\xcd\xac\xaa\x35\x3e\x5b\xb1\x51\x9b\x41\xa4\xee\x8e\xc9\xfc\
+\xfd\x72\xf6\xb5\x72\x42\x3d\x48\x0b\x10\x15\x43\x2e\xa2\x88\x07\
+\x02\x76\xba\xa9\xa9\x6c\x74\xa4\x0e\xe5\x51\x23\x9e\xe7\x39\xbb\
+\xdd\x53\x09\x74\x5e\xe5\x74\xcb\xe4\x6c\x5a\xa3\xb5\xd5\x0b\x5e\
+\xe7\xf1\xa5\xc1\x6d\xfc\xb2\xa4\x73\xdb\x2e\xa6\x13\xba\x33\x35\
+\xd1\x5d\xc7\xae\xaa\xa5\x1c\x14\xe9\x6f\x13\xc5\xd3\xde\x46\xd9\
+\xf3\x5c\x79\xcb\xad\x60\x8e\xb2\x72\x15\x33\x45\xc1\xbe\x54\x6d\
+\xd4\x6c\x42\x14\x31\x70\xf8\x80\xbb\x50\x4e\x88\x83\x84\x29\xc3\
+\xdb\x9b\xa8\x80\x87\xb3\xf9\x5e\xf1\x21\xc6\x07\x88\x4e\x2e\x77\
+\x6b\x3e\x68\x30\x6d\x60\x9d\x18\xee\x4e\x88\x72\x4d\x05\xbc\xd4\
+\x9a\xa4\x61\x61\x36\xbf\x76\xea\x18\x1a\xde\xf3\xe6\x9a\x34\x8b\
+\x85\x75\x20\xea\x9b\x6e\xba\xfd\xde\xb2\xae\x47\x68\x61\x09\x22\
+\xe5\x7b\xa0\x25\x39\xb7\xc3\xe6\x53\x5e\x5b\x80\xbe\x6b\xa9\x1a\
+\x0a\x73\x05\xac\xab\xea\x65\xb9\x8a\xc3\x4f\xe5\x53\xd0\xc4\xf8\
+\xf5\x12\xed\x5d\xca\x3a\x37\x36\x3f\x86\xdb\xe3\x9a\xff\x00\x16\
+\x92\xad\xfc\x33\x74\x0b\xc7\xc3\x02\xda\x91\x90\x37\xaa\x77\x51\
+\xd2\xc9\x29\x0f\x17\xd2\xab\xe9\xde\xd8\xb9\xa8\x28\x9e\xf8\xdd\
+\x84\xee\x8e\x70\xdc\x28\x28\x01\x94\x0d\x2a\x6e\x8d\xce\x02\x8a\
+\x81\xcc\x21\xc4\x61\x45\x4f\xce\xcb\x56\x91\x64\x1a\xd7\x65\x3a\
+\xc3\x03\xd8\xdc\x95\xa7\xcd\x35\xb9\x45\xab\x4e\x57\x0b\xd7\xa0\
+\x84\x59\xf5\xfd\x10\x65\x95\xf1\x6f\x67\x9a\x8a\x01\x26\xcb\xfc\
+\x3a\x36\x37\x89\x36\x23\x1b\x93\xb7\x82\x96\x8e\x9c\xbb\x54\x4e\
+\x1f\x43\x7f\x14\x5c\x19\x11\x8f\x9e\x3d\x83\x74\xee\x6b\x72\x3e\
+\xaa\xb2\x0b\xb8\xba\xca\x8a\x46\xb6\x66\x31\xfd\x95\xef\x0c\x63\
+\x3a\x96\x38\x54\x54\x2c\x89\xdc\x53\x7d\x5e\x3b\x2a\x8a\xc1\x1b\
+\xf5\xe9\x6f\x57\x0a\xef\xa9\x94\x38\x0e\x7c\x95\x03\xc3\x61\xe1\
+\xb9\xa2\xf6\xdf\x9a\xaf\x97\x51\xd3\xa5\xb6\x54\x8c\x60\x66\xca\
+\xad\xfa\x6e\x00\x0a\x09\x8f\x18\x1b\x0b\xad\x65\xc6\xe4\x04\x4e\
+\xa6\x96\x90\x33\xf7\x43\xaa\x9c\xc0\xed\xd3\x5b\xa5\x18\xc5\xef\
+\x95\xa7\xcd\x34\x58\xdd\x37\x2a\xc3\x74\xe4\xdb\x97\x05\x64\x06\
+\x51\x09\xd8\x4d\x3a\x96\x86\x5b\x25\x51\x86\x02\x2d\x9f\x35\xd3\
+\x71\xcf\x57\xd1\x32\xd3\xc3\xd5\x73\xdc\xce\xb0\x1d\x60\x01\xbd\
+\xc6\xdf\x93\x6f\x25\xd1\x5d\x0d\x24\x30\x6a\xa9\x7c\x87\xcf\xc3\
+\x9f\xee\x15\x5b\x43\x6a\x34\x37\x6c\xa2\x00\x57\xca\x39\x4e\xea\
+\x8b\xf7\x2a\xa9\xde\x06\x00\x4e\x98\x89\x2e\xec\x6f\xd9\xdd\x74\
+\x4d\x5b\x26\x7e\x89\x0f\x55\x1a\xc6\x11\x66\x95\x24\x6e\x9d\xd6\
+\xe4\x57\x45\x52\xd3\x46\xcf\x89\x6b\xf8\xd9\x54\x98\xa3\xbb\xa3\
+\x3b\x77\x29\x5f\xad\xca\x19\x74\x31\x54\x49\xc4\x38\x50\xc0\x43\
+\x83\xf9\x26\xb5\x5b\x1f\xe4\x0b\x4f\x9a\x0d\xcf\x34\x45\x96\xa4\
+\x05\xd3\x63\xca\xd3\xe4\xb4\xdb\xb9\x39\x3f\x9a\x18\x52\x49\xd5\
+\x36\xf5\xf9\x54\xb3\x16\xda\xe5\x45\xd2\x0d\x89\xba\x8e\x6d\xcb\
+\xbe\xea\xa3\xa5\x5f\x30\xd2\xd1\x66\x9e\xe1\xfd\xd4\xc1\xa4\x17\
+\x9e\xda\x2e\x40\xf5\xbd\x92\x76\x0a\x9e\x3b\xb4\xaa\x48\x23\x9f\
+\xa4\x23\x82\x43\x66\x3a\xf7\xfb\x2a\xda\x48\x3a\x3d\xbc\x48\x9c\
+\x2f\xe0\xa1\xed\x00\x09\x3e\x6a\x16\xc6\xd8\xf5\x3c\xd9\x3a\xa6\
+\x26\xdf\x4c\x8e\xfb\xa3\x5c\xeb\xd8\x1b\xf9\xaf\x7c\x7e\xad\x82\
+\x85\xe2\x61\xa0\xe3\x57\x72\x14\xac\x06\xf7\x72\x16\xb6\x9b\x61\
+\x59\x13\x8f\xf2\x0c\x15\xab\xc9\x6a\xf2\x44\xdd\x06\xe5\x0c\x2d\
+\x67\xc1\x07\x14\xf2\x43\x49\x0b\x5b\xbb\x93\x8e\x15\xfd\x8d\x75\
+\x93\x64\x3f\x4f\x14\xea\xa2\xc1\x66\xb5\xbf\x65\x25\x4b\xdc\x6e\
+\x70\x3f\x0b\x8b\x74\xd2\x2f\x7e\x6a\xe9\xf7\x73\x48\xf0\x50\x99\
+\x27\x6c\xa1\xe3\xb1\x7b\x5b\xea\xa8\xa8\xc5\x45\x5b\x89\x73\x98\
+\xe6\x93\x62\xd3\x6e\xf5\xd2\xb4\xd2\xdb\x87\xad\xc5\xbe\x3b\xaa\
+\x1e\x89\x7c\x82\xf6\x53\x74\x73\xc3\x0b\x36\x4f\xa0\x2d\x39\x2a\
+\x93\xa2\x9a\xf7\xb6\xeb\xfc\x12\x3d\xd7\xb9\x36\x03\x71\xb8\xf6\
+\x0d\xfd\x87\x6f\xf2\x15\x74\xd3\x9f\x60\xdf\xda\xd4\x45\xc5\x93\
+\x99\x64\xee\x7e\xc7\x6c\x9a\xe4\x5f\x61\x74\x5f\x75\x27\x64\xa6\
+\xb5\xca\x30\x6e\x3d\x8d\xfd\x8a\xa0\x6b\x78\x75\x07\xc0\xfe\xea\
+\x0a\x8e\x04\xd3\x11\xb8\x77\xf5\x55\x35\x2f\x9b\x92\xe8\xfa\xd1\
+\x1b\x40\x01\x9f\x55\x24\xed\x9b\x70\x07\x92\xa8\x8e\x32\xeb\xdd\
+\xca\x94\xb5\x8e\x1a\x49\xb8\x46\xaa\x4b\x72\x52\x3c\xb8\x92\x55\
+\xd0\x76\x56\xaf\x24\x5d\xe4\xae\x8b\x8d\x90\x79\x28\xec\xad\xe2\
+\x53\x47\x58\x7b\x2f\x64\x0d\xfd\x8d\x4d\xdd\x48\x9e\x11\x24\x2b\
+\x97\x61\x59\x1c\x8b\x2d\x21\x3b\x01\x44\xc0\xed\xd3\x5a\xdd\x40\
+\x27\xb4\x35\x17\xdb\x7d\x94\x73\x32\x9e\x37\xe8\x37\xd6\x33\x7f\
+\xaa\x92\x68\xe2\x9d\xce\xc9\x0e\x39\x51\xd4\xd2\x96\xdc\xb5\xf7\
+\x54\x9a\xef\x6c\xf2\x54\xb4\xee\x7d\xb5\x6c\x9f\xd1\xb1\xbb\x37\
+\x4e\xa5\x64\x4e\xd4\x37\x08\xec\x9d\xcf\xdb\x75\x7f\x65\xaf\x85\
+\x6b\x2d\x59\xb7\xb1\xbd\xa1\xeb\x97\xb0\xec\x9b\xc9\x35\x06\xa8\
+\xdb\x90\x9f\x1a\x96\x3c\x14\xe6\xad\x36\xff\x00\x23\x5b\xa9\xc0\
+\x2e\x1e\x86\xad\x76\x94\x04\x4d\xd3\xa3\x0e\x19\x5e\xeb\x19\x61\
+\xca\x75\x2c\x11\x54\x89\x25\xeb\x30\x5e\xe3\x7d\xd4\x43\xa3\x9c\
+\xcc\x46\x3e\xc1\x43\x53\x0b\x4d\xdb\x95\x0f\x49\x92\x38\x60\x37\
+\x3c\xf9\xe1\x54\xf4\x9f\x48\xb0\xda\x18\xd8\xe6\xf7\x90\x54\x35\
+\x95\x72\xb8\x71\xda\xd6\xf9\x5d\x6b\x29\xde\xdb\x2b\x7b\x2f\x6c\
+\xa2\xe2\x50\x19\xf6\x37\xb4\x3d\x8e\xd9\x34\xec\x9a\x6d\x94\xd2\
+\x9b\x8c\xa7\x38\x94\xf1\xa8\x10\x9d\x12\x74\x64\x02\xb4\x91\xec\
+\xb2\x8b\x0f\x05\x49\x21\xd9\x7c\xfa\x96\xa2\xa5\x79\x0c\x28\xd7\
+\x39\x98\x3b\x29\xa4\x85\xcc\x2f\xd4\x4b\xbf\x97\x92\xa5\xab\x8d\
+\xb6\x05\xac\x54\xfd\x16\x41\xc9\x42\x88\x44\xdd\x63\x70\xa9\xf8\
+\x1a\x3a\xf6\xbf\x8a\x9c\x47\xab\xa9\x6f\xa7\xb0\xed\xfe\x7b\x78\
+\x7e\x13\x46\x76\x5a\x7c\xd6\x9b\x77\xfb\x1d\xb2\x6f\x24\x36\x4d\
+\xe4\x86\xc8\xee\x89\xb0\xba\x0f\x69\x4f\xd3\xa4\x94\xe6\x87\x6c\
+\x8c\x04\x75\x96\x9f\x34\x05\xb2\x89\xd4\x8b\x79\xfb\x3a\xbf\x36\
+\xca\x78\x22\x79\xc1\x0b\xfc\x3c\x96\xf5\x54\x94\x33\x33\x60\x57\
+\xb9\xb1\xbb\x17\x27\xc2\xd0\xdd\xcd\xbc\x54\x90\x0e\x4e\x77\xdd\
+\x69\xd3\xcc\x9f\x3f\x61\xdb\xdb\x9f\x05\x9f\x05\x9f\x04\xc0\x4b\
+\x96\x80\xb4\xdb\x2a\xea\xfe\xc7\xf6\x53\x49\x4c\xc9\xb1\x4d\x0a\
+\xfe\xc9\x1a\x0b\x0a\xd3\xa7\x99\x4e\x25\xdd\x5e\x49\xa3\x4a\x2f\
+\xd4\x34\xd8\x65\x3b\x08\x81\xa4\x95\xd5\x5d\x43\x82\x51\x86\x3b\
+\x75\x49\x55\x0d\x6e\x97\x35\xe4\x86\x77\x8d\xd3\xde\x23\x7f\x55\
+\xce\x70\xf1\x54\x55\xb4\xf7\x6b\x5c\x73\xf4\x52\x55\x52\x9d\xed\
+\xf8\x4e\xa8\x0a\x59\xc1\x61\x45\xf7\x44\x73\xf6\x1d\xbd\x81\x69\
+\xf3\x5a\x7c\xd6\x9f\x34\xc6\xf5\xbd\x87\x6f\xf2\x1d\x93\x42\x60\
+\xc8\x4d\xf6\xbf\xb2\x53\x97\xcd\xeb\xbb\xda\xf7\x65\x13\x76\x11\
+\x95\x67\x7a\xba\xd2\xe5\x14\x4f\xb6\x54\xb4\xad\x90\x16\x3b\x62\
+\x9d\xd1\xf4\x6d\x16\x73\x9b\x7f\x30\xa6\xe8\xe8\xe3\xbc\xd1\xbb\
+\x0d\xee\x3d\xe9\xf1\x17\x1c\x39\x4b\x18\x6e\xc4\xa7\xe3\x9a\x19\
+\x56\xb8\x44\x00\x9c\x6c\x10\x37\x5b\x0b\x84\x1e\x4a\xb9\xb2\x67\
+\x5b\x74\xe8\xc3\x5b\xa8\x6e\x86\x56\x90\x51\x68\xf1\x59\xbf\xf9\
+\x35\x90\x99\x29\xe7\x64\x5f\xd5\xba\xe2\x9f\x04\xf9\x4d\xb9\x2b\
+\xdd\x69\x1b\xf3\x56\xc2\x9a\x62\xcb\xe9\xb2\x8e\xf2\x65\xcb\xb2\
+\xb5\x1e\xe0\x9b\x2b\x9a\x41\xb0\xfb\x2f\x7c\x73\x5b\xb3\x55\x6f\
+\x49\xce\x1a\xed\x21\x83\xee\xa8\xe9\x45\x77\x5e\x59\x64\x69\xff\
+\x00\x49\xb2\x77\x47\x33\x41\x88\x3e\x42\x0d\xb9\xe5\x37\xa1\x22\
+\x19\xd5\x27\xdd\x3d\xf7\x52\x26\xf2\x5f\x2a\x2e\x44\xa6\xa1\xb2\
+\x68\x41\x97\x41\x96\x4e\xd8\xa6\xb5\x11\x85\x6b\xa2\xcc\x5d\x59\
+\x38\x63\xd8\xed\x90\x7d\x97\x1b\x16\x5c\x5f\x5e\x8a\xe2\x5f\xd7\
+\xf7\x41\xc8\x1b\xe1\x3c\xd9\xa5\x3d\xda\xe5\xd3\xde\xa2\x65\x82\
+\x93\xd7\xe1\x37\x28\xc7\x61\x75\x34\x9a\x70\xaa\x06\xa6\x1f\xa2\
+\xe8\xa3\xa4\x04\xc2\x01\x0e\x29\xae\x6b\x86\x13\x9c\xf1\x26\x8b\
+\x61\x48\x73\x6e\xff\x00\xe8\x86\x13\x9e\x74\xa7\x38\xad\x46\xe9\
+\xa5\x02\x9b\xc9\x34\x91\xf4\x57\x25\x69\x5a\x40\x44\x5c\x59\x06\
+\x80\x8e\xd6\x44\x59\x13\x74\x70\x89\xbe\x16\x9f\x34\xd8\x81\x76\
+\xe5\x18\x5a\x39\x95\xa1\xbd\xeb\x4d\xbb\xd0\xbf\x2d\xd5\x4d\x40\
+\x63\x6d\x8d\x4a\x18\xcb\xfe\x37\x77\xdb\x2b\x88\xe1\x8b\x23\x9d\
+\xf6\x50\xb6\x1e\x64\xad\x14\xef\x6e\x96\xb8\xea\x2a\x4e\x89\x64\
+\x99\xbb\xae\xaa\x3a\x30\xb1\xae\xb5\xcb\x57\x47\xd1\x06\x80\x4e\
+\xa4\xe6\xb0\x75\x5d\xab\x47\x3b\x6e\xbd\xe2\x18\xb0\xcd\x67\xcd\
+\x3a\x9f\xe2\x93\x6f\x59\x55\x23\x4c\xa0\x7b\x0a\x73\x7d\x7f\x44\
+\x42\x6a\x1b\xa6\xf2\x4d\x41\xa8\xb6\xc3\xfc\x87\x64\xef\x63\xb9\
+\xaf\x9b\xd7\x77\xb0\x6e\x8b\x90\x3d\x6f\x63\x5c\x1a\x75\x1d\x80\
+\x3f\xa2\x91\xcf\xa9\xad\x2c\x69\xc5\xd3\x40\x89\xad\x84\xf6\x88\
+\x5a\x7c\xd4\x31\x07\xbc\x34\xec\x57\xb8\xb0\x6c\x51\xa7\x74\x5d\
+\x76\xdf\x1c\x93\x6a\x64\x1b\x85\xaf\x88\xdb\x38\x60\xee\x98\x58\
+\xd1\x85\x3b\xc4\x6d\x32\x16\xea\x03\x92\x3d\x21\x10\x76\x61\x3f\
+\xfe\x57\xf3\x3c\xee\x76\x1d\xd8\xfe\xb9\xfa\xf7\x6d\x56\x75\x4d\
+\xec\x02\xe6\xc9\xcc\x1e\x29\xd1\xe1\x69\xb2\x17\xbf\x24\xc1\x74\
+\x06\x91\x74\xc7\x5f\xb9\x1c\xb4\xa0\x11\x16\x08\x78\xa7\x35\xba\
+\x4a\x28\xf8\x22\x1c\x79\x7a\xf4\x16\x83\x7b\x95\x64\xd6\xdc\xac\
+\xea\x2d\x3f\x74\xe9\xb4\x4e\xd6\x77\xad\x52\x9c\x86\xe1\x57\x55\
+\x16\x53\xbc\x36\xdc\x5c\x00\x3e\xab\xa3\x29\x74\x7f\xbc\x9e\xd9\
+\xcd\x8e\xca\x52\x65\x94\x4c\x70\x59\xb0\x1b\x67\x09\x81\xcf\xe4\
+\xb4\xcc\xc7\x02\x02\x67\x18\xe5\x09\x26\xd5\x62\xd0\x47\x8a\xd1\
+\xab\x76\x8f\xa2\x2c\xea\x91\xb0\xef\x5a\x08\xda\xe9\xf2\xcb\x1b\
+\x6f\xc3\x63\xed\xc9\xc2\xe1\x09\x38\x99\x75\x3c\x23\xc9\x8a\x59\
+\x34\xb6\xca\x53\x77\x5f\xd7\xac\xfb\x23\xed\x84\xe6\xa7\x37\x0b\
+\x4f\x9a\x0d\xcf\x34\xc6\xfa\x1f\x55\x20\xb4\x64\xa6\x3b\xd7\xdd\
+\x30\xdf\x09\xc3\x4a\xd5\x73\x65\x7b\x23\x27\x24\xe7\x7a\xfe\x89\
+\x87\xae\x2e\xae\xd5\x21\x1a\x4d\xbd\x81\xda\x3a\xca\x3f\x88\xe2\
+\xaa\x58\xe1\x58\xcf\xaa\x88\xb1\xb4\xe6\xf6\xbd\x95\x53\xdc\x7a\
+\x41\xa0\xf6\x2e\x6f\xdc\xa9\xdc\xd1\x4e\x00\xee\x4c\x8f\x50\x25\
+\x53\x44\x05\xae\xb4\xb1\x01\x18\x0a\xec\x32\x5b\x09\xcf\x6b\x4d\
+\x96\x1d\x11\x4d\x00\x6e\x9e\x63\xd0\x51\xd1\xa7\x0a\x70\xc2\x09\
+\xb9\xf5\x75\x23\xba\xd6\x08\x65\x46\x2c\x41\x5b\xa7\x47\x71\xe2\
+\x9c\xc7\x0d\x90\x2f\xd5\xb2\x88\x0b\x7a\xf1\x4f\x3a\xae\xce\x47\
+\x9a\x2d\x0d\xd9\x45\x3b\x83\xc0\xc2\xc3\xc6\x7f\x0a\xc0\x39\x39\
+\x10\x13\x82\x02\xce\x5a\xbc\x91\x37\x4e\x75\x8a\xa9\x75\xa9\xde\
+\xee\x60\x2e\x8b\x9c\xbe\x07\xcc\xee\xd0\x36\xf0\xde\xca\xbd\xfa\
+\x6a\x69\x9c\xc0\x0b\xa4\xd5\x75\x5b\x33\x60\xa6\xd5\xab\xae\x46\
+\xdc\x97\x08\xcf\x4b\x2d\x5f\xfc\x46\x16\xe9\xb6\xd9\x2a\x96\xbd\
+\xe0\x08\xe4\xb0\x54\xd3\x1d\x20\xdb\xa9\xcf\xbd\x44\x75\x8e\xa2\
+\xe1\xc8\x1d\xa9\xf8\x67\x34\xf7\xb0\x5e\xce\xfc\xad\x41\xaf\xd4\
+\x0e\x7f\x08\x31\x92\x75\x9c\x4a\x32\x16\x0d\x2c\xcf\x9a\x76\xbd\
+\x1a\x90\x6f\x12\x32\x6e\x75\x61\x45\x4b\x11\x8f\xae\xe7\x6a\xb6\
+\xd7\x5a\x8b\x9a\xa4\x61\x0e\xd4\x9b\xc9\x37\x92\x6a\x67\x6b\x29\
+\xed\x6a\x2d\x17\xc2\x07\x49\x47\xb3\xa9\x48\xe4\xd7\xd9\xe1\x44\
+\xfb\x84\xee\xf4\x5c\x83\xae\x53\x93\xb9\xad\x5e\x48\x39\x3d\xd9\
+\x52\x0e\x24\x2f\x6f\x87\xf5\x5d\x1e\xc7\x32\x92\x4f\xfa\xbf\xf6\
+\x55\x02\xd5\x34\x4e\x76\xc0\x49\x7f\xb2\xe9\x59\x9f\x2b\xb4\x36\
+\xf6\xba\xe8\xd7\xb5\xb0\x3a\x9d\xdf\x3a\xa9\x89\xc2\x7e\xae\xd7\
+\x5d\x14\xe8\xf8\x01\xb2\x90\x30\x84\xd0\x46\x3e\x19\x05\x54\xf4\
+\x8b\xcb\x5c\xcb\x63\xbd\x1a\x97\x1e\xf4\xd9\x49\x70\x42\xa6\xd8\
+\xba\x64\xe2\xe0\x94\xe7\x31\xf0\x5c\x77\x28\x1e\x03\xec\x76\x57\
+\x24\xe3\x64\x3a\xa3\x0a\x79\x4e\xd6\x09\x8e\x29\x9c\x96\xc9\x92\
+\x9d\x49\xcf\x25\x5f\xac\x8e\x72\xb5\x9d\x3a\x79\x27\x00\x9c\xd0\
+\x32\xa1\x92\xdb\x2c\x3c\x65\x3d\xa0\x21\xda\x09\xee\xb2\x2f\xd4\
+\x6d\xde\xac\xad\x6c\xaa\x8b\xb0\x5c\x2a\x7b\x3a\x17\x3c\xef\x6d\
+\x95\x33\x5a\x03\xa1\xf9\x49\xc9\xe7\xbd\xd7\x4b\xbf\x86\xc6\xbd\
+\xbb\xc5\xd9\xfa\xa6\xc3\xc4\x67\x14\xf6\x8f\x2e\x4a\x96\x37\x19\
+\xda\xe7\x5c\x01\x7d\x94\x96\x32\x58\xed\x75\x1c\x65\xed\x0c\x05\
+\xcd\x69\xdc\x8d\xd5\x1c\x27\x89\xa0\xb9\xc4\x78\x95\x51\x43\x19\
+\x8f\x48\xbd\xcf\x3e\x6a\x4a\x17\xb7\x64\xea\x79\x63\x66\xbb\x6c\
+\x83\x03\xe7\x68\xb9\xe0\xfc\xce\xe6\x0f\xff\x00\x54\x34\x90\xb9\
+\x92\x07\x39\xc3\x6e\x1d\xb9\xf7\xa6\xb4\xb5\x9a\x1b\x72\x13\x61\
+\x90\xbb\x1c\xd1\x74\xf1\x0b\x00\x3c\x6e\xdb\x9f\xa6\x45\xbf\x28\
+\xec\xa7\xf5\xf7\x29\x9b\xa8\xf7\x1f\x5f\xdd\x39\x0c\x14\xe7\x7a\
+\xfe\x89\xa7\xad\xec\x76\xc8\xb9\x3d\xd8\x51\x3b\xd7\xdd\x6b\xb3\
+\x51\x75\xd7\x3b\xa9\x1c\x9a\x7a\xe3\xd8\x55\x43\x7e\x15\xd5\x23\
+\xba\xa5\xbd\xe9\x92\x69\x9a\xde\x2b\xa4\xdb\xc5\x89\xc3\xcb\xf5\
+\x54\xd4\x96\xa7\x17\xee\x4c\xa7\x00\x1e\xfe\x4b\xa4\x21\xf7\x76\
+\x71\x0a\xe8\xf9\x9a\xfa\x47\x49\xdd\x65\x43\x2b\x78\xbf\x55\x57\
+\x5c\x18\x71\xba\x8e\xa4\xc9\xc9\x4f\x2f\xc3\x76\xa1\x82\xa9\x69\
+\x1c\xea\x37\xb2\xdf\x14\x9b\x8e\xfb\x5e\xff\x00\xa2\x6b\x5c\x24\
+\xa6\x8c\x7c\x9a\xb8\x9f\x54\xd0\x06\xea\x99\xd1\xf1\x1b\x7b\x73\
+\x55\x6f\x8a\xf6\x16\x4e\x65\x82\x98\x1b\xa6\x26\x6e\xaf\x75\x60\
+\x9c\x9b\x7d\x41\x5d\x48\x6c\xc2\x51\x79\x29\xca\x3c\x15\x7e\xaf\
+\xb3\x55\x86\x76\x44\x31\xc3\x06\xea\x52\xe8\x0e\xbf\x94\x7e\xe9\
+\xad\x6b\xe1\xe2\x34\xe7\xb9\x46\xd8\xdd\x19\x2f\x24\x3f\x16\xb7\
+\x9a\xa9\x8d\xbc\x0c\x5f\x65\x04\x8e\x6b\xf6\x16\xca\x95\x81\xbf\
+\x14\x13\x7e\xee\x4a\x57\xff\x00\xbb\x3e\x53\x6b\xb7\x4f\x96\xea\
+\x9a\x6d\x74\xe3\x03\x65\x04\x3a\xcf\x57\x27\x90\x5d\x25\xd1\x5e\
+\xf5\xd1\xf2\x3e\x40\xe0\xe6\x34\x91\xa5\x74\x7d\x51\x8e\x9e\xa6\
+\x0f\xe5\x70\x03\xbf\xb4\x55\x0c\xc3\x7b\xe5\x4b\x0c\x92\x9e\x20\
+\x04\xff\x00\x74\xc3\x1c\x0d\x6c\x78\xe3\x9d\xc7\x2b\x6f\xfa\x2a\
+\xca\xc1\x51\x51\x0d\x2d\x38\x06\x3b\x8f\x7a\x77\xcc\xdf\xe5\xd3\
+\xf5\xdd\x35\xad\xa7\x9a\x32\xdc\xf5\x76\x3b\x76\x55\x39\xe2\xd4\
+\xd4\xba\xc2\xe0\x8b\x23\x19\xe7\x84\xd6\x31\xa6\xfa\x8d\xed\xde\
+\x9e\xf6\x3e\x6b\x17\x1b\x5d\x3a\x46\xe9\x55\x52\x0c\xa8\x73\xeb\
+\xcd\x35\xb6\x6d\xfd\x8e\x36\x0a\xfa\x90\x6e\x53\xb0\x9e\xfb\x8b\
+\x7b\x0e\xc9\x9b\xaf\x97\xd7\x7f\xb2\x60\x5d\x19\x0d\xdd\x31\xc6\
+\x3c\x39\x54\x01\x51\x4e\xe6\x33\xb4\x6d\xf8\x54\xb5\x3c\x3f\x80\
+\xfd\xf6\x52\x31\xe0\x82\xde\xc9\x52\x83\xee\xd7\x3d\xcb\x8e\x04\
+\xba\x6f\xcd\x3b\xad\x0d\xd5\x41\x26\x8e\x46\x8e\xf6\xfe\xaa\x95\
+\xfa\x29\xc5\xd7\x40\x54\xb2\x4e\x90\x89\x8e\xd8\xea\xfd\x10\xa3\
+\x8e\xa3\xa3\xaa\x40\x6f\xc8\x7f\x75\x5a\xe3\x49\xd2\xd3\xc1\xb0\
+\x73\xcf\xee\xba\x2e\x09\x24\xb3\xf9\x28\xaa\x69\xe1\x61\x64\xb6\
+\x1d\x53\xf7\x03\x1f\x95\xd2\x15\xb2\x44\xc9\xab\x0d\xc4\x97\xb4\
+\x6d\xf0\x37\x6f\xe8\xbf\xd9\xfa\x79\x05\x14\x95\xb2\xdc\xbe\xa1\
+\xcd\x26\xfc\xac\xe5\x2b\xbe\x2c\x7f\xf4\xff\x00\xea\x15\x14\x9a\
+\x27\xa9\x27\x91\x1f\xba\x75\x43\x4b\x70\xa6\xac\x21\xf6\xbf\x7a\
+\x89\xcf\x92\x52\x42\x34\xcc\x31\x93\x77\x2a\xae\xac\xba\x7e\x5b\
+\xa8\x9f\xa4\xe1\x31\xc4\xb1\x00\xdb\x5c\x95\x3c\x8d\x0d\x21\xa7\
+\x29\xb3\x10\x79\x2d\x7f\x0f\x50\xdd\x3a\x42\xe4\xee\xf5\x75\xbe\
+\x14\x0e\xd5\x26\x93\xb2\x73\x40\x21\xbd\xe8\x85\xaa\xc5\x48\xd0\
+\xf3\x9c\x79\x26\x97\xc2\x75\x45\x67\x38\x72\x76\xd9\xc1\xfc\x2e\
+\x92\x74\x51\x7c\x7a\x72\x4d\x57\x36\x1e\xc5\xfc\x97\x43\x56\x49\
+\x5d\x0f\x0a\xac\x47\x1c\xf6\xea\x5b\x02\xcd\xc9\xfc\x22\xf8\xeb\
+\xd8\xea\x7a\x4b\xeb\x8f\xb4\x5f\xb5\xfc\x3e\x97\x55\x60\x53\xf4\
+\x83\x62\xb9\xd4\x1c\x6f\x7d\xbe\x89\xd2\xb8\x53\xe2\xc7\x0a\x5a\
+\xc7\xe8\x2d\xb3\x72\xe6\x8f\xbb\x95\x7c\x9e\xef\x1d\x2b\x22\xcf\
+\x18\x0d\x77\xe5\xb6\xca\x57\xbf\xa1\xaa\xe8\x6a\x29\xba\xfc\x43\
+\x67\xeb\xc8\x01\xd6\x06\xd6\xf0\x25\x41\xd3\x94\x54\x70\x49\x0b\
+\x5d\xab\x89\x1b\x2f\xa8\x8d\xde\xdc\xdb\xee\xbf\xda\xe8\x38\x7d\
+\x3f\x2c\xd4\xfd\x6a\x70\xe6\x1b\x9d\xfa\xfb\xaa\x4e\x94\xa5\xa5\
+\x64\x70\x40\x43\x9e\x5b\x9d\x59\xcd\x95\x3b\x5f\xd2\xb2\xd4\x7b\
+\xd3\x9d\x0b\x63\xb3\x99\xc2\x36\xb8\x19\xcf\xd9\x57\x55\xb3\xa4\
+\xaa\xb8\x50\xf6\x29\x4d\x9c\x06\xc6\xdd\xff\x00\x6b\xae\x8a\xe9\
+\x38\x5f\x42\xf8\x9a\x07\x08\x39\xad\x77\x7b\x4b\x4f\x2e\xef\xee\
+\xa4\xe9\x06\x19\x9f\x6d\xa3\x68\xd3\xe3\x76\xf3\x4d\x78\x75\x3f\
+\x1a\x33\x77\xce\x7a\xdf\xf6\x9b\x61\x00\xe6\xc1\xaa\xf9\xb2\x97\
+\x5e\xa2\xec\x61\x74\x78\x8d\xbd\x79\x0d\x91\x7f\x50\x85\xd2\x3d\
+\x50\xf7\xf7\x28\x25\xbb\xb7\x50\x9f\x87\xf6\x52\xb8\xe9\xc2\x0e\
+\x79\xa8\x00\xed\x95\x23\xb4\x94\xc9\xee\x34\xad\x5e\x68\x9b\xfb\
+\x1b\xbf\xdd\x40\x6d\x2f\xd7\xfa\xa2\xfb\xca\xd0\x8e\xc8\xee\x8e\
+\xea\x57\x39\x8c\x2e\x66\x4e\x3f\x2a\xb2\x8c\x7b\xbf\x1d\xb9\x92\
+\xd7\xd2\xa9\x5d\x53\x34\xc2\x36\x3f\x85\x38\x24\xb7\x36\xc0\xed\
+\x7f\xe2\xa8\x3a\x46\x29\xda\x69\xe9\xc7\x06\xa2\x31\x69\x5e\x71\
+\xa8\xf9\xae\x99\x94\x7b\xeb\x5d\xbb\x9a\x7a\xce\xef\x51\x75\xe8\
+\xf5\x7f\xa5\x49\x25\xea\x38\x7f\xea\xfd\x14\xb5\x7c\x5e\x0e\xa3\
+\xfc\x35\x34\xed\xae\x11\x01\xff\x00\x0c\x5f\xec\x2e\xba\x26\x9e\
+\x9e\xbe\x80\xd4\xba\x51\xab\x4b\xb9\xff\x00\x26\x3f\x65\xd3\x35\
+\x0f\x92\xb4\x5c\x5e\x19\x0b\xc1\x7f\xfd\x18\x19\x5d\x1d\x4d\x27\
+\x13\xdf\x9e\xe3\xc2\x07\xe9\x6b\xd9\x55\xcd\x4f\x4f\xd1\xae\xa8\
+\x80\x8d\x4f\x6d\xb1\xf6\x5d\x0d\x42\xd3\x2c\xd2\x44\x75\xf1\xbb\
+\x5c\xed\xba\x82\x9e\x1a\x09\xcc\x3a\xfa\x93\x3c\x71\x0d\xf6\xb1\
+\xc7\xe5\x74\x8d\x3c\x10\xd3\xd4\x4d\x13\x81\x3c\x36\x9f\xc2\xe8\
+\xfa\xc9\x8d\x34\x67\x24\x07\x3f\xff\x00\xe9\x54\x74\xbc\x91\xc5\
+\x6d\x94\x1d\x20\xe7\xb0\xb9\xdb\x7f\x75\x57\x52\x59\x4d\xad\x97\
+\xcb\x7b\xd7\xbd\x53\xc9\x1d\xe3\x76\xea\x6a\x31\x53\x4f\x21\x71\
+\x36\xc6\xca\x76\x0a\x59\x24\x11\x9b\xd8\xb7\x85\x7e\x7f\xcc\xa9\
+\x25\xd6\xd3\xfc\xb6\x16\xf3\xe6\xa6\x99\xcd\xc0\xb2\x6b\xc9\x7e\
+\xab\x0b\xa9\x1a\x5e\x2e\x98\x4b\x26\x1a\xbb\x19\x40\xea\xec\x64\
+\x23\x81\xe2\xbc\xd1\x3a\x72\x14\x4c\x17\xd5\xcc\xff\x00\x74\x5f\
+\xa6\x46\xbc\xec\x3f\x74\xfd\x5c\x3d\x51\xe6\xe9\x97\x73\x49\x7e\
+\x0a\xd2\x3b\xd3\x9b\xa0\x6a\x68\x0e\x3d\xc7\x21\x43\x09\xed\xba\
+\xe6\xff\x00\x29\xec\xfd\x97\x4b\xd0\xca\xc9\x3d\xfa\x86\xed\xaa\
+\x8c\xdd\xac\xda\x32\x3e\x6b\x81\x9e\xcd\xd5\x2d\x4b\x6b\x99\xa6\
+\x10\x29\xea\x99\xfc\x5d\x1d\x4d\x47\xf5\x3c\xd7\x49\x1b\xb1\xdf\
+\xf3\x58\x5b\x72\x77\x39\x54\x2c\xbf\x46\x82\x77\xd0\xa5\x01\x95\
+\x85\xc6\xf7\x04\xe1\x36\x20\xec\x82\x55\x1b\x9f\x04\xd9\xec\x10\
+\xe6\x92\x7c\x41\x0a\x8e\xbe\x5a\x06\x7b\xac\x12\x13\x19\x2f\xed\
+\x1c\xf5\xc9\xba\xe9\x4a\x58\x07\x40\xcb\x20\x24\xcb\x19\x05\xae\
+\xf9\xba\xef\xce\x7f\x45\x43\x3f\x13\xa3\x4d\x13\xb0\xc3\xf3\x8e\
+\xde\xf7\x52\x54\x3c\x46\x28\x83\x8b\xa2\x17\xcb\xb2\xe5\xd0\x55\
+\x53\x74\x63\xe5\x64\x40\x4a\xd9\x39\xcb\x9d\x3b\xec\xaa\x62\xd6\
+\x5f\xc4\x7b\xc7\x10\xb5\xc4\x83\xd9\xb1\xb8\xd3\xe7\xfa\x2a\xae\
+\x92\xaa\x11\x18\x5a\x75\x31\xe0\x34\x97\x64\xd8\x61\x74\x3f\x04\
+\x51\x70\xdd\xb8\xbd\xbb\xee\x4d\xd4\xec\x3a\xcc\x75\x2d\xb6\xac\
+\x47\xa3\x73\xdc\xb5\xfb\xbb\xbd\xde\xa2\xcc\x8e\x5e\xcb\x87\x6b\
+\x1b\x7e\x53\x22\xa8\x9a\x2e\x04\x8d\xdf\xb2\x47\x36\xef\xfa\x29\
+\xba\x3e\x4a\x18\x6e\x2f\x85\xd1\xfd\x25\x2c\x92\x7b\xb3\x81\xb3\
+\x83\x87\xd8\x2a\xf1\xa6\x7a\x72\x76\x8f\x89\xc4\xff\x00\xbb\xb2\
+\xba\x3d\xd6\x86\x36\x9d\xc6\xab\xfd\x49\xb2\x98\xdc\xa6\x00\x32\
+\x56\xb1\xb7\x25\x51\x4c\x64\x81\xda\x3b\x58\xb7\xdd\x52\x7c\x26\
+\xd9\xfb\xae\x11\x7b\x83\xbe\x55\x31\xd0\x6c\xa3\xeb\xa1\xd5\xc2\
+\xab\x61\xf7\x67\x38\x6e\x2d\xfa\xa8\x2b\x19\x1c\x01\xb2\x1c\xdb\
+\x9a\x6b\xc4\x8c\x2e\x6e\xca\xe9\xa7\xac\x2f\xb2\x0f\x6d\xac\xab\
+\x23\x77\x0d\xcf\x6f\xa1\xcd\x55\x51\x80\xdf\x7a\xa1\xea\x3d\x99\
+\x90\x0c\x5f\xec\x9d\x2b\x6b\x62\x33\xb8\x70\xdd\x0d\x83\xda\x71\
+\xaf\x36\xfa\xae\x8e\xac\x6b\xe1\x31\x0e\xe5\x5e\xc3\xef\xed\x60\
+\xf9\xae\xa3\xf8\x63\xac\xa5\xaa\x61\x05\x8d\x23\x5f\x24\x35\x87\
+\xea\x2a\x7a\xbe\x35\x13\xe9\x6f\xdb\xb6\x3c\x94\x21\xd1\x36\xc9\
+\xc0\x87\x71\x0f\x2f\xdd\x50\x10\xe9\x71\x9f\xfe\x2a\x8f\x88\xf1\
+\x13\x77\x3f\xfd\x55\x11\x88\xa3\xeb\x6e\xba\x18\x6a\x90\x6a\x36\
+\x8e\xc4\x9f\xa0\xb8\x52\x4e\xda\xc9\xde\x24\xea\xf0\xbb\x17\xe6\
+\xaa\xe0\x7d\x73\x4b\x88\x2d\x74\x24\x16\x78\xd8\xff\x00\x65\x15\
+\x6c\x5f\xe1\x81\xe6\xde\xf4\xc1\xa4\x37\xe6\xee\xf3\xd9\x74\x93\
+\x9b\x35\x40\xa7\x8c\x6b\x88\x8d\xfe\x6f\x13\xfb\xfe\x37\x51\xca\
+\xea\x6e\x93\x7c\x7a\x5a\x1a\xc3\xd5\x36\xce\xcb\xa4\x25\xe2\xba\
+\x53\xff\x00\x33\x4d\xed\xcb\x4f\x77\x9f\x35\x0d\x64\x8c\x27\x0d\
+\xcd\xbf\x1d\xca\x9c\xb6\xa7\x73\x9f\x05\x5d\x23\xe9\xd8\x43\x37\
+\xb8\xdd\x30\x83\x18\x79\x3d\x6f\xc2\xa3\x93\x54\x44\xe0\xbb\x90\
+\x3b\x2a\xf6\x06\x37\x89\xf3\x77\x0d\x95\x0d\x5c\x6e\xa7\x70\x77\
+\x6c\x6c\xaa\xe6\x05\xca\x09\x63\xd3\xd5\x70\x0f\xff\x00\x56\xca\
+\x6a\xde\x09\x1a\xe0\x99\xe3\xbe\x36\xdd\xab\xfc\x5a\x92\x46\x70\
+\xde\x74\x5f\xe5\x76\x1e\x9e\xda\x3a\x81\xd5\x95\xf7\xf3\x08\xd5\
+\x49\x47\x13\x80\x1a\xa2\x1b\x9f\x99\x47\xd3\x30\x3c\xe9\x3a\x83\
+\x90\x65\x4c\xb1\xf1\x22\x2c\x2d\xfc\xa7\x9a\x88\x06\xa7\x69\x4d\
+\x99\xb3\xd3\x38\x1c\x3c\xdb\x6f\x35\xd2\xf1\x9a\x13\x13\xa9\xee\
+\x5a\xfe\xd8\x3b\x1f\x57\x55\x54\xad\xa9\x92\x12\xdb\xc4\xd7\x35\
+\xda\xdb\x16\x03\xac\x31\x75\xd1\xf2\x3a\x19\xa5\x00\xdf\x46\xd7\
+\x53\x55\x49\x24\xce\xa8\xb3\x78\x91\x1b\x34\x7c\xbd\x6c\x65\x1e\
+\x34\xd0\x6b\x20\x03\x6e\x48\xb6\xaa\x19\x78\xd6\xbe\x93\xb1\xdb\
+\x2a\x9a\x09\xea\x63\xd4\x5a\x06\x39\x28\xa0\x9c\xf4\x84\x70\x34\
+\x65\xc4\x8b\x2e\x90\xa3\xa8\xa4\x9d\xb1\xe9\x1a\x48\xb9\x24\x78\
+\x5d\x47\xc3\xa8\x86\xa1\xaf\xc3\x98\x5a\x05\xb1\xb9\xca\x64\x0d\
+\xa5\x96\x31\x19\x27\x5e\xf7\xca\x9e\x2f\x75\xa9\x82\x56\x75\x89\
+\xbd\xc3\xbb\x39\x0b\xa6\x27\x9a\x49\x5b\xc3\x0d\xe0\xf3\x23\x91\
+\xb2\xe8\xe9\x6a\x59\x4b\x33\xa5\x6b\x5b\x18\x03\x43\x85\xee\x7e\
+\xaa\x96\x6a\x9e\x91\xae\xea\xb4\x36\x08\xcf\x59\xcc\x06\xe4\x78\
+\xfa\xfa\xa9\xde\x64\x2c\xf7\x40\x0f\x0f\xb7\xce\xfd\xf7\xb2\xa2\
+\x89\x95\x5d\x2c\xcb\x39\xda\x41\xeb\x30\x7f\x0e\xf6\xee\xf3\x5d\
+\x1f\xd2\x1f\x0d\xd3\x48\x72\xdc\x5c\xfd\x97\x4c\xd4\x08\xea\x59\
+\x3b\x7e\x72\x54\x32\x71\xdb\x74\x18\x4c\x9a\x47\x8f\xee\xba\x22\
+\x42\x6a\x4c\x67\xbd\x74\xab\x87\xbe\x47\x4f\xfc\xd7\xfc\x0b\xa7\
+\x54\xe9\x93\x85\x74\xda\xf7\xc7\xd5\x66\x5c\x76\x0a\x09\xe5\xac\
+\x3a\x24\xba\x73\x22\xa4\x22\xee\xb7\x82\x93\x83\x20\x27\x50\x4d\
+\xab\x8a\x8a\x66\xc8\x59\xc6\x0d\x36\xe1\xe0\xde\xf8\xe7\x8f\x32\
+\x4e\x13\x3a\x46\x9a\xaf\x1d\x48\x39\x16\x12\x07\xe9\x83\xe6\x14\
+\xb4\x34\x55\x0c\x73\x23\x8a\xf2\x9d\xa6\x00\x58\x7d\x54\xf4\xd2\
+\x52\x3a\xcd\x3b\x29\x6a\xe6\x8e\x07\x3a\x48\xcb\xd9\x8b\x8b\x5f\
+\x9a\xa1\x87\xa3\xea\xd8\x1c\x74\xc4\xff\x00\x1b\x0b\x1f\x5f\x6f\
+\xaa\x77\xbe\xd1\xca\x1d\x0c\xba\xe0\x6f\xca\x09\xfa\x2a\x9e\x90\
+\xa8\x91\x9d\x60\x42\xa0\x93\xe1\x6a\x27\xb9\x74\x88\x6d\x45\x11\
+\x97\xf9\x02\xe8\x72\x2b\x19\x2b\xbf\xe5\x02\x3f\x50\x9a\x34\x54\
+\x54\xf9\x9f\xdd\x38\x91\x0d\x43\x86\xe0\xb7\xf5\x50\x55\xb8\x53\
+\x8b\x8e\x4a\x59\x0c\xd0\x3c\x35\xb9\x24\x5b\xee\xa8\x2b\x85\x3c\
+\x1a\x5e\x33\x64\xee\x90\x92\x1e\x92\x8e\xa9\xa3\x0d\x77\x77\x7e\
+\x15\x7f\x48\x3a\xae\xa2\x32\xe6\xfc\xbd\xdf\xe9\x54\xf6\xbd\x56\
+\x7e\x66\xfe\xaa\x59\x34\xcd\x05\xfc\x17\x4e\xd7\x36\x38\xa3\x2d\
+\xdf\x49\xb7\xd5\x36\xaa\x57\x50\xb9\x8f\x07\x8a\x4d\xc7\x7e\xf7\
+\xfd\x13\xab\xb8\xbd\x16\xda\x66\x7f\x10\x34\xea\xb6\xeb\xfd\x8c\
+\x64\x42\x96\xb1\x92\x81\xc5\x70\x3a\x6f\xbf\x35\x0c\x92\x74\x5b\
+\x2b\xdd\x37\x69\xce\x02\x3b\xf7\x38\x91\x85\x44\x22\xa5\xe8\xf7\
+\x55\xb4\x83\x54\xe3\xaa\xdc\xf7\xbf\xe8\xa0\xab\x26\x17\x46\x70\
+\x1f\x93\x6f\x3b\xaa\xd9\x23\xa9\x11\xc6\xe2\x47\x0f\x6b\x1c\xe7\
+\xbd\x53\x3a\x78\x85\xa1\x68\x70\xef\x2a\x29\x0c\x72\x09\xa6\x16\
+\xb0\x37\x03\xc5\x52\x56\xc3\x0d\x51\x91\x81\xf7\x27\x63\xb2\xae\
+\xaa\x12\xd5\x32\xaa\x30\x78\xed\xbe\x96\x9e\xc6\x45\x8d\xd4\x54\
+\xf0\x48\xee\x35\x43\x9c\xd7\xf7\x37\x64\x66\x8e\x1a\xa6\x48\xd3\
+\xa9\xad\xbf\x6b\x6d\xb9\xa8\xfa\x49\x91\x92\xf6\x86\xdf\xd7\x72\
+\xac\xaa\xf7\xc9\x07\x58\x87\x67\x0d\x28\x54\x49\x11\xd2\x49\xb7\
+\x8a\x6f\xba\x81\xc7\x92\x47\xdc\x72\xb8\xb6\x55\x01\xe8\xd9\x19\
+\x71\x1c\x6f\x77\x79\x01\x3e\x6e\x03\xb5\x37\x4b\x63\x1c\x82\xa9\
+\x7c\x32\x75\xc9\xba\x81\x94\xb2\x52\x3f\x53\x1a\xe3\x6d\x88\x16\
+\x2a\x9b\xa1\xe2\xe9\x17\xca\x44\x92\xc3\xa2\xf6\x10\x9d\x21\x70\
+\xeb\x28\xf5\xb5\x9f\xef\x01\x98\xd3\x25\xc9\x3c\xb2\x31\x7f\x0d\
+\x37\xf1\x47\xa4\x5d\x33\xb4\x54\x45\x1c\x7c\xba\xad\xb7\xef\xeb\
+\xf0\x85\x4b\x58\x44\x71\xbb\xaa\x77\x2e\xe4\xa2\xaf\xf7\x9a\x69\
+\x28\xa1\xcb\xde\x2c\x49\xfd\x95\x13\x2b\xba\x11\xef\x88\xb1\xaf\
+\x64\xfd\xa7\x9b\x9b\x7a\xba\x75\x05\x26\x87\xce\x5e\xfe\x23\xf2\
+\x45\xc5\x93\xe1\x7b\x0c\x8d\x68\xbc\x6e\x39\x25\x0b\xe9\x0c\xd2\
+\x2d\xe4\xba\xd0\xc6\x5c\xc6\xb4\x9e\xe2\x84\x82\x4f\xe2\x59\xa7\
+\xb8\x20\xd6\xea\x1d\x50\x5b\x7b\xdc\xaa\xaa\x92\x00\x91\xac\x65\
+\xda\x2d\xe1\xdd\xfa\x2a\x66\xb9\xc6\x49\x33\x77\x9c\x8e\x58\x52\
+\x51\xc2\xea\x31\x51\x2b\x9c\xda\xa6\xe5\xac\x1d\x9d\xf9\x8d\xd3\
+\xe3\x1d\x25\x2c\x11\xc8\x4d\x9b\x7d\x76\xf0\xd9\x55\x40\xf8\xe6\
+\x6f\x0d\xad\xb3\x71\x6b\x60\xf2\xca\x6d\x1c\x94\xd4\xd3\x55\x34\
+\x5d\xce\xb7\x55\xdd\x91\x9e\x4b\xa2\xea\xdd\x4b\x27\x14\x58\x38\
+\xe7\x4f\xca\x55\x63\xa6\xe9\x69\x59\xc4\x63\x58\xdd\xfe\x18\xb5\
+\xed\xde\x9e\xe3\x4c\xf0\x49\x27\x48\xb6\x83\xd8\xda\xd9\x09\xd4\
+\xb1\x34\x58\x15\x51\x4b\x6b\xbc\x1c\x83\xfb\xae\x8e\x96\x28\xd8\
+\x03\xed\x7f\x14\xf7\xc4\xe9\x2f\xa7\x53\x73\x85\x03\xa9\x03\xef\
+\xc1\xff\x00\xc5\x4f\x5b\x49\xc7\x0c\x11\xe9\x26\xf6\x36\x1d\xca\
+\xad\xee\x79\xf8\x7f\x84\xc6\xbd\xcf\x01\xf8\xba\x8e\x9d\xa4\x6e\
+\xa9\x29\x63\x15\x71\xb9\xe7\xab\x9b\xaa\xba\x58\x0d\xc8\x23\xf0\
+\xaa\x20\x0e\x8d\xcc\xd5\x6b\xdb\xf5\x54\x62\x48\x40\x0c\x24\x9e\
+\x56\x52\x54\x55\xcb\xf0\xc8\x36\x3e\x69\xf0\xcc\x22\x04\xdd\x50\
+\xca\xfd\x05\x87\xb8\xfe\x2e\xbf\xd9\xd9\x9a\x24\x9f\x57\xad\xd4\
+\x7e\xea\xe7\x4d\xae\xd6\xfa\x2e\x90\xa3\x86\x4a\x92\x62\xec\xdf\
+\x91\xe5\xdc\x0d\x8f\x25\x51\xd1\xee\x23\x4b\x1d\x67\x9c\xde\xfd\
+\xca\x3a\xce\x01\x10\x44\xdd\x33\xb7\x05\xf6\xdf\x27\x37\xe7\xdd\
+\xe5\x65\xfe\x23\x29\x8c\xd3\xd4\x0d\x72\x3e\xda\x5f\xbd\xad\x9d\
+\xd4\xbc\x4e\x1d\xee\x6c\x8c\x91\x8a\x39\x2f\x6d\x78\xfd\x53\x64\
+\x0b\x5b\x48\xca\x99\x8e\x2e\xbb\x36\x5a\xfe\x16\x9f\x9b\x16\x4f\
+\x61\x30\xe7\xb9\x52\x48\xd6\xe0\xdb\x7f\xd0\xdd\x4b\x3f\xbc\xd6\
+\x34\xc7\xfc\x16\x8b\x1b\x6d\xd9\x4e\x73\xa8\x66\x9d\xff\x00\xcd\
+\x6e\x1f\xee\x9b\x58\xf9\x1f\xa8\x85\xef\x82\x48\x1d\x01\x1d\xa1\
+\xfa\x29\x6e\xd9\x06\x9d\xae\xba\x3e\xba\x18\xc0\xd7\x6b\xd9\x56\
+\xbf\xde\x1f\x78\xf6\x52\x52\xb4\x3c\x8d\x6f\xc7\x8a\x91\x80\x4a\
+\x23\xb9\x2d\x27\x3e\xbe\xab\xdc\x99\xef\x86\x0d\x4e\x0d\x16\xcd\
+\xf3\xb1\xfd\x7d\x15\x57\x4e\xce\x8d\x6d\x24\x91\xde\x43\x28\x76\
+\xa1\x26\x46\x14\x15\x7c\x42\x6f\x0c\x3f\x46\xae\x93\x20\xcf\x86\
+\x35\xa7\xbc\x0c\xf3\x51\xcc\xe6\x0d\x81\xf3\x52\x3b\x56\x76\xf2\
+\x59\x8e\x2d\x40\x92\x7c\x54\x75\x32\x3d\xdb\xdb\x3c\x93\x41\x7d\
+\x50\x80\xb9\xda\x48\xef\xce\xca\xa6\xe2\x69\x62\xb9\xb3\x48\xb1\
+\xe6\xa2\x71\x89\xa0\x8e\xb7\xfd\x4b\xa2\xc3\x6a\xdc\x1b\x23\x5a\
+\x30\xe3\x76\x8c\xe0\x13\xfb\x29\x62\x63\xa9\xde\x6d\xd9\xb8\x16\
+\xf0\x36\x55\x6e\xf7\x2e\x11\x88\x03\xc4\x0e\x06\xfe\x03\xf7\x5d\
+\x16\xf2\xc7\xb8\x8f\x9f\x74\x68\x98\xf8\x9f\xd7\x90\x6b\xc9\xb1\
+\xfa\xe1\x35\xbc\x36\x74\x9c\xba\x8b\x9d\x47\xc3\xe1\xea\xcd\xf5\
+\x9b\x1d\x49\x95\x12\x54\xf0\x9e\xe3\xa4\xbb\x55\xf4\xf8\x29\xed\
+\xef\xad\xa7\x0d\x00\x1f\x9f\xe7\xef\xdd\x44\xff\x00\xe2\xc2\x5a\
+\xd7\x69\xb5\x9e\x7b\x7f\x74\xe9\x0f\x0c\xb2\xc3\xcf\xe8\x15\x5b\
+\xcc\x6d\x75\xbd\x64\xaa\x7e\xb8\x04\xa7\x8b\x62\xe5\x09\x08\x16\
+\xb0\x45\xa3\x56\xbe\xee\x5c\x93\x6a\x9f\x21\xe1\x10\xdd\x3e\x1b\
+\xf3\xfe\x89\xf1\x88\xce\x09\xc8\x3f\xba\xe8\xd7\x18\x43\xa2\x1d\
+\x60\xe3\xbb\xb7\x5d\x28\xf3\x34\xb0\x82\x00\xd1\x7d\xb9\xdf\xbd\
+\x62\x36\x07\x00\x14\x0c\x12\xb1\xce\x38\x20\x13\x8f\x25\xd1\x91\
+\x8a\xf9\xa5\x8e\x5c\x06\x6a\xb6\x9d\xf0\x1d\xfd\x15\x5c\x22\x1e\
+\x21\x63\x9d\xd4\x22\xd9\x54\x95\x0f\x0c\xe4\x7c\xd7\xff\xc4\x00\
+\x47\x11\x00\x01\x03\x03\x02\x03\x05\x05\x06\x04\x04\x04\x03\x09\
+\x00\x00\x01\x00\x02\x03\x04\x11\x21\x12\x31\x05\x13\x41\x22\x32\
+\x51\x61\x71\x14\x81\x91\xb1\xf0\x06\x10\x23\x42\xa1\xc1\x33\x52\
+\x62\xd1\x15\x24\x72\xe1\x43\x82\xb2\xc2\x25\x34\xa2\x07\x20\x35\
+\x44\x53\x63\x83\x92\xf1\xff\xda\x00\x08\x01\x02\x01\x01\x3f\x01\
+\xa8\x68\xb2\x6f\xf1\x41\xe8\xa2\x8d\xae\x09\xd6\x8d\xd7\x4d\x94\
+\x15\x76\x9f\x05\xcd\x0d\xc2\xd6\xd2\x2e\xb0\xf6\xe1\x4b\x11\x69\
+\x27\xee\xb5\xf0\x13\x58\x7a\xac\x7b\xfe\xe7\x0b\x8b\x2e\x59\x4d\
+\x61\x06\xeb\x5d\x9a\x9f\x37\x6a\xc9\xa5\xc7\xe8\xa8\x83\xb5\x02\
+\xa4\x72\x90\xdc\x1b\x28\xae\x1d\x9f\x15\x0b\x86\x85\x29\xb9\x41\
+\x97\x6a\x6c\x28\x43\x64\x23\xfa\xfa\x08\xc7\x8b\xa7\xb7\x2b\x4f\
+\x60\xae\x5b\x91\x61\x09\x8d\xfa\xf8\xa9\x41\x29\xec\x3e\x0a\x27\
+\xc8\xc1\xb0\x53\x48\xe7\x7a\xa8\xdc\xf1\xba\xe7\x59\xbe\x6a\xe5\
+\xc6\xe4\xa6\x58\x8d\x37\x4c\x76\x8f\x35\x2b\xb5\xb4\x8b\x2e\x58\
+\xf3\x4d\x6b\x5a\x6e\x9c\x7c\x10\x0f\xd4\x99\x15\xf7\x44\x35\xbf\
+\xee\x9a\x01\xfa\xf5\x4f\xf0\xb0\x52\x3d\xc3\x0a\x38\xb5\xc8\x0b\
+\x93\x21\x03\xc5\x68\x1d\x13\xd8\xe4\xe6\x69\xcd\x94\x51\x09\x1d\
+\x9f\xd1\x41\xc3\x81\x65\xc1\x76\xca\x7a\x47\x30\xf5\x4d\x16\xc1\
+\x5a\xad\xb5\x91\x91\xde\x01\x46\x49\x17\x29\xce\xfc\xbd\x13\xc6\
+\x50\x00\x31\x01\x7e\x83\xea\xe8\xc1\xa8\x59\x0a\x72\x3e\xbd\x51\
+\x7b\x4a\x25\xa3\x28\xb9\xa5\xb8\x43\x33\x0f\x0c\xa7\x34\x74\x56\
+\x37\xf2\x57\xb2\x89\xfd\xb0\x16\xaf\x44\xf7\x76\x7a\x28\xc5\xc2\
+\x96\xf7\xb0\x51\x83\xd5\x59\xa0\x21\x91\x85\x20\x37\xbf\x44\xc7\
+\x61\x6a\xed\xa9\xa6\x6e\xbb\x2a\x46\x87\xd9\x68\xb2\x1b\x84\xd8\
+\xda\x5b\x75\x33\x41\x25\xa3\x73\xfb\x26\x38\x43\x26\x55\x15\x4c\
+\x7c\xb1\x7b\x6c\xaa\x5d\x1b\xc1\x22\xca\x77\x80\x48\x09\xaf\xba\
+\x68\xd4\x98\xcb\x04\x7b\xe1\x4d\x84\xc9\x54\x2f\x69\xf0\x51\xb5\
+\xae\x5c\xb6\xfd\x7b\xff\x00\xba\x66\xbe\xa9\xec\xd4\xc2\x1a\x4e\
+\xa2\xa3\xa6\x92\xc8\xc2\xe6\x3b\x51\xe8\x83\x49\xd9\x72\x4d\xae\
+\x42\x6d\x18\x78\xeb\xee\x5e\xc0\x58\xeb\x8d\x57\x0b\x90\xee\xaa\
+\x76\x69\x8c\x91\xba\x86\x67\xed\x60\x9d\x1b\x4f\x6c\x9c\xa6\x30\
+\x27\x5c\xf6\x7a\x26\xf6\x53\xec\x5a\x6e\x98\x05\xba\xa9\xc1\x0d\
+\x71\x67\x7b\xa5\xd3\x9b\x2b\xa4\xbc\x98\x17\xe8\xa8\xdd\x14\x51\
+\x82\x0b\xb5\x0f\x14\xea\xb0\x4d\x85\x94\x71\xca\xf3\xa8\xf7\x10\
+\x7e\x91\x60\x83\x43\xa4\x0e\x27\xc5\x56\x0e\xde\x0a\xa5\x9e\x40\
+\x03\x7a\x23\x50\xfd\x93\x6d\x2c\x9f\x88\x6c\xdc\xec\xb8\x45\x19\
+\xae\xae\x10\x10\x79\x5a\xad\x76\xef\x65\x0f\xd8\xae\x12\xd0\xcd\
+\x73\xd4\x02\xe6\xdc\xf6\x87\x82\xae\xfb\x39\x4d\x06\xaf\x67\x74\
+\xae\x02\xfd\xe3\x75\x57\xcc\xa6\xac\x11\xb8\x76\x33\x73\xd5\x3d\
+\xd2\x4b\x26\x96\x8b\x85\x20\x74\x6e\xd3\xd5\x53\xee\xa2\x3e\x1b\
+\xad\x4e\xb5\xca\xe5\x03\xb2\x74\x45\x83\x55\xb6\x42\x47\x86\xec\
+\x9d\x2b\xde\xfd\x24\x6f\xe4\xa1\x00\x6f\x64\x74\x39\x9a\x46\xea\
+\x9a\x20\x06\x56\x98\xc9\x53\x46\xce\x8a\x68\xb5\x02\x10\x87\x4a\
+\x7b\xac\xd5\x11\xb8\x5a\x3b\x41\x39\xb6\x52\x3b\x16\x54\xf1\x17\
+\x32\xff\x00\x5d\x55\x58\x91\x97\xd0\x2e\x57\x0e\xe1\x72\xd6\x58\
+\xbd\xa7\x3e\x4a\x9b\xec\xd4\x62\xc5\xc5\x56\xfd\x9a\x7b\x2f\x24\
+\x42\xed\x1e\x0a\xf2\xc1\xf8\x0f\x69\x4e\x72\x2f\xd3\x94\x47\x30\
+\xa0\xcd\x0d\xba\xbd\xd4\x80\x86\x12\x3c\xb6\xf3\x5f\x64\x69\x18\
+\xdd\x33\x38\x67\x19\x55\x32\x3c\xb8\x16\x6c\x14\x53\x31\xd7\x6c\
+\x96\xbf\x9a\xfb\x4d\xc3\x75\x6b\x9a\x21\xb7\x82\xa1\x8c\x31\xd6\
+\x7e\xea\xb6\x2b\xce\xd7\x0d\xb2\x9b\xd9\x51\xd4\x86\x1b\x9d\x82\
+\xf6\xb6\xb9\xb8\x2a\x4f\xc2\x75\x9b\x9f\x54\xc3\xcc\x69\xb8\x08\
+\xb0\x06\xf7\x47\xc1\x48\x1a\x1f\xb0\x5a\xb2\xa9\x98\xc2\xe0\x49\
+\x28\xb9\xac\xd8\xa1\x37\x6f\x75\x24\x97\xd9\x5c\xdf\x23\x0a\x44\
+\xe1\xa8\xe9\x3b\x28\x9a\x41\x00\x64\x26\xd3\xdd\xba\xcd\xd4\xcd\
+\xb1\x42\x2b\xd8\x94\xc0\xc8\xa1\xbb\x77\xb7\x55\x45\x07\xb5\xd6\
+\x30\x3d\xbd\x92\x4d\xf0\xa8\x28\x59\x10\x1a\x5b\xfa\x2f\x67\xd4\
+\x6c\x49\x03\xc9\x6a\xe5\x8d\x36\x0e\xf3\x76\xeb\x8c\xf0\xf8\xdf\
+\x4d\x2d\x4c\x6d\xfc\x56\xe9\xb0\x1d\xdb\x9b\xfc\xed\xf3\x52\x3d\
+\xec\x75\x9e\x00\x4e\x1a\xa2\x2e\x1d\x14\x23\xeb\xe2\x9e\xc0\xe8\
+\xca\x11\xd9\x16\x92\x2d\xe6\x3e\x6b\xec\xfc\x7a\x69\x9b\x6f\x00\
+\xa3\x76\x2c\x7c\x14\xed\xd1\x26\xa6\x93\xbe\xca\x48\x5b\x55\x0b\
+\x98\xfe\xa3\xa7\xbf\xfb\x2e\x21\x13\xe9\xea\xdc\xd6\x8e\xcd\xd4\
+\xaf\x6b\x88\x4f\x75\x93\xe5\x71\xec\xf4\x2a\x17\x10\x37\x4e\xed\
+\x9b\xa6\xf6\x05\xd7\x7d\xb8\x53\xc0\xec\xb9\x08\xdd\x75\x0b\x1c\
+\xd1\x75\x2c\xae\x07\x7f\xac\xa8\x83\x9d\x62\xac\x46\xea\x47\xb4\
+\x30\xf8\xa2\xeb\xae\xb7\x54\xe0\x75\x52\x4e\xc6\xc4\x42\x96\x60\
+\x4a\x74\x83\x96\x51\xab\xd9\xb7\x5c\x02\x84\x39\xad\x9c\x85\x04\
+\x4d\x01\x48\x00\xd9\x49\xba\x0c\x6c\x8d\x2c\x76\xc4\x2e\x37\xc2\
+\xce\xb2\xe6\x0c\x65\x38\x72\xe1\x73\x0e\xea\x2d\xc7\xd7\x8a\xdd\
+\xa7\xeb\xc5\x69\xf5\x50\xc7\xaa\x46\x8f\x35\xc1\xe0\xd3\x4a\xdf\
+\x44\xf7\x68\x6b\x93\x8e\xb3\x75\x11\x0d\x5c\x7a\x89\xba\x5d\x30\
+\x08\x12\x5e\x4f\x40\xaa\xa5\xd2\x6d\x74\xc3\xa8\x84\xd3\x66\xa6\
+\x27\x8d\x4d\x23\xe4\xa1\xbb\x30\x8e\x99\x06\x93\xd5\x1a\x66\x8c\
+\x85\xda\x03\x4d\x94\x91\x92\xe5\x0d\xda\xdc\x04\x0b\xa4\x7e\x9b\
+\x7c\x15\x58\x74\x66\xdd\x13\x18\x08\xca\x0d\x17\xb2\x65\xef\x60\
+\xa6\xa4\x26\x27\x3e\xe6\xff\x00\xa2\x34\xfe\x24\xa9\xac\xc8\x9d\
+\x62\x6f\x8f\x9a\x63\x5a\x4b\x1d\x73\x7b\x8c\x2f\xb3\x8d\x1f\xe1\
+\xa6\xfb\xd8\x7c\xd4\x63\xb3\xf5\xe6\xa4\xdd\x4a\x10\x90\xdf\x4a\
+\x9e\x9a\x39\x62\x24\xe4\xd9\x71\x2a\x1d\x12\x92\x6f\xa3\xea\xca\
+\x1d\x1c\xcd\x37\x52\xea\x8e\xc1\xa3\x07\xc5\x16\x1e\x56\xbe\xab\
+\x85\x34\xcf\x59\x1b\x1e\x31\x9d\x95\x11\xe5\xc4\x18\x36\xb2\x9d\
+\xd7\xbb\x7a\x14\xd6\xd9\x10\x6c\xb8\xd3\x2f\x44\x7c\x6c\xa5\x79\
+\x8b\x99\xeb\xd5\x4c\x4c\xae\x50\xc3\x61\x7c\xa7\x3d\xc3\x16\x56\
+\xb2\x6b\xbb\x59\xd9\x5c\x1d\x95\xcb\x3b\x5e\x08\x4e\xd2\x9a\xe6\
+\x92\x8b\x1a\x72\x9a\xf6\x87\xe9\x51\x39\xbc\xd2\xb8\x89\x17\x2a\
+\x2d\x8f\xd7\x8a\x76\xea\x17\x80\xec\xae\x63\x1d\x4e\x5a\xaa\x1a\
+\x3a\x29\x58\x5e\x48\x54\x4d\x32\x55\xb6\x3f\xea\x5c\x26\x03\x0d\
+\x10\x1e\x41\x47\xdd\xfa\xf1\x2a\x4d\xd4\xdf\xd9\x3c\xd8\xdd\x32\
+\x61\x6b\x15\xc4\x68\x5b\x51\x49\x2e\x91\xda\xc2\x92\x07\xd3\x54\
+\xd8\xf8\xa0\x5a\xfd\x23\xaa\x98\xb5\xb1\x59\x7d\x9f\x68\x7d\x6c\
+\x5e\xf4\xd1\xa0\x59\x4b\xb5\xd4\x62\xff\x00\x5e\xa8\x45\x70\xab\
+\x59\xcd\x8d\xd1\xf9\x2e\x36\xce\x4c\xee\x8c\x6e\xe5\x04\x17\xc9\
+\x41\xad\xb6\x90\x9f\x1e\x51\x65\xd1\x84\xee\x9a\x2c\xa7\x78\xe4\
+\xb8\x75\x4d\xd6\x7b\xa8\x0a\x86\xf6\xb4\xe3\xce\xe9\x92\xdd\xb6\
+\x76\xe8\xc7\x27\x33\x5b\x46\x13\x5a\xe6\x9b\xf5\x53\xb0\x49\xda\
+\x24\xdd\x37\xb3\xb2\x3e\x29\x83\xaa\x12\x68\x6e\x76\x4e\x94\x3a\
+\xea\xc4\x1b\x81\xe5\xf1\x5c\x22\x94\x9e\x36\xc8\xed\x87\x1b\xfa\
+\x62\xea\x02\xe0\xc7\xc4\x40\xd2\xc0\xdf\x54\x25\xd2\x2c\x9e\xeb\
+\xe5\x4a\xf5\x23\xca\x69\xed\x05\x48\x43\xac\xd7\x6c\x41\xf9\x2e\
+\x3b\xc3\x6f\x29\x92\x30\x77\x40\x06\x5a\xfd\xe0\x76\x4f\xfc\x47\
+\x18\xc9\xc0\x1d\x3d\x17\xd8\xd8\xc4\xd3\x4d\x2b\xaf\x7a\x73\xd8\
+\x03\x6c\xdc\x65\x39\x80\x8b\x95\x27\xf2\xa8\xa2\x6e\x37\xfa\xba\
+\x63\xac\xe0\xde\x96\x3f\x25\x60\xf8\xe7\x90\xee\xd0\x6d\xe1\xd5\
+\x71\x77\x1a\x8a\xa9\x64\x70\x01\xd1\xbb\x16\xdb\x7b\x65\x46\x48\
+\x6e\x07\xe8\x8c\xb2\xb5\xe0\xdb\x09\x8f\x8d\xf9\x7d\xd6\xa0\xdd\
+\xd7\x3d\x9d\xd4\xe7\x83\xb2\x97\x51\x69\x54\xba\x5a\x7b\x48\x3e\
+\x17\xc7\xa0\x5a\xe5\x49\x4a\xfd\x57\x17\xb2\x0e\x8e\x38\x48\x77\
+\x7b\xcd\x49\x2b\x4e\xc9\xe6\xff\x00\x71\xd9\x33\x65\x3d\xf9\x26\
+\xdb\xff\x00\xba\xa6\x8d\xc4\x8b\xa7\x42\x1b\x16\xaf\x30\xb8\x0d\
+\x33\x5d\xc6\xa2\x36\xfa\xd2\xa4\x21\x92\xca\xd1\xfd\x3f\x25\xab\
+\xd1\x39\xd8\x52\xb9\x13\x72\xaf\x67\x2a\x47\xdd\xcd\x01\x4f\x4f\
+\x1c\xb1\x1b\x8c\xd9\x71\x0a\x27\x32\xab\x50\x1d\x80\x54\x8e\xd3\
+\x50\x47\xf4\x9f\xfa\x57\xd8\x36\xea\xf6\xe3\xe6\xdf\xdd\x3c\x59\
+\xa9\xee\xfc\x4b\x28\xb6\x1f\x5e\x28\x61\xfe\xe3\xf2\x4d\x77\xf9\
+\x7a\x9f\x43\xfb\xaa\xc7\x7f\x99\xa8\xbf\xf3\x7e\xe5\x47\x23\x76\
+\xc2\x65\x33\x24\xdf\x65\x51\x04\x4c\xd8\xaa\x99\x08\x05\x32\x59\
+\x1d\x38\x1d\x0d\xd3\x09\x4d\x01\xc7\x4b\xb6\x3b\xa9\x5a\xd6\x1e\
+\xc9\x51\x3a\x56\x38\x38\x66\xca\x2a\xa6\x68\xfc\x4b\x5e\xca\xad\
+\xda\x9c\x74\x9e\xca\x6b\x2e\x37\x2a\xd9\xd2\x76\x4e\xb0\x4d\x8f\
+\x5a\x6d\x39\x1b\xa7\x46\x34\xdb\xaa\x8f\xb0\x76\x0a\x69\xf5\x44\
+\x59\xe6\x3e\x6b\xec\xe9\xff\x00\xc6\x23\xf4\xff\x00\xb4\xaa\xa3\
+\xfe\x62\x67\x78\x69\x42\x42\x9c\xe3\x65\x33\x96\xae\xda\xb0\x2a\
+\x99\xda\x24\x69\x1f\xaa\x2c\x0e\x83\x5f\x5b\x2e\x27\x03\x4d\x34\
+\xaf\x03\xb4\x2d\x6f\x8a\x75\xde\x5f\x23\xb0\xe1\x8f\x2f\x05\xf6\
+\x0e\x9d\x8d\xa7\xa9\x90\x5e\xef\x22\xfe\xe2\x55\x4c\x85\xb8\xc2\
+\x3d\xed\x5d\x54\x0e\x36\xfa\xf3\x4e\xc5\xcf\x97\xec\x9e\xf2\xca\
+\x5a\x97\x0f\x03\xff\x00\x72\x9a\x47\x4b\x35\x49\x76\x3b\x5d\x3d\
+\x4a\x67\x78\x6e\x98\xf3\xc9\x20\x77\x94\xd1\x4a\xeb\xe4\xfd\x5d\
+\x54\x3b\x36\x50\xc1\x77\x07\x2d\x16\x57\xf8\xa3\xbe\x54\x5a\x2d\
+\x95\x57\xcd\xd7\xd8\xbd\x94\x6f\xbb\x74\xbb\x74\xc6\xe1\x4b\xd9\
+\xb9\x45\xf7\x2a\x96\xc0\x8b\xed\x9f\xdd\x39\xcd\x3b\x23\xbd\xfa\
+\x27\x10\x76\x4e\x0e\xfd\x42\xfb\x3b\xff\x00\xc6\x23\xf4\xff\x00\
+\xb4\xaa\xbf\xe3\x4f\xff\x00\x2a\x6a\x76\xca\x6e\xa8\xf7\x8a\x6b\
+\x94\x4e\xed\xb5\x30\xde\x9f\xdc\xa6\x83\x9b\x14\x8c\xf1\xff\x00\
+\x75\x5f\x17\x24\xca\x3c\xd7\xd8\x56\xff\x00\xe1\x95\x0e\xf4\xf9\
+\xaa\xa7\x65\x02\xa0\xdb\xeb\xcd\x3f\xf3\x7a\x29\x33\x49\x53\xe8\
+\x7f\xee\x4e\x8a\xf2\x54\xff\x00\xab\xf7\x2a\x1a\x22\x5b\x7b\x27\
+\xb8\xc2\xeb\x23\x50\xf3\xd1\x47\x00\x9e\x4e\xdd\xc7\xa2\x30\x88\
+\x5c\x1a\xde\xef\x9a\x20\x14\x58\xd6\xf6\x81\xca\x11\x87\xee\x9b\
+\x0b\x00\xef\x1f\x8a\x9c\xdb\x00\x5f\xd5\x06\x67\x58\xbd\xc7\x45\
+\x03\x35\x37\x2a\xa2\x2b\x92\x3a\x2f\x65\x1e\x68\x35\xed\x04\x05\
+\xdb\x6a\x74\x97\x1a\x56\xa2\x11\x9c\x91\x67\x00\x05\xc2\xe1\x15\
+\x2d\x87\x88\xc3\x23\x2c\x5c\x6c\x33\xf0\x55\xe3\x4c\x8c\x70\xff\
+\x00\x8e\x2e\xef\x70\xe8\x9d\x21\x69\xc2\x0f\x2e\x6e\x54\xdd\x53\
+\xfa\xa6\xb8\xdd\x46\xc0\x06\xae\xa2\xca\x9d\xb7\xa6\x1e\x88\x3b\
+\x49\x23\xd4\x2f\xb4\x50\x88\xb5\x16\xfe\x73\x95\xf6\x25\xed\x6d\
+\x03\xe1\xe9\x25\xaf\xe3\x82\xab\xec\xd3\x84\xc3\x7f\xaf\x55\x09\
+\xb0\xfa\xf3\x53\x3c\x86\x9b\x2a\xa7\x18\x69\x24\xb7\xe7\x19\xba\
+\x31\xda\xa1\xf8\xc3\xdd\x94\xe3\xc9\x82\xed\x00\xe3\xaa\x79\x32\
+\xb8\xb8\x81\x74\xd8\x9e\x7f\x20\x50\xca\x04\xd6\xf3\x55\x0e\x07\
+\x3d\x56\xaf\x44\x4d\xfc\x10\xc2\x7c\xb6\x69\x44\xeb\x57\xb1\x51\
+\xce\x1a\x2c\x8c\x8d\x76\x53\x4b\x50\x6b\x6c\xa4\x60\x3b\x27\x46\
+\x46\x53\x94\xb7\xd0\x6d\xe4\xb8\x6b\x9e\x2b\xe9\xef\x7e\xf0\x55\
+\xe2\xec\xa5\x3f\xd3\xfb\x05\x26\xe9\x9d\xcf\xaf\x15\x37\x54\x72\
+\xe2\xad\x62\xa3\x76\x00\xf3\x1f\x35\x4d\xff\x00\x96\xf7\x0f\x92\
+\x3d\xe5\xf6\x86\x97\x9b\x15\xc0\x5f\x65\x63\x7c\x31\xf9\x58\xaa\
+\xd7\xdd\xc5\x33\x0d\xba\x89\xd8\x4f\x72\xe2\xd5\x0d\x6c\x05\xbe\
+\x49\xa0\x3e\xee\xf3\x55\x0d\xff\x00\x2f\xee\x51\x80\x1c\x49\x54\
+\xed\x63\x85\xd0\x8e\xd2\x6a\x17\x5a\x75\x36\xe5\x11\x62\x83\x05\
+\xaf\xd5\x16\xb9\x49\x1b\xb4\x9f\x04\xc6\xe9\x1d\x53\x81\x2e\x01\
+\x32\x06\x9c\x92\xe5\x20\xd0\x3b\x24\x95\x09\x77\x55\x70\x19\x72\
+\x9d\x33\x81\xc5\x8a\x7b\x9e\xe8\x8e\x02\x0d\x73\xba\x26\xd3\x82\
+\x72\xa9\x04\x6d\xac\x8d\xee\xc1\x69\x16\x5a\xcd\x55\x2b\x24\xe9\
+\x1b\x7a\x79\xa9\x1b\x94\xde\xef\xd7\x8a\x91\x80\x8c\xa9\xbf\x0c\
+\x92\xdd\xd4\x4d\xe6\xf7\xbf\x44\xc6\x58\x80\xa9\xa4\x77\x2b\x45\
+\xb0\xa6\x25\xbf\x1f\xdd\x71\x36\x03\x48\x0f\x5b\x2e\x09\x71\x4e\
+\xe2\x40\x05\x55\x64\xa6\x5f\x65\x13\x05\xbe\xbc\xd3\xe3\x6f\x8a\
+\xfb\x49\x2f\x25\x9d\x83\x73\xe0\x57\x0c\x91\xd2\xc6\x75\x80\x3d\
+\x14\xf3\x3b\x46\x8b\x0b\x21\x62\xfd\x2e\xc3\x49\xc9\xea\xa3\x91\
+\xb1\x8b\x31\xd7\xf5\x50\x45\xad\x08\xac\x2d\x65\x33\x2c\x54\x76\
+\xea\x9a\x1a\x7e\xbd\x54\xb1\x37\x94\xe4\xee\xce\x14\x51\xeb\x78\
+\x4f\x1a\x16\x8d\x68\x47\xa5\x48\xe3\xa0\xb4\x28\xa2\xbe\x4a\xec\
+\xdb\x4a\x21\xa1\x07\xb4\x15\x56\xc7\xc4\xe1\x30\xb8\x17\x5f\x67\
+\x6b\x1b\x53\xc3\x4c\x64\xf6\xb4\x81\x6f\x7a\xa8\x65\x8a\x66\xf6\
+\x4e\x6f\x65\x4e\xcb\x9b\x28\xfb\x36\x50\x47\xa9\xc0\xa8\x59\xa5\
+\x8a\x61\x79\x2d\xf5\xd5\x48\xde\x73\x39\x67\x2a\x08\xfd\x9d\x85\
+\x8a\x43\x72\xa3\x6f\xd7\xc5\x30\x58\x27\x3b\xb5\xee\x3f\x25\xc7\
+\xa7\xe6\xd4\x18\xef\xd5\x52\x33\x95\x61\xe2\xa5\x17\x55\x0c\x21\
+\x8e\x23\x75\x0e\xa5\x4c\xfb\x0c\x0f\xac\xae\x64\x84\xda\xc1\x54\
+\xc8\xf0\xeb\x10\x98\x41\x6d\xc7\x79\x35\xcf\x6f\xd1\x52\xd4\x4d\
+\xcb\x36\x68\xbf\xa2\x02\x79\x7b\xcd\xb7\xa2\x82\x12\xcb\x13\xd1\
+\x49\x1b\x5f\xe2\xa9\xe2\x67\x35\xa0\x93\xa4\xdd\x4f\x1c\x63\xba\
+\x4a\x10\xdc\xdd\x77\x02\x6e\x97\x48\x2e\x4a\x95\xc0\x1c\x14\xe2\
+\x34\x92\x0e\x53\xa6\xe7\xc7\xca\x78\x16\xf1\x1b\xaf\xb3\x32\xf2\
+\x6a\xe3\xa6\x07\xb0\xed\x57\xbf\xa1\x21\x54\xeb\x32\x5a\xdd\x94\
+\x40\x66\x42\x07\x53\x72\xaa\x23\xb5\xdc\x10\x27\x56\xca\x8d\xd7\
+\x2d\x0b\x59\x6b\x6c\x13\xdd\xf8\x80\xfd\x75\x51\x9d\x26\xea\x47\
+\x97\x0b\xf8\x27\x38\xdd\x43\xe0\xaf\xd1\x4f\xd8\x63\xa4\x1b\x86\
+\x9b\x78\x6c\x54\xa3\xda\xaa\xe6\x7b\xf7\x69\x3b\x6d\xd5\x52\xbd\
+\xd2\x3c\xeb\xb0\x0c\xf0\xfd\xd4\xf3\x06\x9c\x28\x8b\x2a\x1e\x23\
+\x76\xc7\xc1\x4e\xd6\xc0\xee\xc7\xea\xa9\xe0\x2d\x19\x45\xcd\x6a\
+\xa9\x01\xf9\x09\x84\xb1\xd9\xd9\x73\x87\xd7\xbf\xfb\x28\xe4\x69\
+\x78\x07\x65\x1f\x27\x4d\xf0\xa5\xa8\x8f\xb8\x2d\x75\x7b\xab\x16\
+\xe4\x27\xc8\x6f\x94\xd9\x1a\x18\xa4\x90\x3b\x64\x1a\x75\x5d\x4f\
+\x7b\xa1\x7b\x1b\xa0\xeb\x2a\x1a\xef\x64\xa9\x8e\x62\x70\xdc\x7c\
+\x70\xa9\xe5\x6d\x4d\x20\x9b\xc4\x5d\x0e\xd0\x71\xf0\x41\xfd\x14\
+\xb1\xea\x8d\xc5\x39\x96\x2a\x8f\xf8\x8d\x47\x64\xfe\xf8\xfa\xf1\
+\x4d\xe8\x9d\xdd\x28\xee\xa2\xc7\xd7\xaa\xd5\xea\xab\x24\xd3\x4f\
+\x21\xfe\x92\xa0\x9c\x1a\x8a\x8f\x53\xfb\xa8\x1e\x34\xcd\x6d\xee\
+\xaa\x24\x75\xf7\x54\xb3\x16\xcc\xd7\x7a\xa9\x1f\xcc\x2a\x66\x32\
+\x2b\xe8\x2a\x57\x64\xdd\x62\xc8\xbb\x53\xf4\x74\x29\xf7\x6a\x8e\
+\xf7\xbe\x53\xeb\xa7\x8f\xb2\xd0\x3d\xea\x19\xe5\x7c\xcd\x73\x94\
+\x72\x03\xba\x69\x6b\xbb\x2a\x48\x19\xe2\x53\xd8\x00\x20\x12\x9a\
+\x2c\x9d\x20\x6b\x4d\xad\x74\xf7\x6b\xde\xca\x4e\xe1\xd3\xba\x2e\
+\x78\xdc\x22\x79\xbd\x82\x48\x17\x07\x1b\xe3\x2b\xec\xef\x16\x73\
+\x9a\xda\x29\x74\x88\xf6\xd5\xf9\x94\xb0\xf2\x5b\x78\xbb\x4c\x76\
+\xe4\xe5\x5e\xce\x4c\x21\xec\xd3\xe2\xa6\x8c\x03\x8b\xaa\x41\xf8\
+\xad\xf7\xa7\x38\xd9\x13\x77\x26\x34\x27\x1e\x89\xc6\xc5\x46\xf2\
+\x9b\x90\xb8\xe4\xc6\x1e\x1f\x3b\x9b\xbd\x86\xfe\x6b\x9c\xf8\x65\
+\x7b\x9b\xf9\xce\x6e\xa0\x97\x4b\x1c\x4f\xe6\xdd\x4a\x75\xe5\x47\
+\x23\x84\xc1\xa4\x0d\x3e\x29\xb2\x9b\xe2\xcb\xda\x39\xad\xbd\xd3\
+\x9d\xaa\x5d\x1e\x2b\x94\xeb\x7d\x79\xae\x59\x13\x0f\x7a\x95\xb9\
+\x51\xb7\xeb\xe2\xa5\x8e\xe5\x45\x4f\xd4\x27\x17\x31\xd6\x50\xbc\
+\xda\xe5\x3e\x6f\xaf\x8a\x12\xf6\xb2\x9c\xf0\x76\x4e\xd4\xe5\xcb\
+\x7f\xd7\xbf\xfb\x26\x46\x75\x76\xb6\x53\x44\x0e\xc9\x90\x91\x20\
+\x3e\xaa\x27\x49\x49\x2b\x64\x18\x17\x5c\x1e\xbd\x9c\x42\x93\x95\
+\x7b\xc8\x40\xfd\x14\xd4\xae\x69\x51\x82\xd2\x13\xd9\xa9\x53\xe2\
+\x76\x0f\x54\xfd\x97\xe6\xfa\xf0\x4c\xd9\x3f\x74\xfd\xd4\x7f\x5f\
+\xaa\xd9\xab\x8e\xbf\x55\x0c\xe3\xfd\x3f\x35\x3b\x57\x3c\xf7\x02\
+\xa7\x05\xcc\xb9\x53\x58\x3e\xc3\x75\x4a\xd2\x72\x54\x2d\x68\x66\
+\xe5\x5c\x36\xa1\xa5\x31\xed\x70\xcd\x94\xc0\x0b\xb8\x6e\xa4\x73\
+\x89\xd9\x45\x73\xd1\x08\x1c\xee\x89\xb0\xc8\xc1\x70\xdf\x8a\x9e\
+\x08\xf4\xea\x71\x21\xde\x1d\x14\x34\xd2\xc9\x11\xd0\xdb\x85\x34\
+\x45\x86\xcf\xc1\x4d\xa5\x73\xfb\x42\xf6\x5c\x87\xb4\xe6\xe9\xb0\
+\xf6\x6f\x6c\xa2\xd7\x83\xdd\xfd\x13\x62\xd5\xbe\x3d\x13\xe0\x60\
+\x1b\x95\x3b\x8b\x3b\xa0\x6e\x3e\x6a\x58\xe3\x92\x90\x17\x61\xd6\
+\xe8\xb8\x1f\x14\x7f\x0e\x9d\xae\x69\x07\x49\x22\xcf\xdb\xc1\x50\
+\x54\xc7\xc4\xa3\xd4\xfb\x07\x5b\x66\xaa\x88\x65\x89\xf8\x6f\xe1\
+\xf8\xf5\xf8\xa6\x34\x16\xe5\x34\xe9\xaa\x6f\x86\x53\xdf\xe0\xaf\
+\x94\xcd\x94\x89\xd7\x25\x42\xd1\xf5\xef\x56\xd5\x70\x76\x5f\x68\
+\x27\x31\xc5\x24\x78\xb1\xf8\xee\xa6\x78\x3f\x5e\xa9\x91\xb4\xcc\
+\xdb\x92\x98\xf6\xc6\xcb\x04\xf3\x79\x81\xeb\xe0\xa9\x9f\x61\x95\
+\xed\x1a\x46\xe9\xd3\x76\xb5\x2a\x7a\x9b\x8d\xd0\x7e\xb7\x5b\xc5\
+\x48\xcc\xaa\x58\xfb\x41\x46\xd6\x37\x75\x2c\x91\x08\xce\xca\xa5\
+\xa5\xf6\x23\x65\xc2\x9d\x03\x29\x4e\xbb\x5e\xdd\x57\x18\x78\x7d\
+\x47\xe1\xed\xab\xa2\xe1\xac\x61\xa7\xce\xea\x58\x18\x4e\x02\x8e\
+\x97\xc9\x4b\x03\x41\x45\x8d\x0c\x55\x12\x59\x5b\x5b\xd7\x34\xbf\
+\xf0\x94\xd0\xc9\x13\xc5\xb0\xb8\x27\x1d\x34\x8e\x6b\x1e\xec\x60\
+\x1b\x95\x0f\x15\xa7\xae\xa7\xd0\xd2\x0b\xdc\x05\xbc\x51\x1a\x45\
+\x94\xbd\x93\xaf\xc1\x44\x75\x8b\xaf\xce\x3e\xbe\xb6\x4c\x44\x5d\
+\xd6\x52\x32\xce\x51\x26\x0b\x82\x7c\x97\xda\x59\x3f\x11\xcc\xf3\
+\x4e\x63\x8a\x64\x4e\x0f\xba\x73\x9c\x13\x19\x67\x6b\x28\x4c\x2f\
+\x61\xf5\xba\xa9\xd7\x18\xbd\x93\x47\x36\x07\x1f\xcf\xd2\xde\xaa\
+\x9a\x37\x01\x95\xac\x45\xda\xea\x13\x25\x12\x9c\xaa\x46\x8d\x6d\
+\x52\xb5\xa0\x6e\x55\x51\xd3\x1b\x8b\x49\xbf\x9f\xaa\x8e\xaa\x57\
+\x37\x49\x6b\x7e\x09\xb2\xbc\x30\xb6\xf6\x05\x3a\x36\xbd\xd7\x24\
+\x95\x0b\x9b\x14\x77\x05\x7b\x5f\x6b\xa2\x65\x5f\x63\x00\x27\x48\
+\xe9\x3c\x10\x61\x38\x3b\x2a\x9a\x46\x93\xb9\x4c\xa3\x6b\x7b\x57\
+\x2b\xd9\x59\x0c\x9c\xc0\x49\x37\xeb\xb2\x9c\x73\x1b\xad\xc0\x5c\
+\x0e\x8a\xa2\x3b\x49\x70\x48\x37\xe8\xb8\x2f\x12\x9e\x96\x68\xc8\
+\x21\xd6\xe8\xed\x95\x35\x41\xa9\x88\x3d\xd6\x06\xdd\x14\xec\x06\
+\x17\xfb\xbe\x6a\x95\x96\x6a\x73\x7f\x11\x46\x7e\xbe\x2a\x28\x5a\
+\xe7\x8b\x92\xa5\xa6\x67\x89\x5c\xab\x6d\x75\x1d\xc3\x5c\x0f\x82\
+\xfb\x48\x1a\x27\x73\xca\x32\x66\xc0\x04\x2f\xa3\x55\xb2\x13\xcb\
+\xef\xb7\xd6\x53\xdc\xfe\x4b\x85\x82\x60\x79\x72\xae\xa7\x0e\x8b\
+\xfb\x2a\x66\x68\xbd\xf6\x4d\x73\x6d\x84\xf0\x64\x76\x81\xb9\x51\
+\xc0\xe6\x7d\x7d\x78\xa8\x24\xd2\xe0\xa6\xa8\xdf\xeb\xc5\x4b\x3e\
+\xab\x83\xb2\x64\x80\x27\x54\x0d\x09\xb2\xf5\xfa\xf9\xa7\x55\x9b\
+\x16\xdd\x32\x57\x17\x6e\xa1\x24\xb5\x09\x03\x77\x42\xa5\x9b\x62\
+\xe9\xee\x6b\x94\x93\x06\xdc\x29\x67\x17\x46\x60\xe8\xc8\x52\x33\
+\x56\x54\x6e\xe5\x10\x7c\x17\x07\xa8\xd5\x4e\xdf\x44\x06\xb8\xc8\
+\xf4\x50\xc5\x66\x29\x05\xa4\xfa\xf3\x51\xfd\x7e\xaa\x33\x62\x89\
+\xd4\x98\xc1\xab\x29\xf6\xbb\x80\x5f\x6a\x29\xdd\xa6\x47\xdb\xaa\
+\x8e\x33\xba\x6c\x82\xfa\x2e\x9f\x6b\xa7\xdb\x94\xe5\x0b\x1b\xba\
+\x91\xe5\xed\xd3\x8b\x23\x0e\x08\xe8\x73\x74\x4b\x98\x74\xb7\x23\
+\xcd\x50\x41\x1b\xa4\x63\xe4\x24\x6e\xaa\xa4\x0c\x71\x0c\xca\xa7\
+\x83\x99\xda\xcd\xd5\x54\x25\x97\xdd\x4a\xe7\x5e\xc1\x3f\x54\x6c\
+\xba\x6b\xc3\xa1\x73\xaf\xda\x1f\x05\x1b\xcd\x94\x8e\x70\x3a\x80\
+\x54\x63\x5e\x5d\xfa\x20\xe8\xd8\xcc\x1f\x8a\x7b\x9a\xee\xa8\x34\
+\x07\x6a\x0e\x3f\x14\xe9\x9e\x31\x61\x64\xe8\x9a\xf6\x93\x73\x75\
+\x50\xc7\x07\x62\xe9\xac\xb4\x7a\x8d\xf0\x86\x93\x6b\xfe\xca\x58\
+\x98\x58\x74\x93\x7c\x7c\xd7\x00\x24\xc6\xd6\x95\x19\x20\x86\xf4\
+\x2a\x3e\xea\x92\x26\x97\xdc\xdd\x61\xa6\xc1\x30\x02\x3c\xd6\xc8\
+\x3c\xdd\x6c\x49\x5c\x7a\x8d\xb5\x34\x73\x11\x7d\x78\xb5\x94\x8d\
+\xe5\x38\xc6\xe1\x64\xe0\xf6\xd4\x34\x8e\xee\x56\x8d\x59\x37\x44\
+\xfe\x43\xdd\x51\xe3\x0c\x42\x2b\x29\x40\x11\x9f\x15\x15\x2f\x33\
+\xb4\x9c\xd3\x10\x20\x6e\x84\x6e\x7b\xee\x55\x3b\x44\x51\xea\x3d\
+\x15\x6c\xad\x70\x36\x5f\xf1\x87\xbd\x56\xdb\x95\x85\x05\xf4\x1f\
+\x05\x19\xcd\x97\x2a\xec\xba\x86\x2d\x23\x08\x89\x09\xb6\x55\x9e\
+\xdd\xd4\x0e\xd5\x2b\x5b\xe2\xa4\x87\xaa\x32\x69\x75\x8a\x93\x4b\
+\x8a\x76\x58\x5a\x16\x87\x0f\x14\xdb\xea\x17\x5c\x22\xa4\x32\xcd\
+\x54\xee\x0f\x68\x2a\x3e\xef\xd7\x89\x52\xa6\x42\x5d\x94\xd6\xb9\
+\xae\x4e\x5b\x22\xe4\xd6\xb6\x52\x58\xed\x88\x3e\x9b\x2f\xb4\x14\
+\x9a\x2a\xdd\xa3\x6b\xae\xc5\xb4\xfe\x6f\xd5\x06\xe1\x4e\xdd\xec\
+\xa8\xc5\x88\xd4\xae\xe7\xf4\x46\x98\x3c\x76\xae\x02\x66\x98\x45\
+\x9b\x9f\x55\x89\x24\x1a\xb6\x5c\xa8\x9b\x91\xba\xac\xad\x7b\x61\
+\x7b\x19\xa7\xa2\xe7\x3d\xe3\xb4\x8b\xda\x1d\x92\xa6\x2f\x94\x59\
+\xa2\xed\x50\x80\xc1\xa1\xdd\x54\x56\x74\xb6\x55\x33\x98\x22\xec\
+\x58\x9c\x6e\xa9\x65\x0e\x83\x5b\xb0\x6d\xee\x50\x4e\xd7\xcc\x03\
+\xb6\xca\xac\x95\xc0\x91\x10\x0a\x90\x54\x89\x9b\x23\x83\x74\x84\
+\x23\x74\xb1\xdf\x0a\xa2\x9e\x7e\x76\x07\x67\x2b\x91\x37\x87\xcd\
+\x32\x9d\xc1\xc0\x9f\x82\x34\xe0\x84\xe8\x80\x76\x3c\xd7\x09\x61\
+\x7d\x40\x6b\x8d\x9b\x7e\x8a\x2f\xc0\xd0\xc6\x64\x11\xd5\x45\x29\
+\xb7\x45\xde\x78\x05\x47\x8c\x59\x3d\xa2\xd7\x4e\x47\x64\xd8\x18\
+\xe6\xdc\x92\x88\xe5\xca\x00\xdb\xc5\x7d\xaa\xa5\x30\xc4\x6a\x21\
+\x1a\x9c\x73\xda\xc8\x54\x9a\x27\x0e\x96\x62\x5b\x2b\x4e\x1a\x36\
+\xdf\xaa\xd6\x02\x6b\x59\x23\xc6\xa2\xa4\x91\x90\xba\xc1\x45\x10\
+\x02\xe5\x54\x54\x35\xa0\xb0\x6e\x8d\x47\x6a\xc8\x0f\xc2\x2f\x4e\
+\x91\xda\x53\xc9\x7c\x96\x3b\x15\xc8\xc6\x14\xf4\x92\x1b\xd9\x53\
+\x01\x14\x76\x93\x75\x31\xd5\x35\xdb\xb6\x55\x24\x2e\x74\x97\x55\
+\x6c\x3a\x80\x5a\x8b\x61\xb0\xf0\x5c\x3a\x17\x3e\x40\xe3\xb7\x8a\
+\xaa\x81\xfa\xfb\x00\x95\x0c\x55\x84\x5b\x96\xe0\xdf\x1b\x2a\x2a\
+\x79\xf4\xd8\xb4\xfe\xaa\x4e\x17\x2b\xb3\xa3\xf4\x4f\xe1\x33\x06\
+\xdf\x41\xf8\x27\x52\x4a\xc9\xac\xe6\x90\x33\x74\xf8\x2c\xd2\x8c\
+\x7f\x8a\x02\xa6\x83\x90\x44\x8a\x8f\xf1\x62\xd7\xe0\x84\x96\xc2\
+\xa7\xed\x48\xd5\x6b\x27\x3b\x16\x4e\x4e\xd9\x36\x5c\x59\x48\x2e\
+\x2e\xab\xa9\x5b\x59\x4a\x58\x45\xcd\x95\x7f\x09\x96\x8a\xa0\xb8\
+\x02\x19\x72\x9c\xd7\x26\x35\xda\xd5\x45\x3c\x8f\xd9\x54\xd5\xf2\
+\x81\x6b\x6c\x9a\x24\x9e\x60\x4f\x77\x2b\xfc\x3d\xd7\xd4\x2f\x65\
+\x34\x9c\x8a\x67\x0c\x5f\x1f\x34\xd9\x4c\x8d\xd8\x22\xcb\x3b\x59\
+\x50\x86\xb8\x27\xc4\x01\xb8\x0a\x7a\x66\xbf\x72\x47\xa2\x74\x2c\
+\x8c\x6a\xb9\x36\x54\xd0\xb1\xb1\xf3\x18\x09\x36\xea\x8d\x2c\xf5\
+\x6f\xec\xb3\x3d\x30\x55\x3f\x01\xa8\x9a\xc2\x46\xb8\x0f\x25\x43\
+\xf6\x6d\x8c\x01\xaf\x2f\x0d\x3b\x9d\x88\x4c\xfb\x3b\x42\xc3\x7d\
+\x72\x3b\xd4\x85\xec\x14\xcd\x88\xb0\x31\xbe\xb6\xca\x8e\x08\xa2\
+\xd9\xad\xfd\x16\xb6\x81\xdc\x67\xc1\x73\x18\xe1\x62\xc6\x5b\xd1\
+\x4b\xc2\xe9\xaa\x3c\x43\x8f\x85\x95\x47\x00\x88\x34\xd8\xbd\x54\
+\xf0\x57\xc4\xfd\x6d\xd4\x6c\x54\x34\x6f\x95\xa1\x92\x02\xd0\x3c\
+\x30\xa9\xe0\x65\x3d\x39\x63\x49\xcd\xb7\x45\x80\xaa\x77\xe8\x78\
+\x46\x50\x56\xfb\x6e\xa5\x33\xb4\xe0\x34\x85\xcc\x6b\x86\x92\x7b\
+\x7e\x49\xad\x1e\x68\x81\xa5\x47\xd9\x5c\x4f\x86\xc1\x59\x0c\x9a\
+\xee\x0d\xb7\x6f\x92\xa9\x85\xb1\x55\x3a\x11\xdd\x06\xd9\xdd\x54\
+\xc4\x29\x9b\xcc\x6e\x6d\xe2\x85\x55\x43\x8e\x23\x65\xbd\x0a\x1a\
+\xea\xdd\xa8\x6c\xb1\x14\x04\x0f\xe2\x62\xde\x28\xf1\x3e\x5b\x74\
+\x91\x94\xfa\x89\xaa\x66\xb6\x74\x1f\x82\x86\x12\x06\x54\xa0\x38\
+\x69\x1b\xa8\xdc\x63\x39\x4d\x90\x3d\xbe\x68\x53\x73\x7a\x6e\x99\
+\xc0\xcc\xc4\x34\x83\x62\x55\x37\xd9\xf8\xe3\x84\x6a\xb2\xa4\xe1\
+\x14\xd0\x33\x9d\xa5\xa4\xb7\xd3\xd1\x37\x94\xdd\x9a\xd5\xcf\x04\
+\x69\xb5\xae\xb5\x7a\x27\x3b\x0a\xe9\xe7\xb2\x53\x75\x20\xe7\x33\
+\xb4\x2f\x84\xfa\xc7\xec\x42\xd6\xd7\x9e\xd8\xc7\x54\x44\x5f\x96\
+\xc9\xdf\xa7\xde\xf9\xcb\x37\x4d\xac\x92\x57\x88\xa0\xb9\x90\xec\
+\x06\x4e\x37\xc6\x2f\x61\xe6\x8c\xb5\x11\xe2\x50\x7d\xe0\x83\xef\
+\x17\x3f\x32\x36\xf4\x4d\x1a\x9e\x25\x1d\x13\x5d\xf5\xfd\xd5\xd3\
+\x54\xa3\x54\x6f\x1e\x45\x57\x8f\xfc\x48\x8f\xea\x55\x94\xbc\xca\
+\x7f\x70\x4d\xe5\x41\x87\x6e\xa9\xa3\x6d\x24\x00\xb7\xb5\x8f\xcc\
+\xa2\x70\x96\x5d\x4e\xe9\x7c\x0d\xb6\x55\x4d\x92\x5a\x9d\x21\xa3\
+\x4d\xfa\x78\x28\x69\x69\xa1\x83\x56\x79\x96\xeb\x65\x24\xd6\x1d\
+\x90\x14\x52\xb8\xce\x35\xf7\x73\x75\x53\x38\xd7\x66\xf8\xaa\x76\
+\xbc\xb7\x53\x72\xe5\xc3\x20\x7b\xed\xcc\x6a\x8a\x9e\x36\xb4\x78\
+\xa7\x76\x9b\xa6\xf6\x1e\x48\x0d\x2d\x2d\x0e\x24\x78\x13\xf7\x6c\
+\xae\xae\x89\x5a\xd0\x92\xdd\x17\x3a\xd9\xc2\x92\x4d\x59\xb3\x7d\
+\xc9\xd2\x12\x0b\x6c\x07\x9f\x54\xc1\xe6\x53\x06\xac\x15\x27\x63\
+\x64\xc2\x5c\x76\x55\xa5\xe2\xf8\x5c\x02\xa2\x3a\x4e\x2b\x1d\x54\
+\xa0\x3f\x94\xd2\x79\x7b\xb1\xdd\x9d\x26\xe3\x72\x73\x7c\x75\xd4\
+\xb8\xc7\x18\x86\xb2\x7d\x11\x31\x8c\x73\x88\x16\x02\xd6\xd5\xe3\
+\xf1\xda\xca\x9f\x56\x8d\x5d\x10\x25\x02\x53\x4a\xef\x07\x0f\xe9\
+\x3f\x25\xc5\x35\x37\x8a\x9b\x0f\xce\xa5\x90\xb2\x9b\x55\x86\xc3\
+\x75\x5d\x47\x14\x91\x73\xc3\x9f\xaf\x7b\x0d\x95\x5b\xb9\x50\xd9\
+\x51\xc8\x5c\xed\xf7\x50\xb1\x86\x43\xa8\x0b\xaa\xc1\x27\x34\x06\
+\xf7\x53\x21\x71\xdd\x1a\x32\xe6\xf6\x47\x69\x45\xc2\x25\x7c\x97\
+\x20\xae\x1d\xc2\x0b\x34\x97\x0c\x79\xa8\x69\x59\x18\xc0\x5a\xac\
+\xe0\x15\xd5\xfe\xe7\xe0\x2d\x5e\xab\x52\x2e\x40\xdd\xc9\xd8\x4f\
+\x97\x0b\x5d\xd1\x4d\xe8\xa2\xdc\x29\x05\xca\x89\x9a\x7b\x45\x55\
+\x42\x24\x04\x84\x69\x2f\x25\xb2\x3a\x87\x07\x69\x20\x8d\xb3\x63\
+\xfd\xef\x6b\x11\xd6\x3e\x1a\xd6\x3f\x99\xa8\xbc\xe5\xc2\xe7\x3a\
+\xac\x72\x48\xf0\x76\x7a\x5f\xaa\x85\xc5\xbf\x85\xf5\x84\xd6\xa7\
+\x0b\x35\x35\xdf\x5f\xdd\x30\xe4\x8f\x23\xf2\x5c\x4a\x2d\x5c\x4d\
+\xdf\xea\x55\xcd\xb5\x19\xb7\x92\xa5\x63\xaa\x07\x2c\xae\x27\x59\
+\x58\xe9\x4c\x31\xb5\x85\xb7\xb6\xd9\x54\x11\xd5\x32\x46\x17\x34\
+\x69\x3b\xe1\x1a\x29\x03\x79\xd1\xdc\xbb\x7b\x1d\x94\x14\x26\x78\
+\x4b\x9e\x2d\x28\xd8\x74\x5f\xe1\xd2\x35\xb7\xb6\x53\xcd\x54\x0e\
+\xbb\x63\x63\xad\xe2\x17\x08\x8c\xd4\x34\x3a\x56\x35\xa7\xc8\x59\
+\x3a\xcd\xb3\x1a\x05\x8f\xc5\x03\x64\x46\x75\x78\x20\x6e\xad\x6c\
+\xab\xa7\x9c\x7d\xc5\x5e\xe9\xa2\xc5\x4a\xf2\xb4\x07\x0c\xad\x20\
+\x26\x9d\x46\xc5\x06\xb4\x28\xfb\xc0\x23\x18\x2b\x4e\x34\xf8\xad\
+\x03\x4f\x55\x3c\x3a\x9d\x61\x71\xe6\x37\x50\x53\x91\x8b\x93\xea\
+\x9b\x44\xd2\x43\xb3\x75\xec\xfa\x54\x8d\x1a\x4a\xb5\x93\x5c\x41\
+\xfd\x3e\x2b\x8e\x44\x29\xab\x58\xf6\x64\xbd\xd9\xba\xe2\x52\x68\
+\x81\x80\xf7\x5e\x32\xa9\x6a\x61\xa5\xfc\x46\x1b\x9f\xea\x54\x7a\
+\xea\x27\xd4\xe6\xf5\x4e\xc9\x6c\x4c\x6f\x6b\xa7\xb9\x53\xd5\x96\
+\x9e\x4b\xc6\x76\xb2\x9a\x79\x69\x9b\xcc\x68\xc2\x7f\x1c\x99\xce\
+\xd2\x1a\x7e\x0b\x87\x09\x6a\xe5\x67\x31\x9d\x83\xb9\xb2\xa6\x63\
+\x21\x6d\x85\x93\x85\xdd\x7f\xb8\xec\x9a\x8e\xdf\x71\x5a\x7d\x11\
+\x6e\x3a\x2d\x3e\x8b\x4d\xbc\x14\x9b\xa6\xf7\x7e\xbc\x51\xdd\x03\
+\x63\x74\xd7\xdd\x33\x04\x14\xd3\x74\x1a\x9c\x50\x88\x1c\x94\xc0\
+\xd0\xa2\x7b\x43\x85\xd4\xce\x69\x18\x52\x0b\xdd\x69\xf4\x41\xb9\
+\xe8\xbe\xd1\xb7\xfc\xd4\x3e\xab\x8b\x47\xaa\x08\x87\x92\x9a\x9d\
+\xad\x8f\xbc\xa9\x78\x6c\x70\xe5\xa0\xfb\xd4\x70\x86\x55\x32\x7b\
+\x77\x6f\x83\xb6\x45\x93\xa9\x21\xe7\x73\xee\x75\x5e\xf6\xe8\xaa\
+\x27\xe6\x42\x63\x73\x5b\x6b\x74\xdf\x0a\x8a\x9c\x4d\x55\xa5\xcd\
+\x1a\x6f\xe1\x95\x4f\x0b\x61\x0c\x8d\x8c\x6d\x88\xef\x75\x0b\x96\
+\x3c\x4a\xd8\x5b\xef\xb5\x90\xc9\xb1\x4e\x68\x1b\x2b\x9f\xb9\xdb\
+\x15\x75\x74\xe6\x82\xb6\xc2\x28\xa6\x58\x28\x88\x73\x83\x4e\xc8\
+\x35\xad\xd8\xad\x67\x6b\x04\x72\x8b\xc8\x65\xb0\x98\x6f\xbe\x16\
+\x91\x6b\xdc\xa9\xa6\x73\x36\xca\x75\x44\x9a\x4e\x02\x89\xfa\xc6\
+\x51\x3a\x57\x17\xe1\xf1\x54\x06\xd4\x12\xed\x4d\xc8\x03\x65\x5a\
+\x5f\x24\x7d\xac\x08\xf0\x08\x52\x34\x3c\x69\x73\x8f\xb8\xaf\x69\
+\x60\xf0\x4f\x99\xa5\x84\x8d\xd7\x36\xe9\xdd\xa6\xd8\x75\x54\x34\
+\x1c\xa0\x26\x23\xcd\x43\x67\x47\x7f\x0f\xbe\xde\x5f\xa2\x23\x1b\
+\x7d\xdb\x20\x6e\xb4\x27\x61\x17\x74\xfb\xce\xc9\xfd\x53\x9c\x9c\
+\xe4\xd9\x3e\xbe\x8a\x8a\x5b\x38\x26\xcb\x75\x75\xab\xd5\x5e\xe8\
+\x1b\x29\x26\xb3\x0a\x74\x9a\x8a\xd1\x76\x14\x1d\xa4\xfb\xaf\xf0\
+\xc9\x5a\xee\x15\x5b\xc0\xa7\xcf\x82\xab\x7b\x5f\x0c\xad\x1b\x93\
+\xfb\xa9\x18\x42\x74\x0d\x27\xbc\xe5\xa5\x8d\xef\x13\xa5\x30\xd0\
+\xfe\x69\x1f\x7f\x55\x4b\x15\x3c\xd3\x35\xad\x73\x88\x29\xa0\x72\
+\xf9\x5d\x07\x5e\xaa\x26\xf2\xc6\x91\x73\x7f\x1f\xbe\xe8\x9b\xab\
+\x20\xd0\x4d\x8a\xd0\xd1\xd5\x6b\xb2\x7b\xae\x8f\x8a\xba\x05\x1d\
+\x93\xfa\xa7\x84\x73\x85\x60\x13\x49\xb8\x4d\x91\xcd\x4c\xa9\x24\
+\xd9\xd6\xb2\xe6\x0e\x8b\x98\xe1\x94\xc7\x07\x0c\xa9\xbb\xa4\x26\
+\xb2\xe7\x09\x9a\xad\xa6\xd8\x4f\x8c\x97\x62\xfb\xa8\x29\xc3\x88\
+\xe6\x12\x1b\x92\x4f\x9f\xfb\xae\x2f\x20\x8d\x8e\x8e\x33\x71\xe6\
+\x9c\x5c\xdb\x93\xb2\x3c\xb7\x8c\xfe\x89\xd2\x20\xed\x67\x49\xea\
+\x8f\x0e\x92\x59\x01\x69\xc5\xd7\x0d\xa0\xe4\x06\xbc\xf7\x82\x6a\
+\x1b\xff\x00\xee\x1d\x96\xaf\x54\x1f\x94\xe9\x17\x33\x28\xb9\x6a\
+\xbf\xdc\x37\x47\x64\xee\xa9\xfb\xa7\x9b\x5d\x34\xea\x4c\x66\x53\
+\x85\x93\x9c\x7a\x28\xe5\x23\x75\xcf\x05\xb6\xea\x85\x45\xb1\x75\
+\xaf\x5b\x4a\x61\x0d\xdd\x1a\x86\x69\xb7\x55\xcf\x6b\x72\x6c\xa5\
+\xe2\x6c\x0d\x73\x1a\x7b\x4a\xaa\x73\x2d\xc9\x52\x69\x20\x82\x84\
+\x51\x5b\x70\x9d\x75\x0b\x4b\xe5\x0d\xda\xff\x00\x15\x41\x00\x16\
+\xea\x83\x00\xf7\x2b\x59\x03\x95\x75\x75\x74\x4d\xd1\xb2\xd4\x9c\
+\xe5\xab\x28\xb8\xa1\xbf\xdc\xd1\x72\x9c\xd0\xa5\x36\x04\x85\x87\
+\x0b\x9d\xd3\xdb\x73\x6e\x8a\xe5\x87\x1f\xaa\x6c\xae\x02\xf8\xc2\
+\x07\x98\x33\x8f\x44\xf6\x5b\x21\x36\x3b\x8b\xba\xe3\xd1\x48\x79\
+\x79\x6e\x76\xdd\x4c\x6d\x18\x91\xbd\xef\x05\x49\x23\xdf\x19\x71\
+\x02\xfe\x1e\xf5\xa3\x53\x49\x37\x0a\x69\x8c\x4e\xc2\xf6\xa6\x3d\
+\xbd\xa3\x6f\x45\x21\x80\x3f\x58\x91\xc4\xf4\x04\xe1\x13\xad\xb8\
+\x53\x45\x23\xae\x07\xe8\x8c\x72\xb7\xa9\x5e\xc2\x4f\x45\x07\x0f\
+\x2c\x95\xae\x21\x53\xc1\xa4\x2b\xe6\xdf\x70\xdf\xee\x3b\x2d\x5e\
+\xab\x52\x2e\x45\xdf\x5d\x13\x8a\x07\xb5\xf7\x0d\xfe\xe6\xee\x14\
+\x8e\x4e\x37\xc2\x7b\xb4\xe1\x06\xdc\xdd\x48\xdc\xad\x36\x8c\xa8\
+\xb6\x1f\x5e\x28\x5b\x56\x54\xaf\x03\x65\xcb\x2e\xcf\x44\xd7\x73\
+\x1f\xca\x50\xc7\xc9\x20\x78\xa7\xbb\x16\x0a\x6a\x7d\x44\x97\x6d\
+\xd5\x4b\x0b\x76\x05\x3e\x8c\x9e\xd0\x3b\x28\xa2\x2c\x17\x76\xcb\
+\x99\x18\x75\xb0\x9e\xe8\x9d\xb5\x94\x44\x9d\xc0\x4c\x60\x36\xc2\
+\xee\x8b\x04\xe2\x46\x46\xe9\xaf\x71\x4d\x08\x8b\x22\x6e\x88\xb2\
+\xb8\x4f\x77\x82\x0f\x24\xd9\x1b\x2b\xd8\xdf\xaa\x0f\x25\x5c\x2d\
+\x5e\x8b\x5d\xbc\x11\x71\x28\x34\x6a\x4f\xa6\x6b\x85\xee\x55\xb4\
+\xbb\x48\x46\x3b\xf8\xa2\xcc\x5b\x28\x34\x35\xb8\x4e\x90\x87\x5b\
+\xd5\x77\x8e\x54\xb2\x18\xe1\x71\x60\x04\xe2\xd7\xf8\x2a\x6a\x70\
+\x3f\x1d\xd7\xd4\x73\x6e\x88\x16\xc8\x35\xbb\x1a\x7c\x11\x74\x4d\
+\xdc\x95\x55\x34\x4e\x85\xcd\x61\xed\x1b\x22\x26\x74\x96\x1b\x5d\
+\x70\xce\x16\x27\xd3\xcc\xd5\x6b\x74\x5c\x46\x85\xb0\x92\xd6\x5e\
+\xde\x6a\x7a\x06\x08\xdd\x36\xa7\xdc\x79\xe1\x01\x6d\xae\x9b\x15\
+\x93\x05\x93\x91\xd9\x46\xdf\xaf\x8a\xb6\x13\x90\xdd\x49\x80\x9d\
+\x2d\x91\x9a\xe9\xae\xed\x27\x39\x03\x72\x89\xb2\x12\x66\xca\xe8\
+\x1f\xb8\x6e\x80\xd4\xd4\xe8\xfb\x6b\x95\xf5\xf4\x13\xd9\x66\x92\
+\x8f\x75\x3f\xbf\xf1\x57\xd2\x98\x79\x8e\x0d\xf1\x4f\x68\x6c\x58\
+\x54\xd0\xea\x61\xd5\xb7\x55\x35\x3b\x0e\xc5\x32\x92\xf2\x0c\xdd\
+\x52\xf0\xc6\xb9\xc0\x96\xfe\x8a\x96\x26\x45\x66\xd9\x71\x66\x36\
+\xee\x2a\xa0\x6b\x8d\xf1\x8e\xab\x91\xa7\x70\xa3\x11\x3e\x1d\x77\
+\xed\x26\x5c\x9f\x24\xe0\x88\x50\xb0\x1f\xaf\x54\x5a\x00\xb2\x70\
+\x09\xdd\x91\x70\xa4\x79\x72\x7b\x46\x55\xac\x9a\xfe\xd2\x73\x90\
+\x71\xd4\x13\xa5\x75\xed\x84\x05\x9b\xab\xaa\x69\x25\x06\xdb\x37\
+\xfb\x9a\x2e\x6c\x83\x8b\x46\x10\x7d\xdc\xa4\x99\xcd\xd8\x05\xcc\
+\x2f\x69\x07\x09\xde\x01\x72\xc1\x7d\xcd\xd4\xee\x2d\x7e\x96\xec\
+\xa9\x60\x69\x02\x42\x48\x23\xe0\x88\x0e\x16\x28\x39\xc2\x33\x1b\
+\x2d\x9e\xbd\x54\x9e\xd2\x0f\x64\x28\xdf\x55\x13\xb9\xae\x68\xd2\
+\xdd\xd4\x7c\x72\x58\xcd\xb4\x47\x6f\x45\x4f\xc5\xf9\x8f\x1a\xb4\
+\x83\x6f\xd9\x71\x5e\x25\x54\xe7\x91\x13\x18\x5b\xe8\x53\x1b\x2b\
+\xe3\x32\x0b\x73\xba\x03\xdd\x4d\xa4\xab\x94\x76\xc4\x63\xd2\xea\
+\x0a\xe2\xd8\xc0\x25\x51\xbc\x49\x01\x72\x72\x7f\x75\x40\xec\x7d\
+\x79\xa7\x39\x39\xc9\xe7\x09\xdd\x54\x9b\x14\xe7\x7d\x7f\x64\xd7\
+\x76\x93\x9d\xf5\xfd\x93\x0f\x6c\x27\x77\x82\x1f\xc3\xfa\xf3\x4c\
+\xdd\x7e\x5f\xaf\x1f\xb9\x9d\xe0\x8e\xc8\xe0\xa2\xdd\x59\x4e\x76\
+\x9c\x2b\xdd\x3b\xb2\xdd\x5e\x08\xb7\x5b\xd4\x6d\xd3\x1a\xba\xe6\
+\x16\x76\x93\xeb\x08\x39\x09\xb5\x2c\x99\xbc\xb3\x61\xab\xaa\x34\
+\x91\x9c\x82\x13\xe2\xe5\x65\x87\x21\x45\xa0\xb7\xb7\xbf\x9a\xb7\
+\x32\x40\xc8\xce\x9b\xaf\x63\xa8\xb6\x25\xff\x00\xd4\xbb\x7a\xc3\
+\x6d\x61\xfa\xae\x1c\x74\xc1\x61\xd5\x38\xa7\x1b\x84\xc9\x4b\x36\
+\xb2\xe7\x12\x7a\x21\x67\x66\xea\x4c\x6c\xa4\x90\x84\xfe\xd3\x0f\
+\x8a\x20\xf5\x45\xda\x72\x37\xf3\x4d\x79\x76\xe9\x8c\x17\x05\x38\
+\x66\xe8\x48\xee\xee\x2c\x9a\xe2\x83\xfa\x1d\x91\x73\x42\x6c\xa0\
+\x14\xda\xb2\xe9\x34\x1b\x59\x4a\x40\x18\xc9\x2a\x67\x3e\x22\xc6\
+\x80\x3b\x5b\xdd\x55\x48\x19\x57\x04\x38\xd3\x25\xf5\x78\xe0\x5d\
+\x16\x90\x2e\xcd\x95\x4d\x60\x0c\x2c\x6d\xb9\x9d\x02\x85\xae\xe5\
+\x87\x9d\xff\x00\x45\x1b\xf5\x46\xeb\xe1\x17\x80\x6d\x75\x1f\x2c\
+\xee\x7f\x55\x52\x59\xab\x09\xad\x6e\x8d\x57\x20\xa6\xce\xe6\x8b\
+\x5d\x35\xed\x73\xae\xe3\xea\x9e\xe8\x2f\x97\x11\xe8\x42\x8d\xb4\
+\xc7\xbb\x23\xc3\xbd\x53\x9c\xe6\x61\xb2\xbc\xfb\xd0\x84\x3d\xf7\
+\x01\x52\xc4\xe6\x37\xc9\x39\x3f\xba\xb5\x7a\x20\xec\xf4\x4c\x76\
+\x13\x8f\x69\x54\x1b\x28\x9f\x90\x0a\x98\x02\x9e\xc2\x32\xa3\xfa\
+\xfd\x50\xd9\x6f\x7d\xbd\x3e\xae\xb4\x75\x41\xa9\xcd\xb3\x70\x9d\
+\xa9\x76\xbe\x6a\x37\x3b\x9f\xef\x53\x4c\x63\x01\xe7\x61\x65\x3d\
+\x43\x64\xe4\xd9\x71\x47\xbb\xfc\x46\x90\x0f\x3f\x92\x8d\xe0\x40\
+\x6f\xbd\x94\x8f\x7f\xf8\xa4\x77\xfe\x1d\xcd\xfc\x13\x1e\xc3\x06\
+\x13\x7f\x84\xeb\x29\x8b\x81\x5c\xe7\x35\xa4\xa0\x5d\x21\x5c\xb7\
+\x08\xc8\xf4\x4d\x80\x96\xdd\x34\x7e\x3b\x5a\x70\x3a\xa9\x63\x69\
+\x38\x77\xea\x99\x19\x67\x68\x1d\x90\x90\xea\xca\xa6\x2d\xb8\xdd\
+\x45\x20\x2d\xd2\x9c\x53\xcd\xc1\x08\xe1\x6b\xb2\x8e\xa1\xdb\x63\
+\xea\xeb\x57\xe6\x55\x04\xb8\xa0\xcd\x23\x57\x54\x2e\xed\xd4\xd0\
+\xb7\x94\x6d\xba\x00\xb4\xd9\x0e\xea\x63\x7a\xa2\xf7\x0c\x26\xbd\
+\x6a\x24\x2b\x1e\xab\x4b\x49\xf7\x20\xf7\xb6\xaa\xd6\x16\xba\xe2\
+\x8f\x3e\xcc\xeb\x79\x1f\x82\xe1\x6e\xf6\xba\x4e\x73\xcd\x9d\x1e\
+\xc0\x6d\xba\xad\x96\x63\xc5\xe8\x7b\x22\xc7\x5f\x4f\x25\x50\xe2\
+\xd8\x6e\xdd\xed\xb2\x7c\x01\xd0\x3e\xa1\xc2\xd2\x34\x8b\x7c\x55\
+\x34\xb3\x3a\x30\xd0\x2e\xa9\xc3\x79\x44\x3f\xbc\xab\xda\x18\xcd\
+\x51\xe4\xf9\xa6\x3e\xa2\x50\x40\x68\xf8\x28\x05\x40\x70\x05\x81\
+\x72\x89\x8a\xe4\x76\x91\x7b\x98\xdb\x58\x29\x72\xed\x5b\x7a\x28\
+\xb4\x3d\xf6\x73\x8a\x74\x8d\x8e\x41\x1d\xee\xd3\xd4\xee\x89\x24\
+\xf6\x76\x4d\xa3\x89\xbd\x53\x63\x8d\xbb\x1c\xa7\x75\x52\x62\xe9\
+\xce\x52\x3a\xc1\x47\x27\xd7\xc7\xcd\x73\x30\x88\xd4\x17\x5b\x28\
+\xdb\xf5\xf1\x4e\x65\xd8\x42\x92\x2b\x14\x07\x65\x31\xb8\x52\x8b\
+\x5d\x35\xdf\x5f\xdd\x46\xe1\xa9\x3a\xce\xd9\x72\x88\x3a\xba\x2a\
+\xaa\x7e\x5f\xe2\x59\x4e\xce\x7d\x14\xbe\x20\x2e\x08\xdd\x14\x52\
+\x34\xf8\xfe\xea\xae\x06\xfb\x5d\x14\x96\xc8\xd7\xf2\x4e\x9d\xb2\
+\x3f\x96\xa6\x8c\x18\x8c\x23\xf3\x8b\xfc\x32\xb8\x7d\x44\x71\xcd\
+\xc9\x7d\xbc\x15\x44\x9f\x8e\xc6\xb7\x62\xa6\x66\xa8\xf2\xb8\x75\
+\x23\x37\x21\x36\x8e\x2d\xc0\x0b\x94\xde\xea\xad\xec\xbf\x48\x51\
+\xd0\xba\x56\x13\x6e\x8a\x48\x1f\x14\xe4\x67\x75\x25\x2c\x8f\x20\
+\x84\xc0\x22\x6d\x9d\xbf\x9a\xe6\x39\xc6\xd7\x2a\x18\xb6\x7e\xa7\
+\x7a\x5f\x09\xe1\x4a\x30\x51\x60\x3e\x2a\x58\xc6\x83\xba\x8e\x10\
+\x7c\x53\x85\xb0\x99\x6d\x2b\x40\x32\x0f\x7a\xb9\x07\x01\x33\x2d\
+\xca\x95\x81\x1c\x26\x38\xd9\x4a\x6f\xba\x11\x9e\x89\xb0\x9e\xb8\
+\x4c\x8c\x0b\x27\x0b\xb0\x8b\x78\x2e\x20\x5d\xca\xd3\x6c\x2a\x46\
+\x93\x03\xd8\x46\x1d\xbf\x8a\x86\x16\xd3\xc6\x63\x65\xf4\xb8\xdf\
+\x2a\xb2\x43\xa1\xb2\xf5\x8b\x0d\x1f\xea\xde\xe8\xc5\x23\x07\xb4\
+\xb3\x27\x7c\xec\xa1\xe2\x93\x19\xdb\x76\xb3\x50\xb8\xb7\x4d\x94\
+\x30\xc8\xea\xb3\x39\xc1\x37\x16\xb0\x2d\xc8\xb7\x51\x83\xe0\x77\
+\x07\x21\x08\xce\xa6\x4a\xfe\xeb\x46\xfe\xe5\x24\xb1\x9a\x07\x4c\
+\x0f\x6d\xbb\x78\x6f\x65\x07\x10\x96\x31\x10\xb0\xd2\xfb\xea\xf1\
+\xc7\x82\xa7\xe2\x0c\x23\x25\x45\x3c\x12\x4a\x06\xae\x87\x6f\x45\
+\x3c\xad\x92\xb4\xb0\x9e\xc8\x2a\x5e\x2e\x68\x5c\xd8\xa3\x6b\x1c\
+\xc2\x32\x5c\x32\x9d\x53\x0c\xef\xe6\x3b\x07\xc9\x4d\xc4\x19\x0b\
+\x2e\xd0\xd2\x47\x8a\x8e\x56\x56\x1b\xbf\x17\xfe\x54\xd6\xf6\x93\
+\x07\x61\x3f\x75\x2e\xc7\xee\x78\xbb\x4a\x8a\x3c\x27\xb1\x13\x6c\
+\x6c\x9b\xe2\x9b\x1d\xd3\x45\x8d\x94\x8d\x4f\x6a\x63\x70\xa5\x6a\
+\xa7\x8c\x5a\xe5\x3e\x46\xdf\x40\xdd\x37\xa2\x6f\x9a\xaf\xd3\xcb\
+\xfa\xfa\xfd\x95\x28\x1c\xa7\x5a\xc9\xcd\x55\xac\xd5\x03\x80\xf1\
+\x1f\x35\x13\x23\xf6\x2b\x3b\x7d\x2a\x5a\x67\xb2\xa7\x9c\xc0\x6c\
+\x0f\xcd\x4b\x2c\x94\xf1\x89\x08\x21\x53\xd5\xba\xab\x87\xcb\x6d\
+\xec\x99\x1c\x9f\xe1\x66\xe7\xbc\x35\x5b\x6d\x36\x95\xcd\xb6\xf9\
+\xee\xdf\x1e\x2a\x96\x87\x99\x0d\x35\xfc\x1c\xa4\xa6\x6c\x3d\x54\
+\x6f\x6c\x72\x6b\x2e\xdb\x1b\xf8\xa2\xc8\xb5\x99\x6e\x15\x5b\x63\
+\x94\xdc\x3b\x21\x45\x03\x6d\xba\xad\xa7\xbc\x4e\xd2\x6e\x71\xf3\
+\x54\x50\x48\xd6\xdf\x29\x84\x5d\x73\x48\x65\xb0\xb5\x6a\xca\x95\
+\xdb\x8f\xbd\x8f\xb7\x82\x26\xe1\x3e\x31\xba\x65\xee\x1b\xd1\x44\
+\xc1\xa5\x1c\x3c\x7b\xd3\x9a\x0a\x78\x1a\xad\xf5\xf5\x84\x0d\x94\
+\xb6\x0d\x2e\x2a\x07\xc4\xe6\x5a\xf9\x55\xc4\xd3\xfe\x3b\x33\xa4\
+\x8d\xf6\xb1\x28\xca\x5f\x0c\x72\x52\xd9\xee\x3d\xf0\x73\x6b\xfa\
+\x29\x1f\x38\x87\x5c\x6d\x05\xc2\xda\x91\x1e\xd1\x76\x4b\x82\x1b\
+\x7c\x7a\x5d\x70\x97\xc9\x31\xab\x63\xf0\xd8\x48\xd3\xfa\xee\x88\
+\x1f\x83\xff\x00\xdc\xd7\x7f\xf9\x55\x74\xef\x8e\x97\x98\x00\xef\
+\x5b\xcb\xbd\x64\xd6\x87\x50\xb6\x5b\x9b\x91\xb0\xd9\x41\x04\x52\
+\xd2\xc8\xf3\xb8\xb7\xcd\x71\x16\xc7\x25\x13\xc9\x00\x16\x0c\x59\
+\x70\x3e\x23\xfe\x56\x78\xec\xcd\x41\xcd\x68\xf7\xba\xca\xb2\x16\
+\x53\xd0\x46\x23\xcf\x32\xc5\xd7\xf5\xba\xa5\x94\xb6\x9e\x20\x40\
+\x16\x18\x55\xf5\x06\xe6\xc5\x37\x5c\xdd\x9b\x9b\x1f\x0d\xd4\x81\
+\xed\x1a\x03\x9d\x6f\x5c\xa6\x43\xe2\xe7\x7c\x53\x5b\x6e\xe9\x28\
+\x44\xe7\x3b\xc5\x01\x50\xd6\x59\xac\x6f\xc1\x07\x96\x6e\x99\x54\
+\x1c\x74\x5f\x27\xf6\x4d\x38\x52\xbb\x2b\x57\xaa\xd4\x9a\xe5\xa9\
+\x5b\x52\x0c\xb1\xba\x8f\xbb\xf5\xe2\x51\xef\x8f\x7a\x3b\x27\xf7\
+\xc7\xd7\x8f\xdd\x52\xc7\x49\x13\x9a\xdd\xca\x8d\xef\x80\xd8\xa9\
+\xc0\xaa\xa6\x7c\x63\xbc\xe1\xef\xc2\xe0\x95\x82\x82\x49\x29\xea\
+\xbf\x36\x1a\x0f\xbf\xc5\x52\xc9\x17\x2e\x56\xbe\xdf\x89\x62\xdf\
+\x76\x54\x6c\xe7\x57\xc8\xc6\xed\xa4\xff\x00\xd2\xa9\x26\x6d\x2c\
+\x9c\x42\x23\xb9\x23\xf7\x42\xb8\x6b\xa5\x17\xe9\x2f\xee\xaa\xc8\
+\x9b\x87\x79\x97\xff\x00\xde\xa4\xfc\x2e\x18\xd2\x7f\x95\x70\xda\
+\xe0\xf8\xe4\x8e\xfb\xdf\xf4\xba\x7b\xcc\xd4\xf5\x0c\xf2\x3f\xba\
+\xe1\xb3\x3e\x9e\xb5\xf1\x1e\xe9\x93\xf7\x53\x56\x09\xa2\xa7\x65\
+\xfe\xb0\xaa\x2a\x04\x22\x26\x03\xb8\xfd\x95\x5d\x5d\xe4\xb2\xe1\
+\xcc\xd5\x67\x2a\x90\xd6\x9e\x9d\x7f\x5c\x7d\x1e\x9d\x2c\x56\x08\
+\xb0\xdd\x46\xc2\x37\xfd\x51\x70\x63\x2e\x37\x0a\x3a\xc3\xb1\x0a\
+\x50\x1e\xdc\x2a\x56\xda\xb2\x3e\x61\x22\x3b\xd8\x9f\x5d\x93\x5a\
+\xc1\x53\x3d\x3c\x86\xda\x5a\x0c\x3f\xd5\x76\xea\xca\x63\x4b\xd8\
+\x5f\x2e\x1e\x0b\x85\x87\xae\x11\x6c\x97\xec\x8c\x2d\x11\xf2\xc9\
+\xb9\xe6\x74\x09\xa1\x35\x80\x90\x10\x88\x05\xa5\x0d\x6d\x16\xb2\
+\x0d\x25\xd7\x72\x7d\x80\xc2\x2f\x06\x50\x15\x82\x07\x4e\x6d\xf1\
+\x52\xc0\x27\x37\x38\x3e\x4a\x08\x1d\x03\x83\x87\x6a\xd7\xdd\x7d\
+\xa1\x8f\x9b\x33\x66\xa5\x24\x4e\xc3\x7d\x3f\x90\x95\xc3\xb8\xb4\
+\x8f\xe5\xc5\x59\xa5\x93\xb7\x0d\x11\xe0\x1f\x1b\xdf\xc9\x43\x3d\
+\x3d\x2b\x85\x5c\x2e\xd4\x1f\x87\xea\xb5\xb2\x2c\xb8\xc9\x34\xdc\
+\x45\x92\x33\xb9\x58\x4d\xef\xe5\xe0\xa5\xe1\xd1\x47\x49\x15\x5b\
+\x5e\xf2\xf8\xc3\x88\x17\xec\xf6\xb7\x54\xd5\x7a\xe1\xe5\xc9\x60\
+\xc6\xbc\x7a\xe5\xcb\x8d\x56\x43\x17\x0f\x74\x6d\x37\x20\x46\x07\
+\xfc\xf6\xba\x8d\x94\xf4\x5d\xb6\x39\xee\xb8\x17\x04\xf5\x70\xff\
+\x00\x75\x15\x2d\x48\x0e\x31\xe8\x0d\x94\x7e\x7d\xd7\x17\x81\xdc\
+\x36\xb9\x80\x03\xcd\x95\xff\x00\xf2\xef\x95\x45\x1c\x52\x98\x35\
+\x38\xf7\x6f\x6f\x3b\x5d\x47\x14\x95\xd5\x32\x73\xbb\x31\xd3\xf7\
+\x0b\x7a\x82\x3a\xae\x2e\x0c\x75\xb1\xb2\x8b\xf1\x19\xab\xf1\x0b\
+\xb2\x42\xa1\x6d\x37\x22\x21\x03\xcb\xa5\x70\xed\x82\x45\x81\xc6\
+\x15\x4d\x03\x9c\xc2\xe3\xd3\xc1\x72\xdd\x13\xb5\x6e\x02\x89\xe5\
+\xee\x3a\x9b\x6f\x44\xfb\x87\x80\x32\xde\xb7\x50\x42\x65\x7e\xd8\
+\x4d\xbe\xc5\x55\x53\x13\x4e\xe7\xc7\xde\x69\x6b\xbd\xcd\x37\x3f\
+\xa0\x52\xd6\x7b\x4c\xd4\xbc\x42\x33\xf8\x63\xb1\x21\x1b\x5c\x76\
+\x32\xaa\x34\xb8\xbb\x46\xce\x0d\xb7\xee\xa2\x0c\xe5\xf6\xad\x7b\
+\x27\x35\xc6\xa9\xb6\xee\xe6\xeb\x45\xbe\xbf\xd9\x45\x99\x00\x5a\
+\x7d\x10\x16\x37\x36\x5a\x9a\x9c\x41\x18\xdd\x3a\x22\x63\x27\xc9\
+\x39\xc5\xb5\x6d\x07\xcd\x34\xdd\x16\xf6\x54\x60\x0d\xd3\x39\x6e\
+\xec\xf8\xaf\xb5\x34\x73\x52\x37\xda\x29\x46\xa2\x7c\x2e\x6d\xf0\
+\xca\xe1\x4c\xf6\xa8\x5f\x51\x31\xd3\x52\xc0\x74\x30\xef\x9b\x8d\
+\x93\xa6\x9e\x1e\x1b\xc8\x71\x3c\xc7\x48\x2d\xe3\xdf\xfe\xcb\xed\
+\x19\xff\x00\x29\xc2\x25\xfc\xd1\x87\x6b\xf7\xd9\x7f\x13\x83\x03\
+\xfd\x09\x92\x76\xdd\x1d\xed\x79\x5b\xff\x00\x5a\xe2\xf6\x7f\x14\
+\x6d\x16\xae\xf7\x27\x1f\xf2\x82\xa7\xa5\x64\x53\x54\x5c\x6b\x10\
+\xb6\x13\xa7\x7e\x88\xba\xab\x89\x16\xba\x8d\xda\x19\x0f\x78\x03\
+\x6f\x97\xa2\xe3\x73\xb2\xa2\xa2\x30\xe6\x6a\x92\x0b\x87\x3f\xc0\
+\xf9\x9f\x72\xe0\x73\x9a\x81\xcc\x07\x0d\xc7\xeb\x65\x5d\x51\x17\
+\x0f\xa2\x73\xce\x1d\x2b\x0f\xc4\x05\xf6\x62\xa1\xb5\xcf\xaf\x74\
+\xe6\xe4\x5f\x45\xfd\xfb\x2e\x13\x5f\x3d\x1d\x65\x4c\x92\x13\xcb\
+\x63\xc6\x9f\x0c\x95\x37\x12\xe7\x50\x07\xb4\x6e\xd5\xc2\x69\xdd\
+\x5c\x7b\x63\xb1\x7c\x95\x5f\xc3\x20\xa3\x87\x5e\x02\x6c\x70\xcd\
+\x49\x24\x8c\x20\xbc\x5b\x65\x46\xf6\x46\x74\xba\xd7\x5e\xcd\x20\
+\x6c\xaf\x94\x5b\x42\x82\xb9\x8f\xa6\xa9\xbf\x79\xa0\xb4\x75\xc3\
+\xae\xd2\x6d\x71\x90\x36\xdb\x3e\x0a\x8a\xa1\xd4\xb4\x33\xf0\xc0\
+\x35\x17\x4a\x1d\x09\x77\x7f\x32\x6a\x7f\xc1\x44\xe8\x8b\x62\x0c\
+\x71\x73\xb4\xe6\xfe\x36\x52\x35\xad\xa6\x96\x52\x48\x74\x63\x23\
+\xa5\xcf\x75\x52\x86\xc9\x47\x47\x3b\xbf\xf3\x13\x73\xb9\xad\xe8\
+\x03\x09\xd3\x6e\xbb\x29\x79\x6c\xa2\x74\xe4\xfe\x20\xd8\x74\xde\
+\xca\x17\xba\xf0\xc9\x61\x67\xea\xba\x8f\x43\xc6\xea\x60\x40\x36\
+\xf2\x55\x9a\xe9\xe1\xd6\xcc\xbb\xcf\x65\x40\xf9\xe7\x69\x91\xed\
+\x02\xde\x17\x45\xe4\x46\x41\xb2\x9c\x30\x54\x6b\x26\xd6\x28\x30\
+\xf2\xf5\xc7\x94\xd9\xa4\xd2\x75\x01\x74\xdc\x8f\x0f\x44\x1f\xa1\
+\xf7\x24\xdb\xeb\xfb\xa9\x24\x8a\x48\xcb\x5c\x1b\x25\xfa\x3f\x2a\
+\xba\x8a\x2a\x39\xbf\xc4\x1a\x5e\xc1\x19\xfe\x13\x71\x19\xd5\x8c\
+\x85\x13\xe9\xb8\x8c\xec\x64\xce\xd1\x38\xcb\x43\x2c\x23\xf1\xca\
+\xfb\x46\xd7\xfb\x29\xd1\x96\x40\xe8\xc3\xc9\xfe\xa7\x00\x34\xaa\
+\x3d\x52\xf0\x41\xa7\x3d\x84\x23\xbd\x61\x8c\x92\x09\x90\x1f\xff\
+\x00\x57\x5d\x38\x0a\xbf\xb5\x0d\x73\x9c\xed\x4d\x68\xb0\x1b\x5d\
+\x91\xe3\xe4\xb8\x45\x50\x96\xa3\x8b\xcd\x5a\x1b\xa9\x82\x26\x46\
+\xcb\x76\x5c\x08\xd3\x90\x54\x55\x75\x1c\x33\x88\x56\x45\x10\x1e\
+\xcd\x25\xb2\x6f\x80\x41\x38\xf8\xae\x28\xd8\x69\xf8\x25\x45\x64\
+\x43\x98\xfa\x82\x35\xbd\xf9\x2c\xed\xdb\xb2\x57\xd9\x99\xa9\xe9\
+\xe9\x27\x1a\x89\xd3\xcb\x39\xfe\xa3\x72\xbe\xd5\x71\x41\x34\x4e\
+\x89\x87\xf8\x20\x68\xb7\x5d\x5d\xeb\xfa\x2f\xb2\x76\x2c\xae\x34\
+\xe4\xba\x66\xf2\xf4\xb7\xa1\xd5\xbd\xd3\x38\x1d\x55\x67\xb5\x40\
+\xd6\x5a\x63\xcb\x7b\x2c\x0e\x40\xed\x3b\xf4\x55\x7c\x68\x51\x46\
+\xce\x1f\x10\x69\x95\x9d\x99\x35\xf4\xf4\x5f\x66\x66\x8e\x6a\x02\
+\x62\xd3\xcc\xb0\x2e\xf5\xf2\x5c\x56\x73\x5f\x34\x7c\x3a\xe5\xaf\
+\x21\xda\xed\xe0\x36\x23\xeb\xa1\x4c\xa9\x97\x85\x71\x29\xb8\x7c\
+\x87\xfc\xb9\xb7\x2d\xce\xef\x13\x6c\xdf\xde\x9a\x2a\xdd\x37\x34\
+\x34\x72\x6f\xba\x6d\x7b\x6a\x21\x9e\xfe\x1d\x7e\xbf\x5f\xff\x00\
+\x8b\x84\xc7\x0c\xce\x9d\x9a\x86\x4e\xde\x97\x55\x71\x53\xc7\xc5\
+\xe9\x65\x04\x72\xa2\xe6\x09\x7c\x2e\xe6\xd9\xb7\xf7\xaa\x0b\x30\
+\x97\x13\x7b\x92\x47\xa6\xea\xae\xaf\x5b\xe6\xa7\x6f\xff\x00\x34\
+\x58\x19\xff\x00\xe3\xef\x2a\x79\xf9\x75\xd2\xc3\xff\x00\x0e\x06\
+\x8b\x0f\x0d\x4c\xcf\xea\xaa\xcb\xa5\xa0\x79\x6f\x8f\xfd\xca\x20\
+\x05\x04\x3f\xcf\x9f\x9a\x8e\x62\xd2\x02\x32\xb5\xf1\xfc\x15\x7b\
+\xd8\x29\xc5\xfc\x15\x0c\xd1\x8a\x49\x2d\x6b\xff\x00\xbf\x96\x13\
+\xa4\xd4\xc5\xc4\x43\xfb\x45\xbe\x21\x52\x56\x32\x3a\x70\xd9\x0e\
+\x6c\x13\x1e\x25\xb9\x6e\xc8\x0b\x05\x36\xa7\x92\xc6\xee\xa3\x6b\
+\xda\x7b\x4a\xaa\x96\x2a\x8a\x59\x23\x7f\xe6\x1f\xaf\x45\x3d\x1c\
+\xf4\x35\x5c\x96\x38\x99\x89\xbb\x5f\x9c\x0d\xf7\xf4\x5c\x63\x88\
+\x4b\x2f\x0d\x92\x9e\xc4\x3d\x86\x3e\x63\xb6\xd4\x75\x02\x0d\xfc\
+\x97\xd9\xca\xe8\xcf\x0b\xe5\x3f\xf9\x17\x13\xaa\x14\xbc\x61\xaf\
+\xd9\x9a\x8f\xea\xa0\x89\xd0\x71\x18\xf8\x9b\xbf\x86\xe1\xbf\xba\
+\xca\xb2\x72\x27\x73\xa1\xc3\x6a\x0b\x49\xb7\xf4\xaa\x9d\x35\x1c\
+\xf6\xb2\xdc\xc0\xc6\xf5\x17\xee\xfd\x79\xad\x26\x6e\x0e\x38\x7c\
+\x9d\xe9\x5c\x6c\x0f\xf4\xbe\xe9\x94\x9e\xc7\x15\x50\xbd\xbf\x84\
+\xab\xd9\xcc\x92\x73\x7b\xf6\x07\xfd\x2b\xff\x00\x67\x74\xce\x8a\
+\xb5\xf2\x4d\x7e\x5c\xa5\xc7\x3f\xd1\x75\x27\x1d\x8e\x1a\x9e\x75\
+\x1b\x79\x92\x38\xf2\xc3\x5a\x2e\x5d\x7f\xc3\xc0\x19\x2b\xed\x65\
+\x35\x35\x39\xf6\xd8\x9c\xdf\x68\x94\x93\x23\x01\x07\x49\xeb\xb1\
+\x5c\x0b\x8e\x54\x70\xfa\x76\xb9\xb7\x2c\x73\x9b\xab\x7c\x0d\x4b\
+\xdb\xa0\x6f\x10\x77\x10\x6b\xae\x64\x8d\xba\x05\xee\x6e\x23\xb1\
+\x55\xfc\xce\x2a\xd9\x25\x65\xfd\xae\x17\x8c\x0d\xec\x5d\xf1\xd9\
+\x7f\x88\xb6\x9f\x85\x88\x1c\x3f\x18\x36\xde\x77\x52\x4c\xe8\xaa\
+\xbd\x96\x2c\xc3\x20\x3a\x9d\xf9\xbb\xb7\xdd\x70\xe9\x9b\x49\xc4\
+\x26\x60\x91\xde\x41\xc7\xc4\x67\xe0\xb8\xc0\x2e\x2f\x6d\x2b\xdc\
+\xf1\x33\x9a\x64\x71\x3d\xa6\x69\x37\xec\xdb\xc5\x32\xb5\xec\x64\
+\x6e\x66\x4b\x19\x67\x0f\x75\x97\x07\xd3\x5f\x34\x55\x32\x1f\xc4\
+\xa3\xe6\x68\x6b\x7b\xae\xd7\x7b\xeb\xf4\xe8\xa6\x91\xcd\x9a\xa6\
+\x6f\xcd\x23\x9a\x0f\x90\xbd\xb1\xee\x55\x04\x41\x45\x14\x50\xf6\
+\xc4\xb6\xd4\x4f\xaf\x45\xca\x77\x26\x1b\x74\x0e\xf8\xd9\x4f\x21\
+\x8a\x33\xae\xc2\x70\x70\xde\x9b\xf8\x6f\xb2\xa6\x9e\x17\xc6\xcb\
+\xb8\xea\xce\xb1\xe1\xe0\xb8\xe7\x15\x9d\x8c\xf6\x68\x03\x5d\x50\
+\x6e\x00\x39\xc1\xdf\xff\x00\x4a\xe1\x35\x1a\xa8\x9c\xd9\x1c\x19\
+\x50\x2d\xad\xa4\xd9\xb7\x37\xb6\x37\xe9\xf5\x74\x65\xa9\xa6\x8f\
+\x5c\xb1\x99\x21\xf1\x88\x5c\xd9\x4b\x5d\x4f\x39\xd5\xad\xb1\xc7\
+\xf9\x99\x21\x02\x4f\x70\x51\xd1\xd3\x56\x34\x72\xe7\xcf\xfa\x97\
+\xb3\x55\xd0\x31\xcf\x1a\x1f\x0b\x41\x27\x72\xe5\xc3\x78\xeb\x2a\
+\xa5\x92\x19\xc6\x9d\x38\x16\xc2\xa5\xa7\x8e\x46\xbe\xa4\x3c\x1d\
+\x16\xb0\xbf\x8a\xe2\xaf\x6c\x11\x89\x21\xb1\x3d\x6e\xbd\xb5\xef\
+\xa2\x7c\xa0\x02\xe0\x5a\x08\xe8\x01\x76\x92\x7f\x5c\x2e\x39\x0f\
+\x25\x94\xd3\x51\x3b\x9b\x31\xd3\xad\xe4\x00\xf6\x58\xde\xed\x73\
+\x00\xc8\xfe\x67\x76\xb6\xce\x15\x7d\x0c\x55\x91\xc6\x1b\xfc\x49\
+\x6e\xf9\x8b\x43\x72\xee\xf6\xc0\x69\xb5\xff\x00\x2d\xac\x36\xb0\
+\x54\xd3\xc9\x41\x29\xa7\x07\x1b\x67\x75\xf6\x82\x27\x4a\xf1\x28\
+\xbf\x7d\xa6\xfe\x60\x8c\x7c\xbe\x29\x91\x54\xd6\xf0\x68\xa3\xd0\
+\xd1\xa1\xa2\xce\x68\x37\xf7\xa6\x36\x58\xa1\xbc\x80\x6a\x8b\xbb\
+\x7e\xbe\xab\x87\x3b\x5d\x44\x92\xbc\xe5\xfb\x8e\x98\xc2\xaa\x94\
+\x33\x88\xd3\x01\xdc\x8c\xbb\xff\x00\x57\x8a\xe3\x8e\x64\x51\xdd\
+\x84\xfe\x3e\x9d\x57\xfe\x9b\x6c\x83\x63\x92\x46\xf3\x1c\xeb\x4a\
+\x3b\x5e\xe1\x85\xc2\x2a\x19\x0b\x9b\x4d\x15\xac\xcd\x6d\x0e\xfc\
+\xc7\x5d\xef\x7f\x8a\x89\xa7\x85\xd5\xb6\x56\xb9\xd2\x35\xad\x93\
+\xf8\x9b\x0b\xb4\xff\x00\x28\x1e\x26\xe7\x77\x12\x4b\xae\x49\xbe\
+\xb9\x38\x9d\x6c\xfc\xd9\x1f\xa0\x3b\xb2\xd0\x7b\x21\x31\xd2\x53\
+\xd1\x4d\x1b\x18\xd7\x37\x53\x05\xdc\x32\x3b\x5d\x15\x2c\x60\x4d\
+\x4d\x79\x1e\x5a\xd6\x93\x62\x6e\x32\xdb\xda\xdf\xa0\xf9\x8d\xd7\
+\x0a\x30\xc7\x59\x59\x59\x26\x91\xdc\xfc\x3b\x01\x1e\x1a\x5b\xfb\
+\xe7\x39\x39\x39\x02\xd5\xbc\x53\xda\x78\xef\x25\xa5\xbe\xc7\xae\
+\xc5\xc0\x5b\xa7\x4b\xf4\xbe\xd7\xb1\xb6\xe0\x1c\x0a\x59\xe9\x9e\
+\xc7\x4c\xe2\x35\x37\xc7\xcf\x6f\x88\x5c\x44\x36\x1a\xc8\xe7\x61\
+\xfe\x26\xaf\x92\xa0\xa9\x11\x09\xbd\xa3\x77\xf7\x75\x7b\xfc\x55\
+\x2b\x9c\x5d\x33\x0f\xe7\x04\xb3\xdd\x72\xbe\xcb\xd5\x11\x55\x51\
+\x11\x3b\x1f\xee\xa6\x94\x3a\xa9\xd0\x7f\x31\x27\xe1\x95\x47\xc4\
+\x44\xce\x31\xb8\xff\x00\x09\x49\xc6\xd9\xca\x7b\x23\x37\x7b\x2d\
+\x6f\x8e\x53\x2a\xa4\xe2\x3c\x51\xaf\xcf\x25\xbd\xef\x0d\x97\x3a\
+\x9a\x8e\x69\x63\x91\xe0\x73\x05\xe3\x17\xea\xd1\x75\x1c\xb0\xc9\
+\x33\xb8\x84\xc4\x6a\x69\xb3\x41\xf0\xdb\xe4\x9f\x5b\x4f\x4d\x5b\
+\x05\x4c\x4c\xe7\x32\x5b\x87\xb1\x84\x0d\x2f\xb5\xa2\x71\x25\xcd\
+\x6b\x00\x7d\x89\x73\x8d\x9a\xdb\x94\xd9\xa7\x96\xef\x92\xa1\x90\
+\xd3\xff\x00\xf4\x79\x97\xf9\x12\xd7\x7a\xb7\xb3\xe1\x84\xee\x08\
+\xce\x28\xfb\x41\xd8\x07\x79\x36\x1f\x15\x37\x06\xad\xe1\xdf\xc2\
+\x9c\x9b\x6d\x67\x1e\x89\xf5\xfc\x5a\x99\xae\x92\x70\xe9\x20\x68\
+\x21\xcd\xc9\xbe\x17\xd9\xa7\x51\x71\x13\x3f\x35\xac\x89\xe5\xda\
+\x81\x2d\x0d\x70\x24\x67\xb7\xbd\xb0\x2c\xd3\xa8\x0b\xb8\x8b\x1b\
+\xde\x1a\x69\xa9\x4c\xaf\x64\xfa\xa0\x19\xd3\x7d\xc6\x53\xea\x1d\
+\x55\x4f\x51\xaa\xe0\xc4\x0e\x0d\xee\x3d\xcb\x81\xcb\xed\x74\xb5\
+\xcc\x3f\x93\xf6\x25\x51\x71\x16\x03\x51\x0d\x49\xcb\x6e\x1b\xab\
+\xdf\xe2\xb8\x25\x5b\x5f\x5c\xe6\xc9\xdd\xed\x69\xbf\xa1\x5c\x57\
+\x3c\x44\xe8\xdb\x57\xd7\xcd\x71\x41\xfe\x5d\xda\x72\x6e\xd3\xf0\
+\x3f\x1d\x8f\x53\xe4\xb8\x1f\x13\x60\xa2\x11\x3b\x3d\x81\xf1\xb6\
+\x7e\x07\x0b\x89\x56\x13\x39\x8c\x02\x1a\xe2\x84\xde\xcf\x1e\xbf\
+\x24\xea\x81\x2b\xc4\xce\x38\x6b\x87\xce\xcb\x89\x88\xa6\x86\x9f\
+\x23\x6f\xec\xbd\x92\x37\x3a\x10\xd3\x9b\x1f\x92\xe1\xcc\x8e\x0a\
+\xce\xdb\xba\xf8\xae\x3f\x55\x4e\x69\x9e\x22\x70\x32\x5b\x1e\x2b\
+\x82\xd3\x1d\x33\x4c\xe5\x4d\xa2\xa2\x9e\xa5\x9b\x9c\x1f\x81\xba\
+\xa6\x9f\xb2\x5f\xfc\x98\xfd\x97\x10\xad\x75\x3c\x04\x34\xd9\xd3\
+\x8b\x28\x38\x74\xf0\xd1\xba\xa2\x40\x79\xae\x3a\x81\x3b\xdb\x55\
+\xfe\x4a\x8a\xba\x5e\xd5\x39\x73\xb4\x39\xc0\xdf\xae\x2f\xb1\xf0\
+\xfa\xe8\xaa\x64\x12\x08\x75\x13\x78\xaf\xa7\xce\xfe\x2a\xa7\xda\
+\x6a\xdc\xcd\x2d\x0d\x0d\xdb\x4d\xf3\xea\xa8\xee\xd7\xc7\x24\xfd\
+\x90\xc6\x3c\x63\xcd\xb6\xca\xa1\xad\x7d\x1f\x15\x93\x90\x03\x98\
+\xf7\xe4\xbb\x2a\xa2\x4e\x5c\xa2\xae\x3c\xcf\x63\xd9\x77\x73\xb4\
+\x2c\x71\xe8\xa8\xd8\x22\xe6\x4a\xe7\x1d\x72\x6e\x3a\x0f\x44\x1c\
+\xea\x5a\xa3\x20\x3a\x98\x75\x6a\xd4\x6e\x36\x23\x0b\x87\xd7\xbe\
+\x2d\x6c\x63\x59\x67\x1e\xf9\xe8\x72\xeb\x6a\xbd\x85\xec\x6c\x3a\
+\xdb\x19\x5c\x66\xa2\x7a\xbe\x25\x4e\x4b\xcb\x5b\x19\x77\x70\x91\
+\x7f\x55\x2c\x93\xbd\xad\xdc\x34\x62\xc2\xf6\x3e\xab\x86\x45\x04\
+\x10\xbe\x57\xc8\xf7\xc8\x48\xec\xbc\xe1\xb9\xe8\xa0\x86\x90\xc4\
+\x25\x0e\xe6\x3a\xc3\xb0\xec\xb6\xf6\x1e\x39\xbd\xf7\xe9\x7d\xb1\
+\x65\x1b\xa4\x6d\xe5\x6b\xdf\x13\x1b\xff\x00\x0e\x03\x60\x7d\xca\
+\x3a\xa9\x27\xa9\xd2\xf7\xc8\x1b\x7f\xce\x54\xf2\xc7\x04\x0e\xff\
+\x00\xcb\xcc\x34\x3b\xb0\xfe\xd1\x38\xf0\x5c\x1e\x8a\x1a\xe1\x55\
+\x51\xad\xf4\xef\x0e\xc3\x60\x3a\x5b\xb9\xe8\x85\x3c\xd4\x90\x38\
+\x53\xcd\x24\xfa\xfa\x48\xeb\x9c\xed\x66\xef\xab\xfd\x37\xb2\xa5\
+\xad\xab\x81\xf2\xd2\xbe\x36\xbe\x19\x35\x82\x3b\xaf\x1a\xaf\xdd\
+\x7d\x8f\x5e\xd6\x6e\x3c\xb2\x57\x07\x90\x70\xda\xd3\x4b\x7f\xc2\
+\xab\xd5\xcc\x73\xf7\x06\xc4\x8b\x1e\x82\xe7\xe0\xb8\xa3\x66\x6d\
+\x7b\xa4\x66\x21\x73\xb7\x1e\x09\xb3\x7b\x2b\x7d\xaa\x03\x77\xb3\
+\xf2\x9b\xe7\x50\xb7\xe9\xf1\xc8\xb5\xf3\x68\xc8\x9d\xc6\x79\x3b\
+\xe7\x36\xe8\xab\xe7\x25\xd6\xb0\x21\x50\xcc\x58\xcb\x8c\x5c\x6c\
+\x9c\xe7\x54\xd6\xc6\xc7\x01\x63\xa8\x92\x37\xb8\xe8\x3e\x79\x55\
+\x52\x38\x9e\x41\xc3\x46\x2f\xd5\x4d\x16\x98\x1f\x0c\x7a\x8b\x9f\
+\xa7\x4e\x76\x21\xc0\xf8\x1b\x8b\x5c\x5b\x19\x20\xdf\x16\x3c\x89\
+\xa5\x81\x9a\xcb\xbb\x00\x74\xb6\x6c\x2f\xd4\xe0\x1b\xd8\xf5\x19\
+\xb3\x6f\x61\x4c\xf3\xcd\x63\x9e\x7f\x86\xd7\x5b\xe0\x55\x37\xf9\
+\x9a\x99\xde\xe7\x90\x5a\x4e\x9d\x26\xd7\xdd\x69\x92\x69\x5c\x64\
+\x73\xbb\x06\xcd\x1d\x08\x38\xca\x0c\xf6\x5a\x13\xcb\x17\x2f\x19\
+\xba\xe1\xcd\x74\x54\xf3\xca\xcb\x99\x0d\xfb\x27\x23\x3e\x5f\x56\
+\xf3\x46\x6a\x88\x1a\xe8\x9a\x1b\xdb\x37\x37\xf5\xbf\xcd\x43\x4f\
+\x53\xc4\xe6\xa6\x15\x0d\xd3\x1c\x44\x9b\xb3\xaf\x5c\xfc\x15\x65\
+\x44\x7c\xb1\x0b\xc3\x5a\x1a\xdd\x38\xc7\x4b\x2a\x3e\x0f\x1f\x33\
+\xa2\xe2\xd4\x9c\xa8\xcf\x2f\xbf\x8b\x5b\xaa\xa1\x7b\x9a\xdb\xc8\
+\xdc\x9c\x9c\x01\x9d\xf6\x16\x03\x7c\x58\x01\xd0\x2a\x89\x5e\xf7\
+\x68\x18\x69\x54\xd0\x41\x0c\x9c\xc7\x91\x7b\xaa\xa7\xb3\x96\x65\
+\x6e\xec\xc5\xbf\x44\x66\xa8\x7f\x70\x78\x6e\x74\xb7\x26\xd9\x71\
+\xb3\x5a\x33\x97\x38\x80\x3a\x90\xa6\xac\x7d\xcc\x27\xbd\xaa\xd7\
+\x1b\x63\xa8\x3d\x7e\x1f\x35\x4e\xc9\x1a\xc0\xfc\x9e\xc9\xf1\x36\
+\x02\xee\x3e\xe1\x92\x7d\xe5\x52\xd2\x0a\x9a\x86\x3d\xc3\xb3\x73\
+\x9b\x60\x91\x6b\x8b\xf9\x5c\x5f\xd7\xcc\x29\x69\xa9\x22\x82\xc4\
+\xb6\xf6\x46\x16\x3a\x37\xe8\x3d\x95\x1d\x74\xcc\x22\x28\xb5\x3c\
+\xf8\x01\xd7\x3b\x58\x9b\xe2\xc6\xf8\xf0\xb6\x2e\x6a\xb8\xbf\x15\
+\x84\x69\x82\x27\x39\xe7\x66\x96\x92\x3e\xb7\xc5\x95\x13\xb8\xa4\
+\xac\x13\x55\xc2\x63\xf1\x20\x11\xf3\x51\xb6\x09\x75\x11\x33\xdd\
+\x2e\x87\xd9\x9a\xb1\xdd\x37\xc2\xe0\x12\x98\x61\xab\x07\xf9\xff\
+\x00\xee\x2a\x96\x56\x3e\x26\x17\x6d\x67\x5d\x4c\x62\x92\xb1\xce\
+\x3d\xa3\x7c\xe7\x24\x6d\x83\x6c\x63\x03\x04\x0c\x62\xd8\x5c\x46\
+\x07\xfb\x53\x0c\x5b\xf4\xb7\x87\x5f\xf7\x55\xae\x86\x5a\x36\xc7\
+\x61\xce\x6b\x74\x93\x8b\xbb\xb4\xe7\x5c\xe2\xf7\x17\xb7\xa0\x08\
+\x00\xc8\x8c\x79\xed\x35\xb7\x19\xef\x0d\xed\x72\x4e\x77\xde\xd7\
+\x26\xc0\x0b\x00\xea\x82\xc0\xd6\xe0\x68\x69\x68\xb0\xdf\xb4\xe7\
+\xdd\xde\x26\xee\x22\xfe\x16\x0a\x36\x9a\xa9\x83\x3c\x6f\xfa\x29\
+\x43\xa9\xac\x36\xbe\xdf\x1b\x67\xc3\x23\xaf\xc8\xaa\x07\x35\xd5\
+\x0d\x79\xf0\x3f\x25\x51\x67\xd4\x3a\xdf\x5f\x57\x51\xb0\x32\x66\
+\x3d\xfd\xc1\xbd\xd4\xf5\x50\x08\x2c\xdb\x7b\x93\xa7\xb3\x1e\xe6\
+\xfa\x7c\x54\x6e\x30\x4c\x2f\xff\x00\x11\x54\x16\x53\xb9\x97\xff\
+\x00\x89\x9f\x86\x54\x75\x0d\x9e\x21\x1f\xf4\xdc\x0f\x23\xb7\xc7\
+\x71\xe5\x63\xb2\x2f\xf6\x66\xb9\x13\x24\xd2\x92\x1b\x83\xb7\x66\
+\xf9\xd4\x0f\xbb\x00\xe4\x7f\xa7\x67\x15\x41\x33\x20\x83\xb4\x2c\
+\x6c\xb8\xac\xb2\x4b\x21\x2c\x38\xf5\xf3\xfd\x7f\x5f\x1e\x8a\x2a\
+\x18\x58\x1e\xf6\x99\x30\xdb\x80\x5c\x0e\x7b\xb9\x3a\x45\xc5\xcd\
+\xf6\x18\xc5\xfa\xaa\xf6\x06\xbf\x59\xed\x69\x23\x07\x6e\xd2\x75\
+\x24\x2d\x99\xf1\x11\xd9\x6b\x61\x75\xc6\x1d\x67\xb0\x3c\x8e\xa3\
+\xf3\x5a\xfa\x4e\xc0\xdb\x70\x66\x86\x3f\x6a\xaa\xa6\x03\xb1\x13\
+\x9b\xa1\xdf\x9e\xd9\xc5\xc5\x86\x71\x73\xa7\xa6\x2d\x90\x78\x85\
+\x23\x1a\xcc\x3e\x40\x7f\xd5\xfe\xde\x1e\x7b\xe7\xc9\x51\x33\x5c\
+\x4e\x63\x9c\xe2\x08\xce\x77\xb1\xbf\xcc\x28\x5a\xdf\x67\x97\x00\
+\xe8\xbd\xbe\x1f\xec\x15\x33\x1b\x5b\x56\xfe\x60\xd3\xa0\x9b\x69\
+\x55\x13\xba\x26\x18\x5a\x06\x9d\xaf\xd5\x50\x55\xc8\xd7\x86\x80\
+\x3a\xfb\xb7\x2a\xaa\xa2\x59\x0d\x8b\xad\xf0\x3d\x7c\xd0\xa9\x92\
+\x18\x9c\xd1\x90\x6d\xba\x63\xbd\x9e\x78\x9e\xd0\x1c\x5e\x45\xf5\
+\x2a\xf2\xd8\xe9\x59\x50\xd8\xd8\x1f\xd9\xe9\xe2\x42\xff\x00\x13\
+\x94\xb1\x94\xe6\x38\x8b\x0b\x77\xb6\x76\x50\xd6\x16\x4b\x3b\x9b\
+\x14\x40\xb3\x00\xdb\xf9\x81\x05\x51\x76\x5f\x24\x63\x69\x1d\x73\
+\xf1\x3b\x28\x2e\x0b\x20\xb9\xd3\x67\x67\xae\xc4\xaa\x89\x1d\x4f\
+\x54\x4b\x73\x9f\xcc\x9d\x54\xf3\x33\x64\x21\xb7\x17\xf4\xd9\x48\
+\x3f\x1b\x9b\x73\x72\x76\xfc\xaa\x76\xea\x68\x9b\xa8\x36\xb0\xdb\
+\xa7\xf7\x5c\x4d\x9c\xb6\xc0\x1a\x70\xe6\xe7\xa5\xc8\x7c\x84\x13\
+\xe2\x46\xa2\x01\x39\x03\x1b\x2a\x47\x9a\x6a\xda\x7d\x39\xd5\x7b\
+\xea\xf4\x5c\x42\x9d\x93\x49\x36\xa2\x46\x81\xa8\x5b\xcc\x2a\x69\
+\x9d\x13\xe0\xd3\x6e\xd9\x90\x1b\xf9\x5c\x2a\x78\x84\xd2\x97\x3a\
+\xea\xb5\xa2\xc2\x1d\x81\xb9\xd4\x3b\xde\x43\x7b\x63\xc8\x0d\xcd\
+\xef\x8b\x35\x9a\xcf\x2c\xb9\xd6\x52\xb7\x94\x79\x43\x2d\x27\x73\
+\xbf\x8a\x92\x95\x93\x35\x92\xb8\x90\xe6\x6d\x6d\xbe\xb0\xaa\xe2\
+\x15\x10\xf3\xde\x73\x0b\x98\xc6\x81\xb1\xd7\xaf\x27\xd3\x46\xd9\
+\x06\xf9\x51\x46\x29\x4b\x0b\x4b\x9e\x64\x19\x2f\x3b\x5b\xc3\xe1\
+\x6f\x00\xdc\x5b\x62\x38\x84\x6d\x11\x31\xdf\xcc\x32\xa8\xad\xfc\
+\xa0\xe0\x9f\x80\x25\x4a\xd0\xf6\xdb\x6b\xf8\x2a\x80\x23\xbd\xb3\
+\xea\xbf\xff\xc4\x00\x4b\x10\x00\x02\x01\x03\x03\x03\x02\x03\x04\
+\x07\x06\x04\x04\x04\x05\x05\x01\x02\x03\x04\x11\x12\x00\x13\x21\
+\x05\x22\x31\x14\x41\x23\x32\x51\x06\x42\x61\x71\x15\x24\x33\x52\
+\x81\x91\xa1\x43\x62\xb1\xc1\xd1\xf0\x53\x72\x82\xe1\x25\x34\x63\
+\xf1\x07\x16\x44\x54\x10\x73\x92\xb2\xc2\x35\x64\x83\xa2\xd2\xff\
+\xda\x00\x08\x01\x01\x00\x06\x3f\x02\x3d\x96\xfa\x6b\x91\xa1\xe0\
+\x1b\xea\xc5\x81\x1c\x68\x03\xe0\xda\xda\x1e\x35\xb6\x3e\xef\xd3\
+\xc1\xd7\x23\xef\x7f\x8e\xb8\xe7\xc2\xf1\xfe\x7a\xf3\xfc\x35\xc9\
+\xe0\x7f\xdf\x5c\x6b\xc7\xb7\xbe\x85\xf4\x54\x0b\x71\xa5\x41\xc8\
+\x3e\x74\x3f\x8f\x8f\xcb\x5f\xd7\x9d\x78\xe6\xda\xe7\xdc\xeb\xb9\
+\x6f\xe3\x5c\x71\xae\xeb\x78\xf0\x3d\xf5\xc1\xd5\xc9\xbe\xad\x7d\
+\x0b\x0e\x2f\xa2\x47\x6f\x8f\xe3\xe3\x5d\xde\x6f\xaf\xcf\x9d\x1e\
+\x35\xf2\x80\x74\x57\x44\x5f\x40\x63\x71\x7e\x49\xff\x00\xb5\xb5\
+\xc6\x83\x70\x07\x9d\x05\xe7\x23\xae\x74\x6c\xdc\x7d\x35\xcb\x68\
+\x13\xe3\x56\x07\xcf\xf8\xea\xff\x00\x5f\x7d\x5b\xdf\xfa\xe9\x40\
+\xe4\x5e\xe6\xda\x16\xf7\xf1\xf5\xfc\x6f\xfc\x34\xcd\xcf\xcc\x7f\
+\xed\xfd\x75\x7f\x6c\x45\xef\xf5\xd0\xc7\x92\x46\x87\xe7\xc8\xd7\
+\x77\x92\x0d\xbf\xc3\xfc\x34\x18\xfc\xd7\xb6\xbb\x4f\x75\xf9\xfe\
+\x3a\x5f\x04\xe2\x32\xff\x00\xb6\x91\x47\xd4\x0f\xe7\xa4\xe3\xf1\
+\xfe\x5a\x54\xb6\x27\xf1\xf1\xc6\x85\xb8\xff\x00\x0d\x7d\x7f\xc3\
+\x57\xf7\xfd\xdd\x73\x61\xa6\x92\xec\x4f\xd2\xdc\x7f\x86\x89\xb7\
+\x03\xc6\xb0\x3c\xf8\xff\x00\x1d\x12\x4f\x37\xe3\xf2\xd7\x2c\x6d\
+\xaf\xa8\xd1\xb0\x3a\x66\xfa\x7b\x68\x1b\x71\x6d\x5d\x6d\x7b\xea\
+\xe7\x44\x91\xc7\x81\xe7\xfa\xeb\xf7\xb9\xe3\x45\x8f\xe1\xfc\x39\
+\x1a\x23\x8f\xcf\x5e\xd6\xd1\xb1\xe3\x5e\xfd\xba\xf3\xe3\x9b\x5f\
+\x5c\x82\x35\xe7\xfd\xfe\x3a\xbd\xbf\x8f\xb6\x87\xf1\xf1\xe3\x58\
+\x8b\xf2\x74\x9f\xc3\x59\x7b\xfd\x4f\xe1\xa3\x6e\x42\x7f\x99\xd6\
+\x3e\xd7\xfa\xeb\xdb\x81\x6b\xde\xe7\x4f\xe4\xf1\xfe\x1a\x52\x7f\
+\x7b\xff\x00\x6f\xeb\xa4\x7b\x79\x1f\xf7\xd2\x82\x6f\xf8\x69\x41\
+\xd7\xb7\x8e\x34\x08\x1c\x8b\xf3\xfc\x0e\x99\x58\x79\xff\x00\x2d\
+\x5a\xff\x00\xcc\xf1\xae\xc2\x0f\xbe\x89\x1e\xfa\x76\xb7\xb7\x17\
+\xd2\xdc\xe2\x7c\xff\x00\xbe\x34\x2e\x78\x3a\xcb\xf3\xfc\xbc\x68\
+\xa9\xf7\xd0\xf7\xf2\x3f\xa6\xbc\x68\x1c\x47\xf2\xe3\x5d\xa3\xb7\
+\x44\x1d\x31\xe6\xda\x61\xf4\xe4\x8f\x7f\xe1\xa6\x3e\xd7\xe3\xeb\
+\xa0\x3f\xc7\x5f\x5f\xc0\x7b\xea\xcc\xa6\xf6\xbd\xbd\xb5\xb8\xc2\
+\xc0\x0f\x97\xdf\xfc\x34\xf7\x07\x4d\x7f\xf7\xce\xac\x0f\x77\xd3\
+\x4a\x7d\xaf\x7d\x1f\xe6\x34\x6d\xa6\x53\xe2\xfa\x36\xd5\x85\xc1\
+\x27\xdf\x44\xdf\x40\x02\x7e\x61\x7f\xe7\xa8\xf2\x23\xe5\x1a\x5c\
+\x6d\x63\x7f\xe8\x74\xb6\xd2\xdf\xe6\xfc\x74\xdc\x8d\x59\x7d\xf5\
+\xe4\xf3\xae\xe6\xe7\x4c\x4f\x3a\x92\xb2\xa6\x4c\x29\xe9\x62\xdd\
+\x9d\xbd\xee\x6f\x8c\x63\xfb\xce\x71\x45\xfe\xf3\x68\x3d\x2d\x32\
+\x08\xac\x2c\x25\x36\x63\x73\xda\x3c\x80\x0d\xbf\x0f\x3a\x58\xfa\
+\xdd\x2f\xa7\x81\x96\xcb\x5b\x0f\x7c\x5b\xb9\x80\x22\x2b\x91\x6e\
+\x07\x2c\xd7\xb6\x92\x44\x6c\xa1\x99\x52\x48\x99\x4f\x0e\x92\xae\
+\x4a\xe3\xcf\x6d\xbd\xbd\x8e\x83\xaf\xe5\xad\xa6\xe3\xf3\xfc\x46\
+\xb2\xcb\xe9\xfd\x75\x8b\x13\xe7\x8f\xcb\x4c\xb6\xb9\xb7\xf0\xd1\
+\xb0\x1a\x61\xe2\xc3\x4d\x88\x39\x28\xf3\xec\x74\x7b\x78\xbf\x27\
+\xe9\xa0\x19\x6f\xc0\xfc\xf4\x0a\x79\x23\xdf\x40\xca\x45\xed\xf4\
+\xd2\xaf\x1f\x8f\xe3\xf9\xe8\x95\x51\xe4\x8d\x3a\xa7\x02\xf6\x1a\
+\x25\xda\xc0\x7b\xe8\x73\xff\x00\x56\x97\xf3\xf3\xf8\x68\xdf\x92\
+\x78\xfe\x1a\x36\x6f\xfa\x74\x49\xf7\xff\x00\x5d\x17\xfb\xa4\xf6\
+\xfe\x1a\xf3\xf8\x81\xf5\xfc\x3f\x33\xe0\x7e\x3a\x73\x36\xe3\xcb\
+\x9e\x22\x08\x53\x27\xcd\x8a\xed\x21\x3c\x80\x48\xbe\x64\xff\x00\
+\x4d\x41\x47\x07\x44\xea\x0d\x2b\x1b\x38\x9d\xd6\x9f\xe5\x6c\x5b\
+\x68\xe1\x22\xc9\x8f\xce\x49\x29\xd8\x0d\xb9\xb6\x85\x15\x7c\xb2\
+\xf4\x7a\xbc\xb0\x11\xd6\x8f\x83\x29\x69\x02\x83\x1c\xfc\x2a\x8e\
+\x7c\xb5\xee\x78\xd2\x10\xd7\xbd\x99\x48\x20\x86\x4b\x5c\x38\x23\
+\x82\xa7\xd9\x81\xb6\xbe\x6b\xdb\xfd\xf1\xa3\xcf\xd7\xeb\xfe\xba\
+\x37\xe4\x03\xa0\x3d\xed\xa2\x39\x07\xc8\xfe\x7a\xb7\x77\x9d\x74\
+\xee\x90\x2f\x95\x7c\xcd\x59\x51\x8f\x96\x86\x94\xa2\x20\x6e\x7e\
+\x5d\xf6\x07\xfe\x9d\x2a\xd3\xdc\xb6\x58\xb9\xb7\xd4\xf9\x6c\xaf\
+\xe0\x71\xc5\xb8\xd7\xa5\xa9\xc8\x2b\x5f\xb4\x29\xc5\x97\x03\xf7\
+\x7c\xd9\xfe\x50\x56\xc4\x12\x09\x36\xe3\x4b\xd0\x6b\x5e\x47\x26\
+\x40\xfd\x32\x66\x73\x37\xc1\xc4\x9f\x4c\x5f\x15\xc7\x6e\xde\x0f\
+\xb0\xb7\x9d\x5f\xf3\xfe\x18\x9c\x7f\xc7\x40\x3f\xb1\xf9\xb4\xde\
+\x0e\x36\xfe\x44\x6b\x92\x3e\x5f\x1f\xec\xeb\xbf\xc0\xf7\xfc\x7f\
+\xd3\x59\x0f\x6d\x36\xaf\x61\x73\xcf\xe3\xab\x1e\xdb\x8d\x01\x7f\
+\x03\xfd\xff\x00\x4d\x72\xd6\x2a\x00\x1a\xed\x71\xc0\xd5\x8b\x78\
+\xfa\x69\xae\x2d\x8b\x79\x1e\x75\x27\xd0\xdc\x8d\x01\x70\x18\x8d\
+\x79\xb8\x07\x56\xbe\xb9\x3e\xda\xc7\x82\x0f\xe1\xae\x10\xf9\xd1\
+\x1c\x5f\xf7\x4e\xa4\x94\x00\x70\xc1\x23\xfa\x19\x5a\x45\x45\x07\
+\xfe\x56\x60\x4d\xbd\x86\x9a\xaa\xbf\x0a\xba\xba\x91\x15\x41\x59\
+\x7c\x9c\xf2\x27\x12\x47\x18\x29\x27\xf2\x16\xd1\xaa\x46\x14\xa6\
+\xdf\x71\x01\x42\x0d\xf2\x8c\xa8\xec\xc4\x1b\x12\x71\xc8\x79\xcb\
+\x4f\x51\x3d\x38\xa9\x80\x43\x2a\x3f\xbb\x37\x77\xcd\x1c\x97\x1d\
+\xaa\x7b\x85\xac\xcb\x6b\xdc\xda\xda\x3f\x62\x7a\xe5\x63\x54\x53\
+\x5a\x4f\xfe\x5c\xad\x94\x36\x6b\x1c\x24\x65\x4a\xe7\xb8\x98\x0d\
+\xed\x4e\xec\xd7\x25\x6d\x73\x71\x62\xb9\x0f\x9a\xd6\xe6\xfc\x79\
+\xf2\x3e\xbf\xd3\x5c\x1e\x7f\x0f\xf3\xd7\x0c\x3f\x1f\xff\x00\x0f\
+\x7f\xa7\xf2\xd2\x9c\x79\xe3\xf8\xff\x00\xef\xaa\x5a\x58\xfc\xd2\
+\x74\x5a\x35\x90\x79\xc6\x49\xe5\x9a\xa0\x8e\x3f\xb8\x62\xcb\xf1\
+\xd6\xd3\x31\xb9\x94\x28\xe7\x05\xee\x21\x3b\x8d\x9b\xf7\xbe\x9c\
+\x9d\x45\x59\xb8\x22\x75\xc5\x41\xfd\x9c\x96\xcf\x85\x8d\xb0\xb2\
+\x7c\x24\x7c\x9d\xc3\x01\xf3\x5a\xdc\x1a\x25\x94\xba\x10\xd1\x18\
+\x8b\xb8\x66\xdd\x3c\x48\x24\x02\xd8\x3b\x4d\xf0\xd4\x9b\xab\x40\
+\xf9\x58\x1e\x74\x93\xc5\xc6\xe7\x2c\x9f\xb8\xfe\x1d\x6e\x38\x22\
+\xfc\xdf\x5c\x9e\xd3\xf4\xd0\x3e\xe4\x01\xfc\xb8\xd0\x64\xf2\x0d\
+\x8e\xad\xee\x39\xd2\x10\x47\x23\x9b\x7b\x6b\x8e\x79\x3f\xca\xda\
+\x51\x6e\x72\xb5\xbd\xc0\xd1\x60\x7f\x2b\x69\x94\x96\x18\x9b\x9f\
+\xfb\x6a\xea\x6d\xc0\xe7\xdf\x56\xce\xfc\x69\x71\xfc\x2f\xac\x4f\
+\xfb\xe3\x5f\x9e\x80\xb7\x37\xb7\xf0\xd5\xcf\xd3\x8d\x71\xec\x74\
+\xbe\xe7\xc7\x9d\x65\xed\x97\xbf\xd7\x41\xae\x39\xf3\xab\xaf\xe3\
+\x6c\x75\x49\x45\x28\x06\x92\x40\x25\x96\xdd\xcc\x92\xe6\x24\xa6\
+\x6b\x78\xee\x54\x6d\xcb\xfb\xd8\x8b\x5a\xc6\x78\xfe\x34\x90\xc5\
+\x0a\x05\xf8\x51\x91\x1a\x40\x71\x6b\x62\x56\xe3\xce\x7c\xf0\x97\
+\x3a\xaa\x2b\x18\xbc\x72\xbb\x22\x22\x48\x31\x1d\xa2\x40\xc1\x9a\
+\xec\x1b\x83\x10\x4b\xd8\x5f\x2c\xbc\x88\x73\x8a\xf4\xee\x55\x26\
+\xc2\xe0\x08\x59\xc6\x40\xc5\x20\x60\xb2\x27\xcf\x7f\x1c\x72\xa7\
+\xc6\xa0\xea\x9d\x21\xcc\x52\xc0\xad\x53\x04\x91\x16\xce\x26\x04\
+\xf1\x70\x7e\x50\x39\xc0\x8b\x79\x22\xc6\xd6\x42\xc6\x51\x5b\x02\
+\xc7\x0d\x4a\x4b\x96\x46\x55\x5e\xe6\x37\x3f\x33\xdb\x31\xc7\xcb\
+\xed\x7e\x74\x6d\xc3\x58\xdf\xf8\xf1\xa6\xbf\x25\x4f\x9d\x76\xda\
+\xe3\xf9\xea\xe0\xd9\xbf\x2b\x68\x2b\x2f\x71\x20\x03\xee\xb7\x3e\
+\x75\xf6\x82\x6c\xcb\x7f\xe2\x75\x70\x23\xff\x00\xe9\x40\xe9\x14\
+\x4b\x7f\xa2\xa4\x6c\x06\xa5\xac\x64\x2c\x85\x8a\xa3\x62\x4f\x23\
+\xc3\x2f\x70\xbb\x09\x02\xdb\x9f\xeb\xa9\x29\xa1\x8d\xd6\x46\x47\
+\x68\xd6\x79\x61\x1e\xa1\x5e\x19\x11\x63\x91\x66\x6c\x23\x6b\xe4\
+\x15\x73\x4b\x92\x05\xf9\xd4\xa2\x3f\x4e\xb4\xab\xb0\x17\xbe\x43\
+\xb0\x92\x3c\x6b\x54\x25\x4c\x1e\x54\x64\x92\x24\x11\x13\x24\xa1\
+\x5e\x46\x7d\xe3\x0f\xc3\x0f\x0c\xe9\xb3\x34\x16\x02\x3f\xa4\x78\
+\x86\x5b\x77\xb1\x6c\xc1\xdc\xc8\xdb\x8d\x03\xed\x8d\xef\xac\x2f\
+\x7f\x7f\xc7\xce\x98\xab\x71\x7b\xeb\x8f\x24\x6b\xb7\x8e\x2f\xcf\
+\xd7\x40\x79\x6c\x3c\xfe\x3a\x0e\x4d\xbf\xcf\x5c\x63\xce\x99\xb1\
+\xf3\xf5\xff\x00\xb6\x87\x16\xb7\xe1\xac\x97\xf7\xb9\xfa\xf3\xc7\
+\x1f\xcf\x41\xbc\x37\x3c\xfe\x46\xdf\x4f\xa6\x8a\xf1\xee\x6f\xef\
+\xa2\x2f\xf5\xb6\xb9\x3e\xf6\xe7\x40\x03\xfd\xdd\x13\xe7\x9b\x5f\
+\xf3\xe3\xff\x00\x7d\x07\x3c\x93\xde\x3f\xc7\x45\x7c\x7d\xeb\x7f\
+\xa6\xac\x09\xb6\xac\xff\x00\x51\xcf\x3f\xe5\x7f\xe4\x07\x3e\x35\
+\xd5\xab\xa6\x89\xcc\x56\x58\xa8\xa4\x0f\x0b\xc3\x2a\x05\xb6\x32\
+\x47\x80\x9e\x09\x90\x9e\xc3\x9d\x9f\xe4\xc4\x16\xc8\x4c\x63\x1f\
+\x0c\x15\x74\xdb\x27\x2d\xa9\x01\x59\xe3\x96\x2b\x33\xa8\xcb\xf6\
+\x8d\x73\xf0\x73\xb5\x9a\xce\x18\xc9\xb8\x43\x39\x68\x93\xd4\x5d\
+\x9b\x05\x3d\xd4\xd3\x61\xb6\x57\x0b\xfc\x30\xed\x2f\x16\x64\x02\
+\xe7\x53\xa4\x69\x22\xbe\xe3\x33\x4a\xe4\xb4\x86\x37\x52\x31\x68\
+\xcf\x0a\xfe\xd9\x5b\x1f\xee\xea\xa3\xa7\xce\x59\xa2\x99\x5f\x61\
+\x5f\x80\xee\x7c\xc2\xbc\xa8\x06\xc3\xb4\x7e\xf7\xd7\xc6\xa1\x92\
+\x23\x02\xc3\x57\x3b\x09\x5e\x6a\x82\x88\x48\x89\xe3\xc9\x90\x0c\
+\xf3\x86\xf8\x98\x99\x54\x91\xde\x1e\xc2\xda\x59\x14\x5c\xbc\x48\
+\x7b\x18\x30\x5c\xd4\x31\xca\xfc\x82\xb7\xc0\x8c\x7e\x7b\xeb\x32\
+\x78\x1c\xdf\xfd\x74\xad\x89\x5f\x1c\x8f\x1a\xf3\xf4\xd4\xf3\xc9\
+\xff\x00\xd3\xc3\x3c\xe4\xfb\x63\x0c\x2f\x27\x3f\xfe\x9d\x4d\x53\
+\x6e\xea\xaa\x87\x9b\xcd\xcd\xe6\xa8\x99\xee\x6f\x7f\xde\xfe\x5a\
+\xe9\xef\x59\x07\xeb\x06\x23\x3b\xf7\x58\x0d\xfc\x99\x6f\xfd\xf8\
+\xac\x0d\xfc\x07\x28\x6c\x40\xb1\x75\xb5\x90\x4c\xef\xb4\x6e\x33\
+\x9c\x2a\xf2\x1d\x6f\x2f\xa7\x54\x90\x48\x4e\x76\x6e\xe5\x16\xcb\
+\x80\xc6\x20\x1a\x42\x8d\xbb\x53\xd9\x53\x56\x64\x1b\x0f\x4f\x04\
+\xcf\x25\xe2\xa7\x7a\x06\xa8\x68\xa3\xc0\x85\x68\x8b\xbd\xf7\x13\
+\x16\x8c\xe0\x49\xa7\x9c\x05\x0d\x16\x66\x38\xe2\x38\x13\x87\x38\
+\xc5\x1c\x56\x19\x12\xcd\x98\x6b\xdb\x45\xaf\xe1\x5a\xc3\xf9\x15\
+\x3f\x88\xb5\xff\x00\x8e\x82\xad\xf1\xf7\xd0\x00\x77\x11\xfc\xf5\
+\x66\xd7\xca\x78\xfc\x3f\x86\x8a\xb5\xc5\xb9\x37\xf7\xbf\x1a\x55\
+\x52\x6f\x6e\x34\xa2\xfe\x2f\xab\x93\x7c\x7f\x9f\x3c\x68\xf1\x7b\
+\x0f\xbb\xac\xd7\xdf\xc7\xfd\xf4\x88\xa7\x9b\xb7\xfa\xeb\x83\xdf\
+\xef\xa6\xb5\xee\x01\xf1\xa1\xe6\xe3\x9d\x71\xc7\xbe\x90\x5c\x0e\
+\xe1\x97\xe3\xcf\xe7\xa8\xfc\x7c\x9e\xda\x2e\xbf\x28\xb0\xfe\x63\
+\x44\x79\xb8\x07\x5d\xbc\x7d\x2c\x48\xe7\xf3\x1c\xe5\xfb\xbe\xd9\
+\x5a\xfc\x5f\x5b\xcd\x85\x40\xea\xf3\x45\xd4\x69\xea\x06\x03\x1a\
+\x75\xfd\xa4\x66\x43\xb8\x05\x4c\x45\x4a\xc9\x13\xa8\x2c\x55\x9d\
+\x6d\xc0\xd3\x8d\xc8\x21\x95\xac\xb1\x59\x59\x1a\xa6\x65\xbb\x1e\
+\x33\x06\x9e\x47\x4b\x98\x23\x91\xdd\x9d\xd7\x35\x6f\x09\xa9\xd5\
+\xd9\xc3\x17\x39\xc0\xa0\xb9\x49\x73\x00\x19\xb7\x19\x18\x4f\xf7\
+\x8b\x23\x93\xff\x00\x38\xec\x26\x61\x3b\xb5\xfe\x59\x96\x22\xa4\
+\xb8\xec\x68\xa5\x5c\x9f\x2f\x3c\x49\x92\xff\x00\xf9\x43\xce\x91\
+\xe3\x04\x48\x9d\xc1\x51\xb3\x22\x42\x7e\x76\x61\x6b\x7d\x7b\x6c\
+\xc3\xee\x90\xd6\x20\xce\xcf\xfa\xc5\x3f\x6c\xf2\x14\x01\x96\x48\
+\xc7\xc3\xa9\x97\xfb\x47\x41\xc2\x8e\xeb\x9b\xf7\x16\xd7\x4e\xa8\
+\xac\xa5\x99\x12\xa1\x31\xa9\xa9\xda\xed\x2e\xec\xc6\x19\xa5\x2a\
+\x64\xc7\xd4\x09\x0b\x07\x8f\x28\x4d\x91\x4b\x46\xfd\x8c\x6d\x77\
+\x5b\x0e\x47\xca\xdf\xc4\x9f\xff\x00\x8e\x82\x25\xd6\xeb\xca\xbf\
+\x20\xfe\x5e\x3f\x3d\x1f\xde\x00\xf1\xfe\x9a\xea\xd5\x08\x6e\x1e\
+\x94\xd2\x83\xe0\xe5\x54\x56\x11\xfc\x6c\xe7\xff\x00\x6d\x50\x52\
+\xaa\xe5\x12\x55\xc7\x25\x41\x24\x63\xb3\x4a\xa2\x5c\x5b\x8f\x0f\
+\x83\x2b\xfd\x6f\xc5\xb5\x14\x78\x26\x67\x68\x20\xf0\x9f\xd6\xfc\
+\x6e\x63\x75\xfb\xc1\x70\xe0\x9b\xea\xa9\x81\x06\x3d\xa9\xe4\x96\
+\xf3\x05\x9a\xa3\x6c\xa6\xe6\x45\x81\xd8\x41\x4b\x03\x33\xe1\x60\
+\x79\xc4\x0b\x81\xaa\x59\x04\x99\xd5\x49\x1d\x54\x66\x49\x50\xca\
+\xe8\xec\x61\xa2\xa7\x64\x0c\x48\x4a\x7a\xda\x35\x97\x07\xf9\x92\
+\x28\x84\xe0\xa9\x9a\xda\xe9\x01\x14\x6c\xca\xb3\x2b\x43\x34\x47\
+\x2a\xa2\x23\x9a\x9f\x7b\x3b\xe4\xb0\xa6\x2f\x10\x19\x77\x81\x1f\
+\xe2\x4c\xf4\xed\xc1\x85\xe4\x84\x28\xf6\xf8\x8f\x7f\xfa\x07\x01\
+\x7d\xfe\xa4\xeb\x32\x05\xf1\xd5\x87\xee\xfb\xe8\x92\x7e\xbf\xf6\
+\xd1\x03\xe9\x6f\xf7\xed\xfd\x35\x98\x26\xff\x00\xd7\xf8\xf1\xa5\
+\x04\x93\xa3\x6f\x36\xfa\x80\x3f\xc3\x45\x81\x00\x5b\xeb\x7f\xe9\
+\xa0\xca\x37\x2f\xf3\x01\xa0\x17\x87\xb7\x2b\xee\xa7\x48\xea\x78\
+\x61\x97\xe4\x75\x9c\x87\xe6\xf2\x3d\xbc\x6a\xfd\xbd\xdf\x86\x98\
+\xa6\x03\xd8\x71\xaf\x88\x85\x3f\x1f\x63\xaf\xaf\x17\xd6\x04\xfd\
+\xdd\x63\xef\xff\x00\x6b\x6a\xe7\xc9\xe2\xfa\xa6\xa3\xcb\x11\x53\
+\x34\x70\xe7\xc8\xb2\xc8\xd8\xb7\x37\x16\xed\x24\x6a\x9a\x8e\x2b\
+\x40\x91\x2c\x7b\x8b\x03\x9b\x4d\x33\xc2\x96\x65\x87\x6d\xa1\xe0\
+\x93\x85\xf1\x25\x9d\xb7\x24\xfb\xcb\x23\x47\x2c\x37\x8f\x75\xd4\
+\xd4\x26\xea\x48\x81\xcf\xea\xf2\xb5\x3e\x4d\xbb\x0b\xae\x30\xce\
+\xc6\x9d\xa1\x70\x49\x2d\x03\x64\x88\x98\x49\x23\x94\x46\x6c\xdd\
+\x1e\x43\x1b\xf7\x6e\x53\x34\x81\x77\x15\x24\xb2\x89\xb3\x92\xc7\
+\xc4\x8c\xd6\x04\x30\x4d\xb0\x50\x02\xc3\x25\xf6\x37\x06\x3b\x60\
+\xf3\x1b\x73\x20\xee\x3e\xed\x6d\x3c\x2e\x71\x96\x27\xca\xd8\xf7\
+\x62\xfe\x33\x03\x95\x05\x7e\xa4\xdc\xf8\xb6\x9a\x78\x80\x5b\xdf\
+\x72\xe3\x89\x52\xdc\xc4\x56\xc6\xea\x7c\x0e\x32\xbf\x39\x7b\xeb\
+\xaa\xfd\x90\xa8\xa8\x82\x4a\x24\x87\x77\xa4\xc3\x2b\xec\xd7\xf4\
+\xd9\x1f\x73\x28\x28\xe6\xc2\x5c\xa9\x89\xc2\x4f\x4b\x3e\x51\xee\
+\x77\x26\x0f\x83\x2d\x67\xd9\x6e\xab\x75\xab\xa2\xdc\xc1\xaa\xb8\
+\x90\x80\xc4\x05\x33\xe0\x23\x9d\x98\x77\x65\x0e\x21\x3e\x46\x53\
+\x7b\xea\x26\xb5\xbd\xbe\xbf\xcc\x8b\x6a\xe4\xf0\x7f\x90\xd5\x2d\
+\x2d\xc9\xf5\x7d\x46\x11\xc7\xff\x00\xdb\x44\xf2\x5b\xe9\xcd\x85\
+\xee\x0f\x3a\xe9\xfd\x66\x58\xd3\xd5\x56\xf4\xc3\x58\x5c\xf6\xb8\
+\xde\x32\xa0\x46\xbf\xde\x2a\x53\x1f\xcf\x52\x48\xed\x21\x41\x9c\
+\x98\xa8\x5d\xee\x2a\x1b\xb2\x10\xd7\x04\xaf\x9b\x91\xda\xa0\xb7\
+\xb6\xaa\x21\x62\x59\xa3\x9e\x59\x5a\xb6\xd1\xb0\x48\x56\x5f\x8a\
+\x1d\xb2\x0a\x4f\xc0\x1b\x57\x56\x57\x43\x22\xed\xc9\xbd\x18\x56\
+\x0d\x4f\x4e\xa6\xae\xb6\x4e\xc1\x50\x41\x68\x5c\x2d\x59\x08\x49\
+\xf8\x79\x4c\xb2\x30\xb0\x2b\x1b\x29\xa3\x58\x12\x3e\xe1\xd0\x9e\
+\x6f\xd9\x99\xe5\xa8\x64\x40\xd8\x96\x44\x63\x60\xcc\xcc\x70\x78\
+\x16\x53\x1a\x2d\x92\xf2\x64\x41\x3a\xae\xac\x09\xb4\xb5\x15\x75\
+\x32\x88\xc7\x0a\x88\x5e\xc2\x3b\x1b\x9e\x0d\x8f\x9d\x25\x81\x16\
+\x5f\x6f\x7f\xcf\x45\xb9\xe2\xc3\xfa\xe8\x7d\x3d\xef\xfe\x9a\xed\
+\xee\x62\x3f\x96\x99\x9b\xc8\xff\x00\x7c\xe8\xb2\xf9\xbd\xf8\xd7\
+\x70\xbb\x1d\x0c\xb8\xe3\xe9\xa0\x55\x87\x3f\xc7\xf1\xf6\xd2\xcb\
+\x8a\x83\xec\x4f\xbf\xf2\xd1\xc9\x7f\xdf\xe1\xa2\xd6\xe7\xe8\x35\
+\xfd\xde\x3c\xe8\x02\x53\xe5\xb9\xe7\xef\x5b\xc5\xb5\x7b\xfd\x4d\
+\xad\xe7\xf8\xff\x00\x5d\x16\xe3\x9b\x8b\xfd\x3c\xff\x00\xed\xac\
+\xad\xc7\x8f\xcf\x59\x58\x01\x7d\x2e\x42\xd6\xf7\x1f\xe7\xaa\x08\
+\x63\xc6\x46\x52\xd3\x88\xdb\xe4\x93\x65\x59\x98\x70\x09\xbf\x1d\
+\xa3\xdd\xac\x35\x57\x49\x0f\xa8\xc4\xca\x61\x89\xde\xa2\x31\x03\
+\x49\x10\x8c\x46\xb1\x09\x54\xa3\x13\xcb\x18\x9e\x33\xda\x8c\x6f\
+\xa8\xa3\x49\x8d\x24\x9d\x9e\xa2\x3d\xc0\x1a\x19\x42\x88\x9e\x7c\
+\xea\x1a\x5e\xee\xd8\xf0\xb3\xaa\xff\x00\x66\xd6\x85\xdc\x19\x63\
+\x69\x25\x91\x23\x90\x16\x8a\x48\x61\x9c\x0b\x9c\x9a\x72\x12\x47\
+\x86\x06\x91\xf1\x5c\xe9\xea\x8f\x76\x57\x8a\xc7\x1d\x60\x8c\x6d\
+\x7b\x6d\x19\x2f\x1d\xec\x7b\x81\x9f\xba\xf6\xbf\xec\x45\x81\xfa\
+\x0d\x7a\x8c\x1f\x13\xf0\x58\x06\xbd\xf9\xb0\x66\x63\xe6\xde\xde\
+\xdf\x86\x93\x93\xe0\xfd\x0f\x95\x38\xf8\x03\x92\x6c\x3e\x9a\x73\
+\x51\x57\x3f\x4b\xac\x57\xfd\x56\xb6\x06\x90\x6e\x66\xa1\x5d\x6b\
+\x20\x81\x49\x64\x8d\x54\xb0\x65\x5e\x39\x3c\xeb\xa5\x7d\xa7\x82\
+\xa8\x57\x0c\xd2\x19\xea\x41\xf9\xdb\xc4\x0d\x2c\x23\x15\x88\xb2\
+\xdd\x72\x55\x84\xb8\x3d\xf0\xe5\xdf\xa8\xe6\x4b\x66\x02\xc7\x28\
+\xf7\x49\x50\x7c\x45\xff\x00\x4d\x60\x0f\xb1\x1c\xeb\xa2\x53\xaa\
+\x33\x06\xea\xcd\x95\xb9\xc3\x38\x8a\xdd\x7f\xe5\xf2\x3f\xcf\x54\
+\x54\x69\x64\xf4\xdd\x3b\xa4\xd2\x89\x00\x1c\xed\xd3\x46\x1f\xb2\
+\xdc\x36\xe8\x72\xec\x78\xb7\x38\xdc\x68\x4d\x99\x56\xbd\x99\x4b\
+\xab\x5d\x5e\x4e\xe9\x22\x66\x18\x92\xc1\xc8\x02\xda\x48\x0d\x38\
+\x6a\x56\x9e\x9f\x05\xda\xb3\xc8\x69\x98\x50\x4d\x46\xd1\x2b\x39\
+\x91\x43\x40\x9b\x73\xaa\x65\x1c\x89\xea\x7b\xf8\x4d\x74\xfe\xe1\
+\x4d\x59\x1d\x65\x54\x33\x87\xf4\xb3\xce\xd2\x37\xa4\xa2\x86\x38\
+\x4b\xc6\x91\xbc\x94\x70\x6c\x2d\x45\x52\x48\xb1\xc5\xfa\xc4\x95\
+\x05\xda\xfb\xf4\x55\x42\xef\x12\x35\x6c\xe9\xcd\xd2\x11\x0c\x13\
+\x2c\x10\x83\x19\x68\xce\x71\xc4\x90\xad\x86\x0c\xd2\xb1\x57\xf9\
+\x54\x4a\x4d\xbf\x6f\x2e\x40\x78\x12\x64\x33\xb7\xf7\x55\xbb\x7f\
+\x97\x3a\x54\x16\xe4\x8f\xeb\xad\xd6\x2b\xf2\xdc\xdc\x5f\x5d\xa1\
+\x79\x3f\x97\xf4\xd1\xc7\xe6\xe6\xfa\x6c\x85\xf2\xf6\xd3\x77\xdb\
+\xf0\xd2\xfc\xad\xa2\xc6\xde\x7f\x8e\xb7\x20\x93\xdf\x94\xf6\x23\
+\xdf\x40\xa9\xee\xb7\x72\x9f\x62\x35\xfc\x2e\x2d\xfe\xfe\x9a\xdc\
+\xb7\x26\xf6\xf7\xfe\x9a\x50\x52\xc0\x1b\x72\x34\xe4\x79\x06\xf7\
+\xf1\xa3\x9b\x1b\x83\xf2\xff\x00\xa6\x81\xc0\x00\xde\x72\xfa\x8e\
+\x7f\x0d\x2e\x5c\xfb\xd8\x7b\x69\x1d\x2c\x17\xcd\x8f\xd4\x0f\xc2\
+\xda\xc4\xf0\x0a\xf3\xf9\xff\x00\xbf\x1a\xa2\x90\xc6\xd2\x09\x69\
+\xab\x95\x5d\x43\x33\xd3\xe5\x18\x93\x71\x42\x90\x6e\xa7\xf9\x2d\
+\xfc\xeb\xab\xc1\x29\xcc\xc7\x50\xf1\x46\x56\x34\xc9\xd7\x01\x8b\
+\x2a\x4a\x1c\xa4\xc1\x99\xd4\x48\x8c\x8c\x7c\x1b\xfb\xdd\xe3\x91\
+\xe1\x60\xc0\xc4\xb1\xba\xc9\x1a\xb6\x28\xae\xad\x0b\xfa\x90\x4c\
+\x98\x97\x6c\xe4\x4d\xa7\xe5\x31\xbe\x84\xf0\xfa\x95\x91\x47\x79\
+\x06\x5c\xd8\x7c\x16\x50\x57\x6e\x35\x96\x2c\xd8\xe4\xd2\x96\xb8\
+\x66\x02\xcd\x62\x0e\x48\x86\x4e\x6e\xe3\x6e\x37\x74\x73\x91\x75\
+\x2b\xb7\x0c\x92\xab\x76\xed\xe2\x19\x12\xe4\x96\x23\x44\x6c\xb6\
+\x5f\x77\xbc\x06\x2b\x7b\xa9\x74\xee\x0a\xc4\xdb\x9b\xd8\xfb\x00\
+\x74\x8a\x0b\x0e\xc3\xb9\xcf\x80\xbc\x18\xdb\x8f\x98\xb7\x17\x16\
+\xe0\xf1\xcf\x3a\xa5\x39\xac\x31\xdd\x63\x7c\xa5\x91\x30\x89\x9b\
+\x96\x33\xc4\x8f\x34\x65\x7c\xe5\xdc\x00\xf9\x86\x37\xd5\x41\xfd\
+\x5e\xa1\x4c\x12\xc9\x14\xf4\x95\x70\xd6\x33\x32\x63\x24\x53\xee\
+\x52\x46\x91\xcb\x3a\x2a\x60\x05\x45\x3c\x33\x05\x66\xbb\xbb\x5b\
+\x55\x74\x0f\x96\xc5\x41\xcc\x4a\xb7\x09\xbe\xa2\x25\x37\x89\x89\
+\x68\x04\x82\xf8\xe6\xcf\x93\xab\x0f\x7e\x2e\x17\xc6\x59\x1f\x7d\
+\x74\xf4\x6c\x72\x8b\xaa\xd2\xa6\x2c\xa4\xe5\xb8\x8c\xcd\x8b\x0f\
+\x0c\xaa\x32\xe6\xfe\x3c\x1d\x62\xa6\xe3\x71\x87\xb7\x2a\xaa\xab\
+\xcd\xfe\x96\x63\xed\xcf\xf2\xd0\x9a\x42\xfc\xd3\x4e\xe7\x2d\xb5\
+\x8d\xb6\xa3\xcf\x90\x55\xf6\xd6\x2c\x5a\x4b\x85\x2d\xd8\x2d\x73\
+\xc1\x97\xa8\x08\xed\xb7\x49\x1c\x05\x23\x32\x22\x54\x6f\x55\x93\
+\x0c\xa9\x51\x77\x96\x19\x24\x78\xa3\xcf\x65\xa1\xa8\x11\x65\x3d\
+\xe2\x50\xcd\xad\xb2\xd2\x5e\x97\xf4\xb3\xc6\xac\xeb\x11\x51\x8a\
+\xda\x23\x83\x89\x21\xa7\x92\x46\xa6\x5e\xa8\x63\x2c\xb5\x9b\xd0\
+\xd3\x5a\x9d\xa0\x69\xf4\x66\x9b\x28\x1a\x8e\x8f\xab\xd4\x3a\xb0\
+\x13\x61\xb5\x42\x5e\x89\x5b\xee\xaa\x47\x14\xe4\x45\x1a\xb1\x40\
+\xd1\x86\x29\x90\xcb\x42\x57\x72\xce\x49\x62\xd6\xc4\xb6\x41\x6e\
+\x48\xf1\x76\x7e\xe6\xfc\x7c\x5b\x51\xc7\xf7\x95\xb2\x3f\x4b\x0e\
+\x7f\xcb\x5c\x33\x5c\x9b\x01\xfc\xb5\x94\xb6\x3d\xdc\x5e\xe2\xdf\
+\x97\x3a\x25\x2c\x0b\x1b\x7f\x0d\x38\xe4\xfb\x68\xa9\xec\x3f\x4e\
+\x6c\x74\x39\xbd\xbf\xcc\x5b\x47\x9b\xf2\x7e\x97\x02\xde\xfa\xbe\
+\x47\x12\xdf\xee\xfa\x57\x8c\x5a\xff\x00\x30\x17\xb1\xe0\xf9\xd2\
+\x48\x47\x38\xff\x00\x80\xd0\x5b\x78\xf6\xf6\xf1\xa1\x2e\x17\xb7\
+\x3c\xe8\xa5\xb1\xbf\x95\xf3\xfd\x35\x97\x1f\x5f\xc7\xf9\x68\xaa\
+\xfb\xdf\x9f\x16\xff\x00\x7f\xe3\xa6\x49\x7e\xef\x2a\x41\xf2\x80\
+\xdf\xbb\xea\x7f\x2b\x6b\x9b\x73\x67\x00\xea\xcc\x2e\x99\x0f\xe1\
+\xf9\x6b\xa5\x6c\xe2\x51\xd2\xae\x19\x55\xcd\x8e\x2d\x49\x2f\xc8\
+\xc3\x1b\x37\x60\xf3\x7b\xf2\x2d\xce\xbe\xd0\x23\xac\x72\x42\x7a\
+\x93\xb4\x6e\xeb\x8d\x45\xb2\x56\xdb\x71\x23\x59\x63\x19\x8c\x58\
+\x0b\xb7\x68\x5b\xb1\x00\xa6\xf4\x51\xe5\x4b\x2b\x85\x2f\x31\x8e\
+\x15\x59\x1a\xdc\xf6\xa5\x47\x69\x4b\x20\x93\xb0\xd9\x17\xbb\xde\
+\xcd\x18\x70\x8a\xd2\xa1\x12\x63\x3e\x2c\xa8\xb7\x3b\x79\x47\x24\
+\x0e\xaa\x56\xcb\x2a\x3a\x5f\x3d\xb5\xb6\x88\x50\x0c\x6a\x0b\x45\
+\xb8\x63\x31\xac\x65\xd4\x84\xc9\x91\xf2\x27\x90\x08\x01\xef\x6b\
+\xb1\x17\xd0\x39\x0c\x59\x72\x6d\xb7\xe2\x3e\x71\x08\x3b\x06\x6d\
+\x7f\xa9\xe3\xcd\xb8\xd3\x15\x59\x04\x52\x1b\xa8\xb0\x24\xcb\xee\
+\x5b\x8f\x94\xfe\x16\xfc\xf4\x38\x88\xb4\x8c\xa5\xb3\x38\x7b\x8e\
+\x2e\x2e\x40\x1e\x75\xb1\x0a\x1a\x29\xbd\x39\x74\x8a\x3c\x25\x0f\
+\x26\xd9\x1b\xd4\xf3\x8d\x95\x93\x21\x7c\xe1\x9e\xcc\x8b\x93\x26\
+\xe3\x85\x8d\xaa\xf3\x93\xe2\x53\xd6\xcb\x1e\x51\xa4\x91\xe4\x62\
+\x9c\x4a\xb1\xd4\x47\x63\x24\x6d\x1e\xf3\x6e\x44\xe9\xf0\xe3\x54\
+\x1b\xa4\xb6\x62\x9e\xa1\x4d\xcc\xf0\xc6\xc6\xd6\x23\xb9\x2e\xe5\
+\x6c\xc6\xe2\xfc\x0b\x80\x47\xbe\xa1\xf0\x31\xfb\x4b\x1c\xd6\xc7\
+\x90\x90\xf4\x96\x9a\xcc\x7c\xe3\xdc\xde\x2d\xf7\x79\xf3\x78\x8f\
+\xf6\x79\xda\xd6\xbd\xf3\x94\xd8\xda\xff\x00\x8d\xff\x00\x85\xf5\
+\x1b\x44\xb1\xb9\xe4\x29\x65\x8c\x85\x59\x77\x2f\xba\x97\xf0\x01\
+\x60\x71\xb1\x02\xc7\x92\x39\xda\x82\x29\xab\x53\xd4\x25\x6c\x74\
+\xab\x0b\xb8\xae\x75\xa4\xa6\x99\x68\xa4\x54\x92\x75\x64\xdf\x6a\
+\x88\x8c\xc2\x24\xa8\x90\xc2\xd1\xf6\x47\x29\x1a\xa9\x82\x14\xdf\
+\xab\x69\xb7\xca\x45\x9d\x54\x74\xb1\x75\x2c\xa9\x3a\xa5\x0c\xb3\
+\x24\x4b\x4e\x98\x56\xd2\x3e\xdf\xc4\x20\xcc\x94\xc3\x17\xb4\xee\
+\x7a\xdc\xb3\xa5\x8b\xf4\x1e\xab\x33\x92\x71\x05\xe7\x68\xa2\x46\
+\x01\x4e\xdc\x22\x28\x83\x46\xb8\xe4\x4b\x39\x56\xe0\xf0\x46\x3e\
+\x2e\x7b\x79\x1e\xdc\x5f\xcd\xbe\x9a\x35\x4c\xb6\xc8\x58\x6b\x6a\
+\x3f\x11\xb7\x3a\x2b\x8f\x75\xfc\xd8\xff\x00\xae\x9a\x55\xe6\x3f\
+\x02\xfc\x58\xfb\x83\xfd\xef\xe1\xab\xf3\xc9\xb1\xc5\x73\xfc\xbc\
+\x5b\xdf\xfd\x75\x7d\xb0\xdc\x5f\xcd\xda\xdf\x8f\x02\xda\xca\x21\
+\x83\x7f\x5f\xf0\xb6\x88\x94\x62\xe2\xe2\xf7\xb6\x5f\x9f\x9d\x28\
+\xf2\xa7\x9b\x5c\x5b\xf9\xea\xc8\xbe\xdf\x37\xd3\x8f\xeb\xa5\x53\
+\xf2\x91\xa0\xc0\x63\x6b\x6b\x67\xdf\xf3\xd6\xf2\x92\x3e\xb6\xf7\
+\xd6\xd1\x27\xc7\x04\xeb\x23\xed\xf5\xd1\xc7\x1c\xef\xe3\xdc\x7e\
+\x1f\x96\x94\xad\xc5\xbf\x9f\xe5\xa3\xea\x81\x11\x11\x65\x71\xf5\
+\x3c\x72\x3f\xd3\xc7\x9d\x74\x27\x85\x95\xff\x00\x5f\x8d\x5b\x16\
+\x07\xb5\x91\xa3\x60\xdc\x71\xda\xc7\xf8\xeb\xae\xb4\x8c\x5d\x8c\
+\xc8\x89\x1c\xa1\x03\xb6\xe4\x08\xdb\x51\x8d\xa0\x1e\x30\x22\x04\
+\x65\x76\x06\xed\x91\xe0\x6a\x0d\xbe\xdc\x65\x97\x38\xc8\xdf\x0a\
+\xd8\x59\x7b\x58\x1b\x1c\x8d\xce\xce\xdf\x93\xed\xc6\xa3\x5c\xd4\
+\x53\xb5\x40\x48\x51\x62\x92\x9f\x37\x03\x82\x61\x09\x86\x52\x12\
+\x51\xa7\xc9\x05\xbc\xf1\x70\x4e\xdf\xc3\x93\x20\xbd\xe2\xcb\x65\
+\xbd\xd1\xed\x2c\x89\x11\x53\xf0\x8b\x1c\x37\x24\x78\xca\x81\xe0\
+\xcf\x0c\xf7\xbc\x72\x36\x09\x7c\x85\xa5\x1f\xb6\x8f\x17\x17\x51\
+\x9a\xa7\x39\x59\xf9\xf0\x2d\xab\x13\x6c\x39\x52\xd2\x72\x6c\x6f\
+\xe0\x7e\x1a\x8c\xdf\x9c\x72\x63\x62\xdf\x37\x6d\xbb\x7b\xfd\xfd\
+\x88\x3f\x8e\xb0\x67\x4e\xa2\x21\x89\x1e\x09\x69\x27\xd9\xaf\xa5\
+\x5e\x18\x47\x53\x4b\x22\xed\x4f\x0a\x9f\xbb\x22\x34\xa4\x78\x93\
+\x2b\x1d\x57\xcb\x16\xf6\x3b\xcc\x15\xd5\x36\x6e\xd5\x21\xe0\x95\
+\x76\x9b\x98\x9b\x14\x65\x79\x45\xda\x55\x7b\x3b\x35\xd4\xad\x24\
+\x6f\x4e\x61\x34\xf2\x4b\x44\xfd\xbf\x7a\x31\x14\xbc\x35\xef\xfb\
+\x39\x54\x8c\x8b\x73\x7d\x75\xa9\xb1\xbc\xd4\x75\x34\xf3\x21\xfc\
+\x6a\x3a\x64\xd0\x73\xff\x00\xe8\x4f\x16\xf2\xdf\x85\x8a\x46\x5f\
+\x7d\x10\x10\x5b\x12\xaa\x36\xfc\xfc\xb6\xbd\xdb\xdf\x5f\x15\x48\
+\x64\xc9\xd9\x6d\x16\x0e\xa6\xcd\xda\xf8\x0e\x46\x36\x85\x73\x5e\
+\xe3\x8b\x38\x07\x21\x19\x96\x6a\x6a\x7a\x7a\x38\x23\x9a\x68\x15\
+\xe0\xa0\x82\x5a\x23\x58\xdb\x90\x57\xba\xed\x49\x1c\x9b\x31\x3c\
+\x69\x54\xac\xf2\xc9\x26\xcc\x76\x64\x98\xcb\xaa\x98\xd2\x65\x4a\
+\x48\x7a\x8a\x9a\xa5\x67\x82\x9d\x44\x53\x6d\x54\x52\x7e\x8e\xfd\
+\xac\xd1\xd2\x24\xe5\xe3\xf4\x71\x9f\x4b\x09\xaa\x00\x28\x79\x6a\
+\x9e\x2f\xb4\x93\xc3\x1c\x51\x40\x9d\x1a\x1a\x35\xb3\xc8\x63\x61\
+\x25\x49\xbb\xc5\x9d\xd0\xcd\x29\x40\xef\x04\x6a\xbb\x21\x5d\xda\
+\x67\x16\x4d\x63\xfc\x3f\xfd\xbf\xc3\x47\x8f\xc4\x1f\xa6\x9e\x52\
+\x7b\x98\x96\xe7\xdf\x40\xe0\x39\xf9\xbf\xed\xa5\x84\x80\xc9\x51\
+\xcd\xcf\xdd\x93\xcf\xf5\xf1\xfc\x75\x94\x45\xe3\x5b\xdf\xb3\xcd\
+\xbe\x56\x3f\x4b\x83\xc8\xff\x00\x03\xa5\x59\x73\x93\x10\xc0\x92\
+\xb6\x63\x66\xb2\xf2\x2d\xed\xcf\x8d\x59\x79\x0c\x39\x0d\xed\xf9\
+\x5a\xde\xfa\xee\x07\xcb\x58\x81\xf8\x7e\x20\xeb\x3d\xa6\x71\x95\
+\xb2\x6b\xf0\x2f\xf4\x18\xe8\x1d\xbb\x35\xb8\xba\xf6\xdb\x1d\x27\
+\x8b\xe1\xfd\x75\x8a\xad\xb8\xff\x00\x0d\x48\x58\x13\x7f\x04\xfb\
+\x69\x87\x8f\xa3\x7f\xbf\xe5\xa0\xd7\x37\xf6\xf7\x1f\xc7\x47\xeb\
+\x6e\x7f\x3d\x34\x98\xe5\x73\xc9\xd2\xdb\x82\x34\x43\x02\x6d\x62\
+\x3f\x98\xfe\x9a\xe9\xf5\x08\x70\xf4\xb5\xf4\x53\x72\x59\x51\x97\
+\xd4\x47\x9a\xf6\x73\x62\x85\x86\x85\x70\x01\x85\x75\x0c\x13\xa0\
+\xc6\x56\x5b\xe2\xd0\xb9\x12\x7c\x4b\xb2\x80\xc4\xb7\x68\x45\xee\
+\x20\x81\x63\xd9\x88\xee\x62\x51\xe1\x69\x23\x66\xcd\x06\x71\xb6\
+\x39\x38\xff\x00\x89\x26\x04\x61\x95\x84\x7f\xb4\x58\xa1\xb6\x0d\
+\xb7\x65\xf9\x24\x79\x63\x19\x67\x13\xaa\x66\x15\x23\xe4\xb9\x09\
+\x1c\xaa\x96\x28\x73\x1c\xe1\x3c\xf1\xcc\xaa\xd6\xc9\x59\x1f\x6f\
+\x8c\x73\xf8\xca\x93\x9b\x2f\xfe\x9f\x05\x43\x12\x6c\x74\x95\x51\
+\xaa\x3a\xa5\xd1\x6c\x9f\xd8\x72\x58\xc5\x20\x20\x12\x7d\xd4\xa9\
+\x22\xc3\xe9\xa0\x55\x63\xe4\x2d\x85\xee\xd7\x60\x5b\xbb\xf0\xb0\
+\xfc\x39\xd6\xd0\x38\x4b\x90\x21\xfb\x8a\x80\x4f\xdd\x28\x0b\x00\
+\x3c\xda\xcc\x4f\x8d\x59\x67\x0d\x59\x0d\x3a\x87\x65\x3b\x52\x97\
+\xb5\x90\xbd\x83\x30\x8d\xcf\x62\xfa\x88\xd7\xb9\x85\x9c\x1b\x6b\
+\xaa\xc7\x38\x57\x75\xab\x97\x68\x9a\x96\x39\x6e\xc5\x0b\x61\x31\
+\x94\x1b\x3d\x2c\xab\xc1\x86\x50\x0b\x49\x8e\x1d\xda\xaa\xa1\x39\
+\x4d\x95\x42\x56\x6f\x19\x79\x52\x29\xfb\xe3\x8e\x07\x8a\x37\x17\
+\x4c\x03\x3d\xe5\x07\x1e\x2d\xae\xbd\x7f\xed\xab\xfa\x64\x3e\x39\
+\x26\x34\x94\xd8\x7e\x1b\x56\x27\xf1\xe7\xc7\x1a\x94\xb3\x30\x02\
+\xef\x22\xf1\xcc\x65\x49\xc0\x31\x20\x59\x8a\x85\xfa\x80\x4f\x9d\
+\x3e\x31\x4a\x14\x09\x2c\x88\xcb\x6c\x0c\x7f\xbd\x3c\x7f\x1a\x35\
+\x8e\xf2\x32\x80\x55\x54\xab\x3b\x60\x1e\xf5\xf5\x57\xa6\x8e\x9f\
+\xa8\x25\x44\x27\xa8\x56\x53\xcd\x33\x51\x53\x8a\x83\x4d\x18\x8a\
+\x9a\xd2\x15\x0d\x02\x65\x17\xff\x00\x51\x0c\x69\x82\xb6\xea\xca\
+\x8b\x5b\x3a\xd6\xac\x4e\x2a\x57\x24\x9e\x97\xd2\xd5\xd1\xd3\x54\
+\xc9\xb4\x28\x9f\xa7\x14\x11\xc6\x59\xe1\xd9\x93\xe3\x30\xa4\x82\
+\x9e\x92\x25\x85\x15\x8c\xb5\x1d\x72\xba\x7c\x12\x4a\xde\xa5\x4d\
+\xd3\xe1\x85\x9c\x96\x85\x94\x7a\xba\xa2\xaa\x83\x6f\x2c\x51\x43\
+\x2a\x90\x88\x1c\x59\x2f\xe5\x6e\x78\x66\x16\xfc\xcd\xb4\xf6\x01\
+\x80\x5b\x10\x7c\x83\xc5\xff\x00\xa7\x8f\xc7\x5e\x99\x2f\xe3\xdf\
+\xe9\xa0\xec\x79\xc4\x5e\xde\xda\x1f\x5b\x82\x3f\x0e\x74\xac\xc1\
+\x4e\x4a\x3d\xb9\x07\xde\xdf\xe3\xf9\xe8\x88\xfb\x4d\xff\x00\x77\
+\x40\xff\x00\xfc\x7c\xfe\x7a\x54\x28\x3c\xf9\xb6\x87\x67\x07\x9f\
+\x6f\x7f\xe1\xab\x0b\x0b\x2e\xae\x07\x00\xf9\xd6\x66\xd7\xb7\xd7\
+\xfc\xb4\x7b\x47\x8f\x6f\x3a\x17\x36\xfc\xc5\xfc\xf1\xf9\x6b\x24\
+\x16\xf7\xe3\xdf\xf3\xd1\x52\x0e\x3e\xe7\xfe\xda\xcd\x2d\xf8\xe9\
+\x49\x04\x59\x88\x36\xff\x00\x67\x58\xb5\x8d\xc6\xb6\xef\x67\xfe\
+\xcc\xa9\xb3\x29\x5e\x6e\x0d\xc7\x22\xdf\x97\xd4\x11\xc6\xbe\xc9\
+\x7d\xa1\xdd\x75\x9e\xb2\x90\xf4\xd9\x18\xa4\x9b\x22\xa2\x32\x19\
+\xdb\xf5\x79\x15\x81\xce\x19\x78\x62\xc1\x90\xe0\x47\x75\xf5\xdb\
+\x9d\x4b\x85\x93\x76\x47\x8e\x68\x42\x9c\x95\x9d\xd3\x3e\x56\x3d\
+\xbb\x78\x61\xef\x6e\x6c\x35\x2b\x09\x21\x91\xc3\x01\x4c\x73\x8e\
+\xa1\xbe\xed\xed\xbf\x4e\x1e\x33\x29\xed\x38\xb1\xee\xc6\xd6\xd4\
+\xb1\xd4\x15\x66\x43\x70\x8d\xdf\x34\x03\x1b\xc7\xb8\xf1\x24\x71\
+\xd4\xc1\x2f\x2c\xaf\xda\xb4\xec\xa2\x19\x15\xdd\xc3\x68\x64\x51\
+\x4d\xf2\x51\x1c\x99\xa6\x4c\x8b\x7b\xa7\x85\xcf\x22\x96\x1f\x5f\
+\xaf\x3a\xf5\x2a\x1f\x10\x96\x96\x34\xb5\xb8\x6c\x72\xb1\x04\xde\
+\xcc\x7d\xf4\x92\xa1\xed\x64\xb1\xc3\x2e\x7b\x4b\x58\x79\xb1\x29\
+\x70\xe7\x16\xb0\xb9\xc7\x8b\x6a\x36\x4a\x85\xea\x71\x24\x78\xc1\
+\x1c\xb1\xc2\x9d\x42\x83\x24\xb3\x2c\x13\xc5\xb5\x1d\x4c\x6a\x09\
+\x25\x7b\x26\x28\x18\x34\x76\xbe\xab\xb7\xf7\xf2\xf9\xa2\xb2\x6d\
+\xa0\x78\xe6\x8a\x29\x96\x05\x58\xd2\x45\x59\xe0\x5b\xcb\xbf\x0c\
+\x2e\x6a\x2d\x84\x8f\x16\xa3\x6c\xf2\x6a\xa9\xa1\xa1\x10\xc5\x13\
+\xe4\xd0\x59\xa4\x96\xaa\x2c\x5c\xab\xc7\x0d\x84\x2f\x9e\xf3\x91\
+\x79\x46\x2b\x19\xd4\xb8\x91\x9c\xfd\x56\xa6\x50\x71\x70\x70\x82\
+\x92\x38\xee\x6e\x80\x01\x93\x15\xf3\xe0\xf1\xce\x99\x32\xe0\xd3\
+\xc9\x60\xed\x65\x46\x8f\xb7\x82\xaa\x4f\x76\x44\x10\x6e\x1b\xc7\
+\x68\xe7\x52\xa0\xa8\x0e\x1c\x32\xfa\x78\x15\xc5\xd0\xe1\xdb\xf0\
+\x79\x5d\xc4\x1b\x4c\xcb\x9f\xc3\xf9\xb6\xc6\x52\x06\xf5\x54\x8e\
+\x48\xae\x42\xd1\xc4\x6a\x69\x1e\x48\xe5\xf5\xf0\xb2\x06\x81\x16\
+\x95\x68\xea\xa3\x8e\x6a\x88\xea\x1f\x73\x38\x6f\x1c\x48\x1e\x94\
+\x67\x15\x3d\x3c\x32\xb0\xc9\xaa\x56\x39\xd9\xa4\x34\xa6\xbb\x7b\
+\xd2\x43\xe9\x1a\x27\x92\x39\x3a\x94\x90\xab\xd2\xba\x4b\x55\x55\
+\x3d\x16\xc2\xcf\x51\x1f\x6d\xba\x3a\x43\x10\xa7\x5a\xfa\x9a\xfe\
+\xa3\x24\x4b\x1c\x8a\xb1\xba\x45\x49\x48\xae\xd7\x2c\xbb\xb3\x80\
+\x5a\x5f\x8b\x2a\xa3\x62\x88\x1b\x26\x64\xb7\xdf\x4b\x15\xfa\xde\
+\xfa\x68\xe4\xf3\x89\x1e\xfc\xfe\x77\x3a\xc2\x4f\x39\x77\x7e\x5c\
+\xf8\xd7\xc1\xe7\xb7\xdb\x41\xdd\x7f\xdd\xb4\xf1\xf8\x16\xba\xdf\
+\xea\x75\x7f\x18\xd8\x9f\xc6\xe6\xdc\x68\xfe\x5c\x6a\xe0\x58\x65\
+\xfe\x1a\x8c\x12\x40\xb1\xff\x00\x4d\x12\x7f\x9f\xe0\x35\xed\xf9\
+\xdb\x5e\x15\xbf\x87\xfa\x69\xac\x38\xe7\xc6\xae\x08\xe2\xdc\x7f\
+\x1d\x5c\x81\x62\x38\xd3\x37\x03\x9b\xe8\x01\xd8\x7f\xc7\x4c\xbe\
+\xf7\xbe\x43\xfa\x71\xaf\x6f\x1e\x7f\xed\xa0\xfc\x64\x39\x19\x7d\
+\x4f\x1f\xcb\x9d\x7d\xa1\xe9\xa6\x35\x9a\x5e\x8b\x50\x9d\x4e\x96\
+\x3e\xcb\xc5\x18\x55\x62\xc0\x30\xf9\x43\xef\x33\x85\x2a\x48\x16\
+\x04\x1f\x32\x5c\x39\x24\xbc\x7b\x88\xbb\x65\xee\x43\x2a\xac\x52\
+\x6e\x06\x4c\x4b\x2f\x69\x07\x85\x3d\xd6\xc5\x91\xa5\xc8\x01\x26\
+\x21\xee\x26\x2a\xb6\xbe\xe1\x81\x23\x49\x56\x18\xed\x6e\x56\x32\
+\xaf\xdd\x9b\x01\x81\x8b\x19\x19\x7f\x68\x44\xd2\xcd\x2d\xe5\x79\
+\xdc\xe6\x8b\x0e\xc2\xa3\xa4\x81\x04\xaa\x4b\x88\x91\xd4\x59\x37\
+\x2d\xae\x2c\xc0\x1e\xe0\x92\x46\x5d\x5a\x3b\x5b\x72\x31\x18\xc0\
+\x76\x82\x6e\x4d\xff\x00\x0d\x48\xcf\x75\xb4\xa5\x40\x23\x2d\xd4\
+\x61\x70\xdc\x5b\xb7\xcd\xf5\xb2\x5a\x44\x09\x59\x68\xdb\x17\xb6\
+\x12\xf6\x64\xc1\x06\x6c\x80\xb6\x2a\x16\xdf\xde\xb8\xbe\x82\xe5\
+\x4d\xbe\xb1\x1c\x61\x8e\xa5\xa9\xab\x24\x01\x6c\x8e\x9e\xaa\x18\
+\x1a\x78\xdb\xff\x00\xb6\x76\xae\x89\x7e\x60\x89\x6c\xd6\x6c\x5a\
+\x74\x91\x2a\x09\xfd\x65\xd4\x49\xea\x19\x14\x32\x1b\x5f\x27\x11\
+\xdb\x02\x55\x95\x8d\xe2\x55\x08\xf6\x0b\x1d\x3c\x6c\xec\xcc\x21\
+\x44\xf8\x91\xb3\x4d\x19\x87\x6c\xc4\x01\x5f\x4a\x91\xee\x55\xc3\
+\x92\x63\xb8\x18\x2b\xe5\x7e\x7a\x75\x4a\x90\x91\xd5\x4d\x5f\x10\
+\x0a\xa3\x38\xd9\x24\x54\x91\x37\x39\x37\x4d\xb2\xac\xc6\xf7\x91\
+\x4f\xb1\xb6\xa5\x99\x24\x54\x4e\xee\x58\x9c\x44\x78\x60\xdf\x2f\
+\x36\xbf\x26\xd7\xbf\xee\x37\xc8\x4c\x11\x77\xda\x06\x69\xdc\x2a\
+\x29\x48\x12\x9a\xa2\x7d\xc8\x87\xc2\x75\x92\xa2\x9a\x0a\xa9\x20\
+\x44\x25\x64\x34\xfe\x9e\xa2\x45\xde\xc7\x50\x66\x29\xfa\x9c\xb4\
+\xa2\x08\xe8\xfe\x34\xd4\x54\x35\x29\x04\x1d\x4e\x1e\x99\x5d\x24\
+\x09\x2e\x26\x8d\x56\x68\xa5\x91\x5a\x48\x24\x80\xd0\x4e\xa9\xb8\
+\xd3\x99\x0d\x93\x7e\x5f\x49\x4f\x24\xed\x5d\x06\x52\xcf\x53\x2c\
+\xa2\x4e\x9d\x43\xb5\xb9\x9a\x43\x1e\x27\xd1\xc6\xeb\x0c\x3b\x64\
+\x7a\x98\x71\x74\x0d\xae\x95\x43\xb3\x0c\x11\x53\x74\xfa\x55\x48\
+\x60\x37\x8e\x29\x5a\x3d\xd9\x63\x4e\x4a\xfc\x23\x36\xdf\x68\x16\
+\x51\x62\x49\x2e\x5a\xe5\x78\x1f\xe7\xac\x78\xee\x1c\x7e\x7f\x8e\
+\x85\x52\x0e\x78\x2d\x6f\xc0\xf3\xfd\x35\x17\x8e\xf4\x04\xdf\xcf\
+\xf8\xfd\x75\x62\x2d\xf4\xbe\xac\x88\x40\xfe\x86\xdc\xea\xec\x08\
+\x36\x03\xfa\xeb\x00\x3f\x33\x7f\xf3\xd7\x39\x58\x1b\xf1\xce\xa3\
+\x37\x20\x85\xfa\x5b\xc9\xe6\xfa\xc0\x93\xc2\xdb\xf3\xd0\x62\x6f\
+\x71\xc7\xfd\xf4\xd6\x4b\x81\xa2\x48\x1c\xfb\x9e\x6d\xfe\xfc\x6b\
+\x28\x93\xb6\xf7\x36\xd6\x67\xe5\x17\xe3\xdb\x5e\xd6\x6b\xe3\xf9\
+\xeb\x12\xb6\x22\xff\x00\xec\x69\x91\xae\x0a\xaf\x3f\x8e\xa3\x60\
+\xdf\x29\xb3\x03\xef\xed\xfe\x7a\xb8\xe3\x24\xb5\xff\x00\x21\x7e\
+\x35\x2f\x4f\xea\x18\x7a\x1f\xb4\x74\x75\x5d\x2b\x91\x75\x59\x9d\
+\xaf\x4f\x90\xe4\x5d\x98\xed\xa9\x2a\x42\x96\x53\x6b\x03\xae\xa1\
+\xd3\xde\x9c\x81\x4d\x36\x11\x4c\xac\x43\x05\x3b\x84\x76\xe4\x13\
+\x1d\xbc\x71\x93\x0c\x7b\xc5\xd4\xea\x29\x19\xfb\xa1\x93\x68\x6d\
+\xc6\x8f\xb2\xd8\x87\xc4\x27\x6a\xfe\xf6\xe1\x20\xe6\x63\x61\xef\
+\x6d\x6c\xfc\x0b\x2a\x33\xa8\x7b\xab\xc2\x5a\x4c\x84\xa8\xbc\xd9\
+\x64\x94\x80\xb1\x96\xed\x62\x08\xe0\x58\x87\x26\x16\x7c\x22\x0c\
+\xb8\x6d\x65\xca\x99\x99\xbe\xf4\x8e\x31\x93\x2e\xeb\x6c\xdc\x00\
+\x1b\xbf\x51\x0e\xf8\x90\x49\xb4\xa2\x41\x6c\xd0\x13\xe4\x59\x98\
+\xb7\x39\x29\x16\x1b\x63\x91\xef\xa8\xa4\x29\x23\xc7\x6f\xec\xb3\
+\x52\xc1\x5f\x70\x0c\x96\xec\x3c\x72\x70\xc6\xd7\xdc\xb4\x79\x11\
+\x1b\x24\xd2\x3d\x3c\x9c\x45\x1c\xc9\x96\xd3\xb9\x00\x0b\x89\x4c\
+\x44\x06\x23\xe2\x43\x2f\xe6\x8b\xe4\x57\x6f\x66\xed\x1c\xe2\x64\
+\x64\x2b\x6f\x4d\x13\x7c\x59\xa1\x2d\x1c\x8c\xb2\x06\xf8\x28\xaf\
+\x23\x1b\xe2\xdc\x80\x41\x63\x1b\x63\x24\x82\x31\x98\x96\x59\x56\
+\xce\x21\x9d\x24\x27\x70\x62\xf9\x64\xb2\x0f\xf8\xd8\xe3\x88\xe0\
+\xf5\x0e\x9d\x35\xbf\x52\xea\xcb\x51\x4f\x1a\xc8\x1e\x45\x82\xbe\
+\x27\x92\xa5\x4a\xe6\xdf\xab\xa5\x74\x72\xbc\x73\x8b\x6e\xab\x27\
+\xfc\x4e\xd1\x1f\x81\x8e\x08\xe5\xf6\x15\xb3\x62\xc1\x84\x8d\x71\
+\x14\x88\xca\x0c\x72\x37\x6a\x90\x2f\x6f\x98\x40\xc8\xf7\x68\xeb\
+\x68\x69\x2b\xda\x5c\x5a\x51\x43\x59\x3e\xc9\x48\xa7\x1f\x06\x38\
+\x9d\x4b\x99\x59\xe3\x11\xb5\x4c\xd3\xc0\x53\x6d\x5e\x51\xd4\x29\
+\xb3\x1e\xaf\xf4\x94\x33\x49\x0c\x61\x65\x8e\xa7\xa6\xc7\x4e\xd4\
+\x51\x49\x2c\x31\x06\x68\xaf\x84\xd5\x69\x04\x6f\x25\xa1\xad\x55\
+\x49\x11\xa0\x92\x47\xa4\xa4\xa7\xa4\x54\xa2\x13\xaf\xaa\xa8\x56\
+\x79\x24\xa8\xa9\x8d\x54\xd3\xd0\xd4\xcc\x01\xbd\x4d\x34\xf5\x6e\
+\xed\x12\xb0\xa5\x8a\x36\x4c\x4c\xd2\xc3\x23\xea\x15\x8c\x59\x60\
+\x0a\x9e\x41\x20\x24\x71\x8c\x5a\xc0\x02\x58\xf7\x3b\x00\x2e\x40\
+\xb5\x87\x04\xb0\xf7\x4f\xeb\xab\x65\xe0\xff\x00\xed\xfd\x74\x21\
+\x3f\x42\x4d\xbe\xa0\xf8\xfc\xb4\xb0\xdf\x95\xff\x00\x7c\x6b\x23\
+\x21\xed\x20\x0e\x3f\x10\x39\x3a\xbf\x07\x8d\x35\x96\xff\x00\xfb\
+\xea\x41\x66\xfc\xd8\x68\x86\x61\x97\x3f\x5d\x1f\xee\x8b\x0b\xfb\
+\xe9\x9b\x9b\x81\x71\xcd\x8f\x9f\xaf\xf8\xfe\x1a\x11\xa9\xb2\xa8\
+\x51\xf3\x73\xce\xae\x4e\x5f\xe2\x75\x6f\xe3\x8f\xe1\xa2\x5b\x01\
+\x73\x6e\xef\x16\xd3\x01\x81\x49\x2f\x82\xaf\xe5\xa4\x0c\x2c\x34\
+\xdf\x2d\xd4\x79\xfc\x35\x92\xf9\xf1\xab\x1e\x3d\xf8\xf1\xc7\x3a\
+\x8c\xab\x1b\xda\xff\x00\xf5\x7d\x3f\x2d\x53\xd5\xc0\xdb\x75\x34\
+\x73\xc3\x52\x97\xe7\x19\xe9\x9c\x4a\x3c\x9b\x15\x6c\x6c\x57\xcb\
+\x78\x07\x5d\x23\xff\x00\x88\x9d\x36\x99\x5a\x1a\xda\x65\x83\xac\
+\x04\x35\x0e\x69\xab\x62\xba\x3a\xce\x20\x8a\xd4\xed\xfd\x8b\xe7\
+\x23\x21\x55\x4c\x15\x4b\x03\xad\xe5\x0c\x45\x93\x02\x3f\x67\x91\
+\xef\x61\xca\x8c\x30\x32\x70\xf2\x47\x27\xba\xf9\x20\x8e\xfb\x46\
+\xcb\x6e\x59\xb7\x04\xb7\x3c\x5d\x96\xca\xd6\x3c\xf1\x05\x96\xd9\
+\x7b\x5f\x5b\xf4\xd1\x1d\xc5\x8c\x4d\x28\x21\x76\xf0\x11\x3c\x4c\
+\xe8\xfe\x5f\x3e\xcb\x85\x51\x66\x91\x8f\x8e\x02\x96\xbe\x78\x97\
+\xb9\x7b\xb9\x24\x14\x04\x11\x60\x85\x41\xc4\x58\x0e\xdf\x37\xd4\
+\x52\x45\x3e\x0d\x49\x2a\xcd\x7e\x4b\x28\x03\x13\x93\x8f\x99\x31\
+\x24\xb0\xf1\x6b\xe7\x74\xc8\x13\x54\xab\xb3\x24\x81\x56\x68\xc7\
+\xec\x5e\x41\x66\x22\x54\x4f\x84\xdc\x77\x6e\x45\x65\x6b\x82\xb1\
+\xa1\x5c\xb5\x59\x52\xd9\xc5\x7a\xa7\x0f\x7e\xd5\x5a\x95\xb9\x0a\
+\x0d\x98\x4b\x1c\x2c\x13\xe5\x45\x57\x0d\x7f\x2a\x5b\x49\x26\xf0\
+\x51\x21\xdb\xb1\x8c\x07\xef\x11\xe6\xf1\x47\xdc\xb2\x4b\x1e\x67\
+\x2c\xec\xaa\x31\x2a\x99\x0e\x6b\x29\xe3\x31\xc7\xeb\xfa\x50\xaa\
+\x86\x35\x85\x91\xa4\x91\xa6\x35\x2f\x4b\x14\x85\x8b\x18\x7a\x79\
+\x67\x7a\x7c\x91\x6f\x4f\x53\x2a\x33\x39\x81\x2c\xca\x70\x21\x61\
+\xc6\x43\x32\x6e\xc4\xb2\x0f\x93\x7c\x14\x91\x1a\x2c\x88\xce\xd1\
+\x12\xa3\xbb\xdb\x4a\x88\xce\xf0\x45\x56\x29\x76\x2a\x14\x4b\x2b\
+\x55\x61\x1c\x92\x3a\x4b\x34\x4e\xd2\xd1\xb4\x75\x15\xb0\xfa\x5d\
+\xb3\x3e\xcb\x4c\x63\xc0\x5d\x74\x60\xa9\xf5\x30\x03\x4f\xd7\x44\
+\x95\x05\x29\x42\xbb\x45\xd3\x6a\x5b\xa0\xcf\x1c\x9b\x67\x36\xf4\
+\x3e\x9a\xf4\xe0\xd2\xa4\x0d\x76\x56\x79\x83\xb2\xf4\x4a\x78\xb7\
+\x69\xa9\x68\xe9\x21\x90\x53\xfa\x33\x57\x82\xcf\x49\x4f\x35\xe7\
+\xa9\x91\x95\x95\xb7\x7d\x55\x8c\x49\x16\x4d\x51\x3e\xcc\x49\x4e\
+\x0d\xbb\xac\x63\x6c\xad\xef\xef\x70\x0f\xee\x8b\x73\xcd\xcf\xe3\
+\xa0\xd1\x11\x8b\x78\xb7\xf9\xe8\x94\x16\xf1\xe3\xc7\x9d\x64\xe9\
+\xdc\x09\xe7\xde\xc7\x4b\x53\x91\xdb\xbf\x37\xfc\x8e\xa7\x8b\xbb\
+\x6d\xad\x24\x77\xe7\xb7\xdf\xff\x00\xf6\xd4\x48\x49\xc4\xf9\xe7\
+\x5c\x73\xa2\x57\xcf\xbd\xf4\x5a\x30\x6d\xfd\x2f\xa5\xe2\xff\x00\
+\x9f\xe5\xab\x77\x7c\xba\x76\xf7\x2d\x7e\x3f\x0f\xf7\xce\xb1\x73\
+\xcd\xb8\xfc\xed\xcd\xef\xf8\x68\xbd\xf1\x6c\x71\x1a\x0d\xbb\xf9\
+\x0d\x0e\x6e\x10\xf8\xf1\xf8\x79\xd2\xa1\x16\xee\x3f\x29\xf6\xb1\
+\xb6\x97\xbf\x16\xc6\xdc\xe8\xdc\xf3\xf8\x8f\xfb\xea\xe0\xe4\x0f\
+\xb6\xae\x57\xe5\xfc\x75\x74\xf2\x4f\xb7\x19\x7d\x05\xf9\xee\x63\
+\xda\x0f\x8b\x9f\x1a\xaf\xfb\x15\xd7\x4a\x47\xd1\x7e\xd2\xb9\x5a\
+\x7a\xab\x2c\x42\x8b\xaa\x4a\x9b\x47\x3a\x82\xaf\x8a\x55\x11\x1a\
+\x2b\x95\xb6\xe2\xae\x4d\x89\x7b\xd7\x74\xaa\x85\x63\x1c\x2e\xf3\
+\x45\x3c\xca\x62\x32\xd2\xcd\x79\x21\x58\xe4\x8e\x5c\x5e\x25\xc8\
+\x14\x7d\xa5\xcb\x15\x8d\xbc\x39\xd6\xe2\xb3\x8d\xab\x2c\x83\x01\
+\x97\x25\x4c\x77\x76\x25\x44\x52\x23\xaa\x48\xd1\xb5\xf9\x62\x6c\
+\xb7\x1a\xa5\x9c\x08\x8a\xba\xec\x95\x84\x48\x50\xc5\x53\x18\x52\
+\xaf\x93\xc9\x7d\xb9\x31\x2b\x34\x6f\x1a\x1e\x57\x03\x71\xad\xe8\
+\x22\x67\x47\xc8\x1c\x7e\xe0\x0a\x32\xbe\x47\xfe\x25\xed\xe3\x8d\
+\x63\x10\x90\x92\xc3\x68\x2a\x8e\x49\x17\xc4\xdd\xce\x79\xfc\x98\
+\x78\x7b\xe2\x41\xbd\xb4\xcf\xb9\xe8\xaa\x96\x16\x59\xa1\x93\xe0\
+\x84\xaa\x8d\x08\x89\x84\x6c\x8e\x22\x70\x2f\x13\x5a\x35\x4d\x97\
+\x72\x72\x6c\x48\xde\x75\x4c\xc2\xab\x7a\x59\x5d\xc6\xea\x5b\x85\
+\x93\x16\x65\x46\xf8\xc4\x2f\x08\x5d\x56\x49\x1a\xe0\x61\xa9\x21\
+\x90\xed\xa3\x4b\x64\x00\x07\x18\x54\x62\x65\x66\x29\x18\x7c\x24\
+\x8b\x6b\x6e\x44\x64\x6b\xab\x04\x2a\xc5\x59\x16\xa6\x23\x08\x92\
+\x2e\x9f\x36\xee\x35\x5b\xc5\x23\xa9\xa7\x92\x29\x3d\x31\x36\x32\
+\xab\x55\x80\x19\x6c\x7d\x35\xa4\xb7\x0c\x2c\x13\x75\xa2\x56\xca\
+\x3e\xcb\x32\xde\x5f\x87\x79\x98\xd8\xa8\x39\x5b\x2b\xf6\x5f\x2f\
+\x6d\x45\x57\x0a\x4c\xd2\x52\x8c\x44\x76\x11\xb2\x49\x14\x82\x6f\
+\x52\x67\xa8\x3b\x71\xd4\xcf\x1b\x65\x4f\x53\x8b\x4b\x86\xe1\x32\
+\x6c\xfc\x3d\x51\x54\xd4\xe2\x2a\x76\xd9\xa8\x69\x00\xdc\x96\xa6\
+\x82\x29\x67\xad\x9a\xb6\xb5\x01\x96\x2f\x53\x48\xa2\xf4\x88\xb7\
+\xf8\x72\x12\x88\xaa\x18\x6b\xaa\x4b\x52\x32\x9a\xae\x27\x96\x76\
+\x8d\xc6\xd4\x75\x25\xc4\x2e\xc2\x34\xf8\x50\x6e\x60\xc4\x43\x4d\
+\x23\xc4\x8c\x7b\x92\x23\x74\xd0\x24\x5b\xc1\xe3\xdf\xee\xff\x00\
+\x9d\xce\xa2\x66\x6e\x1f\x13\xf9\x7b\xf3\xad\xd8\x6c\xe5\x6d\xdb\
+\xe6\xfe\xdf\xf7\xd4\x8c\x50\x0c\x7f\x0d\x32\x8f\x97\xe9\xa1\x22\
+\x2d\xcc\x69\x22\xbf\xfc\xa6\xff\x00\xe7\xa8\xd2\xf6\x64\x5b\x11\
+\x7d\x05\x23\xb4\xdb\xfa\xf8\xd3\x7e\xe0\x6c\x5b\xf3\xd0\x3e\x6d\
+\xc9\xfa\xe8\x98\xf9\x03\xf0\xd0\x42\x3c\xf1\xcf\xd3\x5d\xbc\x58\
+\x65\xfe\xbf\xc2\xd7\xd2\xec\x9b\x2e\x5c\xcb\xfe\x9a\xcc\x5d\xad\
+\xef\xa1\xe6\xfe\x34\x59\xc7\x38\x93\x6f\xc7\xfd\xf8\xd2\x03\x90\
+\x6c\x80\xe7\xdb\x9e\x7d\xbe\x9a\x05\xc7\x85\x1c\xfb\x5b\xf1\xd6\
+\x20\xf2\x09\xfb\xbc\x5b\x57\xf1\xff\x00\x37\x8f\xe1\xa3\x88\xc7\
+\xcf\x83\x70\x46\x91\x4d\x95\x83\x71\xee\x1f\xf1\xfc\xc7\x9d\x64\
+\x8a\xca\xea\x7b\x1d\x0d\x99\x71\x39\xc7\x87\xf7\xd1\xbf\x65\x70\
+\x7b\x8f\x76\x43\x8d\x4c\xb5\x10\xd2\x51\xfd\xb2\xe9\x10\xac\x33\
+\x34\x7b\x7b\x75\xf4\xd6\xb4\x55\x21\xdd\x77\xb6\xe7\x43\x3a\x48\
+\xa3\x35\x82\xa2\x46\x56\x01\x59\x76\xea\x69\xea\x61\x96\x93\xd3\
+\x4f\xb6\xd4\xf3\xc1\xb9\x13\x06\x69\x61\x42\x0e\xe3\x46\x69\xdc\
+\xec\xa6\xea\xaa\x62\x0d\xce\xb6\x54\x3c\x58\x47\xd9\x10\x62\xb1\
+\xa6\x27\xcc\x76\xe2\x48\xf2\xf9\x4f\x81\xf4\xbf\x3a\x6c\xbc\xb5\
+\x3a\x30\xca\xe5\x32\x2a\x5d\xad\x6b\x7d\x4f\x92\x7c\x0d\x40\x1d\
+\x1f\xb6\x4c\x5e\x28\x99\x77\x71\x8f\xfb\x48\x8f\x1d\xc0\x77\x29\
+\x07\x25\x60\x18\x72\x2c\x62\xa6\xb8\x9e\x56\x91\x61\x46\x6c\x93\
+\xa9\x14\x20\x3c\x31\x4b\x90\xbd\x5b\xdc\x00\x06\x2d\x9f\xca\x4d\
+\x89\xd2\x4a\xcd\x4e\x24\x91\xa4\x57\x8e\x20\xe0\x4a\xcb\x21\xdb\
+\xd8\x6c\x17\x79\x43\x4c\xb2\x39\x66\xf8\x4d\x18\x37\x68\x9f\x6b\
+\x53\x5e\xd0\x9d\xb8\x5e\x68\xcd\x49\xf8\x79\x46\xc6\x3d\xbe\x79\
+\xc6\x20\xa0\x20\x6e\xd7\x37\xfa\x01\x51\x3c\x51\x47\x4d\x4c\xbd\
+\x35\xa6\x3d\xb1\xee\x2c\xd7\xa7\x81\x55\xfe\x67\x8e\xd2\x54\x63\
+\x20\x42\xa2\x41\xb7\x71\x9e\x6e\xd2\xb9\x92\x48\x99\x24\x11\x70\
+\xa8\x1b\x95\xef\x90\x46\xfd\x93\x01\xce\xda\xf9\x2d\x6e\x49\xb6\
+\x9f\xd4\x34\xbd\xee\xff\x00\x0e\x6a\x98\xea\x72\x82\x08\xb7\x29\
+\xd2\x64\x69\x16\x48\xe5\x7b\xe0\xa8\xa1\xc6\x1f\xab\x9e\x18\x9d\
+\x01\x55\x80\x1b\x2d\x05\x38\x11\xed\xc5\x12\xb4\x89\xf1\xb0\x44\
+\x7e\xd7\x89\x2a\x29\xe4\x44\x28\xcd\xbc\x51\x59\x14\x8b\x56\xc3\
+\x0a\x33\x52\xaa\x38\xdd\x2b\xb6\x64\x9d\x66\x77\xdf\xa9\x67\xf8\
+\xd3\x4b\x66\x68\x11\x58\xe3\x1a\xde\xc3\x8d\x00\xea\x54\xa0\xb0\
+\x27\xdf\x8d\x05\x4f\xd9\xdb\xf1\xff\x00\x5d\x38\xb9\xe0\x9e\x74\
+\x5c\xf9\x7e\x35\x72\x81\x4d\xbb\x79\xf9\xb5\x5b\xba\xbc\xdc\x47\
+\x6f\xc7\x82\x6d\xa9\x16\x33\x64\xb1\x3c\x7e\x07\x43\x2e\x59\x57\
+\xf8\x78\xff\x00\x2f\xf1\xd3\x28\x3e\xe7\xf8\xea\xc3\x80\x4f\x9e\
+\x7c\x68\xab\xd8\x1f\xc7\xdf\x4a\xe9\xd9\x1c\x7e\x4f\xb7\x1a\xdb\
+\x81\x5b\x13\x75\x69\x07\x8f\xc6\xdf\xe1\xa8\x61\x5b\x2e\x16\xca\
+\xfe\x7c\xf9\xbf\xd7\x43\x6c\x86\xe3\x3f\x1e\xdf\xcf\xce\xb1\x0a\
+\x70\x8b\x93\xc7\xbe\xb1\xc6\xe6\xdf\x97\xf5\xd2\xb9\x1d\x85\xb9\
+\x3f\x9f\x8b\x9f\xc0\xf3\xa3\x1f\x6e\x51\xf6\x7b\xf2\xbf\xbd\x7b\
+\xe9\xa4\x0b\x71\xef\xcf\x1f\xee\xfa\xd9\xdb\x62\x07\xcf\xef\xe7\
+\xe9\xa6\x28\x79\x1c\x32\xb7\x17\x16\xfa\x1f\x7f\xcb\x51\xc8\xb1\
+\x98\xec\x57\xe5\xf1\xe7\xcd\xbc\xfe\x7c\xf8\xd6\x5d\xac\x6d\xf5\
+\xb6\x40\x8b\x1b\x0f\x3e\x3d\xc1\xb8\xf2\x08\x3c\xea\x1e\xa5\xd2\
+\xe6\x5a\x7a\xda\x57\x2c\x92\x37\x89\x03\x71\x24\x32\xf0\x7e\x1c\
+\xeb\xd8\xc8\x00\x04\x90\x78\x3d\xda\x15\x2d\x4f\x4f\x49\xd6\x61\
+\x85\x84\xd0\xda\xcc\x2b\x3c\xab\xfc\x26\x8c\xb4\x0c\xe3\xb5\x64\
+\x59\x02\x5f\x23\xe3\x55\x14\x52\xc6\x43\x53\x4a\xd1\x72\xa6\x37\
+\x16\x1f\x31\x85\xc9\x75\x53\xc9\xed\x6c\x64\x5f\x88\xa1\x6d\x6d\
+\x18\xde\xf8\xfa\x60\x38\x16\x71\x64\x03\xb4\x1f\xba\xc0\xe2\x7f\
+\x3b\xdf\x55\x74\xb0\x45\xbb\x3d\x0d\x49\x91\xa9\xfc\x39\xa5\x20\
+\x4c\x19\x1b\xc8\x75\x55\x67\xf2\x41\x2b\x6b\x6a\x95\xe0\x76\x6e\
+\xda\x5d\xd9\xe4\x73\x19\x55\x92\x2d\xdf\x83\x50\x7e\x24\x15\x41\
+\x80\xa5\x49\x15\x82\xee\xf1\x85\x8f\x09\xbc\x1a\x53\xe9\x96\x3c\
+\xa4\x9a\x38\xe3\x48\xe2\x4d\xe6\x82\x96\x34\x2e\xcb\x8a\xca\xce\
+\xf2\x33\x64\xe7\x10\x49\xda\xb6\x82\x18\x60\x2a\xab\x38\x65\x1f\
+\x12\xf9\x45\x97\xce\xc4\xb7\x64\x6d\x68\xae\x7b\x4f\x9b\xeb\xae\
+\x56\x86\xe1\x21\x86\x29\x29\xf1\x16\x4a\x9a\x97\x89\x9e\xc4\x0c\
+\x8c\x7f\xab\xe7\x6c\x89\x05\x41\xbe\x85\x92\x33\x23\x0d\xb0\xec\
+\xec\xc2\x39\x07\xc5\x12\x30\xb9\x38\x05\x5e\x00\xb3\x65\x60\x18\
+\x69\x44\x90\xc4\x2a\x11\xc0\x83\x30\xb2\x1d\xaf\x50\xd3\xc5\x89\
+\x95\x18\xe6\xf2\x77\x38\x76\x66\x10\x28\x01\x85\x8d\xc4\x46\x36\
+\xc2\x7a\x7a\xa3\x3f\xc7\x09\x22\xe3\x48\xf2\xde\x2c\x9d\x13\x74\
+\xca\xe8\x52\x21\x63\x2b\xfc\x38\xac\xee\xb6\xea\x46\xa7\x0c\x9a\
+\x55\x41\x36\x72\x4b\xba\x98\x19\x14\xc4\xce\x42\x98\xc5\xdb\x71\
+\xd5\x59\x9a\x62\xc3\x20\xaa\x6e\x9e\x97\xe6\x4e\x1b\x15\xfe\xed\
+\xb4\xb9\x0b\x3d\xc5\xff\x00\x2b\xe9\x9c\x7b\xff\x00\xbe\x74\x7e\
+\x8a\xff\x00\xc3\xfa\xeb\x1d\x9c\xe5\xf0\x4f\x80\x3f\x9e\x8a\x29\
+\x03\x3c\x2e\x3e\xad\x70\x0f\xf4\xbe\x96\xb1\x5b\xe6\x38\x91\xf8\
+\x1f\xf3\xb9\xd3\x9c\xbc\xa7\x3f\xf6\xfe\x3a\x93\xb6\xea\x98\xf7\
+\x7e\x7c\xe8\x62\x47\x3e\xda\xcd\x9f\xe1\x8b\x9b\xf3\x61\x81\xf7\
+\xd7\xa7\xa7\xc9\x69\xf2\x1b\x92\x0f\x07\x9e\x45\xfe\x9a\x29\x10\
+\x03\x1e\x38\xff\x00\x7e\x74\x1c\x90\xb9\x1f\xe7\xae\x66\x0c\xf7\
+\xb7\x24\x5f\xf1\xf6\xf9\x6d\xa9\x18\x59\xb3\xe0\x11\xef\xa6\xe0\
+\xdb\xea\x7c\x6a\x3b\x02\xb9\x35\xb8\xf7\x1a\x53\x99\x64\x3c\x32\
+\xff\x00\x76\xdc\x0f\x1e\xc6\xc7\xf8\x68\xa8\x1c\xb7\x8f\xf1\xd2\
+\x93\x1d\xdf\xef\x76\x72\x7f\x8f\xe1\xe7\xf8\x69\x66\x47\x29\xc7\
+\x18\xf0\x7f\x8e\xb2\x77\x56\x20\x7d\x39\xfe\x77\xd3\xc6\x38\x58\
+\xd7\xfd\xdb\xdf\x59\x0c\x8c\x6e\x09\x07\xdd\x7f\x3f\xf0\x1a\x82\
+\xbe\x8d\xf0\x9a\x2b\x6e\x72\x3e\x20\x1c\x62\xd7\xfd\xef\x94\x93\
+\xc0\xbd\xc8\xb0\xd7\xe9\x9e\x96\xd1\x47\xd7\x3a\x6d\x31\xf5\x74\
+\xee\x48\xa8\x68\xd3\x97\x5e\x18\x19\x94\x29\x66\xde\x24\xf6\x8c\
+\x13\x10\x74\x8e\x4f\xdd\x55\x17\x49\x1a\xeb\x22\xa0\x4f\x18\x0c\
+\x07\x71\x3f\x10\x1e\x3d\xfc\x1a\x7a\x94\x3b\x49\x59\x4c\x29\xaa\
+\x4c\x64\xf3\x2d\x3d\xd0\xb1\xcc\x5c\x76\x48\x93\x28\xee\xba\x70\
+\x75\xbf\x15\xd6\x58\xa4\x14\x41\x96\xed\x18\x95\x26\x5d\xa9\xe4\
+\x45\xb7\x63\xdc\x99\x05\xc1\x05\x8b\x82\xaa\x2d\xaa\x8d\xd1\x35\
+\x3c\xa6\xb2\x9a\x09\x29\xdd\xa2\x22\x18\x3d\x2b\xee\xc6\xf2\x2a\
+\x24\x6f\x24\x86\x65\xa8\xc9\x40\x1b\x8b\xb6\x47\xca\x04\xe9\xce\
+\xe5\x3d\x33\xd4\x1b\x0b\xbb\xaa\xed\x44\x85\x88\x7b\x22\xba\xcb\
+\xdf\xda\x72\xb0\xc7\x1d\x54\x55\x26\x02\x5a\xbe\xaa\xf1\x72\x0f\
+\x31\x51\xd3\xc6\x0d\x43\x2d\xc3\xed\x48\xd2\x48\x15\xb2\xe6\xcd\
+\xc7\xbe\xa5\x42\xd1\x22\x4b\x91\x8d\xf3\xc9\x6a\x3f\x58\xc7\x61\
+\xb1\x19\xa3\xb4\x0f\x1b\xc6\x01\x05\xbb\x96\xfd\xc3\x11\x54\xb9\
+\xc9\x2b\x34\xd1\xbc\xc8\xe2\x4a\x7a\x25\x85\xb8\x07\x85\x76\x65\
+\x8c\x5a\x16\xb1\x33\x06\x71\xc5\xb5\x3c\x8b\x50\x09\x80\x59\x64\
+\x11\x3b\x07\xa8\x66\x58\x1a\x27\x66\x18\x42\xa9\x09\x35\x01\x8a\
+\xbb\x30\x8f\xe1\x77\x81\xaa\x49\xd7\x18\xdb\xa8\x24\x95\x4e\x22\
+\x8e\x38\x52\x4b\x38\x40\xe8\xb0\xa8\xbc\x6d\x8e\x56\x75\x87\xbb\
+\xb8\x46\x2e\x6e\x91\x4b\xcc\x8e\x7d\xf5\x7e\x2e\x6c\x4d\xbd\x85\
+\xc6\x9e\xeb\x70\x6f\x86\x99\x0f\xbb\xe7\x7f\x6f\x3e\x34\x0c\x29\
+\xc8\x3f\x35\xb4\x78\x23\x6c\xe4\x08\xf1\xda\x6f\x6f\xc8\xf8\xfe\
+\x3a\x8c\x84\xc2\x53\x88\x65\xff\x00\x31\xa0\x1d\xec\x4b\x32\xf9\
+\xf6\x07\x44\x19\x2f\x9e\x3f\x8d\xfb\x7f\x86\x8b\x9b\x36\x3c\xf2\
+\x47\xf5\xfc\x34\xfd\x3a\x95\x82\x41\x19\x26\x69\x07\x8e\x4d\xed\
+\xfc\xf8\xd0\x81\x42\xdd\x3c\xb7\xd7\xdf\xfc\x75\x36\xea\xf2\xeb\
+\x92\x0f\xae\x43\xfc\xb4\x76\x95\x84\x71\xdd\xb2\xff\x00\xfe\x75\
+\x21\x90\xbe\xda\x21\x16\xfe\x1e\x74\x19\x8f\xc1\xbf\x6d\xef\x6f\
+\xe1\xa4\xda\x38\xf3\xcd\xaf\xfe\x1a\x84\x8b\x30\x8d\xaf\xfe\x5a\
+\x3b\x4b\xdd\x6f\x1f\xef\xf9\xeb\x09\x7e\x9e\xfe\xe4\x73\xa0\x50\
+\x8f\xa9\xe7\x59\x40\x85\x81\xed\xbd\xcf\x07\xf9\xe9\xc3\xb3\xb5\
+\xfc\x73\xc6\x9e\xe2\xf9\x76\xdb\xdf\xcd\xb8\xd6\xf9\xb0\x05\x79\
+\x07\x4f\x6b\xe0\x78\xe0\xdb\x50\xd6\x53\x3e\x66\x38\xc8\x78\x98\
+\xf6\xcb\x1e\x24\x3c\x6f\xe2\xe1\x90\xb0\xc7\xf1\xe2\xc6\xc7\x57\
+\x4b\x88\x56\x08\x5d\xcc\x99\x18\xe1\x85\x95\x99\x18\xc3\x9a\x09\
+\x12\x1b\xb2\xcd\xdc\x98\xb4\x79\x86\x40\xba\xdd\x86\x71\x2b\xd1\
+\x4b\x13\x10\xa5\x5d\xde\x29\x2a\x02\x35\xd2\xef\x2c\x35\x41\x1e\
+\x25\x8d\x54\x98\x66\x80\x29\x0e\x71\x60\xd5\xef\x03\xac\x89\x2f\
+\x53\x66\x95\x52\xcc\x20\xa9\x57\x14\xd3\x47\x36\x52\x23\x34\x3b\
+\x72\x06\x63\x16\x04\x49\xd8\x09\x24\x6a\x78\x65\x13\x43\xe9\xab\
+\xd3\xa7\x89\x1a\x0f\xd4\x24\xa9\x68\x2f\x54\xaa\x5d\xc4\xea\xdb\
+\x91\x99\x32\x99\x65\x09\x18\xe1\xbe\xf0\xa4\x92\x27\x85\x77\x2a\
+\x16\x9c\x7b\x14\x2b\xb2\x62\xf5\x52\x59\xf3\x81\xe5\x44\x91\x63\
+\x54\xba\xa8\xb3\xe7\x90\xd5\x00\x25\x44\x95\xa6\xae\x79\x64\x18\
+\xe0\x27\x59\x67\x59\x23\x53\x92\x87\x40\x05\x95\x50\x05\x39\x02\
+\x9b\x98\xb6\x2d\x41\xd4\x0d\xe3\x65\x8a\x19\xab\x61\xe2\x6a\x19\
+\x95\xfe\x05\x53\xc6\x4c\x44\x0c\x58\x06\x2a\xc4\x9b\x2e\x3c\x8b\
+\x35\x1a\xad\x50\x9e\x6d\xb7\xaa\x22\x10\x8b\x4b\x3c\x74\xf4\xa9\
+\x25\x64\xc2\x5c\x51\xde\xaf\x6a\x29\x67\x14\xa2\x23\xb6\xab\x7e\
+\xe0\x5c\x3c\x3d\x26\xa4\x24\x15\x76\xa7\x93\xd1\xb5\xde\x07\x9a\
+\xa1\x53\xd1\x1a\xc9\xe9\xdd\x99\x21\xa6\xa0\xfd\x61\xa7\xbe\xf0\
+\x69\xdc\x25\x3b\x4c\x88\xba\x8d\x21\x37\x82\x9e\x82\x95\x21\x61\
+\x1b\x43\x7f\x86\x18\xe6\xa5\x9b\x36\xbc\x84\xc8\xce\xf2\x3a\x9d\
+\xae\x6f\x21\xdb\x35\x17\xb2\xa9\x24\x7f\x0d\x7c\x23\xc2\x8b\x33\
+\x0f\xc3\xeb\xa5\x89\x8f\x81\x66\xfe\x3c\x68\x84\x04\xdf\xc7\xd0\
+\x7b\xeb\xe2\x52\x89\x2e\x9c\x12\x40\x1c\x7e\x7a\xda\x09\xdc\x6e\
+\x7f\xe5\xe3\x5c\xe4\x6d\x89\xbf\xe4\x7f\xc2\xde\x75\x68\xec\x7f\
+\x2f\xab\x1e\x6c\x35\x1a\x8f\x63\xf8\xfe\xe9\x1e\xe7\xe9\xa7\x8e\
+\x8b\x28\xf3\x5b\x48\x16\xf6\x3f\x96\xa4\x79\x6f\x96\x19\x48\x4f\
+\xd7\x59\x46\x6e\x2f\x76\x60\x78\xb5\xaf\xfc\xf5\x9c\x8d\xf0\x82\
+\xe2\x3f\x25\x1c\x79\xbf\x9d\x24\x31\xf6\x0c\xac\x6d\xef\x73\x6d\
+\x15\x56\xf8\x8c\x00\x3c\x7e\x5a\x50\x48\x56\x4f\xad\xad\xfc\x35\
+\x92\xff\x00\x4b\x6a\x13\xf3\x37\xd3\xfd\x74\x72\x40\x0d\x8f\xf8\
+\x5f\x44\x43\xc5\x98\xf0\x3f\x96\xbe\x33\x64\x9c\x1e\x74\x23\x85\
+\x46\xdd\xee\xfa\x26\x11\xdb\xe2\xff\x00\xbb\xff\x00\xbf\x8d\x33\
+\x4b\xcc\x84\x64\x2f\xac\x40\xfe\xce\xe2\xde\x34\xcc\x5c\x73\x7b\
+\xaf\xd0\xfe\x1a\xc3\xf6\x91\x9f\xe9\xcf\xf9\x6a\x69\x5e\x50\x15\
+\x25\x11\x31\x66\xc0\x6c\xcd\x79\x14\x09\x0f\x08\x44\xf6\x28\x4f\
+\x65\xdd\x83\x5c\x1e\x2a\x69\xa3\x78\xe2\xaa\x6a\x78\x84\x89\x14\
+\xf0\x2c\xb5\x3c\x0d\x82\x4a\x7a\xd8\xea\x5a\x2b\x29\xde\xdd\xa4\
+\x9d\x10\xc8\x5a\x56\x51\xb7\xaa\x2a\x6a\xaa\x65\xa4\xae\x26\x29\
+\x65\x59\xa0\x82\x8e\x4e\xa3\xb8\xa1\xe4\x87\x38\x59\xda\x96\xab\
+\x25\x0b\x1c\xa4\xc8\x26\x66\x8d\xb0\x56\xee\xd0\x5a\x6a\xb5\x56\
+\xae\x77\x41\x4b\xd5\xbe\x34\x73\x47\x32\xe7\x33\xfa\xc5\x0b\x1c\
+\xec\x02\x81\x0d\x9e\x9e\x4f\x4f\x2d\x45\x2c\xd2\x25\x5c\x4a\xd2\
+\x35\x69\x86\x62\x90\x75\x7e\x9b\x25\x53\x40\x2f\x24\x34\xe2\x0b\
+\x75\x1f\x86\x58\x13\x29\xf8\x39\xb0\x0f\x4e\xf1\xfc\x82\xe1\xb2\
+\xaf\xe8\xd2\xd5\x61\x1c\xb5\x55\xa9\xf6\x77\xab\x4b\x8c\x30\x4e\
+\x57\xd3\xb7\xa7\x86\x29\x76\xea\x4b\xcc\xd3\xc5\x2c\xa5\x61\x5d\
+\xad\xab\xcd\x25\xd5\xc4\x55\xdd\x23\xaf\x47\x37\x4e\xaa\xa2\x2d\
+\x47\x30\x66\xff\x00\xcc\xc9\x05\x4e\xc3\x9d\xda\xdd\xb2\x82\xdf\
+\x24\xca\xd2\x44\x58\x76\xe6\x48\x43\xd5\xa9\x7a\x8f\x46\x99\x22\
+\x9e\x89\x2b\xbe\xc9\xc8\x8e\x63\xf5\x35\xb1\xd3\x52\x09\x6a\x6b\
+\x24\x55\x1b\xf1\x65\x1b\xc0\xfb\x22\x36\x75\x32\x3c\x6c\xb9\xa3\
+\x25\x2f\x5d\xde\x83\xd0\x53\x51\x53\xf4\xfa\x35\x9f\xd4\xb4\x27\
+\xaa\x33\x3a\x42\xd0\xca\xf2\x25\x42\xcf\x4e\x12\x49\x4c\x93\xfc\
+\x48\x5a\x40\x82\x62\x14\x61\x45\x2b\x7c\x32\xb0\x53\x53\x98\x10\
+\x1b\x21\xc0\xb5\xf3\x45\xd8\x3b\x6a\xf8\xb9\x57\x77\x2d\xcb\x9b\
+\xf3\xa8\xa0\x8c\xdd\x8f\x92\x3d\xfe\xbf\xd3\xf0\xd6\xdd\x8e\x2f\
+\xe4\x7f\xae\xbb\x57\xf3\xfa\x78\xe3\xfa\xe9\x0b\xdd\x43\x27\x3f\
+\x85\x87\xf9\x9d\x25\x3c\xef\x8a\x32\xf1\x91\xe4\xe9\x44\x00\x99\
+\x47\x69\x05\x4f\x70\xfc\x79\xf2\x3c\xff\x00\x0d\x05\x50\x03\x35\
+\xf9\xfb\xdc\x8d\x28\x77\x37\x37\x3f\xc6\xc7\x5b\x8d\xda\x72\xb0\
+\xd2\xc8\x78\x37\xf3\xc7\xf5\xd3\x1a\x61\x62\x07\x71\xb7\x9f\xaf\
+\xf4\xd3\x52\xa5\x9b\x75\xf2\x07\xf1\xf7\x02\xd6\xe2\xd7\xd4\x2a\
+\xfe\x19\x79\x03\xeb\xf8\xe9\x52\xcd\xf3\x0b\x7f\x03\x7d\x06\x17\
+\xcc\x78\xe7\x9f\xe3\xac\x7b\x82\x2f\xd3\xdf\x4e\x8d\x75\x74\x04\
+\x7e\x7f\x4d\x46\x4b\x10\x57\x1f\xeb\xcf\x3a\x0c\xb2\x1c\xf1\xe4\
+\x0e\x07\x8d\x33\xb1\xe3\x3f\x17\xd1\x10\xbe\x37\x3c\xe8\xad\x4d\
+\xbf\x0e\x74\x56\xc2\xdc\xd8\xdf\xc7\x1a\x6f\xba\x6c\x42\xd8\x5f\
+\x58\xa7\x2a\xb6\x8c\xfe\xf7\xf0\x1f\xef\x8d\x2a\xf7\x00\xef\xf4\
+\xfa\xe8\x4d\x93\x5c\x8e\x79\x00\x7e\x1c\x63\x7f\x3f\x8e\xba\x9d\
+\x3c\x85\x9c\x3d\x38\x3b\x42\x3c\xae\x11\x6c\x71\x26\xf8\xf6\x5c\
+\xb3\xd9\x8a\xdb\x35\x17\x16\xd5\x15\x44\xd1\xf5\x5a\xf8\xe9\xde\
+\xe3\xa6\xf5\x4d\xc3\xd2\x91\x6e\x84\x4b\x9b\xf3\x5e\xb1\xb5\x9a\
+\x38\xb6\x11\x4b\x2a\xad\xbd\xf5\x2f\x54\x86\x1e\xa1\x31\xe9\xa1\
+\xa9\x10\xd0\x74\xfa\x9a\x48\xbf\x79\x96\x5a\x09\x22\x3d\x22\x78\
+\xb1\x1e\x37\x5a\x73\x88\x0d\xb3\x1e\x4c\x28\xcf\x4f\xa7\xaa\x8a\
+\xa9\x7a\x93\x4b\x51\x0f\x54\x8e\x9e\x6a\x2f\xd7\x4c\xb3\x43\x1c\
+\x8a\xf5\x49\x4b\x0f\xc3\x6d\xb6\x35\x15\x6d\xb7\x0f\x7e\xe3\xca\
+\x89\x7a\x48\x05\x22\x4b\x5d\xd6\x68\x3f\x47\x56\xf4\xca\x2a\x79\
+\x62\xe9\x74\xcb\x59\x36\xfa\xd6\x09\xeb\x8d\x44\xb0\x43\x47\x45\
+\x0c\xe9\x4c\x4e\x74\xd2\xb2\x34\x86\x58\xd0\x22\x9a\x9e\x8b\xd5\
+\x6a\xe2\x8e\x64\xaf\xa7\xa1\xe9\xbd\x51\xe2\x9f\xa6\x3d\x64\xb5\
+\x62\x2a\xe7\x4e\x9c\x81\x1d\x6b\xd1\x2b\xc5\x33\xf5\x19\x40\xdc\
+\x9e\x76\x68\xe0\xc6\x1a\x87\x65\xe9\x5d\x57\xed\x15\x4d\x25\x6a\
+\x52\x4f\x35\x47\x4d\x9c\xa1\xa9\xfb\x4c\xd4\x94\x10\x2b\x52\xa3\
+\x8a\x58\x8c\x7d\x41\xfa\x8c\x53\xd4\xd7\x1a\x44\xda\x8e\xa5\xe9\
+\xe1\x14\xca\xa5\xd9\x56\xa7\xa7\x4c\xd8\xd0\x9f\x49\x4e\x60\xa2\
+\x47\xa2\xae\xa9\xa4\x40\xa9\x35\x57\x4a\x2e\x55\x17\xd5\x43\x4c\
+\x94\xf4\xb1\xfe\xce\x96\x55\xa9\xf5\xed\x94\x68\x67\xea\xd4\xd6\
+\xea\x3f\xa3\xe6\xfb\x41\xf6\x7d\xb7\xfd\x01\x92\xaa\xae\x5a\x6a\
+\xfa\xa8\xe9\x28\xea\xe1\x59\x36\xea\x60\xa6\x8d\x6b\xe4\xa7\xea\
+\x28\xf4\x52\x16\x78\x4f\x51\x83\x7a\x4a\x33\xaa\x86\xe9\xeb\x5d\
+\xe8\xba\x72\xc9\x04\xb3\xf5\x02\x37\xe5\x96\x23\x1c\x55\x6d\x2c\
+\x41\x63\x6c\x7d\x54\x67\xd1\xcd\x2c\x4b\x1b\xc7\x79\x02\x82\x13\
+\x34\x9a\x4e\xe4\x11\x62\x7f\x75\x1f\x92\x0d\xbc\x1e\x38\xbf\x8b\
+\xe8\x28\x60\x6f\xf7\xbf\xe5\x19\x73\xfc\xb5\xb9\x65\x63\xf4\x1f\
+\xd3\x52\xa9\x4e\x53\x2e\xef\xf0\xd2\x45\x23\x32\x90\x3b\x0a\x9b\
+\x5b\x4c\x8a\xb7\x91\x7b\x89\x1f\xef\x8d\x24\xdc\x48\x99\x58\x8e\
+\x49\x1a\x3d\xb6\x55\xe4\x5f\xf2\x3e\x75\x76\x6b\x28\xe7\xcf\xd3\
+\xe9\xa6\x31\xe4\xb4\xa2\xd8\x9f\xde\x6f\x7f\xc3\x52\x48\x7c\x2a\
+\x5f\x8b\x0b\xea\x4a\xa0\x6c\xc9\x79\x23\xe7\xb6\xd7\xe7\x8e\x4d\
+\xed\x7b\xf3\xa3\xb9\xf2\xdc\x7f\x8d\xbf\x96\xa3\x9d\x08\x3c\x0e\
+\x47\xd4\xf1\xfe\x7a\x32\xb9\x24\xd8\x37\x3e\xe0\x8f\xad\xbd\xbc\
+\xea\x58\xd4\x82\xe5\xad\x6f\x70\x3f\x0d\x27\x04\xe4\xe0\xff\x00\
+\x0b\xea\x42\xb1\x92\xb6\x5b\x30\xfb\xa5\x74\xb1\xe2\x78\x1f\x37\
+\xb1\xd7\x6a\xfb\x5f\xf8\xeb\xcd\xaf\xcd\x8e\x94\x16\x6c\x6e\x3e\
+\xe5\xec\x3f\x30\x74\x24\x12\x09\x0d\xb9\x5b\x72\x3f\x3d\x3c\x57\
+\x17\x01\xac\x7d\xc7\x07\xdf\x4d\x0d\x4d\x8e\x6d\x60\xd6\xf1\xf8\
+\xfe\x7a\x0e\xb8\xb9\x1d\xdc\x79\xfa\xfb\x73\xc6\xa4\x8f\x7c\xb4\
+\x3f\x73\x71\x7b\x87\xe4\x78\xff\x00\x0d\x2c\x33\xe4\x37\x94\xa2\
+\x55\x46\x0b\x6d\x92\xa7\x97\x5c\x80\x65\xf6\x65\xf7\x52\x78\x3e\
+\x0d\x5c\x7b\x10\x53\x14\xaa\x97\x3f\xec\x2a\x65\x90\xe5\x8d\x45\
+\x46\xd3\x2c\x71\xd3\x34\x61\x64\x8a\x2d\xc6\x76\x7b\x2e\xcf\x76\
+\x80\x96\x68\xfa\xb4\xb1\xc5\xe9\xa9\xe9\xcc\xeb\x0f\x4d\x82\x35\
+\xc7\xf5\xae\xa7\x5a\xa6\x96\x49\x16\x3e\x4a\x52\x01\x00\x67\x54\
+\x8d\xe4\x65\x63\x7a\xb8\x9b\xad\xa7\x53\x4e\x92\x2a\x66\x11\x57\
+\x50\xfa\x9e\x98\x2b\xcc\x51\xcd\x15\x43\x40\x67\x99\xde\x96\x95\
+\x96\x3a\x4e\x9f\x14\x70\xdc\x48\x92\xd5\x3e\x00\x44\x05\x35\x7f\
+\x5c\xac\x8e\xa2\x5e\xbc\xed\xfa\xb5\x3f\x53\xea\x25\xba\x8c\x74\
+\xd4\xf7\x6a\xfa\x34\xa9\x49\xe5\x71\x47\x24\xf0\xa0\xdb\x14\x4b\
+\x54\x8d\x33\x2a\xc8\x90\x08\x18\x56\x55\x52\x75\x5e\x89\xd3\x7e\
+\xce\xcb\x1d\x33\x75\x39\x1f\xd5\xf4\x99\x27\x8b\xa7\xe7\xd1\xa1\
+\x82\x8a\x78\xe1\xad\xa5\x47\x9d\x8a\xd7\x75\x7a\x28\xcf\x4f\x90\
+\x5a\x0a\x98\xde\xaf\x09\x47\xe9\x3e\x95\xd1\xa0\xa7\xa6\xea\xdf\
+\x66\x7f\xf0\xfa\x73\x55\x1d\x4a\x75\x4e\xa1\x05\x28\xaf\xaa\xa5\
+\xa5\xa4\xf5\x0a\x82\x93\xa2\xba\x09\x9f\xaa\x46\x69\xe6\x91\xcc\
+\x34\x6f\x14\x9b\x76\xd7\x44\x1f\x69\x7e\xcf\xc7\x57\x2f\x51\x6a\
+\xa1\x47\xd4\xea\x52\x7e\x9f\xd6\xa8\x27\xae\x44\xa8\xa8\x8a\x68\
+\x1d\xd1\x3d\x4e\x31\xbf\xcb\x0e\x31\x52\xb5\x2c\xa0\xa2\x32\x18\
+\xe3\x8e\x9a\xa8\xd2\x74\x85\x78\xd5\xfa\x9c\x59\x34\x72\x51\xd5\
+\xcb\x5a\xb8\xc9\x47\xc9\x86\xa2\x8a\xb2\x09\x68\x27\x9a\x2c\x22\
+\x9e\x26\x6c\x9c\xab\x21\x4a\x6e\xa9\xd4\x04\x72\x74\xa9\x68\xa9\
+\xfa\x4f\x50\xe8\xb0\xa3\x94\xa6\x92\x96\x4a\xca\x39\xda\x19\xfe\
+\x24\x93\x9a\x5e\x9e\xb1\xbd\x43\x38\xf5\x33\xc8\xdc\xc7\x2e\xc0\
+\x9b\x4c\xb4\x8f\x24\x94\x6f\x8b\xd2\x17\xc4\x95\x82\x55\xcf\x02\
+\x53\xe1\x30\x52\xcb\xb4\xd1\xbc\xa2\x54\xc9\x81\x1b\x72\x00\x2a\
+\x79\xc7\xe9\xf5\xb8\xc7\xfc\xf4\x24\x21\x8c\x4c\xb8\xff\x00\x1f\
+\x6f\xeb\xe7\xf0\xd1\x82\x25\xc8\x1f\x99\xbe\xad\xfe\x9a\x1d\x87\
+\xb4\x0f\xf7\xe3\x5b\xc4\xa8\x2e\x17\xf1\xb8\x2c\x3c\x83\xf9\xfe\
+\x1a\x79\x19\x51\x58\x5d\xbe\xe8\xbf\xe5\x71\xa9\xaa\x86\x38\xc6\
+\x7c\x35\x86\x40\xfd\x3f\xdf\x8d\x08\xf1\x14\xf4\xc9\x6b\xde\xc0\
+\x3d\x8f\x76\x3f\xc3\x5e\x9e\x39\x11\x6d\xdc\xbe\x0f\x1f\xc3\xf1\
+\xd3\xc3\x4f\x26\x50\xa9\xc5\xc0\xf7\xb1\xbf\xf2\xe3\x45\x72\x20\
+\x35\xc5\x87\xb7\xe1\xfc\x7c\x6a\x27\x0d\x6d\xc1\x6b\x7b\x86\xfc\
+\x74\x61\x8d\x9e\xc9\xe7\xf0\x23\x9e\x3f\x96\xb6\xea\x1f\x84\x50\
+\x80\xdf\x9b\x0e\x3b\xaf\x7f\xe9\x6d\x2e\x2a\x2d\x7e\x4a\x9f\xf1\
+\x1a\x8e\x25\x4c\x9c\x79\xfe\x5a\x96\x53\x1e\x1c\x94\x60\x4f\x23\
+\xb7\x2d\x4f\x0a\x2f\x62\xdc\x29\xfc\x7f\x0d\x6d\xb2\xd8\xf1\xa4\
+\x91\xdf\xda\xf6\xb7\x1a\xdc\x4f\x16\xe4\xf3\xa6\x02\x46\x45\xf1\
+\x71\x7e\x47\xf7\x85\xff\x00\xc2\xda\xdc\x49\x6c\x79\xb8\xfa\x9b\
+\x1d\x32\xfb\xf3\x8f\x1f\xef\xdb\x43\x7d\xc6\x43\xb1\xc1\xb8\x61\
+\xec\x3d\xfe\xba\xf8\x6a\x19\x3c\xdc\x5f\xfd\x75\x13\x49\xff\x00\
+\x97\x66\xbb\xb1\x56\x65\x8c\x58\xf7\x59\x08\x6b\x2f\x9e\x0d\xff\
+\x00\x11\xa4\xd8\x90\x34\x0e\xaf\x79\xe0\x98\x98\xa7\x6e\x03\x54\
+\xcd\x1e\x16\x69\x44\x6a\x53\x6c\x63\x2a\x82\x4b\x3b\xf8\xd5\x2c\
+\x10\x24\x52\x9a\x48\x7b\xe3\x48\x55\xd9\x04\xe7\x1d\xcc\x0c\x33\
+\x09\x5a\x47\xf8\x0b\x1a\xc6\x33\xe4\x4a\xdb\x72\x5d\x66\xe9\x4e\
+\x63\xa5\xfb\x3c\x2b\x23\x3d\x56\xac\xd4\xd2\xc4\xdb\x46\x78\xf2\
+\xa1\x82\xa1\xe2\x9a\xfe\xb3\x03\x0d\x5c\xb3\x32\x1a\x4d\xbd\xe6\
+\x95\x52\x31\x6a\xda\x5e\x9b\xd3\xba\x4a\xd3\xf4\xb8\xe1\x93\xa4\
+\x53\x75\x7e\x9f\x46\x68\x0f\x4e\xdb\x1d\x3d\xa8\x29\x3e\xd4\xd3\
+\x40\x0d\x3d\x36\x57\x90\xcb\xd5\x56\x38\x1d\x80\x5a\x5a\xed\xc7\
+\x46\xd4\x6d\xd6\x6a\x6a\x26\xea\xd4\x21\xba\xa7\x41\xdb\x8b\xa9\
+\x45\x43\xd2\x96\x0a\x6a\xba\xb1\xd3\xde\x28\x12\x92\xbe\x3a\x65\
+\x3e\xa6\x92\xa9\x29\x9a\x4a\x29\x55\x63\xea\x51\x3b\xd8\x36\x97\
+\xed\x45\x37\x50\x79\xba\x92\xfa\xa9\x21\x6a\x89\x21\xa8\x92\x8f\
+\xac\xf5\x2a\x45\x8e\xba\x93\x09\xa2\x8f\x7f\xa5\xc1\x14\xb0\xd7\
+\x23\x31\x56\x9a\x0a\xb6\x9d\x05\x42\x59\xa9\x9f\xac\x75\xd1\xbf\
+\x57\xd5\x3a\x95\x45\x6f\x52\x87\xd6\xee\xcd\x49\x1b\xfa\x78\xe4\
+\xdc\xa5\x90\x87\xa5\x8a\x9e\x2e\xa7\xb4\xc9\xb4\x8e\xf1\x25\x32\
+\xee\x6d\x6c\x89\x7a\xe7\xd9\x8a\xaa\x8a\x69\xeb\x21\x0b\xd3\xa9\
+\xa0\xa8\xfd\x52\xa2\x4a\x63\x0b\xcb\x05\x25\x97\x17\xdb\x32\xc9\
+\x1e\xf3\xc2\xec\xd4\xd2\xcb\x14\xd6\x56\x9c\x18\xfa\x91\xad\x8a\
+\x48\x6b\x2a\xba\x5c\x3b\xbd\x56\x94\xd5\x42\x5a\xa9\x2b\xa4\xa0\
+\x5a\xea\xde\x9f\x21\x1f\x1a\x6e\x9b\x0d\x04\x50\xb3\x08\xeb\x44\
+\x7b\x35\x34\xd5\x1e\xa3\x73\xd4\x74\xfa\x89\x69\x4d\x34\xb2\x51\
+\x41\x0c\xb1\x0c\xe5\x86\x39\x68\x94\xa4\xd0\x43\x29\x5b\xe3\x4a\
+\xed\x83\x40\xcc\xe9\x4d\x33\xc8\xa5\xf7\x5f\x12\x88\xea\x58\xde\
+\x4c\x7f\xe9\x22\xda\xdb\x20\xc4\xd1\x9f\xe2\x6f\xc7\x1a\x66\x98\
+\x36\x3e\xc7\x1b\xff\x00\x13\xf9\xf8\xd3\x5f\xb6\x32\x6f\xb8\x47\
+\x1e\x0f\x81\xf9\xea\x27\x5f\x3b\x06\xff\x00\xc0\x7b\x2e\xbd\x3b\
+\x1c\x12\x25\xb9\x37\xe5\xff\x00\x0b\x5f\xfc\xb4\x77\x16\x41\x4a\
+\x87\xe5\x1d\xa3\xc5\x87\xf5\xb5\xf4\x8c\x58\xc6\x13\xee\x8f\x7f\
+\xcb\x8b\xfe\x7c\xe9\x45\x3d\x54\xc1\x8a\xf0\x1f\xc7\x3f\xc3\xc5\
+\xb4\x37\x5f\x73\x3e\x1a\xdf\x5f\xf5\xd6\x5f\x2a\x13\xa7\x55\x19\
+\x08\xdf\xf6\x9f\x81\xe0\x5b\xf2\xd1\x56\x60\x6e\x3b\xff\x00\x1f\
+\xcb\xf1\xfa\xf9\xe3\x58\x53\xb3\x00\xed\xfc\x2d\xa7\x9e\x6c\x5e\
+\xe3\xb5\x8f\x9f\x07\x4c\xe3\xe9\x6f\x1c\x71\xac\x20\x06\xd2\x58\
+\x92\xbe\x3f\x1c\xbf\x31\xc7\xe7\xa9\x27\x96\xdc\x9f\x04\xdb\x1f\
+\xc7\xf3\x27\x8d\x1d\x80\xcc\x43\x8b\x9b\x78\xfc\xb9\xe7\x8d\x26\
+\x44\x2a\x72\x8f\xcf\x20\xfb\x1b\x7d\x00\xe4\xfe\x5e\x46\xaa\xd0\
+\xee\xed\xed\x97\x13\x6d\xbf\xc3\x3e\xca\xe0\x21\x5e\xf3\x6c\x70\
+\x76\x36\x3f\xc7\x59\xbc\xff\x00\xab\x07\x08\xff\x00\x98\x91\x97\
+\xe4\xb1\x6b\x9e\xd1\x6b\x1c\x2f\x93\x76\x8d\x43\x51\x48\x8d\x51\
+\x9a\xee\x4c\x90\x8d\xc0\x18\x03\x75\xc9\x2f\x72\x38\x3f\x77\x1e\
+\x49\xbf\x8d\x77\xd8\x38\xb7\x6b\x5f\x20\x48\xe5\x6d\x88\xf1\xf5\
+\xf1\xaf\x51\x18\x07\xf7\xac\x2d\x6f\xa7\x8f\xc7\x4f\x4f\x89\x73\
+\xf2\xd8\x9f\xf0\xfc\xbc\xff\x00\x0d\x6d\xc8\xc3\xbf\xea\xe5\x79\
+\xfa\x0e\x47\xbf\xfd\xf4\x9b\x84\x47\x34\xa7\x7e\x9a\xce\xa5\x5d\
+\x4c\x80\x85\x23\x12\xa7\xf1\xb2\x86\x23\xcb\x5b\x55\x12\xcf\x4a\
+\xf1\xc0\x47\xc4\x92\x86\xa0\xd2\x55\x08\xef\x8a\x88\x8a\x19\x24\
+\xc8\xa0\x2b\xf3\x27\xb1\xe3\xbb\x2a\x9a\x5a\x55\xa5\x5e\x93\x47\
+\x17\xab\xad\x5f\x4f\xea\xda\x9d\xa7\x95\x90\xd4\x55\x45\x09\xa9\
+\x5a\x84\xa7\x54\x48\xe4\x8a\xa5\xb2\x74\x69\x4c\x82\x57\x6d\x3b\
+\xca\xcb\x35\x0d\x24\x6b\x0c\x13\xf4\x98\xa9\x1e\x96\xb2\x8e\x77\
+\xdd\x75\xaa\x32\x44\x36\x0b\xe3\x21\x48\xae\xe2\x3a\x59\x3d\x38\
+\x98\x33\x6d\x38\xa6\xa0\xac\xad\xe9\x02\x89\x94\xc5\x34\x49\x36\
+\x14\xd2\x1e\x9f\xe8\xe2\x58\xa0\x49\x60\xa9\xa3\x80\xce\x53\xd2\
+\x4c\x3a\x88\x1d\x22\x39\x2a\xa1\x9d\xea\x28\x6b\x26\xa5\x79\x28\
+\xeb\xa8\x22\x5e\x93\x0a\xc7\xd3\xa3\x93\xa5\x75\xda\x8a\x18\xa9\
+\xa7\xa6\xc6\x5a\x71\x55\x40\xe0\xaf\x5a\xdf\xa9\xdb\xdb\xac\xa4\
+\x9c\x24\x54\x3b\xb0\x41\x35\x5c\xf1\xd3\xef\xb7\x4e\xa0\x97\xd6\
+\x27\x54\xe9\xa2\x0a\xc8\xa3\x9e\x2e\xa3\x53\xea\x7a\x6d\x24\x95\
+\x94\x51\xd2\xe4\xac\xad\x37\x4e\x96\x24\xf4\x35\x14\xd3\xfa\x4e\
+\xa7\x42\xb3\xc7\xb5\x57\xb2\x20\xa1\xa3\xfb\x47\x4f\x94\xd3\x4d\
+\xd6\xa9\x6a\x3a\xac\x76\x91\xba\x75\xaa\xe0\x53\x3d\x4c\x75\xdb\
+\xd3\x3d\x0d\x24\xfd\x43\x31\x50\x88\x81\xa1\xa7\x1b\x59\xfe\xad\
+\x0d\x4c\xbf\xa6\xbd\x3b\x55\xd7\xd7\x74\xfa\xce\x89\x59\x24\xb1\
+\x89\x12\xb9\x58\x47\x28\x8a\x28\xe5\x27\xf4\xac\x50\xf4\xfa\x48\
+\x2a\xe3\xea\x1b\x94\x9e\x97\x2a\x95\x4f\x8b\x02\x6a\xae\x9f\x72\
+\x35\x79\xab\x72\xa3\x88\x3f\xa9\xa8\xa4\x92\x44\xa6\x89\xe4\x95\
+\xd4\xe3\x24\x55\xca\xaf\x58\xf5\x03\x14\x4d\xc0\x85\x43\xb1\x58\
+\x8c\x1d\x46\x13\x14\xb0\xab\xca\x12\xdf\x3a\x92\x85\x4a\x9b\x63\
+\x69\xee\x36\x88\xbf\x9b\x73\xe7\x4b\x66\x00\xe4\x85\x80\xfa\xb7\
+\x36\xff\x00\xa7\xe5\x6f\xc7\x4d\x6f\x97\x1f\x90\x64\x01\xe3\xeb\
+\x7f\xe3\xa9\xad\x10\x6b\x7c\x9e\x78\xe7\xf1\xe4\xe9\x76\xe7\x12\
+\xca\x55\xd3\x00\x3f\x78\xe3\xc7\x37\xf7\xfa\xe9\xaa\xeb\x01\x67\
+\x21\xbb\x48\x38\x2f\x9f\x03\xfd\x4e\x9e\x9e\x38\xf2\xb9\x0b\x60\
+\x2c\xa0\x5f\x8d\x19\x2a\xe4\xef\xb5\xd2\x9d\x6c\x4d\xfd\xbf\x1d\
+\x7a\x99\x86\xcc\x63\x84\x4f\xbd\xc7\xd7\xce\xa6\x0c\xae\x4c\x72\
+\xf9\xc0\x95\x61\x6b\xf0\x74\xa2\x35\x75\xf6\xe5\x7e\xbc\x69\xbc\
+\x23\x20\xef\xc8\x5b\x93\xf8\xe9\x8b\xd4\x46\xb6\xbd\xb9\xf3\xf9\
+\x6a\x17\x8a\x54\x26\xdd\xde\xfa\x48\xa3\x75\xcb\x12\x58\x8f\xcf\
+\xfd\xf1\xee\x78\xd6\x5b\x0e\xcc\xe8\x66\xc4\x0f\x89\xb3\x9e\x19\
+\xed\xf2\x40\x06\xfc\xdf\xc0\xd1\x66\x8c\x41\x0a\x20\x0f\xbf\x22\
+\xae\x57\xee\xca\x34\x04\xc9\x6d\xbb\x9b\x05\x76\xcb\xc0\x3f\x29\
+\x59\xd3\xd6\x54\x45\x52\x24\xc2\xa6\x86\x38\xda\x85\x23\x8e\xdf\
+\x16\xa6\xa2\x56\xba\xe6\x32\xdb\x88\x43\xbd\x9a\x80\x51\x07\x7a\
+\xd3\x3d\x3f\x4d\x92\x89\x88\x26\x49\xba\x94\xb3\xd4\xfa\xe9\xcc\
+\x66\xc2\x38\xa9\x29\xe3\x68\x94\x4b\x65\xc4\xb9\x6e\xe5\xee\xf3\
+\x78\x5e\xa2\x85\x4d\x15\x44\xed\x9a\xed\x4c\xc8\x0e\xc9\x1d\xc4\
+\x49\x94\x49\x7e\xeb\x4c\x23\xcc\x80\x97\x37\xb1\x58\x62\xaa\xab\
+\xdd\x48\x62\x3e\x9e\x36\x5a\x18\x21\x72\xc7\x10\xb1\x0d\xc5\x67\
+\x85\x55\x43\x5e\xd9\x06\xb7\x93\x7d\x4f\x5b\x51\x51\x22\x4e\x01\
+\xa8\x22\x03\x01\xf8\xd2\x70\xf5\x25\x1e\x26\x99\x63\x59\x52\x58\
+\xd8\x6f\x1c\x41\x0c\xd9\x00\xc1\x91\x0b\xc5\x54\x93\x54\x4b\x13\
+\x49\x4f\x29\xa2\x90\xac\xc9\xdd\x79\xd7\x2a\x19\x9f\xee\xa6\x09\
+\x9d\xcd\x9a\x21\xf3\x89\x27\x95\x5a\x39\x16\x38\x54\x64\xea\xb3\
+\x53\xc5\xf7\x99\x87\x0b\x51\x67\xe2\xeb\x89\xc6\xfe\xfa\x78\xde\
+\xbd\x16\x6c\x5d\xa2\xba\x5e\x32\x33\x58\xd3\xd5\x15\x91\xb6\xf7\
+\x32\xce\x30\x05\xfb\xa3\x07\xdc\xe8\xd4\xb4\x50\xb7\x0f\x2a\x3c\
+\x6c\x4e\x6a\xa9\x1b\x1f\x61\x6e\x25\xe6\xff\x00\x8e\xa3\xea\x15\
+\x85\x47\x4d\xa7\x9a\x4b\xb3\x77\x87\x96\x11\xdf\x0e\x00\xc7\xda\
+\x72\x1c\xdf\xeb\x63\x7d\x52\xd0\xd0\x41\x1c\x74\xf0\x7c\x92\x5e\
+\x45\x31\x66\x86\xe5\x40\xc8\xd8\x7d\x32\xf1\xe7\x5b\x51\x3d\x14\
+\xd1\x63\x26\x4f\x4d\xd4\x63\x82\xa8\x66\x6d\xb8\xeb\x61\x8a\xc1\
+\xfb\x40\x19\x58\x9c\x48\xbf\x3a\x92\x7d\x98\x18\x15\x69\x9e\x63\
+\x52\xb4\xd2\x25\x52\x86\x32\x0b\xcd\x53\x0a\xd4\xc4\x64\x36\x68\
+\xdd\xce\x45\x86\x01\x8f\xc3\x7a\x8e\x95\x51\xe9\xa9\xa6\x89\x7d\
+\x4c\x14\xb0\x4b\x0d\x35\x4d\x18\x70\xab\x27\xc4\x8b\x67\x2a\x6c\
+\x5d\x19\xe2\x25\x60\x77\x3b\x96\x7c\x4a\x34\x1d\x6e\xa1\xa7\xaa\
+\xad\x89\xa7\x11\x98\x5e\x18\xe2\xc6\x59\x44\xdc\xc9\x1c\x05\x6b\
+\x05\xfe\xec\xcc\xec\xd6\x0b\x91\x36\xd2\x52\x54\xf4\xba\x2a\x96\
+\xa7\x90\x4b\x4b\x34\xd4\xf1\x91\x0b\x84\xdb\xd9\x92\xea\x51\x21\
+\x29\xf0\xcc\x7b\x7f\x09\x42\x32\xb0\x10\xa8\x1d\x4b\xec\xf4\xb2\
+\xc9\x25\x0a\xd2\xc9\xd4\xa8\x27\x62\xb2\x2f\x6d\x57\xa9\x8e\x93\
+\x0d\xb8\xe4\xee\x87\x72\x10\xb0\x4b\x03\x4c\x52\x0a\x97\x76\x99\
+\x65\x33\x61\xd1\xa1\xa6\x9f\xa1\xf5\x94\xa3\x90\x53\x7a\x49\x9f\
+\xa8\x41\xd4\x25\x86\xab\x0e\xa7\xe9\xcc\x8a\xf5\x34\x35\xf4\x54\
+\xdb\x9d\x56\x81\x12\x69\x63\x06\x6a\xaa\x43\x14\xd2\x3e\xec\x9d\
+\x0e\x1d\xf6\x1d\x08\xd6\xd4\x0e\xa3\x31\x35\x51\x52\xd2\x56\x55\
+\xc1\x24\xd3\xc1\x14\x0c\xeb\x5f\x17\x4c\x8e\x46\x49\xa9\xfd\x57\
+\xc4\x8c\xcd\x1a\x2a\x98\x99\xe4\x8f\xa8\x74\xca\x68\xe9\xba\x43\
+\xc6\x5d\x29\x25\x96\x2a\x53\x4b\xd2\x7a\xa1\x86\x3a\xb5\xcf\xe6\
+\xa8\x05\xa8\xe5\xac\xa0\xa5\xc3\xd7\x7a\x2a\x89\x66\x2a\x8f\x13\
+\x99\xff\x00\xf9\x47\xac\xd4\x53\xa7\x53\x5a\x3b\xfd\x9b\xea\x4e\
+\xa5\x67\x8a\x4a\x24\x23\xd2\x54\x16\x5c\xe4\xb4\xea\x21\x43\x93\
+\x89\x50\xee\x64\x8d\x61\xa8\xc1\x93\xe7\x7c\x9e\xf7\xbe\x77\xb6\
+\x3f\x28\xb5\xdd\x4b\x35\xfe\x82\xd6\xd4\x52\x40\xdb\x58\x47\x7c\
+\xd7\xdf\xf9\xe9\xe3\xa8\x8c\x54\x9b\x71\xec\x79\x1f\x50\x74\x2b\
+\xba\x9b\x86\x6f\x9a\x38\x0f\x77\x1f\x90\xfe\x9c\xea\x4f\x45\x09\
+\x8a\x91\xfb\x7b\xf8\x6e\x7e\x96\xb7\xbd\xb4\x48\x5f\x51\x5f\x29\
+\xdb\x8d\x3c\x91\x21\xe2\xe7\xf2\xbd\xff\x00\x86\xb2\xab\x2e\x6d\
+\xf1\x1b\x96\xc5\x6e\x0f\x6f\xe5\xa6\x85\x00\xfa\x7c\xb7\xff\x00\
+\x1d\x30\xb7\x7b\x37\x1d\xbf\xc3\x4f\x1c\xc7\x6f\x03\x61\x7f\xde\
+\x5e\xe1\xfe\x1a\x10\x21\x79\x19\xa4\xca\x56\xbf\xb7\xb5\xed\xed\
+\xf4\xd4\x5f\x1c\x77\x7c\xd1\xbf\x9f\xc7\x1e\x53\xf9\x13\xcf\x8d\
+\x6c\x6e\x32\x6d\xa2\x33\xae\x19\x00\x4f\x21\x2e\x0f\x32\x15\xef\
+\xc2\x2d\xd2\xa9\x76\x6e\x01\xd2\xd7\xe1\x53\x57\x17\xa6\x0c\x22\
+\x0a\x29\x12\x59\x98\xd8\xc2\x03\xef\xd4\xbd\x97\xb8\x11\x02\x5d\
+\x87\xcc\x3e\x61\x7e\xa4\xb0\x74\xd5\x8a\x0a\xb0\xf4\xb5\x5b\xf3\
+\xd5\xd4\xc3\xb8\x65\x4a\x5a\x78\x0c\x53\x99\x1e\x43\x36\x11\x65\
+\x88\x53\x8b\x9b\x60\x74\xfe\x82\xa0\x41\x12\x54\x46\x0c\x92\x2e\
+\xf5\x0a\x6e\x40\xc6\x15\x68\x62\x79\x5a\x44\x0c\x55\x24\x63\xb2\
+\xa8\xf7\x42\x9a\xdb\xa2\xad\x26\x59\xea\x9d\x65\xf4\x63\x71\xa2\
+\x82\x35\x6b\x0c\xa7\x1b\x54\xc8\xce\x58\xc7\x18\x8c\x21\x43\x81\
+\x19\x1c\xc4\xf5\xf5\xe7\x7e\x59\x32\x34\x0c\x4d\x03\x34\x95\x6e\
+\x7f\xb4\x59\x1a\x11\x4a\xe5\xad\x69\x51\xdc\x12\xaa\x15\x55\x8d\
+\xf4\xaf\x33\xc9\x18\x9e\x1c\xa9\x25\xab\x46\x02\xa2\x45\x62\x59\
+\x20\xaa\x79\x0e\xec\xe9\x67\x49\x63\xee\x53\x1d\xd9\x00\x03\x5c\
+\xcd\xdf\x53\x4c\xaf\x1c\x50\x53\xa4\x6c\xaf\x6b\x65\xb9\xb4\xaa\
+\xce\xec\x17\x92\x1c\x65\x63\xaa\x7d\xe8\x0c\x34\xe6\x76\x79\x58\
+\xbe\x32\xab\x31\xf8\xf0\x58\xf0\xc0\x35\xe4\x4b\x8e\xd6\xee\x5e\
+\xec\x74\xd4\xf3\xc0\xf4\xb4\x82\xaf\xb9\x22\x92\x36\xbb\x10\x11\
+\x7b\x24\x5f\x88\xc4\x32\x4d\xbb\xcb\x59\x59\x72\xca\xc4\x45\x0b\
+\xd7\x34\x90\x29\xc8\x6f\x1b\xca\xa6\x69\x24\x72\x80\xc8\x16\xf6\
+\xb1\x51\x11\x0f\x80\xe7\x2e\x2f\xaf\x40\xb2\x52\x6d\x18\x56\xb2\
+\x29\xd2\x38\xf2\x62\xb3\x6d\xd4\x41\x30\x1d\xfe\xa2\x03\x1c\x63\
+\x68\xbf\x14\xcc\x24\xe4\xae\x46\x47\x37\xc6\x74\x31\xc5\x1c\xa6\
+\x47\xf9\xe4\x4b\xc7\x1a\x2a\x85\x0e\xf8\x8b\x5d\xac\x21\xbf\x04\
+\xf3\xae\x93\xd3\x69\xe2\x56\xba\x6e\x4b\x24\x3b\x57\x56\x26\xef\
+\x01\xa6\x12\x47\xb8\xe5\x47\x0d\x6f\x9a\xc7\xdb\x55\x33\xc8\xcf\
+\x4e\x23\x95\x96\xf2\x8e\x3b\x3b\x5d\x2d\x1f\x18\x05\xbe\x72\x78\
+\x8d\xbb\x79\x3c\xeb\x23\x35\x7b\xa6\xf4\x86\x01\x4b\x32\xcb\x42\
+\x60\x29\x95\xea\xe8\xdf\x39\x24\x80\x93\x65\x73\xe1\xb1\x2b\x81\
+\x19\x88\x29\xea\xe1\x82\xb2\x5c\x64\x92\x2c\xe2\x8e\x4a\x78\x61\
+\xa7\xdc\x33\xbc\xca\xb1\xc0\x04\x8b\x23\x2b\x49\x9b\x5a\x37\x8e\
+\x08\x70\x67\x7b\x98\x63\xa3\x96\x86\x53\x11\x74\x48\x95\xdd\x6f\
+\x4d\x1d\xd5\x53\x38\x95\x92\x1a\x7c\x59\x92\xd8\x16\xc7\xe7\x72\
+\x05\xf4\x69\x3e\xc9\x41\xd2\xa1\x83\xa6\x2c\x30\x54\x2c\x8d\x20\
+\x87\xd7\x88\xd7\x7a\x0a\x5c\x2a\x51\x82\x44\x8d\x1b\x49\x2b\x12\
+\x49\x72\x8a\x03\x0d\x41\xf6\x6b\xed\xe7\x48\x7f\xb2\xfd\x7e\xa0\
+\x14\xa3\xf5\x0b\x3a\x51\xf5\x72\x63\xbc\x54\xf0\x55\x3c\x86\x31\
+\x54\xe1\x91\x82\xca\xaa\x5c\xb0\x86\xec\x6e\x1b\xa6\x18\xa8\xfa\
+\x95\x7d\x04\xd4\x75\x51\xc7\x5d\x02\x2c\xeb\x1d\x38\xa8\xce\x58\
+\x26\xc8\xc4\x16\xb6\x92\xea\x91\xa3\xc8\xa5\x99\x5f\x07\x44\x23\
+\x1a\x3a\x1a\xe8\xe9\x3a\x85\x35\x2d\x3d\x25\xe9\xe5\xae\x9e\x86\
+\x5b\x53\xd2\xd5\xf4\x88\x19\x6a\xe6\xa7\x82\x4a\x01\xea\x87\x4d\
+\xdf\x17\x86\xba\x39\xa4\x2f\x4e\xc8\x54\xc7\xae\xaa\x9d\x3f\xf4\
+\x81\x35\xc4\xf5\x18\xa0\xea\xa6\x99\xeb\x3a\x70\x92\x5a\x8e\x9f\
+\xd6\xba\x7c\xb5\x36\xa6\xf5\x14\x52\x55\x36\xd7\x59\xdf\x8d\x52\
+\xb2\x8a\x86\x27\x89\xa9\x2a\x13\x14\xf4\x2d\xe9\xa2\x34\x74\xec\
+\x93\xc6\x18\x4a\x94\xdd\x42\x1d\xbe\xa7\x44\x94\x75\x53\x2c\xb5\
+\x02\x99\x88\x09\xbf\x23\x84\x8e\x96\x9e\xae\x20\xe2\x44\x8b\x73\
+\xa6\x8a\x7a\x8f\x43\xd4\x0d\x6d\x1b\xe4\xb5\x91\xcf\x27\x4d\x8e\
+\x9e\xb1\xa8\xaa\xe9\x9d\xc2\xdd\x04\x91\xc0\x95\x54\xc8\x9f\xb4\
+\x59\xe2\xa9\x98\xcb\x7d\x7d\xa1\xa0\x9f\x25\x8e\x83\xa8\xcc\xb0\
+\x5f\x23\xbb\x13\xb0\x9e\x09\x7c\xe2\x6f\x14\xdf\x74\x01\x7f\x16\
+\xd4\x41\x1c\x9c\xb8\x3f\x86\xa4\x92\xb1\x51\x8e\x3f\x33\x1f\xc2\
+\xdf\xd7\xfc\x74\xe6\x62\x92\x43\xb6\x15\xa5\x26\xe0\x3a\xd8\xf1\
+\x6f\xc7\x8d\x49\x07\x4c\xb6\x28\xb6\x79\x96\xdc\x11\xf4\xd2\xcf\
+\x53\x9c\xa2\x39\x81\x56\x1f\x7a\xcd\xef\xe7\x9f\xca\xda\x0d\xda\
+\x27\x98\x64\xdc\x8b\xf8\xf9\x74\xf0\xd2\xaf\x73\x30\xe4\x73\xe5\
+\x87\x8f\xf3\xfc\x34\x8b\x50\xa2\x55\x03\xbe\xfe\x7f\x1b\x7f\xed\
+\xaf\x51\x0c\x3b\x48\xe0\xc7\x20\x5e\x7e\x27\x94\x65\x1e\x7e\x5e\
+\x4f\x3e\x7f\x0e\x34\xd3\x54\xf7\x9e\x53\x2c\x7b\xb2\xf6\xe1\x8f\
+\x3c\xdb\xc7\xf0\xd1\x67\x56\x6a\x45\xcb\x25\x43\x0a\x3c\x57\x60\
+\x12\x5a\x88\x26\xc1\xcc\x20\x1c\xd8\x46\x72\x38\xf0\xc3\x53\xbb\
+\x28\xab\xdc\x89\x23\x47\x92\x28\x6a\x8c\xeb\x3a\x1f\xd6\xa9\x61\
+\x33\x1f\x44\x29\xa2\x75\x86\x49\x04\x72\x4a\xb9\x93\xde\x6c\x86\
+\x38\xe2\xa8\xae\x92\xa6\xa4\x89\x96\xb6\x66\x2a\xde\x9d\x38\x89\
+\x62\xa4\x56\xdf\x31\x3b\x9e\x66\x9c\x53\x60\xaa\x4e\xd3\x70\x0c\
+\xb5\x7d\x65\x4d\x44\x6f\x46\xcb\x3d\x7b\x3d\x4e\x2d\x50\xdd\xd1\
+\x6d\x2c\xc5\x4c\xcf\x1f\xc9\x2f\xa7\x3f\xb4\xdb\x2a\x53\x13\x73\
+\x53\x49\x49\x19\x86\x30\x20\x0a\xd2\xcb\xb6\xed\xed\x24\x62\x15\
+\xde\x97\x0b\x9d\xc0\xa4\x62\x0b\x2c\xb7\x3f\x15\x6a\xe8\xe2\x4a\
+\xe4\x9b\x72\x28\x67\xaa\x8e\x23\x4d\x1b\xb9\x95\x6c\xab\x3d\x96\
+\x71\x1e\x24\xab\x09\x23\x4b\xaf\x89\xdd\xbb\x5a\x96\x08\xa6\x09\
+\xf0\xda\x9b\xf6\x52\x57\xc1\x8c\x5d\xb2\x06\x35\xa5\xc2\xca\xed\
+\xda\x1e\x2b\x5a\xf7\xd2\xd5\x35\x1d\x34\x30\xc8\x00\x30\x49\x33\
+\x95\x0d\x19\xdb\xb9\xa4\x81\xa9\xa1\xa5\xdb\x7c\x2c\xe9\x1b\x3f\
+\x7f\x7b\xb7\x9d\x52\xe3\x33\xbe\x57\x45\xb5\x6c\x73\xc4\x14\x36\
+\xeb\x08\xa5\x96\x4c\x91\x94\x2f\x60\xfe\x06\xfa\xc6\x61\x2e\x76\
+\xec\x86\x58\x61\x68\xef\x8b\x3a\x90\xeb\x50\x83\xe4\x5c\xf9\x60\
+\x59\xc0\x19\xad\xf5\x25\x4d\x3d\x5c\xf5\x53\xda\x28\x9e\x1a\x66\
+\x49\x29\x63\x59\x50\xd9\x0c\x95\x52\xc8\xf0\x4d\x9f\xc4\x65\x8d\
+\x9f\xbd\x15\x63\x9b\xee\x9e\x99\x14\x9e\x96\x38\x6a\x63\x54\xae\
+\x1e\xa2\x63\x51\x4f\xb8\x21\x96\x25\x68\x9f\xe2\xa3\x54\x91\x24\
+\x70\xbc\x52\xdc\x06\xee\x66\x5b\xe8\x53\xcc\x94\xd4\x75\x10\xc6\
+\xeb\x31\x7a\xa2\x45\x74\xe6\x4a\x88\x54\x83\x8b\x98\x6a\x02\xd8\
+\x48\x3b\xf7\x23\x89\x13\x87\x39\x98\x69\x2a\xce\x58\x3c\x12\x41\
+\x4f\xb9\x24\x4d\x50\x24\x53\xdd\x8c\xc4\x49\x31\x5f\x01\xa0\x8b\
+\x15\x4b\xb3\x0b\x02\xc0\x4b\x27\xea\xb8\xab\x5a\x38\xe0\x59\xdf\
+\x0e\x46\x0c\xc5\xb3\x8c\xda\xf9\x49\xc5\xd6\xe1\x71\x62\x18\x56\
+\x42\xea\x00\x6a\x97\x8e\x39\x1f\x18\x96\x47\x72\xbb\x63\x1e\xf3\
+\x8f\x77\x2a\x07\x7b\x7c\xe7\xdf\x55\x35\x93\xc7\x24\x55\x65\x5a\
+\x24\xdb\x45\x8a\xa5\x9c\x3f\x11\x53\xb0\x64\xd8\x02\x04\x5d\xd9\
+\x31\x6c\x73\x67\x8f\x6d\x82\xe3\x2c\x7c\x51\xc7\x30\x88\xe5\x1a\
+\x8c\x23\x55\xf9\xe9\xd8\x8b\x23\x3e\x19\xe3\x0a\x42\x55\x66\x67\
+\x55\x00\x89\x19\xd7\xa4\x40\xe1\x9a\xa2\x8a\x77\x86\xf9\xc4\xe4\
+\x08\x8c\x92\xe5\x64\xa6\x25\xcc\x5f\x3c\x68\xad\x65\xcd\x8f\x68\
+\xd4\x15\xf1\x16\x05\xba\xcf\x5d\xf5\xa6\x55\x65\xb5\x64\xb5\x55\
+\x0c\xb9\xba\xd9\x9b\xb1\xf7\x21\x27\xb5\x76\xe2\xe0\x85\xd5\x75\
+\x47\xda\xa5\xad\xea\x9d\x4d\xe7\xaa\xaa\xa4\xaf\x79\x62\x8d\xd6\
+\x7a\x6d\x86\xa6\xa8\x8a\x67\x76\x98\xc9\x15\x5c\x4f\x25\xe1\x8d\
+\x10\x78\x08\xb6\xb8\xe9\x73\x55\x46\xb5\x13\xc3\x47\x04\xed\x7c\
+\xef\xbe\x69\xe6\x8d\x98\x98\xfb\x99\xea\x0b\x00\xc6\xcc\xc6\x57\
+\xc8\x03\xc0\xd4\x50\xbf\x4e\xe8\x95\x34\xf2\xd5\x7d\xa5\xa2\x8e\
+\x5e\xae\xd3\xaa\x27\x53\xaf\x80\x4d\x4f\x5e\xd5\x54\x72\xa5\x45\
+\x33\xd4\xc5\x0b\x51\x24\x8a\x8d\x43\x2c\x90\xa3\xd6\x47\x4b\x53\
+\x0c\x36\xeb\x9d\x6a\x9a\x9e\x1c\xbe\xcb\xd3\xc7\x50\xd4\x5d\x4a\
+\xba\xbc\xab\xd7\xf5\x74\x96\x9a\xb6\x41\x49\x12\xcd\x1c\xd4\xf4\
+\x1f\x68\x27\x2f\xf1\xa2\xa4\xa5\xae\xa9\xdf\xa8\x9e\x99\xf7\x84\
+\x32\x54\xc5\x55\x51\x5f\x14\xd2\xa8\xfd\x35\x14\xd4\x71\xc6\x7a\
+\xaf\xe8\xda\x5e\x9e\xd2\x14\xaa\xe1\xa1\xca\x9e\x0a\xa2\x94\xbf\
+\x2d\x6c\xd4\xf0\xb6\x11\x09\x58\x9a\x39\xfa\x74\xc5\xc5\x3c\x6d\
+\xbb\xbb\x2c\x5b\x93\xb5\x38\x87\xa6\xcb\x10\x86\x2b\x49\x15\x54\
+\x42\x93\xa7\xd4\x30\xaa\xde\x1b\x6b\x29\x49\x2e\xe0\x6a\xba\x48\
+\x50\xc9\x26\xf0\x8a\x49\x6d\x7b\xfa\x58\xa2\x85\x86\x40\xdb\xe7\
+\x0e\x39\xbf\x0a\x3d\xf9\x3d\x3e\x63\x22\x46\xad\xb7\x9a\xb1\xee\
+\xee\xb6\xa1\x9e\x36\x22\x1c\x41\x20\x72\x1b\xf3\x23\x8f\xe9\xa4\
+\x5a\x25\x34\xf0\xfc\xfc\xdc\xee\x2d\xc7\xe3\xa9\x50\x1b\x07\x64\
+\xb8\x17\xfb\xc4\x5e\xe3\x9d\x0f\x93\xc5\xd7\x83\xe4\xe9\x56\x0c\
+\x7b\xa3\x38\xc6\x24\xb1\x67\xc4\xfc\xab\xfb\xda\x96\xa2\xaa\x3c\
+\xa4\xbe\xd5\x9b\x87\x46\x1e\x78\x3f\x87\xbe\x92\xb2\x13\x84\x98\
+\x77\xaf\xd0\x7d\x7c\x1e\x7f\x9f\x1a\x30\x5f\x70\x5e\xc4\xe2\x49\
+\x40\x10\x9c\xc2\x8e\x59\x94\x0f\x6f\x6f\xa7\x9d\x1a\xda\xca\xe2\
+\x9d\x3a\x05\x99\x96\xa9\x0b\x61\x14\xff\x00\xd8\xfa\xcd\x91\x2b\
+\x53\xc6\xc8\x1d\x5a\xe0\x36\x65\x08\x20\x5c\x19\x58\xc1\x55\x41\
+\x4d\xd1\xb0\xdc\x92\x79\x56\x49\x2a\xf6\x07\x6a\xee\xb4\x91\xcb\
+\x6b\x07\x71\x4d\xb0\x64\x9f\x15\xb3\x2a\x92\x0d\x4c\x45\x3a\x8a\
+\x3d\x4c\x66\x55\xab\x61\x22\xcd\x4f\x4a\xec\xaf\x34\x78\x6d\x46\
+\x02\x39\x08\xcb\x82\x31\x8e\x25\xee\x6b\x8c\xc4\x74\xb1\xac\x35\
+\x17\x76\x49\x6a\x94\xed\xd4\x52\xca\xe4\x5d\xe6\x7b\x49\x11\xcb\
+\x11\x27\x98\x5b\xb7\xb0\xdc\xe2\xcf\xd3\x69\xe3\xa9\xf5\xb4\x8e\
+\xb1\xd4\x55\x25\x45\x3b\xfe\x90\x19\x7a\x80\x19\xbf\x57\xdb\x17\
+\x00\xfc\x51\x39\xde\x85\x6c\x40\xd2\xb1\xbe\xd4\x89\x7a\x90\xb0\
+\x47\x2f\x4f\xa7\xec\x28\x59\x8c\x20\x5e\xaa\xc7\xe2\x28\x99\x20\
+\x97\x91\x24\x46\xe7\x53\xcf\x49\xd4\x3f\x57\x06\x2a\x9a\x87\x43\
+\xb1\x09\x50\xd6\xc5\x28\x81\x5a\x7d\x90\xbd\xcd\x1a\x4a\xee\x96\
+\xdd\x16\x2a\x34\xd4\xfe\x96\x96\x9e\x9e\x1a\x8d\xcc\xd5\xea\xd9\
+\x5a\x66\x01\x82\xc6\xd2\x4e\xea\xb0\x54\xc7\x79\x0c\x80\x37\x2e\
+\x8a\x0a\x37\x76\xa0\xf4\xc8\xd6\x33\x36\x51\xb1\x98\x49\x1a\xc6\
+\x18\xc8\x62\x9d\x98\x92\x26\x1c\xc8\xd7\x64\x38\xad\x93\xee\xb2\
+\xc5\x3f\xa6\x51\x04\xa6\xd1\x26\x75\x15\x2f\x24\xaa\x4a\x7c\x45\
+\xdb\x45\x40\x9c\xbf\xc2\x8c\x8b\x1e\xf3\xf2\x94\x8a\x96\xa2\x96\
+\xa8\xbb\xc3\x1c\xb4\x84\xca\xa7\x0c\x91\x31\xa8\x9a\x6c\xe2\x89\
+\xce\x64\x6d\x5d\x72\x8f\xbf\x30\x38\x34\x89\x1c\xb2\x53\x47\x52\
+\x89\x4b\x9d\xe0\xad\xa3\x11\x0d\xc0\x90\x29\x80\x34\xfb\xb1\xb9\
+\x0f\x8d\x45\x35\x35\x91\x72\x4c\xc0\xcf\x4e\x0d\x4a\x49\x2d\x4d\
+\x3b\xc7\x55\x4f\x49\x00\x92\x5b\x07\xa7\x48\x26\x90\xa8\x5d\x90\
+\x33\x96\x28\xb7\x15\xda\x35\x6b\xfc\xe0\x3e\xa9\x62\x6a\xa8\x2a\
+\x05\x2c\x72\x41\x4d\x25\x20\x91\x6a\x77\x2a\x64\x98\xa3\xcf\x33\
+\x46\x8d\x19\x49\x20\x68\xdd\x9b\x32\xd1\xcd\xf3\x58\xdf\x54\xf5\
+\x3e\xaa\xa0\xbd\x1d\x38\x81\xd8\xa1\x35\x1e\xa5\x78\x96\x15\x97\
+\x26\x6a\x83\x14\x4d\x21\x93\x66\x38\xee\x2d\xca\xae\x47\x55\x15\
+\x42\x96\xa5\xe5\xea\x30\xd3\x9f\x56\xe0\x72\x53\x11\xb7\x9e\x53\
+\x2c\x70\x22\xcc\x93\x4b\x33\x61\xb9\x23\xa5\x3a\xe2\xc1\x89\xc8\
+\xc8\x93\xb1\x68\xd9\x62\x88\x28\x92\x06\x92\x43\x71\xb8\x41\xbc\
+\x8d\x1a\x76\x15\x02\xc8\x5a\xff\x00\x50\x9b\x7b\x75\x55\x16\x8a\
+\x18\xa6\x43\xea\xa3\x5a\xaa\xb9\x15\xe6\x95\x64\x90\x05\x98\xc7\
+\x14\xe2\x39\xda\xea\x88\x50\x44\x17\x2e\x74\xd0\x32\x4d\x1e\x25\
+\xa5\x81\x15\xa6\x98\xca\xf1\x00\x24\x92\x49\xe8\x80\x7a\x7b\xa8\
+\x69\x1d\x22\xc0\xec\x2b\xe6\xfd\xd2\x33\x74\x7e\xbd\x9c\xf4\xf3\
+\x25\x72\x7a\x82\xb4\xf5\x29\x4b\xe9\xaa\x6e\xad\x0a\xd5\xcd\x25\
+\x42\xbc\x7b\x6d\xb5\x29\x96\xce\x03\x8e\xfe\x39\xad\xea\x1d\x09\
+\xa9\xe4\x4a\xec\x25\xaa\xe9\x95\x71\xc5\x57\x41\x51\x97\xc4\xce\
+\x22\x23\xdb\x25\x07\x21\x91\x41\xe3\x93\xef\xa4\x82\x6e\x8d\x51\
+\x15\x38\xda\x81\xda\x8a\x98\x1a\x4a\x7a\x73\x28\x2c\x52\x15\x2b\
+\x65\xb1\x2e\xdc\x64\x7e\xba\x8a\x92\x69\xd7\x35\x80\x7c\x54\x52\
+\x25\xc3\x1b\x73\x11\x70\x56\x30\xa3\xb6\x23\x93\xb3\xf0\x09\xbe\
+\x3a\x1e\xa6\x94\xbc\x7d\x4d\x76\x6a\xb6\xbf\x58\x85\xe1\x09\x3d\
+\x14\x49\x84\xbb\x72\x43\xbf\x2c\xf5\x9b\xf5\x4a\x66\xbc\xf1\x23\
+\x10\xfb\x52\xfa\x7e\xa1\x2c\x75\xa9\x15\x2f\x5c\x9e\x0a\x5a\xae\
+\xaa\x86\x54\xaa\xf4\x1f\x0a\x58\x2a\x1e\x0a\x98\x88\xa9\x8d\x8c\
+\x63\xd4\x89\x0c\xcb\x50\x48\x8d\x62\xf5\x5b\x4e\x28\x24\xa9\xea\
+\x7d\x47\xa8\x74\xe8\x27\xc5\x29\x6a\x25\xf5\x75\x54\xd2\x43\x2d\
+\x05\x14\x95\x91\xbb\xde\xa9\xba\x64\x87\x27\x8e\x97\x25\xa4\x96\
+\xc6\x1a\x7b\x6d\xcd\xae\x8b\xf6\x8b\xa2\xc3\x14\x4d\x59\x51\x04\
+\x75\x62\x20\x7d\x1d\x62\x54\x55\x6d\x54\xcb\x24\x54\x88\x8c\x69\
+\xaf\x24\x13\x53\xb2\x5b\xff\x00\x2e\xc2\x42\xf8\x33\xeb\xa8\x53\
+\xc7\x0c\x94\xc6\x3e\xa1\x5d\x1e\x33\x93\xba\xa5\x6a\x66\x04\x48\
+\x1d\x50\x97\x61\x6f\x08\x3f\x2d\x74\xe8\xaa\x3e\x42\x12\xed\x6e\
+\x06\x92\x8a\x0a\xab\x92\xbc\xa6\x7c\x1f\x7f\x1f\xc3\x5b\x32\x4f\
+\xcb\xf6\x47\x1f\x1e\x3d\xbd\xbd\xbc\xe9\x0d\x4c\xcf\xde\x43\x48\
+\x43\x62\x40\xb7\xb7\x1f\x4f\xf7\x6d\x2b\x51\xf5\x2a\xc2\xb6\xba\
+\xf7\x17\xb0\x3f\x5e\x31\xfe\x9a\xa7\x9e\xaa\xad\xa6\x7b\xa3\x02\
+\xd1\x8c\x91\x94\x82\x39\x5b\x11\x63\xff\x00\x7e\x35\xbf\x03\xc1\
+\x1d\x68\x42\x19\x77\x0c\x5e\xa4\x85\xe1\x82\xb6\x57\x98\xfe\x76\
+\x63\xc5\xb4\xaf\x4f\xd4\x8c\x4f\x13\x98\x64\x44\xc4\x84\x65\xf3\
+\x14\xaa\xc0\x9c\xed\xe7\xd8\x0e\x75\x2d\x47\x59\xd9\x92\xaa\x3d\
+\xa9\x0e\xd0\xaa\x49\xac\xdd\xd1\x9d\xb4\x89\xd2\x39\xf9\x8c\xc7\
+\x16\xf4\xbb\xbc\x9e\xc5\xe0\x14\x9d\x27\xd9\x5a\x73\x5b\x15\x1d\
+\x40\x0d\x49\x33\x22\x86\x8a\x49\x42\x86\x35\x03\xb6\x51\x81\xc4\
+\x3a\xf7\x62\xbb\x6d\x93\x55\x19\x21\x95\xa4\x91\x27\x79\xe1\x88\
+\x50\xb2\xc8\x7b\x67\x33\xab\xbb\x6e\x32\x15\x3b\x6f\x14\x48\xa0\
+\x16\x05\x59\x0e\x3a\xa5\x83\xa7\x54\x46\x17\xa8\x12\xf3\x49\xba\
+\xd5\x8e\xc8\x18\x5d\x63\x14\xe2\x47\x3b\xc3\x26\x92\x39\xa0\x25\
+\x98\x01\x01\x88\xdb\x4f\xb7\x79\x6a\x27\x2e\x04\x15\x0f\xb3\x20\
+\x8f\x2d\xad\xf8\xbb\xe4\x69\xa7\x0c\xc0\xa3\xa4\x22\x2a\x78\x9c\
+\x25\x42\x87\xbb\x86\x92\x69\x0c\x55\x88\x91\xa2\x3c\xe9\x79\x65\
+\x77\x3f\x12\xa1\x2a\x96\x4c\x24\x92\x32\xc5\x6c\x97\x07\x36\x5d\
+\xae\x78\x21\x62\x41\x76\xbc\xb5\x0c\xc8\xdb\xcf\xff\x00\x16\x5a\
+\x66\x69\x19\x0d\xfe\x67\x22\x00\x16\xe5\x01\x60\x01\xf4\x8d\x24\
+\x50\xc4\xf2\xaf\xc1\x54\xf8\x99\xa0\x37\x68\xa4\x3d\xb3\xa2\xad\
+\xcb\xc7\x51\x01\x51\x70\x52\xc4\x0d\x24\x11\xc6\xc2\xe5\x9b\x29\
+\x9e\x54\xb4\x76\x01\xf6\xf2\x90\xa8\x8b\x11\x76\x50\x2e\x15\x7e\
+\x15\x9a\xc3\x54\xb0\x49\x3a\x3c\x6f\x01\x7a\x78\xb7\xdd\x0b\xc2\
+\x41\x60\xf1\x3d\x4c\x4b\xb8\xb1\x9e\xfc\x31\x46\xb2\x9f\x8b\xad\
+\xa6\xf4\xf2\x2c\xab\xe2\x74\xc2\xb1\xd2\x37\x1f\xb5\x63\x22\xc4\
+\x64\xc8\x0d\xb7\x69\x59\x36\x6e\x0a\x5f\xb8\x42\xdd\x1e\x89\x6b\
+\x44\xf3\xbc\x17\x76\x31\x43\x1b\x97\x12\x18\xc9\x8e\x54\x69\x1e\
+\x28\xed\x21\x9b\x73\x10\xaa\xc1\x26\xb7\x66\xbf\x5a\x5a\x7d\xfa\
+\x4f\x84\xd4\xf4\x71\x53\xc5\x49\x74\x7e\xc1\x0a\xc1\x19\x2a\xf7\
+\xef\x7a\x8a\xaa\x87\xbb\x8c\xcb\x0b\x68\xd4\x57\x7a\x18\x61\x79\
+\xd6\x24\xdc\xa8\x69\xe7\x8d\x60\x05\xde\x59\xb7\x06\xe4\x68\x0d\
+\x83\xc7\x92\xb4\x83\xba\x01\x8f\x76\xa9\xea\xaa\x43\x11\x34\x3d\
+\xd1\xf4\xd4\x5d\x9a\xc5\x46\xc6\x2a\x95\xa8\xd9\x43\x48\x91\x46\
+\x79\x56\x69\x1b\x00\xc1\x89\x26\xfa\xea\xb3\xd3\xc3\x97\xa1\x4e\
+\xa2\x69\xe5\x88\x41\xd4\x25\x0f\xb4\x62\x91\x84\xca\x1a\x35\x79\
+\x57\x71\x0e\x51\xc4\xf7\xc3\x6c\x97\xb2\xb7\x43\xe9\x57\x85\xa6\
+\xfd\x1f\x49\x53\x53\x86\xe4\xaf\x12\x98\xd3\x11\x3b\x32\x16\x49\
+\xcc\x24\x09\x21\x0b\x0c\x41\xe6\x96\x4c\x5b\x18\x82\x6d\xb5\xa2\
+\xa6\xec\x98\xcb\x4f\x29\x47\xc2\x38\x66\x07\x9f\x87\x6b\x44\x58\
+\x7c\xd7\xb7\x8e\xed\x51\xc3\x20\x68\x22\xf5\x49\x08\xa7\x56\x5b\
+\x7a\x79\x1b\xd4\x46\xc0\x5e\xc0\xb5\x3c\x11\x09\x6f\x20\x62\xd3\
+\xa3\x0e\xfb\x6a\x99\x68\xba\x7d\x65\x44\x66\x68\xd1\x8d\x3d\x3d\
+\x52\xd1\xc9\x4e\x24\x23\x72\xaa\x49\x64\x8e\x25\x2f\xe7\x1d\xe0\
+\xc1\x2c\xac\xd2\x16\x00\xba\x4f\x4f\x4f\x25\x29\x5c\x6a\x26\xab\
+\x83\xd4\x45\x0a\xe0\xb9\xc5\x09\xf5\x59\xae\xe9\xbc\x3f\xab\xa6\
+\x57\x2b\x76\xc7\x3b\xcb\x0d\x1f\x55\xaf\xa2\xa2\xc6\x69\x23\xf4\
+\x9c\x15\x81\xfb\x92\x00\xb3\x87\x9a\x25\x4b\x0c\x70\xc8\xda\xea\
+\xcd\x89\x3a\xde\x93\xa9\x75\x49\x03\xe2\xf1\x4f\x53\x33\x8f\x50\
+\xb4\xf8\xe6\xe9\x14\x4b\x33\xc7\x8b\x76\x94\x9d\x57\x33\xcf\xcb\
+\x75\x34\x13\xd2\xfe\xb5\x3d\x49\xa7\x8a\x41\x1d\xe3\xac\xb2\x8f\
+\x89\xb7\x10\x65\x8e\x47\xdb\x27\x1c\xa3\x16\x7b\x35\xae\x34\x91\
+\xd6\x1a\x93\xf1\x62\xa8\xdb\x65\x49\xd2\x19\xa2\x52\xa1\x65\x8a\
+\xa5\xff\x00\x48\x53\x2c\xd1\xd9\x65\xdb\x7f\x4e\xcf\x06\x6b\x93\
+\x24\x69\xa9\xfa\x86\x25\x69\x21\x8a\xa6\x57\xa9\x28\x5a\x15\xa2\
+\xa5\x78\xa3\xa8\xe9\xe8\x9b\x99\xcc\x95\x8c\xb2\x9d\xca\x78\x3f\
+\x54\x40\x65\x6a\x72\x8e\x15\x28\x57\xe2\x4d\x50\xa1\xa8\x69\x56\
+\x95\x5a\x0a\x55\xe9\xdd\x42\xa6\x4a\x9e\xae\xe2\xa2\x4c\x54\x36\
+\xe0\x91\x91\x58\xa3\x33\x60\xd1\x4b\x19\x68\xe9\xcf\x4f\x57\x8a\
+\x9f\x6e\x9b\xa8\x3c\x30\x24\xcb\x8c\x6d\x13\x6d\xc9\x04\x66\x35\
+\x91\x94\x88\x80\x94\x6d\x82\x2c\xa3\x20\x77\x2e\xe7\xaf\xbc\x30\
+\x97\xa3\x96\xa6\x2a\x84\x78\xa3\xc5\x0e\xfc\x09\x50\xcf\x88\xb0\
+\xe4\xb9\xe6\xda\xa2\x8e\x15\x65\x16\x41\x90\xf3\xed\x7e\xdb\x1d\
+\x43\x57\x50\xca\xf2\x2b\x7c\x97\xc5\xb1\xf1\x77\x3e\x3d\xef\xed\
+\x7f\x1a\x57\x87\x6e\x9c\x46\xdc\x16\x0d\xc1\xfc\x3c\x0e\x4f\x1f\
+\xc7\x5f\xff\x00\x52\x8d\x9e\x35\xc8\x88\xd3\xe5\x5b\xdb\xc7\x9e\
+\x46\x84\x15\x32\x4b\x2b\x64\x14\x08\xc9\xe7\x9f\xa7\x3a\x55\xf4\
+\x53\xe3\x7b\x65\x24\x96\x40\xd6\xfa\x7d\x3f\xcf\x4b\x0e\xd4\x10\
+\x93\xf2\xb9\x02\x40\x3d\xc3\x76\xae\x62\xde\x58\xe5\xc0\xbf\x8d\
+\x55\xf5\x1e\xad\x5a\xd4\xce\x02\xc8\xeb\x03\x53\x4b\x14\xa4\xf7\
+\x46\x92\x46\x65\x07\x20\x40\x91\x89\x81\xc9\x47\x41\x21\xc7\x36\
+\xd5\x2c\x2f\x27\x4c\xe9\xd4\x12\xbc\x72\xd3\x20\xac\x63\x86\x11\
+\xb2\x3d\x4c\xe9\x13\x84\x64\x90\x36\x12\xa4\x42\x59\x29\x1c\xc5\
+\x1d\xc6\x59\x2a\xc6\xd4\x34\xfb\x72\xfa\x88\x16\x78\x53\x6f\x7e\
+\x34\x3f\x16\xb6\x30\xcd\x24\xc5\x64\xc2\x65\x8f\x21\x12\x77\x04\
+\x8d\x41\x73\x94\xf4\xd4\x6e\xf0\x42\xd4\xe2\x28\xdd\x8f\xf6\x7b\
+\x80\x0f\x86\xac\x1e\x03\x91\xb9\x2c\x1c\xb7\xf7\x6f\x71\x3b\x48\
+\x56\x29\x16\x0f\x4f\x24\xab\x25\x43\x3e\xdc\x3d\xa1\xaa\x12\x38\
+\xd3\x27\x92\x42\x1b\x27\x98\x28\x4e\x6d\x71\x7d\x23\x0a\x36\x68\
+\x2a\x2f\x1a\x39\xdf\xa7\x34\xb2\x62\x13\xd4\xc5\x26\x2a\xeb\x2b\
+\x84\x58\xa3\x91\xb7\xe9\xf6\x89\xed\x79\x2c\xda\x89\xaa\x69\x9c\
+\x4c\x54\x18\xed\xcd\x3d\x25\x21\x38\x48\xf3\xd4\x4c\x29\xcd\x56\
+\xf9\x18\xda\xe7\x17\x7c\xbd\xad\xa6\xf4\x30\x24\x26\x9c\x33\xe1\
+\x4b\x0a\x39\x96\xdc\xe6\xa6\x3b\x2f\xfd\x26\x4c\x9f\xe4\x43\x9b\
+\x0d\x35\x4b\xb3\x56\x55\x3c\xf1\xa0\x35\xa1\xe3\xc0\x48\x3e\x2f\
+\xa8\x2b\x0a\x34\x3f\xf2\x66\xf7\x2a\xab\x97\x37\xd1\x25\xa4\x3f\
+\x0f\x73\xe2\xcc\x15\x21\xcb\xfb\x28\x78\xde\x6c\x89\xbc\x4a\xbc\
+\xb7\xca\xc6\xc4\xeb\xd6\xd6\x52\x9f\xd1\xd3\xd2\x25\xc8\x12\x55\
+\xee\x45\x71\x7f\x51\x66\x4f\x4f\x8f\xcc\x51\xef\x60\x3c\xeb\x62\
+\x8e\x27\x49\x61\x80\xc9\x50\x3a\x70\xf5\x34\x54\x2a\x1b\x14\x12\
+\xb9\x75\x56\x77\x5b\xac\x90\x23\x0b\x20\x76\x62\x54\xe3\xa6\x13\
+\x75\x36\x78\xca\xd8\xc7\x0d\x54\x14\x8a\x29\x63\x77\xdb\x85\xfe\
+\x64\xa7\x38\x46\x1f\x9f\x98\xaa\xaa\xa3\x31\x08\x6f\x47\x82\x51\
+\x12\xe8\x67\xa6\xdf\x8f\x28\x61\xef\x0b\x3c\xed\xe9\x56\xa2\x51\
+\x89\x65\x92\x3a\x74\xf8\x81\x48\x3a\x79\x27\x9a\x95\x64\x2d\x23\
+\x48\xad\x14\x8c\xd3\x8e\xd5\x81\x9f\xf6\x89\x92\x3a\x65\x82\x05\
+\xce\xd7\x6b\xbf\x7e\x96\x1a\x39\x2a\x24\xab\xa8\x99\xa1\xa3\xa2\
+\xbd\x31\x8e\x54\x59\x36\x9a\x68\xa8\xe4\x12\x38\x51\xdc\xf2\xf7\
+\xae\xd4\x21\xa5\x44\xcd\x17\x51\x53\xf5\x40\xad\x7a\xa9\x73\x96\
+\x39\xa4\x1b\x82\x70\x9b\x90\x30\xa6\x58\xaa\x19\x78\x60\xa5\xc6\
+\x19\x1b\x1e\x39\x14\xab\x4d\x1c\x42\x8a\x80\x31\x11\xc4\x53\xb2\
+\x35\x8b\x12\x19\x63\x32\xb2\xec\xc6\xb8\xc8\xd3\xca\xae\xcc\x54\
+\x7f\x71\xbd\x34\x0b\x4b\x2c\xef\xc5\xf7\x6f\xe9\xa1\xc4\x87\xcd\
+\x02\xe2\x5c\x87\xc9\x32\x0d\xf9\x65\x63\xaf\x49\xb2\x92\x89\xf3\
+\xce\x34\xbe\xf2\x00\xd1\x47\x23\xe4\x02\xa8\x91\x95\x12\x9e\x3c\
+\x55\x70\xc9\x0f\x90\x49\x30\x52\xd3\xa9\x74\x5d\xa2\xd0\x86\x9f\
+\x60\x94\x88\x92\xf3\xcb\x23\x42\xbb\x41\x6f\x34\x7b\x7b\x99\x44\
+\xb6\x90\x0c\x95\xcb\x34\xb5\x2d\x08\x88\x81\x3f\xa7\xbb\xc9\x23\
+\x07\x63\xe9\x9b\xe2\x20\x57\x0e\xb1\x06\x5a\x67\x64\xbe\x5d\xd6\
+\xb6\x9a\x29\xb6\x61\xf9\x57\xe3\x67\x50\x47\x68\xdb\x59\x0c\xad\
+\xbd\x1b\x58\xe5\x33\xec\xc5\x75\xb8\x8a\x28\x9a\xce\xa1\x2a\x7a\
+\x8e\xc5\x33\x9c\x62\xdb\xa6\x8e\xa6\x9a\x45\x47\x6f\x8b\x14\x47\
+\xd4\x75\x49\xde\x4c\x10\x05\x8d\x85\x3d\x34\x3b\x8f\x31\x91\xf1\
+\x4d\x49\x24\x95\x51\x75\x55\xa4\x5d\xb2\x90\x9a\xb1\x0c\xb5\x15\
+\x37\x96\xa2\x0f\xd1\x74\xa5\xa4\x09\x4b\x4c\x15\x44\x93\x47\x24\
+\x93\xb3\x33\x24\x30\x63\x9a\x37\x4d\x5a\x6a\xb3\x14\x34\xd3\x4b\
+\x4f\x1b\x41\x54\x9d\x3a\x58\x44\xeb\x1a\x6c\xcd\x51\x2c\x55\xd1\
+\x35\x2c\xd2\x97\x58\xe4\x11\xae\xf7\x60\xb6\x41\x97\xd2\xd2\x47\
+\x4f\x35\x6d\x5d\x5c\x9f\xa2\x81\x89\x5c\x43\xd3\x6b\xa8\xeb\xbd\
+\x74\x55\xde\xa1\x44\x30\x4f\x5d\x5b\x4a\x61\x75\x55\x1f\xb6\x92\
+\x1d\xf2\xb2\x44\x89\x1c\x13\x4b\xd3\xa8\x96\x77\xc2\xa8\x53\x4d\
+\x2c\xb3\x4f\x6a\x74\xdd\x58\x2f\x88\x57\xa6\x78\xe2\x82\x09\x37\
+\x2a\x76\x80\x09\x63\x76\x6d\x2c\x94\x0f\x0c\x90\xbc\x20\x7a\x7c\
+\xda\x6c\x5a\x38\xa3\xdb\x96\x23\x90\x06\x74\x90\x9c\xa3\xb6\x79\
+\x5a\xef\x8d\xc1\xe9\xb3\x45\x58\x62\xdc\xfb\x3d\xd2\xe4\x9e\xb1\
+\xac\xb1\xcd\x22\x89\xa3\x95\x7c\x76\xb4\x65\x44\x6e\xad\xdd\x70\
+\xa8\x39\x39\x6a\x01\x47\x24\x32\x36\x1c\x54\x48\x30\x42\x47\xfc\
+\x31\xf3\x5f\xf1\xbe\xa5\x8e\x46\x5a\x98\xa4\xf9\x86\x4c\x58\x73\
+\xf7\x45\x80\xff\x00\x77\xd2\xb0\x91\x55\xc7\x25\x73\x5b\xdb\xdb\
+\x82\xc7\x9b\xf3\xa1\x3d\x25\xdc\x00\xf1\x38\x36\x5c\x95\x95\x97\
+\x92\x5a\xd7\x17\xbf\x8f\x6d\x1e\xa5\x53\x28\x8e\xa4\x7c\x54\x47\
+\x50\x03\x65\xdb\x6b\x9c\xee\x7b\xbd\xb4\xf2\x35\x28\x88\x02\xf1\
+\x76\x29\xf9\x94\xf0\xde\x7e\xf2\x8f\xe7\xaa\x41\x36\xe3\xd3\x1a\
+\x80\x5e\x27\x32\x38\xdb\x46\xb8\x53\x1a\xf7\xb6\xe5\x82\x62\x19\
+\x72\x26\xc5\x94\x5c\x89\xb7\xd0\x46\x94\xd2\x4e\xdb\x14\xf6\x57\
+\x91\xe0\xc1\x61\x52\xeb\x70\x32\x03\x06\x61\x1c\xe6\x1c\x10\x5b\
+\x20\xcc\x61\x76\xa7\xde\xab\x44\xfd\x42\x96\xae\x69\x9e\x19\xab\
+\x64\x57\x31\x67\x56\xed\x4f\x29\xa6\xa4\x1f\x15\xfe\x1a\x24\x92\
+\x46\x37\x4b\x58\x15\x90\x2d\x7e\xe2\xd1\xa2\x47\x5c\xd1\x53\x88\
+\x13\xd5\xc3\x8e\x54\xb0\x4c\xd0\xee\xca\xa2\x43\x9a\x19\x31\x42\
+\xc3\x25\x8e\x44\xb9\xd2\x7a\xb8\x4a\x53\xd6\xa9\xa6\x9d\x92\x38\
+\x6a\x0d\x4b\x6d\x7a\x8f\x87\x2b\x2a\x61\x34\xa5\x0d\x30\x25\xac\
+\xb2\xba\x90\x8c\x46\x0c\xf0\x09\x27\xa1\x15\x05\x6a\xe5\xa4\x99\
+\x04\xdf\x08\xb6\x4b\x05\x43\x08\x5f\x16\xc0\x7c\x46\x9c\x08\xb0\
+\xcb\x15\x2d\x6d\x24\xcc\xaf\xdb\x19\xc6\x6b\x34\xf1\xbd\xf8\xdb\
+\x46\x1d\xf8\x00\x71\x0b\x0a\xc7\x00\x5f\xec\x87\xcc\x30\x5a\xb9\
+\x23\x76\x0b\x94\x50\x42\x20\x51\x09\xb9\xdb\xdd\x9b\xb3\x12\xdf\
+\x35\xf9\xfa\x77\x58\x68\x52\xa2\xc9\x1d\x51\x57\x86\x22\xb0\x24\
+\x6a\x70\x52\xe3\xf5\x99\x44\x5b\x85\xf1\xc6\xf0\x46\xec\x09\xed\
+\xe6\xda\xc2\x19\xc4\x29\x99\x82\x64\x79\x5d\xea\x26\x60\x3b\x51\
+\x91\x92\x44\x88\x2b\x72\x6a\x27\x30\x92\xa0\x85\x4c\xad\xac\xcd\
+\x36\xf4\x2b\x90\x32\xb3\x19\xe4\x92\x68\x4b\x92\x8b\x50\xbb\xb1\
+\x0c\x63\x42\xb9\x04\x8c\x0c\x64\xe4\x1b\x15\x92\xa6\x59\xca\xd1\
+\xd7\x01\x4d\x12\x2b\xd4\x03\x38\x26\xdb\x2a\x99\x60\xf9\x0c\x89\
+\x55\x69\x66\xc5\x0a\x0e\xf7\x4b\x47\x1d\x14\x4e\x89\x0d\x44\xf0\
+\x6d\x60\x22\xa1\x98\x08\xd3\x2d\xc8\xfb\x1d\xb6\x55\x0c\x7b\xd5\
+\x0e\x12\x0c\x43\xcb\x29\x75\x21\x9e\x5a\xb5\x9a\xa6\x2b\x49\x18\
+\x5a\x89\x7d\x56\xf4\x8e\xdc\x7a\x78\xa3\x2d\x1a\xc7\x11\x5d\x98\
+\x37\x36\x98\xab\x97\x5c\xc7\xc4\x59\x25\xc5\xe9\x1a\xae\x44\x4f\
+\x4c\x58\x49\x84\x23\xbe\x25\xa9\xcb\x2a\x71\x21\x2d\x14\xaa\x8a\
+\xae\x54\x15\xbf\x8d\x45\x2c\xb5\x4e\x23\x51\x0c\xb3\x4b\x0c\x71\
+\xad\x0a\x4f\x22\x76\x06\xdc\x44\xef\x8d\x71\x92\x4e\x59\x1d\xf2\
+\x08\xaa\x59\x71\xae\xea\x14\x92\x55\xb9\xa3\x77\xdb\x96\xb3\x12\
+\xed\x24\x86\x24\x3e\x9a\x9e\x27\xda\x92\xa2\x5e\xe7\x86\x1d\x86\
+\xf2\x5f\x38\xec\x1d\x23\x78\x61\x1b\xa4\x23\x3c\xd3\xb4\x93\x48\
+\xf5\x32\x92\xbf\x12\x5c\xc7\xc5\xc8\xb0\x31\x24\x42\x1a\x73\x80\
+\x2c\xc4\x5c\xa4\x75\xb3\xc7\xb4\xf1\xaa\xed\xfc\x34\x2f\x24\x92\
+\x25\x90\xca\x1c\x29\xdf\x92\xde\xa1\xe5\x70\xb8\x03\x88\x53\xe5\
+\x69\x21\xa8\xa4\xac\xa5\x09\x9c\xb5\x20\x23\x43\x32\xab\xf0\x56\
+\x6a\x3d\xdb\xb2\x49\x82\xc6\x8f\x2a\x64\x96\xb9\x6e\x6f\x1c\xb0\
+\x5e\x23\xb5\xbf\x59\x51\xb9\x9c\xc5\x18\x6d\xae\xcc\x77\x0a\xb3\
+\x57\xca\xfc\x71\x36\x0a\x82\x4c\x17\x02\xda\xdb\xa8\x67\x4b\x2c\
+\x92\x8a\x45\x7d\xf5\x78\xca\xb4\xaf\x51\x2e\xc8\x43\x69\x1f\xb0\
+\x16\xc8\x86\x1c\xe4\x38\xd4\x92\x2b\xc3\x12\xa6\xd2\x43\x0c\xa7\
+\x16\x8e\x9b\xe7\x92\xf0\xf6\x2d\x3b\x08\xc9\xb2\x92\x64\x64\x19\
+\xab\x02\x2c\x66\x66\x44\xf4\xf9\x4c\xb9\x4f\x3b\x1a\x3a\xc9\x65\
+\xcd\x24\x4a\x2a\x45\x5b\x4c\x56\x0f\x85\x23\x39\x66\x9d\xa4\xb2\
+\xca\x82\xfa\x14\x86\x9d\xba\x7d\x14\xe0\x0e\xa2\x65\x99\x96\x59\
+\x52\x58\x29\x4c\xd4\x8c\x44\x8f\xb7\x1c\x36\x97\xf5\x78\xa5\x04\
+\xa2\x5a\x3c\x00\x70\xd5\xb5\x34\x11\xb7\x4c\xa7\xa9\x67\x6a\xca\
+\xc9\x62\x96\x2a\x9a\xc1\x34\xdb\x7b\x54\xf1\xc5\x85\xe0\xa2\x83\
+\xd3\x46\x8a\xd9\x0a\x8a\x9b\x25\x3e\xd3\xbe\x8e\xc6\x11\x49\x5b\
+\x23\xfc\x09\x7d\x64\x75\xd5\x43\x0b\x48\x7d\x34\xb0\xbd\x3d\x3e\
+\x51\xfc\x39\x21\xa7\x30\x97\x49\x5a\x6b\x97\x4b\xea\x31\x26\x74\
+\xb4\x95\x12\x35\x29\xf5\x52\x36\xe5\x52\x64\xe5\x60\xde\x4c\x9e\
+\x28\xa4\x9a\x4d\xe9\xed\xb4\x06\x37\x8f\x01\x92\xb3\x4d\x51\x19\
+\x4a\x45\x9f\x72\x1a\x6a\x0d\xdb\x49\xb5\xfa\xbb\x92\xa6\x28\xa2\
+\x52\xaf\x0f\xc2\xb0\x5d\xff\x00\x2c\xc5\xc8\x91\x61\x7d\xa3\x13\
+\xc6\x38\x8e\xdb\x29\x83\x64\xdb\x29\xf4\x95\xb0\x62\xd7\xf8\xbc\
+\x31\x26\x3c\x55\x64\x9e\x48\x60\x61\x4b\x53\x86\xe5\x2a\xad\xa2\
+\x82\xa6\x33\x68\x24\x2d\x99\x00\x18\x32\xec\x4c\x55\xe4\x6c\x88\
+\xca\xc7\x54\x90\x40\x71\x94\xa7\xed\x19\xb8\xe2\xc7\x82\x1e\xe9\
+\x6f\xeb\xe3\xdf\x44\xd7\xce\x93\xc0\xcb\xf3\x4a\xea\x58\x7e\x2a\
+\xdc\x76\xde\xde\x41\x3f\x8e\xb7\xa0\x78\x55\xde\xec\x02\x28\xc4\
+\x71\xe2\xd7\xf7\xf1\xa9\x9e\xa2\x38\x58\x03\x75\x0d\x05\xac\xbf\
+\x95\xf9\x27\xdb\x54\x86\x17\x8e\x29\x26\x0e\xd8\x3d\x32\xb8\x0b\
+\x95\x90\x73\xdc\x05\xbf\xbd\xe7\xf0\xe3\x48\x95\xd1\x4a\x8f\x2e\
+\x24\xb5\x3d\x92\x2c\x80\xfd\xcb\x37\x2d\xed\xcf\xce\x47\xb6\xa4\
+\xaa\x8a\x57\xaa\xa8\x78\xe5\x82\x7d\xe9\x56\x04\x50\x54\xb5\x91\
+\x21\x0f\x53\x18\x31\xde\x17\x9b\x7b\x86\x6c\xbb\x46\xba\x7d\x45\
+\x45\x11\x71\x7b\xb4\xcb\x50\x29\xfd\x1c\xef\xb8\xb1\xc2\x22\xf8\
+\xac\xf1\x65\x21\x91\x2a\xfe\x1e\xf6\x28\x24\x57\x24\xdf\xd5\x6d\
+\x41\x55\x5d\x52\x5b\xd2\xd4\x4e\xce\xe6\x9c\xac\xa1\x56\x7a\x77\
+\x97\xe2\x97\x6c\xb2\x40\xb2\xa2\x02\xb7\x0b\xed\xa7\xf4\xd2\x2c\
+\xaa\xb2\x1a\x9f\x8e\xcb\x32\x4c\xd2\x14\xdd\x96\x67\x47\x85\x44\
+\xc2\x5e\xe5\x82\x4c\xa3\xba\x83\x86\xe5\x9c\x51\x47\x4e\x1b\x61\
+\x1d\x6b\xab\x2b\xb0\x0b\x79\x09\xc8\xd0\xab\xc5\x92\x21\x47\x6b\
+\x4e\xa8\x51\x8c\x66\xd9\x1e\x55\x9b\x72\xa7\xd2\x44\xe4\x48\x5d\
+\xc3\x6e\xcd\x92\xb7\xc2\x83\x70\x91\x12\xab\x15\xef\x91\xe2\x12\
+\x25\xe2\xc6\x42\xe1\x1a\x28\xe9\xa5\x74\xa4\x58\x9d\xc5\x35\x18\
+\x02\xa2\x47\x00\x97\x69\x4c\x8e\x19\x3e\x10\x66\xc6\x9e\xc0\xdb\
+\xc6\x24\xeb\xe7\x58\x92\xc3\xe1\xd4\x30\x32\xe1\xf2\x93\x23\xb4\
+\x13\x79\xfb\xab\x6b\xe7\x6e\x74\xb5\x46\xb2\x28\xe2\x93\x98\xa1\
+\x66\x26\xdf\x53\x1a\x0b\x77\x1f\x06\xdb\x7c\x5e\xd6\x3a\xf4\x72\
+\xd1\x89\x16\xc8\x20\x9b\x22\x94\x78\x8e\xe9\x64\xa9\x11\x6d\x47\
+\xea\x5d\xbe\x1d\xe4\x56\x7c\x5b\x92\x4f\x3a\x26\x92\x5a\x6a\x68\
+\x8c\x52\x22\x0a\x49\x1a\x38\xa4\x90\xe4\xc5\x4c\x37\xc6\x56\x42\
+\xcd\x26\xed\x90\x2f\x2e\x58\x05\xb8\x1d\x35\x3a\x87\x4e\x7f\x4e\
+\xbe\xa5\xaa\xa2\xa8\x9a\x4a\x95\x8b\x10\xd5\x21\x0a\xc3\x0a\xad\
+\x5c\xc1\xa3\x88\x48\x0b\x45\x08\x2f\x24\x4e\x64\x55\x1a\xa7\x85\
+\x64\x86\x9c\x53\xcd\xb6\x22\x68\x4b\x8e\x4e\x4d\x0c\x31\x46\xc8\
+\x8a\xae\xcc\xb2\x4b\x37\xdf\x61\xbb\x26\x4e\x32\xd4\xb7\x8b\xd4\
+\x55\x60\xc1\x48\x47\xdc\xc8\x7c\x32\xe1\x43\xaa\xc3\x10\x67\x11\
+\xed\x45\x86\xe5\xf3\x3c\xf7\x6a\x21\x9d\x2c\xf3\x42\xad\x1c\x69\
+\x27\x87\xa9\x72\xaf\x3b\xc1\x04\x8c\xc9\xb5\x04\x16\x80\x4c\xf7\
+\x61\x02\x87\xcf\x27\x56\x5b\xc0\xd2\x4c\x91\xca\xd2\xf8\xd8\xa4\
+\x59\xae\x2f\x14\x4c\xd1\xcc\x5f\x61\x80\xc6\x3d\xa0\x36\x43\x36\
+\xfb\xe8\x53\x54\x2a\x15\x81\x9e\x49\xaa\xb1\x97\x6a\x3a\x72\xad\
+\x68\x63\x5d\xc0\x70\x69\x72\x33\xce\xf3\x19\x59\x46\xd5\x3e\xde\
+\x5b\x6d\x02\x51\xc2\xaf\x06\xde\xc8\x58\x0a\xa4\x52\xc9\x6b\xce\
+\x5a\x4a\x8c\x65\x3b\x3c\x00\xb1\x34\x48\xe5\xef\xdc\xc2\xfa\x34\
+\xb3\xc5\x4f\x33\x4b\x09\x2b\x79\x11\x7d\x34\x4b\x95\x9b\x14\x92\
+\x46\x95\x97\xe6\xc6\xc5\xae\x01\xba\xda\xfa\x6a\x0b\xc3\x15\x44\
+\x4f\x14\x94\x93\x47\x53\x24\x59\xc2\xcb\x82\x33\x40\xeb\x50\x54\
+\x2d\xf6\x91\x10\xa6\x57\x1b\x82\x4e\x6f\xb5\x03\xd4\xa4\xb0\xc7\
+\x04\x75\x2f\x2d\x22\xde\x16\x57\x99\xf7\x96\x55\xb2\x6e\xac\x3b\
+\xa8\x91\xc1\x98\xc1\xaf\x31\x5e\x54\xc6\xec\x2a\x6a\x69\x48\xd9\
+\x49\x5d\xd6\x16\x0b\xb8\x1a\xee\x02\xcc\x4c\x11\x73\x28\x53\x89\
+\x6b\x58\x92\xa6\xda\x80\x31\x8d\x21\x5d\xfa\x89\x59\xd6\x49\xc9\
+\xcc\xb0\x12\x3a\x2a\x65\x54\xca\x51\x5e\x24\x25\x76\xd3\x23\xca\
+\x0c\x75\xbf\x5f\x2b\x25\x28\x82\x4f\xd1\xb4\xed\xfa\xb8\x8a\x96\
+\x98\x49\x81\x30\xa8\x1b\x3b\x92\x1b\xc7\x7e\xe6\xbd\xa5\x7b\x77\
+\x01\x49\xd3\xa9\xe1\xce\x59\x29\x61\xa5\x96\x70\x0c\x30\x4d\x1a\
+\xcb\x4d\xfa\xac\x68\xc7\x76\xa8\x7c\x4d\xf9\xa6\xce\x2b\x34\xf2\
+\xf7\x03\x12\x2a\x53\x47\xd5\x3a\xac\x5d\x49\x95\x61\xa3\x5a\x79\
+\x4c\x1e\x96\x38\xa1\x0b\x2d\x5c\xae\x56\x58\xd9\x44\xed\x2c\xa1\
+\xc4\x69\x13\x15\x51\x82\x1b\x3a\xd1\xc5\x58\x29\x7a\xac\xd0\x48\
+\x25\x8f\xa8\x1a\xb8\x7d\x7f\xaa\x17\x5f\x88\x71\x4f\x5a\xe7\x26\
+\x19\xa4\xa5\x12\x36\x6d\xd4\x7b\x68\xa2\x1a\x29\x56\xa1\x56\x3a\
+\x94\x96\x9c\x10\xef\xf7\xa2\x95\x55\x55\x15\xf1\x27\xe3\x21\x4e\
+\x40\x23\x9d\x50\x7d\xa1\x14\x8f\x55\xd0\x6a\x81\xe9\x35\xeb\x13\
+\x0f\x83\x21\x11\x49\xd3\xaa\x00\x7b\x88\xa3\x9b\x29\xa2\xb1\xf3\
+\xc2\xb3\x64\xdc\xc3\x27\x4b\x65\xf4\xee\xc5\x8a\x55\x1c\xa5\x33\
+\x07\x77\x22\x5c\xa5\xbc\x5d\xed\x8b\x31\x0d\x23\x44\x03\xb3\x49\
+\xb6\x35\xf6\x83\xaa\x4a\xdb\x34\x34\x10\xc7\xb2\xc3\x64\x89\x6a\
+\xfd\x4d\x35\x34\x51\xd8\xad\x80\x87\x26\xf5\x12\x16\x39\x48\x63\
+\x0b\x1c\x79\x5c\x3d\x2b\xd7\xb8\xa8\xf0\x9e\xa2\x38\xf0\x98\x76\
+\x1b\x45\x25\x31\xee\xb7\x75\xec\xab\xda\x3f\x3d\x6c\x4a\xdb\xd3\
+\x90\x55\x76\x91\x88\x1e\xf6\x62\xcf\x70\xbf\xbb\xdb\x7b\xdb\x9d\
+\x31\xad\xf5\x12\x38\xb7\xcd\x90\x03\x9e\x08\xc6\xc3\xfc\x74\xb1\
+\x45\x8b\x00\xaa\x2c\x47\xdd\x51\xef\xef\x7b\x0f\xe7\xa5\x45\x86\
+\x25\x58\x10\x01\xdb\xdd\x61\xed\x6f\x1f\xd4\x7d\x7f\x0d\x55\x9a\
+\x28\x37\x64\x82\x9c\xcf\x69\x59\x8a\x73\xc0\x5f\x86\xa2\xe4\xdf\
+\xc2\xb0\x3f\x8e\xa9\xcc\xe2\x4a\x08\xe2\xa8\x16\x85\x69\x24\xf5\
+\xcc\xb3\x3e\x4b\x4c\xdb\x48\x37\x52\x6e\x0a\x87\x04\x90\x7b\xdb\
+\x1b\xe8\x74\xe8\x2b\xa5\xa6\x1d\x47\xd3\xc9\x55\xfa\x46\x00\x93\
+\xa3\x51\xfe\xca\x49\xea\x99\x70\x12\xab\x80\xc2\x9e\x08\xc2\x92\
+\x00\x2a\x05\xce\xa7\xe9\x15\x55\x90\xcd\x57\x0c\xe9\xe9\xa6\x78\
+\x19\xa2\xa8\x80\x07\x5d\x81\x13\x5b\x69\x2f\x6c\x59\x0e\x7d\xc7\
+\x1b\xbe\x36\x61\x23\x53\x41\x47\x4d\x45\x93\x08\x2a\x11\x22\x8e\
+\x37\x36\x92\x2b\x2a\x33\xfa\xc9\x0b\xdb\x16\x9a\x4c\x63\x25\xd9\
+\x94\xae\x06\x16\x12\x25\x43\x41\x4d\xb6\xbe\x9e\x28\x16\x9f\x3b\
+\x02\xf2\x24\x94\xe4\xe5\x26\x38\x87\x92\xa3\x26\x2e\x3f\xe9\xd2\
+\x47\x23\x8d\xe9\x14\x36\xcc\x72\xbc\xad\xde\x07\xed\x02\x3c\x5b\
+\xa7\x8b\x05\x77\x29\x1d\xf3\x0b\x92\x8d\x18\x69\x68\xe6\xaa\x8c\
+\x48\x36\xa9\xe2\x63\x6d\xd4\xe2\xdb\xd0\xc7\x69\xe3\xbf\x2e\xcf\
+\x75\x89\xbb\x58\xfd\xed\x2c\xbd\x4d\xe8\xa9\x9f\x89\x1a\x86\x59\
+\x73\x19\xe3\x70\x8e\xd4\xd2\x42\x65\x37\xb7\x64\x32\x13\x7f\x9e\
+\xcb\x96\xa2\xa8\x92\x9f\xa7\xc3\x1a\x77\x15\x83\x70\x3a\x44\xa3\
+\xcd\x93\x7f\x6c\xcb\xfb\x38\xd6\x57\x2c\x5d\xc0\xc8\x13\x71\x08\
+\x58\xa2\x92\x67\x52\x62\x58\xee\x40\x8c\x79\x62\x9d\xa3\x24\x00\
+\xee\x46\x4c\xb2\x31\xe3\x34\x1e\x27\x8a\x29\x22\x91\x42\xfc\x92\
+\x29\x4f\x86\x39\x2a\xb1\xd1\x89\xcd\x3a\x10\x2c\x59\xac\xe0\x5c\
+\xb3\x81\x7d\x57\x5e\x3a\x38\xaa\x54\x53\x81\x2c\x62\x9a\x8a\x8e\
+\x39\x54\x87\xd9\x09\x04\xaa\x6a\x2f\x15\xcb\xd4\x56\xb9\x96\x67\
+\x44\x40\x41\x38\x97\xa5\xa4\x50\x68\x9c\x48\x93\xd6\xe7\x8d\x44\
+\xf2\xbc\x62\x39\x9a\x9d\xac\xc3\x26\xdd\xc3\x86\x0a\x13\x90\x32\
+\x17\xd2\x47\x55\xd4\x27\x8b\x00\xc6\x3a\x38\xb2\xde\x6e\xcc\x40\
+\x12\x21\x92\xc3\x64\x1c\xcc\xd2\x1b\x77\x38\x19\xe3\xa4\xce\x6d\
+\xf9\x12\x9d\x25\x96\x38\xbb\xf7\x51\x9a\xc2\x84\x4e\xf9\x61\x9e\
+\x59\xd4\xb8\xfb\xa0\x81\x68\xd4\x47\xa5\x84\x4d\x1c\x53\x25\x43\
+\x56\x49\x1c\xb2\x2b\x99\x2a\x70\x3b\x31\x4a\x03\x65\x15\x2c\x51\
+\xfc\x35\x87\xbb\xd4\x1b\x6d\xe0\xe5\x48\x8a\x9a\x9e\x04\x90\x46\
+\x99\xc9\xb5\x68\x54\x2d\x4a\x48\xe9\x25\x49\xc6\xe9\x8a\xb8\x0e\
+\x2a\x19\x53\x21\x21\x89\x37\x36\xd7\x41\x7e\x1c\x2e\x49\xa8\x58\
+\xe2\x9c\xe4\xe6\x4b\xcb\x1c\x47\x8c\xe5\x58\x84\x6f\x2c\x6f\x25\
+\x87\xd7\x70\x85\xd6\xf5\x6d\x3c\x22\x08\x70\xdd\x96\x68\x5e\x52\
+\xce\xe3\x25\x32\x02\x0e\xd4\xc6\x55\xc5\x06\xe0\x05\x48\x92\xc2\
+\xc4\x15\x95\x1e\xa9\x56\x71\xb7\x4a\xea\xcb\x51\x57\x1a\x91\x7b\
+\x40\x56\xf2\x82\x47\x6c\x6b\x04\x8b\x6b\xf7\x32\x0b\xb8\xa3\xa1\
+\xf4\x53\x45\xb7\x08\x19\x6e\x24\x82\xf3\x1c\x99\x89\x89\x1d\xd4\
+\xa2\xab\x6f\xfc\x34\x45\xb9\xdf\x9e\x4c\xb2\x12\x45\x50\xb1\xbc\
+\x67\x1d\xc9\xe0\x8c\x2c\x30\xaa\x82\x5d\x0d\x49\x86\x15\x9d\xe3\
+\xc4\x67\x14\x02\x43\x93\x0f\x88\x7e\x53\x51\x5b\xf6\x6e\xad\xc3\
+\x4d\x8f\xa9\x82\xaa\xf5\x31\xcb\x11\x72\x32\x7a\x79\x0b\x6d\x48\
+\x7e\x26\x1d\xb4\xc0\x45\x6b\x06\x90\x02\x76\x3a\x8b\x1e\x9e\x5a\
+\x33\x93\x0a\x96\xf4\xe7\xb1\x88\x92\x7c\x17\xb2\x20\x40\xc6\x16\
+\xed\xbd\x95\xdb\x1b\xb0\xdf\xe9\xd5\x4b\x51\x25\x9a\x18\xdc\xe3\
+\xb3\x1f\x7a\xb9\x95\x0f\x7c\x2b\xdb\xda\x94\xb0\x9a\xb9\x8a\x7c\
+\x4b\x65\x7b\xcf\x4e\xe9\xfa\x4a\xa9\xa3\xbc\xd5\x59\xb4\x4b\x4c\
+\xd2\xbc\x85\x94\xb4\xd2\xe3\x14\x20\x39\x36\x23\x7a\xe1\x7f\x56\
+\x8f\xe7\x09\x3b\xd1\x49\x2f\xc1\xc2\x3a\xc4\x96\x58\xde\x13\xea\
+\xb1\x3f\x0a\x73\x9c\xa9\xea\x42\x6d\xbd\xce\x6d\x6c\x6c\x9c\x68\
+\x65\xd6\x65\x68\x22\x56\xfd\xb5\x2e\xcf\xa8\x45\x53\x92\xba\xaa\
+\x70\x89\xf2\xb4\x97\x2d\xee\xb7\x36\x1a\x97\xa4\x75\xa6\xa5\x96\
+\x92\xb9\x19\x66\x6c\x64\x93\xa7\x54\xb3\xac\x6f\xb5\x2c\xd8\x29\
+\xe9\xf2\x0b\xa6\xc9\x93\xb9\x4a\xac\x91\x92\x46\xdb\x74\x68\x3a\
+\x7f\xda\x7a\x19\xfe\xce\x75\x8e\xa2\x90\x1a\x84\xa9\x0b\xd4\x29\
+\xa9\x56\x11\x53\x21\x8e\x35\x55\xde\xc2\x9c\x3d\x3c\x75\x45\x2e\
+\xb2\x4b\x16\xec\x26\xe4\xea\x2f\xb1\xbf\x64\xa9\x41\x86\x2f\x4b\
+\x53\x52\xb1\x19\x51\xa0\xe9\x94\xd5\x32\x7a\x63\xc4\xc2\x79\xa7\
+\x9e\x75\x69\x25\x79\x5e\x49\x59\x12\x46\x98\xba\x34\x61\x12\xbe\
+\x4a\xe9\x5d\x40\x2d\x4f\x49\x1b\x31\xbd\xaf\xc1\xc7\x1f\x89\xfd\
+\xce\x09\xb5\xaf\xa8\xaa\x6a\x23\x75\x9e\x31\x83\x46\xbd\xb3\x47\
+\xed\x93\x9f\x67\x3f\xb8\x41\x23\xeb\xa0\x6b\x11\x65\x96\xdf\x20\
+\xee\x66\xf6\x3c\xfe\x1e\x75\x2c\xdb\x0d\x46\x38\x55\xee\xc4\x95\
+\xbf\xcd\x63\xfd\x7f\x0d\x24\x11\x05\xab\xa5\x9d\xb0\x53\xe9\x52\
+\x7f\xff\x00\x5d\xb9\x16\xfc\xc6\xbd\x59\xe9\x24\x44\xf5\x18\xc4\
+\xf7\x64\xa4\xa8\x47\x47\xcd\x66\xfd\x99\x8d\x22\x00\xbb\xe6\x00\
+\x8d\x57\x28\xe5\x79\x02\xab\x41\x59\x2d\x25\x44\x74\x52\x98\xeb\
+\xa9\xa6\xaf\x93\xbe\xa1\xb1\xdb\xa5\xd9\x30\xc8\xd5\x51\x45\x25\
+\x9b\x6f\x72\x06\x02\x10\x64\x93\xb3\xc2\x56\xd3\xa8\xa9\x31\xb4\
+\x09\x52\xd4\x4b\x04\x88\x5a\x5f\x98\x52\xd4\x31\xc2\x08\xe2\xb6\
+\x53\x55\x38\x0c\x41\xc6\xcf\x7c\x1a\x2a\x9a\x0a\x5a\x79\x1a\x9a\
+\x34\x8d\x4f\xc3\x77\xbb\x0c\x42\x43\x26\x6a\xb2\x4e\xbd\xec\xd5\
+\x2c\x8a\x89\x6c\xe2\x40\xea\xba\xa7\x82\xbe\x25\x58\x04\xb3\x4e\
+\x71\xe5\x1b\x68\x6e\x0e\x21\x51\x1a\x9c\x80\x0c\xb2\x09\x37\x66\
+\xc6\x5f\x6d\x34\x33\xc8\xf2\x46\xd6\x77\x47\x2f\xda\x8e\x55\x96\
+\x38\xee\xab\x18\x50\x2e\xf2\xe2\x01\x38\x0e\x47\x20\xaa\xe7\x47\
+\x1d\x2c\x70\xa6\x4c\x54\xa2\x9c\x58\x5a\x34\x65\x0f\x21\xcc\x76\
+\xb7\x24\x9b\xf0\xd1\xfc\xcb\x4b\x41\xd3\x24\x8d\x66\x0b\x9c\xd3\
+\xc5\xbf\x49\x84\x0f\x20\xf8\x10\xa6\xde\x26\x66\xfd\x9a\x32\xbb\
+\xf7\x30\x77\x52\x45\xf5\x2b\x55\xd1\xd2\xbe\xd4\x59\x93\x2c\xef\
+\x59\x33\x4d\x6b\xa4\x8e\x96\xdd\xed\xfe\xd3\x39\x18\x06\xee\x0a\
+\x2d\x6d\x21\xa7\xa3\xab\x94\x4d\x7d\xc1\x44\x8d\x49\x4b\x98\x22\
+\xcd\x3c\xa1\x43\x34\x6a\x7b\x8d\xdc\x03\x6b\x76\x5f\x21\x21\x46\
+\x14\xf0\x89\xa4\x82\x1a\x9d\xb4\x7a\x4a\x7a\x75\xe5\x85\x2d\xd2\
+\x59\x24\xab\x67\x1f\x2e\xc6\xe1\xf9\xb2\xd9\x0d\x32\xcf\x47\x41\
+\x54\xd1\x74\xf3\x93\x54\x75\x3a\xd2\xb1\xcf\x29\x66\xc5\xf1\x33\
+\xc4\xb1\xc7\x70\x6d\xb6\xa2\x4b\x03\x7b\x7b\x6a\x1a\x69\x20\x82\
+\xa8\x6d\x99\x5a\xa6\x5e\xa1\x2e\x06\x75\x5c\x04\xf5\x38\x47\x0a\
+\x8a\x78\x95\x8c\xcd\x81\x5c\xb0\xb2\xdb\x49\x13\x4b\x34\xd4\x88\
+\x32\x59\x41\x89\xa1\x96\x30\x2e\x8d\x03\x33\x19\x4a\x4c\x78\xcc\
+\x0e\x50\x7b\x7c\xda\x64\x8e\x36\xd8\x89\x32\x14\xf0\xc5\x34\x85\
+\xef\xdd\x79\x66\x42\x8a\x14\x7b\xb4\x8c\x55\x12\xe6\xc4\xe9\x6a\
+\x7f\x64\xf0\xa3\xdd\x47\xc7\x55\x0b\xcd\xde\xd8\xc7\x22\x44\x6c\
+\xc0\xe1\xcd\xb1\x6c\xaf\xa3\x5d\x1e\xe0\x8f\x28\xfe\x1a\xc7\xde\
+\xf2\x4a\xe4\xbb\xe4\x15\x98\xc4\x24\xda\xc9\x98\x3a\xe0\xed\xb6\
+\x8a\xa0\x8d\x45\x2c\x95\x11\xb8\xee\x9d\x7a\x6c\x2e\xe3\x79\x99\
+\x96\x38\xf7\xa1\x8c\xc4\x1c\x89\x4a\xe0\xd3\x24\x49\xc9\xc5\x4b\
+\xe1\x66\x49\x6b\x04\x93\x2b\x87\xa9\x53\x43\x4d\x58\x94\x96\xe2\
+\x2d\xe6\x2b\x77\xc4\x90\x94\xb0\x17\x20\x1f\x9a\xe7\xb8\x6c\xa5\
+\x6c\x46\x95\xe2\x5a\x8a\x85\xaf\x82\x9e\x90\x46\x6a\x65\x44\x49\
+\xa5\xc6\x57\xdf\xa8\x61\x91\x4a\x6b\x2d\xb2\xc4\x0c\x7b\x75\x53\
+\xff\x00\xcb\xf4\x91\x14\x8e\x19\x61\x8a\x7a\xdb\xd0\xee\x30\x8c\
+\xa4\xd2\xd9\xe3\x48\xe9\xa9\x80\x3b\x2c\x23\x89\x9a\xab\x76\xc1\
+\xd5\x0b\x6a\x0a\x0e\xa4\xd4\xdb\xf4\xd4\x9b\x45\xa9\x60\x31\xd1\
+\x20\x9e\x75\xb4\x14\x74\xe9\xb5\x13\x42\xb1\xfa\x5a\x58\xa6\x68\
+\xf2\x67\xb6\xe4\x12\xe4\x6a\x00\xaa\x9d\x87\xeb\x08\x6a\x33\x6f\
+\x50\x26\x68\x16\x45\x79\x25\x64\xf8\x66\x28\x55\xc4\x10\xb5\x34\
+\x7c\x4a\xc6\xdc\x23\x11\xa8\x1d\x2b\x05\x4a\xb3\xef\xa2\x21\x28\
+\xb5\x13\x0b\x44\x6a\x0c\x10\x24\x25\x69\xa8\xb2\x08\xd0\xb1\x32\
+\x4b\x54\xdb\x22\x5e\xc6\x27\xd3\x54\xc1\x68\x67\x04\xca\xa6\x3c\
+\x1c\x47\x18\xcf\x70\xc6\x45\xd0\xc9\x1b\x21\x54\x95\x9f\x1e\x5c\
+\xe4\x06\x3a\x8e\xaa\x09\x03\xc1\x91\x89\x69\x0c\xac\x36\x91\x87\
+\x7c\x90\x94\x64\xde\x9e\xd7\xe7\xe6\xfb\x8b\x61\xc6\xb2\x86\x35\
+\x94\xd9\x19\x04\xb8\xa9\xa9\x96\xf6\x51\x20\x6b\xc8\xd4\xb4\xa9\
+\xf1\x2a\x64\x67\xbc\x92\xed\xd3\xc6\x63\x67\xcb\x52\xb2\xa5\x53\
+\x7a\x66\xda\x13\x54\xc1\x1b\x86\x4f\x86\x7d\x4a\xc5\x8d\xa2\x8d\
+\x3d\x4a\xc3\x46\xa2\xc1\x1a\xdb\x82\x57\x42\xda\x7a\x91\xea\x90\
+\x06\x53\x4f\x9d\xb6\xa9\x82\x48\x6d\xb9\x05\x81\x91\xa4\x65\x8e\
+\x62\xb9\x05\x3c\xf6\xdb\x8d\x1f\x51\xe9\x9a\xa0\xc8\x0f\x75\xa3\
+\x79\x26\x31\xa1\x25\xf6\xe1\xf8\x86\x48\xee\x6e\xc4\xed\xa8\xc2\
+\x32\x8f\x66\x10\x75\x0a\x9a\x98\x60\x6a\x5a\x79\x16\x91\x5a\xca\
+\xa9\x51\x52\xc8\x6a\x24\x19\x0b\x92\xca\x91\x87\x65\xc5\xb6\xe2\
+\x0a\x08\xbb\x65\xda\xd2\x27\x5c\x8e\x46\x86\xaf\xaa\xbc\xac\x65\
+\x92\x47\x96\x58\x84\xfb\x57\xf8\x90\x09\x44\x6a\xb0\x00\x31\x85\
+\x52\xe6\xf2\xe6\x44\x9d\x5a\x08\xe6\x2c\xcc\x26\x0a\xd8\x36\x63\
+\xe4\x74\x20\xe3\x79\x97\xe2\xc3\x32\xa0\x46\x50\xcb\x8d\xd7\x9d\
+\xe6\xa8\x92\x09\x07\x69\xde\xc6\x39\x01\xff\x00\x86\xf6\x0b\x1c\
+\x83\xff\x00\x52\xc1\x8f\xef\x68\xd6\x47\x51\x34\x71\x96\xc4\x46\
+\x2e\xcf\x9f\xf1\xbe\x8d\x55\x6d\x75\x44\x14\xe0\x76\x2b\x9e\x4f\
+\xd2\xf6\x03\x82\x6d\xa3\x4d\x99\x4a\x9a\x99\x92\x18\xe6\xcd\x24\
+\xa7\x5c\x9d\x54\x34\xbb\x80\xa8\xfc\xfc\x29\xee\x2a\xc0\x62\x6a\
+\x07\x51\xaa\xa7\xad\x8c\x0a\xa8\xa9\x61\x98\x43\x48\x8b\x29\x65\
+\x65\x33\xd5\x02\xd7\x86\xca\xdb\x31\x60\x10\xdf\x3f\x97\x8d\x7f\
+\xe2\x6d\xf0\x84\x35\x0f\xb8\xe1\x9e\xa7\x73\x3c\x22\x8e\x95\x5d\
+\x9b\x74\x3b\x6d\x45\x00\xbe\xd9\x0d\xf0\x91\x10\xea\x54\x8a\x86\
+\xa2\x3a\x3a\x95\xcc\xd7\xf5\x2a\x81\x1a\x53\xc7\x26\x53\xbb\x5a\
+\x6d\xb8\xe1\xda\x44\xee\x85\x37\x71\xc4\x12\x6c\x0d\xe0\x92\x7a\
+\xcc\xe8\xcb\x11\x1e\xc9\x9e\x9a\x3a\xb9\x55\xfe\x8f\x12\xb3\x53\
+\x02\x55\x53\x28\xee\xe4\x48\x62\x36\x2b\x2c\x6b\x53\x32\x09\x69\
+\xfa\x74\xd3\x48\xe3\x75\xe3\x8d\xa4\xf8\x9f\x0a\x65\x8b\xb5\x56\
+\x0a\x74\x19\xbb\xdf\x1c\xb3\xc5\x98\x01\xa2\x8f\x13\xc9\x10\xe9\
+\x91\xd5\xb2\x22\x36\xd4\x1b\xce\xec\x4e\xf7\x06\xd6\x22\x38\xee\
+\xe5\x8c\x47\x26\x40\x2f\xa1\x63\x02\xd3\xc6\xd1\x46\x46\x12\x10\
+\x8f\x82\x32\x62\x01\x2d\x25\xda\xe0\x9b\xe1\x7b\x5e\xcb\x96\x8c\
+\xb6\x31\xad\x09\xc6\x9d\x8c\x10\x23\x12\xca\x6e\xf7\xdd\x91\x51\
+\x52\xf9\x8c\x17\x23\x6c\x78\x26\xe2\xe6\x5a\xa8\xa2\x19\x3b\xbc\
+\x70\x44\x66\x94\xdf\x33\x2c\x8d\x3c\xc8\x89\x4f\x90\x16\x32\x3a\
+\xab\x7c\xa7\x83\xa0\x63\xa8\x35\xf4\xf1\x54\xb5\x54\x50\xc9\x90\
+\xa1\x33\x15\xbf\x78\xa7\x60\xb2\x32\x11\x91\x58\xaa\x24\x85\x2d\
+\x9a\xb2\xb2\x86\x06\x08\xea\x27\xfb\x3d\x4f\x24\x62\x28\xd2\xf1\
+\x22\x55\x65\xde\xfe\x9a\x9f\xd2\x5a\x9a\x9d\x83\x03\x2d\x4a\x35\
+\x4c\x8c\xb9\xdf\x9e\xe0\x9e\xa6\xb1\x65\xf4\xac\xc2\x04\xac\x96\
+\x16\x14\xfe\xd3\x55\x98\x5d\x40\x50\x01\x67\x84\xc8\x19\xe4\xb0\
+\x67\x55\x4b\xe9\x2b\x29\x13\x67\xa6\xb4\xa5\x56\x6a\xa6\x47\x4a\
+\x97\x88\x61\x23\xa8\x54\x8b\xf6\xc4\x76\xc5\x1a\xec\x08\xc9\xfd\
+\xa7\xca\x61\x26\xaa\x1d\xb9\x4e\xe4\xcf\x1e\xe4\xae\x23\x44\x90\
+\x2c\x71\x46\x19\x54\x30\x1c\x05\xda\x8d\x17\xe6\xb3\x5b\x99\x06\
+\x32\xa0\x75\xe2\x15\xa9\x91\x63\x92\x9e\x3f\x96\x49\xca\x32\xae\
+\x7c\x64\x62\xb0\xb5\xbb\xb2\x5b\xa9\x5d\xb6\xda\x45\x91\xda\x22\
+\x2f\xb4\xc5\xca\x58\x28\x40\xc6\x73\xc7\x0a\x2d\x18\x3d\xce\xa5\
+\x41\xd0\x8a\x70\xb1\xc3\xb7\x10\x8a\x08\x83\xdb\x28\x93\x01\x2d\
+\x4e\x72\x76\x2e\x19\x16\x1f\xb3\x37\x37\x8c\xf0\x04\x54\xd1\x4e\
+\xf2\xc7\x00\xdf\x2d\x4c\xc2\x0e\x9d\x4c\xab\x22\xfc\xd2\x2a\xc3\
+\x1b\x36\x6d\x19\x03\x6e\x5b\x49\xca\x8c\xac\x41\xa0\xa4\x8a\x04\
+\x14\x69\xea\xa7\x14\xac\x72\xde\xa8\xe1\x65\x9a\x47\xbc\xb2\x8d\
+\xa7\x76\xe6\xc3\x02\xdb\x69\x9e\x07\x51\xf5\x19\x1d\x16\x39\x25\
+\x68\x23\x2d\xbe\xa9\x20\x1e\x6a\xa4\xcd\x23\xdd\x68\x80\x2b\x11\
+\xc1\x36\x94\x97\x3b\x85\x75\xb7\x2c\xe5\xa2\x45\x27\xb5\xac\xb5\
+\x12\x82\x45\x32\xb4\xe7\x6e\x37\xda\x8d\xe3\x57\xdc\x05\x01\x93\
+\x36\x56\x2a\xa3\x57\xa8\x5b\xd4\x54\xd2\x57\x0a\x58\xe6\xc1\xb7\
+\xa4\x47\x5c\x2a\xb7\x04\xc7\xe4\x78\x8c\x74\x93\x14\xcb\x28\xac\
+\xbf\x0f\x8d\x2a\x0c\xaa\x16\x0a\x30\xbb\xca\xdb\xb3\xa3\xc9\xdb\
+\x56\x22\x90\xf0\xc0\x02\xd4\xe8\xaa\x06\x12\x2e\x6d\x96\x36\xd3\
+\xd6\xa6\x3e\x9a\x98\xc9\xfb\x67\xb4\x11\x98\xd5\x23\xb2\x61\x83\
+\xc9\x11\xa7\x95\x64\x8d\x72\x04\xdf\xd5\x3b\x34\x92\x06\x49\x9a\
+\xa3\xd5\xc0\xa9\x80\x9f\x00\xed\x24\x97\xc1\x71\x93\x26\x7c\xb1\
+\x8d\x57\x0c\x71\x2c\xa4\x29\xbd\xf5\x4d\x47\x40\xaf\x55\x57\x34\
+\xcb\x41\x42\x23\xe5\x4b\xd6\x54\x24\x50\xcd\xc0\x53\x1c\xc4\xcc\
+\xa1\x12\xf7\x4b\x31\x62\x46\xa7\xe9\xfd\x26\x41\x5b\x4b\xd3\x92\
+\x9f\xa5\x49\xd4\x85\x41\x96\x9f\xaa\xf5\x18\x4b\xcb\xd6\x2b\x29\
+\x9d\x70\xb7\x4f\x15\xe4\x74\xda\x50\xb6\xf5\x0b\x42\x6a\xc3\x77\
+\xa6\x34\xdb\xe1\xf7\xaa\xd9\x5a\x5b\x92\xc8\xeb\x4f\xf1\x8a\x96\
+\x37\x7c\x0d\x63\xca\xd6\xcb\xc0\x8c\x0b\x63\xa6\x59\xa7\xd8\x61\
+\x8b\x5d\x62\xcc\x96\x16\x0a\xe4\x13\x62\xca\x07\x1e\x07\xd4\x1d\
+\x7a\x93\x35\x65\x4c\xaa\x6c\x04\x71\xfb\x15\x17\xb0\xbd\xee\x4a\
+\x83\x7b\xf1\xed\x61\xc6\xa2\xfd\x17\x49\x58\x8c\x2f\x7f\x5b\x16\
+\x4a\x78\xb1\xb3\x8e\x50\x63\x7f\xaf\xd3\x49\x55\x24\x31\xbc\xb3\
+\xc6\xf2\x3a\xe7\x92\xbd\x4d\x36\x31\xd6\x84\x1c\x63\xea\x68\xa2\
+\xa5\x9d\x46\x57\x0f\x4e\xcc\xa4\x5c\x8d\x16\x95\x25\x9e\xaa\x08\
+\x88\xc1\x4e\xcf\xea\xe5\xd0\x11\xf3\x62\xc8\x2e\x19\x5c\x01\xb2\
+\x2c\xdf\x26\xe2\x38\xfd\x22\x59\x29\xa6\x27\xb4\x46\xb5\x4d\xb7\
+\x7b\xac\x72\x92\xc4\x46\xeb\xf3\x28\xb5\xd8\x0c\xee\x00\xc7\x53\
+\xcf\x55\x44\xa6\x9a\x3b\x76\x22\xcb\x88\x75\xee\x6b\xb7\x36\x21\
+\x79\xfc\x7c\x6a\x65\xae\xdd\xa6\x64\x58\x4f\x6b\x61\x92\xcb\x62\
+\xa6\xee\x48\xc4\x8b\x8f\x6f\xc9\xbe\x52\x95\x70\x50\xc7\xd4\x36\
+\x06\xf4\x0d\x3b\x22\xc1\x1c\xbd\xd8\x28\x49\x32\x92\x72\x7f\x1a\
+\x67\x52\x7c\x5b\xe6\x1d\x46\xa2\xa5\x0c\x92\xd4\x51\xa4\x52\x50\
+\xa5\x2c\x98\x26\xf3\xab\x30\x28\xc9\x13\xa2\x04\x66\x8a\x59\xfe\
+\x11\x0c\xe9\xb4\x42\xfc\x27\xb5\x42\x1a\x2e\x9e\x25\x69\xa2\x29\
+\x3c\xf2\xcb\x34\xf1\x2a\x05\x48\xf7\x9e\x79\x38\x45\xc3\x85\x8e\
+\x24\x52\xce\x17\x35\x52\x16\x0e\xb1\x2c\x9b\xb0\xc7\x05\x3d\x3c\
+\x2a\x1a\x43\x1c\x0d\x0a\xa4\x50\xa4\x72\x32\xd3\xd3\xa3\xee\x5e\
+\xa2\xa2\x71\x21\x98\x5e\x23\x92\x39\x8d\x9e\x7f\xd6\x63\xa0\xe8\
+\xb4\xc6\x1a\x4a\x08\x0c\x0a\xd5\xf5\xe9\x11\x53\x35\x5b\xe6\x93\
+\xbc\x51\xcb\x23\x4a\x5a\xa3\x68\x8c\x30\xa5\x89\x21\xd5\x5f\x4f\
+\xa8\xaa\x9c\x4b\x4d\x41\x04\xf5\xb4\xd4\x0d\x1c\xb2\xa5\x45\x54\
+\x74\xf2\x54\x19\xf6\xb8\x0c\xbb\x9b\x32\xc9\x33\x48\x00\x06\xc8\
+\x1a\xcd\xa8\x96\x0c\xd9\x27\xa3\xa6\xa3\x08\xb5\x16\xa5\xa3\x81\
+\xd3\xe2\xb9\x65\xb9\x79\x59\x32\x8e\x57\x94\x4c\xe3\xe2\x2a\x98\
+\xc5\xb1\x14\xf4\x9d\xb1\x19\x5a\x18\xaa\xb9\xda\x44\x8d\xbe\x21\
+\x49\xb8\x66\x16\xc9\x14\x14\x39\x5c\x21\x36\x24\xe9\x61\x4a\xfa\
+\x7a\x31\xb9\xdd\x8c\x4b\x3d\x43\xd8\xe1\xba\x23\x85\x76\xa1\xb9\
+\xf0\x25\x65\x2d\xe3\x9b\xe2\x49\x77\xaa\xaa\x62\xd6\x05\xc4\x0a\
+\x24\x89\x08\xde\x92\x6e\xf0\x3e\x5c\x8f\xa6\xba\x0b\x7c\xa3\x2b\
+\x69\x9a\x9f\xd3\x24\x00\xc8\x66\xaa\x45\xf5\x52\x53\xd3\xc0\xa7\
+\x08\x2e\xee\xaa\x01\x97\x6f\x01\x1a\x91\x1c\x84\x25\x99\xac\xda\
+\xaa\x98\xb3\xcd\x58\x9b\x11\x18\xc9\x2e\xd4\x94\xfc\x02\xf3\xd5\
+\x49\xcc\x73\x38\x75\x30\xd1\xc5\xe1\x07\x24\x79\xd2\x6f\xd3\x45\
+\x55\x1b\xcc\x94\xb1\x51\xe4\xf0\x2b\xc8\x87\x29\x1a\x69\xa4\x79\
+\x1d\xc3\x62\x4c\xa1\x9b\x32\x99\x47\x9e\xd3\x34\x66\x25\x8b\x88\
+\xa1\x08\x94\xf0\x43\x0a\xa5\x1d\x2a\x44\x7b\x21\x83\x8b\x39\xec\
+\x20\xbf\xc8\xbf\x38\x40\xc2\xfa\x10\xbb\xc7\x31\xb6\x4c\xb0\x66\
+\x1c\x9b\x16\x1b\xae\x8b\x2c\x8d\x16\x5f\x0d\x98\x70\xcc\x40\x18\
+\x5e\xe2\x25\x81\x66\x46\x93\x3d\xf6\x31\xc9\x11\x92\x20\xcb\x84\
+\x11\xc6\x50\xaa\xc6\x86\xce\xd3\x3b\x06\x94\x2e\x1e\x5a\xda\x82\
+\x02\xb2\x41\x14\x65\xb1\x31\xcb\x69\x66\x21\x5d\x48\x8e\xe1\xb6\
+\xc6\x2c\x72\xc4\x02\x47\x82\x35\x55\x22\x52\xbc\xcb\x77\x57\x62\
+\xec\xbb\x62\xdc\xde\x5a\xa9\x1c\x3b\x5b\xcf\x9b\xf8\x44\xcf\x11\
+\xa8\xfa\x84\xf1\x6c\x52\x8f\x8b\x04\x4c\xcc\xf0\xaa\x06\xc8\x3c\
+\xb1\x92\x23\x58\xb3\xc4\x91\x66\x95\xf1\x0a\x91\xab\x10\xe2\xad\
+\x7a\x8c\xc5\xa3\xa7\x02\x5f\xd5\xe1\x4d\xa9\x2b\xa6\x3f\xaa\xfa\
+\xda\x88\xd5\x9e\x2d\xb8\x4e\xe2\x53\xb3\xd6\x24\x70\x21\x99\x9a\
+\x17\x51\x8b\x57\xa3\x05\x21\xe0\x3f\xad\x3b\xbd\x22\x29\xed\x61\
+\x1b\x06\x95\x9c\x3a\xe6\xd9\x0d\xa4\x71\xd8\x23\xb9\xd2\x0e\xa5\
+\x51\x4f\x53\x4b\x4f\x0e\xf9\xa7\x2a\xd1\x1b\xbc\xd7\x84\xd5\xc5\
+\x00\xf8\x0b\xb9\x1d\x38\x75\x59\xa4\x25\xbe\x0e\x44\x09\x1d\x60\
+\xea\x5d\x2f\x29\xd6\xa6\xbf\x62\x04\x51\x32\xc5\x23\xd0\xab\x95\
+\xa7\x92\x2c\xcb\xc1\x04\x5f\xb4\xa8\x89\x30\x29\x94\x99\x39\x32\
+\x21\x8e\x98\x75\x08\x54\xf4\x8a\x98\xa8\x93\x66\x99\x8b\x2f\x4f\
+\x96\xa6\xa2\x5d\xe9\x0d\x43\x3d\xcf\xc4\xaa\x15\x16\x2a\x6c\xa9\
+\xcd\xf5\x5f\x0a\x4b\x1b\xc3\x5a\xf9\x41\x24\x45\x5a\x00\x8b\x11\
+\x8a\x40\x3e\xee\xd3\x65\xb2\x51\x70\x91\x53\x1f\x89\xf0\xd6\xc1\
+\x66\x7d\xc3\xf1\x67\x9c\x55\xee\xcc\xc1\x28\xe3\x48\x5a\x45\x28\
+\xca\x77\x73\x58\xb1\x0c\xe5\x59\xd9\x42\xaf\x3a\x6e\xb3\x20\x48\
+\xeb\x2a\x37\xa9\xba\x2d\x82\xa0\x8e\x32\x02\xd7\xd5\x80\xa1\x6e\
+\x69\xe1\x69\x28\xe9\x67\x27\x2f\x53\x24\xac\xa7\x2a\x43\x72\xa8\
+\x8b\x68\x91\x5e\x34\x51\xda\x8a\x8d\x8a\x27\xf5\xc5\x7e\x97\xb9\
+\xf7\xbd\x3c\x8f\x63\xe9\x52\x60\xd1\xfb\xa9\xb0\x57\x18\xfb\xf2\
+\xe1\x83\x78\xf3\xa7\x92\x38\xa3\x25\x8b\x63\xba\xc4\x28\x5f\x6b\
+\x85\x65\xe7\xfd\xdb\x4e\x9d\x4e\xaa\x9a\x8a\x9c\x72\x36\xd6\xe4\
+\x8b\x1f\xdf\x32\x7f\x4d\x45\x4f\xd0\x3a\x84\xd5\x05\xd9\x51\xf0\
+\xc6\x2b\x5d\x85\xfe\xe5\xfc\x5f\xc7\xb6\xa8\xcd\x55\x52\xf6\x54\
+\x4d\x5a\xc2\x59\x9b\x22\x32\xb2\xc5\x8d\xf9\x59\x29\x96\x68\x48\
+\x16\x36\x6f\x3c\x68\x45\x43\xb7\x51\x52\x98\x18\x18\x39\x90\xb5\
+\x3d\x4a\xb6\x21\xae\x6c\x44\x6d\xf0\xe5\xbf\x68\x08\x9c\x70\x72\
+\x57\x6a\x7a\x6a\x57\x07\xe3\x44\xa4\x16\xdd\x07\xe6\x8e\xe4\xee\
+\xa4\x8b\xc5\xbe\x74\xbf\x0e\x10\x14\x33\x09\x2b\x52\x78\x2a\x95\
+\x84\xf4\xb5\x20\x34\x64\xfc\x85\xe3\x62\xc3\xcf\xe3\xa8\xe7\xa4\
+\x94\x45\x53\x52\x94\xd0\x10\xd8\xc9\xe1\x64\x0c\x03\x02\x30\x6c\
+\x88\x11\x1b\x0b\x1c\x6e\xcb\xf3\x8a\x78\x6b\x52\xa2\x4a\x95\x8c\
+\x53\xc9\x3e\x6d\x51\x84\x56\x29\x8a\x14\x59\xe5\x60\xd1\x33\x23\
+\x65\x89\x12\x30\xf1\x16\x52\xac\x50\xc5\x11\x8a\x69\x64\x96\x83\
+\x7a\xa1\x54\xe1\x0e\x1b\x8e\xcb\x2c\x73\x32\xa9\x74\x53\x74\x66\
+\x59\x73\x0b\x89\x1f\x29\xa7\xfd\x60\x3a\xd2\xb3\x23\x46\x0e\x72\
+\x97\xf3\xb7\xb9\xba\x59\xfb\x46\xed\xcd\xec\xaa\x50\xf2\x6f\xa7\
+\xaa\x86\xae\x7a\x3c\xfb\x91\x63\x04\x4c\xff\x00\x2c\x6a\x57\x73\
+\x2b\xc9\x6b\x05\x17\x0a\xa7\x94\x0a\xe1\x59\x68\x56\x6a\xbc\xa3\
+\x66\x95\x9e\x8d\x61\x7c\xd5\xf3\xe2\x16\xda\x93\x6a\x26\x99\xdf\
+\x39\x72\x89\x9d\xd8\x0d\xd9\xd6\x3c\xce\xaa\xe1\x8f\xd5\x6d\xd4\
+\xc3\x4f\x34\xb1\x46\x58\xc9\x53\x25\x64\xcb\x2b\xcf\x54\x98\x47\
+\x77\x91\x10\x2a\xc3\xba\xf0\xa2\x5a\x50\x0e\xec\x6a\xaa\xd3\x43\
+\x50\x82\x9e\x9e\x3a\x3a\x68\xd5\x23\xa5\x8a\xaa\x7b\x7c\x79\x82\
+\xa9\x13\x05\x8c\xc9\xe5\x9c\x7e\xd0\xaf\xc5\x23\x06\x55\x8e\x8d\
+\x5a\xae\xa9\x24\xb7\xa8\x24\xac\x39\x5f\x13\x15\x33\xbe\x51\x00\
+\x6c\xcb\x55\x34\x78\x34\x81\x71\x17\xb6\x8c\xd2\xed\x19\x1b\x6d\
+\x26\x96\x6a\xa5\x09\xb9\x6c\x58\x0c\x91\xf9\xb9\xf9\xd5\x6c\xa7\
+\xb9\x15\x48\x04\x4a\x62\x92\x74\xa4\x16\xc2\x5a\x93\x3c\xb5\x15\
+\x59\x5e\x39\x21\xe9\xf4\xd2\x96\x22\x2c\xc1\x40\x41\x0f\xb8\x62\
+\x43\x27\xc4\xe2\x59\xfa\xaf\x57\xaa\xea\x95\x13\x19\xa6\xa7\xa4\
+\x49\x32\xa2\xe9\xd8\xc9\x1a\xd2\xef\x45\x03\x6d\xc9\x54\x0e\x2c\
+\xb0\xc8\x16\x08\x15\x77\xa7\x92\x49\xd7\x65\x4b\x52\x8f\x4d\x49\
+\x67\x51\x51\xcb\x4d\x3c\x87\x86\x66\xdd\x6b\x3c\xf5\x8f\xdc\xad\
+\x19\x94\xc1\x0d\xb8\x45\xe7\x54\x34\xd4\xcd\x33\x88\xd6\x79\x6b\
+\x6a\xa6\x5d\xa8\xe1\x44\x38\xc6\xb1\xa9\xcb\x29\x6a\x40\x99\xd4\
+\xf2\xcb\x1c\x67\x23\xcd\xf5\x1b\xaa\xca\x86\x75\x93\x66\x23\x1e\
+\xdf\xc3\x4f\x91\xa1\x5d\xc9\x16\xd9\x0b\x86\x36\xe4\xf7\x64\xbd\
+\x84\xac\x71\x47\x0c\x8d\x13\xbc\xce\xac\xb2\x16\x2b\xce\x05\xed\
+\xc1\x2d\x8b\x04\x1d\xb9\x8f\x16\xe3\x5b\x68\xbf\x12\x46\x9f\x82\
+\xe3\x80\x8e\x2e\xf3\x5b\x13\xc9\xb6\x3c\x88\xd7\xe6\xc0\xdb\x59\
+\xed\x02\xaa\xaa\x86\x71\xc8\x67\x2e\x2e\x90\x9b\xae\x4f\xfd\xf0\
+\x55\x00\xb9\x60\x40\x3a\x14\x94\xe6\x2c\x14\x70\xae\x15\xd6\x33\
+\xc6\x4d\xde\xaa\x1a\xa0\x0b\x9d\xcd\xb9\x23\x8b\xf6\xa8\x4b\xa2\
+\xeb\x06\x8f\xa9\xf5\xda\xaa\x55\x10\x61\x18\xc7\xa7\xc5\x57\x17\
+\x32\xcf\x4f\x4f\x33\xfe\xb1\x22\x3d\x94\xd5\xc9\x8c\x0b\xcb\x95\
+\xb2\xf0\xb1\x74\xba\x18\x12\x61\x94\x8f\x0c\xa9\x12\x8a\x89\x5c\
+\x5e\xd1\xfc\x59\x92\x34\x0c\x1b\xd4\x32\xc1\x2e\x6a\x09\x49\x6d\
+\xd8\x66\xde\x5a\x8e\xa5\xd4\x1a\x15\x9a\xb7\x66\x46\x55\xa6\x9e\
+\x5e\x63\x82\x38\xf2\x65\xa2\x81\x11\xa3\x5a\x38\xd1\x1e\xa6\x66\
+\x90\x2e\x17\xd7\xa1\x81\x61\x8a\x29\x26\x41\x53\x24\x67\x38\xe0\
+\x3b\xd0\xe6\x1a\x67\x0c\x8e\x90\xd3\x46\x51\x42\x0b\xcb\x37\xaa\
+\x34\xd1\x8b\xcc\x35\x05\x37\x42\x4a\x95\x84\xd4\xd7\xc8\xfd\x46\
+\xbe\x31\x04\xb5\xde\xaf\xa8\xce\x94\x91\x53\x2e\x02\x48\x62\x11\
+\x47\x33\x94\x3f\xae\xcf\x12\xc3\x24\xcf\xb3\x2e\x02\x58\x27\x92\
+\x11\x15\x43\x35\x08\x49\x63\x2a\x8b\x25\x04\xeb\x0a\x55\xfb\x1c\
+\x77\xce\xd3\x77\x0f\xb9\x7e\x03\x65\x3e\xc8\x58\xb6\x2a\x27\x9f\
+\x64\xc7\x95\x39\x86\x73\x72\x80\x31\x3d\xc0\xa9\x4e\xd2\x3b\xbd\
+\xb4\x8d\x1b\xd9\xab\x6a\x7b\xdb\x20\xab\x4d\x05\x34\x50\x55\xd4\
+\xe6\xb6\xc7\x99\x4a\x5f\x8b\x17\x83\x80\x0e\x9e\x61\xff\x00\x95\
+\xa1\x84\xd3\xd3\xc1\x60\x36\xa9\x55\xd4\xa1\x41\x6f\xfe\xa5\xcf\
+\xa9\x75\xf3\x79\x38\xc7\xe2\xe7\x06\xdd\xcc\x73\x2b\xa3\x9f\xba\
+\x41\x8d\xd9\x55\x81\xe4\x15\x70\xa6\xf9\x78\xf0\x2f\xad\xed\xe8\
+\xd2\x44\x40\x37\x03\x7c\xeb\x9a\xab\xa4\x99\x05\xf2\x7c\x62\x3d\
+\x85\xcd\xb5\x0c\x51\x42\xe0\x82\x43\x39\x7f\x84\x78\x3f\x40\x2d\
+\xf8\x7e\x36\xd5\x8d\x36\x4a\x05\x91\x87\x70\x3f\x4f\xeb\xa7\xac\
+\xea\x12\x7a\x78\x94\x85\x55\x0b\x63\x90\xfd\xd2\x3f\xce\xfa\x8e\
+\x9e\x81\xf7\xa4\xcd\x22\x4c\xd7\x12\xab\x7b\x13\xf8\x9c\x4b\x6a\
+\x3a\x8e\xa9\x58\x21\x9d\x37\x22\x68\x23\x88\xf3\x1d\x47\x75\x83\
+\x5c\xb0\x11\x4a\x51\x97\xe8\xb9\x03\x7b\xe8\xf5\xee\xa9\xd4\xcc\
+\x48\xc4\x35\x25\x3e\x3d\xf3\xe3\xc2\x61\xda\x78\x26\xd9\x58\x0e\
+\x2e\x7c\x6a\xa1\x2b\x5e\xad\x67\x01\x8c\x55\x0f\x0e\xec\x41\x1b\
+\xe4\xdd\x52\xa7\x14\x0d\x6b\xba\xf2\x07\x36\x3e\x35\xd2\xd6\x8e\
+\x9d\xe9\xdf\x75\xe7\x51\x1c\x4e\xde\xae\x28\x23\x2a\xcf\x19\x8c\
+\xa8\x4a\x69\x0f\xbb\x86\x67\xbe\x0d\x16\x2c\x75\x8c\xc9\x21\x95\
+\x24\x8c\xc7\x25\x04\xb5\x10\x01\x24\xdf\xd9\x54\x67\x1a\xfa\x86\
+\x58\xee\x87\x91\xb7\x19\x61\x90\x4d\x52\xb5\x41\x92\x16\x8c\x4c\
+\x50\xfc\x19\x61\x92\x65\x23\x6d\x51\xaf\xb7\x4e\xc8\x3b\x99\xd5\
+\xa4\x76\x00\xac\x97\x42\xc3\x51\x8c\x96\x2a\xaa\x65\xdd\x9a\x35\
+\xa9\x48\xd2\xf9\x67\x93\xae\x4e\xd2\x09\x1a\xd7\x95\x4d\xb9\xb0\
+\x50\xba\x2a\xe2\x2f\x93\x6e\x39\x78\x69\x00\x36\xb8\x81\x2f\x72\
+\xc0\xfc\xb2\x96\xb7\xd1\x43\x58\xe8\xfa\x8a\x54\x92\x8e\xef\x0a\
+\x9a\xb9\x0c\x12\xb6\xe0\xc1\xb3\x4a\x76\x2c\xca\xe0\xe2\xf9\xbe\
+\x4e\x85\x97\x25\xbd\xc1\xf5\x52\xca\xcb\x24\x99\x3e\xdd\x3c\x71\
+\x33\x29\xdc\x00\xc1\xda\xeb\x15\x2c\x30\xaa\x88\x54\x61\x8c\x6c\
+\xb6\xbb\x04\x22\x79\x16\x96\x1a\xb4\xa6\x7c\xe9\xa9\xd6\x43\x3b\
+\x31\x9e\x79\x24\x1b\xf2\xc8\xf9\x11\x9d\xe4\x95\x1a\x4c\x57\xf0\
+\x45\xc7\x54\xf5\x93\xcb\x4c\xf5\x52\xc6\x62\xda\x8c\x32\xcb\x27\
+\x8c\x69\x69\xa1\x50\xfb\x74\xea\x4e\x12\xcf\x80\x8e\xd9\x6d\xca\
+\xcd\x65\x30\xd7\x49\x8b\xbd\x24\x73\xcd\x4d\x14\x31\xba\xd1\xc5\
+\xb7\x75\xdd\x6f\x51\x99\x9c\xac\xa4\x60\x8e\x8b\x91\x5b\xf7\x2f\
+\x6e\xa9\xd2\xd6\x69\x14\x4f\x31\x9c\x4d\x7d\x9b\x5a\x28\x92\x38\
+\x9f\x70\x87\x99\x85\xa2\x87\x06\x6a\x9e\xe7\x6c\x00\x0b\x0a\x75\
+\x1d\xc8\xa2\x88\xa3\x54\xc4\xf4\xd4\xf0\x94\xa7\x89\x25\x78\xe8\
+\xa8\xe2\x56\x23\xa6\xc3\x9d\xb7\x1f\x69\xa6\x95\x84\xb5\x13\x3b\
+\xc9\x2e\x7a\xa5\xa0\xf8\x5b\xb3\xd5\x60\x62\x33\x48\xa5\x64\x7a\
+\x7e\xe5\x32\xb3\xb6\x17\x88\xd3\xaf\x8e\xc4\x56\x9d\x47\x69\x43\
+\x13\xd2\x97\x8c\xc6\x93\x7a\x68\xda\x56\x98\xd5\xde\x23\x4a\xb5\
+\x4c\x1d\x29\xde\x54\x72\xec\xc4\xa2\x46\xa9\x11\x65\xb6\x5d\xfa\
+\xa3\x92\xee\xb1\xa4\x4b\x1f\x85\x4c\xfe\x21\x6b\x76\x1c\xb0\xba\
+\x0f\xc6\xc7\xce\x86\xcb\xf6\x20\x8f\x6d\x4a\x96\xce\x48\x33\x32\
+\x48\xdc\x82\xcb\x31\x3c\x73\xe1\x75\x14\x7f\x18\xcb\x20\x19\x96\
+\xb6\x6d\xb8\x59\xed\xc0\x03\x12\xec\x32\x1e\x70\x16\xbd\xf9\xd6\
+\xdd\xa0\x6a\x8c\x4a\xaa\x95\xf8\x71\xd9\x49\xc4\x25\xed\xcf\x82\
+\x0d\xcb\xdf\x1b\xf3\xa2\x32\xe2\x38\x0e\x4e\x26\x5c\xb6\xc5\x90\
+\x45\xe2\xd4\xca\x58\xf6\xa8\xe0\x1b\x13\xc5\xf5\x49\x14\x7d\x27\
+\xd5\xc2\x8c\xad\x3c\x74\x54\xea\xc6\x18\xe1\xef\x91\x37\x27\xbd\
+\x53\xcd\x20\x5d\xd9\x1a\x5d\xa5\xba\xee\xd3\xaa\x85\x0e\x25\x32\
+\xec\x50\xf5\x0a\xd6\xfd\x25\x83\x41\x2a\x55\x40\xab\x1b\x2c\x75\
+\xfd\x46\xa4\xc2\x0c\x54\x34\xf1\x25\xe1\x1b\x8d\x55\x5b\x2d\xf1\
+\x55\x87\x27\x15\x09\xd0\xa6\x9e\xab\xa3\xd2\xba\x91\x1b\x57\xec\
+\x37\x5c\xae\xa8\x99\xa2\x93\xac\x75\x6e\xae\x69\xa4\x5a\x55\x33\
+\xbf\x6c\x10\x1a\x99\xa9\x96\x58\x63\x47\x60\x1e\x48\xa8\x66\xa2\
+\x78\x62\x96\x59\xe4\xa4\xa7\xa1\x94\xca\x22\xee\xa9\x2d\x3d\x5c\
+\xf0\x2c\xad\xb8\xd5\x93\xa9\xda\x12\x48\xf5\x4b\x08\x2b\x55\x89\
+\xdd\x44\xf4\x66\xa1\xea\xcc\xc4\xd2\xa7\x50\x6b\x08\x23\xa9\xa0\
+\x4c\x80\x0b\x23\x2a\x45\x25\x64\xfb\x95\x0b\x02\xaa\x88\x95\x23\
+\x44\xc5\x3b\x4d\x6c\xc2\xec\x2a\xaa\x5c\xfc\x6b\x95\x88\xd4\xbc\
+\x72\xc8\xb1\xaa\xb7\x99\x2a\x62\x71\xe7\xe6\x06\xdc\xea\x45\x99\
+\x71\x29\xf1\x15\xd4\x97\x5e\xd7\x1b\xbd\xa0\xdc\x8d\xc8\xea\x21\
+\x7b\x9f\xda\xab\x38\xb2\x90\xba\x8d\xd0\x47\xb9\x5a\x5e\x9c\x5d\
+\xee\xae\x9b\x92\xbc\x92\x84\x5c\x59\x5e\xa0\x88\xa2\x8c\xe4\x57\
+\x89\x81\x53\x75\xc2\x7f\x89\xdb\x23\x21\x6b\x28\x6f\x88\x70\x18\
+\x8c\x6d\x6d\xb6\xcc\xa8\x20\x80\x92\x72\x0d\x81\xd5\x39\x29\x66\
+\x95\x17\x70\x2e\x39\x2c\x8b\xe5\xca\xb0\x65\x2a\xdc\x0e\x00\x22\
+\xf7\xbe\xa3\xc8\xec\xc6\xe2\x36\x56\x57\x8f\xce\x4b\x70\x15\xe3\
+\x90\xa0\x3e\xff\x00\x5d\x47\x01\xa0\x5a\x97\x7c\x4a\xcb\x19\x42\
+\xb8\xff\x00\x7b\x21\x6b\xfd\x7c\x7e\x1a\x8c\x97\x86\x1e\xc0\x42\
+\x05\x5b\x78\xfa\xa9\xf3\xfc\x34\x3a\x5d\x2c\x4c\x49\x06\xee\x54\
+\xaf\x79\x07\x91\x7f\x3f\xd3\x52\x54\x4d\xfa\xcb\x39\x2e\x2e\xca\
+\xd8\x70\x4f\x39\x2b\x5b\xf8\x5b\x4f\xd4\xba\xe3\x29\x92\x32\x5a\
+\x1a\x6d\xc1\x69\x25\x60\x36\xc6\x3f\x75\x45\x81\x39\x79\xe4\x7b\
+\x8d\x4f\x3d\x75\x7a\xd3\x44\x3b\x69\x62\x57\x49\x63\x8a\x9e\xff\
+\x00\x0f\xe1\x0f\x96\xe2\xd9\x63\x6b\x8b\xea\x07\x21\x67\xa6\x8a\
+\x2c\xb7\xb3\x2a\x71\xfa\xa8\x22\xcf\xfd\xd0\xf7\xe6\xd6\xb1\xe7\
+\x54\xf5\x2c\x26\xa7\x86\x96\x1b\xd3\xd3\xec\x03\x94\xf2\xf7\xfc\
+\x48\xfd\x45\x95\xd5\x01\x2e\xce\xe8\x09\x2b\x65\xfb\xa6\x49\x6a\
+\xe3\x8e\x15\x18\xcc\x16\x51\x70\xcf\x19\x3f\x10\x59\xe6\xc1\xf1\
+\x16\x05\x2d\x6f\x7b\xad\xc6\x9a\x6a\x9e\x9a\xcd\xea\x63\x12\xc3\
+\x84\xcb\xb6\xe4\x82\x09\x12\x70\xcc\xde\x0e\x24\x1f\xa1\xd3\x4a\
+\xf4\xd2\x21\x7b\x1c\xce\x24\x27\xbd\xb9\x73\x91\xfc\xfe\x1a\xfc\
+\xdb\x66\xda\x68\xe1\x42\xd1\x03\x7e\x12\xf9\x33\x30\x37\x79\x9e\
+\xc8\x49\x3d\xa0\x41\x1a\xa2\xf9\x2b\xc6\x86\x14\xc2\x69\xdd\x5b\
+\x14\x8e\x35\x11\xc4\x1c\x63\x66\x94\x62\x26\x90\xde\xc6\xff\x00\
+\x2f\xcc\xa3\x20\x35\x21\x9a\x43\x05\x39\x89\x20\xa5\x5b\x1c\xda\
+\x43\x8a\xaa\x39\x8e\xd2\x3a\xc2\xa8\x65\x39\x2a\x06\xda\x51\x97\
+\xd6\x06\x4e\xd8\x68\x56\xd0\x84\x8e\x15\x69\xe7\x94\x6e\x7a\xc7\
+\x18\xb5\x9e\x06\x56\x28\x64\x27\x6c\x77\x08\xdd\xc2\xde\x4a\x85\
+\x95\x06\xec\xd2\xcd\x24\xef\x31\xf5\x12\xb3\x5b\xe2\xdb\xb1\xa1\
+\x04\xf6\xc6\xb7\x69\x24\x9b\x07\xb4\x71\xe4\xba\x9e\x59\x26\x0d\
+\x74\x0d\x24\x8c\xd9\x03\x1c\x7c\xc6\xaf\xe1\x9e\x44\xf0\x22\x56\
+\x16\xb9\x66\xc8\x8d\x43\xd4\x26\x95\x62\xa3\x80\xee\xfa\x8a\xbc\
+\xe4\x2c\xeb\x72\x36\xa9\x2f\x91\x08\x7e\x20\x52\x7c\xf2\x2d\xc5\
+\x8e\x46\x73\x1c\xb2\x34\xf4\xcb\x2c\x62\x0c\xf0\x26\x0f\x53\x54\
+\xc1\xb2\xa8\x2d\xe6\x38\xb0\xc4\x24\x71\xb9\x56\xb9\x2d\x51\x08\
+\x69\xe7\xa8\x68\x4b\x7e\x91\x45\xdb\x79\x65\xa9\x95\x5a\x55\x86\
+\xa8\x39\x44\x6c\x6d\x4a\x89\x1a\xcb\x27\xa7\x61\x23\x4a\x89\x26\
+\xd0\x8e\x79\x6a\x16\x11\xb0\xd9\x15\x0b\xfb\x33\x34\x8f\x34\x69\
+\x23\x87\x92\xa2\x79\x9e\x18\x9a\xd9\xed\x44\x2a\x83\x88\xac\xa2\
+\xcd\x59\x3c\x65\x77\x3b\x92\x28\xca\xe1\x47\x1c\xcb\x8c\x11\xb4\
+\xcf\xda\x67\x31\x2b\x4f\x28\x00\x08\x79\xc8\x1c\x80\xd0\x48\x16\
+\xc3\x12\x33\x23\x0a\x70\x6f\xc4\x50\x95\x6c\xe7\xdb\x4e\x49\x5c\
+\x79\x12\x9f\x96\xc0\x2c\x46\x52\xa5\x01\x92\x59\x0b\x84\x62\xa1\
+\x1b\xe5\xdd\x1c\x2f\xee\xdd\xbe\x6b\x79\xf9\x4b\x4f\x26\xdc\xc2\
+\x35\x92\x52\x4c\xed\x1b\x76\x72\x85\x9c\x06\x4c\xb8\x16\xb5\xb2\
+\x3c\x0f\x3a\x0a\xbd\x37\x62\x46\xef\xcd\x25\xf2\x46\x4b\x13\x79\
+\x8a\x42\x6a\x0b\x07\xee\x9f\x0c\x15\x88\x5d\x2c\x95\x69\x10\x9a\
+\x67\xc6\x26\x22\x2d\xe5\xbc\xa1\x76\xe9\xd2\x32\x76\xc9\x63\xdd\
+\x24\x76\x25\x6e\x6f\x97\x76\xa1\xa9\x86\x63\x34\x95\x55\x35\xa9\
+\x36\xe3\x9f\x4b\x2c\xac\x86\x01\x34\xb0\xf2\xbe\x92\x2e\xe6\x4a\
+\x78\xd5\x03\xb4\x78\xde\xee\x5b\x43\xa7\xca\xcd\x12\x3c\xfe\xae\
+\xaa\x17\x90\x5e\xba\x18\x02\x6c\xc8\x42\xe0\xd2\xd2\x6f\xb4\x55\
+\x55\xa2\x35\x43\x55\x37\xc0\x76\xc2\x3c\x45\x37\x56\x86\xe7\x7f\
+\xa6\x2d\x35\x0c\x71\x76\xc7\x4e\x93\xbc\x86\x43\x18\xf9\xa2\xb9\
+\x86\x4a\xe9\x09\x72\xd9\xd5\x4f\x23\x13\x34\xb9\x89\x30\x10\xbc\
+\x13\x55\x2f\x51\x88\xe0\x86\x28\x8d\x56\x0d\x00\x19\x29\xdd\xa8\
+\x68\x69\xfd\xac\x70\xbd\xb9\x37\xd2\xc3\x33\x7c\xcf\x4e\xc6\x77\
+\xf9\x49\x59\x77\x15\xc7\xdd\x12\x6e\xb9\xdc\x5c\x6c\xaa\xcc\x78\
+\xb6\x84\x0a\x0e\x4f\xea\x92\x71\xff\x00\xdb\xaa\x49\x94\xd9\xfb\
+\xda\xf2\x6f\x03\x7b\x11\x1c\x9f\xbd\xa4\x48\x90\x18\xa0\x14\x92\
+\xd2\x17\xc5\x10\xd3\xd0\xe4\xd5\x18\x71\xc4\x86\x9c\x99\x94\xb6\
+\x40\xc8\xcd\xc5\x8a\x85\xad\x5c\xdf\x6e\xa2\xad\xa4\xa6\x95\x1c\
+\x15\xe1\xc3\x34\x52\x45\x6c\x90\xd9\xc2\x19\x32\xc7\x6d\x78\x5b\
+\xf7\x6a\x9d\x25\x55\x6c\xf7\x65\x8f\x25\x6e\x05\xe3\x52\xa4\xf2\
+\xc5\x04\xa4\xed\xbf\xd6\xc0\x8f\x7d\x2d\x3f\xa1\x9a\xb6\xaa\xa7\
+\x88\xe3\x8e\x98\xcf\x18\x51\xc7\xc4\x7b\xf6\x77\x78\xed\x1f\xe7\
+\xa2\xd1\x3a\x74\xd9\x27\xf9\x43\x02\x1a\x00\xde\x2d\x7e\xd0\x3d\
+\x8d\xef\xe7\x57\xa7\xea\xd4\xfd\x56\x23\x60\x43\xe0\x71\xfa\xe0\
+\xea\xeb\xed\xf8\x1d\x3c\x5d\x6e\x8a\xaa\x29\x64\x6b\x24\xe7\xbe\
+\x22\x4f\xd1\xad\xc0\xff\x00\xab\x54\xf5\x33\xcc\x9e\xa2\xa5\x41\
+\xb9\xe7\x83\xe7\x82\xc3\xdb\xea\x75\x33\x4b\x51\xba\x5a\x11\x28\
+\x4c\x95\xa3\x61\x14\x8b\x27\xc9\x72\x03\x00\xbf\xcb\xdb\xdf\x58\
+\xd5\x53\x45\xe9\x7d\x34\x1b\x72\x47\x12\x09\x33\x5d\xd8\x88\x24\
+\x5b\xb6\xf0\x83\xe2\xfc\xf2\x74\xd3\x52\xd5\x55\x43\x9a\x7f\xe5\
+\x9f\x81\x91\xf3\x16\x0c\x0b\x76\x9e\xeb\x2b\x0c\xad\x6b\xf3\xa0\
+\x33\x60\x8b\x51\x24\x55\x0d\x83\x08\x66\x31\x76\xa5\xd1\x43\x33\
+\x49\x21\xc4\x3a\x9c\xb1\xe1\xd7\x1c\x74\xbe\x9a\x54\x8a\x9c\x32\
+\x2e\xca\xa9\x4e\x5b\x2c\x87\xc5\x8d\x5f\xf3\x02\xf7\x17\x1a\xc9\
+\xc4\x2b\x67\x71\xbc\xf1\xb9\xc1\x6d\xf7\x11\xf1\xc7\xc5\x97\x10\
+\x7c\xe9\x55\x4a\x22\xb0\x16\x5d\xc0\x5e\x42\x6f\x9b\x9b\x82\x17\
+\xdb\x14\xb0\x23\xde\xfa\x57\xdd\x77\x10\x0b\xfd\xe6\x54\x36\xe1\
+\x45\xc9\x01\xaf\x61\x70\x2d\xf8\x68\xde\x59\x20\x8e\xc4\xa0\xcd\
+\x2f\x93\x76\x86\x63\x86\x28\x05\xef\xf2\xdf\xd8\x10\x6c\x74\x0f\
+\x32\x62\x3e\x33\x77\xee\x3d\xbb\xce\x32\x02\xa7\x14\x5c\x0c\x77\
+\xbd\x9a\xf9\x66\xbd\xba\xba\x04\x8e\x67\x8b\x1a\x38\x24\x68\xe0\
+\xa7\x86\x47\xb0\x35\x53\xca\xca\x77\x24\x8e\xf7\xc9\xb2\x11\x8b\
+\xb2\x44\xd2\x04\xd2\xc1\x1d\x55\x3b\x52\x51\x41\x10\x9a\x47\x6c\
+\xd6\x79\xe5\xbe\xe1\x85\x59\xb7\x81\x96\x56\x18\xd4\x4a\x43\x94\
+\x75\x65\x44\x88\x32\x92\xbb\xe3\x6c\x0f\x86\x82\xc9\x18\x1e\x62\
+\x22\xe0\x92\xce\xc3\xb8\xb1\x24\x22\xb0\x3f\x30\x21\x55\x6a\x52\
+\x58\xe4\x9d\xda\xa4\xc5\x8e\xfc\xae\x33\x81\x28\x20\x32\x64\xb1\
+\x87\xb3\x24\xb2\x85\x38\x81\x23\x8f\x16\xd1\x60\x90\xd5\x4f\x24\
+\x5b\x12\x4a\x81\x96\x8b\xa6\xd0\x25\x92\x48\xa9\xe5\x91\x8c\x8d\
+\x2c\xa8\x36\xcc\xb7\x0d\x0d\x34\x12\x9e\xf9\x88\x6d\x37\x54\xea\
+\x02\x66\x71\x2d\x44\x1d\x2a\x8e\x08\x6d\xb9\x2d\x3f\xea\xd2\x55\
+\x43\x4a\xb6\x8e\x96\x91\x59\xbe\x0e\x71\xab\x56\x7e\xdc\xca\xc2\
+\x35\x00\x53\x4e\xd9\xcb\x40\xb8\x55\x40\x8b\xbf\x1a\x55\xd6\x45\
+\xbe\x29\xa2\x3d\xa3\x71\x29\xd1\x63\x94\x83\xf2\xed\xc6\x02\xcc\
+\xcd\x85\x4d\x5d\x4a\xed\xee\xbb\xd3\x45\x03\x36\x34\x94\xb1\x03\
+\xf2\xaa\x42\xc4\xcd\x55\x33\x88\x64\x9a\x4c\x58\x61\x09\x0a\x91\
+\x2c\xdd\x90\xbd\x4d\x78\xf5\x27\x15\x0b\x85\xa5\x97\x18\xc7\x10\
+\xa5\x97\x04\xc8\x5c\xb2\x2a\xb1\xc9\xf2\x62\xa6\xda\x31\xd3\xb9\
+\x33\xd5\x26\xe5\x44\x85\xa5\x76\xc4\xfc\xb0\x02\x09\xe6\xf6\xc1\
+\x06\x37\x6b\x06\x60\xb7\x3a\x49\xe5\x49\x65\x69\x1f\x0f\xd8\xed\
+\xac\x00\x2f\x26\x59\x1d\x98\xb3\x05\xbb\x18\x55\x3f\xff\x00\x31\
+\xf1\xa9\x21\x80\xbf\xad\x93\x0d\xde\xf8\xdb\xd2\xc2\xa8\xd1\xc4\
+\xac\xb1\x30\x54\x69\x01\xd8\x85\x58\xe5\x19\x66\x77\xce\xc0\x6b\
+\xa8\x75\x1a\xf8\xea\xaa\xfa\x98\x81\xbd\x22\xc9\x23\xbc\x14\x14\
+\xa1\xcd\x9a\x3a\x5b\x81\xea\x0a\x58\x89\xde\x66\x8f\x33\x71\x0d\
+\xec\x35\x57\xd4\x2b\x2a\x5e\x92\x09\x24\x9a\x08\xd5\xa4\x3b\xea\
+\x67\x0f\x04\x30\xd2\x44\xb6\xc5\x9a\x5c\xb3\x76\x76\xdb\x7d\xc9\
+\x7e\x55\x09\xa6\x9e\x8e\xa2\x46\x9a\x8b\x2e\x9d\x3d\x61\xc4\xc9\
+\x09\x82\x19\x5a\x9d\x29\xcf\x20\xa4\x4f\x24\xa5\xdc\x29\x56\x9d\
+\xf2\x91\x59\x54\x28\xeb\x46\x76\x77\xa6\x8e\xb1\x21\xa0\x6b\x86\
+\xc5\x6b\x2a\x20\x8f\xd8\x0b\x26\x4a\x96\x22\xc2\xcd\x22\xf8\x6e\
+\x28\xb2\x42\xa4\xaf\x46\x6c\x9c\x5d\xd4\x51\xd3\xc7\x16\x78\xae\
+\x23\xbd\x8c\x91\x12\x00\xb2\x3d\xfc\x8b\xe9\x05\x4a\x8d\x9a\x14\
+\xab\x8e\xf7\x0c\x5d\x24\x96\x4b\x66\x05\xb9\x00\xc4\x01\xf9\xac\
+\x5b\xb8\xf1\x69\x6b\x1e\xcd\x25\x4b\xc1\x1b\x38\xe2\x46\xa4\x8d\
+\xe1\x15\x4c\xa9\xee\x5b\x7b\xd3\x65\xfb\xe2\x72\x6e\x2c\x16\xbe\
+\x44\x90\x09\x69\xa0\x4a\x78\xdc\xaf\x62\xfe\x94\x70\x22\x5b\x1e\
+\x3b\x28\x6e\x1a\xd6\xb0\xc8\xf1\xc5\xbf\x6a\x89\x34\x44\x1f\xef\
+\x5e\x31\xdc\x3e\x9d\xea\x37\x06\x57\xbe\x3e\xfa\xa1\x33\xcf\xb7\
+\x93\xd4\x04\x94\x71\x25\xd9\xf3\x31\xfe\x3c\x12\x71\x16\x50\x05\
+\xed\xc6\xa4\xab\x34\x74\xd5\xd5\x4e\xb9\x96\xa8\x51\xb9\x95\xad\
+\x88\x76\x56\xb2\xf3\x91\x00\x5c\xf8\x04\x6a\x63\x5f\xf6\x7e\x8d\
+\x3a\x6b\x4b\xb2\xce\x94\xac\x71\x46\xe0\x32\x33\x93\xc8\x6c\x79\
+\xe4\x5b\xdb\x4f\x05\x12\xe1\x4d\x3b\x61\x4c\x82\xf0\xb2\x31\x37\
+\x57\x46\x42\xbf\x30\xe3\xf1\xbd\xb5\x37\xe9\x59\xa4\x9a\x95\x2f\
+\x83\x19\x0d\x46\xd3\x2b\x06\xc7\x3f\xde\xc0\x7e\xcc\xad\xd7\xce\
+\x5c\x5b\x4b\x0c\x15\x2c\xd4\x71\xe3\xdb\x3b\x62\x98\x93\xc0\x16\
+\x17\x1a\x8a\x8d\xa9\x8c\x90\xc9\x04\x9b\xb2\x26\xdb\x04\x0e\x18\
+\x76\x3b\xdc\x91\x6f\x60\x2f\xfc\x35\x0f\xa5\xea\x6f\x4c\x14\x00\
+\xd1\xf7\x29\x7e\x72\x23\x11\xee\x3b\x8d\xf8\x1c\x9e\x35\x49\x95\
+\x4a\xd1\x54\xc5\x4e\xab\x3c\xcb\x3e\x32\x4b\x3a\xc7\x79\x07\x71\
+\xdb\x62\x40\x3f\x10\x63\xe6\xe3\x9d\x55\x53\xd2\x47\x35\x74\x51\
+\xc2\x5a\x1a\x9d\xc8\x31\x4a\x99\x1c\xe7\xde\x87\xe5\x8e\x20\x1c\
+\xbd\x8b\x9e\x46\x7d\xdc\x34\xb2\x75\x09\x45\x41\x70\xc1\x64\x89\
+\xea\xd1\x3b\x5c\x87\x66\x91\x8d\x98\xdd\x50\x6d\xb2\x0c\x83\x71\
+\xe0\x6a\x26\x8d\xa7\xad\xcd\x8c\xd5\x13\x1d\xdc\x92\x15\xe1\x8a\
+\x45\x2b\x94\xed\x3c\xf0\xca\x02\x8f\x0d\xe0\xc1\x8e\xec\x50\x54\
+\x87\xa8\x39\xa2\x2b\xae\x7c\xc0\x05\xe4\x62\xce\x42\x17\x6c\x71\
+\x50\xb7\x36\xb6\x98\x30\x70\x14\x0e\x0d\xbb\x99\x83\x00\xec\x15\
+\xbc\x65\x6b\x71\xa7\xdd\x20\x46\xab\xdc\xec\x80\xf6\x81\x91\x08\
+\xa0\x0e\x4b\x0c\x79\xbd\xaf\xa3\xd9\x84\x24\xe1\x1a\x61\xc3\xb6\
+\x6b\xda\xab\x18\x46\xc7\x23\x18\x52\x5b\xb4\x72\xf9\xa8\x20\x99\
+\xcc\x69\x25\x62\x1b\xef\x15\xca\x18\xa5\x61\x70\xb4\x91\x1b\x89\
+\x9a\x22\x8a\x22\x51\xce\xf9\x5e\x74\xc8\xd1\x14\xad\x9d\x95\x9a\
+\x1d\xc7\x9b\x65\xe5\xdb\x18\xd4\x30\x61\xea\xeb\x5b\x35\x8d\xec\
+\x55\x69\x83\x18\x15\x43\xc0\xd2\xb4\x70\xb9\x53\xe9\xe2\x47\x9a\
+\x3c\xc2\xac\x60\xad\xe7\xef\xc4\xa9\x69\x2d\x8b\x49\x6d\xb4\xfd\
+\x98\x40\xc7\x3d\x30\x69\x2d\x22\x5a\x35\x86\x96\x02\xec\xb2\x77\
+\xbb\x9c\x8e\x2a\x99\x6e\xe4\x64\x62\x25\x39\xc8\x63\x86\xd6\x91\
+\x16\x93\x79\x93\x6e\xef\xb1\x4d\x89\x65\x48\x9d\x4e\xf5\x65\x64\
+\x8b\xb5\x19\x69\x4c\xac\x51\xe2\x96\xfb\x71\x22\xad\xf2\xce\x92\
+\x16\x98\xbd\x4d\x7e\x18\xc3\x15\xa3\x9b\xd2\xd3\x89\x5b\xd4\xcf\
+\x2c\xf2\x3b\x47\x4d\x04\x31\xcb\x77\x98\xac\x4d\xf1\x27\x0b\x81\
+\x8e\x21\x5d\x59\x14\x02\xac\xd2\xdc\xd2\xc7\x08\x2d\x04\x9d\x48\
+\xe5\x51\x75\x77\xfd\x62\xab\x66\x3d\x8a\x8a\xba\xa3\x82\xc9\x53\
+\x22\xc5\x0a\x2a\xbc\xac\xd7\x35\x0f\x13\x30\x59\xa6\x66\x77\x58\
+\x61\xca\x5c\xf2\x70\xa9\xf0\xe7\xaa\x9e\x7b\xa0\x1e\x47\xc2\xb0\
+\x4c\x71\x35\xdd\x42\xb6\x5a\xb9\xc7\xfc\x40\xd2\x4e\x10\x1c\x88\
+\x86\x1b\x13\xc8\xba\x8f\x88\x97\x07\x45\xa2\xca\x92\x18\x98\x7a\
+\x82\xc9\x8b\x86\x61\x7f\x4c\x1d\xb2\xbc\xcf\x1d\xd9\xfc\xaa\x26\
+\x40\xf3\xa6\xce\xad\xe3\xa4\xf9\x92\x08\x8b\x3b\x94\x5e\x42\x34\
+\x97\xe3\x75\x80\x40\xaa\x14\x5d\xad\x6d\x55\xd6\x52\xc7\x24\x54\
+\xa1\xd6\x38\x69\x5a\x11\xfa\xc5\x6b\xdd\x24\xae\x94\x80\x1a\x4d\
+\x98\xa4\x95\x80\x72\x50\x4d\x62\x14\x58\x6a\x36\xe0\xa4\x45\xa3\
+\x3b\x93\x5c\x49\x8c\x6a\x64\x9a\xa1\xfb\x55\xac\xca\x7e\x07\x0a\
+\xab\xe3\x16\x01\xc1\x8c\x00\xb1\x46\x62\x6a\x40\x10\xde\x49\x11\
+\x8c\x92\xd4\x15\x3f\x2e\x25\x9c\xa0\x65\xbc\x8a\xed\x23\x08\xc2\
+\xaa\x3b\xd2\x52\x30\x8f\xa6\xd3\xd4\x85\x89\x63\x42\xcf\x53\x5b\
+\x56\xd6\x91\xa5\x90\x11\xfb\x55\x77\x57\xf0\x8a\xbc\x85\x16\xd7\
+\x54\x49\x04\x6f\x24\x54\xf4\x34\xa6\x3b\x8c\x60\x6c\x44\xd8\xad\
+\xac\x25\x96\x36\x50\xd9\xfb\x18\xdc\xf3\xac\xcf\xed\x64\x75\xef\
+\x17\x18\xd3\xbb\x2e\xda\xa9\xf6\x09\xb6\xce\x7c\xf8\xd4\x71\x28\
+\xbb\xcb\x22\xde\x2b\xd9\x5e\x57\x96\x37\x08\xc7\xce\xd5\x98\xb9\
+\xb9\xb8\x89\x39\x6e\x09\xd0\xc4\xde\x8a\x9a\x96\x28\xa9\xd0\xfd\
+\xe4\x87\x3b\xb1\xfc\x6b\x66\xca\xb0\xf8\xb6\x68\xbe\xdc\xbc\x6e\
+\x86\x57\x92\x65\xdc\xf2\x59\xfd\x2d\x36\xdb\x5f\xc5\xda\x35\x9b\
+\xf9\x0f\x1a\xe5\x45\xf9\x49\x95\x9a\xdb\xaa\x2d\xb7\x52\x9e\xe0\
+\x95\x36\x51\x73\xc2\x9b\x83\xa8\x91\xa3\xf5\x22\x36\x32\xc5\x0d\
+\xc2\x60\xe1\x3f\x7b\x83\xed\xf5\xe7\xc6\xaa\x29\x69\x60\xa7\x4a\
+\x48\xf2\x3f\x1b\x17\x02\xc7\xe4\x53\x7f\x36\xfa\xdf\x52\x53\x56\
+\xd4\xc3\x0e\xca\x17\xd8\x94\xad\x9d\x95\x4e\x58\x85\x55\x04\x00\
+\x0b\x0b\xf3\x70\x39\xd0\x7a\x69\x37\xc8\x75\x08\xf1\xc5\x84\x94\
+\xe5\x7b\x46\x2c\x5b\x1b\x0f\x37\x2b\x7f\x7f\xc3\x55\x34\x94\x11\
+\x48\xf2\x4c\x31\xa8\x98\x54\x2c\x90\xb1\x03\xcc\x88\x51\x02\x31\
+\xf7\x31\xa9\x62\x78\x26\xd7\xd4\xc7\xab\x4e\xd1\x6e\xe2\x5b\xd2\
+\x48\xcb\xb6\xa1\x0f\xcb\xd8\x48\xfc\x7b\x8e\xa0\x96\x5a\xed\xf8\
+\xf0\x2b\x03\x47\x9b\xd5\x2f\x69\x5b\x96\xc7\x82\x2f\x72\x1b\x86\
+\xf9\x6e\xb7\xc8\x4d\x37\x48\xa8\x92\x68\x26\x38\xbd\x53\xd5\x5a\
+\x54\xb9\x1e\x62\x30\xb4\x94\xec\xbf\x93\xa1\xf1\x99\xbe\x9a\xa2\
+\x87\xad\x11\xd3\x64\x6f\x87\x83\xc7\x29\x58\x7c\x6d\xba\x9c\x25\
+\xcb\xf7\xb6\xd0\x96\x1d\xa2\xd7\xbe\x96\x91\x26\x7a\x9a\x7d\xaa\
+\x9a\x06\x0b\x68\xd6\x62\xd1\x72\xf2\xcb\x29\x12\x6e\xc2\xb1\xbc\
+\x8b\x12\xd3\x64\x18\x0b\xb3\xad\xc6\x8e\xca\x33\x80\x69\xd1\xe4\
+\xa8\x8e\x26\x8f\xf6\x2a\x96\x0b\x21\x89\xc8\x0c\x4c\x84\xc8\xa9\
+\xde\x4b\x2d\xf8\x4d\x3c\xac\xbb\x8b\xf2\x46\xaa\xe2\x18\xf1\x8d\
+\x90\x77\xa8\x8d\x06\xdb\x39\xe6\xc4\xfe\x7a\xbb\x44\x37\xe6\x24\
+\xef\x3e\xdb\x3f\xd1\x56\x04\xb5\xe3\x82\x14\xb8\xdc\xf7\x8b\x30\
+\x6e\x4d\xf4\x8c\x64\xbb\x49\x6c\xa4\x7f\x9b\xb1\xb8\xc6\x31\x62\
+\x61\xfe\xf5\xfb\x8f\x03\x49\x1a\x17\xed\x37\x24\xaf\x66\x2c\x79\
+\x6f\xc8\xf8\xc7\xce\x9d\xee\xe5\x42\xe3\x04\x74\xea\x8c\xe6\xdf\
+\xda\x33\x90\x02\x5f\xf7\x78\x37\x00\x7e\x71\xd7\xd5\x76\xd4\x6e\
+\x7e\xaf\xb8\xc0\xb5\x3c\x69\x76\x67\x8e\x3c\x19\x70\x1c\xbc\x95\
+\x64\x35\x98\x6d\xa4\x7b\x85\x4e\x8d\x65\x43\x34\x3d\xce\x91\x53\
+\xe5\xdd\x4e\xb8\xde\x67\xe2\xec\xf3\xb2\x0d\x84\x60\xcd\x94\xb2\
+\xca\xe5\x96\x68\x8e\x53\xc4\xd2\x1a\x7d\xc0\x37\x66\x60\xad\x20\
+\xa6\x81\x31\x79\x40\xf9\xa2\x0c\xe2\xf1\x2d\xf7\x0b\x2d\xc3\x6e\
+\xe2\xea\x12\x2a\x47\xda\xa5\x32\xb9\x9a\xaa\xa1\x97\x75\xf1\x0e\
+\xf3\x14\x51\x79\x24\x92\xe1\x90\x9f\x16\xb4\x99\x37\x3a\x92\x24\
+\x44\x8a\x25\x6f\x52\xf9\x2b\x4f\x2b\xcb\x8b\x48\x8e\xea\x51\xbe\
+\x1a\x3f\xc5\x48\xca\x9c\xa5\x54\x1e\x0e\xaa\xd6\x35\x8a\x17\x9a\
+\x08\xe8\x9e\x75\xa6\xf5\x05\x69\x98\x82\xf4\xb1\x6e\xe4\x6a\xe6\
+\x9a\x99\x04\xb3\xb3\x4a\x94\xd0\xc4\x24\x85\x69\xb3\x6d\x52\xd0\
+\x88\xad\x19\x67\x91\xdd\x0a\x4d\x55\x53\x3b\x38\x67\x9a\xa6\x5e\
+\xc2\x91\x45\x02\xc4\x25\xd9\x54\x45\x9c\x9a\x58\xc2\x47\x1b\x2b\
+\x45\x1b\x31\x8a\x05\x39\x6d\x47\x21\x51\x2c\xbd\xa5\x5d\xda\xe5\
+\x9d\x63\x88\xf1\x91\xf8\x60\xbb\xd9\x98\x2d\x95\x23\x95\x91\x05\
+\x90\xb0\xec\xdc\x95\xbc\x61\xc1\x9e\x48\xd4\x77\x6f\x36\x2b\x90\
+\xe3\x49\x1c\x72\x17\xe7\xe1\xad\xe4\x7b\x23\x35\xa5\x2c\xa6\xd9\
+\x39\xb9\xf8\x8c\x72\x0b\xef\x8f\x05\xee\xdb\xe5\x14\xa4\x51\x29\
+\xf8\x71\xb5\xb8\x69\x0a\xe3\x7c\x4f\x72\x8f\xde\x03\x53\x03\x24\
+\x92\x4f\xb0\x29\xb6\x22\x52\x70\x15\x1c\xcd\x26\xe7\x80\xec\xc4\
+\x22\xfb\xa0\x6e\x6e\x79\xd6\xed\x44\x10\x88\xe0\xc2\x9e\x9a\x9a\
+\x4b\x34\x3b\xad\x70\x37\xc0\xb0\x94\x96\x7b\x90\xd7\xdc\xb0\x47\
+\xba\x96\x04\x46\x9b\xaf\x5d\x3d\x2c\x93\x2a\x04\x22\x4f\x4e\x23\
+\x92\xa9\x1a\xc3\xfb\x6a\xe1\x4c\xd9\x29\xee\x08\x89\x95\xc0\x1a\
+\x43\x39\x45\xb5\x60\x6d\xb8\xfb\x14\x3f\xa6\x78\x63\x12\x1f\x21\
+\x92\x4a\x81\xbd\x73\xcb\x2f\x6e\x1a\xeb\x28\xf3\x63\x24\x4d\x04\
+\xc3\x3f\xed\xcf\xa7\x92\x30\x00\xfb\xc0\x48\xcc\xcd\x8e\x27\x1c\
+\xb9\xd2\x52\x47\x68\xe1\xa7\x7d\xb6\xe3\x99\x18\x5d\x55\x7f\xe5\
+\x39\xd8\xfe\x7e\x75\xbd\x6d\xc3\x5f\x4f\x57\x0c\x6c\xe6\xcf\x1b\
+\xe3\x18\x0c\xab\xc1\xc9\xa9\x59\x90\x73\xc6\xe5\xbe\x64\x27\x51\
+\xcb\x27\xe6\xee\xc3\xcb\x1e\x30\xb7\xb5\xb8\x3f\xc2\xc2\xda\x83\
+\xc9\x68\xa4\xa9\x76\xb0\xc4\x93\x21\x45\xce\xe7\xea\x8b\x7f\xa7\
+\x1f\x4e\x34\xb1\x49\x4f\x03\xdc\xb2\x32\xcc\x5b\x22\x40\xee\xda\
+\x65\x06\xd8\x03\xf0\xee\xae\x2c\x58\x1f\x39\x2e\xdf\x4e\xa6\xaa\
+\x5c\x90\x64\xeb\x26\xd3\xa3\x2b\xa9\xed\xc4\xf7\x0e\x2d\xca\xaf\
+\x1a\x11\x88\x6a\xe6\x8a\x6e\xf7\x32\x65\xd9\x97\x25\xb2\xcf\x9f\
+\xe5\x6d\x35\x62\xc8\x63\x89\x7c\x10\xb1\xbb\x30\x6e\xdc\x49\x46\
+\x63\x1d\xf2\xb1\x2d\x6d\x7a\x8e\x9a\x58\x52\x29\x3e\xa6\x00\xec\
+\xcc\xd8\xde\xf8\x39\xca\x36\x27\xee\x81\x17\x07\x50\x2d\x1c\xf3\
+\x8a\xdf\x57\x7a\x98\x4c\x8f\xea\x29\x51\x1b\xbd\xa4\x50\xaa\xb6\
+\x28\x1b\xf3\xd5\x45\x5f\x55\xea\xca\x70\x88\x1a\x74\xb6\xd2\x15\
+\x8d\x78\x2d\x89\xce\xe6\xd6\xe4\x9c\x8f\x1e\xfa\x82\x04\xe8\xe6\
+\x38\xf7\x1a\x03\x5b\xe1\x24\x55\x17\x57\xe6\xd7\xee\xb5\xfd\x88\
+\xf2\xa4\x70\x4c\x34\x94\x73\x24\xf4\xac\x41\x96\x0a\xa8\x86\xfd\
+\xb8\x06\x47\xdb\xdb\x10\x1f\x06\x22\xa3\x0f\x98\x77\x01\xa8\x28\
+\x29\xe1\x94\x2b\x32\x96\xad\xaa\x55\x9d\x63\x4b\x7c\x4a\x90\x96\
+\xb5\xe2\x17\x91\x55\x02\xb5\xd4\x05\x21\xec\xc2\xa2\x59\x0c\xd1\
+\x45\xe9\xb7\xe3\x46\x6d\xa0\xf2\x54\x33\x25\xff\x00\x7b\x7e\x4a\
+\x65\x67\x74\x27\xb2\x29\x18\x1d\x37\x4d\x88\xaf\xc0\x75\xa9\x99\
+\x84\x99\x18\x23\x8c\x06\x90\xae\xe6\x71\xa9\xda\x46\x07\xb3\xc9\
+\xe3\x54\xc8\x8b\x3c\xd4\xe7\x30\x85\x22\x7a\x83\x19\x87\x0e\x5c\
+\x6e\xc4\x8a\x9b\x85\x2d\xc7\xce\x8c\x7b\xc7\xc3\xd1\x7f\x4d\x29\
+\x11\xe7\x24\x8e\xf2\x17\x92\xaa\x61\xc4\x71\x44\xdf\x0a\x34\x4c\
+\xf1\xf8\x4a\x2d\xed\x73\xa5\xcd\x06\x72\x15\x93\x74\xb7\xfe\x59\
+\x0f\x36\xc4\x16\xbf\xfe\x9c\x60\x8b\xe2\x57\xc9\x04\x5d\xf7\x46\
+\x6c\x19\x59\x80\x00\x76\xb5\xcd\xfc\x17\x36\xdc\xc2\xd6\x44\x04\
+\x1b\xb7\x3a\x01\xec\x41\x1f\x20\x03\xe2\x9f\xdf\xfa\x73\xef\xc7\
+\xfc\xb6\x6b\x11\xb8\xed\x98\x01\x5e\x43\x19\x23\x14\x0c\x12\x2a\
+\x68\xa2\xf9\x43\x16\x2a\xa3\xee\xab\x91\x2b\x02\x56\xfa\x9d\xd8\
+\x04\x82\x86\x37\x58\x05\xc1\x46\x9e\x36\x53\x38\x87\xeb\x4d\x45\
+\x9e\xcc\x93\xf8\x9e\xb9\xdd\xb9\x73\x70\xce\x78\x8d\x21\xdd\x79\
+\xe5\x66\x20\xbc\x8d\xf0\x2d\x73\xdd\x80\xc9\x82\x9b\xae\xe5\xb8\
+\xb7\x1a\xf8\x79\x24\x16\x2f\x24\xf2\xa8\x2f\x39\x6f\x99\x23\x56\
+\x05\x80\x95\xad\x91\x16\xc7\xc8\xb2\x82\x34\x61\x8e\x19\x65\x2e\
+\xc5\x7b\x43\xb2\xc8\xf1\xf3\xe9\x94\x87\x4c\xec\x71\xee\x2c\x16\
+\x34\xc9\x8f\xcb\xaa\xaa\x96\x78\x90\x52\x09\xe2\x9e\xa2\x9b\x6f\
+\x08\xa5\x34\xc9\x1b\x45\x0d\x93\x66\x6a\xb7\x49\x1a\x38\xf0\x2f\
+\xb6\xd7\x95\xf3\x2b\xa0\x4c\xef\x4c\xac\x11\x38\x19\xa8\x4f\x86\
+\x12\x18\xf1\x63\x2a\x45\x15\x92\xea\x1f\x29\x25\x2c\xd3\x3b\xe4\
+\xda\x58\x62\x92\xa6\xa6\x7a\x99\x56\x4c\xdb\x6e\x20\xd1\x01\x71\
+\x14\x69\x26\x78\x65\x92\x21\x6c\x3f\x13\xa8\x45\x3e\x6f\x53\x3a\
+\xac\x21\xe4\x25\x7b\x57\x1d\xd9\x47\x39\x6c\xc4\x4b\x9e\x5a\xc8\
+\xb1\x1f\x24\x83\xa9\xd8\x33\x6e\x3c\x2c\xc8\xc5\xc8\x08\xad\x21\
+\x86\x34\x6e\x7f\x69\x25\xee\x79\xb0\x65\x94\x5b\xe1\x9b\xc7\x3c\
+\xf3\xb2\xa3\x41\x9c\x6a\x3c\xb9\x90\x91\x1b\xe1\xe7\xbc\x07\x3d\
+\xf7\xc0\xa8\x27\xc8\xd4\xab\x1d\xd1\x4b\xf6\xaa\x36\x4e\x5a\x5b\
+\x1d\xc9\xa4\xf1\x71\x89\xc4\x00\x07\xe1\xaa\x78\xe6\x5f\x83\x4f\
+\x22\x4b\xcd\xb1\x69\x63\x8d\xe5\x2e\x7f\x79\x8e\xdf\xbe\xa5\xd9\
+\x7d\xb9\xe6\x11\x4c\xd3\x29\x21\xcc\xf1\xed\x89\x24\xc8\x9e\xdb\
+\x2c\xb8\xe2\x98\xa6\xdd\xd7\x1e\x4e\xaa\x84\x47\x6d\x78\x9f\x8b\
+\x5f\x29\x1a\x49\xa6\x71\xc7\xee\x9b\x2d\xc1\xb3\xa5\xf5\xd5\x63\
+\x28\xac\xef\x43\x18\x56\x03\xe2\x2b\x26\x71\xb9\x42\x49\xb1\xf8\
+\xe0\xf8\x3e\x35\x0b\xc9\xde\x54\x2d\xc5\xec\xcf\x23\x3b\x5a\xff\
+\x00\xde\xb8\x5d\x48\xb0\xe2\xd5\x34\x96\x9a\x9f\x6f\x96\x79\x69\
+\xe4\x79\x24\xdb\xb7\xdd\x9b\xe3\x62\x3f\xe1\x94\x17\xe3\x50\x2d\
+\x1c\x66\x7d\xe4\x8d\x99\x22\x37\x96\x41\x3c\x5c\x4e\x80\x7e\xe6\
+\xe2\x71\x6f\x9e\x37\x1f\x80\xe9\xd4\xb2\xab\xcd\xd5\x56\x8a\x29\
+\x27\x8f\x2c\x78\x63\x32\xa6\x44\x02\x56\x43\x8d\xdd\x4d\xec\x39\
+\xbd\xb5\x0d\x55\x77\x88\x01\x0e\xa9\x88\x48\xdb\xb9\x2c\x65\x37\
+\x72\xc7\x2e\xf2\xbc\x37\xcb\x61\x7d\x13\x4a\x29\x05\x53\xc7\x2e\
+\x22\xc8\x25\x66\x04\x5a\xf7\xbe\x7f\x87\x8e\x6d\xaa\x2a\x6a\x95\
+\x52\x65\x18\x46\x55\x91\x65\x61\xc3\x2a\xe3\x11\x0d\x97\x04\x9f\
+\x00\x81\xc8\xb5\xf5\x35\x24\xb4\x58\x45\x23\x6d\x9f\x19\x9b\xfd\
+\xe9\x51\x31\x04\x2f\xcd\xfc\x35\xff\x00\x86\x2c\x6d\xb7\x73\x26\
+\xdf\xec\xde\xe0\xfb\x72\x51\xb9\xf2\x3c\xf8\xe3\xce\xab\x6a\xba\
+\xe4\x54\x6b\x5d\x31\x33\x2a\xee\x16\xf8\x2c\x1a\xf9\x1b\x2e\x4d\
+\x92\xb8\xc4\xc9\xda\x2c\x6c\x6d\xcc\x0d\xf6\x5b\xa8\x54\x52\xb7\
+\xff\x00\x54\xb4\x9b\xb2\x05\x17\xbc\x71\xe0\xa4\x8b\x39\xb2\xfd\
+\x79\xbd\xf5\x4b\x4f\xd7\x27\xaf\x8e\x2a\x0f\xec\x4b\xcb\x0a\xc9\
+\x32\xf6\xc7\xf0\xd8\xf3\x93\xe1\xe5\xbc\xf9\xc8\x76\x9e\xa4\x9d\
+\x2e\x28\x56\x5a\x87\xdd\xdd\x2c\xf1\x31\x8b\x20\xcb\x11\x12\x26\
+\x0f\x27\x1f\x34\x56\x4f\xee\xea\x69\x26\x97\x1b\x42\xc8\xaf\x26\
+\x0c\x90\x5f\xb8\x91\x99\x0d\xf2\xdc\x78\x3e\x7d\xbc\xeb\xa9\x53\
+\x04\xa7\x92\xa2\x8a\x57\xdb\x54\x32\xcc\xef\x12\xba\x04\x92\xa7\
+\x95\x8d\x03\xaf\xc4\x60\xac\x8e\x54\x14\x52\x2f\x6d\x4d\xe9\xa3\
+\xbb\x54\x24\xf2\xbb\x60\xc0\xcb\x03\xb6\x70\x17\x5b\xfc\x38\xfb\
+\x6c\xf2\x34\x98\x94\xe2\xcb\xe7\x54\xb1\x44\x58\x55\x98\x0b\x48\
+\x5d\x36\xd1\xe2\xde\x0f\xb8\x22\x43\xb8\xf1\xad\xd4\x66\x62\x11\
+\xc9\x30\x32\x2c\xdb\x6c\xa8\x33\x15\xf0\xc4\xb0\xc8\xa6\xf3\xb3\
+\x4a\x11\x4b\x8e\xf4\xa4\xb4\xd0\xa9\x3e\x10\xb4\x86\xc4\x83\x8d\
+\xf5\x25\x44\x2c\x70\x67\xb6\xeb\x20\x8c\xb6\xd8\xb5\xe3\x5d\xb1\
+\x1d\x91\x72\x29\x75\xe0\xf3\xe6\xda\x86\x25\x60\xaa\x57\x16\x62\
+\x59\xca\xc4\x01\x66\x16\xbf\x99\x1b\x96\x6f\x9a\xff\x00\x44\xba\
+\xe8\xed\xc0\x6c\x8d\x1a\x2e\x6d\xc8\x87\xe6\xcc\x78\xb0\xed\xf7\
+\xf6\xbe\x9e\x69\x64\x55\x04\x4a\x06\xd8\xb0\x39\x70\x02\xbb\x64\
+\x64\x3c\xf3\x86\x27\xdd\x48\x36\x3a\xa3\xe9\x6a\x30\x9e\xb7\x69\
+\xe7\xe6\xdb\x34\xa0\xc8\x56\x2f\x37\x5f\x04\xca\x9f\x7a\x79\x44\
+\x8f\x7c\x45\xae\x01\x10\x2f\xc8\xb6\xe1\xbc\x20\xb0\xb7\x84\xf3\
+\xcf\x8e\x49\x3e\xe0\xe7\xdc\x41\xc4\xa1\x7b\xaa\x2a\xf3\x93\xfd\
+\xc5\x0d\x6b\x05\x8c\xbb\xb9\x21\x00\xb9\xd5\x31\x8f\x27\xdc\x7c\
+\x19\x63\xbc\x09\x72\x09\x01\xa4\xb1\xda\x8d\x87\x13\xf8\x94\xa5\
+\xc1\x54\x5b\x9d\x7a\x34\xa8\x85\x52\x96\x42\x0c\x31\x47\x2c\x7d\
+\x36\x92\xc8\x05\xa3\x82\x28\xe4\xde\x58\x95\x4b\xfa\x80\x0c\x92\
+\x1b\xab\x38\x0d\x75\x45\x89\x67\x77\xcb\x2c\x9c\x08\x0e\x4a\xd7\
+\x36\x0c\x77\x39\x23\x36\x18\xa9\xb6\x3e\x05\xef\x1b\xa6\x02\x46\
+\x0f\x0b\xcc\x40\x72\x8a\xf2\x32\x9e\xf6\xb9\x41\x6e\x2e\xa4\x1c\
+\x38\xbf\xbe\xa6\x9d\x8b\x1c\x29\x4d\x3c\x05\x8d\xca\xc5\x24\x96\
+\x90\x78\xf9\xa7\x99\x96\x46\x22\xdf\x0d\x00\x00\x77\x64\x8a\xf7\
+\x65\x50\x99\xa8\x3c\xb3\xa6\x18\xaf\xfc\xbd\x9f\x9f\x7c\x8d\x7c\
+\x9e\xfa\x12\xff\x00\x68\xdb\x99\x7d\x11\x08\xb8\x88\x01\xe3\xb9\
+\x57\xf8\x5e\xd6\xb9\xd2\xaa\xde\xe6\x48\x4e\x7e\xca\x12\xf7\xbd\
+\xbc\xdd\x59\xbc\xfb\xdb\x51\xc8\xc7\x10\x25\x84\x13\xf7\x45\xda\
+\x44\x24\xfe\x68\x3b\xbf\x8e\xbd\x40\xee\x8e\x2a\xad\x96\x17\xb0\
+\x93\xbe\x0d\xc5\x5b\x72\xc3\x65\x4d\xf9\x5e\xf4\x63\x7b\x76\xeb\
+\xd3\x37\xf6\xab\xd3\xd3\x6b\xd8\x41\x3d\x24\x12\x3b\xb7\x3d\xa2\
+\xf3\x12\x2e\x4f\x24\x8d\x54\xca\x85\x45\x84\x88\x46\x5c\x10\x56\
+\xd9\x01\xfb\xb9\x0f\xaf\xb6\x9a\xbe\xc7\x18\x77\x64\x20\x0b\x9f\
+\x85\x30\x88\x49\x6f\x74\x4c\xa5\x96\xde\x48\x8d\x6c\x7c\xde\xba\
+\xaa\xb5\x20\x77\x48\x13\x64\x54\x8c\xa1\x89\x5c\x86\x49\x06\x3c\
+\xb6\x49\x75\x07\xc2\x86\x28\xfd\xc7\x31\x58\xfd\x36\x6a\x6a\x84\
+\x86\x6a\x9a\x3a\x76\x8a\x68\x9a\xd0\xc7\x29\xa8\x8e\x05\x28\xc6\
+\xd2\x46\x2a\x76\xa4\x1d\xac\x00\x4c\x56\xeb\x66\xad\xae\xeb\x5d\
+\x5c\x86\x6a\x54\x88\x43\x08\x69\x64\x55\x82\x31\x11\x8a\x48\xe3\
+\x73\x30\xdc\x6c\x86\xfe\x09\x91\x6f\xa1\xd3\xfa\x08\x9e\x92\x9e\
+\x48\xdd\xd1\x98\x82\xfb\x27\x90\xd8\xe3\x23\x83\x7f\xde\x37\xd2\
+\x75\x16\xaf\x35\xf5\x2f\x4b\x3b\x47\x0c\xe3\xb1\x48\xb6\x58\x09\
+\x7f\xb5\xc6\xf6\xed\x22\xf6\xed\xd4\xbd\x56\x96\xa6\x0a\x99\xb2\
+\xc6\x5a\x36\x2b\x1d\x60\x6c\x38\x34\xd9\xf6\x8e\xc7\x28\xe5\x47\
+\xcd\xe2\xde\x35\xb6\xf0\x49\xf3\x06\x8e\x35\x23\xd4\x72\x33\xe2\
+\x4b\xb5\xfc\x6d\x9b\x82\x2e\x7c\x5b\x55\x15\x74\xab\x34\x6f\x46\
+\xc2\x27\x49\x00\x59\xe4\xa8\xfd\x9c\x74\xbd\xa2\x35\x79\x64\xa8\
+\x64\x45\x6c\x6c\x72\xf1\x7e\x74\x0d\x55\x1b\x55\x50\x18\x82\x91\
+\x4d\x6d\xc9\x66\x41\x79\x1d\xe4\xc9\xdd\x48\x93\x27\x50\x2c\x08\
+\xb2\xdb\x9d\x55\x53\x49\xd2\x5e\x9d\xda\x70\x4c\xb2\x43\x36\xe4\
+\x85\x38\x58\xc6\x4b\x27\x2a\x7b\x8f\x80\x6d\xec\x35\x4b\x17\x41\
+\xa2\xda\x9e\x9c\x93\x57\x3b\xd2\x53\xce\xc4\xfc\xdf\x11\x64\x51\
+\x1d\x8d\xb1\xb8\x12\x32\xdf\x21\x66\x00\x84\xa6\x15\x34\xbe\xa2\
+\x18\xdb\xe1\xfa\x78\xaf\x68\xf9\x2a\x8d\x24\x21\x4f\x68\x37\x55\
+\x37\x3e\x03\x5f\x51\xd4\xf5\x3b\x4b\x13\x80\xff\x00\x0e\xa0\xbd\
+\xce\x06\x3c\x7c\xf2\xa4\x1e\x47\x9f\xc4\x6a\xa6\x61\x4c\xa2\x21\
+\x78\xb6\xac\xdc\xcb\x92\x83\x55\x3a\xaf\xcc\xb1\x5d\x70\xdc\x2e\
+\xb8\x03\xc6\x56\x75\x4f\x48\xfe\x8e\x87\x36\x04\xc8\xec\xad\x84\
+\x38\x8d\xe2\x11\x9b\xcb\xa6\x50\xa9\xc5\x07\x90\x99\xd8\x85\x30\
+\x88\xec\xc6\x3d\xc9\x1e\x3e\xfa\xb7\x8d\x12\x3d\xcc\xe4\x52\xf6\
+\xdb\x8d\x57\xf6\x81\x08\x5b\xb2\x93\x7b\x93\x1d\x4b\xf0\x71\x90\
+\x81\x9c\x70\x2b\x70\x04\x7f\xb2\x8a\xca\xa6\xe1\x29\xd5\x9d\xe4\
+\xb2\x97\x55\x24\x8f\x49\x04\x8e\xeb\x4a\x00\xa8\x96\x41\xc4\x4c\
+\xdc\xda\x43\xb8\xc9\xb9\x2f\x81\x1c\x57\x31\xe5\xdf\xf5\xd2\xaa\
+\x2d\xfe\xbf\x90\x17\xf6\x03\x83\x6e\x7f\x0d\x48\xb2\x7f\x68\x4e\
+\x4a\xbc\x81\x1c\x4a\xcc\x39\x1c\x85\x16\xc8\xf3\xcd\xbe\x9c\x13\
+\x34\xff\x00\xf9\x6a\x37\x49\x22\xa5\x52\x31\x96\x58\x97\x38\xe0\
+\x88\xda\xce\xce\x54\x48\x58\x00\x31\x06\x33\xc9\xbe\xa0\x9e\x60\
+\xd3\xcb\x21\xe5\xf1\x22\x24\x92\xa2\x55\x09\x73\xfb\xd2\x65\x27\
+\xc2\xbf\xc2\x41\x11\x27\xc9\x60\xd7\xc6\x35\x8d\xec\x05\xc7\x19\
+\x15\xdb\x3e\xe4\x91\xf3\x1f\x95\xb9\x16\xe7\x50\xfe\xce\x38\x44\
+\xbd\xa8\xec\x22\x87\xf0\xdc\xf6\xda\x06\xcc\xfc\x5d\x80\x20\x9e\
+\x75\x24\xab\x3c\xb3\xb4\xb7\xa6\x81\xc4\x58\x34\x84\xa9\x06\x38\
+\x92\xc4\x88\x55\xb8\xc7\x9d\x95\xb1\xf8\x8c\xcb\x69\x68\x62\x20\
+\x2c\x30\x9c\xa7\x66\x98\x42\x58\xb6\xde\x4c\x56\x50\xf2\xfc\x70\
+\xc9\xb5\x1c\x88\x24\x1c\xc4\x59\x44\x96\xda\x69\xaa\xe5\x9f\x7d\
+\xe6\x79\x79\xdb\x95\x16\x4c\x64\x91\xf8\xf9\x94\x61\x82\xf1\xb9\
+\xb9\x10\x5b\x10\x58\xb5\x22\x23\x32\x91\x9b\x4a\xca\x42\xb2\x4b\
+\x4f\x0c\xb1\x80\x7e\xf1\x1c\xee\x30\xb0\x49\x0e\x16\xe7\x51\x0f\
+\xaa\xc7\x7f\xe0\x2e\x0f\xe6\x3c\x68\x9f\x16\xf7\xf7\xb9\xe3\xf9\
+\xfd\x3f\x1d\x33\x37\x8f\x17\xfe\xff\x00\xbd\xff\x00\xbd\xfd\x3f\
+\x0d\x34\x6a\x00\x24\x81\x6f\xcf\xb4\x1f\xeb\xa4\xb2\xdf\x39\x63\
+\x76\xbf\xb0\x89\xad\xff\x00\xee\x7f\xc7\x4e\xc5\x62\xa8\xce\x70\
+\xf2\xd3\x54\x73\x0c\xdd\xfb\xb2\x2c\x84\x58\xc5\x96\x38\x87\x88\
+\xc7\x6d\xc3\x95\xc6\x97\xab\x50\x42\xf4\xf0\xd6\xf4\x8e\x8b\x5b\
+\x15\x31\x90\xcb\xe8\x63\x96\x9d\x69\xcc\x32\x4f\x88\x13\x14\x96\
+\x1d\xa9\x2d\x88\x53\x6f\x16\xd5\x5d\x04\x86\xc0\xf4\xfc\xa1\x6b\
+\x64\x72\x12\x5d\xb2\xb5\xae\x99\xc9\xcd\xac\x70\xf7\xf7\xd3\x43\
+\x4d\x4b\x53\x2d\x6c\x32\x51\x59\x23\x19\x53\x98\x67\x8d\x9a\x68\
+\xaa\x0a\xc6\xcc\xbc\x18\x95\xbd\xb7\x59\xaf\xda\x7b\x4d\x7d\x75\
+\x4c\x74\x69\x8b\x7a\x4a\x5a\xba\x39\x6b\x54\xab\x3f\xc5\xa6\xd8\
+\x8c\x96\x65\x42\x77\x23\x9d\xf8\x5c\x41\x0b\xc6\xa3\x6f\xb3\xd6\
+\xa3\xa1\xaa\xa8\xa3\xeb\x74\x55\x22\xf4\x70\xb7\x52\xa7\xa6\x92\
+\x4e\xa1\x12\xb3\xed\xb2\xef\x07\x43\x38\x07\x93\x01\xdb\x1f\xd9\
+\x93\x1d\x5d\x14\x6b\xd4\x3d\x3e\xe5\x5d\x53\x4f\x0f\x50\xac\xa8\
+\x68\x43\x09\x09\xa9\x4b\x4c\xe1\x8a\xbc\x9b\x45\x17\xe1\x8f\xd9\
+\xdf\x9d\x24\xe8\x92\x31\x98\xbc\x31\xc4\x80\x2c\x98\x6d\xe5\x77\
+\x8e\x31\x0b\xaa\x0b\xde\xd2\xc6\x0d\xbd\xc9\xd4\x55\x4f\x57\x2d\
+\x0c\xd4\x91\xcd\x35\x32\xc3\x4b\x2c\xb2\xd4\x34\x80\x98\x91\x5c\
+\xc5\x1a\x02\xac\xb7\x37\x73\x60\x3c\x3f\xca\xc8\xfd\x57\xa7\xd6\
+\xb8\x8a\xeb\x1c\x91\xc6\x38\x1f\x32\x3f\x62\x96\x24\x80\x38\x68\
+\xc7\x7d\xb9\xb7\x1a\xf4\xd5\x66\xba\x9a\x3e\x08\xae\xf4\xa1\x5e\
+\x94\xf8\x2a\xf9\x05\xbc\x77\xe6\x4b\x00\x54\x5d\xbc\x0b\x6a\x93\
+\xd3\xed\x54\x14\xa9\x8f\xaa\x0a\xa9\x62\x92\x38\xdc\x34\x71\x3d\
+\x01\x9f\x38\xd5\x09\x79\x77\x6a\xe9\xbd\xe7\x5a\x74\x90\x62\x38\
+\x73\x4d\x94\xd4\x31\xc3\x1d\x33\xd4\xcc\x70\x3b\xaf\x57\x56\x69\
+\x15\x56\x37\x05\x15\xbe\x69\x89\xff\x00\x86\xb7\xb5\xf9\xd7\x51\
+\x87\xba\xba\x48\x59\x8c\x92\x9d\xd8\xd2\xe5\x0f\x70\x22\xf1\x16\
+\xbf\xd2\xc9\xf5\x16\xd6\xe4\xc9\x15\x32\xee\x66\x64\x9a\x38\xb3\
+\xb1\x36\xe3\x6d\x11\x1a\xf7\xb0\xdb\x05\xb9\xee\xe2\xfa\xa9\x96\
+\xaa\x92\xae\xae\xab\x71\x9a\x39\x70\x92\x48\x57\x1e\xf0\xf8\xb1\
+\x48\xd4\x02\x2e\x6c\x39\x1c\x69\xe0\xac\xaf\xd8\x8d\xa4\x99\x41\
+\x8c\x48\x61\xba\x82\xdf\x19\xb6\x76\xe3\x01\x46\x57\x49\x00\x62\
+\x02\xa9\xb9\x1a\xa6\x14\x35\x6a\x69\xcf\xed\x6a\xa9\xcd\xbd\x52\
+\x87\xc7\xb9\xd9\x8c\x9b\x77\x04\xb8\xca\xee\xaa\x14\x1e\x79\x8e\
+\x0c\x54\x09\x01\x57\x9f\xe2\x47\x3c\xc8\xad\xf0\xcb\xc6\x14\x33\
+\xae\x78\x84\x31\xaf\xd1\x98\x95\x07\x51\xa1\x66\x68\xd5\xd3\x27\
+\x75\x66\xb8\x49\x54\xac\x58\xbd\xca\x0b\x81\x73\x8b\x07\x1d\xbc\
+\x5e\xfa\x82\x49\x69\xaa\x2a\xa7\x76\x65\xa5\x78\xe3\x91\x20\xa7\
+\x66\xc8\x65\x18\xca\x38\x22\x65\x1f\x33\xb2\x95\xc3\x2b\xab\x78\
+\xd4\x91\xd3\x99\x76\x61\x75\xca\xa2\xa5\x17\xe2\x4f\x2a\x16\x7d\
+\xa8\x91\xc6\x0f\x33\xdc\x2e\x4b\x23\x62\x0b\x16\xc0\xdb\x58\xdf\
+\xe6\xf8\x4b\x6c\x41\x37\xf3\x21\x6b\x7c\xaa\xb7\x0d\x6b\x1c\xbf\
+\x96\xa4\x58\x88\x67\x9b\xb1\x02\xfc\xff\x00\x30\x5c\xd8\xfd\x33\
+\xb6\x56\xb0\xc2\xf7\xd4\xab\x11\xe6\xc2\x24\xe7\xb5\x10\x0c\xa6\
+\x45\xfa\x06\x61\xcc\x83\xba\xd7\x55\x65\xbe\x96\x4c\xbe\x2e\xcc\
+\xaf\x1f\x77\x2a\x91\x18\x43\x4b\x6e\x2f\x2c\xd2\xc7\x0c\x61\xbf\
+\xe1\xe5\x6b\x13\x96\xb7\x5f\xc2\xc5\x94\x96\xf0\xb9\x5e\x65\x84\
+\x79\xf9\x7f\x1b\xb5\x87\x9d\x17\x74\x5b\x05\x85\xee\x57\x20\xbf\
+\x23\x3e\x0b\xc8\xe2\xfe\x18\x3f\x1e\x75\x53\x25\x4d\xd4\x46\x80\
+\x53\xd3\x80\x70\x85\x71\x31\xc3\x73\x6f\x9a\x6c\xfe\x28\xc8\x16\
+\x42\x72\xbd\x85\xaa\x2b\x82\x89\x16\x3a\xa1\x22\xa3\x77\x4b\x24\
+\x89\x20\xa7\xa3\x62\x00\x0b\x75\x9b\xe3\x49\xc0\x12\x15\x52\xfe\
+\x35\x0c\x28\xea\xad\x34\x33\x7a\xb8\xd7\xf6\xa1\x03\x3c\x14\xdf\
+\xf2\xfa\xc2\x8f\xb1\xef\x12\xac\x73\x3e\x59\xae\x12\x09\x62\x8e\
+\x38\xe4\x72\x5e\x3e\x5b\x6d\xe4\x4b\x42\xab\xdd\xd8\x9b\x43\xb6\
+\x3f\x2b\x8f\xc4\x2e\xcc\xa4\x42\xbf\x44\xb1\x1e\xc5\x95\x4d\x94\
+\x1f\x6c\xed\x88\x27\x80\xc4\x1f\x1a\xdc\xb5\x92\x5b\x88\x5f\xd9\
+\x9e\x1f\xdb\x2f\xe0\xd1\xc9\x88\x00\xfc\xc2\xed\xac\xfc\xa7\x87\
+\x8f\xe8\xfe\xf2\x7f\x0f\x3a\x3c\x5e\xe0\x10\xe3\xe8\x0d\xc1\xfe\
+\x9a\x91\xc8\xbd\xf1\xc3\xd8\x83\xdb\xff\x00\xb9\xd1\x7c\xb1\xdc\
+\xb3\x31\x1c\x0c\x5b\xba\x40\x4f\xd3\xb3\x1f\x3e\x09\x1f\x8e\xba\
+\x2d\x31\x93\x8a\xce\x8f\xd7\x3a\x36\x2d\x72\x9b\x99\xd5\xcd\x41\
+\x2d\xbf\xf4\xea\x16\x19\x01\xfc\x5a\xde\x45\xa9\xa6\xf8\x42\x48\
+\x20\x29\x50\x5a\x5c\x09\x84\xcb\x1b\x36\x5c\x13\xdf\x02\x16\x51\
+\xee\x78\xf7\xe3\xa9\x56\x41\x48\xf3\x3c\xb3\x53\x2c\x8b\xbd\x2d\
+\x31\x8b\x71\x71\x62\xe8\xb6\x7e\xd6\x44\xcb\xbb\x12\xcc\x01\x18\
+\x92\xba\x15\x55\xd4\x71\x15\x69\x30\xf4\x79\x65\x24\xb7\x43\xce\
+\x4f\xfd\x9e\x56\x66\xe4\x70\x0e\xbe\xcf\x53\xe5\x43\x3b\xd5\xd6\
+\x4b\x20\xa5\x8e\x4c\xa7\x8a\x15\x86\x48\xaa\x21\x79\x10\xc4\x21\
+\x0f\xbf\xf3\xc2\xa2\x44\x3d\xd9\xf6\xea\x93\xab\x74\xf3\x56\xe2\
+\x58\x60\x9a\x82\x3a\x4a\x89\x7d\x42\xca\xb5\xde\x8a\xb6\x96\xb8\
+\x59\xcc\xfe\x8a\x78\xcc\xd1\xd4\x92\xae\x69\xa4\x54\x91\xa4\x27\
+\x2d\x75\xde\x8e\x16\x2a\x91\x27\x52\xa7\xe9\x71\xe7\x19\x95\xa5\
+\x2d\x1d\x14\x5b\xcf\x32\x0f\x86\x14\x97\x6b\x95\x61\xda\x00\x00\
+\xf7\x68\x6c\xb1\x96\x15\xa8\x90\xc6\xd2\x33\x9e\x98\xaa\x1b\x0e\
+\xd9\x65\x91\x5a\xdc\x86\x8b\x0b\x5a\xcd\xe7\x8b\x45\x0d\x4f\x54\
+\xe9\xf5\x2c\x55\xdd\x92\x14\xf8\xd1\x6d\x91\x7d\xca\xa9\x06\x32\
+\x22\x9f\x79\x0a\x2a\x25\xdb\xba\xd6\x34\x54\x15\xdf\xa2\xa5\xf5\
+\x29\x35\x41\xfd\x5a\x39\x43\x43\x0f\x71\xc2\xa1\x61\x31\xce\xf2\
+\x2f\x07\x6b\x70\x73\xc8\x51\x72\x1a\x0a\x48\xb7\x81\x65\x9e\x58\
+\x2f\xfa\xb4\x5b\xb0\xac\x7d\xa3\x02\xb1\xaa\x43\x0c\x70\x41\x1b\
+\x48\x16\x9d\x10\x61\xb7\x79\x59\xde\x2a\xba\xba\x02\x4b\xcb\xbc\
+\xd4\x90\xfe\x92\x44\x96\x00\xb8\xc3\x2c\x9b\xa2\x38\xe6\x88\x49\
+\x21\xf8\xb3\x08\x81\xfd\x99\x69\x31\x46\xa8\x87\xa1\x41\x31\x90\
+\xc7\x8c\x55\x35\x31\x85\xa6\x91\xef\xe4\x43\x4c\xb1\xe3\xc5\xf9\
+\x96\xa6\x44\x6f\x96\xc6\xf6\xd2\x57\xd6\x99\xfe\xd1\x4f\x81\x79\
+\xa9\x96\x22\x29\xa8\x14\xdc\x2e\xcc\x28\xa4\x5f\x90\x38\x56\xfc\
+\x78\xb9\xd5\x07\x4e\x1d\x22\xbc\xef\xba\x89\x18\xd1\x98\xa9\x62\
+\x0b\xdf\x89\x2a\xb0\x9b\x82\x9d\xc5\xcb\x71\xed\xa0\x27\xae\x59\
+\xe2\x44\x14\x12\x44\xa5\x66\xa2\x69\x06\x63\x18\xa1\xad\x8b\x3a\
+\x96\x0a\xb7\x93\x69\x5f\x06\x1f\x32\xdb\x25\x8d\xfa\x57\x14\x0a\
+\x24\x48\xa3\x8e\x92\x08\x22\x7d\xa3\x9d\xa5\x37\x17\x6c\xd3\x20\
+\xb1\xaa\x94\x3d\xc7\x20\x31\x33\x6e\x09\x6a\x1c\x5d\x44\xb7\x44\
+\xf8\x71\xc5\x7d\x8a\x43\x8b\xce\x91\x2f\xf6\x8e\x30\xcd\xbb\x54\
+\x80\x6d\xa5\xf4\x92\x54\x53\x56\xb1\x74\xcd\xf7\x5a\x48\x14\xb2\
+\x81\x82\xbf\x32\x93\x7c\x79\x6f\x7e\x08\xf3\xa8\xe3\x79\xb7\x55\
+\x22\x78\xe3\x1d\x4a\x61\xb7\x2c\xa1\x1d\x9a\x79\x29\xe2\x97\xe1\
+\x85\x17\x76\x49\x0f\x85\xf3\xa6\x96\xa4\xd3\x47\x1a\x8d\xcc\xe3\
+\x86\xd9\x3d\x40\x2c\x22\x86\xe5\x8c\x95\x1d\xb7\x79\x7e\x54\x4c\
+\x70\x55\x4c\x95\xa6\x6e\x22\x8e\x22\x10\x2b\x37\x10\xa3\x7c\xd7\
+\x6f\xbd\x24\x87\xe9\xc0\x62\x38\xd0\xc4\x9e\xe8\xf1\x4f\x17\x09\
+\x6f\x17\x03\xef\x7e\x5e\x74\x18\xb0\xf8\x68\x8a\x40\xfb\xc5\x95\
+\x98\x47\xf9\x06\x00\xbf\xde\xb0\x3c\xe8\xb4\xec\x3b\x65\x81\x23\
+\x1f\xbb\x05\x30\x26\x60\x7f\xb9\x24\x85\x48\xfa\xb0\x5f\xe2\x29\
+\xf3\xf8\xb5\x0d\xba\xc3\xf1\x6b\xa0\x55\x1e\x6c\x42\xb0\x1e\x7c\
+\x8d\x42\x47\xec\x84\xb2\x12\x01\xc7\x8d\xb5\x45\x8d\x8f\x3e\x59\
+\x40\xfe\x27\x53\x92\x56\x38\xec\x5b\x02\xed\x26\x72\x78\xde\x96\
+\xc6\xe5\xa3\x4f\xd9\xaa\xe2\x3c\x0b\x5f\x9d\x57\x40\xb2\xed\x36\
+\xcd\x49\x92\x28\xd3\x37\x69\x0a\x46\x20\xa7\x13\x94\xb2\xca\xc0\
+\x19\x99\x02\xe6\xad\x28\x40\xc1\xd6\xfa\xaf\xa8\xa9\x45\x59\xe2\
+\x89\x44\x54\xd1\xb6\x52\x45\x59\x3b\x8e\xc9\x4d\x8e\xe3\xa4\x0c\
+\xfb\x80\x15\x58\xcc\xb8\xa0\x8c\x88\xf0\xa9\x5a\xc5\x39\x49\x58\
+\xd2\x49\xea\x1b\xe6\x35\x10\xc5\x8b\xc5\xe3\x1e\xef\xba\xc4\x85\
+\xc7\x8f\x70\xdb\x60\x2e\xda\xb3\xc7\xef\xdd\x8d\xfe\xb8\xe3\xc7\
+\xdf\x19\x03\xe0\x5b\xce\x9a\x81\xd9\x62\x5a\xdd\xad\x86\x27\x8a\
+\x6e\xa0\xa1\x70\x91\xbe\x8b\x37\x31\x4b\xe2\xea\xd7\xe0\x8c\xb5\
+\xfb\x32\x8f\xdd\x0c\xd1\xf9\xf8\xb1\x9c\x64\x4f\xcf\x10\x5b\x2f\
+\x05\x48\x1e\x79\xd2\xbd\x40\xbd\xde\xca\xa7\xe7\x55\x22\xc1\x7f\
+\x9f\x8e\x38\xf3\xaa\xba\x92\x29\x96\x28\x15\x4a\x67\x38\xdf\x06\
+\xf6\x2a\x91\xd8\x67\xc7\x9b\x78\x5b\xb7\xb6\x8c\x2b\x89\x91\x25\
+\xa9\xa4\xc0\x7c\xcf\x24\x52\x82\x83\xfe\xa5\x74\xfa\x5f\x9b\x6a\
+\x82\x46\x5c\x7d\x07\x51\x8e\xa0\x9c\x71\xc6\x14\x74\x69\x22\xee\
+\x3e\x1a\xcc\xae\x05\x8b\x29\x20\x10\x48\x3a\xea\x02\xe8\x6f\x04\
+\xdf\x08\xe3\xca\x47\x5b\x12\x40\x5d\x81\xed\xca\x19\x36\xf8\xb1\
+\x17\xbf\x8d\x75\x19\x0c\x76\x9a\xb6\x73\x0d\x33\x4a\xf6\x8e\x19\
+\xaa\x99\xcc\x3b\x8e\xc1\xb2\x52\x42\x8b\xf8\xf0\x17\x13\xce\xa3\
+\xa7\xfb\x4c\xdb\x70\x8a\x5a\x6a\x8a\x56\x86\x23\x52\xb5\xbe\xb6\
+\x9a\x39\x61\x89\x63\x5f\x01\x52\x7b\x96\x3e\xeb\xc1\x53\xa7\xac\
+\x4f\x44\xe2\x15\x9e\xae\x0a\x36\xac\x88\xf5\x68\xe1\x48\x9e\x69\
+\x9f\xd2\x19\x8c\xd1\x91\x8e\xe5\x94\x10\x51\x08\x65\xc6\xfa\xa9\
+\x48\x27\x4f\x49\x4d\x5b\x45\x5b\x88\xa7\x84\xbc\x94\x1d\x5d\x64\
+\x86\xad\x59\xe5\x57\x01\x04\xf0\xd3\xce\xeb\x18\x56\x11\xb4\x84\
+\x02\xe5\x6d\x45\x54\x7a\x4d\x1d\x6f\x5e\x31\xee\x8f\x47\x01\x9a\
+\x7a\x60\x48\x88\x54\xf5\x16\x09\x8f\xad\x9f\xb7\x62\x9d\xa4\x0c\
+\x72\xdc\x31\xaa\x0e\x29\xfa\x7f\xd9\xca\xd6\xe8\x70\xaa\xac\x75\
+\x14\x55\x3d\x36\xa2\x0a\xfb\x2d\xa1\x6b\x0c\x56\x91\x41\x00\xb1\
+\x91\x5c\x95\xcd\xa4\x5e\x42\x8d\x4b\x05\x76\x15\x90\x43\x4f\x3c\
+\x54\x74\xcc\xd2\x7a\x32\xd1\x9b\xbb\xcc\xee\xc2\x5a\x92\x71\xcd\
+\x83\x4a\xca\x96\xcd\x30\x2a\x18\x53\x3e\xe5\x2f\xa9\xf4\xe2\x28\
+\xa7\x87\x79\x52\x44\x48\x62\xca\x8f\xa7\x09\x03\x3e\xc1\x64\x48\
+\x51\xd9\x10\xbc\xdb\xb9\x90\xb8\xc6\xd4\xfd\x2a\x19\x69\x23\xa7\
+\xa6\x92\x49\x7a\x8c\x2d\x57\x1d\x22\x07\xc5\xe5\x30\x54\x94\x02\
+\x7a\x9a\xc4\x3f\x2c\x26\xe8\x6c\x17\x11\xf3\x8a\x69\x56\x1a\x8a\
+\x29\xe5\x35\x28\xb4\x4f\xbb\x2c\x45\xd6\x7d\x8a\xa8\x8c\xb4\xc5\
+\x62\x95\x30\x11\xb4\x60\x3f\x69\x7f\xde\x50\x45\x3c\x13\xd4\xcf\
+\x03\x48\xa3\xd2\x43\x59\x0c\x94\xf1\x2b\x16\x01\x63\x86\x50\xa4\
+\xed\xdc\xff\x00\x6e\xcc\x4f\x83\x2a\x0e\xf5\x34\x75\x4d\xd4\x60\
+\x3c\x54\x29\x55\x8a\xc4\x2f\x26\x1c\xad\x89\x49\x2d\xd8\xe1\xe4\
+\x4c\x7d\xc9\xd0\xa8\xe9\x94\xd3\xe4\xf6\x10\xa9\xd8\x8e\x41\xc6\
+\x2c\xed\x8b\xa4\xf9\xca\xd7\x09\xb6\xad\x78\xf2\x6c\x4a\xdf\x49\
+\xd4\xaa\xbe\xcc\x54\x53\xd5\x2e\xe3\x6d\x24\xed\x3d\x34\x25\xc3\
+\x99\xbe\x08\x2a\xc1\xa5\xcd\x9d\x9a\x17\x2c\x5e\xc1\x59\x56\xe3\
+\x53\x74\x58\x68\x63\xa3\xab\xa0\x99\xa8\x92\x96\x15\x1f\x04\x88\
+\xda\x6a\x3a\xb8\xf3\x82\x46\x6f\x55\x0b\x6e\x92\xd3\x16\x1e\x09\
+\xf6\x2d\x3a\x6f\x42\x25\x50\x6c\x88\x84\xc9\x2d\xd7\x7b\x27\x66\
+\x69\x6c\xef\xec\xbd\x8b\xe7\x1d\x35\x7a\x57\xad\x2c\xc6\xa2\x55\
+\x8e\xd2\xbc\x68\x62\x03\xb8\xfc\x45\xc9\x47\x18\x16\x42\x72\x27\
+\x15\xc4\x90\xc2\x53\x1a\xc7\x54\xc6\x48\x44\xd5\x6c\xcd\x1c\x32\
+\x20\xef\x9a\x21\x92\xb3\x4d\xf2\xe2\x79\xcd\x94\xb0\xc8\x12\x18\
+\x55\xca\xae\x32\x48\x62\xb8\x1e\xca\xd6\x56\xf4\xea\xc7\x1e\xd5\
+\xb2\x1c\x63\xca\x28\x73\x91\xd9\x82\x9d\x0c\x86\x65\x2d\x20\xa7\
+\x4e\xf6\x63\x6b\x6e\x4c\xfe\x08\xc8\xf0\xd6\x00\x9e\xd0\xa0\x90\
+\x75\x04\xa7\x87\x9c\xdc\x46\x3c\x46\xbf\xd9\xf0\x3d\xb2\xb5\xf9\
+\xf1\xa4\x40\xf7\x58\xf0\x42\xdf\xfa\x88\xdb\x93\xb3\xfe\x38\xde\
+\x31\x6b\x76\xb7\xd7\x9d\x3b\xda\xfb\x9b\x6f\xdb\xc6\x51\xa8\x69\
+\x2d\x7f\x6c\x99\x56\xff\x00\x96\xa0\xbd\xdb\x6b\xbd\x9b\xee\x42\
+\x29\xe2\x6c\x91\x47\x92\x4f\xef\x5c\x8c\x89\xe3\x51\xd4\x65\xda\
+\x7f\x69\xf5\x12\x19\x0b\x29\x37\xb8\xee\x5e\x3c\x79\xb6\xab\xae\
+\xd3\x19\x30\x32\x33\x49\xc1\xc7\xf7\x12\x11\x66\x5f\xc2\x42\xf6\
+\x7f\x94\x2a\x93\x71\x51\xd4\xcc\x67\x6d\x0b\x3d\x2e\xf4\x92\xda\
+\x4a\x99\x67\x75\x81\x29\xe9\xa3\xc9\xea\x24\x32\x4a\x67\xa8\x96\
+\xd2\x95\x91\x11\x23\x8e\xc3\x03\x2b\x4d\x22\xd3\xc0\x02\x47\x31\
+\x82\x25\x96\x5a\xaa\xda\xb6\x8e\x5a\xa5\x8f\x36\x25\xc5\xa3\x09\
+\x57\x3a\x12\xb0\xcd\x34\x30\xc6\xc1\xd8\x85\x91\x90\x25\x4b\x32\
+\xa5\x31\x5a\x88\xe3\x9c\x2d\x3c\x72\xb3\xec\xca\x24\x31\x77\x14\
+\x28\xa3\x06\x59\x97\x9f\x8b\xc5\xc4\xb1\xfd\x9c\x99\x69\x7a\xaa\
+\x19\x0c\xdd\x02\xb2\x5f\x88\xc8\x97\x91\xe5\xe8\x75\x8e\xa1\x6b\
+\x38\x56\x2d\x42\xca\xb5\x31\x2e\x58\xbd\x48\x1d\xd1\x06\x8d\x91\
+\xd6\x68\xfd\x54\x6e\xa4\x48\x85\x03\x06\x49\x12\xc1\xd5\xee\x79\
+\x53\x83\x58\x5f\x5c\x08\xcd\x62\xe2\xd2\xa3\x5c\x34\xd1\xc8\xa1\
+\xa2\x9d\x00\xe4\x9b\x3c\x71\x49\x6e\x44\xa8\xcc\x7b\x2e\xba\x4a\
+\xea\xfe\x9f\x27\xa5\xca\x44\x5a\xb9\x59\x76\xb8\x1c\x3a\x5d\xe2\
+\xca\xc7\xb7\x12\x2e\xef\x8a\xa9\x04\xea\x19\xe2\x0d\x3f\x4d\xea\
+\x14\xe6\x78\xa1\x8e\x28\x4b\x51\xed\x48\x55\xde\x56\x4c\x98\x09\
+\x07\xde\x2c\x2c\x0e\xd7\x25\xb2\xd5\x6c\x0c\xb9\x61\x5b\xd2\xab\
+\x57\xb6\xdd\x95\x30\xa5\xdc\x7b\xdb\x28\x4e\x56\x0c\xc4\xf0\x15\
+\x9a\xca\x6b\xe7\xaa\xa8\xa3\x8a\x34\x58\x26\xa6\xdc\x99\x4f\xae\
+\x59\xeb\x0a\x67\x42\xb1\xe6\x95\x12\x52\xbc\x67\xd7\xc4\x5d\x5a\
+\x8d\x5e\x25\x95\x77\x0d\x8f\x50\xa9\x8d\x4b\xcb\x57\xd2\x9e\x62\
+\xfb\x63\xfb\x5c\x76\x08\x20\x02\x32\x98\x18\xd8\x7b\xe1\x61\x89\
+\xe7\x54\xc6\x73\x9c\x10\x91\x63\xb6\x5c\x03\x45\x08\x71\x23\x27\
+\xb4\x6d\x87\xc3\x2d\x93\x65\x97\x77\x23\x14\xeb\x75\xed\xb3\x2c\
+\xc9\x49\x4e\x1f\x68\x3a\x51\xc1\x32\xbf\xa6\x80\x29\x12\xe0\x8b\
+\x02\xf1\x2d\x8e\xd0\x08\x0f\x70\xbe\xa7\xda\x94\x4d\x9c\x8c\x86\
+\x5d\xa9\x33\x6c\xc6\xd9\x08\xf8\x24\xb2\x44\x51\x89\xc8\xc9\x8e\
+\x5e\xc5\x6e\x87\xac\xf4\xd9\xd1\x46\x1d\x2a\xb1\xa3\x88\x02\xff\
+\x00\xac\x74\xc4\x96\xcd\xfb\xeb\x85\xd1\xfd\xed\xb6\x08\xf1\xa8\
+\x9e\x3e\xa7\x46\x29\xe6\x67\x9d\xe0\x64\x94\x49\x4e\xf0\x63\x03\
+\x1a\x88\xa5\x81\x3d\x6c\xee\x49\x30\xb9\x2c\x7e\xea\xb2\xf9\x11\
+\xd1\x3e\x55\x75\x30\x6f\xb1\x54\x54\x45\xf9\x53\xd4\x48\x88\x1e\
+\x34\xd8\x8d\x01\x90\xf3\x94\x3d\xf9\x66\x6d\x68\x47\x48\x89\x68\
+\x7a\x75\x05\x6c\x2f\xf1\x3d\x3c\x9e\xa2\x27\x81\xcc\xb2\xa1\x66\
+\x93\x08\x8b\xf1\xb7\x87\x2b\x72\xf9\x47\x92\x9a\x99\xa4\x9a\xb2\
+\x84\x48\x4d\x3d\x25\x7a\xef\x47\x3c\x93\x4a\xeb\xc5\x31\x40\xcc\
+\x91\xdf\xe3\xcb\x3f\xc9\x21\x5b\xe2\x31\x4c\x25\xab\xeb\x55\x1f\
+\x6c\xab\x6a\xa0\x92\x1d\xa9\xa8\x26\x48\xa2\xfd\x22\x24\x51\x15\
+\x5c\xd2\x4b\x1c\xd2\xbc\x21\xb1\x72\xfb\x4d\xbc\xa4\x42\xe0\xa3\
+\xb5\xd1\xe7\x6a\xb6\xa4\xe9\xd4\x95\x50\x40\xdb\x4e\xf1\x35\x6c\
+\xb5\x52\xd5\x48\xf2\x3c\x7b\x48\x8f\x65\xc3\x20\x22\x90\xe5\x89\
+\x53\xc5\xaa\x2a\x60\x8e\x3f\xd1\xd4\xa8\x29\xe6\xaf\xa8\xab\x97\
+\xd4\x47\x39\xfd\xbd\x3c\x29\x3f\x2d\x26\x19\x36\x11\xf0\x62\xc9\
+\x4e\x77\xe6\x9a\x1a\x29\x6a\x67\xe9\xd5\x49\x07\x48\xc2\x75\x13\
+\x56\xd2\xbd\x61\x69\x26\xea\x52\x2c\xc0\x54\x53\x45\x05\x1a\x4c\
+\x55\x20\x91\xa9\x76\xc5\xf2\x59\x2c\x9a\x4e\xa6\xbd\x41\xfd\x33\
+\xf5\x08\x93\xd4\x11\xbf\x3d\x41\x2b\xb2\x1a\x98\x5c\xb5\x3c\x34\
+\x94\xc1\x95\x1c\x7c\xdb\xac\x6e\x4d\xad\x27\xe8\xfe\x26\x17\x67\
+\x99\x16\x9d\xeb\x21\x41\x7f\x88\x5d\x41\xb0\x76\x2b\x1a\x1f\x8b\
+\xdf\x7d\xc0\x52\xe0\x50\xcc\xef\x0c\x49\xd5\x52\x7e\x9e\x4c\x6c\
+\xdf\x0f\xa8\x51\x87\x9e\x9d\x59\x9a\xfd\xf3\x53\x63\x0f\xbf\x75\
+\x82\xe2\xbd\xba\xc8\x64\x36\xb3\xdc\x91\x55\x0b\x28\x68\xc9\x38\
+\x3b\x0e\xd3\x21\x59\x02\xb1\xbd\x80\xf7\x3a\x97\x75\x6a\x6a\x18\
+\x91\x1c\x51\xd3\xb8\xa9\x5a\x5a\x7c\x81\xc3\x26\x25\x23\x67\x3d\
+\xcf\xda\xdc\xf8\xb6\x85\x2c\x11\x08\xe2\x00\xc6\x10\xca\x31\x0d\
+\x33\x2c\x6f\xc2\xdd\x84\x85\x09\x53\xc1\xe0\x90\xb8\x1b\x3a\xd3\
+\x0c\xb6\x0c\x7c\xa2\x28\x1d\xa8\xc8\x31\xf5\x0c\x7e\x26\xc3\x1c\
+\x56\x40\x3e\x23\x2b\x95\x2e\x01\xd5\x1d\x45\x2a\x16\xa7\xab\x99\
+\xf7\x97\xff\x00\xb4\xa8\x89\xbf\x58\xa1\x2d\xfd\xa3\x7f\x69\x07\
+\x84\xc0\x86\xc5\x8a\x1b\xe2\x4a\xdd\x07\xdd\xe0\xdf\x93\x61\x7b\
+\xf0\x80\x00\x7f\xbd\xfc\xb4\x7c\x77\x3c\xdc\x0f\xbd\x99\x42\x58\
+\xfe\x22\xdf\xca\xfa\xc0\xd8\x80\xa8\x0f\xf0\xfb\xbf\x91\x4b\xdf\
+\x57\x16\xbd\xad\x7e\x39\x4e\x46\x1f\xd6\xe6\xf7\x26\xda\xf4\x77\
+\x2b\xdc\xa0\xa9\xb7\x36\x3d\xac\x3c\x0c\x94\xf3\xf4\xe3\xc6\xba\
+\x9a\x6d\x6d\x8a\x8c\x63\x79\x9c\xe3\x33\x2c\xad\x83\xb6\x4c\xf2\
+\x35\x81\x0c\x40\x8f\x00\x13\x95\x01\xbb\xb5\x2e\x49\x8d\x25\x14\
+\x26\x46\x31\x13\x14\x34\x22\x04\x3b\x52\x99\x7b\xa4\x8d\xa4\xed\
+\x21\x50\xe4\xfd\xfd\xae\xc4\x6a\x08\xe2\x81\x7f\x4b\xb4\x88\x28\
+\x29\xea\x95\x9f\x2a\x84\x63\x1d\x45\x6d\x56\xe4\xdb\x54\xf2\x31\
+\x50\x82\x2b\x95\xa7\x84\x46\xb0\x47\x34\xd5\x39\xa3\x8b\xa2\x42\
+\xf2\x49\x3e\xfc\xf1\x23\x7a\xca\xd8\x1e\xbe\x39\x66\xa4\x04\x19\
+\x0d\x1e\xe4\x6d\x4c\x65\x71\x12\xbc\xdb\x08\x23\xb5\xf2\x69\x03\
+\x12\x6e\x93\x24\x8a\xcc\x19\x08\x00\xc7\x34\x6c\x3e\x22\x4a\xef\
+\xdb\x14\xaa\xc1\xa3\x50\x42\x90\x35\x1c\x9d\x45\x4c\x95\x10\x22\
+\x0f\xd2\x58\x5e\x59\x12\xc4\xb4\x75\xd8\x0b\xd4\xbc\x44\x2f\xeb\
+\x45\x4d\x40\x1f\x39\x9b\xe4\x65\xea\x1b\xd2\x53\xec\xd5\xfa\x7a\
+\x37\x86\x2c\xc7\xa6\x44\x69\x27\x9b\x7a\x22\x4e\xf4\x6d\xf1\x76\
+\x65\x54\x57\x88\x34\x7d\xb2\xb2\xae\xab\x07\x5c\xce\x4a\x88\xa3\
+\xa3\x8d\x3a\x5c\x71\x19\x37\xfe\xea\xc9\x40\xe5\x9a\x29\x62\xae\
+\x0d\xbf\x92\x20\x7a\x66\x8c\xe4\xcf\xc6\xab\x28\xa0\x8f\xa8\xd2\
+\x6e\x48\xf0\xf5\x09\x20\x6c\xe0\x25\x42\x3c\x74\xd2\xc4\xd9\x6d\
+\xc5\x10\x0a\xad\xb7\x14\x40\xc9\xc9\x24\xea\x92\xec\x00\xea\x1d\
+\x1e\x40\xbc\xf9\xf4\x92\x4b\x24\x76\x1e\xec\x00\x2a\xbe\x6c\x48\
+\xd4\x56\x03\x69\x6a\xa3\x6d\x90\xb7\x4f\x8d\x93\x49\x64\xf1\xbc\
+\xca\x98\xb4\x9f\xb5\x97\xe5\x91\x9b\x8b\x52\x2b\xa0\x15\x32\xd6\
+\x0a\x28\xdc\x82\xae\xdb\x55\xf5\x26\x4a\x77\x8e\xe7\x00\x9f\x0d\
+\xa3\xbf\xbb\xbf\xd5\x70\xea\x1d\x4c\x82\x29\xde\x98\xf4\x9e\x99\
+\x18\x3b\x53\xad\x6d\x65\x54\x34\x89\x78\xc0\x66\x97\x6a\x99\xaa\
+\x5e\xf8\xfc\xf6\x3c\x0e\x35\x4d\xd3\xa9\x29\xa9\x62\x9a\x97\x0a\
+\x49\x21\x59\x5a\xb2\xa6\x54\xab\x95\x60\xa6\x9e\xa2\x32\x7d\x28\
+\x8e\x1a\x95\x89\xa2\x58\x9e\xac\xa4\x8c\x56\x62\xa1\xb6\xc4\x92\
+\x55\x1a\x55\x14\x53\xb5\x34\x93\xd0\xa2\x6c\xce\xf4\xd2\x49\x11\
+\x32\x30\x4b\x53\x15\x68\x8a\xcc\x83\x81\xe7\x5e\xa2\x53\x1a\xbf\
+\x53\x82\x2a\xac\xd0\xde\x3f\x4d\xd5\xa1\x78\x6a\x80\xb5\xb3\x51\
+\xde\x72\xfc\x07\xbf\x3a\xea\x33\x75\x28\xa8\xcd\x07\x4d\xa6\xa3\
+\xa4\x15\xd5\x7f\x0d\x29\x64\x4c\xea\x33\x32\xa3\x23\xab\xb9\x74\
+\x09\xb4\x44\x9f\x27\x21\xbb\xb5\x59\x57\xd3\xa9\xe9\x3a\x47\x48\
+\x99\x77\x5a\xae\xb6\xa5\xd3\xa9\x75\xd6\xf6\x96\xae\x59\x1d\xaa\
+\xe9\xfa\x7b\xb2\x7e\xc8\x4a\xbb\x89\x69\x0b\x5a\xe0\xd7\x51\xd2\
+\x44\xb2\x4b\x4d\x41\xb9\x59\xb0\xcd\x34\x48\x69\xe3\xe6\x65\x91\
+\x53\x6f\x6e\x9e\x9a\x45\x8c\x1e\x03\x65\x8b\x06\x62\x0e\xa8\x7a\
+\xc7\x44\xeb\x50\x9a\x87\x8e\x9e\x19\x21\xaa\x8a\x1b\x52\x75\x08\
+\x23\x54\x9e\x1d\xc3\x0b\xdb\xbc\xe7\x1c\x5b\x60\xcf\x4e\xe9\x28\
+\x60\xaf\xa8\xd7\xaa\xf4\x14\x8e\xa2\x06\x61\xfa\x53\xa3\xa4\x21\
+\x2b\x23\xdb\x3d\xce\x4e\x73\x53\x38\xe3\x9b\xd8\xe2\x02\x2a\x39\
+\xcc\x47\x2f\x49\x31\x40\xb2\xac\x11\xca\x92\xb4\x75\x94\x55\xc2\
+\x6f\x8b\x58\x3a\xbf\x4c\xac\x67\x88\x1a\x66\x22\x48\x6a\x54\xc3\
+\x51\x64\xfd\xac\x92\x62\x75\xfa\x32\xa2\x93\xa7\xf5\x3f\xb3\x72\
+\x50\xd3\xa5\x45\x2d\x25\x1b\x51\x3d\x54\x4c\xa3\x3a\xb4\x8a\x44\
+\xdb\x15\x11\x1f\xd6\x28\x45\x3a\x09\x7e\x1c\x70\xcf\x24\xd9\x31\
+\x35\x15\x13\xf5\x48\xa9\xfa\x47\x4c\xe9\x48\x91\x54\xb2\xb3\x89\
+\x4f\x53\x47\x7a\x4a\x05\x54\x26\x48\xa6\xfd\x1e\x58\x49\x4e\x51\
+\xd2\x19\x9c\x66\x99\x32\xba\x4f\x43\xbb\x20\xa7\xc2\x2a\x59\x21\
+\xa4\xa3\x69\x1e\x95\x69\xc0\x31\xc5\x1c\xd5\x10\xac\x51\x2a\xd9\
+\x4a\x4a\xd2\x5e\x43\x23\xe4\xce\x2c\x9a\xfd\x37\x47\x5c\xa9\x1f\
+\xa8\x0b\x5b\x0a\x33\x66\xd4\xe9\x6c\xa3\x58\xf1\x94\xc6\xd9\x02\
+\xfb\x2d\x0a\x36\x57\x2d\x29\x5e\x35\x2c\xd4\x71\x6d\xf5\x3e\x93\
+\x5b\x0f\x57\xa4\x9a\x25\x1b\x52\x4d\x4a\x4b\xf6\x9c\x15\xcb\xd4\
+\x53\x67\x97\x98\xc9\x4c\x15\xf2\xb6\xaa\x0d\x27\xc6\x3d\x47\xa2\
+\xc9\x5f\x4f\x06\x60\x3b\x18\xca\x4f\x6f\x65\x43\x12\x19\xa3\xe6\
+\xfc\x9b\x6a\x69\xa2\x68\xe5\xdd\x96\x28\xa3\x86\x33\x18\x90\x48\
+\x10\xbb\xb5\x93\x12\xe1\x11\x48\x66\x37\x19\xff\x00\x2d\x1a\x87\
+\x81\x69\x96\x38\x89\x15\x36\x11\xa8\x24\xd8\xc9\xe0\x93\x2d\x8f\
+\x9b\xdb\xf0\xd3\x88\xc9\x11\xf4\x7e\x94\x95\x12\xdc\x5f\x72\xbb\
+\xa9\x32\xed\x40\xe4\xf7\x12\x94\x74\xdb\x85\x58\xf1\xea\x01\xfa\
+\x69\x3a\x7f\x56\x9a\x54\xa7\xfb\x46\x76\x66\x64\xef\x1d\x28\xe3\
+\x8d\x2f\x50\xb5\x8e\x2f\x04\xa5\x55\xd9\x7c\xc0\xce\x18\x13\x66\
+\x15\x54\x75\x98\xc5\x51\x4e\x5d\x58\xa9\xcd\x65\x47\x19\xa4\xc9\
+\x27\xba\x4d\x16\x12\x07\x17\x52\xef\x8f\xe1\xa5\xef\xe4\x5c\x8f\
+\xad\xa4\x5b\x1e\x7f\x0d\x5a\x17\x17\x59\x22\x36\xbf\xcd\x65\xb3\
+\x65\xf8\x63\x73\xf9\xeb\xba\x46\xdb\x27\x30\xab\xcd\x96\xdc\xf3\
+\xf4\x1e\x74\x26\x90\xf3\xc8\x36\xf6\x5f\x01\xbd\xfc\x0e\xec\xfc\
+\x02\x2f\x6f\x6d\x75\x05\x4d\xea\xba\x8c\xe3\x76\x69\x53\xb1\x1e\
+\x18\xcd\x92\x00\x46\x46\x36\x03\xbd\xb2\x39\xbb\x1b\x63\x7b\x6b\
+\xae\x1a\x38\xa3\xc9\x5b\xa5\xd7\x1c\x83\x05\xa9\x96\x9e\x5a\xc8\
+\x53\x7a\xcd\x75\x8f\x72\xa2\x29\x2e\x2c\x10\x53\xab\x90\x42\x90\
+\x62\xa4\x8a\xa9\x04\x50\xed\xcf\x5f\x50\x29\xcc\xcd\x57\x51\x24\
+\xa6\x49\xcc\x28\xc5\x59\x20\xa7\x52\xd4\x34\xa8\x66\xca\x5f\x4b\
+\xbc\x8f\x76\xe4\x4f\x30\x91\x76\xaa\x0c\xb1\xaa\x01\x12\xd3\xd3\
+\x95\x73\x18\x14\x63\x38\x63\x44\xdd\x77\x9d\xa3\x54\x67\x99\xd5\
+\x5c\xb3\x9c\xb4\xcc\xd8\xb3\x9a\x58\xa2\x48\xf8\xf9\x8a\x36\x09\
+\xe3\x93\xf1\x06\x04\x7c\xb8\xc8\xad\x76\x2a\x55\x0a\x33\x65\xb7\
+\x13\xc6\xcb\xee\x25\x6c\xcd\xad\x63\x94\x4f\x1e\x17\x1c\x8f\x7d\
+\x75\x87\xe9\xe2\x6a\x9a\x1e\xa0\xcd\x5b\xe8\x21\x00\xa4\x8a\x31\
+\xdf\x51\x64\x44\x86\x73\x32\x2b\x05\x72\x52\x4e\x7b\x37\xca\x4a\
+\xb4\xf3\x54\x64\x69\x21\x91\x21\x15\xd2\x41\x23\x4d\x45\x4f\x21\
+\xb5\x15\x4c\xf1\xee\xbe\xdc\x74\x86\x19\xe8\x2a\x63\x54\xcf\x38\
+\xe0\x99\x1a\x32\xd7\x6a\x9a\x38\x69\x76\x65\xac\x8e\x8a\x0e\x93\
+\x5f\x49\x3b\xcd\x4f\x2c\xa8\xfe\xa2\xa2\x5e\xa7\x9b\x36\xf7\xe9\
+\x08\x91\x91\x03\x62\x62\xcd\x40\x3b\x81\x5c\x7d\x85\xeb\x91\x2f\
+\x64\xb3\xcf\x4a\xe0\x15\x1b\x26\x76\xc2\x44\x26\xdf\xd9\x99\x64\
+\x8d\x94\xff\x00\x69\x8f\xb5\xc1\xad\x92\x3c\x9d\x29\x22\x5a\x89\
+\x58\xf6\x94\x92\x29\x9a\x45\x3f\xde\x27\x6c\xc7\xdb\x8f\xce\xbf\
+\xc6\x2a\x39\x4b\x99\x29\x3e\xd4\xd6\xfc\x4b\x82\x48\x91\x1a\x4c\
+\x9c\xdb\x9e\xe6\x42\x0f\x00\x0e\x6d\x7e\x75\xf6\x76\x9a\x73\xf1\
+\x2a\xaa\x67\x7a\xba\x73\xb8\xcb\xb6\xd5\x71\x88\xe5\xb6\x76\x11\
+\x1c\x7e\x09\xf9\x80\x99\x72\x66\xf7\x14\x54\x69\xba\xb4\x55\xfd\
+\x22\x61\x24\x37\x6a\x89\x87\x55\x58\xea\x25\x77\x9a\x46\x92\x47\
+\x8f\xa6\x4a\x61\x44\x19\xdc\x07\x2d\xe1\x4a\x6b\xaa\x51\x75\x1a\
+\x40\xfd\x35\xfa\xbd\x5c\x71\x4b\x1d\x25\xa8\x69\xe9\x26\x91\xe5\
+\x15\x32\x4c\x84\x5e\xdd\xf2\x54\x33\xc3\x39\xf7\x38\xa6\x5a\xa0\
+\xea\x72\xd7\x45\x0f\x4c\x41\x35\x34\x93\x45\x13\x07\xab\x8a\x26\
+\x12\x47\x1f\x4d\xa3\x3f\x1b\x77\xbe\x48\x76\x0f\x6c\x64\x6e\x96\
+\xc2\xf6\xab\x9f\xd7\xc9\x14\xd2\xfe\xb3\xd1\xfa\x3b\xe2\xf4\xd0\
+\xb2\x9f\x48\x6a\x3a\x8e\x03\x3a\x8a\x89\x12\x07\xa7\x1f\xd8\x52\
+\x3b\xee\x38\x6e\xd2\xb0\x20\xeb\x95\x13\xbd\x12\x4a\xb1\x53\xa0\
+\x01\xdd\x8c\xdb\x66\x8a\x59\x94\x31\xd9\x13\x5c\x46\xee\xd1\x86\
+\x85\x25\x40\x31\x6b\x6a\xae\xb7\xa7\xf4\xef\xd3\x5f\xa5\x45\x44\
+\x3d\x41\x36\xaf\x58\xf4\x75\x12\xad\xe5\xa7\x69\x2e\x22\xc1\x4d\
+\x33\x3a\x14\x65\x78\xd9\x54\x28\xb3\x13\x4a\x7a\x1c\xaf\xd3\x3a\
+\xa7\x5c\xda\xaf\xad\xa4\xde\x12\xad\x02\x45\x03\xbd\x1d\x3a\xa1\
+\x8b\x65\xa4\xa9\x8c\xbc\x92\x30\x4d\xe8\xe9\xa6\xa7\x83\x2f\x80\
+\x4b\x7e\x8b\xaf\x6c\xa7\x9e\x37\xde\x58\xb7\x1a\x57\x0f\xdb\x94\
+\xb2\xfc\x55\xe2\x4b\x1b\x6d\xd3\xe0\xbc\x9c\xad\x62\xe7\xaa\xb4\
+\xc5\xaa\xe9\x60\x36\xa6\x91\x3b\x91\xa1\x55\x8a\x17\x73\x8f\x70\
+\xb0\x96\xa4\x79\x65\x96\x24\x18\x62\xf9\x4b\x5e\xca\xf2\xbc\x6a\
+\x15\x0d\x21\x5a\x26\x48\xea\x0a\x2c\x86\x43\x04\x92\x13\xb6\x8a\
+\x5b\x21\x1f\xc3\x53\x23\x0c\x6c\x19\x2a\xda\x4e\x9d\x4c\x94\x7d\
+\x4f\xa8\xcf\xd6\x16\xa9\xe7\x35\x15\x1b\xd5\x7b\x50\x51\x8d\xb7\
+\xfd\x9a\x47\x49\x04\x68\x19\x91\xfd\xc8\x01\x8e\x42\xaa\x9b\xab\
+\x74\x98\xa3\xea\xeb\xd6\xaa\x3a\x3d\x17\xd9\xca\xba\x78\xa1\xad\
+\xab\xb0\x89\xa9\x24\x9f\x76\x23\x8f\x4f\x05\xa4\x3e\xae\x61\x28\
+\xa5\x80\x48\xd3\xe5\x2e\xdc\x27\xd7\x75\xe8\x3a\xd4\x75\x55\x08\
+\xb1\x57\x75\x4a\xda\x4a\x4a\x7a\x4e\xa0\xcb\x29\xc6\xa6\x45\xa7\
+\xca\x08\xdb\x32\xb7\xcd\x71\x0f\x8c\x2e\x1c\x31\xbd\x77\x53\xfb\
+\x1d\x3d\x3a\x04\x3b\x6f\x1c\xb1\x4b\x0e\x74\xe9\xcf\xa1\x82\x54\
+\xde\x81\xe1\xc8\x96\x97\x6e\x38\xbb\xd8\x60\xc8\x38\xd7\x4f\xe9\
+\xd5\x08\x21\x5a\x39\xe4\x47\x81\xbb\xb0\x87\xa9\xc6\xc5\xa1\x17\
+\xb9\x78\x14\x97\x3d\xfe\xca\x2d\xdd\xaa\xb6\xa9\x58\x44\x14\xf5\
+\x4f\x1d\x32\x20\xda\x67\x85\x7b\xc7\x2a\x8c\xd6\x36\xbf\x1c\xb9\
+\xed\xc8\x2b\x69\x62\x65\x09\x12\x2e\xfc\xa5\xec\xb1\xc3\x12\x07\
+\x69\xd9\xee\xcc\x56\x28\xc4\x6c\xc7\x3f\xba\x3e\xbc\xeb\xf4\xa4\
+\xc9\x2e\xff\x00\x5d\xab\x9f\xaa\xc8\x92\x2e\x32\x0a\x5a\xd9\x11\
+\x3a\x6c\x6c\xbf\x2d\xa9\xfa\x5a\xd3\x5f\xff\x00\x52\x43\x60\xa0\
+\x63\xaf\xb3\x7d\x22\xaa\x6a\x8a\x3a\x5a\xe8\xea\x45\x45\x4d\x3c\
+\x69\x2b\x04\x8e\x96\xa6\xa6\xd1\xac\xa4\x27\x74\x94\xbb\x64\xb3\
+\x1c\x22\x72\xd8\xb1\x16\x26\x07\xef\xeb\x9d\x06\x09\x76\x07\x97\
+\xaf\xe8\xd1\xc9\xb8\xf4\x99\x0b\xe7\x51\xd3\xd1\x1a\x51\xcb\x9d\
+\xab\xa1\xc8\xe2\x44\x8f\xfd\x91\x63\x0f\xbd\x90\xfc\x44\x01\x1c\
+\xfc\xe5\x42\xee\x38\xc4\x61\x70\x0e\xb8\x6c\xc3\x42\x16\xff\x00\
+\x4e\x31\xcf\x9b\xfd\x6d\xaa\x2a\x2a\x9a\x58\xaa\x62\x78\xaa\x96\
+\x55\x9f\x71\xa1\x01\x29\x19\xf3\x95\x61\x92\x27\x68\xf9\xf9\x51\
+\xd1\x9b\x80\x18\x6a\xaa\x87\xa7\xc4\x8a\xd0\x54\x4c\xf5\x18\x3e\
+\xea\xd3\xdd\x0e\x1d\x2e\x36\xbd\x9d\x21\x8d\xb2\x99\xf9\xc6\xa6\
+\xf4\xf7\xf8\x4d\x95\x79\xe6\x11\xbd\x24\x8d\xdc\x59\xee\xe2\xff\
+\x00\xde\xb1\xb8\x0b\x12\xdb\x01\x7e\x54\xeb\xa9\xab\x34\x50\x89\
+\xe8\xea\x0d\x44\xf5\x04\x61\x0f\xa7\x22\x48\xfe\x16\x58\x91\x1a\
+\xc7\x24\x96\x90\xdb\x2b\x16\x0c\xb7\x46\x68\xe9\x9e\x38\x58\x4c\
+\x16\xa7\xf5\x38\xb3\x9e\x0b\x81\x08\x32\xe4\xc7\x1c\x7e\x25\xe3\
+\x09\x80\x94\x5b\x12\xac\x4a\xd4\x2c\x05\x9e\x7a\x90\xb7\x93\xb2\
+\x31\x19\x11\xa4\x21\xe4\x1c\x49\x2b\x90\xcd\x60\xab\x1f\x62\x33\
+\x28\x20\xbe\x81\x4f\x85\x57\x4d\x0c\x65\x56\xfb\xac\x98\xc7\x9b\
+\x19\x06\x21\x1b\x71\xe4\x67\xed\x72\x43\x58\xf0\xa0\x8d\x23\xd4\
+\x4f\x2e\x42\x5e\xd5\xf5\x3b\x7b\x5e\x0e\x2b\xb6\x13\x04\xcc\xe5\
+\x8b\x64\x6f\xc5\xf5\x25\x3d\x2b\xa5\x3c\x13\x23\x2d\x64\xa9\x23\
+\x30\x64\x01\x19\xc3\x64\x4b\x2d\xc9\x06\xea\xd7\x0f\x8b\x7b\x6a\
+\x1a\xc8\x30\x93\x6d\x77\x18\xb2\x2b\x45\x51\x1d\xd5\x6a\x51\xe1\
+\x64\x3b\x82\x15\x45\xaa\x72\x6e\x48\x85\xb1\xe5\x8d\xcd\x2c\x94\
+\x30\x51\xf5\x3a\x7c\x25\xaa\xa1\x51\xf0\x6a\x10\x15\x7d\xfa\x65\
+\x52\x05\x45\x24\x86\xd3\x41\x34\x26\x36\x87\xb6\x09\x63\x72\x4b\
+\xea\xae\x2a\x75\xdb\xa6\x83\xab\x53\x75\xca\x05\xbe\x4d\x4b\xea\
+\xc3\xd3\x75\x0a\x2f\x6c\x76\x2b\xa3\x8e\x7b\xdb\xbb\x7d\x2d\xe2\
+\xfa\x8a\x96\xa7\xb7\xa7\xf5\x8a\x36\x8a\x43\xf3\x16\x6a\xfa\x78\
+\xf6\x65\xe4\xdb\x1a\x67\x68\xa7\xb7\xff\x00\x9b\xcf\x23\x1a\xd8\
+\x27\x12\x7a\xaa\x5a\xe9\x3d\x5f\x6d\xf0\x30\xfe\x8b\xa6\x9e\x57\
+\xee\x25\x5e\xc5\xc9\x5e\x6c\xb9\x35\xf5\xd5\xd4\xdc\x53\xfa\x7a\
+\x6e\x97\xd2\xdd\xa3\x61\x82\x43\x24\x0a\x93\xc2\xf7\x3d\xec\x69\
+\xa2\x6e\x41\xdc\x91\x8c\x63\x0b\xdd\x42\x4b\x23\x09\x5a\x28\x66\
+\x70\xd6\x63\x1c\x94\x55\xf4\x54\x4b\x08\xe1\x5a\xd4\xea\xcd\x99\
+\xe7\x68\x37\xc4\xdd\x2b\xa6\x11\xcf\x4d\x7a\x8a\x8a\xb9\x96\x09\
+\x55\xe1\x76\x8f\x69\xa5\x92\xbd\xab\x64\x97\xf5\x0a\x5a\x67\x29\
+\x94\xbb\x4a\x5e\x1d\xd5\x85\x25\x95\xe3\x5d\x3d\x74\x95\x31\xd7\
+\xf5\x38\xe6\xa1\x32\x56\x46\x27\x31\x45\x04\xce\xcd\xe8\x68\xac\
+\xa2\x0a\x6a\x33\x31\x96\x56\x64\x2f\x51\xd4\x24\x4d\xca\x89\x6f\
+\x68\xf5\x11\x8a\x78\x14\x50\xd7\x55\xc6\xf4\x72\x53\xab\xd4\x54\
+\xac\x8a\xb2\x84\x8a\x7d\xc5\x60\xaf\x10\x99\x16\x2c\x4c\x6a\xc1\
+\x65\x31\x97\x56\x63\x15\x14\x04\x6d\x3b\x41\x51\x55\x2c\x63\xe2\
+\xde\xa9\x50\xbc\x5c\x9b\x0f\x49\x48\xb3\x85\x64\x0a\xa1\xea\x99\
+\x99\x58\x95\xc5\x4c\xd0\xcd\x33\x57\x55\xc9\x0c\x51\x2b\xed\xda\
+\x2a\x9a\x88\xe0\xa1\x79\x1a\x27\x52\x91\xc6\x94\x95\x59\x15\xc7\
+\x8c\x09\xe0\x73\xd4\xfd\x13\xd5\xd7\x8a\xb9\x4d\x44\x32\xc4\xa8\
+\xd4\xb4\xb2\xd1\x19\x28\xf3\x96\x76\x21\xa9\x8c\x3c\x53\xd3\xa8\
+\x06\x39\x17\x1c\xc3\xb7\x78\xae\x83\xa9\xe1\x47\xea\x52\x4a\x78\
+\xf7\xa9\xa9\xa9\xe6\x6c\x4f\x75\x75\x45\x42\x84\x98\xc0\x9c\xa9\
+\x52\xdd\xf2\xad\xd0\x81\xdb\xae\xa0\x2a\x6a\xea\xa9\xa9\x3a\x7f\
+\x53\x96\x9e\x76\x7a\x5c\xa2\xa4\xbc\x70\xbb\x61\x22\x21\xbc\xbb\
+\x52\xe5\x32\x34\x96\x48\xca\xe3\x7b\x6a\xa6\x3a\x0e\xbd\x4a\xe2\
+\xa6\xa6\x3e\x97\x59\xd4\xde\x67\x02\x81\x9f\x03\x59\x23\x3c\x65\
+\xec\x60\xa0\x9b\x77\x6a\xc0\xb3\x3a\x21\xe0\x9d\x75\x98\xfa\x6f\
+\xab\x83\xec\xdd\x5d\x46\xd7\x45\x91\xe0\x4d\xd6\x10\x52\xc3\x4f\
+\xc5\xc8\x1b\x75\x51\xcb\xbd\x1c\x0f\x2e\x23\x74\xc1\x20\x26\x29\
+\x0b\xad\x6d\x54\xcb\x53\xd4\x9a\xaa\x3e\x9b\xd3\xfa\x81\xa8\x0d\
+\x79\xa8\x77\x29\xa6\x82\x76\x08\xad\x24\x94\xa7\x66\xf5\x42\xa2\
+\x51\x34\x92\x6c\xcb\xba\x04\x7b\x7f\xa2\xbe\xd9\x75\x3f\xb2\xbd\
+\x5e\x81\x63\x99\xe5\x8f\xa0\x3d\x6c\x7d\x45\x40\x36\xa3\xa3\x99\
+\xa7\xa6\xa7\x44\x8a\x56\x57\xc9\x4c\x62\x69\x30\xb6\xec\x92\x38\
+\x0d\xd4\x62\xeb\x1f\x68\x3a\xbc\x1d\x4e\x9f\xac\xd4\xc5\xd3\xe1\
+\xa5\xdf\x86\x19\xe8\xa4\xdb\x95\x24\x79\x1e\x22\x8a\x95\x1c\xc7\
+\x8c\xa2\x22\xaa\x00\x32\x12\xc0\xea\x82\xa6\x8e\xaa\x3a\x9a\x2a\
+\xf8\x1f\xa7\x49\xe9\xda\x13\x24\x35\xd4\x88\x24\xa6\x8a\xa0\xc3\
+\x23\xab\xb3\x4b\xc0\x6d\xd5\x27\xc1\x2b\xc9\xd6\xfe\x6d\x1c\x72\
+\x45\x4e\x64\x01\x96\x37\xb9\x4b\x18\xc1\xee\x60\xe1\x95\xee\xab\
+\xc1\x1d\xbb\xa7\xc1\x3d\x26\x96\x17\xf5\x7d\x62\x41\x48\x29\x8d\
+\xa3\x9d\xe9\xa7\x5d\xda\x95\x69\x2d\xf0\xd2\x6e\x9f\x1c\xa7\x72\
+\x5d\xc1\x16\xf6\x2c\x0b\x3a\xdb\xa8\xf4\xbe\xa7\x43\x49\x49\x45\
+\x4b\x42\x9d\x4d\x29\xe1\x93\x7a\x4a\x37\xd9\xac\x74\xc2\xa3\x26\
+\x32\x2b\x6c\xda\x54\x5b\x46\xa8\x4e\x0a\x98\xa9\x1d\x2b\xed\x8d\
+\x45\x5e\x12\x74\x8e\x99\x1d\x75\x1c\x50\xb7\x6d\x47\xab\xa6\xda\
+\x74\x9f\x82\xe4\x22\xd4\xc8\xcc\xa9\x24\x47\x82\x2f\xa4\x99\x69\
+\x63\x8f\xa8\xb4\x19\x53\xf5\x18\xef\xea\x61\xab\x9a\x22\xdb\xaa\
+\x5a\xf8\xdd\x82\x6e\xa5\xb1\x99\x72\x88\x8c\x5c\x8d\x4b\xfa\x6d\
+\xa7\xfb\x2f\xd5\xe9\x6b\x1a\x93\xa8\x56\xd3\x29\x92\x89\xa5\x79\
+\x77\x05\x47\xa7\x3b\x82\x25\xad\x81\x85\x45\x87\x28\x06\x19\x5d\
+\x58\x32\x75\xae\x95\x59\x49\xf6\x83\xa2\x7c\x6d\x8a\xbe\x9e\x73\
+\xa8\x14\xd1\xca\x63\x0f\x53\x4a\x6c\xea\x2c\x54\xf6\x83\xdd\xcf\
+\x8d\x57\xf5\x38\xe6\xb8\xa3\xa1\xad\x93\xe5\xb5\xda\xa2\x9c\x53\
+\x41\x4d\xf5\x49\x04\xb2\x58\x8b\x5d\x4c\x6c\xde\xd6\xd5\x28\xde\
+\x75\xad\xa8\x8c\xcd\x3d\x19\x47\xdd\x8e\x27\xc1\xa0\x9e\xa1\xde\
+\xf6\x9a\xab\xb8\xca\x87\xba\x0e\x5a\x4d\xc7\x98\x11\xd6\x60\x3c\
+\x6d\x3d\x24\xce\x87\x3c\xd7\x7b\xfe\x29\x3b\x61\x05\xc0\xdb\x88\
+\x64\xcc\x3b\xcb\x63\xc6\x9e\x92\x64\xa8\x91\x9a\x9e\xbf\xf4\x82\
+\xc7\x4e\x36\xde\x9e\xae\x16\xa5\xf9\x90\x93\x73\x14\x8f\x7e\x1c\
+\xdc\x9c\x05\xed\x69\x9e\x2a\x43\x52\xb5\x4b\x93\xa8\xdd\x78\xe9\
+\x92\x22\xf2\xcf\x31\xe7\x91\xde\x52\x24\xb8\x91\xbe\x17\xc3\xb4\
+\x83\x16\xa3\x98\xc9\x51\x51\x89\xaa\x05\x0b\x24\x30\xa3\x07\x1f\
+\x08\x02\xdf\xac\x53\x37\xa8\xa7\x9a\x29\x02\x62\x96\x7e\x7c\x34\
+\xd1\x89\x00\xa7\x6a\x2a\x09\x62\x7b\x9b\x17\x7a\x64\x56\x51\x6f\
+\x72\xd6\xf9\x42\x73\xf3\x36\x37\xd0\xad\xa9\x66\xa4\xa6\x9b\x70\
+\xc0\x5e\x10\x6a\x3a\x83\x06\x54\x58\xba\x6d\x2a\xb0\x7a\x9c\xbe\
+\x5f\x52\x64\x5a\x54\x7f\xed\xcb\x81\x13\x45\xd2\x2b\xa4\x58\x21\
+\x2b\x24\x30\x55\x93\x17\xea\x95\xd5\xb8\x24\x70\xcf\x8a\xfc\x48\
+\xb8\x58\x6a\x1c\x96\x5a\x53\x23\x36\xe3\x95\x03\x5d\x2f\xa0\x55\
+\x47\x4f\x41\x37\x4d\xea\xa8\x2a\x23\xc3\x28\x66\xa5\x96\xd1\x0a\
+\x37\x6b\x8b\xc3\x5f\x03\x39\x8e\x44\x54\x36\x6b\xa4\x81\xed\xae\
+\x9f\xd7\x3a\x79\x1d\x3a\x0a\x0d\xb8\x3d\x62\x9d\xb9\x7a\x70\x35\
+\x35\x29\x27\xac\x66\xdc\xde\x48\x26\x2b\x4f\x3c\xca\xb1\xa6\xc9\
+\xa7\x62\x83\x96\x6f\x45\xd7\x24\x14\x15\xd4\xb8\x45\xbd\x0a\x6e\
+\x43\xd5\xe9\xe4\x49\x2a\x29\x0d\x39\x04\x8d\xc3\x2c\x6a\x67\x04\
+\xb6\xd5\xe2\xc8\x92\x6f\xae\x9f\x23\x08\xaa\x62\xa3\x54\xa2\x99\
+\x84\x9f\x22\x45\x22\x5d\xc7\x37\x46\x30\x2a\x46\x54\xf3\x94\xa1\
+\x43\x02\xba\xeb\x75\x35\x1b\x5b\x51\x4b\x25\x1d\x4e\x28\xb1\xc5\
+\x2c\x52\x53\xc5\x47\x34\xd8\x6e\x7c\xd2\x28\x92\xa3\x36\x66\x67\
+\x78\xcd\xbc\x85\xd7\x5a\xa6\xac\x97\x7d\x50\xca\xca\x86\xa2\x58\
+\x4c\x74\xb2\x54\x34\x74\xff\x00\x1a\x11\x19\x47\x4a\x85\x56\x95\
+\xe3\xfe\xd2\xaa\x46\x4c\x12\x2b\x6a\x70\x94\x9d\xd3\x41\xba\xdb\
+\xaf\xcd\x2d\x38\xb7\xaa\x5d\xc7\x76\x3f\xb6\x88\x36\x38\x19\x67\
+\xf8\x6e\x64\xf3\x7a\x4a\x4e\xb3\xd4\xaa\xa9\x62\xfb\x5b\xd6\x16\
+\x8a\x7a\xf5\xa6\x15\xb5\x50\x43\x2d\x96\x94\xca\x89\x2c\x72\x47\
+\x47\x4b\x57\x14\x4c\x63\x51\x7d\xa6\x88\xe5\x98\xcc\xf4\x5e\x98\
+\xd5\x0b\x51\x24\xff\x00\x69\x6a\xba\x62\xd8\x5e\x49\x17\xa5\xd4\
+\x55\xab\xb8\x39\x37\x0f\x3c\x66\x60\xc1\xac\xd1\xc9\x89\xf9\xaf\
+\xae\xa9\x46\xb5\x02\x0a\x88\xab\xa9\xab\x29\xe5\xaa\x8f\xd3\xcd\
+\x49\x57\x47\x34\xad\x23\x09\x14\x49\x94\x72\xc7\xf0\x59\x49\x40\
+\xc8\xf8\xfb\xea\x79\xaa\x63\x58\xea\x8f\x48\x32\xaa\x47\xfa\xc5\
+\x25\x47\x54\xea\x11\xa4\x72\xac\x33\xdf\x16\x8e\x2a\x38\xa4\x9a\
+\x36\x57\x64\x18\xe3\xf3\x6b\xf4\xe7\xda\x44\x43\xd1\x3a\x35\x27\
+\xaa\xea\xae\x22\x72\xd3\x9a\xba\xa1\x4d\xd2\xba\x73\x18\x5f\x70\
+\x0a\xa6\x9e\x5c\xb6\x40\x94\x46\xd2\x32\x9e\x35\x5f\xd6\xfa\x55\
+\x08\xe8\xdf\x67\xfa\x47\xd9\xaa\x5a\x0e\xa9\x0c\x94\xa3\xa7\xc4\
+\xbe\xa2\xa2\x3e\xa5\x40\x91\x6d\xee\x6f\x54\xc9\x46\x1a\x32\x1d\
+\x9e\x66\x76\x46\x91\xe3\x63\xb6\x7a\xc7\x52\x6e\x8d\x3d\x1d\x1a\
+\x2a\xc7\xd2\xe6\x90\xe6\xb3\x2c\x93\xa9\x10\xd6\x46\x44\x49\xf0\
+\xa0\x1b\x91\xec\x03\x77\xde\x49\x01\x2e\x8d\x14\x54\x6d\x25\x42\
+\x8e\xa1\x4d\x51\x3d\x45\x38\x5a\x7a\xd8\x7a\xc0\xe9\xdd\x2a\xa2\
+\xb2\x33\x57\x0d\x55\xca\xd4\xc2\xa6\x48\xa5\x31\x3c\x72\xd6\x50\
+\xc6\xac\xaa\x65\xa7\x02\x4a\xaa\xae\xa7\xd0\x47\x48\xe9\xdd\x0f\
+\xec\xe4\x3d\x51\xba\x14\x71\xc7\x49\xfa\x4b\xed\x77\x52\x39\xa9\
+\xac\xa7\x48\xa1\x8a\xa4\x43\xd3\xe9\x23\xde\x57\x45\x2c\x98\x59\
+\x3b\x4e\x52\xc8\x62\x86\x86\x21\x94\x01\x60\x5f\x43\x15\x2c\xb3\
+\x2a\x97\x8c\x44\xa6\xc9\x5b\x51\x04\x89\x13\x12\x63\xc1\x0b\x30\
+\xb3\xb0\xd7\x4f\xfb\x4d\xd4\x7a\xa9\x81\x7a\x60\x8e\x6e\x97\xd3\
+\x42\xc9\xff\x00\x95\xa4\x2d\x9d\x3d\x0d\x20\x88\x4a\x88\xf2\x0b\
+\x4f\xd4\x26\x05\x66\xa9\xcb\x2a\x89\x2e\xab\xa6\xe8\x55\xf2\xc9\
+\x45\xf6\x86\x15\x7f\xd1\x3f\x6d\x7a\x34\x38\xd3\x54\xd5\xd2\xf3\
+\x1d\x0f\x54\x75\xbb\x8a\x8a\xa5\xec\x23\xe2\x41\x22\x64\xc9\x24\
+\x0e\x44\x46\x3a\x7e\xa7\xd1\x13\xad\xc1\xd4\xe6\x86\x48\x20\x11\
+\xad\x46\xcd\x4c\xe3\x66\x69\xe3\x56\x68\xc3\x61\x3c\x0a\x27\x8f\
+\x21\xb2\x8d\xb9\x7b\x2b\x65\xd5\x28\x69\x69\x56\x99\x68\xe0\xe9\
+\x5d\x5f\xa5\x53\x28\x11\xad\x3c\x94\xf3\xd4\x09\x12\x18\x96\xe8\
+\x5e\x64\x43\xba\xa9\x24\xc5\xf8\x04\xa2\xdf\x5d\x02\xaa\x39\xa3\
+\x76\x9d\xda\x9d\xf6\x71\x29\xbf\x2b\x2d\x45\x34\x32\x7f\x68\x5a\
+\x08\xe6\x12\x4e\x11\xd6\x24\x58\xe4\x0a\xaa\xf6\x22\xa6\xbe\x7a\
+\xb1\x32\xc1\x15\x47\x48\xa2\x97\x0b\x67\xf1\x12\x5e\xa5\x54\xbd\
+\xcc\xf9\x4a\xea\x94\x50\xb5\xca\xaf\xa5\x96\x30\xbe\x58\xf5\xf6\
+\x43\x73\x5f\xd1\xe8\x3a\x5d\x3b\x8b\xe5\x14\xfd\x42\x2a\xe8\xa1\
+\x8f\x16\x5b\x9b\x9b\xaf\x04\x37\x71\xe7\x5d\x57\xa4\x46\xe2\x43\
+\x0d\x75\x67\x4a\x8b\x1b\xd9\x62\x85\xd1\xa2\x94\x9b\x3e\x60\x86\
+\xe2\x38\xc0\xb8\x42\x38\xf3\xa1\xd7\x1e\x75\x31\x22\xcb\xea\x23\
+\x96\x92\xad\xee\x91\x84\x08\xd4\x63\x11\xbc\x5c\xfc\x38\xdc\x0f\
+\x83\x23\x2d\xd6\x4b\x73\x17\xda\x19\x20\x8b\x77\x88\xba\xb7\x49\
+\xac\x8e\x24\x1d\x4e\x8d\x88\x96\x4d\xbd\xef\x8c\xdd\x4a\x84\x39\
+\x94\xc3\xe9\xd6\x4d\xb2\xea\x0d\x96\xea\x3a\xe5\x33\xe7\xf6\x76\
+\x56\xa5\x58\xa9\xa1\xc7\x0a\x0f\x51\x8c\x77\xb3\x33\xb3\x52\xc8\
+\xe6\x32\xeb\xb4\xe6\x15\x66\x67\x66\xb5\xb5\x45\xd4\xba\x3d\x3a\
+\x52\xd5\x55\xf5\x4e\x9e\xf5\xfd\x2e\x9e\x36\xdb\xea\xf2\xae\xed\
+\x54\x8e\xc5\x6f\xb4\x90\xe5\x4e\xc4\x47\x1d\xea\x2a\x67\x8e\x9b\
+\x69\x72\x3a\xa3\xe8\xbd\x1f\xd5\x4c\xdd\x47\xa7\x49\xd5\xa2\xeb\
+\x3d\x6a\xae\x24\xe9\x75\x0a\xed\x34\x95\x35\xb5\x32\x88\x23\x5e\
+\x9b\x45\xd2\xd1\x07\x4e\xa8\x35\x52\x49\x22\xcf\x1b\x54\x6c\x62\
+\x62\x8c\x7d\xa3\xa8\xe9\xa2\x6a\xe8\xe9\xa6\xa5\xe9\x95\xf3\xf4\
+\xd9\x24\xea\x5d\x1e\x0e\xa6\x91\x34\x82\xa6\x8e\x79\xb6\x6a\xeb\
+\x21\xab\x07\xee\xc7\x27\xa6\x5e\xd5\x2d\xb8\x98\xcf\x55\x44\x82\
+\x69\x45\x34\x4b\x2b\xb7\x6c\xcd\xe9\xb7\x5e\x78\x62\xa5\x98\x23\
+\xe7\x21\x8c\x46\xb9\xae\x69\x96\x61\x41\x50\xc1\xe1\xa3\xb2\xc7\
+\x57\x2d\x34\xf1\xc7\x25\x36\xdd\x08\x86\xa9\x04\x86\xa2\x59\x21\
+\x0f\x2c\xb2\xef\xc8\xe8\xdb\x0d\x11\x0b\x18\x53\xd8\x9a\x76\xaa\
+\x79\x7e\xcd\xd5\x24\xd3\x4a\x6a\x2f\x13\x52\xb9\xde\x29\x94\xf3\
+\x2d\xe5\x8e\x9a\xa3\xb1\x8a\xd6\xc6\x1a\xf8\xda\x41\x73\x71\xf6\
+\x8e\xaa\x9d\xba\xe2\xc7\x45\x4f\x04\x3d\x3a\x9b\x23\xd3\x66\xaa\
+\x48\xf9\xa9\xea\xd5\x31\xf6\xaf\x49\x81\x42\x7e\xa9\x4c\x4d\x47\
+\x51\x99\xbd\x3c\xe6\x96\x9d\x65\xdc\xab\xaa\xaf\xac\x8a\xa6\xa1\
+\x44\x69\x3b\x47\x18\x09\x4d\x8c\x6c\xb0\x52\x40\xa1\x52\x3a\x7a\
+\x58\x23\x6c\x20\x86\x1b\xc2\xa0\x0c\xd0\xcf\x69\x87\x4d\xa4\x9d\
+\xe3\xf4\x2c\xc5\x5d\x23\x8f\x12\x37\x22\x92\x32\xcd\xe4\xb0\x19\
+\x6e\x05\x16\x41\x20\x12\x5b\x25\xc8\x74\x8f\xb3\x1d\x76\xa2\x38\
+\xba\xbf\x42\xea\xb4\xc7\xec\xef\x5a\x61\xfa\xcd\x54\x74\xd5\x1e\
+\xa6\x3e\x87\xd6\x26\x36\x33\xc5\x3a\x28\x3d\x37\x31\x2c\xc9\x34\
+\x78\x99\x4c\x47\x11\xd6\x3e\xc6\xf5\x88\x3f\xf0\xea\xe9\xe4\x35\
+\x90\x4d\x99\xc2\x2a\xb8\xb6\x2b\x82\x23\x8e\xe8\xeb\x69\x2a\x23\
+\x94\x5b\x8d\xca\x78\x9e\x3c\x4a\xb6\x5f\x66\xfe\xcd\xf4\xf9\x9a\
+\x54\xe8\xd4\x1f\x6b\xa2\x15\x65\x59\x64\x92\x3e\x97\x50\xfd\x3b\
+\xa6\x97\x37\xba\x45\x2d\x5b\x7c\x39\x9a\xee\x63\xc2\xec\x70\xd5\
+\x55\x4f\x44\xab\x29\xd7\xe9\x2a\xad\x37\x47\x99\x16\x4a\x5e\xad\
+\xd3\x52\x1d\xfa\x9a\x68\x50\x94\x47\xae\xa7\x99\x26\x94\xc4\x19\
+\x67\x9a\x31\xbd\x13\x5a\x2d\xb6\xea\x9d\x61\xd2\x82\x3e\xa7\x51\
+\xd5\x68\xe6\x83\xa6\x7a\x61\x51\x48\x29\xbd\x25\x64\x4f\x51\x79\
+\xef\x9e\xcc\xb2\x26\xd4\x44\xb3\x35\x51\xcc\xa2\xa4\x64\x6b\xa7\
+\xcf\x1b\xcb\xde\xdf\xa1\xba\xad\x4f\x12\xec\xbd\x30\x5c\x27\x96\
+\x3f\xde\x9a\x8c\xc5\xd8\x38\xbc\x2f\x29\x0c\x77\x03\x53\x54\x30\
+\x6d\xe8\x2a\xea\xe8\xaa\xe4\x2e\x5b\x78\x54\xbd\x95\xf7\x8d\xfb\
+\x5a\xb2\x21\x1d\xad\x74\x68\xdb\x9d\xb7\xc4\x75\xaf\xb4\x52\xec\
+\xec\x7d\x9d\xa9\xa6\x5d\xea\x9d\xc9\x1a\x07\xac\x58\x69\x92\xb2\
+\x28\x36\xe4\x69\x0e\xe3\xed\x38\xc4\xaa\x48\x22\x24\x2f\x37\xe8\
+\x48\x99\xc9\x17\x43\xa7\xfb\x43\xd5\x1d\x21\x8d\x8b\x48\x64\xaa\
+\x2f\x19\xa7\x88\x1c\xe4\x7b\x05\x48\xa2\x90\x89\x0b\x58\x34\x9c\
+\x93\xa9\xea\x6a\xe8\x2b\x3a\x70\xea\xdd\x1d\xba\xd4\x50\xd4\x8d\
+\x89\xb6\x55\x06\x0d\x24\x5d\xb6\x61\x53\x11\x59\x23\x70\x59\x99\
+\x2c\xb1\xc8\x92\x83\xa8\xa9\x51\xea\x05\x5f\x4c\xe9\x55\x73\xca\
+\xf2\x55\xda\x91\xba\x45\x14\x14\xb2\x4b\x4d\x15\x17\xc4\x43\x57\
+\xd3\x66\x9b\xd4\x8d\xac\x59\xe8\xaa\x24\x0c\xfb\x91\x90\x7a\x7d\
+\x07\x59\x96\x8e\x96\x0f\xb5\x1d\x5a\x93\xa9\x98\xa1\xa2\xae\xac\
+\x9c\x2d\x18\x09\xd3\x52\x4a\x18\x95\x25\xaa\xe9\xf1\xd4\x32\x19\
+\x24\xa3\x96\xb1\x97\x33\x14\xd4\x8c\xb9\x6a\xaf\xec\x74\xf4\x0d\
+\x57\xd2\x29\x2a\xf7\xaa\xea\x23\x98\xd3\x7f\xf3\x0f\x5e\x92\x58\
+\x6a\x6a\x3a\xa3\xbc\x8a\x95\x08\xd4\xd4\xea\xb0\x52\x41\x34\x0b\
+\x12\x43\x4d\x25\x10\x55\x92\x51\xac\xe9\xe0\x64\xe8\x3d\x02\x5d\
+\xd4\x57\xc6\x48\xc5\x43\xc9\xb9\x0c\x16\x60\x71\x96\x57\x62\xfb\
+\x6c\x4d\xe3\x56\x50\x45\xf5\xd3\x7a\xe0\x65\xdd\x8b\xed\x15\x66\
+\x61\x63\x48\xa4\xd8\xad\xa6\x96\x95\xe4\x84\xc7\x64\x45\x6c\x84\
+\x40\x59\xb6\xda\xc2\x3c\x10\xba\xb4\xd5\x3d\x62\x46\xa5\xe9\xf5\
+\xbd\x4e\xbe\xaf\xa9\x57\xc8\x59\xda\xbe\x6a\x14\x71\x4b\x4a\x18\
+\x5b\xd4\x4f\x4b\x4c\x9f\xaa\xa6\x26\x49\xbe\x2c\xbb\x98\x47\xb7\
+\xa9\x2b\x8c\x75\x1d\x37\xec\xc7\xd9\x8f\x5d\x55\x54\x5b\xaa\x57\
+\xd6\xd6\xf5\x9e\xbd\xd4\xe5\x32\x1a\x63\x14\x72\x20\xea\x0f\x5c\
+\xcb\x4d\x96\xd3\xa8\xa4\xa5\x0a\x91\x08\xcc\x81\x96\x92\x5e\xa3\
+\xd1\xa5\x85\x6b\xaa\x84\xd5\x7d\x22\x9a\xa2\x3c\xe3\x8e\xbd\x9f\
+\xf4\x6c\x32\xcc\x9b\x11\x41\xb6\x1b\xd4\xd4\x11\x83\xc7\x9a\x24\
+\xdb\x93\x77\x1f\xd2\x74\x3d\x41\xfa\x65\x6c\x9d\x5b\xa9\xd2\xfd\
+\x9f\x8f\xa7\xd3\x53\xd0\xf4\xf8\xa0\xe9\xad\x0c\x6f\x48\x90\x4d\
+\x22\x51\xd3\x2b\xd5\xc7\x35\x58\x80\x4e\x26\x92\x44\xda\x12\xfc\
+\x55\x5d\x74\xc8\xba\x85\x3d\xe7\x8e\x5a\xb4\xf5\x1b\x78\xc3\x17\
+\x52\xa9\xe8\xeb\x51\xb7\x02\x44\xe7\x19\xa4\xaa\x6c\x94\xb9\x78\
+\x11\xc0\x0b\x31\x92\xd7\x9a\xb2\x96\x99\x0c\xf2\x74\xba\x2a\x05\
+\x79\xa5\x46\x20\xc1\x1c\x8d\x5c\xf7\x9d\xfb\xa6\x8c\x3a\xc7\x3c\
+\x77\xbc\x0d\x21\xb2\xbb\x14\xb7\x58\xa6\xa7\x0d\x59\xd5\xfa\x55\
+\x54\x54\x9f\x67\x29\x28\x51\x66\x6a\x96\xaa\x4a\xb9\x64\x93\x27\
+\x68\xd0\x52\xc5\x11\x6a\x93\x5a\xd1\x79\xa5\x48\xb3\x22\x40\xa7\
+\xa3\x48\x91\xc7\x01\x8d\xc7\x47\xea\xe0\xc6\xc0\xf4\xea\xda\x38\
+\xe1\xe1\x84\x72\x12\xc2\xb5\xd9\x1d\x6a\x33\xb3\xc8\x1d\x88\x39\
+\xc9\x94\x9d\x2d\xdc\xca\x14\xfd\x98\xad\xbe\xe0\x60\xbe\x89\xba\
+\x85\x49\x7f\x1f\x47\x88\x1f\xa6\xaa\x23\xa8\x65\x8e\x08\xa7\xa8\
+\xad\xac\x79\x0f\xc3\xa7\xa8\xaa\x53\x1a\xae\x57\xbb\x3a\xc3\x76\
+\xb7\x73\x5a\x65\xc4\x67\x6d\x53\xf4\xd8\xfa\x4f\x52\xeb\x72\xd2\
+\xcb\x4d\x51\x53\x78\x97\xa7\xf4\xc5\xa5\xe9\xee\x26\x11\x37\x6c\
+\xf5\x31\xc0\xf1\xc1\x9c\xd2\x18\x69\xf7\x2e\x30\xb3\x95\x3a\xf5\
+\x82\xa8\xd7\x52\xd3\x24\xf5\xe6\xa5\xdd\xf7\xaa\x6b\x7a\xa1\x17\
+\x74\x59\x69\xe2\x0c\x29\xa0\x93\x69\x24\x92\x18\xd4\x45\x54\x5b\
+\xe2\x34\x63\x55\x3d\x2e\x7c\x65\xa7\xaf\xe8\xf5\xb5\x1d\x36\xa8\
+\x3b\x42\x63\x85\x51\x25\xac\xa5\x85\x4b\x23\x98\x69\x25\x68\x26\
+\x8e\xa4\x15\x92\x7a\x71\x32\x46\xc1\x93\x9a\x6e\xbf\x5d\x51\xb9\
+\xd5\xa7\x8e\x08\xfa\x54\xb7\x0b\x1d\x32\xde\x5d\xec\x43\x62\xf2\
+\xd5\x4a\x23\xdc\x99\x8e\xe3\xca\xdb\x54\xeb\x8e\x56\xd7\x5b\xa2\
+\xa4\xa8\x5e\x93\x5d\xd0\x7d\x1f\x51\xa8\xa7\xf8\xd2\x56\x4b\xf6\
+\x56\xaa\x44\xf5\x94\xd5\x71\xa4\x22\xaf\x61\xaa\xf0\xad\x8e\x90\
+\x76\x34\xb1\xa2\x16\x2c\xf9\x6a\xaa\x0f\x57\xd4\xba\x35\x3f\xac\
+\xdb\x9e\x43\x08\xe9\x75\xfd\x68\xe0\x5e\x39\x27\xdf\x33\x4b\x41\
+\x02\x03\xb3\x10\xa1\x29\x34\x90\xc5\x8c\xb5\x01\x8e\x84\x5d\x2e\
+\x9e\x9d\xeb\x17\x39\x9d\xe9\xde\x48\xe4\xdd\xde\x8e\xc6\x7c\xb2\
+\x33\x47\x0b\xb3\x4e\xd3\x55\xc9\x2c\xad\xb7\x6d\xd3\xe0\xd0\x4d\
+\x5b\x46\x95\xaa\x2a\x2a\x3a\x3d\x6c\x6b\x1d\x34\xc2\x0a\xc6\x78\
+\xa7\xa0\x4f\xd6\x39\x76\x9c\x55\x6d\x00\xb2\xa7\x72\x92\xa3\x8c\
+\x4c\x26\xff\x00\xa2\x3a\xbe\x13\x56\x41\xd3\xaa\xa4\x8c\xaa\xbd\
+\x4c\x3b\x70\xd4\xd4\x74\x5a\x99\x99\x1b\x62\x44\xe2\x96\x39\x97\
+\x6e\x52\x85\xf7\x43\x61\xaa\x6f\xb5\xbf\x64\xdf\xa9\x54\xf4\xe8\
+\x29\x5a\x86\xb8\x52\x3f\xac\xf8\xb4\x32\xbc\x73\x4d\x5b\xd1\xe5\
+\xcb\x75\x2a\x42\xa9\x92\x68\xe3\x67\xe3\xe2\x4b\xc1\x7d\x6c\xfd\
+\xa5\xe9\x2f\xd0\xfa\x90\xe0\xf5\x8f\xb3\xa9\x78\xf2\x66\xee\xf5\
+\x9d\x1a\x77\xbc\x77\x93\xe7\x29\x25\xd6\xf9\x0e\x06\x3a\xa4\xaf\
+\xa4\xea\xf4\x5d\x57\xa4\x99\x31\xa5\xeb\x9d\x3a\x46\x30\x53\xd5\
+\x76\xbd\x2c\x1d\x66\x9c\x2f\xad\xa0\x8a\xb2\xcf\x4a\x66\x68\x36\
+\x22\xa9\x78\xa3\x79\x59\x58\x9d\x74\xaa\xc9\xa9\xbd\x5d\x35\x77\
+\xa3\x1d\x4a\x29\x00\x5a\x91\x51\x45\x54\x21\x82\xb2\x96\x6e\xff\
+\x00\x49\xd4\xe9\xa4\x7d\xc8\x76\xce\xdb\x8c\x52\xa2\x33\x14\xcd\
+\x6f\xb1\xdf\x6e\x69\x9c\x54\xd6\x9e\x95\x2d\x3d\x7b\x46\x93\x24\
+\x35\x7d\x3f\xa6\xd6\x57\x27\x4e\xea\x0a\x5a\x32\xcb\x2d\x45\x0a\
+\xc6\x6a\x29\xea\x1b\x7b\x0d\x93\x1f\x6a\xb3\xb7\x51\x91\x11\x71\
+\xa7\xa0\xa5\x8a\x39\x46\x59\x0a\x59\xea\xde\xae\x79\xa3\x8f\x02\
+\xd2\xc7\x1a\x34\x55\x52\xfb\x60\x0b\x37\x03\x5f\x6b\xba\x67\x6a\
+\x4a\xb5\x75\xbd\x61\x2a\x40\x63\x2a\x7a\x09\xab\xa9\xe8\x91\x4a\
+\xbf\xc0\x44\xc1\x4e\xe4\x32\x09\x9f\x32\xdb\xab\x1a\x98\xb5\x4f\
+\x57\x3d\x3d\xea\xaa\x4c\x51\xc1\x34\x97\x20\x44\xb0\x51\x54\xce\
+\x57\xee\x96\x91\xf3\xde\x95\x42\xba\x61\x29\xcd\x63\xdc\x07\xa8\
+\x7d\x98\xeb\x14\x47\xa7\x55\xf5\x35\x69\xfa\x7b\xee\x3c\x31\x54\
+\x49\x4d\x2b\xd5\xd0\xb3\x33\x33\xab\xbc\x90\x34\x91\x6e\xc4\xff\
+\x00\x12\x15\x8e\x36\x4f\x9c\xb5\x3f\xd9\xfa\x4b\xcd\x34\x94\xf2\
+\xd5\xd6\x4c\xa6\xf0\xa4\x1b\x6e\xf3\x54\x48\x17\xba\xe9\xd4\x36\
+\x52\x39\x14\xa8\x11\x6f\x66\xb9\x1d\xe4\xe9\xf3\x53\x04\xdc\xea\
+\x31\x4f\x59\x59\xbe\xe6\x58\xeb\x26\xfd\x22\x95\x82\x92\x44\x4b\
+\x1b\x3b\x53\xd3\x42\x42\x48\xf9\x4c\x19\x14\xc4\xaf\xdb\x5b\x5d\
+\x1c\x94\xf4\xfb\x95\xb5\x31\xd3\x3a\x53\x46\x68\xe0\x92\x76\x69\
+\x38\xa7\xa9\x2e\xa6\x35\xb3\x8d\xb9\xf7\x00\x0a\xc7\x92\x06\xba\
+\x1f\x59\xfb\x57\xd3\x8f\x5d\xa5\xac\x97\xa8\x52\xd6\x46\xcb\x1c\
+\x73\xaf\xaf\x86\x9c\xf4\xb6\x76\x45\x53\x11\x8a\x4a\x48\x24\x8d\
+\x43\x8e\x2a\xa4\x82\x2c\x4b\xf1\x51\xf6\x7f\xa3\xaa\xc9\x57\xd4\
+\xea\xe9\xfa\x7d\x53\x43\x12\x6f\xd2\xf4\xe8\x67\x93\xd6\x42\xb5\
+\x05\x53\x69\x31\x29\x35\x5b\x42\x55\xdf\x60\x09\x25\x62\x35\xd1\
+\x8d\x1a\x43\x7e\x90\xd4\x54\xcb\xbf\x9d\x5c\x29\x4d\xea\xb7\xf3\
+\x39\xe1\x26\xfd\x64\x71\x4a\x27\x92\x2c\x76\xe4\x14\xe7\x18\xdc\
+\x90\x9d\x6a\xa6\x05\x68\xe4\xa3\xea\x1e\x8a\xae\xaf\xd1\x6c\xc5\
+\xb5\x11\xd8\xa4\x12\x48\x02\x0a\xdd\xcc\xcb\x45\x29\x22\x74\x4c\
+\xad\x36\x20\x01\x04\x54\xd4\xb3\x50\x25\x6f\x52\xab\x96\x65\x76\
+\x13\x52\x75\x49\x54\xfa\x38\xcc\x73\x10\x0c\x29\x43\x24\x91\x3c\
+\x26\x7b\xab\xdd\x94\x54\xb1\xb5\xa9\xfa\x43\xac\x74\xfe\x96\x1a\
+\x8a\xd9\x44\xa8\x97\x85\xe0\xf8\xe4\x2c\x98\xac\xad\x25\x53\x48\
+\xb6\xca\x43\x8a\x15\x62\x88\x66\x88\x6a\x2a\x57\xaa\xea\x14\xf4\
+\xf4\x95\x15\xfb\x34\xf4\x6d\xb4\xd4\xd1\x34\x12\x75\x0a\x8a\xb7\
+\x99\x02\xc7\x1b\xc9\x75\xa7\x8a\x42\x9f\xb3\x3e\x9f\x95\x92\x40\
+\xcd\x47\xd5\x68\x45\x74\xc1\x67\x93\xa7\x75\x09\x68\x18\xd3\xf5\
+\xa9\xa2\x68\xe1\x35\xb4\x92\xcb\x34\x5e\x9f\xa9\x52\x66\x77\xe4\
+\x83\x72\x09\x6c\xf7\x86\x28\x7b\xa2\xa7\xae\xa9\xad\x68\xaa\x6a\
+\xe0\x6a\x8f\xd1\xd3\x45\x04\x94\x7d\x44\xd4\xe1\x11\x92\x96\xba\
+\x17\x6b\x9f\x4d\x26\x2d\x4d\x3a\x05\x99\x7f\x65\x2a\xbc\x27\x3e\
+\x87\x23\xcb\x51\x4f\x6e\xaf\x5f\xf1\xa1\xaa\x8e\x3a\x4a\x0a\xaf\
+\x52\xbd\x5a\x4a\xda\x4a\x52\x44\x19\xc9\x43\x67\x87\x27\xde\x6a\
+\xe8\x43\x41\x2b\x7e\xcc\x56\xf5\x41\x55\x5f\x34\xb4\x6c\x1e\x3a\
+\xa9\xfe\x3d\x44\x30\x34\xce\x6b\x4d\x45\x4c\xae\x36\xba\xbd\x5a\
+\xc8\x20\x8a\x74\x59\x64\xa6\xa4\xdc\x11\x03\x50\x22\x95\x69\x12\
+\x1a\xda\x7a\x78\x3a\x6d\x2a\xf5\x1a\xba\xf9\x67\xc3\xa7\x7e\x90\
+\xaf\x99\xa0\xa0\x4c\xe5\xc6\x28\xd1\xe3\x6b\xd2\x96\x8c\x62\xa4\
+\xda\x32\xf2\x17\x35\x7b\x71\x7a\x4f\xb3\xb4\x3d\x3a\xb7\xa5\x52\
+\xf5\x62\xa2\x39\xe5\xa6\x8e\x28\x31\xad\x4a\xba\xa9\x23\xa6\xf4\
+\xf5\x15\x34\x73\xd1\xd2\x33\x6f\xb9\x55\xb4\x74\xec\xf3\xa6\xba\
+\x97\x4f\xa2\x15\xe7\xf4\xf4\xf4\x6f\x1c\x3d\x36\x11\x55\x57\x49\
+\x2d\x3c\xe5\x26\xac\x68\x5f\x05\xf4\xde\x88\xcd\x93\x30\x07\xb3\
+\x35\x1d\xa3\x55\x75\x90\xc6\xf5\x35\x26\x38\xe9\xbe\x56\x2c\x91\
+\xac\xef\x4b\x9c\x87\x12\x37\x2a\x25\x22\x9a\x18\x17\x92\xc7\x86\
+\xef\x52\x28\x13\xac\xbd\x4f\xad\xab\x4a\xea\xea\xb8\x4b\x29\x54\
+\x8e\x92\x16\x91\xeb\xab\x8a\x94\x58\x52\xc9\xe9\x23\x53\x33\xbe\
+\x54\xf7\x68\xb1\x6d\x74\xca\x9a\xc5\x96\x77\xea\xfd\x33\xed\x25\
+\x6c\x34\x51\xb0\x15\x1e\xab\xa9\xcf\x41\x49\xd2\x12\xb2\x43\xb4\
+\xca\x22\x85\x2e\x49\xce\x3b\x55\x5a\x38\x73\x1a\xea\x14\xdf\x68\
+\xaa\xff\x00\x4a\xf5\xca\xd5\x8a\x6a\x9e\x93\xd2\x25\x5e\xa3\x34\
+\x95\xf3\x63\x1c\x1d\x2e\x75\xa3\x86\x49\xa1\xa5\xe9\xf0\x82\x25\
+\x8a\x9f\x99\x24\x92\x08\x1a\x7a\x66\x0c\xda\xe8\x75\x06\x8f\xaa\
+\x41\x5f\x25\x0f\xa7\x9e\x9f\xa8\x53\xd1\x25\x64\x35\x35\x9d\x4d\
+\x66\x89\x56\x86\x9e\x57\xa7\x8a\x81\x22\x48\x82\x44\x66\xdd\x5a\
+\x67\x68\xe4\x6d\xe6\xc7\x51\x4f\x07\x58\x1d\x3e\x43\x5d\x55\x4b\
+\x13\xd2\xac\x6f\x57\xd2\xaa\xa3\x41\x24\x8b\x00\x74\x14\xbe\x8a\
+\xaa\x4b\xbc\x33\xd3\xb7\xa8\xa7\x8c\x02\x6f\x98\x65\x14\xbd\x46\
+\xb0\xc7\x55\xd7\xfa\x64\xb1\x55\x51\x52\xd5\x43\x35\x00\x97\xa8\
+\xc6\xc2\xaa\x56\x76\x1e\xa2\x6a\xea\x56\x51\x2e\x4d\x51\x2c\xa5\
+\xdc\x2a\xba\x80\x75\xd4\x68\xbe\xd2\x52\xd6\x4f\x69\xab\xa9\xa0\
+\xa9\xea\x34\x4e\x18\xc9\x4d\x23\x6d\xed\xb6\xce\x11\x24\x91\xa3\
+\x49\xf0\xa4\xef\x90\x91\x23\x1c\xae\x27\xae\x8e\xf0\xcb\x53\x4f\
+\x35\x33\xb1\xce\x21\x2d\x1c\xad\x86\xcc\xea\x2f\x10\xbb\xc9\x8c\
+\x2e\x9f\x2b\x60\x64\xed\x0c\x75\xd7\xfa\x35\x37\x77\x52\x96\x86\
+\x6e\xb9\xd2\xe9\xa3\x8e\x3a\x84\xa1\xea\xbd\x22\x99\xaa\xd5\x53\
+\x74\xda\xa7\xa9\xcd\x4a\xd5\xd2\xc3\x10\x05\x20\xf4\x2a\x81\xe7\
+\x9c\x48\x22\xa6\xad\x69\xa5\xeb\x15\x18\x44\xe9\xea\x9b\x29\x4a\
+\x4f\x27\x6d\x6d\x5c\xd2\x2e\xf2\x98\x19\xce\xfd\x34\x24\x32\xca\
+\x63\x70\xc9\xb6\x2d\x4f\x4d\xd0\x6a\x24\x8e\x21\x23\x6e\xee\xa4\
+\x73\x51\x3b\x24\xf2\xa1\x8a\x77\x66\x86\xae\x12\xc9\x75\x59\x69\
+\xdc\x2a\xdb\x7a\x48\xa7\x1d\x87\xd0\xff\x00\xf1\x23\xec\xb2\x7d\
+\x98\xeb\xab\x2c\x90\xb7\xda\x1a\x25\x29\x01\xa8\x8e\x52\x97\x9e\
+\xba\x08\xb7\x44\x7d\x8f\xf0\xfa\xad\x1d\x6c\x12\x2f\x26\xa2\x24\
+\x7d\xd4\xab\xfb\x4b\xf6\x47\xa8\xd2\xd1\xf5\x00\xf1\xc6\xd3\x74\
+\x3a\xa8\x22\xa0\xad\x55\x8d\x02\x4e\x28\xa1\xff\x00\xc3\xa6\xa4\
+\x9e\x05\xc6\x4f\x45\x54\x63\x57\x25\xe4\x82\xf7\x07\xae\xf5\x1a\
+\x38\x26\x8f\xab\x7d\x92\xaa\x7e\xa9\x3f\x4a\x2c\x97\x7e\x8d\xf0\
+\x7f\x49\x94\x36\xbc\xb2\xf4\xca\x9f\x8b\x39\xc3\xba\x9d\xf3\xee\
+\x58\xf5\xd2\xe4\xe9\x86\xd1\xcd\x4a\xd2\x75\xda\x7a\x99\x8c\xd4\
+\xb5\xbf\xa3\xfa\x74\x86\x43\x48\xbc\xfa\x6a\xa3\x46\x98\x14\xbf\
+\x64\xab\x88\x53\x15\x42\xc4\xbd\x17\xa9\xd2\xd7\xd7\x51\x50\x75\
+\x3e\x95\x53\xfa\x32\xaa\x91\x84\x72\x2a\xf4\xe9\x8c\x32\x2b\xa5\
+\x42\x38\x7c\xa9\x0a\xe6\x0c\x2c\x93\x40\x36\xcc\x60\x31\x3a\xfb\
+\x43\x0f\x5a\x2e\xde\x97\xec\xf7\x56\xe9\x34\x55\x50\x53\xc7\x14\
+\x0e\xeb\x59\xfa\x72\xa5\x67\xd8\x54\xbd\x42\x8e\xa0\xb1\x87\x7e\
+\xe5\x8d\xf0\xe4\x6b\xa5\xae\x4e\xd5\x89\x4b\xcc\x12\x44\x50\xd3\
+\x35\x4e\xf4\x73\xd8\x5f\xbe\x31\x0c\x98\x96\x04\x5f\x3b\x10\x47\
+\x1a\xe8\x73\x54\x6d\xc5\x5b\xd1\xaa\x69\x96\x96\xb6\x68\xff\x00\
+\x60\xe1\x91\x69\x2a\x83\x26\x27\x15\x64\xa9\xa3\x95\x6f\xb6\xee\
+\x8b\xda\xa1\xec\x7e\xd1\xf5\x1a\x4a\x49\xa5\xa1\x7e\xa0\xd4\x4d\
+\x2d\x3a\xb6\xcd\x0f\x4f\xaf\x9a\xa2\x83\x72\x42\x58\x84\x82\xad\
+\xe6\x11\x6c\x9b\xae\xe4\xc9\x60\xbc\x6b\xa0\xee\xca\x3d\x6f\x49\
+\x49\xe3\xa8\x82\x0a\x70\xa2\x9a\x8d\x25\x5a\x75\x99\x88\x7c\x7d\
+\x44\xd5\x41\x0f\x60\x52\xb2\x4a\xee\x7b\x3b\x07\x52\x91\xe4\x86\
+\x28\x5b\xaa\x52\xc9\x3a\x4f\x4e\x24\xa8\x9a\x8a\x39\x67\x31\x53\
+\x53\x48\xce\x45\x3b\xb5\x56\xd6\x53\x48\xb2\x64\x0b\x21\xf9\xb5\
+\x4b\x3f\x52\x86\x8c\x56\xf5\x2a\xf5\xdf\xa5\x48\xc0\xf4\x88\xbd\
+\x45\x53\xa7\xf1\xf0\xef\x59\x0e\x2d\x2c\x90\x04\x3e\x9e\xd1\xb0\
+\x99\xf8\x5d\x75\x59\x69\x5d\xdf\x18\x6a\xa1\x45\xda\xf5\x52\x4b\
+\x4b\x0c\xde\xb6\xa6\x38\x53\x03\x52\xd5\x12\x56\x2d\x3c\x20\xc7\
+\xfb\x77\x95\x62\x2c\x90\x19\x35\x41\x55\x5c\x24\x8f\xae\xd3\x4b\
+\x35\x7f\x5b\xa7\xa8\x9e\x39\x1d\xba\x77\x52\xa8\xbc\xc8\x81\x4b\
+\x6c\x4b\x43\x2c\x11\xd5\xfc\xef\xf1\x52\xaa\x3c\x6d\x52\x6d\x4d\
+\xd4\xc7\x51\xac\xa8\x8f\xac\xd4\x52\xc7\x27\x4f\x7b\xed\xcc\xf0\
+\x49\x37\xa7\xa8\x55\x7f\x9b\x28\xe3\xd9\xfa\x19\x4b\xb7\x08\xea\
+\x10\xf4\xb9\xf3\x0b\x41\x43\x3d\x14\x11\xc8\x05\xde\x92\x2a\xb8\
+\x2b\x95\xa4\xee\x93\x34\x07\x38\xd1\x03\x10\xcf\x15\x88\x53\x67\
+\x45\x96\x25\x77\xe8\x13\xed\x6e\xb4\xc4\x7a\x53\x1c\x55\x48\xd9\
+\x41\xd4\x83\xb3\xbd\x75\x32\xcb\x17\xe9\x2a\x69\x98\x19\xaf\x04\
+\x67\x1d\xa8\x5a\x38\xa2\xa3\x98\xc5\x37\x52\xa2\x14\x33\x7d\xeb\
+\xc9\xea\xe1\xf4\xe2\x45\x0a\x48\xdc\x8d\x88\x2d\x66\x45\x31\x2f\
+\xc5\x16\xd3\x50\x50\xcf\xb1\x14\x53\x3a\x56\x56\x46\xc8\x2a\x65\
+\xa8\x7d\xc3\x34\x14\x52\x54\xac\xd1\x44\x64\xc5\xb6\xd6\x10\x77\
+\x71\xda\x90\x10\xe7\x55\x1d\x19\x69\x69\x22\xea\xd2\x67\x3d\x77\
+\x4f\xaf\x69\x17\xec\xef\xda\x45\xcd\x91\x3a\xe5\x04\x6c\x20\xfd\
+\x15\x5e\xb1\xb4\x71\x56\xd3\xd0\x63\x24\x53\x7a\x97\x0b\xe8\xc8\
+\x73\x4b\x04\x12\x4b\xd6\xbf\x49\xd4\xc9\x07\xaa\x8e\x28\x29\x9e\
+\x9a\xbe\xbb\xa2\xd2\xa5\x4c\x94\xd4\xf4\x12\x18\xe4\x84\x64\xbb\
+\x55\x2d\x24\x51\xd1\xa8\xa9\xf8\x31\xab\xca\x74\xa9\x28\x4b\x15\
+\x8a\x9a\x64\x58\x20\x9e\x96\x6a\x58\xa2\x2e\x95\x92\xcf\x14\x99\
+\x4d\x5b\x2d\x49\x45\x7e\xed\xd3\x2b\x87\x82\x7b\x85\x88\xf5\x2e\
+\x9d\x16\x4b\x04\xf0\xd1\xd3\xd6\xd1\xd7\xb9\xd9\x9e\x08\x9d\x63\
+\x83\x6b\xa8\x42\x86\x57\xa8\xa5\x8b\x35\x84\x24\x4d\x55\x04\xc3\
+\x19\x63\x94\x78\x45\x91\xba\x95\x6c\x35\x10\x26\xd8\xa2\x5a\x76\
+\xaa\xa7\x58\x69\xf6\x21\xa7\xf5\x2a\xed\xfa\x32\x89\x23\x60\x65\
+\x8c\x53\x4d\xd4\xea\xc8\x21\xe5\xa7\x59\x64\x4d\x7d\x95\xaa\xea\
+\x09\xd3\xaf\x5a\xdd\x5e\x8f\xa8\x51\x6e\xbc\x66\x01\x47\x35\x2f\
+\x4f\x8a\x4a\xa9\x56\x48\x62\x86\x55\x9a\x51\x57\x35\x5c\x95\x52\
+\x60\x77\x19\xd5\x7f\x61\xae\xa2\xf4\x7d\x37\xa5\xac\x14\x03\xa7\
+\xd1\xd1\xd7\xa8\xab\xea\x80\xd2\x50\x4f\x59\x1d\x33\x53\x8a\xb9\
+\xe9\xe1\x87\xd5\x24\x2b\x53\x35\x51\x05\x2d\x1a\x4b\x15\x42\x9f\
+\x9a\x01\x5d\xd3\x0d\x6c\x95\xd4\xb2\xa5\x1d\x35\x66\x3e\x9c\x74\
+\xd9\xf6\xcc\x12\x1a\x5a\x65\x96\xbe\xa6\xbe\xb4\xc5\x24\x8f\x14\
+\x44\xcf\x24\x35\x22\x25\x8d\x81\x79\x74\x89\x27\x4d\xa4\xa0\xf5\
+\x30\xc2\x69\xa3\x11\x49\xfa\x48\x15\x95\x25\x8a\x3d\x98\x04\x8d\
+\x0c\x77\x40\x95\x34\xb1\xbb\xb3\x73\x4f\x2c\x74\xee\xdb\x3a\xab\
+\xeb\xdd\x6a\xb2\x97\xa1\x35\x54\xad\x2e\xcb\xd3\xc5\x43\x59\x57\
+\xd6\xe6\x68\xde\xa0\xd5\xa4\x6b\x15\x74\xdb\x72\x30\x95\xa9\xcb\
+\x49\x2c\xeb\x22\x53\xc7\x02\x2a\xc9\x7f\xb2\xf4\x3d\x62\x7a\x2a\
+\xa7\xa6\xac\xe9\x95\x7d\x60\xd4\xac\x72\xcb\x97\x53\x91\x87\x4c\
+\x69\x63\x26\x55\xa4\xaa\xa8\x92\x7a\x78\x3a\x75\x2f\x35\x62\x9c\
+\x66\x1b\xe0\x49\x38\xdb\xea\x11\xd3\xcf\xd6\x0d\x77\x56\xa9\xeb\
+\x09\x1a\xc7\x4b\x14\x34\x5d\x3a\xa1\xbd\x17\xc2\x81\xdb\xe2\x47\
+\x89\x85\x65\xc9\x4c\xf1\xac\xf9\xa9\x11\xa8\x14\x74\xb5\x73\x25\
+\x1f\xa9\xa8\x58\xba\x7c\xe2\x78\xfd\x4d\x2d\x61\x9c\x0a\x66\xa1\
+\x5c\x9a\x79\x51\x9e\x64\x46\x87\x07\x32\xa1\x28\xcd\x89\x24\x55\
+\xf4\xa9\x3e\xcd\x35\x47\xda\x4a\x8e\xa7\x22\x45\x17\xd9\xfa\x9e\
+\xad\x47\x0b\x74\xa6\x48\x56\x6e\xa9\x57\x3c\xbd\x45\xa9\x3d\x44\
+\x75\x55\x4a\xf5\x69\x0d\x26\xd2\xc1\xdc\xcd\x1b\x2c\xb1\x09\xe9\
+\x1b\xa7\xcf\x45\x55\x45\x33\x43\x53\x05\x4c\xcf\xd4\xeb\x63\x57\
+\x76\x85\xa2\x46\xa5\xa6\x86\x1a\x3d\xc2\xad\x1a\xcc\x6b\x4e\xea\
+\xb1\x70\x50\x02\x35\x44\xde\x84\xc5\xf6\xa3\xa5\x08\xba\x84\xbd\
+\x20\xc4\x16\xb1\x28\x15\x67\x10\xc8\x97\xec\x34\x53\x34\x67\x7d\
+\x17\x39\x3a\x7b\x32\xd1\xc9\xb6\x2a\xa3\xd7\x53\xab\xe8\x8d\x32\
+\x43\x4c\xcb\x53\x0c\xb2\x0a\x09\x29\xe0\x8a\xae\x64\xa9\x78\xf6\
+\x64\xa4\x46\x48\xec\xb3\x43\x21\xb4\xcd\x16\xcd\xfc\xd8\xea\xb6\
+\x9a\x15\x13\xc9\x24\xeb\x2c\x90\xe2\x86\x46\x81\xa0\x8f\x6e\x7b\
+\xdd\xa0\xa7\x8a\x17\x31\x45\x23\x96\x09\x23\x3a\xed\xac\xb6\x99\
+\x4c\x1d\x72\x87\xec\xc9\xea\x3d\x51\x27\xc1\xfa\x65\x22\xbd\x45\
+\x4c\x90\xb2\x08\x64\x7a\x79\x0c\xa2\x05\x36\x5d\xdf\x54\xd0\x48\
+\x63\xc5\x8a\x18\xfe\x65\x23\xec\xd5\x4b\x53\xd6\x1a\x78\xba\x88\
+\xe9\x82\x85\xa7\x8a\x8e\x78\xd6\x47\xaa\xe8\x9d\x40\x4d\xea\x7f\
+\x48\xcb\x5b\x01\x92\x4d\xda\x72\xb5\x79\x20\x31\x4b\x16\x22\xdd\
+\x4b\xaf\x75\x18\x29\xfa\x3f\x50\x7a\xba\x71\x51\x49\x32\x4c\xb4\
+\xb3\x34\xf4\xcf\x4b\xd4\x68\xd8\x4c\x4c\x90\xd3\xf5\x08\xb7\xd6\
+\x38\xaa\x99\xd3\xc4\x6c\xd2\x48\x54\xeb\xaf\x7d\xa2\xe8\x35\xc2\
+\xa3\xa3\x75\x69\xfa\x6f\x5f\xa4\xe9\x9e\x8e\x2a\x95\xe9\x68\xa0\
+\xd2\x54\x41\x9c\xdb\xb1\x48\xc5\xe5\x87\x98\xd1\x41\x8d\x14\xca\
+\x1f\x1d\x3c\x55\x10\xd3\x75\x0a\xb4\xfb\x6c\x6a\x29\xa1\xa8\xa6\
+\x89\xf0\xa1\xad\xf4\xb9\xa4\x55\x08\x8a\xd4\x91\x47\x38\x4a\x73\
+\x04\x25\x56\x58\xa6\xc3\x13\x83\x96\xeb\x0d\x4d\x53\x24\xf2\x75\
+\x6f\xb4\x53\xd6\x55\x53\x92\x31\x8c\x2e\xd5\x0d\x74\x94\xae\x30\
+\x73\x0c\x8f\x4a\xbb\xd1\xb4\x5c\x47\xb6\x72\xb2\x9c\xab\xe9\xa8\
+\x7d\x3c\xb5\x6b\x4f\x4f\x5c\x82\x79\x1a\x39\x4d\x3b\xce\x1e\xd4\
+\xb2\x3c\x96\x69\x24\x50\xa8\xd1\xf0\x87\xc2\xaa\x9d\x75\xde\x99\
+\xd3\x45\x7b\xfa\x18\x9a\x96\xa6\x2a\xbb\x03\x4b\x57\x57\xdc\xd4\
+\x91\x90\x3e\x31\xa1\xac\x81\xf6\x67\x58\xf1\x76\x95\x4d\xbb\x5f\
+\x38\xe2\x9a\xae\x9e\x0a\xa7\x33\x4f\x59\x4f\x0d\xe5\x92\xa8\xcd\
+\x1e\xcd\x35\x3d\x4a\x11\x61\x1f\xa8\xda\x78\x73\xc9\xa3\x9d\xb7\
+\x10\xe4\x12\xcb\x14\x26\x29\x2a\x6a\xab\x31\x66\xa6\x56\xdb\x14\
+\xf2\xbb\x54\xbd\x22\xf6\xdf\xe0\x7c\xd2\xbc\xcb\xf3\x0e\x1b\xdb\
+\x55\xc9\x4f\x0c\x46\x5a\xa4\x96\x91\xb7\xa0\x8d\xcb\x85\xda\xa8\
+\x0f\x4f\x96\xe2\x37\xa2\x90\xbb\x4e\x4a\x8e\xd5\x16\xb1\x06\xe9\
+\x15\x4a\xd3\x54\xf5\x37\xea\x11\xc5\xd2\x2b\xd9\x1f\x79\x2a\x32\
+\x50\x25\x57\xcc\xb4\x91\xc6\xbb\x92\x59\xbb\x6e\xe1\x8f\xca\xa5\
+\x5b\xa5\x7d\x8e\xa4\x5a\x6a\x5a\x9a\x59\x3a\x3c\xdd\x4d\xd0\x9e\
+\xa1\xbd\x3c\x71\x67\x55\x1d\x5a\x24\x8d\x49\x14\x52\x46\xf3\x3b\
+\x8b\x5d\x33\x0d\x70\x78\x7a\x3f\xd2\xd4\x94\xdb\x33\x40\x6b\x6a\
+\xab\x66\x25\x2b\x92\x89\xd9\xe9\xfa\x6d\x3b\x22\x4a\xc3\x7c\x62\
+\xa6\x69\x07\xc4\x32\x13\x28\x6b\xe9\x2b\xe2\x6c\x68\x3a\x3d\x62\
+\xf4\xea\x1d\x96\xc4\xd3\xd4\xd1\xcd\x95\x61\x78\xe2\x0e\x13\x27\
+\x99\xba\x65\x22\xd4\xac\x3b\xde\x9d\xa6\x05\xb2\x0a\x7a\xdd\x6f\
+\x4e\xea\x48\x7a\x8d\x05\x35\x70\xae\xa0\xea\x10\xde\x16\xc6\x36\
+\x2e\x29\x98\xb5\xc4\x2b\x72\xf1\xd5\x46\x7e\x0d\x63\x0d\xd0\xf1\
+\xdd\x74\x7a\x13\x46\x1b\xd3\x4d\x4d\x5f\xd6\x07\x56\x55\xa5\xf4\
+\x35\x58\x8a\x9a\xca\xae\x9d\x4e\xa2\x24\xca\xae\x28\xe0\xa1\x8d\
+\x71\x74\x9e\x9e\xd3\xc8\xae\x55\x8b\x74\x7a\x9a\x32\xb4\xcf\x4a\
+\xf5\x32\xcf\xd4\x21\x2e\xf2\xd3\xc1\x35\x3d\x3b\x6d\x5d\x1f\x1a\
+\x8a\x5d\xc2\x4a\x40\xa9\x91\x79\x1b\x6d\xd6\xdc\x53\x2f\x56\xe8\
+\xd1\x75\x29\xa6\xeb\x53\x4b\xd3\xba\xbd\x1f\x5b\x9e\x9f\xa6\x19\
+\xe1\xa6\x8e\x7f\x49\x12\xc5\x03\x55\x45\xd4\x68\xcb\x4c\xf5\x14\
+\x35\x02\x09\x1d\x4e\x30\x9a\xc8\x37\x64\x11\x2f\xa5\x65\xea\x11\
+\x75\x2f\x57\xd3\x24\x82\x39\xa3\x1d\x3a\x77\xc7\x77\xa9\xb5\x42\
+\x10\x2a\x3d\x72\x44\xb0\x47\x05\x44\xe2\x29\x54\x49\x40\x36\x1d\
+\x10\x6a\x6a\x48\x05\x15\x25\x5f\x50\xae\xab\xa7\x96\xba\x96\x93\
+\x68\x43\x49\x83\xcf\x2d\x3d\x1d\x26\xeb\x43\x4e\x65\xda\xc3\xd4\
+\xdd\xea\x82\x31\x1b\xac\x38\x30\xf5\x39\x01\x8a\x8e\x7a\x95\xa0\
+\xfd\x19\x4e\x12\x21\x9d\x2c\xb1\xd1\x2d\x6c\xb5\x38\x9d\xda\xb9\
+\x41\xca\xa1\xf6\x23\xdc\x05\x93\xb7\x2c\xc0\xfb\x68\xb5\x7b\x1d\
+\x42\x8d\x3a\xb6\x14\x7b\x28\xdd\x38\x7a\x26\x48\xe0\x11\x41\x19\
+\x81\xe3\x8d\x73\x67\xc1\xa5\x97\x29\x4e\x4e\x58\x76\xeb\xec\xb7\
+\x55\xc6\x0e\xa5\xff\x00\xcc\xff\x00\x65\x47\x53\xea\x5d\x37\xa8\
+\x23\x7e\x88\x3d\x46\x55\x8a\x56\xaa\x5a\x0a\x37\xa4\x43\xc2\x6d\
+\x8a\x69\x5a\x4a\x3b\x1d\xc7\xa7\x79\xc2\xca\x2a\xeb\x64\xa5\xe9\
+\x50\x0a\x9e\xaf\x2f\xaa\x8a\x8e\x87\x61\xa7\x87\xaa\xcc\x93\xcb\
+\x4b\xbe\xd3\x4a\xd1\xd2\xd3\xbd\x34\x5e\x8e\x14\x50\x20\x5c\xad\
+\x79\x30\x91\x0b\x30\x92\xf5\x4b\x0d\x48\x77\x65\x92\x6a\x79\x63\
+\x49\x22\xce\x17\xc1\x53\x2f\x4b\x7a\x64\x67\x89\xb6\x94\xee\x25\
+\xa6\x51\x26\xaa\xa5\xa0\xa5\x44\x96\x92\xa4\xb7\x51\xac\xad\x76\
+\xad\xea\x9d\x5e\x38\xee\x3d\x33\xf5\x05\xf4\xb2\x50\xd3\x4a\x5c\
+\x6f\x47\x42\x91\xe5\x1a\x08\xd5\x92\xe5\xb5\xfa\x4a\x8a\x49\x91\
+\xab\x29\x33\xdb\x92\x56\x97\x67\x73\x37\x65\x49\x4d\x9f\x6e\xe4\
+\x90\xab\x87\x75\x9d\xcb\xb0\xbe\xa3\xae\x0b\x06\x5b\x94\xd5\xaf\
+\xbf\x4f\x05\x7c\xfb\xf3\xc5\x51\x13\xed\x56\xf5\x08\xea\xaa\xa9\
+\xd7\x29\x1a\x4c\x63\x92\xd7\xe3\xd9\x6c\xf2\x47\x4d\xb5\x35\x3c\
+\x94\x33\x1a\x88\xe4\x8c\xd4\x4f\x3d\x0c\x10\xad\x1c\xf3\x49\x51\
+\x4d\x51\x93\xd2\x24\x31\x47\x48\x31\xda\xa3\x0a\x5a\x92\x38\x65\
+\x92\x59\x1f\xaa\x46\xd2\xd7\x3c\x5d\x49\x28\xab\xf6\x0d\x7d\x4a\
+\xd3\xd2\x9e\xa5\x0c\x53\xd4\xc5\x04\x31\x34\x68\x53\x75\xde\x48\
+\xc4\xa1\xd5\x1d\xd8\x84\xe6\xda\x86\x59\xe3\xf5\x13\x74\xad\x85\
+\xa6\x7a\x92\xb3\x0c\xb2\xa5\xdb\x92\x48\xcc\x61\x18\xc2\xd2\x09\
+\x10\x58\x02\xf1\x47\xb9\x9a\x66\x8f\x1f\x51\x86\x4b\x56\x74\x7e\
+\xb9\xd3\xe5\xa4\x98\x5d\x1d\x52\x7a\x7d\x87\xa7\xcd\x58\x48\x69\
+\xc8\xbc\x86\x37\x79\x01\x91\xa4\xbd\xd5\xd9\x75\x5b\xd4\xde\x5a\
+\xaa\x7e\xa5\x2f\x42\xaf\xa9\x15\x30\x54\x48\x88\xd5\x34\xb0\x1a\
+\xba\x69\xab\x20\x8c\xc6\xbd\x40\xd3\x4d\xb8\xf4\xcb\x39\xb4\x52\
+\x49\x9f\x76\x0a\x35\x47\xff\x00\xc4\xee\xa5\x5b\x5f\x55\xd5\xe8\
+\xfa\x35\x67\x47\x5a\x40\xf1\x43\x49\x20\xea\x42\xa4\xd7\x54\xc8\
+\xcb\x09\x9a\xee\x88\xc9\x04\x48\xc8\x90\x34\x8d\x2f\xc5\x6c\x6d\
+\xea\xbf\x46\x53\xd0\xd2\x35\x5d\x15\x3d\x35\x1d\x34\x95\x0d\x35\
+\x3b\x6c\x2d\x44\xb5\x0d\x5b\x34\xae\xd2\xcd\x2c\xfd\xe0\xa4\x30\
+\x2c\x77\xb2\xaf\xbe\xba\xbc\x14\x7d\x62\xbe\x88\xd3\xf5\x89\xeb\
+\x6a\x7d\x30\xa4\x58\x3a\x8b\x88\xd9\xa9\xc5\x55\x39\xa6\x6b\xfa\
+\x5e\xfd\xa2\x24\xfe\xda\x5b\x8b\x10\x17\xab\xbc\x93\x56\x54\xa2\
+\xf4\x4d\xea\xa8\x6a\x66\xa6\x92\x2a\xed\xd8\xa0\x94\xc1\x3a\x9a\
+\x2e\xda\x62\x67\xc5\xe2\x87\x6f\x38\xc1\x5c\xc6\x57\x02\xb6\x1a\
+\x4a\x7a\x79\x50\xf4\xe4\xa3\x14\xbb\xb4\xf1\xd0\x41\x1c\x54\xaf\
+\x1c\x14\xb1\xac\x98\x2c\x71\xee\xb8\x40\x41\x2b\x7c\xaf\x98\x0d\
+\xaa\x4e\x9e\xed\x5d\x07\xad\xa4\xeb\x7d\x3a\x79\xab\x6a\x29\x7a\
+\xb7\x6f\x4b\x51\x51\x4f\x24\x6b\x27\x4f\xa5\x7f\xda\x02\x5b\x76\
+\x69\xa5\x19\x1d\xb9\x93\x5d\x47\xec\xe0\x93\x3a\x46\xe9\x56\x0c\
+\x14\x21\x8a\x44\xa6\x86\x49\x0c\x2a\x77\x30\x86\x42\xb7\x10\x97\
+\x76\x47\x39\x6f\x38\xec\x33\xf4\xfd\xa8\xde\x1f\xd1\xab\xd4\xbb\
+\x81\xb8\xad\xa4\xfb\x44\xa9\x15\x42\xe2\x56\xd2\xa4\x72\x48\xa8\
+\x49\x2a\x0b\x06\x74\x93\x05\x1a\xea\x5d\x69\x16\x48\x6a\x26\xea\
+\x32\xc4\xa8\x25\xcd\x63\xdd\xa2\xe9\xf2\xce\x4b\x3a\x64\xe2\x66\
+\x96\x42\x57\xb4\x02\x41\xf6\x37\xa6\x96\x19\x72\x5a\x8a\x8a\x7a\
+\x09\xa1\x70\x0a\x35\x35\x63\xbc\x66\x35\xfd\xcd\x9e\x1a\x12\xb6\
+\x2a\x54\x5c\x9d\x56\x18\xe9\xe2\xff\x00\xc4\x3f\x44\xcb\x3f\x04\
+\x02\xd7\xaf\x9a\x53\x8a\xb0\x1f\xac\xc9\x4f\x13\xcc\x6c\x3b\x97\
+\xe1\xed\xab\x32\xb4\x23\x7a\x4c\x44\x74\xd2\x95\xcb\xf6\x8c\x0e\
+\x4b\x99\xf2\xd8\x3a\x2b\xa7\x37\x0e\x2f\x7d\x57\xc9\x2d\x3c\x35\
+\x4d\x8f\x51\x82\x2d\xdd\xd5\xda\x35\x70\xc7\x79\x6f\x1c\xaa\xf2\
+\x3c\x45\x72\x8b\x37\x2a\x09\x39\x06\x1d\xba\xea\x2a\x4e\xd8\x87\
+\x3e\x8b\x06\x21\x71\x89\x2a\x60\x2f\x57\x56\x16\xd6\x35\x73\xad\
+\xd0\xb9\xec\x5b\x86\xc0\xdb\x9a\x6e\x99\x14\x31\xb4\x53\x53\xe3\
+\x1b\xca\x5d\xde\x95\xce\x79\x4b\x4f\x66\x4c\x1c\xaa\x04\xe7\x2e\
+\xdd\x02\xb3\xcf\x8c\x51\x21\x11\x09\x9e\x38\x8b\xc8\xaf\x93\xc8\
+\x91\x95\x12\x90\x45\xd3\x77\x30\xa7\x93\x96\xa4\xe9\xfb\x74\x22\
+\x39\xba\x84\x24\xcf\x25\x14\x55\x15\x69\x34\xf5\x30\x50\x47\x2c\
+\x53\xcd\x7d\xaf\x4a\x25\x13\x44\x91\x2a\x03\x24\x60\x3e\x48\x58\
+\x1a\xee\x87\xbd\x32\xd2\xc0\x3a\x84\x93\xc8\x24\xf8\xf5\xef\xd2\
+\xe7\x96\x99\x65\xab\x65\x55\x47\x9a\x73\x16\xfb\xc9\xb7\x64\x91\
+\x9f\x69\x17\xb7\x14\x1d\x3e\xa2\x2a\x3a\x48\xa9\xa3\xab\x6a\x44\
+\xa7\x46\x13\xfa\xe6\xfd\x1f\x53\x04\xf3\xb9\x33\xb4\x33\x43\x50\
+\xe6\x55\x0e\x15\x9b\x90\xaa\xd6\x61\xd3\x3a\x9c\xa9\x27\xa9\xa8\
+\xa1\xe9\x74\x13\x59\x97\x6e\x45\xa7\xa7\x6c\x26\x70\x50\xb3\x4d\
+\xb7\xf0\xae\x5e\xd8\xdb\x8f\x62\xf4\x15\x90\xb7\xa4\xa3\xe8\xdf\
+\x69\x27\xa6\x86\x19\xa4\x88\x47\x27\x4c\x8a\x4f\x42\xd9\x5d\x9d\
+\xb6\x3c\xad\xcd\x89\xf9\xf2\x5e\xdd\x2d\x64\x65\xe3\x32\x24\x5b\
+\xf1\x5e\xf1\xcf\xb4\xe8\x13\x30\xbb\x7c\xc6\x1d\xb6\x59\x6c\xf4\
+\xed\x67\x85\x91\xc5\xf5\xd3\xe8\x7a\x84\xb2\x55\x53\x4f\xd7\xa8\
+\x61\x95\x64\x2b\x97\xa6\x28\x77\x61\x85\xb0\xf8\x42\x60\xa8\x58\
+\x59\xe2\xdd\x41\x36\xce\xeb\x4a\xd2\x7f\xff\xc4\x00\x26\x10\x01\
+\x01\x00\x03\x01\x00\x02\x02\x02\x03\x01\x01\x01\x01\x00\x00\x01\
+\x11\x00\x21\x31\x41\x51\x61\x71\x81\x91\xa1\xb1\xc1\xf0\xe1\xd1\
+\xf1\x10\xff\xda\x00\x08\x01\x01\x00\x01\x3f\x21\xad\xc8\x4d\x83\
+\xe3\x7b\xff\x00\xbb\x87\x40\xa5\x9e\x5f\xce\x24\x74\x15\x0e\x71\
+\xf7\x02\x40\x0a\x07\xa4\x9c\x89\x9b\x59\x61\x57\xcd\xfc\xfd\x63\
+\xc9\x1a\x82\xcd\x6b\xfe\x30\x56\x7d\xda\xfe\x4f\xde\x51\x0b\x1a\
+\xa3\xbd\xa3\xf3\xe3\x87\xdf\x10\x3f\x63\xf9\x7f\x18\x85\xb0\xdb\
+\xff\x00\x0c\xda\x4a\xba\xf1\xd0\xdd\xbf\xe7\xa6\x06\xe7\x41\x73\
+\x75\x20\x55\x2b\x70\xa4\x93\xe3\x28\x6a\x6e\x28\xf3\xbf\x9f\xf9\
+\xc9\x21\x14\x53\xb0\xaf\xc7\x83\x31\x25\x92\x84\xfa\x79\xf4\x77\
+\xdc\x9e\x0a\xe9\xf5\x8b\xf3\xf8\xca\xf4\xbc\x7a\xee\xff\x00\xac\
+\x01\x44\x21\xba\x7c\x99\xd0\x7c\x23\x96\xf8\x04\x51\xf7\xe7\x25\
+\x44\x2e\xfb\xfd\x7e\xe6\x7c\x07\x13\x46\xc8\x6e\xab\xae\x91\x30\
+\x5a\x47\xbb\x46\x6f\x53\xdc\x23\x23\x6c\x3c\xc1\xaf\x8e\x97\x58\
+\x03\x0a\x15\x1f\x8d\xfc\xfb\x26\x18\x74\xc5\xb7\xa1\x5e\xe5\xe0\
+\x82\x81\x48\xbc\xe4\xc8\x1c\xe8\x41\x0f\xf3\x81\xa2\xd6\x6a\x5b\
+\xb3\xdc\xf8\x88\xec\x9e\x6f\xfa\xb8\x26\x13\xa0\xfb\x7d\xbf\xde\
+\x00\x34\x2f\xf8\xfe\x3d\xf8\xc1\x3b\x56\x25\x4d\x8f\xfe\x1f\x73\
+\x03\x63\xe4\x7e\x5d\x60\x51\xa9\x77\xb7\x73\xfb\x9e\x60\x59\xbe\
+\x43\xc3\xdc\xdb\xd7\xd8\x7e\x75\xf7\xd9\xee\x24\xc5\x48\xc7\xe7\
+\xfe\x71\x11\xf0\x7c\xfc\xfe\x7f\xe3\x12\xb6\x12\xce\x72\x7f\xdb\
+\xc4\xd6\x40\xa6\xfe\x0f\xc4\xd6\x6b\x22\x03\x7b\x6d\xf8\x7b\xac\
+\x80\x27\xe3\x7d\x7d\xfd\x77\x5c\xcd\xc7\x4f\x92\xfb\xfa\xfb\xc4\
+\xab\x4d\x23\x8f\xff\x00\x44\xd1\x9c\x3f\x0e\xe7\x01\x63\x5f\x4b\
+\xf5\x64\x77\x85\xe0\x52\x7c\x34\x1a\x93\xe7\x5d\xcf\x54\x03\x7e\
+\x52\x32\x4f\x17\x11\xd5\x20\xfa\x2e\xbf\xbd\xe7\x01\xf8\x2f\x1f\
+\x97\xe5\x95\x70\x73\x9f\x1f\x37\xe7\xe7\x7c\xf8\xc8\x08\x6c\x3d\
+\x26\x84\x3f\x29\x70\xdf\x64\x69\xcd\x93\x4e\x6f\xb6\xe7\x2c\x8a\
+\x81\x66\xd3\xfa\xc7\x03\xb0\x2d\xba\xdb\x41\x6f\x7f\xce\x6c\x97\
+\x92\x9f\x0b\xdd\x76\x3f\xbc\x95\x4f\xc9\x95\xfd\x0f\xf7\x8e\x51\
+\x34\x29\x3e\x1b\xdf\xbf\xde\x06\x5d\x52\x6c\x75\xf1\x7c\xef\xeb\
+\x34\x42\x7b\x45\x4f\xc0\x27\xba\xc6\x43\x1f\x11\xd1\xf6\x7e\xfb\
+\xf5\x83\xdd\xef\xed\xaf\xf7\x9a\x47\xe8\x46\x84\x72\x4e\x77\x1b\
+\x48\x6b\x66\xff\x00\x6c\xba\xb2\x84\xba\xff\x00\xee\x12\xf5\x44\
+\x89\xb9\x1f\x7f\x38\xfa\x04\x0e\x4b\xd3\xeb\xe3\xbf\x59\x00\x3f\
+\xfa\xcc\xf4\x16\x9f\x9e\xe4\x71\x1f\xe0\x1d\x61\xd3\x69\xab\x0d\
+\xf1\xe7\x7f\xbb\x9d\xb3\xed\x9c\x0f\xdb\xfc\x4d\xe0\xf1\x0a\xe1\
+\xe0\x6f\xfd\x6f\xea\xe6\x94\x6b\x68\xeb\xe5\x1b\xfc\x66\xce\x90\
+\xd4\x6e\x9b\xfe\xd2\x66\x8f\x51\xb6\x3d\xbf\x9c\x86\xea\x1d\x1f\
+\x8c\xb3\xd8\xbd\x7f\x58\x1b\x76\xb8\x2a\xac\x9f\x8f\xfa\xe5\x9d\
+\xde\x8b\xc7\xf1\x97\x80\x13\x93\xad\xee\xcb\xe5\xe4\xc4\x57\x27\
+\xe8\xa4\xdf\xe7\x9d\xc7\xb6\x14\xfd\x01\xef\xe7\x10\xd0\x43\xdf\
+\x9d\x7b\xf3\x30\x70\xdf\x9f\xd2\xbb\x3f\x8c\x5f\x06\xc5\xd9\x34\
+\x75\x03\xf1\xbc\x5c\x2d\xa0\x5a\x5f\x91\x27\xbc\x93\x11\x56\xc1\
+\xba\xcf\xdf\x9f\x59\xdc\x3a\xba\x29\xf2\xbf\x29\xe4\x93\xb3\x0b\
+\x67\x8f\x7d\xda\xf9\x30\xc0\x46\x2d\xe0\xdf\xfe\x06\x27\xaf\xa2\
+\x7c\x2c\x5f\xc3\x3d\xe6\x7f\x0f\x16\x8d\x7a\xcb\xaf\xcf\x73\x41\
+\x2e\xcf\xd4\xde\x6b\x90\xdf\xcd\xcf\x72\x9d\xb1\xf8\x1f\xa3\xd3\
+\x58\x3f\x93\x9c\x95\x7f\xd6\x43\x36\xe3\xb0\x7e\xbf\xc6\xfb\x82\
+\x15\x4e\x3d\x63\x5f\xe0\xde\x78\x28\xc9\xe9\x3b\x3f\x5f\x38\xec\
+\x91\xad\xa5\xfd\xfc\xe5\x42\x87\xc8\x95\xf3\xe9\x90\x4f\x43\xd2\
+\xbf\xd6\x14\xf4\x93\xa4\xd0\x5e\x77\xfb\xc1\x3d\xcf\xbf\x6c\x67\
+\xeb\x23\xd1\x7a\xfc\x57\xf7\xff\x00\x4c\x4a\xea\x12\x7c\xef\xfc\
+\xfc\xe2\xb3\x83\x0f\x09\xbb\x7e\xb9\xbe\xe2\x77\x6f\xc8\x33\x7f\
+\x01\x8d\xb7\xaa\xeb\xe3\x4f\x3f\x58\x5c\x74\x70\x74\xd4\x9a\x9f\
+\x31\xcd\xd4\xac\xfb\x15\xfa\x4f\xce\xb9\x8b\x35\xb6\x0d\x7f\xa6\
+\x4e\x2f\xcf\xed\xa4\xc1\xad\x70\x40\xdd\x7c\xfe\x3a\xe4\x65\xc5\
+\x3d\x18\xc3\x97\xbc\xdf\x70\x7d\x98\x20\x07\xc5\xab\xdf\xc6\x69\
+\xc4\x29\x3f\x1c\xf3\x3e\xb6\x9a\x67\xc2\x78\x7b\x9b\x8c\xe0\x3a\
+\xf4\xbf\xc1\xbc\x54\x87\x91\xeb\xe9\xfd\xe5\x34\x3a\x03\xcd\x79\
+\xce\x4f\xbc\x04\x2f\x15\xe4\x19\xe6\xb0\xa1\x37\xb6\xfe\xf5\xc8\
+\xf7\x3e\x2f\x9b\xb7\xcd\xfc\xe6\xcc\x00\x1e\xba\x59\xcf\x2e\x77\
+\xca\xe1\x24\x44\xdf\x80\xff\x00\xac\x0d\x02\x57\xf1\x23\xfb\x99\
+\x54\x7c\x04\xb6\x19\xaf\x92\xf1\x7f\x1f\xf1\x85\xb3\x47\xbf\x8d\
+\xea\x4f\x8c\x63\xba\x07\x47\xfc\xfb\xfd\x66\xcf\x51\xad\x3f\x39\
+\xcc\x4d\x26\xdf\xce\x36\xd2\xf8\x9f\x9f\xb7\xde\x7e\xf0\x2d\x2d\
+\x6b\xf0\x3a\xd7\xdf\xf3\x87\x70\x08\x34\xee\x1a\xf9\x62\x02\xd3\
+\x58\x04\x5c\x8f\xd2\x27\x63\x6c\x69\xa3\x1e\x63\xd5\x03\x4a\x29\
+\xe7\xf2\x28\x06\xb2\xdb\x8c\xad\x61\xb4\x29\xcd\xac\x6b\x35\x8a\
+\xe1\x09\x1f\x37\x5f\xe5\xcf\x12\x95\x1a\x6a\x86\xa2\x7c\xe0\x18\
+\x69\x7c\x3c\x53\xfc\x39\x65\xed\x34\x34\xaf\x9f\xfc\x99\x0c\xf2\
+\x08\xfd\xbf\x36\x66\xc7\xb7\x5f\x3f\x7f\xd5\xcd\x57\xa6\x29\xf3\
+\xe7\x6f\xb8\x71\xd1\x23\xd3\x9f\xc5\xf7\x17\x6c\xd9\x06\x52\x1a\
+\x2f\xbc\xfd\xe3\x08\x4b\x0c\xf9\x57\x7f\xf9\x9c\x62\x29\xa2\x82\
+\x4d\x6b\xff\x00\xb9\x59\x03\x46\x2b\xa7\x6e\xbc\xee\x26\x51\x44\
+\x40\x0c\x17\x6e\x79\xf0\x67\x6c\x68\xcf\x23\xfd\xff\x00\xd3\x2a\
+\x84\x7e\xe6\x91\x6c\xd7\x9f\x18\xcc\x19\xff\x00\x7f\xd6\x29\x9a\
+\x34\x14\x75\x86\xce\xef\x9f\xbc\x9c\xd6\xc6\x97\xad\x37\x7f\x16\
+\x7d\xe0\x2d\x23\x88\x3e\xad\x9d\xff\x00\x58\xd2\x4a\xf3\xe5\xbf\
+\x99\x35\xdf\xd6\x69\x43\x8f\xe0\x0f\xf8\xc0\x89\xd4\x8f\xcb\x7f\
+\xd6\x55\x6c\xec\x3b\x64\xd0\x3f\xf5\x06\x9c\x2d\xfb\xca\x90\xd8\
+\x10\x81\x00\xb0\x0e\x68\xa6\xb9\x93\x13\x81\xa2\x48\xc3\x91\xa9\
+\x8e\x2c\x0b\x57\x78\x01\x0d\x2e\x1d\x90\x53\xdf\x2a\x70\x28\x25\
+\x90\xb8\x2d\xdc\x3d\x79\xfa\x7c\xf1\xee\xb2\xc4\x05\x2b\xf4\x79\
+\x80\x17\xf2\x35\xff\x00\xbe\xb2\x8c\x36\xa3\x37\x66\x36\xa6\x87\
+\xd0\xe9\xfe\xb2\x67\xb0\x34\x7a\x5f\xbb\xe6\xf1\x4e\x20\xad\x27\
+\x24\x38\x92\x6e\x77\xa6\xc4\x65\x46\x00\x0a\x75\x5a\x0e\x5e\x2e\
+\xf3\x63\xf0\x10\xd2\xa4\x0a\x9e\xcd\x68\x55\x37\xbe\x28\xe2\x89\
+\x94\x9e\xd6\xe8\x71\x39\xef\xbe\x51\xaa\x3b\xba\xcf\xac\x6b\x5f\
+\xc1\xd9\xe1\xfa\x58\x7e\xf1\x78\x54\x4c\xe3\x60\xce\xad\xfb\xe7\
+\x99\xa3\x33\xa6\xb3\xc7\x7b\xfd\xb0\xcb\xb1\x5e\x2b\x1c\x7e\x7f\
+\x00\x7e\xf0\x0e\x7a\x7e\xea\x0f\xf4\xe7\x39\x6f\x9f\x29\xbc\x74\
+\xac\xf1\x29\x5e\x3a\xe1\x8d\x98\xa9\x79\xe6\xce\x9f\x20\x39\xa0\
+\xde\x9d\x07\x5d\x3f\xc5\x4f\xbc\x21\xd6\x29\xf4\xf9\xdf\xbf\xc6\
+\x38\xf4\x67\xcf\x3f\x39\xc7\xcd\x8e\x2f\xed\x5c\x21\xaa\xe8\x6f\
+\xb9\xf2\xfe\xf5\xf3\x9c\xca\xed\x1b\x89\xbf\xad\x61\x20\xa0\xa1\
+\xff\x00\xeb\x86\x05\x0c\xcd\xd7\x7f\xc7\xf5\x8b\x60\x9a\x0b\x7e\
+\x3f\x26\x1b\xda\xdd\x35\xac\x08\xd7\x35\xb5\xf9\xed\xc1\x41\x09\
+\x17\xa4\xfc\x4f\xd6\x73\xe3\x60\x75\x48\xce\x6f\xa9\xf7\x9e\xe3\
+\x2b\x4d\xdb\xd6\xd0\xc5\x40\x8b\x71\xb8\xde\x5c\xa5\x1b\x40\x8a\
+\xb6\xab\x73\x88\x04\x4c\x92\x1b\x6a\x48\xdc\xd4\xc1\xe4\x32\x80\
+\x1a\x5c\x3a\x1b\xd7\x75\x4a\x4b\x28\x11\x2b\x46\x6c\x49\x59\x83\
+\x7d\x08\x98\x65\xc5\xc4\x5e\x8d\x86\xfd\x73\xce\x45\x3f\x4f\xf9\
+\xf1\x9a\x25\x06\xe2\xcd\xd3\xe7\xef\xf9\xc8\xb1\xb3\x4c\x37\x0d\
+\xeb\x7f\xf1\x8f\xb4\x71\xfe\x1b\x7d\xfc\x6f\x25\xc1\x4c\x19\x10\
+\x8c\x75\xf8\x74\xee\x56\x73\xa8\x4d\xe1\x11\x59\xcb\x27\x9a\xc2\
+\x42\x95\xf0\x84\xa0\xf1\xfe\x00\x4b\x72\x96\x65\xe5\x55\x49\x22\
+\x5b\xd2\x84\x1c\x8b\x5b\x81\x0b\x11\x12\xab\x90\xc2\x4b\x0e\x1d\
+\x10\x38\x85\xeb\x18\x81\x04\x7f\x33\xf9\xa7\x7e\xb0\x66\x6e\x2f\
+\xd0\xff\x00\x4f\xef\x13\x50\xdd\x9d\x43\xf1\x1b\x92\xc7\x16\xbd\
+\xa9\x3f\x8d\xfc\x5f\xbc\x23\x29\x92\xd2\x67\x4a\xbf\xde\x21\x17\
+\x74\x5e\x0d\xb9\xf7\xfb\xfd\x62\xbc\x36\x4c\x58\x34\xf6\x77\xeb\
+\x1f\xbe\xc4\x01\x87\xe4\xdf\x79\x93\xd4\xe4\x76\xd3\xc7\x31\x95\
+\x2f\x52\x3a\xd7\xbc\xfc\xeb\x94\xc7\xc5\x5c\x26\xed\x3b\x37\xf1\
+\xf9\xcd\x3c\xed\x1d\x58\x37\x5b\xfa\xdf\x75\x9a\x5a\x55\xf9\xdb\
+\x5d\xdf\xef\x04\x77\x7d\xfc\xcb\xbf\xeb\x3a\x14\x8b\xf1\xf2\xef\
+\x5e\x7f\xac\x17\x0f\x9c\x7b\x7e\x7f\x58\xe3\x51\xd1\xfd\x8f\xf5\
+\x9b\x5e\x2a\x88\x2e\xbf\xcf\xb8\xce\xbc\x03\x6d\x3e\xc8\x4c\x01\
+\x48\x37\xd0\x29\xad\x77\xb9\x57\xab\xb0\xc6\xa3\x18\xdf\x77\x93\
+\x34\xd6\xe8\x53\x2c\x2e\x5c\x3a\xc1\x75\x26\x08\x7a\xd4\xa4\xe8\
+\xa8\x5c\xdf\xd1\xb9\x45\xcc\x05\x49\x53\x71\x84\x82\x31\xa2\x82\
+\xc9\x8f\x0f\x33\xb5\xd5\x92\xe3\x1a\xd2\xce\x05\x43\x4e\x07\x33\
+\xd8\x36\x12\xa6\xd3\x68\x94\xe0\x11\x1b\x6a\x9a\x51\xe0\x8f\xbf\
+\x3f\xd6\x6e\x09\x0b\x65\x6b\xf0\xdc\xb9\x01\x8a\x4b\xd8\x68\xff\
+\x00\x3f\x57\x16\x18\x4d\x4d\x4f\xd5\x47\xb8\x5f\x9d\x16\x20\x02\
+\xfe\x75\xf0\xcb\x79\x90\x51\xac\x10\x0b\x54\xc0\x49\xaa\xb0\x8c\
+\x18\x4a\x66\x93\xf1\x44\x97\x5c\xe8\x47\x65\x8d\x9a\xa5\x63\x6b\
+\x61\xce\xd4\xb1\xb9\x5d\x18\x00\xb3\xf7\x11\x2b\x89\xf4\x35\x22\
+\x63\xa1\xba\x39\x89\xc8\x15\x2a\xef\x25\x0e\x06\x9f\x47\xdf\xc7\
+\xd7\x32\x84\x3f\xdc\xc6\x57\xc7\x5f\x8f\x9f\x7e\x3f\xbc\x2f\xaa\
+\xba\xeb\x4b\xaf\x3f\xac\x28\x21\x42\xf5\xa6\xdf\x7e\xb5\xf7\x3f\
+\x18\xc1\xfb\xd3\xbd\x46\x6f\xfb\xfc\x63\x5e\x97\xdf\x9f\xe7\xeb\
+\x5f\x78\xc0\xec\xb6\x81\x50\xde\xa0\xff\x00\x78\x21\x34\x4b\x3a\
+\xfc\xfb\x88\x35\xf9\x54\x8a\xae\x3e\x3d\x5c\xe8\x14\x22\x93\xf9\
+\x0f\x5e\xf7\x0e\x2a\xf4\x58\x67\x8d\x87\xf1\x89\x1f\x9e\x9f\xcf\
+\xf5\x84\x2b\x68\xd7\xd1\xc3\x1b\x54\xd1\xff\x00\xbf\x79\x24\x8c\
+\xb0\xe9\xca\x7e\xd3\x8e\x5e\x63\xfd\xc0\x0b\x47\xc3\xf4\xf1\xf6\
+\x2e\xcc\xf6\xe5\xd0\x26\xdd\x75\x75\xef\xaf\xde\x50\x08\xf9\xf3\
+\xfd\x7f\x58\xe5\x0d\x47\x58\x6c\xb5\x0d\x5e\x14\x24\xa2\xd0\x56\
+\x21\xcb\x85\x54\xaa\x88\x89\x2b\x05\x20\x4e\xe8\xd1\x33\xd7\x81\
+\x70\x58\x6b\x57\x88\x92\xd7\xc8\x90\x98\x2f\xcf\xe6\x5d\x06\x21\
+\x19\xb1\xb1\x74\x18\x8f\xd0\x56\x6a\x03\x86\x0f\xa1\x68\x25\x8e\
+\x46\x59\x28\x7a\xbe\xc5\x31\xd4\x56\xd0\xb4\x03\x54\x26\xde\x98\
+\xe0\xd0\xcd\xb4\x3f\x63\x00\x9d\xab\x35\x22\xe7\xc9\x60\xec\x5f\
+\xfc\xfd\xe0\xd5\x02\xfd\xad\xa7\xb7\xcc\xf9\x72\x5e\x21\x75\x7b\
+\xaf\x13\x2d\xe7\xb4\x06\xea\xa8\x60\xf9\xd4\xb7\x78\x49\xa6\xca\
+\x3d\x83\x28\x20\x55\x6d\x8c\x8c\x63\x67\x35\x98\x14\xd9\xd1\xd0\
+\x9c\x8b\x75\x48\x8d\x9b\x19\xe5\xbc\x1c\x81\x00\xe0\x39\xb5\x16\
+\x0e\xa3\xf3\x66\x42\x2b\x7c\x62\x87\x47\xa4\x59\x38\xe4\x46\x48\
+\xe1\xa2\xb3\xbc\xfc\xf3\x3a\x16\x1c\x6e\x95\xbb\xf8\xc4\xf5\x23\
+\xfa\xca\xd0\x37\x08\xb6\x3a\x5d\xef\x6f\x93\x20\x41\x28\x3f\x07\
+\x43\xb0\x5a\x7c\x4d\xfc\x66\xe1\x02\xbf\xf7\xf1\x70\x57\x23\x4f\
+\x7e\x1e\xef\x2a\x0c\x01\xdf\xc9\xc6\xe4\xdf\xc7\x31\x21\x8f\x80\
+\xd5\x26\xed\xcf\x02\x69\xdf\x89\xb7\xc1\xcb\xf1\x9d\xa6\xe7\xf7\
+\x57\xb8\x27\x9b\x9d\x4e\x7f\x3f\xde\x1b\x11\xff\x00\x73\xb8\xd6\
+\x9b\xac\xf9\x7e\xff\x00\xef\xde\x34\xec\xbd\xb7\xbf\xcf\x3f\xeb\
+\x81\xa4\x0f\x23\xe0\x6e\xfc\xa6\x54\x15\xa5\x7f\x0f\xb5\xfc\x65\
+\x84\xd0\x1f\x62\xbb\xfb\xbf\x8f\xc6\x52\x54\x01\xfb\x4b\xfd\x62\
+\x9c\xd2\xa4\x22\xad\x10\x90\x16\xbf\xc9\xe5\x78\x43\x19\x25\x7d\
+\xc9\x1a\x46\x97\x6b\xbe\x50\x1e\xe5\xb3\x08\x53\x0e\x11\x16\xb1\
+\x17\x05\x04\x41\x60\x38\x8a\xac\xdd\x89\x92\xd0\x7e\x5b\x14\x88\
+\xa7\x06\xee\x8c\x4f\xd2\xed\xa5\x18\xd8\x83\x09\x2d\x4c\xf2\x43\
+\x4c\xa0\x7c\xcf\x75\x11\xe8\x8b\x00\x69\xa1\xdf\xeb\x93\xb8\x58\
+\x00\x7f\x01\x75\xdf\xb7\xc7\x46\xef\x28\xee\x1b\xb7\x13\x8d\xf4\
+\xf7\x1d\x4d\x58\x52\xac\xf5\x3c\xee\x32\x6a\x0f\xaf\xb3\x96\xb9\
+\x35\xaa\x88\x46\xb2\xe9\x30\x31\xc6\x8c\x09\x82\x31\x57\x14\x8a\
+\xc2\x34\x20\xd1\xc4\x30\x41\xb0\x99\x9a\x43\x38\x04\x94\x47\x20\
+\x26\xd3\x69\xa6\x4f\x10\x2b\x87\xe1\x3b\x22\x8b\xf6\xe4\x4b\x93\
+\x2b\x35\xe8\x40\x5e\xb5\xe4\xe0\x48\x35\x88\xb2\x62\x94\xf8\x68\
+\x79\xda\xef\x15\x21\x76\x23\xd7\x5a\x93\x1c\x6e\x3b\x7d\x5f\x1f\
+\x96\x18\x40\x1a\x43\xab\xd3\xe6\xd7\xfc\x30\x90\x72\x92\x93\xd0\
+\xd0\x1b\xb3\x9f\xde\x4e\x78\x72\x75\xf6\xfe\x0d\xf9\xf7\xf1\x8e\
+\xdc\xd3\xda\x14\xc1\xf0\x08\x30\xee\xbe\x4e\xd3\xdf\xbc\x78\x03\
+\xd7\x09\xf8\x5b\xf7\xdc\xe9\x81\x13\x4f\xb4\x2d\x6b\xad\x7c\xe0\
+\xcc\x34\x2d\xd9\xe1\x3c\xff\x00\xae\x04\x5c\xf4\xce\x93\x5d\xec\
+\xf7\x07\x45\x89\x14\xf4\xfc\xfc\x63\x27\xac\x50\xf8\xb4\xfd\xbc\
+\xfd\xf3\x0c\x1a\x18\x45\x43\x7e\x72\xfd\xb8\x44\x9d\x85\xbd\x53\
+\x7c\xef\x9f\x38\x57\x41\x3f\xae\x1f\x38\xea\x9a\xd9\x0d\x9a\xfb\
+\x3e\x37\xf9\xdf\xd6\x1a\x02\x22\x51\xc3\xba\xd7\x75\xff\x00\x99\
+\xd4\x69\x1a\x02\x85\x6a\x80\x92\xfb\xcc\x74\xfd\x6d\x18\x04\x99\
+\x98\x50\x31\x30\xa9\xaa\xe3\x1f\x15\x12\xc2\xb0\x14\xd1\x29\x01\
+\x59\x13\xc6\xa5\x8c\xcc\x55\xd0\x90\x06\xf5\x31\x0d\x97\x76\x51\
+\x83\xbc\x0a\x90\xb6\x5a\x12\xa7\x68\x1b\x09\x22\xa6\x94\x4a\x1a\
+\x03\x5e\x02\x00\x48\x18\x84\xb6\x8d\xdd\x8e\xf2\x4c\x9c\x0c\xb8\
+\x68\xb6\x52\x34\xa4\x6c\x96\xd9\x25\x98\xbd\x71\x18\xf0\x3e\x33\
+\x61\x34\xb5\xe0\x22\xc9\x1e\x7d\xb8\xe7\x88\x94\x8f\xc3\x5e\x9d\
+\x82\x24\xc8\x9d\x87\x21\x4d\x8d\xe9\x09\x55\xd1\x01\x89\x99\xce\
+\x56\x0f\x24\x50\xd0\x1c\x59\x19\x6a\x6b\x7b\xb1\x4a\x75\x7c\x00\
+\x74\xab\xd6\xbe\x7c\x3c\x26\xbe\x1b\xad\xd0\x95\x5d\xd6\xa1\x65\
+\x42\x38\x54\xc7\x82\x86\x67\x3d\x65\x7e\xe1\x13\x5a\xaf\xb4\xf9\
+\x5f\xd7\x32\x98\x83\xc0\xc9\x1f\x11\xbf\xbc\x44\x32\x27\xc5\xaf\
+\xe5\xd9\x9e\x64\x5b\x66\xda\x7c\x0f\x8c\x8b\x61\xad\x78\x97\x47\
+\xfe\x26\x45\x0c\xba\xf1\x74\x9f\x88\xb8\x03\x52\x03\xfb\x39\xe6\
+\x1b\xac\xc8\xbe\x1f\xfd\xe6\x0d\x0f\xad\xf9\xd3\x50\x9b\x26\xf2\
+\xf0\xfe\xc5\x7f\x62\x3a\x72\xfb\x82\xc6\xce\x59\x3f\x49\x70\x02\
+\x91\xed\xf7\xe6\xbc\xff\x00\x06\x1a\x92\x1a\x37\x95\x61\x76\x32\
+\xa7\xc6\x53\xba\xa0\x1e\xb0\x2d\xcb\x3d\xbf\x79\xe7\x36\x6b\xb6\
+\x7e\x15\x80\x69\xf6\x66\xd4\x85\xb5\xf1\xf1\xf2\xff\x00\x96\x57\
+\x4e\xc4\xbe\x04\x89\xf7\x63\xf1\x31\x83\x5c\xdf\x9d\xeb\x57\xe6\
+\xe4\x88\x2a\x80\x1d\x25\xa3\xef\xeb\x05\x47\xb8\xd0\x7f\xa5\x4c\
+\x37\xb0\x2d\x37\xe6\x1d\xa4\x75\x36\x90\xf1\xba\x50\xbe\xae\xde\
+\x81\x61\xa7\xd3\x72\x6f\x9c\x28\x94\xca\x4a\x39\x1e\x00\x02\x68\
+\x57\x10\xf5\x21\xb0\x89\x07\x15\xcf\x8b\xcf\x0e\xe0\xc7\x62\x6f\
+\xa6\xba\x8e\x37\x27\xb7\xa9\xa8\x35\x29\x0a\x6c\xec\x97\x0e\x6a\
+\x1a\x14\x68\xe4\x19\x7a\x50\x4d\x21\x58\xcb\xe9\x81\x73\x29\xcb\
+\x66\xf7\x82\x52\x35\x40\x61\xb8\xdd\x63\xb5\xee\x2b\x33\x52\x2d\
+\xf2\x7d\x73\xa7\xd9\x8e\x51\x06\x2c\x4a\xbe\x9d\x2e\xed\x8d\x61\
+\xa9\x15\x06\xef\x01\xad\xa8\x75\x0a\x3a\x68\xea\x97\x84\x09\x19\
+\x0a\x11\x7a\x4d\xf3\x9d\x77\x32\x52\x84\xf5\x6d\x98\xd0\xa1\xc5\
+\x62\xf1\x5f\xd3\x2c\x1b\x9c\x05\xf0\x84\x96\x8c\xbd\xc1\xd8\xd1\
+\x2c\xa2\x5d\xba\x59\xdb\x5a\xf9\x42\x48\x28\xdf\x50\x49\x79\xbd\
+\x62\x3a\x68\x0e\xed\x6b\x53\x1c\x2a\xb9\x2d\x7e\x4f\xff\x00\x59\
+\x32\x50\x40\xd1\x4e\x77\xef\xff\x00\x31\x51\x65\xba\xd7\x4d\x9b\
+\xba\xef\x5e\x62\xb2\x12\x2f\xa9\xf9\x70\x0f\x73\x1f\xbe\xef\xdf\
+\x8b\xe6\x2b\x51\x52\x6c\x46\xb9\x27\xfc\x63\xc5\x81\x7b\x9a\xa0\
+\x8b\xad\x2f\xb8\x5c\x38\x36\xa4\xb5\x17\xd4\xd6\x1d\x09\xca\xd1\
+\xee\xfd\x9e\xb3\x63\x68\x51\xf7\x1b\xa1\x5d\x59\xbe\xef\x99\xf3\
+\x03\x04\x13\x7e\x3f\xf5\xc3\x2d\x27\x06\xa9\xb0\xa4\xd7\xd1\x87\
+\x0a\xc3\x6a\xa8\x6e\x26\xea\x76\xdd\x5d\x98\x80\x87\xbb\x21\xb1\
+\xcd\x2c\x87\xdc\xc8\x30\x16\xe8\x5d\x1e\xdb\xab\x83\xdd\x5e\x8d\
+\x86\x35\xfa\x1f\x33\x78\x26\x92\x3c\x1c\xe8\xdb\xff\x00\xa9\xbc\
+\x7d\xc8\x41\x4c\xf2\x32\x6a\x6d\x0b\x79\x10\xb5\x39\xd4\x7f\x84\
+\x00\xd3\x6c\x44\xdb\x2f\x84\x2a\xad\xe2\x68\x85\xef\x73\xbd\x48\
+\x16\xc1\x0f\xba\x99\xf6\x26\x9c\x70\x1a\xfb\xe1\x02\x75\x15\x43\
+\x34\x0c\x00\x52\x50\xeb\x14\x50\x47\x3e\xa2\xc1\x02\xa9\x49\x35\
+\x91\xc1\x04\x0c\xc2\x0a\xd5\xf8\x11\x09\x08\xcf\x32\x02\x96\x37\
+\xa1\xa0\x1a\x12\x19\xdb\xa1\x8e\x8a\xd8\x31\x48\x22\x93\x89\x85\
+\x0e\xc7\x86\x10\xff\x00\x39\xb1\xcc\x0b\x30\x4e\x06\x27\x42\x31\
+\xa6\x70\x7c\x40\x20\x3b\x81\x24\x03\x5a\x34\x6a\x45\xda\x86\x19\
+\x7c\x81\x0c\xe4\x87\xf2\x08\xc0\x92\xf9\x50\xa1\x35\xb7\x2f\xa0\
+\x46\x8e\x2e\xe5\xa9\xc2\x55\xdd\x47\x04\x27\xc4\xe2\xd8\x4c\xfb\
+\x9d\xa3\x4c\x59\x4a\xe6\x69\x40\xd6\x18\xb8\x55\xb0\x69\x87\xde\
+\x9f\xbc\x48\xb4\x46\x92\xe8\x9c\xe4\xfb\xc4\x8d\x44\x8a\x8e\xfe\
+\x91\x9d\xa3\x86\x66\x81\xa8\xfa\xa9\xda\xff\x00\x1f\x58\x22\x3c\
+\xc5\x43\xbf\xf5\xcb\x92\x7a\x67\x63\x5d\xbe\x5b\xdf\x31\x05\x7b\
+\x4a\x6f\x49\xa0\xea\xef\xf5\x9a\x7a\x2c\xcd\x2e\x6f\x4f\x7e\xa6\
+\x4a\x79\xc8\x9a\x8d\x9a\x7b\x27\x98\xd2\x3e\xa0\x7b\x0b\xdf\x7c\
+\xde\x71\x40\xc9\xe6\xc5\xbb\xbc\xfb\xc4\xed\x25\xbd\x52\x8d\x1d\
+\xef\xde\x27\x8c\xba\x13\x61\x67\x66\xf9\xbc\xd3\x01\x52\xd8\x6c\
+\xd8\x8a\x59\xf8\xea\xa1\x30\x6a\xf1\x0e\xa3\xdd\x42\xb7\x8e\xf9\
+\x70\xf2\x40\x3a\x62\x0a\xcf\x87\xe2\xde\x33\x76\x08\xab\x7c\x81\
+\xbc\x7e\x1f\xac\x5c\xb4\x6e\x8b\x2f\x3b\xf3\xdf\xac\x11\x3a\xa2\
+\x07\x14\x7a\xbc\x97\x77\x23\xb6\xf4\x6a\xdb\x44\x54\x01\xf8\xac\
+\x93\x8a\x1d\x00\x45\xf2\x0e\xe6\x34\x15\x57\x4c\x74\x61\x0c\xea\
+\xc0\x99\xab\x90\xae\x41\x49\x64\xb8\xd9\x99\xbd\xd0\x2d\xbd\x3c\
+\x1a\x79\x29\xed\x68\x15\x42\xc6\x15\xa5\x42\x62\x18\x83\xfa\x98\
+\x03\xd2\xfd\x02\x01\xee\x81\x5d\x83\x00\x4d\xec\x7f\x70\x8b\xcb\
+\x81\x69\x1a\x29\x95\x45\x1f\x76\xcb\xd6\x91\xac\xbc\x75\xc1\x2f\
+\x20\xa8\x39\xad\xb8\x98\x79\x14\xad\xeb\x02\xcb\xe3\x5d\x87\x49\
+\x85\x4a\x9a\x77\x70\xf5\xab\xa2\x94\xf0\xc1\x6c\x94\xb4\x28\x0a\
+\x45\x9f\x24\x21\x50\x45\x4b\x50\xc0\x77\xed\x34\x75\xf3\x03\x52\
+\x62\xe1\xa7\x48\x6b\x62\x4a\x17\x52\x35\x53\xe0\xf0\xcb\x4d\xfe\
+\x3a\xa6\x10\x7e\xa1\x05\x47\xe8\x33\xc6\xb5\x58\x05\x2a\x40\x56\
+\x17\xd5\xd1\xbf\x92\x99\x05\xa6\xc9\xff\x00\xdf\x7e\xb1\xc2\xa3\
+\x58\xe5\xfc\x6f\xdc\x5c\xde\x8e\x00\x8d\xfe\x17\x26\xa0\x42\xc2\
+\x09\x54\x91\xb5\xe1\xe4\x3b\x8d\x75\x1e\x2c\xdf\x03\x77\x42\xf8\
+\x54\x43\x3f\x33\xd0\x7c\x26\x29\x3a\x77\x78\x26\xc1\x14\xe6\xff\
+\x00\x6f\x0f\xc9\xfd\xef\x36\x7d\x66\x80\xd9\xd4\x73\xe3\x03\x6a\
+\x81\x0e\x8f\xe1\xae\xf3\x6e\x0c\xd2\x15\xf8\x13\x13\xe5\xcd\x4e\
+\xdc\xf9\xf1\x47\xe7\xe3\xfe\x70\xcd\x6c\x2f\x16\x27\x75\xef\x1f\
+\xac\x13\x7c\xd6\x57\x52\x7f\x07\x4f\xbc\x98\x79\x5a\x6c\x79\x67\
+\xc7\xd4\xc4\xc8\xf3\x07\x78\xf7\x7c\xfb\x3e\xfe\x32\xcf\x76\xb0\
+\x69\x0d\xcf\xdf\x32\x08\x12\x84\x90\x38\xfe\x8b\xff\x00\xdc\x69\
+\x40\xba\x3c\x23\x07\x92\xbf\x18\x65\x0d\x9d\x40\x7e\xd7\x75\xa5\
+\x45\x41\x1d\x04\xc7\xb1\x36\x52\xd6\xc8\xd9\x04\xc0\xaa\x88\x94\
+\xe4\xb1\xeb\x7e\xa4\x11\x3a\x84\x29\x90\x22\xfc\x20\xa8\xf7\x86\
+\xa0\x7e\x5e\xe0\xf4\x51\x2d\xf6\x72\x46\x84\x84\x6f\x58\x3e\x6a\
+\x28\x9e\xe7\xb6\xc4\xf5\xdb\x04\x92\x3a\x03\xf3\x03\x3e\x84\x5a\
+\x10\x35\x96\xd0\x9d\x34\xe4\x1d\x25\xb3\x4d\x80\x85\xf8\x6f\x63\
+\x02\xc5\x64\x38\x07\x49\x3a\xcc\xd5\x8c\x08\x17\xf6\x22\x45\xca\
+\x5c\x99\x80\x23\xed\x34\xdf\x1b\x1d\x71\xa8\xd2\x68\x3d\x64\x59\
+\x78\xcd\xbe\xc3\xa7\xbe\xf1\x84\x84\x89\x23\xa2\xc0\xbe\xe8\x20\
+\xca\x5c\x7e\x39\x07\xd0\xb0\x67\x44\x5c\xf1\x15\x80\x21\x13\xbb\
+\x0e\x71\x98\x3f\x2a\x95\xe8\xb6\xf5\x83\x4f\x8b\x63\x98\xb0\x21\
+\x0f\xaa\xce\x7a\xa0\x2c\xf1\x76\x1b\x6b\x67\xd3\xd7\xe3\x0b\x20\
+\x2b\xe3\xad\x3e\x9e\x33\x0c\x52\x60\xeb\xd6\x9b\xcf\x71\x26\xa3\
+\xdb\x50\xef\xfe\x37\x71\x93\x82\x27\xb4\x6b\x7a\x28\xad\x73\x48\
+\xef\x00\xa8\x30\x24\x57\x04\x36\x3c\x64\x37\x85\x54\x0f\xa1\x6d\
+\x84\xbb\xd5\x56\x6a\x62\x2d\xac\x1a\xdc\xd7\x40\xe9\xdb\x8d\x29\
+\xf5\x1d\x62\xbb\x1b\xfc\x60\x17\x22\x91\x42\xa9\x35\xe1\xc9\xec\
+\xc6\x2a\x24\x34\x05\x0d\xf2\xd2\x86\xfb\x32\x2a\xc4\x29\x2f\xe2\
+\x4c\x62\x42\xab\x74\x7a\x21\x6f\x9f\x38\x03\x01\x68\x7a\xdc\xdf\
+\xc5\xc4\x92\xe9\x13\xca\x87\xc3\xdf\xa7\x5c\xb4\xed\x16\x14\x06\
+\xec\x04\xd7\xd6\xf9\xac\x75\x60\xf2\x9b\xe0\x27\x7d\x97\xb9\xd7\
+\xe6\xfd\x57\x5a\x9f\x39\xab\x89\xa9\xef\xfd\xf3\xae\x7c\x65\xab\
+\x66\xc2\x6f\xea\xf1\xe9\xf1\x8f\x0f\x65\x15\x13\x27\x72\x34\xf7\
+\x68\x6c\x7a\xe6\x12\xe2\xa8\x09\x59\x61\xb7\x29\xb7\x1d\x0e\x86\
+\x09\x77\xec\x21\x98\xcf\x3a\x01\x6e\x8a\x20\x68\xec\x51\xc5\x85\
+\xde\x88\x1a\x68\xe9\x42\xca\x21\x34\xa6\x5f\x51\x36\x98\xb6\x95\
+\xf8\x84\xfd\x20\x42\x87\x87\xd0\xf3\x2b\x8b\x35\x9b\xd1\xbf\x42\
+\xe2\x80\x16\xe0\x08\x96\x9a\x26\x99\xe0\x02\x9e\x6f\xb7\x6c\x8d\
+\xd9\x38\x65\x2e\xcf\xa8\x33\xa8\x2e\x63\x69\x70\xf0\x51\xb1\xfc\
+\x3b\x39\xb4\x3a\xab\x55\x84\x01\xb0\x18\xf0\xc7\x2d\xeb\x6f\x98\
+\x21\x0f\x55\xb8\x18\x8f\xab\xfe\x10\x52\x05\x33\xa0\x16\x29\x3e\
+\x34\xf0\xbd\x80\x6b\x19\xe0\xa5\x53\x88\x9d\x69\x2b\x8c\xe2\x88\
+\x99\x22\x58\x3b\xd2\x8b\x86\xc5\x58\x7f\x7c\x0e\x1a\x11\xfe\x09\
+\xbe\xfc\xe2\x7b\x6d\x2a\x4a\x5a\x4d\x6c\xeb\xe2\xd2\x98\x56\xe9\
+\x53\xc5\xfc\x93\x7f\xeb\x53\x20\x58\xb4\x4b\xd1\x3f\xbe\xe5\x9e\
+\x4b\x86\x98\x0d\x0f\xd6\x78\x3c\x45\x00\xd3\xd4\x7a\xfd\xac\xd6\
+\x24\x05\x87\x34\xd6\x9e\xfc\x97\xf7\x81\xf8\xfb\x78\x34\xfa\x3f\
+\xeb\x21\x15\xda\x40\xd9\xf2\x89\xbe\x73\xf7\x97\x29\x59\xaf\xa1\
+\xf8\xfe\x1f\x78\x64\x82\x01\xeb\x3e\x5e\x7f\x58\x26\x4a\x78\xe7\
+\x87\xf7\x8f\xdd\x4a\x71\x29\x3c\x7d\xe5\xb5\x91\x02\xf8\x3f\x9f\
+\xde\xb3\x89\x33\xa1\xfb\x23\x67\x87\xe3\xef\xb8\xe6\x88\x6c\x60\
+\xbe\x8d\x3f\x80\xcd\x07\x60\x08\x82\x27\xc3\x9e\x7f\x78\x23\x9d\
+\x3f\xf8\xe5\xf9\xc0\x75\x3c\x42\x46\x31\x3d\x4b\x83\x06\x84\x13\
+\x6e\x97\xe3\xce\xe4\x1f\x6b\x80\x04\x83\xd0\x47\x6e\x20\xa0\x78\
+\x59\xe6\x51\x2a\x60\xca\x48\x84\x45\xa1\x21\x4a\x66\x36\x20\x17\
+\x52\xb0\x6a\x01\x46\xdd\x31\x69\x84\xab\x67\x7b\x57\xa1\x66\x2a\
+\xa8\x18\x20\x34\x92\x74\x7a\xc3\x5b\x5f\x49\xd0\xd1\x09\x81\x5d\
+\x3d\x28\xd9\x03\xc3\xf1\x1e\x7c\xd8\xe2\x23\x60\xbe\x6c\x84\x16\
+\x4b\xda\x32\xf4\x5b\x19\x1b\xa5\x07\xce\xc1\x2d\x08\xe9\x00\xa4\
+\x21\xda\x4c\xa3\x77\xbc\xe2\xa6\xc5\xec\xa9\xcc\x1a\x7a\xf8\x41\
+\x71\x30\x6c\xee\x82\xeb\x12\xd7\x54\x90\x7d\x01\x82\x46\x96\x4a\
+\xc7\x15\x62\xfd\xbe\xe6\x4f\x9e\x06\xe2\xc0\x0e\xf8\x8f\xc4\x94\
+\x13\x2a\xca\x60\x28\x5f\xc3\xc1\x24\xe0\x3a\xca\x38\xb0\x94\xc6\
+\x32\x88\x36\xc8\x4b\x8d\xd0\x0d\x3f\x1b\x7c\xc0\x82\x35\x68\x90\
+\x76\x8d\xbc\xd4\xc5\x50\xa9\xa7\x42\xd0\x88\xc1\xdf\x5c\xa0\xf0\
+\xea\x26\x81\xdd\xbf\x7e\xe5\xa5\x26\xe7\x7e\x5f\xad\xe2\x55\xa0\
+\x32\xd0\x81\x35\x35\x18\x1f\x32\xae\x52\xf0\x6c\x78\x3d\x3e\xef\
+\xb9\x66\x36\x0e\xb3\x51\x74\xc7\xd1\x52\x6f\xe4\xc5\x2a\x29\x97\
+\xc6\x25\x5f\xf7\x88\xa3\x52\x8f\xe4\x1f\xee\x47\xe9\xc7\x36\xd7\
+\xb5\x5f\x37\xb4\xc0\x07\x06\xf8\x7b\xe6\x9c\xca\x27\xa7\x4f\x91\
+\x3e\xfe\x73\x7d\x66\xc6\x7b\xf2\xe7\xfa\xc0\xf2\xd6\x86\xb4\x8e\
+\xf7\x90\x11\x36\x3d\x9f\x24\xfb\x35\x85\x3b\x85\x51\xf5\xf1\xcc\
+\x62\x30\xf2\x13\xfc\x8d\x60\xef\xdc\xdb\xa9\x2a\x34\xef\x44\x75\
+\xfc\xef\x98\x11\xe2\x80\x7c\x63\x49\x5a\x3a\xb2\xc4\x62\x59\x45\
+\x1b\xe3\x16\x00\x65\x37\x9c\x22\x39\x25\x0e\x23\x32\x1a\xc6\xdf\
+\x99\xb8\x12\x53\x2e\x19\x56\x60\xa7\x05\xd9\xc9\x4c\x03\x91\x28\
+\xa9\x87\xb8\xf5\x3c\x5e\x9b\xa6\x45\x8e\x90\x34\x4d\x03\x62\xc4\
+\x7f\xad\x79\xce\x69\x13\x15\x88\xcb\x68\x54\xfb\xc4\x06\x86\x31\
+\x5e\x02\xf5\xd7\x14\x09\xea\xd0\xf9\xd1\x06\x4b\x38\xc5\xef\x3c\
+\x99\x1a\x46\xe8\xe4\x1b\x30\x50\x10\xde\x69\xc7\xdb\x57\x2d\xd8\
+\x24\xc4\x93\xa0\x26\xa0\x1d\x75\x4d\xda\x2d\x11\x5b\x45\x71\xb8\
+\xad\xb2\x45\xb2\xe6\x9a\x5a\x12\x8f\x7f\x50\x8d\x23\x31\x96\xb1\
+\x7e\x0a\x33\x4a\x5b\xa1\x22\x0c\x1c\xc3\xf1\xdb\xd1\x36\x5f\x98\
+\x75\x18\xbb\x6a\xd1\x8b\xfd\x3f\xde\x18\x3b\xb5\x1c\x22\xff\x00\
+\x29\x3c\xc5\x64\x15\xca\x68\x18\xfc\xd7\x57\x19\xfc\xed\x3a\x24\
+\x27\xcb\x4f\xef\x22\xc7\x47\xce\x4f\xa4\xf3\x99\xa7\x16\x8b\x18\
+\x08\x9b\xf9\x35\x86\x0a\xe9\x7d\xd2\x7f\x7f\xd6\x04\x12\x96\x88\
+\x08\x5f\x4f\xa4\xfe\xbd\xcf\xd3\x89\xeb\xed\xbc\xfd\x5c\xa5\xf9\
+\xc1\xb0\x07\xd3\x73\x9c\xfd\xe4\xe0\x0e\xbe\xc1\x6f\xe7\x58\x86\
+\x82\xf9\x1b\x1e\x91\xd5\xfa\x30\xd8\x3b\x27\xda\x04\xfd\xef\x08\
+\x30\xdd\x04\x4e\xe2\x7d\xcf\x5e\xe4\x8b\x62\xa1\x1e\xce\x7c\x7b\
+\xfe\xf1\x31\xf3\x7c\xb0\xf0\xed\x3f\x39\xb2\x40\x3f\xd8\xd3\xbe\
+\x7f\xbc\x5a\x80\x9b\x4d\x48\xcf\xf9\x70\x68\xe0\x0a\x3b\xea\x66\
+\xc5\xe0\x71\x43\xae\xd2\xe9\x0f\x7c\xc3\x69\xa4\x02\x28\xa8\x8d\
+\x95\x4f\x47\xfc\x61\x46\x4d\xb7\x1c\x5a\xdb\xec\x02\xaa\xf2\x48\
+\x81\xd6\x28\xdf\x12\xc0\x36\xb1\xf8\x90\x89\x32\xe1\x8d\xb2\x02\
+\xe1\x8d\x08\x0b\xa3\x70\x54\xa5\x41\x7d\x13\x26\x54\x47\xe8\xdd\
+\x5a\xd2\x51\x46\x0b\x8f\x7c\x07\x6d\xcc\xea\x06\xcb\xca\xe6\x3b\
+\x19\x92\xc8\xaa\x20\xba\x49\xa6\x5a\x14\xb5\xf5\x62\x35\x60\xb4\
+\x95\x58\x2f\xbd\x7f\x71\xe9\x2a\x5d\xe8\xcc\xcf\xb8\xa5\x13\xec\
+\x52\xdc\xfa\x40\x9c\x84\xa9\xe0\xd0\xdf\x01\xc8\x34\x4a\x5c\x70\
+\x67\x93\xad\x51\xa0\xa2\x34\xc8\xd7\x03\x0e\x62\x94\x3c\xe8\x2b\
+\x0e\x74\x34\xf2\x13\x77\x0e\x10\x10\x09\x3c\x7f\x3b\x5f\x73\x06\
+\xf1\x96\x0d\xe6\x83\x02\x94\x23\xf5\xef\x6d\x64\xc4\x86\x91\x3e\
+\x86\xe7\xf9\xc9\xd8\x75\x63\xc4\x6f\xcb\x48\x07\xfc\xe2\x1d\xa7\
+\x96\x34\x0d\x97\xf2\x3b\xf7\x82\x24\x20\x69\x68\x78\x6d\x27\xce\
+\x9c\xdd\x49\xfb\xe4\x78\x71\x7e\x31\x63\xf7\x53\xae\xbc\x0c\x90\
+\xe6\x09\xa5\x4d\x79\x13\x86\x4c\x14\xb3\x47\xbe\xbc\x9f\x1a\xee\
+\x02\x38\x89\x47\x8f\x96\x73\x01\xd3\x7b\x02\xfc\x3e\x72\xe9\x10\
+\x10\x9a\x68\x8e\x7e\x0b\xb1\xae\xe6\xc5\xe3\x06\xd1\xde\xac\xd7\
+\xe3\x59\x2c\x58\xf1\xdd\xbe\x5e\x6b\xbc\xf3\x37\x52\x3d\x0f\x7a\
+\xf6\xe4\x89\x32\x47\x0b\x9c\x13\x6f\x3f\x7c\xc0\xa0\xb5\xed\x0d\
+\x2c\xb7\xcc\xa9\x0f\x9f\x4d\xbd\x0f\xac\x7b\x45\xe4\x6e\xb4\x27\
+\xdf\x3f\xf9\x8e\xaf\xad\xa7\xe1\xd7\x21\x75\xac\x25\x35\x24\x3a\
+\xd2\x05\xd3\xe9\x31\x19\x49\xeb\xc7\xf9\x38\x9d\xfb\xc3\x4c\xa1\
+\x1b\x64\x9f\x74\x40\xc8\xa6\x05\x01\x06\x99\xc8\x05\x77\x45\xa9\
+\x56\x97\x72\xd5\x5c\xd4\x4e\xf1\x53\x06\x47\xbd\xa3\x20\xb0\xc7\
+\x20\x16\xd0\x35\x55\xa4\x85\x8b\x2d\x0b\xd4\xa3\xdc\xcc\xb5\x2d\
+\xca\xde\x7c\x80\x82\xd8\x35\x71\x28\x13\x55\x60\xfc\x89\x18\x30\
+\x32\xa7\x8f\x15\xa4\x36\xc1\x28\x1b\x6c\x11\x12\x6d\x96\xb9\x90\
+\xb9\x67\x26\x00\x9e\xa1\x2b\xeb\x0c\x76\x95\x43\x8b\xc9\xd3\x2a\
+\x1e\x0e\x98\x25\x01\xd9\x6d\x14\xdd\x71\x29\x24\xab\xd0\x2e\x4a\
+\x26\x46\xd0\xbd\x4e\xcd\x69\x74\x0b\xa7\x6c\x5e\x48\x19\xf2\x1d\
+\x46\x0e\x9f\x88\xaa\xd1\xc0\x23\x6e\x2c\x91\x6d\x52\x9c\x7d\xe0\
+\x04\x0e\xe0\x67\x72\x60\x57\x62\xe9\x36\x91\x29\xc3\x19\x32\xdd\
+\xf4\xa3\xa6\xde\xfd\xe1\xe5\x40\x9b\xb1\xe9\xf3\xbf\xe3\x34\xd9\
+\xb4\x3f\x37\x5f\xe7\x5f\x79\x60\xc8\x05\xb4\xda\xd1\x50\x12\x04\
+\x3e\xf7\x84\x91\x5b\xa2\x48\xcd\x77\xb3\x0b\xd3\x44\xe8\x3f\x3d\
+\xc9\x20\x6e\x85\x47\xdf\x8c\xb0\x17\xa9\xfe\x80\xd6\x29\x5f\x43\
+\xf9\x23\xc9\xcc\xd6\xab\xc5\x8c\xb3\xeb\x99\xa7\x69\xf4\xc9\xe7\
+\xf5\x3f\x87\x13\x0e\x71\xa4\x14\xeb\x14\x79\x52\x4d\xe6\xfd\xa2\
+\x8f\x23\xab\x3b\x63\xf3\xfa\xce\xaa\x61\x11\x88\x35\xa3\x6b\x32\
+\xd1\xbc\x11\xd3\xfc\x06\xff\x00\x7c\xcb\x0f\xd3\xe5\xe0\x0d\xf6\
+\x3d\xc8\x12\x4a\x1e\x89\xef\xdc\xc4\x40\x85\x6a\x2b\xa6\xc4\x8e\
+\x7d\x61\x51\x90\x8c\xde\x91\x7f\x82\xbf\xac\xb9\x83\xbb\x47\xcc\
+\xd6\xae\xbb\x80\x91\x5f\xa4\x24\x6e\xc2\x20\x8b\x42\xa3\x58\x9e\
+\xb8\x58\x00\x1c\x60\x4d\x40\xcf\x75\x56\x33\x28\x34\xe9\x59\x32\
+\x5a\xfe\x5a\x8f\x5a\xbe\xaf\x0a\x65\x0b\x13\x5c\x24\x79\x49\x37\
+\x95\x92\x51\x43\xd7\x02\x02\x1c\x28\xc3\xa4\xeb\xb7\x77\xdd\xb9\
+\x53\xf6\xe4\x0e\xad\xb4\x12\xd1\xcc\x66\x26\x61\x03\xc6\x98\xd7\
+\xaa\x02\x02\x20\x8e\x96\xc5\x90\x71\x16\x34\xec\x12\x5f\x5c\x4b\
+\xca\x7e\x35\x0a\x12\xda\x24\x05\xed\x40\x0e\xc9\x52\x32\xb2\xb3\
+\x0d\xb2\xc4\x54\x07\x57\x50\x90\x94\x41\x92\x86\xa8\xa9\x40\x97\
+\xbc\x09\xc8\xf2\x25\x08\x86\xd1\x59\x52\x8e\x12\x24\x50\x86\xa2\
+\x8e\xae\x67\x26\x9f\x00\xed\x36\x2f\xc9\x30\x50\x1a\x9f\xc1\x16\
+\xc7\xd7\xf3\x96\x34\xb2\xe0\x1d\x40\x9c\x17\xaf\x32\x66\x55\x74\
+\x01\x1d\xeb\x23\x2e\x2f\x8d\xfd\x7c\x67\xe8\x0f\x49\x5f\xc8\x89\
+\xf5\xa9\x71\xf9\xf2\x6a\xbb\xfd\x7f\x5f\x33\x0f\x3a\x03\x6e\xf5\
+\xaf\xaa\x9e\x64\xc5\x9f\x40\x8d\xeb\xea\xcc\xe1\xc1\x3c\x55\x44\
+\xfe\x0b\x7f\x59\x05\x05\x6e\xaa\x7c\xee\x87\xf5\x9e\xf1\x52\xc7\
+\xfa\x7b\xcc\x50\xb0\xd4\xeb\xf3\x6c\x91\x6f\xf7\x8e\x2e\x94\xb8\
+\xda\x24\x7c\xf3\xf7\x8a\x12\x6d\x6b\xfe\x26\x24\x37\x54\x13\xe4\
+\x84\x9f\x92\xe6\xe0\x1e\xaa\x5f\xda\xf0\xdf\xda\x77\x0a\x84\x1b\
+\x55\x29\x29\x06\x9a\x0c\x1a\x65\x04\xf9\x1c\x1b\x5f\xc2\x6f\x7c\
+\xd6\x21\x37\x0a\xb8\x3e\xdb\x8d\x2a\x0f\x80\xfe\x7a\x22\x7f\x2e\
+\x37\x70\x9f\x40\x1d\xc3\x98\xe1\x84\x47\xe8\x02\xeb\xd1\xf2\x73\
+\x12\x69\xa6\xbb\x80\x42\x41\xbe\x8c\x5c\xe0\x69\x3a\x8d\xc2\x32\
+\x32\x56\x2e\xb8\xaf\xb3\x95\x47\x7e\x9e\x0d\x93\x26\x09\x9c\x15\
+\x44\x6a\x70\x82\x53\x54\x90\x0d\x13\x1c\xbb\x14\xaf\x6d\x60\xa3\
+\xc6\xa3\x68\x7b\x6c\x8d\x22\x50\xed\xa1\x70\x0c\x4c\x33\x4b\x25\
+\xef\xf1\x93\x2b\x02\x4e\xa2\xc3\xe8\x27\x02\x5e\x48\xec\x3d\x6c\
+\x0a\x8e\x98\x94\x64\xc6\xb0\x1d\x5f\xa4\x47\x63\xa4\x23\x0e\x45\
+\x86\x94\xe4\x2d\xe5\xe4\x26\xa0\x86\x61\x58\xa1\x7a\x38\x1b\x92\
+\x21\xba\x8e\x41\x5e\xf6\x5a\x8f\xba\x14\x84\x80\x64\xd4\xd1\x6a\
+\x9e\x47\x2a\xe0\x7e\x29\x79\xa1\xb6\x2d\x7f\x3f\x1c\xe6\x2b\xb0\
+\x13\xc4\xd9\xfe\x58\x32\x03\xee\x7e\x1f\x7e\x2e\x24\xbf\x43\x6d\
+\x53\xbf\x9b\x32\x2e\xad\x08\xbf\x15\x86\xbb\x5f\xe3\xef\x12\xca\
+\xaa\x7c\xa8\x4f\xd5\x98\xe5\xc2\x35\xea\x05\xff\x00\x8c\x74\x0e\
+\xc2\xff\x00\x26\xc7\x7d\x1b\xe0\xc6\x3f\x4f\x7b\xe0\x58\x1b\xb3\
+\x1f\x66\xd5\x1a\x43\xcd\xcd\xf3\x66\x6a\x07\x6f\x4a\xff\x00\xfd\
+\xc9\x75\x4c\x99\xa6\xee\xbe\xa0\x7d\xe2\x26\x37\xba\x08\xc2\xbe\
+\x83\xb5\xee\x6e\xd2\xeb\xd3\x45\xd8\x1f\xc3\x22\xbd\x1a\x9e\x7e\
+\x48\xff\x00\x9a\xc4\x0e\xc1\x6c\xb0\xf7\xc4\xbf\x01\xf9\xce\x88\
+\x66\x49\x16\x1f\x84\xe9\xda\xeb\xdc\x99\xb4\x01\xc8\x11\x73\xdc\
+\x68\x1c\xc3\xe7\xa4\x74\x5c\x97\x0e\x83\xef\x17\x28\x89\x4a\x3c\
+\x13\x7f\x23\xb7\x27\x50\x22\x18\x05\x35\x02\xcf\xcb\x3b\x80\x08\
+\xa9\x10\xb1\xea\xaa\xcb\x07\xd6\x32\x44\xda\xd9\x0d\xb0\xec\x5a\
+\xd3\x6d\x18\x7d\x7a\x24\xb8\x07\x03\x4d\x07\x34\x81\xd4\x14\x8f\
+\x72\x8a\x31\x3d\x82\xee\x35\xa7\x6a\xf8\x0a\x89\xe1\x15\xbe\x37\
+\x19\x81\x00\x1a\xc4\x64\x40\x8d\x83\x55\xdc\x06\xed\x4f\xec\x2a\
+\x9e\x87\xc0\xc1\x72\xd9\xa2\xf9\xcc\x8c\xa0\x07\x79\x93\x6b\x56\
+\x58\xb1\x1b\xb5\x66\xbd\x1c\x1b\xb1\x8a\x67\xba\x47\xeb\x3f\x81\
+\xe8\x4b\x26\xa9\xa6\x42\xa8\x00\x89\xcf\x98\xce\xa9\x42\x95\x00\
+\xf5\x27\x11\x7a\x4a\xed\x57\x38\x89\x09\x7a\x13\x42\x40\xcc\x3b\
+\x82\x1f\x42\x25\x49\x9f\x60\x2b\xd5\x86\x1d\x44\x46\xed\xc5\xc8\
+\x80\x81\x70\xd3\x34\xa3\x17\xe0\x6c\x32\x40\x03\x48\xce\xf8\xee\
+\xdf\xa9\x85\xf0\x82\x87\x83\x7d\xec\xff\x00\xf3\x37\xcf\x66\x72\
+\x53\xbc\x73\xf8\xcd\x24\xb2\x05\x21\xbb\xf5\xe7\xef\x26\xc8\x4b\
+\x9f\x1e\xca\x77\xfd\x62\xea\x6c\x3a\x09\x03\x7f\x77\xeb\x18\xd6\
+\x6c\xe3\xb5\xdc\x83\xa1\xbb\x27\x9e\xe2\x9c\xc2\xa5\x34\xb0\x34\
+\x9f\x0b\x6e\x0c\x00\x0a\xb6\x69\xd7\xce\xf4\x73\x00\xd1\x20\x83\
+\xfe\xe7\x7f\x59\x5c\x36\xda\xb7\x11\x5e\x21\x3f\x33\x02\xc0\xb8\
+\x1d\x25\x0a\x4a\x93\x8b\xbe\xe7\x5c\xa5\x01\x50\xaa\xa9\xf6\xdf\
+\x3e\xb2\x0e\x68\x0b\xf6\xf6\x7d\xe3\x61\x82\xe4\x8a\x47\xa8\xa4\
+\xdd\xbe\xe0\x82\x97\xc4\xdb\x72\x46\x86\xfb\x96\x97\x6b\x5b\x06\
+\xc6\x23\x46\xf0\xfb\x71\xe2\x4f\x34\x16\xde\x8f\xae\xe5\x26\xad\
+\x6d\x29\x89\xd4\x99\xf6\x32\x6a\xc1\x89\x75\x3a\xd7\x7e\x3e\xfc\
+\xc1\x7f\xf5\x93\xd2\x71\xfe\xec\x74\x11\xf0\x06\x46\x78\xf6\x73\
+\x12\x27\x52\xa3\xe1\xc6\x8f\xf9\xc7\xb2\x4e\x9a\xeb\xde\xb6\x79\
+\xdf\xd6\x41\x45\x07\xb9\xbe\x7c\x66\x88\xd4\xde\x2e\x9b\x66\x1b\
+\x89\xf6\x97\x4a\x29\x88\x24\xec\xa8\x27\xdd\x5f\x0d\xa7\x2c\x92\
+\x65\xab\x3c\xb9\xbb\x83\x4e\x85\x18\xce\x8d\xa3\x23\x98\xf6\x8f\
+\x1e\xc9\x15\xc9\x83\x75\x5a\x61\xd6\xbf\x4f\x60\xd3\x91\x75\xa8\
+\x4f\x44\xc5\x68\xf0\x88\x81\x4c\xa6\x9d\x06\x2a\x5e\x1b\xef\x37\
+\xce\x91\x52\x3e\xa3\x4e\x60\x03\xa6\xc1\x41\xe1\x77\x01\xe8\x38\
+\x18\xae\x1f\xfe\x01\x20\x7e\x46\x00\xc3\x7b\x97\xa5\x9f\x43\x30\
+\x1b\x25\x8f\x48\xa3\x50\x4f\x80\xd4\x7e\x09\xaf\x8d\xb0\x3b\x89\
+\x76\x9f\x9e\x63\x20\xb2\x16\x85\x06\x77\x73\xf3\x97\x9b\x00\x7f\
+\xb7\xeb\xe6\x4c\x24\x29\xd8\xd3\x5e\x1e\xc0\xe6\xfb\xd6\x6b\x04\
+\x6d\x0d\x24\x89\x37\x3e\x79\xbc\x5e\x5b\x5a\x69\x02\x77\x74\xeb\
+\x6f\xcb\x14\x1d\xd4\xc8\xe9\x45\x57\xcd\x55\xce\xfd\x6a\xdb\xe5\
+\xfd\xcd\x9f\x71\xe6\xb1\x88\xca\x15\x20\x35\xb0\xa8\x0c\xe4\xd3\
+\xbc\x61\x10\xb4\x88\x97\xf4\xff\x00\x97\x26\x49\x01\xae\x47\x7a\
+\x41\xf1\x77\x71\xfa\xbb\xe7\x43\x0b\x22\xae\x9f\xbc\x42\x56\x01\
+\xeb\x4a\xfb\x16\xf4\x9a\x3b\x86\x34\x89\xdf\x5e\x26\x9a\x3e\x47\
+\x37\xc3\x52\xbd\xa1\x7e\x5f\x98\x1a\xbc\xee\x5b\xa5\x11\x04\xee\
+\x8b\x1d\x02\x4c\xa4\x21\xd6\xb1\x4b\x40\x19\xb8\x9e\x3d\xee\x1d\
+\xc4\x05\x04\xde\xaf\xe8\xeb\xf1\x9b\xd8\x09\x8d\x1d\x00\x6e\xb4\
+\x6f\xeb\x23\x6b\xd0\xb9\x75\x34\xfb\xcc\x3d\x40\x45\x4f\x65\xfc\
+\x2e\x05\xd4\x10\x9e\xec\x06\xf3\xb9\x5c\x88\x16\xc8\x10\x20\x4d\
+\xd4\xb4\x75\x70\xa5\xc7\x17\x9d\xe7\xce\x47\xa5\xd6\xc0\x16\x70\
+\xff\x00\xf3\xe4\xc3\xf6\xb0\x82\x5f\x84\x15\x53\x14\x1a\xa7\x95\
+\x57\x84\xab\x96\xf6\x08\xd3\x67\xaf\x3b\x73\x60\x1e\x0e\x70\xaf\
+\xe3\x78\xa4\xaf\x89\xf2\x0e\x06\xf4\x5b\xf4\x05\x08\xf5\xad\x6d\
+\x0c\xa9\x01\xbc\x69\x4c\x93\x24\x6e\xd2\x90\x03\x02\x5f\x55\x6b\
+\xa4\x85\x70\xe1\xd2\x48\xe8\x07\x95\xaa\x99\x70\xb7\x75\x21\xc4\
+\xc3\x14\xe2\x91\x88\x4a\x92\x69\x64\x32\x2f\x83\x21\x5a\xfe\x98\
+\xd1\x02\xff\x00\x12\x0a\xa0\x61\x5b\xf1\xf2\x4a\xf9\xbe\x66\xc1\
+\xd0\xcf\x23\xe4\xbd\x93\xf7\x82\xb9\x37\xdb\x7d\x13\x7d\x6f\xc6\
+\x79\x81\xdf\x03\xa3\x47\x53\xd6\x4c\x0f\xe2\x46\x41\x7b\x40\xcf\
+\x9b\x78\x61\xf5\x8a\xcb\xb4\x52\x59\x2f\xd7\xdc\xef\x31\x6d\x46\
+\xe8\xf4\xa9\xad\x4e\xc2\x59\x77\x8f\xa8\xc5\x55\x40\x1a\x4d\xa7\
+\xdd\x86\x19\x12\xfb\x21\x84\x8d\x34\xd0\xeb\x05\x3d\xd2\x70\x5e\
+\x96\x6c\xdf\x75\x79\x9e\xb2\x2c\xdf\xfe\x07\x6d\xbf\xef\x13\xe0\
+\xfd\x63\x63\xf1\x79\xbf\xd6\x34\x8a\x0c\xa1\x61\xd3\x65\x07\xf3\
+\xa0\xce\x3f\x49\x37\x17\xcb\x7d\xcd\x58\x72\x60\x45\x4c\xfb\x4b\
+\x6d\xd7\xc6\x08\x8f\xb3\xd9\xaa\x3e\xee\xea\xeb\x19\x80\xfa\xa7\
+\xd6\x99\xef\x1b\x85\x88\xfa\xf8\xa3\xaa\x2f\x66\xfc\x2e\x2d\xb4\
+\xa5\x4b\xa5\xf9\x6e\x4f\xc6\x0f\x8f\xbe\x25\xba\x7b\xef\xce\x36\
+\xea\x84\xa7\xbd\x8d\xf3\xf5\x90\x28\xf5\xf6\xf3\x71\xe4\xfc\x8b\
+\x80\x7f\xad\x31\x5e\xeb\xdf\x4f\xa7\x26\x52\x3a\x24\x46\xeb\x52\
+\x7e\x45\x9e\xdd\xe5\xee\xa2\xf9\x6e\x47\xea\x5f\xbc\x8c\xc4\xd5\
+\xf2\x6a\x4e\x6e\x3b\xb8\xed\xa2\x43\x73\x5e\x12\xeb\x68\xec\x79\
+\x92\x4b\xf1\xcb\x92\x96\xe5\x42\x1e\x45\x02\xcf\x23\x47\x1a\xc2\
+\x5c\xdd\xca\xe2\xcb\x6d\x77\xc0\x69\x14\xc3\x3f\xb3\xe5\x0a\x48\
+\x2c\x2e\x1b\x25\x37\x10\x51\x3a\x5b\xc2\x60\x48\x60\x99\xfb\x01\
+\x78\x8a\x67\x55\x0c\x10\xa5\x33\xd5\xed\x3a\xc9\xad\x82\xc9\x0a\
+\xd0\x31\x7a\xe0\x5a\x92\x53\x88\xdf\x84\x8a\x95\xf5\xd2\x29\xdc\
+\xe2\x0a\x32\x61\x30\x23\xe8\x9b\xae\xbc\x38\xac\x31\x35\x28\x9b\
+\x4d\x34\x1f\x2c\x68\x63\x53\xe1\x51\x8e\xbf\x32\x73\x79\x01\x5a\
+\x37\xd3\xb3\xa1\x1a\xc0\x6f\xaf\x32\x41\x40\x59\x57\x43\x9f\x00\
+\x7e\xf2\x84\x07\xa4\x7a\x6a\xea\x6b\xe3\x2a\xbc\xc8\xec\x4d\xb4\
+\x85\xae\x7c\x30\xc4\x35\x13\xd9\xae\xc9\xe7\x39\x9c\x69\x89\x79\
+\x52\x02\x7b\xf6\x38\x67\xc8\x96\x59\xea\x13\xa9\x7f\xf9\x8b\x51\
+\xa0\xbf\x01\xf4\xbb\xe7\x9d\xc2\x0a\xa0\x1a\x17\x55\x74\x9b\x60\
+\x0e\x17\x52\x83\xe5\x81\x0a\x35\xd7\x66\xb1\x05\x14\x1e\x68\x5f\
+\xed\x9a\xf4\x0d\xe3\x87\xc3\xe0\xd7\xde\x1e\x9a\x10\xea\x86\xef\
+\x9c\xb3\x9b\x98\x14\xed\x2d\xb6\x05\x37\x53\xa1\xe6\x49\x14\x7b\
+\x6e\x92\x2d\xdd\x97\xea\xc9\xdc\x88\x51\xc7\x28\xe1\xde\xeb\x49\
+\xac\x00\x1a\x28\x76\x46\xad\x9a\x7e\xff\x00\x59\x04\xde\x88\xab\
+\xf8\xd7\xf3\xf5\x81\x29\x00\x3c\xd4\x7a\x3a\xe6\x7b\xa2\x55\xeb\
+\x5a\xed\xf7\x15\xbd\x93\x1e\x9f\x1a\x69\xad\x9e\xe0\x65\x5a\xc7\
+\x53\x66\x8e\xf3\x71\x35\x72\x2d\x94\x2d\xb6\x5a\x09\xab\xfe\x59\
+\x6a\x36\x36\xa8\xd1\xaf\x26\x25\xfd\x4b\xfb\x20\x68\xb3\xef\x8d\
+\x4b\xe6\xe9\x92\x7c\xa9\x9a\x92\x2a\xaa\xb8\x56\x96\x7e\x90\xcb\
+\xcb\xb0\x9e\x97\xb0\x52\x52\x1f\x88\x0e\xf8\x67\x93\x2a\x96\xb2\
+\xf2\xac\x42\x31\x85\xae\xe6\x97\x5f\xc5\xe9\xff\x00\xf6\xcc\x1d\
+\xe8\xe4\xdc\x56\x98\x39\xd8\xa9\x5b\x0f\x98\x70\x8a\xa4\xda\x8d\
+\x5a\x92\xec\xb7\x44\x60\x32\xc3\xcf\x41\x47\x6a\x15\x0b\x39\x05\
+\x85\x59\xb2\xfc\x11\x6e\xab\x33\xc5\xb6\x8f\x15\x2d\x48\x00\x95\
+\xd8\x4d\x9a\x0c\x53\x51\xae\x80\x53\xc2\xfc\x09\x37\x31\x1a\x4c\
+\x13\xd6\x3b\x35\x5d\x3b\xef\x98\x93\xa6\xfb\x08\x30\x5a\x76\x79\
+\x84\x27\x26\x9a\x1b\xbe\xf4\x26\xa7\x73\x7c\x70\x88\xe9\x3e\x43\
+\xe5\xbb\x7e\x30\xf1\xb2\xf1\x9a\x4d\x43\xf3\xae\x5c\x68\x2a\xea\
+\x26\xf7\x0b\x93\xe8\x2f\xde\x16\x27\x5d\x13\xe5\x30\xfd\xdb\xac\
+\x08\xee\x43\xd0\x24\x59\xa7\xba\x0f\xce\x24\x31\x49\xf8\x03\x74\
+\x7e\x77\x27\xc6\x59\xc8\xa4\xce\xa0\x2d\x86\x38\x45\x93\x1a\x78\
+\x1c\x2e\x99\x69\x57\x4b\x5f\xa3\xb9\x58\x33\x12\xf0\xd1\x9d\x1d\
+\xae\x29\x82\x86\x6d\x8d\x01\xd7\xf0\x32\xd3\x44\xa3\x41\xd7\x8d\
+\xfc\xf7\x5e\x61\x51\xa9\x17\xe8\x5e\x07\x86\x36\xc8\xfa\xa0\x37\
+\x6e\xbe\x75\xfb\xcb\x44\xaf\xa7\x8c\x8f\xfd\xdc\x6f\x21\xa2\xe0\
+\xa9\xfa\x2c\xff\x00\xae\x6c\x62\xb1\xa3\xcf\x95\x9f\x8f\xbc\xd7\
+\x4b\x12\x85\xbd\x20\x7d\x6b\xb3\x10\x96\x09\x10\xf4\x8a\xef\x7f\
+\x19\x35\x00\x06\x9c\xe1\xf2\xfd\x60\x96\x1d\x73\x42\x75\x76\x34\
+\xbc\xdf\x30\xb9\xec\x59\x05\x02\x69\x4b\x7a\x66\xb6\x25\x31\x99\
+\x49\x09\x3b\x64\x18\x87\x95\xfe\x72\x9b\x2e\x83\xe5\x69\xec\x00\
+\x02\x39\x28\x57\x02\xe8\xc4\xed\xb0\x9a\x74\x80\x19\x4d\xac\x84\
+\xdf\x5c\x75\xd0\x2a\xae\xac\x6d\x8f\x5c\xe4\xaf\x80\x6c\x0f\xce\
+\xec\x34\x69\x33\x19\xd2\x60\x4b\xda\x18\xcb\x9a\x05\x8e\x31\x8d\
+\xf0\x50\xee\xcf\xea\xa2\xba\xd0\xbd\xc8\x37\x1d\xa0\x72\x1f\xc6\
+\x31\x38\x31\x47\x48\x0d\x77\xe6\x41\xad\x2a\x01\x31\xad\x6b\x36\
+\xd4\x6b\x59\x0d\xa1\xc1\x8e\x7e\xb1\x77\x5e\x96\x32\xde\xef\xe9\
+\xbf\xeb\x02\x10\x4d\x6c\x5a\x5f\xa6\x3f\x93\x9d\xc1\x4f\xc9\x0b\
+\x4d\xa5\x10\x8f\x34\xbf\x78\x0a\xf5\xbf\x53\x6e\x36\x31\x28\x89\
+\x28\xd8\xae\x97\x18\xef\xd6\x27\x5c\x78\x6d\x1a\x42\x3d\x77\xbe\
+\x53\x35\x2a\x35\xd0\xc9\x2f\xbd\xdf\xe5\xf9\xc7\xcb\xc3\x5d\xb1\
+\x4f\xc1\x96\xfe\xf9\x96\xe5\x93\xf6\x48\xd0\x6f\xd7\xd7\xf3\x8e\
+\x31\xb0\x02\x8d\x1d\xf3\xf0\xbf\x79\x33\x10\x09\xa9\xdb\x1f\x82\
+\x2f\xae\x1f\x6e\x34\xee\x13\xcf\x17\xf7\x89\x8e\x39\x3a\xa8\x6b\
+\x46\x1e\x28\xef\x22\x42\x03\x8d\x1d\x9b\x29\xad\x36\xc1\x89\xfd\
+\x0a\xd1\x2f\xa6\xfb\x26\x3c\xfe\x34\xf9\xd2\x7e\x5e\xfd\x64\xf9\
+\x00\x51\x06\x9e\x71\x49\xf8\x7e\x77\x86\xc1\x81\x7a\x6c\xf5\xd4\
+\xdf\xd6\x72\x0f\x1a\x1d\xd7\xcb\x7f\x7f\x59\x40\x67\xd6\x21\x4b\
+\xab\xd9\xe9\xbc\x4b\xbc\x49\xc6\xc7\xd2\xcf\xc6\xbb\x31\x04\x81\
+\xb2\xb6\x42\x8a\xd7\x5a\x75\x9a\x8a\xc3\x2e\xc5\xbf\x8e\xde\xf4\
+\xcd\xe9\x95\x3e\x98\x2b\xbf\xc1\x9f\x78\x68\x7a\xc8\x57\x72\x3b\
+\x2a\x0d\x1c\x79\x88\xb6\x9a\x56\xf4\x77\xcf\xf5\x9b\xc3\x01\xfd\
+\xa5\x35\x40\x41\xeb\xae\x99\xa2\xf9\x13\xa2\x91\x2e\xc8\x99\x85\
+\x10\x3d\xdb\xbb\x02\x6b\x56\x6d\x0b\x0a\x59\x38\x1d\x11\x21\xa0\
+\xd2\xcd\x96\x65\x18\x45\x38\x33\xcb\x2a\x2a\x17\x71\x86\xfc\xb0\
+\x85\x16\x81\x43\x0d\x44\xf4\xdd\x37\x20\x85\x31\x43\xcf\xd5\x1c\
+\xb1\x55\x48\xa9\x38\xc3\x2f\xc6\xd5\x91\xc6\x1d\x05\x31\xa6\x4a\
+\xa5\x5c\xdd\x93\x13\x58\xca\xf1\x04\x42\x89\x84\x8c\xa0\xe2\x28\
+\x39\x3e\x78\x4b\x25\xdd\xdc\x9b\x98\x81\x37\xac\xd8\xbd\xbe\x9d\
+\x67\xdd\xc2\xc0\x95\x0b\xaa\xb6\xd8\x47\x98\xd2\x7c\x32\xd5\x82\
+\x9e\x80\x6a\xf7\x0c\x06\xaa\x14\xa2\xd3\x45\xfc\xed\xf9\xf3\x26\
+\x23\x74\x44\xb0\x1d\x37\x3f\xb3\x87\x52\x02\xca\x02\x53\xba\xa5\
+\x56\x97\x98\x84\x28\x69\x2f\x47\x3e\x8d\xae\x2e\x16\xc4\x44\x51\
+\x11\x06\x00\x25\x2d\xd8\x6f\x18\x21\x2a\x05\x04\x4b\xad\x52\xc6\
+\xdc\x62\x55\xe6\xb2\x14\x77\x3f\x33\xf1\x9c\xd7\x64\x75\x04\xf1\
+\xb2\x2f\xd1\x9a\x2a\xc0\xf8\xac\xb3\x20\xa2\x98\x87\x46\x07\x48\
+\x04\x1a\x76\x55\x3e\x7f\xaf\xac\xd4\x81\x50\x68\xe0\x44\x68\x2a\
+\xe8\xf4\x9f\x61\xb3\x7d\x33\xd5\x6f\x6e\x21\xd3\xe4\x12\x6c\x7e\
+\x32\x08\xd1\x65\x17\xca\x45\xa0\x16\x8a\x86\xad\xc7\xa3\x19\x26\
+\x38\xde\xbd\x3c\xce\x0e\xd0\x68\x98\x89\x7c\x1d\x28\xb4\xec\x1d\
+\xab\x4c\xed\x8c\x2e\xf5\xa4\x98\xb3\xa9\x70\x0b\x22\x42\x82\xa6\
+\xf4\x9e\xe6\x33\xb6\xa1\x07\x3d\xc0\xb0\x9a\xe2\x18\xd0\xef\xb4\
+\x93\x55\x7a\x7b\x6e\xcd\x4b\x85\xd0\x5b\xb4\xd8\xda\xa7\x8e\x8f\
+\xf3\x86\x62\x2a\xfc\x8e\xaf\x0e\x63\x9c\xa0\x3b\x5b\x44\x1b\xc0\
+\xf4\x8e\x89\x4c\x70\xd6\x6d\x70\x05\xf2\xf7\x69\x62\xe6\xba\x5d\
+\x60\xd8\xd1\x52\x1e\xb2\x50\x1f\x1c\x36\xbe\x6b\x30\xf0\xb3\xc8\
+\xa8\x55\xa9\x42\xbb\x26\x01\x88\x02\xb5\x10\x2a\xb2\xca\x35\x45\
+\xe8\x10\x91\x1b\xc0\x7e\x6e\x02\xad\x6a\xdc\xd9\xaa\x75\x3c\xf1\
+\x86\x7b\x7d\x3b\x07\x6c\x43\x07\xdb\x00\x5f\x4b\x94\x44\x9b\x50\
+\xa3\x55\x99\xc9\x75\xe1\xcc\x50\x72\x43\x82\xa6\x84\xfa\x40\x75\
+\xf4\xb6\x20\xca\x56\x90\x70\xc4\x4b\x24\xd3\xc7\xf6\x3c\xa1\xac\
+\x5c\xdf\xd8\x8a\xe2\x70\x8e\xdb\xdc\x9e\xe4\xd8\xcd\x88\xb0\x3b\
+\xa7\x45\xe2\x61\xae\xb1\x66\x89\x21\xdb\xdb\xf0\x1d\x62\xf4\xb4\
+\xd6\x9a\x51\x53\x5d\xaf\xd6\x7a\x4b\xe6\x40\x47\x51\xb3\xab\x7e\
+\x33\xa7\xbf\x70\x5c\x13\xaa\x9f\xab\xcc\xa1\x35\x54\x88\x5a\x4a\
+\xeb\x37\xa9\x8f\x56\x81\xb4\x5f\xc8\x13\xe6\x26\xa7\xb8\x6c\x5a\
+\x88\x78\xae\x43\x9a\x56\x7b\x89\xaa\x2c\xf8\x5b\x74\xfc\xbe\xdf\
+\xd3\x8f\xd3\x3b\xa0\x3b\xb6\xae\xe7\x6d\xe6\x2c\x9c\x8a\x4e\x84\
+\xa4\x98\x55\x10\xd3\xba\x47\xb6\xd3\x9d\x40\x25\xc3\x6d\xe9\x11\
+\xd9\xe7\xaa\x53\x28\xeb\x11\xeb\xc2\x54\x17\x70\x14\x88\x31\x91\
+\x8a\x87\x06\x53\xde\x8c\xec\x4b\x86\x95\x7a\x13\x0b\x31\xb1\xa6\
+\xa8\x06\x12\x1b\x61\xa0\xda\x44\x4f\x5c\x43\x30\xea\xb4\xf2\x42\
+\xcf\x2e\x1b\x40\x84\x7c\xa2\x49\xf4\x08\xc3\x03\x38\x9a\x64\x45\
+\x25\x63\xd3\x85\xe1\xab\x38\xd3\x4a\xd9\x32\x24\xc6\x8b\x66\x5e\
+\x1c\x85\x21\x36\xdd\xf2\xfd\x0c\x7a\x8a\x95\x5d\x6a\xb8\xcd\x1a\
+\xdd\x79\xeb\x22\xc1\x24\xcd\x2c\x54\x3b\xd8\xf0\x12\x72\x78\x33\
+\xc3\x4b\x59\xab\x61\x7b\x17\x02\x9e\xd4\x1c\xa6\xb5\x6d\xd7\x29\
+\xa1\xee\x29\xf1\x1e\xd5\x23\x1b\xc7\xc9\x4d\x48\xe7\x42\x55\xd2\
+\xac\xb1\xe7\x90\x65\x80\xfe\x67\xcd\x3a\xeb\x11\x3a\x4c\x91\x42\
+\x9c\x78\xdd\x35\x58\x0f\x26\xc5\xb8\xc4\x6e\x08\x8a\x02\x09\x4f\
+\x98\x99\x1c\x18\x5e\x0a\xa1\xb8\x03\x84\xc0\x40\xc7\x7a\x47\x7c\
+\x00\x5e\xcd\xac\x29\xe3\xfc\x22\x21\xf4\x3a\x19\x69\x09\x9c\xb6\
+\xfc\x2b\x00\x90\x53\x1d\x15\x12\xda\x36\x12\x20\xc1\xc0\x53\x00\
+\x61\xa3\x63\xf9\xc0\x87\xe5\xca\xd7\xa0\x35\xde\x79\x32\xe7\x5b\
+\x0a\x36\x7c\x9f\xdb\x0b\x2c\xdc\x23\x5d\xf2\xf0\xfa\xed\xc1\x69\
+\xb6\xd7\x00\x2a\x12\x8b\xeb\x44\x63\x80\x4b\xee\x76\x41\x35\x3c\
+\x01\xdb\xee\x06\x30\x96\xc7\xd5\xe1\xf3\x21\xb3\x7b\x23\x72\x38\
+\x7b\xc6\xe0\x92\x6a\x22\x8d\x17\x5c\x28\x9f\x73\x2c\x61\xed\x5b\
+\xe2\x07\x72\x27\x65\x71\xea\xa8\x8a\x28\x3b\xc0\xa7\x4e\x3e\xe2\
+\x99\x7b\xad\x16\xa0\xf4\xae\x52\x6d\x88\x36\x4a\x6e\x5b\x1c\x65\
+\x62\xd0\x05\xc4\xf8\xe8\x56\x54\xb3\xea\xd7\xe0\x44\xaf\x6b\xf2\
+\xd3\xda\x86\x0a\xb2\xea\x0f\xb1\xb0\x68\x14\xa2\xf5\x01\x84\x35\
+\x4a\xd1\x88\xbb\x10\x6c\xf9\x94\xc7\xd7\xa2\xad\xc2\xb8\xea\xa0\
+\xd6\xb9\x3d\xd1\x3a\x55\xb2\x1a\x44\x70\x89\x8c\x93\xf7\x70\x5e\
+\x64\xba\xf1\x06\xd3\x67\x6f\xc2\x2f\x96\x98\x21\xe7\x8b\x9f\xfb\
+\xd6\x39\x77\x09\xc6\xf2\x3e\x0a\x39\x07\x94\x67\xa0\x94\x76\x07\
+\xb9\x22\xf5\x28\xa1\x2a\x73\xd9\x42\xc5\x7d\xda\x31\xd0\x2c\x15\
+\x2e\xc6\x3b\x64\xdf\xc5\xb8\x25\x53\x14\x82\x23\x9d\x44\x46\xca\
+\x42\x1c\xea\x0a\x61\xe3\x53\x52\xf6\x5c\x92\xf1\x8d\x00\x65\x13\
+\xf4\x65\x5b\x9c\xda\x84\x8d\x61\xb0\x79\x70\xb8\xa0\x2f\xc2\x82\
+\xce\xa6\x4f\xc6\x84\x30\x37\x78\xe0\x17\xb6\xe4\x2e\x90\x69\x31\
+\x86\xb1\x3e\xa2\x23\x65\xc8\xda\x65\xcf\x59\x8d\x73\xbf\x8b\xd2\
+\xb8\x39\x2b\x01\x82\xa7\x93\xaa\x21\x29\xd1\xff\x00\x05\x64\xa4\
+\x3e\xf3\x5c\xd0\x04\x49\x10\xf2\x96\x42\x11\xb0\x15\x5e\xb4\x44\
+\xc0\xd2\x01\x2c\x85\x08\x13\xf8\xb7\x06\x91\xa8\x29\xc6\x1a\xdd\
+\x43\xed\x9b\x14\x1c\xb5\x0a\x04\xd0\x53\xf1\xcc\x0f\x39\xd6\xb0\
+\x95\xa6\xd8\x7b\x9b\xa0\x65\x92\x0b\xbe\xc8\x13\xe4\x79\x8d\xf8\
+\x16\x44\xbc\xbd\x08\x8e\xdd\xf2\xe2\x52\xd1\x6f\x04\x4c\x3c\xfb\
+\x5e\xb0\x8e\x45\x1a\x58\x2f\x40\x21\xca\xb7\x92\xac\xb3\x45\xf7\
+\x11\xf6\x5a\x5d\x60\xae\xb6\x74\x35\x0f\x50\xe4\x80\x5f\xb4\xc0\
+\x53\x62\x61\xb7\xb5\xa0\x6e\x2f\x97\x35\x51\xe0\x25\xd2\x9f\x20\
+\x16\x08\xdf\x2f\x67\x57\x5b\x00\x37\x8b\x03\xc5\xfc\x41\x24\xe5\
+\xf7\x82\x23\xd8\xdb\x78\xcd\xef\xfd\xf0\x0f\xed\x98\x52\x39\x71\
+\x1c\xce\xfb\x42\x8e\x18\x46\x72\xbd\x12\xcd\x6d\x58\x62\x45\x04\
+\xfc\x3c\xb2\xf6\x21\x86\x0a\x78\x08\xfb\x60\xda\xea\xdc\x1d\x41\
+\x02\x18\x6f\xb2\x3c\xce\xb1\x2b\xeb\x2e\x0c\x3b\xee\x8b\x39\x12\
+\xa0\xa9\x81\xdc\xb5\xa5\x40\x46\x08\xe9\x4e\x17\x63\xbf\x65\x09\
+\xee\x70\xbf\x34\x42\xca\x90\x64\xe3\x77\xc9\x98\x90\xe5\x0f\x82\
+\x4a\xdb\x9d\xcd\x35\x01\x9e\x10\x0c\xfe\x0b\xaa\xc6\x31\x2b\x4b\
+\x14\x57\x3b\x1a\xa0\x48\xdb\xe4\x9b\x80\x78\x28\x38\xc2\x6e\xca\
+\x8f\x86\x38\xda\x2d\xd2\x17\xc0\x89\xd6\x30\x93\x25\x48\x70\x7e\
+\xe8\xc6\xc8\x23\x54\x6a\x37\x54\xd3\x7a\x43\x37\x91\x21\x20\x67\
+\x50\x73\x4a\xb2\x7c\xe7\x4d\x52\x3f\xfe\x77\x4d\x37\x6f\xe3\xe3\
+\x83\x6a\x2e\xa1\x50\x19\x74\x60\x96\x05\xe0\xc6\x23\xcd\x4e\x09\
+\x17\x70\x76\xc4\xc3\x64\x80\x67\x5f\x1e\xd1\x05\x32\xfb\x1c\x60\
+\x27\xdd\x01\xa0\x24\xf6\x1c\x0d\x98\xfa\x57\x4f\x83\xae\xa8\xfe\
+\xf0\x33\x36\xc2\x18\xba\xc2\x3b\x2e\xc8\x19\x73\x07\x41\xbd\xaa\
+\xc6\xd4\xfe\x29\xd8\xe2\xa5\xdd\xee\xba\x32\x4e\xc8\x6b\xad\x8e\
+\x53\x0b\x45\x9a\x7b\x6c\x37\xfb\xee\x68\xd1\xdc\x1e\x5f\x99\x39\
+\x76\x70\xb3\x18\x06\x80\xab\xb4\x5d\x47\x69\x11\xf8\xc5\xe0\x88\
+\xd3\x50\x81\xf4\x5d\xd0\x34\x00\xb4\x82\xd1\xdc\xa4\xc1\x60\xe2\
+\x35\x62\x8b\x42\x92\xc0\x2b\xe4\x81\x6e\x0b\x02\x4d\xce\xe2\x7e\
+\x11\x06\x26\x4e\xd2\xc9\x22\x0c\x1d\x2c\x8c\x52\xe6\x46\x20\x27\
+\xc6\x3a\x8e\xc6\xd3\x18\x52\xba\x15\x13\xbc\x6a\x47\xe9\x6a\x30\
+\xea\x12\xe3\xee\x31\x58\xbe\x2a\xec\x72\x41\x8f\xbb\x45\x44\xda\
+\xf1\x46\xc4\x34\xd5\xc1\xe1\x6f\x28\xa3\xf0\x17\xfd\x67\x34\x16\
+\x00\xd0\x88\x4a\xe4\x72\x77\x01\x14\x52\x65\x9a\x81\x1c\x1d\xf6\
+\xb0\x54\x89\xd0\x92\xb4\x00\xca\xa7\x54\x07\x85\x8b\xd7\xb0\xf9\
+\xd0\x15\xc7\xa7\xeb\xdf\x32\xd5\x4c\x52\x37\xcc\xcd\xd5\x2a\x2d\
+\x00\x98\x5f\x87\xa0\x4b\xd1\x5b\x1a\xd6\x61\x0f\xfe\x85\xaf\x77\
+\xde\xb0\x87\x01\xbc\x40\xd8\x99\xb6\xf3\xa0\x8a\xd6\x1c\xce\xfc\
+\xe9\xd7\x13\xfb\x00\x1a\x99\x4c\xff\x00\xd5\x55\x12\x8f\x4c\xe5\
+\xfb\x29\x76\x17\xec\x31\xdf\x5a\x8c\xea\x49\x7d\x3d\xaf\x43\x02\
+\xb4\x67\x46\x7a\x42\x0b\x9b\xba\xda\xc6\xe8\x6b\x2c\x54\x31\x6a\
+\xee\x94\x60\x73\x56\x4f\x3c\x5f\xb4\x78\x2a\x62\xd9\x3c\x13\x6e\
+\xb6\x66\x5f\x21\x00\x60\x2c\x5c\xe2\x7c\x0d\x67\xa1\x01\x44\xbd\
+\x14\x27\x7f\x1e\xa2\x83\xac\xb6\x20\xe8\x35\xdc\x0d\xa1\x02\x8e\
+\x8b\x07\x27\xff\x00\x3e\x57\x41\xa0\xfe\x3e\x16\xf0\xc4\xee\x27\
+\x9a\x92\x11\xdb\xe3\x35\xd0\xfc\xf7\x6e\x3a\x2b\xc4\xe6\x6c\xf1\
+\x85\x35\x7d\x9a\xd8\xfb\x37\x68\x62\x0a\xae\x11\x49\xd8\xd6\x7f\
+\x58\xc7\x35\x91\xeb\x18\xb0\xa6\x07\xbb\x92\x92\x32\xaa\x6f\xe2\
+\x63\x20\xd4\x10\x10\xa3\x8e\x35\xd0\x52\xd4\x40\xb7\x9a\x6f\x59\
+\x3d\x45\xd3\x18\xa5\xe6\xe1\x3d\x29\x81\xa0\x28\xd0\x89\xa4\x88\
+\x6f\xc7\x9c\x3f\x8f\xb4\xc1\xf5\xb1\x52\x80\xc1\xf1\x27\x43\x47\
+\x2b\x88\x3f\xa7\xa4\x66\xf0\x90\xd2\x39\x57\x42\xb1\x19\xcd\xa5\
+\x35\x74\x8d\x09\x94\x25\xce\x87\xda\x25\x1d\x6b\x88\xcc\x05\x5a\
+\x14\xbc\xae\xf7\x73\x25\x58\xad\x5b\xe5\xc4\x3c\x65\xaa\x3a\x0d\
+\x6e\x81\xc5\xbc\xb9\xa2\x21\x47\xab\xc7\x2e\x3b\x1d\x1a\xf5\x51\
+\xb9\x15\x2d\x51\x99\x76\x90\xde\xca\xeb\x79\xc8\xe3\x1f\x3b\x53\
+\x64\xc5\xe6\x59\x28\x6e\x56\x0d\x4b\x20\x80\x6a\x5c\x8f\xc6\x8e\
+\xfe\x0a\x83\x70\xa9\xe1\xa9\x38\x5c\xa6\x0d\xab\x4e\x5d\xdb\x63\
+\x83\x04\xad\x66\xf0\xa2\xb7\x2d\x1a\x02\x63\x83\x7d\xb0\x5b\x19\
+\xda\x9c\x7c\x2f\x4a\x6b\x8a\xb4\x1d\xa2\xef\x68\x26\x0c\x95\xc6\
+\x15\x30\xe3\xa9\xcb\x77\xfd\xf4\x3c\x54\xc0\xca\x00\x9a\xc6\x55\
+\x83\x52\x82\x69\xea\x31\x4d\xb1\xb0\x80\xcb\x91\x55\xe2\x33\x87\
+\x54\x67\x22\x04\x09\x8d\x2b\x0e\x2b\x5e\x61\x03\x6b\x91\x04\xed\
+\xf2\x0c\x8b\x93\xc4\x98\x20\xf7\x33\x6d\x57\x9c\x2f\xa5\x60\xa6\
+\x83\x2b\x90\x49\xff\x00\x1d\x40\x4d\xa9\xef\x30\x40\x0d\x4e\xf8\
+\x28\x5f\x2e\x26\x96\x44\xfe\x0e\xfd\xde\x00\x72\x04\x36\x50\x2a\
+\x90\xbf\x8e\xb4\x22\xc1\xa8\x11\xc5\x84\xda\x1a\x6b\x44\x02\xd1\
+\x46\x98\x7d\x11\x44\x22\xe8\x57\xcd\x37\x95\x1a\x00\x5d\x20\x91\
+\x51\xa1\xdf\xab\x86\xc7\xdd\x0d\x44\xf0\x0e\xa4\xe0\xe6\xc3\x74\
+\x58\x92\x37\x1d\x58\x69\xd8\xae\x04\x4c\x35\x75\xc0\x86\x8f\x40\
+\x50\xc5\x08\xbb\x5e\x92\x5f\x01\xd5\x13\x90\x4d\xc1\x41\xea\xcc\
+\x30\x7f\x16\x39\xd8\xa8\xdc\x91\x52\xb0\xc2\x3d\xc3\x6b\x75\x21\
+\xb1\xbc\x68\xac\x4d\x30\x6e\x48\x4d\x41\x05\xe0\x22\xe9\x27\x8d\
+\x23\x2b\x36\x78\x81\x27\x91\xa8\x1d\x70\xa8\x40\x72\x5f\x92\x21\
+\x92\x61\x70\x6f\x2a\x05\x74\xb8\xaf\x50\x14\xe0\x10\x4e\x17\x75\
+\x20\x62\x34\x20\x55\x8b\x90\xbe\x90\x00\xf2\xb1\x00\x22\x11\x8d\
+\x03\x39\x84\x3c\x01\x1f\x39\x25\x4c\x77\xba\x4c\x25\xc0\x2a\xcc\
+\x89\x31\xb8\x03\x52\xd6\x6b\xd0\xd3\x89\x09\x43\x54\xbd\x8c\x25\
+\x25\x2f\x97\xaf\x54\x6a\xf3\x01\x54\x21\xd1\x20\x0c\x07\x1b\xb0\
+\x1e\xac\x30\xaa\x0f\xf2\x3c\x9b\xc4\x28\xb6\xcf\x45\xdb\x06\xe7\
+\xb9\xc6\x08\xbc\xe8\xe9\x91\x8e\xf2\x7f\x70\x80\x3e\x16\x01\x00\
+\x97\x68\x55\xb0\x24\x21\x1f\x71\x9a\x20\x8c\x03\x83\x80\xc4\x3a\
+\x15\x10\x91\xf2\x20\x4a\x36\x18\xd4\xcb\x44\xb5\x23\x38\xd0\x2f\
+\x61\x99\xf0\x2c\x86\x84\xff\x00\x93\x52\xe5\xa9\x0f\xbf\xcd\x69\
+\x3d\xc6\x19\x71\x0c\xd1\x3f\xf6\x1d\x73\x97\x2c\xc6\x71\xcd\x66\
+\x15\x7c\xcd\x3c\x23\x49\xec\xaf\xb7\xac\xc7\x60\x48\x1f\x21\x10\
+\xca\x6a\xd2\x17\x6b\x8e\xcd\x67\x41\x8f\xe5\x33\xa0\x67\xae\x69\
+\x73\xf6\x5d\x4f\x91\x58\x01\xf6\xd0\xdb\x33\x26\xe0\x7a\x0f\xc4\
+\xce\x88\x84\x17\x0c\xf4\x01\x3e\x3d\x32\x65\x56\xae\xdc\x1d\x58\
+\x4c\x7e\x9c\xc5\xab\x68\xd5\x02\x83\xd3\x70\xc0\x15\x13\x60\xef\
+\xf5\x42\x86\x0a\x30\x5f\x0c\x07\x02\x2d\x2d\x02\x85\x28\x8f\xa8\
+\xf3\x58\xa5\xf5\x2e\xbb\x3a\xa0\x00\x14\x78\x9e\x8c\xaa\x17\x2d\
+\x76\x9e\xd3\x9e\x28\x82\x1d\x26\xba\xee\xe7\xa6\x11\x8c\x96\x0f\
+\x03\x32\x04\x34\x94\x03\x2a\xb2\x13\x0c\xbc\xa3\x01\x14\xda\xc2\
+\x6f\xcc\x8a\xa1\x49\x23\x46\x08\x9c\xb5\x30\xf5\x4d\x9d\x0e\xe4\
+\x85\x2f\x93\x28\xa3\xe5\x85\x44\xa8\x62\xbe\x5a\x4a\xcc\xa0\xe4\
+\x82\x47\xb5\x69\xbb\x60\x91\xf0\x5c\x8e\x3c\xae\x26\x0a\xfc\x3e\
+\x55\x31\x76\xbc\x86\x6c\xd8\x8f\x6c\x36\x4a\x9b\x71\xa1\x01\x5c\
+\x02\x26\x6b\x60\xd3\x62\x01\x91\xad\x74\x85\xce\x1e\x1d\x52\x98\
+\xe9\x15\xca\x7e\xbf\x39\xd6\x15\xcd\x08\x97\x6c\x00\x38\x2c\x0e\
+\xb2\x75\xa6\x45\x29\x61\xad\x48\xa7\x29\x22\xa1\x1e\x98\x07\x0a\
+\x45\xd6\xa9\xc0\x5a\xa1\x13\x83\x76\x04\x35\xb4\x5b\xf8\x42\x99\
+\x31\xa3\xbc\x20\xca\x21\x45\x1e\xb4\xc2\x33\x55\xab\xf3\x5c\xe6\
+\x24\xed\x1c\xf2\xca\x4a\x93\x58\xa6\xd6\xc0\x30\x50\x73\x29\x04\
+\x21\x47\x98\x43\xdc\x0b\x02\xd7\x49\xd4\x60\x0e\x6f\x2a\xb9\xad\
+\x4d\x04\xca\x55\x11\x2a\x96\x4a\x88\x62\xfa\x8c\x48\xd8\x99\x81\
+\xb3\x2a\xab\x53\x09\xf5\x38\xdc\x40\xbf\x22\xb4\xec\xa4\xac\xcf\
+\xc2\x6e\x2c\x0a\xf4\xdd\x3a\x65\x8a\x56\x99\xce\x1d\x32\xc1\x21\
+\xec\x53\xc2\x36\x35\xe0\x7b\x0d\x51\xde\x54\x68\x60\xa7\xc8\xd9\
+\x6c\x6e\x05\x69\x98\xc5\x68\xc9\xe7\x12\x53\x17\xe0\x09\x60\x3a\
+\x3c\x02\xb3\x77\x03\x79\x95\x0b\xb8\xb8\x55\xdf\x79\x84\x17\x56\
+\x05\x2a\x8b\x51\xa5\x60\xa3\xb9\x8c\x38\x19\x80\x74\x4a\x37\x27\
+\x8b\xe9\x1c\x40\x1e\x84\x8f\x40\x5a\x3a\x6c\xf6\x65\x31\xab\xb8\
+\x30\x26\x6a\xd1\x01\x4c\x9b\xc8\x5a\xb4\xe5\x50\x4f\xad\x07\x3b\
+\x3e\x80\xa0\x1d\xaa\x5f\x03\x80\x79\x58\x47\xed\xe2\x27\xc4\xe9\
+\xcd\x00\xed\x9c\x1d\x43\x00\x5a\x25\x86\xfd\x76\xf4\xe6\xc1\x80\
+\x33\x34\x42\x01\xc8\x9e\x42\x91\xd9\xbe\x18\x19\x05\x14\x68\x89\
+\xe1\x8c\xa8\xaa\x96\x4a\x80\x97\x00\x14\x1b\x57\x47\x50\xab\x8c\
+\x91\x26\xe8\x09\x1a\x8a\x95\xa2\x00\x67\x1b\x05\x01\xf4\xed\xbc\
+\xd5\x26\x20\x15\xc2\x2a\x9c\x95\x20\x67\xf0\x85\xa9\xb6\xf3\xcd\
+\x10\xa5\xb7\xc4\x9f\x45\x4a\x2a\x31\xd1\xd5\xe9\x93\x26\x10\x6e\
+\x0a\xc9\xc0\x2e\x59\x0f\x32\x49\xeb\xcd\x97\x9f\x92\x53\x40\xc8\
+\x8f\x1b\x34\x51\x69\x5b\x4d\xb9\x86\x11\x82\x15\x8a\x47\x9a\x12\
+\x2b\x88\x5e\xbc\xae\x85\x21\x50\xab\x43\x84\x80\xe2\xbd\x9d\x20\
+\xcb\x21\x00\x15\x60\x7c\x84\xd8\x7c\x5c\x90\x12\x13\x06\x2d\x1e\
+\xd3\x6e\x23\x86\x40\x21\x3a\x3a\xf4\xb3\xc8\xd4\x08\xe1\x12\x0c\
+\xc0\x4d\x4c\x9d\x4b\x76\xac\xd3\x36\xdc\xc8\xde\xf7\x53\x6f\xa8\
+\xab\xbb\xb0\x38\xc8\x04\x7a\x28\xc1\x0c\x49\x31\x18\x0f\x8c\x8a\
+\xc5\xc6\x84\x0a\x8a\x2d\x7a\x8e\xcb\xdd\x98\x44\x47\x1b\x66\x31\
+\x2a\x1b\x19\x32\xd4\x76\xc1\x70\xf9\x91\x3a\xc6\xe4\x1e\x59\x9b\
+\x4c\xd0\xba\x50\x41\x65\xf2\x7f\x0e\xac\x37\x84\xcf\x02\x8b\x13\
+\xa4\xaf\xaf\x2a\xab\xd7\x22\x09\x1c\x80\xd2\xfa\xa3\x78\x10\x3b\
+\xb6\xb7\x5a\x29\x19\xd0\x7d\x65\x98\x7a\x7f\xc1\x3b\x7a\x2c\xd1\
+\x93\x4a\xa0\x22\x36\x0f\x08\x36\xf9\xd1\xf2\x94\x61\x95\x4a\x38\
+\x82\x18\x02\xd9\x34\xcd\x6f\x62\x3d\x94\x61\x56\x09\x0a\xf2\x41\
+\xe3\x5a\xca\x92\xb9\x7a\x2b\x30\x2d\xe9\x1f\x3c\x30\x09\x84\xdd\
+\x4d\x95\x45\xe1\x8a\xec\x25\x86\x68\x25\x34\xf9\xde\x28\x38\xd1\
+\x73\xa0\xf9\x6d\x5a\xfa\x20\xaa\x04\x29\xfb\x66\x46\x80\x58\x24\
+\x35\x00\x87\x57\xbe\xe2\xc1\x28\x22\x14\xf8\x1f\x89\x21\x15\x14\
+\x5a\x02\x12\x8e\xfa\x09\xa3\x52\x4c\xbb\x04\xcf\xde\xb0\xdd\x84\
+\x8e\xc1\x70\x42\x5a\x36\x97\x1a\x48\x1d\x50\x05\x1e\x3c\xad\xd2\
+\xc9\x93\x05\xe1\xbc\xe2\xce\x22\x31\xc6\x1b\x87\x51\x06\x49\x1c\
+\x45\xe4\x82\x8f\x1a\x82\x10\x86\x5b\x3f\x35\x67\x98\x22\x29\xc4\
+\x08\xa9\x63\x03\x19\x95\x0b\x50\xd8\x70\x97\x66\xb0\x1e\x23\x63\
+\x45\x20\xa2\x4b\x97\x76\x7f\xca\x62\x3f\x28\x13\x1c\x48\x06\x2e\
+\x23\xba\xa7\xe3\x0c\x83\x7a\x66\x03\x60\x44\x96\xa9\xe0\xd5\x00\
+\xc9\x75\xa3\x59\x92\x75\x7c\xc8\x43\x46\x0b\xbe\x08\xf4\x10\x53\
+\xb8\x31\xb8\x28\x48\x8c\x89\x41\xc2\x98\xd2\x98\x48\x6b\xac\xcb\
+\xbf\x14\x12\xc1\x72\x55\x20\x92\x9c\x32\x95\x30\x91\x9a\x8c\xb4\
+\x74\xc8\xb3\x07\x43\xa6\x38\xac\xda\x9d\x93\x75\xcb\x4e\xe7\x4d\
+\x31\xab\x3c\x88\x74\xea\x7b\xdd\x27\x45\x14\x25\xa5\x1a\x46\x56\
+\xcb\x48\x82\xc8\x88\x29\x11\xb4\x29\x95\x83\x4a\x63\xd4\x0b\x93\
+\x6a\x42\x53\x81\x1c\x89\x91\xf2\x11\x68\xaa\x09\x7a\x43\x80\xf6\
+\x81\x6c\xa0\xad\x1c\xaa\xa6\x3b\xc8\x0d\x0b\x52\x83\x44\x2f\x3e\
+\x65\xcc\x08\x41\xa4\x45\x36\x0d\xf0\xd6\xb1\x3a\x7c\x29\xa3\x03\
+\x04\xa2\xbe\x36\x9d\xca\x0e\x87\x74\x12\xb4\x67\x31\x82\xed\x84\
+\x1d\x2d\x6a\x20\x6d\x7f\xc1\xae\x13\x41\xd9\x39\xa6\x4c\x54\x58\
+\x99\xce\xbb\x91\x46\xa1\x09\x17\xb5\x0d\xc0\xed\x78\xca\x72\xf4\
+\x4a\x09\xb0\xda\x10\x23\x49\x10\x76\x43\x41\x63\x5f\x2c\xe4\x28\
+\xe0\x48\x0a\x52\xec\xaa\x61\xe7\xf0\x0d\x5f\x53\x16\x0b\xab\x4a\
+\xab\x5a\x84\x67\x5c\xbc\xb8\x9d\xc5\xf5\x53\xe3\xcb\x62\xcb\x42\
+\xc9\xf5\xc2\xe5\x72\x9f\x35\xbd\x35\x61\x0a\x5f\x9c\xe2\x2a\xec\
+\x58\xf9\x1c\x69\xab\xf6\x74\x88\xd6\x84\x47\x67\x65\x6f\xb6\xbc\
+\x60\xb5\x55\x02\x24\xb8\xaa\x3f\x41\x6e\x56\x43\x51\x32\xc0\x88\
+\x13\x56\x34\xfe\x78\xd0\x26\x6b\x5b\x53\x36\xa8\x35\xe7\xa2\x9a\
+\xc5\x86\xb4\xa5\x19\x8f\x6b\xc1\xbd\xd5\x61\xb3\x17\xcd\x14\x4d\
+\x74\xd5\x63\x2c\x4d\x8c\x4a\xae\x25\x4f\x6a\x90\x92\xd2\xc7\xf6\
+\x8b\x53\xde\x99\xf5\x77\x07\x9a\xa5\x2e\x34\x22\xbb\xc0\xfc\x54\
+\xe6\x75\x39\xcb\xcd\x8c\x13\x09\x82\x4e\x2b\x76\x6a\x6e\xa1\xf6\
+\x0f\xd9\xd1\x25\x36\xb3\x4e\x44\x51\xda\xac\xf8\x19\x4a\x35\x42\
+\x2a\x81\x51\xf0\x6f\x6d\xe8\xcd\x82\x23\x66\x44\x30\x71\xf4\xd9\
+\x14\xcb\x6f\x76\x81\x18\x2d\x43\xfb\x63\x9f\xed\x88\x2c\xe6\x66\
+\xaf\x4a\x59\x6f\xd5\x7b\x14\xb0\x24\x92\x34\x8e\x79\xb8\x43\xba\
+\xe0\xcc\x66\xd4\xdb\xd0\x94\x6d\x6d\x71\x2d\x88\x11\x68\x90\xce\
+\xb2\xe4\x5d\xc5\x6a\x09\xad\xf0\x63\xd7\xd3\x35\x4b\x8e\xa5\x4b\
+\xf9\x90\x8d\x15\xf0\xfb\xca\x56\xfc\xc6\x07\x44\x10\x1f\x81\xbe\
+\x66\xc7\x88\xb6\x31\x77\xbe\xef\x14\xf0\x5a\x09\x7e\xa6\x94\x48\
+\x70\x4a\x56\x08\xe1\xb2\x46\x21\xd2\x84\x98\xa9\x4c\x1b\xb2\x7b\
+\x67\x97\xbd\x5e\x92\x5c\x1c\x92\xb6\x6f\xd6\x79\x49\x87\x5c\x81\
+\x21\x2e\xf3\x8f\xc7\x18\xb4\x72\xad\xdf\x60\x48\x0f\x25\x11\x66\
+\x91\x42\x22\x3c\xc2\x04\xae\xbd\xa5\xc3\xac\x5e\xae\xa1\xce\x58\
+\xf5\x42\x3b\x60\x89\x56\xad\xc4\xa0\x23\x67\xa8\x83\x8d\x6c\x0e\
+\x33\x5c\x33\x57\x9f\x80\x02\x6b\xa2\x94\xaf\xac\x79\x2e\xa1\xe2\
+\xdf\x2c\x8a\xd5\xe0\x21\xc0\x06\x3a\xd1\x1d\x63\x00\xa9\x28\x0c\
+\xb7\x31\x0f\xe3\x8a\x41\xf1\xd3\x06\xea\x9c\x58\x2a\x8b\x25\xc4\
+\x4c\x30\x90\x40\x61\xda\x36\x61\x3b\x80\x2d\xc5\xa2\x3a\xd4\xc2\
+\x83\xda\x4a\xa1\xcc\xe7\xa8\x6d\xbd\x29\x43\x38\xa0\x21\x92\xf2\
+\xb5\x2a\xc4\x46\xc0\x91\x86\x4e\x52\x08\x87\x32\x85\xdd\xe9\x17\
+\x44\x94\x6b\xe0\x4d\x46\x3b\x28\x57\x8b\x0e\xc7\xa7\x71\xae\x77\
+\x06\x2a\x14\x93\x08\x5c\x5d\x14\x84\xeb\xe2\xb0\x90\x6f\x43\xc7\
+\x6d\x96\xc5\xac\xbd\x99\xd0\x3d\x1c\x72\xd2\xe5\xe0\xe8\xad\x77\
+\x2a\x0e\xf0\x7c\x20\x99\x45\x40\xaa\xff\x00\x5f\x10\x2d\x3f\x86\
+\xc2\x4f\xb7\xe5\x82\x40\x29\x1d\x9f\x6c\x42\xce\xf8\xf9\x5a\xa5\
+\x39\x76\xf1\x62\xc3\x94\x58\x0c\xca\xab\x1e\xaa\x61\xda\x2d\xb9\
+\x6c\x95\x47\xe6\x87\xd1\x68\x80\x22\xa9\x1a\x88\xbd\x41\x07\x2d\
+\x2f\xa5\xbe\xa0\xa7\x1b\x07\x2a\x30\x90\xcb\x4d\xc7\x0d\x34\x0c\
+\xd7\x69\x2a\xf7\xc6\xea\x4a\x28\x21\xdd\x34\x8d\xb9\xf1\x72\xd8\
+\x1a\x83\x05\x4a\x18\x88\x61\x51\x30\xda\x88\x15\xa8\x1b\x6f\xb4\
+\xc4\xf5\xef\x3a\x66\xe2\x68\x92\x88\xe1\xa8\xbe\xf8\x7e\xa0\xca\
+\xad\x5b\x05\xc3\x7a\x51\xf1\x6c\x38\x79\x70\x73\xe0\x41\xe0\x92\
+\xbd\x1a\x8a\x82\xe3\x87\x7d\x59\x2f\x32\xf1\x14\xd8\x05\xfb\xd6\
+\xb1\xc6\x47\xb5\x4d\xb8\x41\x58\x0f\x71\x82\x72\x01\xf8\x65\xba\
+\x72\x89\xa1\x8b\x51\x07\xac\x77\x83\x86\xd5\x14\x88\xbe\x00\x50\
+\xa2\x67\xdb\x70\x50\x94\xd6\xd1\x38\xda\x0c\x29\x97\x85\x26\xac\
+\x83\x13\x50\x4a\x43\x99\x0d\x8b\x38\xe2\x86\x99\x8e\x9f\x79\x7e\
+\xc2\x6f\x45\xda\x99\x8e\x22\x23\xd4\x0b\x0e\x42\x00\x02\x59\x67\
+\xb4\xea\xcc\xd2\xb6\xa1\x88\x30\x49\xbd\xb4\xd5\x0c\x45\x4b\x0d\
+\x4c\x4e\x0f\x21\x11\x5b\x85\x50\x0d\x0a\xa4\x9f\x8d\xfa\x81\x35\
+\x5e\x24\xc0\x69\x39\x9b\x0c\x53\x40\x79\xa5\x28\xa0\xdf\xef\x12\
+\x42\xbe\x2c\x50\x0c\x78\xb2\xa6\x5a\x88\x5f\xb8\x98\xc0\xc6\x91\
+\xd4\x1b\x12\x80\xaf\x41\x0a\xe2\x1b\xbb\xfa\x02\x73\xe2\x6e\x7a\
+\x06\x07\x1d\xc4\xda\x5b\x72\x08\x8f\x19\x99\x42\x25\x1a\x4a\x4b\
+\x52\x08\xd2\x98\x16\xd3\xc3\xda\x3e\x6d\x24\x17\xe5\x91\x5f\x26\
+\xf2\xc2\x02\x04\xbb\xd0\xb3\x90\x45\x44\xa2\xcf\x20\x41\xe1\xb7\
+\x2e\xa1\xaf\x75\xcb\xae\xcb\xdf\x9b\x96\x61\x35\x8a\x0a\x01\x1b\
+\x73\xe7\x8d\xfd\x51\x44\x9c\x56\xb0\xbb\xa6\x1d\x94\x5a\xcd\xca\
+\x7d\xa9\x4a\x4b\x80\xea\xa1\x6b\x10\xb0\x1f\xb6\x89\x4e\x6a\x6c\
+\x99\xd1\x45\xd0\x98\x8f\x47\x4b\xa2\xf2\x01\xf5\x20\x9f\x58\x40\
+\xcb\x1d\x93\xa3\x43\x0e\xc1\x6a\xcc\x5d\xc1\x12\x72\x0d\xc9\x20\
+\x72\x4a\x02\x7a\x08\x4a\x58\xe1\x00\x55\x26\x5f\x45\xc2\x99\x57\
+\x1f\x0f\x7f\x42\xb6\x22\xd0\x12\x36\x07\x80\x9a\x00\x2b\xeb\x20\
+\x48\x73\xc8\x07\x2f\xa2\xbc\x94\x85\x01\xd4\xc5\x1f\xab\x98\xd3\
+\x58\x14\x08\xad\xc7\x62\x4c\x45\xdd\x1f\x3c\x54\x57\x4e\x1c\x82\
+\xb7\x29\x58\xa9\xeb\x10\x78\xd3\x9c\x03\x49\x4a\x55\xd9\x4f\x91\
+\xa3\x4c\xea\xdd\x26\x3b\x5e\x6f\x21\x70\xd8\x7f\x08\x21\x0b\x74\
+\x04\x93\x67\x7b\xec\x4b\xe4\xda\x4e\xd0\x89\x59\x75\x2c\xc6\xc5\
+\xff\x00\x1e\x60\xd8\x96\x88\xe5\x48\x45\x06\xc0\x81\xb8\x8b\x60\
+\xdb\xa0\x47\x2a\xb0\xdb\x66\x95\x76\xf6\x89\xa4\xac\x13\x8a\xa0\
+\x61\x5c\x45\xfa\x13\x2f\x98\xb0\x68\xa4\x86\x44\x45\x00\x59\x6a\
+\xd0\x32\x80\x53\x1a\x3b\x56\xe4\x01\x08\x6a\x4c\x35\xce\xd8\x89\
+\xf3\x6b\x03\x1a\x41\x2f\xb8\x5c\x68\x0c\x54\x8c\x3b\x72\x41\x52\
+\x8c\x24\x0f\xb8\x12\x2b\xca\x50\x27\x32\xb2\x61\x28\xb6\xc2\xe0\
+\x7a\x7c\xb3\xba\xd8\xb3\x6d\x26\xd8\x35\x4b\xd0\xe6\x8f\xaa\x7b\
+\x12\xc1\x34\x10\x87\x11\x78\x83\x5c\x4d\x46\xed\xd8\x18\x0f\xf2\
+\xe8\x19\x87\x0e\xbe\x70\xcb\xa3\x9d\x77\x38\x41\x22\xbd\x48\xf0\
+\x3c\xae\x68\xe2\x14\xac\x4b\x13\x42\x9d\xb5\x02\xe7\xc3\x9b\x31\
+\x52\xb3\x2f\xb5\xca\xba\x41\x2a\x51\x27\x97\x62\xfd\x5c\x30\x40\
+\xa2\x7b\x28\x10\x7f\x0a\xe7\xb8\x01\x46\x0f\x95\x60\x6a\x89\xd1\
+\xbd\x8e\x6c\x45\x9a\x34\x9d\x40\xe9\x04\x1c\xb8\x1f\xc9\xd9\x85\
+\x4b\x93\x86\x86\x11\x00\x26\xca\x77\xa5\xe6\xc1\xe4\xa9\x4c\x64\
+\x9c\x7d\x95\x33\x07\x46\xaa\x05\x0d\xaf\x10\x57\xad\x48\xb1\x03\
+\x26\x16\xab\x3f\x42\x2f\xdb\xfe\x90\x96\xc9\x40\x48\x61\x30\x66\
+\x01\xad\x84\x67\x31\x51\xc7\xd0\xc0\xfe\x8e\x90\x49\x22\x52\x66\
+\xa6\xb9\xc1\x8e\xa1\xc2\x27\x8a\x37\xd2\x1d\x59\xeb\x58\xc5\xc1\
+\xf2\x3d\x14\x75\x20\x44\x0a\x62\xb2\xf6\x0b\x56\xa4\x61\x5c\xed\
+\x83\xcc\x64\x7a\x16\x94\x8d\x13\xaf\xbd\xc6\x8b\xa0\x6d\xe4\x51\
+\xcf\x38\xc3\xa0\x09\x48\x89\x6c\xa6\xab\x05\x78\xf5\x70\x50\x0f\
+\x0f\x04\xbb\x6a\xc6\x59\xec\xc6\x3a\x75\x34\x9e\xf2\x2f\x06\x48\
+\x6a\x1a\x02\x89\x85\x41\x57\x06\x5b\x80\x28\xd1\xd5\x21\x21\x09\
+\xaf\x6a\xaa\x62\x8d\xd4\x1a\x13\x9a\x61\x69\x56\xb3\x6c\x6a\x08\
+\xd7\xd0\x51\x40\x18\x89\x60\xd3\x02\x3b\x9a\x82\xb7\x22\x6e\x2a\
+\xad\xc8\x1b\x37\x01\x42\x91\x82\xc4\xd3\x7f\x7f\xbd\x78\xbd\x6f\
+\x92\x73\x13\x2b\x9e\xbe\x0c\x47\x04\x14\x85\xf4\xe7\xdc\x9b\xab\
+\x2a\x2e\xae\x3d\x5b\x91\x97\xa7\x88\xab\x58\x86\x4c\x05\x6e\x93\
+\x77\x21\xe0\x51\x23\x44\x08\xe8\x07\x9d\xda\x4f\x18\x48\xa7\x83\
+\x69\xae\xe9\x76\x0c\x04\x16\x17\x03\x34\x00\x0e\x6d\xd6\x3c\xdd\
+\x19\xa0\x8b\xa3\x96\x9d\x23\x64\x9f\xb2\x81\x13\x2e\xba\x4f\xb0\
+\x19\x8d\xf4\x09\x71\x28\x22\x71\xea\x87\x90\x2f\x29\x60\x66\x23\
+\x4b\x41\xc1\xe4\x5c\x3f\x90\xba\x85\xa5\x39\xf3\x83\xd2\x09\x3d\
+\x13\x4e\xef\x20\x10\x19\x99\x0e\xe2\x3c\x3b\x6b\xdc\x4b\x0a\x23\
+\x35\xa8\x08\xda\xb4\x04\x61\x12\x3b\xa7\x5f\x23\x35\x6c\xa4\xe7\
+\xc0\xba\x95\xa2\x8d\xbc\xf8\x7d\x4a\x00\x5d\x0b\x70\xb7\x40\x8d\
+\xa2\x20\xc6\x2d\x6b\x18\x78\xad\xd6\xa2\x1c\x48\x23\x1e\xcc\x4e\
+\x9d\xc4\x88\x43\x74\x1b\xa8\x16\x80\x47\x12\xba\x98\x49\x5f\x44\
+\xbb\x9e\x8d\xc9\x21\xc2\x16\xd4\x40\x9c\x59\x4c\x1c\x53\xa2\x81\
+\xaf\x15\xca\x86\x8e\x1d\x52\x03\x5a\xc0\x81\xd9\x33\x67\x74\x96\
+\x08\x1f\x9c\x45\xc7\x31\xa7\x35\x98\x8a\x2c\x02\x21\x48\x05\xc3\
+\xb9\xd6\xba\x05\xe2\x7e\x02\xdc\xcc\x60\x34\x4e\x01\xde\x04\xca\
+\x6e\xd1\x80\xb9\xd8\x58\xbd\x7b\x01\xab\xea\x62\x41\x52\xb1\x92\
+\x94\xd6\x93\x89\x31\x59\xab\x34\xf8\xfc\xba\x38\x70\x2c\x78\x04\
+\x04\xbc\x33\xe0\xdd\x02\xb4\x54\x54\x9b\xa2\x2e\xc1\x16\x95\x63\
+\xf8\x60\xbd\xe4\x2c\x5f\x0d\xc2\x07\x11\x00\x4b\x5d\xd4\x94\x31\
+\x2e\x30\xfe\xc7\xaa\x0d\x41\xad\x6c\xcf\xa8\x18\xe0\xf8\xb3\x6f\
+\x71\x3e\x54\x8f\xcf\xf3\x70\xc0\xdf\xfb\x50\x4b\x2c\xd6\xa4\xb6\
+\x77\x5d\x09\x1d\xb9\x46\x29\x3f\x51\x91\xac\x48\x05\x40\x0a\x61\
+\x7f\xbc\x5f\xb6\xd3\x9c\x48\xc6\x15\xb3\xad\x1c\x1b\x43\xb0\xee\
+\x0e\x4e\xfa\x27\x40\x53\x11\xdd\x14\x0f\xda\x9c\xb6\xa4\x50\x89\
+\x67\xba\xd4\xdc\x0a\x55\x09\x2b\xf1\x94\x69\xd3\x02\x69\xd3\x34\
+\xc1\xad\xc4\x90\x0d\x21\xea\xe2\x49\xd7\x80\x12\x43\xc9\x67\x90\
+\x9b\x8d\xe9\x85\x26\x0d\xf0\xcb\x23\x02\x91\x98\x1a\xb9\x1e\xdf\
+\x1b\x00\xb5\x39\x6f\x0b\x30\x05\x74\x6b\xed\xf9\x05\xe5\x79\x8f\
+\x5a\xac\xe7\x4c\x44\x23\x5e\x1a\xe3\xcc\x02\x86\x71\x0e\xa0\x89\
+\x2e\xa6\xe4\x3a\x1b\x21\x70\x18\xc1\x09\x91\xec\x54\x66\x48\xd8\
+\x83\x44\x4a\x46\x6b\xb3\xa6\x36\xcd\x45\x18\x51\x7a\x61\xba\xa3\
+\x01\x42\x62\xcf\x27\xa2\x62\xa9\x3a\x58\xe6\xe3\xdb\x59\x76\x93\
+\xbd\x4d\xbd\xa9\xc4\x06\xcb\x88\xc4\x46\x4d\x04\x9d\xb8\xc6\x15\
+\x02\x8e\x30\x64\x56\x82\x97\x73\x9a\x83\x4a\xb0\x21\x75\xd6\xbc\
+\xe9\x45\x09\x54\xd7\x21\xde\xa5\xc6\xeb\x74\xcf\x5e\x62\xcb\x70\
+\x5e\xaa\x1c\xfc\x4f\x21\x8e\xc0\xad\x84\x25\x59\x09\x11\x4f\xc3\
+\x86\x32\xbd\x67\x9e\xe4\x2f\x45\x15\x4d\x80\x93\xeb\xc9\x93\x17\
+\x3b\x63\x23\xfb\xab\x28\xc0\xce\x65\x89\x33\x5f\x06\xc8\xca\x39\
+\x0a\xd2\x6d\xd6\x48\x72\xe0\x6f\xb1\x15\x8d\x2d\x4b\x65\x68\x80\
+\x63\xea\xfc\x70\xd1\x76\xd3\x24\x09\x7b\xcd\x2f\x47\x4e\x04\x55\
+\x37\x95\x36\x0e\xdf\x85\xea\x33\x4a\x11\x03\x00\x43\x56\x55\xc0\
+\x92\xf6\x58\x12\x28\x41\x3a\x26\xec\x4f\x29\x30\xef\xc1\xe2\x16\
+\x2d\x30\x66\xfb\x53\x81\x95\x68\x63\x82\x7e\xf4\x1a\x80\xec\xc0\
+\x87\x3a\x66\x9e\xb5\x4e\x7e\xf9\x3e\x17\x61\x8b\x61\xdc\x2d\xbc\
+\x25\x4e\x0e\x05\xa8\xb5\x31\x84\x88\xbe\x09\x30\xa8\xe3\x1c\x6c\
+\x49\x26\xcd\xae\x9b\x09\x8c\x30\xc3\x17\xb6\xd0\x52\x89\x1b\x00\
+\xac\x1b\xbd\x4d\x9b\x5d\x80\x89\xd4\x10\x03\x1a\x6e\xdd\x42\xbc\
+\x1a\xa8\x0d\x12\x01\x74\xb5\x76\xa5\xad\x8f\xa0\xf0\x2d\x95\x14\
+\x33\xfc\xe6\xd2\xad\x4a\x36\x25\x65\x13\xaa\x96\xec\x0e\x8d\x37\
+\x7e\x0e\x2e\x2c\x3f\x78\xe6\x42\xcb\xf3\xec\xa7\x9b\xb1\x9c\x3a\
+\xb7\x8b\xef\x3c\x32\x90\x59\x9a\x23\x8a\xbb\x4d\x75\xdb\x0e\x81\
+\x5d\x39\xd9\x3b\x46\x07\x73\x88\xdf\xa9\x3c\x36\x61\x60\x43\x80\
+\x18\x27\xfe\x91\xad\xed\x79\xd9\x6e\x41\x93\x74\xd4\xa2\xf5\x0c\
+\x63\x4c\x25\x00\xe0\x32\xc5\x80\xd1\xac\xd8\x0b\x0c\xb5\xb2\xc1\
+\xc1\x49\x85\x30\xe4\xb2\x67\x06\x1d\x67\x6c\xe0\xe2\x3d\x4a\xe2\
+\x3f\x6e\x24\xf0\x01\x20\x24\xec\x4a\x5c\x51\xad\x44\x8d\x61\x00\
+\x24\x20\x37\x20\x2d\xb9\x7e\x0c\xcd\x10\x85\x6e\x74\x12\xdd\x21\
+\x21\x77\xa5\xe2\x6c\x5b\x04\x73\x91\x08\xd5\xa9\x05\x53\x24\x7f\
+\x9c\xcc\x77\xa1\x99\x40\x5e\x93\x91\x09\xdc\xca\xaf\x06\x48\xa4\
+\xa8\x38\x1c\x01\x97\x8b\xcb\xed\x40\x6d\x61\x5c\x76\x3f\x59\xac\
+\xe5\x34\xca\x1b\x7d\xda\x92\x8e\x44\xa9\x97\x75\xc2\x59\xe1\x12\
+\x0d\xd6\x3e\x92\xe9\x17\x5d\x3b\x80\x20\x69\xa5\xc5\x04\x84\x05\
+\xd6\x14\x86\x2c\xd0\xbb\x5c\x28\x91\x42\x98\xf9\xd8\x45\x01\x08\
+\x6e\x9d\xb8\x06\xb7\x49\xa4\x5f\xc9\x17\xa8\xaa\xb0\x11\x38\x7b\
+\x68\xd7\x91\x81\xc1\xc0\xdd\x76\x01\xcb\x12\x58\x20\xba\xc5\xe7\
+\x18\x00\xd0\xaf\x29\xe1\x18\x10\x01\xe3\x61\x07\xa6\x14\xe9\x9a\
+\xb5\x5c\x35\x91\x45\x39\x89\x12\x01\x48\xf4\x21\x2a\x2a\x78\xa3\
+\xa6\x53\xcb\xa2\x2a\x2a\xc5\x16\x2e\x41\xb9\x86\x38\x92\x17\x95\
+\xbc\x13\x56\x44\x89\x6e\x3d\x86\xa9\x43\x73\x73\x29\xbe\xe5\x7e\
+\x69\xf0\x7e\x06\x60\x1a\x7a\xa2\x67\xdd\xd5\xba\xfe\x19\xa4\xb8\
+\x70\xa8\x4e\x0c\xea\x96\x28\xbc\x80\xdc\xcf\xb5\xc0\x24\x5d\x60\
+\x2f\x2a\x51\x69\x10\x69\x15\xa9\xe0\xcc\x8e\x00\x9e\x85\x2e\x7e\
+\x67\x9a\x50\x80\xa1\xec\x70\x4a\x25\xa2\x44\xe7\x3b\xd0\xe0\xc1\
+\x6e\xe2\xd9\xa5\x9d\x4c\x5b\x13\x1a\x04\x97\x40\xd3\xa9\xb8\x0d\
+\x4d\xab\xda\xd9\x66\x25\x5b\xc2\xc4\xcc\xb0\x40\xf7\x20\x11\x64\
+\x16\xfb\xd4\xef\x6a\xae\x85\x14\x9c\xf5\x95\x0f\x32\x36\xcf\x0b\
+\x45\x4a\x44\x46\xc8\x0a\x08\xad\xc3\x49\x6c\xdd\x18\x5c\x45\x3b\
+\xa1\xa2\xaa\x77\xca\xd9\x1a\xae\x5d\x99\x24\x52\xdf\x58\x3d\x35\
+\xba\x63\xe4\x13\x84\x0f\x30\x3b\x1b\xd6\x05\xf2\xcb\xb4\x8c\x04\
+\x2e\x52\x35\x1e\x2a\xfb\x0c\x33\x80\xd5\x99\x64\x5e\xa1\xf5\x84\
+\x9c\xf8\x0d\xf0\xc4\x29\xe7\x25\x36\xe3\xdd\x80\xc9\xca\x31\x97\
+\x28\x36\x6b\x96\x8b\x46\x24\x15\x57\x6c\x01\x30\x98\x17\x9b\x8d\
+\xc6\xb2\x73\x53\x52\x0c\xf0\x20\x2b\x04\xda\x2f\x12\x0b\x40\x7d\
+\x5e\x21\xee\x19\x44\x3a\x00\xc5\xed\x80\x4a\x6a\xd8\x39\x6b\xcb\
+\x9a\xda\x4f\xd2\x68\x72\xfd\x99\xf8\x4a\xb6\xac\x08\x04\x10\x00\
+\x17\x29\x60\x7f\x76\x92\x78\xcc\xcf\x7c\x6c\x98\xcb\x40\x9d\xe0\
+\xd4\x1c\x5f\x1f\x3a\x3d\x92\xf8\xb2\x76\x04\xae\x8a\xa1\xb8\x0e\
+\xa9\x7a\x59\xe0\x50\x18\x1d\xa1\x7b\x2b\xa9\x02\x0d\x06\x32\x3a\
+\x6a\xf2\x6e\x9a\x4c\xa1\x2d\x81\x6f\x1d\xcb\x3c\xe6\xbb\xf4\xba\
+\x09\x46\xb1\x48\x06\xd8\x41\xed\x0a\x95\xaa\x78\xc3\xd9\x65\x29\
+\x41\x6c\x40\x6e\x2e\x8c\xdc\xdc\xbf\xc0\x8a\x76\xa5\x45\x3f\x8c\
+\xd8\xd2\x17\xd9\x44\xeb\xc3\x6f\x96\xb7\x96\x7a\x43\x28\x0f\xe0\
+\xc0\xb0\xba\xf3\x12\xda\x90\x35\x2c\xb8\x34\xac\x1b\xab\x86\x81\
+\x12\x6a\xd3\x88\x84\x20\x19\x37\x30\x66\x6a\x2c\xc5\x44\x09\xb0\
+\x0a\x48\x2c\x24\x0e\x85\x1c\x1f\xd8\x37\xdf\x10\x70\x30\xa8\x9e\
+\x29\x50\x3c\x25\x0a\xa2\xb3\x7a\x15\x70\x3c\x52\x12\x32\x8f\x64\
+\xdb\x0d\x1c\x35\x0d\xb7\x33\xb4\x25\x23\x43\x7b\x90\x13\xc3\xba\
+\x95\xb4\x52\x54\xb8\xeb\x07\xc9\x7e\x90\x0c\x83\x5e\x94\x41\xbb\
+\x43\xf2\x92\x81\x42\xa2\x36\x3d\xc0\x52\x5f\x60\xb4\xd3\xc0\x00\
+\xa4\xb9\x14\x88\xb2\xe8\x28\x10\xe4\x2d\x93\x5f\x22\xac\x9b\xce\
+\xb4\x12\xb8\x95\x15\x1c\x63\x63\xb4\x54\x0e\x62\x96\x96\xfb\x25\
+\x2b\x1a\xd4\xd6\x59\x82\x9f\x23\x55\x0f\x5b\x0c\x6e\x84\xdc\xe2\
+\xa3\xa0\x32\xc2\x40\x27\x58\xec\x13\x77\xb9\x82\x55\x09\xdd\x28\
+\xdc\x63\x79\x03\x03\x60\x3d\x3d\xaa\x0e\x57\xc9\xd9\x30\x4d\xad\
+\x1f\xa4\xa8\xc9\xac\xdc\x56\x19\xec\xec\x82\x15\x00\x50\x90\xd7\
+\x5e\x42\xc6\x86\x0c\x32\x83\xa1\x4c\x4a\x55\xe6\x88\xa2\x02\x71\
+\x29\xa4\x03\x6e\x25\x5d\x54\xad\xf9\x86\x5b\xd3\x73\xcc\x10\xee\
+\x01\xf9\x4e\xf1\x3f\x8f\x80\x9b\x00\x82\x06\x8a\xd0\xb1\x3d\x50\
+\xf8\x1a\xf9\x23\xe2\x65\xb4\x96\x48\x2e\xdd\x9d\xd1\x50\x6f\x69\
+\x40\xc5\x41\x6d\x13\x8f\x86\xf5\xa2\x2d\x65\xc1\x9f\x80\x20\xa0\
+\xda\x30\x81\xd7\xf5\x2a\x40\x96\x26\x80\x7c\xfb\x9a\x2b\x77\xa3\
+\xb3\x48\x89\x50\x35\x55\x2f\x31\x30\x69\x2a\x3e\x24\x12\xd0\xf4\
+\xc4\x07\x03\x6e\x04\xc2\xba\x51\xb4\xa6\x42\xb2\xb5\xf5\xb4\x9d\
+\x1d\x36\xe9\xea\xfa\x62\xf0\xb7\xed\x3c\x83\x60\x28\x34\x09\x23\
+\x52\xf0\x6a\xfc\x52\x0a\x2d\x0b\x66\x0d\x02\xed\xc8\x64\x46\x7d\
+\x37\xd0\x52\x06\xd8\x01\x5b\x7c\x2e\xff\x00\x3d\x90\xc0\xca\x68\
+\x68\xed\xa3\x69\xb3\x4f\x89\x9b\xac\xe9\x39\x7a\x18\x06\x06\x2c\
+\x40\x64\x24\xee\x48\x2b\xbc\xd1\x7c\xd5\x50\x39\x10\xd4\x9a\x1a\
+\xb3\x17\xeb\x9a\x0a\x04\x99\x26\xb2\x16\x38\xf7\xa7\xb7\x01\x3a\
+\x98\x33\x15\x1a\xb2\x0e\xd6\x23\xd4\x4d\x62\xc6\x31\x0a\xdb\xe2\
+\x7a\x21\x73\x80\x6d\x4d\xb8\x12\x84\xc7\x5b\x46\xf8\xc7\xee\x06\
+\x36\xec\x41\x02\xbe\x83\xd8\x73\xca\xfc\x06\x8d\x86\xeb\xe3\x79\
+\xcf\xce\x6a\x7d\xae\xb2\xec\x5c\x0b\xd4\x05\x12\x02\x1d\x83\x0a\
+\x00\x21\xa8\xea\x20\x2d\xb6\xa6\x87\x01\xa5\x18\x9d\x6e\xdd\xd6\
+\x88\xdc\x30\x0c\x26\x20\xe1\x89\x77\x36\x16\x9a\x91\xa6\x3f\x0a\
+\xe0\xeb\xb2\x58\x48\xc6\x6d\x37\x67\x51\x15\x80\xef\x4b\xf2\xa2\
+\xef\x53\x77\xe9\x2a\x1b\xa7\x5a\x0e\x2c\x08\x12\x4e\xf9\x60\xbd\
+\x09\xb3\x02\xc2\x93\xd4\x46\xe8\x0f\x90\x8a\x15\x8d\x80\xb1\xd0\
+\xed\x9f\x45\x69\xef\x7a\x1a\xa3\xd1\x35\x63\xb1\x25\xa5\xd0\x1d\
+\x07\xc8\x34\x34\x0e\x90\xa2\x1a\x7a\x81\x22\x1d\x09\x2c\x4d\x8a\
+\x2e\x9c\x6d\xbb\x10\x86\x12\x81\x8b\x5c\x6d\x5c\x76\x26\x62\x3d\
+\xd9\xde\xfb\xd1\x64\xb8\x0a\xc3\x48\x19\xa1\xfa\x51\xbe\xbd\xcd\
+\x4e\xb1\xd6\x76\x91\xe3\x40\x35\x6b\x69\x35\x16\x62\x58\x73\x77\
+\xb3\x62\x10\xce\xfe\x06\x32\x96\x62\x69\xd5\xaa\x65\xb0\x97\x1d\
+\x11\xcb\xcd\xc7\x91\xd0\xaf\x8d\x9b\xbf\x39\x6f\xb2\x9a\x04\x90\
+\xf7\x04\x29\x4c\x51\x83\x8d\x99\xdd\x6a\x0c\x47\x03\x45\x84\x47\
+\xe7\x57\x38\xd7\x5f\xbf\x04\x76\xec\x2b\x6f\xa3\x75\x8c\x28\x3f\
+\x00\x39\x09\x96\xc0\x11\xb8\xc7\xb5\x3a\x7c\xa5\x5d\x60\x75\x6a\
+\x57\xe0\x10\x24\xd8\xe6\x0d\x59\xf8\x92\x63\x2b\xb2\xb8\xd6\xaa\
+\x63\x2c\x2a\x60\x73\xa0\x05\x31\x81\x71\xa1\xb8\x66\xd3\xb0\x45\
+\xd8\x92\x2c\x60\x27\x99\x14\xa5\x76\x4a\x31\x62\x76\x12\x4e\xdc\
+\xc6\xa2\xec\xd8\x2c\x07\xca\x97\xe2\x4a\x8c\x9b\x61\x37\x55\xf9\
+\x2d\x22\x79\xde\x6f\x5c\xc7\x70\xaa\x43\x03\x3c\xa0\xde\xc5\xad\
+\x6d\xb7\x0f\x89\xc5\xc4\x22\x13\xdf\xef\xbb\xf0\x4f\x54\xc7\xdc\
+\x48\x2a\xcb\xc1\xcd\x39\xaf\xe2\xb5\x38\x3e\x2a\x0c\x3b\x84\x3c\
+\xe0\xbd\x99\xf7\x88\xf8\xc9\x8a\x8f\xf3\x08\x93\x02\x2f\xf5\xfc\
+\x0b\x40\x74\x10\x50\x19\x8c\x1e\xa7\xdb\x88\x0f\x58\x8c\x01\x24\
+\x11\x9e\x42\x9f\xbf\xf6\x8c\x80\xec\x64\x04\x1b\x00\x81\x69\x26\
+\x94\x46\xce\xcd\x35\x42\xba\x81\xf6\x00\x2e\x60\xa1\xba\x06\xf8\
+\x82\x5a\x9b\x06\x69\xa1\x01\x5b\x9b\x6e\x9f\x12\xe4\x07\x93\xcb\
+\xbc\x9b\x45\xeb\xf4\x09\xf6\x59\xa4\xd3\x4e\x68\xae\xa5\xbd\xe0\
+\x5f\xb2\x9a\x9b\x60\xdd\x0b\x56\x83\xe5\xbe\x43\xf9\xc6\xc9\xd6\
+\xa3\x67\xa8\x02\x54\x62\xd4\x2e\xad\x92\x87\x4a\x00\xa0\x29\xfc\
+\xf2\xae\x0c\x6b\x8d\x76\x4a\xde\xdc\x04\x50\xcd\x90\x12\x28\x05\
+\x2a\x28\xc4\xce\xec\x57\xb5\x31\xc6\xbd\xfe\x80\x87\x90\x0c\x98\
+\xae\x24\xbc\xde\x9b\x17\x72\x38\x39\x1c\x19\xe0\x1e\x5d\x84\x7a\
+\xcc\x55\x20\x4c\xf6\xa4\xa1\xb0\x02\x31\x4a\xda\x93\x70\x71\x88\
+\x06\x50\x29\x30\xb4\xbc\xb1\x9c\x56\x83\x86\x8c\x00\x2b\xe9\xa3\
+\x52\x2d\x36\x44\x5b\x29\xd1\xd2\x6a\xc4\x6d\xb0\xc3\x6f\x55\x56\
+\xe2\xa2\x36\x70\x88\x89\xde\x9c\xf0\x96\xf3\xd6\xd6\xa0\x1d\x44\
+\x80\x85\x34\x7b\xb4\xd5\xd8\x34\x1a\xb3\xa6\xb3\x03\x12\xfc\x43\
+\xea\x17\xf6\x58\x6e\x51\x3e\xc1\xc4\xe4\x63\x42\x9a\x45\x41\x0c\
+\xa0\x4a\xa5\xc6\xdc\x18\x04\xcb\x47\xd6\x1a\xd5\xf7\xcf\xf0\x0c\
+\xe0\xae\x48\xc5\xae\xb4\x1b\xac\x8d\xb1\xc1\xe8\xb3\x5d\x3c\xbd\
+\x55\x92\x43\x1a\x36\x1a\x5f\xc1\x25\x69\x0f\x92\x0e\xbe\x0a\x0d\
+\x12\xa2\x43\x25\xd8\x62\x89\xbb\xf2\x9b\x30\x86\x64\x34\x36\x18\
+\x3a\x62\x31\xf0\xcc\xa2\xd8\x43\x46\x26\xf2\xca\x39\x31\x26\xb3\
+\x66\x36\x2d\x30\x44\xd2\xa0\xd8\x89\x88\x19\xbd\x88\x18\x88\x82\
+\xd8\xc1\xd0\x12\x06\x0b\x5a\x0f\x9e\x6f\xf1\x15\x55\xe9\xc7\xcc\
+\xb7\x87\xb8\x40\x03\xd3\x28\x42\xf5\x06\x5a\xb4\xcc\xe1\xdc\xcc\
+\x61\x21\x74\x9b\x64\xaa\x32\x2f\x87\x78\xce\x71\xca\x6c\xd4\xb7\
+\xcb\x0c\x95\x44\x3e\x42\xe0\x00\x4a\x2c\xa7\x76\xf4\x28\x5e\x44\
+\x10\x89\x81\x2f\x17\x71\xab\xf3\xfc\xc0\x1a\xe7\x20\x26\xf8\xda\
+\x71\xb6\x8d\xde\x41\xd6\x45\x36\xdd\x2a\x4e\x57\xd8\xe6\x4e\x8e\
+\x31\x5c\x6a\x0d\xa5\xe0\x79\x70\xfe\xe3\xf5\xe0\x4d\x3e\x20\x6d\
+\x2a\x83\x83\x1b\x46\xec\x4d\x7c\x38\x34\xb0\xd2\x1f\x2b\x88\xc3\
+\x5e\xdb\xbe\x2c\x58\x01\x66\x28\x03\x2b\x03\x75\x18\x70\xeb\x87\
+\x01\xcc\x22\x60\x93\x05\x60\xbc\x6b\x8f\x3d\x28\x14\x11\xe1\xc9\
+\xbe\x59\x2d\x53\x29\x28\x99\xa5\x89\x10\xad\x00\x8e\xec\x64\x70\
+\x31\xa1\x50\xb0\xd6\x12\x4d\xc3\xb7\xb3\x82\x51\xd6\x70\x3b\xdc\
+\x0a\x85\xd1\x79\xcb\xe7\x79\x07\x9c\x85\x8f\xb3\x82\xb4\xec\x49\
+\x13\x8c\x45\x34\xe4\x84\xa7\x74\x25\x08\x0d\xe5\xe3\x1e\x6b\x88\
+\x33\xe5\xe2\x0d\x0e\x30\x30\x40\xe7\x86\xc4\x01\x6d\xb2\xd4\xfa\
+\x84\x8c\x50\x37\xcc\x09\x00\x86\xb4\x62\x30\x10\x4b\xb0\x8a\x28\
+\x73\xa2\x8e\x22\x3c\x24\x34\x81\x22\xae\x8e\x1b\x6c\xb5\xc2\xf2\
+\x26\xe3\x42\xa8\x86\x7b\x25\x6e\x57\x68\x76\x15\xe6\x0b\x3d\x1d\
+\x1e\xdc\x39\xa2\xc5\xb7\x60\x2d\xb6\x7c\xbf\xc0\x9b\x2e\x1c\xcd\
+\x40\xd9\x78\xa5\xd2\x44\xaa\xa2\x73\x43\x82\x93\x26\xa0\xd6\x8b\
+\x44\xc8\x9f\x7d\xa8\x89\x88\xb6\x88\x18\x23\x8a\xd5\xf5\x50\x67\
+\xa7\x89\xca\xc1\xf1\xe5\x06\x3b\xdb\x3b\x30\x1d\x1f\x97\x7d\x60\
+\x01\xec\x08\xae\xea\xd9\x53\xe7\x34\x0c\xe8\x00\x16\x04\xa2\x21\
+\xec\x7b\x03\x4a\x2b\x93\x83\xe1\x06\xab\xe9\x67\x1c\x4e\xf2\x53\
+\xc9\xec\xe8\x22\x6b\x42\xd4\xb7\x72\x83\x8a\xf3\x57\xea\xbc\xc8\
+\x21\xbc\x8b\xca\x6f\x14\x30\x91\x69\x45\x95\x12\x94\x1d\xbd\x80\
+\x57\xaa\xba\xf3\x71\x0e\x61\x87\x5a\xa1\x46\x8a\x26\xde\x58\xcc\
+\x2f\xec\xda\x84\x01\xb4\x8a\x0d\x95\x15\x04\xc9\x69\x8c\x49\x60\
+\x09\xc6\xb0\xda\xba\x65\x9b\x3b\xb1\xf8\xfa\x97\xa7\x4a\x17\x36\
+\xc0\xf6\x64\x6f\x65\x68\x07\xc9\x3c\xba\xe5\x26\x92\x30\x50\x54\
+\x14\x07\x28\x81\xa0\xc5\xbf\x25\x78\x2b\x62\x1a\xba\x4a\x72\xeb\
+\x25\x05\xdf\x3c\x47\x04\x93\xb1\x43\xe7\xfa\xa8\x17\x22\x64\x34\
+\x11\x1d\xe8\xfd\x12\x30\x52\x4f\x5e\xfd\x8c\x7c\x5e\xca\x30\x22\
+\x69\xc7\x26\xac\x41\xb5\x04\xb3\x2d\x04\x3d\x82\xac\xba\xb4\x18\
+\xad\x8e\xcf\x48\x33\x97\x80\x1e\x9b\x8d\x52\x8a\x43\x39\x05\x66\
+\xdb\x57\x04\x99\xf6\xeb\xa6\x03\x8c\xb9\xc8\xab\xe5\x3b\x86\xe2\
+\x30\xfb\x60\xb0\x6f\x0a\x09\x88\xb5\x02\x92\x45\xbc\x8a\x10\xec\
+\x82\x66\x40\x40\xb6\xa2\x86\x0c\x66\xbb\x05\x94\xca\x88\x2c\x10\
+\xde\x08\xd1\x31\xe5\xb1\xf2\x37\x79\x22\x50\x14\xc1\x89\x4c\x24\
+\x91\xd0\x19\x56\xe2\xc3\x2b\x2e\x66\x30\xae\xca\x45\x82\x9c\x86\
+\x77\x10\x55\x06\xe6\x1b\x5a\x69\x41\xb4\xc5\x6b\x08\xec\x08\x1d\
+\xae\x5c\x6c\xf8\x6d\x2e\x24\x06\x7f\xa2\x0b\x2c\xd4\x9e\x9a\xea\
+\x4e\x8a\x10\x91\xb6\x91\x4e\x3b\x78\x04\x11\x8c\x18\x48\xd4\xa5\
+\x45\xa5\xa5\x96\x85\x1a\x94\x56\xeb\x85\x8f\x7c\x1d\x90\x89\x31\
+\x8a\x06\xdb\x26\xae\x1a\x07\x1f\xd8\x58\x9c\xca\x0e\x3e\x39\xf2\
+\xa8\x79\x63\x43\x1c\xa7\x5d\x2a\x09\xa0\x5f\x2f\xff\x00\xcd\x43\
+\xc2\x7b\x36\x27\xe5\xd1\x1c\x44\xd9\x8b\x68\x64\x5a\xe8\xda\x30\
+\x60\xd2\x24\x9a\xa0\x3b\x10\x02\x14\xce\x2a\x6a\x42\x5f\x78\xa5\
+\x84\x40\x04\xb9\xdc\x38\x51\x77\x60\x98\xd7\x01\x0c\x6c\xaf\x23\
+\x86\x97\xee\x38\x2e\x11\x93\xc9\x0a\xda\x11\x14\x66\x21\x06\x20\
+\x79\xb0\x98\x18\x39\xe5\xc9\x05\x56\x31\xc8\x01\x66\xa1\x25\x60\
+\xfd\xb1\x3e\x76\x6a\xeb\xb1\x00\xc5\xdb\x0b\x00\x5d\xe8\x14\xd9\
+\xab\xd9\xb5\x0a\xe3\x88\xaa\x35\x0b\x28\x41\xba\x23\x41\x30\x85\
+\x0d\xd1\xaa\xfd\x66\x62\x97\x1f\x32\xf1\x4b\x69\xd8\x8a\x5e\x24\
+\xa5\xda\x54\xdf\x0e\x58\xf0\x04\x21\x60\xab\x4b\xd7\x05\x84\x14\
+\x0e\xa1\x59\x0c\x40\x32\xd6\x6c\x9c\x84\x5d\x9e\x78\x00\x58\xe0\
+\x2f\x5c\x7a\x94\x7a\x04\xc5\x74\xb3\x5f\xc0\xfd\x6f\x27\x73\x87\
+\xf6\x67\x3a\xb7\x01\xb1\xc3\xa9\x86\xb9\xaa\x3c\xc7\x49\xda\x84\
+\x92\x91\x89\xb0\x09\x65\x93\xb2\x46\x43\x44\xd1\x45\xd7\xd0\x1b\
+\xb8\x61\x1c\x0b\x0b\x91\x68\x90\x06\xea\x02\xbe\xa5\x82\x33\x98\
+\x29\x30\x4c\x74\x96\xd9\x68\x9e\x30\xa9\x53\x1f\x91\xc4\x18\xa0\
+\x6d\xb4\x4a\xa1\x3b\x2e\xb1\xd4\x75\x9b\x32\x85\x91\xc3\xaf\x95\
+\xc9\x4a\xc7\x05\xe8\x32\xb6\x6d\x05\xdd\x58\xd9\xb4\xd3\x15\x47\
+\x72\x10\x34\x92\xb0\x6a\x03\x04\x8a\x30\xe9\x05\xe0\x9f\x50\xf7\
+\x66\x16\x3f\xe5\x87\x3c\xa9\x03\x60\xf4\x4c\x23\xc1\xbc\xbd\xa3\
+\x68\xd5\x17\xc4\xc1\x3b\x1d\xe4\x31\x83\x41\xb4\x28\x83\xbf\x92\
+\xc2\x8b\x41\xb9\x65\xb9\x05\xf0\x2b\x8b\x76\x86\xe7\x00\x25\x8b\
+\xf2\x00\x03\x45\x33\x5c\x4e\xe6\xe4\x6c\x78\x29\x56\x64\xea\xc9\
+\x9b\x56\x17\x1d\xc3\xec\xba\x03\x06\xb8\x9a\xc1\xf9\xb5\x92\xcf\
+\x24\x00\x5f\x26\x6a\xe6\x2e\xe4\x84\x0b\x5e\x67\x0a\x66\x2b\x86\
+\x81\x20\x84\xa3\x61\x53\x89\xc0\x6f\x35\x28\x2d\x1d\xf8\xad\xe0\
+\x21\x97\xb4\x2a\xe1\x54\xbe\x10\x05\x51\xc7\xc0\x27\x34\xa6\x7c\
+\xf2\x9b\x44\x82\x24\xe0\x39\xc5\x92\x48\x7e\x60\x8a\x6a\xc1\x15\
+\x72\x9e\xaf\x7c\xce\x3e\x4e\x6d\x01\xe0\x5e\xca\x0d\x8e\x19\xb0\
+\x15\xc6\x0c\x84\x25\x80\x66\x96\xcc\x31\x6a\x9c\x4d\x80\x96\xd5\
+\xe2\x89\x48\x3f\xb7\x73\xe0\x77\x82\x21\xbc\x86\x9e\x6a\x80\xb3\
+\x04\x58\x92\x64\xb0\x63\xee\xc6\x60\xd4\x07\x89\xe1\x9d\xc5\x3d\
+\x1e\x24\x81\xc0\xb4\xe4\x72\x96\x0e\xf5\x50\xa9\x04\x18\x84\xe7\
+\xab\xfc\x23\x04\x81\xa1\x26\x43\x06\x16\x51\xd0\x1b\x3a\x65\xb8\
+\x86\x8e\xdd\xa5\xdd\x47\x7f\x50\xc5\x84\x19\x61\x13\x25\xd2\xdd\
+\xa9\x07\x11\x78\x52\x85\x88\xc6\xde\x12\xc5\x08\x97\x01\x76\x42\
+\xfa\x47\xd1\xeb\x57\xc2\x3d\x62\xa7\xfa\x16\x80\xca\xc2\x63\x51\
+\xe1\x93\x70\xd0\x9d\xd7\xee\x2c\x41\xbb\xd0\xe3\x4f\x70\xdc\x98\
+\x1b\x5e\xb8\x6a\x66\x88\x3d\x0d\x33\xf9\x11\xe9\x32\x28\xd8\x0c\
+\x40\x20\x03\x3d\x1e\x53\xa7\xa5\x72\x32\x5e\x61\x69\xe8\xf8\x80\
+\x48\xa8\x01\x91\xc1\x84\xa2\xaf\xe5\x97\x8b\xd1\xae\x74\x71\xd9\
+\x6b\x75\x22\x1a\xf7\x9c\x02\x93\x73\x58\xd0\xd1\xcb\x14\x7b\x00\
+\x14\x2e\x89\x5a\x6b\x38\x28\xb3\xaa\xe8\xb5\x55\xd8\xee\x30\xa1\
+\xb6\x44\x0d\x4c\x2a\x76\x98\x08\x21\xb6\x8a\x62\xa9\x00\x6f\xe0\
+\xa2\xa5\x85\x72\xb3\x61\x17\x29\x44\xac\xc4\x80\x58\x40\x1b\xd9\
+\x04\x3b\x4a\xa7\x4a\x22\x6f\x53\xa1\xe2\xc1\x45\xdd\xed\x05\x25\
+\x12\xa9\x89\x2a\x35\x85\xa7\x26\xd1\xf1\x00\x21\x21\x84\xd2\x72\
+\x75\x21\xca\x16\x67\x03\xeb\xc7\x86\xa8\x51\xc6\x95\xd3\x59\x85\
+\x40\x09\x51\xcd\x47\xd8\x47\x8c\x18\x0c\x40\x0b\xf9\xac\x15\x8d\
+\x80\x68\xee\x08\xe4\x36\x71\x8b\x6a\x0e\x2c\x78\x00\x24\x9a\x3c\
+\x24\x00\x61\x05\xf2\xf7\x8a\x51\x2a\xa3\x01\xaf\x58\x16\x1c\xa1\
+\x8a\x06\x54\xf3\x4d\x4a\x44\xd6\x61\x04\x59\xa4\x04\xf6\x34\xd2\
+\xe8\x0c\x74\xc8\xe5\xb0\xd2\x68\x14\xca\x1c\x04\x2d\x03\x14\x2d\
+\x5c\xf4\x45\x35\xf2\xe4\xca\x12\x0e\x4c\xb4\xae\x54\xdc\xe7\x45\
+\x94\xd2\x28\xbf\x5c\x29\xe3\xd1\xe8\xdf\xbc\x0f\x52\x5b\x21\xf7\
+\xfe\x10\xba\x1a\x6c\x30\xe7\x58\x64\x99\xdf\x52\x30\x20\xcd\x11\
+\x63\x6a\xcc\x77\x85\x88\x2d\xcd\x58\xab\xd1\x83\xd6\x29\x4a\xa6\
+\xbc\xb0\x8f\x7f\x99\x39\x16\x57\x33\x05\xc6\x2a\x7b\xd0\x63\x3a\
+\x8d\x72\xfd\x6f\x83\x9d\x29\xa3\x0f\x21\x14\x2b\x81\x4c\xaa\x91\
+\x65\xc1\xfb\x74\x1d\x54\x8d\xd3\x30\x24\x21\xfa\xe7\x75\x69\x18\
+\x0c\xd3\x8a\xf8\xe0\xa2\x4c\x92\xb4\x0e\x29\x94\x0d\xcf\xb7\x3d\
+\x93\x7c\x36\x44\xad\xd0\xf3\xd0\xb6\x50\x67\xc7\x46\xd7\x3c\x74\
+\x51\x00\xb0\x44\xc2\xf5\x63\xa3\x06\x84\xb0\xf4\x23\xd2\x75\xb9\
+\x09\x9d\xfe\x4a\x93\x12\xa0\x1d\x9a\x84\xbb\x2a\x01\x70\x4c\xce\
+\xc1\xab\x95\x13\x68\x72\xd2\x32\x72\x02\xe2\x6d\x8f\x30\x60\xdc\
+\xd9\x63\xd8\x17\x1b\xc5\x6f\xff\x00\xa6\x38\xdb\xed\x4a\x56\xe1\
+\x97\x3b\x0b\x6e\x4a\x1d\xf7\xa2\x13\x6b\x3c\x61\xb8\xf4\x5b\x4b\
+\x0b\xc7\xa7\x6c\xce\x95\xfc\xbf\x5d\xdb\xca\xcc\xd2\x2a\xd5\x10\
+\x93\x59\xa8\xc4\xc3\x86\x4b\xdb\x7e\xb5\x4d\xaa\x09\xf3\x1b\x35\
+\x49\x21\x71\x26\xde\xe2\x82\x64\x15\x89\x29\xf0\x76\xc4\x16\xd5\
+\x87\xc7\x64\xa4\x0a\x96\x73\xe3\xa2\xa9\xe2\x77\x13\xc0\xad\x90\
+\x32\xc5\x6a\x0d\x6b\x00\x32\x6c\x9c\x12\x20\x8a\x60\x07\x9f\x51\
+\xf8\x85\x57\xf7\x7e\x25\x75\x08\x75\x70\xf4\x39\x50\xae\x85\xc5\
+\x49\x0b\xcf\x53\x96\x53\xe9\x8c\x72\x95\xe1\x78\xe9\x3c\xd1\x93\
+\x2c\xe7\x44\x69\x69\x43\x09\x9d\x31\x2d\x80\xdf\x54\xb8\xb6\x80\
+\x06\xd7\x1a\xe8\x82\x4a\xcb\x58\x73\x1d\x4b\x04\xa2\xa4\xd6\x24\
+\xb0\xd7\x32\x33\x31\x27\x4b\x04\x8c\x99\x3a\xdd\xe5\x82\x9c\x7e\
+\xd6\xbb\x28\x1a\x9b\xcc\xca\x84\x82\x12\xb7\xe5\x9a\xe5\x1a\x51\
+\x75\xb2\x9a\x4e\x33\xf6\x5e\xcb\x3b\xc9\xa6\x86\xc0\x34\x80\x03\
+\xcd\x94\x1c\xd5\x54\x51\xb4\x0a\x7c\xe1\x34\xb9\x85\x0a\x41\x84\
+\xc0\xe8\x32\x4a\x99\x6f\x83\xa7\x20\x2e\x01\x4a\xe0\x40\xdf\x4f\
+\x80\x7e\x34\x3c\x38\x72\xe0\xc8\x03\xce\xa7\x77\x57\xcc\xc1\xd4\
+\xc8\xf0\xf4\x3d\x9a\x36\x87\x51\x32\xaf\xef\x6d\xa0\x52\x93\x89\
+\x90\xbc\x17\x46\xcb\x97\x00\xd3\xb1\x43\xe9\x7b\x59\x37\x89\xb4\
+\x36\xb8\x30\xda\x97\x67\x69\x15\x1b\x42\xf0\x56\x0d\x6e\x59\xaf\
+\x23\x3a\xbe\xa2\x3c\x0a\xa3\x26\x97\x42\xfe\x4b\x92\x64\xad\x0e\
+\xdb\x57\xd6\xd9\x05\x2d\x40\x64\xe9\x93\xb9\xde\x02\xc0\x2b\x81\
+\x38\xfa\x39\x4a\xec\x7f\x83\x16\x4e\x7c\x49\x97\xb4\x46\x3d\xc2\
+\x4d\xe6\x4a\xae\x3b\xe3\xb8\xff\x00\xb6\x10\xb9\x6c\xeb\x59\x80\
+\x2a\xe2\xc1\xa5\x7a\xfb\x73\x67\xdc\xd8\x01\xb0\x8c\xed\x9d\xf9\
+\xad\x83\x21\x83\x4e\xea\xd1\x9d\x9e\xdb\x95\x30\xd7\x48\x59\x63\
+\xb8\xf6\x76\x21\x78\xb4\x2c\x6e\x02\x48\xdd\x54\xc8\x7d\xa6\x75\
+\x0b\xbd\x0f\x62\xb4\x7f\x4f\xbc\x5b\x01\x08\x06\x6a\x6c\x7b\x07\
+\x28\x59\x41\x29\xbc\x12\x0c\xd7\x21\x73\xa3\x43\x04\xb8\x4c\x58\
+\x85\xa4\xda\x42\x03\x6f\x23\x30\x6c\xfa\xb0\xf5\xed\x86\x7a\x30\
+\x47\x89\x41\x25\x6b\x5f\x80\xa6\x29\xbe\x84\xc8\x88\x83\x4a\x52\
+\xb6\x99\x2c\x85\x85\x1a\x28\xff\x00\x7a\x3f\x91\x63\x54\x20\xbc\
+\x48\x3f\xff\x00\x99\x73\x8e\x8b\x17\xda\xb8\xb4\xd1\x50\x58\x74\
+\xde\x52\x79\x19\x58\xd6\xaf\x27\xd4\x7d\xcc\x13\xf6\x60\x7d\x98\
+\xd6\x92\xec\x8f\xcc\x4c\x9f\x24\x31\xd5\xb3\x70\x3f\x03\xa3\x90\
+\x99\x3c\x9a\x0a\x17\x25\x55\xf1\x10\x16\x69\x16\xd2\xeb\x38\x2c\
+\xdd\x70\x5e\x5a\x88\x02\x1e\x07\x06\x06\x4a\x45\xd8\xce\xd2\xe4\
+\xf6\x9f\x8a\x92\x63\xa8\x74\x3c\xa1\x56\x0d\xf7\xf1\xe6\x02\x40\
+\xb4\x00\x50\xe8\x3c\x98\x4a\x43\xec\xe5\x10\x29\xdb\xb7\x37\x93\
+\x82\x85\x16\x0d\xa7\xe0\x1a\xad\xb8\x1b\x92\x10\x5c\x0c\xa0\xd4\
+\x2e\x39\x08\x63\xfd\xdf\xa4\x20\x7b\x20\xe4\x75\xa2\x8d\xfd\xd9\
+\xe2\x1e\x2c\x15\xe2\xa9\x02\x49\x83\x78\x7b\x2d\x93\xda\xcb\x11\
+\xe8\xc1\x4b\x61\xc6\xad\xda\x83\x3a\x90\xb1\xf3\xa0\xe8\x12\x55\
+\xee\x0e\x95\xa3\x67\x69\xad\x31\xe6\x3d\x7f\x18\x5d\xa0\x4a\x28\
+\xe4\xa0\xa9\x73\xd0\x5e\x43\xc9\xce\xb3\x9a\xcc\x3f\x5b\x3c\x88\
+\x83\xcb\x09\x7e\xad\x8a\x08\x1a\x60\x82\xe9\x95\x4d\x36\xfc\x04\
+\xf4\xd8\xc3\x20\x72\xcf\xc6\x95\xf4\xb4\x87\x70\x7b\xe6\xf4\x68\
+\x00\xa5\x51\x34\x8c\xac\x32\xba\xaf\x6b\xb5\x66\x20\x30\x63\x6c\
+\xb4\x00\x41\x9a\xb2\x3e\xd0\x73\x60\xd0\x11\xd4\x7c\xa3\x40\x1a\
+\x85\x25\x90\xa8\x0e\x14\x06\x44\xa6\x81\xb5\x91\x34\x44\x0d\x5e\
+\x56\xe0\x10\x18\x61\x4c\x0f\x2f\x89\x6d\x77\x41\x64\xc0\x18\xa2\
+\xa5\xa8\x41\xed\xad\x88\xba\xd8\x22\x7d\x02\x5b\xfc\x13\xc0\x8c\
+\xa0\xd2\x19\x7d\xcb\x4c\x50\x41\x78\x9e\xdc\x44\x23\x90\x36\x04\
+\x69\x29\xb2\xb6\xab\x19\x2b\x61\x94\x2c\xb5\xb0\x08\x61\x2b\x56\
+\x5e\xa6\xb1\xf5\x2a\x25\xd2\xce\x1a\xaa\xe1\xf1\xdc\x74\x94\xf6\
+\xe4\x95\xb2\xfa\x77\x3e\x01\x66\xe5\x14\xe7\x39\xe6\x07\x44\xba\
+\xaa\xd4\xa5\x0f\x58\x94\x11\x3c\x5a\x6a\xdc\x75\xdc\xf8\x51\x99\
+\xb5\x32\x61\x74\xb2\x31\x45\xc0\x1d\x8e\x30\xf2\x69\x78\x31\xd2\
+\x65\x9b\xbd\x90\xb1\xc9\xa3\xbf\x9c\xfa\xf1\x8c\x1b\x08\x4c\xe4\
+\xe6\xe6\x3f\xe5\x31\x2a\xf3\x57\x21\xa1\xab\xc2\x1b\x1f\x6d\xa6\
+\xa0\x61\x97\xc8\x41\x56\x8a\x71\x96\xfb\x70\xfa\xb4\x48\x18\xde\
+\x81\x40\x74\xa2\x98\xf7\x9b\xa4\x1d\xf8\xa5\x63\x16\x69\xed\x68\
+\xc3\xa2\x7b\xe9\xf4\x1b\x14\x25\x83\xc8\x5e\x07\xbe\x42\x89\x73\
+\x00\x21\xb2\x00\xc5\x00\x5a\xd3\x98\xbf\xf8\xe1\x7e\xe6\x66\x5e\
+\x9f\x0e\x2d\x8e\x9d\x54\xd0\x28\xc8\xa6\x42\x8e\x74\xe0\x9f\xad\
+\x7d\x22\x71\xb9\x5d\xe8\x65\x45\x40\xcc\x46\x2a\x42\x4f\xa8\x41\
+\xca\x9b\x0b\x11\x4c\x65\x0a\x60\x9a\x2c\x15\xd1\x29\xa6\x21\xdc\
+\xd2\xf6\x0d\x1e\xbe\x9a\x60\x89\xb3\x9b\x9f\xf6\xe7\x64\xd4\xf2\
+\x32\x20\xa7\x6b\x0a\x37\xd0\x2b\xa8\x62\x34\x95\xa0\xd7\x0b\xa2\
+\xfc\x18\xac\x7a\x1c\x0e\x50\x53\xdf\x9f\x32\x1e\x6d\x98\x61\xb5\
+\x2f\x74\x3c\x1e\x1f\x2f\x29\xaa\xc6\xb2\x9a\xe5\xcc\xd5\xc2\x9c\
+\xa4\xcd\x84\x58\x13\x60\x78\x08\x87\x9c\xa5\x44\x8a\xbe\x0b\x78\
+\x2c\x33\xb8\x44\x78\x0e\xe5\xf3\xd9\x37\xcc\x7e\x5a\x07\xc3\x2c\
+\xba\xc0\x56\x59\x40\xf8\x64\xa6\xbe\x02\xe7\xdc\xdf\x47\x11\xd9\
+\xc6\x58\x0c\x0a\x4e\x6d\xd6\x2d\xb8\x36\x59\x5b\xb2\xae\xb8\x08\
+\x56\xc5\x95\x18\x3c\x58\x2c\xd4\xa6\xa8\x50\xf3\x96\xe5\x6a\x6b\
+\x10\x8d\x4d\x09\x65\x42\x62\x42\x0d\xa5\x6f\x9c\xdd\xb2\x97\x88\
+\x6a\x03\x95\x98\x48\x1b\x84\x83\x3b\x9f\x6a\xc8\x87\x0e\xff\x00\
+\x21\x85\xfd\x5b\x9f\xf8\x84\xa4\xf9\xa3\xab\x09\x86\xbf\x9e\x68\
+\x72\x43\xb9\xad\xa3\x4d\x92\x31\x58\xda\x65\xe9\xb6\x66\xc4\x93\
+\x34\x0b\x11\x4a\x57\xa8\xd7\x7a\x49\x15\x34\x08\xd3\x77\x2e\xbd\
+\x78\xb6\x0e\x42\xb1\xe0\xb2\x12\x78\x1d\x8a\xaa\xa1\xc0\xba\x4a\
+\x69\x66\x0a\xee\x49\xde\xc1\x54\x43\x9d\xdb\xa4\xa9\x61\x27\xc8\
+\xdf\x8c\x0a\x42\x1b\x86\x51\x87\x03\xf5\xf2\x45\xb3\x19\x8d\xed\
+\x0a\x4a\x44\x88\x8b\x7c\x9a\x34\x71\x22\xac\x24\xf5\x09\xe2\x83\
+\x7b\x83\x00\xa5\x00\x68\x37\xac\x11\xb1\x35\x87\x44\x6f\xc2\xe7\
+\x42\x8c\x93\x99\x3c\x73\xf6\x83\x5e\x5c\xb4\x8d\x99\x9b\xe9\x09\
+\x77\xc3\x6b\xc2\xa8\xce\x35\x53\x60\xa7\x85\xb5\xb1\x7e\x56\xd2\
+\xb1\x14\xba\x3b\xd8\x61\x68\x3d\x98\x90\x0f\x43\xd6\xce\x16\x9b\
+\xce\x04\x93\x82\x37\xb4\x09\xf4\x02\x18\x46\xbb\xf4\x11\x22\x0d\
+\x0a\x4f\xdd\x06\xed\x1b\x43\x23\xd2\xce\xea\xa0\x60\x90\x65\x8d\
+\xfe\xed\x3c\x73\x8d\x2f\x79\x3b\xde\x41\x19\xcc\xe3\x9c\xfc\x92\
+\xcd\x6f\x96\xa1\x1b\x6e\xc7\x3c\x0c\x22\x43\xe6\xc4\xd1\xb4\x1e\
+\x45\x80\x22\x79\x8c\x98\x95\x6a\x39\x37\xda\xe7\xae\x5f\x3a\x6a\
+\xf6\x5a\x20\x53\x6e\x19\x43\xcc\x84\x79\xea\x3c\x4e\x02\x6b\x9a\
+\x50\xd9\x83\x54\xa2\x1e\x40\xa2\x20\x22\x6d\xde\x23\x00\x47\x1a\
+\xd7\xb9\x45\xbe\xd1\x80\x5b\xf0\xb1\xc6\xca\x96\xd1\x18\xc5\x22\
+\xbb\x8c\xe2\x85\xd3\x80\x24\xa4\x74\x8b\x5b\x24\x6e\xa6\xff\x00\
+\x2b\x82\xba\x0f\x79\x28\xfa\x09\xb0\xe5\x49\x7f\x7c\x80\x04\x9d\
+\x57\xba\x6c\xcc\x9a\x0e\x10\x80\xd4\x14\xc1\x38\x21\x0b\x6d\xa9\
+\x20\xec\x25\x4d\xcc\x8c\xb8\xf5\x2b\x71\x90\x71\x45\x3b\x67\xe4\
+\x12\x8d\x1b\x98\xb9\x02\x87\x85\x9c\xe7\xb8\xf9\x8e\x68\x69\x37\
+\xfc\x94\xab\x0c\x88\x16\xb9\x6e\x12\x87\xa6\x3b\x6b\xd8\x2b\x23\
+\xb6\xc6\x0d\xd8\x4e\x6c\x05\x84\x68\x0a\xc3\x44\xe3\x01\x57\xc2\
+\x7e\x2a\x5b\x86\xca\x62\x31\xc6\x71\x25\xc6\x6d\x01\x87\x77\x20\
+\x6d\x57\xc1\x26\x26\x39\xed\xac\xcb\x19\x04\x0a\x9a\x51\x8e\x9d\
+\x5c\x4c\xa7\x93\x54\x96\xb5\x92\x18\x43\x4c\xa0\x32\xa5\x86\xc8\
+\x1d\xae\xe5\x69\xcf\x5a\x00\x67\x30\x09\xd9\xf1\x79\xe1\xcb\x42\
+\x13\x14\x61\x03\x6c\x44\x30\x43\xce\xc4\x46\x03\x3b\x76\x1d\x69\
+\x2f\x11\x96\x03\xd8\x22\x26\xb9\x31\xa2\x47\x14\x38\x49\x88\x44\
+\xdb\x0b\x81\xbf\x1b\x22\x48\x21\xea\x92\x65\x3c\xc4\x9e\x20\xa1\
+\x30\x2a\x10\x51\x94\xda\xf4\xb5\x6e\x5d\x28\x61\x59\xac\xd5\xa5\
+\x19\x16\xb0\x67\x59\xe9\xd9\x86\xcd\x2e\x33\x2b\x29\x9f\xbf\x8b\
+\x10\x26\x28\xb5\xf5\xcd\xa8\xb3\x14\x05\x14\x5c\x2b\xdb\x2e\x6d\
+\x91\x32\x8a\x93\x5d\x21\xbd\xbb\x21\x32\x38\xe8\x01\xd5\x9c\xb1\
+\x25\xa5\xf2\x2a\x01\x81\x89\x72\xcc\x12\xc9\x08\x4e\x5a\xd7\x15\
+\x04\xe3\x71\xdd\x8d\x65\xb8\x15\x4d\xcc\x4b\x35\x02\xe1\xa9\x5d\
+\x14\x2b\x34\x5a\xd6\xae\x59\xbe\x1e\x73\xa3\x7d\xb9\x00\xd8\xf0\
+\x6a\xf5\x5b\x71\x0c\x02\x6a\x46\x8e\x0a\x54\xfb\x48\x55\xd3\x07\
+\x72\xec\x7f\x99\x6d\x03\x16\x15\x2e\x3c\x7f\xe1\xe4\x3f\x64\x46\
+\xb0\xb1\xc4\x54\x92\xa1\xc0\x0a\xd0\xae\xd0\x68\x9a\xea\x2e\x8b\
+\xe7\xd6\x36\x01\x7b\x78\x3b\x29\x13\xb5\x8d\x40\xc1\xb3\x11\x22\
+\x99\x58\xc4\xd0\xf2\xb7\xb9\xae\xab\x49\x5c\xab\xf0\x70\x56\x36\
+\x09\x97\xb3\x28\x35\xa4\x7a\x0c\x1e\x66\xc3\xd2\x7a\x89\x1d\xab\
+\x26\xae\x9a\x2d\xb4\xe2\x09\xe6\xc3\x52\x90\x55\x92\x91\xd1\xef\
+\x90\x18\xf9\x9d\xcc\x02\xf9\xa5\x06\x25\x55\xae\xe6\x89\xff\x00\
+\xec\xa3\xd3\x4c\x1c\xa1\x51\xa2\x31\xc9\xbc\x52\x91\xcf\x65\xa1\
+\xf3\x9b\xbe\x3b\xb9\x42\x2a\x86\x79\x61\x08\x54\x27\x39\x20\xcb\
+\x03\x43\x78\x60\x24\xb4\x48\x07\x06\xe8\xa4\x6c\xc5\x1b\x09\x46\
+\xc0\x60\x9b\x34\xc7\x61\x03\x69\x21\x61\x9a\x74\x50\xc2\xa3\xa6\
+\xaf\x54\x4e\xc6\x60\x76\xfd\xc5\x4b\x12\x26\x15\x95\x7b\x39\x74\
+\x1e\x15\xa0\x82\xf2\x22\xc2\x14\xc5\xa8\x0b\x60\xd4\x4b\xc3\xeb\
+\x49\x15\x08\x3a\x5f\x10\xa3\x9c\x04\xa8\x26\x94\x47\x16\x0c\xb7\
+\x25\xde\x6b\x08\xb7\x4e\x27\x30\xf9\x91\x04\x5a\xed\x08\xf9\xd8\
+\xf0\xa2\xce\x56\xa6\x8e\x40\xd8\x85\x42\x0b\xa9\x58\x1f\xc7\x7c\
+\xd4\xe2\xd4\x49\x0d\x60\x06\x01\x0b\x80\x55\x41\x5c\xb8\x91\xc7\
+\xe6\x99\xa1\x0f\x00\xd2\x75\xe8\x79\xdb\x2d\x17\xb7\x3e\x06\x42\
+\x9b\xf7\x2b\xf8\x42\xc0\x5d\xfe\x58\xa1\xac\x0f\xff\xda\x00\x0c\
+\x03\x01\x00\x02\x00\x03\x00\x00\x00\x10\xfd\x54\x36\x2e\x3a\x65\
+\x12\x3a\x19\xef\xb0\xe7\x6f\xdd\x21\x54\x42\x0d\xf7\xb1\xdf\x0d\
+\x50\x14\x47\xba\x0d\x1e\x03\x2c\x5c\x0a\xf7\x01\x75\x71\x45\xd4\
+\xa1\x5e\xad\x6e\x22\x95\x3e\xd7\x4d\xa1\x27\xc5\xc8\x2b\xdc\x69\
+\x19\x67\x71\x50\x6d\x27\x2b\xc8\xf4\x54\x6e\xb9\x18\xa4\x62\x49\
+\x0d\x57\x25\x6c\x43\xfd\x62\x92\x24\x02\x9a\x14\xe0\xfa\x0b\x88\
+\xf9\xfc\xa8\xc1\xca\xfb\xe7\x0b\xb9\xcb\x7d\x48\xf6\x06\x51\x1d\
+\x6e\xae\x88\x26\xb3\x41\xbf\xaf\x75\xa3\x59\xc2\x30\x19\xe3\x90\
+\x41\x55\x1e\x9e\x14\xae\xc3\x70\x29\xe9\xef\xe7\x19\x23\xe5\xc0\
+\xbe\x78\x1a\x4f\x9d\xde\xe8\x63\xe1\x2e\xd0\xda\x95\xee\x70\x16\
+\x8a\x49\x24\x24\x2f\x49\x08\x1a\xf9\x7a\xac\x44\x93\x73\x35\xd3\
+\xe3\xc5\x8b\x83\x43\x56\xf0\x21\x66\x41\xb0\x18\x66\x18\xa3\x73\
+\x6b\xff\x00\xf4\x54\xe5\x87\xcc\x10\x76\x5e\xc3\x99\x34\x94\x4e\
+\x6f\xb5\xc0\xa6\x11\xff\x00\xf5\x9f\xa1\x09\x62\x05\x19\x93\xf2\
+\x26\x29\x7b\x50\x59\xdc\xec\xe4\x13\xb7\xc7\x71\xd0\x64\x14\x18\
+\x48\xbe\x46\x03\x8a\xc0\xfa\xd2\x7a\x2f\x93\x2f\x9e\xf9\x37\x34\
+\xd0\xc2\x93\xc8\xf5\x09\xaa\xf2\x11\xfc\x03\xef\x6d\x18\x8e\x89\
+\x0f\x05\xda\xe4\xef\x6f\x41\x20\xf1\x69\xfa\x89\x9d\x23\x5f\x1b\
+\x20\x8e\xe7\x91\x2e\x56\x77\x02\xfc\x0a\x68\x24\x25\x5e\xbd\x76\
+\x96\xd7\x4a\x24\x30\x9b\x68\x7a\x26\xd9\xec\xcd\xd8\x5e\xd0\x68\
+\xd2\x88\xd1\xf1\x53\xce\x96\x8d\x7e\xbe\xd1\x78\xb5\xfb\x20\x90\
+\xfc\x92\x86\x3a\x51\x2f\xb2\x2c\x38\xb0\x33\xd1\x05\x7b\x12\xc5\
+\x3c\xc9\x6e\x77\x31\x35\x9e\x9d\x74\x65\x8d\x2a\x16\xe4\xdb\xb3\
+\xc5\x44\x74\xb3\xf7\xa6\x61\x26\xbb\x7e\x90\xd8\xca\xc4\x9c\x47\
+\xea\xa5\xc8\xaf\xc8\x30\x51\xd3\x74\xe3\x2a\x6e\x62\x82\xb6\x71\
+\xbc\x01\xc8\x54\xea\x0d\x97\xf6\x70\x94\x10\x1d\x9a\x06\x14\xe4\
+\x50\x2c\xeb\x38\xe4\x1c\x9b\xf2\x19\x06\x24\x05\xce\x8d\xf5\x0b\
+\xfe\x80\xb3\xa4\x27\x84\x0a\xf8\x85\x16\x68\xb8\x99\xbf\x56\x29\
+\x99\x63\xb0\x89\x74\x70\x0c\xbf\x73\x41\xf9\x87\x08\x62\x55\xa0\
+\xa1\x4f\xd7\x89\x17\x18\xa6\xa2\x72\x14\x5a\x0f\xed\x96\x14\x80\
+\x3c\xae\x73\xf2\xec\x8c\xda\x09\x03\xa2\x29\x24\x13\x38\x2b\x0c\
+\x42\x20\x03\x6e\xf8\xcc\x9c\xb2\xad\xf4\x6e\x6a\x6f\x18\x29\x9e\
+\xc8\x42\x12\x02\x8d\x48\x24\xb9\xd6\xa0\x88\x65\x88\x06\x82\xd8\
+\xfc\x65\x3d\x3a\xd6\x1b\x00\x8c\x67\x28\xc4\xa0\x6a\x09\x00\x93\
+\x2d\xe0\x00\x68\xce\xfb\x39\x36\x59\xd5\xcc\x5b\x60\x9c\x94\x03\
+\x1d\x44\x6c\xc5\x7e\x0b\xa8\xb4\x89\x01\x1b\x15\x04\x9e\xa8\xb2\
+\x02\x34\x89\x14\xa6\x76\xb0\x6a\xd5\x80\x6e\x6d\xbc\x05\x01\x97\
+\x76\x3f\xd6\x68\x1f\x05\xf3\xc6\xa9\xc9\x24\x11\x47\x83\x3b\xde\
+\x84\x9a\xb0\x43\x00\x3a\x09\xc0\xff\x00\x82\x55\x4a\x4f\x98\x3f\
+\x23\x1f\x09\x6e\x92\x48\x24\x9f\x80\xdf\xcc\x40\xa3\xf6\xa6\xee\
+\xc8\x99\x0e\xbf\x00\x52\xee\xbe\xec\xe4\x05\xe4\x06\x49\x94\x3c\
+\x03\xf5\xc8\x48\x8b\x5d\x7e\xf7\xfb\x86\x99\xb6\xd1\x0e\x73\x3c\
+\x0a\x32\xbd\xa6\x84\xc0\x44\x86\x29\x1a\x73\x9c\x1e\x1c\x13\xba\
+\xda\x24\x82\x32\x83\x44\xf2\x29\xe3\x7a\x15\x69\xab\xef\xf7\xab\
+\x70\x74\x3e\x60\x04\xd1\x5b\x56\xb4\xf8\x4a\xe0\x4b\x07\xd2\x47\
+\x80\x31\x8e\xa8\x98\x89\x33\xd3\x47\x6c\x34\x9d\xa3\x7a\x7f\xf6\
+\x9a\x5b\x24\x10\x0e\xd3\x01\x42\xa5\xc2\x55\xde\xdc\xf6\xf8\x2c\
+\xbd\x36\xdd\x72\x3f\xb0\x51\xd1\x9c\x59\x62\x07\x3d\x20\x11\x40\
+\x26\x19\xef\x17\xac\xe7\xf1\x0c\x54\xf4\xa2\x9f\x82\x61\x07\xde\
+\x10\x6d\xca\x38\xa1\x5f\x29\x8d\xa4\x71\xbf\xcb\xfc\x4f\x7c\x94\
+\xa2\x25\x30\x26\xfe\xc6\x54\x80\xc7\x4c\x26\x6d\x3f\xa8\x36\xd8\
+\x95\x86\x9b\x11\x28\xda\x24\xd1\x23\x6e\x36\x98\x8d\xef\x55\x57\
+\x7f\x94\x8a\x3e\xf5\x0e\x06\x5a\x03\x4a\xfb\x76\xf1\xae\x8b\xc6\
+\x9f\xd3\xc1\x40\xc5\x55\x36\x10\x20\x3a\x22\xc9\x54\x98\xe0\x35\
+\xd1\xdd\xa6\xf5\x15\xea\x1c\x4b\x87\xbf\xff\xc4\x00\x27\x11\x00\
+\x02\x01\x03\x03\x04\x03\x01\x01\x01\x01\x00\x00\x00\x00\x00\x01\
+\x11\x21\x00\x31\x41\x51\x61\x71\x81\x91\xa1\xf0\xb1\xc1\xd1\xe1\
+\xf1\x10\x20\xff\xda\x00\x08\x01\x03\x01\x01\x3f\x10\xca\x03\xba\
+\xcd\x83\x63\x88\xa4\xe0\x90\x42\xb6\xbe\x94\x68\x06\xc1\x16\x99\
+\xd3\x58\xa2\x33\x66\x5f\x3b\x00\x57\x97\x42\x41\x27\x08\x72\x43\
+\x4f\x41\xe6\x89\x02\x36\x13\x7d\x59\x7b\x5d\xeb\xd2\x9d\x72\x57\
+\x93\x6d\xe5\x50\xc0\x12\x7b\x5a\xd8\xba\xd7\x16\xbd\x20\x74\x37\
+\x59\xb7\xea\xa3\x93\x03\x08\xcf\xa6\x23\xfd\x34\x98\x4d\xfa\xa7\
+\x79\x1b\xd3\x90\x42\xba\x10\x53\xe4\xd4\xd9\x07\x41\x7d\x48\x52\
+\x07\xed\xe9\xe0\xc4\xb7\x1d\xce\x92\x47\x9a\x89\x4c\x9d\x9e\x4f\
+\x3c\x79\xab\x66\x03\xd4\x5a\xfe\xe9\x78\xa6\x59\x16\xb0\xb6\xb6\
+\x81\x41\xbd\xa5\xa5\xfe\xea\xc5\xd9\xfc\x16\xcc\x6a\x45\xe3\xcd\
+\x16\x70\x92\x77\x57\x79\x38\x7c\xd0\x0a\x00\x48\x93\x03\xfb\x73\
+\x7e\x94\xd2\x99\x69\x70\x7f\x34\xb7\x7a\x07\x0b\x3e\xbc\xc5\x18\
+\x88\x16\x81\xec\x49\xba\x1f\x63\x6a\x13\x1a\xe0\xe1\xaa\x22\x81\
+\x00\x65\x8d\x58\xd7\x6f\x1d\xd4\x72\x2f\x26\xf9\x8f\xea\xa2\x21\
+\x88\x0c\xe5\x93\x68\xa2\x09\xaf\x65\x78\xfb\x9c\x78\xa0\x86\x7c\
+\xb2\xfa\x1b\x97\x58\xd1\x59\x76\xdf\x83\x44\x8b\x01\xfe\x18\x8d\
+\x4d\x1b\x12\xc9\xed\x67\xa9\x39\xd1\x4a\xe1\x36\xf1\x40\x0a\x50\
+\xbc\x95\xa0\xac\x3a\xfd\x50\xca\x44\xbf\x18\xf9\xc2\x54\x50\x0a\
+\x02\x70\xde\x75\xa1\x4c\x95\x84\xc5\xd1\xce\xf1\x8f\x8a\x5b\x58\
+\x81\x4b\xdc\xe6\x34\xfc\xa1\x82\xc9\x47\x27\x6f\xea\xa5\xbd\x04\
+\x00\x9c\xc3\x1b\x3c\x4e\xda\x50\x89\x82\x16\xe7\xe2\x73\x40\x96\
+\x4d\xb4\x23\x7d\x68\x01\xc9\x64\xc0\x23\xbe\x9d\x68\x90\x40\x13\
+\x39\x0e\x3c\x6f\x3b\x50\x7b\x41\x50\x90\x17\x7b\xc1\xe9\xa5\x11\
+\x42\x23\x5b\xe9\x9e\x9d\xf6\xa2\x2a\x00\x3a\x05\x70\x61\x77\xa0\
+\xa6\xb0\x04\x9e\x1b\xbd\xb6\xbd\x00\x94\x92\xbd\xb3\x37\xc3\x31\
+\x9a\x04\x52\x70\x21\x64\x5b\xa1\xeb\x40\xa3\x83\xcd\x11\x36\x02\
+\x41\xf0\x09\xd7\x6f\xba\x79\xa7\x9f\x0d\x29\xeb\x9b\xaa\x53\x34\
+\x90\x60\xee\xbd\x9a\x33\x95\xc2\x63\x47\xf1\x47\x41\x60\x12\x4c\
+\x1e\x57\xce\x3b\xd5\xe9\xab\x7e\xaf\x33\xbe\xd5\x21\x58\x66\x0c\
+\xb3\xbd\x2a\x40\x59\x53\x64\xde\x21\xed\x45\x38\x02\xe3\x19\x3e\
+\xfd\xd1\x97\x2c\x3d\x43\xbc\xf2\x7a\xed\x45\x04\x4a\xdb\x89\xc2\
+\x33\xec\xd3\xa1\x63\x3e\xcd\xff\x00\x94\x79\x10\x0e\x0a\x8c\x91\
+\xf5\xe7\x61\x46\x60\x12\x5b\xab\x74\xee\x41\xe6\x91\x8b\x06\xe7\
+\x47\xa5\x4e\x88\x02\x5c\x15\xaf\x03\x07\xbd\x28\x1c\x48\xc1\x21\
+\x1b\xea\x7d\xd6\x88\xe0\x78\xef\xfc\xed\xbd\x1c\x20\x01\x62\x13\
+\xae\x34\xf3\x41\x0e\x60\xa2\x40\x7f\xab\x02\x8c\xcb\x01\x76\x3a\
+\x9e\x3b\x6f\x44\x13\x17\x80\xf9\xe9\x67\xfd\xad\x41\xf9\x2a\xcf\
+\x0b\xb5\x04\x44\xd2\x82\x77\x8d\xb4\xfe\x66\x8a\x61\x69\x8f\x1a\
+\xcd\x10\x90\x29\x84\x01\xdc\xee\x7f\xca\x75\x33\x01\x3e\xc3\x5a\
+\x08\x8c\x26\xb5\x9f\xc5\x42\xac\x64\xeb\xd7\x0b\x55\xa5\x0c\x91\
+\x1d\x49\x1b\x8e\x5d\xac\xf8\xa0\x8c\x42\x1b\xe9\x2c\x2c\xb1\x0a\
+\x8c\xef\x12\x40\x03\x9e\x1f\x3a\x51\x80\x80\x5f\x2f\x71\xf4\x28\
+\x93\x89\x43\x90\xbd\x16\xfe\xd1\xcc\x01\x48\x97\xf5\xeb\x33\xae\
+\x48\x2d\x93\x9c\xae\x05\x7c\x8c\x9e\x1e\xbf\x68\x6c\x97\x59\xf2\
+\xd9\x7a\xeb\x5f\x6a\x23\x5d\x3b\x6b\xb5\x10\x90\x8d\x8e\x87\xe0\
+\x74\xda\x88\x40\x42\x37\x8b\x9b\x74\xd3\xad\x1e\x01\x44\x7c\xc9\
+\xc7\x34\x22\x1e\x91\x7b\xcc\x6d\x45\x70\x25\x02\xfc\xef\x2e\xfb\
+\x6b\x40\xee\xce\x4a\x1e\xbd\xad\x44\x62\x6c\x8e\xbe\x44\x65\x9a\
+\x28\xd9\x31\x86\x7f\xc7\x34\x5c\xa8\xeb\xb9\x27\xe8\x7e\x51\x01\
+\x62\x9f\x97\x6f\xbb\xf2\x6a\x61\x17\xf8\x6d\xf2\x45\x30\xb3\x02\
+\x6f\xb8\x2b\xef\xbd\xe9\xd4\x5c\x38\xcb\x8e\xbd\x4d\x66\x0d\xf5\
+\xdc\xe2\xf4\x45\x0d\xc6\xba\x8e\x98\x74\x5d\x6d\x0b\x5a\xef\xb5\
+\x00\x30\x58\x5e\xff\x00\x35\xa3\x82\xc0\x43\xe5\x81\x68\x83\xde\
+\x85\x50\x48\x9b\xa3\xa1\xfd\x4a\x82\xe0\x39\x46\xb3\x7b\x1e\x83\
+\x5a\x5c\x10\x41\xe5\x61\xfd\xa5\x21\x01\xcc\x00\x31\x67\x8f\x34\
+\x22\x4a\x01\x87\x99\x37\x54\x74\x9a\xf0\x35\xe9\x33\xfb\x8a\x86\
+\x03\x0a\xc6\x4f\x11\x3d\x7b\xd1\xd2\x57\x4b\x06\xd9\xf8\x7a\x50\
+\xf9\x24\x66\x66\xd7\xdc\xd1\x32\xb0\x06\x01\xe8\x07\xba\xda\x88\
+\x81\x93\x73\x3b\xb1\x01\x8b\xad\xe8\xe5\x32\x67\x39\x0c\x47\x31\
+\xad\xb3\x4b\x00\x96\xe0\xe1\xf4\xc7\xfb\x44\x06\x02\x01\x4b\x5a\
+\x66\x3d\x54\xd5\x01\x92\xa1\xf2\xb4\xe1\x54\x9d\x87\x22\x4c\xaf\
+\xf6\xae\x47\x95\xbb\xb7\x73\xde\x89\xc7\x07\x49\x62\x49\x3e\x1f\
+\xe9\x15\x0d\x24\xca\x9b\x9d\xfa\x54\x46\x21\x05\xc8\x5e\xab\x67\
+\xec\x00\xc6\x40\xe5\xe4\xc8\xdf\xce\x93\x48\x11\x24\x99\x28\xb9\
+\xc7\x3e\xba\x44\x65\x3d\x0a\x69\xfe\x79\xa3\x73\x30\x16\xbc\xb4\
+\xd5\x12\x38\x23\x86\xa3\x44\x37\x1a\x3f\x94\x46\x64\xad\xef\xc6\
+\x4d\x9c\xa8\xa0\x8c\xa0\x03\xb9\x8b\xeb\xd3\xd3\x4a\x34\x81\xa6\
+\x49\x1f\xcb\xaf\xb7\x43\x61\x33\x49\xda\x7d\xce\x55\x13\x01\x59\
+\x21\xf6\xa2\x7e\x68\xa0\x40\x63\x06\x1d\xf3\xce\x9f\x94\x49\x85\
+\x02\x5b\xeb\xa6\xa6\xf9\xb5\x48\x10\xd0\xdc\xc9\x04\xa1\x73\x0f\
+\xae\xd5\x6e\x0b\x30\x24\x6a\x33\x33\x1e\x9a\x7a\x10\x21\xea\xf8\
+\xa6\xa9\x4b\x07\x5c\xe9\x19\xc9\xea\xe6\xa0\x44\x7f\xbf\x6a\x9d\
+\x82\x61\x25\xf7\x9d\x36\xfb\xb1\xd7\xe1\x4d\x1b\xdb\xd0\x56\x9b\
+\x27\x7c\xb9\xf3\xa7\x34\x00\x82\xd9\x43\x27\xdf\xf2\x82\x00\x0d\
+\xa0\x4e\x7a\x72\xdb\xa7\x04\x6d\xef\xd5\x11\x50\x28\xed\x83\x26\
+\xf9\x7c\xd1\x08\x8a\x02\xc6\x2d\x96\x77\x8a\x9c\x90\x19\xfb\x2b\
+\xce\xf9\xa0\xa1\xc3\xb8\xc1\x7c\x75\xc6\x36\xab\x38\x70\x03\xce\
+\xfb\x8e\xf5\x29\x9a\x35\xcf\xc9\xa1\x80\x8e\x71\xce\xe6\x8c\x88\
+\x10\x23\x66\x0c\x93\x13\xc6\x15\x6e\xf7\x3c\xea\xed\x41\x89\x07\
+\x29\x79\xb4\xf7\xa4\x44\xac\xa7\xb8\x98\xa1\x18\x48\x2e\x2f\xfe\
+\xea\xdd\x95\x14\x92\x6e\x9d\xc2\x07\x27\x7e\x9d\x68\x40\xde\x6e\
+\x3e\x0e\xb8\x1a\xcd\x3f\x93\xa7\x97\x91\xad\x00\x08\x40\x80\xdc\
+\xf3\xa9\x3f\x15\xc1\x9c\x0c\x7a\x75\xa0\x01\xb4\x3c\x0f\x56\xf3\
+\x57\x88\x81\xe3\x3f\xb4\x0b\x3b\x24\xf1\x0f\xe9\xf1\x9a\x48\x00\
+\x3d\x5a\xf4\x3c\x37\x45\x50\x12\x41\xd3\x13\x11\xe2\x15\x2e\x21\
+\xb1\x13\x32\xce\xd9\x46\x82\x24\x60\x4b\x70\x34\xcb\xc5\x0f\xa8\
+\xec\x9f\x19\xd0\xf1\x43\x34\x00\x01\x61\xdf\xc4\xf6\xa0\x98\x2d\
+\x72\xb5\x13\x4f\x81\x66\xd7\xdc\xf2\x5c\x45\x3e\x9f\x55\xe3\x4e\
+\x0f\xa5\xd0\xe4\x66\x44\x0d\x34\x5e\xe6\x45\x22\x05\x84\x02\x5e\
+\x4d\xe1\xd8\x7a\x28\xe8\x20\x83\x6e\x17\xe7\xac\xd1\x8a\xc1\xc6\
+\x86\xe7\x3c\xfa\xa9\x15\xc8\xe7\xad\xf8\x1d\x27\x9a\x21\xc4\x04\
+\x06\xaf\x24\xae\xda\xe7\x8a\x00\x24\x3a\xf6\xdb\xf7\x4a\x00\xa5\
+\x31\x20\x38\x95\xf4\xfc\xd1\x0b\x0f\xb3\x3f\xa3\xcd\x08\x30\x43\
+\x10\xc1\x52\x7f\xc0\x6d\x4d\x08\x0d\xc5\xa7\x7a\x14\x42\x4b\x51\
+\xa1\x2e\x33\xca\x5a\xd0\x59\xda\xe6\xe6\xf3\xce\xd3\x7a\x40\xb6\
+\x04\x0a\xe8\xb1\xfe\x51\x16\x23\x23\x57\xef\x8f\x9a\x19\x02\x79\
+\x62\xf9\x37\xc2\x9f\x45\x32\x1b\x60\x09\xbb\x4f\xcd\x33\xb5\x15\
+\x30\x84\xb0\xb6\x3f\x69\x00\x04\x46\xa4\x4e\x4f\xbf\x94\x63\x14\
+\x06\x88\x2b\x15\x8a\xba\xc6\xc6\xe6\x44\xeb\x6d\x2a\x35\x1d\x4b\
+\xc7\xd1\xe8\x2f\x48\xc0\x0d\xc7\xc5\x6d\xc0\x98\x21\x43\xec\x6d\
+\x45\x27\x20\x37\x24\x92\x43\x3a\x51\xc8\x0e\x22\xdb\x0d\x86\x19\
+\xeb\xd5\x45\x34\x02\x6c\x41\x19\xbe\xda\xff\x00\x28\x22\x40\x3f\
+\xdc\xc6\x48\xc4\xd0\x44\x01\x25\x33\xed\xa8\x14\x80\x41\xa1\x24\
+\x59\x4d\x09\x60\x03\x6d\x09\xce\x38\x95\x6a\x19\xf2\x46\x2c\xff\
+\x00\x9e\x68\xa0\x92\x10\xb6\x6f\xf0\xbf\xc9\xa0\xe0\x06\xac\xdb\
+\xf9\x46\x12\x40\x32\x6e\x75\x2f\xe4\x76\xde\x83\xd2\x01\x20\x16\
+\x0f\x1f\x8a\x22\x48\x02\xe5\x2e\x7c\x5b\x99\xad\x40\x22\xf9\x9f\
+\x95\xc6\xb5\x20\xcc\xdd\x95\xbb\x08\x74\x04\x90\x96\x7a\xfb\x10\
+\xed\x44\x05\x46\x35\xe7\xbe\xb6\x8d\x28\x98\x0a\xe3\xe4\xe3\x9b\
+\x1a\x27\x62\x37\xc3\xe7\x6f\x9a\x09\x49\x69\xaf\xcd\x5a\xd9\x50\
+\x40\x48\x44\x8b\xb2\x36\xb8\xe9\xd2\x6f\x59\x0d\xbe\x89\x36\xde\
+\x8d\x11\xa1\x83\xab\x76\x9f\xda\x8d\x27\xd6\xca\x9b\x34\x06\xf9\
+\x6a\x54\x5f\xea\xa4\x23\x26\x41\xd5\x3e\xff\x00\xda\x00\x62\x0a\
+\xf7\x84\xf1\x97\x42\xc4\x73\x6f\xf4\x4e\x2e\x3a\xd2\xac\x32\x9b\
+\x4c\xec\xf4\xa1\x17\x63\xfa\x30\xb6\xb9\x7b\x52\xc1\x90\xd9\xe0\
+\x3a\xb5\xd7\xe0\xd0\x20\x4c\xe9\x7b\xba\x9f\x03\xad\xf3\xdb\xc5\
+\x44\x20\x6b\x9d\x45\xef\x9d\x30\xa9\x08\x25\x2b\x81\x3c\x63\x16\
+\xa3\x22\x40\xc8\xbe\x43\xea\xd7\x4a\x02\xd9\x25\xbd\xd0\x8b\x50\
+\xa6\x04\x18\x47\x36\xce\x72\xe8\x10\x44\x86\x87\x3d\x27\xfb\x40\
+\xe3\x62\x32\x60\xe6\xf6\xa0\xe4\x4b\xb4\xb4\x9e\xf5\x1c\x42\xd4\
+\xa7\xd6\x2a\x5d\x5b\x6d\xcd\xbe\xec\x36\xa0\x8a\x19\x36\xbf\x05\
+\xe9\x65\xd7\xad\x09\x01\x2c\xd3\xd2\x3e\xf6\xbd\x16\x21\xa6\x10\
+\x5b\xf3\xef\x14\xab\x02\x1e\xba\x1d\x62\xf4\x2c\xe9\x19\x0a\x13\
+\x16\xe1\xde\x8a\x28\x0c\x9b\x1e\xa2\x6f\x1f\x7a\x51\x40\x2c\x2d\
+\x37\xce\xfd\xe1\xd0\xf0\x51\x04\xdd\x7c\xda\x30\x55\x20\xa6\x0d\
+\x4f\xe8\x34\x51\x09\x5b\x02\x8e\xdf\x54\x60\x99\xcf\xd8\xfe\xef\
+\x6b\x53\xb4\xcb\x9c\xc3\xf6\xd4\x2c\x50\xba\x32\x8f\xfb\xa6\x29\
+\x54\xda\x12\x26\xe5\x97\xd3\x4a\x0a\x10\x2d\xd4\x5f\x41\xe8\x34\
+\x43\x25\x08\x40\x5a\x49\x16\xe9\xa2\xa0\x80\x02\x03\x50\x3e\x73\
+\x73\x61\x9a\x24\x88\x31\x56\xf2\xc7\x5b\x50\x5f\x4d\xe5\x60\x3b\
+\xd1\x51\x62\x00\x44\x82\xcd\xf4\x58\xa5\x62\x00\xd8\x0d\xcb\xf1\
+\xb4\x33\x49\xd2\x82\x0c\xa2\xe0\x39\xef\xa6\x28\x84\x81\xb9\x20\
+\x25\x25\x8f\x62\x76\x75\x38\x76\xf9\x04\xf9\x01\x3d\x26\x80\x82\
+\xe7\xde\x94\x6f\x12\x79\xf6\x68\x80\x99\xf1\xae\xca\x24\x60\xd8\
+\x1b\x68\x63\x81\xfb\xad\x1c\x64\x80\xc8\x41\x02\x51\xbb\xf8\x93\
+\x14\x64\x04\x40\x96\x40\xdb\x13\xa7\x2a\x55\x0e\x94\x2c\x32\x0f\
+\xbe\xbf\xe6\x94\x46\x8c\x0a\x7a\x23\x56\xf4\xdf\xc5\x20\xc8\x22\
+\x53\xb1\xff\x00\x27\xed\xd1\x04\x02\xfd\x63\xfc\xd6\x98\xa6\x9b\
+\x85\xfa\xa0\x38\x40\x6f\xca\x7a\xd1\x41\x00\x84\x11\x6b\x7a\xf6\
+\xa1\x1b\xa3\xb4\xc9\xf3\x52\xb0\x52\xba\x81\x8b\x23\xe9\xa1\x9c\
+\x00\x04\xb2\x37\xbc\xea\x4f\x7e\x28\x85\x09\x12\xa2\x74\x7a\x64\
+\xeb\xd2\x90\x08\x97\x75\x9d\x47\xbb\x0a\x4c\x0b\xb2\x05\xad\x9f\
+\x20\xd4\x59\x27\x7d\x4e\x19\xd3\xaf\xc8\x64\xb4\x78\x23\x51\xb6\
+\xd7\xa4\x5b\xcf\x4b\xcf\x6a\x39\x3a\x5e\xfa\x6f\xad\x5a\xa0\x46\
+\xd6\x0f\xc9\x54\x52\x04\xfa\x74\x73\x63\x3f\xb4\x28\x1b\x14\x5f\
+\x7b\x4c\x69\xa1\xa0\x89\x6e\x91\xa9\x1a\x61\x51\x32\x84\x0c\x9b\
+\xcf\xa4\x1f\x55\x14\x80\xc0\xc1\xd1\x09\xef\x03\x34\xc1\x88\x9c\
+\x7d\xdd\xeb\xbd\xdd\x5f\xa7\x7b\xbb\x80\x5d\xbb\x66\x97\x25\xc9\
+\x06\x18\xce\xb9\xee\xe2\xb0\x69\x0c\x85\x67\x68\xfc\x1b\x0a\x34\
+\x33\x79\xf8\x1f\x94\x40\x64\x1b\x23\x52\x23\x36\xa6\x10\x05\xe2\
+\x74\xd5\xff\x00\x3d\xdd\x2b\x1a\x5f\x44\xdb\xeb\x45\x08\x54\xec\
+\x23\xf2\x3f\x86\x80\xa0\x8d\x40\x26\x08\x27\x78\x00\xff\x00\xb4\
+\x1d\x04\x22\x1c\x66\x7a\xfb\x7a\x34\x0d\x81\x10\xb0\x44\xf6\xdd\
+\x51\x28\x06\x59\x9c\xeb\x81\x45\x94\xf2\x6e\x63\x7f\x55\x4a\x20\
+\xf5\xb9\xbc\x28\xef\x49\x02\x96\x9e\x6f\xeb\xac\x3a\xfd\x54\x61\
+\xb7\xd5\x20\x74\x47\xe3\x83\xa8\xef\xcd\x1d\x3c\x38\x93\x93\xc7\
+\xc5\x10\x25\x37\xd5\x49\x23\x23\x8a\x00\x02\x49\x6a\x0e\x74\xa2\
+\xd7\x25\xbb\x6e\x4f\xd8\x14\x72\x21\x66\xfa\x91\xc5\xd8\xa8\x05\
+\x22\x93\x4b\x2e\x04\xea\x7a\x54\x84\x03\x55\x70\xad\x78\xc0\xa0\
+\x21\x71\xea\x9c\x9d\xf6\x5d\x1d\x04\x40\x8d\x65\x5a\x4b\xbe\xaf\
+\xbd\x30\x48\x03\x51\x23\x26\xfc\x8f\x34\x55\x2e\x08\xbb\xaf\x99\
+\xa0\x04\x08\x01\x17\x30\x03\x21\x78\xfc\xa8\xf7\x32\x60\x98\x92\
+\x7d\xcd\x17\x76\xb0\x0e\x5d\xed\x31\xa4\xf7\xa0\x19\x20\x54\xa2\
+\xc1\x5d\x33\xd2\x8c\xb1\x04\x26\x30\xec\xf5\xb6\xd3\x51\x84\x97\
+\x6d\x00\xb7\x85\x43\x29\x93\x36\xbf\x1c\x7a\x36\x60\x8c\x45\x89\
+\x25\xe1\x6a\x4c\xff\x00\xb4\x06\xc0\x1b\x0b\x0c\xbe\xf7\x74\x12\
+\xa9\x85\x91\x48\xdf\x9f\x87\x4c\x0e\xf8\x04\x2f\x1f\x06\x90\x90\
+\xb3\x78\xeb\xbe\x28\x22\x42\x89\x68\x5c\x4f\xac\x50\x4c\x06\xdd\
+\x75\xfd\x54\x68\x00\x82\x71\xb9\xfa\xe2\x76\xa0\x80\x02\x11\x0c\
+\x5c\xc3\xf8\xf3\xad\x13\x14\x00\x99\x03\x38\xb7\x58\x76\x16\xdc\
+\xba\x2c\x6a\x96\xfc\xf1\x4b\xd1\x31\xa4\xe7\x61\xaa\xa6\x2f\x23\
+\xbe\xef\x9d\x68\x2f\x84\xd4\x15\xbb\xda\x62\x80\x40\x05\x3f\x04\
+\xfe\x8e\xb4\x0d\x26\xe1\x7c\xf6\x35\xe6\x8f\x62\x8b\x78\xfd\xf1\
+\x58\xac\x3e\xbc\x88\xda\x2d\x4c\x72\x09\x32\xb8\xb6\x9a\x3f\xda\
+\x31\x98\xa2\x5a\x34\xff\x00\x3c\xd4\xa8\x89\x13\xd7\xf1\xdf\x4e\
+\xb7\x02\x59\x50\x51\x63\x64\xf3\x4a\x8a\x6d\x60\x84\xe8\xff\x00\
+\xd6\x62\x86\x06\xdb\xa1\xba\x60\xdd\x43\xf1\x44\x4c\x9b\xe4\x58\
+\xe9\xdf\xae\xc2\x87\xca\xfd\xfb\x77\xb0\xa5\xa0\x0b\x2d\x1b\xfb\
+\xf5\x4d\x90\x3e\x72\x23\x1d\x3a\x6f\x50\xf0\x18\x64\x09\x72\x62\
+\xf5\x75\x2d\x93\x37\x23\xde\x1c\x74\xa2\xa6\xb5\x95\x09\xe0\x89\
+\xc3\x9e\x99\x84\xe2\x3b\x8a\xeb\x48\x51\x48\xb9\xd5\xba\x20\x06\
+\x42\x4a\xc8\x07\x6d\xe8\x40\xc0\x84\x42\x1a\x3d\x86\x9f\xca\x19\
+\x0d\x16\xc6\x0e\x28\x45\x83\x01\xb8\xd5\xc3\x46\xdc\xd0\x62\x00\
+\x13\xb2\xc0\x39\x5a\xd0\x70\x05\x3b\x64\x79\xdc\x51\xd8\x61\x13\
+\xdd\x08\xdb\x7a\x70\xbc\x5f\x5b\xee\x0e\x95\xa7\xc9\xf9\x3c\xfc\
+\x8e\x97\xac\x71\x10\xf9\x67\x63\xf2\x69\xa0\x02\x8f\xef\x02\xf3\
+\x1c\x50\x04\x52\xc1\x5d\x1d\x02\xc0\x5c\xea\x70\x48\xf6\xd5\x78\
+\x4e\x50\x8a\xa5\x12\xe4\xb8\xbc\x35\xbd\x14\x6a\x11\xb4\xa7\x74\
+\x4e\xb4\x84\xf0\x33\x23\x60\x2f\xe6\x8b\x08\x07\xd5\x82\xab\xe6\
+\x7c\xab\xd1\xcd\x33\xa1\xe5\xbf\x1d\x3f\x1b\x7c\x96\x81\x53\x95\
+\x89\x4b\xae\x47\x03\x32\xe8\x88\x05\xb3\x80\xc8\xb9\x6c\x11\xd7\
+\xd8\x38\xa0\x03\x25\xc3\x6f\xc3\x3f\xba\x50\x10\x08\x10\x07\x66\
+\x92\xc7\x9b\xd1\x09\x12\x23\x8d\x49\xea\xd4\xd0\xd8\x11\x2c\xc9\
+\x16\x07\xab\x46\x79\xa0\x89\x4f\x16\xbd\x87\xb0\xf3\x08\x8c\x02\
+\x82\x92\x6c\x6f\x17\x17\xc4\xf6\xa8\xe2\x36\xf0\x62\xff\x00\x85\
+\xeb\xda\x81\xc0\x89\x56\xbd\xde\x9d\x7f\x94\x08\x49\x0d\x9d\xfd\
+\x7d\x28\x12\x4a\x97\x7b\x64\x8c\x0d\x7c\xed\x43\x94\x90\x2d\x9e\
+\xfd\x99\xe4\x50\x04\x28\x84\x24\x07\x8b\x73\xe8\x34\x22\x9b\xd3\
+\x2b\xac\x7d\x8d\x29\x10\x87\x27\x30\xfa\xff\x00\xb9\x4a\x99\x41\
+\xb1\x37\xeb\xaf\x5e\xdb\xd2\x15\xa0\x1d\x5e\x4e\x37\x72\xb6\x06\
+\x9e\x08\x36\xc4\xdf\x3c\x7d\x53\x22\x25\xdd\x02\x14\x92\x5e\xbe\
+\xed\x41\x24\x7f\x57\xe6\x98\x08\x22\x1e\xb0\x4a\xf7\xf2\x88\x92\
+\xc8\xec\xd8\x8d\x38\xed\xbd\x09\x26\x82\x0a\xf0\x5c\x5a\x68\x66\
+\x11\x13\x18\x77\xe3\x8e\xbb\x52\xe6\x40\x10\x01\xb4\x82\xdc\x75\
+\xfe\x50\xc9\x69\x32\xb1\x71\x8c\x5e\x92\x82\x32\x16\x73\x9b\xa7\
+\xdf\x9a\x00\x08\x08\x32\x21\xb0\xbc\xe9\x09\x71\x42\x3a\x1a\x1d\
+\xce\x75\x89\xeb\xb5\x10\xda\xee\xb3\xdc\x01\xa5\x21\x88\x11\x16\
+\xea\x66\xdf\x9d\x68\x64\xc8\x33\x03\x96\xe6\x86\xac\x83\x72\x6f\
+\x9d\xb7\x34\x22\x1f\xb8\x1f\x87\xa6\xf4\x64\xa0\x0f\xb0\xbb\xa2\
+\xa8\xc2\x4d\x49\x16\x23\xcb\x8a\x2b\x18\x9b\x22\x88\x66\xe2\xfd\
+\xbc\xd4\x02\x53\x90\xfe\x87\xba\x51\xaa\x02\x51\x35\xf5\xb7\xec\
+\x56\xdb\x9e\xe7\x31\x93\x9c\xd0\x9b\x00\xd2\x1e\xa7\xba\xa0\x8d\
+\x1b\x6f\xd2\x06\x0d\xdd\x4c\x21\xd4\x6e\x77\x23\x3b\x1e\x28\x67\
+\x81\x25\x18\x66\x2f\x18\xa2\x04\xb0\x0f\xa7\xf2\x74\xa1\x88\x40\
+\x01\xe4\x5b\x3e\x7b\x0e\xf5\x69\x2b\xed\xbb\x58\xf6\x62\x84\x81\
+\x77\x4d\x4e\x93\xea\xa8\xbf\x3e\xad\xa3\xb5\xc6\xf4\x00\x84\x07\
+\x8e\x7e\xb0\x9d\x09\x00\x0c\x19\x7a\x93\x1f\x78\xba\xa0\xb8\x87\
+\x11\x1a\xfb\x9a\x2d\xf1\x7c\x2d\x49\x5e\x82\x29\xce\x2f\xfe\xfd\
+\x4d\x4d\x5b\x7d\xbb\x4d\xfa\x53\x40\x5e\xf7\x57\x9f\x8a\x12\x79\
+\xd6\x74\x8c\xfc\x54\x8f\x8e\x5b\x3e\xab\x8f\x67\xf2\xb1\xc7\x37\
+\x11\xd6\x28\x6c\x2e\xa7\x69\xe3\xf6\xa1\x10\x7b\x4e\x6d\x1d\xf6\
+\xad\x87\xef\xe6\x99\x14\xee\x17\x06\xc9\xb5\x8e\x7a\x16\x69\x42\
+\xc8\xa3\x53\x23\x20\x9d\x28\x55\x19\x00\x15\xb4\x3c\x69\x9e\xd4\
+\x27\x80\xf3\x6b\xb7\xe4\x03\x36\xda\x8b\xac\xdd\xb3\x6d\x9c\xad\
+\x52\x74\xc0\x33\x7e\xb1\xce\x3e\xa9\x70\x2e\x8b\x22\xf1\xda\xbd\
+\x3a\x8a\x02\x40\x2e\xfe\x94\x41\xe4\x00\x67\xf1\x7c\xe6\x8d\x24\
+\x90\x4e\x4d\xa2\x5c\x40\x74\xfb\x40\x4f\x99\x78\x1a\xad\x3c\xcd\
+\x10\xe2\x6e\x42\x17\x86\x4f\xda\xe8\xdc\xd6\x94\x76\xee\xfb\xf1\
+\xbd\x11\xc3\x67\x7e\x5c\x6e\xf4\xde\xd1\x48\x9f\x5a\x26\x27\x1d\
+\x7d\x8a\xc5\x18\x16\x50\x7f\x67\x9b\xf1\x46\x90\xb1\x72\x06\x04\
+\x1b\xea\xef\xd6\x98\x18\x23\x72\x41\x79\xb7\xaa\x8b\x70\x81\x40\
+\x0a\x12\x51\xf0\x71\x40\x91\x78\xf6\x7b\xaf\x26\x8c\xc0\x00\x05\
+\xbb\x48\x24\x60\x7d\xe9\x9a\x22\x58\x03\x50\x79\x71\x7b\x54\x04\
+\x12\xad\x70\x5a\x19\xeb\x45\x12\xc3\x12\xb6\x0f\x5d\xe6\x82\x21\
+\x16\x19\xeb\x0b\x02\xef\xaa\xb8\xa9\x26\x14\x01\xe4\x6f\x9d\xa8\
+\x58\x20\x4d\xd3\xd7\x4e\x5e\xbd\xa8\x92\xdc\x6b\xa6\x75\xa1\x10\
+\x33\x2d\x2d\xcd\xdf\xf2\x90\x29\x1d\x77\xf7\x1a\x50\x40\x16\x41\
+\xb5\xe5\xe5\x27\x4f\x80\x1e\xdd\x58\xe8\xaf\x46\x0a\x14\xc9\xe0\
+\x7d\x9a\x1a\x40\x01\xca\x0b\x57\x48\x33\x10\xe3\x01\x92\x3d\xfe\
+\x51\x59\x41\x44\xa1\x03\x4f\xa0\x68\xa0\x48\x61\x5e\xc0\x8f\xaa\
+\x14\x30\xb6\x8b\x7a\x75\xa3\x05\x24\x10\x07\x70\xfe\xba\xd5\x88\
+\x5f\x6d\x46\xba\x7c\xd1\xf5\xc4\x37\x9f\x6f\x1c\x50\x00\x5d\xa3\
+\x3d\xfa\x48\xed\xbd\x00\x1c\x97\xfc\xfc\xaf\x4e\xa2\x8a\x70\xd2\
+\x8e\x82\x8c\xac\x26\x51\x76\x7a\xef\x41\xc0\x80\x1e\x3b\x3d\x70\
+\x4d\x0e\x84\x0b\xb8\x82\x61\xfb\xa8\xe5\x50\x10\x43\x04\x39\x86\
+\x73\x61\xed\xe9\x33\x83\xca\x3e\x3a\xc6\x8a\x88\x44\xb1\x91\xd7\
+\x6d\xb5\xa4\xc0\x64\x0d\x8d\xa3\x50\x46\xbd\x68\xe0\x00\xdf\xf9\
+\xa1\x3a\x50\x06\xe5\x0e\x8f\xa7\x1b\x6d\x48\xc1\x2f\x9e\x38\xd6\
+\x80\x50\x92\x35\x49\x1c\xc9\xe9\x47\xc6\x87\xa6\xac\x5f\x48\xa1\
+\x0c\x5e\x2d\x67\x9d\x3d\xeb\x4b\x81\xde\x0b\xb1\x5a\x0b\xd0\x18\
+\xe8\x36\x36\xdb\x55\xec\xcd\x38\x80\x12\x38\xdc\xe7\x48\xa0\x3e\
+\x0e\x81\x83\x2b\x4a\x1a\x28\xc1\xbc\x1f\xf4\xf0\x68\x48\xb0\x2c\
+\xb5\x73\xb8\x0b\x13\xf0\xa9\xd3\xa6\x0e\x81\xe9\x46\x02\x07\x27\
+\x5d\xed\x11\x6a\x8c\x41\xa0\x1b\x95\x27\x6d\x27\x45\x4d\x1a\x0d\
+\x80\xe6\x6e\x75\xdb\xe6\x90\x01\x4e\xf8\x0c\xfb\xd5\x52\x5d\x1a\
+\xfb\xde\xd6\x15\x30\x3e\xe8\xc6\x64\x79\xa6\xab\x08\xa5\xaa\x04\
+\xda\xae\xf0\x7e\x6a\xde\x1f\x0f\xf8\xe0\xc0\x02\x6d\x1f\x06\xb6\
+\x06\xf9\x31\x77\x6d\x7c\x62\x85\x84\x49\xb2\xfa\x8b\x77\x3d\x76\
+\xa1\x88\x6b\x7a\x39\xf6\xbc\x7c\x9f\x81\x5e\x9d\x45\x5e\xe9\xf0\
+\x2a\xf7\x07\xe0\x50\x9c\x28\x02\x13\xb9\x0f\x7f\x28\x04\x14\xb3\
+\x9d\x2d\xa7\x5a\x15\xc9\x04\x93\xab\xb7\x5b\xcd\x49\xa5\x2b\xe7\
+\x3e\x63\x11\xd2\x90\x06\xce\x75\x24\xe9\xd2\x86\x42\x2c\x76\xf1\
+\x30\x0f\x71\xbd\x24\x0b\xcd\xa3\xe2\x57\x93\x50\x81\xe0\x78\xb5\
+\xe3\xe2\xa5\x72\xb7\xb7\x81\xb6\xf4\xa1\x91\xc3\xd4\x15\xf1\xf6\
+\x68\x60\xc1\x3d\x0f\x16\x9e\xf4\x20\x82\x60\xe8\x60\x25\xbd\x03\
+\x90\x57\x00\x6a\x3c\x99\xda\x83\x2b\xb1\x8b\xda\xd8\x39\x9b\x50\
+\x41\x92\x08\x61\x8d\x5e\x36\xa0\x20\x49\x01\x39\x8c\x8b\xcf\xb9\
+\xa3\x25\xc0\xdd\x4a\xd4\x63\xc5\x08\x19\x35\x13\x7b\xe7\xa0\xbf\
+\x84\xe9\x2c\x0c\xb8\x04\x70\x37\xcd\xb7\xcd\x00\x42\x44\x13\xbe\
+\x63\x18\x91\xe8\xab\x76\x20\x88\x2e\x47\xaa\x82\x40\xc9\x70\x2e\
+\x01\x4a\x05\x63\x00\xb3\xab\xf7\xe7\x6a\x30\xe0\x7a\x3f\x9d\xb7\
+\xa3\x30\x30\x3e\xdb\xe8\xf7\xda\x9d\x05\x03\x9b\x6b\x33\x13\x42\
+\x2b\x42\x2f\x5d\x7f\x4f\x4a\x41\x66\x40\x3b\xf4\x3a\x9e\x2d\x14\
+\x26\x92\x49\x27\x8b\x75\x64\xd4\x42\xe0\xe5\x75\x03\xdd\xe8\x25\
+\x22\x75\x6b\x52\x23\xc9\xcd\x09\xeb\x4c\x1b\x58\xb7\x17\xd2\x84\
+\x43\x39\xb7\x4f\x5e\x9a\x30\x4b\x22\xf9\x0c\x47\x5c\x63\x67\x9a\
+\xc4\x2f\x97\x6f\xf4\x0f\xba\x88\x44\x59\x88\x36\x8f\x73\x47\x02\
+\x50\x07\x3e\x8a\xb3\x40\xc1\x24\x19\x12\x27\xe3\xd1\x43\x21\x00\
+\x00\x59\x91\xcc\x5f\x6a\x20\xe8\x92\x80\x80\x98\x39\xe5\x54\xa4\
+\x12\x49\xee\xca\x22\x37\xce\x68\x88\x17\x1a\xc0\xc7\x02\xae\x46\
+\x40\xf7\x5f\x4d\x1b\x99\xae\x84\x9d\x06\x28\xc4\x00\xb8\x6b\xb0\
+\x3e\xe8\x28\xdc\x9b\xd8\x0b\xaf\xbd\xaf\x46\x18\x1d\x49\x97\xb3\
+\x3a\x69\x6a\x68\xbf\x9e\x6f\x27\x5d\x7a\x51\x18\x6b\x1d\x1d\x9f\
+\xd0\xa9\xf2\x3a\x5a\xe6\xf3\xdb\x7a\x11\x07\xe2\xed\x07\x8e\xd5\
+\x23\xdc\xef\xf2\x37\xa2\x41\x5e\x23\xeb\x58\x74\xa2\x13\x36\x53\
+\x89\x98\xda\x68\x80\xb2\x9b\x3c\x36\xfd\xfb\xa2\x72\x42\x32\xb7\
+\xf3\x61\xda\xe1\x81\x98\x05\xd9\xf5\xf3\xd6\x8a\x08\x36\xd2\xf7\
+\xd3\xa9\xff\x00\x28\xfc\xc1\x33\xa5\xc7\x08\xef\xc3\xbd\x11\x86\
+\x47\xd4\xed\x85\x67\xd6\xa2\x09\x98\x56\xe0\x7e\x54\x42\xc9\xe7\
+\x17\x3a\x1e\x7a\x6f\x50\x01\xf1\x8c\xef\x46\x23\x5e\x6f\x8b\xdf\
+\xfc\x14\xb5\xe9\xdb\x4d\x6e\xa7\x9b\xd1\x93\xcd\xcf\x4b\x9c\x6b\
+\xec\x52\x50\x62\xfb\xbe\x4d\xfe\xd5\x67\xae\x9e\x2d\x31\x8c\xe9\
+\x41\x88\xd3\xb0\x19\x7b\x7f\x69\xd1\x0c\x11\x83\x86\x48\xb2\xde\
+\x98\x70\x7f\x0e\x9b\x0c\xbd\x0b\xa6\x1b\x1f\x70\x1e\xbd\x28\xd7\
+\x01\x9e\xab\x1e\xc6\x90\x73\x00\x99\x36\xb7\xa0\xd9\x74\xa3\x15\
+\x16\x8b\xf2\x77\xac\xa2\x75\x37\x8d\xfc\xf1\xb5\x1f\xe4\x86\xdc\
+\x19\x3a\x9d\xce\x9b\x5a\x80\xad\x00\x67\x5e\x9f\x13\x48\x02\x16\
+\x52\x39\xe3\x4f\x34\x68\xd1\x26\xd9\xb1\x54\x49\x2c\x0c\xbc\x1c\
+\x3f\xda\x39\x50\x24\xbb\x97\xad\xb7\xa7\x84\x3d\xb9\x23\xe9\xcb\
+\xa0\x10\x24\x91\x66\x76\x39\xe3\xe3\x7a\x22\x87\x06\xfc\xf3\xa5\
+\xc5\x18\xc2\x04\x3b\xe7\x11\x27\xf9\x48\x64\x89\x17\x07\x46\x7a\
+\xf2\x3a\x0a\x25\x88\xbd\x0a\x22\x49\xba\xdb\x53\xda\x89\xc9\x88\
+\x64\xdf\xa8\xfe\xd3\x0d\x31\x21\x8b\x84\x48\x8d\x2c\xfa\xd1\x51\
+\x28\x95\x98\xd6\x8a\x67\xc1\x77\x16\x61\x9f\x93\x44\xce\xa8\x60\
+\x00\xd9\x69\xde\xdb\xd1\xf2\x24\x31\x7c\x23\x6d\x9f\x45\xb5\xa8\
+\x04\x21\x17\x7d\x78\x7a\x66\x86\x10\x80\x02\x37\x9c\xe7\x2b\x9a\
+\x03\x24\x8c\x40\xeb\x79\xd1\xfd\x91\x40\xf9\x0c\x81\xd0\x5b\xeb\
+\xae\xd4\x3a\x70\x34\x4e\x89\x1e\x41\x3c\x3c\xaa\x34\x60\x21\x32\
+\x76\x7f\x74\xe0\xee\x93\x6c\x80\xfa\x08\x34\x61\x14\x08\x38\x38\
+\x62\x71\x8d\x6b\x40\x1e\x20\xfb\x26\x88\x06\x4b\x84\xde\x3f\x8a\
+\xf4\xe8\x28\xc8\x88\xfe\x8f\x83\x44\xc1\x14\x2c\x6d\x94\x4a\xd6\
+\x8c\x14\xae\x7c\x13\xf9\xd3\x7a\x9d\x9d\xd0\x1b\xf7\xa3\x90\x02\
+\x81\x4c\x73\xfd\xef\x47\xa2\x06\x36\xe9\xfb\x43\xa2\x20\x2f\xa9\
+\xa2\x23\x04\x9c\xc8\x63\x5e\xdf\x94\x16\x44\x37\x10\x08\x46\x13\
+\xb3\x37\xa2\x01\x26\x11\x70\x66\x5d\xe7\x35\x7a\x47\x11\x02\xfb\
+\x0d\x68\x01\x80\xdb\x5e\x4c\xfd\x45\x04\x49\x6b\x75\x2d\xdb\x67\
+\x8a\x1a\x44\x00\xdc\x15\x94\xda\xd4\x66\xf5\x7b\xa5\x2e\xe8\x0f\
+\xa5\x4e\x9a\x7b\x6b\xb0\xdb\x34\x93\x3b\x3c\x9d\x4e\x84\xf9\xa3\
+\x07\x25\xf5\x5f\x9a\x4d\xc1\xd6\x8e\xc2\x3e\xee\x54\xa9\xef\xd7\
+\x34\xde\x74\x8d\x24\xb8\xf9\xa2\x88\x39\xea\xf7\xc5\xb7\xab\xdd\
+\x3e\x45\x0d\xab\x07\xd5\x11\x59\x09\xd3\x3d\x44\x50\x74\x13\x3c\
+\x37\x6e\xe8\x76\xa6\x69\xb7\x7b\xf0\x3d\xda\x92\x09\x32\x64\x69\
+\x27\x4e\x3f\x86\x88\x10\x57\x7b\xce\x17\xc0\x55\x19\x41\x83\x7d\
+\xc1\xda\x95\x6f\xab\x7e\xc8\xb0\xa2\x59\x02\xc6\x05\xc5\xbf\xb4\
+\xff\x00\x76\x3d\xe8\x57\xe6\xca\x10\xb9\x1e\x6e\x7e\xed\x5e\x47\
+\xdd\x5b\xeb\x5f\x4e\x82\xac\xfb\x93\x57\x78\x3f\x34\x0c\x09\xcc\
+\x29\xee\xbf\x94\xa2\x42\x2e\x95\x5c\xe4\xfc\x8a\x04\x35\x23\xea\
+\x82\xd9\x49\xb1\x94\x76\x15\x6f\x06\x1d\xc7\xb5\xad\x7d\xe8\xf2\
+\x00\x5f\x8c\x9f\x6d\x44\x44\x05\x1d\x07\x1f\xe6\xfe\x29\x06\x20\
+\xd0\xc1\x60\x8c\xed\xd7\x6a\x02\x32\x29\x88\x28\x4e\x0e\x38\x38\
+\xd8\x04\x84\x21\x32\x54\xb3\x87\xfe\x3f\x93\x8a\x20\x46\xef\x52\
+\x7e\xcd\x12\x11\x90\x08\x2d\x6c\x38\xfd\xa3\x9d\x84\x32\x03\xfe\
+\x6f\x7f\x19\xa3\x83\x42\xfb\xce\xb9\x8b\x73\x49\x06\x5e\x98\x37\
+\x9e\x7a\xd1\xc0\x0c\x3c\xee\x67\xdb\xef\x53\x48\x1d\xad\x63\xfa\
+\xb6\xbd\xa8\x72\x33\x18\x00\x99\x3b\xef\x65\x14\x20\x85\x39\xd3\
+\x5e\xf9\xcf\x14\x22\x06\xd2\x21\xf5\xb1\xa5\x88\x64\xe4\x73\xf4\
+\x40\xe9\xbd\x24\x00\xad\x8b\xa9\xde\xce\x83\x80\x8d\x85\xbd\x3d\
+\xa8\xd9\x2d\xa4\xc1\xe5\xfe\x79\x14\x71\x00\x49\x47\x26\x63\xf4\
+\x60\x9b\x9e\x28\x3c\xc9\x40\x00\xa5\xbf\x50\x36\xa3\xbc\x00\x26\
+\xcb\x63\xda\x80\x72\x1b\x11\x0a\x6e\xb5\x51\x1e\x68\x46\x1e\xbb\
+\x69\xf3\xb5\x11\x05\x03\x0b\x23\xf6\x85\x60\x90\xcc\x1f\x5e\x7c\
+\x5a\x68\xca\x36\x2e\x9e\x9d\x05\x59\xf7\x26\xae\xf0\x7e\x6a\xe7\
+\x3f\x27\xfc\x05\xe0\xd8\x19\x12\x55\xbb\x5b\x3d\x68\x12\xa2\xf4\
+\x2d\x27\xbe\x1f\x5a\x57\x83\x64\xe5\x02\x3b\xff\x00\x2f\x44\x82\
+\x41\x00\x40\x77\x5c\xef\x6f\x33\x46\x0e\x4c\x92\x6f\x8b\x2e\xe2\
+\x29\xe0\x41\x24\x5f\x51\xe8\xa1\x08\x01\x00\x74\xdf\xaf\xcd\x06\
+\x2a\x48\x09\x4a\x09\xf7\x5a\x01\x4a\x7d\x30\xcf\x48\xd3\x91\x4e\
+\x00\x82\x4b\xeb\x9f\xa5\x6f\xba\xe1\xe2\x8f\x92\xdb\x2f\xa1\x43\
+\x81\xbd\xb6\x3b\x64\xd0\x12\x12\x2e\x64\x5b\xa6\xa2\x80\x07\x74\
+\xf9\x57\x04\x36\xba\x62\x2f\xf3\xd2\x9e\x1d\x0e\xae\xc4\x6b\xc7\
+\x7d\x29\x81\x19\x36\x09\xc4\x0c\x39\x1f\xb1\x45\x70\xc3\x5a\x38\
+\xe4\x73\x7d\xa8\x40\x20\xc2\xdc\xb2\x6f\x67\xc8\xa2\xa0\x90\x42\
+\x6d\x0f\xb2\xbb\x9d\xe8\xb0\x04\x90\x9a\xf7\x4e\xd1\xbd\x42\x6c\
+\xe5\x63\x5b\xce\x96\xa8\x92\x03\x87\x3c\xfc\xf4\xa2\x82\x06\xa8\
+\x8d\xbe\xfe\x7c\x51\x5c\xc8\x21\x08\xbd\x10\x33\x63\x73\xa7\xc1\
+\x5e\x24\x18\xd7\xe6\x68\x54\x10\x66\x07\x48\xe9\x9e\xf4\xa0\x35\
+\xf9\x67\x13\x4d\xcf\x00\xc9\xeb\x73\xbc\x55\xcb\x70\x4e\xf2\x67\
+\x38\xda\x94\x82\x40\x67\x50\xb7\x39\xaf\x4e\x82\xac\xfb\x93\x57\
+\x78\x3f\x35\x73\x9f\x93\xfe\x04\xb5\x8f\xc0\xd4\xa4\x0c\x37\x5f\
+\x0b\x5a\x10\x14\xb0\x2c\xe3\x23\x4f\x97\x56\xa0\x80\x26\xf9\x8f\
+\xa3\xaa\xa3\xc2\xe4\x0a\xf2\x3e\xac\xd7\x8a\x21\x82\x36\x02\xc9\
+\x9b\xe6\x57\xc5\x11\x82\x00\x60\xe0\xb1\xee\x2a\x39\x19\xc8\x21\
+\xdb\x9d\x57\x19\xa0\x00\x03\xec\xa0\x08\x10\x87\x4b\x56\x9a\x7c\
+\xf7\x4e\xf8\x8c\x51\x31\x00\x01\xb9\x0d\xfc\x51\x20\x10\x1b\x68\
+\xf4\x9d\x9f\x68\xa3\xd1\x16\x92\x42\x71\x21\x1e\x97\xce\xc2\x8a\
+\x90\x04\x13\x70\x76\x25\x7b\x23\x13\x47\x54\x00\x00\x84\x65\xc7\
+\x36\x0c\x50\x1b\x92\x55\xa4\x95\xd2\x3f\xca\x14\xc0\x0b\x60\x1f\
+\x43\xf9\xda\x84\x52\x63\x00\xa0\xed\xec\xba\x4a\xc9\x0b\x94\xe2\
+\xd9\xc7\x9a\x20\xa7\xd4\x59\xb6\x77\xf7\x31\xb0\xa1\x17\x3b\xc7\
+\x9b\x67\xa5\x14\x30\x8d\x01\x88\x2a\xe0\x69\xbd\x05\xea\x5b\x23\
+\x44\x6e\x5c\x6d\xc7\x71\x64\x41\xd7\x2a\xff\x00\x25\x1d\x07\x14\
+\x04\x52\xc4\x6a\xc5\xc7\xb3\x16\xa8\x92\x40\x80\xd8\xfe\x77\x91\
+\xf1\x49\xcf\x08\xc0\x19\x46\x87\xbe\xd4\x05\x88\x82\x13\x20\xc1\
+\x43\xe6\x81\x10\x90\x48\x46\x20\x9f\xf5\xf4\xbd\xcb\xe4\x88\x26\
+\xe6\x6a\x68\x42\xbe\x89\x80\x7c\x79\xa0\xfa\xe3\x9d\xbb\x50\x01\
+\x24\xaf\xe9\xf6\x62\x84\x0d\x33\x07\x45\x7d\xa9\x81\xd0\xfc\x9f\
+\x55\x22\x26\xf8\x1d\x48\xa2\x8b\x45\x2a\xe1\x1c\x7a\x76\x91\x45\
+\xac\x4b\x1c\x92\xf1\xc1\xa0\x34\x90\x92\x0e\x4d\xbc\xff\x00\xb4\
+\x8e\x10\x4b\x24\x06\x01\x93\x8c\x5d\xf4\xa3\x18\x04\xcd\xa2\x2e\
+\x05\x30\x24\xa4\xe8\xa5\x99\xb6\xa4\xfa\x28\x98\x2c\x5a\xeb\x7b\
+\x69\xad\x0f\x5b\x63\xc3\x7b\xc5\x39\x25\x83\xa4\x90\x9e\xf4\x04\
+\x9a\x4f\x9b\x9f\x47\x4a\x25\xf6\x2c\x6f\xd6\xfd\xea\x38\x02\x0b\
+\xec\xed\xa9\x31\xf5\x42\xde\x46\x5b\x0f\x24\xff\x00\xbf\x24\x66\
+\x76\xc1\x02\xdb\x11\x69\xc0\xef\xe6\x8c\x88\x2e\x5f\x99\xa1\x9c\
+\x28\xa7\xa2\xf9\xcd\x0e\x32\x64\xce\xd0\x7b\xbd\x3e\xa8\x18\x01\
+\x90\x6d\x36\x7a\x63\xdd\xe8\x02\x00\x0e\x60\xd3\x09\xc2\xba\x8c\
+\x7b\x39\xa1\x36\x7e\xf4\x16\xfe\x1a\x12\x22\x6f\x29\xb4\xef\xc0\
+\xbf\xed\x19\x40\x01\xa4\x2c\xbd\x54\xc2\x09\x8a\x4f\x54\x3c\x1e\
+\x7c\xd0\x40\xcb\x57\xe9\xd7\x8e\x45\x0c\x52\x00\x33\xcb\x1a\x9b\
+\x2f\x72\xee\x41\x68\x57\x4f\xbf\xee\x68\x88\x98\x20\xe7\x67\xc6\
+\x9f\x14\x70\x16\xe7\x59\x96\x71\xc0\xde\xb5\xe3\x92\x1a\x02\x7d\
+\xfc\x9a\xb6\xdb\x07\x53\xe6\xde\x6b\xdf\x9b\x9e\x97\xd3\x3d\x29\
+\x64\xdf\x36\xb9\xce\xdc\xf5\xda\x94\x6e\x1a\x98\xb9\x1a\xd1\x0e\
+\x26\xdd\x24\x9d\xcf\x4a\x81\x38\x0a\xef\x7b\xf7\x26\x80\x0e\xee\
+\xad\x49\xdf\xb6\xb4\xc6\xfa\xeb\x27\x60\x95\xb7\xd0\xd1\x9b\xe6\
+\xe5\xef\xb0\xa5\x2e\x7e\xc1\xce\x94\x1c\x00\x1b\x38\x18\x79\x2f\
+\x6d\xf6\xa8\x03\x0a\x76\xe7\xa0\x3f\x7a\x5c\x8c\x06\x43\xb8\xdf\
+\xd1\xf7\x83\x40\x84\xb5\x97\x3f\xdd\xe3\xa5\x17\x20\x8c\x92\xde\
+\xda\xad\x69\x30\x62\x36\xf7\x73\xfb\x41\x30\x83\x92\x30\xcb\x30\
+\x73\x39\xa2\x32\x37\xa1\xa9\xe0\xd9\x7b\xbb\x68\x09\x03\x28\x36\
+\x3d\xbd\xe6\x82\x04\x00\x90\x36\xfc\xd6\xef\x6a\x2d\x40\x51\xad\
+\xca\x39\xda\xe3\xfb\x42\x27\x52\x37\x5c\x4c\x6f\xfd\xd6\x82\x42\
+\x45\x80\x22\x93\xa9\x36\x50\x35\xa9\xf0\xe6\xc1\x5e\xe4\x7f\x94\
+\x10\x29\x0c\x23\x22\x49\x18\x5b\xd5\x89\x06\x80\x83\xa7\xba\xeb\
+\x34\x8d\x30\x0e\x1d\xc4\xcf\x51\xf3\x44\x40\xc1\x90\x42\x4b\xbb\
+\xec\x36\x5a\x92\x35\x14\x20\x99\x90\x99\x09\xee\x1e\xda\xd2\x00\
+\x6b\xb2\x4c\xe7\xa2\x04\x7a\x2e\xe9\xec\x04\x24\xfc\xe1\x8e\x8e\
+\x8d\x04\x98\xbb\x60\x21\x67\x85\xe8\xa1\xc1\xc6\x64\x30\x4f\xe5\
+\xf7\xd2\x8e\x01\x00\x95\x39\x4c\xe1\x6b\x83\x9d\xa8\x44\x40\x18\
+\x66\x58\x9f\x9c\x2a\x60\x89\x33\xad\x81\xd4\x74\x54\xc9\x98\x09\
+\x44\x94\x21\xfd\x8a\x14\xd8\xb1\x9b\x43\xfe\xd3\x45\x03\x09\x69\
+\x27\xc2\x14\x41\x25\x98\x5e\x57\xf3\xb5\x10\x11\x14\xcc\xf1\x23\
+\xcd\x08\x40\xf0\x71\xd9\xd1\xc6\x2a\x55\xaf\x1f\xe0\xc5\x5c\xe9\
+\xf2\xa0\x51\x90\x4d\x91\xcc\x50\x64\x7a\x8e\xb3\x6e\x97\xde\x9e\
+\x26\x59\xa2\x60\xb2\xbd\xc5\x22\x8d\xb7\x22\xf7\x59\x64\x2e\x74\
+\xd5\x80\xe0\x91\x6e\x8c\x32\x11\x29\x5b\x5c\xc5\x18\xaa\x03\x39\
+\x10\x72\x2f\xa6\x94\x36\x39\x29\x3c\xf4\xb1\x35\x6d\x89\x27\x24\
+\x3d\xe8\x08\x66\x50\x56\xdf\x45\x45\x66\xc0\x58\xb5\x20\xaf\xba\
+\x34\x4f\x09\xb8\xac\xce\x57\x4a\x38\x0c\x09\x21\xbb\x5d\xcf\xf9\
+\x06\x96\xc5\xac\x75\x7d\xef\xfc\xa2\x18\xa6\x19\xb4\xf4\xbc\xd4\
+\x5c\x77\x21\x72\xb3\x65\xf1\x61\x44\xfc\x11\x04\x89\x62\x3c\x1d\
+\xfe\xcd\x2e\x82\x49\x03\x27\xe7\xf2\x87\xcc\xa1\x4e\x75\x3a\xd8\
+\xeb\x7d\x28\x80\xc1\x24\x0d\xee\xb3\xef\x5c\x1e\x41\x05\x7c\x37\
+\xae\xc4\x76\xde\x82\x80\x2c\xf6\x57\x9e\x46\x6a\xf2\xc0\x6a\x04\
+\xec\x05\xe7\xc0\xa0\x12\x30\x72\x39\x5a\xf4\x33\x02\x00\xdc\x9f\
+\xc0\xad\x47\x80\xe3\xe7\x77\x7e\xb4\x5a\x45\x85\xb5\x22\x15\xa5\
+\x9a\x01\xc4\x4c\xda\x47\x10\x79\xf1\x34\x41\x81\xb1\x46\x48\x87\
+\xdc\x59\x7c\xe9\x45\x28\x16\x77\x67\x63\xed\xed\x41\x29\x59\x34\
+\x60\x0f\x17\x9a\x3b\x99\x32\x67\xd8\xd6\x6f\x59\xe0\x7e\x6e\x4d\
+\x47\xb3\xea\x89\x12\xe7\xe2\x97\x43\xe3\xf6\x82\x49\x03\xd7\x78\
+\xfb\xab\x9d\x3e\x54\x60\x97\x14\x95\x20\x97\x78\x7a\xeb\xf2\xcd\
+\xf4\x14\x27\x22\x58\x59\x36\xcd\x82\x76\xad\x52\xd3\x79\xbf\xd6\
+\xbd\x68\x00\x70\x4c\x85\x37\xff\x00\x17\xdd\x00\x36\x50\x91\x3b\
+\xfe\x66\xac\x37\x8b\xb2\x2e\x10\x9c\x7f\x93\x44\x44\x09\x84\x86\
+\xc2\x6e\xce\xdd\x68\x92\x02\x98\x00\x83\x79\xe9\xfd\xa6\x38\x82\
+\x00\x49\x00\x0c\x82\x3e\x8e\xfc\x14\x20\x52\x44\x0b\x5a\x49\xa1\
+\x35\x88\x25\x29\xe5\x6a\x34\xf8\x34\x10\x37\x63\x09\x53\x65\xf1\
+\xe2\x8c\x23\x13\x75\x65\xa0\xf9\xf9\xbd\x0e\x6b\x1c\x98\x37\xdf\
+\x93\xd7\x6a\x4d\x82\x76\x13\xee\x2a\x6b\x55\xb4\x41\x57\xd4\xf6\
+\x8c\x0a\x10\x91\x1c\x92\xa4\x0c\x10\xf4\xf3\x9a\x00\xb0\x10\x91\
+\x11\xd4\xf1\xe0\x69\x40\xb8\x5a\x26\x7d\xb0\xd2\x35\xa7\xe0\x6d\
+\x0b\x52\x2f\x36\x8e\xf4\x79\xf3\x00\xc9\xb8\x56\xda\x64\x9f\xca\
+\x98\x4b\x01\x84\xb2\xe7\x7e\x9a\xc5\x08\x90\x0e\xe5\x4a\x0c\xc2\
+\xd7\xa7\xcd\x30\x89\xb6\x4e\x14\x1c\x87\xda\x69\x52\x06\x22\x54\
+\x2e\x08\xcd\xe3\xbe\xd4\x29\x19\x26\x19\x97\x76\x44\xc2\x06\x88\
+\x48\x18\x32\x00\x37\xd7\x2e\x8d\x0d\x00\x08\x0e\xcc\x7e\xaa\x21\
+\x21\x28\x9c\x3d\x47\x9a\x65\x02\xd1\x53\xbb\xf3\x42\x06\x16\x30\
+\x75\x2f\x3a\x51\xf1\x22\x0e\x51\xb8\x77\xe6\x2d\xfe\xd1\x42\x9a\
+\x16\xf1\xf2\xe8\x0c\xdc\x2f\xba\x00\x30\x24\x92\x93\xb4\x13\xa5\
+\xdd\x1c\x82\x45\x38\xcc\x98\x9d\x0f\xcd\xa9\x7c\xc9\x94\x8d\xd9\
+\x1a\xcc\x50\x45\x16\x05\x8f\x53\x93\xdf\xee\xa1\x18\x93\x3a\x0c\
+\xe5\x0d\x69\xd0\x3a\x03\xd8\x8e\xb6\xa2\x48\x26\x04\x08\x2a\x49\
+\x6f\xa3\xef\x41\xc0\x62\x74\x0f\x53\x73\xb0\x36\xa3\xc1\x00\xc9\
+\x42\x46\x41\x5f\xe7\xf2\x89\x69\x20\x4b\x01\x6a\x5e\x31\xfc\x91\
+\x53\xb9\x00\xa2\x67\x8f\x83\x81\x88\xab\x0b\x40\x25\x81\xe7\x68\
+\x99\xef\x44\xac\x21\x5a\xe7\xb7\xee\xf4\x86\x24\xdc\xbe\x19\x13\
+\x76\xbe\x31\x80\xcb\x08\xcd\xb5\xfd\x5e\x5d\x14\x05\x46\x43\x67\
+\x42\xde\x6e\x8c\x3c\x6f\x59\x68\x1a\xc9\x63\xf5\xc5\x05\xd1\x00\
+\x08\x11\x2c\x97\x8b\x88\xe7\x4a\x26\xa6\x4d\x9e\xff\x00\xcf\xda\
+\x72\x09\xae\x67\x07\xdf\xaa\x15\x06\x07\x9b\x4e\x3f\xce\xb5\x1e\
+\x62\x32\xdb\xfc\xe5\xd5\xd4\x7a\xd9\x0b\x55\x3a\x51\x38\x90\x42\
+\x53\x7b\x0e\xdd\xef\x4c\x11\x45\x5d\xef\x7c\x5f\x5a\x60\x60\xc0\
+\xd1\x1d\x5e\xe1\xe1\x50\x22\x1c\xe9\xa1\xd4\xde\x3a\x50\x24\x43\
+\x68\x17\xcd\x1d\xc1\x31\xcf\xd7\x16\xee\xe9\x82\xf7\x9e\xa7\x7f\
+\x9a\xb1\xea\xc6\xaf\x71\x4d\xfe\x47\xdd\x03\x0a\x85\xa9\xae\xba\
+\xf5\x1a\xe3\x5a\x73\x26\x2f\xdf\x93\xa0\xac\xba\x7d\xd1\xc0\x19\
+\x7e\x0d\x04\x00\x0f\x67\x0b\x5a\x28\x10\x0a\x32\x22\x2f\x8e\x77\
+\xa2\x18\x49\x84\x3a\xa3\x7d\x29\xa1\x16\xac\xe2\x72\x3f\xbf\xc3\
+\x53\x91\x17\x56\x7a\xf3\xf9\x14\x5a\x36\x66\x00\x13\x13\x61\xa6\
+\xbb\xef\x46\x91\xd6\x10\x99\x1c\x0a\x7d\x08\x82\x12\xe8\x43\xbd\
+\x14\xa0\x20\x86\x18\x42\x0c\xe3\x5c\xd1\x9b\xa4\x23\x20\x5f\x7d\
+\xb3\xba\xa4\x72\x2a\x1a\x22\x13\xaf\x18\xf1\x34\xae\x6c\x2d\xbd\
+\xe7\x3a\x66\xf8\x51\x51\xb8\x13\x6d\x8c\xfc\x29\xdb\x9a\x9d\x90\
+\x30\x6c\xe4\xe7\x7c\xd4\xd9\x16\xac\x11\x74\x8f\x27\xd1\x42\x83\
+\x50\xd4\xec\x60\x4e\x97\xde\x95\x28\x20\x41\x6a\x4e\xab\x1f\x94\
+\x44\xa6\x9b\x10\xbe\x68\x86\x83\x4c\xa3\x80\x77\x2b\xde\x96\xd2\
+\x0d\xcf\xbb\xd1\xa2\x4b\xb1\xf8\x2f\xc7\xc6\xf4\x28\xc9\x12\xd2\
+\x6a\x5a\xfc\x9d\xa8\x97\x01\x08\x06\x61\x7e\x44\x37\x4f\x14\xc6\
+\x3a\x8a\x01\x6f\xd8\x9a\x18\x3c\x02\x4c\xbb\x46\x02\x27\x8e\xb4\
+\x64\xc3\x06\xc0\x1d\xf4\xde\x33\x7d\xa8\xc0\x00\x11\x22\x40\x36\
+\x12\x93\xf3\x95\xbd\x0e\x0c\x0a\x08\x5d\xcb\x66\x34\x35\x84\x28\
+\x20\x1a\xbc\xde\x7a\xd0\x89\x19\xda\xc4\x5d\x8b\xfd\x71\x46\x1f\
+\x34\x93\x7b\xbf\xd7\x6b\xd3\x52\x2c\xdc\x73\xfd\xa2\xc9\x62\xb5\
+\xd0\x83\xfa\x6a\x68\x4b\xca\x87\x7f\xda\x29\x6f\x05\x49\xbc\x3f\
+\xd3\x59\xb8\xe9\x7a\x22\x82\x80\x6f\xd6\x88\x34\x47\x80\x7f\xbb\
+\x62\x8a\xbc\x18\x26\x2e\x6e\x3c\x2f\xe4\x51\xca\xd6\x78\xcf\x7f\
+\x99\xa5\x7a\xc4\x20\x49\x4d\x26\x23\x37\xa1\x56\x2d\x12\x92\x64\
+\x23\xda\xff\x00\xea\xa3\xbd\x1a\x16\x48\x22\x5f\x18\x3e\x1d\x11\
+\x65\xce\x10\x64\xe7\x3e\xf2\x84\x20\x04\x92\x7d\xf6\x72\x2c\xc0\
+\x84\x10\x0e\x0b\xb6\x24\x66\xba\xbe\x0b\xa5\xd5\xf7\xde\x92\x21\
+\x05\x84\x54\x7c\x5f\x91\xa4\x8a\x20\x49\x0b\x7c\x64\xfb\xd8\xa8\
+\x08\x66\xee\xec\x6d\x6d\x7a\x11\x2f\x0e\x22\x25\xf4\x9f\x13\x34\
+\xe2\x06\x09\x32\x57\x41\xff\x00\x66\xf5\xb9\xe9\xd0\x2d\x68\xc4\
+\x03\x26\xc3\x87\xed\x8f\x26\xd5\xb6\x73\xe3\x87\xa3\x46\xf3\x41\
+\x8b\x37\x71\xa6\xd5\xed\xfe\x2a\x12\x89\x65\x2a\x6c\x23\x46\xd6\
+\xbf\x5d\xe8\xfe\x06\x02\x22\x81\x02\x5f\x44\x2c\xd6\xb4\x66\x44\
+\x30\x67\x1a\x31\xec\x68\xea\x59\x20\x00\x9b\x11\xbf\xe5\x06\x2c\
+\x8f\x41\xc9\xfb\xed\x50\x68\x4c\x61\x01\x07\x8d\x2e\x38\xa6\xa2\
+\x14\xb0\xb5\x3d\x21\xd3\x1b\x10\x58\x28\x8c\x81\x9d\xe6\x95\xca\
+\x1b\x89\x17\xd3\x10\x68\xb0\x2c\x06\xe4\x5f\x38\x1a\xff\x00\x6a\
+\xf7\x4f\x91\x56\xfa\xcb\xfe\xe5\xd3\xee\x81\x4f\x9d\xf9\x35\x20\
+\x80\x2c\x4e\x22\xfb\x59\xf4\x14\xad\x03\x3f\xcd\x35\xa7\x0b\xbf\
+\xf4\xc5\xfe\x8d\xe8\x13\xc1\x8c\x6e\x76\x17\x33\xd3\x4a\x36\x40\
+\x07\x08\x46\x0f\xa7\x6d\xaf\x21\xc0\x5a\xe4\x9c\xf7\x8b\x75\xa2\
+\x74\x06\x5f\x05\x75\x1a\x75\xa2\x89\x10\x60\x5a\xf8\x5d\x1f\x55\
+\x42\x8b\x22\x00\x1b\x84\x06\xf1\xf3\xd6\xa0\x1d\x73\x25\x67\x4e\
+\x07\xda\xa6\x36\x41\x20\xd8\xbc\xc5\xed\xa6\x6b\x32\x04\x2d\xf5\
+\xb1\xf5\x4b\xc5\x22\x48\x02\x44\x82\x8d\xe2\x5f\xd9\x3d\x9d\x07\
+\x2e\xd8\xb8\xe6\x2f\x1f\x7a\x0a\x89\x90\x16\x82\x38\x77\xf8\xe3\
+\x17\x34\x51\xf0\x26\x43\x19\x3a\xe0\xd0\x41\x11\x10\x50\x36\x38\
+\x31\xb4\xea\xfa\xd1\xc6\x18\x04\xa8\x0a\xfc\x89\x4f\x14\x39\xa0\
+\x01\x01\x85\x33\x3c\x0e\xec\x1a\x32\x00\x48\x1a\xfa\x69\x70\xc0\
+\x43\x50\x73\xb7\x1a\x50\xc4\x0d\x66\xe8\xe3\xdb\x51\x11\x18\x6c\
+\xc0\x45\xf4\xed\xd3\x7a\x22\xc8\x19\xc9\x13\xbd\x10\x58\x00\x83\
+\x60\x68\xf0\x41\x96\xc2\xed\xda\x06\xb4\xdb\x81\xc1\x18\xbd\xf9\
+\x6b\xa6\xf4\xad\x37\x24\xf6\xed\x15\x05\x05\x92\x28\xa6\x23\xbd\
+\x2f\x64\xda\xdc\x6f\xf9\xe7\xb8\x40\x43\x01\x2c\x69\xf3\x3e\x32\
+\xe8\x99\x0a\x3d\xeb\x46\x25\x07\x86\x9a\x69\xa5\x70\x67\x5f\xa6\
+\x17\x8d\xe8\x18\xd0\xd2\x9b\xb9\x81\xf1\xd1\xe6\x8a\x60\xb1\xa2\
+\x96\xa0\xfd\x27\xa9\xd2\x92\x24\x06\x02\xc3\x31\x36\xbd\xe8\x02\
+\x05\xdd\x02\xc3\x36\x4a\xc7\xb1\x45\x49\x38\x5e\x73\xd0\x92\x68\
+\x84\xb0\x0b\x30\x64\x29\x0b\x6d\xab\x62\x01\x33\x00\xf4\xe7\x63\
+\x16\xa3\xf3\xa6\x8c\x82\x65\x9b\x19\xf6\xf4\x68\x34\x02\x0c\xe7\
+\x20\x7f\x39\x52\x48\x88\xa6\xc5\xa0\xf3\x72\x34\x56\xc6\x2c\x4c\
+\x19\x29\xb1\x71\x3e\x38\xa3\xf9\x45\x07\x72\x66\x37\xbd\xa2\xd4\
+\x08\x53\x71\x28\xfb\x7f\x4d\x2a\x26\x03\x42\xba\x55\xcc\x12\x94\
+\x1c\x12\xd7\xb8\xe9\x4c\x88\x50\xd8\xe1\xfe\xda\x88\x20\x65\xb6\
+\x26\xc7\x73\xa1\xed\x44\x82\x4d\xed\xb9\x78\xd1\x51\xbc\x00\x60\
+\xc1\x40\x48\x17\x1e\x9a\x49\x05\xb8\xc7\x14\x40\xa7\x6c\x8c\x1c\
+\x8d\xf4\xba\x9c\x8c\x82\x20\x47\x54\xcd\xf4\x13\x73\xfe\xd1\x39\
+\x4c\xa7\x67\x0f\x88\xf6\xdf\xf0\x12\x39\xf8\xae\x3d\x9f\xca\x87\
+\x07\x37\xb5\xb8\x1e\xe2\x84\xb3\x17\x77\x16\xb4\x51\x12\x9a\xf6\
+\xb6\x23\xd3\x5c\x3c\x52\x24\x6b\x8d\x8d\x2f\x48\xe2\x20\x5f\x61\
+\xad\x5c\xec\xee\xcb\xff\x00\x91\xc3\x36\xfb\x8b\xd2\xd0\x00\xb2\
+\xbc\x84\x61\x53\xb5\x8f\x38\x00\x26\x00\x92\x10\x65\x75\xa7\x85\
+\x97\x00\x18\x80\x20\x06\x04\xdc\x02\x51\x84\x8d\x2e\xe1\x91\x88\
+\xb7\xba\x1e\x9f\xf2\xd7\x5f\x83\x5f\x57\xd5\x24\xb5\xfa\x55\xd0\
+\x00\xcf\x2e\xde\xbe\xb4\x56\x80\x26\xdc\x08\x11\x76\x06\xfb\xf9\
+\x24\x94\x92\x09\x16\x99\x81\xab\xf9\xbd\xe8\xbe\xe0\xc8\x4e\x85\
+\xf5\xda\xd4\x31\x62\x20\x16\xa1\x3f\xee\xf6\xa0\x6d\x94\xa2\x40\
+\x57\xd7\xfc\xed\x40\x62\x08\x19\x01\x60\x77\xf6\x7b\xd6\xbf\x28\
+\xc0\x72\x54\xae\xb5\x1a\x02\x48\x25\x62\xce\x7d\xd2\x28\xb9\x8c\
+\x86\xa7\x37\xa0\xc6\x51\x94\xa2\x43\x5a\xe6\xaf\x06\x6e\x81\x59\
+\xa4\xa2\x09\x20\x41\x12\x73\x46\x88\x00\x42\x53\x3a\xae\xce\xaf\
+\xa2\x2d\x6d\xa8\x00\x81\x27\x9a\x2a\x52\x20\xb0\x39\xf7\xc5\x71\
+\xec\xfe\x51\x44\x00\xbd\xed\xf1\x44\x4e\x60\x6d\xd7\x57\xa5\x01\
+\x09\x4e\x07\x8a\x3b\xc0\x85\x8d\x55\xf5\x58\xa3\x00\x42\x13\x28\
+\xbe\x07\xb8\xa5\xd4\xf8\xfc\xa1\xa4\x9c\xe9\xa1\xda\x84\x16\x5e\
+\xbd\x28\xd4\xac\x59\xf0\xeb\x30\x2e\x3a\xfe\x50\x3b\x9c\x08\x90\
+\x46\xb9\xd1\x9a\x33\x14\x11\x52\x76\xd2\x71\x8e\xb5\x0a\xac\x25\
+\x3c\x91\x01\x00\x20\x06\x04\x20\x38\x1a\x18\x3c\x00\x90\xd0\x58\
+\xa4\x2c\x4a\x63\x20\xb0\x41\x54\x0a\x62\x6f\x18\x76\x3a\x6f\xaf\
+\x5c\x1a\xb7\x12\x40\xd1\x64\xe3\xba\xe9\x41\x00\x0b\xcf\xc3\x99\
+\x72\xea\xe3\xca\xb6\xd4\x01\x16\x4b\x27\xb8\x3b\x51\xc8\x2c\x23\
+\x04\x13\xaf\x40\xd7\x47\xd8\x34\xc4\x41\x22\x60\x1c\x19\xcf\x8c\
+\xd0\x49\xc9\x93\x74\x75\x7b\x78\x74\x68\x00\x38\x4b\x7d\x3a\xfa\
+\xe8\x29\xcb\x67\x48\x7b\x4e\x31\xf7\x41\x04\x84\x00\x6d\xf6\xe9\
+\xc0\xa4\xc7\x18\x05\x77\xa2\xde\x77\xf9\x95\x25\xb3\x9d\xbf\xce\
+\xf4\x17\x12\x10\x0a\x73\x71\xb6\x9a\xca\xdd\xd0\x0d\x09\x91\xac\
+\xed\xdc\xdf\x9d\x8e\x00\x82\x5d\xb5\x1d\x74\xce\x37\xab\x1f\x7d\
+\x6f\x1d\xa8\xa9\x11\xb5\xfa\xda\x36\x2f\xff\x00\x00\xc8\x1a\xe9\
+\x5c\x7b\x3f\x95\x0a\x32\xc6\xc7\x6a\xc2\x61\x74\x33\xa2\x03\x5a\
+\xbd\x47\x38\xb3\xd6\xa4\xb6\x6d\xbb\xf9\xd2\x90\x05\x0c\xf1\xe0\
+\x0a\xe3\xd9\xfc\xa3\x71\x43\x4b\xe9\xa5\x61\xd7\xea\x81\x8e\x8f\
+\x85\xf7\x45\x89\x4b\x53\xf3\x6d\x68\x84\x45\x30\x97\x3a\x0a\x1b\
+\x63\xab\x79\x02\x7f\x6d\x41\xc3\x02\x28\x98\x04\x04\x24\x6c\x35\
+\x77\x2c\x4d\x33\x33\x11\xd0\x27\xa2\xc5\x18\x39\x2a\x68\xa7\xb0\
+\xb4\xcc\x92\xce\xa7\x6e\x55\x28\x4a\xfa\xc5\xe7\xb5\x3c\x06\xae\
+\xf7\xb7\x5e\x3b\x7f\xc3\x44\xe2\x9b\x88\x71\xd2\xc7\x6d\x95\xba\
+\xe2\x80\x48\x87\x12\x00\x08\x88\x71\xf9\x6a\x36\xc9\xa4\x1d\xf5\
+\x01\xdf\xe6\x81\x00\x8e\xe4\xc1\x67\xf6\x7a\x50\xa1\xa0\x00\xb1\
+\x0c\x40\xb1\x36\xa1\xe8\x6f\xb2\x1f\x38\x1f\x14\x73\xd1\x3c\x9d\
+\xf0\xfd\x74\x08\x9d\x62\x0e\xef\x88\xc6\x28\x68\xe6\x47\xa0\x8f\
+\x8f\xc6\x0d\x09\x34\x8b\x44\xc7\xbe\x85\x4a\x11\x0d\xd9\xd7\xea\
+\x80\x0f\xed\x18\x90\x40\x70\x3a\x7d\xff\x00\xe0\xd0\x74\x77\xe0\
+\xd7\x3e\xef\xed\x03\x70\x5b\xdd\xe8\xac\xd4\xd0\x12\x4e\x7e\x28\
+\x1d\x8f\x3d\x78\xd6\x80\x82\x5c\x97\xd6\x3e\xe8\xa7\x02\x39\xcb\
+\xf8\xa1\x30\x09\x09\x03\x6f\x1d\xe8\x99\x3b\x36\x3f\x9c\x51\x98\
+\xe4\xfd\x07\xf5\x44\x8f\xf3\xee\x8a\xca\x5b\xd1\xac\x23\x6f\x2f\
+\x34\x41\x0c\x82\x89\x60\xac\xe7\x68\xae\xef\x39\x09\xdb\x73\x67\
+\xa6\x2a\x1a\x82\x50\xfa\x6c\xd0\xd2\x2f\x40\x1c\x15\xad\xc3\x4f\
+\x9c\x40\xa3\x40\x09\x3a\x21\x05\x7c\xe6\x2d\x4f\xa0\xf3\xfb\x48\
+\x6b\xb1\x09\xb6\x26\x84\x44\x00\x60\x90\x0c\x14\x9e\x95\xb5\x9a\
+\x42\x64\x75\x1d\x78\xa7\x20\x1a\x01\x22\xd2\x6f\xda\xdd\x71\x42\
+\x06\x65\xca\x23\x6e\x3f\x14\xbb\x0a\x54\xcb\x0b\x86\x08\x46\x0f\
+\x9e\xd4\x72\x08\xb4\x3f\x7f\x3c\xca\xa1\x71\x02\x08\x2d\xf1\xe3\
+\xbe\x68\x8c\x92\x03\x5b\x05\x0d\x63\x55\xdf\x6a\x9d\x84\xa1\x77\
+\xe7\x9b\xff\x00\xcb\x5d\x7e\x0f\xfc\xbd\xd3\xe4\x7f\xe0\x90\x27\
+\xdb\xd3\xe8\x3c\xfe\xd1\x48\x82\x06\x7e\x0f\xfc\xb5\xd7\xe0\xff\
+\x00\xdc\xba\x7d\xd3\xa4\x6e\xb1\x21\x7b\xa0\xe3\x51\xc5\x19\x83\
+\x88\x8e\xdf\xf0\x91\x7b\xbf\xd5\x22\xfe\x3a\xda\x7b\xd3\x30\x33\
+\xa8\xb7\xcf\xcc\x6f\x45\x1d\x7e\x0c\xf3\xcf\x5a\x02\x44\x2f\xee\
+\x94\x2a\x6e\x1b\x93\xbe\xdb\xd0\xe4\x20\xc5\xcc\xf3\x9d\x07\xf3\
+\xfe\x5c\x5d\xa4\xed\x45\x20\x09\xf8\x47\x7b\x1a\x54\x09\x60\x04\
+\x11\x2c\x81\x8e\xbe\xe4\x91\x20\xa7\x63\x9f\x9c\xdf\xec\x51\x43\
+\x82\x02\x00\x9b\x95\x3b\x7b\xa5\x12\x2a\x48\x2f\x30\xc9\x81\xdb\
+\x50\x00\xf2\x7a\x9c\x9c\xa1\xdb\xbf\xdd\x3c\xfb\x10\x24\x1e\x71\
+\xa1\x79\xeb\x4e\x46\xc0\x2f\x18\xdf\x5f\x5d\x1a\x0d\x23\x1e\xcf\
+\x7e\xd4\xfa\x0f\x3f\xb4\x44\xb6\x7e\x0e\xf5\xcf\xbb\xfb\x4c\x06\
+\x7a\x3f\xde\xb4\xfa\x0f\x3f\xb4\x21\x10\x03\xf7\xfc\xeb\x57\xa0\
+\x27\x6b\x5f\x8b\xd2\x93\x9d\x24\x73\x3d\x6b\xd0\x6b\x30\x4d\xee\
+\x5d\x81\x3f\x5f\xf0\x90\x31\x71\xfe\x51\xd2\x00\x6f\xc3\xa0\x20\
+\x9d\x17\x93\x40\x66\x0c\xa5\xbd\xe8\x0a\x43\x22\xe8\x12\x33\x42\
+\x66\x3d\x8f\xc3\xda\x88\x19\x2f\x8e\xd7\xfa\xa7\x88\x3d\x20\xed\
+\xdd\x51\x98\x40\x1b\xab\xe4\x85\xd2\x3c\xd0\x10\x5c\xfb\xd2\xa4\
+\x9d\xb5\xcd\x00\x64\xf7\xf7\xfb\x42\xd2\x24\xe8\x64\x76\x54\x01\
+\x80\x0f\x61\xbf\xe7\x9d\xaa\xe8\x81\x36\x4f\xdb\xe6\xd5\x64\x27\
+\xd5\xfb\x45\x32\x50\x29\x04\xd8\xc8\xc7\x7d\xff\x00\x00\x64\x02\
+\x32\x31\xb0\xc4\xcd\x11\x8d\x64\x60\x9b\x93\x1d\x55\xcd\x58\xd6\
+\xc0\x1a\x1c\xb3\xcd\x0a\x88\x86\xc3\x19\x34\x50\xcc\xbc\x12\x63\
+\x61\x78\xed\x4c\x08\x0e\x45\x9e\xb2\xbd\x8d\xe8\xa8\xb8\x00\xc4\
+\xe9\x1a\x2a\xbd\xd3\xe4\x57\xd5\xf5\xff\x00\x09\x41\xd2\xe8\x7c\
+\x7e\xd0\x12\x54\xfb\xd7\xfe\x77\x1f\xed\x61\x3d\xf5\xeb\x1a\xd0\
+\x22\x83\x1a\x39\xb3\xb3\xd7\xfe\x7c\xcf\x97\xfc\xbd\xd3\xe4\x57\
+\xdd\xf7\x40\xd8\x4e\xd1\x7d\x69\x56\x01\xf8\x17\xda\x1d\x34\x4b\
+\x5b\xdd\xe1\xdb\xd3\x42\x47\xdd\x46\xa3\x51\xaf\x34\x82\xae\xef\
+\x53\x7b\xf6\x27\xa5\x33\x1d\x14\x8b\x5a\x3b\xd1\x63\x46\x34\xb5\
+\x96\x9e\x9f\xfc\x6f\x4e\xce\xd3\x4a\xe5\x20\x71\x61\x37\x1c\xdb\
+\x5a\x82\x19\x67\x6b\x0b\x63\xe6\x8c\x37\x06\xd2\xf5\x22\xf2\x74\
+\x54\x50\x14\x02\xba\x5a\xd0\x3e\x68\xc5\x12\x30\x45\x97\xd0\x3e\
+\x27\x60\x48\x08\x61\x35\x82\x2d\x0f\xcd\x5c\x8d\x5b\x99\xfa\xff\
+\x00\x69\x94\x67\x94\x8c\x1d\x0e\xd4\xa7\x40\x0a\x00\x83\x95\xa4\
+\x8e\xd7\xd6\x8b\xe7\x40\x0b\x46\xac\x46\xbe\x68\xbc\xc1\xb0\x00\
+\x3a\x38\x1a\x5b\xf6\x89\x02\x43\xd2\x7f\x9d\xb7\xa2\x60\x93\xb7\
+\xc8\xff\x00\x84\x30\xa9\x75\x3e\x3f\x28\x08\x2e\x7d\xe9\xff\x00\
+\x30\x03\x5a\xf6\xa1\x28\x80\xbf\xaf\xf0\x74\xa1\x29\x97\xfc\x54\
+\x8e\x87\xb1\xa1\x36\x0e\x6f\xc1\xff\x00\x84\x8b\xdd\xfe\xa8\xf8\
+\x0c\xeb\xbe\xf4\x54\x05\x3f\x4c\x51\x0a\x81\x2d\xa1\x30\xe8\xdc\
+\x2b\x33\x06\xda\x51\x42\x08\x1e\x8f\xee\x6b\x16\x35\x69\xad\x26\
+\xc3\x9b\xeb\x7e\x20\x6b\x1b\xd1\xe1\x18\xf8\x7c\x3c\x6e\x68\xb0\
+\xc5\xb9\xfc\xa1\x25\x02\x1d\x3e\xa3\xcf\xe5\x09\x3c\x88\x0e\x3a\
+\x2d\xa9\x52\x81\x4f\x47\x1f\x7e\x37\xa2\x09\x1e\x47\x62\x48\xe8\
+\xfd\xe8\x01\x65\xee\xb3\x45\x31\x09\x5a\xf7\x2b\xb0\x43\x52\x04\
+\x9a\x91\xb2\x1b\xe6\x33\x1e\x27\x6a\x52\x45\x22\x20\xde\x8c\x5e\
+\x3d\x38\xa0\x08\xd0\x0b\x00\x9c\xdf\xfc\xa0\x06\x2c\x96\x5e\xfb\
+\x5e\x9f\xcb\x2c\x3c\x12\xbe\x3f\x31\x44\x28\x26\x9a\x21\x03\xa8\
+\xc7\x5e\xf7\x74\x44\x07\x0e\xb6\xf6\xff\x00\xf2\xf7\x4f\x91\xff\
+\x00\xa4\xe1\x3d\xaf\x5e\xdf\xe2\x9a\x36\x5e\x52\xc7\xdd\x71\xec\
+\xfe\x50\x63\x50\xd7\xb6\x9f\xf2\xff\x00\x5f\x83\x5f\x77\xdd\x5a\
+\xeb\xf2\x6b\xee\xfb\xab\x5d\x7e\x4d\x5e\xe9\xf0\x28\x66\x22\x80\
+\xd6\xae\x09\xf4\xb7\x7a\x4c\x14\x6f\x6d\x66\xdf\xb5\x08\x9f\x7a\
+\x8b\x6e\xe8\x9b\x02\x85\x96\x85\xe3\x8e\xda\x57\x1e\xcf\xe5\x32\
+\x8c\x2c\x9b\x7c\x0a\x30\x5c\x13\xcf\x17\xbe\x94\xb0\x60\xf0\xb1\
+\xae\x34\x1a\xff\x00\xc4\x50\x60\x29\x64\xd9\xe3\x5a\x24\x07\x4a\
+\x85\xc1\x9c\x5c\x76\xa2\x68\xb1\xd0\x6b\x33\x61\xfe\xbe\xd3\x4c\
+\xb3\x67\x6f\xe2\xd2\xb4\x1b\x9f\x94\x16\x4a\x8a\x38\x06\xd9\x82\
+\x1a\xbc\xaf\x3b\x53\x24\x87\xc2\x0d\x3f\xcc\x46\x70\x18\x80\x02\
+\xec\xc9\x63\xfe\x5e\xe9\xf2\x3f\xe1\x78\x4f\x7a\xf6\x9a\xf6\x9a\
+\xf6\x9a\x00\x05\x29\xb3\x7e\x6b\x78\xfa\xff\x00\x47\x6d\xe9\x22\
+\x6c\x59\xee\x48\xf8\x2b\xa6\xa6\x9f\x41\xe7\xf6\x89\x90\xa3\xde\
+\xbf\xf0\x88\x22\x2f\xfe\xd4\x68\x10\xdc\x18\xbe\xf4\x64\x00\x40\
+\xe8\xc1\xbd\xa6\x80\x35\x8b\x75\x74\x0c\x05\x1e\xf5\xa2\x59\x74\
+\x30\x64\x35\x9e\xb8\x55\x61\x64\xcf\x4a\x68\x45\x12\xb3\xc3\x3a\
+\xe6\x80\x8a\x56\xb9\xbf\xed\x10\xa6\x01\x90\x12\x2e\x62\xd4\x4e\
+\x87\x9e\x07\x1a\xd1\xc6\x12\x17\x19\x61\xfd\x4d\x00\x39\x3d\xc6\
+\xfb\xcc\x15\xd1\xd0\x05\x60\x02\xe5\x87\x63\x45\xb1\x27\x0c\x89\
+\xdb\xcd\x09\x94\x63\x80\x37\x48\xe1\xa5\x67\x34\x38\x5d\x6e\x60\
+\xc7\x4f\x75\x25\xc1\xc4\x51\x30\x50\x18\x79\xf6\x4e\xc2\x8b\x22\
+\x46\x19\x06\xc0\xc7\xbd\xab\x04\x8b\x1e\xe1\xfe\x66\x84\x20\xcc\
+\x4c\xb2\x1c\x66\x2d\xac\x56\xb8\x77\x1f\xa6\x7e\x31\x46\x66\x0a\
+\x39\xc0\xff\x00\x97\xba\x7c\x8f\xf8\x0c\x81\xae\x95\xc7\xb3\xf9\
+\x5c\x7b\x3f\x95\xc7\xb3\xf9\x48\x03\x39\xbf\x7d\xbf\xe5\xee\x9f\
+\x23\xff\x00\x02\xcb\xdd\xbe\xe9\x38\x3d\x45\xef\x78\x95\x47\x06\
+\x9c\xb3\x8e\x96\xd2\xb2\xe9\xf7\xff\x00\x7d\xdd\x6b\x0e\xbf\x5f\
+\xf4\x25\x02\x7d\x98\xad\x51\xe9\xe8\xd5\xf5\xda\x8a\x38\xb4\x5c\
+\xee\x77\xad\xe3\xeb\x8a\x6c\x02\x59\xb5\xff\x00\x2b\x38\xb6\xf3\
+\xdf\x46\xac\xe2\x96\x80\xb8\x62\x00\x73\x36\xe1\x47\x8a\x45\x82\
+\x60\x02\xc9\xb7\x5c\xb1\xa2\x54\x7c\x65\xc0\x8d\x98\x8f\xda\x27\
+\x05\x4f\x5e\x6e\x1d\x36\x6e\xf2\x4d\xae\x56\xf7\xbd\x19\x02\x1b\
+\x19\xe1\x7c\x9a\xb4\xf2\xed\xb3\xa0\x32\x39\xfd\xab\x71\x24\x0d\
+\x16\x4e\x3b\xae\x94\xc3\x27\xe2\x45\xe8\x8c\xd4\x2f\xba\x0c\x17\
+\x83\xe3\x22\xaf\x40\x4e\xd6\xbf\x17\xa2\x02\x28\x3c\x5e\x2f\x70\
+\x7a\x2a\x02\x50\x43\x6c\xde\x27\x8b\xaa\x24\x21\x21\x83\x69\x62\
+\x88\xe1\xc2\x06\x6e\xe8\x44\x95\x9f\x9a\x1a\xd0\xf7\x9a\x48\x0a\
+\x0e\xc5\xda\x91\xd0\xf6\x34\x41\xc8\x2b\x71\x40\xa2\xe8\x0e\xc0\
+\x05\x5b\xad\xfe\x68\xcb\x01\xfd\x3f\x6f\x41\x08\x21\xf8\xbf\x27\
+\xb9\x8a\xf6\x11\x44\x18\x97\x9f\x8d\x6d\xd6\x80\x18\x68\x09\xd8\
+\x8e\x64\xe9\x44\x20\xb1\x4d\x7b\x7f\x2d\x0e\x95\x89\x32\x05\xb0\
+\x6f\xe9\xa1\x48\x25\x12\xf5\x8a\x82\x81\x16\x1a\xc8\xd7\x6f\x1d\
+\xc9\x42\x02\x36\xbf\xcf\x73\x47\x17\x63\x9d\xb8\xed\xbd\x08\x91\
+\x3b\xc2\xdc\x50\x28\x43\xd6\x93\xe2\xd0\xa6\x9b\xc8\xd3\x4c\x89\
+\x4c\x5d\x1b\x52\xc2\xe4\x90\x93\x28\x9b\xfb\x15\x7f\x5b\x12\x06\
+\x13\xf7\x3d\xf5\xa9\xc3\x81\x64\x22\xd4\xe0\xfa\x2b\x58\xfb\x4c\
+\xf7\x37\x66\x7a\xd0\x30\x7d\xc3\xfa\xaf\xbb\xee\x89\x4d\xf1\xc9\
+\x3f\x14\xa1\x2b\xeb\x17\x9e\xd4\xd6\x35\xd6\xf1\xd7\xd1\x59\x74\
+\xfb\xa0\x62\x3d\xbd\x27\x07\xa8\xbd\xef\x12\xa9\xd0\x08\x25\xdf\
+\x43\xe3\xfb\x41\x3b\x01\xf2\x22\x31\x40\xc5\x83\x8c\x1d\x3c\xfb\
+\x34\x0d\xa2\xeb\x17\xb4\x77\xa4\x19\xb1\xda\x0c\x33\x36\xd3\xcd\
+\x09\x2d\xd6\x96\x60\x17\x21\x7d\x0f\xbe\x29\xf5\x1e\x7f\x28\x80\
+\xad\xec\xfd\x7f\xc2\x47\xee\x09\xfa\xa4\x3d\x43\x89\x0a\xf4\x5c\
+\x9b\x4c\x8b\xeb\x78\xb0\xef\x15\xcb\xcd\x0d\x87\xe6\x7a\x50\xcf\
+\x13\x65\x63\x7b\xcd\x22\x30\x37\xd7\x27\x53\xa7\x6a\xe8\x03\xb5\
+\x03\x72\x3c\x43\x7e\x3f\xcd\x6e\xdd\xfb\xdb\x1f\x14\x44\x12\xa8\
+\x20\xfe\x1f\x5b\xdf\x4a\x01\x10\x21\xee\x94\xa1\xc3\x3e\x90\xaf\
+\x9d\x28\x07\xde\x4b\x99\x0f\x6c\x71\xa8\xa2\x84\xe5\x05\x29\xc9\
+\x2b\xd7\x3a\xd5\x88\xc0\xba\x0b\x4d\x21\xae\xf8\xa5\x44\x0d\xb3\
+\x1a\x6b\xe1\x6d\x47\xe8\x20\x50\x6d\x99\xd5\xa9\x54\x45\xc5\x9e\
+\xb7\x55\x85\x87\x7d\xe8\x02\x11\xb6\xd0\x5f\x2e\x91\x36\x9b\x37\
+\x8d\x7c\x76\xde\x81\x05\x80\x2f\x13\x11\x65\xc5\xe8\xb3\x03\x1a\
+\xef\xbd\x18\x10\x10\x22\x6e\x39\x34\x4c\x91\xdf\xee\xa6\x02\x76\
+\x3d\xdb\x77\xa1\x20\x80\xb2\x52\x26\xff\x00\xc1\x48\x42\x24\xb3\
+\xa5\xb6\xc5\x0b\x01\xdd\x1e\xf1\x40\x21\x58\xe7\x21\x56\xa0\x75\
+\x79\xbe\x28\xd9\xe1\xe6\xff\x00\xda\x02\x27\x2e\xfd\x28\x80\x8a\
+\xe9\x57\x96\x15\xf7\x54\x52\x26\x02\xdb\x83\xfb\x44\x4e\x78\x3e\
+\x7f\x87\xa6\xf4\x0c\x08\x01\x79\xf4\x78\xa7\x48\x96\x4c\x89\xb3\
+\xb5\x01\x10\x89\xcd\xa7\x19\x9a\x01\x61\xcb\x3e\xff\x00\x68\x84\
+\xe7\xa0\xc8\xeb\x4d\x53\x81\x5f\x62\x4e\x8f\xaa\xd1\xd1\x06\x05\
+\x91\x40\x5d\x21\xbb\xef\x40\x04\x1c\x63\xe2\x21\xd1\xbb\x12\x1a\
+\x50\x5f\xea\x8e\xd5\x05\x7e\x08\x18\x7f\x6a\xd9\xda\x81\x92\xa0\
+\x40\x30\x42\x90\x6d\x3a\x73\xcd\x0d\x27\x9c\x81\x42\xec\xd0\xf8\
+\x04\x22\x48\x90\x1e\xb0\xbf\xa2\xac\xc4\x47\x4b\xd0\x96\xc0\x18\
+\xd4\x59\x0b\xad\x32\x41\x8c\x44\x9f\xad\x7a\xfc\x34\x86\x20\xbe\
+\xec\x7c\xd2\xdb\x71\xc2\x0a\x3b\x9f\xf8\x0c\x11\xae\xb5\xb3\xd8\
+\x71\xa3\xbd\x24\x83\xcc\x8e\xd3\x1d\xab\x2e\x9f\x75\x6b\xaf\xc1\
+\xaf\xbb\xee\x85\x92\x35\x56\xeb\x53\x63\xeb\x37\x8e\xdb\xd4\x8a\
+\xef\x7b\xb9\x8d\x07\xfe\x2f\x74\xf9\x15\x87\x5f\xaf\xf9\xf5\x7d\
+\x7f\xd0\xd0\x91\xbf\xc1\xa5\x5c\x87\xe0\x5b\x78\x74\x32\x02\x17\
+\x9b\x66\xff\x00\xf2\x26\xb0\x2e\xd7\x6b\x14\x54\x47\x18\x6a\xe5\
+\x45\xbe\xbc\x50\x50\x56\x59\x62\x7a\x95\xb6\x74\x75\xc7\xb3\xf9\
+\x4c\xfc\x31\xbb\x40\x7a\x75\xa2\x41\x4d\xf5\x1a\xda\x9a\x18\x8d\
+\xa1\xbc\x18\xb7\x3b\x3a\x2c\x8a\xb7\x16\x77\x73\xbe\x45\x06\x81\
+\x00\x16\x0e\x66\xc7\xf9\xe1\x60\x00\x8b\x84\x35\x5d\xd2\xdb\xad\
+\x14\xa2\x2d\x1b\xc5\xad\xad\x0c\x6a\xa5\x37\xe9\x7d\x75\x55\x00\
+\x10\x49\x09\x80\x01\x08\xa1\x12\x08\x19\x32\xd1\x80\x02\x92\x28\
+\x41\x32\x2c\x93\xfa\x03\xfe\x2a\xd4\xed\xc7\xed\x42\xb2\xfd\x1d\
+\xbe\x47\x6d\xe8\x00\xa4\xed\xa5\xff\x00\xa3\xb6\xf4\x0d\x91\x13\
+\xa9\xfe\x54\x6e\x5a\xe8\x68\xc8\x94\x3b\xf5\xa7\x02\xd8\xd7\x0d\
+\x8d\x34\x7d\xfa\xd3\x52\x8f\x79\xce\xf4\xa4\x4b\xc7\x91\xfe\x53\
+\x6e\xc7\xcf\x56\x28\x44\x21\xf5\xe0\xd0\xbb\xa7\x6e\xba\xd0\x46\
+\x64\x90\x9c\x89\xf3\xb7\x4d\xf2\x21\x6e\x2d\xbd\xa9\xc3\xb8\xa8\
+\xcd\x36\x61\x3c\xe1\xfe\xbb\x52\x90\x23\x5f\x23\x4d\xa9\x75\x3e\
+\x3f\x28\x63\x0c\x88\x3f\x1c\x7b\xe6\x88\x21\x05\x0c\x9b\x87\xad\
+\xed\xea\xa5\x62\x4f\x7b\xc0\x24\x69\x64\x3d\x8a\x00\xa4\x72\x28\
+\xe3\x8f\xcc\xf7\x2a\xa4\xe4\x6c\x58\x03\x1b\x03\xbe\x2e\xe8\x02\
+\x1e\x6c\x00\x5d\x63\xe3\x5c\xf0\x13\x67\x08\x07\x29\x3d\xa8\x23\
+\x00\x4e\xdf\x3e\xaa\x00\x1d\x8b\x41\x3c\xf8\x56\x26\x88\x4c\x24\
+\x63\xbb\x8f\x76\xa1\x00\xc2\xc2\x02\xb3\x3d\xc7\x95\x48\x6c\x42\
+\xda\x02\x1e\xa2\x44\xdb\xdc\xad\x50\x44\xc0\x22\x07\x24\x0a\xba\
+\x22\x33\x76\xa7\x5f\x7a\x1a\x2d\x10\xb2\xc5\x64\xdc\x4f\x3e\x28\
+\xe0\xdf\xc1\xd3\x3f\x74\x22\x13\xb6\x37\x9f\x6d\x5c\x9c\x9d\xf0\
+\x7d\x71\xff\x00\x05\x83\x9a\x65\xbc\xf4\xbc\x76\xa9\xd1\xa7\x22\
+\xdc\x7a\xa2\xb8\xf6\x7f\x2a\x34\x65\x8d\x8e\xd5\x30\x83\x1a\x3f\
+\x15\x0d\x59\x5f\x72\x44\xc0\xe9\x53\x63\xad\xfc\xa9\x91\x02\xf1\
+\x71\x93\x12\x7a\xef\x58\x92\x77\xe9\xc6\xb5\x01\x98\x2e\x0c\x98\
+\x0e\x67\xd1\x46\x0b\xbd\x61\xfd\x78\xa3\x22\xde\x60\xf7\x36\xf9\
+\xad\xde\xc7\x8d\x5d\xe8\x68\x90\x2d\x8c\x08\xd0\x98\xad\x91\xe3\
+\x7d\xf7\x34\x4a\x81\x9e\x35\x27\x07\x73\xdf\xfe\x0c\x9a\xc0\x1f\
+\x22\x90\xb0\x19\x2c\xe0\x9b\x1f\xdd\xa8\x65\x21\x9b\x34\x4c\xe0\
+\xe3\x5d\x35\xa5\xa6\x5a\x39\x2c\x13\xe3\xcf\x5a\x6a\xc4\xcc\x17\
+\xd8\xf0\x9e\x0f\x9c\xa6\x4d\x0a\xd8\xfd\xe8\xa8\xcb\x2e\x44\x39\
+\x92\x52\x9a\x10\x91\xcf\x73\xa9\xfe\x51\x78\x04\x09\xdc\x7b\x3b\
+\x75\xa2\xfb\x18\xd9\x1b\xfd\x83\xea\xa2\x00\x59\xbb\x4a\xed\xd7\
+\xd1\x50\x90\x13\x10\xb5\x37\xe8\xa8\xbc\x08\x98\x3a\xb6\x78\xe0\
+\x45\x1c\xd6\x38\xde\xcc\x71\x46\x88\x81\x61\xa6\xb6\xdf\xf9\x40\
+\x05\x06\x01\x7a\xc9\x29\x2d\x9d\x07\xb0\x38\x63\xe5\xcf\x9d\xa9\
+\x4a\x31\x32\x76\xe3\x81\x9a\xb4\xf2\xed\xb3\xa0\x8d\x93\x28\x19\
+\x16\x23\xad\x02\xa4\x1d\xad\xe9\xd2\x82\x44\x49\xfc\x7b\xed\x88\
+\xf2\x43\x06\xee\xf3\xf6\x28\x44\x20\x9f\x6b\x8e\xb6\xe4\xe9\x63\
+\x47\x31\x33\x28\x6b\x3e\xba\xed\x4a\x92\x2f\x05\xc2\x90\x5e\xed\
+\x5a\x2f\x52\x26\x4a\xc1\xc7\x23\x76\x74\xa4\x19\x03\x64\xf0\xc5\
+\x19\x04\x01\x02\xd9\x4f\x3b\x6f\x4a\xc8\x67\x50\x74\x4f\xe2\x29\
+\x08\x4c\xbd\xba\x76\xda\x8a\x24\xcf\x8f\xed\x06\x2f\x9a\x03\x99\
+\x8d\x4e\xcc\x7e\x5e\xb9\xf7\x7f\x69\x24\xc4\xe9\x7b\x1d\xcd\x11\
+\x40\x31\xbd\xed\xfd\x1d\xa8\x82\xf2\x36\xbf\x7c\x76\xa5\x92\x16\
+\x01\xba\xcb\x84\xee\x6d\xa3\x26\x20\x02\x08\x62\x14\x80\x1d\x86\
+\xb3\xb5\x6e\x79\x11\x01\x9d\x87\x7f\x8c\x50\x12\x5f\x02\xe0\x41\
+\x79\xdd\xfe\xd0\xa0\x5a\x01\x09\x18\xcf\x92\x2a\x28\x12\xba\x4b\
+\x2b\x03\xda\xff\x00\x94\x78\x05\xda\x45\xae\xac\x77\xa2\x1d\x20\
+\xb8\x30\x41\x95\x26\x24\xfe\xe0\xd0\xa6\x0f\x2c\x2d\xb9\x29\x85\
+\x03\x52\x53\x66\x8c\xed\x02\x61\x8d\x43\xde\x69\xc0\x23\x78\x81\
+\x1d\x82\x5b\x9e\xb4\x6e\x50\x56\x04\x01\x21\xc3\xb1\x04\x82\xee\
+\x08\xa1\x10\x20\x8a\x92\x90\x38\xc7\x13\x0a\x4d\x2d\xc0\x25\x00\
+\x31\x73\x61\x7b\x1d\x31\x46\x44\x16\x14\x00\x1d\xec\x70\xfe\xa8\
+\x5f\x0a\x21\x58\x9c\x9f\xb7\x45\xa4\x0a\x04\xe2\xcd\x8d\x6b\xee\
+\xfb\xaf\xbb\xee\xb2\xe9\xf7\x42\x08\x00\x62\x68\x80\x60\x29\x59\
+\xbc\x9b\x68\xcf\xc6\x94\x79\x00\x00\xff\x00\x4f\x58\x27\x83\xa5\
+\x14\x43\x5d\x2d\x6e\x46\xb4\x01\x93\x49\x53\xbb\xec\x84\xd4\x07\
+\xea\xc6\x07\x3c\x75\x3a\x53\x43\xc9\xd7\x41\x75\xe2\x04\x51\x80\
+\xe4\x1f\xe9\xca\xfc\xda\xa2\x4e\x8b\x3b\x48\x00\xf6\xa8\xb3\xf7\
+\x8b\x4f\x7d\xa9\x08\x7d\xad\x6e\x6b\x0e\xbf\x54\x48\x96\x8a\xfd\
+\x2b\x9f\x77\xf6\xa4\x12\x05\xec\x66\xdc\xd6\xbc\xf4\x8e\x98\xb7\
+\x32\xf6\xa2\x05\x2c\x93\x8c\xc0\x29\xd5\x2b\xeb\x9a\x18\xcb\x4d\
+\x75\x69\xec\x51\x25\x52\x0b\x16\x6b\x68\x23\xc4\x81\x4e\x19\x0a\
+\x20\x63\x1a\x74\xe9\x99\x54\x6a\x64\x2c\x53\x61\x9f\xcf\x51\xa1\
+\x32\xe0\x62\x04\x45\xff\x00\xbd\x17\x26\x04\x04\x19\x2b\x06\x2f\
+\x3b\x4e\xfa\x51\x99\x28\x04\x22\x0f\xc2\xd2\x87\x05\x2d\x06\x11\
+\x89\xde\x3d\x74\x3a\xff\x00\xa1\x3f\x80\xed\x4f\xe2\x72\xf7\xba\
+\xf9\x1d\x9b\xa2\xa9\x43\xe4\xcb\xf8\x77\x46\x8e\x24\xc0\x20\x92\
+\x4e\xbf\x9a\x81\xf7\x41\x24\x61\xa0\x11\x7d\x75\x89\xce\x6d\x00\
+\x83\x24\xb9\x2c\xef\x24\x6f\xdb\x6a\x5a\x5f\x55\xec\xb8\xe3\xfb\
+\x40\x33\x10\x53\xd9\xfb\xc5\x22\x60\x15\xf2\x47\xd1\xee\xa9\x84\
+\x84\x3d\x72\x0e\xf4\x2c\x87\x3f\x74\x74\xe7\x5d\xb8\x5a\xd2\x2b\
+\x0b\xfc\x50\xc9\x43\x6d\x71\xf7\x8a\x06\x84\x10\x56\x7a\x76\x8c\
+\x50\x02\x66\xf6\x81\xef\xb7\xa2\xe1\x26\xb9\xea\x4f\xdd\x18\x08\
+\x7c\x48\x9b\x7c\x7f\xb4\xd8\x0b\x3c\xc0\x16\x9e\x94\x60\x40\x3a\
+\x89\x86\x37\x15\xa8\x01\x94\xb2\xc6\x78\xab\x71\x31\xdb\xdf\xcd\
+\xea\x02\x16\x9f\x20\x47\x93\x46\xb1\x1d\x3c\x7e\xf8\xa2\x00\x95\
+\xcd\x5c\x20\x67\xb5\x2e\xa7\xc7\xe5\x10\x81\xb1\xaf\x6a\x04\x62\
+\x4c\x5e\x44\xf0\x36\x55\x8a\x92\x1a\x0b\x24\x1e\xc0\xbe\x4d\x05\
+\x10\xd4\x01\x9a\x3c\x93\x46\x54\x90\x35\xa6\x01\x7d\xed\xad\x02\
+\x68\x81\x92\x96\xc2\xbf\x3b\x3d\xa9\x6d\x2e\x90\x90\x60\xbb\xeb\
+\x85\x9b\x50\x12\x18\x30\x32\xd8\x2e\xf3\x07\x3a\xe6\x82\x0c\x89\
+\x2d\x02\x90\x8e\x0b\x05\xbd\xce\x69\x48\x38\xa6\xc2\xbe\x3e\xfa\
+\x51\x39\x90\x12\x02\xc2\xcc\xfa\xda\xa2\x68\x49\x03\x24\x93\x9c\
+\x9f\x6e\xa8\xf5\x20\x90\x6c\x1b\x12\x41\xc0\xb0\xde\x8c\x46\x44\
+\x0a\x05\x9d\x95\x85\xda\x6f\x15\x73\x8d\x32\x00\xa3\x2d\x12\x96\
+\x3b\xaa\x07\x32\x09\x9b\xf7\xdf\x3f\x1a\x1c\x00\xb9\xea\x63\xce\
+\xbc\x6b\x14\xe6\x60\x39\x1b\x0c\x00\x99\x61\x9c\x25\x37\xba\x7c\
+\x8a\xb8\xf4\xa3\xd3\xa1\xaf\x4b\x6a\x61\xd7\xea\x8d\x07\x47\x7e\
+\x0d\x6e\xf6\x3c\x6a\xef\x45\x20\x1d\xdc\x60\x42\xe9\x77\xdf\xfe\
+\x12\x2f\x77\xfa\xa5\x5c\x87\xe0\x5b\x78\x75\x21\x2f\xbb\x64\x6f\
+\x6e\xb5\x20\x31\x7b\x8c\x79\x76\xa9\x25\x8e\x9c\x9b\xef\xdb\x32\
+\x2a\x7c\x85\xc8\x77\x7a\xfe\x9d\xe9\xe0\x2b\x55\xb2\xf9\xde\xa0\
+\x2f\xde\x3b\xeb\x73\xb5\x30\x0c\x1d\x37\xb7\xc7\x8f\xf8\x0c\x2d\
+\x48\x1d\xc8\xa7\xc0\x0c\x68\x35\x37\x7e\x8d\x69\x07\x98\x02\x16\
+\xe1\xf3\x62\xf0\xb7\xa2\x15\x97\x45\xa6\x06\x7e\x68\xa2\x59\x67\
+\x5b\x0f\x0f\xf3\x1a\xaa\x32\x02\x84\x1f\x9b\x8a\x54\x00\x18\x04\
+\xe4\xbf\xb4\x29\x48\xc8\xcb\x48\x1b\x7e\xef\x91\x44\x51\x04\x88\
+\x0e\xa5\x7c\xe3\x4a\x38\x8c\x40\x02\x72\x58\x77\xff\x00\x2d\xc5\
+\x09\x3e\x85\xad\xa2\x3d\x9a\x97\x26\x66\x61\xdc\xf2\x6f\xd3\xf2\
+\x19\x02\x22\x42\x0c\xb0\x2d\x69\xa6\x68\x40\x48\xc9\x86\x7a\x81\
+\xed\x34\x58\x88\x20\x80\xe5\x09\x0c\x5f\xbd\x6c\x51\x30\x90\x4f\
+\x6e\x2a\x0d\x40\x92\xb0\x39\xe9\xd2\xf4\x01\x42\x66\x09\x66\x5d\
+\xc9\x24\xdf\x72\x80\x42\x28\xa5\x33\xef\x41\x51\x26\x06\x6d\x86\
+\x7e\x75\xc7\x4a\x47\x1d\x74\xb1\xb7\xdd\x19\x01\xa0\x6b\x76\xff\
+\x00\xb4\x49\x1a\x8a\xde\x3d\xc7\xe5\x00\x94\x5a\xb7\x54\xe8\xc3\
+\xac\xdd\xec\xc7\xef\xc5\x03\x72\x02\xda\xff\x00\x34\xb8\x20\x90\
+\x90\x63\x31\xf7\x4c\x1a\x9e\xba\xff\x00\x3b\x6f\x44\xc1\x27\x6f\
+\x91\x58\x1e\x7a\x9a\x26\x4c\x58\x1d\x2f\x7f\xed\x00\xb5\x3c\xde\
+\x88\x49\x00\x2e\x7a\xbe\x3d\x55\x3f\x49\x44\xe6\x2e\x66\xca\xa1\
+\xa0\x4a\x01\x25\xab\x07\x8f\xdd\x20\x00\x82\x61\x98\x2f\xae\x28\
+\x7f\x44\x04\x00\x3a\xb3\xa6\xa3\x6a\x15\x8c\x80\xb8\xf5\x2f\xbf\
+\xce\x8c\x51\x9b\x90\x12\x1d\xdf\xb9\x1b\xe2\x92\x14\x39\x32\x97\
+\x1c\x53\xc5\xb6\x83\x26\x92\x36\xa5\xc2\x01\xa0\x4c\xdf\x1a\x0a\
+\x32\x58\xa4\x92\x48\x62\x4e\xf6\x65\x0a\x22\xe3\x42\x83\x93\x20\
+\xde\x7c\x1a\x3b\xc8\x60\x24\xc8\x23\x93\xdb\x11\x40\x10\x0e\x73\
+\x78\x97\x8e\x2c\x78\xa1\x40\x00\x42\x12\x44\xb3\xde\xd8\x1d\x11\
+\x26\x52\x04\xe4\x28\x48\x80\xd8\x4d\xd7\x4b\x55\x8a\x1e\x59\x41\
+\x04\x08\x18\x05\x83\x5c\x62\xf4\x32\x40\x3d\xb2\x51\xb8\x09\xa6\
+\xf9\x18\xc3\x76\x09\x80\x50\xb8\x85\x83\x9f\x4d\x1d\x19\x0d\x82\
+\x19\x1e\x6f\xf7\x7a\x77\x8c\x08\x8c\x21\xef\xce\x94\x50\x30\x08\
+\x14\x71\x2a\xf0\x6c\xf8\x8a\x71\x22\xc6\x6d\xdc\xce\x88\x51\x2a\
+\x35\xbf\xe5\xad\x9d\x28\x89\x81\x1c\x8d\x3f\xc5\x76\x02\xb6\x49\
+\xec\xf9\xff\x00\x8e\x4a\x74\x09\x00\x43\x6f\xd9\x3a\x45\x0d\x0a\
+\x39\x98\xd3\x55\x46\x47\xf3\xa2\x5d\xe6\x9a\xb9\x2f\x73\xdc\xc9\
+\xf8\xff\x00\x97\xba\x7c\x8a\xf4\xe8\x7f\xe8\xf9\x19\x25\xb1\xf4\
+\xd1\xe0\xc0\xb5\xf7\xe6\xe2\x74\xa1\x44\xc4\x40\x8c\xb3\x26\x36\
+\x7f\xe4\xd5\xed\x0b\x09\x97\x37\x7c\xc7\x4d\xe9\xa5\x02\x02\x74\
+\x2e\xc2\x2f\x2e\xdc\x50\xc6\xf4\x08\xf3\x7e\x2c\x47\x14\xf0\x64\
+\xc1\x3b\x91\xe1\x7e\xf5\xa3\x20\xd8\xe4\x5a\xda\x75\xa7\x04\x1a\
+\x33\x6d\x0b\xdf\x34\x73\xa3\x01\x3f\x4e\xba\x8a\x42\xc5\xa2\x0a\
+\x50\x66\xcf\x8e\x4f\x14\x37\x45\x5b\x01\xd9\xfc\xe4\xd0\xe2\x48\
+\x5a\xb4\x82\x56\xf7\x7a\x4c\x3b\x4b\x0e\xd7\x5f\xef\x78\xa3\xe4\
+\x41\x71\x09\x05\x9c\xca\x21\x3c\x53\xdf\x25\x31\x92\x00\x80\x26\
+\xe0\x60\xe8\xb1\x4d\x20\x32\x58\xa6\x6c\xc1\x1f\xc5\x46\xd3\x8c\
+\xb2\xd0\x22\x08\x8b\x8b\xca\xbb\x04\x30\x42\x64\x00\x67\xa9\x4b\
+\x9f\x7c\x13\x62\x41\xa2\xd4\xdb\x52\x47\x1c\x52\x08\xec\x88\xec\
+\x41\xce\xaf\x14\x50\x0d\xdb\xc5\xbc\xf4\xa2\x41\xc9\xa6\xc5\x89\
+\xdd\x6d\xd6\x6b\x5b\x91\x9c\xa0\x4a\x9b\x69\x4b\x42\x99\xce\xef\
+\x43\x4c\x65\x02\x40\x3b\x4b\xf1\x3e\xda\x8f\x74\x2e\xf6\x95\xa8\
+\xef\xf9\x4c\x84\xc0\x00\xe6\x2e\x94\xdb\xe6\x81\x46\x46\x75\xb1\
+\xfd\xa4\x04\x84\x48\x4a\x93\x38\xab\x90\x03\x8f\x76\x14\x00\x03\
+\x27\x39\x8b\x1c\x74\xa7\xd0\x79\xfd\xa0\x49\xd9\x2e\xdb\x07\xae\
+\xd4\x4d\x78\x43\x10\x61\x8d\x28\x78\x25\x06\x6f\xa8\x8f\xda\x08\
+\x04\xcf\xa7\x8a\x68\x80\x2b\x04\x6d\x47\x52\xd9\x0c\x50\xa0\xa1\
+\x84\xe6\x2e\x06\xa1\x88\xe2\x84\x82\xfc\x9a\x08\xb4\x80\x12\xba\
+\xfe\xd1\x52\x90\x40\x49\x6e\x0c\xb6\x42\x37\x20\x50\xaa\x40\x81\
+\xc4\x40\x86\x61\xa2\x50\xf4\x20\x18\x25\x92\x24\x11\xac\x9d\x43\
+\xce\xb4\x36\x43\x81\x7b\xfd\x62\x83\xbe\x18\x10\x64\x00\x13\xe5\
+\xf3\xd2\x84\x26\x00\x02\x91\x69\x43\x32\x6f\xf7\x46\x62\x08\x1e\
+\xe1\x84\x18\x04\xe7\x8a\x25\xf9\xd1\x04\x00\x76\x80\x24\xb3\x6a\
+\x38\x56\x4d\xe0\x04\xd8\x88\x24\xa6\x23\xad\x3b\x1f\xc4\xc1\x09\
+\xd0\x56\x97\x87\x19\xbd\x0e\x0d\x05\xdc\x93\x0d\x70\x50\x11\x9b\
+\x5c\xd1\xf0\x06\x92\x90\x4c\x45\xce\x43\x99\xe0\x11\x05\x50\x20\
+\xa4\x02\x10\xd0\x4b\x82\x8a\x4a\xa2\x2d\x8e\x65\x1b\x03\xb9\x4f\
+\xde\x80\xe4\x02\xe8\xd8\x0d\x0d\x42\x1b\xb6\xd1\x43\x85\xca\x27\
+\x37\x8b\xff\x00\xbb\x3a\x69\x20\x98\xe0\xd8\x94\x2f\xa3\x77\xf8\
+\x54\xf8\xb2\x01\xdc\x2c\x91\x7f\xf2\xd7\xa1\x87\x30\x6f\xc9\xd1\
+\xeb\xe6\xf4\x1a\x89\x47\x75\xee\x37\xd0\x82\xb9\x91\xc7\xdd\xa7\
+\x20\xd0\xc9\x13\x91\xdc\x3f\x5b\xd2\x80\x20\x65\x23\x20\xc5\x98\
+\xf7\x9d\x28\x9a\x92\x65\xaf\x80\x55\xfb\xed\xd1\x54\x98\x8f\xf4\
+\x81\x90\x30\xa8\xa0\x33\x7d\xf4\x23\xfd\xbd\x73\xee\xfe\xd2\x44\
+\x4f\x5f\xf7\xfe\x0b\xe9\xf8\x11\xf7\x4c\x4e\x84\xfa\x9f\xc7\x6c\
+\x54\xb5\x71\x6e\x87\x8c\xed\xd6\xaf\x74\xf9\x15\x7b\xa7\xc0\xab\
+\xdd\x3e\x05\x06\x04\x90\x01\x36\x09\x1f\x06\x8e\x7e\xfe\x12\x41\
+\x98\x5e\x3e\xf4\x35\x30\x01\x8c\x8c\x90\x57\x44\x08\x37\x9b\xc3\
+\xa1\x18\x20\x08\x18\x9b\x24\x0b\x36\x33\xbe\xa5\x50\x60\x00\x5c\
+\x02\x41\x9c\xbd\x1b\xef\x11\x46\x5e\xb9\x87\x63\xbe\x9c\xba\x20\
+\x00\xdd\x95\xaf\x7f\x52\x68\x44\x00\x20\xc2\x0f\x8e\xb7\x9f\xda\
+\x3c\xc0\x94\x51\x98\x8b\x38\x4b\x42\x89\xa5\x06\x00\x01\x1b\xbf\
+\xaf\x6d\x82\x04\x20\x8c\x81\x36\xd9\x70\x00\xf0\xe9\x6a\x0e\x19\
+\x2f\x40\x29\x2c\x77\xbe\x12\xd5\x0d\x83\x96\x66\x27\x27\xc9\xa1\
+\x21\x22\x24\xc2\x90\x35\x84\x5c\xf1\x2e\xf4\x8a\xc1\x94\x00\x20\
+\x96\xc0\x92\x00\xde\xa6\x82\x10\x20\xf3\x13\xf1\x9f\x03\x76\xe5\
+\x28\x2b\xc2\x5e\xe9\x4b\x10\x60\xb8\xd2\xe7\x24\xed\x7a\xcb\xa4\
+\x32\x77\x4b\x9d\xfc\xd1\xd9\x00\xa0\x24\x0e\x59\x40\xa9\xc9\x38\
+\x01\x5c\x8a\x9a\xc4\x83\x0c\x82\x17\xbc\x9a\x0b\x00\xb3\x34\x53\
+\x70\x51\xc3\x7b\x5a\xf4\x50\x4a\x42\x68\xc4\xd1\x94\x19\x02\x88\
+\x2a\x02\x7c\x36\x40\x41\xec\x62\x3f\xc7\xa1\x20\x62\x41\xd5\x7e\
+\x1f\x14\x1a\x28\x34\x08\x29\xcd\xbf\x99\xa2\xa2\x04\x31\x88\xb3\
+\xd7\x7d\x26\x97\xb2\x04\xb1\xb2\x82\x04\x98\xbf\xb8\xa3\x98\x40\
+\xcb\xcb\x5d\x39\x7d\x28\x01\x5b\xd2\x2f\xd1\x7b\xa5\x0f\xe9\x7f\
+\x68\xac\x16\x46\x0e\x86\xfe\x8a\x10\xcd\xdc\x58\x13\xf2\xbf\x8e\
+\x18\x14\x52\xf4\xd0\x7b\xbe\xbd\xa8\xc8\x04\x15\x99\xea\x3a\xfc\
+\x50\x80\x83\x2c\x1c\x2d\x41\xd6\x3e\x68\x94\xbf\x90\xd0\xff\x00\
+\x3b\x6f\x40\x28\x5e\xc3\x63\x89\x00\xe3\x14\xc9\x5a\x05\xb8\x85\
+\xd2\x2b\x6b\x31\x46\x84\x4a\x64\x93\x81\x98\xd8\x89\x34\xb4\x09\
+\x15\x88\x17\x23\x42\xed\x4e\xd4\x65\x81\x01\xa6\xb4\x59\x06\xe5\
+\x06\x4e\xc3\x14\x32\x0c\xc4\x03\x95\xa6\x2c\x36\xa2\xc6\x00\x41\
+\x18\x2c\x10\xc8\xeb\x1b\x8a\x10\x58\x17\x0e\xcf\x03\xd5\xd2\xc0\
+\x02\x4c\xc1\x80\xe0\x1b\x02\x1c\x7c\x4d\x20\x5e\x4b\xcc\xa5\x90\
+\x53\x29\xd1\x75\x09\x08\x24\x5c\xe8\xcd\xf7\x21\x51\x80\x50\x4c\
+\x31\x54\xd9\x3f\x19\xa1\x09\x41\x04\xb8\x09\xee\x0d\xba\x66\x9a\
+\x10\x41\x92\xc8\x5d\xc1\x0d\x53\xec\x3e\xa1\x39\xa1\x68\x15\xf5\
+\xe4\xe8\x3f\x1f\xc1\x02\x10\x45\x8a\xbe\x3b\xd0\x15\x33\x96\xb1\
+\x48\x76\x04\x91\xaa\x6e\x8e\x00\x7a\x40\xb0\xd8\x41\x0c\x92\xc2\
+\x4c\x96\x35\xa2\x28\xc9\x31\xd1\x19\x01\x27\x05\x01\xd4\x69\x14\
+\x12\x30\x00\xc4\x2f\x20\x93\x7b\x25\x2e\xf4\xea\x12\x15\x2d\xe9\
+\x6d\x7d\x83\x42\xef\x20\xc1\x4c\x89\xf2\x52\xd6\xf4\x25\x30\x8b\
+\x6a\xc1\x8f\x64\x4f\x7a\x29\x44\xe6\xed\xa2\x3a\x55\xa3\x8a\x39\
+\x09\xf5\x1e\x06\xbe\x6a\xcb\x21\xa5\x85\xf6\x17\xd3\x34\x0e\x6c\
+\xec\xcb\x59\xc9\xed\x4a\x4c\x89\x10\xbc\x49\x2e\xb6\xa0\x53\xd0\
+\x22\xe3\xb9\x8d\x8f\x4e\x94\x03\xa3\x27\x1e\xf9\x54\xcc\x21\x62\
+\xd1\xd0\xe1\x36\xf3\x42\xa3\x76\xdf\x5d\x78\x3a\xda\xa4\xd9\x73\
+\x9c\xf1\xac\xc5\x4d\x56\x29\x18\x3b\x96\xd3\x77\x42\x61\xbc\x0c\
+\xad\x89\xf5\x3b\xba\x49\xd6\x18\x91\x91\xf7\xf8\x69\xf4\x1e\x7f\
+\x68\x76\x32\xf3\x8a\x6e\x2b\x1d\xa7\xf9\xf3\xad\x15\x7d\x08\x9b\
+\xdc\x79\xe1\xed\x45\x07\x19\xdc\x31\x78\x91\xb1\xda\x48\xa0\x0a\
+\x34\x05\x88\x80\x15\x74\x4e\x6d\x7a\x26\x41\xc4\x01\x68\x05\x7b\
+\x17\xcd\x00\x45\x32\xa4\x1a\x0f\x1e\xeb\x42\xf3\x04\x8c\xf0\x73\
+\x9b\xcf\xf6\x84\x98\x4a\x17\x86\xe3\x89\xa2\x60\x30\x5b\x3a\x8d\
+\x39\x5c\xd1\xdc\x89\xca\x64\xbb\xe7\x9d\x0e\x97\xa5\x89\x23\x9d\
+\xa2\xdd\x29\x46\x42\xf2\x79\x05\xf9\x1e\x22\xa2\x67\x24\xc0\x0c\
+\x99\x1b\x06\x4a\x4d\x6d\xb1\xa3\x26\x6a\x5b\xd8\x00\x7a\x10\x19\
+\xe4\xe9\x42\x41\x48\x85\x8b\x8d\x0e\x87\x51\xb7\x14\xde\xa0\xa3\
+\x41\x93\x42\x58\x00\x1d\x85\x1b\x09\x4c\x88\x23\x10\x6e\x64\x0f\
+\x9a\xc0\x80\xf0\x83\x0a\xd6\x30\xf0\x28\xf4\x80\x54\x0d\x22\xd6\
+\xd0\x6f\x4e\x02\x16\xe0\xe4\xb0\x46\x01\x61\x29\x06\x52\xe4\x04\
+\xb2\xae\x8d\x00\x81\x32\x25\x93\x1f\xc9\xbd\x1a\xd0\xe4\x50\x72\
+\x63\xb4\x05\x0a\xc0\x20\x44\x85\x00\x01\x0f\x71\x17\xe6\x80\x08\
+\xaf\x22\xde\xae\x54\x6d\xad\x09\xc0\x50\x17\x41\x25\xdb\x4c\xe6\
+\x68\xa5\x62\x09\x44\xc8\x9d\x08\x73\x80\x86\xfa\x50\x01\x81\x50\
+\x02\x52\x89\x23\x50\x0e\x23\xc5\x01\x09\x45\x25\x12\x24\x8b\x6a\
+\xbe\x09\xbd\x13\x00\x04\x87\xaa\x3b\xb4\x3f\x73\x44\xae\xc4\xce\
+\xb1\x2c\xf5\xe2\xda\x1a\xb8\xc0\x43\x81\x16\x48\x2a\xf2\x68\xe5\
+\x11\x32\x63\x0c\x86\x4b\xb3\x10\xe5\x17\x62\x0d\x3b\x25\xb2\x70\
+\x02\x09\x30\x09\xc1\x66\xd4\x06\x80\x58\x01\x07\x74\xb3\xcf\x13\
+\x40\x41\x08\xc0\x9b\xa1\x1b\x5e\x4f\x8d\xe7\xf0\x28\x32\x00\xbe\
+\x67\xde\x28\xc0\xde\xa1\x93\x33\xa7\x14\x12\x1b\x99\x6e\x35\xfb\
+\xf3\xa0\xa3\x76\xc8\x80\x60\x37\x2b\xcd\xbd\xb5\x5f\xa0\x1b\x23\
+\x2a\x08\xdd\xa0\xc0\x14\x3e\x4a\x2e\x1c\xd4\xe4\x83\x32\x5b\x2d\
+\xd1\x35\x01\x19\x4e\xe0\x13\xd0\x7a\x28\x59\x52\x44\x92\x04\x4d\
+\x2f\xa9\x14\x04\x90\x58\x01\x2a\x5b\xc5\x83\xa3\x91\x00\x40\x01\
+\xc8\x24\x6c\xfc\xea\x2a\x6f\xc6\x62\x40\x7e\xf7\xa1\xbc\x22\x04\
+\xd1\x42\x4a\x18\xbe\xb4\x67\x37\x10\x36\x2d\x62\xe6\xfb\xaa\x12\
+\x19\x8a\xb6\xcc\xf9\x17\xa1\x18\xe1\x8c\xc6\x39\x07\xf2\x8c\x0e\
+\x81\x32\x4a\x02\x55\xe0\x12\x81\x01\x04\x10\x55\x29\x33\x23\x16\
+\x80\x4c\x40\x0f\x5c\x1a\x33\xe5\x03\x05\x12\x4b\x28\x51\x38\xbe\
+\xf4\xf8\x63\x94\xc0\xf0\x82\x4a\x80\x50\x66\x40\x16\x00\xc6\xc0\
+\x00\x20\x80\x20\xfa\xc9\xa7\x21\x77\x48\xc4\x88\x94\x02\xc1\x18\
+\x3b\x66\x6e\x22\x1e\x6e\xc9\x0d\xdf\x36\x59\x9b\xdb\x25\x5d\x03\
+\x09\x06\xf0\x05\xc7\x31\x75\xb2\xa3\x08\xa5\x89\x2e\x44\x73\xca\
+\x9d\x62\x20\x64\x52\x41\x76\x05\xae\xda\xd6\x32\x91\x1e\x0b\x8f\
+\x3b\xba\x2c\x04\xc4\xc0\x89\xd3\x3b\x8e\xf6\xbd\x18\xd6\x01\x4b\
+\x8d\x9b\x16\xfa\x8a\x16\x1f\x20\x0d\x94\x1d\x86\x9e\x36\x9a\x47\
+\x83\x04\x10\x79\x23\xdb\x7c\xa2\x32\x20\x32\x20\x17\xc6\x97\xfa\
+\x54\xa9\x24\x19\x63\xd9\xe9\xf9\x39\x2d\x08\x4c\xae\x06\x04\x03\
+\x20\x00\x32\x48\x01\xd1\xf7\xba\x48\xa2\x89\x60\x12\x20\xc8\x21\
+\x04\x58\x97\x27\x66\x1b\x3e\x5c\x96\x33\x23\xbd\xe8\x8c\x82\xc9\
+\x32\x5f\x8f\x78\xa0\x1c\x8a\xc3\x03\xa2\xc7\x5f\x13\x4c\x6c\x82\
+\x40\x74\x88\xdc\x22\x52\x52\x48\x02\x50\x04\x8d\x19\xc8\xe1\x26\
+\x81\x0b\x08\x1d\x35\x3a\x9a\x00\x03\x0c\x34\x46\x57\xd7\xc5\x20\
+\xa7\x82\x48\x9c\xbd\x2e\xf5\x98\xf9\x2a\x03\x9c\x1b\xa4\x76\x7a\
+\x3f\x62\xf9\x88\xeb\x14\x08\xfa\x3e\x68\x23\x40\x37\x35\x81\xe9\
+\x1d\x32\x28\x29\x13\x63\x99\x23\x72\x37\xcc\x0b\xd0\x30\xa9\x80\
+\x29\xfb\x12\x45\xaa\x79\x02\x00\x4a\x13\xed\xd5\xfc\x2c\xd0\x0b\
+\x21\x60\xca\xe7\x4b\x51\x1d\x93\xd2\x29\x16\x18\xf1\xe0\xb9\xa5\
+\xe1\x04\xf4\x00\x56\x34\x8f\xaa\x40\xc2\x18\x40\x28\xdc\xfc\x4f\
+\x5d\xa8\x0c\xa0\x9f\x04\x0e\xf1\x3a\xd1\x96\xb4\x91\x6c\x10\x32\
+\x49\x6c\xe4\xba\x32\x00\x65\x2e\x17\x80\x33\x74\xc4\x0a\x40\x50\
+\x01\xdc\x29\xe8\xe7\xbd\xcb\xa5\x54\xf6\xb3\x4b\x45\xf4\xc5\x3d\
+\x02\x08\x76\xcd\x24\xe0\xf5\x0a\x86\xdc\x43\x0b\xed\x01\x29\x8f\
+\x4a\x23\xaf\x13\x40\x82\x0a\x12\xaf\xf3\x26\xee\x5c\xe1\xc0\xc0\
+\x8b\x63\xc6\x35\xe5\x8d\x69\x0a\x49\xcb\x91\x06\x20\x7a\x68\xb0\
+\x48\x40\x62\x0b\x3b\xbf\xba\x21\xf1\x8c\x00\xc9\x83\x0e\xd7\x9b\
+\x85\x4a\x03\x40\x46\x40\xc8\x09\x80\xd2\x17\xa2\xa3\x5b\x24\xc0\
+\x32\x30\x8c\xad\xbe\x6a\x0f\xc0\x01\x82\x4c\x84\x35\xf0\x0d\x02\
+\x9c\xd1\x40\x04\x1b\x00\xa2\x36\x72\x30\x62\x11\x14\x43\x9e\x41\
+\x00\x56\xdd\x39\xc5\x4d\x27\x05\x8b\x01\xfb\xfe\xa0\x48\x68\x99\
+\xce\x96\x06\xf8\xfb\xf2\x24\x41\x00\xbf\x32\x1a\x64\x06\x45\x9d\
+\x9c\x82\x45\xce\x30\xb2\x06\x00\x88\x86\x01\xdc\x5e\xd8\xab\xbb\
+\x12\xc8\x61\x6f\xd4\xfa\x5d\x16\x05\x9d\xe1\x03\x4f\x7c\xf2\x7a\
+\x51\x70\xe4\x43\x48\x99\x0c\x70\x3e\x68\x12\x69\x2c\x05\xdc\x20\
+\xe0\x06\x6e\xc1\x13\x0b\x51\xde\xf2\x04\x2f\x29\x24\x5c\x23\x80\
+\xd8\x0c\x1c\xe0\xa3\x40\xb9\x68\x86\xbf\xb4\x21\x30\x93\xd8\x06\
+\x4c\x86\x24\xfc\x07\x47\x59\x45\x04\x49\x70\x61\x30\x49\x0c\x63\
+\x2b\x74\x34\x24\x90\x60\x04\xe0\x1d\xce\xb4\x10\xe1\x08\x84\x98\
+\x25\x11\x8b\xdf\xb5\x38\x40\x4f\x27\x9d\xbe\x3a\xd1\x5b\x52\x41\
+\x24\x10\xd4\xc0\xdf\xfd\xa1\xfa\x9e\x10\xfa\xbc\x7f\xae\xa4\x61\
+\x44\x80\xcc\x16\x26\x05\xd1\x68\xe8\x2e\xc0\x6c\x15\x00\x24\x08\
+\x96\xa0\xdd\xb7\x14\xf8\x90\xc4\x0d\x09\x14\x86\x98\x82\x7b\x50\
+\x18\x5b\x70\x0b\x46\xc3\xa1\xbc\x5e\x80\x50\x49\xf6\x50\x47\x49\
+\x40\x1e\x68\xc4\x74\x12\x22\x05\x20\x12\xc0\x9e\x40\xde\xae\x68\
+\xd0\x12\xc2\x64\x13\x08\x12\x77\x22\xc2\x99\x62\x4c\x71\x01\xc6\
+\xfe\xec\x34\x21\x20\x98\x09\x04\x6e\xb3\x7f\xb5\x04\x91\x9e\x5e\
+\x40\x37\xec\x18\x04\xc0\xd4\x09\xc9\x58\x90\x7c\x5a\xd4\x01\x34\
+\x70\x09\x97\xe8\x54\x75\x80\x42\x38\x04\x17\x77\x3a\xdd\x4d\x42\
+\x04\x30\x80\x5c\x69\xcf\xed\x35\xc1\xb3\x08\xc0\xd4\x94\x02\x2d\
+\x5c\x98\x2d\x04\xd7\xf0\x4c\x00\x04\x06\xef\x38\x0a\x8f\x09\x94\
+\x5a\xff\x00\x1b\x3f\xf2\x8a\x01\x82\xe4\xbe\xbf\xeb\xa2\x16\x32\
+\xb2\x81\xd2\xf9\x64\x0b\xe9\x43\x40\x42\x02\x4a\x20\x82\x26\x45\
+\xf6\x3c\x1a\x20\x0a\x67\x3e\xa1\x6b\x41\x82\x09\x11\xd0\xbf\x07\
+\x0a\x87\xcb\x00\x8c\x49\x00\x68\x03\x89\x39\x80\xc9\xc0\x32\x45\
+\xae\x40\xc2\x67\x8e\xf3\xb5\x4b\x84\x0d\x48\x47\x24\xf5\xf5\x1a\
+\x10\xf1\x97\x33\x10\xfe\xbe\x2d\x42\x42\x02\x4e\x91\xe1\x07\x31\
+\xa5\xe9\xbb\x3d\x93\xa9\x86\xcf\x85\x79\xd6\x8f\xc3\x4b\x02\x05\
+\x22\xc0\x82\x05\x10\x22\x14\x18\x3f\x89\x01\x52\x28\x8d\x87\x36\
+\x1a\x50\xd5\x21\x54\x24\xc2\x43\x24\x01\x96\x80\xb0\x00\x5e\xc4\
+\x93\x01\x5c\x56\x24\x10\x04\x13\x19\xb9\x38\x99\x39\x49\x01\xf0\
+\x1f\xa1\x0a\xc1\x90\x69\x8b\x8f\x39\x27\xf6\xac\x60\x76\x81\xa8\
+\x9d\xe6\xee\x89\xd0\x8a\x74\x59\xc7\x28\x75\x74\x52\x23\x2b\x80\
+\x57\x8b\x7c\xf2\xe8\x08\x23\xbc\x80\x66\xf3\xfd\xb5\x00\x17\xc8\
+\x93\xc1\xfb\x9c\x5e\xe2\x8d\xaa\xc1\x2c\x06\x00\x0a\x4d\x8c\x5c\
+\x4a\x86\x89\xa3\x1a\xb2\x43\x92\x08\xa6\x2e\xc9\xeb\xb5\x10\x10\
+\x4c\xda\xe4\x0c\x3b\xa2\xbf\x94\x04\x41\x9c\x8d\x23\xf9\xcb\xbe\
+\x10\x92\x03\x63\x53\xe2\xfa\xba\x13\x44\x40\x95\x8a\x8e\x81\x1c\
+\x7c\xdc\x51\x3c\xd2\x8c\xac\x82\x2e\x6d\x3f\x04\xf0\xea\x66\x29\
+\x06\x33\xa0\x24\x28\xeb\x11\x4d\x98\x00\x90\x51\xc1\x00\x60\xc4\
+\x82\x72\x52\x61\xb0\xb5\x84\x18\xca\x25\xfd\xaf\x44\xa3\xc6\x81\
+\x01\x93\x28\x82\x92\x0c\xe0\x5c\xcb\xbc\x20\xdb\x00\x40\x13\xee\
+\xb3\x4e\x63\x30\x70\x6a\x35\xf7\x7a\x0f\x92\x14\x90\x43\x23\x86\
+\x8d\xb5\xee\x83\x26\x18\x32\x83\x8d\xff\x00\xdd\x68\x85\x00\x44\
+\xe0\xb0\x68\x98\x50\x34\x51\x8b\x69\x7a\x04\x60\x48\x1c\x0d\xc8\
+\xf8\x1e\x76\x97\xab\x52\x48\x21\x9e\xfd\x4f\x17\xa0\x0d\x46\x32\
+\x4c\x90\x49\x3e\x63\x8a\x9c\xe2\xdc\x21\xfc\xaa\x7c\x92\x20\x03\
+\x78\x3a\x90\x7e\x5d\x1c\x08\x4a\x00\x45\xd3\x04\xcb\x39\xce\x61\
+\x10\xd4\x01\x72\x04\x04\x89\x33\x71\xc3\x25\x00\x10\x07\xe6\x4c\
+\xce\xc1\x83\x6e\xfc\x6d\x34\x43\x26\x83\x12\x88\x07\x82\x68\x83\
+\x8a\x16\x48\xf6\xe1\x28\x4b\x7a\x9c\x8e\x04\x64\x20\xd6\x26\x43\
+\x17\xfe\xd2\xc0\x20\x92\x21\x19\x03\xe4\xf1\x15\x6b\x93\x5e\xc1\
+\x92\x4a\xc2\xc0\x51\x45\x1c\x0b\x24\x88\x10\xd0\x18\x24\x03\x26\
+\x6f\x46\xb3\x24\x31\x04\x95\xe8\x3c\xed\x40\x4e\x48\x33\x62\x55\
+\xb9\xcb\xa6\x91\x07\x7d\x0d\x29\x08\x12\x97\x46\x5f\x05\x8a\x19\
+\x72\x36\xb0\xeb\x4a\xdc\x10\xc0\x88\x7a\x75\xef\x23\x92\x19\xd4\
+\x07\xd7\x9a\x08\x00\x91\x33\x0a\x24\xa0\x7c\x71\x43\x2c\x8a\x98\
+\x98\x9c\xdb\xbc\x1b\x8a\x20\xb3\x12\xae\x35\x24\x4e\xb6\x74\xe0\
+\x41\x96\x06\x08\xcf\x65\xd6\x99\xa8\xe4\x66\x88\x98\x09\x25\xc1\
+\x20\xc6\x43\x0c\x19\xa3\xb6\x9c\x18\x16\x48\x9e\xce\x84\x82\x81\
+\x36\x2e\xfb\xed\x5f\xff\xc4\x00\x27\x11\x01\x00\x01\x03\x03\x03\
+\x05\x01\x01\x01\x01\x00\x00\x00\x00\x00\x01\x11\x00\x21\x31\x41\
+\x51\x61\x71\x81\x91\xa1\xb1\xc1\xd1\xf0\xe1\xf1\x10\x20\xff\xda\
+\x00\x08\x01\x02\x01\x01\x3f\x10\x22\x80\x18\x5b\x6b\x33\x1a\xe8\
+\xb4\x11\x18\xac\xed\xa8\x4f\x4f\x5e\xf5\x88\xf4\xef\x31\xec\x3b\
+\x69\x6a\x71\x16\x45\xe3\xf7\x6e\xc1\x50\x64\x9b\x3f\xa7\x55\xa0\
+\x0a\x58\x13\x78\xc5\x2e\x82\x5e\x48\xec\xfc\x94\x48\x13\x9b\x1f\
+\xdd\x22\xae\x11\xa4\x58\xcc\xe3\x13\x8b\x34\xd5\x18\x16\xfd\x66\
+\x6f\x87\xf7\x4f\xf8\xa2\xe4\x76\xa0\x6a\xef\x30\x66\x74\xfc\xd1\
+\x6d\xa2\x5b\x46\xfc\x71\xff\x00\x26\xc7\xef\xdf\x8a\xe2\x7f\x4f\
+\x1c\x34\x2d\x48\x1f\xde\x0d\x46\x89\x11\x31\x0c\xcf\x73\x9d\xf6\
+\xa6\x51\xb3\x31\x8e\xb2\x49\x15\x17\x9e\xbd\xd1\xbe\xd4\x0b\xf8\
+\x37\x9d\x4b\x7d\xd7\x73\xa7\x6f\xe1\xae\x29\x00\x99\x79\xf7\xd6\
+\xf3\x3b\xb4\x47\x7f\x54\xec\x94\x3b\x52\x60\x0b\xdc\xcc\xe9\xae\
+\xdd\xaa\x54\xdf\x3c\x61\x8c\x1e\x68\xd8\x27\xac\x4e\xae\xc7\xed\
+\xa8\x76\xea\xc6\x6f\x8c\x5b\x5a\x0b\x93\xd3\x1e\x95\x9e\xdb\x69\
+\xd6\x91\x30\x77\x8f\xe1\x8e\xb5\x36\x9e\xfd\x3b\xe3\xd6\x6a\x69\
+\x17\x6d\x06\x0c\xbf\xbe\x2b\x83\xd1\xe7\xe8\xf3\xc5\x0d\x2e\x39\
+\x93\x57\xf9\xe7\x8a\xbd\xa7\x7c\xfa\x28\x66\x05\xcc\xf8\xbf\xb3\
+\x52\xd8\xba\x75\x3a\xfa\x59\x73\xf7\x51\xdc\x04\x4a\x3b\x5f\x1d\
+\x69\xe6\x22\x4a\x90\x73\x7f\xba\x84\x87\xbf\x33\xf2\x77\x9a\x1a\
+\x42\x36\x59\xb9\x32\xf3\xdf\x1a\x56\x00\x33\x30\x36\xd7\x1e\xf8\
+\xa1\x70\x26\xa8\x93\x62\xd1\xf8\xcf\x7a\x01\x00\xf5\x47\xdf\xbd\
+\x0a\xa0\x18\xbd\xad\x0f\xf7\x88\xa6\x4b\x48\xd1\x2f\xa3\xf3\x1e\
+\x39\xa1\x0d\x88\x99\x17\x1d\x9f\xaa\x26\x75\x9b\x5f\x5f\xf5\xda\
+\x90\x20\xb4\xeb\x3f\xb6\xbe\x68\x0c\xc8\xdf\x4e\xc7\xdd\x2f\x23\
+\x28\xc4\x78\x7e\x8f\x34\x3c\xa1\xdb\x9e\xed\xdf\x35\x18\x4c\x8c\
+\x33\x1d\xfd\xd6\xac\x30\x8e\x79\x99\xf9\x8b\x7b\xd2\x48\x22\xf8\
+\x33\x6d\xa3\x4b\x7f\xb5\x14\xf8\x3a\xdd\xfc\xd0\x04\x4a\x62\xd0\
+\x13\xcf\x27\xed\x2b\x46\x49\xde\xd1\xed\x72\xf4\xb3\x72\x43\x09\
+\x3b\x9b\x7e\x8e\x68\xb1\x31\x92\xdc\x94\x4e\x85\x05\x98\xd1\xa6\
+\x35\xb7\xc5\x39\x82\xc7\x0c\xf4\xf1\x62\xf3\x51\x6e\x91\x03\xa6\
+\xfb\xd0\x32\x43\x98\x5e\xf7\x8a\x30\x83\x6c\xc3\x7e\x27\x5b\x4f\
+\xd5\x40\x83\x9d\xf5\xc6\xda\x7f\xb4\x8b\x61\x2d\xad\xa4\xfc\xd1\
+\xb3\xfd\x82\x7c\xd3\x04\x85\x82\xcd\xf7\x9e\x73\xb5\xa9\xdc\x45\
+\x99\xb3\xaf\x47\x2e\x9a\xd3\x2c\x21\x73\x07\x56\x31\xd6\xf3\xf5\
+\x48\xa9\x3a\xfa\x77\x6c\xf9\xe2\xbd\x62\x71\x7d\xb5\xd8\x9e\x26\
+\xa6\x94\x41\xab\x0b\xae\xdd\x5a\x58\x42\x6f\x6f\x3a\xf7\x1f\x4a\
+\x04\x9b\xa7\xde\xdf\xd7\x15\x1e\xc2\x6f\x8c\x97\xfb\x7d\x28\x8f\
+\x3a\xae\x33\xa7\xa6\x4e\xf4\xd8\xcf\x6a\x95\xc9\xae\x5b\x63\xad\
+\x75\xf9\x7f\x6a\xfa\xfa\x30\xdf\xde\x8e\x74\xd3\x69\x8c\xb3\xd3\
+\xc5\x21\x22\xfb\xf4\x8d\x2f\x4e\x60\xf5\x9b\xcb\x7d\xfd\xea\xff\
+\x00\x61\x22\xd6\xde\x0e\x9f\xaf\x4c\x5f\xa1\xab\x6b\x7e\xbd\x07\
+\x3a\x2c\xc7\x7f\x6b\x78\xe6\xaf\x73\xd0\x6c\xdd\xfd\xad\x24\x93\
+\x8b\xdf\x7b\x17\xfe\x51\x87\x2b\xdf\x98\xb7\x96\x80\x44\x4c\x3e\
+\xd7\xbf\x3d\x31\x74\x8a\xb3\x8e\xd1\x3e\x2d\xcd\x30\x9b\x0a\xfb\
+\x7f\x69\x44\x6c\x5f\xae\x63\x4d\x26\xa3\x0a\x46\xd1\xc9\xb4\xf9\
+\x68\xc9\x08\x92\xdf\xa3\x57\x4d\xf5\xab\xe1\x0d\x56\xd3\x3e\x5f\
+\xaa\xbb\x02\x1b\x30\x9a\xc4\x6f\xe9\x18\x8c\xd7\x65\x07\xca\xdf\
+\xfa\x76\xa2\x8d\xcd\x66\xf7\xd7\x97\x6a\x68\x19\x99\x9f\x2c\x66\
+\x6a\x4d\x4f\x33\x89\x70\x40\x5a\x94\x86\xf3\xe9\x6a\x4b\x61\xc4\
+\x71\xb8\xfb\x50\x40\x2d\x9b\x37\xe6\xda\xb4\xc9\x37\x4f\x7d\x63\
+\xdf\x7a\x00\x80\xb9\xb5\xe2\x13\x0f\x16\xae\x3d\xfd\x7f\x1d\xaa\
+\x4d\x86\xb9\xcc\x5f\xe2\xb1\x28\x32\xec\xdd\xd7\xd8\xe6\xa7\x26\
+\x7d\x71\x8b\x3d\xb1\xad\x1d\x08\xba\x73\x24\xfd\xb3\x3c\x7a\xe3\
+\xd3\xfe\xc5\x26\xad\x35\x60\x8d\x78\x63\x11\xcd\x4d\xa6\x7c\xba\
+\x63\xfb\x56\x0d\x6e\x72\x46\x23\x68\xf9\x6a\x19\x82\x11\x33\x1b\
+\x79\xa8\xf9\x26\x20\x66\x2e\xf9\xc7\x1f\x74\x72\x71\x36\xc2\x6f\
+\x17\x63\xf3\x52\x0c\x86\x8c\x43\x77\x23\xf1\xbd\x2c\x9f\x60\xe4\
+\x3e\xf9\xa9\x93\x59\x5d\x66\xe4\x4a\x79\xe2\x92\x00\xbc\x41\x7d\
+\x6b\x0c\x03\xe4\xbf\xa7\x98\xac\x32\xad\xc5\xf3\x17\x9d\xef\x4c\
+\xcc\x92\xcc\x21\xe2\xce\x3f\xdd\x28\x88\x49\x73\x22\xd3\x7c\xfd\
+\xe9\xd6\x52\x08\x80\x10\x8c\x97\xe7\x7f\x5d\x6c\x43\x40\xcc\x1f\
+\x8f\xd6\x9d\x68\xb0\x01\xca\x4c\x92\x11\x1a\x13\xad\x23\xc4\x88\
+\x4a\xfa\x7b\xd3\x42\x90\x51\x3c\x2f\x6b\x7e\xd2\xae\xd6\x91\x93\
+\x9b\xeb\x1f\xda\x48\x30\x88\x5b\x98\x9b\xf0\xef\xac\x6d\x47\x21\
+\x08\xc9\x73\xcf\x7b\xef\x50\x02\x20\xd6\xc4\x42\x4b\xe9\x2d\xb5\
+\xfa\x28\xd6\x30\xa6\x9d\x5b\x3b\xcf\x34\xbe\x94\x08\x49\xba\x02\
+\x37\x5b\x5e\xde\x18\x80\xa2\x10\xdd\x13\x06\xf4\x61\xec\xca\x0c\
+\x2c\xa3\x3c\xba\x76\x9a\x89\x31\x5b\x82\xb1\x3f\xef\xcf\x02\x2f\
+\x16\x8c\xf5\x63\xf9\xeb\x34\xd4\x4b\x38\xf3\x2c\xf3\x50\x84\xe6\
+\x56\x34\xcb\x78\xcc\xfe\xe2\x8b\x00\xd7\x47\x4d\x34\xda\x9b\x61\
+\x9e\x35\x56\x34\xe6\x96\x94\xed\x0c\xcc\x91\x6d\xfd\x38\xa7\xd0\
+\xee\x38\x1e\x76\xed\x53\x8a\x12\xba\xbf\xbf\x9e\x94\x89\xb9\xd0\
+\xd6\xfc\xe8\xe3\x4a\x2b\x02\x50\x5b\x58\x89\xfd\xb1\x42\x20\x33\
+\x19\xc1\xea\xf9\xd2\x88\xc4\x24\xd6\xce\xfe\x71\xad\x18\xb0\x33\
+\xa7\x0f\xb6\x39\xcd\x46\xfa\xf1\xca\xee\xe9\x83\x7e\xf5\xb3\x8d\
+\x76\xcd\xb6\x73\x53\x38\xf9\xd7\x9e\x6b\xbe\xfb\xdf\xdc\x8e\x94\
+\xca\x4e\x73\xd2\xf3\xda\x34\xfa\xa2\xd1\x1b\x68\xe9\x9b\x78\xa4\
+\x58\xb3\x6c\x5a\x77\xd7\x42\xa5\x89\xc4\xfa\x7c\x8a\xbc\x05\x48\
+\x22\x66\xf7\x23\x2c\x71\x4b\x5f\x4d\x51\xfe\x7b\xd0\x85\x04\x33\
+\x31\xb3\xc6\xe8\xef\xc5\x20\x9a\x32\x26\xf7\x61\x8c\x48\x31\x31\
+\x20\xc6\x18\x12\x00\x32\x2b\x22\x44\xc6\xbd\xf6\xf8\x83\x1e\xbd\
+\xb3\x7f\x14\xb2\x2e\x35\xd7\xbd\xea\xeb\x9b\xf1\x8d\x70\x38\xbd\
+\x0d\xbc\x44\x5f\x6e\xff\x00\xd2\xf4\x72\x5b\x7e\x7b\xf1\x51\x22\
+\x32\x07\x2b\xa3\x63\x7a\x84\x3c\x92\x35\x07\x58\xef\x66\x6d\x6d\
+\xc4\x11\x85\x2d\x80\x8b\xe2\x71\xd2\xa6\xe2\x63\x3c\xa1\xcf\xed\
+\xf1\x8a\xc1\x96\x08\x8d\x1c\xe3\x3e\xd1\x49\x84\xdd\x25\xe7\xbf\
+\x19\xa0\x12\x71\x63\x1d\x39\x3c\x4f\x34\x6d\x56\xc6\x38\xce\xf0\
+\x6b\x46\xdc\x82\xf7\x36\xce\x50\xc7\xad\x4e\x12\x11\xc7\x37\x8c\
+\x6d\xf9\xa9\xbd\x98\xf2\x75\xee\xea\x7b\xe2\x9c\x52\x98\x9b\x67\
+\x3a\x53\xc1\x0b\x3d\x5e\x7a\x94\x35\x82\x17\x07\x5e\x37\x1a\x05\
+\x82\x05\xf8\x71\xd6\xa3\x56\x86\xd2\x24\x86\x6f\xf9\xe4\xa3\xd3\
+\x43\xc6\x6d\x9e\xbe\x76\xa7\x4d\x91\x2c\xc7\x7e\x9f\x74\x81\xcb\
+\x5b\xdd\xeb\xeb\x34\xb0\x08\x6d\xd8\xbf\x49\xd7\x6d\x4d\x74\xa4\
+\x69\x1f\x1a\x7d\x34\x24\x88\xb5\x34\xc3\xeb\xec\x50\x31\xd4\x33\
+\x9e\x86\xad\x1d\x84\xc6\x98\x2f\x1e\xd1\xfa\x2a\x68\x2f\xfe\xfc\
+\x07\x7a\x14\x96\x26\xf9\xb5\xe3\x36\xe3\xa5\x66\xa3\x96\x0e\x89\
+\xa6\xad\xf3\x4a\x00\xd8\x16\x58\x7d\x0c\xeb\x40\xd0\x91\x03\x03\
+\x8b\xa7\xa3\x7b\x6f\xaa\xf0\x0c\xb3\x8f\xc4\x8f\xb5\x63\xc1\x00\
+\x04\x89\x97\x24\x7e\xed\x50\x1b\x88\x02\x48\x16\x32\x41\x28\x28\
+\x36\x40\x81\x26\xc3\x92\x11\x23\x87\xb7\xad\x1a\x66\x21\x28\xda\
+\xef\x6d\x3a\xf1\x40\x21\x99\x9c\xf0\x50\x07\x13\x1c\x04\x2e\xdd\
+\x2a\x16\x67\xbf\xd8\xd0\x08\x88\xc9\x19\x6c\x6f\x31\x35\x28\x91\
+\xd8\xc4\xcc\xf9\xd2\x63\xbc\x50\x2c\x44\xb0\x9c\xea\x7e\xd6\xfc\
+\x51\x2c\xa6\xe5\xb2\xf8\x8f\x8b\xd0\xef\x64\xbd\x8d\xa4\x67\x17\
+\xf6\x6d\x48\xc0\x31\x16\x46\x0d\x67\xdf\x4e\xf4\x03\x65\x4d\x63\
+\x26\xdd\x7f\x1b\x19\x63\xd7\x38\x9d\xba\x3f\xe5\xe7\x65\x08\xdc\
+\x59\xb5\xf5\xf9\x2a\x23\x26\x71\x2e\xcb\x9f\x1f\x18\xa1\xbe\x2f\
+\xb5\xbc\x09\x99\xa6\x12\x60\x33\x68\xb5\xed\x1f\xbb\x50\x8d\x94\
+\xed\xf1\x0e\xc5\xf9\xcf\x02\xb0\xc1\xb4\xdb\x33\xed\xbb\xe2\xa0\
+\x73\x9e\x63\x50\xb4\x6b\xb4\xd0\x04\x38\x71\xdd\xcf\x7a\x68\x49\
+\xba\x44\xbb\x8f\xbf\x6a\x02\xeb\x66\xf7\xf8\x98\xbc\x54\x89\x56\
+\xe5\x7e\x4a\x80\xc0\x91\x7b\x6e\xf3\x68\xc5\x5f\xdc\x8e\xa4\xe6\
+\x77\xfb\x79\xa2\x58\x86\x39\x38\x86\x85\x08\x20\x72\xf5\x79\xe1\
+\xa1\x1a\x4c\x18\x81\xf5\xd2\xfe\xb3\x4b\xe1\xcb\x1a\x72\xdf\xc4\
+\xe6\x8a\x82\x08\x91\x16\xd5\x74\x9d\x1f\x5e\xd4\x88\x72\x18\x12\
+\x77\x4e\x77\x9d\x23\x9a\xc5\x94\x95\x48\xbb\x3a\xf5\xe3\xe2\x84\
+\x5b\xd3\x65\xf9\x1a\x3b\x0e\xb1\xd7\xdd\xb7\xae\x2b\xe2\xf6\x68\
+\xdd\x17\x08\xe1\xcc\x53\x0b\x92\x56\x2d\xfc\x8e\xb8\x86\x92\xc7\
+\x48\x47\x47\xb7\xb7\xad\x7b\xcf\x6a\x04\x2f\xd9\xa7\x4f\x87\xf2\
+\xac\xfb\x70\xdf\x84\x76\xac\x1a\xe4\x71\xd7\x92\xfb\x52\xe3\x11\
+\x01\xdd\x6d\x3d\xe3\xe6\xa7\xbd\x91\xce\xd3\xbb\x50\x93\x88\x47\
+\x5c\xc9\x7f\x3d\x3d\xa8\x85\x65\x96\x40\xd7\xf7\xeb\xb5\xa9\x45\
+\xbf\xf3\xf5\xfd\x15\x6c\x67\x6e\x4b\x06\xd9\xab\xf1\x75\xf6\x71\
+\x77\x6a\x2b\x56\xb6\x7b\xb3\xef\x49\x22\xdb\xcc\x9d\x62\xa3\x45\
+\x96\x22\x5c\xde\xff\x00\xb5\xab\x0d\x9b\x99\xcc\xe8\x3f\xed\x05\
+\xc4\x30\xb9\x1a\x67\xcf\x4d\x62\x92\xb9\x39\x31\xeb\x6b\x37\xb5\
+\xce\xd4\xaa\x01\x13\x28\xcc\x69\x7f\x36\x7f\xb5\x3e\x84\xbf\x98\
+\x9b\x7b\xd0\x8b\x23\x06\x49\xdf\xdf\x3a\x76\xa5\x08\x01\x38\x77\
+\x96\xfb\xfc\x77\x88\x66\xeb\xe7\x49\xb0\xfe\x35\x9a\x65\x26\x48\
+\xf5\x5f\xaa\x11\x9b\x17\xf8\x7e\x69\x58\xed\x62\x2f\x31\xdb\xb9\
+\xe2\x6a\x12\xa2\x20\x18\x53\xc6\x3e\xba\xde\x8c\x56\x7e\xb0\xc6\
+\xb1\xeb\xfc\x9a\xbc\x20\x84\x2e\xeb\x37\xd2\xf6\xf3\x5b\x28\xa1\
+\xe7\x09\xeb\xaf\xcd\x4b\x24\x18\x5d\xee\xb6\xf6\xe7\x5e\x32\x7a\
+\x93\xfd\xfc\xd2\xa5\xaa\xcc\xfa\x3f\x9a\x21\x9d\xa3\xbc\xfd\x14\
+\x12\x20\x1d\x4c\x91\x0d\xbc\xde\xb2\x6a\x31\x1d\x3d\x6c\xf5\xb5\
+\x40\xe0\x56\x52\xc7\x55\x17\x70\x03\x9b\x4d\xed\xf2\xd3\x60\x96\
+\xba\x19\x8c\xfc\xcd\x0a\xc4\x42\x63\x49\xb9\xad\xbf\xca\x8a\x43\
+\x64\x8c\x41\x24\xae\xf0\x7e\xb5\x31\x82\x10\x97\x38\xb1\xe9\x6d\
+\x3c\xc5\x31\x4c\x99\x33\x96\x1f\x4a\x20\x22\xaf\x9d\xcf\xb7\xfc\
+\xa1\xc8\xdc\xc6\xb7\x8d\xbe\xdd\x23\x34\x16\xd2\x1f\x3d\x79\xcf\
+\x6e\x94\x04\xc0\x4e\x0d\x59\xc6\xf1\xfa\xd4\xc9\x5b\xae\x49\x8e\
+\xbc\x4d\xf6\xc4\xd3\x5c\x59\xbf\x36\xb7\x51\x73\x56\xd8\x4f\xc9\
+\xbf\x35\xa2\xf9\xdf\xbd\xb7\xa3\x01\x0e\x0e\x7d\xe0\xbe\xb4\x58\
+\x40\x74\x48\xb7\x72\xf8\x9a\x6e\xaa\x12\x99\x5d\x6c\x67\xf5\xeb\
+\x60\x6e\x9f\x47\xb5\x0b\x24\x7c\x6c\xfe\xdb\x7a\x29\xb3\x5e\xba\
+\xde\x09\x3f\x76\xa0\x1a\x11\xce\xb6\x7a\x7e\x7b\xd4\xc1\xc4\xaf\
+\xbb\x86\xd8\x8c\x6d\x4b\x22\x27\x06\x2d\xc7\xf9\x6b\xd7\xb0\xf7\
+\xa2\x82\xde\xd3\x8c\xe0\xa2\x0e\x02\x65\xbe\x75\xcd\x12\xd0\xa8\
+\x44\x24\x6a\x3a\xda\x7d\x34\xd2\xa3\x20\x8c\xbd\x6c\xbc\x63\x3e\
+\x94\x31\x14\x65\x88\xda\x52\xdb\x91\x1c\x97\xa8\xba\xd8\x11\xa9\
+\x7b\x7b\x7d\x56\x27\x8c\xe4\x7f\x2d\x7a\xc5\x46\x1e\xfe\xf5\xaa\
+\x9a\xc2\xdb\x67\x4a\x8c\xc4\x91\x0f\x63\x18\x72\xd2\xac\xec\x44\
+\x17\xe6\x3a\x53\xf1\x40\xba\x6c\x67\x7f\x9d\x34\xa1\xd2\x11\x17\
+\x9d\x5f\xdc\xed\x35\x84\x89\x34\xd3\x3a\x6e\xbd\xca\x1c\x02\x57\
+\x7b\x81\xfd\x8b\x7b\x49\x42\x1b\x66\xc5\x97\xa6\xff\x00\xda\x37\
+\x46\xc7\xa5\xe7\xfc\xbe\xf5\x20\x3a\xfe\x78\xa3\x20\x27\x3e\xfd\
+\x3d\x28\x72\x90\x88\xda\x0e\x79\xd4\xcf\x9a\x71\x50\x8d\x8e\x15\
+\xf9\xed\x6c\x5e\x91\x80\xf2\xb9\x7a\xfc\x7e\x82\x6b\x12\x36\xc5\
+\xf7\x9c\x7e\xd6\x8a\x47\x2f\xbb\xd7\x72\xa2\xc1\x3e\xb6\xf4\xfd\
+\x19\xa0\x2c\x1e\xb7\xe4\xd0\xd6\xde\x39\xa9\xe4\xce\xb7\x7b\xee\
+\x1b\xd4\x5c\x82\x8b\xda\x6c\xce\x47\xb7\x4e\x28\xa4\x49\x6f\xf5\
+\xfb\xee\xa0\xa2\x86\x61\xab\xf8\xe7\x4f\x4a\x0c\x2a\x12\xd9\xdc\
+\xb7\x36\xa8\x84\x37\xb7\xd9\x22\x36\xc6\x7e\x73\x49\xde\x5a\xc3\
+\xa8\xc4\x1e\x6a\x7c\x41\xa0\xfb\xcd\xe3\xf6\xd4\x21\x1a\xb3\x3f\
+\xb9\x7c\xd3\xee\x3c\x5e\x0f\xd7\xa0\x72\x6d\xa4\xdb\x2f\xee\xf4\
+\xf3\x22\x33\x9d\x2f\x56\xd3\x33\x3d\x7a\xfb\x7d\xd2\xa1\x56\xd7\
+\x1b\x23\x53\xae\xf4\x8a\x49\x13\x17\x86\x08\xce\x6c\x69\x25\x1b\
+\x40\xa2\x11\x04\x9b\xb8\xd2\x9a\x01\x6e\xdd\x7e\x5a\xb8\x84\x26\
+\xf8\x86\x99\x19\x0f\xf0\x93\x7c\x4f\xa7\x35\x79\x83\x6f\xde\x0a\
+\x75\x96\xd3\x7f\x0f\xce\xb5\x6e\x49\x4c\xeb\x2b\x48\xd5\xdf\x58\
+\x38\xa2\xcd\xb2\xc1\x25\x9c\xf6\xd7\xb6\x8d\x3a\x13\x68\x26\xd9\
+\xbd\xb8\x27\xe1\x8a\x52\x30\xd6\xe4\x6c\x9c\xed\x36\xe9\x4c\xf4\
+\x60\x89\x43\x4b\xc6\x6c\x5a\x91\x23\x89\x03\x8b\x6d\xc1\xfc\xa2\
+\x2b\xa5\x59\x75\xb7\xf6\xaf\x93\x2b\xfc\x29\xe1\x09\x5c\x72\x42\
+\x4e\xd3\xbf\x7e\x35\x82\xa3\xa3\x2f\x07\x4f\x34\xac\x84\x13\x0a\
+\x52\x85\xdc\x13\xc5\x41\x02\x43\x77\x27\xc7\xf9\x4c\xf2\x09\x95\
+\x1c\x5f\xf6\xbb\xd0\x52\x84\x89\x08\x8b\x75\xf7\xa4\x38\x49\x33\
+\x6b\x3a\xf5\xd7\xb3\x4b\x0d\x93\x78\x88\xb8\x68\xfc\xf5\xa6\x61\
+\x43\xc4\x17\xd7\x5e\x28\x19\x74\xb6\x67\x7f\x19\xeb\x40\x0c\x06\
+\x75\xfe\xf5\xe2\x93\x03\x22\x22\x06\xd3\xb4\xe1\xfd\x35\x6c\xc4\
+\xf4\x3d\x6d\xa5\xb3\xcd\xb1\x50\x1e\x00\x30\x9c\xfd\x46\xe9\x53\
+\x52\x36\x92\x33\x2b\xfb\xad\x5c\x6d\x6f\x8f\x6c\x79\xff\x00\x99\
+\xbb\x7b\x95\xf8\xee\xd1\x47\xac\x45\x06\x0a\xb3\xac\xdb\x2f\xcf\
+\xce\xb4\xe1\x10\x1a\x3c\x87\xeb\xf7\xa8\x72\x50\x5d\x3f\x08\xf6\
+\xe6\xa2\xf8\x60\xa6\x9b\x26\xe6\xcf\x07\x5a\xeb\xf2\xfe\xd5\xcd\
+\xce\xd7\x76\xdd\xa8\x86\xf3\x1a\xfc\xe2\xf1\x3d\xe6\xad\xb9\x99\
+\xcf\x9b\x7b\xb6\xd4\xa1\xcd\xa0\x9d\xad\xa5\x2d\xc0\xba\x76\x7a\
+\x7b\x34\xe6\x4a\x59\x05\xec\x7e\xdf\x35\x61\x4b\x9b\x58\x96\x34\
+\x3c\xfc\xd3\x59\xb8\x3a\x9f\x67\x8e\xb5\x61\x3a\xee\xd9\x1b\x34\
+\x0d\x36\x61\xb7\x4b\xed\xb5\xea\x42\x35\x59\x77\xcf\x16\x9b\xd7\
+\xbc\xf7\xa2\x81\xb5\xb2\xe3\x45\x4d\x02\xf3\xdc\xc7\x36\x86\xe9\
+\x89\xcc\xe1\xf9\x3d\xe3\x37\xa4\x22\x85\xd3\x48\xce\xb9\xdf\xd3\
+\x9a\x2c\x63\x22\x55\xb4\x6a\x71\x52\xa1\x96\x75\x39\xfd\x99\xa8\
+\x30\x30\xb0\xdf\x12\x7c\x1e\x69\xe3\x98\x5a\x71\x0e\x2a\x4c\xb7\
+\xeb\x32\x67\x3b\x54\x58\x09\xa4\x04\xd8\xd2\x69\x40\xef\x57\x39\
+\xda\x31\xf7\x57\x8b\x4a\xcc\xc7\x72\x2f\x4e\x8c\x73\x48\x01\x0b\
+\x9c\xc6\x3d\xaf\x9a\x77\x22\x96\x62\x3b\x36\xfd\xe2\xaf\x8a\xf9\
+\xcc\xb3\x8d\xf3\xc5\x47\x33\x29\xde\xd0\xe7\xf7\xc5\x15\x61\x53\
+\xf1\xac\x73\x4d\x69\x32\xf8\xcb\xaf\x6a\x22\x24\x79\xde\xd8\xef\
+\x53\xa2\x61\x16\x4e\x57\x13\xa6\x6a\x44\xc1\x1a\xa3\xef\x6e\x9f\
+\xae\xb6\xc2\x70\xe6\x0d\x0d\xf7\xa7\x35\x39\x7e\xbf\xda\x60\xcd\
+\xf0\x68\xc9\xb7\x4a\x4b\x70\xb6\x9b\xe6\x80\xb1\xfa\x5f\x8a\x40\
+\x78\x3d\xc7\xf6\xb5\x38\x4c\x10\xa7\xa7\xd5\xbd\x66\x86\xaa\xf6\
+\x1b\x39\xc7\x4a\x9b\x73\x0d\xcc\x36\xb9\xa4\xd4\xe0\xb2\x94\x0d\
+\xb3\xfb\x1b\xf7\xac\xc2\x35\x86\xec\xf1\xdb\x1c\x53\x8b\xc2\x80\
+\xb4\x11\xbb\xb1\xc7\x6a\x77\x12\xa1\x84\x9c\x03\x49\xfd\x8a\x90\
+\x02\x2e\x0c\x33\x17\x37\xd8\xd6\xa1\x94\x43\x31\x24\x32\xdf\x1f\
+\xad\x4a\x13\x16\xfc\xf6\xf5\xa5\x2d\x41\x52\x26\x57\x5f\x1a\x34\
+\xe9\x44\x21\x76\xf8\x1c\xdc\xf5\xd7\xb5\x14\x61\x82\xeb\xc4\xc7\
+\xaf\x7f\x5a\x73\x37\x00\x5e\xfb\x3a\xcd\x86\x39\xf0\xd3\xa9\x99\
+\xd9\x7a\x9f\x7f\xd1\x4c\xbe\x5c\x72\x7b\x4f\xd5\x1c\x24\xa4\xdf\
+\xb7\xcb\x37\x4c\x66\xb5\xd3\xb4\x67\x4d\x8d\xe9\x85\x8e\x88\xd3\
+\xf1\x52\x79\xe7\x5f\x9f\x7c\x76\xb5\x44\x18\x58\xfd\x9d\x6c\x71\
+\x6a\x42\x48\x71\x9c\x3f\xbc\x56\xbd\x3b\x13\xbe\xb3\x9e\x0f\x34\
+\x5a\xef\xc6\x32\xfe\xd2\x8f\x42\x7e\x3b\x7a\xcd\x59\x5c\x4b\xdb\
+\x2f\x1d\xed\x49\x31\x22\xe2\x8b\x4c\x22\x78\xf3\x0f\xfb\x78\xd2\
+\x90\x25\x86\x5c\x98\xf1\x53\x16\xe7\x04\x4b\x73\x6e\xef\x14\x20\
+\x55\x82\x4c\xee\x6f\xed\xcf\xfc\x8b\xf3\xf0\xd6\xae\xdf\x35\x9f\
+\xbf\xb3\x58\xf4\x1e\xcd\x38\x4e\x5f\x6a\x83\x3e\x9d\xf1\x7f\x35\
+\x1a\x73\x7d\xb3\xc3\x7a\x89\x34\x95\xb4\x66\x6f\x1d\xa8\xa2\xa4\
+\x2e\x62\xf0\x74\x63\xe2\x80\xb2\x19\x5b\x42\xeb\x68\xd2\x7d\x66\
+\x84\x87\x8c\xe3\x45\xfe\xfd\x15\x79\x7d\xdc\x75\xbe\x3b\x54\xac\
+\x26\x71\xfd\xaf\xd7\x7a\xa8\x13\xbb\xda\x87\x4d\xeb\xcb\xe6\x3d\
+\x69\x46\x07\xf7\x83\xeb\x1c\x56\xcd\x8b\xda\xda\xf4\xbd\x3c\x04\
+\xa4\x91\x73\x4d\xbd\x2a\x78\x94\x4b\x82\xfa\xce\xbc\x3a\x7c\x54\
+\x29\xdd\x73\x8d\xdb\xce\xef\x6d\x2a\x67\x15\x32\xde\xe1\xbc\xe3\
+\xf6\xd5\x9f\x4f\x24\x63\x6e\xb0\xf6\xa3\x14\x20\xc4\x91\x8f\x34\
+\xfc\xa4\x59\xc7\x7d\xe7\x6a\xb1\xf7\x70\x8b\x2c\xcc\x71\x42\xd1\
+\x67\x71\x7b\xd9\xd0\xbc\x62\xac\xef\x2e\x05\xd7\x25\xac\x6d\xb5\
+\x15\x85\xd3\x81\x1b\xa7\xcf\x4d\xaa\x09\x51\x2d\xcc\xf5\xd7\x6d\
+\xbf\xa0\xb2\x3d\xeb\x1e\xd4\x01\x5a\x73\x79\xb2\xfd\xb4\x39\x27\
+\x31\xae\xec\x99\xd6\x3b\x52\xb8\x81\x62\xe4\x4d\xaf\xd7\xea\xa6\
+\x89\x79\x9c\xb8\xfd\x35\x20\x95\x14\x21\x21\xfb\x87\xb5\x22\xe8\
+\xa1\x18\x84\xc2\x16\xf0\xaf\x1b\x55\xda\xb0\xcb\xa3\x6b\x85\xef\
+\x73\x8a\x83\x02\x1d\xf8\x62\x91\xa0\x1e\x3a\xa4\x7e\xde\xb1\xe8\
+\x3d\x9a\x68\xb3\x33\xfb\xeb\xbd\x38\x89\xd5\x88\x8c\xe9\xc9\x6f\
+\x5a\x0a\x14\x48\x0c\x43\x2d\xf4\xd3\x3f\xc2\x81\xcc\xd8\xf7\x91\
+\x5f\x9f\x3c\x52\x0c\x08\x97\x39\x1e\xda\xd3\x12\xae\xb2\xeb\xa4\
+\x5b\x0b\xac\xd4\xaa\xb0\x93\x17\x23\x6d\x0d\x99\xf4\xa9\x51\x5a\
+\x50\x58\x77\xce\x77\xff\x00\x29\x94\xbe\xf3\x40\x94\x8c\x19\xeb\
+\x2f\xdf\x15\x18\xc5\x60\xb8\xe1\xb5\xbf\x93\x8d\x66\x8e\x08\xcb\
+\xad\x99\x88\x8c\x44\xbf\x35\x0d\x13\x22\x65\xc6\x5c\x77\x70\x69\
+\x57\x25\x6c\xc9\x7f\xf5\xe7\xc5\x17\x51\x6c\x02\x0c\xcc\xdb\x8c\
+\xed\xeb\x3a\xc1\x7d\xa6\xdf\x86\x9e\xcb\x17\x5f\x7b\x7e\xc9\x50\
+\xc2\x1d\xdb\x6f\x3e\xfa\x15\xd7\xe5\xfd\xa8\x70\x32\x7f\x73\xa4\
+\xd2\xd2\xc4\x6e\xfb\xe3\x7a\x9d\x0c\x44\x6a\x5a\x5b\xea\xd6\x56\
+\x66\x71\x77\x26\x73\xb1\x56\x62\xf5\xbc\x69\x6e\xba\xda\xa3\xa7\
+\x3e\xb1\x27\xa7\xae\x29\xc5\x23\xe3\x97\x1d\x06\x98\xde\x2f\x6b\
+\x44\xef\xf5\x4b\x95\xb9\xc7\x26\xdb\x2d\x18\xc2\xfb\x87\x7b\xc3\
+\xcf\xa6\x29\x56\x36\x3d\x99\x35\xe9\xfb\x5d\x1d\xfe\x28\xa0\xca\
+\x61\xe7\xf3\x44\xeb\x60\xac\x69\xbf\x5f\x4a\x18\x5b\x99\x9e\xb7\
+\xb6\xfa\x56\x1e\xfe\xf5\xf8\xee\xac\x7a\x0f\x66\x8c\x0b\x5d\xd7\
+\x1b\xd7\xf4\xda\xf6\x8c\xf5\xb5\x32\xc7\x42\x27\x91\x88\xef\x3d\
+\xab\x1f\xea\xea\x40\x97\x13\xee\x45\x20\x35\xc2\x3d\xfa\x73\x8b\
+\x7d\x5f\x13\x09\x26\x40\xb3\xd3\xdd\xac\xda\xd2\xeb\x6b\xc9\xbb\
+\x8a\x8a\x59\x3c\xe8\x4a\x7e\x6b\x75\xe3\xbd\xc7\xe2\x71\x40\xb7\
+\xc6\xbe\x9d\x32\xc1\x9d\x2d\x76\x85\x09\x12\x2f\xcf\xfb\x79\xf3\
+\xb8\xd6\x66\xeb\x72\xfe\xef\x3d\x2a\xea\xd1\x66\x3a\x38\xbf\x6c\
+\x6b\x8b\x50\x31\x61\xbc\xe9\x2b\xa5\xa8\x3c\x08\x8f\x69\xb7\x58\
+\x1e\x7d\x29\x24\xa4\xb7\x95\x8c\x4f\xe9\xb7\x4b\xd0\xe7\x59\x82\
+\x3a\xbd\xfd\x3e\x29\xa0\xd3\x77\x2d\xad\x11\x6e\xb4\xc4\x25\x18\
+\xf5\x36\xef\x5b\x6b\x77\xeb\x7d\xf1\x34\xc3\x48\xb2\xe4\xce\x6f\
+\xaf\xe9\xa1\x5b\xa6\x0c\xe7\x2c\x4f\xbf\x7a\x36\x4c\xb3\x8c\xdd\
+\x5f\x6a\x10\x09\xd8\x71\x76\x3d\xbd\x78\xa9\xeb\x04\xc4\xbf\x59\
+\xa9\x43\x87\xbe\x77\xef\xa6\xb4\xa4\x89\x1f\x2b\x1d\xca\x86\x90\
+\x5b\x4c\xba\x3a\xe9\x8a\x9c\x49\xb5\xc1\x99\xbb\x37\xe5\x7b\x38\
+\xa5\x09\x87\x49\xd7\x1a\x6b\x15\x10\x96\xf1\x0c\x31\x7b\xfa\x52\
+\x52\xae\x04\x13\x11\x13\xbf\x3f\x8a\x1c\x00\x24\x32\x45\x8d\xd7\
+\x6d\x42\xc1\x8b\x11\x51\xeb\x8e\x34\x75\x35\xdf\x35\x01\x1d\x23\
+\xca\x9c\xa9\xc5\xe3\x16\xc6\x7a\xf1\x8a\x6d\xe0\x16\x27\x5d\x3a\
+\x63\xf6\xb4\x22\x64\x37\xf0\xf3\xb4\x76\xe6\x8c\x79\x6f\xad\x9b\
+\x5c\xf9\xa8\xe8\x2c\x89\xd6\xc3\x13\xb5\x9c\xe3\x5d\x6c\xca\x91\
+\x28\xc9\xc0\x3e\xfd\x28\x90\x4b\x0c\x38\x86\x27\xeb\x7f\x14\x87\
+\x02\x22\xd0\xd9\x74\xed\x8e\xb6\xab\xb5\x5c\x96\x9b\x5e\x6f\xd6\
+\x65\xf8\xa9\x02\x36\x66\x74\x8c\xfd\xb6\xcf\x8a\x8c\xbb\xaf\xbf\
+\xf5\xe7\x8a\x91\x97\x9b\x7c\x76\xbb\x89\xd6\x9d\x4b\x43\x76\x4d\
+\x33\xf9\x31\xa4\xd2\xfb\x12\x40\x10\x91\x59\x47\x7d\x4f\xc4\xcd\
+\x80\x81\xbc\xe1\x4f\x68\xf5\xe2\x94\xba\x51\x0b\x59\x29\x0e\x31\
+\x9d\x42\xa6\x10\x46\x57\x2f\x49\xbb\xc5\x04\x14\x97\xa7\x23\xbc\
+\xbe\x2b\xa0\x97\xb3\xf5\x8e\xfc\xe6\xf4\x09\x18\xfe\xb8\xbb\xcd\
+\x21\x06\x0f\xf7\xf6\xd4\xf9\x80\xed\xf9\xaf\x9a\x64\x05\xd8\x4e\
+\xca\x51\x5b\xd1\x9f\x98\x78\xa9\xd6\xf3\x9e\x91\x18\xd8\xde\xa6\
+\xa4\x1a\x7c\xed\xd3\x8a\x02\xc2\xce\x9d\x3f\xcf\xd1\x41\x7c\x74\
+\xb1\x68\x90\xd2\x69\x08\x5d\x80\xbf\x32\xeb\xce\xde\xb4\x8a\xe2\
+\xe6\x5f\x37\xb7\xc7\x2e\x85\x5a\x90\x4b\x6b\xf5\x78\xd3\x9b\x6b\
+\x36\xac\x00\x77\x87\x9b\x79\x68\x16\x07\x1a\x19\x92\xf1\x3c\xd5\
+\x8b\x41\x63\xae\x7a\x5f\x14\x26\x96\x0b\x15\x40\xcc\xdd\x20\x1d\
+\x62\xf7\xd2\xa5\x98\xd7\xfb\xbb\xb5\x5c\x14\x71\xde\x6a\x25\xa5\
+\x9d\x2f\x9d\x71\xdb\x8a\x26\x57\x95\xb4\x73\x9d\x73\xc6\x27\x8a\
+\x8a\x1f\x9c\xf8\x91\xda\x28\x10\x33\x87\xb3\xd3\x40\xcb\x3c\x56\
+\x53\x43\x4c\x6a\xe6\x5a\xdc\x32\xfb\x3f\x9b\xed\x44\x01\x2b\x75\
+\xe6\x7a\xee\xc7\x33\x92\x0c\x20\x7b\x72\x69\xfa\xf3\x5d\x2f\x6c\
+\xf2\x69\xcb\x4e\xdd\x07\x90\x9f\x65\x04\xf0\xdb\x13\x6d\x53\x83\
+\xd2\xa4\x47\x29\xd9\x4e\x9c\x06\x79\xa4\xbc\xa1\x8e\xba\xe2\x35\
+\xeb\xef\x4c\x23\xc2\x63\xd7\xe9\xff\x00\x6a\x22\x7e\x60\x2d\xc6\
+\x73\x40\x9c\x84\x8e\xca\x69\x3a\x73\x8c\x99\xa6\xd2\x57\x9f\x7b\
+\x6b\xb7\x34\xf6\x87\xac\xf4\x7b\x7a\xc6\x94\x17\x0c\x86\x60\x4d\
+\x18\x7b\xc6\xb4\xa0\x11\x3b\x38\xbc\x54\xcc\xe0\x0f\x2c\xfd\xff\
+\x00\xb5\x86\x07\xac\x8f\x6e\xbe\x68\xe0\xdb\x20\x93\x7e\x90\x7e\
+\xe2\x9d\x10\x13\x78\x23\x04\xb6\xf3\xeb\x7c\x53\xc2\x48\x33\x3a\
+\x4f\xfa\xf1\x4e\x4a\x81\xdb\xb7\x5a\x70\x65\xc2\x24\x90\x49\x36\
+\xb5\xe9\xd4\x61\xa5\xcf\x8d\x9f\xd9\xa3\x0b\x92\xec\x33\x68\xed\
+\xfb\x34\x92\x10\x63\x29\x7e\x6f\x66\xd3\x7d\x68\x30\x66\xf6\x20\
+\x16\xf9\xa6\x44\x87\x7e\x7f\x64\x35\x69\xe9\x20\x8c\x49\x0b\x32\
+\xe3\xae\x43\xd2\x9c\x81\x20\x45\xa3\x10\xdf\x6f\xd1\x74\x49\x4e\
+\xe2\x5b\x00\x5f\x7b\x62\xc6\x2f\x94\x80\x19\x37\x86\xe4\xae\x6e\
+\x65\xf1\xb5\x20\x5d\x4d\xf0\xe2\x85\xac\x2d\x81\x86\x61\x1f\xd1\
+\x40\x1c\xa8\xf6\x67\xf0\xe9\x41\x16\x67\x42\xda\xfb\x72\x75\xa4\
+\x54\x21\x99\xce\x82\x9e\xd4\x20\x04\x73\x3f\xad\x4e\xb4\x26\xf6\
+\xd3\x12\xf3\x1d\x9b\xd3\x89\x05\x66\xce\x0c\xd2\x34\x03\x08\x89\
+\xe7\xea\x94\x94\x3a\x53\x94\xd1\xeb\x97\xee\xa5\x18\x47\xae\x66\
+\x8e\x7b\x1a\x77\x49\x3b\xef\x49\x21\x16\x0b\x52\x6a\x9c\xca\x1c\
+\xd4\x66\x95\x06\xc9\xd3\x2b\x69\xad\xf8\xb5\xd7\x48\x73\x9c\xd8\
+\xd4\xe6\xdf\xca\x72\x62\x79\x54\x36\x24\x27\xb7\x34\xe0\xbc\x35\
+\x06\x21\x74\xfd\xad\x10\x87\xbf\xec\x46\xe6\xd3\xad\xe7\x0c\x39\
+\x89\xb8\xed\xfb\x8a\x41\xb8\xe7\x41\xcb\xd3\x3a\x64\xe2\x81\x38\
+\x26\x66\x73\xfb\xae\x2b\x9c\xd7\xd3\xab\xf1\xa8\xf1\x6e\x9f\x29\
+\xce\xd3\x8f\xba\x38\x22\xdc\x5b\x36\xe3\x5d\x35\xed\x51\x17\x91\
+\xb2\x64\x8c\xdf\xcd\xa4\xf1\x47\x25\xb7\xe7\xbf\x14\x81\x20\x4d\
+\x4e\x7b\x1e\x29\x77\x2d\x3e\xf7\xcc\xf3\xcf\x4a\x5c\xda\x77\xef\
+\x27\xbc\x7f\xb5\x22\x29\xdb\x19\xd2\xd9\xd0\xf9\xa2\xc2\xa1\x79\
+\xcd\x87\xb7\xe9\xe2\x94\xd7\x67\x8e\xac\xe3\x8f\xe5\xe9\x36\xc2\
+\xd9\x99\xcb\xdb\xf9\x53\xc8\x48\x27\x5b\xeb\xc9\xbd\x1c\x02\x97\
+\x28\x40\x2c\xcb\x99\xa3\x2c\x39\x45\xf5\xbd\xf7\xcf\xce\x6a\xfc\
+\x9b\xb5\x24\xca\x6f\x61\x3f\x5a\x8a\x40\xa6\xfb\xef\x78\x7e\x28\
+\x60\x2d\xc7\x7f\x4e\x26\x2f\x5c\x4c\x2d\xff\x00\x49\xae\x2d\x1d\
+\xe8\x40\x75\xf7\x6b\x37\x6f\x72\xbd\xc7\xb5\x7e\x6f\x9a\xf6\x3f\
+\x35\x9b\xb7\xb1\x4e\x43\x4e\xbf\x2f\xed\x12\xea\x06\x4e\x8f\x3e\
+\xd7\xa8\xb5\x95\xfc\x7a\xf9\xc4\xb4\xb5\x45\x88\x8e\xaf\x5f\xaf\
+\x6a\x98\x65\x9d\x59\xa7\x82\xc0\x0b\x96\xb9\xc3\x52\x1a\xce\x62\
+\x1e\x9b\xe9\xbd\x1c\x11\xda\x42\x6d\xc8\x5a\xfd\xa9\xd0\x51\x7b\
+\xc5\xb7\xf1\xae\xba\x73\x4a\x1a\xab\x95\x58\x46\xfc\x15\x7e\x00\
+\x8d\xcc\xda\x70\xe9\x0f\xc7\x5a\x2b\x02\xa4\xe5\x5e\x76\x7a\x17\
+\xa5\x15\x84\xeb\x6c\xdf\xd2\x89\x91\x2e\x19\x3e\xff\x00\x0f\xc5\
+\x40\xc8\x13\x21\x30\xb0\xe8\xc6\x96\xab\x42\x2e\xe8\xce\xbb\xf7\
+\xfe\xe9\x41\xc9\xcd\xfa\x99\xd1\xe7\x5c\x53\x55\xb5\x79\x87\x58\
+\xfb\x27\xb7\x25\x25\x7b\x36\x16\xec\x2f\xfb\x8e\x2e\xd3\xb2\x56\
+\xea\xdf\xa7\x31\x49\x42\x0c\x4c\x43\xe1\xb5\xbd\xa8\x14\xc1\xd1\
+\xfb\xa1\x07\x06\x12\x16\xbe\x5d\x3b\xe9\x46\x60\xf8\xf4\x36\xfb\
+\xa4\x63\x44\x85\x02\x40\x35\xb4\x90\xf1\x4b\x41\x00\xca\x3b\x96\
+\xcb\xa6\x37\x74\xa9\x99\x04\x37\xc2\x6e\x22\x58\xbf\xe6\x88\x0a\
+\x6b\x8e\x85\x69\x98\x09\x8c\xc1\x3b\xc3\xab\xa6\xb4\xee\x4b\x6c\
+\x73\x3f\x7e\xd5\x18\xae\x6e\x8e\x26\x8d\x60\x5f\xf9\xf7\x3d\xaa\
+\xf6\x98\x98\xf0\xbf\x2d\x40\x19\x6d\xd3\x55\xe2\x9c\x13\x10\xeb\
+\xad\xbf\xdf\xf6\x9b\xa9\xf4\x50\xcb\x02\xff\x00\xbf\xdf\x3c\x56\
+\x73\xe9\x86\xe9\x37\x26\xf1\x34\x27\x89\x00\x96\x14\x38\x8d\x2f\
+\x6f\xba\x9b\x02\xa6\x6b\x5d\x98\x8e\xbe\x3b\x54\xf6\x26\x08\x5c\
+\x74\xee\xef\x44\x21\x7b\x49\xc6\x58\xcf\x33\x7d\x9a\x20\x0b\xac\
+\xb2\x59\xd7\x4f\xbd\x66\x8c\x49\x09\x8f\x7f\xba\x52\x25\x8b\x29\
+\x3b\xf1\xfb\xb5\x21\x07\x34\xf1\xd8\xf0\xf8\xa4\x1d\x98\x4c\x6d\
+\xc3\x1b\x54\xe1\x12\x32\x87\x51\xc5\xf9\x66\xb6\xde\x70\x62\xce\
+\x7c\xef\x57\x82\x1b\xcc\x4d\xbe\x15\x0c\x44\xdf\xc8\xe3\x7e\x9e\
+\xf5\x04\x04\x21\xf1\x07\xcb\x1e\x6a\x34\x9c\xe6\x6e\x5f\xab\xc5\
+\xe8\x32\xb0\x75\xd1\x31\xd0\x3c\xd3\x43\x79\xce\x7e\x00\x87\xbd\
+\x1a\x4c\x2e\xbd\xa5\x88\xf9\x8e\x29\x98\x50\xf1\x05\xf5\xd7\x8a\
+\x04\x84\xe3\x9d\x25\xda\xde\xfc\xd7\x53\x5d\x5d\x3f\x1d\xea\x0a\
+\xec\x86\x71\x94\xd5\xe3\xd6\x80\x61\x0d\xf8\x31\xad\xcd\xfc\xde\
+\xa0\xa5\x88\x4d\xf5\x93\x9d\xf6\xa6\xad\x02\xcc\xa6\x1f\x1f\xb7\
+\xa0\x2c\x02\x23\x33\x97\x33\x69\xfe\x52\x2b\x36\x9e\x77\xd6\x20\
+\xa9\xb2\xe1\x99\x93\xa2\xcf\x5b\xeb\xeb\x44\x15\x26\xce\x7a\x38\
+\xb8\x7e\xf0\x63\x31\xf1\x3e\xe6\xbf\x1d\xcf\xf8\x7e\x3b\xb5\xf8\
+\xec\x57\xe3\xb1\x5a\x62\x82\xc8\x31\x07\xa4\xed\x57\x83\x3b\x39\
+\x70\x54\x4a\xc6\xec\xfa\xe2\x7b\x52\x44\x90\xa9\xc4\x76\xe8\x37\
+\xff\x00\x69\x6e\xc8\xfd\x7b\x7d\x34\xac\x52\x76\xea\x5d\xfd\xa6\
+\xd0\xd4\x65\xc8\x86\x1d\xa5\x9c\xb3\x7e\x94\xbc\x9a\xda\xaf\xd4\
+\xe7\xfc\xa0\xb6\xe0\xb9\xde\x12\x3d\x5c\xf7\xab\x24\x27\x2c\x7e\
+\x87\xb6\xbc\x58\x1b\x81\x72\x6e\x7a\xfc\x3a\x4d\x61\x0e\x85\xf5\
+\xeb\x39\xf6\xe6\x93\x01\x73\x62\xc9\xbf\xef\xf2\x91\x16\x0e\x6d\
+\xdf\x77\x5b\xbe\x95\x70\xc8\xcc\x17\x2a\x73\xbe\x31\x57\x79\x74\
+\x25\xcf\x19\x7c\xfb\x55\xb9\x00\x84\x1d\xfa\xbe\x7e\xe6\xae\x29\
+\x2d\x16\xb5\x92\x21\xfd\x33\x43\x42\xf7\x12\xd9\xb6\x91\xc6\x1c\
+\x68\x55\x8c\x2c\x66\xf3\x33\x8e\x69\x25\xd0\x11\x6d\xf6\x7e\x33\
+\xd2\xa3\x50\x83\xa2\x6e\xf1\xc5\x28\x92\x86\x70\x87\xb7\x9f\x9a\
+\x5e\xae\xf3\x73\x5c\xfa\x78\xe6\x95\x86\x60\x92\xed\xd7\xe3\x5f\
+\x34\xc1\x41\x38\x84\xcd\xf4\xcd\xa3\xb6\xd0\x50\x9a\xc0\x91\x43\
+\x74\x87\x18\xc3\xf0\x4d\xd5\x25\x60\x9c\x04\xac\xba\x6e\xce\xb9\
+\xa6\x61\x2d\xbb\x1e\x8d\x99\x7f\x94\x85\xca\x24\xef\x3a\xfa\xff\
+\x00\x94\x9b\x54\x65\xc6\x1d\x61\xda\x9d\x30\x76\xd5\xfd\x8f\x1c\
+\xd1\x23\x39\x67\x1c\x1f\x55\xf8\xee\xd3\x49\x4c\xc5\xba\xc1\x59\
+\x40\xcb\xfb\xae\x26\x71\x1c\xcd\x2a\x19\x70\xf1\x70\x96\xfa\x8f\
+\x9d\x31\x46\x6d\x09\x0e\x6c\xb3\xe9\xeb\xd6\xb4\xe3\x99\x61\xb2\
+\x5a\x61\xe1\x89\x11\xc2\x34\x0a\x49\x86\x63\xb3\x6d\x0e\xb5\x1e\
+\x0b\xad\x9e\xef\xae\xf6\xb6\x94\x81\xa4\x8d\x72\x96\x8c\x73\xfb\
+\x4a\x73\x55\x93\x17\x47\x8b\x54\x05\xa3\x19\xe3\x7d\x4e\x34\xa1\
+\x20\x60\x31\x8d\x44\x8c\xbb\x35\x18\x9e\x17\x5d\xfa\x7e\xf1\x50\
+\xb7\x5c\x32\xdf\x31\x50\xd3\x1b\xbe\x79\x9e\xd8\x33\x35\x0b\x82\
+\x75\xbd\xf3\xe5\xa1\x4d\x33\x39\xce\x1e\x1f\x8e\x85\x43\x20\xf4\
+\xd0\x8f\x0c\x7e\x8a\x11\x00\xdb\x16\x6e\xcf\xcc\x4e\x99\xa3\xa6\
+\xc1\x96\x3a\xda\xda\x31\x86\xa3\x5c\x50\x6c\xcd\xf4\xfd\xb4\x69\
+\x49\x2c\xbd\x19\x59\x7f\x7d\xd4\x30\x8a\x0c\x97\xfd\x6f\x34\xc8\
+\x21\x66\xd1\xa9\x8b\xf7\xa2\x51\xc0\xe2\xd0\x16\x9f\x2d\x3a\x40\
+\xd3\x01\x8b\x9d\x73\xd6\x99\x46\x4c\xe2\xd0\x77\xda\x6a\xf4\x24\
+\x89\x27\x92\xdb\x7b\x4d\x4e\xf5\xf2\xf4\x82\x61\x8e\x9f\xb4\x14\
+\x95\x74\x42\x7b\x31\xf5\x1a\xd2\xd4\xa4\xa9\x93\x9f\xdd\x78\xa8\
+\xc9\x88\x08\x16\xea\xf2\xfc\xd0\x7c\x82\x03\x21\x97\x77\xbd\xed\
+\xe2\xa6\x77\x4c\xcf\x5b\x68\x6f\x57\x79\xa8\x86\x2f\x7c\xfe\x8e\
+\x97\xab\xab\x31\xe7\x77\x1a\x7e\xb1\x56\x0b\x79\xde\xd7\xb6\xbb\
+\x22\xf3\x9e\xf5\x8f\xed\xda\x86\xdc\x3d\xec\x74\xa9\x28\x3a\x1e\
+\x96\xbb\xfe\x52\x44\x87\x2c\x43\x89\x67\x7b\x77\xa2\x86\xd4\x8f\
+\x93\xdc\x4f\x9a\x64\xeb\x2e\xed\xa7\xef\xae\xb4\x06\xbc\xe6\x7a\
+\xdc\xd3\xe6\xd4\x22\x2d\xb5\x3b\x9f\x47\x7c\x6e\xc4\x13\xce\x5f\
+\x9d\xe7\xc5\x28\x1d\x85\x95\x88\xb9\x13\x8f\x4d\xe8\x49\x31\x16\
+\xde\xfb\x3c\xd2\x8b\x13\xcc\xf4\xfc\xf5\x8a\xcc\xb0\x88\x2b\x25\
+\x8a\xe5\xc6\xde\xd4\x72\x29\xdb\xe7\xfd\xcd\x28\x0d\xf4\x16\xd7\
+\xdf\x98\xbf\xeb\x80\x6c\x96\x58\x98\xbc\x75\xe9\x57\x73\x02\x37\
+\xf3\xfe\xc7\xa4\xde\x96\x41\xda\xc4\xf6\xd9\xd9\xc6\xf4\xee\x20\
+\x91\x25\x32\xb6\x0b\x62\x84\x46\x49\x79\x4c\x5f\x57\x2b\x56\xc8\
+\x97\x46\x10\x1b\xfe\xcf\xc9\xd5\x93\x2a\xa7\x6f\x9d\xf8\x9a\x66\
+\x99\x0c\x2d\xb3\xae\x3a\xfe\x9a\x67\x09\xe1\x3a\xcc\x8f\xde\xbe\
+\x94\xb3\x52\xc1\xd7\xe3\xec\xe9\x25\x5e\x22\xec\xd9\xdd\x74\x9d\
+\x56\x87\x64\x11\x76\xf3\x1b\xdf\x69\xf5\xc9\x48\xe4\x65\x70\x9c\
+\xbb\xfb\x5e\xa7\xc4\xb0\x90\xe2\xf2\x6b\x1f\xc6\xa4\x67\x53\x08\
+\xd5\xb7\x5f\x6e\x85\x1a\x48\x02\xcb\x6a\x5e\xde\x3b\xd2\x47\xe4\
+\x82\xc2\xce\xc7\x7c\x66\x72\x51\xf6\x1c\x5d\x50\x91\x73\x16\xfd\
+\x7a\x9c\x92\x14\xc2\xf1\x8b\xe9\xeb\x4c\x97\x91\x8c\x73\x77\x88\
+\xc5\xf1\x50\xa3\x28\x8d\xed\x6c\x9a\x38\xc7\xdd\x00\x5b\xda\x5c\
+\x75\xce\x75\x78\xbb\x4a\x91\x6f\xdd\x54\x84\x08\x9c\x58\xb9\xac\
+\xf4\x29\x77\xf5\x4b\x4c\x63\xcc\xfa\x52\x66\x35\xb4\xeb\xaf\xcb\
+\x8e\xf4\x8c\xac\x2b\xc6\x33\x3c\xe7\xea\x5a\x52\x1b\x2c\x9a\x49\
+\x63\xf6\x3b\xd2\xde\xb7\x8b\x9f\xb9\xd6\x39\xab\xc0\x60\xb1\x16\
+\xbf\x9f\xbd\x79\xa4\x42\x39\x74\x77\xdc\xb5\x6e\x2b\x10\x83\x26\
+\xbe\x22\x3d\x8d\xa8\x2b\x1a\xbb\xe8\xfe\xbe\x79\xa9\x48\x45\xad\
+\x84\xe7\xf4\x7a\xda\x9a\x2c\x71\x9e\x78\xa0\xcc\x1a\xe2\x3f\xae\
+\x36\xf5\x6a\xea\x5c\x01\x9b\x17\x31\xa7\xac\xf1\x4d\x82\x63\x3e\
+\xbf\x67\x1c\x52\xb5\x61\xbe\x37\x87\x49\xd7\xa5\x22\x5d\xbd\xdd\
+\x2f\x48\x88\xba\x66\x78\x5d\x3f\x14\xb9\x7b\xcf\xdd\xec\xe9\x3e\
+\x95\x38\x0c\xe2\x6e\xda\x57\xdb\x8d\xaa\x51\x96\x61\xcc\xde\xf3\
+\x6c\xbc\x51\x0a\xa5\xb7\x36\x9f\x13\xd7\xee\x85\x12\x25\xce\xba\
+\xbf\xcf\xf6\xae\xdb\x61\xb7\x3d\x3b\x66\xa2\x65\xac\x33\x78\x99\
+\xe6\x70\xd6\x11\x4a\x62\x33\xf8\xef\x40\x2a\x8c\x66\x7f\xdd\x87\
+\xf4\x54\x11\x16\xfe\xbe\xe4\xd5\xba\xd9\xc7\x75\xb6\xbb\x4d\x4c\
+\x80\x98\xf8\x9f\x77\xa5\x1a\xb3\xe7\x4b\xe7\xe0\xe9\x53\xad\x94\
+\x46\x9a\xff\x00\x76\xa7\x32\xc9\x08\x6f\xc7\xc7\x42\xad\x76\x77\
+\x72\xb3\xeb\x8b\xd6\x81\x68\x73\xa6\x73\x9b\xf8\x79\x2a\x20\x8b\
+\x13\xed\x7f\xad\x69\xe3\x14\xb8\xe9\xae\x9a\x35\x02\xef\x73\xb7\
+\x5d\xaa\x05\x84\x43\x6d\x31\xd3\xcd\xe8\x2d\x40\x6d\xa6\xaf\x5d\
+\xf8\xa0\x8d\x30\x2f\xd5\xce\xf8\x66\x34\xa2\x42\xf2\xaf\x3c\x72\
+\x7e\x2a\x39\x86\x47\x0d\xf5\x63\xdf\xf4\x15\x7b\x88\x97\x3f\xde\
+\xf5\xb2\x4c\x98\x88\x89\x66\x7f\xb6\xa5\x44\x06\xef\x7f\x1c\x15\
+\x64\xd0\x22\xd9\xbf\x9d\x67\x7e\x9b\x40\xd9\x0a\x40\x84\x45\xc6\
+\x22\x5c\xfd\x55\xde\x03\x0b\x29\x8b\xe3\xad\xbe\x77\xa8\x8a\x05\
+\x98\x26\x20\xcf\x6f\x5a\x2a\xc0\xb0\x4c\x4d\xfd\xf2\xe9\x1e\x94\
+\x04\x48\xba\x02\xc7\xae\xe6\xdd\xe8\x1c\x90\x33\x27\x7d\x3a\xfa\
+\xf1\x52\xf1\x4a\xa1\x27\x3c\x6b\xed\xad\x5e\xad\xf2\xca\xc5\xf6\
+\xba\xfe\x69\x9a\x88\x20\x9d\xd1\x73\xfa\x79\x8a\x5e\x99\xc3\xeb\
+\x1f\x7d\xe2\xae\x60\x8e\x12\xdd\x34\xc3\x34\x2c\x94\x6c\xec\x8d\
+\xbe\x2d\xfe\x9c\x11\x40\xb2\x21\x7f\x3e\x6a\x58\x17\x68\xc2\x26\
+\xbd\x28\xc2\x08\xa8\x41\x3a\xb5\x26\x51\x5a\xf7\x75\xe7\x7e\x87\
+\xb5\x30\x4a\xf8\x04\x07\x23\xe9\x73\x9e\x30\x8c\x4a\xf9\xcf\x3c\
+\x69\xb5\xb5\xa9\xf6\x94\x14\x92\x2f\x6c\x4f\x45\x9e\x69\x08\xb3\
+\x33\xea\xbc\xf4\xb5\x3a\x22\x50\xb9\x16\x1b\x5f\x4a\x12\xec\x11\
+\xcd\xc6\xcf\x5d\xfd\xf2\x97\xc1\xcc\xeb\x6c\x7d\x5b\x9e\xc4\xb7\
+\x47\xed\x3e\x2a\x60\x01\x95\xb9\xa4\xf1\xcb\xe6\x80\xd2\xb7\x73\
+\x9b\x4f\x48\x3c\xde\x92\xb2\xcb\x11\xb4\xf4\xfd\x3d\x29\xc6\x2f\
+\x3b\xe9\xd3\x1b\xd2\x20\x84\x33\x8e\xff\x00\x16\xed\x48\x64\x17\
+\x4d\x0e\xba\xeb\xfb\x34\x25\x38\x31\xaa\x1b\xc9\x7d\x3f\x45\x6f\
+\xb4\x36\x5b\xfd\xe3\xbe\xd7\x19\xc9\x32\x59\xcc\x6f\xdf\xeb\x31\
+\x4c\x0b\x07\x8b\x11\x29\xd6\xdd\x69\xd6\x58\x53\x2c\xdf\x54\xff\
+\x00\x73\xc9\x41\x17\x19\xd5\xcb\x66\x22\x27\xe3\x6d\x6c\xf9\x16\
+\x26\x57\x56\x62\xf6\xd2\x9e\xc8\x12\x6d\x39\x62\xc7\xed\x68\x84\
+\x8e\x47\x86\x7a\x4d\xfd\xf5\xa9\x01\x01\x04\x77\x24\x88\xcd\xf7\
+\xab\x99\x55\x9b\xde\x21\xbe\x9b\xf1\xf1\x4b\x60\x00\x70\x93\x36\
+\xd3\x38\x98\xe5\xa9\xf4\x5c\x62\x32\xdd\xcf\xee\x75\xa4\x16\x4b\
+\x4e\x5c\xcc\x4f\xe8\xa3\x0b\x9a\x71\xa2\x67\xbe\x27\xbd\x14\x3a\
+\x9e\xd3\x3a\xfa\xfe\x8a\x80\x41\xd9\xd3\x32\x94\x16\x62\xe3\x37\
+\x98\x7e\x2f\x3f\x74\x92\x0c\x16\x8e\x0b\xf4\xd6\x31\x51\x81\x16\
+\xd8\x61\xcf\xe9\xbf\xcd\x2c\x14\xc4\xcc\xdf\x32\xc7\x9c\xdf\xa5\
+\x49\x0e\xab\x4d\xf1\xd5\xf6\xe6\xa0\x18\x1b\xdc\xbe\xbb\xc7\x9a\
+\x9e\xb4\x5c\xcf\x59\xe2\xff\x00\xe5\x4c\x2c\x2c\xe7\x9b\xcf\x07\
+\xb6\x94\xc7\x57\x63\xe6\x37\xa6\xe6\x65\x78\x95\xe4\xe3\x67\x17\
+\xe1\xa5\x03\x1d\x73\xc6\xf4\x9c\xd0\x48\x7e\xd0\x2d\x47\xf0\xc4\
+\x98\x73\xb7\xaf\xbd\x62\xa0\xaa\x86\x6f\x8e\xb5\x72\x4e\x1f\x8f\
+\x8a\x20\x38\xbc\x9d\x17\x47\x8b\xda\xb4\x77\xf8\xa1\x94\xda\xdb\
+\xf8\xab\x5a\xfc\xe9\x8b\xf9\xe2\x81\xb9\x9f\x33\x62\x48\x97\x7f\
+\x9a\x45\x08\x0d\x3a\x76\x27\xaf\xe0\x50\x5c\x4c\xb6\x2e\x0b\xc6\
+\x74\xfe\x55\xfd\x9e\xe5\xf2\xe2\xde\x78\xa4\x8b\x93\x36\x8f\x0b\
+\xdf\x6d\xca\xf1\x04\x5a\x3b\xfe\x1f\x4a\x2c\x22\x4c\xb6\x13\xe3\
+\x7e\x7d\x29\x10\xf5\x28\xdc\x88\x88\xc1\xb3\x42\x6d\x02\xc4\x8e\
+\x73\xcf\x3e\xb4\x10\x58\x73\x31\xd1\x48\x9d\xa5\x9b\xf3\xd1\x1c\
+\xec\x15\x26\x22\xf2\xd1\xa6\x9c\x33\x2d\xf4\x8f\x0e\xd9\xa9\x87\
+\x5e\x73\x7c\xef\xf5\x3e\xd4\x3e\x20\xf5\x9c\x19\xe8\x3c\xd8\xa1\
+\x26\xdc\xba\x97\x9d\xe3\xf7\x8c\x08\x85\xdd\x6c\x4c\x72\x52\xbc\
+\xa1\x39\xe9\xae\x23\xc4\xdd\xb5\x2e\x0d\xb0\x0c\xd9\x63\xc8\x71\
+\xeb\x44\x0c\x59\x41\xe8\x27\x9a\x18\x89\xdb\x19\xb0\xfb\xe7\x48\
+\xa4\x01\x1b\x13\x79\x65\xda\x84\xfa\x69\x41\xda\x38\xfd\xa5\xa9\
+\x0c\x03\x0c\x87\xd7\xa6\x9d\x75\x08\x4c\x89\x30\xce\x37\xd0\xbf\
+\xcf\x34\xeb\x79\x1f\x6a\xb9\x44\x67\x43\x32\x1a\xf9\xfd\x32\x54\
+\x4b\x36\x2d\x29\x3b\xdb\x7e\xd5\x11\x94\x60\xda\x44\x14\xf7\x38\
+\xa7\x65\x02\xf2\x1b\x2f\xce\x69\x2a\x4d\xf1\xbd\xc6\xf1\xaf\x2e\
+\x29\x11\x61\x9f\x9d\x3d\x6d\xd2\x97\x48\x33\x8d\x35\xf7\x77\xd2\
+\x84\x6c\x42\x21\x33\x27\xe8\xa9\x23\x32\x6e\xe1\xbd\xfb\xd6\x8e\
+\xff\x00\x15\x9b\xb7\xb9\x57\xb1\x86\x9f\xbe\xfa\x51\x20\xb6\x49\
+\x37\x26\x71\xb6\x7e\x73\x49\xa4\xca\x47\xb1\xd2\x33\x7e\x2b\x22\
+\x26\xe0\xe5\x0c\x1b\xe0\x23\xd5\xa4\x88\x24\x03\xad\xf5\x99\xbf\
+\xb0\xf7\xa0\xa4\x8b\xcc\x25\xf6\x8f\x1b\x78\xa3\x4b\x21\x01\x29\
+\xcf\xe8\xeb\x45\xc8\xb5\xd6\xdd\xa1\x8e\x93\xf5\x94\x90\x96\xda\
+\xc4\xfe\xfd\x35\x30\x97\x17\x5c\x4b\x9d\x69\x12\xb7\x21\x1e\xaf\
+\x2c\xe3\x8f\x88\x94\xba\x5b\x37\x31\x38\x6f\xbb\x3e\x28\xc3\x2a\
+\x3e\x99\x9b\x7c\x7d\xd2\x9b\x5a\x46\x31\x67\x52\x26\x22\x9a\x85\
+\x99\xb4\x0c\x90\x93\x9c\xf8\xad\x18\x48\x67\x74\xf7\xf1\x7b\xf2\
+\xc0\xd9\xb1\x66\x42\xdf\xec\x4d\x31\x83\x13\x3d\x24\x7f\xde\xa6\
+\x68\xcf\x94\x52\x46\xf8\x96\x34\xfa\xe7\x4a\x0b\x68\x98\x76\x2d\
+\xf0\x6b\x43\x2b\x9c\xf5\x10\x5f\xaf\xa9\x45\x94\x4b\x68\x97\x5e\
+\x33\x47\x12\x91\x32\x00\x4d\xb5\xff\x00\x69\xa2\x09\x2f\x26\x17\
+\xd3\x0c\xcf\xae\xd4\x4d\xf5\x71\xdd\x0f\xa7\xf0\xd9\x46\x9b\x76\
+\xb2\xfc\xd1\x8c\xd2\x23\x18\x62\xc9\xc5\x0d\x86\x9b\x46\x24\xcf\
+\x5b\x7c\x34\x6c\x56\x55\x22\xf7\xf3\x3f\x1d\x68\x4a\x01\xdf\x5f\
+\xbd\xcf\xe5\x6a\xf2\x90\x97\xc4\xfb\xc3\x7b\x78\xa6\x72\x5e\xef\
+\x7d\xcd\xe8\x5e\x2a\x5e\x25\xe1\xeb\xb5\x39\x6f\x26\x8f\x36\xe3\
+\x7a\x45\x59\x7d\xbe\x6f\xcd\x68\xef\xf1\x4a\x13\xfa\xd2\xfc\x54\
+\x52\x31\x33\xaf\xc4\xed\xbd\xad\x4d\x04\xc2\x62\x6d\x2f\x14\x1f\
+\x51\x81\x17\x98\x7e\x42\x3a\xc4\xeb\x40\x24\xcd\x64\x2f\x31\x82\
+\x35\xb3\xfd\x84\x4c\x49\xe6\xd1\x9f\x9c\x5e\xf5\x17\x13\x87\x7d\
+\x97\xd6\x1b\xb4\xf2\xc9\x71\xaf\x3e\xbf\xa2\x81\x0a\x61\x2f\x9b\
+\xec\x1f\xa6\x8a\xf8\x6a\x53\x99\x4d\xe2\xff\x00\xca\x96\x76\x07\
+\x58\x89\xe9\x1e\xa5\x48\xf2\x24\x46\xf3\x85\xf1\x7b\xfb\x1d\x5e\
+\x08\x5b\x42\xf7\x59\xb7\x67\x8f\x17\x53\x06\x0c\x8e\x2f\x24\xfe\
+\x27\x8a\xbc\xa3\x1e\x26\x6d\x7e\xb4\xf0\x29\x11\x72\xc6\x5a\x90\
+\x46\x74\x70\x67\xf7\xb3\xcb\xa0\xa4\x66\x1c\xf4\x8e\xbc\xd4\xce\
+\x5c\x00\x93\xdb\xfb\xef\x51\x14\x9a\xdb\x01\x13\xc7\x5f\x36\xa3\
+\x8d\x6d\xe0\x8c\xcc\xb9\x3a\x74\xa2\x1d\xd6\xd3\x50\x42\xda\xfa\
+\xf4\xa1\x33\x06\xf4\xcc\xdf\xdb\xa5\xaa\xcc\xa4\x0b\x50\x89\x74\
+\xec\x7a\xd4\x54\xc8\xdc\xfc\xfa\xab\x04\x87\x42\x9f\x8d\x7e\x69\
+\xd7\xe0\x2c\x24\x92\xe6\x6f\xd6\x9b\x75\xe8\xb5\x6c\xbb\xfd\xf3\
+\x15\x28\x74\x1d\x4b\x59\x36\x8d\x39\xf9\xa4\x22\x92\x03\x2e\xfa\
+\x73\x3e\xbd\x2a\xca\xb0\x93\x2d\x35\xc5\xfd\xa7\x4a\x75\xc8\x65\
+\x16\xcc\xb8\xb6\xb4\xa0\xca\x25\x68\x38\xb9\x2e\x99\xf7\x5f\xda\
+\x12\xdc\xfd\x2d\xfa\x07\xa7\x34\x4b\x84\x2b\x12\xcf\x9a\xb1\x93\
+\x3a\x32\x1e\x63\x39\xf8\xc5\x0b\x46\x58\x30\x23\x8c\xfd\x75\x2a\
+\x5c\xaa\x8c\xde\x7c\x4b\xb5\xb4\xf4\xa4\x23\x38\xbd\xb7\xd7\x7c\
+\xdb\x4a\x03\x62\xe6\xce\x2f\x3e\xde\xb5\x15\x55\x28\x01\x9b\xa2\
+\x5b\xc4\xd4\xb1\xb7\x2d\x0b\xf8\xc7\xad\xaa\x24\xc8\x0e\xb1\x58\
+\xd8\xe7\xae\x2d\x51\x65\xb8\xbd\xe8\xdf\x31\x6f\x7d\x68\x91\xd5\
+\x33\x37\x46\xff\x00\xa7\x88\xa8\x32\x11\x21\x17\x5e\xfc\xe3\x5f\
+\xb2\x5d\xe1\x13\x5c\xce\x9e\xe9\xc9\x41\x89\x25\x5c\xe1\x7b\xfe\
+\xec\x62\x89\x43\xbb\xd3\xb9\xae\xdd\xe9\xd8\x42\xd4\x36\x67\x6e\
+\x23\xf9\x44\x0b\x2f\x04\xff\x00\x9a\xde\x8b\x16\x91\xe7\xf2\xfe\
+\xc5\x3d\x82\xe0\x0c\x4c\xfb\xb3\x47\xc4\x05\xb6\x75\xdb\xae\x9a\
+\x76\xa0\xb0\x20\x34\x09\xeb\x3a\x73\x16\xeb\x49\x00\x18\xc5\xd2\
+\xbf\x08\xed\x3a\xd2\xc3\xa1\x9c\x13\x97\xde\x0f\x3c\x35\x2a\x0a\
+\xd5\x16\x3f\x47\xc6\x2b\xaf\xcb\xfb\x57\x37\x3b\x5d\xdb\x76\xa3\
+\xb3\xe9\xf7\x52\x81\x23\xfb\x66\x93\xde\xf3\x13\x3c\xe7\xc5\xa2\
+\xa7\xa4\x65\x17\x56\x47\x1e\x2f\xfe\xd1\xa7\x87\x71\x08\xbf\x79\
+\xf4\xa1\xe4\x45\x32\x4b\x6b\x19\xb6\xfd\x28\xb3\x0e\xa0\x2f\x13\
+\x88\x9b\xe3\x78\xa5\x23\x1d\x9e\x30\x63\x3f\xf2\xfa\x67\x4c\xf7\
+\xc7\x14\x1a\xac\x59\xef\x9d\xf4\x7e\xa9\x30\x7e\xc4\x8a\xe4\x07\
+\x50\x84\x4b\xa9\x9a\x94\x8f\x01\x53\x53\x64\x68\x11\xb4\x80\x9b\
+\xa5\x29\x28\x08\x53\x60\x9b\xc9\x12\xe9\x7d\x1b\xeb\x81\x39\x7c\
+\xbd\x77\x78\xa2\x62\x74\xb3\xe6\xd7\xf3\x5a\xbb\x7c\xd4\xe1\xaf\
+\xb4\xef\x46\x69\x96\x4e\xf7\x89\xa9\x30\x25\x50\xb7\x47\x9d\xb5\
+\xa3\x63\x01\x62\x62\xfb\xed\x53\xc0\xb5\x5d\x7d\xf4\x76\xf6\x2a\
+\x77\x80\x19\x91\x76\xf3\x36\x0f\x6a\xdd\xb1\xa1\x9b\xb7\xc6\x91\
+\xef\x17\xa9\x29\x04\x41\x91\xb4\xda\xce\xf8\xd3\xd4\x98\x63\x09\
+\xf0\x79\x48\xef\x7a\x45\x00\x74\x23\x46\x34\xe1\xf5\xa0\x5b\xa3\
+\x74\x5d\xcc\x6f\xaf\xdd\x17\x16\xcc\x09\x25\xf3\xb6\x4f\x5e\xb4\
+\xe2\x82\xe5\xa1\x2f\x37\xf7\xf5\x88\x22\x9e\x21\x08\x23\x60\xd7\
+\xdb\x8b\x62\x81\x23\x49\x70\x3e\x6a\x68\x04\x58\x3a\xfa\xff\x00\
+\xbb\xd4\x1b\x1e\x0a\x60\x28\x12\x71\xda\xa7\xb1\xeb\xf7\x57\xd9\
+\xc6\xb1\x9f\x56\xa0\xeb\xfb\x34\xa7\x01\x1c\x9d\x7a\xeb\x1e\x39\
+\xa4\xd0\x89\xd0\xd3\x63\xda\x94\x58\x3b\x62\xc9\xdc\x3e\x6d\x4e\
+\xa7\x34\xcc\x0b\x6d\xf3\xe9\x51\x74\x31\x61\x66\x1c\xfa\x74\xa4\
+\xb6\xa4\xeb\xa7\xfa\x4d\x1c\x5a\xcc\xdf\x5b\x2c\x5f\x9c\x51\x13\
+\x99\xa4\xf5\x49\xf4\x9f\x4a\x8a\xe8\x97\x0f\x3e\xc5\x31\x60\xdf\
+\x36\x34\xe2\xf7\xd5\xcc\x51\x48\x04\x50\x04\x02\xc8\x51\x0b\xe0\
+\xa1\x80\xa8\x28\x42\x24\x88\x00\x2e\x08\x26\xe5\xd1\x2d\x15\x2b\
+\xca\x26\x74\x97\xf4\xdd\xf3\x5b\x42\xfa\x43\x36\x9a\x94\x30\x45\
+\xf4\x79\xac\xb2\x75\xf5\x88\xbf\x9a\x51\x48\x87\x0f\x0b\xae\xb4\
+\xc1\x92\xeb\xf7\x7e\x7b\x75\xbd\x0d\x68\x83\x94\x5e\xcb\xa5\xc1\
+\xda\x82\x09\x06\x51\xfb\xfb\x31\x51\x00\x82\x19\xb7\xaf\x13\x3a\
+\x5b\x6e\x62\x65\xd2\x88\xef\x3a\x1d\xef\xeb\x4f\x59\x18\x9e\xef\
+\x33\x16\xbe\x98\xc4\x52\xe5\xe5\x23\x18\x2d\xe9\xe6\xb0\xa6\xe9\
+\x33\x7d\x7f\xdf\x14\xec\x61\x10\x44\xcc\xc0\xba\xfe\x28\xf2\x57\
+\x34\x77\x71\xa7\x1f\x55\x32\xf1\x2e\x09\x1b\x7e\xfc\xd4\xe0\x08\
+\xd4\x39\xb7\xd7\x5b\xeb\x42\x43\x0f\x5d\x8e\xda\xd4\x76\x7d\x3e\
+\xe8\x2b\x17\xfd\xdf\xfe\x29\x5a\xeb\xf2\xfe\xd1\x79\x77\xbb\x6e\
+\xf7\xab\x5a\xfc\xe9\x8b\xf9\xe2\xa3\x09\x6f\xb6\x31\xa5\xdf\xf6\
+\x9a\x7e\xbb\x44\x79\xbd\x20\x89\xf7\xe7\xaf\xc3\xd2\x87\x83\xe5\
+\xcf\xab\x38\xa2\x42\xea\x7a\xe0\xbd\x7c\xdf\x35\xee\x3d\xea\xd1\
+\x0b\x9c\x75\x68\x19\xc9\x9e\xf9\xb4\x9a\xf3\x6a\x22\x06\x76\x08\
+\xb4\xc7\x9a\x69\x6d\xf9\x33\xe5\x44\x02\x12\x62\x00\x15\xc5\x19\
+\x13\x24\x38\xd2\x04\xaa\xa0\x65\x90\xbb\x34\x00\xcb\x39\x9c\x6c\
+\xf6\x8c\x76\xd6\xa4\xcf\xa7\x7c\x5b\xcd\x49\x38\x4d\xb1\x9d\x31\
+\x5c\xbe\x5e\xbb\xbc\x54\xfe\x47\xd4\xda\xfe\x69\x51\xcd\x9d\x32\
+\xf9\xf7\xdc\xa7\x2d\x8c\x47\x4c\x27\x3c\x69\x6d\xab\x38\xac\x9a\
+\xeb\x3d\x7b\xf6\x7a\x4c\x57\xa5\x26\x18\xc9\xd3\xe6\x8f\xbe\x42\
+\x4a\xd2\x74\x8d\x7d\x33\x42\x24\x04\xae\x5c\x9b\x46\x7f\x73\x1e\
+\xc6\x06\x5d\x36\x74\x97\xa9\xde\xae\x01\x0b\xdc\x6e\xf4\xe2\x0f\
+\x34\x1c\xd3\x88\x67\x36\x64\x33\xf7\xc5\x3c\xc0\x4a\x30\xc4\xff\
+\x00\xbf\x14\x94\x56\xb4\x59\x93\x3e\x7d\xb1\x4a\x20\xb9\xcf\xce\
+\xf4\x79\x2f\xa3\x4a\x49\x4c\x5a\x3e\x69\x16\x26\x4d\xfc\x54\xf6\
+\x3d\x7e\xe9\x56\x21\xf8\x7f\xe2\x81\x7f\x66\x95\x09\x8b\x50\x0a\
+\x4c\xf3\x4a\x52\x0b\xc7\xaf\xf0\x8a\x53\x52\x3c\x72\xfe\xbf\xd5\
+\x09\xb2\xdb\x77\x73\xfb\x51\xb1\x03\x97\x1b\xbf\x5e\x39\xad\x55\
+\x63\x10\x93\xcf\x5c\xd3\x97\x62\xf7\x33\x87\x98\xd6\x92\x55\x6a\
+\x5b\x06\x49\x92\x2f\x9e\xb4\x9b\x1b\xa3\x5f\x9f\x7f\x9d\xe5\x12\
+\x47\x27\x65\xef\x9c\x69\x1b\xd1\x22\x95\xaa\xe0\xe9\x6b\xf3\xc5\
+\x08\x2d\xe0\xd1\x6f\x6f\x0f\x1c\x6d\x4b\x8e\x48\x9b\xbd\x5f\x8a\
+\x29\x5e\x5e\x96\xd7\xb5\xbc\xd0\x25\x13\x7d\xe8\xca\x02\xa3\xe0\
+\x4d\xea\x58\x66\x3b\xfa\x47\xee\xb4\x50\x50\x13\xd4\xda\x3b\xf7\
+\xe7\x4a\x85\x23\x13\x10\x4d\x98\xd7\x79\xc1\x8a\x13\x02\x5c\xa8\
+\xbc\xe1\xfd\x7c\xd0\x09\x66\x58\x1b\x25\x8c\xde\x31\x9d\xf7\xac\
+\x76\x1b\x86\x19\x77\xf1\xbb\xbe\x29\x53\x62\x0b\x66\x19\xf4\xb4\
+\xc6\x73\x6d\xe8\xbd\xe1\x88\x96\xb6\x30\xbf\xed\x04\x31\x2a\x88\
+\x08\x24\xbb\x69\xb1\x46\x8c\x31\xc4\xfc\x62\xa0\x23\x62\x61\xbe\
+\xbc\x96\x6f\x3f\xf3\x37\x6f\x72\xb5\x76\xf9\xac\xdd\xbd\xcf\xf8\
+\x24\x4d\xf7\xae\x9f\x0f\xe5\x5f\x5b\xf3\x7b\x63\x4f\x8a\xe9\xf0\
+\xfe\x53\x92\x2c\xdb\x3b\x6d\x5f\x17\xb3\x59\x3b\x7b\xab\x37\x6f\
+\x62\xa2\xa5\x11\x53\x2e\xc8\xed\x74\x89\xe6\xb2\x08\x6f\x77\xb9\
+\xeb\x43\xa9\x67\x17\x98\x89\xe6\xa5\x24\x04\xdd\x39\xd6\xd5\x0b\
+\x0c\xc7\x1d\x9b\xde\xac\x10\x83\x77\x66\x5d\x5d\xfd\x36\xad\x04\
+\x83\x18\xfd\xa1\xe2\x8a\x81\x00\xde\xdb\x6b\x77\x3b\xd3\xcb\x2f\
+\xda\x73\xf3\x7f\x4a\x65\xb1\x75\xc3\x8f\xf3\x89\xae\x9f\x0f\xe5\
+\x44\x30\xce\x3a\x74\xad\x29\xb6\x9f\x6d\x71\xfb\x34\x6d\xc0\x23\
+\x16\xf5\x8f\xdd\x68\x13\x90\x3a\xed\x7e\xdb\xfa\x54\xbc\xc6\x52\
+\x11\x8d\x2d\x8b\xc7\x13\x4a\xc1\x24\xc1\x7c\x97\x1d\xad\xf8\xa6\
+\x32\x0a\xc1\x22\xed\x17\xb6\xd3\xfd\xa2\x97\xf0\x48\xb2\x16\xbc\
+\xda\x79\xa0\xd8\x26\x41\x66\x95\x9f\x82\x33\x11\x68\x62\xdb\x73\
+\x14\xa2\xd8\xee\xfd\xd2\x6e\xa2\x2e\xe7\x3f\x33\xff\x00\x12\x48\
+\xa0\x4a\x26\xfb\xd3\x8b\x03\x38\xcd\xaf\xbf\x14\x05\xca\xed\x9d\
+\x7e\x9f\x49\xa4\x16\x09\x3a\x34\x4e\xb1\xda\x7e\x69\x46\xf6\x9b\
+\x6f\xf1\x53\xd8\xf5\xfb\xa5\xa4\x5b\xf7\x7a\x35\x55\x9f\xc1\xe3\
+\xd6\x92\xe1\x8b\x7d\xfc\xd4\x46\x67\xad\xf1\x88\xa8\x24\x2c\x4f\
+\x31\x4a\x08\x57\xc5\xf3\x8f\x9a\x50\x41\x4d\xcd\x2d\x31\xe6\x90\
+\x84\x53\xa7\xde\x97\xd3\xee\x82\x30\x23\xcd\x09\xcb\xe9\xdb\xea\
+\x9c\x13\xaa\x2f\x69\x69\x18\x48\x4d\xc1\x4b\x5f\xeb\x6a\x45\xe0\
+\x1b\xb7\x7f\x66\xd6\xc5\x28\x8f\x64\xb3\x95\x7e\xe9\xc8\x5b\x8b\
+\xa3\x6b\xbf\xc3\xa9\x49\x24\x47\x8b\x68\xef\x53\x84\x84\x1d\x7b\
+\x1c\x5a\xed\xfc\x50\x33\xce\x80\x26\x76\x89\x75\xda\x99\x84\xb2\
+\x08\x62\x62\xfd\x6a\x2a\x24\x2c\x84\xf9\xfa\xdb\xcb\x62\x23\xc7\
+\x3b\x66\xe8\xff\x00\xb5\x1c\x05\x91\xc4\xa9\x69\x0a\x31\x2d\xba\
+\x96\xcf\x3d\xbb\x51\x5a\x45\x41\x9b\xc4\xc7\xb5\x59\x62\x42\x51\
+\x77\xce\x33\x3f\xa2\x9b\x8e\x70\xc5\xb4\xeb\xff\x00\x22\x6d\x13\
+\xc6\x6b\xf5\xfe\x2a\x24\xd9\x8b\xc4\x6b\xff\x00\x06\x53\xb6\xf5\
+\xba\xbf\xbf\x4b\xb3\x8a\x24\xcc\x76\xfe\x47\x7a\x23\xf7\x8e\xd8\
+\xc6\xf5\x36\x53\xd5\xf6\xbf\x5d\x3f\xee\x6e\xde\xe5\x28\x97\x4c\
+\x74\x1f\x6a\x4e\x6f\x89\xd7\x19\xbf\x8a\x70\x61\x58\xe7\xbd\x99\
+\xf3\x8c\x44\xd2\x09\x7c\x4c\xc3\xbc\xd2\x41\x30\xde\x77\xd6\x1c\
+\xb8\xe6\x99\x11\x36\x9d\x67\x4e\xb5\x8c\xcb\xd2\x6f\x98\xde\xba\
+\xfc\xbf\xb5\xa5\x76\x77\xc7\xbd\x48\xfa\xce\xb8\xa4\xbd\xda\xcb\
+\xd3\x77\x6a\x7b\xec\xcb\x11\x3d\x7f\x3a\x7c\x05\xc8\x05\xa3\x17\
+\xba\xe9\xe9\x25\x32\x02\x10\x82\xcc\xc0\x70\x5a\xc4\xb7\x82\x0d\
+\x58\x15\x1b\xac\x97\xdf\x3c\xb9\x8f\x5a\x52\xab\x4f\x3c\xc9\xe7\
+\xfd\x9a\x5a\x48\x11\x11\x91\x5e\xcc\xde\x2f\xfe\x41\x6e\x75\xfc\
+\xce\x31\x06\xa4\xf1\x4d\x17\xa5\x27\xb4\xf3\x40\x21\x7a\x99\x3d\
+\xff\x00\x78\xa3\x58\x1b\x23\x13\x7c\x8c\x6f\xed\xcd\x25\xe2\x59\
+\x91\x98\xb9\xe2\x3e\x78\xa0\x44\x01\x41\xc9\x3a\xfe\xd7\xb0\xa2\
+\x02\x96\x5b\x4a\x71\xff\x00\x06\x19\xa9\xec\x7a\xfd\xd2\x08\x63\
+\xb5\x47\x77\xd3\xea\x87\x22\x0e\x62\x3e\xaa\xde\x17\x17\x35\xe7\
+\x1b\xd3\x22\x91\xd1\x89\xc7\x5e\x67\xa5\x6a\x40\x78\xeb\x37\xdb\
+\x8b\x50\x05\x13\x26\xfe\x2f\xfe\xd4\xf6\x3d\x7e\xe9\x54\x2d\xf8\
+\xeb\x59\xbb\x7b\x94\x27\xc3\xd8\x3e\x6a\x06\x25\xf3\xd1\xff\x00\
+\x77\xa3\x29\xb0\x6f\xda\x6a\x65\x95\xdf\x10\xfe\x9f\x4a\x30\x11\
+\x37\x85\xe8\xe7\xb4\xd5\xd0\x89\xea\xff\x00\xbf\xb8\xa2\x85\x26\
+\x5d\x73\x25\xd6\xa6\x19\x1b\x77\xf3\x4d\x80\x20\x9c\xe3\x5f\x63\
+\xda\xa4\x0e\x1e\x22\x35\xfd\x25\x32\x12\xc2\xe6\x6f\x06\x2f\xe9\
+\xd2\xa3\x19\x2e\x86\x93\x8f\xd6\xf6\xa8\x42\x03\x33\x79\x8c\x9e\
+\xf4\x29\x82\xc4\x45\x11\xeb\x32\x22\x09\x8b\x94\x58\xc2\x03\x24\
+\x15\x6e\xea\x95\x31\x2b\x01\x86\x30\x08\x82\xa5\x8b\xe6\x35\xc6\
+\x46\xdb\xc5\x33\x7d\x36\x67\x17\x5c\x71\x69\xde\x8a\x56\x8a\x36\
+\x56\xf1\xd6\x4a\xb1\x33\xeb\xef\x77\x8c\xbd\xa8\xa5\x20\x96\xb8\
+\xdb\x5f\x83\xb5\x2b\x2c\x88\x2c\x67\xe7\x0f\x9a\x37\xb2\x3a\xb7\
+\xb9\x1b\x5e\x64\xf1\x35\xab\xb7\xcd\x62\xef\xec\xff\x00\xe1\xc2\
+\x7d\xbc\xfb\x57\x5f\x97\xf6\xa2\x0c\xba\xe6\x36\xe5\xa4\x06\xfd\
+\x2f\xed\x7b\xe9\x31\x1d\x4a\x24\x49\xb5\xfa\x6b\xb3\xf7\xd6\xad\
+\x6b\xf3\xa6\x2f\xe7\x8a\x64\x89\x6f\xb6\x31\x3b\xfe\x7f\xe6\x2e\
+\xfe\xcd\x66\xed\xee\x57\xc5\xf1\x5f\x8e\xc5\x04\x93\x18\xf8\xa9\
+\x97\xb1\xc6\x75\xeb\xb5\x02\x14\xdf\x06\x73\x8b\x1b\x73\xd2\xb2\
+\x7c\xed\x8d\x3d\x7b\xd0\xa6\x57\xd8\xed\x82\x5c\x6b\x50\xd3\x43\
+\x5e\xd1\xbf\x4f\xda\xb7\x71\x22\x4f\x13\xf6\xd3\x3c\x17\x8f\x36\
+\x6d\xf3\xac\xd4\xd0\x4b\x3d\xf3\x3d\x78\x6c\x71\x4e\x93\xe3\xd5\
+\xfb\xa4\x40\x86\x06\xee\x7a\x63\x2f\x31\x51\xb4\x17\x97\x29\x79\
+\xdf\x68\xa8\xc9\x2c\x04\x68\x68\x74\xfc\x52\x08\x5c\xcc\xff\x00\
+\x27\x1f\xb8\x97\x60\x2d\xdb\x17\xff\x00\x78\xfb\xa9\xfc\x5a\xde\
+\xf9\x8b\x76\x29\xdf\x18\xef\xf9\x7e\xb1\x4d\xb9\x09\x24\x9c\x39\
+\x8e\xd9\xd2\x89\x4c\xc0\xd6\x27\xce\x3e\x7d\xe8\x6b\x28\x88\x8b\
+\x43\xfb\x34\x09\x44\xdf\x7a\x78\x58\xd7\x7d\x9e\x6a\x7b\x1e\xbf\
+\x75\x3d\x8f\x5f\xba\x9e\xc7\xaf\xdd\x40\x86\xc7\x05\xf0\xee\xd0\
+\x1a\xb3\xdb\xd6\x9e\x88\xe7\xfd\xa4\x26\xf3\xb5\xef\xa7\x3e\x62\
+\x86\x18\x77\xe4\xc6\x97\x7b\xf3\x4a\xd0\xd7\xdf\xfc\x3b\x56\x2e\
+\xfe\xcf\xfc\x21\x16\x0b\xde\x8a\x30\xbc\x8e\x74\xf1\x9f\x4e\x6a\
+\x0c\x4a\x45\xbc\x44\x45\x02\x24\x81\x68\x88\xdb\xe3\x9a\x07\x9b\
+\x25\x94\xc8\x12\x19\xde\x3a\xf8\xa6\x11\x89\xa7\x67\x1d\x78\xa3\
+\xd1\x4c\xad\x16\xbc\xfd\x27\x7a\x72\x81\x29\xe8\xc9\xf1\xfb\x28\
+\xce\x55\x22\x06\xe5\xfa\x71\x6e\xb7\x68\x24\x20\xe8\xfd\x7a\x34\
+\xba\x84\x12\x53\x29\x8d\x73\xe7\xa5\x2e\x60\x06\x58\xc7\xb7\x0e\
+\x69\xc9\x0c\x00\x18\xba\x91\x37\x8b\x91\x25\xc3\x70\x12\x34\x89\
+\x82\xc4\x7d\x7f\xbc\xd3\xf5\x28\x3a\xef\x3a\xc7\x77\xbd\x4d\x4f\
+\x22\x2e\x8d\xf7\xf6\xe7\x5b\x54\x2d\x55\xb8\x29\x91\xb4\x4d\xba\
+\xe6\x8f\x51\x13\x8d\xf4\xc2\xbc\xb4\x80\x90\x75\x94\xeb\x8c\x77\
+\xfd\x03\x45\x9e\xfd\x6f\xcc\xc7\x9a\x8a\x9a\xb8\xce\x71\x77\x76\
+\xb0\x80\x5d\xf2\xf6\xa0\x28\x3b\xed\x9d\x63\x7e\x3f\xb8\x3a\xa7\
+\xc4\xdb\xe7\xfe\x62\xef\xec\xff\x00\xc7\x09\xf6\xf3\xed\x5d\x7e\
+\x5f\xda\x2f\x2e\xf7\x6d\xde\xf5\x6b\x5f\x9d\x31\x7f\x3c\x56\x4f\
+\xde\xef\xcd\x4b\xa9\xd9\xc6\x31\x7b\x4d\x1a\x0b\x47\xae\x35\xcf\
+\xfc\xc5\xdf\xd9\xff\x00\x8a\x1b\xaf\xb3\x56\x1f\x8c\x36\x3a\xf4\
+\xee\xed\x40\xe5\x79\xdb\xb6\x4f\x6b\x62\xa0\x61\xaf\x7c\x98\xff\
+\x00\x1b\xe9\x7a\x42\xcb\x3c\x6f\xb7\x38\xbc\x5e\xae\xec\xf6\xf7\
+\xd7\x3e\x91\x4c\x84\x46\x33\x9c\xbf\xa2\xdd\x2b\xde\x7b\xd0\x28\
+\xc2\x35\x9e\x85\x58\x16\xf2\x7a\x61\x3b\x9f\x54\xaa\x43\x0b\xf5\
+\xcc\xf8\xcf\x78\xd2\xb7\x04\x31\x1e\xbf\x0f\xf6\x89\x32\x0c\xb6\
+\x92\xfa\xba\x3c\xb9\xb5\x02\xf5\x2d\x6e\x66\x62\x24\xc4\xf3\xd2\
+\x9e\x60\x4e\xe6\xd8\x9d\xe7\x9b\xf3\xda\x85\x25\xd4\xb2\x5f\xf2\
+\x5f\x6a\x19\x72\xc2\x0e\xba\x58\xf9\xa8\x21\xca\x4b\xf7\x9b\x54\
+\x6a\xdd\x6b\x68\x3e\xd9\x9e\xd5\x88\x35\x22\x20\xd9\xa5\xcd\x5d\
+\xad\xad\xe3\x6d\xb6\x8b\x54\x19\x05\xae\x9a\x44\xfd\x45\x44\x1c\
+\x97\xfd\xd7\x18\xac\x65\x0c\x0e\x2e\x43\x3d\x8f\xe5\x23\x81\x1d\
+\x85\xdf\x68\xda\xa5\x45\x9d\x67\x8c\xc6\x94\x10\x89\xbc\xe7\xb5\
+\x20\x86\x3b\x50\x6e\x97\x18\xa2\x40\x5b\x33\x72\x88\xe8\x98\x9f\
+\xf3\x8e\x97\xd6\x28\x1e\x23\x98\xf2\x43\xde\x3b\x73\x46\xe2\x58\
+\xd5\x93\x8c\x35\x08\xad\x9a\x4f\x4d\x33\xcd\x66\x00\x5e\x3f\xcd\
+\xbd\x68\x02\x46\xe7\x24\x5e\xdd\x71\xeb\x5d\x7e\x5f\xda\x95\xc4\
+\x93\xfc\xdd\xa2\x61\x08\xfe\xcf\xd1\xda\x9c\x15\x4e\x76\xb3\xef\
+\x63\x8a\x9e\x65\x25\x81\x0d\x5f\x96\xa6\x57\x09\x46\x73\x17\x8f\
+\xbf\x46\x85\x4a\x78\x3f\xce\x28\x56\xe0\x31\x2f\x4f\xf6\xa6\x52\
+\x90\x5b\xf5\x7e\xd7\xee\xa3\x80\x85\x1e\x24\xa1\x99\xb6\xf3\x6b\
+\x67\x7f\x11\xa5\x14\x03\x00\x26\xcb\x29\x86\x70\xcd\x42\xb1\xbc\
+\xd1\x5d\xb5\xfb\xa2\x08\xdb\x02\x06\x6d\x7f\xe0\xf0\xec\xf4\xca\
+\x26\xd3\x3c\x6b\x14\xb7\xa2\x84\x24\xb0\xf1\x51\x79\x60\xdd\x73\
+\xef\x1c\x68\xd1\xd2\x95\x74\xad\x30\xba\x97\x67\x62\xc5\x3b\x4c\
+\x29\x3b\x2d\xb6\xb9\xe6\xa0\xfd\x1d\xa1\x25\x62\xff\x00\xe5\x2e\
+\x57\xd7\x1a\x4e\x3a\x54\xf2\x08\x7a\x71\x8c\x69\x52\xc3\xaf\xcf\
+\x06\xf5\xa3\xbf\xc5\x19\x47\xb7\x8f\x6a\xbb\x87\xb1\x6f\x45\x04\
+\x4f\x8d\xf3\x17\xb7\x8a\xd1\xdf\xe2\xb0\x77\xf6\x69\xcd\xb9\xb6\
+\x93\x17\xc5\xf1\x8a\x79\xdd\x3f\x3f\x59\xb1\xc5\x5e\xc5\xf3\xce\
+\xfc\xed\xae\x6a\xd1\xbe\xb3\xbf\x6e\xc3\xf1\x50\x63\xd7\xb6\x6f\
+\xe2\xa3\x44\x91\x9c\xe6\xc6\xb9\xac\x8c\x3a\x3f\x93\x7a\x64\x4b\
+\x3a\x37\xf9\x6a\x7b\x1e\xbf\x74\xaa\x16\xfc\x75\xff\x00\x98\x3b\
+\xfb\x35\x88\xfd\x77\xe4\xfe\xd4\xb8\xe7\xfb\xcb\xec\xf4\xae\x47\
+\xa7\xf1\x56\xf3\x11\xa4\x7c\x15\x97\xa3\xef\x42\x49\xcf\xbd\xa5\
+\x4b\x0e\x27\xf5\xb7\xa1\x46\xe2\xc4\xed\x7d\xdf\xda\x94\x38\xb2\
+\xd6\xfd\xad\xbd\xaa\x41\x65\xea\x6d\xbe\xaf\x6d\xbb\x50\x9e\x1b\
+\xf5\xc4\x4e\x5b\xfa\x52\xae\xc3\x24\x76\x83\x11\xeb\x9a\x10\x99\
+\xfc\xbe\xe5\xfd\x26\x87\x20\x30\x91\x8d\x36\xcf\xec\xee\xe0\x03\
+\x75\xc7\xed\x73\xbc\x5a\x8b\x3a\x84\x5b\x65\x71\xeb\x8a\x9e\x90\
+\x31\x21\x66\x7a\x3c\xe6\x8e\x16\x42\x62\x4f\x1e\xb3\x41\x6c\x10\
+\x5b\xef\x43\x6b\xba\xfe\xfd\xe6\x80\x14\x9f\xcd\x1f\x2a\xfe\x87\
+\xc7\xad\x30\x0c\xe2\x31\xe9\x1d\x6f\x56\x57\xf5\x2d\xd7\xaf\xe6\
+\xae\x32\x18\x1a\x21\x90\x22\x31\xae\x9e\xca\x53\xa4\xae\x91\xe2\
+\x7e\xbc\x73\x48\x0c\x28\xf5\xcd\x30\x71\x1c\x74\x67\xd3\xdb\x9a\
+\x44\x56\x2f\xa7\xed\xaa\xda\x88\xbe\x37\x85\x9f\xdf\x65\x30\x42\
+\x17\xeb\x81\xac\xc5\x87\xda\x7c\x7a\xf1\x48\xc2\xbd\x97\x67\x97\
+\x6a\x10\x4c\xa6\xef\x6f\xf8\x46\xb0\xd4\x02\x10\x6f\xd7\xfa\xb4\
+\x82\x20\x46\xa4\xe3\xa7\x7f\xe5\x27\x78\x73\x3f\xee\x2f\x48\x64\
+\x94\x63\x19\xe7\x93\xda\xa1\x1a\x0c\xe7\x27\x5c\xef\xdf\x8a\x06\
+\x40\x5d\xb6\xe8\xfd\xfa\x5b\x6a\x5c\x03\x22\xee\xdf\xcc\x5f\x67\
+\x5a\xbb\xa2\xa2\x4b\xb1\xeb\xfe\x51\x56\x20\x88\xb9\xa7\xbe\x5a\
+\xb8\x72\x36\x61\x17\x62\x3a\x78\xa3\x18\x52\x52\xe3\xb7\x9c\x31\
+\xde\x8d\x5d\x48\x23\x17\x98\xdb\x55\xef\xda\xa1\x8b\x88\xba\x9c\
+\xb8\xbf\x9d\xe6\x81\xa9\x4a\xc3\x06\x5e\x63\xf6\x69\xaa\x35\x26\
+\x46\x34\x6c\xdf\x18\xd0\x4a\x3c\x86\xed\x39\xb3\x26\x58\x16\xe2\
+\x6b\x9d\x72\x11\x9c\x46\xaf\xef\x8a\x78\xe0\xc4\x5f\x49\x99\xfd\
+\xe6\x83\xcc\xb6\xcd\xef\xab\xf9\xd3\x6a\xd1\xdf\xe2\x94\x27\xf6\
+\xb5\x69\x9e\xdf\xe3\x68\xed\xcd\x66\x89\x8f\x53\x18\xbe\xba\xd2\
+\x73\x7c\x4e\xb8\xcd\xfc\x54\xa8\x99\x8d\x73\x9d\xbc\xde\xbe\x2f\
+\x8a\x70\x98\x88\xcf\x4a\xe5\xf0\xf4\xdd\xe6\xa0\x33\xe2\x6c\x62\
+\xff\x00\xb9\xae\x5f\x0f\x4d\xde\x6a\x50\x5c\xe8\x60\x88\xd2\x6d\
+\x41\xc1\x99\x4e\x48\x89\x3b\x89\xd4\x6b\x27\xed\x69\xf8\xec\xff\
+\x00\xd3\xf6\xed\x59\xbb\x7b\x94\xa5\x71\x11\x9e\x94\x82\x58\xfc\
+\x6a\x26\x9b\xd3\x4a\xc3\xd2\xf1\xd7\x97\x1e\x68\x12\x49\x79\xfc\
+\xbb\x51\x52\x01\xd1\x19\xb5\xed\xdf\xf4\x91\xcd\x9b\xcf\x12\xdf\
+\xa7\xf9\xd6\x8d\xe0\x8c\x49\x1c\xb1\xab\x53\xd8\xf5\xfb\xac\x01\
+\x31\xa0\x7f\x6a\xc8\x22\xf9\x0f\x48\x63\x3e\xfc\x52\xb3\x0c\x95\
+\xb1\x29\x7c\x99\x3f\x4d\x16\xf6\x47\x63\xa7\x4c\x94\xc9\x6e\x91\
+\x31\x6c\x30\x5b\x41\x7b\xe6\xd4\x84\xc5\xd5\x64\xcf\xf2\x78\xa1\
+\x8a\x48\xc3\x30\x5a\xf1\x69\x89\xd3\x9a\x25\xc7\x80\xca\xf6\xec\
+\xed\xe5\xe6\xa7\x0e\x58\xd6\x52\xbd\x74\x78\xc6\xed\xca\x69\x50\
+\x4c\xbb\x75\x7d\xbb\x25\xe9\x6d\x8d\x7f\x7e\xdb\x15\x32\x36\x2c\
+\xdb\x39\xdf\xde\x80\x89\x7a\xbd\x79\xe5\xa4\xe9\x8c\xe4\x1b\x31\
+\xfe\x50\x19\x23\x8c\x78\xd7\x4d\x26\x68\x13\x13\x69\xb3\xd2\x63\
+\x98\xb7\xdd\xe9\x44\x82\xf1\x6f\x6f\xdc\x5c\xbd\x4d\x62\x30\x2c\
+\x6b\x93\x4e\x9f\xb3\x45\xc0\x23\xaf\x06\xb4\x37\x0c\x30\x41\x99\
+\x23\x4b\xe2\xa1\x60\x19\xc7\x7f\xaa\x24\xd6\x6f\xaf\xed\xa8\x20\
+\x27\xf5\xaf\xa7\xf9\x59\x70\x2c\x48\xcf\x7f\x2e\x3d\x2c\x50\x19\
+\x82\x3b\xdf\xa7\xa9\xde\x9d\x88\x4d\x49\xd6\x76\xac\x62\xf7\x4c\
+\xed\xe9\x9a\x32\xc9\x61\x7c\x4f\x2e\xa7\x9a\x42\x46\x51\x3a\xdb\
+\xbf\x4f\x3a\xe2\x86\x4e\x50\x43\x8c\x9b\x7f\x29\x55\x0c\xc1\xf4\
+\xf2\xf3\x3a\x5a\x95\x08\x06\x9b\x05\x00\x2e\xf2\xf6\x6f\x8b\xdd\
+\x43\x94\xbb\x5d\xe9\xe7\x13\x52\xbd\x48\x26\xb9\x9b\x10\xb1\x3d\
+\x69\xa1\x92\x25\x8f\xcd\x18\xc7\xc5\x28\x89\x81\x69\xc8\xcf\xba\
+\xf1\x53\xe3\xcc\x67\xaf\x4d\xa9\x42\xbc\x43\x39\x0d\xa7\xf4\x46\
+\x1d\xe8\x90\x8c\x69\x1e\xb8\xb7\x17\xb5\x09\x10\x30\x16\xb2\xf6\
+\xe3\x0d\x41\x05\x39\x74\x7f\xd6\x8e\xae\x2f\x09\x21\xb5\x9c\xe8\
+\xb6\xcd\x22\x03\xce\x82\x3f\x27\x5e\xd4\x09\x66\xb0\x84\x48\x34\
+\x79\x26\x77\x3b\x54\xe4\x39\xcb\xa6\x5d\xad\xfb\xc0\xd0\x4c\x8c\
+\x87\xb3\xe8\xf0\x34\x65\x84\x23\xa5\xaf\x63\xef\xcd\x68\xef\xf1\
+\x4e\x13\xb6\xfd\xeb\xaf\xcb\xfb\x56\xd7\xd5\xaf\x0f\x34\x5a\x6f\
+\xc6\x32\xfe\xd6\xa7\x81\xfa\xd9\xef\x1d\xa2\xa4\x29\x9d\x59\x88\
+\x65\xf8\x8a\x95\xa1\x19\x92\x66\x75\xd5\xa1\x18\x0e\xda\x73\xcd\
+\xdf\xaa\x79\xbe\x06\xfa\x59\x5f\x25\x69\xa5\xa3\xbe\x2d\xab\x51\
+\x34\x00\x99\xca\x09\x54\x09\x54\x18\x25\x5d\xd5\xbd\x63\x62\x76\
+\x87\xda\xaf\x69\xf1\xae\x6d\xe3\x9a\x64\x60\x3c\xe7\x5e\x29\xdd\
+\x77\x10\xe7\xc1\xce\x66\x6f\xb5\x49\x72\xe2\xc2\x76\x73\x37\xf1\
+\x4b\xbe\x72\x9b\x3c\xfd\x14\xca\xa2\x4e\xf8\x94\xfd\xce\x9a\x53\
+\xea\x0d\xbe\x03\xb5\xb8\xd3\xc3\x19\x65\x23\x9d\x0c\xf4\xd3\xa6\
+\x22\xb7\xaa\xc4\xc0\xab\x3f\x5e\x8c\xd4\xe9\x20\xbe\xc2\xd6\xf5\
+\x1f\x42\xf4\x42\x01\x6d\xa7\x42\xfb\xea\x54\x9d\x84\xdb\xbb\x3d\
+\x6c\x99\xb5\xaf\x48\xae\xce\xf6\x97\x3d\xf9\xed\x14\x48\x08\x04\
+\x5e\xd9\xd2\xed\xb1\xeb\x52\x25\x51\x7b\xeb\x6d\x66\x3f\x71\x61\
+\x22\x72\xbf\xec\x74\xa9\x20\xbb\x2e\x27\x05\x20\x8a\x92\x26\xd6\
+\x85\x2d\xa4\x5a\xf4\xfa\x49\x56\xd0\xcd\xe0\x9f\xf3\x9a\x0c\x4a\
+\xca\x0b\xde\x6d\xed\x27\x6a\x71\x13\x76\xfb\x6f\x1a\xef\xb5\x05\
+\x59\x26\xfd\x51\xf9\xa1\xe6\xd2\x6d\x7b\x79\x8c\xff\x00\x85\x31\
+\x3c\x63\xbc\x53\xa2\x11\x6e\xbf\xaf\xe9\x40\xd5\xd6\x52\xd8\x8a\
+\x55\xf6\x9d\x3e\x7d\x2a\x26\x8f\xfa\xde\x99\x4d\x92\x4d\xb4\x05\
+\xbc\xdf\xbf\xc9\x48\x1c\x4b\xdb\x28\xe9\xcf\xad\x14\x05\x8e\x3b\
+\xcf\x9d\x36\xa2\xb6\x3d\xa5\x9c\xe5\x73\x8e\xd5\x29\x96\x1b\x6f\
+\x50\x01\x00\xea\x3c\xcf\xbb\xfc\xa2\xb3\xbc\x86\x9d\x5d\xb7\x83\
+\xcd\x24\x48\x59\xd3\x3b\xe4\x8a\x72\xd2\x37\xcf\x23\xe7\x7a\x5b\
+\xd8\xe7\xe3\x5f\xaa\x58\x00\x57\x5c\x8e\x74\xfd\xf0\xb3\x41\x0d\
+\xec\xcd\xba\xe6\x85\x8b\xcc\xa3\x16\xb3\xb6\xf6\xdb\xd6\x9a\xdb\
+\x32\x86\x62\xf7\xbd\xb5\xf3\x4b\x18\x00\x22\x59\x94\x25\xfb\x73\
+\xb5\x3a\x39\x60\xc8\x57\x17\x15\x6e\x13\x5a\x3e\xf5\x95\x80\x84\
+\x67\x4b\xf3\x9d\xe8\x93\xca\xb9\x7c\x1e\x9f\x34\xe1\x2c\x4e\x25\
+\x82\x6e\xda\x80\x50\x82\xec\xae\x9a\xe9\x63\xaf\xb5\x0a\xd2\xa2\
+\x0d\xf4\x60\xb3\x63\xa7\x9a\x68\xcc\x12\x17\x12\x6f\xf8\x3e\x2f\
+\xbd\xb1\x65\xa2\xfe\xf5\xc4\xc0\xe0\x1b\x83\xba\xfb\xba\xf4\xd2\
+\x87\xe0\x80\x80\x35\x9b\xf3\xaf\xf6\x99\xb9\x61\xba\x5f\xfc\x67\
+\x9a\x9b\xca\x42\xb2\x20\xc5\xbd\xfd\x2a\x48\x38\xd9\xbc\x93\x19\
+\xbc\x5b\xd6\x5a\x31\x39\x52\x9a\x30\x93\xd3\x56\xa7\xe4\x83\x98\
+\xf9\xdb\xf1\x66\xa3\xec\x02\x36\xcf\x87\x7f\x8a\x89\x49\x18\x07\
+\xdb\xb7\xb5\x7c\x5f\x14\xa0\xba\x7b\x52\x73\x7c\x4e\xb8\xcd\xfc\
+\x52\xac\x2b\x1a\xcc\xf3\x6f\xc7\x5a\x41\x25\xf5\xa2\x2e\x7b\xcf\
+\x69\xcd\xdf\x8e\xa5\x0b\x37\x63\xce\xbf\xbb\xdc\xda\x6d\x9b\x0c\
+\xfa\x6c\x75\xf1\x23\x5d\x49\xe7\xf8\xa9\xe0\x22\x2f\x62\xf7\x71\
+\x31\xde\x81\x60\xc6\xb6\xe7\xaf\xb5\x1c\x88\x86\xd9\xce\x5f\xe3\
+\xf1\x57\xb9\xea\x16\x2e\xfe\xd2\xaf\x5b\x6d\xda\x4c\xe9\x1d\xe6\
+\xb9\x7c\xbd\x77\x78\xa3\x09\xc6\xcf\xc5\xe2\xee\x69\x27\xc2\xfd\
+\x2d\xe7\xb5\xa8\x71\x48\x2c\xf7\xb1\xde\x89\x45\x5d\x99\xb6\x77\
+\x7b\x76\xa5\x5e\x6c\x71\xce\x33\xf8\xbc\x53\xda\x05\xa8\xf5\xfe\
+\x9e\xb7\xa2\xc2\x02\xc5\x8e\x9b\xff\x00\x9a\x54\xa6\x8d\xe1\x31\
+\x19\xbe\x7e\x28\x17\xbc\x08\xcf\xf8\x1f\xda\x93\x12\x1b\x16\x7d\
+\x37\xc7\xaf\x34\xc2\x29\x33\x6d\x75\xfe\xfa\xf1\x4e\x60\xc9\xc3\
+\xed\x3d\x28\x30\x78\x5d\x4e\xa6\x6d\x17\xee\xd2\x0b\x86\x48\x3a\
+\xbb\x6a\xae\xdf\x14\x1b\x69\x10\xda\x0d\xad\xa7\x13\xee\x51\x37\
+\x06\xde\x23\x13\xac\xff\x00\x4a\x32\xa9\x93\x30\xb8\x1e\xbf\xec\
+\xf4\xa3\x28\x13\x40\xcc\x93\x82\x71\xfe\xd0\x6c\xcd\xa2\x25\x79\
+\x9e\x91\xf1\xb5\x59\x6d\x8d\xbc\x2d\x8d\xd3\x4b\xef\x14\x4a\x00\
+\x52\xe2\xf5\xb6\x96\xd6\x80\x51\x10\x99\x49\x4c\x97\x3a\xfe\xbd\
+\x0c\xa6\xff\x00\x10\x9f\xdf\x8a\x1d\x7f\xc7\x7a\xd4\x07\x7f\xf3\
+\x36\xf1\xcd\x19\x86\x44\x44\x4d\xef\xad\xf6\xa2\x25\x65\xcb\x6d\
+\x6f\xc4\xfb\xd2\x08\x12\x7a\xfe\x99\x9a\x29\x0c\x0b\x9d\xf2\xf7\
+\xc6\xde\xf4\x66\x49\x32\xd8\x5f\xea\x3e\x95\x04\x03\xcb\x9c\x4d\
+\xe3\x3a\x9f\x34\xa6\xd5\x18\xde\x5f\xe4\xef\x7e\x29\x6c\xb9\xf4\
+\xd2\xf7\xea\x53\x8a\x05\xad\x7d\x5e\xfc\x2d\x1e\xd2\xc4\xe9\xd7\
+\xd9\xbf\xa5\x5e\x96\x67\x1a\x7e\x9d\xf4\xa6\xb0\x26\x7a\xfd\x1b\
+\xd2\x61\x98\x32\x9f\xba\x75\xac\xc1\x73\x9e\x27\xe2\xa2\x91\x32\
+\x86\x2f\x96\x3c\x53\x4c\x24\x32\x10\xeb\xcf\x1d\xc6\x28\x68\x25\
+\x16\x59\x2a\x5b\x98\xd0\xda\xa5\x11\x20\xdc\x8c\xce\xd6\xbb\x45\
+\x50\x5f\x46\x12\xde\x47\x11\x48\x01\xc0\x24\xcb\x68\xef\x6e\x9d\
+\xe8\xfa\x24\x4c\x72\x45\xc7\x58\xc7\x3b\x53\x90\x21\xa0\x13\x24\
+\x18\x09\x90\x83\x08\x25\x3e\x0e\x54\xe1\x78\x04\xb7\xcb\xef\x9a\
+\x9f\x72\x40\x13\x5e\xe9\x67\x07\xaf\x34\x26\x9f\x9a\x18\x4a\x49\
+\x62\xf7\x9c\xf6\xc5\x04\x8e\x2d\xb1\xa6\xd8\x75\xd6\x53\x66\x95\
+\x28\x98\x54\x48\x89\xdc\xcb\xf5\x4f\x38\xb5\x46\xee\x73\xe9\x7f\
+\x5a\x52\x82\xb9\x42\x34\x84\x3e\x31\x48\xdc\x55\x62\x00\x3b\x33\
+\xd2\x97\x46\x00\x08\x8c\xda\xf1\x04\x84\x7b\x73\x52\x45\x7a\x10\
+\x06\x7a\xf6\xb8\x93\x5f\xb6\x1b\x60\xc6\x75\xe6\xa3\x6c\xed\xa7\
+\xf7\xb5\x7e\x3b\x15\xec\xfd\xbf\xe4\x43\x78\xa2\x5d\xbc\xf7\xeb\
+\xea\x4e\xed\x1d\xed\xf8\x9e\xd6\x5b\xfb\x43\x52\xe1\x10\xce\x9e\
+\x21\x37\xa1\x28\x6d\x16\x9e\xbf\x24\x6f\x57\xa9\x2f\xc6\x67\x48\
+\xd2\x84\x61\x99\xb3\x11\x6e\xdc\xd5\x96\xde\x73\xdf\x1b\xc7\x47\
+\x8a\xc9\x8f\xf6\x3d\xf5\xcf\x7a\x2d\x77\xe3\x19\x7f\x69\x53\xcc\
+\x71\xfb\x3a\x4f\x7a\x0e\xb0\xbb\x31\x6c\xc4\x67\x3c\x7f\x28\x6a\
+\x29\x60\x33\xae\x7d\x5f\xe5\xeb\xe6\xf9\xa8\x5f\x45\xa7\x1c\xef\
+\x6c\xd7\xbc\xeb\x9f\xf6\x88\xcc\x5b\xd5\x57\x15\x06\x9d\xa2\xce\
+\x31\x6f\x34\xa1\x33\x76\x2f\x61\xc7\xe2\x85\x08\x64\x34\xda\xff\
+\x00\x16\x63\xe9\xb2\x0f\xc0\xc6\x46\xd1\xc0\xda\xe5\xe0\xa9\xc4\
+\x04\xac\x3b\x9d\xf9\xfd\x01\xe0\x6d\xc2\x4c\xcc\xb3\xed\xa7\x4e\
+\x99\xa1\x78\x99\x64\x66\xe2\x0c\x4c\x02\x2c\xb5\x36\x36\x51\x63\
+\x1c\xce\x31\xde\xac\x04\x6c\xc5\xe2\x20\xe6\x3f\xbe\xe4\xac\x83\
+\x2e\x04\x38\xbb\x6d\xb3\x7b\xd3\x24\xca\xcc\xc9\x6c\xe2\x3a\xde\
+\xf3\x1d\x29\x91\x14\x22\x1e\xd3\xe9\x1b\x77\xa5\x4b\x59\x72\x76\
+\xff\x00\x6a\x07\x71\x80\x33\xb1\x63\x38\x0d\x68\xf3\x03\x12\xed\
+\xed\xfb\x34\xb0\xcc\xde\xc4\x99\x8e\xbd\x28\x78\x0a\xd1\xc9\x12\
+\x9f\x3e\x78\xa6\x09\x27\x31\xe3\xe2\xb0\x11\x78\xfd\xa6\x7d\x23\
+\xfe\x20\x8c\xd8\xa7\x30\x4b\x6d\xf5\x6d\xeb\x53\xcd\xa7\xda\xfb\
+\x4b\x1a\xd3\x35\x2e\x87\xbe\x2f\xac\xd4\xc9\x09\xcc\xa4\xce\xf6\
+\x71\xaa\x71\xcd\x00\x5d\x9d\xfb\xbf\xdf\x31\x35\x80\xe8\xe2\x3d\
+\xf1\x44\xaa\xb3\xfe\x1f\x4f\x6a\x84\x8d\x99\xeb\x69\xfc\xeb\xe6\
+\x2c\x00\x9c\x97\xf3\xd6\xf4\xdc\xe0\x1b\xed\x7f\xc6\xb5\x71\xb2\
+\x37\x33\xa4\xfd\x1e\x5a\x93\x4b\x54\x39\xb1\x2a\x6f\x0c\x95\x03\
+\x00\x36\x0b\x18\x2e\xb4\xb9\xdb\x9b\x5a\x63\x25\x14\x25\xd2\x3f\
+\x66\x8a\x51\x88\x96\xdc\x40\xbc\x6b\x1c\xf9\xa2\xf0\x1a\x89\x16\
+\x51\x94\xcd\xcd\x3d\x29\x89\x9b\x87\x76\xa1\x80\xdb\x04\xcd\xfc\
+\x54\x82\xe6\x61\x30\x22\xb6\xf0\x4e\x19\xa4\xa1\x15\x6c\x0b\x5f\
+\xa4\xdf\xdd\xa0\x11\x9d\x04\x8c\xdd\x9b\x13\x89\xb1\x1c\xeb\x4c\
+\xe0\x1a\x13\x0b\x99\xe9\xbc\x5e\xd4\xcc\xe0\x65\x2f\x13\xd7\x32\
+\xc3\x64\xd6\xf4\x4a\xa8\x8a\x2c\x30\x81\x8d\x57\x2c\xfc\x91\x69\
+\xa4\x10\xdc\xd7\xaf\x13\xad\x40\xa0\xc8\x33\xd4\x31\x7c\x9c\x56\
+\x6c\xf2\x29\xc2\x5b\x37\xda\xad\xd0\x5a\x55\xfe\xb1\xf5\x51\xb2\
+\xf1\x65\x95\x68\x77\x63\xf3\xc5\x04\x45\x8e\xe9\x16\xf3\xb7\xa5\
+\x04\x49\x82\x30\xcc\x39\x6e\x7a\xed\x48\x2f\x22\x65\xd0\xfe\xfd\
+\x52\x37\x62\x37\x77\x99\xbf\x5c\x94\x3e\xf5\x92\x1b\xd9\x2b\x7c\
+\x71\x4b\x9f\x82\xd3\x77\x9a\xb8\xd2\xe9\x6c\x97\xd3\x13\x39\xe9\
+\x5d\x7e\x5f\xda\x6c\xd7\xbe\x3d\xea\x0c\xfa\x77\xc5\xfc\xd6\x16\
+\xcb\xe1\xbf\x5f\xcd\x02\x19\x33\x1f\xaf\xb5\x47\x43\x1c\x47\xc1\
+\x58\xa8\xfd\x7c\x35\x9b\xb7\xb9\x5e\xe3\xdb\xfe\x65\x2a\xd4\x46\
+\x6c\xcd\x04\x76\x31\x75\xfb\xe6\x7a\x55\xe7\x64\x86\x65\x27\x4b\
+\xe9\xfb\x46\x16\x14\xe5\x73\x08\x21\x66\xd7\xdf\x68\xab\xfa\x0c\
+\x29\x32\x26\xc9\xbe\x3d\xa9\xb0\x9d\x93\x61\xda\x63\x8d\xac\xeb\
+\xa5\x3e\x81\x12\x5a\x6c\xae\x23\xfd\xb6\x29\x31\x8b\xbb\xb9\xe1\
+\x11\xcd\x11\x0b\xc8\x23\x5b\x9e\xde\x37\xcb\x49\xd3\x1a\xf4\x8d\
+\x7c\x3f\xcb\xd6\x5f\x82\x09\xd6\x4d\xe7\x5f\xd3\x34\x1a\x56\x23\
+\x26\x5b\x6c\xe6\x07\x16\xeb\x4e\x7a\x09\x45\x59\x86\xcb\xfa\x6d\
+\x15\x72\xe0\x01\xbf\x65\xaf\xc4\xfc\xd1\xcc\x27\x82\x6f\x69\x75\
+\x3e\x2f\x49\x39\x99\x6d\x7e\x6f\xa7\x4a\x29\xc4\x89\x37\x27\x27\
+\xec\xb4\x81\x85\x61\x70\x70\x55\x99\x04\x16\x2c\x54\x28\x04\x59\
+\x79\xd1\xd5\xda\xf6\xbd\x20\x1c\xb5\x39\x9c\x5a\x29\x41\x49\x62\
+\xdb\xe9\x17\xa9\x04\xa6\x63\x0e\xb3\xa2\xd3\xc5\x33\x0a\x5c\xd6\
+\xfc\xff\x00\x39\xc5\x03\x99\xa0\x59\x9b\x21\xb4\xae\xb4\xfb\x9c\
+\x2d\x05\x3a\xbb\x37\x8c\x78\xa0\xa5\xc4\x81\x02\x12\x31\x90\x1e\
+\xf5\x1a\x4b\x3b\xa8\xc8\x6e\xf3\xc6\x29\x92\x14\x08\x1b\x66\xf6\
+\xcf\x3d\x27\xa5\x4a\x8b\x3f\x56\x73\x27\x8a\x70\xac\x54\x14\x2d\
+\xa9\x08\x84\xab\xf1\xd0\xab\x40\x45\xf7\xe5\xdb\x87\xf4\x50\x90\
+\x80\x5c\x69\x32\x6b\x9c\x26\x79\xc5\x4a\xaa\x60\xbc\xa6\x8c\xe9\
+\x31\xa5\x34\x52\x6f\xaf\x5e\x39\x78\xbc\xe8\x53\x05\x99\x74\x24\
+\x7d\xa9\x59\x7a\x2d\x02\xcc\xdb\x8a\x70\x52\x68\x62\xfe\x2d\x2f\
+\x34\x20\xa0\xc8\xbc\x86\x4b\xea\xdb\x12\xeb\x58\x75\x62\xd8\x37\
+\x90\xbc\x5b\xbd\xe8\xd8\xaf\x7e\x34\x43\x37\x28\x26\x4d\x9b\xc5\
+\x46\xd6\x2c\xd0\x6c\x48\xe5\x7b\x85\xa6\x9c\x55\x72\xe4\x10\xd7\
+\x1a\x2e\xb8\x37\xa5\xfd\x7a\x0a\xbe\x0e\xb6\x15\x3f\x95\x85\x44\
+\x12\xcb\x7f\x9b\xe8\x47\x8a\x3a\xc3\x06\x25\x10\x91\xc0\xc8\xba\
+\x79\xa6\xa6\xcc\x09\x0d\x11\x6b\x4b\x2a\x76\x85\x69\x58\x8a\xc0\
+\x6b\x7e\x71\x48\x46\x14\x92\x63\x07\x9e\x16\x3f\x44\x44\xd0\xb0\
+\x96\x06\x11\xb4\xe7\x69\xde\xa0\x2a\x60\xb1\x60\x15\xb6\x5b\x11\
+\x0e\xfc\xcc\xfd\x00\x13\x12\x6e\x91\x63\x53\xcd\x36\x3c\x54\x01\
+\x24\x00\xb4\x4e\x2f\x99\xbc\x30\x93\x6a\x99\x62\xce\x75\x35\xfd\
+\x96\x3c\x49\x6c\x8a\x6d\x11\x8f\x5b\x2d\x45\x10\xba\x22\x33\x3a\
+\xfe\xe6\x84\x81\x75\x59\x62\xc6\x6d\x3f\x35\xa2\x65\xc8\x47\x13\
+\xef\xd7\x34\x4b\xa3\x89\xbd\xb3\xbe\xed\xbd\x74\xa2\xe1\x0f\xa6\
+\x60\xb9\x0d\xa5\x27\x10\x4d\x0c\x9e\x6a\x98\x24\x11\xb2\x24\x38\
+\xc6\xf4\xde\x88\xa8\x20\xbc\x08\xb6\xf2\xff\x00\x66\x28\xea\x17\
+\xd9\xce\x14\x8f\x4e\xf3\xa3\x57\xed\x7c\x57\x89\xbe\x98\xb7\xed\
+\xa9\x8a\x5b\x7a\x7c\x37\xa5\x0e\x66\x66\x7a\x4f\xeb\x57\x4f\x87\
+\xf2\x8b\x10\x26\x63\xfc\x3f\xb8\xae\x9f\x83\x9f\xa6\x9c\x91\xb8\
+\xc4\x4e\x53\x4e\x8f\x8e\x94\x54\x97\x29\xeb\x3d\x71\xde\xa5\xaa\
+\x26\xdc\xe8\xf3\xb9\x6a\x98\x77\xc6\x30\xd4\xeb\x7f\x4d\x71\xdb\
+\x39\xe9\x48\x0c\x35\xc4\x69\x31\x76\x28\x42\xa0\x82\x4d\xb1\xfe\
+\x77\xea\xd4\xe8\xba\x58\x65\x04\xb1\x60\x13\x30\x3a\xc0\xb5\x6a\
+\x6c\x58\x34\x20\x2b\xb0\x7e\x69\x59\xac\x15\x6c\xbd\x85\xbe\x57\
+\xfa\x28\x52\x25\xf3\x12\xcb\x20\xa1\x23\x9b\xb1\x61\x26\xf7\x97\
+\x29\x3b\x9d\xa7\xe1\xc7\x69\xa8\x6c\x00\xb7\x2f\x22\xdf\x53\xbd\
+\x4d\x20\x0a\x25\x9b\xbb\x6a\xeb\x3a\xd3\xad\x90\x06\xa2\xb0\x26\
+\x9a\xf4\x93\x97\xf7\x97\xd0\x0d\x12\xc3\x2f\x8d\x6b\x0a\xe0\x24\
+\x00\x65\xc4\xaa\xeb\xe9\x47\x94\xb9\x3d\x35\x31\xf8\xef\x4a\xf0\
+\xac\x6c\x2a\x20\x9e\xaf\xf7\x5a\x0f\x93\xea\x2c\x66\x49\xe9\xd5\
+\xa8\x02\x88\x33\x62\x16\x31\x16\xd2\xa0\x12\x64\x92\x26\xee\xb1\
+\xd6\xd1\xbd\x3f\x56\x57\x03\x19\x63\x4d\xe3\x9d\x6d\x35\x23\xa8\
+\x93\xa7\xd6\xeb\xeb\xb5\x26\xa1\x84\x89\x65\x46\x2d\xf1\x7b\xe6\
+\x18\x79\xe8\x13\x31\x89\x49\xe2\xdd\x49\xc8\x64\xc2\x40\xb4\xc4\
+\xcc\xcf\x4c\x5a\x9c\x08\x9d\x01\x23\x9e\x48\xc9\x13\x82\x5c\x83\
+\xb9\x74\x5a\x1e\xf6\xc1\x42\x30\x66\x8b\xf0\x04\xe3\x82\x4b\x5f\
+\x33\xc9\x1a\x53\x65\x3d\xf8\x12\x12\x1c\x0e\xbd\x77\xa8\xb4\x9a\
+\x00\x46\x51\xdc\x48\x16\x73\x3b\x53\x67\x8a\x12\x87\x38\x6f\xb7\
+\xad\x28\xe8\xd2\xc3\x04\x58\x8c\xc6\xdd\xb7\xa5\x22\x53\xfa\x2b\
+\x45\xb3\x94\xea\xf1\xb6\xf1\xeb\x4c\x85\x31\x89\x3f\x6f\xed\x1b\
+\x22\x31\x60\xcb\xbc\xcf\xc7\x9a\x28\xa1\x09\x30\xc9\x9d\xcf\xf2\
+\x5a\x2e\xa4\x98\x62\x66\xcf\x5d\x7f\xcb\xa0\x01\x8c\xde\xe6\xbb\
+\x75\xd3\xea\x98\x71\xd1\x10\x3b\xbd\xfb\x27\x98\xa4\x92\xdd\xb5\
+\x99\x5c\xf8\xa2\x00\x82\xb3\x31\x1a\xdd\xee\xfd\x14\x2a\x51\x10\
+\x47\x52\x4d\xb8\xfe\x5a\x62\x0d\x2a\x29\x43\x3c\x82\xef\xbf\x61\
+\xac\x89\x74\xdb\x0b\x75\x83\x8b\xcd\x41\x09\xb8\x00\x0b\xc5\xdb\
+\x38\xbb\xbd\x22\x88\x03\x82\x5c\x4f\x6d\xfe\xe8\x01\xa8\x98\x74\
+\x1d\x2d\xa9\x8a\x1d\xa7\xd3\x10\x10\x4b\xd9\x44\xf7\x89\x6f\x40\
+\xd6\xe5\xba\x0d\xb8\x50\x88\x87\x30\xd4\x78\xa2\x6e\x92\x06\x40\
+\x46\x1f\x18\xa3\x68\x28\x80\xae\x45\x72\x65\x19\xa6\x98\x10\xcc\
+\x99\xd4\x3a\xb0\x5f\xc9\x40\x7e\x46\x13\x24\x98\x58\x61\x88\xdd\
+\xcd\x05\x40\x84\x66\x4a\x44\x6d\x2d\x8c\x47\x4a\x1a\x77\x00\x19\
+\x1a\x65\x89\x24\x5a\x22\x72\x54\x11\x54\xc4\xa8\x49\xb2\x13\x5c\
+\x9c\xf3\x59\xde\x82\xd2\x06\x79\x5f\x0c\xc6\x38\xa6\xc2\x21\xcc\
+\x49\x14\x59\x88\x11\x77\x0c\xd0\x93\x60\x29\x54\xd9\x2c\x30\xa0\
+\xff\x00\x2a\xe4\x34\x82\x38\x71\x7c\x71\x3a\xe7\x09\x56\xec\x0b\
+\xc0\x19\x46\x48\x97\x5b\x0a\xe8\x0a\x13\x49\x48\xb3\x5c\x6a\x4c\
+\xf6\x28\x1e\x4e\xf0\x82\x36\x19\x5a\x79\xcd\xe8\xeb\x8c\x99\x6e\
+\x6c\x9d\x21\xd3\x1e\x6a\x69\xca\x54\x72\x21\x81\xc1\x6e\x9c\x54\
+\xfb\x60\xf4\x94\x90\xd3\xfa\xde\x69\x7d\x51\x2d\xb1\x19\xe3\xfb\
+\x6e\xd4\x4f\xb2\x3b\x91\x77\x3c\x39\xa7\xc2\x9d\xfa\x7e\xbd\x64\
+\x02\xce\xa2\xd7\x3f\x7f\x2a\xd3\xdd\x99\x9c\x5b\xf6\x68\xb1\x44\
+\x85\x91\x32\xc2\x98\x6a\x22\x91\x71\x4a\x27\x46\x24\x71\xad\xb5\
+\xef\xc4\x52\x99\x02\x6f\x6f\x7f\x32\xf3\xf0\x7c\x2d\x21\x76\xeb\
+\x99\xcd\x5a\xda\x9e\xba\xb6\xb4\xf6\x2a\x45\x80\x82\x6d\x69\xbb\
+\x8b\x50\x50\x64\xc1\x19\xb4\xc6\x97\x9f\xd7\x8a\x1c\x4e\xd3\x7b\
+\xed\x63\xdb\xc5\x17\x02\x01\x8e\x52\x87\x10\xc3\x3d\xad\x48\x44\
+\xd0\xa8\x0b\x88\x42\x4d\xae\x98\xa9\x8a\x7a\xfa\x02\x19\x2a\x24\
+\xc7\xa4\xd1\x26\x24\x88\x31\x38\x7a\x1e\x02\x6d\x6a\x92\xe4\x1b\
+\x36\x26\x61\x8c\x5d\xdf\xd6\xa4\xfc\x95\x39\x08\x7b\x4e\x4f\xaa\
+\x69\xf4\x1b\x19\x19\x8b\x7f\x76\xcb\x1a\xf9\xed\x85\x12\x41\x5b\
+\xb6\xb0\x4a\x6c\x14\xb1\x57\x5c\x9b\x01\xbf\x5b\x1c\xd8\xad\x1f\
+\x9c\x58\xd4\xb3\xfb\xd2\xa4\x02\x08\x65\xcb\xc6\x7a\x7e\x28\xb4\
+\x51\x8b\x86\x0f\x16\x34\xb4\x0c\x58\x96\x28\x59\x64\x6d\x32\xa2\
+\xec\xba\x00\x2c\x91\x9a\x30\xd2\xc2\x25\x01\x72\x72\xc4\x28\x80\
+\x8a\x45\x20\xa4\x2c\x60\x80\x65\x21\x2c\xb0\xfb\x50\x1d\xbe\xc2\
+\x26\x4b\xac\xa4\xca\xab\x75\x9a\x23\x41\x20\x99\xcf\x6d\x7c\x16\
+\xe2\x92\x88\x9a\x92\x20\xe1\xbc\xdf\xdb\x7a\x4a\x32\xe4\x24\x32\
+\x80\x1b\x4b\x3a\x38\xb9\x13\x0e\x5a\xcb\x89\x44\xc7\x83\x6e\x8b\
+\x9c\x4b\xa0\x3c\x29\xc5\xe0\x29\x99\xc9\xde\x95\xf1\x06\x4a\x6f\
+\x21\x37\xb4\xbd\xf8\xa4\xd3\x25\x32\xe9\xb4\x6e\xd9\xb2\xac\xba\
+\x2e\xd0\x14\xa1\x7d\x1d\xe8\x31\x00\xaf\x51\x83\x75\xa0\x99\xec\
+\xdf\x5a\x8c\x4e\x54\x33\x75\x28\x7b\xe3\x16\xf4\x47\x60\x23\x91\
+\x10\x1f\xc0\xa7\xb0\xc2\x12\x12\xda\x69\x78\xce\xe7\x78\xbf\xf0\
+\xd0\xbc\x28\xbb\x2a\x4c\x48\xaa\x22\x09\x2d\x76\x42\x04\x44\x6d\
+\xb0\x95\x88\x2c\x29\x09\x59\x9e\xa7\xf5\x0b\xdb\xcd\xf1\x48\xc1\
+\x8d\xc0\xb2\x9b\x19\x2e\xba\x50\x52\x10\x20\x04\x4c\x6b\x13\x3f\
+\xbb\x5f\xa6\x8c\x2e\x06\x22\x2d\x77\x38\xe3\x5a\x17\xf3\xc8\x77\
+\x33\x32\xde\x60\xf8\xa0\xcc\x39\x21\x51\xc3\x68\x86\x0d\xf1\x44\
+\xe4\x29\x17\x86\x0c\x5b\xfd\xd2\xa3\x6a\x70\x37\x10\xbd\x98\x92\
+\x75\x83\x86\x47\xc3\x16\x88\x08\x2b\x31\x22\xf5\xe1\x11\xbc\x90\
+\x90\xdc\xc6\x04\xd9\x00\x62\x10\x5a\x01\xf0\xa4\xb6\x7a\xe9\x94\
+\x8d\x54\xd6\xe8\x09\x89\x26\x50\x4c\x4a\x63\x41\x6b\x94\x9b\x2c\
+\x62\x38\x8c\xb5\xc7\x1e\xad\x22\x72\x50\x07\x26\xf7\x4c\xe3\x34\
+\x56\xd9\x09\x2d\x02\x20\x78\x86\x31\xe2\x9b\x70\x8a\x88\x86\x24\
+\xec\xcb\x26\xf1\xbd\x1c\x71\x9c\xa2\xd2\x81\xe5\x75\xa8\x6c\xb4\
+\x62\x5a\xdc\x14\xb4\xc3\xcd\xad\x44\xa8\x26\x22\x22\x24\x32\x92\
+\x47\x4a\x8f\x62\x12\x88\xad\x80\x5e\x48\x24\x32\xd4\x91\x31\x8a\
+\xe9\x5d\x80\x70\x58\x8b\xc0\x85\x64\x79\x5c\x34\x8a\x8c\x5b\x1a\
+\x6d\x34\xfc\xa2\xe5\x17\x08\x66\xf6\x14\x30\x21\x22\x71\x88\x82\
+\x52\x31\x64\x90\x04\xe2\x8e\x54\x50\x15\xc6\x93\x5c\x09\xc1\x0a\
+\x72\x09\x05\x66\x8b\x3d\x41\x70\x31\x01\x13\x0c\x20\x8e\x12\x13\
+\x4a\x32\xe0\x71\x48\xb2\x0c\x59\xbb\x1e\x28\x11\x97\xbb\xcd\xc6\
+\xe6\xda\x7a\x52\x36\xda\x8c\xc8\x04\x4b\x6d\xe9\xb5\x2d\x42\x42\
+\x17\x6e\xb9\x7a\x69\x14\x6e\x49\x04\xde\x2b\xf0\xea\xc7\x6a\x93\
+\xf0\xf0\xb8\x89\xc4\xf4\xf6\xe9\x4e\x01\x02\x06\x52\x36\x1d\x8e\
+\x8f\x16\xa4\x38\x09\x06\xf6\x24\xe9\x90\x8f\x9a\x5d\xbc\x10\x02\
+\x42\x09\xe7\x43\x6b\xf1\x30\x32\x4c\x56\xe9\x83\x7c\x0b\xfa\xd6\
+\x5b\xd6\x59\x94\x24\x8a\xc0\xe9\x02\x30\xa0\x60\x40\x00\x44\x0a\
+\x25\xca\x29\x96\x30\xa1\xe2\xa2\x42\xca\x6a\x99\x2e\xef\x7b\xd2\
+\xe8\xef\xb4\x98\x3f\x98\xe1\xa8\x78\xe0\xa3\xa8\x18\x6d\x69\x9b\
+\xc1\xc5\xed\x21\x09\x81\x58\x94\x86\x22\x96\x82\x65\x48\x7c\x75\
+\x86\x98\x08\x40\x59\x11\xe4\x6d\x68\xa2\x3b\xa8\x10\xb0\xa0\xa2\
+\x49\x21\xbe\x9b\xcd\x67\x44\xed\x2c\xdf\x07\xc7\xfb\x44\x11\x84\
+\xa2\x4b\x42\x1b\xad\x16\x88\x8f\x76\x7c\x55\xa8\x40\x68\x0f\x62\
+\xcf\x34\x67\xde\x18\x46\x02\x55\x3c\xcb\x8b\x4d\x45\x02\x12\x40\
+\x84\x59\x6e\xc2\x20\x04\x65\x82\xad\xe0\x49\x82\xc9\x7b\x28\x86\
+\x1b\x8c\xb0\xc4\x92\x22\x85\xa2\x8c\x16\xd5\x36\x34\x62\x73\x7d\
+\x46\x9a\x03\x19\x79\x9d\x7a\xbd\xe7\x15\x13\x10\x55\x71\x23\x2c\
+\x76\xb5\xad\x4a\x0a\x58\xc4\x8e\xeb\x21\xe9\x98\x3a\x54\x48\x5d\
+\x98\x49\x1b\x72\x11\xe7\x7c\x44\x35\x1f\x02\x1c\xc8\xe7\x03\xaf\
+\xd5\x34\xa0\x02\x25\xad\x99\xea\x17\xd6\x73\x7a\x18\xae\xf2\x91\
+\xbc\xf5\xbc\xdf\x29\xcb\x14\x43\x80\xa4\x59\x6f\x74\x69\x26\xdd\
+\xe2\x95\x9b\x9d\xfd\xf4\x76\xc6\x89\xd2\x92\xb2\x42\x14\x96\x22\
+\xd1\x9c\xe9\x2e\xc5\x2d\x68\x66\xb5\x08\x9b\xf2\xf9\xa6\x92\x24\
+\x4a\x4c\x90\x24\xb0\x18\x81\x88\x82\x2c\x01\x25\x0a\x93\x38\x14\
+\xce\x71\x68\x28\x2c\x83\x84\x46\xc6\xab\xd8\xbd\x11\x91\x23\x01\
+\x93\x26\x5d\x78\xd3\x6a\x4a\x75\x01\xc2\xf3\x08\xc1\x13\x7e\xbc\
+\xcd\x67\x26\x03\x6e\x04\x5e\x04\xc7\x3d\xa9\xc1\x02\xb3\xc2\x33\
+\x87\x7d\xf9\xab\x57\x68\x40\xc8\x18\x5a\x26\xe3\x79\xce\xd4\x33\
+\xf9\x8c\x62\xc1\xc8\x10\x5e\x26\x40\x36\x52\xfb\xd0\x48\x98\x45\
+\xe5\xcb\x44\x21\x9b\x4c\xd2\x20\x04\x28\xda\x58\x23\x7c\xb0\x89\
+\xa3\x78\xa8\x7c\x4a\x36\x78\x29\x71\x9c\x14\x26\x19\xa5\x8e\xe0\
+\x89\xe4\x40\x9b\x98\xe8\x18\x32\x96\x91\x18\xda\x83\x0f\x15\xa1\
+\xb5\x2d\x8e\xf6\xcc\x7e\x8a\x3b\x22\xa5\x84\x4d\x39\x42\xcd\xbb\
+\x62\x69\xd2\xe3\x01\x8b\x8b\x27\x6d\x8a\x6d\x34\xc8\xca\xc8\xb8\
+\x50\x5b\x97\x64\xcc\x03\x4a\xa5\xd0\x98\x39\x24\x82\x20\x02\x79\
+\xdf\x0e\x83\x31\x30\x2c\x80\x24\x0a\xe3\x29\xa0\xd1\x41\x64\x26\
+\xe8\x54\xb5\xa6\x6d\xf1\x51\xa7\x8e\x5d\x12\x9a\xc1\x11\x18\x65\
+\x25\x00\x0a\x8e\xd3\x90\x12\xe8\x58\xbb\x31\x1b\xf6\xa8\xe0\x14\
+\x22\xe0\x9d\xc7\x69\x24\x42\xd6\x6f\x4f\x54\x57\x06\x13\x41\x26\
+\xe4\x83\x1c\x1c\x50\x40\x40\x47\x60\x97\x1b\x02\x61\x94\x8b\x13\
+\x0f\xcc\x23\x6b\xad\xfb\xff\x00\xb5\x12\x56\x4a\x02\xac\xa5\xe8\
+\xc0\x59\x21\x15\x62\xb3\x90\xf2\xdc\x18\xbb\x05\x20\x90\xd2\x94\
+\xf8\x90\x46\x98\x89\x3b\x69\xbe\xd4\xa4\x25\x65\x08\x58\xdc\x98\
+\x60\xc8\x30\xe9\x8a\xc7\x6d\x90\xc8\x49\x3c\x67\xac\xc5\x0c\x7a\
+\xe2\x33\x05\xcb\x46\xa4\xb1\xc9\x48\xe4\x18\x05\x2e\x32\x42\x2f\
+\x12\x33\x72\x90\x05\x4c\xcb\x21\x51\xc0\x77\x77\x23\x8a\x12\x30\
+\xc8\x8c\x20\x09\x91\x16\x0f\x16\xda\xad\x75\xe8\x49\x1a\x93\x37\
+\xd7\x79\xd3\x34\x14\x96\x4c\xdf\x38\xde\x3e\xe6\xa4\x6a\x43\x06\
+\x42\x6f\x60\xd3\x3b\x78\x9a\x6a\x6b\xda\x90\xca\x08\x33\x63\x40\
+\x60\x8a\x81\x0c\x89\x41\x08\xbf\xc7\xa4\x51\xc9\xba\x59\x61\x23\
+\x0c\xb6\xbd\xc2\x19\xb3\x21\x94\xca\x4c\x2b\x50\xac\x84\xd1\xb5\
+\xc6\x21\x91\x84\x8a\x8f\x18\x14\x48\x04\x45\x68\x68\x81\xd7\x04\
+\x53\x51\x94\x9d\xc6\x38\x96\x88\x59\x85\x04\x02\x2e\x10\xd1\x84\
+\x08\x81\x24\x2f\x01\x38\xb0\x0b\x61\x6b\x13\xf5\x35\x00\x82\xcb\
+\x84\x03\x20\x1b\x12\x68\xa4\x22\xd3\xf3\x3b\x67\xea\x9c\xac\xa1\
+\x23\x85\xda\xd9\xf0\x77\x84\x88\x82\x28\x50\x28\x2c\x08\x22\x10\
+\xad\x81\x54\x95\x38\x31\x46\x36\x55\x62\xe8\x22\x0b\xb3\x60\x88\
+\xa4\xa7\x9b\xcb\x84\x6f\x51\x80\x24\x02\x9c\xa1\x7b\x44\xf5\x31\
+\x13\x2b\x82\x42\xfc\xf8\xc7\xbd\x42\x2c\xae\x9b\x25\xf3\xa6\x6e\
+\x4e\xc2\x12\x55\xd2\x0c\x40\x01\x64\x82\x03\x08\x00\x54\x5c\x42\
+\x55\x42\xf0\x26\x51\x88\x22\x12\xc4\x37\xd6\x8c\x66\x91\x5d\x20\
+\x80\x40\x33\x56\xce\xc1\x03\x84\x0c\xf0\x00\xc8\xe4\x40\x06\x94\
+\x4b\x56\xde\x22\x81\x0c\xe0\x70\x25\x88\x4a\xc4\xd4\x60\x5b\x89\
+\xad\x8a\x78\x88\x47\xfc\x65\x60\x0d\x46\x15\xac\xb0\x46\x20\xc4\
+\x30\x82\xe7\x50\x85\xcc\x4a\xd7\xaf\x9b\x4d\x44\x20\x12\xb9\x06\
+\x26\x1b\x28\xad\x98\x96\x05\xc0\xa4\x03\xdc\xb5\x6d\x8c\xce\xcf\
+\xc3\x53\x32\xe2\xd6\x47\xef\x7b\xde\x81\x11\x2e\x8d\x05\x11\x6c\
+\x75\x11\x6e\x5e\x51\x65\x49\x3b\x97\x26\x71\xef\xa6\xb8\x8a\x77\
+\x40\x09\x62\xf0\xcb\xb9\xb6\x92\x36\x29\x47\x02\x8b\x09\x80\x52\
+\x4c\x90\x89\x21\x54\x32\x16\x1d\x16\x70\x46\x55\xcb\x8b\x04\xb3\
+\x7b\xdb\x59\x1e\x64\x40\x2c\x43\x29\x49\xc8\x01\x66\xe2\x41\x20\
+\x31\xcd\x01\xc2\x6b\xca\x5e\xc4\x70\xd3\x35\x8b\x2c\x01\x48\x04\
+\x1a\xa5\x2c\x0a\x25\x10\x90\xc6\xc6\x5e\x5c\x58\x84\x84\x06\xc0\
+\x1a\x81\x45\x0c\x75\x63\x24\x49\x8b\x4a\x91\xaa\xac\xe0\x71\x2c\
+\xa5\x58\x46\xb1\xb1\x7b\x70\x80\x6a\x12\x33\x20\xb2\x55\xea\x4f\
+\x24\x06\x45\x96\x80\xd6\x28\xca\x08\x59\x99\x08\x21\x82\x4a\x72\
+\x05\x18\x74\x97\x5c\x20\x0e\xf6\x1b\xda\x41\x89\x28\xf2\x44\xa2\
+\x92\x4c\xa5\x8c\x4a\x02\xe5\x82\x56\x08\x70\x0b\x10\xc0\xc2\xe6\
+\x7a\x1d\x2a\x20\x11\x70\xb8\x2e\x4c\x59\xb8\x38\xcd\xf2\x53\xf8\
+\x89\x05\x99\x05\x82\xf6\x16\x58\xc4\xab\x99\x97\x50\x12\x60\xc0\
+\xb4\x09\x0c\x5c\xc2\x59\x12\x65\xcb\x18\x26\x6b\x0a\xcf\xcf\x9d\
+\x69\xe2\x05\x26\x42\xe4\xc1\xde\x8d\x7d\xb5\x08\x11\x9b\x97\xc5\
+\x5e\x54\x6a\x58\xcf\xa5\xde\x3a\x6b\x44\x64\xd1\x5f\x70\x2a\xac\
+\xde\x7a\xe2\x0b\x51\xd6\x99\x75\x19\x2e\xeb\xfb\x78\x00\x24\x21\
+\x87\xba\xea\x7a\xd2\x1a\xcd\x59\x29\x61\xda\x91\xc8\xc8\x25\xd2\
+\xcb\x9c\x4d\xb4\xa7\x52\x90\x37\xd9\x7c\x45\x12\x16\x8e\x28\x58\
+\x2b\xbd\xac\xe4\xd6\x6c\x4b\x00\xe2\x00\x80\x1e\x36\x3a\x21\x80\
+\x51\x19\x09\x22\x4e\x50\xc7\xab\xb5\xd2\x22\x85\x83\xbe\xe2\x59\
+\x51\xd2\x24\xd0\xeb\x36\x8b\x9c\x4c\x46\x8c\x23\xac\x4b\xe2\x9a\
+\xb0\xc8\xc1\xcc\xfd\x54\x20\x03\x49\x07\x10\x23\x28\x41\x49\x0d\
+\xe0\x2a\x9e\x8c\xc9\x23\x0c\x4b\xf2\x4f\x78\xd2\xe1\x2e\x84\xb7\
+\x2c\xf0\xe2\x82\x44\x89\x71\x60\x64\xd7\x0d\x77\xcd\x03\x80\x75\
+\x60\x09\xa6\xf6\x91\x08\xd0\x21\x53\xa4\x91\x62\x64\x80\x86\x01\
+\x19\x62\x0a\x50\x35\xcc\x92\x2d\x12\x4f\xc9\x35\x2d\x9c\xa4\x84\
+\xa8\xaa\xb3\x97\x3d\xf5\x6c\xe1\xa9\x92\xe2\xd8\xb5\x46\x85\xaa\
+\x4d\xfb\xfd\x1e\x0e\xff\x00\xff\xc4\x00\x24\x10\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x00\x02\x03\x00\x01\x11\x21\x00\
+\x31\x41\x51\x61\x10\x71\x81\x91\xa1\xb1\xc1\xd1\xe1\xff\xda\x00\
+\x08\x01\x01\x00\x01\x3f\x10\x58\x98\xd2\x22\xe0\xd8\xd7\x29\x27\
+\x8f\x64\xe5\xe0\xd4\x2a\x43\xc0\x7e\x43\x70\x06\xe7\xe7\x02\xd8\
+\x45\xfa\x32\xa5\x44\xbe\xae\xa8\x70\xcc\xc4\x14\x12\x45\x03\x3f\
+\x4d\xf3\x94\x29\x09\x61\x63\x68\x32\x60\xfd\x0b\x97\x98\x41\xa9\
+\xe0\x03\x75\x9e\xb3\x4b\xb6\x4d\xa7\xeb\x96\xfa\x98\x7a\xac\x84\
+\x89\xa5\xef\x62\x95\x40\x30\xac\x41\x1f\x19\x36\x84\xeb\x18\x20\
+\x20\x60\xbf\x0d\xf8\xcf\xfc\x7b\xd2\xe0\x24\x9d\x68\xff\x00\x06\
+\x5b\xff\x00\x33\x80\xda\x5c\xfd\x89\xec\x62\xd2\x08\x16\x94\xe6\
+\xa1\x00\x4b\x14\x63\x98\x1e\xb0\xf9\xff\x00\x9d\x5a\x40\x85\x35\
+\x25\xa7\x42\xfb\x83\x27\xbd\xa4\xb8\xa5\x42\xc4\x0d\x05\x48\x2a\
+\xd1\xf9\x38\xea\x0e\x8c\xe9\xf0\x6b\x40\x84\x67\xce\x76\xdb\x07\
+\xad\x1a\x00\x00\x81\x16\x4b\xa7\x45\x81\xa3\x03\x60\xb9\x0a\x95\
+\xfc\x50\x07\x78\xb9\x5a\xc4\x4e\x99\x03\x42\x35\x89\xff\x00\xf8\
+\xbe\x1c\x41\x0a\xfa\x09\xb7\xee\xe6\x3e\x72\x41\xfd\xf0\x60\xbf\
+\xfb\xa9\x99\xe5\xae\x7a\x4c\xe2\x65\x8a\xa2\xa8\x4f\xdb\x93\x65\
+\xcf\x5e\x94\x62\xb0\x7e\x02\x90\xc1\xf5\x8e\x27\xbc\xe9\xa2\x5b\
+\x04\x0e\xc1\xaf\xb0\x0f\x4a\x35\x25\x45\x13\x30\xe0\x00\x58\x35\
+\x54\x5b\xf7\x92\x0d\x04\xdd\x09\xe0\xdc\x2a\x6f\xa5\xdf\x38\x92\
+\x0a\x6e\x81\x7c\x32\x21\x53\xee\xa0\x7f\x3a\x87\x90\xe5\x8b\x1e\
+\xbd\x7c\x32\xfe\x9d\x39\x5f\x98\x30\xc4\x4d\x48\xff\x00\xe8\x3f\
+\x4b\xb8\x8b\x1a\x04\x4d\x12\xec\xaf\xfd\xe6\xd4\x15\x43\xf4\x32\
+\x84\x0f\xdf\x54\xa5\xa9\xd4\xf2\x4c\x2c\x21\x1c\x12\xca\xfc\xbe\
+\x1f\xca\x84\xc4\x89\xa0\x2b\x6a\xc5\x20\xf3\x67\xbe\x39\x0c\x24\
+\xa0\x42\xb4\xf1\x21\x10\x1b\x2d\xfa\xc1\x8c\xad\xdd\x43\x57\xf0\
+\x82\xf0\x79\x28\x20\x06\xc4\x28\xcf\xa9\x44\x64\xe6\x27\x51\xd0\
+\xa1\x52\xdc\xc6\x7c\xf0\x66\xef\x30\x7e\x6f\xa6\x68\x56\x01\x69\
+\xac\x97\x9c\x4c\x0e\x16\x05\x13\x1d\x09\xef\xaf\xd1\x78\xc8\x9d\
+\x45\x99\x53\xe2\x20\xf9\x7c\x1b\x67\x3e\xf5\xa9\x84\x40\x46\x89\
+\x2f\x87\xe4\x6d\x88\xfc\x7e\xd5\xb0\x03\x02\x88\xc8\xfd\x52\x7e\
+\x3c\xcb\xa4\x03\x66\xaa\x0d\x45\x52\xb8\xfa\x73\xeb\x85\xe5\x6a\
+\x05\x5e\x86\x04\x7e\xd7\x80\xbc\xc2\x6a\x7e\x28\xb5\x52\x00\x6f\
+\xb7\x81\x64\x11\x52\x08\x05\x45\x27\x87\x49\x6b\x45\x12\x6c\xc8\
+\x15\x27\xeb\xe0\x0b\xe3\xe7\xd3\x39\x77\xd3\x9e\xe0\xa5\x34\xa0\
+\xca\x08\x5a\x67\x03\x55\xb0\x69\x79\x92\xd4\x87\xa2\xc0\x40\x3f\
+\x5e\x84\x55\x61\xe1\x0d\x07\xd4\xac\xa2\x20\x72\x11\x09\x56\x17\
+\x89\x2d\xfd\x6f\x39\xad\x80\x2c\x42\x80\x08\x91\x4d\x33\xce\x62\
+\x49\x37\xc2\x1a\xe3\x47\xaa\xa3\xbe\x4f\x38\x5b\x0d\x39\xec\x48\
+\x03\xe1\x6b\x0d\x41\x38\x48\x64\x93\xa6\xf8\x47\xd0\x85\xc1\xf3\
+\x85\xa1\x53\xb0\x0a\x51\x0a\xc6\x94\x53\x3d\xed\x6f\x41\xc2\x16\
+\x83\xea\x44\xac\xa6\xd3\x39\x02\xaf\xf8\xa4\x18\x04\x1e\xdb\x70\
+\x26\x1d\x3b\x15\x64\x5a\xad\x01\x18\x8a\xea\x39\x5d\x05\x26\xaa\
+\xd1\x02\x07\xe3\xf5\xf7\xdb\x7c\x11\x1a\xb1\x18\x4a\x00\xa4\x0e\
+\x7e\x7a\x4e\x09\x96\x40\x62\x89\x34\x5b\xa9\x2b\xe7\x5a\x50\x2b\
+\xd5\xc9\xf6\x10\x87\xc1\x7e\xf0\x49\x41\x7e\x0e\xa5\x04\xcd\x33\
+\x0d\x5e\x10\x04\x20\xaa\xaa\x55\x44\x63\x7f\xcf\x7f\x9d\x91\x9a\
+\x1f\x42\x75\x29\x45\xf0\x99\xa2\x74\xc5\x46\xb0\x54\x59\x85\x94\
+\x5f\xa5\xfb\x1e\xaf\x41\xe3\xc2\xfa\x1b\xe8\x1c\x7d\x98\x98\xc7\
+\x77\x11\xaa\xa1\x11\xe9\x0b\xf1\x3e\x73\x2a\x41\x18\x5e\xf2\xf8\
+\x52\x0f\xb5\xe7\xa0\x0e\x9f\x04\xbe\x12\x12\x8e\xd7\x70\xb9\x99\
+\x3c\x33\xb3\xf5\x0b\xa1\x20\x6f\x9f\x3d\x78\x80\x70\xa6\x7c\x95\
+\x60\x8a\xc1\xf9\x28\x07\xa5\x10\x01\xda\x19\x05\x80\xd4\xf1\x8f\
+\xfc\xea\xde\x13\xfb\x21\x80\xd7\x10\x60\x21\x8f\x8a\x08\xec\x7f\
+\xf7\x3b\x31\x04\xfc\x30\x23\xe1\x60\xac\xc4\x94\x34\xab\xfa\xbe\
+\xb7\xc3\x69\xe4\x0b\xfc\x10\x32\xd0\x08\x03\xd9\x78\xc2\xa7\xb3\
+\x80\x8a\x5c\x1f\xbb\xf5\x2f\x54\x08\x00\xd5\x5b\xf3\x7d\x1d\x21\
+\x93\x4e\x79\x6d\x09\x95\xd6\x1f\x92\x2f\xc2\x87\xbe\x9c\xa2\xa0\
+\x80\x00\x05\xa1\x22\xd9\xea\x9c\x08\x79\x78\x50\x68\xa8\x09\x9b\
+\xac\x5e\xab\xe9\x15\x70\x40\x20\xb5\x0c\x7f\x56\x70\xdc\x01\x49\
+\xd9\x3e\x0b\xeb\xc0\xd4\xff\x00\x9c\x72\x56\x28\x8a\xa1\x2d\x56\
+\x27\xa6\xbf\xf3\xbd\xda\x70\x11\x7c\x48\x33\x29\xbe\xfb\x67\x18\
+\xaa\x52\x8e\x00\x96\xe5\x30\xf6\xfa\xbe\x2d\x91\x43\x22\xb0\xcc\
+\x0a\x95\xac\x5f\x18\xf1\x20\x48\x7a\x0d\x6c\x0c\x82\x15\x83\x7d\
+\x45\xa4\x69\x21\xbd\x8e\xf8\xa2\x6e\xcf\xf8\x92\x3b\x9c\x21\x40\
+\x02\x02\xb4\x02\x2a\x04\x4d\x82\x41\x58\xa8\x18\x81\xe8\x7c\xd0\
+\x9f\xa8\x7b\xaa\x24\xc1\x53\xb4\xb4\x6a\xb6\x13\xde\x63\x09\x02\
+\x7a\x36\xc2\xe2\x88\x25\x0d\x78\x35\x75\x80\x9b\x27\x81\x45\x20\
+\xc0\x38\xc4\xa5\x54\x83\xf1\xe4\x51\xfc\xdb\x72\xfd\xea\xee\x42\
+\xe1\x4e\x9a\x4d\xa5\x30\x35\x9f\xb4\xa3\x2e\x04\x0a\x16\x8f\xd0\
+\xfa\xfb\x93\x87\x10\xfa\x4a\x40\x65\xa0\x52\x36\xda\x9f\x49\x12\
+\x85\x5c\x48\x1b\x98\xae\x25\x62\x16\xc8\x82\x62\x18\x8c\x08\xa0\
+\x10\x51\x8f\x9e\xb2\xf7\xa6\x11\x78\xb8\xaa\x42\x40\xb8\x7f\x65\
+\xde\x26\x0a\x1e\x04\x3a\xbe\x28\xbe\x00\xd9\x36\xf5\xc2\x72\x86\
+\x91\x05\x53\x4b\x0d\xb5\xb6\xce\x00\xb0\x1c\xab\x84\x22\x1b\x5f\
+\x70\x77\x0e\x4e\x2e\xd5\x52\x40\x5d\x25\x66\xc1\xa7\x29\x21\x6a\
+\xb7\x3f\x64\x18\x99\x68\x31\x6e\xf5\xd4\x49\xac\x56\xa5\x64\xc7\
+\xa4\xcc\xfc\x73\x04\x28\x30\x98\x22\x92\xa3\xea\x9f\x79\xfe\x22\
+\x60\x45\x7d\x4a\xed\x00\xf1\x49\x46\x1c\x12\x59\xdc\x54\x2f\xd5\
+\xfb\x9e\xab\xbc\x8a\x07\xcd\x45\xb1\x5a\x1a\xfb\x5f\xde\xdc\xac\
+\xd3\x28\x0b\x4d\x43\xc9\x1c\xde\x34\xb8\x72\x04\x24\x4a\x01\x68\
+\x53\x09\x45\xc9\xd2\x74\xb6\x88\xc5\x01\x04\xae\x64\xc9\xc7\x5c\
+\x29\x0e\x9a\x54\x20\x12\x2c\xfa\x3f\x53\x38\xa4\x0d\x66\xa8\x80\
+\x60\x54\xac\x26\x0d\xce\xae\xef\x68\x8a\x68\x7c\x21\xc3\x05\xca\
+\x22\x2b\x41\xfc\x9b\x79\x28\x70\xfe\x1f\xbc\x39\xe2\xe0\xd1\x24\
+\x79\xf6\x5f\x3e\xff\x00\xde\x55\x00\x97\xba\xb1\x80\x4f\x42\xef\
+\xef\x08\x3d\x00\xb4\x3f\x65\x48\xbe\xbe\x7f\x39\x6b\xc9\x40\x30\
+\xa1\x81\xf0\x29\x2a\x0f\x9e\xf3\xe5\xcc\x01\x29\xa8\x21\x00\x61\
+\xaf\x1b\x29\xc3\xea\xbb\x83\xfb\x05\x0f\x65\xfa\x9b\xc9\x25\xba\
+\x84\x61\x6a\x51\x00\x91\x22\x6d\x20\x85\x00\xa3\x45\xe1\x83\x00\
+\xb0\x0a\x3a\xf9\x9c\xa8\xa0\x28\xb3\x64\x11\xf0\xf7\xfa\xca\x72\
+\x35\x01\x03\x6a\xe6\x3f\xab\xf1\xf0\x8f\x97\x7b\x24\x2f\x98\x00\
+\x81\xea\x68\x1b\xb2\xcd\xe1\x98\x4a\x53\x10\xc5\xfe\x80\xf9\x65\
+\x1f\x11\xd6\x8c\xc2\xf6\xcf\xa4\x4a\xf8\x57\xc6\x67\x1d\x11\x4e\
+\x28\x57\xea\x06\xba\x3f\xe9\x7f\x3a\x3b\x2e\x50\x48\x15\xec\x04\
+\x46\xdc\xf1\xe7\x90\x2e\x72\xbf\x92\xe2\x42\xea\xeb\xcb\xcd\xdd\
+\x85\xaf\x9e\x8d\x27\xb3\xdf\xec\xe9\xb5\x0a\xe8\xd8\xfe\xa2\x27\
+\xb4\xff\x00\xdb\xd2\x7c\x91\x89\x08\x11\xa2\x42\xaf\xfc\x13\x87\
+\x2f\x41\x1a\x26\x93\xa8\x85\x06\x8d\xf3\xa2\x6c\xa9\x61\xca\xee\
+\x02\x8c\x98\x96\xc0\xbe\x45\x81\x47\x96\xe7\x80\x02\x89\x00\x0c\
+\x0d\x68\xd1\x69\x40\x26\xf4\x87\x49\xcc\x1a\x15\xc1\x9a\x89\x42\
+\x82\xd9\x11\x5a\x18\x6c\x45\x40\xfe\x7c\x3c\x78\x25\xa4\x5e\x52\
+\x21\x20\x60\x96\xfd\x84\x49\x6c\x41\x50\x81\xb2\xbe\x24\xf9\x62\
+\xd9\xb8\x1c\x84\x94\x00\x72\xaf\xe4\x8b\xf7\xfa\x05\x49\x72\x3e\
+\x52\x22\x40\x28\x8f\xb2\x89\x8c\xec\x5d\x48\xd4\x56\x34\xf9\x1f\
+\x4f\x7e\xde\xb1\xe0\x40\x02\xc8\x10\x06\xc0\x4d\xae\x37\x92\xd2\
+\x42\x84\x0d\x50\x18\xe1\x03\x7c\xcc\xe4\xec\xf5\x03\x38\xec\xf5\
+\x15\x63\x5b\x22\xd5\x90\x33\x40\x4c\x4c\x05\xf5\x99\x57\x7b\x22\
+\x3a\x55\x39\x20\x1a\x8a\x57\xf1\xca\xc4\xa1\x08\xa4\x57\x4a\x4f\
+\x07\x9a\x71\x59\x05\x25\x50\x20\xe1\x09\x34\x9f\xf3\xa3\x22\x9a\
+\xf4\x68\x89\x99\x28\xe9\x63\x47\x2f\x63\xa6\xc6\xeb\x1a\x10\x40\
+\x6c\x35\xec\x20\x09\x0d\xfa\x7f\x46\xad\x24\xf6\xe7\x9d\x89\x50\
+\xa2\x04\x0c\x2a\x93\x08\x88\xf9\x45\x00\x72\x62\x81\x68\x15\x5b\
+\xc2\x78\x51\x2d\x73\xa1\x45\x03\x05\x1c\xa0\x57\xc4\x24\x31\x1f\
+\xad\x17\x15\x6c\x49\x03\x55\x4d\x20\xd8\xf5\x01\x54\x85\x68\x2a\
+\x80\x8b\x42\x3a\xcb\xc8\x3d\x86\x50\x45\x41\xb2\xd5\xc7\x1f\xcf\
+\x10\xd0\xd1\x70\x50\x44\x54\xdb\x01\x48\x08\xbf\x46\x5f\x08\x93\
+\x1c\x88\xc9\xaa\x26\x6d\x38\xa5\x81\xe0\xf5\x8a\x42\x84\x96\xc1\
+\x50\x14\x11\x1e\xc6\x69\xf9\xfd\x63\xaf\xbf\x18\x29\x75\x0f\x12\
+\x1c\xb6\x64\x81\x42\x57\xa1\x49\x88\xe8\xf3\xd9\x62\x14\xc9\xa7\
+\xb7\x76\x9f\x96\x9c\x19\xd1\x89\xa5\x5b\x4b\x59\xec\x04\x41\x70\
+\xe9\x10\x4c\x00\x0a\x40\x60\x15\x23\x95\xa8\x35\xbc\x89\xcd\x1b\
+\xa7\xfc\x96\x6b\x2d\xfd\xfc\x6b\xd9\xcf\x32\x01\x91\xa1\x21\xa8\
+\xa7\xdf\xb7\x68\xed\x2a\x52\x25\x36\x91\x92\x3d\x50\xc0\x2a\x49\
+\x21\xa6\x44\x11\x98\x03\xe5\x47\x0e\x4e\x6d\xa6\x3a\xca\x60\x5b\
+\x71\x5a\x24\xce\x1e\x69\x64\x4e\xe1\x51\xd3\x45\x9a\x92\xf0\xa0\
+\x42\xd8\xbd\x3f\x2c\x94\x9a\x88\xb3\x28\x4c\xf3\x0f\xde\x58\xca\
+\x88\x04\x30\xb0\x4e\x80\x2a\xae\x9a\x06\xcb\x41\x48\x01\x34\x43\
+\xd4\xcf\x3c\xea\xac\xbc\x14\xe5\x1d\x13\x43\x20\x7d\x15\xe4\x20\
+\x32\xab\x60\xba\x88\xb1\x52\x67\xd6\x84\xe4\x1a\x1a\x35\x01\x02\
+\xb4\x5c\x4a\x7f\xc3\xfa\x76\x91\x31\xe2\xa0\x42\xd6\x6c\x23\x0f\
+\x5f\xb9\x41\x5b\xe1\x2e\x68\x6d\x80\xd1\xc8\xe8\x52\xec\x4b\x65\
+\x26\xe7\xd1\x09\xe0\x5a\x51\xc2\x07\x24\x40\x6a\xfa\x8b\x60\x27\
+\xc3\x1e\x4e\x72\xb0\x13\x1e\x14\x03\xf8\xe7\xd4\x27\xc0\x38\x2d\
+\x8d\xac\x44\x04\x96\x79\x5c\xad\xef\x66\x19\xd8\x20\x55\x14\x54\
+\x20\x63\xa1\xde\x3c\x73\x50\x07\xc7\x80\x14\x89\xea\x5d\x1d\xe1\
+\x12\x40\x1a\xaa\xd8\x3e\x46\x83\x6a\x7f\x38\xc5\x27\x4e\x02\xc6\
+\x34\x18\xfe\x0e\x16\x4e\x49\x48\x0a\xe1\xa0\x17\xf3\xef\x9c\xa0\
+\xa0\x24\x21\x33\xd7\x55\xff\x00\xc4\xff\x00\xfb\x7c\xb1\x03\xe0\
+\x18\x53\x8e\x53\x0a\x9f\x6b\xca\x18\x0b\xcb\x62\xd1\x5a\x5f\x58\
+\xb5\xf1\xe5\x44\xcc\x89\x60\x34\x88\x68\xa4\x0b\x4c\xe4\xe4\x8b\
+\x16\x12\x05\x85\x96\xd4\x00\xc0\x62\xe8\x35\xf2\x7d\x06\x31\xd2\
+\xb8\xae\x1d\x66\x01\x0b\x86\x32\x28\xd4\x5e\x0f\x40\x05\x35\x22\
+\x09\x9c\xe1\x4c\xb6\x04\xf8\x6b\x7b\x0a\xb8\x16\x05\x11\x36\x17\
+\x97\x2d\xf8\x88\x3c\x7a\x12\x56\x90\x15\x74\xae\x51\x88\xfe\x67\
+\x4d\x80\x48\x27\x28\x15\xf8\x57\xb6\x0f\x42\x73\x25\x03\xd0\x14\
+\x07\xf4\xa1\x9e\x6b\x2c\x51\xe2\xc4\x6e\x02\x79\xa6\x9c\x55\xa2\
+\x84\x64\xc6\x09\x9c\x08\x30\x28\x8a\x88\x90\x22\xde\x69\x89\xaa\
+\xa0\x38\x21\xc0\x22\x29\x1d\xa2\x26\xde\xbe\xa4\x58\x0a\x85\xd8\
+\xdb\x6a\x14\x14\x0a\x62\x26\xf2\xf8\xde\xb9\xc3\xb4\x83\xf4\x27\
+\x47\x40\xe5\x71\x92\x2d\xa0\x82\x9a\x0a\x15\x59\xde\xe0\x16\x62\
+\xe2\x34\x12\x47\xa8\xbf\xf0\x79\x0a\x96\xca\x94\xda\xf9\x5b\xaa\
+\x45\x08\x1e\x72\xfa\x96\x20\x16\xab\x05\x11\x2d\x88\xe1\xc8\x44\
+\x16\xdb\x4d\x85\xb1\x28\x43\x82\x19\xe9\xc5\x20\x1e\x01\x49\x70\
+\xea\xa1\x39\xb6\x8d\x75\x09\xa1\x9b\xa4\x54\x5e\x2f\x16\x0d\xe2\
+\x55\xfc\x82\xe8\x74\x01\x8f\x0c\x13\x10\x59\x10\x65\x2c\x78\x42\
+\xbd\xf7\x23\x7f\x2e\x09\x40\x16\xf8\xb0\x77\xce\x69\xf6\xaa\x20\
+\xfc\x24\x3a\x56\x97\xa4\x78\x52\x93\x34\xf6\x08\xc8\x05\x44\x50\
+\x5a\xd7\x9e\x44\x7c\xd5\x89\xab\x03\xfa\x01\xa2\x0b\x79\x64\x11\
+\xcf\x7b\x1f\x36\x38\x03\xd3\xef\x35\x4d\xa2\xa4\x21\x87\x43\xd7\
+\xa3\xc6\x40\xeb\x4f\xd5\xa8\x36\x2b\x23\x53\x5e\x49\x82\x03\x93\
+\x08\xe8\x6c\x4b\x09\xa0\xe9\x4e\xdf\x1d\x04\x56\x25\x3a\x18\xd9\
+\xe4\x83\xe1\xd9\x8a\xf2\xf0\x3b\x89\x60\xc6\xfc\xf1\xe0\x50\x77\
+\x51\x14\x51\x4f\x23\x61\x7d\x2b\xc2\xc8\xd7\x0f\x18\x7c\x98\x35\
+\x5d\xb6\x1c\xa9\x14\x23\xa7\x00\x1b\x10\xa4\x80\xaf\xf5\xcf\xae\
+\x55\x54\xbd\x16\x18\x5d\xbb\x0c\xef\x63\xfd\xd9\x44\x64\x01\x67\
+\x3e\x45\xc8\xb1\x41\x13\x94\x7a\xbf\x12\x35\xc9\x17\xc1\x9b\x0c\
+\x54\xa4\xbc\x90\x06\x09\x56\x18\xa0\x4c\x0c\x7e\xf3\xd6\x3b\xdd\
+\x6f\x2a\x1f\x41\x1c\x91\x64\x10\x09\xc1\x06\x66\xc0\xcb\x16\x84\
+\x68\x91\xc2\x20\x88\x00\x92\xa0\x86\x87\xb3\x82\x4d\xf0\x6d\xba\
+\x09\x71\xfe\x3f\x0e\x51\xfd\x58\xc9\x1c\x02\x30\x6b\x54\x3d\x4e\
+\x5d\xb1\x26\x48\xa2\x56\x85\x80\x22\x00\x50\xd0\x99\x6a\x8e\x70\
+\xc4\x13\x40\x38\x3c\xf5\x67\x00\xa2\x8b\x10\xb2\x47\x90\x78\x9b\
+\xec\xf2\x45\x62\x33\x74\x38\x49\x31\x88\xf8\x68\x58\x54\xde\x1c\
+\xc1\x8c\x5b\x37\x5b\x86\xd9\xac\xea\xec\xe8\xe8\x1a\x6e\xe2\x90\
+\xcf\xfd\xe4\xc9\x10\x2c\x84\x44\x12\x24\x34\xaf\x45\xf3\x9e\xdd\
+\xa8\xad\x35\x45\xb2\x1f\x84\xff\x00\xb9\xa7\x0a\x25\xbb\x03\x04\
+\x1a\xca\x8a\xb2\x28\x84\xe2\x08\xa0\x6c\xc1\xc5\x24\x42\x1a\x77\
+\xdc\xbc\xda\xa9\x02\x1d\x85\x20\x41\x3f\x93\x54\x14\x64\x94\x33\
+\xa2\xff\x00\x81\x8c\x59\x50\xf9\x68\x7d\x90\x28\x41\x09\x65\x5a\
+\x0b\xea\x45\x12\x9d\xa2\x0f\x16\xc1\x1f\xf2\xfe\xc4\x70\xbb\xcc\
+\x9b\x09\x8b\x27\xc9\x45\xd2\x27\xee\x99\xd8\xfc\xa5\x54\x46\x66\
+\x19\x47\x08\xf5\x50\xd3\x35\x2b\x8b\xba\x28\x04\xab\xc7\xa8\xe4\
+\x45\xb0\xaa\x04\x08\x94\x90\xb2\x35\xb1\xf4\x74\x4e\x94\x44\x8a\
+\x06\xa3\x00\x95\x32\xdf\x9f\x39\xda\x41\xd0\x40\xdd\x3c\xd6\x35\
+\xb3\xec\xe5\x6a\xd9\x14\x26\xa5\x5d\x27\xa2\x41\xc1\xd3\x1b\x67\
+\x56\xc8\xa6\x85\x32\x55\x71\x51\x1c\x53\xc0\xa2\x80\x8a\x22\x24\
+\x02\x81\x34\x41\x09\xa6\xe0\x6a\x2a\x82\x31\x7c\x37\xe3\x8c\x29\
+\xd1\x1a\xa2\x3e\x2b\x09\xee\xa2\x1f\x1d\xe7\x14\xbd\x88\x32\x14\
+\x0a\x67\x51\x5d\x5f\xe9\x80\x4e\x80\xff\x00\x3a\x74\x2b\xc0\x85\
+\xe3\x78\x8f\xa9\x8d\xce\x2c\xda\xa0\xbd\x6f\x7c\x20\xe8\xf0\x39\
+\x15\xa2\x16\x5c\x91\xad\x03\xc8\x91\xb9\xa7\x56\xa3\xf9\xa2\x40\
+\xe0\x02\xf1\xe2\x85\x2d\xcc\x9c\xa4\x2f\x60\xd1\xbd\x69\xb2\x66\
+\x6a\xd0\xbd\xa6\x88\x87\x48\xa9\x04\x80\x9f\x00\xb7\xce\x70\x88\
+\xd2\xf8\x41\x59\x52\x94\x89\x6b\x3f\xe0\xa9\xcc\x79\x41\xed\x4e\
+\xa2\xd3\x62\x1f\xcc\x23\x0f\x9b\xf3\x4a\xd4\xb5\xb8\x47\x79\x8e\
+\xf5\x8a\x22\x02\x0a\x61\x7e\xe7\xbb\x9a\x2d\xdc\x1a\x0b\x02\xe2\
+\x9a\xaf\x22\x89\x83\x66\xf9\xc1\xcb\x8f\x61\xc6\x98\xc0\x15\x87\
+\xe4\x80\xce\x2b\x42\x02\x90\x7c\x3a\xe1\xb4\xa9\x4e\xbb\x63\x55\
+\x2a\x63\x72\x6e\x23\x80\xd9\x8f\xc0\x34\xc5\x49\x06\x85\x8d\xbf\
+\x81\xdc\xb8\xc9\x0d\x38\x30\x2f\x81\x9f\x78\xf0\x82\xd1\xbf\x1f\
+\x63\xff\x00\xf3\xef\xdc\x79\x89\x39\x51\xce\xd2\xd4\x89\x61\xf6\
+\x1f\x18\xf3\xc2\x19\x8d\x86\x21\x0d\x41\xa0\x52\x16\x0a\x01\x4a\
+\x44\x7f\x8c\x26\xd9\x6f\xd4\xa2\x00\x5b\x6c\xb0\x3f\x89\x81\x43\
+\xf3\x4e\xa3\xbb\x49\x49\xd7\x93\x68\xa6\x16\x89\x79\x2a\xb2\xa8\
+\x51\x44\x9b\x63\xfc\x6f\x20\x6e\xb7\x04\x28\x01\x82\x04\x0f\x59\
+\xbc\x5d\x25\x95\xad\x60\x80\x22\x88\x62\xc6\x2d\xde\x16\x64\x11\
+\x51\x95\xf3\xc0\xfe\xbb\x93\xf9\xc8\x00\x85\x4f\xdf\xd3\x48\x9e\
+\xc4\xc7\x80\xaa\xdc\x22\x14\x0a\x2a\x56\xfc\x67\xc7\x55\x05\x96\
+\xc1\xba\x18\xd1\x40\x55\x54\xc7\xbc\xdf\x42\xed\x24\x45\x19\x71\
+\xe4\x77\xa5\x7a\x29\xac\x86\xf8\x01\x95\x4d\x17\xc7\x46\x3e\x33\
+\xe0\x10\x19\x0a\x22\x44\x64\xa7\xd4\x69\x00\x42\x58\x8a\x06\x14\
+\x81\x1a\x15\x4a\x72\x8a\x04\x41\xd1\x80\xa1\x00\x4c\x62\x6f\xdb\
+\xca\x81\x2a\x72\x53\x44\x9d\x28\x9e\xf8\x00\x9a\xe9\x3a\xa7\x07\
+\x26\x4a\x61\x10\xa5\xc2\x4d\xf4\x13\x91\x57\xc5\x89\x1b\x58\xe4\
+\x54\x8e\x9f\x15\xc9\x93\x06\x4d\x44\xa1\x38\xd9\x32\x90\x5a\xa1\
+\xa0\x64\x3e\x1c\x1e\x86\xe0\x4a\xe8\x51\x9d\x28\xd0\xe1\x05\x4e\
+\x2c\x22\xdf\xe6\xc4\x78\x07\x84\x93\x38\xe2\x1b\x00\x2c\x60\x26\
+\x05\x0c\x68\x3a\x0d\x00\xb4\x00\x09\xfd\x50\x83\x5b\xc3\x81\x49\
+\x2e\xca\xa7\x50\x21\x3d\x87\x77\x43\x34\x80\x42\x0e\x01\xa3\x6e\
+\xf2\x15\x2a\xe8\x75\x6c\x37\xaa\x55\xf0\x8a\x34\xa7\x81\xd5\x12\
+\xcc\xb3\xb0\x1f\x72\x56\xc1\x38\x19\xd6\x1e\x4a\xbf\x17\xf5\xb7\
+\x50\xda\x1e\x39\x84\x43\x35\x4c\x9d\x22\xff\x00\x98\x23\x1e\xab\
+\x63\x28\x50\x53\x15\x50\x0b\xf1\x60\x62\x2a\xee\xa0\xe1\x7a\x22\
+\x08\xb3\xef\xf7\xe7\x3d\x20\xdf\xd2\x0c\x13\x6a\x95\x5f\x67\x4a\
+\xab\x1b\x48\x59\x36\x4d\xd5\x03\xa5\x48\x7f\x6b\x28\xf1\x01\xb1\
+\x7a\x79\x72\x01\xec\x90\x35\x55\x44\x20\x8a\x50\x45\x08\x29\x2f\
+\x10\x62\xd0\x98\xa2\x22\x90\x4a\x1b\xbf\xb3\x98\xbb\x23\xf7\xa1\
+\x20\xfb\x08\x21\x7c\x1d\x64\x2e\xa5\x2c\x46\xa0\x25\x21\xf5\x00\
+\xbc\xf6\x51\x99\x2c\xcb\x83\x26\xb2\x15\x49\xc6\x5b\x7a\xd1\x3e\
+\x82\x4b\x23\x50\xc2\xb4\x41\x14\x87\xfc\x21\x08\xda\x6b\xa0\xc0\
+\xa3\xcc\x69\xd6\x62\x30\xab\x8a\x2c\x5a\x29\xe5\xce\x1b\xc1\xb5\
+\x18\x12\x0d\x54\x2e\x81\xf0\xe3\xdc\x2a\xd3\x18\x4c\xa6\x0c\x47\
+\x61\x17\x0e\xca\x0c\x02\x54\xee\xc8\x84\x34\x25\x5e\x9b\xa2\x42\
+\xb1\x2c\x37\x1e\xe5\xdb\x0e\x19\x29\x69\x94\xa6\x8d\x51\xa2\x38\
+\x4d\x15\x5b\xb8\x88\x40\x4b\x55\x58\x51\x91\xcf\xc0\x3c\xd3\x41\
+\x66\x14\x08\x3e\x8a\x61\x4e\x19\x6a\x4b\x21\xa2\xd7\xaf\x92\x84\
+\x1a\x5e\xb2\xf8\x51\xeb\x63\xf8\x9f\x17\xfc\x61\x48\xfb\x2a\xa1\
+\x28\x5b\x77\xfb\x54\xd7\x71\xd0\x9a\xea\x3f\x1e\xa0\x49\x2c\x56\
+\xa8\x26\xe2\xcc\xf4\xce\x8a\x89\x84\x03\x4d\xe0\x91\xcc\x5a\xe1\
+\x98\x80\x31\xc3\x32\x83\x4d\x29\x4c\x99\x1a\x05\x81\x04\x93\x9a\
+\x98\x32\x90\x54\x32\x6a\x1e\x28\xde\x06\xb2\xd4\xb6\x80\xa1\x0a\
+\x15\x28\x98\xa4\xb6\xa6\x39\x6d\x01\x41\x48\xdb\x9c\xb2\x28\x49\
+\xff\x00\x43\x30\x1d\x37\x18\x67\x06\xfe\xf3\xbe\xa6\xda\x08\x89\
+\xa3\x80\x2b\x47\xf8\x34\xa9\x4f\x83\xe9\x91\x59\x06\x27\x89\xff\
+\x00\xf3\x79\xc9\x54\x03\x73\x7e\x25\x1d\x86\xa3\x76\xf0\x15\xe8\
+\xa5\x81\xa7\x82\x88\x61\xcd\x02\x64\x40\xd0\x08\x43\x50\x6e\xd5\
+\xd0\x5b\xc3\x52\x8a\xf5\x00\x5a\x93\x39\x01\x56\x66\x1c\x23\x5e\
+\xa2\x2b\x8c\xb4\x27\x30\x15\x72\x4d\x37\xff\x00\xb2\x1b\xfa\x7c\
+\xbc\xe7\x6c\x24\x18\x30\x41\x4b\x20\x95\x95\x4e\xb4\xe1\x50\xfa\
+\x10\x46\x40\x46\xcf\x46\xce\x21\xa4\x02\x2b\x52\x62\x9e\x2d\x51\
+\xc1\x80\xce\x71\x28\xdb\x55\x80\x49\xf4\x8b\xf0\xd7\xce\x84\xce\
+\x26\x27\xe0\xb9\x43\x47\x5f\x12\x9c\xde\x3b\x91\x40\xac\xc4\x28\
+\x01\x68\xd5\xbc\x95\x30\x97\x10\x42\x48\x0f\xba\xb0\xe5\x91\x14\
+\x07\xa0\x32\x63\xe9\xd7\x43\xfe\x9c\x41\x83\xb0\xa2\x84\x0f\x22\
+\xac\xe0\x9c\x21\xad\x5a\x4d\xe2\x46\x45\x74\x75\xca\x22\xc6\x42\
+\x44\x41\x79\x2f\x50\x2b\x74\x88\x00\x85\x26\x45\x10\xa4\xa9\x3f\
+\x1d\x25\x94\x49\xd4\x10\xd8\xb1\xb5\x50\x2f\x26\x21\x69\xf3\xe1\
+\x14\x34\x06\x8b\x16\x4d\x7a\x81\xd8\x05\xe3\x45\x10\xd6\x7a\x9f\
+\xce\x84\x4f\xa5\x4f\x0c\x75\x96\x5e\x7e\xa9\x94\x40\xe2\xdf\x5d\
+\x10\x54\xcb\xc1\xc4\x20\x9e\xa8\x67\xed\x61\xc4\x07\x48\xd0\x1d\
+\x50\xea\x57\x46\x2e\xa4\x45\x7e\x87\x0a\x16\x97\x67\x60\xee\x91\
+\xc9\x5b\x11\x36\x43\x29\x80\xc4\x80\x20\x5a\x0f\xba\x8a\x61\x20\
+\xb4\x92\x8b\x0a\x84\xef\x2f\x88\xc5\x6f\x46\x5d\x7f\x31\xf1\xcb\
+\xc9\x46\x7e\xbc\x10\x61\x1c\x80\x00\x04\x1a\x98\x1a\x5d\x68\x82\
+\x14\x9a\x1a\x15\x13\x02\x89\x8d\x48\x1d\x44\xb8\x10\x00\x32\x63\
+\x53\xa8\x6e\xbe\x5d\x1f\x19\xa0\x3b\xe7\x48\x05\xe6\x2c\x6e\x2d\
+\xba\x13\x09\x78\xe2\x5a\x20\x75\x55\x00\xc7\x8e\x89\xb0\xe2\x04\
+\x0b\x9a\xca\x7a\x2b\xfe\x50\x07\x22\x76\x53\x32\x66\x36\x26\xd8\
+\xe9\x88\x8a\x00\xa7\x24\xa4\x8b\xc6\x4e\x59\xe0\x12\x92\x5f\x80\
+\xd1\xf5\x4a\x32\x44\xc0\x31\x0b\x01\x46\xc2\xaa\x2f\xe0\x8e\xec\
+\x52\x0a\x46\xaa\x49\x01\x51\xf1\xff\x00\x3a\x84\xa6\xa4\x05\x6a\
+\x97\x40\x3b\xa5\x21\x48\xb3\x41\x67\x81\x20\x28\x15\xef\xff\x00\
+\xc8\xe3\x02\x66\xca\x6a\x90\x90\xdf\xff\x00\x43\xb7\x86\xcc\x94\
+\xdb\x5f\xe9\x00\xa4\xa7\x39\xbe\xb1\x30\x94\x80\x08\x98\xd1\x44\
+\xc4\x43\x81\x82\xde\xa8\x89\xa1\x79\x06\x84\x2e\x25\xa0\xcd\x89\
+\x9a\x28\x47\x09\xa9\x68\x74\xae\xbd\xa0\x88\x4f\xaf\x00\x65\xf3\
+\x5e\x82\x51\x83\xe8\x14\x0a\x2c\x04\x85\x42\x2b\x76\x80\x66\x68\
+\x55\x6b\x62\x32\x40\xce\xda\x1c\x8b\x28\x90\xd2\x4c\x16\xca\xf3\
+\xdc\x84\x48\xb4\x60\xca\x80\x98\x08\x89\x45\x92\x02\x1d\x02\xa9\
+\x4a\x58\xbd\x1c\x62\x9a\xd0\x65\x0e\x45\x40\x60\xd4\x2d\xde\x77\
+\x10\x51\x42\x48\xea\x2c\x02\x3f\x47\x8b\xd0\x29\xaf\xa0\x3a\x80\
+\xb8\x15\x72\x50\x22\x69\xb5\x0a\x06\x3e\x65\x72\x13\x8a\x0b\xf8\
+\x2c\x3a\xd1\x83\x08\xed\x1c\xa6\x16\x11\xe3\x79\x9f\x12\xaa\x3c\
+\x10\x94\x5e\x30\x3f\x60\xb8\x92\xef\xbd\xd2\xf5\x25\x00\x90\x05\
+\xc4\xfd\xc8\xbe\xf4\x71\x56\xd1\xdb\xb6\x01\x2e\xbd\x86\xb1\xe0\
+\xed\x50\x53\x1f\x42\x07\xdb\x96\x5b\x90\x03\x70\x75\xe3\x82\xc1\
+\x7a\xbf\x92\x26\x04\x8d\xd2\xa6\x95\xb8\x20\xf5\x2c\x26\x7a\xcb\
+\x39\xa4\x45\x3b\x5d\xa5\xa3\x95\x26\xc6\xbc\x1c\xad\xa0\x2d\x24\
+\x81\x11\xce\x12\xd2\x3c\xea\xa3\xd4\xfe\xb4\xe2\xd2\xae\xbd\xa4\
+\xf0\x85\x10\x41\x3c\x92\x68\x16\xc1\x20\xd2\x83\x3d\x8e\x3e\xa4\
+\x29\xbf\x75\x33\x4c\xaa\xdd\x50\x14\x28\xc9\xc6\xad\x0d\x19\x10\
+\xae\xe8\xcd\xc8\xec\x06\x72\xe3\x66\xb4\x42\xa6\x03\xec\x52\xd3\
+\xe2\x31\xe0\x94\x32\xa9\x30\x36\xd1\xbe\xbf\x1b\x39\x85\x6a\x38\
+\x54\xb3\xef\x04\x34\xa0\x54\x47\xa0\x80\x28\x29\xa9\xa8\x97\xfe\
+\x3f\x89\xb7\x8a\x50\x98\x8e\x4a\xfd\x7a\x50\x8a\x5d\xa5\x44\x80\
+\xb0\xa3\x48\xc8\xb8\xb1\x27\x14\x60\xd2\xb2\xc8\xaa\x88\x28\xea\
+\xcc\xe4\x51\x39\x80\x44\x04\x35\x88\x40\xad\x49\x46\xf3\x71\x09\
+\xfa\x4a\xc8\x41\xab\xef\x09\x10\x2c\x88\xa4\x06\x8b\x11\xc4\x51\
+\x09\xcf\xc4\x01\x51\x91\x16\x94\x21\x8d\x97\xdd\x19\x88\x2c\x61\
+\x38\xc4\x51\xe6\x5d\x54\x13\x9b\x8b\x46\x65\xcc\x60\x62\x21\x6b\
+\x06\xc7\xaf\xd0\x3e\x11\x45\x32\x48\x88\xa8\x80\xab\xa0\x46\x04\
+\x8c\x29\x5e\x1d\x8d\xd2\x71\x47\x22\x4b\x44\x7f\x80\x99\x3d\x04\
+\x51\x7a\x80\x51\x03\x6a\xb8\x5d\xf2\x5c\xd3\x86\x04\x9a\x30\xcc\
+\x26\x47\x11\xfd\xe9\x68\xb5\x61\x50\x0b\x5c\x07\x82\x06\x0a\x25\
+\x39\x29\x45\x8f\xab\x04\x11\x1e\x88\xaf\xf9\x06\x03\xd0\x44\x35\
+\xa1\x6e\xd6\xcd\x26\x48\x1b\xc3\x09\xb7\x78\x6d\x58\x47\xae\x23\
+\x72\x30\x26\x4f\xb6\x7a\x52\xfc\x8f\xbc\x19\x65\xd0\xa3\xb8\x57\
+\xb5\xa0\x10\x5c\xf0\x61\x41\xef\xde\x8a\x42\x35\x8b\x7a\xc8\x13\
+\xbc\xf5\x73\x6a\x94\x54\x05\x50\xa7\x22\x17\x06\x7e\x6e\x2b\x05\
+\x3b\x94\xaa\x19\xc8\x87\x9b\x34\x29\x7a\x94\xef\x6b\x3e\x2d\xb7\
+\xcd\x65\x11\x57\x42\xba\x05\x2a\x14\x32\x82\x46\x16\x03\x81\xf1\
+\x13\x60\x05\x19\x82\xa0\x08\xe8\x14\xd9\xde\x5c\x9a\x8c\xf5\xc2\
+\xc7\xd5\x4a\xf5\x4b\xea\x6c\xd3\x87\xec\x5d\x25\x05\x77\x3a\x35\
+\xc2\xef\x67\x00\xfb\xf8\xda\x9d\xe1\xce\x11\xe6\x96\xb1\x66\xfc\
+\x30\x1e\xc2\xa8\x54\x5e\x4a\x02\x06\x8b\xf8\x8b\xf8\xdc\xa6\x4f\
+\x7b\x2e\xfa\xd0\xf8\x05\x52\x30\x62\x3b\xec\xea\xe7\x19\x6c\xc2\
+\x61\xf4\xc8\x64\xb1\x47\x9f\x65\x8d\x94\x29\x8d\xd0\x00\x10\xc8\
+\x16\x2b\x1d\x64\x8f\x50\xa8\x6a\x32\x28\x37\x03\xf8\x5b\x4c\x68\
+\x44\x06\xa0\x1b\xf6\x47\xa7\xc8\x13\xc5\xf0\x53\xd5\x14\x11\x00\
+\xba\x3c\x3f\x1a\x2a\xcd\x55\x00\xc8\x05\x10\xaa\x22\x6c\x14\xda\
+\xa0\xac\x0d\x00\x0e\xd2\x06\xbe\xb0\x2e\xb0\xdc\x6f\xcb\xf0\x3b\
+\xcd\xab\x10\x84\xc4\xc3\x3d\xfb\xeb\xf4\xce\x72\x99\x32\x3d\x5b\
+\x07\xa9\x00\x54\x87\xe9\x5e\x1a\xd4\x2d\x10\xd9\x15\x24\xa0\x15\
+\x4c\xeb\xdf\x36\x7e\xef\xea\xa4\x7f\x84\x69\xc4\x80\x80\x1b\x44\
+\x14\x3f\x69\x10\x63\x40\xf2\xbc\x14\xcc\xb9\xb0\x25\xcf\x84\xf6\
+\x7f\x79\x8a\x4d\xf5\x6a\x9a\xa5\xe0\xc5\x7d\x41\x39\x90\x9b\xdb\
+\x00\x03\xe2\x7d\x4d\xdc\x13\x76\xd2\xed\x6a\xcb\x36\x18\xb7\x9f\
+\x58\x1b\x09\x0e\x30\x01\x81\x06\xc4\x46\x30\x29\x41\xce\x84\x9c\
+\x09\x70\xd2\x1b\xe3\xf2\x6d\x1a\x69\x1a\x16\xa5\xba\xd9\xe5\x06\
+\xbd\x0d\x7c\xaa\xbd\xf6\xaa\x37\x71\x98\x26\x41\xc8\xdb\x68\x5c\
+\xaa\xe8\x4a\xac\xe7\x80\x45\x4c\xae\xb9\x13\x5b\x64\x74\x10\x69\
+\x21\x27\x0a\x11\xa1\x81\x00\xc1\x02\x14\x04\x8a\xbb\x97\x67\x19\
+\x80\xe9\x0b\x25\x88\x9a\x52\xe7\xac\xac\xe0\xdf\x16\xdc\x5a\x04\
+\x32\x22\x5c\x61\xc6\xf7\x1b\x34\x1c\x28\x88\x46\x3d\x0f\x60\xb6\
+\xf3\x40\x04\xfe\x06\x7e\xb4\x66\x62\x86\x4f\x64\x91\x41\xe3\x78\
+\x0b\xa5\xd3\xe8\xff\x00\xa0\x57\xc2\x29\xd8\x36\x97\xfc\xe4\x5d\
+\x25\x17\xbe\xd3\x40\x8e\x83\x30\xc0\xf7\xc8\x81\x02\x83\x0a\x06\
+\x20\x30\x51\x37\xf9\x1e\x9d\xc9\x05\x80\x34\x0b\x50\x50\xd4\x76\
+\x72\xc9\x6d\x56\x2b\x14\x11\x28\x45\x41\x04\x5a\x48\x02\x2a\x21\
+\x41\x61\xa2\xd0\x2b\x4d\x73\xd7\xb4\x4e\x38\x33\x80\x8a\x6b\x54\
+\xa4\x09\xd4\x4c\x3a\x2d\x51\x46\xb3\x12\x51\x7a\xcb\x33\x00\xb6\
+\xdc\xaf\x69\x5e\x45\x6d\xa8\xe9\x29\xb0\x00\x5f\x7f\x1b\xe7\x47\
+\xce\xd0\x31\x70\xc2\x38\xc0\x63\xa9\x44\x6e\x5c\x40\x40\x54\x48\
+\x95\x81\xc6\x09\x72\x14\xa1\x0a\x0a\x48\x85\x6b\xea\x72\x0a\xdf\
+\x11\x0c\x41\x19\xf0\x1a\xff\x00\x78\xd8\x50\x09\x5f\x41\x8f\x41\
+\xd5\x85\xe1\x4d\xf7\x74\x10\x48\x83\x02\x8b\xb6\xfc\x15\x61\x49\
+\x56\xd8\xb8\x61\x87\x30\x74\x2f\x35\xa8\xb0\xf4\x8c\x40\x42\x4f\
+\x06\x29\xa2\x34\x4f\x6c\x0a\x90\x9e\x2d\x5e\x2c\x86\xf0\xa7\x25\
+\x50\x4b\x42\x03\x14\x16\xbe\xfe\x0d\x3c\xf1\x12\xda\x21\x01\xa4\
+\xf7\x49\x6a\x54\x40\x50\x63\x62\x40\x16\x0d\x06\x1a\x25\x05\xe3\
+\x8d\x8b\x5d\xfe\x32\xda\xa3\x43\xbd\x0b\xaa\xc5\x7e\x6c\x59\x66\
+\xcc\x14\xd2\x67\xea\xb7\xe8\x45\x9a\x07\x48\x7e\x16\x6b\xb8\x0c\
+\xb4\xbf\xe8\xaf\x1d\x1b\xea\x40\xf9\xf1\xa9\xe9\x78\xd1\xa4\xb8\
+\x07\x99\x04\x91\x8a\x7b\xe9\x24\x20\x1e\x43\x6a\x08\xfb\x17\xa8\
+\x8f\xf0\x0a\xfb\xad\xd4\x4a\xcf\xbc\x3e\x86\xae\x5a\x0a\x33\x00\
+\x27\x93\x94\xa2\xb5\xf8\x28\x87\x15\xa0\x71\x2b\x5a\x7c\x00\x8a\
+\x95\x45\x47\x99\xe6\x16\xf2\xd7\x84\x5a\x94\x93\x29\xec\x90\x8a\
+\x81\x01\x82\x4a\xa2\xbb\x94\x32\x2c\x82\x3d\xce\x74\x0d\x61\x0b\
+\x2d\x29\x1b\x62\x4e\xe7\xf8\x76\x8b\x4d\x44\x4a\xf4\x18\x92\x14\
+\xc0\x4e\x89\x98\x29\x05\x85\x3d\x00\xad\xff\x00\x74\x99\xef\xa7\
+\x03\x62\xa3\x39\x76\x04\x0b\x37\x43\x23\xd8\x03\x56\x2d\xa5\x2a\
+\x7a\xb8\x32\x07\xea\x00\xd4\x16\xf3\xc0\xed\x47\x51\x1a\xeb\x22\
+\x68\x8b\x03\x12\x42\x08\x62\x91\x47\xa2\x3f\x0c\x3e\xf9\x3a\xed\
+\x45\x00\xa4\x35\x93\x10\x55\x49\x85\x60\x6e\x65\x68\x04\x02\x89\
+\x43\x6d\x42\x27\xc6\xc0\xfc\x80\x55\x5d\x7e\x94\x8d\x3c\xa9\x29\
+\x41\x8d\x11\x18\x26\xaf\xd2\x43\xa4\xa3\xd0\x77\x44\x2f\xa4\x51\
+\x89\x21\x73\x19\xae\x80\xa5\x03\xa3\x4b\x23\xe2\x58\x0a\x3c\x70\
+\x60\xa9\x25\x08\x42\xe2\x82\x6f\xbd\xa4\x5a\xa1\xf4\x11\x5f\x88\
+\x6b\xf5\xce\x43\x87\xe0\x48\xb6\xa8\xb0\xd4\x60\x90\xbc\x16\xf4\
+\xa8\x4c\xc4\x64\x38\x2b\x47\x08\x07\xbd\x48\x79\x3e\x06\x29\xb6\
+\x7d\xa9\x3c\xe0\xf7\x3e\x24\x14\xd1\x52\x08\xf4\x1d\x21\xc3\x67\
+\x98\x28\xd6\x69\xd2\xa8\xb3\xc7\x66\x74\xbe\x75\x40\x8d\xc0\xac\
+\x35\x22\xe1\x88\x9c\x03\x08\x00\x45\x5f\x51\x10\x34\xfc\xce\xcc\
+\x3f\x6a\x68\xfd\x12\x4a\xcf\xb0\x2a\xb0\xb0\x18\xb2\x2c\xa0\x27\
+\xc6\x2f\x00\x83\xa0\xfc\x82\xce\x12\x41\x7f\xcd\xe4\x19\xfd\xea\
+\x84\x43\xb9\xe7\x6b\xae\x30\xe9\x73\x94\xed\x08\xaa\x13\x48\xfc\
+\x10\x77\x39\x07\x8d\xe0\x58\x8d\xa0\x3c\xe0\x80\x09\x87\x89\xb0\
+\x4f\x54\x23\xdb\x38\x00\x1e\x07\x05\x60\xb0\xd1\xd8\x8d\x06\xf4\
+\x37\x55\xcc\x81\xa7\xfe\x5a\x5c\x9b\x7a\x9d\xfd\xe3\x8f\xf0\x69\
+\x3e\x40\x45\x8f\x92\x4c\x21\xb0\x60\x26\xc4\xc7\x75\x30\xae\x0b\
+\xc8\x1a\x7d\x4f\xcd\x54\x1e\xbd\x93\xb3\xb5\x49\xd1\x33\x3c\xe2\
+\x65\x68\x8c\xd5\xda\xb8\x9b\x57\x4f\xc2\x47\xd3\x10\xf0\xd9\x35\
+\x84\x55\xc4\xfb\xb2\x7d\xce\x09\x55\x10\x1b\xbe\x08\x00\x82\xcf\
+\xfd\xef\xa4\xe2\x63\x7c\x53\x0a\x75\xb2\x6f\x16\x5e\x31\xc0\x21\
+\x81\x06\xbc\x5d\x97\x86\x49\x2e\xba\x22\xb8\x2b\x9e\x07\xff\x00\
+\x79\x08\x58\x90\x60\x21\x45\x55\x00\xe7\xdc\x8c\x4b\xe1\xab\x42\
+\x7f\x91\xa0\x01\xa8\x58\x83\xcc\x0c\xbf\xff\x00\x1b\x0f\x37\xc1\
+\xaf\x6c\x2d\xe6\x95\xca\x23\x4b\x28\x61\x33\xc8\xf5\x9f\x52\x57\
+\x21\x24\x23\x05\xf4\x94\x97\xa7\x3c\x7a\x11\x60\x88\x09\x2d\x15\
+\xd1\x0c\xe8\x81\xa5\x3c\x2e\xd3\xc7\x4b\xc5\x20\x3e\x0a\x08\x22\
+\x74\x54\x14\x50\x47\x29\x46\x36\x87\x2d\x2a\x01\x40\xa8\x05\x22\
+\x53\xf4\x73\x3b\xf2\x83\xeb\x3d\x82\x51\x45\x0f\x9f\x5e\x59\xe9\
+\xd1\x2c\x84\x81\x30\x69\x14\x21\x68\x27\x3d\xd4\x54\x3f\x51\x4c\
+\x43\xe2\x6e\x0e\xf5\x9b\x0e\x83\x46\x06\xc8\x88\x1a\x96\xdc\xed\
+\xb0\x02\x41\x45\x82\x21\x9b\x8e\x3e\xfd\xe7\xf8\xb1\x10\x17\x43\
+\x4b\x71\x18\x24\xf3\xa0\x05\xd1\x1c\xc8\x31\xaa\xc1\xe2\x9f\x09\
+\xd5\x4b\x86\x59\xa0\x3d\xd0\xba\x78\xa2\x20\x58\x50\x01\x25\x6a\
+\x43\xae\x78\x54\x76\xdd\x0f\xb1\x00\x0a\x2d\x72\xac\xc5\xe8\x8c\
+\x0a\x9a\x00\x9d\x9c\x30\x03\xa2\x9d\xd1\xdc\x84\xe8\x97\x01\x9b\
+\xa1\x96\x66\x31\xca\x6a\x8b\xd2\x34\x1a\x27\x2d\x24\x94\x34\x32\
+\x69\x1c\xe9\x24\x65\x7e\xd6\x4c\x21\xd2\xe2\x61\x6e\xa6\x92\x3a\
+\x30\xa3\xe0\x49\x0f\x18\xf1\x00\x55\x98\x30\x9d\xdd\x03\x93\x45\
+\x8c\xdc\xbc\xb8\x55\xfd\xb1\x00\x7d\x49\x46\xc3\x0e\x0c\xfb\xd1\
+\x53\x89\x55\x41\x6d\x60\xb8\x01\xbf\xf1\xda\x37\xc5\x97\xef\x84\
+\xfc\x2e\x6c\xd3\xe6\x01\x6b\xf0\xb4\x70\xcc\xb1\x54\x48\x70\x66\
+\xc8\xed\x0c\xff\x00\xdd\x24\x3d\x5b\x76\x4f\x94\xd1\x14\x06\xe1\
+\x49\x9b\x8c\x2b\xfa\xf3\xf1\x38\x6c\x14\x44\x35\x54\x62\xaa\x6f\
+\x41\x88\xc2\x42\x0f\xa6\x0f\xd0\x87\x17\x2d\x61\xc0\x21\x02\x1a\
+\x22\x24\xf0\x7b\xcf\xd1\x40\x15\x09\xd4\xd2\xbe\x96\x58\xcf\x9d\
+\x91\xf9\x43\x66\x98\xb6\x2d\x29\x43\x39\x3c\xc8\x64\x90\x62\xb6\
+\x62\xd5\x35\x0f\xa1\x3c\x84\x2b\x20\xd1\x0a\x00\x46\xac\x44\x24\
+\x40\x24\x95\xce\x1c\x14\x35\x07\xd0\xb1\xfb\xd9\x63\xb1\x81\x00\
+\x9d\x1a\xb1\x16\x52\xb8\x96\x2e\xc1\x77\x80\xc1\x1a\x52\x10\x73\
+\xc7\xaf\xee\xe0\x19\x81\x29\xe0\x65\x1c\xbb\xcc\xe0\x40\x53\x45\
+\x28\x7d\x10\x90\x90\x64\xf4\x40\xe5\x28\x55\x06\x2b\x23\x7d\x07\
+\x67\x05\xa1\x0b\x0a\x12\xfe\x37\x12\x98\xf0\x3e\x44\x50\xc1\x27\
+\xb5\x11\x5c\xe3\x9d\x65\x60\x55\xf8\x8a\x23\xf0\x00\x38\x8f\xe2\
+\x04\x39\xc9\x6a\xa5\x75\x42\xd9\x8e\x47\x7a\xd4\x34\x84\x80\xa8\
+\x46\x88\x2c\x98\x6e\x53\x94\x21\x50\x8b\x20\x40\xa1\x5d\x08\x9b\
+\xcb\xac\xc2\x33\x6a\x08\x19\x70\x2a\x03\x5c\xb4\xd8\xc9\xc5\x23\
+\xa3\x5f\x86\x18\x1a\xf1\x23\x71\x47\x5c\x20\xaa\x8d\xf0\x6c\x06\
+\x08\x9b\x96\x23\x93\x88\xb9\x00\x95\xdc\x47\xc5\x08\x42\xc2\x83\
+\x9a\xb6\x0f\x6c\x9d\x10\x1a\x00\xeb\x79\x41\x12\x90\xb1\x00\x24\
+\x4d\xd2\xb5\xc1\x03\xcf\x21\x0f\xe7\xa0\x09\xa1\x47\xd2\x51\x50\
+\x0c\xf0\x6f\x6c\x15\x4e\xe5\x0e\x3e\x60\x43\xdc\x07\x18\x6e\xa2\
+\xfc\x34\xe2\x48\x53\x53\xd6\xfd\x44\x0d\xe2\x87\x0e\x8c\x19\x68\
+\x9a\x45\x79\xa4\xa7\x9a\xf0\x92\xb4\x7d\xff\x00\x91\x59\xb7\x9d\
+\x6d\xc1\xa5\x51\x2e\xa6\xf6\x89\xc0\xaf\x6d\x9d\x8e\xf8\x45\x20\
+\xc1\x89\x31\x70\xb8\xf8\x97\x03\xa5\xd5\xd4\x69\xf2\x8a\xac\x01\
+\x42\xa8\x1e\xf0\x53\x46\x80\x98\xb2\xa6\x02\x11\x45\x00\xb7\x8f\
+\xd8\x43\x48\x40\x30\xb0\x1d\x1e\xe4\xe3\x42\xf4\x66\x6c\x4b\x17\
+\x10\xa2\x5d\x18\xf0\xa8\x0e\x54\x46\x1e\x80\xc1\x0a\x50\xdb\x38\
+\xc4\xd0\x04\xec\x0b\x54\x52\xd3\x7d\x0b\x99\xc8\x17\x83\x2d\x55\
+\x1b\x28\x94\x62\x56\x82\x76\x9c\x65\x73\xf4\x10\xf0\xcf\x4c\x46\
+\xce\x15\x17\x46\x44\x4d\x84\xd6\xa6\x20\xcc\xcd\x1d\x48\xc8\xc0\
+\x74\x82\x05\x05\x4f\xc8\x31\x9c\x90\xd4\x88\x7f\xf1\x56\x29\x48\
+\x40\xa6\x3f\x5a\x20\xbd\x75\x75\x34\x86\x35\x18\x71\xf3\xc9\x2c\
+\x40\x20\x22\xd2\xa1\xa2\xf3\xde\x16\xb0\xd1\x09\x61\x8c\xe4\xaf\
+\x84\x18\x0a\x20\xf7\x8c\x51\x80\x22\x42\xa2\x6a\x7a\x35\x98\x86\
+\x48\x52\xa0\x51\x85\x6a\xd0\x66\xce\x6e\x10\x94\x66\x64\x80\x98\
+\xd1\xbe\x71\x8c\x29\x49\x6c\x40\xd4\x2d\x3e\x1b\xf1\xc2\x39\x42\
+\x8a\x49\x62\x52\x93\xea\x16\xf8\x71\x71\x20\xd9\x14\xd5\x88\xa0\
+\x45\xac\x4a\x20\x0e\x11\xf3\x41\x94\x93\xea\x15\x0a\x05\xd0\xc9\
+\xa9\x5c\x44\x54\x5a\x20\x89\xce\xa7\xbf\x7c\xfb\x44\x89\xe3\xe2\
+\xf1\xf1\xe3\xc4\x31\xa8\xdf\x50\xaf\x0e\xa0\x4a\xae\x18\xe4\x33\
+\x4a\xa0\xef\xc0\x91\x18\x32\x7f\x53\x28\xaf\x41\x06\x24\x0f\xe1\
+\x55\x40\x86\xe1\x24\xc0\xe2\xb3\xc8\xd6\xd9\x98\x3f\x2b\xf2\x4a\
+\xca\x61\x21\x9f\xe5\xa3\x46\x90\xa9\xa8\xf1\x63\x25\xc1\xec\xb6\
+\x10\x83\x58\xab\xb5\x2e\x22\xd3\x86\x40\xc3\x5f\x67\xfc\x3b\xc6\
+\x64\x76\x23\xea\xc9\x6c\x9a\x5e\x83\x4f\x09\xe2\xd0\xe9\xc4\xee\
+\x27\xea\xc0\x6e\xdd\x10\xe2\x49\x81\xdd\x82\x6a\x5b\x25\xbd\x99\
+\x36\x9f\x2a\x54\x91\x1d\x10\xed\x25\xe0\x0b\xe8\x5a\x01\x6a\xc5\
+\x8a\xb8\xaa\x00\x20\xa6\xb7\x9c\xa5\x61\x22\xc6\xb0\x95\x1e\x0d\
+\xf7\x39\x09\xab\xda\x2f\x60\x28\x60\x44\x94\xa3\x2f\x05\xc9\xb5\
+\x42\xca\x02\xcf\x8f\x82\x0f\x79\x2d\x29\x9d\x01\x98\x61\x08\x94\
+\xa3\xc3\x26\x23\x4c\x2f\x83\x47\x94\x71\x8e\x84\xeb\xc0\x33\x32\
+\x03\xc0\x08\xd3\x7d\xa5\x08\xb4\x42\x28\x24\x41\x40\xa0\xfa\x1f\
+\xf7\xf8\xce\x16\x9d\xbf\x48\x88\x08\x61\x58\xab\xe5\xfc\x5f\xaa\
+\xe8\x85\x9a\x07\x92\x9a\x2d\x88\x7b\xc7\xa1\xab\xc0\xb8\x40\x09\
+\x03\x34\x5f\xfe\x72\x35\x99\xd5\x32\x80\xd6\x21\x8b\x5a\x10\xf1\
+\xc1\x12\xf8\x6b\xa1\x94\x0a\x04\x55\x28\x84\x5e\xc4\xd4\xa5\xbd\
+\xa6\x82\x84\x8d\xfe\x1d\x08\x12\x53\x0c\xdc\x85\x62\x19\x80\x84\
+\x6c\x61\x22\x05\xc6\x41\x69\x69\x88\x35\x1e\x56\xf3\xc0\x2d\xa5\
+\x6d\x40\x8f\x80\x58\x4b\xcd\x37\xe8\x4c\x8d\xf0\x2b\xeb\xcb\x32\
+\xce\x32\x83\xc6\x8a\x30\x2c\x2c\xab\xf6\x5e\xf1\xc0\x01\x5e\xa4\
+\x9e\x01\xf5\xc2\xa7\x11\x76\x1a\x11\x4d\x41\xd5\x00\x20\x21\x54\
+\xa7\x21\x99\x51\xa9\x00\xc7\x30\xb1\xc1\x46\x76\x41\x95\x98\x84\
+\xf4\xa3\x3c\x84\x99\x1d\x99\x66\xf1\xab\xbe\x30\x2b\x59\x74\x56\
+\x6b\x9a\xeb\xd1\xe3\x2e\x4c\xc9\x16\x37\xd0\x57\x7b\xa8\x00\x08\
+\x0a\xc0\x15\x55\x60\x14\x5e\xad\x0e\xbf\xa0\xd8\xee\x11\xda\xee\
+\x11\x67\x8f\xa9\x37\xb2\x0c\x47\x14\x12\xa8\xf3\xd0\xda\x9a\x6f\
+\x0e\x86\x27\xb4\x0b\x95\xad\x12\x1c\x15\x62\x4f\x97\x8f\x4f\x29\
+\xda\x1a\x62\xdf\x10\xc6\x81\x00\x69\x04\x64\x74\x9d\x97\xb8\x01\
+\x42\xb7\x43\x7f\xd1\x3f\x2e\xde\xfe\x11\x99\xae\xed\x85\x2e\x9d\
+\x2d\xd5\x32\x26\xb9\x30\xdb\xc7\x12\x64\x04\x03\x67\xd4\x05\x23\
+\x12\x90\x00\xa0\x33\x34\x25\x10\x19\x51\xf2\x8b\x94\x48\xeb\x41\
+\xf5\x5d\xa4\x16\x86\x1c\xd1\x04\x24\xc0\x40\x2b\x10\x81\x6d\xf7\
+\x33\x8f\x05\x2e\x42\xa5\x7d\x88\x01\x07\xcf\x9c\x8c\x02\x4a\x2c\
+\xc6\x93\x30\xd5\x22\x96\xb8\x01\x10\x80\x2c\x2e\xba\x16\xb7\xc8\
+\x00\xa4\x62\xce\x6e\x99\x58\x32\x6c\x82\x17\x73\x48\x91\xef\x4a\
+\xb8\x5d\xb9\x62\xae\xfa\x1c\xae\x17\x91\x07\x47\xf7\x14\x84\x42\
+\xa9\x79\x9c\xaa\xa0\x15\x0c\x43\x97\xeb\xff\x00\x79\x88\xc6\xa0\
+\x05\x08\x86\xaa\x00\xd9\xb6\x67\x1b\xe0\x66\xd4\x4c\x4c\x18\x41\
+\x87\xae\x35\x0d\x00\xa9\x48\x81\xa7\x28\xca\x5c\x3a\x1c\xc0\xd8\
+\xac\x0a\xd6\xdb\xe9\x27\xa4\xe4\x41\x46\x92\x54\x2c\x1d\x41\x5f\
+\x2c\xde\x74\x6f\x8c\x2c\x96\x26\x1b\x7b\x33\x4f\x8e\x93\x64\x2a\
+\xb2\x8a\xd1\x24\xf4\xaa\x63\x22\x7a\x71\x49\x06\x0f\xc0\x98\x84\
+\x34\xa0\x99\x84\x90\x95\x4c\x2e\x96\xc5\xf8\x5e\x86\x30\x5c\xa3\
+\x0d\x00\x8b\x14\x05\x16\x99\xc2\x8f\x5a\x8b\x04\x3d\x74\x9a\xb8\
+\x6c\xb7\x88\x68\xb3\x8b\x46\x5a\xa4\x29\x80\xa5\x07\x06\x4e\x19\
+\x6b\xd7\xbd\x7a\xa2\x9e\x1d\xdb\x73\xeb\x2f\xf5\x95\x80\xca\xa6\
+\x03\x00\x03\x75\x07\xc2\x32\x11\xd2\xaf\x18\xb6\x0f\xb0\x7a\x0e\
+\xc0\x93\x0b\xb5\x8a\x5c\x6c\x99\xa2\xb7\x07\x49\xfb\x0c\x0d\xb5\
+\x04\xb0\x2f\x48\x86\xa0\x2c\xd2\x52\xd4\x9c\xba\xc0\x97\x99\x25\
+\x16\x08\x0c\x8f\xa2\x93\xa3\xf8\x9c\xa4\x44\x43\x3a\x38\x95\x78\
+\x0f\xc3\x46\xa6\x85\x0e\xaf\xde\x69\x06\x80\xe9\xb0\x1e\x42\xc9\
+\x33\x02\x41\x99\x4a\x6e\xf0\x25\x02\x42\xcd\xaf\x84\x7b\x0b\xef\
+\x00\xf0\xc3\xb9\x04\xfb\xb9\xd7\x60\xbc\xbb\xb0\xed\x7e\x52\x4b\
+\x08\x41\x15\xf4\xa0\x15\x12\x66\x04\xa0\x1d\x60\xb2\x7f\x3e\x72\
+\x0b\xa8\x0d\xa2\xea\xa8\x8b\x1f\x36\x2d\xe0\xd0\x50\x3a\x4e\x82\
+\x2a\xa8\x3f\x16\xb4\x27\x21\x7b\x27\xc9\x62\x3c\x18\x20\xa0\x84\
+\x50\x7b\xc2\xda\x15\x5b\x0c\x00\x93\x48\x23\x78\xa2\xcc\xdd\x08\
+\x81\xa4\xd6\x09\x63\x65\xe9\xc5\x9c\x40\x44\x2e\x80\x37\xc0\x84\
+\x41\x1f\xd4\x10\xe3\x5b\xac\x0a\xa4\x86\x48\x7b\xd7\x18\x13\xa8\
+\x93\xd1\xc0\x9a\x1b\x39\xe1\x48\x6e\x57\xfb\x22\xa4\x24\x8d\x05\
+\xba\x72\x76\x6d\x33\xd0\xb7\x8d\x44\x90\xa1\x14\x78\x6f\xb1\x32\
+\x02\xa7\x0f\x90\xff\x00\x3c\x67\x9b\x3b\x11\x12\x6a\x8e\xd9\x2c\
+\x2c\x79\xcf\x86\xc4\x6b\xd9\x04\x0a\xf8\xf9\xfa\xd5\xba\x67\x00\
+\x30\x36\x19\xc4\x1e\xe3\x39\x8b\x23\x35\x59\x5f\x68\x42\x82\x40\
+\x35\xc7\x4c\x40\x32\x21\x1b\xb0\x0a\x89\x49\xf7\x2e\x5c\x88\xb1\
+\xac\x89\x71\x04\x14\x11\xf3\x81\x3e\x3e\xd8\x73\x20\xe9\x64\x94\
+\x01\xd1\x00\x44\x9c\x11\x2a\xb4\xbb\xfd\x09\xd5\xf4\xfd\x31\x0a\
+\xaf\x02\x48\x36\x3d\xe8\x08\x2d\x7d\xd2\x50\xd0\x06\x8c\x87\x32\
+\x85\x68\x00\x4e\x84\xd1\xac\x1e\xd6\x6d\xcd\x2d\xc4\x54\x37\x1f\
+\x02\x21\x7e\x3f\x9c\xbf\x4e\x8f\x18\x50\x93\x40\xf7\xd2\xa1\x15\
+\xb0\xe5\xc4\x98\xc6\xf9\xc4\x25\xb8\xa4\x80\x18\xbe\x19\xaa\x1e\
+\xa1\xd8\x7b\xbe\x62\xe2\x06\x96\x1c\x32\x11\xcd\x0b\x87\xa2\xfa\
+\xf9\x5b\xbd\x3c\x92\x96\x86\x6d\x10\x71\x09\x54\x69\x94\xb5\x82\
+\x23\x5e\x6a\xaa\xb7\x6f\x21\x86\xe9\xe3\xd4\x24\x49\xf8\x9d\xc6\
+\xf5\x0c\x20\x00\xd7\xb8\xad\x83\x5d\x5c\x85\xf0\xf8\xde\x00\xaa\
+\xed\x8a\x15\x14\x08\x64\x8c\x73\x47\x16\xe6\x28\x31\xe9\xb2\x1d\
+\x3d\x31\x02\x88\x5b\xe1\xa2\xed\xa0\x4a\x09\x51\x38\xca\x57\xb6\
+\xe0\x51\xe9\x40\x84\x75\xfd\x67\x23\x24\x84\x22\x39\x80\x7d\x67\
+\xac\x04\x67\x1c\x00\x49\x10\x18\x29\x1b\x51\xc5\x81\xe9\x39\x60\
+\x16\xa3\x8b\xf4\xa2\xad\xf5\x28\xd8\xa3\x2c\x08\x84\x80\x10\xa7\
+\x04\xd7\x3f\xba\x01\xc0\x96\x1a\x09\x62\x97\x6f\x1e\x48\x57\x43\
+\x46\xd1\x32\x81\x03\x5b\xef\x3b\x63\x48\x4c\xf5\xb1\x8e\x85\x65\
+\x07\xde\x57\xb8\x60\x92\x60\x8d\x01\x6a\xc0\x9e\x72\x08\x30\x4b\
+\xa4\xd4\x93\x1f\x02\xb8\x65\x94\x02\x01\xeb\xc4\x4a\x9e\x83\x58\
+\x17\xbc\x09\x57\x8b\x65\x08\xf2\x4f\xfe\xf6\xb0\x3a\xe9\x09\x41\
+\x8e\xe0\x05\x60\x88\x53\x40\x43\x8d\x2b\x12\x53\x3e\x7d\x3d\x3b\
+\xa8\x7d\x6d\x27\x8b\x1e\x58\x0f\xcb\xd4\x32\x11\x1c\x0e\x28\xa8\
+\x5f\xe0\x50\x1d\xeb\x8c\x02\x6c\x07\x80\x8d\x77\x62\x94\x41\x7f\
+\x9e\xc2\x60\x86\x91\x15\x08\x00\x5f\x8e\x0f\x95\x40\x6c\x44\x68\
+\x00\x74\x13\xd1\xa2\x88\x07\x42\xf4\x28\xa7\x38\x95\x28\x36\x88\
+\x42\xe8\x93\x0c\x50\x0d\xa8\x33\x3e\xa7\xde\x4f\x4a\x80\x80\x6a\
+\x40\x88\x43\x45\x4a\x8a\x2c\x6c\x22\xaf\xa9\x70\xdc\x42\x4a\x51\
+\x44\x00\x00\x90\x64\x4a\x4d\xbd\xe7\x29\x8e\xa1\x28\xb0\x2b\xa8\
+\x4d\x94\x42\xf1\xc3\xdb\xb3\x96\x78\x00\x21\xbe\xea\x82\xa9\x9d\
+\x98\x57\x45\x41\x9d\x4a\xa7\xb2\x4e\x64\xe2\x94\xb0\x6a\x9a\x2e\
+\x55\xbb\x43\x55\x67\x80\xf0\x99\x27\x9f\xf6\xa4\x3a\x50\xa4\x57\
+\x90\xef\x7a\xa4\x46\x0c\x13\x89\xa3\x38\x95\x6a\x87\x1f\x68\xfa\
+\xc4\xed\x44\x2c\x68\x9a\xd3\x20\x35\xc2\x72\x2d\xa1\x5e\x11\x0c\
+\xfb\xa6\x34\xe8\xf7\x24\x50\x40\xe7\x22\x2d\xc6\xa2\xb0\x89\xfd\
+\x34\x6b\xee\x8f\x15\xf8\xf5\x14\xad\x42\x28\xd4\x35\x67\xde\x2c\
+\x95\x11\xba\x0b\xf5\x5a\x2f\xc2\x25\x3a\xc6\x28\x15\x0c\x58\xa0\
+\xa1\x34\x84\x52\x94\xa7\x16\xe0\xfa\x12\x20\x51\x0e\xa3\x93\x9f\
+\x9f\xc0\x8c\x02\x96\x94\x50\xa0\x51\x06\xa3\x37\xd0\x1e\x2a\xd5\
+\x07\x7c\x79\x81\x2a\xdb\xc4\x1a\x5a\x0a\x80\x00\x86\x93\x65\x84\
+\xc0\x03\xb9\x41\x10\x84\x00\x89\x76\x01\x02\x56\xc0\x41\x34\xa3\
+\x30\xa6\xf2\x98\x0d\xbc\x29\xaa\x40\x40\xf0\x50\x1e\x56\x32\x4b\
+\x83\x21\x11\x14\x27\xe0\x1d\xe7\x4a\xc5\xc2\x8e\x0f\x52\x44\x61\
+\x5f\x45\xbb\x23\x4d\x5a\xe4\x29\x29\x3d\x5c\xe0\xbf\x21\x01\x21\
+\x03\x4d\x41\xd1\x90\xb1\x75\x05\x30\x01\xb2\xa6\x55\xab\x7c\xfb\
+\x39\xd2\x46\x34\x5a\x89\x14\x8b\x6c\x12\xca\x70\x91\x20\x4a\xd5\
+\x6d\x9e\xb7\x0b\x2b\x93\x90\x74\x16\x5b\x28\x56\x03\x41\x55\x10\
+\x35\x23\x80\xe5\xf0\xa1\xf9\xb9\x5f\xd5\x1f\x4e\x0b\x46\x9a\xc0\
+\x50\x82\x01\x62\xae\xcb\xfa\x5c\x45\x1c\x58\x1c\x18\x2f\x0e\x31\
+\xd8\x9d\x57\x31\xb8\x6f\xa0\x32\x56\xae\x6f\x38\xec\xc6\x44\x15\
+\x1e\x04\xec\x03\xa2\x11\xa1\x8d\x98\xd8\xba\x8f\xa0\x31\x9f\x39\
+\x69\xe9\xfa\x04\x32\x0d\x50\x88\xa1\x44\x14\xe9\x44\x11\x66\x5c\
+\x87\x24\xc5\xf8\x26\x17\xc9\x8e\x37\xb6\x8d\x76\x1c\xbb\xaf\x80\
+\x5d\xdf\x46\xed\xdd\xa6\x70\x90\x76\x14\x75\x40\xef\x47\x0d\xed\
+\x9c\x40\xf7\x9a\x31\x9c\xe8\x82\xe1\x62\x8d\x5d\xaf\x46\xd0\x0e\
+\x52\xa1\x17\x4b\xbf\xbe\x8e\xd8\x6f\x40\x47\x6c\x4e\xa0\xbf\x72\
+\x3b\x39\x5f\xb3\x36\xc6\x8a\xe4\x0c\x04\xf1\x0c\x71\x8b\xe7\xe7\
+\x97\xbf\x79\xb1\xfe\x70\x33\xa3\xff\x00\xd7\xce\x4a\xa2\xfa\x76\
+\x0b\x71\xf1\x0f\xbd\x24\xc7\x81\x15\x91\x01\xa8\x40\xde\x00\xa8\
+\x09\x40\xc0\x00\x13\x4a\x8f\x59\xf9\x1d\x26\xc8\xf0\x68\x20\x80\
+\x54\x49\x00\x5a\x2f\xea\xb5\x9c\x1a\x24\x21\x14\x48\x28\x8f\x98\
+\x3b\x54\xd8\x80\xa0\x19\x46\x94\x0a\x02\x05\xb0\x19\xa3\x04\x07\
+\xc4\x60\xb2\x0c\xe4\x62\x41\x00\x34\x26\xb4\x28\xca\x58\x21\x06\
+\x82\x64\x1a\xf1\x1d\xa2\x3e\x24\x3b\x41\x4f\x4b\x54\x16\xa3\xc8\
+\xa1\x0f\x83\xa9\xd7\x6a\xa5\xca\x40\x08\x05\x11\x00\x73\x7a\xd1\
+\x68\x48\x03\x09\xa4\x19\x5f\xd1\x48\x74\x6a\xb0\x95\x19\x64\x1a\
+\xfa\x05\xf1\x63\xd6\x2a\xd2\x63\xd6\xd8\x6c\x67\x02\xe3\x41\xe3\
+\x88\x92\x52\x8a\x90\x14\x43\x1a\xc0\xff\x00\xd8\x00\x8d\x08\x0a\
+\x64\x62\x07\x6d\x10\x5c\x42\x20\x88\x95\x5c\x3d\x94\xe3\x91\x24\
+\xd6\x1a\xa8\x52\x90\x8c\x06\x7c\xe8\x18\xd7\x80\x6c\x03\xd2\x85\
+\x74\x99\xef\x16\x8a\x14\x51\x45\x9e\xfe\xcd\xf1\xf4\xec\x05\xf0\
+\x44\xb2\xb6\x90\x81\x00\xac\x2f\xed\xfb\xc8\x67\xac\x24\x87\xf8\
+\x89\x97\x4e\x61\xa7\x2a\x9f\x28\x51\x7a\x40\x82\xb9\x2f\x56\x46\
+\x0b\x05\x65\xc9\x02\x22\x09\x01\x1c\x39\x93\x9a\xd1\x17\xa0\xbf\
+\x2c\xfc\x3c\x3f\xb6\xea\xaf\xa2\x14\x51\x59\x18\xfe\x2e\xa1\xcf\
+\xc2\x2e\x73\x13\x8a\xe0\x1d\xe8\x6c\xfa\xc1\x06\x5b\x81\x1c\x79\
+\x29\x9b\xfc\xe8\xff\x00\x9a\x30\x9a\xc0\x40\x08\x23\x90\x60\x34\
+\xb8\x07\xb7\x8d\x90\x39\x4a\x3b\xa1\xb2\xa5\x5a\xbc\x9b\x47\xef\
+\xf3\x2e\x77\x44\x5d\x78\x4a\x10\x63\x7e\xbd\xeb\x18\x76\xa4\x84\
+\xb5\x50\xb6\x95\xdc\x0b\x7c\x18\xf2\x87\xaf\x7b\xf6\x44\x17\x8c\
+\xde\xd8\x39\xa5\x39\x03\xab\xba\x2d\x52\x64\xea\x9a\x35\x40\x41\
+\x65\xaa\x47\x84\xc0\x39\x55\x82\xa5\x38\x1e\xca\x12\x2e\x44\x11\
+\xf2\x55\x1f\xde\x0d\x7e\x66\xd3\xa8\x69\x92\xc9\x69\xe2\x9d\x61\
+\x55\x47\x00\x48\x1b\x67\xd2\x6f\x65\x19\x6c\x5f\xc8\x13\x6e\x36\
+\x03\xbd\xaa\x80\xad\x14\xa8\xa6\x00\x12\x0f\x5d\xb7\x75\xd0\x68\
+\x6d\xd0\x57\xb6\x98\xd2\x97\x09\x52\xfd\xd1\x00\x01\x22\x23\x88\
+\x87\x38\xd5\xc0\x1c\x3f\xc0\x17\x93\x5f\x8e\x72\xbd\x01\x4a\x2e\
+\x8a\x9c\xc7\x41\x0f\x7a\xdb\x80\xf2\x41\x90\xd2\x72\x08\x6d\x1e\
+\x4b\x64\x01\x83\x7e\x1c\x60\xda\x5d\x2b\x05\x20\x61\x96\x6a\xd8\
+\x27\x9b\x3d\xe4\x49\x6c\xf0\x88\xef\xd5\x31\x0c\x5a\x51\x7f\x44\
+\xa4\xa0\x0d\x37\xf2\x82\xbd\x28\x08\xca\xc8\x83\x2c\xa6\x1b\x5c\
+\xe6\x52\xf5\x03\xea\x41\xdf\x50\x14\xc6\x7d\x41\x41\x9d\x02\xa9\
+\xa4\x8a\x0a\x18\x42\x69\xff\x00\xbc\x62\x82\xd9\x5d\x8f\xc4\xab\
+\x5a\xd0\xa6\xf3\xec\x11\x0a\xab\x34\x0c\x77\xd5\x0f\xe8\xf2\x58\
+\x58\xb1\xaa\x30\x47\xc6\xa2\xc3\xef\x21\x4b\x64\xcb\x35\xb7\x84\
+\x1f\xfe\xbd\xde\x3e\x9a\x1a\x29\xa0\x02\x56\xda\xfa\x11\x2f\x24\
+\x2d\xa6\x1b\xb2\x82\xbe\xe4\x29\x93\xac\x61\x87\xbd\x75\x88\x02\
+\xdb\x03\x6a\x51\x05\x2a\xa1\x14\x02\x92\xbe\x22\x9f\x15\x9c\x5e\
+\x5e\xeb\x44\x17\xb4\xd6\x08\x2c\x7b\xc8\x99\xa3\xd0\x5a\xa0\x7f\
+\x1e\x4e\x11\xc4\xb3\xe5\x75\x34\x08\x21\xd9\x83\xc1\x29\x8f\x39\
+\xe0\x15\xec\x88\x43\x25\xd2\x5a\xc4\x05\xbf\xf2\x9b\x91\x36\x37\
+\x14\x12\x18\xf6\x84\xe1\xd6\xf3\x4d\x5d\x5e\x8d\xee\x8d\x40\x28\
+\xf1\x5a\x91\xe5\xc4\xa2\x1b\xf1\x7c\x2c\x28\x12\x3d\x39\x2a\x20\
+\x17\x1f\x85\x3a\xee\xc0\x56\xb1\x10\x71\xf0\x4c\xd8\xa3\xb1\xb9\
+\x24\x2a\x2d\x01\x2a\xcd\xc6\x16\x12\x3c\x63\xd8\x54\x93\xf4\xf6\
+\x10\xa9\x4a\x2a\x10\xe0\xa1\x00\x48\x33\xc8\x28\xc8\xc5\xed\x90\
+\x10\x60\x18\xa1\x62\x7a\x18\x23\xa3\x23\x0c\xad\x0d\x3e\x95\x60\
+\x7e\x23\x39\xca\x9a\x8f\xb0\xa3\x40\x18\x1a\x04\x45\x12\xb0\x08\
+\x04\xa9\x02\xb0\xb6\x94\x0b\x94\xe2\x6c\xae\x86\x06\x25\x80\xa0\
+\xfc\x74\x11\x53\x2d\xc6\x72\xa9\x40\x96\xbc\xc8\xc8\x78\x23\x26\
+\x47\x92\x08\x15\x4d\x5b\x76\x7b\xa0\x37\x17\x99\xf0\xa2\x50\x8e\
+\x83\x0c\xa4\x03\x3f\x7f\x56\x5c\x22\x88\x54\x08\x62\x84\x35\xca\
+\x2c\xbd\x1e\x13\xa2\x5a\x8a\x01\x80\xf4\x06\x82\x62\xde\xb4\x35\
+\x52\x3e\x52\xa0\xc0\x3e\xc5\xab\x79\x54\x02\xb3\xa1\x31\x51\x2a\
+\x66\x19\xf4\x4a\xf9\x10\x69\xfa\x40\x1a\x5b\x31\x68\x45\x61\x22\
+\x32\x81\xa2\x14\x08\x00\xd6\x83\xe1\x2f\xf1\x1f\x51\x5d\x6c\x05\
+\x24\x84\x6b\xf5\x3c\x34\x69\x00\x2a\x42\x91\x83\x73\x79\xfb\x2f\
+\xf6\x9a\x65\xc1\x95\x28\xd9\x36\x9d\x78\xe3\x69\x70\x53\x33\xe3\
+\x76\x83\x6f\x09\xea\xa9\xa3\xc0\xc8\x0d\x21\x71\xa2\xf0\x20\x9f\
+\x0c\x04\xa3\x0c\x4a\xaa\x53\xea\xf5\xcc\x32\x12\x50\xb5\x28\xd1\
+\x7d\x32\x67\x15\x8f\x01\x06\x06\x39\x41\x0f\x4b\x69\x51\xe9\x2f\
+\x08\x94\x8c\x86\x32\x35\xbd\x08\xba\x7d\xc2\x26\x4a\x90\x98\x3c\
+\x6c\xb9\xa1\x6c\xe1\xc8\x5b\x5c\xe2\x8f\xe0\xfe\x43\x25\xc9\xdc\
+\xdb\xd5\xf7\xc1\xfb\x54\xad\x89\xdd\xd3\x70\xb2\xbc\x84\x6e\xdb\
+\x8f\x5b\x19\x1e\xb4\xfe\x4c\xb3\x57\xcb\xba\x95\x9c\x62\x94\xf3\
+\xe4\x46\x61\xcd\x7a\xdb\x67\x11\xa2\x97\xff\x00\x2f\x02\xc2\xc0\
+\x2b\x80\x6d\x4f\x25\xe0\xae\xe3\x50\xe6\x62\x0a\x4b\xb1\x8f\x71\
+\x34\xb5\xbb\x5d\x12\xf6\xba\xc9\xc6\xd8\x80\xce\x29\x92\xcb\x0a\
+\xb7\xe8\xe7\x37\x41\x9e\x8e\x4f\xb3\x44\x56\x37\x2c\x4e\x43\x43\
+\x1b\x0a\x12\x21\x5f\x8e\x66\xf5\x81\x57\xea\x57\x06\x84\x53\x09\
+\x68\x36\x8d\xe6\x30\x01\xd9\x26\x51\x50\x78\x77\x0e\xc0\xc3\x28\
+\xe4\x9d\xa4\x11\x8f\x57\xdb\xa3\x72\xa5\x19\x4e\x6d\x81\x18\x0e\
+\xa2\x13\x08\x03\xfc\x55\x4d\x7a\x0a\x8d\x96\xd3\xd8\x45\x89\x68\
+\xb1\x06\xf0\xf1\xb7\x69\x09\x2b\x89\x56\xa0\x23\x3d\xde\x6e\x72\
+\x21\x30\x89\x2b\x00\x09\x50\xd7\xce\x5d\x8b\x01\x48\x87\xc2\x8f\
+\xc2\x15\x11\x8f\x23\x09\xbb\xa0\x85\x00\x24\x61\x46\x9d\x8d\x58\
+\x03\x5d\x30\x5a\x11\x51\x90\x9c\x05\xc6\x6f\x50\xb4\x09\x52\x11\
+\xef\x83\xc2\x03\x06\x79\x18\x38\x12\xa1\x57\x48\x45\x12\xd6\x04\
+\x4b\x9e\xa2\x1b\xb1\xd0\x34\x03\xc9\x9a\x82\x88\x4a\x30\x18\xd4\
+\xc8\xb4\xcf\xe8\xe1\x19\x23\x41\x82\xb4\x34\x33\x77\x87\x3a\x0c\
+\xa9\x27\x4f\xc9\x01\xe0\xf0\xa2\xd5\xd8\x75\xa6\x1d\x78\x37\x24\
+\x29\xb2\x27\xff\x00\x93\x34\x10\x8b\x91\x40\x21\x48\x3c\x01\x09\
+\x75\x0d\x14\x15\x8a\x03\xa0\x37\x4e\xb9\xb4\x45\xf5\x18\x4b\xe5\
+\x03\x8c\x7c\xea\x20\x32\x89\xb5\x35\xbe\x05\x18\x98\x10\x4d\x84\
+\xed\x84\x2c\xb2\xe1\x0b\xbf\x8e\x46\x91\x4e\x94\x62\xde\x18\xe2\
+\x08\x0a\x0e\x92\x3f\x01\x99\x2e\xd0\x7d\xd7\x66\x4f\x7a\x34\xae\
+\x7e\xe5\x4e\x01\x37\x8b\x02\x2b\xdf\x8e\xa1\x73\xd5\x43\xaa\x87\
+\x5e\xc9\x3d\x48\x35\x56\x82\xd8\xe6\xaf\x3c\x96\x90\x2d\x37\xbe\
+\x2d\xa2\xcb\x5c\x8a\x4a\x3a\xee\xe4\xe1\x16\xae\x59\x3c\x51\xc6\
+\x48\x41\x08\x5d\x1c\x98\xbb\xf0\xee\x41\x06\x37\x79\xc1\x09\xef\
+\x79\xae\x56\x72\x00\x79\x21\xe1\xfa\x12\x25\xd6\x59\xfa\x00\x01\
+\x13\x60\x43\x00\x94\x10\xd0\xaf\xa4\x41\xbf\x39\x18\x22\x16\x61\
+\x51\x40\xa2\x80\x44\x1e\x85\xd1\xe4\x86\xb3\x49\x80\x58\x91\x7c\
+\xec\x64\xab\xc6\x8f\xd3\xc1\xb9\x02\x27\x19\x56\x36\x22\x2b\x27\
+\x24\x02\x1a\x63\x4f\x44\xf0\x25\x20\xd3\x01\x60\x85\x69\x89\xd4\
+\xfc\xc8\x08\xa8\x2b\x14\x8f\xf8\x3e\xb9\xb0\x44\xf1\x07\x2f\x06\
+\x83\x86\xa2\x5c\x00\x4e\x80\x02\xf8\x28\x03\xa3\x31\xa0\x2a\xeb\
+\x41\xf3\x0f\x8b\xf4\xc4\x14\xa8\x20\x80\x26\x69\x48\x10\x4a\x7d\
+\xe7\x3c\x79\xf2\x50\x5a\x54\x0a\x04\x44\x78\xaa\x22\xf4\xb1\x59\
+\x81\x8a\xc3\x17\x11\x41\x82\x9f\x6a\xa2\x80\x55\x50\x81\xef\xfd\
+\xe0\xf4\xdc\x4a\x27\x0a\x20\x9b\x2c\x28\x94\x68\x06\xcc\x2f\x68\
+\x1b\x9b\x3e\x82\x95\x5c\xce\x02\x64\x8c\x01\x50\x82\x82\x03\xd5\
+\x34\xd2\x71\x18\x98\x0a\x27\xb1\x93\xbc\x0f\xdc\x02\x50\xe7\x5f\
+\x78\xbd\x2a\x87\xb8\xaf\x2c\xa4\x81\x2a\x1f\x04\xab\xcc\xbf\x38\
+\x7d\x8a\xa8\x3f\x1a\x14\xf1\xba\x1d\x1a\x4b\x40\x0d\xf7\xb5\x54\
+\xce\x05\x9b\x5b\x63\x4b\x62\xab\x7b\x4b\xa6\x28\x8b\xd0\xa8\xda\
+\x24\x22\x25\xe6\x48\x2e\x61\x18\x6b\x52\x2a\x4a\x2c\x0a\x5a\x58\
+\x01\xa2\xbf\xa4\x05\x11\xc2\x79\x7d\xb1\x5f\xa5\x78\x24\x33\x63\
+\x99\x2f\x08\xcf\xd8\x8e\x7b\xca\x28\x33\x04\xb8\x91\x43\xc0\x31\
+\x4e\x8b\xd6\x2b\x16\x15\x3f\xe1\xc4\x26\x2b\x09\xb2\x80\x16\x81\
+\x78\x89\x7e\x83\xe2\x4d\xa2\x06\x05\x73\x94\xdf\x13\x2a\xcf\x4c\
+\xf1\x07\xc9\xe5\x27\xa5\x4c\xa2\x61\x02\x53\xa6\x6d\x24\x9f\x87\
+\x70\x40\x1b\xeb\xfc\x36\x33\x0f\x3e\x8f\x09\x9a\xf4\xa7\xb2\x7a\
+\x22\x4c\x5d\x86\x15\x38\x23\x79\xa0\x40\x47\xf8\x0a\x90\xd0\xed\
+\x4a\x56\x68\x31\xa7\x44\x7c\x96\x43\xd5\xea\x78\x2b\x05\x59\xe8\
+\x7e\xfa\xd2\x8b\xb9\x50\x14\x5d\xc0\x1a\x6c\x64\x1e\xf2\xb2\x08\
+\xa0\x63\x40\x1d\x61\x5f\x03\x26\xa2\xaf\x64\x82\x1f\x44\x41\xe0\
+\x14\x41\x3c\x1c\x95\x81\x70\xa3\x1d\xf1\x06\xa0\x34\x3a\xaa\x50\
+\xa0\x30\x46\xa0\x82\x3c\x16\x3c\x62\x05\x1d\x60\x4a\xe0\x20\x28\
+\x0a\x46\xa1\x8d\x89\xe0\x45\xfa\xf6\xb7\x87\x11\x85\x40\x80\x10\
+\x14\x46\x12\x28\x50\x7a\xa4\x70\x00\x42\x02\x01\x4f\xa0\x40\x0a\
+\x3d\x25\xf3\xf4\x15\x61\x0b\x56\xb6\xfe\x70\x3e\x54\x00\x13\x2a\
+\xf4\x08\x08\x45\x63\x22\x50\x1d\x32\x0d\x54\xd9\x18\x5e\x70\x1d\
+\xe1\xfe\x66\xfe\xb8\xeb\x75\x20\x30\xd6\x18\x16\x30\x3f\x62\x9e\
+\xaa\x62\x33\x7f\xe7\x61\x87\xe0\xd8\xe2\x71\x01\x27\x16\xae\x59\
+\xcf\x34\x5e\x93\x99\x0e\x49\x09\x9b\x8f\xd1\xf4\x22\x89\xe4\x1e\
+\x14\x79\xf9\x2a\x84\x77\x04\x2f\x22\x9a\x1f\xc8\xcd\x92\xc7\x74\
+\xbe\x89\x4b\x09\xe2\xd6\x86\xac\xda\x8e\xb5\x01\x80\xe0\x0a\x22\
+\xc3\xe8\x21\x66\x71\x00\x1e\x38\xeb\xfc\x15\x01\xc2\xd6\xd6\x05\
+\xec\x59\x16\xe0\x60\x87\xf5\xa5\x31\x84\x42\x30\xe6\x48\x05\xe4\
+\xd8\xf3\xfe\x70\x83\x64\x9e\xfa\x9d\x16\x28\x7d\x26\xcc\xb9\xbe\
+\x2e\x98\x71\x15\x48\x80\xb2\x0d\xd4\x96\xda\x13\x8b\xeb\x8b\x8a\
+\x04\x33\xaa\xbc\x2f\x67\xdf\xbe\x67\x25\x98\xf3\x63\x80\xca\x0e\
+\xb6\xc2\xff\x00\x36\x97\x88\xab\xa2\xe5\xa8\xda\x6f\x2f\x40\xd5\
+\x80\x96\xe2\x56\x87\x3b\x75\x55\x0b\x81\xb3\xd0\x06\x25\x21\x51\
+\x8e\xf3\x17\x89\x90\xb1\x01\x3f\x60\x1c\x00\xe4\x45\xa7\x58\x4c\
+\x82\x23\x13\x42\xf3\x2f\x3e\xbd\x52\xe8\x27\xf7\x45\xe9\xa1\xb7\
+\xea\xee\xe4\xe0\x2b\x9a\xb6\x2d\x71\x65\x08\x70\x0d\xc2\x10\xc8\
+\xcb\x12\xa1\x6f\x8a\x5b\x4e\x70\x45\xa4\x96\x99\x02\x9e\x05\x40\
+\x98\x37\x91\x56\x94\x59\xe6\x54\x01\x03\x43\x76\x0b\x51\x24\x7d\
+\xb1\x38\xb2\xc0\x66\x69\x12\x19\x6b\x43\x54\x8c\x7a\xa8\xea\x65\
+\xd4\x41\xb4\xbd\x7d\x1b\xc5\xb1\x3d\x15\x95\xe4\x07\xb0\x29\x4a\
+\x29\xc5\xa1\x92\x94\x31\xd4\x8e\x01\x91\x29\x3f\x80\x56\x26\x62\
+\x90\xce\x73\x4b\x9d\x16\xe9\x60\x3d\xa7\x3f\x0e\x4c\xe8\x58\x40\
+\x89\x4c\x4e\x85\x80\xc9\xfe\x14\x49\xd5\xda\x3e\xbc\x68\xe4\x90\
+\x5f\x1a\x10\x9e\x4a\xe4\x1a\x25\x82\xcb\x61\x4b\x0c\x4c\x92\x8a\
+\xb0\x9c\xfa\x49\x4a\xc0\x67\x69\x86\x83\x1d\x19\x9d\xc9\xa1\x25\
+\x54\x2e\x64\x1b\xdf\xc8\xf9\x86\x97\x50\x7c\x21\x36\xf4\xbc\xab\
+\x19\xde\x2a\x03\xa5\xb8\x48\xd6\xd1\x20\x89\x11\x05\x3d\x33\xc1\
+\xa2\x35\x8e\x50\x87\x03\xd1\x74\x22\xdf\x3d\x65\x94\x04\xec\xbd\
+\x46\x34\xc3\xac\xf0\x80\x61\x18\xbe\xab\xfd\x3d\x68\xd2\x69\x4d\
+\xc6\x1a\x90\xdd\xbe\x88\x58\x17\x0b\xfd\x03\x2c\x1f\xb7\x64\x6b\
+\xd5\x99\x3e\xf4\x3c\xed\x42\x7d\xb9\x59\x7b\x85\x65\x04\xc3\x52\
+\x76\x74\x8a\x90\xdc\x11\xd0\xb3\xa0\x3d\xb0\x86\x79\xca\x5e\xc6\
+\xb8\x56\x1a\x51\xe3\x94\xaf\xdc\xb3\xee\xcd\x6f\x66\x5f\x3d\xc2\
+\x06\x39\x00\xee\xed\xef\xa6\xbc\x7f\xc6\x48\x63\x55\x56\x15\x38\
+\xbf\x6f\xbc\x9b\x35\xeb\x36\x11\x42\x96\x60\x3b\x88\xfd\x11\xbf\
+\x8b\x8b\xc2\x10\xa3\xa1\x39\x7a\x70\xa8\x22\x2d\x4c\x6d\xf8\xa8\
+\x82\x3b\xa0\xa0\x92\x50\x24\xef\xa1\x56\x93\x9b\x15\x71\x22\x08\
+\x01\x27\x47\xd6\x89\x78\xb8\x6d\x2a\xd8\x83\x3e\x56\x40\x54\x08\
+\x8a\x48\x29\xd8\x0e\xe5\x61\x58\x00\x5a\x14\x84\xc4\x96\x6c\x01\
+\x79\x0d\x22\x20\x94\x4c\xb9\x9b\x52\xca\x15\x24\x06\xbb\xc3\xc0\
+\xcd\x23\xd0\x22\x9b\x2e\xc8\x92\x81\x21\xcf\xc9\x14\x16\xe1\x56\
+\x21\xc0\xe1\xfd\x40\x18\x3e\xe2\xc6\x92\x39\xf0\x3d\x29\x69\xa2\
+\x13\xcf\x46\x34\xb9\x31\xec\x16\x15\xaa\xf4\xd8\xeb\x9e\x24\x29\
+\x68\x45\x59\xdc\x1e\x43\x9b\x8d\x8e\xec\x07\xae\x27\x83\x35\x24\
+\xaa\x88\x41\x97\x7e\xef\xa3\x47\x40\xb9\xa8\xef\x74\xda\xb4\x3a\
+\xf0\x2f\xe2\xb9\xe7\xd9\x03\x7b\x65\x2b\x01\x88\x9a\x8b\xda\x4b\
+\x95\x6d\x44\xe0\x14\xcb\xa1\x12\xb1\x00\xd4\x5e\x44\xb5\x16\x67\
+\x42\xbf\xd9\x86\x70\x30\x11\x52\x94\x58\xb9\xe8\x5d\x40\x77\xac\
+\xc5\xd2\x46\x0e\x9a\x74\x06\x30\x6c\x20\x3c\x23\x07\x54\x59\xe3\
+\xf0\x36\xc3\x2b\x67\x74\x06\x57\x93\x33\x07\x84\xf3\xa4\x08\x90\
+\x5a\xee\xf9\x2c\xe2\x56\x58\x71\x42\x70\xb2\xb6\xbe\x71\xfe\x45\
+\xa1\x15\xf4\xea\x69\x42\x63\xe2\x1e\x6c\x17\xdc\x0f\x6e\x1e\x9d\
+\x84\xb8\x84\xf1\xee\x3c\xbf\x38\xa3\x4e\xe1\xf4\xcb\x73\xe8\x48\
+\x91\xc8\x96\x96\xf2\x3d\x22\x3e\x49\x1f\x7f\xe7\x2d\x52\x46\xe4\
+\xc4\x3b\xaf\x71\x95\x97\xf8\x02\x87\x5a\xf5\x01\xc7\xbc\x72\x9b\
+\xd6\x5c\x27\xe4\x97\xba\x6f\x71\xed\x89\x55\x1b\x63\x8c\x86\xc6\
+\x94\x0a\x24\x4d\x0f\xc6\x0d\xad\xe6\x6b\x1a\x12\xa2\x06\x01\xd3\
+\x51\x78\x58\x01\x40\xb5\x10\x82\x0d\x0a\xc0\x10\x6a\xc5\x6c\xec\
+\xc1\x0d\x88\x38\x40\x9d\x15\xc2\xe9\x45\x70\xd5\x54\xb0\x01\xd9\
+\x15\x40\x8a\xe0\xb4\xe9\x45\x5a\x15\x28\x5c\x3a\x0b\x75\xfa\x9b\
+\x22\x9a\xb0\x31\x1d\x31\xd5\x16\x82\x91\x89\xb0\x03\x3a\x3e\xbf\
+\x2f\x84\x25\xf6\x01\x10\x29\xc0\xc1\x0a\xcb\xae\xbf\x70\x07\x53\
+\xb1\x22\x4a\x8f\x84\xeb\x1d\x99\x05\xaa\x36\xce\x11\x6f\x5a\x79\
+\xdc\x66\x5c\x0a\x85\x18\x8a\x58\xd5\x9d\x40\x22\x1a\xce\xf9\x95\
+\x8f\xac\x05\x2c\x51\x8c\xb5\xf4\x8c\xce\x08\x8a\xc4\xc2\x88\xe8\
+\x36\x81\x3e\xc2\xe2\x38\x51\x80\x54\xf4\x66\x66\x55\xe1\x72\x72\
+\xbd\x26\x82\x29\xfa\x88\xda\x87\x6f\x8d\xc2\x7a\x54\xba\xf3\x37\
+\xc8\x9a\xf3\xc2\x8c\x5e\xb6\x31\x49\xa0\x67\xb7\xd2\x97\xba\xa9\
+\x70\xd0\x94\xa9\x36\x9b\xc3\xd4\x23\xd0\xf0\xc3\xf4\x93\xe1\xfb\
+\xfa\xac\x2a\x60\x77\xd4\xf8\x37\x22\x8a\x31\x48\x00\x90\xa4\xe6\
+\xa9\xc3\xcc\x24\x36\xd3\x58\xc6\x74\x7d\xed\x98\x40\x85\x2c\x92\
+\x9d\x98\x87\x4a\x3f\xbb\x4e\x4f\xf1\x7f\xce\xa0\xf1\x67\x16\xf0\
+\x2e\xdd\x49\x1b\xa5\x4c\xfb\x41\x94\x6b\x77\xe4\x7b\xd0\xf2\x20\
+\x86\x0b\xa4\xa0\xe6\xa3\xc3\xe7\x3e\xd7\x11\x7d\x1b\x95\x6d\x86\
+\x94\x09\x21\x32\x39\xe7\x98\xcf\xb1\x3a\x97\x5d\xd7\x08\xe5\x7b\
+\xfa\xa6\xb2\x88\xef\x70\x14\x21\x5b\xb4\x84\xd1\x7c\x8c\xc3\xb5\
+\xde\x7d\x0c\xf4\x92\x19\x11\x50\xb6\x82\x63\x81\xf9\xa9\x21\x07\
+\x6d\x8b\x08\xd1\x52\x87\x44\x02\x5a\x20\xa4\xb2\x0c\x58\x9a\x06\
+\x72\xb6\x24\x44\xe4\xaf\x56\x03\x70\xe6\x46\x70\x4a\xef\xbc\x05\
+\x9a\x5a\x6a\x04\x90\xe4\xcf\x3e\x1e\x20\x08\x00\x6a\x43\x44\x4c\
+\xdb\x91\xc0\x05\xc9\x75\x18\x7c\x32\xb7\x4b\x8d\x69\x8c\x49\x43\
+\x0e\x8d\x92\x8e\x87\x84\x44\x49\x9c\x4b\xe3\x4a\x6f\x63\x27\xb4\
+\xac\xad\x4f\xb0\x1c\xa8\xd2\x23\x62\x2f\xbf\xc0\xec\xc1\x2d\x90\
+\x0e\x46\xda\xba\x07\xb2\x45\x7a\xdf\x93\xf4\x4d\x39\xef\xb6\x10\
+\x4b\x5c\x85\x0a\x35\x96\x62\x90\xdf\x75\xdd\x68\xc3\xde\xe2\x84\
+\xa9\x55\xb9\xa2\xd4\xf3\xc1\x54\xb7\x51\xe2\xc9\xad\x4f\x8e\xb5\
+\x3b\x29\x91\x02\xe6\x3c\x70\x06\xea\x6d\x04\x3f\x86\xd2\xbc\xb4\
+\x17\x98\xaf\x62\x00\x38\xb8\x2a\x85\x70\xc8\xf8\x63\xa0\xbc\x71\
+\x8e\x17\x10\xa0\x49\x8a\xe1\x2b\x44\x97\xd6\x90\x4f\xb8\x01\x81\
+\xc2\x1b\x58\x82\x70\xd3\x78\xce\x2d\x26\xb7\x6c\x38\x75\x48\x69\
+\x4b\x0d\x92\xb4\x16\xe2\xcd\xe1\x31\x5b\xba\x66\x70\x55\x82\x02\
+\x2a\x46\x89\xc4\x2a\xa3\xa1\xe3\x30\x3a\xd2\x51\x77\x86\x07\x93\
+\x0c\x8b\x92\x6e\x6a\x64\x75\xc1\x4d\x75\x83\x73\xe4\xdf\x20\x04\
+\xf8\x47\x5c\xab\x4f\xa6\x95\xfd\xe2\xfe\x08\x28\x70\x38\x9e\x00\
+\xd5\xa3\xe0\x17\x20\x51\x61\x8c\xa9\x54\xcb\x8a\x4a\x9a\x47\x1d\
+\x6a\xf1\xd8\x4e\xb0\xbf\xe6\x53\xf1\xd1\x5f\x65\xc4\x7a\xfc\x17\
+\xb0\xb3\x3e\xb7\x12\x13\x84\xa4\x62\x20\xee\xd0\xf1\x5d\x7c\x25\
+\x03\x4b\xf6\x87\x99\x80\x26\x44\x95\xdf\x02\x02\xc9\x51\x12\xe7\
+\x44\xa8\x72\x43\x2b\x04\x8c\x00\x8a\x37\xe9\xb7\xfe\xb3\x0a\x21\
+\x65\x8b\x62\x1e\x06\x44\x83\x4b\x84\x74\xbd\xc3\x00\x27\x57\x89\
+\x67\x92\x3a\x0a\x4d\xd3\x60\x94\x3e\xb0\xee\x09\x27\x42\xf5\x02\
+\x20\x3c\x1c\x26\x5f\x58\x11\x08\x04\x20\x81\xd3\x83\x95\x94\x6e\
+\xd3\x31\x85\x31\xef\x1d\x85\x39\x1a\xed\xd8\x2f\xd2\x8e\x31\xd5\
+\x5e\xc8\x43\xae\x70\x07\x24\xf6\x00\x15\xf0\x72\x27\x77\x52\x5e\
+\xb5\x5e\xb1\xc3\x11\x25\x0d\x4b\x61\xeb\xbb\xa5\x9c\xca\x0d\x97\
+\x63\x53\x0c\x17\xc2\x31\x66\x30\x00\x46\x4e\xb2\xe4\x9a\x10\xe0\
+\x88\x8d\xbc\xc5\x86\xa6\x32\x53\xf5\x74\x5a\x08\xe1\x92\xad\xab\
+\x12\xb6\xc3\xb6\x1e\xf9\x07\x10\xa4\x51\x0a\xe4\x0a\xc6\x04\xdd\
+\xdf\x40\xb2\xf8\x69\xcb\xed\x96\x9a\x05\x4e\xf5\x2e\x04\xd7\x20\
+\x21\x48\x27\xe4\xe7\x42\x9a\xe5\x97\xb5\x06\xa3\x1d\x72\x64\x1f\
+\xd2\xaa\xab\x69\x81\x88\x48\x06\x5c\x7e\xc3\x57\x4a\x2b\xc2\x20\
+\xaa\xf4\xd1\xe6\x0e\xd3\x85\x1e\x13\x9f\x6c\x6e\x64\x0c\x88\x7c\
+\x1d\x09\x5f\x25\xde\xa2\x75\x7a\xdc\xfd\x3f\x2e\x0b\x99\x09\x9b\
+\xc7\x03\xec\x03\xdb\x96\x82\xbf\x4d\xcb\xb5\x1a\x23\x14\xd2\x7f\
+\x90\xf8\x91\xd7\x96\x84\xbb\xb0\x0a\x6f\xce\xcd\x64\x2e\xda\xeb\
+\x43\xd0\x48\x51\xe2\xb3\xb0\xa9\x80\x36\x07\x9c\xa2\x9e\x93\x80\
+\x0e\xe2\xeb\xb5\xcd\x3b\xca\x09\x50\x2f\xcb\x1c\x90\x9b\xfe\xf4\
+\x24\xad\xad\x8c\x3e\xe1\xcc\xb2\x90\x01\x0d\x7a\xe4\x6c\x6b\x5a\
+\x04\xc8\x10\x96\x08\x5a\xb4\xa2\x71\xb2\x91\x36\x7b\x62\x3c\xd7\
+\x81\x5a\xa4\xad\x44\xa9\x47\x19\xa9\x00\xca\x55\x25\x42\x08\x8a\
+\xd3\xcb\x38\xb0\xb1\x85\x09\xd4\xc5\xa0\x27\x96\x34\x38\x03\x11\
+\x03\x42\xaf\xd1\x35\x48\x8a\xd0\x88\x4d\xb5\xe1\xb3\x9a\x46\x39\
+\x19\xf9\xca\x85\x9c\x2f\x52\xbf\xd7\xd5\xbd\x15\xf4\xa5\x86\x40\
+\x28\x02\x83\xff\x00\x1b\x8b\x85\x00\x48\x08\xe2\x4f\x20\x49\xb8\
+\x21\xc6\x70\x0a\x9c\x8f\x5c\x3f\x0e\x0a\xc9\xd6\x54\x49\x2d\x20\
+\x0d\x74\xf8\x3b\xfb\xda\xfc\x73\x1e\x0c\x79\x0d\xf8\xa1\xa2\x7d\
+\x5b\x43\xb5\x2e\x8a\x53\x60\x91\x30\x00\xee\x60\xe6\x80\x74\xee\
+\xbd\x90\x16\xb2\x39\x40\xbe\x8b\x51\xce\x0a\x43\xf0\xaa\xa2\x8e\
+\xf6\xac\x43\x84\xd1\x54\x53\xbd\x60\x40\x7a\xc3\xa4\x6a\x58\xa7\
+\x4c\x56\xe0\xf0\x7b\x8a\x21\xa9\xd6\xcb\xe5\x54\xac\x7c\x1d\x38\
+\x52\xba\x0f\x6e\x7c\x18\x16\xf3\x4f\x22\xc7\x13\xb5\xef\x5b\x77\
+\x57\x6a\xf0\x14\x79\x93\xc1\x75\x59\x1e\x72\xf4\x6f\xb9\xd6\x5b\
+\x88\x41\xcc\xbb\x90\x26\x9c\x66\xc3\xc4\x5c\x00\x21\x50\x64\x04\
+\x19\xba\x04\x8a\xc1\x26\xe8\x00\xe2\x31\x2c\x5f\xd1\x21\x80\x3d\
+\x1c\x82\x54\x06\x38\x34\x7e\x97\x2f\x5d\x63\xcb\xb5\x9b\xb6\x6b\
+\xc7\xc6\x52\xf7\x2c\x2d\xa7\x4c\x1f\xef\xb0\x40\x5c\x3b\xee\x56\
+\x33\x6b\x74\x64\x4c\xfa\xfb\x35\xb7\x18\x4c\x59\x1a\x08\xbb\x80\
+\x64\x42\x8a\xf7\x35\xc0\x93\xc9\xa9\x38\x90\x3b\x06\xab\x78\x2e\
+\x11\xc1\x80\x54\x27\xe0\xb4\xab\xcb\x83\x7f\x32\x03\x8a\x97\x56\
+\x02\x86\x08\x9f\x50\x99\xf9\x17\x34\xc5\x24\x4a\x70\x81\x68\xcd\
+\x12\xd8\x15\xba\x64\x0d\x04\x56\x70\x1b\xa5\x2e\x46\xa0\x28\x70\
+\xa1\x97\xab\xc0\x20\xa0\x48\x2e\x0e\x09\x5f\x50\xe6\x44\xf2\x58\
+\x53\x18\x1a\x79\x06\xb7\x0d\x6a\x29\x9b\xc6\xf1\x9d\xfc\x11\x7f\
+\x82\x9b\xf1\x01\x18\x14\xca\xf9\xb5\x76\x3c\x76\x1c\x6a\xd8\xb1\
+\x10\xcc\xf1\x16\xd3\x81\x08\xa1\xd2\x80\x9a\x28\xc8\x91\xdc\x86\
+\x9e\x64\x4b\xd2\x5c\x46\x1c\xf5\xbd\xa5\xda\x5e\xc3\xc4\x08\x89\
+\x4f\x06\x07\xf2\x44\x91\x39\xf0\x35\xe6\x45\x10\x51\x60\xc9\xd2\
+\x89\xec\xcf\x9b\x45\x8f\x8a\x1d\xd7\x06\x00\x14\x03\x60\x4e\x7e\
+\x51\x9a\x7f\x97\xf3\x58\x4c\x90\x27\x35\x4c\x16\x78\x43\x1a\x86\
+\x76\xc0\x5c\xde\x0c\x2e\x81\x92\x15\x6c\x81\xc5\x81\x7f\x97\x61\
+\xb3\x10\x4d\x0e\xe3\xb6\x5f\x1e\x40\x20\x6a\x2d\x0e\x02\xe7\x11\
+\xd8\xd4\x1b\x0c\x58\xf1\x80\xf2\x1b\xd3\x24\x28\x1e\xcd\xb4\x61\
+\x9f\x2b\x8b\x95\xd1\x5c\xe0\x5c\x8c\xd3\xbc\xff\x00\xa1\x36\xee\
+\x20\x6f\xf2\x52\xca\x14\x21\x45\x8c\xcf\x18\x16\xe7\x34\x11\x5b\
+\x3e\xc4\x30\x14\x44\x14\x50\xe2\xb2\xe7\x79\xd4\x77\x98\xd4\x31\
+\x29\x10\x1b\x79\xdc\x75\x97\x4d\xa3\x0d\xc0\x7b\xfc\x98\x3c\x91\
+\x19\xcb\xeb\x98\xc9\x18\x24\x2d\xb5\x55\xa0\xb4\xdd\x47\x29\xa6\
+\x9c\x12\x52\x77\x25\xc0\x88\x37\x8c\xb1\xc3\x08\xc9\xd2\x6a\xe9\
+\x6d\x34\x7e\xbc\x4e\x51\xa9\x3c\xa5\x35\x7f\x11\x2e\x8f\xaa\x4e\
+\x1c\xfc\xf4\x65\xa8\xe0\x06\x08\x94\x86\x13\x8e\x49\xf4\x3f\x0b\
+\x11\xd0\x54\xc1\x20\x8c\x04\x98\x04\x48\xb4\x9b\x06\x4a\xde\x39\
+\xd8\x8a\x8e\xda\x44\x88\xb2\xa2\x0f\x44\x9b\xa3\x4e\x95\x3f\xee\
+\x26\xf8\xae\x43\xaf\x8c\xf0\x0f\x3b\xb6\x31\x01\x7f\xc7\x55\x12\
+\x49\x90\xe3\x87\xc8\xdf\xae\x79\x32\x28\x12\x04\xe0\xb5\x52\x39\
+\x92\xd2\x0e\x38\x07\x5c\x88\xe3\x4f\xec\x34\x1f\x0a\x87\x60\xb5\
+\x0f\xc2\x7b\x98\x3a\xa9\x03\xc5\xa0\x2e\xac\x4d\x82\xc4\x08\xfc\
+\x23\x78\x7c\x07\x04\x13\x81\x12\xa9\xcc\x13\x51\xa4\x7a\x21\x61\
+\x00\x1d\xda\x89\xc8\xbd\xb8\x15\x21\x24\x7d\x50\xb8\xdc\xe0\xe3\
+\x22\x95\x75\x5d\x21\x91\xed\x5d\xd2\x6e\x4e\x5b\x3e\xf8\x34\x89\
+\xf9\xc6\xe0\x3e\x2e\x5c\x88\x1b\x1e\xd4\x5d\x00\x72\x4d\xa2\x17\
+\xce\x76\x60\x14\x6e\x78\x11\xc3\x86\x2b\x47\x8f\xbe\x3a\x2a\xee\
+\x11\x57\x2b\x77\xc2\x3c\x6e\x47\x36\xdc\xaa\x7a\x6e\x91\xeb\x4a\
+\x5f\x6a\xaa\xf7\xd5\x52\x18\x9f\x24\xe3\x2c\xee\x18\xc4\xb9\xda\
+\x7a\x9d\xe1\x8e\x26\x9e\x6c\x91\x25\x76\x3f\x11\x06\x4e\xb9\xb9\
+\xea\xa7\x6a\x2f\xb5\x21\xea\xee\x63\x0b\xdb\x14\x1e\xad\x01\xe9\
+\x7b\x49\x7e\xd4\xde\xe0\x85\xc0\x36\x25\xdb\xad\xcf\x42\xf5\x2a\
+\x99\xb4\xe0\xe9\x5c\x35\xd2\x01\x6e\x63\x2d\x21\xe3\x60\x33\x74\
+\xa0\x10\x93\xb2\x10\x7e\x70\xeb\xcc\x69\x32\x60\x6d\xb4\xa4\xb3\
+\x92\x7f\x50\x98\x57\x19\x83\x95\x8a\xf5\x58\x48\x33\xd1\x36\xb0\
+\x0e\x27\x44\x6d\x98\x13\xbf\xe4\xe0\x20\x22\x53\x10\xcc\x8a\x76\
+\xc3\x2d\x60\x59\xd5\xe4\x59\xb4\x60\xc1\x4e\x35\xb7\x8b\x70\x33\
+\x30\x87\x83\xb6\x15\x4e\x9a\x36\x75\x58\x31\x29\x84\xe5\xb1\x20\
+\x01\x0a\xe1\xb4\x85\xb4\xcc\x03\x25\xff\x00\xf0\x38\xa8\x08\xf4\
+\x25\xcb\x57\x96\x20\x0c\x13\xa4\xf0\xb5\x1f\x1c\xb2\x36\x8c\x0b\
+\x53\x03\xae\x0c\x36\xef\xf3\x83\xab\x54\xf5\x33\x6d\xf7\x26\xb2\
+\x41\x69\xd1\x79\xdd\xad\x8c\xf2\x67\x82\x2b\x3d\xec\x47\xcd\x9e\
+\xe3\x59\x08\x8b\x51\x83\xb8\xbc\x22\x39\xfd\xcf\x6b\x2e\xc5\x75\
+\xe7\x34\x67\x3c\x9c\x42\x8f\x88\xde\xf9\x1d\x75\x9c\x04\x9e\xe1\
+\xc2\xef\xbd\xe3\x5a\x13\x34\x23\xa3\x37\xd1\xc9\xbb\x8b\x21\x50\
+\x43\x41\x78\xa9\x1c\x01\x05\x85\x82\xf0\x94\x14\x32\x78\x91\xe2\
+\x1c\x40\xa3\xa1\x34\x20\xed\x8c\xa3\x83\x22\x92\xef\x15\xa1\x81\
+\x52\xc5\x01\x81\x59\x58\x8e\x20\x8d\xa2\xcc\x6c\xac\x60\x25\x3d\
+\x8c\xe6\x9d\x1f\xae\xe8\xde\x0b\xa1\x66\x6d\xa1\xaf\x91\x9c\x8a\
+\xea\xa0\x97\x33\x19\xed\x77\x01\x5c\xb4\x1c\x8b\xa7\x86\x0b\xc8\
+\x9c\x8f\xbe\xc5\x97\xa0\x23\x5c\x28\x21\x63\x07\xf3\x5f\x66\x3a\
+\xc4\xb9\x39\x80\x47\x02\x8f\x0f\x93\xe2\xbe\x38\x56\x26\x27\x73\
+\xce\x6f\x76\xd2\x5c\x84\x88\x9c\xee\x28\x30\x07\x52\x5d\x4f\xca\
+\x85\x80\x26\x47\x46\x82\x64\xe6\x1b\x84\xa6\x19\x96\xe1\x6e\x8f\
+\x94\xe0\xfa\xc5\x33\x52\x0a\x61\xd0\x69\x45\x42\x65\x34\xb2\x1f\
+\x92\x06\xf1\xd7\x50\x6e\x54\x0c\x79\x30\x4a\xdb\x99\x53\x1e\xc3\
+\x7d\x87\x23\x50\xa1\xed\xb3\x17\xca\x70\xa6\x24\x36\x27\x31\x48\
+\xd5\x4f\xc0\xac\x2f\xf9\xff\x00\x15\x62\x08\x00\x21\x3d\x29\x89\
+\x0f\xcd\x29\x42\x61\x34\x20\x31\x51\x08\x85\xfe\x2f\xce\x9d\x18\
+\x1e\x77\x4a\xf6\x51\x56\x09\x25\x7c\xc9\x67\x60\xb6\x0c\x1a\x98\
+\xd0\xb5\x04\x17\x1f\x27\xe3\xa3\x50\x8a\xc9\xed\x86\x7f\x12\xc9\
+\xd2\x71\x69\x75\xdd\x37\x16\x1a\x58\x3c\x15\xd0\xba\x2f\xd0\x97\
+\x39\x71\x49\x2d\xc2\x1c\xb4\x91\x01\x71\x48\x77\x7e\xbf\x3d\xba\
+\x95\x22\xaf\x31\x7e\xba\x37\xdb\xc3\xe7\xa3\xdc\x5b\xa1\x1c\xb7\
+\x80\x22\xa9\x65\x14\xf9\x68\xc1\xae\x2a\xd1\x10\x0d\xe4\x81\x6a\
+\xcd\xf7\x40\xdc\x37\x1d\x0d\xe0\x38\x81\xdf\x5f\x28\xe4\x30\x05\
+\xe2\x47\x0a\x3e\x27\xa8\x88\x4e\x2e\x14\x79\x7d\x57\x47\x41\x5a\
+\x77\xdb\xb4\xe8\x8f\x08\xb0\x3e\x5f\x2d\xef\x37\x3a\x10\xe1\xbb\
+\x4f\xb9\x45\xac\x95\x72\x73\x80\xb4\x7a\x50\x4d\x60\x58\x09\x5c\
+\xe6\xb5\x08\xea\xb2\xbc\x43\x58\x3a\x45\x82\xc5\xc5\x38\xc4\x18\
+\xb8\x73\xad\xd2\x7f\x88\xcb\x09\xa9\xb9\x1c\x54\xa5\xa9\x85\x62\
+\x15\xb2\xcf\x0a\x25\x15\x28\x43\x98\x08\xaa\xf4\xd6\x6b\x84\x4d\
+\x48\x10\x13\xb8\xfc\x06\x9e\x49\x80\x50\x92\x81\x79\x6a\xa6\xc8\
+\xb9\x13\x6a\x03\x4a\x3f\xec\xfa\x62\xcb\x27\x35\x61\xcf\x4b\xc2\
+\x09\x7d\xf2\x3b\xab\x92\x70\x03\x50\xf0\xa4\x02\x2b\xc8\x80\x16\
+\x77\x9b\x30\x72\x29\xa0\x14\x4a\x05\x48\x38\xd1\xbf\xaa\xa0\x83\
+\x21\x08\x79\xd5\xe1\xc3\x72\xdc\xae\xcb\xbb\xf0\x39\x47\x63\xf4\
+\x29\xb1\xaf\x1e\xe1\xc8\x14\xd6\x4c\x64\xb7\x3d\x98\x08\x51\x15\
+\x0a\x02\x6d\x7a\x1d\xc0\xf2\xe8\x61\x10\x9d\x8e\x1d\x3a\xe3\x0e\
+\x66\x90\xef\x4c\xa3\x9b\x26\x10\x37\x54\xf7\xf9\x06\x0d\x8c\x9b\
+\xd0\x00\x21\xc3\x41\xd6\x8e\xff\x00\xd3\x17\x03\x7f\xe2\x3f\x48\
+\x4d\xa3\xc3\x16\xa5\xd7\xe9\x21\x4c\x19\xed\x6e\x68\x3d\xc5\x28\
+\x96\x38\x3d\xf1\xc8\xee\xe5\x18\x93\xfa\xf8\xb5\xa3\xed\x9c\x00\
+\x23\x73\x31\x5b\x49\x8d\x17\xc8\x70\x0a\x2b\x5a\x85\xd3\xaa\x4f\
+\x18\x08\x93\x6a\xb7\x05\x6b\x46\x2a\x63\xf0\xe5\x57\x5d\x10\x9d\
+\x90\x9f\xb3\x85\x26\x04\x10\xdc\xb4\x73\xf9\x57\x3a\x05\x52\xfa\
+\xf8\x86\xfa\x24\xb8\xdc\x1a\xdf\x27\x8f\x89\x96\xb1\x01\x58\x60\
+\x8a\x4c\x5d\x25\x0f\x23\x54\x44\x76\x3d\x77\x20\x72\x65\xf5\x9a\
+\x42\xcc\xca\x0e\xfb\x5e\x18\x1f\x5f\xf2\x7c\x01\x24\x37\x31\x1a\
+\xc3\xd0\x41\xf5\x5d\x8e\x81\xb9\x36\x78\x2a\x56\x83\xfb\x85\x3c\
+\x8e\xdf\x6d\x40\x30\x72\xcf\x70\x2e\xe8\x42\xf5\x23\xd9\xd5\x25\
+\xe0\x2b\x14\x98\x7b\x42\x55\xd1\xaf\x58\xa8\x45\x1b\xe4\x56\x29\
+\x7c\x8e\x73\x6a\xa5\x12\x8a\xe8\x1c\xbc\x70\x5e\x52\xa4\xe7\x3a\
+\x8e\x27\xe0\x9d\x0f\x1a\xda\x18\x7c\xf0\x7d\x06\xb9\x82\x77\x14\
+\xc6\x2a\x59\xd2\x9f\xba\x71\xe7\xb1\x93\x65\x59\xee\x47\x30\x68\
+\x56\xca\xa0\x41\x2e\xbf\x4f\x96\xcb\x6e\x4f\xa6\xa8\x9e\x16\xf0\
+\x08\x03\x4a\xd2\xab\xd2\x18\x90\x7d\xe0\x1e\x48\x31\x9b\xa1\x80\
+\x25\xea\x00\x96\x9e\x87\x46\x5b\xba\x38\x8f\x41\xa9\x86\x8d\x40\
+\x0a\x06\x2a\x74\x60\x67\xf9\x04\x80\xcf\x18\x93\x04\x8e\x32\x4c\
+\x7c\x82\x61\xf0\x20\x8d\xcb\x1c\x5f\x16\x0c\x99\xd8\x33\xba\x14\
+\x6b\x19\xa5\x04\x68\x00\x04\xf4\x0f\x3d\xa8\x86\x90\x72\x80\x88\
+\x9c\x32\xf5\x58\x54\x05\xb1\x70\x3d\xa0\x51\x21\xd9\xb3\x91\x8e\
+\xc6\x71\x24\xa8\xf8\xb0\x6a\xc3\x2e\x8d\xd7\x47\xc8\x82\xe8\x1c\
+\x54\x16\x0f\x08\x0e\xde\x28\x80\x37\x08\x9d\x80\x3e\x5b\xcf\x81\
+\x1a\x58\x65\x7b\x54\x38\xd0\x18\x5d\xa1\x80\x70\x74\x85\xda\xd1\
+\xdf\xf6\x41\x28\xeb\x70\x2c\x22\x8e\x5f\x6f\x43\x5f\xe4\xbb\x5e\
+\xbf\xb0\x2c\x15\x79\xa4\xa4\x9a\xf4\x34\x6c\xd1\x4d\x52\xe3\x8a\
+\x79\x19\xcf\x3c\x15\x6a\x3c\xbf\xa5\x71\x28\xe2\x40\x02\x4d\x98\
+\x77\x5c\x20\x7b\xc2\xca\xd0\xc8\x3c\x70\xc0\xbb\xbe\x6d\x10\x28\
+\xb0\xaa\x31\xc4\x85\xfe\x92\xb5\xf7\xea\xd2\x3b\xba\x5e\x5d\xd9\
+\x93\xab\x63\x40\xcd\xc5\x1a\x86\x5b\xbc\xab\x34\x27\xe4\xe0\xb1\
+\x47\xec\xbf\xd4\x06\xc6\xa4\x13\xf5\xb9\xc4\x84\xa7\x15\x3c\x8c\
+\x7f\x7a\x64\xab\xf3\x99\x36\x3c\x32\x01\xe0\x02\x08\xa2\x25\x47\
+\x82\x1d\x6b\x3c\x72\x1c\x82\x8b\x30\x04\x08\x48\xca\x15\x82\xf4\
+\x41\x15\xf4\x51\x98\xd9\x1b\xda\xb1\x59\x01\x35\x1d\x56\x45\xaa\
+\x9a\x01\x26\xa3\xf4\x44\x63\xb4\x45\xd1\x48\x2b\x12\xd6\x6a\x8a\
+\x2a\x54\x64\x21\x62\xc9\x09\xff\x00\xbb\x25\xe4\xde\xd2\xc9\x93\
+\xa0\x82\x59\xff\x00\xcc\x4a\x96\xe3\x25\x20\x19\x64\x6d\x0a\x8a\
+\x7f\x14\xd3\x95\xae\x48\xf7\x06\xb8\x3c\xb7\x31\x60\x58\x44\x40\
+\xa7\xd6\x21\x4e\xd1\x90\x1f\x0f\xde\x47\x7c\x3b\x11\xef\x0e\xda\
+\xa3\x74\xf8\x4c\x8a\xbf\x49\x69\x70\x80\x30\x12\x84\xb3\x52\xe0\
+\x47\xe8\x75\x2f\xce\x26\x47\x46\xed\x68\x1c\x2b\xb1\x4c\x57\x66\
+\x12\x82\xcc\xc0\x5b\xd8\x44\x9a\x8f\x27\x20\x13\x13\x2e\x5a\xd6\
+\xd2\x01\xc3\x74\x8b\x33\xc7\x65\x20\xf1\xe9\x39\x5b\x24\xea\xa9\
+\x27\x11\x42\x37\x45\xb2\xf3\x80\x86\xaf\x44\x4b\x63\x3f\x3a\xd7\
+\x3f\x7b\x93\x79\xcc\x44\x9f\x6c\x5f\x2a\xd2\xed\x87\x0a\x12\x0e\
+\xf2\x8c\x88\xe6\x3a\x59\xea\x8c\xa3\xc9\xe6\xba\x1c\xe1\xaa\xe0\
+\xe7\x53\x2f\x06\x01\xa3\x83\x7f\xdc\xd2\x01\x14\x1c\x51\x20\x4f\
+\xb0\xfe\xb0\x04\x2f\x6d\xfd\x22\x48\x34\xc4\xa5\xcd\x7d\x21\x57\
+\x6b\x91\x95\xab\x50\x04\xec\x09\x8b\xce\x30\x97\x52\x58\x81\x6f\
+\x2f\x05\x80\x20\xb8\x4c\x1f\x73\x6b\x4a\x83\x65\x5d\x20\x02\xeb\
+\xe6\x36\xc9\x04\x0f\xc7\xfe\xe1\x7f\x4c\x68\xff\x00\x2b\x2f\x93\
+\x97\xbe\xca\x11\xc3\xb6\x08\x8d\x49\x92\xcf\x77\x15\x8f\x5b\x3d\
+\x2e\xac\x53\x33\x07\x52\xd4\xc0\x3e\xa1\x89\x1a\x9d\xdc\x2b\x3d\
+\xb0\x6f\x4d\x33\x55\x56\xe3\x64\xd9\xa1\x94\x2e\x14\xe2\xfd\x21\
+\xfa\x8c\x9d\x6d\xf1\xc1\x21\x92\x9e\x4d\x8b\xa4\x32\x63\xdb\x12\
+\x90\xb0\x51\xd1\x54\xa5\xbc\x52\x41\x02\xae\x11\x0a\x08\x91\x11\
+\xba\x3e\xe2\xa9\xc9\x0c\x10\xfe\xc2\xc2\x91\x05\x40\xd0\x44\xaa\
+\x0d\xc0\xd9\xb2\x40\x43\x63\xe9\xcc\x70\x30\x64\xaf\x62\xa5\xcf\
+\x87\x59\x01\x38\x28\x59\x59\xd3\x06\x25\x5e\x1a\x59\x21\x8f\x5b\
+\xc8\xc1\x21\x23\x94\x75\x65\x47\x78\xf2\x10\x4a\x17\x1d\x3f\xa2\
+\xa5\x9b\x17\xc4\x8b\xfc\xf4\x96\x31\x25\xcc\xa8\x15\x30\x92\x2f\
+\x55\x84\xc5\xbf\x96\x90\x11\xec\x30\xe9\x57\x88\x20\x22\x39\x3b\
+\x8b\xea\x40\x8b\x48\x34\xa4\x1e\xc6\x7c\xe2\x2d\xfb\x6f\x5f\x71\
+\x98\xb8\x61\xde\xaf\xbc\x73\x15\xd8\x80\xe0\x76\x6a\x51\x09\x4c\
+\xae\xe1\x38\x4a\x46\xa5\xa3\x06\x64\xb4\xab\xae\x04\x00\xc7\x26\
+\x8a\x58\xe9\x4b\xc1\xbf\xdc\xb6\xb0\xe5\x97\x54\x67\x5d\x6c\x69\
+\xde\x8f\x0f\x78\x2f\xb8\x7d\xe9\x0e\x88\x66\x24\x51\xb6\x89\xdb\
+\xd0\x9a\x66\x4a\xb5\x82\x11\x9d\xef\x89\x26\x3b\xd2\x08\xfb\x10\
+\xd5\xdb\xc7\x31\x43\x1c\x1c\x0d\x04\x4b\xa2\x16\x9d\x88\x11\x9b\
+\x52\x34\x64\x85\x72\x0d\x4f\xa5\x1d\x99\x0c\xf9\xd5\xf1\xc6\xdb\
+\xb0\x85\x5b\xea\x03\x26\x0e\x72\x08\xfa\x94\x3e\xb0\x93\xd1\x7c\
+\xfe\xda\x0b\x35\x06\x09\x83\x2d\xdd\x15\xda\x82\xd1\x5c\x41\x07\
+\x20\x56\x26\x41\xc5\xa6\xfa\x0b\x45\x5a\x1a\x61\x58\xc8\x51\xc7\
+\xa6\x32\xa5\x7b\x94\x78\xc1\x4f\xc4\x61\x31\x79\x94\xf6\x0c\x40\
+\xa1\x61\xf6\xcc\xbd\x96\x9b\x4c\xc5\x5b\x8e\x0d\x1b\x06\xe0\xb3\
+\xb8\xda\x10\x14\x14\x03\x11\xce\x8b\x69\x06\x80\x0c\x46\x82\x01\
+\x8a\xe1\x67\xd2\xbb\x71\x38\x50\x46\x75\x54\x0b\xb9\x76\xac\xd4\
+\x8a\x88\x48\x82\x0a\x95\x7c\xed\xf6\x86\x60\xa0\x68\x49\x1a\x4d\
+\x9a\x0f\xc5\x08\x1b\x24\x21\xa0\x26\x17\xc9\x26\xfb\x63\x7b\x66\
+\xe0\xe1\x1a\x2e\xe5\x65\xf0\x40\xcd\x4c\x6e\x03\x96\xd3\xa5\x5b\
+\xad\x25\xd0\x0c\x70\xe2\x20\xd9\x1b\x1b\xb5\xed\xa9\x0b\xb0\xd4\
+\x50\xad\xc8\x59\x26\xde\x20\xac\x62\x0f\x7b\x70\x40\x57\xa4\x1e\
+\x54\x51\x30\x91\xa8\xa0\x08\xd1\xf2\x3d\xa0\xcc\x9d\x4e\xb8\xaa\
+\xa5\x88\xf8\x86\x41\x81\x05\xc2\x82\xfa\xd1\x08\x5f\xa5\x38\xa8\
+\x8a\xc1\xe7\x9e\xc3\xeb\x86\xd0\x3a\x0c\x81\x10\x20\x88\xf3\x21\
+\x57\xbf\x8e\x86\xcf\xc3\x5e\xc9\xaf\x35\xe3\xb2\x35\x22\x4e\xb5\
+\x4e\xcb\xab\x88\x25\x01\x64\x40\xc1\x63\x46\x50\xd1\x28\xea\x51\
+\xd2\xa0\x41\xc9\xb7\x2e\x11\x49\x0a\xa0\xc3\xa8\x93\x0c\x4e\x49\
+\xd7\x2d\x11\xd3\x59\x86\xdd\x12\x1e\x2c\xee\x47\xd3\x58\xae\x95\
+\x4f\x0c\x74\xfe\x82\x5c\x01\x0a\x46\x87\x2f\x12\x3a\x7d\x24\x9a\
+\x16\xa7\x77\xea\xc7\x44\x3d\x90\x4b\x92\xda\x70\xf1\x95\xc4\x84\
+\x4e\x4d\x15\x10\x85\xc1\xca\x7a\xe9\x3a\x16\x18\x4a\xb4\x61\x30\
+\xf2\x12\x51\xe3\x4b\xe6\xe7\xa3\xdd\x32\x62\x5e\x15\x8d\xc0\xba\
+\xda\xbd\x70\x29\x95\xcc\x74\xca\x38\x7f\x82\x5f\x86\xd7\xf3\xb9\
+\xae\x3e\xd3\xe7\x2e\x7d\xd1\x71\x35\x5c\xbc\x66\x84\xf1\xd1\xe0\
+\x4c\x79\x20\xd3\xd8\x6c\x88\x14\xfe\x2b\xe2\x5b\xc6\x1e\x94\xd6\
+\x11\x27\xbb\x8f\x0b\xa3\xd8\x28\x73\x5c\x86\xd2\x4e\xa9\x69\x9e\
+\x6f\xc9\x68\x5b\x2e\x64\x1a\x18\xc2\x35\x02\x1c\xeb\x43\xeb\x28\
+\x10\x41\xce\x96\xa2\xb5\xa2\x66\xca\x41\xb6\xaf\x0c\x54\xed\xc6\
+\x37\x26\x4b\x28\x54\x09\x58\x6c\x06\x96\x54\xb8\x5d\xe8\x08\xc0\
+\x17\x7b\xc3\xb4\xf6\xa1\x22\x01\x08\x70\x12\x38\xee\x94\x9a\xac\
+\x97\x12\xd4\xe2\x03\x12\xfc\x3d\xc1\xc4\xa3\xc3\xae\x95\x82\x86\
+\xc4\x59\xd9\x72\xb0\x0c\xf7\x3e\x66\x60\x0c\x55\x5d\x96\x94\x15\
+\x85\x07\x39\x42\x71\xa8\x5b\x98\x15\xbd\x30\xf5\x88\x3a\x0a\x8c\
+\xef\x17\x20\xc2\x0c\x73\x2a\x80\x00\x02\xfe\x8e\x30\xd1\x47\x26\
+\xe9\x11\x72\x4a\xe4\x92\x53\x61\x27\xfc\x58\x26\x57\x76\xbf\xf2\
+\xaa\x3d\x43\x7d\x17\x83\xe8\x50\x1d\x25\xec\x7a\xe8\x47\x68\x8f\
+\x01\xf1\xe7\xb6\x89\xb3\xaf\x16\xb1\x8d\x40\x3b\xec\xe4\xb8\x29\
+\x92\xa6\x1a\x87\x3b\x61\xdf\x40\x73\xae\xbe\x79\x26\xe6\x1a\x73\
+\xa4\x8b\xec\x46\xc0\x07\x2d\x26\x3a\xa5\xf7\x2e\xd5\xb5\x87\x92\
+\xed\x8b\xd0\xaf\xa5\x11\x7f\x8d\x99\x27\xef\xa4\x8f\x57\x82\x9a\
+\x1c\x58\xe2\x49\x0c\xb7\x9f\x54\x80\x45\x5e\x4d\x8b\x80\x00\x65\
+\x87\xab\xeb\xb1\xad\xf5\x4e\x6c\x56\x7f\xf2\x13\x0e\x95\x96\xb9\
+\x82\x78\x45\xf2\xd5\x3e\x46\xa6\x22\x9e\xf8\x77\xc9\x27\x18\x2d\
+\x9d\x85\xcb\x44\x02\x8f\x07\x48\xc5\x51\x80\x09\x6e\x8a\xf0\xc1\
+\x70\xb4\xa8\xcb\x0a\x4b\x03\x06\x72\x6e\x3d\x0d\xc7\xe3\x23\x00\
+\xa5\x21\xa2\xc9\xda\xd3\x06\xe8\xa0\x41\x38\x7a\xad\x06\x68\x5c\
+\xb2\xa1\x4a\xa5\x5e\xad\x2c\xe5\x47\x9d\x8d\x34\x52\xcf\x1c\x7b\
+\x6c\xe5\xb4\x05\xa4\xab\x09\x1b\xb3\x92\xdc\xa0\xee\x44\xd3\x5b\
+\x10\xa3\x70\xc3\xe7\x60\x05\xa2\x3b\xb9\x8f\x46\x29\x65\x2a\x44\
+\xa0\xb4\x07\x22\x78\x26\x6a\x4c\x4a\x00\x56\x03\x99\x22\x98\x21\
+\x00\x23\x86\xe7\xdd\x4c\xa5\xbd\x57\x38\xe0\x84\x96\x9e\xb6\x9e\
+\x86\x33\x00\x1d\x6b\xf4\x06\xce\x28\x99\x1c\x0d\x56\x4a\xb2\xf9\
+\x4e\x5a\xd3\x39\x0d\x79\xa0\x3d\xb9\x3d\x22\xc4\x73\x3e\xb8\x5d\
+\xd0\xd8\xf4\x35\x45\x28\x21\x47\x11\x9b\x2f\xb0\x8b\x8b\x2a\x10\
+\x2a\x81\x61\x2f\x34\x5f\x11\x62\x7c\x82\x3f\x76\x37\x95\x1e\x41\
+\x30\xaa\xfe\x62\x3c\xf7\xd2\xc5\x10\x91\xed\xce\x20\xa4\xaf\xa8\
+\x2b\x4c\x3b\x5e\xf4\xad\xf0\xf1\x64\xdb\x69\xbc\x43\xf1\x89\x17\
+\x75\x85\x9c\x41\x1f\x04\xbd\x23\xee\x45\x6a\xd4\xb8\xb1\xa5\x9e\
+\x21\x1f\xf0\x46\x02\x34\xf5\x30\x7f\xd9\x88\x91\xa4\x49\x8f\x3d\
+\x4f\x56\x3d\x77\x47\x3a\x32\xad\xd4\x34\xe6\x52\x3d\xea\xf0\x9c\
+\x54\xd0\xdc\x5e\x44\xfc\xa8\x1b\x76\xd9\x21\x87\x13\x7c\x70\x07\
+\xa1\xaf\x68\x8e\xb2\xc4\x94\x31\x18\x2d\x3e\xca\x33\x88\xe4\x0b\
+\x2b\x4c\x34\x0a\x8b\x4c\x49\xfe\x2e\xb1\xa3\xa0\x7b\x30\x6c\x94\
+\x9e\xff\x00\x08\xe7\xdd\x48\x18\xdc\x0d\xda\xf1\xf1\x89\x8e\xe9\
+\xb6\x64\x78\x41\x52\x78\x02\xa2\xcb\x21\xb6\xe3\x16\x9e\x05\xac\
+\x2e\x53\x74\x4d\xc1\xab\x6c\x3c\x09\x1c\x78\xe6\xeb\x58\x94\x9e\
+\xcf\x0f\xb0\x51\x75\x15\x96\x9a\x73\x4c\x01\xf1\x68\x84\x32\x0c\
+\x04\xd5\xe9\x66\x96\xf2\x88\xb9\xd4\x54\x41\x0a\x00\x48\x49\x0c\
+\x65\xf9\x0b\x68\x21\xf5\xba\x77\x28\x10\x72\x8f\xb9\x48\xd9\x48\
+\x2c\x9b\x90\xa4\x39\x26\x10\xe1\x49\xfe\x45\xd8\x93\xa6\x0c\x55\
+\xd2\x75\x84\x11\x94\x41\xc8\x7a\xc3\xcd\x7b\xe0\x28\xc1\x1c\xf4\
+\x81\x84\x41\x37\x45\x3c\xbe\xef\xca\x4a\x0c\x05\xdb\x3b\xa8\x19\
+\x50\x3d\xc1\xaf\xc6\xd3\x21\x45\x99\x6f\x78\x1a\x26\x78\x57\x95\
+\xc9\x51\x2c\xc8\x11\x9e\xb9\xfe\xf4\x06\xae\x21\x0b\x69\xc3\x36\
+\x04\xd6\x67\x8b\x18\x90\x3b\xe0\xf6\x8d\x90\xc5\x0c\x94\xa2\x43\
+\x37\xdd\x9c\x13\x58\x09\xd3\x00\x09\x20\x8c\x01\xd1\xa9\x44\xf9\
+\x45\xcc\x30\xd0\x3f\x61\xd8\xf0\x16\xa1\x69\x36\xc6\xfb\x07\xb6\
+\xd6\xc0\xa5\x36\x0e\xd4\x2e\x43\x10\x54\x80\xdd\x6c\xc7\x2b\x6c\
+\xfa\x02\xac\x2a\x05\xba\xc7\x52\x35\x31\xbe\xe0\x05\x2c\x7f\xb2\
+\x4c\x0f\x66\x40\xf6\xd2\xc2\x2e\x7d\x84\x23\x43\x0b\x1e\x6f\x8a\
+\xa1\xac\xf1\x7b\xb2\x84\x67\x61\x3b\x3b\xd0\x07\xaf\x06\x80\x94\
+\xc1\x22\x69\xc1\x2b\x13\x23\x08\x86\x7a\x45\x05\x24\x79\xb8\xa7\
+\xc0\x11\x43\xc4\xa9\xc7\xd5\x7c\x1a\x2d\xde\xe2\x40\xc0\x7b\xbf\
+\x83\x9d\x31\x62\x52\xc6\x45\x2f\x3b\x9e\x60\x0d\xa7\xea\xa5\x03\
+\xd1\xeb\x60\xb3\x6c\x71\xda\x24\xfc\xca\x27\x4f\x03\x04\x43\x5d\
+\xe8\xd8\x82\x34\x78\xcd\x7a\xca\x01\x94\xd4\x05\x5f\xf3\x59\x4a\
+\xf8\x18\xf0\xf1\x99\x5a\x7b\xb8\x25\x93\xc3\x7f\x25\xa2\xe9\x1b\
+\x92\x05\x8e\x1c\x47\xea\x35\x3d\x7f\xd6\xb6\x76\x06\x34\xa9\x74\
+\x0a\x35\x07\xa4\x55\x6a\x44\x1a\xa8\x5c\x41\x1f\x6d\x56\x58\x49\
+\x0c\xa9\x62\xc9\xd2\x86\x79\x73\xa4\x58\xa9\x10\xc6\xf3\xe6\x0e\
+\x41\xac\xa8\x07\xec\x04\x56\x4f\xb2\xc0\xe1\xb0\x08\x17\xb1\x38\
+\xbc\x95\xcd\x4a\x45\x04\xc3\x56\xbb\xae\xdb\x15\x31\xd6\x0f\x28\
+\xb1\x45\x72\x11\x56\xa1\x5a\xdb\x21\x17\xce\xed\x6d\xc8\x1d\xaa\
+\x33\x86\x72\x85\xfd\xc2\x41\x2d\x0b\x26\x72\x64\xe4\x59\x73\x7b\
+\x6c\x58\x1f\xf1\xd3\xf1\x2f\x9a\xb7\x64\xc6\x2b\x09\x6b\x92\xec\
+\x2e\x39\xc2\xcd\x69\x5a\xdb\x5d\x40\xad\x4b\x12\x60\x97\x48\x68\
+\x73\x29\x74\x4e\x6f\x26\xd8\x54\x0a\x20\x1b\xc2\x6f\xa6\x7d\xe6\
+\x0b\xc8\x8f\x50\x0d\x22\x56\xa0\x00\x42\x3a\xae\xcf\x10\xd1\x83\
+\x96\x58\x00\x34\xb4\x18\xba\x79\x20\x63\x88\xca\xa2\x5a\x0d\x7b\
+\xa1\x45\xcc\x3b\x53\x08\xe7\x58\xeb\x6b\x63\xe8\xd6\xf5\x6c\xca\
+\xef\x3a\x4b\x4d\xaa\x74\x40\x7b\x7b\x73\xb8\x04\x9a\x14\xee\x29\
+\x0f\x77\x48\x3a\x2d\x72\x4e\xe0\xc1\xc7\xf2\xd6\xb0\xe8\x9b\x04\
+\x53\x63\xa8\x41\x73\xbd\x4b\x0d\xa0\x6a\xb9\x42\x80\x5a\xcd\xb7\
+\x06\x75\x86\x05\x44\x8e\x24\x13\x40\xf0\xbc\x25\x50\x90\x2d\x69\
+\x0c\x1c\x20\x30\x48\xf5\xa4\x83\xe6\x26\x86\x20\x16\x45\x12\x2d\
+\x3b\x93\x8c\x39\x00\x59\xfc\x70\xb2\x30\x37\x31\x29\x2a\x54\x95\
+\xeb\x97\xf2\x19\x8c\xb8\x27\x28\x94\x21\x33\x60\x65\x58\x25\xc1\
+\x17\x4d\xc5\x95\x00\xd5\xdd\x8d\x7c\xa5\x6a\x56\x50\xad\x23\xe2\
+\x58\xb1\xfb\xfe\x96\xd6\x31\x60\xcf\xa4\x79\x86\x80\x2f\x12\xb5\
+\x0e\xc4\xba\x9f\xe9\xbb\x35\x2b\x2a\x14\x59\xa1\xe2\x4a\xc9\xb4\
+\x46\x38\xa7\xf7\x62\xc7\x5a\xa0\x87\x19\x84\xa3\xbe\x94\x44\xd7\
+\x30\xc6\xf4\x36\xa3\x31\xe1\x48\x25\x4d\x8f\xcf\xdc\x03\x42\xac\
+\xf3\x2e\xaa\xcf\x29\x0b\xf5\x08\x11\x38\x18\x94\x28\x8b\x43\x74\
+\xaf\x5f\x4c\xb4\x15\x8a\x60\xfc\x97\xe5\xc8\x72\x4b\x7c\x60\x62\
+\xda\x2b\xce\xf5\x4f\xce\x17\x65\x7a\x08\x8a\x38\xdd\x9c\xf8\xab\
+\x92\xe4\x91\x37\x83\x4c\x53\x08\x40\x5e\x82\xe2\x9d\xc8\x99\x9c\
+\x1b\xff\x00\x9a\xd0\xef\xc6\xc9\xf1\x18\xdb\xb5\x0a\x29\x04\x45\
+\x88\x68\x80\xb1\xa0\x09\x71\x67\xb2\x4a\x17\x12\xd0\x84\x61\x92\
+\xa4\x30\xbb\x80\xe8\x22\xe4\xaa\x4f\x32\x41\x90\x9e\xb5\xa9\x15\
+\xd0\xf3\xe1\x01\x38\xca\xc2\x00\x21\x52\xaa\x54\x00\x9d\xac\xcc\
+\xd0\x88\xae\xdb\x64\xe7\x46\x19\x0a\x5d\x0f\x8f\x40\x79\xda\xc9\
+\xf6\x8b\x23\xcc\x39\x02\x5e\x42\x26\x47\x35\xb9\xaa\x62\x23\xca\
+\x6c\xb9\xa5\x24\x5f\x60\xae\xb2\x57\x0d\x12\x0d\xda\xf3\x8e\xa1\
+\x3a\x7d\x41\x84\x94\x50\x49\x02\x25\x27\x49\xb8\x89\x10\xd4\xd0\
+\xb7\x8e\x2d\xa6\xe9\xb0\x17\xea\xb4\x04\x28\xc9\x46\x77\xd6\x88\
+\x6f\xb0\x20\x21\x11\x8f\x6f\x59\x4d\x7e\x9d\xa1\x51\xac\xce\xe9\
+\x45\xef\x62\x07\x07\xc9\xcd\x4f\x0b\x31\x71\x02\xe2\xcc\xae\xa7\
+\x71\x0a\xb8\x44\x45\x69\xf2\xc2\x77\x84\xdc\xc8\xdf\x0c\x2b\xa9\
+\xe8\x65\x19\x9f\x5a\x47\xae\xd2\x78\x47\x01\xec\x68\xda\x4c\xd3\
+\xce\x52\x1e\xe7\xca\xc7\x5f\x52\xd8\xd5\xb9\xc1\x9d\xf8\xe2\xab\
+\x57\x49\x95\x47\x54\x2b\xb8\xfb\xa5\x7d\xa3\x44\x7c\x0e\x7c\x0e\
+\xa4\x54\xc3\xd7\xf3\xee\x62\x80\x6e\xf9\xb2\x7d\xb7\x54\x1c\x12\
+\xc9\xed\x42\x53\xe1\x5d\x46\x0b\xc9\x02\x47\xea\x12\x52\x24\x5c\
+\x07\xac\x79\x9d\x2c\xc0\x4b\xa2\x80\x20\x87\x4b\x18\x65\x7b\x87\
+\x8a\x96\xf1\x1e\x11\x1e\x4f\xad\x8a\x3d\x8a\xe8\x44\x25\x2d\x12\
+\xd0\x11\x44\x0b\x15\x0e\x19\x63\x6d\x0e\x6a\xf0\x2b\x6c\xef\x2a\
+\xe7\x72\x53\x7a\x10\x92\xf6\x90\x68\x57\x83\x2b\x51\x0d\x0b\x37\
+\x87\x3e\x91\x1f\x2a\x85\x17\xb0\xa1\x8d\xa2\x8f\x1d\x82\x1c\xb0\
+\x12\xb5\x4f\x7b\x0d\x61\x24\x51\xf0\xe9\x84\x80\xdf\x9b\xea\xda\
+\xc3\x61\x1d\x24\xb5\xaf\x2a\x91\xd6\xc6\xae\x9a\xaf\x87\xb0\xf9\
+\x29\x21\x8e\x11\x76\xad\x2f\x2a\x8b\x0a\x6b\x2c\x4b\x24\x48\x0e\
+\x85\xb3\x19\x4e\x47\x37\xbc\x96\x12\xf5\x8a\xaa\x2f\x0c\x1c\xad\
+\x3c\x70\xa5\xce\x8f\x48\xb8\xa2\x34\x6d\xd9\xfe\x2f\xa7\x18\x09\
+\xd2\x6b\x2e\x7e\x9e\x1e\xad\x9d\xf7\x91\x52\x3a\x8d\x53\x24\x21\
+\xf0\x48\x9f\x72\x44\x55\x27\x08\x10\x41\x40\x50\xa0\x52\x50\xb6\
+\xab\xab\xf8\xca\x3f\xa6\x48\x10\x9f\x47\xfe\x37\xdb\xde\xf8\x53\
+\x2d\x98\x2b\xa0\x13\xbd\x9c\x0f\x96\x31\x80\x48\xe1\x65\x98\xdd\
+\x27\x78\x08\x41\xa9\x2a\x38\xbf\x81\x91\xdc\x99\x77\x8c\xc0\x0b\
+\x8a\x2f\xcd\xb1\xfd\x15\x51\xb3\x76\x1c\x4c\xaa\xb0\xac\x5b\xdf\
+\x6f\xe1\x04\xe4\x9c\xd6\x19\x74\x7e\x9b\x6a\x4a\x54\x36\x16\x0a\
+\x3b\x07\x34\x32\x45\xba\x3e\x15\x29\x30\xbb\xb6\x58\xd1\x12\xc4\
+\xcb\x2d\x04\x21\x94\x8f\x87\x7f\x1a\xaa\x8c\x0d\x47\xdd\x0f\x1b\
+\xc9\x14\x80\x41\xac\x76\x2c\x4f\x60\x5e\xe3\x3d\x8c\xcd\xbf\xdc\
+\x3c\xc3\x0e\xa3\x3b\x00\x14\x2d\x48\x37\x3c\x59\x54\x4a\x1a\x16\
+\xce\x99\xf6\x69\xac\x84\xd5\x59\xf8\xa3\xaa\x38\x03\x8f\xaf\x30\
+\x27\xa1\xc1\x81\x9c\x11\xbe\x06\x1e\xa7\x65\x59\x40\x70\xdb\x28\
+\x11\x61\x78\x91\x94\xfb\xe7\x34\xd9\xd3\x50\x95\x9a\x21\xb3\xba\
+\xdd\xd0\xaa\x52\xd0\xd1\xd2\x82\x70\xca\x1e\x7e\x30\x7a\xb4\x79\
+\x08\x46\x3d\x87\xc9\x83\x8c\x0b\xbb\xc3\x56\x51\x4a\x6c\xd3\x01\
+\x64\xb0\x12\xcf\xed\x5c\x0b\xd4\x93\xe8\x20\x35\x38\x23\x74\x58\
+\xe6\x6d\x05\xd9\x42\x64\xe2\x68\xa8\xa2\x39\x43\x21\x3d\x4a\x67\
+\x06\x26\x0c\x0d\x79\xb2\x21\xca\x08\x22\xe2\x92\x7a\x2b\x83\x91\
+\x8d\x9e\x97\x84\x4a\x26\x58\xc3\xa1\xa6\x8a\xb1\xbe\x52\xc0\x57\
+\x07\x78\x3e\x1b\xdd\x20\x3e\x9e\xc4\x6d\x65\xf6\xb4\xc8\x75\x3a\
+\x0a\x66\x66\x80\x24\x45\xe4\xa5\xe1\xe0\x59\x09\x17\x45\x06\x1b\
+\x7c\x58\xa2\xd8\x5f\x60\x28\x0b\x9f\x2a\x8a\x15\x52\xca\x49\x49\
+\x18\x4a\x05\x1d\x32\x3c\xcb\x40\x06\x8d\x96\xca\x5e\x2b\xef\x70\
+\xff\x00\xf6\xed\x02\x6c\x1d\x45\x7c\x6e\x09\x90\x1a\x82\xc2\x04\
+\x03\x88\x9d\x6e\xba\x51\x7f\x29\xcc\xe2\x0c\x90\xba\x08\x80\x0f\
+\xd0\xa4\x39\x99\xf3\xee\x52\xdb\x0c\x43\x9c\x66\x56\x71\x41\x4e\
+\x44\x61\x71\x17\x26\x26\x4a\x36\x61\x3d\x24\xd9\xa0\x17\x3e\x81\
+\x8c\x6f\xca\xad\x9b\x50\x51\xb5\x42\xce\xca\x48\x74\xc7\xa3\x58\
+\x54\x87\xc3\xa5\xbd\xf2\x61\x20\x92\x4f\x13\xc2\xaf\x6a\xe2\x1d\
+\x54\x27\x68\x59\x0d\x54\x54\xdf\x73\x5d\x50\xdb\xed\x4a\xb4\xfb\
+\xac\x17\x44\x57\xb9\x81\xd0\x5a\x70\xea\x9f\x52\xd2\x6e\x75\x60\
+\x18\x04\x9e\x0c\x91\x20\x8a\xaa\x05\x09\x1c\xf1\x65\x03\x94\x66\
+\x64\x2d\x00\xe4\x1f\x86\x40\x76\xcd\x66\xa8\x71\x22\x01\x79\x42\
+\x28\x14\x90\x26\x88\xee\xb5\x7f\x11\xe2\x70\x98\x0c\x0b\x52\x6a\
+\x96\x0c\x15\x4d\xbd\x0f\x3c\x1c\xef\x4d\xa8\x26\x9c\x76\x4a\x58\
+\x55\xbf\xe8\xae\x19\xa3\xf3\xa2\x1f\x14\xa8\xce\xa0\x7d\x2e\x9d\
+\x22\xbd\x84\x3d\x6c\x75\xa2\x09\x42\xdb\x69\xc4\x2e\x90\x35\xa6\
+\x02\xea\x84\x92\x6b\xfe\x6a\x09\xd0\x34\x52\x14\x5e\x01\xb6\xaf\
+\x86\x64\x7d\x2f\xfd\x76\x17\xdd\x81\xa2\x70\x21\x14\x57\xa7\x0a\
+\xd1\x53\x30\x9f\xae\x3e\x3f\xe6\x6f\xcf\xc2\x3f\x4c\x6a\x85\x6d\
+\x36\xf7\x75\x7e\x5f\xe4\x9b\xe6\x0b\x16\xc4\x7a\x69\x71\x27\x82\
+\x58\x0a\x2f\x36\xf9\x36\x84\x11\x0d\x36\xa0\x7b\xa6\x4b\x57\xe9\
+\xbb\xbd\x5d\x7a\xd5\x38\x96\x4f\x29\xda\x34\xa3\xcc\x1b\x21\x19\
+\x31\xf4\xbc\xd7\x84\x2f\x59\xce\xed\xc8\xb7\xd5\xe1\xd7\x7c\x6e\
+\xca\x58\x11\xd5\x22\x1b\xdc\xe8\x6f\x2a\x5f\x50\x02\xa4\xa9\x22\
+\xe5\x21\xcb\xc8\x0b\x14\x55\x9d\x38\xe2\x5c\x49\x3d\xb3\x8d\xa0\
+\x91\x68\xe0\x5b\x17\x63\xb0\x77\x05\x9f\x8a\xb5\xcb\x09\xd3\x65\
+\x12\x7e\x19\x78\x24\xa8\x71\xd7\x94\x94\x70\xdd\x3a\x16\x8b\xff\
+\x00\xff\x00\x06\x18\x6d\x59\x3b\x58\x15\x1a\x89\x83\x3a\x6b\x7c\
+\x78\xb4\xd7\x2d\xc3\x4a\x0f\x3c\x57\x41\x4e\x40\x07\x2c\x59\xa5\
+\x90\xe9\x06\x9d\xbf\xe4\x2d\x9a\x8d\xe9\x26\xc3\x1d\xee\xc2\xe4\
+\xd2\x04\x6c\xfd\x86\x9d\xb6\x98\x70\xe9\x9f\xdc\xa2\x2a\x1a\x44\
+\x00\x93\x76\x12\xff\x00\x9a\x5c\x59\xc4\xad\x01\x06\x9d\xcd\xbf\
+\xdb\x3d\x78\xb4\x30\xce\xaf\x85\x92\x1b\x47\x67\x95\x4e\x0c\x12\
+\xea\xeb\x14\x8a\x34\x0d\x13\x40\xc8\x78\x9f\x32\x36\x1b\x32\x69\
+\xc4\x81\x81\x80\x3b\x55\x46\x28\x2f\x33\x9c\xf9\x85\x53\x20\x5a\
+\x3a\x7c\xa2\xb5\xc2\x49\xa0\xa9\x6b\x02\xa3\x97\x32\xa3\xa1\xa8\
+\x4a\x81\xa0\x33\x10\x2c\xe7\xba\xf9\x0c\x05\xd2\x55\x51\x8b\x04\
+\xa9\x38\x21\xea\x18\x37\x50\x70\xfb\x54\x4f\x45\x63\x5a\x7c\x0e\
+\x51\x07\x82\x04\xc1\x38\x65\x01\x34\x52\x87\x21\xc0\xe8\xd3\x8c\
+\x4c\xa4\xf6\x77\x15\xb0\xe0\xf4\x36\xb9\x3e\x4f\x9f\x7e\x17\xed\
+\xba\x80\x08\x01\xd1\x4e\xcb\xd5\x21\xca\x22\x2b\x55\x41\x33\x4c\
+\x37\x57\x0a\x26\x0a\x6f\x53\x01\x27\xb9\x00\x8c\xcc\xe6\xfe\x46\
+\x8f\x28\x7e\x4a\xe9\x1a\x44\xe8\x4d\x20\x9e\xbf\x3e\xba\x78\x37\
+\x20\xc4\xb5\x17\xf0\x49\x64\xfa\x44\x57\xab\x03\x78\x5c\x3c\x05\
+\x07\xfc\x1f\x46\x80\xae\xed\x8f\xb1\x9f\x0c\xc3\x6a\x07\x47\x42\
+\xa8\x75\xb4\xe3\x89\xf3\xe4\x77\x75\x2a\x02\xd4\xc7\xeb\x5e\x24\
+\x21\xd7\x58\x7b\xa8\x4a\x04\xab\xcd\xb8\x19\x3a\x0b\x85\x4c\x15\
+\x02\x81\xe4\x00\xd1\xc4\x57\x98\x6d\x29\x21\x10\x7c\x83\x3c\xc4\
+\xee\x7c\x38\x52\x79\xf7\x5d\x80\x81\xa6\xa7\x3e\xc6\x78\xd1\xe8\
+\x5a\x03\xe2\xc0\x24\x1d\x30\xe8\x97\x3a\x05\x5e\x2a\x36\xf4\x50\
+\xa6\x00\x75\xd7\x2d\xc4\x99\x71\xe4\x19\x91\x7a\xfd\xc2\x4d\xe5\
+\x53\x3e\x56\x30\x6e\x64\x06\x00\x9b\x63\x6b\x14\xbd\xdf\x5a\x98\
+\x67\x95\x46\xe3\x13\x83\x43\x81\x88\xb8\xe6\xbf\xe1\xa1\x5e\x17\
+\xab\x09\x0e\x4e\x83\xa6\xd7\xd7\x7c\xbc\x1b\x67\xb1\xdf\x15\x1a\
+\x88\x2a\xb9\xe1\x4b\x42\xa6\x70\x01\x84\xc3\x21\x84\x09\x44\xa1\
+\x96\xb8\xca\x08\x1c\xa6\x19\x4e\x29\x0d\xec\x24\x2f\x24\xce\xe8\
+\xed\xe5\x5b\xbc\xae\x38\xce\x90\x52\xa3\x3c\xc8\x27\xb5\xb2\xaa\
+\x93\x54\x40\x84\xf7\x90\x0e\x91\x05\xca\xc0\x94\xd2\xa2\xbf\xb2\
+\x83\x56\x94\x4e\x0b\x24\x80\x79\x85\x4b\x92\xcb\x43\x3a\x1e\x48\
+\x97\x59\x84\x51\xf0\x8e\x4a\x02\x21\xb3\x72\x03\x9f\x6a\x94\x7b\
+\x0d\x84\x1a\x3d\x72\x5b\xf1\xf6\x95\xe2\x0a\xe3\x4a\x2c\x87\x41\
+\x32\x2b\x51\x80\xe7\x10\x01\xf3\xe1\xa8\x71\x31\x55\x80\xd2\xfb\
+\x11\x38\xa6\x72\x50\xdd\x43\x0d\x5a\x85\xe6\x30\xb3\xd6\xad\x45\
+\x27\x28\x71\x8e\x9b\x52\x51\x31\x87\x9c\x7f\x76\x3c\xab\xe3\x8a\
+\x52\x4e\x9d\x10\xdc\xe6\x5c\xf1\x6c\x8d\x42\xc8\xb9\x0e\xe0\x40\
+\x76\x06\x8a\x7b\xd1\xe0\xe9\xab\xa8\xbe\xb8\x35\xd9\xbf\x07\x67\
+\x9d\xf3\x1c\x34\x8d\x90\x37\x0a\xf8\xa2\x08\x80\x99\x39\x40\xa1\
+\x65\x60\xc8\xef\xf7\xb9\x4b\x73\xab\x74\x17\x65\xa1\x14\xdc\xc4\
+\x13\xf4\xee\x55\xb5\x95\xfb\x90\xd6\x32\xdd\xec\x85\xe5\x8e\xa8\
+\xa6\x06\x98\x74\xc2\x85\x17\xed\xd9\xe0\x1a\xd7\xc0\xcd\x7e\xdc\
+\xe3\x8f\xfa\x1f\xe6\x96\xc2\x6a\x58\x02\x32\xbb\x86\xef\xbb\xd6\
+\x47\x64\x21\xf6\xb4\x11\x1e\xf8\xf5\x03\x9d\xc0\x94\x9e\x97\xcc\
+\x78\x12\x1f\x99\x31\x1c\x5d\x7f\xc0\xb2\x62\x0c\x44\x8a\x9d\xca\
+\x93\xd6\xe0\xd2\xfa\xe9\xc1\x08\x75\xd0\xb6\x42\x2e\x68\x3a\x8e\
+\x89\x90\x37\xa5\xb3\x70\x63\xc5\xcd\xb4\x4b\xbc\x02\xfa\x61\x00\
+\xe6\xac\x2a\x75\x72\x62\x0e\x5b\x72\xa8\x33\xd1\x82\x44\x3f\xd3\
+\x42\x1c\xb3\x73\x02\xef\x0d\x3b\x53\x9f\xc4\xb6\x0c\xfa\x7e\x18\
+\xc9\xaa\xb1\xb6\x12\x11\x1c\xa6\x00\x91\x3c\xf4\x79\x6f\xf8\x39\
+\x12\x33\xbf\x39\xa5\xff\x00\xdb\x2d\x21\x80\x13\xe0\x30\x57\x5f\
+\xb0\xf4\xf6\xa5\x8b\xc2\x5c\x58\xc7\xa3\x86\x77\x67\xdd\xa8\x92\
+\xf8\xb0\x68\x8d\xdd\x1c\x60\x86\xbf\x0e\x44\x70\x0f\x19\xca\x94\
+\x8e\x6f\x70\x62\xc2\x68\x1c\x74\x28\xc8\x0b\xc6\x1f\x81\x36\x82\
+\x5e\xb8\x00\x27\x0a\x20\x02\x62\xb0\xe0\x0f\x40\x36\x80\x1c\x04\
+\x3e\x95\xf2\x88\x6a\x2e\xf0\x1d\xef\xc9\x35\x6e\xcb\x18\xb9\x39\
+\x1b\x0e\xa8\x22\xc3\x4e\x20\x63\xdf\xd1\xe1\xc3\x24\xec\x0c\x3a\
+\x8e\xd3\xa1\xaa\xc4\xd9\x92\x8f\xf8\x04\x50\x94\x9f\x80\xb3\x83\
+\xb4\x47\xcd\xb5\x44\xd3\x3c\x2a\x48\x05\xf5\x93\xec\x35\x50\xe0\
+\x41\x06\xf2\xb7\x7d\x10\xb7\x58\xbf\xc1\x29\x31\x44\xd6\x32\x4f\
+\x6d\x73\x0d\xa0\x2c\x7b\x30\xfd\xcd\x7f\xb3\x21\x83\xfe\xd7\xa4\
+\xf7\xd1\x51\x38\x99\x76\x3e\xc4\x59\x9c\x0c\x1a\x29\x8a\x88\xed\
+\x1b\xc3\xf8\x78\xe4\x28\x0b\x7f\x24\x25\x0b\xb1\xb2\x1c\x4f\x84\
+\x45\xf7\xbe\x7a\x38\xdc\x9e\x43\xa4\x1c\xca\x1d\x5c\x0d\x02\x2b\
+\x07\x81\x3f\x23\x3e\xf6\x1c\xe3\x68\x99\xd9\xa4\x09\xbc\xc0\xab\
+\x89\x5e\x52\x77\x2d\xce\xae\x50\x89\xc4\xf5\x01\x40\xef\xc4\x7a\
+\x3c\x3d\x12\xa9\x30\xba\xd7\x0f\x03\x80\x78\x8f\x94\xd1\x0e\x79\
+\x6f\xa3\xcb\x91\x05\x5d\x0f\xdd\x24\xbf\xe6\xb3\xb7\xc9\xcd\xf2\
+\x87\x82\xad\x1a\x37\xe7\x50\x17\xd6\x9a\x69\x71\xc6\x53\x0e\x8f\
+\x18\x02\x8e\xa9\xc7\xed\x72\x04\x21\x56\xc4\x1e\x9d\x7e\xe4\xfb\
+\x3d\x58\x6c\x3e\xa5\x18\x79\x80\x62\xd2\x78\x08\x54\x72\x02\x11\
+\x68\xba\x11\x0c\x48\x80\x7a\xa0\x15\x00\x9e\xb8\xa4\x53\xed\x31\
+\x58\xf3\xba\xf4\xc3\xc8\x45\xc8\xf2\x19\xbe\x91\x55\xfc\xa5\x57\
+\xe1\x3f\x46\x30\x2e\xb3\x63\x06\x0d\x86\x17\xb0\x46\x97\x96\x7c\
+\x1a\x29\x98\xf3\xc6\xa4\x2f\xc5\xa6\xeb\xd2\x69\xb4\x73\x53\xfd\
+\x71\x9d\x60\x2a\x96\xe8\x37\xcb\x2a\x36\x2b\xfd\xb7\xed\xad\x48\
+\x0d\x81\xeb\xa3\xde\x9d\x00\xff\x00\x9f\xcf\x57\xde\x7f\xa6\x23\
+\x18\xe2\x54\x9e\x98\x63\x83\x2a\x72\x10\xe9\x4d\x82\x20\x74\xb4\
+\xfd\x94\x99\x13\x1f\x8a\x2d\x25\xa6\x6e\x61\xe5\xeb\x77\x34\xcb\
+\x19\x72\x07\x0c\x8e\x2d\x92\x41\xfe\x21\xe3\x1b\xb5\xe8\x23\xb0\
+\x98\xea\x1b\xac\x78\x14\xc3\xdd\xc9\x89\x4b\xca\x9e\x32\xef\x16\
+\x24\x8e\xc2\xa0\xc5\x2c\x7a\xc1\x92\xb3\x96\x5d\x65\x97\x54\x40\
+\x3a\x47\x2b\xd2\xb9\xc5\x9c\xba\xfb\x22\x17\x3d\xc3\x82\x69\xa7\
+\xc0\xed\x2a\x7f\xf5\x9c\xe4\x39\xe8\x90\x85\xf2\x39\x4f\x8c\xb8\
+\x4e\xda\x6c\x54\x1b\x79\x83\xef\x4a\x4c\x45\xb1\x64\x82\x02\x28\
+\x7d\x9b\xfb\x8a\x36\x5d\x4a\xda\xe5\x9d\x0a\xc8\x8c\x5b\x00\xf7\
+\x07\x40\x24\xfc\xad\xb4\xdf\x7f\x39\xf2\x47\x16\x72\x20\x2e\x8c\
+\x77\x22\x58\xbe\x28\x8c\xf2\x80\x06\x62\x5f\x23\x63\x31\x71\xb4\
+\x0b\x80\x63\x57\x04\xa3\xbf\x41\xdd\xa0\x24\x4c\x56\xea\x5d\xc8\
+\x82\x93\x44\x2b\x47\xb1\x72\xbe\xd9\x98\xa3\xba\x14\x59\xd1\xe4\
+\x40\x8a\xe7\x02\xc3\x80\x76\xf4\xa2\x8e\x8c\xf1\x2f\x26\xcd\x39\
+\x14\x7a\xfd\x00\x55\x82\x15\x78\x97\xfc\x8c\xab\x9a\xac\x8c\xe4\
+\x34\x03\x00\x9c\xf7\x94\xcf\x35\x13\xfb\x1c\x8d\x84\x31\xf4\xb9\
+\x66\x8c\x12\x60\xc3\x21\xe6\x24\xab\x46\x50\xf6\x1e\xe6\xe1\x7a\
+\xea\xa4\x8e\x27\xf5\xd9\x79\x0f\xd1\xb7\x1f\xa6\xc5\x40\xca\x5a\
+\xba\x59\xe8\xe7\xf2\xec\xf9\x88\xc8\x23\xae\x20\x1e\xcc\x98\x9d\
+\x09\xae\x44\xd2\xa3\xc3\xd5\x18\xc2\x45\xaa\x21\x3b\x2f\x45\x7b\
+\x7d\xdd\xfc\x7a\x4c\x79\xda\xd1\xc3\xff\x00\x23\x7f\x45\x6e\x0b\
+\xfd\x10\x48\x42\x6b\xe6\xbb\x55\x66\xd2\x8f\xc5\xb0\xb2\xd3\x87\
+\x51\xed\x5c\xe8\x51\x43\xcd\x21\x38\xe0\x0e\xbe\x6b\x20\xa6\x6d\
+\xa6\x75\x66\x23\x71\x17\xf9\x85\x18\x84\x22\xf1\xc4\x72\x5c\x50\
+\x42\x77\x5f\xeb\x5b\x83\x16\xd4\xa5\x86\x16\x57\xa9\xed\x18\x9c\
+\x48\xb7\x9f\x56\x6f\xfc\x4e\xe8\x74\xc9\x7c\x12\x37\xc0\x64\xb9\
+\x94\xe0\xcb\x64\xc1\x05\xd3\x71\x6a\x2b\x5a\xeb\x18\x1b\xff\x00\
+\xb9\x7a\x47\xad\x6c\x17\x4d\x4f\x2b\xe4\x5d\x89\x80\xae\x64\x99\
+\xc4\x52\x21\x09\x98\x40\x73\x2a\x45\x5c\xfc\xac\x7d\x30\xa6\x8d\
+\x3c\x30\xf6\xf5\x1a\x0e\x8d\x5b\x38\xd8\xf7\x46\x4c\x1b\x98\xa2\
+\xd5\x09\x5b\xee\xcb\x0b\xf2\xa1\x8d\x0c\x46\x07\x8c\xd4\xea\x0d\
+\xe2\xc2\x5a\xfa\x4d\xb8\x9f\xb2\xdb\x32\xf3\x7b\xa6\x2a\x49\x00\
+\x91\x1d\xa7\xc4\x60\x2a\x0b\x60\x95\x14\xf2\x51\x99\xf6\x70\x13\
+\x3e\xbc\x34\x49\x2e\xa7\x08\xc5\x90\x74\x1e\x41\xf6\xa2\xae\x97\
+\x58\xb8\x62\x0c\x81\xde\xe9\x43\xce\x05\x9a\xd6\x31\x49\x11\x96\
+\x34\x10\x02\x19\x15\x74\x2d\x08\xbd\x2a\xca\xa6\xc7\x7d\xe6\x6b\
+\xd1\x5a\x32\x05\x1e\x6c\xd1\x91\x34\x76\x60\x77\x5d\x68\xb7\x1a\
+\x95\xb5\x85\x54\x77\x40\x90\xc9\x09\xc1\x5b\x05\x5e\x34\x70\x0f\
+\x3a\x64\xf1\x5a\xc5\xdc\xd1\x03\xc7\xf4\x2e\x2f\x66\xae\xb5\xe9\
+\x2d\x35\x0b\x3e\x45\x7f\xc4\x23\xe9\xa0\xff\x00\xbf\x1e\x16\x6c\
+\x92\x5c\x3b\xef\x2f\xbe\x75\x4e\x79\xf7\xb6\x18\xeb\x5a\x49\x0e\
+\xbd\xb4\xad\x7e\x1c\xca\x1c\xe5\x63\xa1\x8d\x77\x97\x31\x4c\xaf\
+\x95\x84\x79\x93\x95\x22\xc6\xbd\x64\xe0\x43\xf0\x1f\x93\x62\xe4\
+\x50\xd6\x18\x69\xc6\xea\xc5\x3f\xa7\x1e\xca\x08\x34\x5c\x71\xbf\
+\xa3\x81\x4d\x28\x87\xe8\xef\x89\x1b\x19\xd4\xe4\x05\xa5\x5f\xe8\
+\xca\x3b\xa0\xf8\x9f\x87\x88\x4f\x0b\xac\x6b\x46\xd6\x6f\xf2\x7a\
+\xb3\x58\x79\x45\x00\xd9\x98\xa8\x3a\x7e\xfb\xe9\x5b\xbb\xc7\xbd\
+\x0a\x33\xa4\x32\xba\x5f\xfc\xf3\xc0\x8c\xfe\xbe\x05\xbb\x5f\xac\
+\x6c\x48\x7d\x11\xbb\x2c\x64\x6a\xdc\xbc\x71\x20\x95\xd9\xa2\x61\
+\x30\x64\xbc\xcd\x14\x46\x8a\x74\x33\x49\xd3\x99\x8e\xb0\xe7\x4d\
+\x41\xdc\x72\x4b\xa0\x0d\x17\x75\x5e\x0e\x5a\x61\x86\xe4\x2d\xce\
+\xbc\x2c\x7a\x44\x4f\x44\xd3\xa8\x90\x92\xea\x09\xe9\xd2\x15\xb0\
+\xe1\x24\xd8\xc9\x05\x1c\x67\x89\xa3\xb2\x32\x4f\x0b\x7a\x76\x1e\
+\x1e\x48\xdd\x9b\xd9\x58\xdd\xcf\x01\xcd\x18\x72\x9e\x11\x26\x43\
+\xb8\xf8\x05\xcc\x0b\x59\x2a\x93\x19\x72\x95\xcc\x62\x1d\x57\x82\
+\xa0\xb9\x0b\x83\x42\x0a\x51\x6a\x26\x0c\x3e\xe6\xa7\xdf\x04\x55\
+\x66\xa7\x5e\xa5\xf1\xba\xa5\xfb\xd6\x01\xae\x59\x39\xa7\x78\x44\
+\x1d\x02\xf8\x16\xd7\x69\x84\x33\x42\x25\x93\x16\xbe\xee\x63\x75\
+\xa9\x1c\xfe\xfe\x2c\x6e\x46\x50\xa0\x95\x13\xd2\x3e\xbc\xe8\x2b\
+\x20\x21\x19\x2d\xa7\xae\xc3\xcc\x41\x2f\x8a\xc7\x4f\xfb\xec\x54\
+\x2a\x35\x5f\xdf\x86\xfe\x3e\x65\x49\xf8\xb9\x07\x68\x60\x52\x83\
+\x03\x9a\xf6\xe0\x96\xcd\x8a\x22\xd4\x2e\xd1\xed\x52\xc8\xfc\x36\
+\x95\x3d\xd6\xb4\xdd\x7d\x96\xce\x76\xdc\x1f\xe1\x45\x6b\x40\x62\
+\x75\x92\x8f\x49\x90\x7c\xfe\x44\x04\xf4\x1f\x91\xc0\x73\xae\xde\
+\x88\xc8\xb8\xa4\x31\xc4\x05\x0a\x95\x21\x11\x33\x74\x4d\xcb\x0e\
+\x2b\xb3\x04\x07\x8f\x58\x35\x1f\xfd\x9b\x06\x7d\x54\x37\x46\x01\
+\x53\x0c\x7e\xb8\x0b\x13\x18\x72\x6b\x10\x20\x0c\xc5\x09\x0f\xe7\
+\xc2\x09\x50\xc9\x72\x50\x4a\xf2\xd5\x51\x46\x60\xde\x05\x05\x31\
+\x19\x5a\x93\x75\x07\x52\x8c\x24\x57\x35\x2c\xfd\xcd\x35\xd0\x9a\
+\x51\x32\xf9\xa3\x72\x4a\x2e\x00\xe8\x8e\xaa\xc9\x8d\xe0\x97\x98\
+\x87\x1b\x8a\xc4\xdd\xce\x27\x00\x1d\xb8\x6c\x42\xc3\x56\xc9\x86\
+\xef\x74\x74\xc1\x74\x06\xbf\x23\xf3\xeb\xca\x61\x67\xfc\x8b\x05\
+\x43\x1d\xe4\xe6\xe2\x3b\x3e\x80\x74\x84\x15\x2a\x2e\x82\xd9\x36\
+\xcf\x76\x73\xce\x72\xb2\xbd\xc2\xf3\xbe\xb7\x09\x1c\xb9\xbd\xf9\
+\xa6\x17\xa8\x9a\x49\x5d\x5f\x72\x29\x37\x9b\x08\x31\x36\x9d\x40\
+\xc0\x7e\xd1\x7a\xc5\xad\x77\x97\x9f\x6a\xd1\x6c\x12\x97\x83\xaf\
+\xb0\x60\xed\xa3\xaf\x3c\x21\x25\x8d\x31\xd4\x49\x9e\x82\x5c\x98\
+\x0f\x9f\xf9\x52\x48\x04\x76\xd4\x9c\xcb\xb5\x84\xdc\xef\xc1\xa4\
+\x49\xf1\x0a\x60\xcc\x73\x20\xd3\x2b\x33\xa9\xd5\x1b\x73\x5b\x35\
+\x6b\xb1\xa5\x8b\x09\x7d\xc4\xf4\x7e\xa9\x2e\x0d\xf3\x1d\x88\x0e\
+\x0d\xa1\x6e\x90\xe4\x82\x78\x24\xdf\x0e\x19\x27\x17\x3b\xc2\x80\
+\xc5\x66\x20\x0d\x82\xa2\x03\x22\xc5\x83\xfc\x81\xd4\x68\x9e\x27\
+\x8a\x37\x3c\x17\x85\x54\x8c\xe6\xb2\x68\xe5\x3c\x22\x4e\xe4\xa0\
+\xe7\xd5\x6f\x06\xc5\x68\x39\x7b\xd2\xa7\xa0\x97\x7c\x9a\x21\x6c\
+\x92\xf4\x0c\x91\xec\x62\x17\x66\xa7\x17\xf9\xa3\x29\xed\x11\x46\
+\x6b\x68\x66\xe9\x7f\xf2\xc8\xae\xe8\x18\xbf\xcf\xd1\x8c\x66\x9f\
+\xb3\xcd\x33\x02\xf4\xe4\x72\x81\xff\x00\x7d\x40\xfe\xa3\xae\x47\
+\x5c\x99\x9e\xdb\xa8\x4e\x6b\xbb\xbd\x1b\x7c\x34\x8b\x53\xe6\xac\
+\x29\x17\x0c\x85\x3c\x5a\xc0\x47\x50\xec\x3d\xce\xce\x06\x09\xe0\
+\x99\x3f\xf1\x5c\x0c\x47\xb0\xc7\x36\x16\x56\xec\x0c\x53\x56\x4a\
+\x00\x19\x74\x1c\x75\xcf\xaf\xcb\xd6\xcc\xa5\x7a\xce\x41\x35\xac\
+\xc9\x71\x12\x3b\x16\x79\xd1\x32\xc5\x33\xcd\x2a\xcd\xf9\x89\xe3\
+\x50\x31\x7e\x58\xb8\x19\x47\x76\x06\x12\xc9\x3d\x29\x82\x09\x6b\
+\x5f\x68\x2b\xf1\xbf\x63\xc5\xfd\x20\xb7\x1b\xf2\x63\x23\x75\x34\
+\x84\x68\x95\xaf\x20\xb5\xc5\x07\x91\x1c\xf2\x93\xf0\x04\x2c\x73\
+\x36\x4a\x38\xd4\x14\x7f\xcd\x12\x2b\x43\x88\x2e\x6c\xcc\x3f\xf3\
+\x8c\x4e\xbf\xb7\xde\x79\xf4\xb4\x42\x44\x51\x3d\x29\x5e\x33\xfc\
+\x09\xdf\xc5\xc9\xa0\xd7\x44\x89\xeb\x1e\x15\x32\x22\x11\x8a\x36\
+\xfa\xf5\xe0\x74\xdb\x24\x89\x6f\x45\x27\xd8\xac\xda\x9b\x4c\x19\
+\xb5\x84\xc1\x8a\x6d\x70\x28\xa2\xf9\x09\x55\x37\x89\x5f\x82\x58\
+\xde\x32\x5a\x88\xe7\xb4\x88\xc7\x04\x1e\x31\x75\xb2\x65\x18\xcc\
+\x56\x78\x66\xc3\x0c\x57\x2e\xae\xe4\xbe\x2a\x1e\x02\x58\x7d\x21\
+\x56\x9a\xe3\x5e\xe3\x4b\xc0\x92\x43\x83\xd1\x41\x7c\x8d\xb9\x42\
+\x36\x3c\xd9\xc6\x38\x76\x2b\x2c\x4c\xb8\xfa\xc3\x0e\xa5\x97\x8b\
+\xef\xdc\x8b\xbc\x7f\xa2\xd4\x53\xbb\xa3\xa0\x79\x46\x77\x7d\x77\
+\xaa\x33\x39\x79\x20\x65\x27\x84\x70\x3b\x47\x14\x7f\x8f\x9b\x84\
+\xfb\xb9\x23\x9d\x4e\xc6\xda\xd1\x16\x00\x4a\x5c\x02\x67\x7a\xf5\
+\xf5\x40\x58\x58\xc2\xd0\x9c\x59\xa7\x42\x62\x4e\x88\x46\x83\x58\
+\x2c\x53\x8b\xce\x4f\x30\x5b\xa8\xbf\xff\xd9\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x70\x37\xd5\
+\x00\x69\
+\x00\x6d\x00\x61\x00\x67\x00\x65\
+\x00\x15\
+\x0d\x0f\x53\x87\
+\x00\x72\
+\x00\x61\x00\x62\x00\x62\x00\x69\x00\x74\x00\x6d\x00\x61\x00\x72\x00\x6b\x00\x2d\x00\x72\x00\x61\x00\x62\x00\x62\x00\x69\x00\x74\
+\x00\x2e\x00\x6a\x00\x70\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9c\x6d\x5a\x28\x18\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -1,13 +1,15 @@
 """
-import_dialog.py -- interface for importing from a CSV file
+import_dialog.py -- interface for importing from a CSV file, and for running
+imports in the background
 """
 
-from typing import Optional
+from typing import Callable, Optional, Tuple
 
 # pylint: disable=no-name-in-module
-from PyQt5.QtCore import QUrl, Qt
+from PyQt5.QtCore import pyqtSignal, QThread, QUrl, Qt
 from PyQt5.QtGui import QDesktopServices
-from PyQt5.QtWidgets import QApplication, QDialog, QTableWidgetItem, QComboBox
+from PyQt5.QtWidgets import (QApplication, QDialog, QTableWidgetItem, QComboBox,
+                             QProgressDialog)
 
 from rabbitmark.librm import interchange
 
@@ -22,15 +24,96 @@ class MultipleResultsError(Exception):
     pass
 
 
+class ImportThread(QThread):
+    """
+    Worker thread to import bookmarks, so the GUI stays responsive while a
+    large file is imported. /import_func/ is one of the importers in
+    interchange.py, called with a session, /args/, and callbacks to report
+    progress and check whether to stop.
+    """
+    progress_update = pyqtSignal(int, int, int)
+
+    def __init__(self, sessionmaker, import_func: Callable[..., Tuple[int, int, int]],
+                 *args) -> None:
+        super().__init__()
+        self.sessionmaker = sessionmaker
+        self.import_func = import_func
+        self.args = args
+        self.result: Optional[Tuple[int, int, int]] = None
+        self.exception: Optional[Exception] = None
+
+    def run(self) -> None:
+        """
+        Create database session for this thread, then import the file using
+        it, reporting progress after each chunk is committed.
+        """
+        try:
+            session = self.sessionmaker()
+            self.result = self.import_func(
+                session, *self.args,
+                progress=self.progress_update.emit,
+                canceled=self.isInterruptionRequested)
+            session.close()
+        except Exception as e:  # pylint: disable=broad-except
+            self.exception = e
+
+
+def importInBackground(parent, sessionmaker,
+                       import_func: Callable[..., Tuple[int, int, int]], *args) -> None:
+    """
+    Run /import_func/ on an ImportThread (which see) with a progress dialog
+    that can stop it, then tell the user how it went.
+    """
+    thread = ImportThread(sessionmaker, import_func, *args)
+    progressDialog = QProgressDialog("Importing bookmarks...", "&Stop", 0, 100, parent)
+    progressDialog.setWindowTitle("Import Bookmarks")
+    progressDialog.setAutoClose(False)
+    thread.progress_update.connect(
+        lambda at, tot, imported: updateProgress(progressDialog, at, tot, imported))
+    thread.finished.connect(progressDialog.accept)
+    thread.start()
+    stopped = progressDialog.exec_() != QDialog.Accepted
+    if stopped:
+        # The thread stops once it's committed the current chunk.
+        thread.requestInterruption()
+    thread.wait()
+
+    if thread.exception:
+        raise thread.exception
+    assert thread.result is not None, "Import thread finished without a result!"
+    imported, duplicated, similar = thread.result
+
+    msg = f"{imported} bookmark{'' if imported == 1 else 's'} imported."
+    if stopped:
+        msg = f"Import stopped. {msg}"
+    if duplicated > 0:
+        ess = '' if duplicated == 1 else 's'
+        msg += (f" {duplicated} bookmark{ess} "
+                f"with URL{ess} already in collection ignored.")
+    if similar > 0:
+        urls = "has a URL" if similar == 1 else "have URLs"
+        msg += (f" {similar} of the bookmarks imported {urls} "
+                f"very like one already in the collection; "
+                f"you may want to check for duplicates.")
+    utils.informationBox(msg)
+
+
+def updateProgress(progressDialog, at: int, tot: int, imported: int) -> None:
+    "Show how far the import has got. Called after every chunk is imported."
+    progressDialog.setLabelText(
+        f"Importing bookmarks... {imported} imported so far.")
+    progressDialog.setValue(int(at * 100 / tot) if tot else 100)
+
+
 class ImportDialog(QDialog):
     "Import bookmarks from a CSV file."
-    def __init__(self, parent, session, target_path: str) -> None:
+    def __init__(self, parent, sessionmaker, target_path: str) -> None:
         "Set up the dialog."
         QDialog.__init__(self)
         self.form = ImportMappingForm()
         self.form.setupUi(self)
         self._parent = parent
-        self.session = session
+        self.sessionmaker = sessionmaker
         self.target_path = target_path
 
         # set up details widget
@@ -156,20 +239,12 @@ class ImportDialog(QDialog):
             rm_field = self.form.mappingTable.cellWidget(table_rownum, 1).currentText()
             mapping.append(None if rm_field == DONT_MAP else rm_field)
 
-        imported, duplicated = interchange.import_bookmarks_from_csv(
-            session=self.session,
-            target_path=self.target_path,
-            dialect=self.schema.dialect,
-            mapping=mapping)
-        self.session.commit()
-
+        # Close the mapping dialog before the import starts, so only the
+        # progress dialog is left on top of the main window.
         super().accept()
-        msg = f"{imported} bookmark{'' if imported == 1 else 's'} imported."
-        if duplicated > 0:
-            ess = '' if duplicated == 1 else 's'
-            msg += (f" {duplicated} bookmark{ess} "
-                    f"with URL{ess} already in collection ignored.")
-        utils.informationBox(msg)
+        importInBackground(self._parent, self.sessionmaker,
+                           interchange.import_bookmarks_from_csv,
+                           self.target_path, self.schema.dialect, mapping)
 
     def onMappingChanged(self, _new_index) -> None:
         self._updatePreview()
@@ -2,12 +2,12 @@
 wayback_search_dialog.py -- interface for searching the WayBackMachine
 """
 
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 # pylint: disable=no-name-in-module
-from PyQt5.QtWidgets import QApplication, QDialog
+from PyQt5.QtWidgets import QApplication, QDialog, QListWidgetItem
 from PyQt5.QtGui import QDesktopServices
-from PyQt5.QtCore import pyqtSignal, QThread, QUrl
+from PyQt5.QtCore import pyqtSignal, Qt, QThread, QUrl
 
 from rabbitmark.librm import bookmark
 from rabbitmark.librm import broken_links
@@ -30,7 +30,7 @@ class LinkCheckDialog(QDialog):
         self.form = Ui_LinkCheckDialog()
         self.form.setupUi(self)
         self._parent = parent
-        self.blinks = {i.name: i for i in blinks}
+        self.blinks = {i.pk: i for i in blinks}
         self.session = session
 
         # set up details widget
@@ -39,7 +39,14 @@ class LinkCheckDialog(QDialog):
         self.detailsForm.browseUrlButton.clicked.connect(self.onBrowseUrl)
         self.detailsForm.copyUrlButton.clicked.connect(self.onCopyUrl)
 
-        self.form.pageList.addItems(sorted(self.blinks.keys()))
+        # List items are keyed by the bookmark's primary key (UserRole), as the
+        # user may rename bookmarks while working through the list.
+        self.items: Dict[int, QListWidgetItem] = {}
+        for blink in sorted(self.blinks.values(), key=lambda i: i.name):
+            item = QListWidgetItem(blink.name)
+            item.setData(Qt.UserRole, blink.pk)
+            self.form.pageList.addItem(item)
+            self.items[blink.pk] = item
         self.form.pageList.item(0).setSelected(True)
         self.form.pageList.currentItemChanged.connect(self.updateDetailsPane)
 
@@ -79,10 +86,16 @@ class LinkCheckDialog(QDialog):
         if widgetItem is None:
             widgetItem = self.form.pageList.selectedItems()[0]
 
-        blink_obj = self.blinks[widgetItem.text()]
+        blink_obj = self.blinks[widgetItem.data(Qt.UserRole)]
         mark = bookmark.get_bookmark_by_id(self.session, blink_obj.pk)
         return blink_obj, mark
 
+    def _removeItem(self, pk: int) -> None:
+        "Remove the bookmark with primary key /pk/ from the list."
+        del self.blinks[pk]
+        item = self.items.pop(pk)
+        self.form.pageList.takeItem(self.form.pageList.row(item))
+
     def updateDetailsPane(self, new, previous):
         """
         Fill the editor/details pane with data from the currently selected bookmark.
@@ -133,8 +146,7 @@ class LinkCheckDialog(QDialog):
     def onDeleteBookmark(self):
         "Delete a broken link from the database."
         _, mark = self._blinkAndMark()
-        del self.blinks[mark.name]
-        self.form.pageList.takeItem(self.form.pageList.currentRow())
+        self._removeItem(mark.id)
         bookmark.delete_bookmark(self.session, mark)
         self.session.commit()
 
@@ -150,8 +162,7 @@ class LinkCheckDialog(QDialog):
         "Remove a bookmark from the list (when we're done dealing with it)."
         self.saveBookmark()
         _, mark = self._blinkAndMark()
-        del self.blinks[mark.name]
-        self.form.pageList.takeItem(self.form.pageList.currentRow())
+        self._removeItem(mark.id)
 
     def saveBookmark(self, mark=None):
         "Save the specified bookmark, or the currently selected one if not specified."
@@ -168,20 +179,23 @@ class LinkCheckThread(QThread):
     """
     progress_update = pyqtSignal(int, int, int, str)
 
-    def __init__(self, sessionmaker) -> None:
+    def __init__(self, sessionmaker, check_all: bool = False) -> None:
         super().__init__()
         self.blinks: List[LinkCheck] = []
         self.link_success_count = 0
         self.link_fail_count = 0
         self.exception: Optional[Exception] = None
         self.sessionmaker = sessionmaker
+        self.check_all = check_all
 
     def run(self) -> None:
         """
         Create database session for this thread, then call into
-        broken_links.scan() using it. The callback for scan tracks progress
-        and reports it to the calling dialog and saves off any failures as
-        they occur where they can be collected at the end of the check.
+        broken_links.scan_concurrent() using it, checking only the links that
+        are due, or every link if /check_all/ was given. The callback tracks
+        progress and reports it to the calling dialog and saves off any
+        failures as they occur where they can be collected at the end of the
+        check.
         """
         def callback(at: int, tot: int, obj: LinkCheck) -> None:
             if obj.successful:
@@ -197,8 +211,11 @@ class LinkCheckThread(QThread):
 
         try:
             session = self.sessionmaker()
-            broken_links.scan(session, callback, only_failures=False,
-                              canceled=self.isInterruptionRequested)
+            max_age = (None if self.check_all
+                       else broken_links.configured_max_age(session))
+            broken_links.scan_concurrent(session, callback, only_failures=False,
+                                         canceled=self.isInterruptionRequested,
+                                         max_age=max_age)
             session.close()
         except Exception as e:  # pylint: disable=broad-except
             self.exception = e
@@ -210,12 +227,13 @@ class LinkCheckProgressDialog(QDialog):
     and compile a list of links that aren't working. This dialog shows progress
     while performing those steps.
     """
-    def __init__(self, parent, sessionmaker) -> None:
+    def __init__(self, parent, sessionmaker, check_all: bool = False) -> None:
         QDialog.__init__(self)
         self.form = Ui_LinkCheckProgressDialog()
         self.form.setupUi(self)
         self._parent = parent
         self.sessionmaker = sessionmaker
+        self.check_all = check_all
 
         self.lct: Optional[LinkCheckThread] = None
         self.blinks: List[LinkCheck] = []
@@ -224,7 +242,7 @@ class LinkCheckProgressDialog(QDialog):
 
     def start(self) -> None:
         "Start a worker thread which coordinates scanning of the links."
-        self.lct = LinkCheckThread(self.sessionmaker)
+        self.lct = LinkCheckThread(self.sessionmaker, self.check_all)
         self.lct.finished.connect(self.join_thread)
         self.lct.progress_update.connect(self.update_progress)
         self.lct.start()
@@ -2,32 +2,44 @@
 main_window.py -- RabbitMark Qt application, application window
 """
 import sys
-from typing import NoReturn, Optional
+from collections import Counter
+from typing import List, NoReturn, Optional
 
 # pylint: disable=no-name-in-module
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QShortcut, QDialog,
-                             QFileDialog, QListWidgetItem)
+                             QFileDialog)
 from PyQt5.QtGui import QDesktopServices, QKeySequence, QCursor
-from PyQt5.QtCore import Qt, QUrl
+from PyQt5.QtCore import Qt, QTimer, QUrl, QItemSelection, QItemSelectionModel
 
-from rabbitmark.definitions import MYVERSION, NOTAGS, SearchMode
+from rabbitmark.definitions import MYVERSION, NOTAGS, MatchMode, SearchMode
 from rabbitmark.librm import bookmark
+from rabbitmark.librm import bookmark_index
 from rabbitmark.librm import config
 from rabbitmark.librm import database
 from rabbitmark.librm import interchange
 from rabbitmark.librm import readwise
+from rabbitmark.librm import result_cache
+from rabbitmark.librm import search
 from rabbitmark.librm import tag as tag_ops
+from rabbitmark.librm.models import Bookmark
 from rabbitmark.librm.wayback_snapshot import request_snapshot
 
 from .bookmark_table import BookmarkTableModel
 from .forms.main import Ui_MainWindow
 from .forms.about import Ui_Dialog as AboutForm
 from .forms.bookmark_details import Ui_Form as BookmarkDetailsWidget
+from . import duplicates_dialog
 from . import import_dialog
 from . import link_check_dialog
+from .search_thread import SearchThread
+from .tag_list import TagListModel, bookmark_counts
 from . import wayback_search_dialog
 from . import utils
 
+#: how long to wait for typing to pause before searching, unless configured
+#: otherwise with the "search_delay_ms" config key
+DEFAULT_SEARCH_DELAY_MS = 150
+
 
 # pylint: disable=too-many-instance-attributes, too-many-public-methods
 class MainWindow(QMainWindow):
@@ -39,13 +51,25 @@ class MainWindow(QMainWindow):
         self.form.setupUi(self)
         self.Session = sessionmaker
         self.session = self.Session()
+        # Tag filtering is interactive here, so keep tag bitsets in memory.
+        # Seeding waits for the first tag search (usually on the search
+        # thread) so as not to delay the window appearing.
+        bookmark_index.enable(self.session, seed=False)
+        # Toggling tags and options back and forth repeats recent searches.
+        result_cache.enable(self.session, int(
+            config.get(self.session, "result_cache_size") or result_cache.DEFAULT_SIZE))
+        self.search = search.RefiningSearch()
 
         sf = self.form
         # File menu
         sf.actionShowPrivate.triggered.connect(self.onTogglePrivate)
         self.showPrivates = False
+        sf.actionSubstringFilter.triggered.connect(self.onToggleSubstringFilter)
+        sf.actionRankByRelevance.triggered.connect(self._updateForSearch)
+        self.matchMode = MatchMode.FullText
         sf.actionExport_CSV.triggered.connect(self.onExportCsv)
         sf.actionImport_CSV.triggered.connect(self.onImportCsv)
+        sf.actionImport_HTML.triggered.connect(self.onImportHtml)
         sf.action_Quit.triggered.connect(self.quit)
 
         # Bookmark menu
@@ -66,6 +90,8 @@ class MainWindow(QMainWindow):
 
         # Tools menu
         sf.actionBrokenLinks.triggered.connect(self.onCheckBrokenLinks)
+        sf.actionCheckAllLinks.triggered.connect(self.onCheckAllLinks)
+        sf.actionFindDuplicates.triggered.connect(self.onFindDuplicates)
         sf.actionChangeReadwiseToken.triggered.connect(self.onChangeReadwiseToken)
         sf.actionChangeReadwiseToken.setVisible(
             config.exists(self.session, "readwise_api_token")
@@ -96,13 +122,18 @@ class MainWindow(QMainWindow):
         self.tableView.setModel(self.tableModel)
         self.sm = self.tableView.selectionModel()
         self.sm.selectionChanged.connect(self.fillEditPane)
-        self.tableView.horizontalHeader().setSortIndicator(0, Qt.AscendingOrder)
+        header = self.tableView.horizontalHeader()
+        header.setSortIndicator(0, Qt.AscendingOrder)
+        header.sectionClicked.connect(self.onSortColumn)
         self.tableView.setColumnWidth(0, 500)
 
         # set up tag list
-        tag_counts = tag_ops.scan_tags_with_counts(self.session, self.showPrivates)
-        self._fillTagList(tag_counts)
-        self.form.tagList.itemSelectionChanged.connect(self.onCheckOptionAvailability)
+        self.tagModel = TagListModel(self)
+        self.form.tagList.setModel(self.tagModel)
+        self.tagSelection = self.form.tagList.selectionModel()
+        self.tagModel.setCounts(
+            tag_ops.scan_tags_with_counts(self.session, self.showPrivates))
+        self.tagSelection.selectionChanged.connect(self.onCheckOptionAvailability)
 
         # set up details form
         self.detailsForm = BookmarkDetailsWidget()
@@ -111,8 +142,21 @@ class MainWindow(QMainWindow):
         self.detailsForm.browseUrlButton.clicked.connect(self.onBrowseForUrl)
 
         # set up re-search triggers and update for the first time
-        self.form.searchBox.textChanged.connect(self._updateForSearch)
-        self.form.tagList.itemSelectionChanged.connect(self._updateForSearch)
+        # Searches triggered by typing or clicking tags run on a worker thread
+        # once input pauses; other updates (after edits, etc.) are immediate.
+        self.searchId = 0
+        self.searchParams: Optional[search.SearchParams] = None
+        self.searchThread = SearchThread(self.Session)
+        self.searchThread.results_ready.connect(self._onSearchResults)
+        self.searchThread.finished.connect(self._onSearchThreadFinished)
+        self.searchThread.start()
+        self.searchTimer = QTimer(self)
+        self.searchTimer.setSingleShot(True)
+        self.searchTimer.setInterval(int(
+            config.get(self.session, "search_delay_ms") or DEFAULT_SEARCH_DELAY_MS))
+        self.searchTimer.timeout.connect(self._submitSearch)
+        self.form.searchBox.textChanged.connect(self.searchTimer.start)
+        self.tagSelection.selectionChanged.connect(self.searchTimer.start)
         self._updateForSearch()
 
 
@@ -120,54 +164,49 @@ class MainWindow(QMainWindow):
     def _currentSearchMode(self) -> SearchMode:
         return SearchMode(self.form.tagsModeDropdown.currentIndex())
 
-    @staticmethod
-    def _makeTagItem(tag_name: str, count: int) -> QListWidgetItem:
-        """Create a QListWidgetItem with display text
-        'name (count)' and raw name in UserRole."""
-        item = QListWidgetItem(f"{tag_name} ({count})")
-        item.setData(Qt.UserRole, tag_name)
-        return item
+    def _currentMark(self) -> Optional[Bookmark]:
+        """
+        Return the currently selected bookmark, as an object in our session
+        (the table may hold bookmarks loaded by the search thread), or None
+        if no bookmark is selected.
+        """
+        mark = self.tableModel.getObj(self.tableView.currentIndex())
+        return None if mark is None else self.session.get(Bookmark, mark.id)
 
-    @staticmethod
-    def _tagName(item: QListWidgetItem) -> str:
-        "Return the raw tag name stored in a tag list item."
-        return item.data(Qt.UserRole)
-
-    def _fillTagList(self, tag_counts: dict,
-                     selected_names: Optional[set] = None) -> None:
-        """Populate the tag list widget from tag_counts, ensuring NOTAGS
-        is always the first item regardless of sort order."""
-        self.form.tagList.clear()
-        notags_count = tag_counts.get(NOTAGS)
-        for tag_name, count in tag_counts.items():
-            if tag_name == NOTAGS:
-                continue
-            item = self._makeTagItem(tag_name, count)
-            self.form.tagList.addItem(item)
-            if selected_names and tag_name in selected_names:
-                item.setSelected(True)
-        self.form.tagList.sortItems()
-        if notags_count is not None:
-            item = self._makeTagItem(NOTAGS, notags_count)
-            self.form.tagList.insertItem(0, item)
-            if selected_names and NOTAGS in selected_names:
-                item.setSelected(True)
-
-    def _findTagItem(self, tag_name: str) -> Optional[QListWidgetItem]:
-        "Find a tag list item by its raw tag name (UserRole data)."
-        for i in range(self.form.tagList.count()):
-            item = self.form.tagList.item(i)
-            if item.data(Qt.UserRole) == tag_name:
-                return item
-        return None
+    def _searchParams(self) -> search.SearchParams:
+        "Return the search described by the filter box and tag selection."
+        selectedTags = tuple(self._selectedTags())
+        return search.SearchParams(self.form.searchBox.text(), selectedTags,
+                                   self.showPrivates, self._currentSearchMode(),
+                                   self.matchMode)
+
+    def _searchOrder(self, params: search.SearchParams) -> search.PageOrder:
+        """
+        Return the order to show the results of /params/ in: by relevance if
+        ranking is turned on and there are words to rank by, or else by the
+        table's sort column.
+        """
+        if (self.form.actionRankByRelevance.isChecked()
+                and search.can_rank(self.session, params)):
+            return search.PageOrder(search.RANK)
+        return self.tableModel.columnOrder()
+
+    def _selectedTags(self) -> List[str]:
+        "Return the names of the tags selected in the tag list, top to bottom."
+        rows = sorted(self.tagSelection.selectedRows(), key=lambda i: i.row())
+        return [self.tagModel.nameAt(i) for i in rows]
+
+    def _markCounts(self, mark: Bookmark) -> Counter:
+        "Return what /mark/ contributes to the counts in the tag list."
+        return bookmark_counts((t.text for t in mark.tags), mark.private,
+                               self.showPrivates)
 
     def _getSingleTagName(self) -> Optional[str]:
         """
         Return the name of the single tag currently selected, or display an error
         message and return None if there is not exactly one tag selected.
         """
-        tags = [self._tagName(i)
-                for i in self.form.tagList.selectedItems()]
+        tags = self._selectedTags()
 
         if len(tags) < 1:
             utils.errorBox("Please select a tag.", "No tag selected")
@@ -190,9 +229,7 @@ class MainWindow(QMainWindow):
     def _newBookmark(self, url) -> None:
         "Common portion of creating a new bookmark."
         # Create the new item with any tags that are selected.
-        tags = [self._tagName(i)
-                for i in self.form.tagList.selectedItems()
-                if self._tagName(i) != NOTAGS]
+        tags = [i for i in self._selectedTags() if i != NOTAGS]
 
         # Full-text filter is automatically cleared on add -- otherwise, the new
         # item won't be visible!
@@ -200,13 +237,15 @@ class MainWindow(QMainWindow):
         self._updateForSearch()
         # If in AND mode, turn off "no tags" mode, or it similarly won't be visible.
         if self._currentSearchMode() == SearchMode.And:
-            self.form.tagList.item(0).setSelected(False)
+            self.tagSelection.select(self.tagModel.indexFromName(NOTAGS),
+                                     QItemSelectionModel.Deselect)
 
         newBookmark = bookmark.add_bookmark(self.session, url, tags)
         self.session.commit()  # pylint: disable=no-member
 
-        self._resetTagList()
+        self.tagModel.adjustCounts(self._markCounts(newBookmark))
         self._updateForSearch()
+        self.tableModel.pin(newBookmark)
         index = self.tableModel.indexFromPk(newBookmark.id)
         if index is not None:
             self.tableView.setCurrentIndex(index)
@@ -218,8 +257,9 @@ class MainWindow(QMainWindow):
         Select the given /item/ if it still exists in the view, or the first
         item in the view if it doesn't or /item/ is None.
 
-        This method should be called after updating the table view using a
-        resetModel() command, as that causes the loss of the current selection.
+        This method should be called after updating the table view, as the
+        current selection is lost if the model was reset or the selected
+        bookmark's row was moved.
 
         Arguments:
             item (default None) - if not None, attempt to select the item by
@@ -245,19 +285,15 @@ class MainWindow(QMainWindow):
 
     def _resetTagList(self) -> None:
         """
-        Rebuild the tag list widget from the database.
-        Signals are blocked during rebuild; callers must handle _updateForSearch
-        explicitly if needed.
+        Update the tag list to match the tag counts in the database. Only the
+        tags that appeared, disappeared, or changed count are updated, and
+        the selection is kept (less any tags that disappeared).
+        Selection signals are blocked during the update; callers must handle
+        _updateForSearch explicitly if needed.
         """
-        # Save selected tag names.
-        selectedNames = {self._tagName(i)
-                         for i in self.form.tagList.selectedItems()}
-
         tag_counts = tag_ops.scan_tags_with_counts(self.session, self.showPrivates)
-
-        # Rebuild list with signals blocked to avoid spurious updates.
-        with utils.signalsBlocked(self.form.tagList):
-            self._fillTagList(tag_counts, selectedNames)
+        with utils.signalsBlocked(self.tagSelection):
+            self.tagModel.setCounts(tag_counts)
 
     def _updateTitleCount(self, count) -> None:
         """
@@ -268,40 +304,77 @@ class MainWindow(QMainWindow):
 
     def _updateForSearch(self, *_args, fill_edit_pane=True) -> None:
         """
-        Update the bookmarks table to match the filter and tag selection.
+        Update the bookmarks table to match the filter and tag selection
+        right away, abandoning any search waiting to run on the search thread.
 
         We determine and pass the text in the filter box and a list of the tags
         selected, and we restore the selection to the currently selected
         bookmark after the view is refreshed if that bookmark is still in the
         new view.
         """
-        selectedTags = [self._tagName(i)
-                        for i in self.form.tagList.selectedItems()]
+        self.searchTimer.stop()
+        self.searchThread.cancel()
+        self.searchId += 1
+        params = self._searchParams()
+        page = self.search.find_page(self.session, params, self._searchOrder(params))
+        self._showSearchResults(params, page, fill_edit_pane)
+
+    def _submitSearch(self) -> None:
+        """
+        Start updating the bookmarks table to match the filter and tag
+        selection on the search thread. Called once typing or clicking pauses.
+        """
+        self.searchId += 1
+        self.searchParams = self._searchParams()
+        self.searchThread.submit(self.searchId, self.searchParams,
+                                 self._searchOrder(self.searchParams))
+
+    def _onSearchResults(self, searchId: int, page: search.Page) -> None:
+        "Show the results of a search from the search thread, unless outdated."
+        if searchId == self.searchId:
+            self._showSearchResults(self.searchParams, page)
+
+    def _onSearchThreadFinished(self) -> None:
+        """
+        Raise any exception that stopped the search thread. (Otherwise it only
+        finishes when we're quitting.)
+        """
+        if self.searchThread.exception:
+            raise self.searchThread.exception
+
+    def _showSearchResults(self, params: search.SearchParams, page: search.Page,
+                           fill_edit_pane=True) -> None:
+        """
+        Fill the bookmarks table with the results of the search /params/,
+        keeping the sort and selection. If /page/ is only the first page of
+        results, the table fetches the rest as needed.
+        """
         mark = self.tableModel.getObj(self.tableView.currentIndex())
         oldId = None if mark is None else mark.id
-        searchMode = self._currentSearchMode()
-
-        nameText = "%" + self.form.searchBox.text() + "%"
-        marks = bookmark.find_bookmarks(self.session, nameText, selectedTags,
-                                        self.showPrivates, searchMode)
 
         header = self.tableView.horizontalHeader()
         saved_col = header.sortIndicatorSection()
         saved_order = header.sortIndicatorOrder()
 
-        self.tableModel.updateContents(marks)
-        self.tableModel.sort(saved_col, saved_order)
+        if page.order is None:
+            # (sorted by the model, in the order it was last sorted by)
+            self.tableModel.updateContents(page.marks)
+        else:
+            self.tableModel.updatePaged(self.session, params, page)
+            if not self.tableModel.isRanked():
+                self.tableModel.sort(saved_col, saved_order)
         header.setSortIndicator(saved_col, saved_order)
+        header.setSortIndicatorShown(not self.tableModel.isRanked())
 
         self._reselectItem(oldId, fill_edit_pane=fill_edit_pane)
-        self._updateTitleCount(self.tableModel.rowCount(self))
+        self._updateTitleCount(self.tableModel.matchCount())
 
 
     ### Evil in-betweens. Called from events and from other methods. ###
     def fillEditPane(self) -> None:
         "Fill the editor/details pane with data from the currently selected bookmark."
         sfdw = self.detailsForm
-        mark = self.tableModel.getObj(self.tableView.currentIndex())
+        mark = self._currentMark()
         if not self.sm.selectedRows():
             # nothing selected; hide editor pane
             self.form.splitter.widget(1).setVisible(False)
@@ -338,32 +411,35 @@ class MainWindow(QMainWindow):
         sfdw = self.detailsForm
         if old in (sfdw.nameBox, sfdw.urlBox, sfdw.descriptionBox, sfdw.tagsBox,
                    sfdw.privateCheck, sfdw.linkcheckCheck):
-            mark = self.tableModel.getObj(self.tableView.currentIndex())
+            mark = self._currentMark()
             QApplication.processEvents()
             if mark is None:
                 return # nothing is selected
+            before = self._markCounts(mark)
             if bookmark.save_if_edited(self.session, mark, utils.mark_dictionary(sfdw)):
                 self.session.commit()  # pylint: disable=no-member
-                self._resetTagList()
+                deltas = self._markCounts(mark)
+                deltas.subtract(before)
+                with utils.signalsBlocked(self.tagSelection):
+                    self.tagModel.adjustCounts(deltas)
                 self._updateForSearch(fill_edit_pane=False)
 
     def tagsSelect(self, what) -> None:
         "Select tags en masse using the convenience buttons at the bottom."
-        # Block signals so that we only have to call itemSelectionChanged
-        # once instead of numTags times -- this *greatly* improves performance.
-        oldSigs = self.form.tagList.blockSignals(True)
-        for i in range(self.form.tagList.count()):
-            if what == 'none':
-                self.form.tagList.item(i).setSelected(False)
-            elif what == 'all':
-                self.form.tagList.item(i).setSelected(True)
-            elif what == 'invert':
-                currentStatus = self.form.tagList.item(i).isSelected()
-                self.form.tagList.item(i).setSelected(not currentStatus)
-            else:
-                assert False, "Invalid argument to tagsSelect!"
-        self.form.tagList.blockSignals(oldSigs)
-        self.form.tagList.itemSelectionChanged.emit()
+        # Each of these changes the selection in one step, so selectionChanged
+        # is emitted once rather than once per tag.
+        if what == 'none':
+            self.tagSelection.clearSelection()
+        elif what == 'all':
+            self.form.tagList.selectAll()
+        elif what == 'invert':
+            rows = self.tagModel.rowCount()
+            if rows:
+                everything = QItemSelection(self.tagModel.index(0),
+                                            self.tagModel.index(rows - 1))
+                self.tagSelection.select(everything, QItemSelectionModel.Toggle)
+        else:
+            assert False, "Invalid argument to tagsSelect!"
 
 
     ### Event handlers ###
@@ -389,13 +465,26 @@ class MainWindow(QMainWindow):
         )[0]
         if not fname:
             return
-        dlg = import_dialog.ImportDialog(self, self.session, fname)
+        dlg = import_dialog.ImportDialog(self, self.Session, fname)
         dlg.exec_()
 
         # Since we could have edited things within the dialog, we need to resync.
         self._updateForSearch()
         self._resetTagList()
 
+    def onImportHtml(self) -> None:
+        "Import bookmarks exported from a web browser."
+        fname = QFileDialog.getOpenFileName(
+            caption="Import Browser Bookmarks",
+            filter="HTML files (*.html *.htm);;All files (*)"
+        )[0]
+        if not fname:
+            return
+        import_dialog.importInBackground(self, self.Session,
+                                         interchange.import_bookmarks_from_html, fname)
+        self._updateForSearch()
+        self._resetTagList()
+
     # Bookmarks
     def onAddBookmark(self) -> None:
         "Create a new bookmark without a given URL."
@@ -410,6 +499,13 @@ class MainWindow(QMainWindow):
                              "http:// to beginning. You may wish to check "
                              "the URL.", "URL possibly invalid")
             pastedUrl = 'http://' + pastedUrl
+        similar = bookmark.find_near_duplicates(self.session, pastedUrl)
+        if similar and not utils.questionBox(
+                f"You already have a bookmark of this URL, or one very like it: "
+                f"'{similar[0].name}' ({similar[0].url}). "
+                f"Do you want to add another one anyway?",
+                "Possible duplicate bookmark"):
+            return
         self._newBookmark(pastedUrl)
 
     def onBrowseForUrl(self) -> None:
@@ -426,21 +522,28 @@ class MainWindow(QMainWindow):
                            "No bookmark selected")
             return
         curIndex = self.tableView.currentIndex()
-        nextRow = self.tableModel.nextAfterDelete(curIndex)
-
-        mark = self.tableModel.getObj(curIndex)
+        # Remember the next bookmark rather than its index, which the
+        # deletion will shift.
+        nextIndex = self.tableModel.nextAfterDelete(curIndex)
+        nextPk = None if nextIndex is None else self.tableModel.getObj(nextIndex).id
+
+        mark = self.session.get(Bookmark, self.tableModel.getObj(curIndex).id)
+        deltas = Counter()
+        deltas.subtract(self._markCounts(mark))
         bookmark.delete_bookmark(self.session, mark)
         self.session.commit()  # pylint: disable=no-member
 
         self.tableModel.updateAfterDelete(curIndex)
-        self._resetTagList()
-        if nextRow is not None:
-            self.tableView.setCurrentIndex(nextRow)
+        self._updateTitleCount(self.tableModel.matchCount())
+        with utils.signalsBlocked(self.tagSelection):
+            self.tagModel.adjustCounts(deltas)
+        if nextPk is not None:
+            self.tableView.setCurrentIndex(self.tableModel.indexFromPk(nextPk))
         self.fillEditPane()
 
     def onWayBackMachine(self) -> None:
         "Find a snapshot of the item's URL in the WayBackMachine."
-        mark = self.tableModel.getObj(self.tableView.currentIndex())
+        mark = self._currentMark()
         archiveUrl = wayback_search_dialog.init_wayback_search(self, mark.url)
         if archiveUrl is not None:
             self.detailsForm.urlBox.setText(archiveUrl)
@@ -448,7 +551,7 @@ class MainWindow(QMainWindow):
 
     def onSnapshotSite(self) -> None:
         "Ask the WayBackMachine to take a snapshot of the selected site now."
-        mark = self.tableModel.getObj(self.tableView.currentIndex())
+        mark = self._currentMark()
         QApplication.setOverrideCursor(QCursor(Qt.WaitCursor))
         try:
             request_snapshot(mark.url)
@@ -515,7 +618,7 @@ class MainWindow(QMainWindow):
         if not accepted:
             return
 
-        mark = self.tableModel.getObj(self.tableView.currentIndex())
+        mark = self._currentMark()
         tags = [t.strip() for t in reader_tags.split(",") if t.strip()]
 
         QApplication.setOverrideCursor(QCursor(Qt.WaitCursor))
@@ -581,9 +684,9 @@ class MainWindow(QMainWindow):
                 self._updateForSearch()
                 self.fillEditPane()
             # select the tag we merged into
-            merged_item = self._findTagItem(new)
-            if merged_item:
-                merged_item.setSelected(True)
+            merged_index = self.tagModel.indexFromName(new)
+            if merged_index is not None:
+                self.tagSelection.select(merged_index, QItemSelectionModel.Select)
 
     def onRenameTag(self) -> None:
         "Rename the selected tag."
@@ -603,9 +706,9 @@ class MainWindow(QMainWindow):
                                "Cannot rename tag")
 
             # select the newly renamed tag
-            renamed_item = self._findTagItem(new)
-            if renamed_item:
-                renamed_item.setSelected(True)
+            renamed_index = self.tagModel.indexFromName(new)
+            if renamed_index is not None:
+                self.tagSelection.select(renamed_index, QItemSelectionModel.Select)
 
     # Entire view
     def onFocusFind(self) -> None:
@@ -614,7 +717,19 @@ class MainWindow(QMainWindow):
 
     def onCheckBrokenLinks(self) -> None:
         "Scan the database for broken links and help the user correct them."
-        obtain_dlg = link_check_dialog.LinkCheckProgressDialog(self, self.Session)
+        self._checkLinks(check_all=False)
+
+    def onCheckAllLinks(self) -> None:
+        "Like onCheckBrokenLinks(), but check every link, even those checked lately."
+        self._checkLinks(check_all=True)
+
+    def _checkLinks(self, check_all: bool) -> None:
+        """
+        Check the links that are due, or every link if /check_all/, and help
+        the user correct the broken ones.
+        """
+        obtain_dlg = link_check_dialog.LinkCheckProgressDialog(self, self.Session,
+                                                               check_all)
         obtain_dlg.start()
         obtain_dlg.exec_()
         blinks = obtain_dlg.blinks
@@ -627,6 +742,16 @@ class MainWindow(QMainWindow):
             self._updateForSearch()
             self._resetTagList()
 
+    def onFindDuplicates(self) -> None:
+        "Look for bookmarks of the same page and help the user merge them."
+        dlg = duplicates_dialog.DuplicatesDialog(self, self.Session, self.session)
+        dlg.exec_()
+
+        if dlg.merged:
+            # Bookmarks and tags may have been deleted, so we need to resync.
+            self._updateForSearch()
+            self._resetTagList()
+
     def onTogglePrivate(self) -> None:
         """
         Choose whether to hide or show private bookmarks and tags. A tag is
@@ -636,6 +761,25 @@ class MainWindow(QMainWindow):
         self._updateForSearch()
         self._resetTagList()
 
+    def onSortColumn(self, _section) -> None:
+        """
+        Show the sort indicator again when the user sorts results that were
+        ranked by relevance (and so sorted by no column).
+        """
+        self.tableView.horizontalHeader().setSortIndicatorShown(True)
+
+    def onToggleSubstringFilter(self) -> None:
+        """
+        Choose whether the filter box matches the beginnings of words using the
+        full-text index or arbitrary substrings (slower, but finds fragments in the
+        middle of words and URLs).
+        """
+        if self.form.actionSubstringFilter.isChecked():
+            self.matchMode = MatchMode.Substring
+        else:
+            self.matchMode = MatchMode.FullText
+        self._updateForSearch()
+
     @staticmethod
     def onHelpContents() -> None:
         "Display the manual."
@@ -679,8 +823,8 @@ class MainWindow(QMainWindow):
         )
 
         bookmarkSelected = bool(self.tableModel.getObj(self.tableView.currentIndex()))
-        tagSelList = self.form.tagList.selectedItems()
-        tagSelected = bool(tagSelList) and not self._tagName(tagSelList[0]) == NOTAGS
+        tagSelList = self._selectedTags()
+        tagSelected = bool(tagSelList) and not tagSelList[0] == NOTAGS
         multipleTagsSelected = len(tagSelList) > 1
 
         for action in bookmarkActions:
@@ -699,6 +843,7 @@ class MainWindow(QMainWindow):
         # one of the editable boxes is required for old
         self.maybeSaveBookmark(old=self.detailsForm.nameBox,
                                new=self.detailsForm.nameBox)
+        self.searchThread.stop()
         # Double-check we don't have any uncommitted changes.
         self.session.commit()
         self.session.close()
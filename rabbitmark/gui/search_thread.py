@@ -0,0 +1,135 @@
+"""
+search_thread.py -- run bookmark searches off the GUI thread
+"""
+
+import threading
+from typing import Optional, Tuple
+
+# pylint: disable=no-name-in-module
+from PyQt5.QtCore import pyqtSignal, QThread
+
+from sqlalchemy.exc import OperationalError
+
+from rabbitmark.librm import search
+
+Request = Tuple[int, search.SearchParams, search.PageOrder]
+
+
+class SearchThread(QThread):
+    """
+    Worker thread that runs searches as the user types, with its own
+    database session, so a slow query doesn't freeze the window.
+
+    Submit searches with submit(); only the most recent one matters, so any
+    search still waiting is replaced and any search already running is
+    interrupted. Results are delivered by the results_ready signal, as a
+    search.Page, along with the ID they were submitted under, so the receiver
+    can ignore results for searches that have been superseded in the meantime.
+
+    The bookmarks delivered belong to no session (they're detached once the
+    next unrelated search starts), so their fields and tags can be read but
+    nothing else; to modify one, look it up by ID in your own session.
+    """
+    results_ready = pyqtSignal(int, object)
+
+    def __init__(self, sessionmaker) -> None:
+        super().__init__()
+        self.sessionmaker = sessionmaker
+        self.exception: Optional[Exception] = None
+        self._cond = threading.Condition()
+        self._pending: Optional[Request] = None
+        self._running_conn = None  # raw DBAPI connection of a running search
+        self._stopping = False
+
+    def submit(self, search_id: int, params: search.SearchParams,
+               order: search.PageOrder) -> None:
+        """
+        Search for /params/ as soon as possible, abandoning any earlier search.
+        If there are too many results to load at once, the first page of them
+        in /order/ is delivered.
+        """
+        with self._cond:
+            self._pending = (search_id, params, order)
+            self._interrupt()
+            self._cond.notify()
+
+    def cancel(self) -> None:
+        "Abandon any waiting or running search."
+        with self._cond:
+            self._pending = None
+            self._interrupt()
+
+    def stop(self) -> None:
+        "Abandon any search and wait for the thread to exit."
+        with self._cond:
+            self._stopping = True
+            self._pending = None
+            self._interrupt()
+            self._cond.notify()
+        self.wait()
+
+    def _interrupt(self) -> None:
+        # Lock must be held. Make SQLite abort the running query at once.
+        if self._running_conn is not None:
+            self._running_conn.interrupt()
+
+    def _next_request(self) -> Optional[Request]:
+        with self._cond:
+            while self._pending is None and not self._stopping:
+                self._cond.wait()
+            if self._stopping:
+                return None
+            request, self._pending = self._pending, None
+            return request
+
+    def run(self) -> None:
+        """
+        Create database session for this thread, then run searches as they
+        are submitted until stop() is called. As in the main window,
+        searches narrowing the previous one are refined from its results.
+        """
+        # Results are handed to the GUI after each search's transaction ends,
+        # so they must not be expired then.
+        session = self.sessionmaker(expire_on_commit=False)
+        searcher = search.RefiningSearch()
+        try:
+            while (request := self._next_request()) is not None:
+                search_id, params, order = request
+                if not searcher.narrows(session, params):
+                    # Start from an empty identity map, so bookmarks are
+                    # loaded fresh and those handed out earlier aren't
+                    # touched again by this thread.
+                    session.close()
+
+                with self._cond:
+                    if self._pending is not None:
+                        continue  # already superseded
+                    self._running_conn = (
+                        session.connection().connection.dbapi_connection)
+                page = None
+                try:
+                    page = searcher.find_page(session, params, order)
+                except OperationalError as e:
+                    # Interrupted because this search was superseded or
+                    # canceled; the next request (if any) is waiting.
+                    if 'interrupted' not in str(e):
+                        raise
+                    searcher.invalidate()
+                finally:
+                    with self._cond:
+                        self._running_conn = None
+                    # Don't hold a read transaction open while idle; that
+                    # would stop the main window from committing. Bookmarks
+                    # already handed out must not be expired, so on failure
+                    # close the session rather than rolling back.
+                    if page is None:
+                        session.close()
+                    else:
+                        session.commit()
+
+                if page is not None:
+                    self.results_ready.emit(search_id, page)
+        except Exception as e:  # pylint: disable=broad-except
+            self.exception = e
+        finally:
+            session.close()
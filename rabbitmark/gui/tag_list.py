@@ -0,0 +1,185 @@
+"""
+tag_list - model for the list of tags and their bookmark counts
+"""
+
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+# pylint: disable=no-name-in-module
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+
+from rabbitmark.definitions import NOTAGS
+
+
+def _sort_key(name: str) -> Tuple[bool, str]:
+    "Sort the NOTAGS placeholder first, then the tags by name."
+    return (name != NOTAGS, name)
+
+
+def _runs(rows: Iterable[int]) -> Iterator[Tuple[int, int]]:
+    """
+    Group ascending row numbers into (first, last) runs of consecutive rows.
+
+    >>> list(_runs([1, 2, 3, 7, 9, 10]))
+    [(1, 3), (7, 7), (9, 10)]
+    """
+    first = last = None
+    for row in rows:
+        if last is not None and row == last + 1:
+            last = row
+            continue
+        if first is not None:
+            yield first, last
+        first = last = row
+    if first is not None:
+        yield first, last
+
+
+def bookmark_counts(tags: Iterable[str], private: bool, show_private: bool) -> Counter:
+    """
+    Return what a bookmark with /tags/ adds to the counts in the tag list:
+    one for each of its tags, or for NOTAGS if it has none -- or nothing, if
+    it's /private/ and private bookmarks aren't being shown.
+    """
+    if private and not show_private:
+        return Counter()
+    return Counter(tags) or Counter({NOTAGS: 1})
+
+
+class TagListModel(QAbstractListModel):
+    """
+    Handles the display of the list of tags, each with the number of
+    bookmarks that have it, in alphabetical order after the NOTAGS
+    placeholder. Tags with no (visible) bookmarks aren't listed.
+
+    The counts can be replaced wholesale with setCounts() or adjusted with
+    adjustCounts(). Either way, only the rows whose tags appear, disappear,
+    or change count are reported to the view, so the selection is kept and
+    a small change to a long list of tags is cheap.
+    """
+    #: above this many tags appearing at once, find their rows in one pass
+    #: over the list rather than searching for each one
+    BULK_INSERT = 64
+
+    def __init__(self, parent) -> None:
+        QAbstractListModel.__init__(self)
+        self._parent = parent
+        self._names: List[str] = []
+        self._counts: Dict[str, int] = {}
+        self._rows: Dict[str, int] = {}  # tag name -> row in self._names
+
+    ### Standard reimplemented methods ###
+    def rowCount(self, _parent: Any = None) -> int:
+        return len(self._names)
+
+    def data(self, index, role):
+        "Return 'name (count)' for display, or the bare tag name for UserRole."
+        if not index.isValid():
+            return None
+        name = self._names[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{name} ({self._counts[name]})"
+        elif role == Qt.UserRole:
+            return name
+        return None
+
+
+    ### Custom methods ###
+    def nameAt(self, index) -> str:
+        "Return the tag name at model index /index/."
+        return self._names[index.row()]
+
+    def count(self, name: str) -> int:
+        "Return the number of bookmarks with tag /name/ (0 if it isn't listed)."
+        return self._counts.get(name, 0)
+
+    def indexFromName(self, name: str) -> Optional[QModelIndex]:
+        "Return the model index of tag /name/, or None if it isn't listed."
+        row = self._rows.get(name)
+        return None if row is None else self.index(row)
+
+    def setCounts(self, counts: Mapping[str, int]) -> None:
+        "Show the tags in /counts/, a mapping from tag names to bookmark counts."
+        changes = {name: counts.get(name, 0)
+                   for name in self._counts.keys() | counts.keys()
+                   if counts.get(name, 0) != self._counts.get(name, 0)
+                   or (name in counts) != (name in self._rows)}
+        self._apply(changes)
+
+    def adjustCounts(self, deltas: Mapping[str, int]) -> None:
+        """
+        Add /deltas/, a mapping from tag names to the number of bookmarks
+        gained (or lost, if negative), to the counts shown.
+        """
+        self._apply({name: self._counts.get(name, 0) + delta
+                     for name, delta in deltas.items() if delta})
+
+    def _apply(self, changes: Mapping[str, int]) -> None:
+        "Set the count of each tag in /changes/, adding and removing rows as needed."
+        def listed(name, count):
+            return count > 0 or name == NOTAGS
+
+        removed = [name for name, count in changes.items()
+                   if name in self._rows and not listed(name, count)]
+        added = [name for name, count in changes.items()
+                 if name not in self._rows and listed(name, count)]
+        changed = [name for name, count in changes.items()
+                   if name in self._rows and listed(name, count)]
+        for name, count in changes.items():
+            if listed(name, count):
+                self._counts[name] = count
+            else:
+                self._counts.pop(name, None)
+
+        first_moved = len(self._names)
+        root = QModelIndex()
+        # Bottom up, so rows above each run keep their numbers.
+        removed_rows = sorted(self._rows.pop(name) for name in removed)
+        for first, last in reversed(list(_runs(removed_rows))):
+            self.beginRemoveRows(root, first, last)
+            del self._names[first:last + 1]
+            self.endRemoveRows()
+            first_moved = first
+
+        if len(added) > self.BULK_INSERT:
+            first_moved = min(first_moved, self._insertBulk(added))
+        else:
+            for name in sorted(added, key=_sort_key):
+                row = bisect_left(self._names, _sort_key(name), key=_sort_key)
+                self.beginInsertRows(root, row, row)
+                self._names.insert(row, name)
+                self.endInsertRows()
+                first_moved = min(first_moved, row)
+        self._reindex(first_moved)
+
+        for first, last in _runs(sorted(self._rows[name] for name in changed)):
+            self.dataChanged.emit(self.index(first), self.index(last))
+
+    def _insertBulk(self, added: List[str]) -> int:
+        "Insert the tags /added/ in runs; return the first row inserted."
+        final = sorted(self._names + added, key=_sort_key)
+        new = set(added)
+        root = QModelIndex()
+        first_inserted = len(final)
+        # The names already listed are in the same order in /final/, so
+        # walking it lines up their rows with self._names as runs go in.
+        row = 0
+        while row < len(final):
+            if final[row] not in new:
+                row += 1
+                continue
+            end = row
+            while end < len(final) and final[end] in new:
+                end += 1
+            self.beginInsertRows(root, row, end - 1)
+            self._names[row:row] = final[row:end]
+            self.endInsertRows()
+            first_inserted = min(first_inserted, row)
+            row = end
+        return first_inserted
+
+    def _reindex(self, start: int = 0) -> None:
+        "Update the rows of the tag names at row /start/ and below."
+        for row in range(start, len(self._names)):
+            self._rows[self._names[row]] = row
@@ -0,0 +1,377 @@
+"""
+backup.py - compact binary snapshots of the whole library, for backup and restore
+
+A CSV export (see interchange.py) is meant for other programs to read: it
+leaves out the private and skip-link-check flags, escapes newlines by hand,
+and can only be brought back by importing it one row at a time. A snapshot
+instead holds exactly what's in the bookmarks, tags, and mark_tag_assoc
+tables, IDs and all, and restoring one replaces the library with it.
+
+A snapshot file is laid out as:
+
+    header      MAGIC, FORMAT_VERSION
+    blocks      one or more per table, each holding up to BLOCK_ROWS rows
+    index       the kind, offset, and number of rows of each block
+    footer      the offset of the index, the number of blocks, MAGIC
+
+Each block stores its rows column by column (see SCHEMA): integers as
+64-bit values, flags as one byte each, and strings as one UTF-8 run plus
+their lengths. The columns are compressed together with zlib. The writer
+streams rows from the database a block at a time, so memory use doesn't grow
+with the size of the library; the index is written last, so a snapshot cut
+short is recognized as such before restoring it touches the database.
+
+Restoring loads the rows with one executemany() per block and the triggers
+dropped, then rebuilds the full-text indexes and tag counts the triggers
+would have maintained, all in a single transaction.
+"""
+
+from array import array
+from dataclasses import dataclass
+from itertools import accumulate, islice
+import os
+import struct
+import sys
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+import zlib
+
+from . import fulltext
+from . import tag_counts
+
+MAGIC = b"RMSNAP\r\n"
+FORMAT_VERSION = 1
+
+#: rows written to a block, at most
+BLOCK_ROWS = 16384
+
+#: zlib level blocks are compressed with: cheap, and nearly as small as higher
+#: levels on data like this
+COMPRESSION_LEVEL = 1
+
+TAGS = b'TAGS'
+BOOKMARKS = b'MARK'
+ASSIGNMENTS = b'ASSC'
+
+#: the columns of each kind of block, one character each: 'i' for integers,
+#: 's' for strings, and 'f' for small flags
+SCHEMA: Dict[bytes, str] = {
+    TAGS: 'is',              # id, text
+    BOOKMARKS: 'issssf',     # id, name, url, url_key, description, flags
+    ASSIGNMENTS: 'ii',       # mark_id, tag_id
+}
+
+#: the SQL that reads each kind of block's rows out of the database, and that
+#: writes them back
+_READ = {
+    TAGS: "SELECT id, coalesce(text, '') FROM tags ORDER BY id",
+    BOOKMARKS: "SELECT id, name, url, coalesce(url_key, ''), description, "
+               "coalesce(private, 0) | (coalesce(skip_linkcheck, 0) << 1) "
+               "| ((url_key IS NULL) << 2) "
+               "FROM bookmarks ORDER BY id",
+    ASSIGNMENTS: "SELECT mark_id, tag_id FROM mark_tag_assoc ORDER BY mark_id, tag_id",
+}
+_WRITE = {
+    TAGS: "INSERT INTO tags (id, text) VALUES (?, ?)",
+    BOOKMARKS: "INSERT INTO bookmarks "
+               "(id, name, url, url_key, description, private, skip_linkcheck) "
+               "VALUES (?, ?, ?, ?, ?, ?, ?)",
+    ASSIGNMENTS: "INSERT INTO mark_tag_assoc (mark_id, tag_id) VALUES (?, ?)",
+}
+
+#: bits of a bookmark's flags: whether it's private, whether it skips link
+#: checks, and whether its url_key is NULL (stored as '')
+_PRIVATE = 1
+_SKIP_LINKCHECK = 2
+_NO_URL_KEY = 4
+
+#: the tables a snapshot replaces, in the order rows are deleted from them
+_TABLES = ('mark_tag_assoc', 'bookmarks', 'tags')
+
+_HEADER = struct.Struct('<8sH')
+_BLOCK = struct.Struct('<4sIQ')         # kind, rows, length of compressed data
+_INDEX_ENTRY = struct.Struct('<4sQI')   # kind, offset, rows
+_FOOTER = struct.Struct('<QI8s')        # offset of index, blocks, MAGIC
+_LENGTH = struct.Struct('<Q')
+
+
+class SnapshotError(Exception):
+    "A file isn't a snapshot this version of RabbitMark can read."
+
+
+@dataclass(frozen=True)
+class BlockInfo:
+    "Where a block is in a snapshot file, and what's in it."
+    kind: bytes
+    offset: int
+    rows: int
+
+
+### Columns ###
+def _encode_ints(values: Sequence[int]) -> bytes:
+    ints = array('q', values)
+    if sys.byteorder == 'big':
+        ints.byteswap()
+    return ints.tobytes()
+
+
+def _decode_ints(data: memoryview, rows: int) -> Tuple[List[int], int]:
+    ints = array('q')
+    ints.frombytes(data[:8 * rows])
+    if sys.byteorder == 'big':
+        ints.byteswap()
+    return ints.tolist(), 8 * rows
+
+
+def _encode_strings(values: Sequence[str]) -> bytes:
+    # Lengths are counted in characters, so the whole run can be decoded at
+    # once and then sliced up.
+    lengths = array('I', map(len, values))
+    if sys.byteorder == 'big':
+        lengths.byteswap()
+    text = ''.join(values).encode('utf-8', 'surrogatepass')
+    return lengths.tobytes() + _LENGTH.pack(len(text)) + text
+
+
+def _decode_strings(data: memoryview, rows: int) -> Tuple[List[str], int]:
+    lengths = array('I')
+    lengths.frombytes(data[:4 * rows])
+    if sys.byteorder == 'big':
+        lengths.byteswap()
+    pos = 4 * rows
+    (size,) = _LENGTH.unpack_from(data, pos)
+    pos += _LENGTH.size
+    text = str(data[pos:pos + size], 'utf-8', 'surrogatepass')
+    ends = list(accumulate(lengths))
+    return [text[start:end] for start, end in zip([0] + ends, ends)], pos + size
+
+
+def _encode_flags(values: Sequence[int]) -> bytes:
+    return bytes(values)
+
+
+def _decode_flags(data: memoryview, rows: int) -> Tuple[List[int], int]:
+    return list(data[:rows]), rows
+
+
+_ENCODERS: Dict[str, Callable[[Sequence], bytes]] = {
+    'i': _encode_ints,
+    's': _encode_strings,
+    'f': _encode_flags,
+}
+_DECODERS: Dict[str, Callable[[memoryview, int], Tuple[List, int]]] = {
+    'i': _decode_ints,
+    's': _decode_strings,
+    'f': _decode_flags,
+}
+
+
+### Files ###
+class SnapshotWriter:
+    """
+    Write a snapshot to the binary file /f/, a block at a time. Call close()
+    once every row has been written to finish the file.
+    """
+    def __init__(self, f: BinaryIO, block_rows: int = BLOCK_ROWS) -> None:
+        self._f = f
+        self._block_rows = block_rows
+        self._index: List[BlockInfo] = []
+        self._offset = 0
+        self._write(_HEADER.pack(MAGIC, FORMAT_VERSION))
+
+    def _write(self, data: bytes) -> None:
+        self._f.write(data)
+        self._offset += len(data)
+
+    def write(self, kind: bytes, rows: Iterable[Sequence]) -> int:
+        """
+        Write /rows/, tuples with the columns SCHEMA gives for /kind/, in
+        blocks of up to block_rows as they come.
+
+        Return:
+            The number of rows written.
+        """
+        count = 0
+        rows = iter(rows)
+        while True:
+            block = list(islice(rows, self._block_rows))
+            if not block:
+                return count
+            self._write_block(kind, block)
+            count += len(block)
+
+    def _write_block(self, kind: bytes, rows: List[Sequence]) -> None:
+        columns = zip(*rows)
+        data = zlib.compress(
+            b''.join(_ENCODERS[column_type](values)
+                     for column_type, values in zip(SCHEMA[kind], columns)),
+            COMPRESSION_LEVEL)
+        self._index.append(BlockInfo(kind, self._offset, len(rows)))
+        self._write(_BLOCK.pack(kind, len(rows), len(data)))
+        self._write(data)
+
+    def close(self) -> None:
+        "Write the index and footer. The file itself is left open."
+        index_offset = self._offset
+        for block in self._index:
+            self._write(_INDEX_ENTRY.pack(block.kind, block.offset, block.rows))
+        self._write(_FOOTER.pack(index_offset, len(self._index), MAGIC))
+
+
+class SnapshotReader:
+    """
+    Read a snapshot from the binary file /f/, which must be seekable. The
+    header and index are checked as soon as it's opened.
+
+    Raises:
+        SnapshotError - if /f/ isn't a complete snapshot of a version this
+            reader understands.
+    """
+    def __init__(self, f: BinaryIO) -> None:
+        self._f = f
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size or _HEADER.unpack(header)[0] != MAGIC:
+            raise SnapshotError("This is not a RabbitMark snapshot.")
+        version = _HEADER.unpack(header)[1]
+        if version > FORMAT_VERSION:
+            raise SnapshotError(f"This snapshot is in format version {version}, "
+                                f"but this version of RabbitMark only reads "
+                                f"versions up to {FORMAT_VERSION}.")
+
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size < _HEADER.size + _FOOTER.size:
+            raise SnapshotError("This snapshot is incomplete.")
+        f.seek(size - _FOOTER.size)
+        index_offset, blocks, magic = _FOOTER.unpack(f.read(_FOOTER.size))
+        index_end = index_offset + blocks * _INDEX_ENTRY.size
+        if magic != MAGIC or index_end != size - _FOOTER.size:
+            raise SnapshotError("This snapshot is incomplete.")
+        f.seek(index_offset)
+        index = f.read(blocks * _INDEX_ENTRY.size)
+        self.blocks = [BlockInfo(*i) for i in _INDEX_ENTRY.iter_unpack(index)]
+
+    def count(self, kind: bytes) -> int:
+        "Return the number of rows of /kind/ in the snapshot."
+        return sum(i.rows for i in self.blocks if i.kind == kind)
+
+    def read(self, kind: bytes) -> Iterator[List[Tuple]]:
+        """
+        Yield the rows of /kind/ a block at a time, as lists of tuples with
+        the columns SCHEMA gives.
+
+        Raises:
+            SnapshotError - if a block is damaged.
+        """
+        for block in self.blocks:
+            if block.kind != kind:
+                continue
+            damaged = f"A block of this snapshot at {block.offset} is damaged."
+            self._f.seek(block.offset)
+            header = self._f.read(_BLOCK.size)
+            if len(header) < _BLOCK.size:
+                raise SnapshotError(damaged)
+            header_kind, rows, length = _BLOCK.unpack(header)
+            if (header_kind, rows) != (kind, block.rows):
+                raise SnapshotError(damaged)
+            try:
+                data = memoryview(zlib.decompress(self._f.read(length)))
+                columns = []
+                for column_type in SCHEMA[kind]:
+                    values, used = _DECODERS[column_type](data, block.rows)
+                    columns.append(values)
+                    data = data[used:]
+            except (zlib.error, struct.error, UnicodeDecodeError) as e:
+                raise SnapshotError(damaged) from e
+            if len(data) or any(len(i) != block.rows for i in columns):
+                raise SnapshotError(damaged)
+            yield list(zip(*columns))
+
+
+### Backup and restore ###
+def save(session, target_path: str, block_rows: int = BLOCK_ROWS) -> Dict[bytes, int]:
+    """
+    Write a snapshot of every bookmark and tag in /session/'s database to
+    /target_path/. The tables are read in a single transaction, so the
+    snapshot is consistent even if something else changes the database
+    meanwhile; changes /session/ hasn't committed aren't included. The file
+    is only replaced once the snapshot is complete.
+
+    Return:
+        The number of rows saved of each kind (TAGS, BOOKMARKS, ASSIGNMENTS).
+
+    Raises:
+        Any file handling errors that may occur.
+    """
+    counts = {}
+    temp_path = target_path + '.tmp'
+    with session.get_bind().connect() as conn, conn.begin(), \
+            open(temp_path, 'wb') as f:
+        # pysqlite only begins transactions for writes by itself.
+        conn.exec_driver_sql("BEGIN")
+        writer = SnapshotWriter(f, block_rows)
+        for kind, query in _READ.items():
+            result = conn.exec_driver_sql(query)
+            counts[kind] = writer.write(
+                kind, (row for rows in result.partitions(block_rows) for row in rows))
+        writer.close()
+    os.replace(temp_path, target_path)
+    return counts
+
+
+def restore(session, source_path: str) -> Dict[bytes, int]:
+    """
+    Replace every bookmark and tag in /session/'s database with those in the
+    snapshot at /source_path/, in a single transaction: if anything goes
+    wrong, the database is left as it was. Saved link-check results are
+    dropped, as the IDs they're for may now be other bookmarks' (so every
+    link is due to be checked again). Objects loaded by sessions on the
+    database are stale afterwards; the bookmark index and other caches
+    notice by themselves (see generation.py).
+
+    Return:
+        The number of rows restored of each kind (TAGS, BOOKMARKS, ASSIGNMENTS).
+
+    Raises:
+        SnapshotError - if the file isn't a snapshot that can be restored.
+        Any file handling errors that may occur.
+    """
+    counts = {}
+    with open(source_path, 'rb') as f, \
+            session.get_bind().connect() as conn, conn.begin():
+        reader = SnapshotReader(f)
+        # Take the write lock now, rather than partway through.
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+        # Maintaining the full-text indexes, tag counts, and secondary indexes
+        # row by row is most of the cost of inserting; rebuilding them
+        # afterwards is far cheaper.
+        triggers = conn.exec_driver_sql(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'trigger'").all()
+        placeholders = ', '.join('?' for _ in _TABLES)
+        indexes = conn.exec_driver_sql(
+            f"SELECT name, sql FROM sqlite_master WHERE type = 'index' "
+            f"AND sql IS NOT NULL AND tbl_name IN ({placeholders})", _TABLES).all()
+        for name, _ in triggers:
+            conn.exec_driver_sql(f'DROP TRIGGER "{name}"')
+        for name, _ in indexes:
+            conn.exec_driver_sql(f'DROP INDEX "{name}"')
+        conn.exec_driver_sql("DELETE FROM link_checks")
+        for table in _TABLES:
+            conn.exec_driver_sql(f"DELETE FROM {table}")
+
+        for kind in (TAGS, BOOKMARKS, ASSIGNMENTS):
+            counts[kind] = 0
+            for rows in reader.read(kind):
+                if kind == BOOKMARKS:
+                    rows = [(pk, name, url, None if flags & _NO_URL_KEY else url_key,
+                             description, int(bool(flags & _PRIVATE)),
+                             int(bool(flags & _SKIP_LINKCHECK)))
+                            for pk, name, url, url_key, description, flags in rows]
+                conn.exec_driver_sql(_WRITE[kind], rows)
+                counts[kind] += len(rows)
+
+        for _, sql in indexes + triggers:
+            conn.exec_driver_sql(sql)
+        fulltext.rebuild(conn)
+        tag_counts.rebuild(conn)
+    return counts
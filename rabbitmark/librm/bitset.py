@@ -0,0 +1,104 @@
+"""
+bitset.py - compact sets of small non-negative integers
+"""
+
+from typing import Dict, Iterable, Iterator
+
+CHUNK_BITS = 4096  #: number of consecutive integers each chunk of a Bitset covers
+
+
+class Bitset:
+    """
+    A set of non-negative integers (in practice, bookmark IDs), stored as
+    bitmaps supporting fast bitwise intersection, union, and difference.
+
+    A single bitmap covering every ID would cost one bit per bookmark in the
+    whole database for every set, which adds up quickly when there's one set
+    per tag and most tags are used by only a handful of bookmarks. Instead,
+    the ID space is split into chunks of CHUNK_BITS integers, and only chunks
+    containing at least one member are stored (each as a Python int), so a
+    set's size is proportional to how many members it has and how spread out
+    they are.
+
+    >>> a = Bitset([1, 5, 9000]); b = Bitset([5, 9000, 9001])
+    >>> sorted(a & b), sorted(a | b), sorted(a - b)
+    ([5, 9000], [1, 5, 9000, 9001], [1])
+    >>> len(a), 5 in a, 6 in a
+    (3, True, False)
+    """
+    __slots__ = ('_chunks',)
+
+    def __init__(self, members: Iterable[int] = ()) -> None:
+        chunks: Dict[int, int] = {}
+        for i in members:
+            key, bit = divmod(i, CHUNK_BITS)
+            chunks[key] = chunks.get(key, 0) | (1 << bit)
+        self._chunks = chunks
+
+    @classmethod
+    def _from_chunks(cls, chunks: Dict[int, int]) -> 'Bitset':
+        new = cls()
+        new._chunks = {k: v for k, v in chunks.items() if v}
+        return new
+
+    @classmethod
+    def union(cls, sets: Iterable['Bitset']) -> 'Bitset':
+        "Return the union of all of /sets/."
+        chunks: Dict[int, int] = {}
+        for bitset in sets:
+            for key, bits in bitset._chunks.items():  # pylint: disable=protected-access
+                chunks[key] = chunks.get(key, 0) | bits
+        return cls._from_chunks(chunks)
+
+    def add(self, i: int) -> None:
+        key, bit = divmod(i, CHUNK_BITS)
+        self._chunks[key] = self._chunks.get(key, 0) | (1 << bit)
+
+    def discard(self, i: int) -> None:
+        key, bit = divmod(i, CHUNK_BITS)
+        bits = self._chunks.get(key, 0) & ~(1 << bit)
+        if bits:
+            self._chunks[key] = bits
+        else:
+            self._chunks.pop(key, None)
+
+    def copy(self) -> 'Bitset':
+        return self._from_chunks(self._chunks)
+
+    def __contains__(self, i: int) -> bool:
+        key, bit = divmod(i, CHUNK_BITS)
+        return bool(self._chunks.get(key, 0) >> bit & 1)
+
+    def __len__(self) -> int:
+        return sum(bits.bit_count() for bits in self._chunks.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._chunks)
+
+    def __iter__(self) -> Iterator[int]:
+        "Iterate over the members in ascending order."
+        for key in sorted(self._chunks):
+            bits = self._chunks[key]
+            base = key * CHUNK_BITS
+            while bits:
+                low = bits & -bits
+                yield base + low.bit_length() - 1
+                bits ^= low
+
+    def __and__(self, other: 'Bitset') -> 'Bitset':
+        small, large = sorted((self._chunks, other._chunks), key=len)
+        return self._from_chunks({k: v & large[k] for k, v in small.items()
+                                  if k in large})
+
+    def __or__(self, other: 'Bitset') -> 'Bitset':
+        return self.union((self, other))
+
+    def __sub__(self, other: 'Bitset') -> 'Bitset':
+        return self._from_chunks({k: v & ~other._chunks.get(k, 0)
+                                  for k, v in self._chunks.items()})
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Bitset) and self._chunks == other._chunks
+
+    def __repr__(self) -> str:
+        return f"<Bitset of {len(self)}>"
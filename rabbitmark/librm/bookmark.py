@@ -2,23 +2,178 @@
 bookmark.py -- RabbitMark bookmark operations
 """
 
-from typing import Any, Dict, Iterable, Optional, Sequence
+import json
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set
 
-from sqlalchemy import or_
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.orm import selectinload
 
-from rabbitmark.definitions import NOTAGS, SearchMode
-from .models import Bookmark, Tag
+from rabbitmark.definitions import NOTAGS, MatchMode, SearchMode
+from . import bookmark_index
+from . import fulltext
+from .models import Bookmark, LinkCheckResult, Tag, mark_tag_assoc
 from .tag import maybe_expunge_tag, change_tags
+from .url_key import normalize_url
+
+#: names looked up with a single IN (...) query by prefetch_names()
+PREFETCH_BATCH = 500
+
+
+def _numbered(orig_name: str, number: int) -> str:
+    "Return /orig_name/ with /number/ on the end (number 1 is the name alone)."
+    return orig_name if number == 1 else f"{orig_name} {number}"
+
+
+def _split_number(name: str):
+    """
+    Split a name that could have come from _numbered() into the original
+    name and the number, or return None if it couldn't have.
+    """
+    orig_name, _, suffix = name.rpartition(' ')
+    if (orig_name and suffix.isascii() and suffix.isdigit()
+            and str(int(suffix)) == suffix):
+        number = int(suffix)
+        if number >= 2:
+            return orig_name, number
+    return None
+
+
+def _numbers_taken(session, orig_name: str) -> Set[int]:
+    """
+    Return the numbers n for which the name _numbered(/orig_name/, n) is in
+    use. The names are found in a single range scan of the name index: every
+    name that is /orig_name/ or starts with /orig_name/ and a space.
+    """
+    in_range = or_(Bookmark.name == orig_name,
+                   and_(Bookmark.name > orig_name + " ",
+                        Bookmark.name < orig_name + "!"))
+    # Only the suffixes are needed, and reading them as one string rather
+    # than a row each is many times faster when there are thousands. (A
+    # suffix containing the separator can't be a number anyway.)
+    suffixes = session.execute(
+        select(func.group_concat(func.substr(Bookmark.name, len(orig_name) + 1), '\n'))
+        .where(in_range)
+    ).scalar()
+    taken: Set[int] = set()
+    if suffixes is None:
+        return taken
+    for suffix in suffixes.split('\n'):
+        if suffix == '':
+            taken.add(1)
+        # Only the form _numbered() makes counts: not "Note 03" or "Note 1".
+        elif (suffix[0] == ' ' and suffix[1:2] not in ('', '0')
+              and suffix[1:].isascii() and suffix[1:].isdigit()):
+            number = int(suffix)
+            if number >= 2:
+                taken.add(number)
+    return taken
+
+
+class _NameAllocator:
+    """
+    Unique names handed out by _uniquify_name() during names_batch(): which
+    numbers are taken for each name it has looked up, and the lowest number
+    that might be free; the numbers handed out for names it hasn't looked up
+    (yet); and names prefetch() found not to be in use.
+    """
+    def __init__(self) -> None:
+        self.taken: Dict[str, Set[int]] = {}
+        self.next_free: Dict[str, int] = {}
+        self.given: Dict[str, Set[int]] = {}
+        self.unused: Set[str] = set()
+
+    def prefetch(self, session, names: Iterable[str]) -> None:
+        # Everything handed out so far is in the database now, so
+        # _numbers_taken() will find it without our help.
+        self.given.clear()
+        unknown = [i for i in dict.fromkeys(names)
+                   if i not in self.taken and i not in self.unused]
+        in_use: Set[str] = set()
+        for start in range(0, len(unknown), PREFETCH_BATCH):
+            in_use.update(session.execute(
+                select(Bookmark.name)
+                .where(Bookmark.name.in_(unknown[start:start + PREFETCH_BATCH]))
+            ).scalars())
+        self.unused.update(i for i in unknown if i not in in_use)
+
+    def allocate(self, session, orig_name: str) -> str:
+        taken = self.taken.get(orig_name)
+        if taken is None:
+            if orig_name in self.unused:
+                # Free, so there's no need to know its numbered forms (yet).
+                self._hand_out(orig_name)
+                return orig_name
+            taken = self.taken[orig_name] = (_numbers_taken(session, orig_name)
+                                             | self.given.pop(orig_name, set()))
+            self.next_free[orig_name] = 2
+        if 1 in taken:
+            number = self.next_free[orig_name]
+            while number in taken:
+                number += 1
+            self.next_free[orig_name] = number + 1
+        else:
+            number = 1
+        name = _numbered(orig_name, number)
+        self._hand_out(name)
+        return name
+
+    def _hand_out(self, name: str) -> None:
+        "Record that /name/ is taken now."
+        # The new name may also be another name seen, or a numbered form of one.
+        split = _split_number(name)
+        for orig_name, number in ((name, 1),) + ((split,) if split is not None else ()):
+            if orig_name in self.taken:
+                self.taken[orig_name].add(number)
+            else:
+                self.given.setdefault(orig_name, set()).add(number)
+        self.unused.discard(name)
 
 
 def _uniquify_name(session, orig_name: str) -> str:
-    "Given the name of a bookmark, add numbers to the end until it's unique."
-    name = orig_name
-    next_number = 2
-    while name_exists(session, name):
-        name = orig_name + f" {next_number}"
-        next_number += 1
-    return name
+    """
+    Given the name of a bookmark, add the lowest number to the end (from 2 up)
+    that makes it unique, if it isn't already.
+    """
+    allocator = session.info.get('rm_name_allocator')
+    if allocator is not None:
+        return allocator.allocate(session, orig_name)
+    taken = _numbers_taken(session, orig_name)
+    number = 1
+    if 1 in taken:
+        number = 2
+        while number in taken:
+            number += 1
+    return _numbered(orig_name, number)
+
+
+def prefetch_names(session, names: Iterable[str]) -> None:
+    """
+    During names_batch(), look up which of /names/ are in use in a single
+    query, so that giving a bookmark one that isn't needs no query of its
+    own. Every name given out in the batch so far must be in the database
+    (flushed, if not committed) by now. Outside a batch, this does nothing.
+    """
+    allocator = session.info.get('rm_name_allocator')
+    if allocator is not None:
+        allocator.prefetch(session, names)
+
+
+@contextmanager
+def names_batch(session) -> Iterator[None]:
+    """
+    Within this block, remember the names given to bookmarks added (or
+    renamed) in /session/, so that giving many of them the same name -- say,
+    importing thousands of untitled bookmarks -- costs one query per distinct
+    name, rather than one per bookmark that reads every numbered name so far.
+
+    Nothing else may name bookmarks in the database during the block.
+    """
+    session.info['rm_name_allocator'] = _NameAllocator()
+    try:
+        yield
+    finally:
+        session.info.pop('rm_name_allocator', None)
 
 
 def add_bookmark(session, url: str, tags: Iterable[str],
@@ -31,6 +186,7 @@ def add_bookmark(session, url: str, tags: Iterable[str],
                         url=url, description=description, private=False,
                         skip_linkcheck=False)
     session.add(bookmark)
+    bookmark_index.stage(session, bookmark)
     for tag in tags:
         add_tag_to_bookmark(session, bookmark, tag)
     return bookmark
@@ -44,6 +200,7 @@ def add_tag_to_bookmark(session, bookmark: Bookmark, tag: str) -> Tag:
 
     Returns the Tag object for the new or existing tag used.
     """
+    bookmark_index.stage(session, bookmark)
     existing_tag = session.query(Tag).filter(Tag.text == tag).first()
     if existing_tag:
         bookmark.tags.append(existing_tag)
@@ -56,10 +213,16 @@ def add_tag_to_bookmark(session, bookmark: Bookmark, tag: str) -> Tag:
 
 def delete_bookmark(session, bookmark: Bookmark) -> None:
     """
-    Delete the specified bookmark. If the bookmark was the last to use any of
-    its tags, delete the tag(s) as well.
+    Delete the specified bookmark, and the saved result of checking its link.
+    If the bookmark was the last to use any of its tags, delete the tag(s) as
+    well.
     """
     tags = bookmark.tags
+    # SQLite may give the ID to the next bookmark added, which mustn't
+    # inherit the result.
+    session.execute(delete(LinkCheckResult.__table__).where(
+        LinkCheckResult.mark_id == bookmark.id))
+    bookmark_index.stage(session, bookmark)
     session.delete(bookmark)
     for tag in tags:
         maybe_expunge_tag(session, tag)
@@ -73,16 +236,36 @@ def name_exists(session, name: str) -> bool:
             is not None)
 
 
+def any_bookmarks(session) -> bool:
+    """
+    Return True if there are any bookmarks at all.
+    """
+    return session.query(Bookmark.id).first() is not None
+
+
 def url_exists(session, url: str) -> bool:
     """
     Return True if a bookmark with the exact URL /url/ exists.
     This is a fast, exact string match only and does not follow redirects,
-    uniquify URL encodings, etc.
+    uniquify URL encodings, etc.; see find_near_duplicates() for a looser one.
     """
-    return (session.query(Bookmark).filter(Bookmark.url == url).one_or_none()
+    return (session.query(Bookmark.id).filter(Bookmark.url == url).first()
             is not None)
 
 
+def find_near_duplicates(session, url: str) -> List[Bookmark]:
+    """
+    Return the bookmarks whose URLs are the same as /url/ once normalized
+    (see url_key.py), and so are probably of the same page -- including any
+    with exactly the URL /url/. This is a single lookup in the index of
+    normalized URLs, however many bookmarks there are.
+    """
+    return (session.query(Bookmark)
+            .filter(Bookmark.url_key == normalize_url(url))
+            .order_by(Bookmark.id)
+            .all())
+
+
 def save_if_edited(session, existing_bookmark: Bookmark,
                    new_content: Dict[str, Any]) -> bool:
     """
@@ -104,6 +287,7 @@ def save_if_edited(session, existing_bookmark: Bookmark,
         return False
 
     if _dirty():
+        bookmark_index.stage(session, existing_bookmark)
         if existing_bookmark.name != new_content['name']:
             new_name = _uniquify_name(session, new_content['name'])
             existing_bookmark.name = new_name  # type: ignore[assignment]
@@ -120,29 +304,90 @@ def save_if_edited(session, existing_bookmark: Bookmark,
         return False
 
 
+def _tagged_with(tags: Sequence[str]):
+    """
+    Return a condition matching bookmarks with any of the tags named /tags/.
+
+    Unlike Bookmark.tags.any(), which checks the tags of each bookmark in
+    turn, this looks up the bookmarks with each tag (by the tag_id index on
+    mark_tag_assoc), so it takes time in proportion to the number of
+    bookmarks tagged rather than the number in the database.
+    """
+    return Bookmark.id.in_(
+        select(mark_tag_assoc.c.mark_id)
+        .join(Tag, Tag.id == mark_tag_assoc.c.tag_id)
+        .where(Tag.text.in_(tags)))
+
+
+def _text_filter(session, filter_text: str, match_mode: MatchMode):
+    """
+    Return a filter clause matching bookmarks against the text in the filter
+    box, or None if there is nothing to filter on.
+
+    Full-text matching falls back to substring matching if the full-text index
+    isn't available or the text has no words the index can search for.
+    Substring matching always has the semantics of LIKE, but where the
+    trigram index can answer the search, only the bookmarks it finds are
+    checked against the LIKE pattern instead of the whole table.
+    """
+    if not filter_text:
+        return None
+
+    if match_mode == MatchMode.FullText and fulltext.is_available(session):
+        expression = fulltext.match_expression(filter_text)
+        if expression is not None:
+            return Bookmark.id.in_(fulltext.matching_ids(expression))
+
+    pattern = '%' + filter_text + '%'
+    like_filter = or_(Bookmark.name.like(pattern),
+                      Bookmark.url.like(pattern),
+                      Bookmark.description.like(pattern))
+
+    expression = fulltext.substring_expression(filter_text)
+    if expression is not None and fulltext.is_available(session,
+                                                        fulltext.TRIGRAM_TABLE):
+        candidates = fulltext.matching_ids(expression, fulltext.TRIGRAM_TABLE)
+        return and_(Bookmark.id.in_(candidates), like_filter)
+    return like_filter
+
+
 # pylint: disable=singleton-comparison
-def find_bookmarks(session,
-                   filter_text: str,
-                   tags: Sequence[str],
-                   include_private: bool,
-                   search_mode: SearchMode) -> Iterable[Bookmark]:
+def query_bookmarks(session,
+                    filter_text: str,
+                    tags: Sequence[str],
+                    include_private: bool,
+                    search_mode: SearchMode,
+                    match_mode: MatchMode = MatchMode.FullText):
     """
-    Return a list of Bookmarks in the database that match the specified
-    criteria.
+    Return a query for the Bookmarks in the database that match the specified
+    criteria (see find_bookmarks()), which callers can further sort, limit,
+    or count before running.
 
-    /filter_text/: substring match on name, URL, or description
-    /tags/: a list of tags, either OR'd or AND'd together depending on mode
-    /include_private/: show private bookmarks?
-    /search_mode/: describes whether to OR or AND the tags together
+    If the bookmark index is enabled (see bookmark_index.py), the tag and
+    private-bookmark criteria are resolved from it rather than with a
+    subquery per tag.
 
     Note that SQLAlchemy doesn't support in_ queries on many-to-many
     relationships, so we have to compare on the text of the tags. Conveniently,
     we are given those already!
     """
-    query = session.query(Bookmark).filter(
-        or_(Bookmark.name.like(filter_text),
-            Bookmark.url.like(filter_text),
-            Bookmark.description.like(filter_text)))
+    query = session.query(Bookmark)
+    text_filter = _text_filter(session, filter_text, match_mode)
+    if text_filter is not None:
+        query = query.filter(text_filter)
+
+    index = bookmark_index.get(session) if tags else None
+    matching_ids = None
+    if index is not None:
+        matching_ids = index.lookup(session, tags, include_private, search_mode)
+        if matching_ids is None:
+            # Something changed the database behind the index's back. Use SQL
+            # this time, and get the index ready for the next search.
+            index.seed(session)
+
+    if matching_ids is not None:
+        id_list = func.json_each(json.dumps(list(matching_ids))).table_valued('value')
+        return query.filter(Bookmark.id.in_(select(id_list.c.value)))
 
     if tags:
         if search_mode == SearchMode.And:
@@ -150,22 +395,50 @@ def find_bookmarks(session,
                 real_tags = [i for i in tags if i != NOTAGS]
                 query = query.filter(Bookmark.tags == None)
             for tag in tags:
-                query = query.filter(Bookmark.tags.any(Tag.text == tag))
+                query = query.filter(_tagged_with([tag]))
         elif search_mode == SearchMode.Or:
             if NOTAGS in tags:
                 real_tags = [i for i in tags if i != NOTAGS]
                 query = query.filter(or_(
                     Bookmark.tags == None,
-                    Bookmark.tags.any(Tag.text.in_(real_tags))))
+                    _tagged_with(real_tags)))
             else:
-                query = query.filter(Bookmark.tags.any(Tag.text.in_(tags)))
+                query = query.filter(_tagged_with(tags))
         else:
             raise AssertionError(f"in updateForSearch(): Search mode {search_mode!r} "
                                  f"unimplemented")
 
     if not include_private:
         query = query.filter(Bookmark.private == False)
-    return query.all()
+    return query
+
+
+def find_bookmarks(session,
+                   filter_text: str,
+                   tags: Sequence[str],
+                   include_private: bool,
+                   search_mode: SearchMode,
+                   match_mode: MatchMode = MatchMode.FullText) -> Iterable[Bookmark]:
+    """
+    Return a list of Bookmarks in the database that match the specified
+    criteria.
+
+    /filter_text/: text to look for in name, URL, or description (as typed
+        into the filter box; empty to match everything)
+    /tags/: a list of tags, either OR'd or AND'd together depending on mode
+    /include_private/: show private bookmarks?
+    /search_mode/: describes whether to OR or AND the tags together
+    /match_mode/: describes whether to match /filter_text/ as words using the
+        full-text index or as a plain substring (the latter is slower on large
+        databases, but finds fragments in the middle of words)
+
+    The tags of the bookmarks returned are loaded up front in bulk, since
+    callers generally display them; reading them doesn't cost a query per
+    bookmark.
+    """
+    query = query_bookmarks(session, filter_text, tags, include_private,
+                            search_mode, match_mode)
+    return query.options(selectinload(Bookmark.tags)).all()
 
 
 def get_bookmark_by_id(session, pk: int) -> Optional[Bookmark]:
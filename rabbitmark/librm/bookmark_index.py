@@ -0,0 +1,272 @@
+"""
+bookmark_index.py - optional in-memory index of bookmarks by tag
+
+Filtering by tags in SQL takes a correlated subquery per selected tag, which
+gets slow with many tags selected on a large database. The index instead
+holds a Bitset of bookmark IDs for each tag (plus the private and untagged
+bookmarks), so any combination of tags can be resolved with a few bitwise
+operations; find_bookmarks() consults it first when it's enabled.
+
+The index is seeded from the database by enable() and then kept up to date by
+the bookmark and tag mutation functions, which stage the objects and
+operations they touch with stage() and stage_op(). Staged changes are applied
+only once they're committed. If anything else changes the database --
+another process, or code that modified bookmarks without staging them -- the
+index notices (see generation.py) and reports itself stale, and callers fall
+back to SQL until it's been reseeded.
+"""
+
+import threading
+from itertools import chain
+from typing import Dict, FrozenSet, Iterable, Optional, Sequence, Tuple
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from rabbitmark.definitions import NOTAGS, SearchMode
+from . import generation
+from .bitset import Bitset
+from .models import Bookmark, Tag, mark_tag_assoc
+
+
+class BookmarkIndex:
+    "Bitsets of bookmark IDs by tag, for one database."
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._all = Bitset()
+        self._private = Bitset()
+        self._untagged = Bitset()
+        self._by_tag: Dict[str, Bitset] = {}
+        self._mark_tags: Dict[int, FrozenSet[str]] = {}
+        #: generation of the database the index reflects, or None if stale
+        self._synced: Optional[int] = None
+
+    def seed(self, session) -> None:
+        "(Re)build the index from the database /session/ is using."
+        seeded_at = generation.current(session)
+        marks = session.query(Bookmark.id, Bookmark.private).all()
+        assoc = (session.query(mark_tag_assoc.c.mark_id, Tag.text)
+                 .join(Tag, Tag.id == mark_tag_assoc.c.tag_id)
+                 .all())
+
+        mark_tags: Dict[int, set] = {pk: set() for pk, _ in marks}
+        tag_marks: Dict[str, list] = {}
+        for pk, tag in assoc:
+            mark_tags[pk].add(tag)
+            tag_marks.setdefault(tag, []).append(pk)
+
+        # Build each set in one go rather than with _set_mark(), which is
+        # much slower on a large database.
+        with self._lock:
+            self._all = Bitset(mark_tags)
+            self._private = Bitset(pk for pk, private in marks if private)
+            self._untagged = Bitset(pk for pk, tags in mark_tags.items()
+                                    if not tags)
+            self._by_tag = {tag: Bitset(pks) for tag, pks in tag_marks.items()}
+            self._mark_tags = {pk: frozenset(tags) for pk, tags in mark_tags.items()}
+            self._synced = seeded_at
+
+    @property
+    def stale(self) -> bool:
+        return self._synced is None
+
+    def lookup(self, session, tags: Sequence[str], include_private: bool,
+               search_mode: SearchMode) -> Optional[Bitset]:
+        """
+        Return the IDs of bookmarks matching the tag and private-bookmark
+        criteria of find_bookmarks(), or None if the index is stale.
+        """
+        if self._synced is None or generation.current(session) != self._synced:
+            self._synced = None
+            return None
+
+        with self._lock:
+            if not tags:
+                result = self._all
+            elif search_mode == SearchMode.And:
+                result = self._all
+                if NOTAGS in tags:
+                    result = result & self._untagged
+                for tag in tags:
+                    result = result & self._by_tag.get(tag, Bitset())
+            elif search_mode == SearchMode.Or:
+                real_tags = [i for i in tags if i != NOTAGS]
+                matching = [self._by_tag[i] for i in real_tags if i in self._by_tag]
+                if NOTAGS in tags:
+                    matching.append(self._untagged)
+                result = Bitset.union(matching)
+            else:
+                raise AssertionError(f"in lookup(): Search mode {search_mode!r} "
+                                     f"unimplemented")
+
+            if not include_private:
+                result = result - self._private
+            return result.copy() if result is self._all else result
+
+    ### Updating (lock must be held) ###
+    def _set_mark(self, pk: int, tags: FrozenSet[str], private: bool) -> None:
+        self._unset_mark(pk)
+        self._all.add(pk)
+        if private:
+            self._private.add(pk)
+        if not tags:
+            self._untagged.add(pk)
+        for tag in tags:
+            self._by_tag.setdefault(tag, Bitset()).add(pk)
+        self._mark_tags[pk] = tags
+
+    def _unset_mark(self, pk: int) -> None:
+        for tag in self._mark_tags.pop(pk, ()):
+            members = self._by_tag[tag]
+            members.discard(pk)
+            if not members:
+                del self._by_tag[tag]
+        for bitset in (self._all, self._private, self._untagged):
+            bitset.discard(pk)
+
+    def _rename_tag(self, old: str, new: str) -> None:
+        members = self._by_tag.pop(old, Bitset())
+        if members:
+            self._by_tag[new] = members
+        for pk in members:
+            self._mark_tags[pk] = (self._mark_tags[pk] - {old}) | {new}
+
+    def _delete_tag(self, name: str) -> None:
+        for pk in self._by_tag.pop(name, Bitset()):
+            self._mark_tags[pk] = self._mark_tags[pk] - {name}
+            if not self._mark_tags[pk]:
+                self._untagged.add(pk)
+
+    def _apply(self, ops: Iterable[Tuple]) -> None:
+        for op, *args in ops:
+            if op == 'mark':
+                self._set_mark(*args)
+            elif op == 'unmark':
+                self._unset_mark(*args)
+            elif op == 'rename_tag':
+                self._rename_tag(*args)
+            elif op == 'delete_tag':
+                self._delete_tag(*args)
+            else:
+                raise AssertionError(f"Bookmark index operation {op!r} unimplemented")
+
+    ### Session events ###
+    def _before_commit(self, session) -> None:
+        # If someone else has committed since we last synced, applying our
+        # changes on top of what we have won't give the right answer.
+        if self._synced is not None and generation.current(session) != self._synced:
+            self._synced = None
+
+    def _after_commit(self, session, new_generation: int) -> None:
+        ops = session.info.pop('rm_index_ops', [])
+        unstaged = session.info.pop('rm_index_unstaged', False)
+        session.info.pop('rm_index_staged', None)
+        if self._synced is None:
+            return
+        if unstaged:
+            self._synced = None
+            return
+        with self._lock:
+            self._apply(ops)
+        self._synced = new_generation
+
+
+_indexes: 'WeakKeyDictionary[object, BookmarkIndex]' = WeakKeyDictionary()
+
+
+def enable(session, seed: bool = True) -> BookmarkIndex:
+    """
+    Build an index for the database /session/ uses, and use it to answer
+    tag searches from now on. Only databases opened with
+    database.make_Session() can be indexed, as the index relies on generation
+    tracking to notice changes it didn't make.
+
+    If not /seed/, the index starts out stale, so it's built by the first
+    tag search instead (which answers from SQL meanwhile); seeding takes a
+    few seconds on a library of hundreds of thousands of bookmarks.
+    """
+    engine = session.get_bind()
+    index = _indexes.get(engine)
+    if index is None:
+        index = BookmarkIndex()
+        _indexes[engine] = index
+        generation.add_commit_hook(
+            session, index._after_commit)  # pylint: disable=protected-access
+    if seed:
+        index.seed(session)
+    return index
+
+
+def get(session) -> Optional[BookmarkIndex]:
+    "Return the index for /session/'s database, or None if it isn't enabled."
+    return _indexes.get(session.get_bind())
+
+
+def stage(session, obj) -> None:
+    """
+    Note that /obj/, a Bookmark or Tag, is about to be added, changed, or
+    deleted by a mutation function. Bookmarks are snapshotted into the index
+    at each flush; Tags should also have an operation staged with stage_op().
+    """
+    if get(session) is not None:
+        session.info.setdefault('rm_index_staged', set()).add(obj)
+
+
+def stage_op(session, op: str, *args) -> None:
+    """
+    Stage an operation on the index that can't be captured by snapshotting a
+    bookmark: ('rename_tag', old_name, new_name) or ('delete_tag', name).
+    """
+    if get(session) is not None:
+        session.info.setdefault('rm_index_ops', []).append((op, *args))
+
+
+# pylint: disable=unused-argument
+@event.listens_for(Session, "after_flush")
+def _snapshot_staged(session, flush_context) -> None:
+    if get(session) is None:
+        return
+    staged = session.info.get('rm_index_staged', set())
+    ops = session.info.setdefault('rm_index_ops', [])
+    for obj in staged:
+        if isinstance(obj, Bookmark):
+            # A bookmark deleted by an earlier flush in this transaction is
+            # no longer in session.deleted, but mustn't come back.
+            state = inspect(obj)
+            if obj in session.deleted or state.deleted or state.was_deleted:
+                ops.append(('unmark', obj.id))
+            else:
+                ops.append(('mark', obj.id, frozenset(i.text for i in obj.tags),
+                            bool(obj.private)))
+
+    # Anything else touching bookmarks or tag names means we can't keep up.
+    # (Tags also become dirty when bookmarks are added to or removed from
+    # them, and new tags appear when bookmarks are tagged with them, but
+    # those bookmarks are staged.)
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if obj in staged:
+            continue
+        if isinstance(obj, Bookmark):
+            session.info['rm_index_unstaged'] = True
+        elif isinstance(obj, Tag) and (
+                obj in session.deleted
+                or (obj not in session.new
+                    and inspect(obj).attrs.text.history.has_changes())):
+            session.info['rm_index_unstaged'] = True
+
+
+@event.listens_for(Session, "before_commit")
+def _check_before_commit(session) -> None:
+    index = get(session)
+    if index is not None:
+        index._before_commit(session)  # pylint: disable=protected-access
+
+
+# Registered after generation's after_commit listener, which calls
+# BookmarkIndex._after_commit() first if anything was committed.
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _discard_staged(session) -> None:
+    for key in ('rm_index_staged', 'rm_index_ops', 'rm_index_unstaged'):
+        session.info.pop(key, None)
@@ -1,42 +1,227 @@
 """
 broken_links.py - tools for checking for link rot
+
+There are two ways of checking links. scan() hands each one to requests in
+a pool of threads, which is simple but can only have a few requests out at
+once. scan_concurrent() checks them with asyncio instead, making the HEAD
+requests itself (_check_async()) so that thousands can be waiting on slow
+servers at once at the cost of a coroutine apiece, not a thread. It limits
+the number of requests out both in all and to each host, so that one site
+with many bookmarks doesn't get all of them at once.
+
+Either way, connections are kept open after each request, and links to the
+same host are checked one after another, so that the next one can reuse the
+connection rather than connecting and negotiating TLS all over again. Many
+bookmarks are usually of a few sites (Wikipedia, GitHub...), so most
+requests do. Both scans return ConnectionStats saying how many did.
+
+Both scans are polite, too. The hosts take turns, so that a host with many
+bookmarks has its links spread over the whole scan rather than checked all
+at once, and no host is sent requests more often than every
+MIN_HOST_INTERVAL seconds. A host that answers 429 Too Many Requests, or 503
+with a Retry-After header, is left alone for as long as it asks and sent
+requests less often for a while, and the links it turned away are checked
+again (see _HostLimiter).
+
+Every result is saved in the link_checks table (LinkCheckResult), along with
+how long the server took to answer and the validators (ETag, Last-Modified)
+it sent. Given a /max_age/, a scan checks only the links that failed last
+time, haven't been checked, or were last checked longer ago than that, which
+in a large library that is scanned often is only a small part of it. Links
+that were fine are checked with a conditional request, which the server can
+answer with a short "304 Not Modified" if the page hasn't changed since.
 """
 
+import asyncio
+from collections import deque
 import concurrent.futures
-from typing import Callable, Optional
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+import heapq
+import queue
+import socket
+import ssl
+import threading
+import time
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional, Set, Tuple
+from urllib.parse import quote, urljoin, urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from sqlalchemy import delete, insert, select
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.connection import HTTPConnection, HTTPSConnection
+
+from . import config
+from . import generation
+from .models import Bookmark, LinkCheckResult
+
+#: seconds to wait for a server to connect or answer before giving up
+TIMEOUT = 10
+
+#: redirects followed before deciding a link is in a loop (as requests does)
+MAX_REDIRECTS = 30
+
+#: requests scan_concurrent() has out at once, in all and to any one host
+MAX_CONNECTIONS = 500
+MAX_PER_HOST = 6
+
+#: seconds between checks of whether the scan has been canceled when no
+#: results are coming in
+CANCEL_POLL_INTERVAL = 0.25
+
+#: header lines read from a response before giving up on it
+MAX_HEADERS = 100
+
+#: threads scan() checks links in
+THREADS = 15
+
+#: links to the same host scan() checks in a row in one thread, over one
+#: connection; a host with more is checked by several threads at once
+THREAD_RUN = 20
+
+#: longest, in seconds, one of scan()'s threads waits for a host to be ready
+#: for the next link of its run; if the host asked us to wait longer, the
+#: rest of the run is set aside, and the thread freed, until it's ready
+MAX_THREAD_WAIT = 1.0
+
+#: hosts each of scan()'s threads keeps a connection open to
+THREAD_HOSTS_KEPT = 4
+
+#: connections scan_concurrent() keeps open between requests, in all
+MAX_IDLE_CONNECTIONS = 200
+
+#: days after which a link that was fine is due to be checked again, unless
+#: the linkcheck_max_age_days key in the conf table says otherwise
+DEFAULT_MAX_AGE_DAYS = 28
+
+#: fraction of the maximum age by which links may come due sooner, so that
+#: the links checked in one scan don't all come due in the same later one
+MAX_AGE_SPREAD = 0.5
+
+#: results saved to the database at a time
+SAVE_BATCH = 500
+
+#: seconds between the starts of requests to any one host, at least
+MIN_HOST_INTERVAL = 0.1
+
+#: seconds between requests to a host once it has asked us to slow down, at
+#: first; each time it asks again, this is doubled, up to MAX_HOST_INTERVAL
+THROTTLED_HOST_INTERVAL = 1.0
+MAX_HOST_INTERVAL = 10.0
+
+#: fraction of the interval between requests to a host that was throttled
+#: left after each answer that doesn't ask us to slow down again
+HOST_INTERVAL_RECOVERY = 0.9
+
+#: times a link is checked again after the server asked us to slow down
+THROTTLE_RETRIES = 2
+
+#: longest Retry-After waited for, in seconds; a link whose server asks us to
+#: wait longer is reported with the status it gave
+MAX_RETRY_AFTER = 60
+
+#: status codes of links that work (304 only in answer to a conditional request)
+_WORKING = (200, 304)
+
 
-from .models import Bookmark
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class _Validators(NamedTuple):
+    "What a server sent to identify the version of a page it has."
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+    def headers(self) -> Dict[str, str]:
+        "Return the headers asking the server whether the page has changed since."
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class _Link(NamedTuple):
+    "A bookmark to check, and the validators to check it with, if any."
+    pk: int
+    name: str
+    url: str
+    validators: Optional[_Validators]
 
 
 class LinkCheck:
     """
     The result of checking a link for accessibility.
     """
+    # pylint: disable=too-many-arguments
     def __init__(self, pk: int, name: str, url: str,
                  status_code: Optional[int] = None,
-                 error_description: Optional[str] = None) -> None:
+                 error_description: Optional[str] = None,
+                 response_time: Optional[float] = None,
+                 final_url: Optional[str] = None,
+                 etag: Optional[str] = None,
+                 last_modified: Optional[str] = None,
+                 revalidated: bool = False,
+                 retry_after: Optional[float] = None) -> None:
         self.pk = pk                    #: primary key of bookmark in database
         self.name = name                #: name of bookmark
         self.url = url                  #: url of page
         self.status_code = status_code  #: HTTP status code, if we got that far
         #: description of an error that prevented an HTTP status code, e.g., timed out
         self.error_description = error_description
+        self.checked_at = _utcnow()     #: when the check was made, in UTC
+        self.response_time = response_time  #: seconds taken to answer, if it did
+        self.final_url = final_url      #: where any redirects led, if it answered
+        self.etag = etag                #: validators for the next check, if any
+        self.last_modified = last_modified
+        #: whether the server said the page hasn't changed since the last check
+        self.revalidated = revalidated
+        #: seconds the server asked us to wait before asking again, if it did
+        self.retry_after = retry_after
 
     @property
     def successful(self) -> bool:
-        return self.status_code == 200
+        return self.status_code == 200 or (self.revalidated and self.status_code == 304)
+
+    @property
+    def throttled(self) -> bool:
+        "Did the server ask us to slow down, rather than say the link is broken?"
+        return (self.status_code == 429
+                or (self.status_code == 503 and self.retry_after is not None))
 
     def __str__(self) -> str:
         if self.successful:
-            return f"[ OK ] [200] {self.name} ({self.url})"
+            return f"[ OK ] [{self.status_code}] {self.name} ({self.url})"
         elif self.status_code is not None:
             return f"[FAIL] [{self.status_code}] {self.name} ({self.url})"
         else:
             return f"[FAIL] [ERR] {self.error_description}: {self.name} ({self.url})"
 
 
+class ConnectionStats:
+    """
+    How many HTTP requests a scan made, counting each redirect followed, and
+    how many connections it opened to make them.
+    """
+    def __init__(self, requests_made: int = 0, connections: int = 0) -> None:
+        self.requests = requests_made
+        self.connections = connections
+
+    @property
+    def reuse_rate(self) -> float:
+        "The fraction of requests made over a connection already open, from 0 to 1."
+        if not self.requests:
+            return 0.0
+        return max(self.requests - self.connections, 0) / self.requests
+
+    def __str__(self) -> str:
+        return (f"{self.requests} requests over {self.connections} connections "
+                f"({self.reuse_rate:.0%} reused)")
+
+
 def _get_user_agent():
     """
     When checking for link rot, some websites will return a 403 if we are
@@ -54,17 +239,122 @@ def _get_user_agent():
             'Chrome/83.0.4103.97 Safari/537.36')
 
 
+class _ThreadSessions:
+    """
+    A requests Session for each thread checking links, so that each can
+    keep its connections open without waiting for the others'.
+    """
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: List[requests.Session] = []
+        #: every connection pool the sessions have made, for their request counts
+        self._pools: Set[HTTPConnectionPool] = set()
+        self._connections = 0
+        self._pool_classes = self._counted_pool_classes()
+
+    def _counted_pool_classes(self) -> Dict[str, type]:
+        """
+        Return connection pool classes for the sessions' adapters that note
+        each pool made, and each time one of their connections connects
+        (which urllib3 doesn't count when it reconnects a connection the
+        server closed).
+        """
+        sessions = self
+
+        class CountedHTTPConnection(HTTPConnection):
+            def connect(self) -> None:
+                with sessions._lock:  # pylint: disable=protected-access
+                    sessions._connections += 1  # pylint: disable=protected-access
+                super().connect()
+
+        class CountedHTTPSConnection(HTTPSConnection):
+            def connect(self) -> None:
+                with sessions._lock:  # pylint: disable=protected-access
+                    sessions._connections += 1  # pylint: disable=protected-access
+                super().connect()
+
+        class CountedHTTPPool(HTTPConnectionPool):
+            ConnectionCls = CountedHTTPConnection
+
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+                sessions._pools.add(self)  # pylint: disable=protected-access
+
+        class CountedHTTPSPool(HTTPSConnectionPool):
+            ConnectionCls = CountedHTTPSConnection
+
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+                sessions._pools.add(self)  # pylint: disable=protected-access
+
+        return {'http': CountedHTTPPool, 'https': CountedHTTPSPool}
+
+    def get(self) -> requests.Session:
+        "Return the session for this thread."
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            # A thread makes one request at a time, so one connection to a
+            # host is all it can use.
+            adapter = HTTPAdapter(pool_connections=THREAD_HOSTS_KEPT, pool_maxsize=1)
+            adapter.poolmanager.pool_classes_by_scheme = self._pool_classes
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def stats(self) -> ConnectionStats:
+        "Return how many requests and connections were made in all."
+        with self._lock:
+            return ConnectionStats(sum(i.num_requests for i in self._pools),
+                                   self._connections)
+
+    def close(self) -> None:
+        for session in self._sessions:
+            session.close()
+
+
+# pylint: disable=too-many-arguments
+def _answered(link: _Link, status_code: int, reason: str, headers,
+              response_time: float, final_url: str) -> LinkCheck:
+    """
+    Return a LinkCheck for /link/ from the server's answer, with the
+    validators to check it with next time: the ones the server sent, or if it
+    said the page hasn't changed without sending them again, the ones we sent.
+    """
+    revalidated = status_code == 304 and link.validators is not None
+    etag = headers.get('etag')
+    last_modified = headers.get('last-modified')
+    if revalidated:
+        assert link.validators is not None
+        etag = etag or link.validators.etag
+        last_modified = last_modified or link.validators.last_modified
+    return LinkCheck(link.pk, link.name, link.url, status_code, reason,
+                     response_time, final_url, etag, last_modified, revalidated,
+                     _retry_after(headers.get('retry-after')))
+
+
 # pylint: disable=too-many-return-statements
-def _check(pk: int, name: str, url: str) -> LinkCheck:
+def _check(link: _Link, sessions: Optional[_ThreadSessions] = None) -> LinkCheck:
     """
-    Given the url /url/, check to see if it accessible, and return a LinkCheck
-    object with the URL, primary key, and name, as well as the results of the check.
+    Check to see if /link/'s URL is accessible, with a conditional request
+    if it has validators, and return a LinkCheck object with the URL, primary
+    key, and name, as well as the results of the check. If /sessions/ is
+    given, make the request with this thread's session.
     """
+    pk, name, url, validators = link
     headers = {
         'User-Agent': _get_user_agent()
     }
+    if validators is not None:
+        headers.update(validators.headers())
+    http = requests if sessions is None else sessions.get()
+    start = time.perf_counter()
     try:
-        r = requests.head(url, timeout=10, allow_redirects=True, headers=headers)
+        r = http.head(url, timeout=TIMEOUT, allow_redirects=True, headers=headers)
     except requests.exceptions.SSLError:
         return LinkCheck(pk, name, url, None, "Invalid SSL certificate")
     except requests.exceptions.ConnectionError:
@@ -78,38 +368,825 @@ def _check(pk: int, name: str, url: str) -> LinkCheck:
     except requests.exceptions.RequestException as e:
         return LinkCheck(pk, name, url, None, str(e))
     else:
-        return LinkCheck(pk, name, url, r.status_code, r.reason)
+        return _answered(link, r.status_code, r.reason, r.headers,
+                         time.perf_counter() - start, r.url)
+
+
+### Saved results ###
+def configured_max_age(session) -> timedelta:
+    """
+    Return how long ago a link that was fine must have been checked for it
+    to be checked again: DEFAULT_MAX_AGE_DAYS, or the number of days in the
+    linkcheck_max_age_days configuration key.
+    """
+    return timedelta(days=int(config.get(session, "linkcheck_max_age_days")
+                              or DEFAULT_MAX_AGE_DAYS))
+
+
+def _due_age(pk: int, max_age: timedelta) -> timedelta:
+    """
+    Return how old the last check of bookmark /pk/ may get before it's due:
+    /max_age/, less up to MAX_AGE_SPREAD of it, the same for the bookmark
+    every time.
+    """
+    spread = ((pk * 2654435761) % 1024) / 1024
+    return max_age * (1 - MAX_AGE_SPREAD * spread)
+
+
+def _links_to_check(session, max_age: Optional[timedelta]) -> List[_Link]:
+    """
+    Return the bookmarks to check: all of them but those marked to skip, or
+    if /max_age/ is given, only those that weren't fine the last time their
+    URL was checked or are due to be checked again (see _due_age()). Links
+    that were fine are given the validators the server sent last time.
+    """
+    now = _utcnow()
+    # pylint: disable=singleton-comparison
+    query = (select(Bookmark.id, Bookmark.name, Bookmark.url,
+                    LinkCheckResult.url, LinkCheckResult.checked_at,
+                    LinkCheckResult.status_code, LinkCheckResult.etag,
+                    LinkCheckResult.last_modified)
+             .outerjoin(LinkCheckResult, LinkCheckResult.mark_id == Bookmark.id)
+             .where(Bookmark.skip_linkcheck == False))
+    links = []
+    for pk, name, url, checked_url, checked_at, status_code, etag, last_modified \
+            in session.execute(query):
+        validators = None
+        if checked_url == url and status_code in _WORKING:
+            if max_age is not None and now - checked_at < _due_age(pk, max_age):
+                continue
+            if etag or last_modified:
+                validators = _Validators(etag, last_modified)
+        links.append(_Link(pk, name, url, validators))
+    return links
+
+
+class _ResultWriter:
+    """
+    Saves each LinkCheck of a scan in the link_checks table, replacing the
+    bookmark's last one. Results are committed SAVE_BATCH at a time, so that
+    those of a scan that's canceled or fails partway through are kept too.
+    """
+    def __init__(self, session) -> None:
+        self.session = session
+        self._pending: List[dict] = []
+
+    def add(self, result: LinkCheck) -> None:
+        self._pending.append({
+            'mark_id': result.pk,
+            'url': result.url,
+            'checked_at': result.checked_at,
+            'status_code': result.status_code,
+            'error_description': result.error_description,
+            'response_time': result.response_time,
+            'final_url': result.final_url,
+            'etag': result.etag,
+            'last_modified': result.last_modified,
+        })
+        if len(self._pending) >= SAVE_BATCH:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self.session.execute(
+                insert(LinkCheckResult.__table__).prefix_with("OR REPLACE"),
+                self._pending)
+            self._pending = []
+            generation.note_changes(self.session)
+        self.session.commit()
+
+    def close(self) -> None:
+        "Save the results left, and drop any for bookmarks since deleted."
+        self.session.execute(delete(LinkCheckResult.__table__).where(
+            LinkCheckResult.mark_id.not_in(select(Bookmark.id))))
+        self.flush()
+
+
+### Politeness ###
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Return the seconds from now a Retry-After header of /value/ asks us to
+    wait, or None if there is none or it makes no sense.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class _TokenBucket:
+    """
+    Lets a request through every /interval/ seconds: a token drips in that
+    often, and each request takes one, but no more than /capacity/ are
+    kept. The bucket can also be paused for a while.
+    """
+    def __init__(self, interval: float, capacity: float, now: float) -> None:
+        self.interval = interval
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def _refill(self, now: float) -> None:
+        if now <= self.updated:
+            return
+        if self.interval <= 0:
+            self.tokens = self.capacity
+        else:
+            self.tokens = min(self.tokens + (now - self.updated) / self.interval,
+                              self.capacity)
+        self.updated = now
+
+    def ready_at(self, now: float) -> float:
+        "Return the time at which a request can next go through."
+        self._refill(now)
+        if self.tokens >= 1:
+            return max(now, self.updated)
+        return self.updated + (1 - self.tokens) * self.interval
+
+    def take(self, now: float) -> None:
+        "Let a request through, which must be ready_at() now."
+        self._refill(now)
+        self.tokens -= 1
+
+    def pause(self, until: float) -> None:
+        "Let no request through before /until/, and only one then."
+        self.tokens = min(self.tokens, 1)
+        self.updated = max(self.updated, until)
+
+
+class _HostLimiter:
+    """
+    Keeps the requests to each host of a scan polite, with a token bucket
+    apiece. A host gets a request every /interval/ seconds at most. If it
+    answers 429 Too Many Requests, or 503 Service Unavailable with a
+    Retry-After header, it's given nothing more until the time it asked
+    for, and the interval between its requests is raised, to be lowered
+    bit by bit again as its answers come back normally. Any thread can use
+    the same limiter.
+
+    Hosts are those that links were first requested of: the limits don't
+    follow redirects to other hosts.
+    """
+    def __init__(self, interval: float = MIN_HOST_INTERVAL) -> None:
+        self.interval = interval
+        self._buckets: Dict[str, _TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host: str, now: float) -> _TokenBucket:
+        if host not in self._buckets:
+            self._buckets[host] = _TokenBucket(self.interval, 1, now)
+        return self._buckets[host]
+
+    def ready_at(self, host: str) -> float:
+        "Return the time.monotonic() at which a request can next go to /host/."
+        now = time.monotonic()
+        with self._lock:
+            return self._bucket(host, now).ready_at(now)
+
+    def try_take(self, host: str) -> bool:
+        "If a request can go to /host/ now, count it as gone and return True."
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(host, now)
+            if bucket.ready_at(now) > now:
+                return False
+            bucket.take(now)
+            return True
+
+    def wait(self, host: str, stop: threading.Event,
+             timeout: Optional[float] = None) -> bool:
+        """
+        Wait until a request can go to /host/ and count it as gone, unless
+        /stop/ is set first, or (given a /timeout/) /host/ won't be ready for
+        longer than /timeout/ seconds, in which case don't wait at all.
+
+        Return:
+            False if /stop/ was set or the wait would be too long, True
+            otherwise.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.try_take(host):
+            ready_at = self.ready_at(host)
+            if deadline is not None and ready_at > deadline:
+                return False
+            if stop.wait(max(ready_at - time.monotonic(), 0)):
+                return False
+        return not stop.is_set()
+
+    def note_result(self, host: str, result: LinkCheck, tries: int) -> bool:
+        """
+        Note the result of the /tries/th check of a link to /host/, backing
+        off if the server asked us to slow down.
+
+        Return:
+            True if the link should be checked again once the host is ready.
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(host, now)
+            if not result.throttled:
+                bucket.interval = max(bucket.interval * HOST_INTERVAL_RECOVERY,
+                                      self.interval)
+                return False
+            # Requests that were already out when the host first asked us to
+            # slow down don't make us slow down further.
+            if bucket.updated <= now:
+                bucket.interval = min(max(bucket.interval * 2, THROTTLED_HOST_INTERVAL),
+                                      MAX_HOST_INTERVAL)
+            wait = (result.retry_after if result.retry_after is not None
+                    else bucket.interval)
+            if wait > MAX_RETRY_AFTER:
+                return False
+            bucket.pause(now + wait)
+            return tries <= THROTTLE_RETRIES
+
+
+def _interleave(groups: List[List]) -> List:
+    "Return the items of /groups/, taking one from each group in turn."
+    interleaved = []
+    for i in range(max((len(group) for group in groups), default=0)):
+        interleaved.extend(group[i] for group in groups if i < len(group))
+    return interleaved
+
+
+class _SetAside(NamedTuple):
+    "The rest of a run of scan()'s, put off until its host is ready."
+    ready_at: float
+    run: List[_Link]
+    #: times the first link of the run has been checked already
+    tries: int
 
 
 def scan(session, callback: Callable[[int, int, LinkCheck], None],
          only_failures: bool = False,
-         canceled: Optional[Callable[[], bool]] = None) -> None:
+         canceled: Optional[Callable[[], bool]] = None,
+         max_age: Optional[timedelta] = None,
+         host_interval: float = MIN_HOST_INTERVAL) -> ConnectionStats:
     """
     Retrieve all bookmarks from the session /session/ and check their URLs in
     parallel. Whenever a result comes back, call the /callback/ function of
     three parameters with the number of the current item (indexed by time),
-    the total number of items, and the LinkCheck object.
+    the total number of items, and the LinkCheck object. Each result is saved
+    in the database, and the session committed.
 
     If /only_failures/ is set, only items which have failed will trigger a
     callback; the items with no issues will never be returned to the caller.
 
-    If /canceled/ is provided, it is called before processing each result.
-    When it returns True, remaining futures are canceled and the scan exits
-    early. Already-running requests finish naturally (bounded by their timeout).
+    If /canceled/ is provided, it is called before processing each result,
+    and every CANCEL_POLL_INTERVAL seconds while none are coming in. When it
+    returns True, remaining futures are canceled and the scan exits early.
+    Already-running requests finish naturally (bounded by their timeout).
+
+    If /max_age/ is provided, only links that failed or weren't checked the
+    last time, or that were last checked about that long ago or longer, are
+    checked (see configured_max_age()).
+
+    No host is sent requests more often than every /host_interval/ seconds,
+    or more often than it asks (see _HostLimiter). A thread doesn't wait
+    long for a host that asked us to slow down, but sets the rest of its
+    run aside to be picked up again when the host is ready (see
+    MAX_THREAD_WAIT), so that one slow host can't hold up the others.
+
+    Return:
+        How many requests were made and connections opened.
     """
-    # pylint: disable=singleton-comparison
-    marks = session.query(Bookmark).filter(Bookmark.skip_linkcheck == False).all()
+    links = _links_to_check(session, max_age)
+
+    # Each thread is handed a run of links to the same host, which it checks
+    # one after another over the same connection. The runs of different
+    # hosts take turns, so that the threads are spread over as many hosts as
+    # they can be rather than all waiting their turn at one.
+    by_host: Dict[str, List[_Link]] = {}
+    for link in links:
+        by_host.setdefault(_host_of(link.url), []).append(link)
+    runs = _interleave([[host_links[i:i + THREAD_RUN]
+                         for i in range(0, len(host_links), THREAD_RUN)]
+                        for host_links in by_host.values()])
+
+    results: queue.Queue = queue.Queue()
+    stop = threading.Event()
+    sessions = _ThreadSessions()
+    limiter = _HostLimiter(host_interval)
+    writer = _ResultWriter(session)
+
+    def check_run(run: List[_Link], tries: int = 0) -> None:
+        try:
+            for i, link in enumerate(run):
+                host = _host_of(link.url)
+                while True:
+                    if not limiter.wait(host, stop, MAX_THREAD_WAIT):
+                        if not stop.is_set():
+                            results.put(_SetAside(limiter.ready_at(host), run[i:],
+                                                  tries))
+                        return
+                    result = _check(link, sessions)
+                    tries += 1
+                    if not limiter.note_result(host, result, tries):
+                        break
+                results.put(result)
+                tries = 0
+        except Exception as e:  # pylint: disable=broad-except
+            results.put(e)      # to be raised in the scanning thread
+
+    # (ready_at, order set aside, run, tries), soonest first
+    set_aside: List[Tuple[float, int, List[_Link], int]] = []
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=THREADS) as executor:
+            futures = [executor.submit(check_run, run) for run in runs]
+            idx = 0
+            while idx < len(links):
+                now = time.monotonic()
+                while set_aside and set_aside[0][0] <= now:
+                    _, _, run, tries = heapq.heappop(set_aside)
+                    futures.append(executor.submit(check_run, run, tries))
+                timeout = None if not set_aside else set_aside[0][0] - now
+                if canceled is not None:
+                    timeout = min(timeout or CANCEL_POLL_INTERVAL, CANCEL_POLL_INTERVAL)
+                try:
+                    result = results.get(timeout=timeout)
+                except queue.Empty:
+                    result = None
+                if canceled is not None and canceled():
+                    stop.set()
+                    for f in futures:
+                        f.cancel()
+                    break
+                if result is None:
+                    continue
+                if isinstance(result, _SetAside):
+                    heapq.heappush(set_aside, (result.ready_at, len(futures),
+                                               result.run, result.tries))
+                    continue
+                if isinstance(result, Exception):
+                    stop.set()
+                    raise result
+                idx += 1
+                writer.add(result)
+                if (not result.successful) or (not only_failures):
+                    callback(idx, len(links), result)
+    finally:
+        writer.close()
+    sessions.close()
+    return sessions.stats()
+
+
+### Asynchronous checking ###
+class _BadResponse(Exception):
+    "The server said something that isn't HTTP."
+
+
+class _TooManyRedirects(Exception):
+    pass
+
+
+class _Response(NamedTuple):
+    status_code: int
+    reason: str
+    headers: Dict[str, str]
+    keep_alive: bool
+
+
+def _request_target(url: str) -> Tuple[str, str, int, str]:
+    """
+    Split /url/ into what's needed to request it: its scheme, host (encoded
+    for DNS), port, and the path and query to ask for, quoted as requests
+    would quote them.
+
+    Raises:
+        ValueError if the URL can't be requested over HTTP.
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in ('http', 'https'):
+        raise ValueError(f"No connection adapters were found for {url!r}")
+    if not parts.hostname:
+        raise ValueError(f"Invalid URL {url!r}: No host supplied")
+    host = parts.hostname.encode('idna').decode('ascii')
+    port = parts.port or (443 if scheme == 'https' else 80)
+    target = parts.path or '/'
+    if parts.query:
+        target += '?' + parts.query
+    return scheme, host, port, quote(target, safe="!#$%&'()*+,/:;=?@[]~")
+
+
+_Stream = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+_Origin = Tuple[str, str, int]  # scheme, host, port
+
+
+class _Connector:
+    """
+    Opens the connections for one scan's requests and keeps them open
+    between requests, up to MAX_IDLE_CONNECTIONS in all (closing the one
+    left idle longest to make room). Each host's addresses are looked up
+    only once, too: asyncio asks the system's resolver in a small pool of
+    threads, where thousands of lookups would wait in line.
+    """
+    def __init__(self, max_idle: int = MAX_IDLE_CONNECTIONS) -> None:
+        self.ssl_context = ssl.create_default_context()
+        self.stats = ConnectionStats()
+        self.max_idle = max_idle
+        self._lookups: Dict[Tuple[str, int], asyncio.Future] = {}
+        #: connections not in use, by origin, the origin used longest ago first
+        self._idle: Dict[_Origin, List[_Stream]] = {}
+        self._idle_count = 0
+
+    async def _addresses(self, host: str, port: int) -> List[str]:
+        if (host, port) not in self._lookups:
+            loop = asyncio.get_running_loop()
+            self._lookups[host, port] = asyncio.ensure_future(
+                loop.getaddrinfo(host, port, type=socket.SOCK_STREAM))
+        # Shielded so that a request timing out doesn't cancel the lookup
+        # for the others waiting on it.
+        infos = await asyncio.shield(self._lookups[host, port])
+        return list(dict.fromkeys(i[4][0] for i in infos))
+
+    async def open(self, origin: _Origin) -> _Stream:
+        """
+        Open a new connection to /origin/'s host, trying each of its
+        addresses in turn, over TLS if its scheme is https.
+
+        Raises:
+            OSError (including ssl.SSLError) if no connection could be made.
+        """
+        scheme, host, port = origin
+        tls = scheme == 'https'
+        error: OSError = OSError(f"No addresses found for {host}")
+        for address in await self._addresses(host, port):
+            try:
+                stream = await asyncio.open_connection(
+                    address, port, ssl=self.ssl_context if tls else None,
+                    server_hostname=host if tls else None)
+            except ssl.SSLError:
+                raise
+            except OSError as e:
+                error = e
+            else:
+                self.stats.connections += 1
+                return stream
+        raise error
+
+    def take_idle(self, origin: _Origin) -> Optional[_Stream]:
+        "Return a connection to /origin/ left open by an earlier request, if any."
+        streams = self._idle.get(origin)
+        while streams:
+            reader, writer = streams.pop()
+            self._idle_count -= 1
+            if not streams:
+                del self._idle[origin]
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer
+            writer.close()
+        return None
+
+    def put_idle(self, origin: _Origin, stream: _Stream) -> None:
+        "Keep /stream/ open for the next request to /origin/."
+        streams = self._idle.pop(origin, [])
+        streams.append(stream)
+        self._idle[origin] = streams
+        self._idle_count += 1
+        while self._idle_count > self.max_idle:
+            oldest = next(iter(self._idle))
+            self.take_idle(oldest)[1].close()  # type: ignore[index]
+
+    def close(self) -> None:
+        "Close every connection left open."
+        for streams in self._idle.values():
+            for _, writer in streams:
+                writer.close()
+        self._idle.clear()
+        self._idle_count = 0
+
+
+async def _exchange(stream: _Stream, target: str, host_header: str,
+                    extra_headers: Dict[str, str]) -> _Response:
+    """
+    Send a HEAD request for /target/ over /stream/, with /extra_headers/ as
+    well as the usual ones, and read the response.
+
+    Raises:
+        EOFError if the server closed the connection without answering,
+        _BadResponse if the answer isn't HTTP, or OSError.
+    """
+    reader, writer = stream
+    request_headers = {'Host': host_header,
+                       'User-Agent': _get_user_agent(),
+                       'Accept': '*/*',
+                       **extra_headers,
+                       'Connection': 'keep-alive'}
+    writer.write((f"HEAD {target} HTTP/1.1\r\n"
+                  + ''.join(f"{k}: {v}\r\n" for k, v in request_headers.items())
+                  + "\r\n").encode('latin-1'))
+    await writer.drain()
+
+    status_line = (await reader.readline()).decode('latin-1').rstrip('\r\n')
+    if not status_line and reader.at_eof():
+        raise EOFError("Connection closed without a response")
+    version, _, rest = status_line.partition(' ')
+    code, _, reason = rest.partition(' ')
+    if not version.startswith('HTTP/') or not code.isdigit():
+        raise _BadResponse(f"Bad status line: {status_line[:80]!r}")
+
+    headers: Dict[str, str] = {}
+    for _ in range(MAX_HEADERS):
+        line = (await reader.readline()).decode('latin-1').rstrip('\r\n')
+        if not line:
+            break
+        key, _, value = line.partition(':')
+        headers[key.strip().lower()] = value.strip()
+    else:
+        raise _BadResponse(f"Got more than {MAX_HEADERS} headers")
+    # A response to HEAD never has a body, so once the headers are read the
+    # connection is ready for the next request, unless the server is closing it.
+    keep_alive = (version == 'HTTP/1.1'
+                  and 'close' not in headers.get('connection', '').lower())
+    return _Response(int(code), reason, headers, keep_alive)
+
+
+async def _head(url: str, connector: _Connector,
+                extra_headers: Dict[str, str]) -> _Response:
+    """
+    Make a single HEAD request for /url/, with /extra_headers/, not following
+    any redirect, over a connection left open by an earlier request to the
+    same host if there is one.
+
+    Raises:
+        ValueError if the URL is invalid, _BadResponse if the answer isn't
+        HTTP, or whatever opening the connection raises.
+    """
+    scheme, host, port, target = _request_target(url)
+    default_port = 443 if scheme == 'https' else 80
+    host_header = host if port == default_port else f"{host}:{port}"
+    origin = (scheme, host, port)
+    connector.stats.requests += 1
+    while True:
+        stream = connector.take_idle(origin)
+        reused = stream is not None
+        if stream is None:
+            stream = await connector.open(origin)
+        try:
+            response = await _exchange(stream, target, host_header, extra_headers)
+        except (OSError, EOFError, _BadResponse):
+            stream[1].close()
+            if reused:
+                # The server gave up on the connection while it sat idle;
+                # try again on a new one.
+                continue
+            raise
+        except BaseException:
+            stream[1].close()
+            raise
+        if response.keep_alive:
+            connector.put_idle(origin, stream)
+        else:
+            stream[1].close()
+        return response
+
+
+async def _head_following_redirects(url: str, connector: _Connector,
+                                    extra_headers: Dict[str, str]
+                                    ) -> Tuple[str, _Response]:
+    """
+    Make HEAD requests for /url/ and wherever it redirects to, with
+    /extra_headers/ and timing out each one.
+
+    Return:
+        The URL the last request was for, and its response.
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        response = await asyncio.wait_for(_head(url, connector, extra_headers), TIMEOUT)
+        location = response.headers.get('location')
+        if response.status_code not in (301, 302, 303, 307, 308) or not location:
+            return url, response
+        url = urljoin(url, location)
+    raise _TooManyRedirects()
+
+
+# pylint: disable=too-many-return-statements
+async def _check_async(link: _Link, connector: _Connector) -> LinkCheck:
+    """
+    Check /link/ as _check() does, but without tying up a thread while
+    waiting for the server, and return a LinkCheck object with the results.
+    """
+    pk, name, url, validators = link
+    start = time.perf_counter()
+    try:
+        final_url, r = await _head_following_redirects(
+            url, connector, validators.headers() if validators is not None else {})
+    except ssl.SSLError:
+        return LinkCheck(pk, name, url, None, "Invalid SSL certificate")
+    except asyncio.TimeoutError:
+        return LinkCheck(pk, name, url, None, "Timed out")
+    except _TooManyRedirects:
+        return LinkCheck(pk, name, url, None, "Redirect loop")
+    except (OSError, EOFError):
+        return LinkCheck(pk, name, url, None, "Connection error")
+    except (ValueError, UnicodeError, _BadResponse) as e:
+        return LinkCheck(pk, name, url, None, str(e))
+    else:
+        return _answered(link, r.status_code, r.reason, r.headers,
+                         time.perf_counter() - start, final_url)
+
+
+def _host_of(url: str) -> str:
+    "Return the host (and port) a request for /url/ goes to first, or '' if none."
+    try:
+        return urlsplit(url).netloc.lower()
+    except ValueError:
+        return ''
 
-    futures = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=15) as executor:
-        for mark in marks:
-            future = executor.submit(_check, pk=mark.id, name=mark.name, url=mark.url)
-            futures.append(future)
 
-        for idx, fut in enumerate(concurrent.futures.as_completed(futures), 1):
+class _HostScheduler:
+    """
+    Decides which link scan_concurrent() checks next.
+
+    Links are queued by host. A host is "ready" while it has links queued
+    and fewer than /max_per_host/ requests out, and ready hosts take turns,
+    so that requests are spread over as many hosts as there are rather than
+    going to each in turn as bookmarks of it come up. A host whose token
+    bucket (see _HostLimiter) is empty waits aside until it has a token
+    again, while the others carry on. The exception is that when a request
+    finishes, the next link of the same host goes first if the bucket
+    allows, so as to reuse the connection it just freed.
+    """
+    def __init__(self, links: List[_Link], max_per_host: int,
+                 limiter: _HostLimiter) -> None:
+        self.max_per_host = max_per_host
+        self.limiter = limiter
+        self._queues: Dict[str, Deque[_Link]] = {}
+        for link in links:
+            self._queues.setdefault(_host_of(link.url), deque()).append(link)
+        self._out: Dict[str, int] = dict.fromkeys(self._queues, 0)
+        self._ready: Deque[str] = deque(self._queues)
+        #: hosts waiting for a token, by the time they'll have one
+        self._waiting: List[Tuple[float, str]] = []
+        #: hosts that are ready or waiting
+        self._scheduled: Set[str] = set(self._queues)
+        #: hosts whose requests just finished, which go first if they can
+        self._handoffs: Deque[str] = deque()
+        self._tries: Dict[int, int] = {}
+
+    def _schedule(self, host: str) -> None:
+        if (host not in self._scheduled and self._queues[host]
+                and self._out[host] < self.max_per_host):
+            self._scheduled.add(host)
+            self._ready.append(host)
+
+    def _start(self, host: str) -> _Link:
+        self._out[host] += 1
+        return self._queues[host].popleft()
+
+    def take(self) -> Optional[_Link]:
+        "Return the next link to check, or None if no host can be sent a request now."
+        # A host whose request just finished can be sent the next one over
+        # the same connection straight away, if its bucket allows.
+        while self._handoffs:
+            host = self._handoffs.popleft()
+            if (self._queues[host] and self._out[host] < self.max_per_host
+                    and self.limiter.try_take(host)):
+                return self._start(host)
+
+        now = time.monotonic()
+        while self._waiting and self._waiting[0][0] <= now:
+            self._ready.append(heapq.heappop(self._waiting)[1])
+        while self._ready:
+            host = self._ready.popleft()
+            if not self._queues[host] or self._out[host] >= self.max_per_host:
+                self._scheduled.discard(host)
+            elif not self.limiter.try_take(host):
+                heapq.heappush(self._waiting, (self.limiter.ready_at(host), host))
+            else:
+                link = self._start(host)
+                self._scheduled.discard(host)
+                self._schedule(host)
+                return link
+        return None
+
+    def done(self, link: _Link, result: LinkCheck) -> bool:
+        """
+        Note that checking /link/ gave /result/.
+
+        Return:
+            False if the server asked us to slow down and the link has been
+            queued to be checked again, True if /result/ is final.
+        """
+        host = _host_of(link.url)
+        self._out[host] -= 1
+        tries = self._tries[link.pk] = self._tries.get(link.pk, 0) + 1
+        retry = self.limiter.note_result(host, result, tries)
+        if retry:
+            self._queues[host].appendleft(link)
+        self._handoffs.append(host)
+        self._schedule(host)
+        return not retry
+
+    def next_ready_in(self) -> Optional[float]:
+        """
+        Return the seconds until a waiting host has a token, or None if none
+        are waiting.
+        """
+        if not self._waiting:
+            return None
+        return max(self._waiting[0][0] - time.monotonic(), 0.0)
+
+
+# pylint: disable=too-many-arguments
+async def _scan_async(links: List[_Link],
+                      callback: Callable[[int, int, LinkCheck], None],
+                      only_failures: bool,
+                      canceled: Optional[Callable[[], bool]],
+                      max_connections: int, scheduler: _HostScheduler,
+                      writer: _ResultWriter) -> ConnectionStats:
+    """
+    Check each of /links/ as scan_concurrent() describes, in the order
+    /scheduler/ gives them, saving the results with /writer/.
+    """
+    connector = _Connector()
+    link_of_task: Dict[asyncio.Task, _Link] = {}
+    running: Set[asyncio.Task] = set()
+
+    def start_requests() -> None:
+        while len(running) < max_connections:
+            link = scheduler.take()
+            if link is None:
+                return
+            task = asyncio.ensure_future(_check_async(link, connector))
+            running.add(task)
+            link_of_task[task] = link
+
+    finished = 0
+    try:
+        start_requests()
+        while finished < len(links):
+            timeout = CANCEL_POLL_INTERVAL
+            ready_in = scheduler.next_ready_in()
+            if ready_in is not None:
+                timeout = min(timeout, ready_in)
+            if running:
+                done, _ = await asyncio.wait(running, timeout=timeout,
+                                             return_when=asyncio.FIRST_COMPLETED)
+            else:
+                await asyncio.sleep(timeout)
+                done = set()
             if canceled is not None and canceled():
-                for f in futures:
-                    f.cancel()
-                break
-            if (not fut.result().successful) or (not only_failures):
-                callback(idx, len(marks), fut.result())
+                return connector.stats
+            for task in done:
+                running.remove(task)
+                result = task.result()
+                if not scheduler.done(link_of_task.pop(task), result):
+                    continue
+                finished += 1
+                writer.add(result)
+                if (not result.successful) or (not only_failures):
+                    callback(finished, len(links), result)
+            start_requests()
+        return connector.stats
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.wait(running)
+        connector.close()
+
+
+def scan_concurrent(session, callback: Callable[[int, int, LinkCheck], None],
+                    only_failures: bool = False,
+                    canceled: Optional[Callable[[], bool]] = None,
+                    max_connections: int = MAX_CONNECTIONS,
+                    max_per_host: int = MAX_PER_HOST,
+                    max_age: Optional[timedelta] = None,
+                    host_interval: float = MIN_HOST_INTERVAL) -> ConnectionStats:
+    """
+    Check the URLs of all bookmarks from the session /session/ as scan()
+    does, calling /callback/ in the same way, but with asyncio in this
+    thread, with up to /max_connections/ requests out at once and no more
+    than /max_per_host/ of them to any one host. Redirects to other hosts
+    don't count towards the limit of the host redirected to.
+
+    If /canceled/ is provided, it is called as each result comes back and
+    every so often in between. When it returns True, requests still out
+    are abandoned and the scan exits early.
+
+    Results are saved, links checked only if due given /max_age/, and
+    requests to each host kept at least /host_interval/ seconds apart, as
+    scan() does. Hosts take turns (see _HostScheduler), so waiting for one
+    doesn't hold up the others.
+
+    Return:
+        How many requests were made and connections opened.
+    """
+    links = _links_to_check(session, max_age)
+    writer = _ResultWriter(session)
+    try:
+        scheduler = _HostScheduler(links, max_per_host, _HostLimiter(host_interval))
+        return asyncio.run(_scan_async(links, callback, only_failures, canceled,
+                                       max_connections, scheduler, writer))
+    finally:
+        writer.close()
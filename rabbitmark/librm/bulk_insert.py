@@ -0,0 +1,156 @@
+"""
+bulk_insert.py - add many bookmarks at once, as importers do
+
+Adding a bookmark with bookmark.add_bookmark() takes a few queries -- is the
+URL there already? does each of its tags exist? -- plus the ORM's
+bookkeeping for every object, which adds up to minutes when importing a
+hundred thousand bookmarks. A BulkInserter instead reads the URLs and tags
+already in the database once, checks new bookmarks against those in memory,
+and writes them out in batches, with one executemany() per table per batch.
+
+As the rows are written with SQLAlchemy Core rather than the ORM, what the
+ORM would otherwise see to is done here: the normalized URL (see
+url_key.py), a unique name, staging each bookmark for the bookmark index,
+and telling generation.py the database changed. Tag counts and the full-text
+indexes are kept up to date by their triggers as usual.
+"""
+
+from contextlib import contextmanager
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+from sqlalchemy import insert, select
+
+from . import bookmark
+from . import bookmark_index
+from . import generation
+from .models import Bookmark, Tag, mark_tag_assoc
+from .url_key import normalize_url
+
+#: values looked up with a single IN (...) query; well below SQLite's limit on
+#: the number of parameters to a statement
+LOOKUP_BATCH = 500
+
+
+class BulkInserter:
+    """
+    Bookmarks waiting to be written to the database /session/ uses, and the
+    URLs and tags already there. Create one with bulk_insert().
+    """
+    def __init__(self, session) -> None:
+        self.session = session
+        self._urls: Set[str] = set()
+        self._url_keys: Set[str] = set()
+        for url, url_key in session.execute(select(Bookmark.url, Bookmark.url_key)):
+            self._urls.add(url)
+            self._url_keys.add(url_key)
+        self._tag_ids: Dict[str, int] = dict(
+            session.execute(select(Tag.text, Tag.id)).all())
+        self._pending: List[Dict[str, Any]] = []
+        self._pending_tags: List[Tuple[str, ...]] = []
+
+    def __len__(self) -> int:
+        "Return the number of bookmarks added but not yet written."
+        return len(self._pending)
+
+    def is_duplicate(self, url: str) -> bool:
+        """
+        Is there already a bookmark, or one waiting to be written, with
+        exactly the URL /url/?
+        """
+        return url in self._urls
+
+    def add(self, url: str, tags: Iterable[str],
+            name: str = "New Bookmark", description: str = "",
+            private: bool = False) -> bool:
+        """
+        Add a new bookmark using the provided starting fields, as
+        bookmark.add_bookmark() does. It isn't written to the database, or
+        given a unique name, until the next flush().
+
+        Return:
+            True if there's already a bookmark, or one waiting to be written,
+            with a URL that's nearly the same as /url/ (see
+            bookmark.find_near_duplicates()).
+        """
+        url_key = normalize_url(url)
+        near_duplicate = url_key in self._url_keys
+        self._urls.add(url)
+        self._url_keys.add(url_key)
+        self._pending.append({
+            'name': name,
+            'url': url,
+            'url_key': url_key,
+            'description': description,
+            'private': private,
+            'skip_linkcheck': False,
+        })
+        self._pending_tags.append(tuple(dict.fromkeys(tags)))
+        return near_duplicate
+
+    def _lookup(self, key_column, value_column, keys: Sequence) -> Iterator[Tuple]:
+        "Yield (key, value) for the rows whose /key_column/ is one of /keys/."
+        for start in range(0, len(keys), LOOKUP_BATCH):
+            yield from self.session.execute(
+                select(key_column, value_column)
+                .where(key_column.in_(keys[start:start + LOOKUP_BATCH])))
+
+    def flush(self) -> int:
+        """
+        Write the bookmarks added since the last flush, creating any tags they
+        use that don't exist yet. The changes aren't committed.
+
+        Return:
+            The number of bookmarks written.
+        """
+        if not self._pending:
+            return 0
+        session = self.session
+
+        # Most names in an import are new, and finding that out for all of
+        # them at once saves a query apiece.
+        bookmark.prefetch_names(session, [i['name'] for i in self._pending])
+        for mark in self._pending:
+            mark['name'] = bookmark._uniquify_name(  # pylint: disable=protected-access
+                session, mark['name'])
+
+        new_tags = [i for i in dict.fromkeys(chain.from_iterable(self._pending_tags))
+                    if i not in self._tag_ids]
+        if new_tags:
+            session.execute(insert(Tag.__table__), [{'text': i} for i in new_tags])
+            self._tag_ids.update(self._lookup(Tag.text, Tag.id, new_tags))
+
+        # Names are unique, so they identify the new rows.
+        session.execute(insert(Bookmark.__table__), self._pending)
+        names = [i['name'] for i in self._pending]
+        mark_ids = dict(self._lookup(Bookmark.name, Bookmark.id, names))
+
+        assoc = [{'mark_id': mark_ids[name], 'tag_id': self._tag_ids[tag]}
+                 for name, tags in zip(names, self._pending_tags)
+                 for tag in tags]
+        if assoc:
+            session.execute(insert(mark_tag_assoc), assoc)
+
+        for mark, tags in zip(self._pending, self._pending_tags):
+            bookmark_index.stage_op(session, 'mark', mark_ids[mark['name']],
+                                    frozenset(tags), mark['private'])
+        generation.note_changes(session)
+
+        written = len(self._pending)
+        self._pending = []
+        self._pending_tags = []
+        return written
+
+
+@contextmanager
+def bulk_insert(session) -> Iterator[BulkInserter]:
+    """
+    Within this block, add bookmarks to /session/'s database through the
+    BulkInserter yielded, flushing it every so often. Bookmarks not yet
+    flushed at the end of the block are discarded.
+
+    Nothing else may add or name bookmarks in the database during the block
+    (see bookmark.names_batch()).
+    """
+    with bookmark.names_batch(session):
+        yield BulkInserter(session)
@@ -11,6 +11,10 @@ from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
+from . import fulltext
+from . import generation
+from . import migrations
+from . import tag_counts
 from .models import Base
 
 
@@ -55,4 +59,8 @@ def make_Session() -> sessionmaker:
     engine = create_engine(sqlite_uri)
     Session = sessionmaker(bind=engine)
     Base.metadata.create_all(engine) # will not recreate existing tables/dbs
+    migrations.migrate(engine)
+    fulltext.install(engine)
+    tag_counts.install(engine)
+    generation.watch(engine)
     return Session
@@ -0,0 +1,358 @@
+"""
+dedupe.py - find bookmarks that are probably of the same page, and merge them
+
+Comparing every pair of bookmarks is out of the question in a large library,
+so find_duplicates() reads each bookmark once and works in two passes:
+
+* Bookmarks whose URLs are the same once normalized (see url_key.py), also
+  ignoring http versus https and a leading "www.", are exact duplicates.
+  SQLite hands the bookmarks over in order of that URL, so each group of
+  them comes in a row and can be reported as soon as it ends. URLs without
+  a host (empty ones, "http://", notes) aren't grouped at all.
+
+* Everything else is left to MinHash locality-sensitive hashing. Each
+  bookmark gets a short signature summarizing the overlapping four-letter
+  pieces of its name and the words of its normalized URL, and another for
+  its description if it has a long one. The fraction of two signatures that
+  agree estimates how much the two sets of pieces overlap (their Jaccard
+  similarity). Cutting the signatures into bands and bucketing bookmarks by
+  each band finds the pairs likely to be similar without looking at any of
+  the rest; only those pairs are compared.
+
+Signatures are computed with one-permutation hashing -- each piece is hashed
+once and lands in one slot of the signature -- so the time taken grows with
+the length of the text rather than the length times the signature size.
+Apart from SQLite's sort, both passes take time proportional to the number
+of bookmarks.
+"""
+
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations
+from operator import eq
+import re
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+import zlib
+
+from sqlalchemy import case, func, select
+
+from . import bookmark
+from . import tag as tag_ops
+from .models import Bookmark
+
+#: slots in each signature; a power of two
+SIGNATURE_SIZE = 32
+
+#: slots in each band of a signature; bookmarks whose signatures agree in
+#: every slot of any one band are compared. With 8 bands of 4, pairs with a
+#: similarity of 0.7 are found 87% of the time, 0.8 97% of the time, and 0.3
+#: only 6% of the time.
+BAND_SIZE = 4
+
+#: estimated similarity at which two bookmarks count as near-duplicates
+SIMILARITY_THRESHOLD = 0.7
+
+#: descriptions with fewer words than this aren't compared; short ones are
+#: too often boilerplate ("Read later.")
+DESCRIPTION_MIN_WORDS = 8
+
+#: words of a description looked at, at most
+DESCRIPTION_MAX_WORDS = 200
+
+#: bookmarks sharing a band beyond this many are all alike in some dull way
+#: (a common name, say) and aren't compared with each other on its account
+MAX_BUCKET = 50
+
+#: hashes of pieces of text remembered
+HASH_CACHE_SIZE = 1 << 18
+
+#: bookmarks read from the database at a time
+READ_BATCH = 1000
+
+#: called with (bookmarks read, bookmarks in all) as the search progresses
+ProgressCallback = Callable[[int, int], None]
+
+_EMPTY = 0x10000
+_WORD = re.compile(r'\w+')
+_SCHEME_AND_WWW = re.compile(r'^https?://(www\.)?', re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class DuplicateGroup:
+    """
+    Bookmarks that are probably of the same page, by ID, oldest first.
+    /exact/ is True if their URLs are all the same once normalized; if not,
+    /similarity/ is the lowest estimated similarity (from 0 to 1) of the
+    pairs of them that were matched up.
+    """
+    ids: Tuple[int, ...]
+    exact: bool
+    similarity: float
+
+
+### Signatures ###
+# The same pieces of text turn up again and again, and mixing in Python is
+# slow compared to looking them up.
+@lru_cache(maxsize=HASH_CACHE_SIZE)
+def _hash(feature: str) -> int:
+    "Return a well-mixed 32-bit hash of /feature/ that's the same in every run."
+    h = zlib.crc32(feature.encode('utf-8', 'surrogatepass'))
+    h = ((h ^ (h >> 16)) * 0x85EBCA6B) & 0xFFFFFFFF
+    h = ((h ^ (h >> 13)) * 0xC2B2AE35) & 0xFFFFFFFF
+    return h ^ (h >> 16)
+
+
+def _signature(features: Iterable[str]) -> Optional[List[int]]:
+    """
+    Return the one-permutation MinHash signature of the set /features/, as
+    SIGNATURE_SIZE 16-bit values, or None if there are no features. Each
+    feature's hash picks a slot with its low bits and competes for the
+    smallest value there with its high bits. Slots no feature landed in
+    borrow the value of the next filled slot, shifted by the distance to it
+    so that they don't all agree by accident.
+    """
+    slots = [_EMPTY] * SIGNATURE_SIZE
+    for feature in features:
+        h = _hash(feature)
+        slot = h & (SIGNATURE_SIZE - 1)
+        value = h >> 16
+        if value < slots[slot]:
+            slots[slot] = value
+    if all(i == _EMPTY for i in slots):
+        return None
+    for slot in range(SIGNATURE_SIZE):
+        if slots[slot] == _EMPTY:
+            distance = 1
+            while slots[(slot + distance) % SIGNATURE_SIZE] == _EMPTY:
+                distance += 1
+            borrowed = slots[(slot + distance) % SIGNATURE_SIZE]
+            slots[slot] = (borrowed + distance * 0x9E37) & 0xFFFF
+    return slots
+
+
+def _name_features(name: str, url_key: str) -> Iterator[str]:
+    "Yield the pieces of a bookmark's name and URL that its main signature summarizes."
+    text = ' '.join(_WORD.findall(name.lower()))
+    if len(text) <= 4:
+        yield 'n' + text
+    for i in range(len(text) - 3):
+        yield 'n' + text[i:i + 4]
+    for word in _WORD.findall(_SCHEME_AND_WWW.sub('', url_key).lower()):
+        yield 'u' + word
+
+
+def _description_features(description: str) -> Optional[List[str]]:
+    """
+    Return the pairs of adjacent words in /description/, or None if it's
+    too short to compare.
+    """
+    words = _WORD.findall(description.lower())[:DESCRIPTION_MAX_WORDS]
+    if len(words) < DESCRIPTION_MIN_WORDS:
+        return None
+    return [f"{first} {second}" for first, second in zip(words, words[1:])]
+
+
+def _has_host(url_key: str) -> bool:
+    """
+    Is /url_key/ a URL with a host? Empty and placeholder URLs ("http://")
+    and notes that aren't URLs at all say nothing about what page a bookmark
+    is of.
+    """
+    try:
+        return bool(urlsplit(url_key).netloc)
+    except ValueError:
+        return False
+
+
+def _exact_key(url_key: str) -> str:
+    return _SCHEME_AND_WWW.sub('', url_key)
+
+
+#: _exact_key() in SQL, so that bookmarks can be read in order of it
+_EXACT_KEY_SQL = case(
+    (Bookmark.url_key.like('https://www.%'), func.substr(Bookmark.url_key, 13)),
+    (Bookmark.url_key.like('http://www.%'), func.substr(Bookmark.url_key, 12)),
+    (Bookmark.url_key.like('https://%'), func.substr(Bookmark.url_key, 9)),
+    (Bookmark.url_key.like('http://%'), func.substr(Bookmark.url_key, 8)),
+    else_=Bookmark.url_key)
+
+
+class _Signatures:
+    "The signatures of many bookmarks, packed into one array."
+    def __init__(self) -> None:
+        self.values = array('H')
+        self.owners = array('q')    # index of the bookmark each belongs to
+        self.where: Dict[int, int] = {}
+
+    def add(self, owner: int, signature: List[int]) -> None:
+        self.where[owner] = len(self.owners)
+        self.owners.append(owner)
+        self.values.extend(signature)
+
+    def similarity(self, first: int, second: int) -> float:
+        "Return the estimated similarity of two bookmarks, or 0 if either is missing."
+        if first not in self.where or second not in self.where:
+            return 0.0
+        a = self.where[first] * SIGNATURE_SIZE
+        b = self.where[second] * SIGNATURE_SIZE
+        same = sum(map(eq, self.values[a:a + SIGNATURE_SIZE],
+                       self.values[b:b + SIGNATURE_SIZE]))
+        return same / SIGNATURE_SIZE
+
+    def candidates(self) -> Iterator[Tuple[int, int]]:
+        "Yield the pairs of bookmarks that share a band, with repeats."
+        for start in range(0, SIGNATURE_SIZE, BAND_SIZE):
+            buckets: Dict[bytes, List[int]] = {}
+            for i, owner in enumerate(self.owners):
+                offset = i * SIGNATURE_SIZE + start
+                band = self.values[offset:offset + BAND_SIZE].tobytes()
+                buckets.setdefault(band, []).append(owner)
+            for members in buckets.values():
+                if 1 < len(members) <= MAX_BUCKET:
+                    yield from combinations(members, 2)
+
+
+class _Groups:
+    """
+    Union-find over the indexes of bookmarks that have been joined to
+    another, noting the lowest similarity of the pairs joining each group.
+    """
+    def __init__(self) -> None:
+        self.parent: Dict[int, int] = {}
+        self.similarity: Dict[int, float] = {}
+
+    def find(self, i: int) -> int:
+        root = i
+        while self.parent.get(root, root) != root:
+            root = self.parent[root]
+        while i != root:
+            self.parent[i], i = root, self.parent[i]
+        return root
+
+    def join(self, first: int, second: int, similarity: float) -> None:
+        self.parent.setdefault(first, first)
+        self.parent.setdefault(second, second)
+        a, b = self.find(first), self.find(second)
+        lowest = min(similarity, self.similarity.get(a, 1.0),
+                     self.similarity.get(b, 1.0))
+        if a != b:
+            self.parent[b] = a
+        self.similarity[a] = lowest
+
+
+### Finding ###
+def find_duplicates(session, threshold: float = SIMILARITY_THRESHOLD,
+                    progress: Optional[ProgressCallback] = None,
+                    canceled: Optional[Callable[[], bool]] = None
+                    ) -> Iterator[DuplicateGroup]:
+    """
+    Yield groups of bookmarks that are probably of the same page: those
+    whose URLs are the same once normalized, and those whose names and
+    URLs, or long descriptions, have an estimated similarity of at least
+    /threshold/. The bookmarks themselves aren't loaded; look them up by ID
+    as each group comes.
+
+    Bookmarks are read in order of their URLs, so each group of exact
+    duplicates is yielded as soon as the last of it has been read; groups
+    of near-duplicates follow once every bookmark has been. Only the oldest
+    of a group of exact duplicates is compared with the others, so a group
+    of near-duplicates may include it. Bookmarks whose URLs have no host are
+    never exact duplicates, and are compared by name and description only.
+
+    Near-duplicates are found by chance, if very reliably for pairs well
+    above the threshold (see BAND_SIZE), but a group is never reported
+    unless the pairs joining it were checked.
+
+    Parameters:
+        session - Database session to search
+        threshold - Estimated similarity at which bookmarks are near-duplicates
+        progress - If provided, called as bookmarks are read with the number
+            read so far and the number in all.
+        canceled - If provided, called as bookmarks are read; when it
+            returns True, the search stops without yielding anything more.
+    """
+    total = session.query(func.count(Bookmark.id)).scalar()
+    ids = array('q')
+    groups = _Groups()
+    names = _Signatures()
+    descriptions = _Signatures()
+    #: the bookmarks read so far with the same URL as the last one read
+    same_url: List[int] = []
+    last_key: Optional[str] = None
+
+    query = (select(Bookmark.id, Bookmark.name, Bookmark.url_key, Bookmark.description)
+             .order_by(_EXACT_KEY_SQL, Bookmark.id)
+             .execution_options(yield_per=READ_BATCH))
+    for i, (pk, name, url_key, description) in enumerate(session.execute(query)):
+        if i % READ_BATCH == 0:
+            if canceled is not None and canceled():
+                return
+            if progress is not None:
+                progress(i, total)
+        ids.append(pk)
+        url_key = url_key or ''
+        if not _has_host(url_key):
+            url_key = ''
+            key = None
+        else:
+            key = _exact_key(url_key)
+
+        if key is not None and key == last_key:
+            # Its oldest copy stands in for it when looking for near-duplicates.
+            same_url.append(pk)
+            continue
+        if len(same_url) > 1:
+            yield DuplicateGroup(tuple(same_url), True, 1.0)
+        same_url = [pk]
+        last_key = key
+
+        signature = _signature(_name_features(name, url_key))
+        if signature is not None:
+            names.add(i, signature)
+        features = _description_features(description)
+        if features is not None:
+            signature = _signature(features)
+            if signature is not None:
+                descriptions.add(i, signature)
+    if len(same_url) > 1:
+        yield DuplicateGroup(tuple(same_url), True, 1.0)
+    if progress is not None:
+        progress(len(ids), total)
+
+    checked: Set[Tuple[int, int]] = set()
+    for signatures in (names, descriptions):
+        for pair in signatures.candidates():
+            if pair in checked or groups.find(pair[0]) == groups.find(pair[1]):
+                continue
+            checked.add(pair)
+            similarity = max(names.similarity(*pair), descriptions.similarity(*pair))
+            if similarity >= threshold:
+                groups.join(*pair, similarity)
+
+    members: Dict[int, List[int]] = {}
+    for i in groups.parent:
+        members.setdefault(groups.find(i), []).append(i)
+    found = [DuplicateGroup(tuple(sorted(ids[i] for i in indexes)), False,
+                            groups.similarity[root])
+             for root, indexes in members.items()]
+    found.sort(key=lambda group: group.ids)
+    yield from found
+
+
+### Resolving ###
+def merge_duplicates(session, keep: Bookmark, duplicates: Iterable[Bookmark]) -> None:
+    """
+    Resolve a group of duplicates by deleting /duplicates/, first giving
+    /keep/ all of their tags that it doesn't have already. Nothing else of
+    theirs is kept. The changes aren't committed.
+    """
+    duplicates = [i for i in duplicates if i.id != keep.id]
+    tags = [i.text for i in keep.tags]
+    for mark in duplicates:
+        tags.extend(i.text for i in mark.tags)
+    tag_ops.change_tags(session, keep, list(dict.fromkeys(tags)))
+    session.flush()
+    for mark in duplicates:
+        bookmark.delete_bookmark(session, mark)
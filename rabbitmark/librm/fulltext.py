@@ -0,0 +1,213 @@
+"""
+fulltext.py - SQLite FTS5 indexes over bookmark names, URLs, and descriptions
+
+There are two indexes:
+
+- The word index (FTS_TABLE) tokenizes text into words and serves the default
+  full-text filter, where each word typed is matched as a prefix.
+- The trigram index (TRIGRAM_TABLE) indexes every three-character sequence,
+  which lets it find arbitrary substrings -- fragments in the middle of words
+  and URLs -- without scanning the whole bookmarks table.
+
+Both are external-content FTS5 tables: they store only the index, reading the
+actual text out of the bookmarks table when needed, and are kept in sync with
+the bookmarks table by triggers, so no application code needs to remember to
+update them.
+"""
+
+import json
+from typing import Iterable, Optional, Sequence, Set
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import column, func, literal_column, select, table, text
+from sqlalchemy.exc import OperationalError
+
+FTS_TABLE = 'bookmarks_fts'
+TRIGRAM_TABLE = 'bookmarks_trigram'
+
+#: BM25 weights of the name, URL, and description columns when ranking
+#: matches: a word in the name counts for the most
+RANK_WEIGHTS = (10.0, 3.0, 1.0)
+
+_TOKENIZERS = {
+    FTS_TABLE: 'unicode61',
+    # Case-insensitive (for all of Unicode), so it matches a superset of what
+    # LIKE matches (case-insensitive for ASCII only).
+    TRIGRAM_TABLE: 'trigram case_sensitive 0',
+}
+
+
+def _create_table(index: str) -> str:
+    return f"""
+        CREATE VIRTUAL TABLE {index} USING fts5(
+            name, url, description,
+            content='bookmarks', content_rowid='id', tokenize='{_TOKENIZERS[index]}')
+    """
+
+
+def _create_triggers(index: str) -> Sequence[str]:
+    return (
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {index}_insert AFTER INSERT ON bookmarks
+        BEGIN
+            INSERT INTO {index}(rowid, name, url, description)
+            VALUES (new.id, new.name, new.url, new.description);
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {index}_delete AFTER DELETE ON bookmarks
+        BEGIN
+            INSERT INTO {index}({index}, rowid, name, url, description)
+            VALUES ('delete', old.id, old.name, old.url, old.description);
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {index}_update
+        AFTER UPDATE OF name, url, description ON bookmarks
+        BEGIN
+            INSERT INTO {index}({index}, rowid, name, url, description)
+            VALUES ('delete', old.id, old.name, old.url, old.description);
+            INSERT INTO {index}(rowid, name, url, description)
+            VALUES (new.id, new.name, new.url, new.description);
+        END
+        """,
+    )
+
+
+#: names of the indexes install() succeeded in creating, by engine
+_available: 'WeakKeyDictionary[object, Set[str]]' = WeakKeyDictionary()
+
+
+def _install_index(conn, index: str) -> bool:
+    exists = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {'name': index}
+    ).first()
+    if exists is None:
+        try:
+            conn.execute(text(_create_table(index)))
+        except OperationalError:
+            # This SQLite doesn't have FTS5 or (for trigram) is older than 3.34.
+            return False
+        conn.execute(text(f"INSERT INTO {index}({index}) VALUES ('rebuild')"))
+    for trigger in _create_triggers(index):
+        conn.execute(text(trigger))
+    return True
+
+
+def rebuild(conn) -> None:
+    """
+    Reindex every bookmark in the full-text indexes that exist, using the
+    SQLAlchemy connection /conn/ -- after changing the bookmarks table with
+    the triggers dropped, say.
+    """
+    for index in (FTS_TABLE, TRIGRAM_TABLE):
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {'name': index}
+        ).first()
+        if exists is not None:
+            conn.execute(text(f"INSERT INTO {index}({index}) VALUES ('rebuild')"))
+
+
+def install(engine) -> Set[str]:
+    """
+    Create the full-text indexes and their triggers on /engine/'s database if
+    they don't exist yet, indexing any bookmarks already present.
+
+    Return:
+        The set of indexes available for searching. An index is missing if
+        this SQLite doesn't support it, in which case searches fall back to
+        scanning the bookmarks table.
+    """
+    with engine.begin() as conn:
+        installed = {index for index in (FTS_TABLE, TRIGRAM_TABLE)
+                     if _install_index(conn, index)}
+    _available[engine] = installed
+    return installed
+
+
+def is_available(session, index: str = FTS_TABLE) -> bool:
+    "Return True if the full-text index /index/ can be used with /session/."
+    return index in _available.get(session.get_bind(), ())
+
+
+def _quote(phrase: str) -> str:
+    "Quote /phrase/ as an FTS5 string, so that it can't be parsed as query syntax."
+    return '"' + phrase.replace('"', '""') + '"'
+
+
+def match_expression(filter_text: str) -> Optional[str]:
+    """
+    Convert text typed into the filter box into an FTS5 query for the word
+    index. Each word becomes a quoted prefix query, and all words must match
+    (in any column and any order), so 'pyth tut' finds 'Python Tutorial'.
+    Quoting means the user can't accidentally type FTS5 syntax.
+
+    Return:
+        The query, or None if /filter_text/ has no searchable words in it
+        (e.g., it is empty or consists only of punctuation).
+
+    >>> match_expression('pyth tut')
+    '"pyth"* "tut"*'
+    >>> match_expression('  -- ') is None
+    True
+    """
+    terms = [_quote(word) + '*'
+             for word in filter_text.split()
+             if any(c.isalnum() for c in word)]
+    return ' '.join(terms) or None
+
+
+def substring_expression(filter_text: str) -> Optional[str]:
+    """
+    Convert a substring into an FTS5 query for the trigram index, which
+    matches every bookmark containing /filter_text/ -- plus, since the trigram
+    index folds non-ASCII case, possibly a few that LIKE would not match, so
+    callers wanting LIKE semantics must still apply the LIKE filter to the
+    (much smaller) set of rows that come back.
+
+    Return:
+        The query, or None if the trigram index can't answer this search:
+        it is shorter than a trigram, or it contains LIKE wildcards,
+        which the index doesn't understand.
+
+    >>> substring_expression('xiv.org/abs/23')
+    '"xiv.org/abs/23"'
+    >>> substring_expression('py') is None
+    True
+    >>> substring_expression('50%') is None
+    True
+    """
+    if len(filter_text) < 3 or '%' in filter_text or '_' in filter_text:
+        return None
+    return _quote(filter_text)
+
+
+def matching_ids(expression: str, index: str = FTS_TABLE,
+                 among: Optional[Iterable[int]] = None):
+    """
+    Return a SELECT of the IDs of bookmarks matching the FTS5 query
+    /expression/ in /index/, suitable for use with Bookmark.id.in_().
+    If /among/ is given, only those of the bookmark IDs in it are selected.
+    """
+    fts = table(index, column('rowid'), column(index))
+    query = select(fts.c.rowid).where(fts.c[index].match(expression))
+    if among is not None:
+        id_list = func.json_each(json.dumps(list(among))).table_valued('value')
+        query = query.where(fts.c.rowid.in_(select(id_list.c.value)))
+    return query
+
+
+def ranked_ids(expression: str, weights: Sequence[float] = RANK_WEIGHTS):
+    """
+    Return a subquery of the IDs of bookmarks matching the FTS5 query
+    /expression/ in the word index (column 'id') along with their BM25 rank
+    (column 'rank'), weighting the name, URL, and description columns by
+    /weights/. Lower ranks are better matches.
+    """
+    fts = table(FTS_TABLE, column('rowid'), column(FTS_TABLE))
+    return (select(fts.c.rowid.label('id'),
+                   func.bm25(literal_column(FTS_TABLE), *weights).label('rank'))
+            .where(fts.c[FTS_TABLE].match(expression))
+            .subquery())
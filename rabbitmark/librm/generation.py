@@ -0,0 +1,143 @@
+"""
+generation.py - notice when the database has changed
+
+In-memory structures derived from the database, like the bookmark index, need
+to know when what they hold may be out of date. Each engine being watched has
+a generation number, which increases whenever a transaction that changed
+something is committed: by any session in this process (the main window, the
+link checker's thread, etc.), or by another process using the same database
+file (say, the CLI). Anything derived from the database can remember the
+generation it was built at, and compare it to current() before trusting
+itself.
+"""
+
+import sqlite3
+import threading
+from typing import Callable, List, Optional
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+CommitHook = Callable[[Session, int], None]
+
+
+class _Watcher:
+    """
+    Track the generation of one engine's database.
+
+    Commits made through sessions are seen by the session events below.
+    Commits from anywhere else are seen by polling SQLite's data_version, which
+    changes whenever any other connection commits to the database, on a
+    connection of our own.
+    """
+    def __init__(self, engine) -> None:
+        self.generation = 0
+        self.commit_hooks: List[CommitHook] = []
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._data_version: Optional[int] = None
+
+        path = engine.url.database
+        if path and path != ':memory:':
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._data_version = self._read_data_version()
+
+    def _read_data_version(self) -> Optional[int]:
+        if self._conn is None:
+            return None
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def poll(self) -> int:
+        "Return the current generation, noticing any commits made elsewhere."
+        with self._lock:
+            data_version = self._read_data_version()
+            if data_version != self._data_version:
+                self._data_version = data_version
+                self.generation += 1
+            return self.generation
+
+    def bump(self) -> int:
+        "Start a new generation after a session committed changes."
+        with self._lock:
+            # Our own commit changed data_version too; absorb it so it isn't
+            # taken for someone else's commit at the next poll().
+            self._data_version = self._read_data_version()
+            self.generation += 1
+            return self.generation
+
+
+_watchers: 'WeakKeyDictionary[object, _Watcher]' = WeakKeyDictionary()
+
+
+def watch(engine) -> None:
+    "Start tracking the generation of /engine/'s database."
+    if engine not in _watchers:
+        _watchers[engine] = _Watcher(engine)
+
+
+def _watcher(session) -> Optional[_Watcher]:
+    return _watchers.get(session.get_bind())
+
+
+def current(session) -> int:
+    """
+    Return the current generation of the database /session/ is using. If the
+    database isn't being watched, the generation is always 0.
+    """
+    watcher = _watcher(session)
+    return 0 if watcher is None else watcher.poll()
+
+
+def has_uncommitted_changes(session) -> bool:
+    """
+    Has /session/ made changes that it hasn't committed yet (flushed or not)?
+    Its own queries see them, but no other session's do, and they don't
+    count towards the generation until they're committed.
+    """
+    return bool(session.new or session.dirty or session.deleted
+                or session.info.get('rm_flushed'))
+
+
+def note_changes(session) -> None:
+    """
+    Note that /session/ has changed the database without flushing any ORM
+    objects -- say, with Core inserts -- which the session events below can't
+    see, so that committing it still starts a new generation.
+    """
+    session.info['rm_flushed'] = True
+
+
+def add_commit_hook(session, hook: CommitHook) -> None:
+    """
+    Call /hook/ with the session and the new generation whenever any session
+    on the same database as /session/ commits changes. Hooks run after the
+    generation has been increased, so calling current() in one returns the
+    same generation it was passed, unless yet another commit has happened
+    elsewhere in the meantime.
+    """
+    watcher = _watcher(session)
+    if watcher is not None:
+        watcher.commit_hooks.append(hook)
+
+
+# pylint: disable=unused-argument
+@event.listens_for(Session, "after_flush")
+def _note_flush(session, flush_context) -> None:
+    session.info['rm_flushed'] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _note_commit(session) -> None:
+    if not session.info.pop('rm_flushed', False):
+        return
+    watcher = _watcher(session)
+    if watcher is not None:
+        generation = watcher.bump()
+        for hook in watcher.commit_hooks:
+            hook(session, generation)
+
+
+@event.listens_for(Session, "after_rollback")
+def _note_rollback(session) -> None:
+    session.info.pop('rm_flushed', None)
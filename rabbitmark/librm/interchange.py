@@ -4,10 +4,31 @@ interchange.py - import or export from data-interchange formats
 
 import csv
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from html.parser import HTMLParser
+from itertools import islice
+import os
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
 
-from rabbitmark.definitions import SearchMode
-from . import bookmark
+from sqlalchemy import func, select
+
+from . import bulk_insert
+from .models import Bookmark, Tag, mark_tag_assoc
+
+#: columns of an exported CSV file
+CSV_FIELDS = ["name", "url", "description", "tags"]
+
+#: bookmarks read from the database at a time while exporting
+EXPORT_BATCH_SIZE = 1000
+
+#: rows of a CSV file read and written to the database at a time
+IMPORT_CHUNK_SIZE = 1000
+
+#: characters of an HTML bookmark file read and parsed at a time
+HTML_READ_SIZE = 64 * 1024
+
+#: called with (bytes read, bytes in file, bookmarks imported) as an import
+#: progresses
+ImportCallback = Callable[[int, int, int], None]
 
 
 @dataclass
@@ -18,6 +39,49 @@ class CsvSchema:
     first_data_row: Dict[str, str]
 
 
+def iter_bookmark_rows(
+    session, batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[Dict[str, str]]:
+    """
+    Yield the fields exported for each bookmark (see CSV_FIELDS), in the order
+    they were added, as they're read from the database. Each bookmark's tags
+    are joined together in SQL, and the rows are fetched /batch_size/ at a
+    time, so memory use doesn't grow with the number of bookmarks.
+    """
+    tags = (select(func.group_concat(Tag.text, ','))
+            .join(mark_tag_assoc, Tag.id == mark_tag_assoc.c.tag_id)
+            .where(mark_tag_assoc.c.mark_id == Bookmark.id)
+            .scalar_subquery())
+    query = (select(Bookmark.name, Bookmark.url, Bookmark.description, tags)
+             .order_by(Bookmark.id)
+             .execution_options(yield_per=batch_size))
+    for name, url, description, tag_list in session.execute(query):
+        yield {
+            "name": name,
+            "url": url,
+            "description": '\\n'.join(description.split('\n')),
+            # SQLite doesn't promise an order for group_concat().
+            "tags": ','.join(sorted(tag_list.split(','))) if tag_list else '',
+        }
+
+
+def write_bookmarks_csv(session, f: TextIO) -> int:
+    """
+    Write all bookmarks to the open text file /f/ as CSV, one at a time as
+    they're read from the database.
+
+    Return:
+        The number of bookmarks written.
+    """
+    writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, delimiter=',', quotechar='"')
+    writer.writeheader()
+    count = 0
+    for row in iter_bookmark_rows(session):
+        writer.writerow(row)
+        count += 1
+    return count
+
+
 def export_bookmarks_to_csv(session, target_path: str) -> int:
     """
     Export all bookmarks to the CSV file at /target_path/, overwriting
@@ -30,19 +94,7 @@ def export_bookmarks_to_csv(session, target_path: str) -> int:
         Any file handling errors that may occur.
     """
     with open(target_path, "w", encoding="utf-8") as f:
-        names = ["name", "url", "description", "tags"]
-        writer = csv.DictWriter(f, fieldnames=names, delimiter=',', quotechar='"')
-        writer.writeheader()
-        marks = list(bookmark.find_bookmarks(session, "%", [], True, SearchMode.And))
-        for mark in marks:
-            writer.writerow({
-                "name": mark.name,
-                "url": mark.url,
-                "description": '\\n'.join(mark.description.split('\n')),
-                "tags": ','.join(str(i) for i in mark.tags),
-            })
-
-    return len(marks)
+        return write_bookmarks_csv(session, f)
 
 
 def get_csv_schema(target_path: str) -> CsvSchema:
@@ -63,11 +115,61 @@ def get_csv_schema(target_path: str) -> CsvSchema:
         )
 
 
+def _import_marks(session, marks: Iterator[Dict[str, Any]], f: TextIO, total_bytes: int,
+                  progress: Optional[ImportCallback],
+                  canceled: Optional[Callable[[], bool]],
+                  chunk_size: int) -> Tuple[int, int, int]:
+    """
+    Add the bookmarks /marks/ yields, as keyword arguments to
+    BulkInserter.add(), /chunk_size/ at a time, skipping those whose URLs are
+    already present; /f/ is the file they're read from, which has
+    /total_bytes/. See import_bookmarks_from_csv() for the rest.
+    """
+    dupes = 0
+    near_dupes = 0
+    imported = 0
+    with bulk_insert.bulk_insert(session) as inserter:
+        while canceled is None or not canceled():
+            chunk = list(islice(marks, chunk_size))
+            if not chunk:
+                break
+            for mark_data in chunk:
+                # If the bookmark exists already (or earlier in the file),
+                # ignore it.
+                if inserter.is_duplicate(mark_data['url']):
+                    dupes += 1
+                    continue
+                if inserter.add(**mark_data):
+                    near_dupes += 1
+
+            imported += inserter.flush()
+            session.commit()
+            if progress is not None:
+                # The text layer reads ahead of the parser, so this is
+                # approximate until the end of the file.
+                progress(f.buffer.tell(),  # type: ignore[attr-defined]
+                         total_bytes, imported)
+
+    return imported, dupes, near_dupes
+
+
 def import_bookmarks_from_csv(session, target_path: str, dialect,
-                              mapping: List[Optional[str]]) -> Tuple[int, int]:
+                              mapping: List[Optional[str]],
+                              progress: Optional[ImportCallback] = None,
+                              canceled: Optional[Callable[[], bool]] = None,
+                              chunk_size: int = IMPORT_CHUNK_SIZE
+                              ) -> Tuple[int, int, int]:
     """
-    Import bookmarks from the CSV file at /target_path/. If the names
-    duplicate names already present, do not import those.
+    Import bookmarks from the CSV file at /target_path/. If the URLs
+    duplicate URLs already present, do not import those. Bookmarks whose
+    URLs are only nearly the same as ones already present (see
+    bookmark.find_near_duplicates()) are imported, but counted.
+
+    The file is read and written to the database /chunk_size/ rows at a
+    time (see bulk_insert.py), and each chunk is committed as it's written,
+    so memory use doesn't grow with the size of the file -- but an import
+    that fails or is canceled partway through leaves the bookmarks imported
+    so far in place.
 
     Parameters:
         session - Database session to create imported bookmarks in
@@ -78,19 +180,22 @@ def import_bookmarks_from_csv(session, target_path: str, dialect,
             the 1st, 3rd, and 5th fields of the CSV will be mapped to Name, URL,
             and Description, the 2nd and 4th fields will be ignored,
             and the Tags RabbitMark field will be left blank.
+        progress - If provided, called after each chunk is committed with the
+            number of bytes of the file read so far, the size of the file,
+            and the number of bookmarks imported so far.
+        canceled - If provided, called before reading each chunk; when it
+            returns True, the import stops there.
+        chunk_size - Number of rows to read and write at a time.
 
     Return:
-        Tuple of (number imported, number of duplicates).
+        Tuple of (number imported, number of duplicates, number of those
+        imported that are near-duplicates).
 
     Raises:
         Any file handling errors that may occur.
     """
-    with open(target_path, 'r', newline='', encoding="utf-8") as f:
-        reader = csv.reader(f, dialect=dialect)
+    def read_marks(reader) -> Iterator[Dict[str, Any]]:
         _ = next(reader)  # skip past header row
-
-        dupes = 0
-        imported = 0
         for row in reader:
             # Create a dictionary of defined field names to values for this row.
             mark_data: Dict[str, Any] = {}
@@ -103,15 +208,145 @@ def import_bookmarks_from_csv(session, target_path: str, dialect,
             assert "url" in mark_data, "Missing URL role allowed in import!"
             assert "name" in mark_data, "Missing Name role allowed in import!"
 
-            # If the bookmark exists already, ignore it.
-            if bookmark.url_exists(session, mark_data['url']):
-                dupes += 1
-                continue
+            mark_data['tags'] = [i.strip() for i in mark_data.get('tags', '').split(',')
+                                 if i.strip() != '']
+            yield mark_data
+
+    total_bytes = os.path.getsize(target_path)
+    with open(target_path, 'r', newline='', encoding="utf-8") as f:
+        return _import_marks(session, read_marks(csv.reader(f, dialect=dialect)),
+                             f, total_bytes, progress, canceled, chunk_size)
+
+
+class _NetscapeParser(HTMLParser):
+    """
+    Pick the bookmarks out of a Netscape bookmark file -- what browsers
+    export, laid out like this -- as it's fed to the parser:
+
+        <DL><p>
+            <DT><H3 ADD_DATE="...">Folder</H3>
+            <DL><p>
+                <DT><A HREF="https://..." TAGS="a,b">Name</A>
+                <DD>Description
+            </DL><p>
+        </DL><p>
+
+    Each bookmark is tagged with the name of every folder it's in, besides
+    the browser's own toolbar and "other bookmarks" folders, and any tags it
+    was given in the browser. Finished bookmarks collect in /marks/, as
+    keyword arguments to BulkInserter.add(), for the caller to take away; the
+    last one isn't finished until the next bookmark, the end of its folder,
+    or close(), since its description comes after it.
+    """
+    #: attributes marking a browser's own folders, which aren't used as tags
+    ROOT_FOLDER_ATTRS = frozenset(('personal_toolbar_folder',
+                                   'unfiled_bookmarks_folder'))
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.marks: List[Dict[str, Any]] = []
+        #: names of the folders we're in (None for those not used as tags)
+        self._folders: List[Optional[str]] = []
+        #: the folder whose heading we've just read, which its <DL> opens
+        self._folder_heading: Optional[str] = None
+        self._folder_is_root = False
+        self._mark: Optional[Dict[str, Any]] = None
+        #: the text of the heading, link, or description being read
+        self._text: Optional[List[str]] = None
+
+    def _finish_mark(self) -> None:
+        if self._mark is not None:
+            if self._text is not None:
+                self._mark['description'] = ''.join(self._text).strip()
+            self.marks.append(self._mark)
+            self._mark = None
+        self._text = None
 
-            # It's a go, add the bookmark using whatever fields we've defined.
-            if 'tags' in mark_data:
-                mark_data['tags'] = (i.strip() for i in mark_data['tags'].split(','))
-            bookmark.add_bookmark(session, **mark_data)
-            imported += 1
+    def handle_starttag(self, tag, attrs) -> None:
+        attrs = dict(attrs)
+        if tag in ('dt', 'dl', 'h3', 'a'):
+            self._finish_mark()
+        if tag == 'h3':
+            self._folder_is_root = bool(self.ROOT_FOLDER_ATTRS & attrs.keys())
+            self._text = []
+        elif tag == 'dl':
+            self._folders.append(self._folder_heading)
+            self._folder_heading = None
+        elif tag == 'a' and attrs.get('href'):
+            tags = [i for i in self._folders if i]
+            tags.extend(i.strip() for i in (attrs.get('tags') or '').split(','))
+            self._mark = {
+                'url': attrs['href'],
+                'tags': [i for i in dict.fromkeys(tags) if i],
+                'private': attrs.get('private') == '1',
+            }
+            self._text = []
+        elif tag == 'dd' and self._mark is not None and 'name' in self._mark:
+            self._text = []
+        elif tag == 'br' and self._text is not None:
+            self._text.append('\n')
 
-    return imported, dupes
+    def handle_endtag(self, tag) -> None:
+        if tag == 'h3' and self._text is not None:
+            # Tags are separated by commas everywhere else.
+            name = ' '.join(''.join(self._text).replace(',', ' ').split())
+            self._folder_heading = None if self._folder_is_root else name
+            self._text = None
+        elif tag == 'a' and self._mark is not None and self._text is not None:
+            self._mark['name'] = (' '.join(''.join(self._text).split())
+                                  or self._mark['url'])
+            self._text = None
+        elif tag == 'dl':
+            self._finish_mark()
+            if self._folders:
+                self._folders.pop()
+
+    def handle_data(self, data) -> None:
+        if self._text is not None:
+            self._text.append(data)
+
+    def close(self) -> None:
+        super().close()
+        self._finish_mark()
+
+
+def _read_netscape_bookmarks(f: TextIO) -> Iterator[Dict[str, Any]]:
+    "Yield the bookmarks in the Netscape bookmark file /f/, reading it as needed."
+    parser = _NetscapeParser()
+    while True:
+        data = f.read(HTML_READ_SIZE)
+        if data:
+            parser.feed(data)
+        else:
+            parser.close()
+        for mark in parser.marks:
+            # Firefox exports its smart folders as bookmarks of queries.
+            if not mark['url'].startswith('place:'):
+                yield mark
+        parser.marks.clear()
+        if not data:
+            return
+
+
+def import_bookmarks_from_html(session, target_path: str,
+                               progress: Optional[ImportCallback] = None,
+                               canceled: Optional[Callable[[], bool]] = None,
+                               chunk_size: int = IMPORT_CHUNK_SIZE
+                               ) -> Tuple[int, int, int]:
+    """
+    Import bookmarks from the Netscape bookmark file -- the HTML file browsers
+    export bookmarks to -- at /target_path/. Each bookmark is tagged with the
+    names of the folders it was in (see _NetscapeParser).
+
+    The file is parsed as it's read, in a single pass, and the bookmarks
+    are written to the database /chunk_size/ at a time, as in
+    import_bookmarks_from_csv(), which describes the rest of the parameters,
+    the return value, and what happens to duplicates.
+
+    Raises:
+        Any file handling errors that may occur.
+    """
+    total_bytes = os.path.getsize(target_path)
+    with open(target_path, 'r', encoding="utf-8", errors="replace") as f:
+        return _import_marks(session, _read_netscape_bookmarks(f),
+                             f, total_bytes, progress, canceled, chunk_size)
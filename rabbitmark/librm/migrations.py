@@ -0,0 +1,99 @@
+"""
+migrations.py - bring the schema of existing databases up to date
+
+Base.metadata.create_all() creates the tables a database is missing, along
+with their indexes, but leaves tables that already exist alone. Changes to
+existing tables -- new indexes and columns -- are made by the migrations
+here instead. They're numbered in order, and the number of the last one
+applied to a database is kept in its user_version pragma (0 for databases
+from before there were migrations), so each runs once per database.
+
+A migration must be safe to run on a database created from the current
+models, which may already have what it adds (hence CREATE INDEX IF NOT
+EXISTS, and checking for columns before adding them), since new databases
+start at version 0 too.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, List, Sequence, Union
+
+from sqlalchemy import text
+
+from .url_key import normalize_url
+
+#: an SQL statement, or a function to call with the connection for changes
+#: that SQL alone can't make
+Step = Union[str, Callable[..., None]]
+
+
+@dataclass(frozen=True)
+class Migration:
+    "A change to the schema, made by running /steps/ in order."
+    version: int
+    description: str
+    steps: Sequence[Step]
+
+
+def _add_url_keys(conn) -> None:
+    "Add the normalized URL column (see url_key.py), and fill it in."
+    columns = [row[1] for row in conn.execute(text("PRAGMA table_info(bookmarks)"))]
+    if 'url_key' not in columns:
+        conn.execute(text("ALTER TABLE bookmarks ADD COLUMN url_key VARCHAR"))
+    rows = conn.execute(
+        text("SELECT id, url FROM bookmarks WHERE url_key IS NULL")).all()
+    if rows:
+        conn.execute(text("UPDATE bookmarks SET url_key = :key WHERE id = :id"),
+                     [{'id': pk, 'key': normalize_url(url)} for pk, url in rows])
+
+
+MIGRATIONS: Sequence[Migration] = (
+    Migration(1, "Index tag assignments by tag, and bookmarks by URL and privacy", (
+        # The primary key (mark_id, tag_id) only helps in finding the tags of
+        # a bookmark, not the bookmarks with a tag.
+        "CREATE INDEX IF NOT EXISTS ix_mark_tag_assoc_tag_id "
+        "ON mark_tag_assoc (tag_id, mark_id)",
+        "CREATE INDEX IF NOT EXISTS ix_bookmarks_url ON bookmarks (url)",
+        # By name within each privacy setting, so the bookmark list can be
+        # read in order with private bookmarks hidden.
+        "CREATE INDEX IF NOT EXISTS ix_bookmarks_private ON bookmarks (private, name)",
+        # Give the query planner statistics to choose between the indexes.
+        "ANALYZE",
+    )),
+    Migration(2, "Store normalized URLs, to find duplicates by", (
+        _add_url_keys,
+        "CREATE INDEX IF NOT EXISTS ix_bookmarks_url_key ON bookmarks (url_key)",
+    )),
+)
+
+#: version of the schema once every migration has been applied
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def schema_version(conn) -> int:
+    "Return the number of the last migration applied to /conn/'s database."
+    return conn.execute(text("PRAGMA user_version")).scalar()
+
+
+def migrate(engine) -> List[int]:
+    """
+    Apply the migrations /engine/'s database hasn't had yet, recording each
+    one as it completes. A database from a newer version of RabbitMark is
+    left as it is.
+
+    Return:
+        The versions of the migrations applied, in order.
+    """
+    applied = []
+    for migration in MIGRATIONS:
+        with engine.begin() as conn:
+            if schema_version(conn) >= migration.version:
+                continue
+            for step in migration.steps:
+                if callable(step):
+                    step(conn)
+                else:
+                    conn.execute(text(step))
+            # PRAGMA doesn't accept bound parameters.
+            conn.execute(text(f"PRAGMA user_version = {int(migration.version)}"))
+        applied.append(migration.version)
+    return applied
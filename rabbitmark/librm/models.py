@@ -8,15 +8,21 @@ models.py - SQLAlchemy ORM database model for RabbitMark
 #pylint: disable=invalid-name
 
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
-from sqlalchemy import Integer, String, Boolean, Table, Column, ForeignKey
+from sqlalchemy.orm import relationship, validates
+from sqlalchemy import (Integer, String, Boolean, DateTime, Float, Table, Column,
+                        ForeignKey, Index)
+
+from .url_key import normalize_url
 
 Base = declarative_base()
 mark_tag_assoc = Table(
     'mark_tag_assoc',
     Base.metadata,
     Column('mark_id', ForeignKey('bookmarks.id'), primary_key=True),
-    Column('tag_id', ForeignKey('tags.id'), primary_key=True))
+    Column('tag_id', ForeignKey('tags.id'), primary_key=True),
+    # Indexes added after the first release must also be added to existing
+    # databases by a migration (see migrations.py).
+    Index('ix_mark_tag_assoc_tag_id', 'tag_id', 'mark_id'))
 
 
 class Bookmark(Base):  # type: ignore
@@ -25,7 +31,9 @@ class Bookmark(Base):  # type: ignore
 
     id = Column(Integer, primary_key=True)
     name = Column(String, nullable=False, index=True, unique=True)
-    url = Column(String, nullable=False)
+    url = Column(String, nullable=False, index=True)
+    #: normalize_url(url), to find other bookmarks of the same page by
+    url_key = Column(String, index=True)
     description = Column(String, nullable=False)
     tags = relationship("Tag",
                         secondary=mark_tag_assoc,
@@ -33,6 +41,14 @@ class Bookmark(Base):  # type: ignore
     private = Column(Boolean, nullable=False)
     skip_linkcheck = Column(Boolean, nullable=False)
 
+    __table_args__ = (Index('ix_bookmarks_private', 'private', 'name'),)
+
+    @validates('url')
+    def _update_url_key(self, _key, url):
+        "Keep url_key in step with the URL whenever it's set."
+        self.url_key = normalize_url(url)
+        return url
+
     def __repr__(self) -> str:
         return (f"<Bookmark id={self.id} name={self.name} url={self.url} "
                 f"tags={self.tags} private={self.private} "
@@ -65,3 +81,30 @@ class Config(Base):  # type: ignore
 
     def __repr__(self) -> str:
         return f"<Config {self.key}:{self.value}>"
+
+
+class LinkCheckResult(Base):  # type: ignore
+    """
+    What happened the last time a bookmark's link was checked (see
+    broken_links.py). It goes for the bookmark's URL only while that is
+    still /url/.
+    """
+    __tablename__ = 'link_checks'
+
+    mark_id = Column(Integer, ForeignKey('bookmarks.id'), primary_key=True)
+    url = Column(String, nullable=False)
+    #: when the check was made, in UTC
+    checked_at = Column(DateTime, nullable=False)
+    status_code = Column(Integer)
+    error_description = Column(String)
+    #: seconds taken to get an answer, following any redirects
+    response_time = Column(Float)
+    #: where any redirects led
+    final_url = Column(String)
+    #: validators the server sent, to ask next time whether the page has changed
+    etag = Column(String)
+    last_modified = Column(String)
+
+    def __repr__(self) -> str:
+        return (f"<LinkCheckResult mark_id={self.mark_id} url={self.url} "
+                f"checked_at={self.checked_at} status_code={self.status_code}>")
@@ -0,0 +1,139 @@
+"""
+result_cache.py - remember the results of recent searches
+
+Browsing tends to repeat the same searches: toggling a tag on and back off,
+flipping the AND/OR selector back and forth, or showing and hiding private
+bookmarks. When the cache is enabled, search.RefiningSearch and
+tag.scan_tags_with_counts() keep the results of the most recent queries in a
+bounded LRU cache and answer repeats from it.
+
+Entries are only good for the generation of the database they were computed
+at (see generation.py), so any commit -- by the main window, the link
+checker, or the CLI in another process -- empties the cache. Searches record
+the IDs of the bookmarks found rather than the objects, which belong to the
+session that loaded them.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Hashable, Optional
+from weakref import WeakKeyDictionary
+
+from . import generation
+
+#: number of results kept, unless configured otherwise with the
+#: "result_cache_size" config key
+DEFAULT_SIZE = 64
+
+
+@dataclass
+class CacheStats:
+    "How well the cache has been doing."
+    hits: int = 0
+    misses: int = 0
+    #: entries dropped to make room for new ones
+    evictions: int = 0
+    #: times the cache was emptied because the database changed
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache:
+    "Least-recently-used results of queries on one database."
+    def __init__(self, maxsize: int = DEFAULT_SIZE) -> None:
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._generation: Optional[int] = None
+        self._stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        "Return a copy of the hit and miss counts so far."
+        with self._lock:
+            return replace(self._stats)
+
+    def _sync(self, current: int) -> None:
+        # Lock must be held. Forget everything from earlier generations.
+        if current != self._generation:
+            if self._entries:
+                self._entries.clear()
+                self._stats.invalidations += 1
+            self._generation = current
+
+    def get(self, session, key: Hashable) -> Optional[Any]:
+        """
+        Return the result cached under /key/, or None if there's none for the
+        database as /session/ currently sees it.
+        """
+        if generation.has_uncommitted_changes(session):
+            # Its queries see changes no one else can yet.
+            return None
+        current = generation.current(session)
+        with self._lock:
+            self._sync(current)
+            value = self._entries.get(key)
+            if value is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, session, key: Hashable, value: Any, computed_at: int) -> None:
+        """
+        Cache /value/ under /key/. /computed_at/ is the generation of the
+        database when the query began (from generation.current()); if
+        anything has been committed since, the value may be out of date
+        already and isn't cached.
+        """
+        if generation.has_uncommitted_changes(session) or self.maxsize <= 0:
+            return
+        current = generation.current(session)
+        with self._lock:
+            self._sync(current)
+            if computed_at != current:
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def clear(self) -> None:
+        "Empty the cache (but keep the statistics)."
+        with self._lock:
+            self._entries.clear()
+
+
+_caches: 'WeakKeyDictionary[object, ResultCache]' = WeakKeyDictionary()
+
+
+def enable(session, maxsize: int = DEFAULT_SIZE) -> ResultCache:
+    """
+    Cache the results of up to /maxsize/ searches and tag counts on the
+    database /session/ uses from now on. As with the bookmark index, only
+    databases opened with database.make_Session() are tracked closely enough
+    to be cached safely.
+    """
+    engine = session.get_bind()
+    cache = _caches.get(engine)
+    if cache is None:
+        cache = ResultCache(maxsize)
+        _caches[engine] = cache
+    else:
+        cache.maxsize = maxsize
+    return cache
+
+
+def get(session) -> Optional[ResultCache]:
+    "Return the cache for /session/'s database, or None if it isn't enabled."
+    return _caches.get(session.get_bind())
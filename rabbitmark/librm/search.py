@@ -0,0 +1,397 @@
+"""
+search.py - refine the previous search instead of repeating it
+
+As the user types into the filter box or adds tags to the selection, each
+search usually finds a subset of what the previous one found: "pyth" becomes
+"pytho" becomes "python". RefiningSearch remembers the last search and its
+results, and when the next search is narrower, filters those results in
+memory rather than querying the whole library again, so it takes time
+proportional to the number of bookmarks currently shown.
+
+Searches matching too many bookmarks to hold in memory (say, the empty search
+on a huge library) are instead read a page at a time with fetch_page(), which
+sorts in SQL and continues each page from where the last one ended. Pages
+can also be ordered by relevance to the words typed (RANK), so a broad search
+shows its best matches first without loading the rest.
+
+If the result cache is enabled (see result_cache.py), searches that can't be
+refined are looked up there before being run.
+"""
+
+import json
+import re
+from dataclasses import dataclass, replace
+from typing import Any, List, Optional, Pattern, Sequence, Tuple
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import selectinload
+
+from rabbitmark.definitions import NOTAGS, MatchMode, SearchMode
+from . import fulltext
+from . import generation
+from . import result_cache
+from .bookmark import find_bookmarks, query_bookmarks
+from .models import Bookmark, Tag, mark_tag_assoc
+
+#: most bookmarks a search loads at once; larger searches are paged
+COMPLETE_LIMIT = 2000
+#: number of bookmarks fetched per page after the first
+PAGE_SIZE = 500
+
+
+@dataclass(frozen=True)
+class SearchParams:
+    "The criteria of one call to find_bookmarks()."
+    filter_text: str
+    tags: Tuple[str, ...]
+    include_private: bool
+    search_mode: SearchMode
+    match_mode: MatchMode = MatchMode.FullText
+
+    def find(self, session) -> List[Bookmark]:
+        "Run this search in the database."
+        return list(find_bookmarks(session, self.filter_text, self.tags,
+                                   self.include_private, self.search_mode,
+                                   self.match_mode))
+
+    def query(self, session):
+        "Return an unsorted query for this search (see query_bookmarks())."
+        return query_bookmarks(session, self.filter_text, self.tags,
+                               self.include_private, self.search_mode,
+                               self.match_mode)
+
+    def count(self, session) -> int:
+        "Return the number of bookmarks this search matches."
+        return self.query(session).with_entities(func.count(Bookmark.id)).scalar()
+
+
+def _tags_sort_key():
+    """
+    SQL equivalent of sorting by the list of tags as the bookmark table shows
+    it: sorted, joined with commas, and compared case-insensitively (for
+    ASCII only, unlike the table's own sort).
+    """
+    tag_texts = (select(Tag.text)
+                 .join(mark_tag_assoc, Tag.id == mark_tag_assoc.c.tag_id)
+                 .where(mark_tag_assoc.c.mark_id == Bookmark.id)
+                 .order_by(Tag.text)
+                 .correlate(Bookmark)
+                 .subquery())
+    tag_list = select(func.group_concat(tag_texts.c.text, ', ')).scalar_subquery()
+    return func.lower(func.coalesce(tag_list, ''))
+
+
+#: SQL expressions bookmarks can be sorted by in fetch_page(), by name
+SORT_KEYS = {
+    'name': Bookmark.name,
+    'tags': _tags_sort_key(),
+}
+
+#: sort key for ordering by BM25 relevance to the filter text, best first
+#: (see fulltext.ranked_ids()); only for searches where can_rank() is True
+RANK = 'rank'
+
+#: where a page ends: the sort key and ID of its last bookmark
+Position = Tuple[Any, int]
+
+
+@dataclass(frozen=True)
+class PageOrder:
+    "The order to fetch pages of bookmarks in: one of SORT_KEYS or RANK, then ID."
+    key: str
+    descending: bool = False
+
+
+@dataclass
+class Page:
+    "Some or all of the results of a search, in order."
+    marks: List[Bookmark]
+    #: number of bookmarks the search matches in all
+    total: int
+    #: where to continue from to fetch more, or None if /marks/ is everything
+    after: Optional[Position] = None
+    #: the order /marks/ and any further pages are in, if there are more
+    #: or they're ranked (otherwise, complete results are in no order)
+    order: Optional[PageOrder] = None
+
+
+def can_rank(session, params: SearchParams) -> bool:
+    "Can the results of /params/ be ordered by relevance (PageOrder(RANK))?"
+    return (params.match_mode == MatchMode.FullText
+            and fulltext.is_available(session)
+            and fulltext.match_expression(params.filter_text) is not None)
+
+
+def fetch_page(session, params: SearchParams, order: PageOrder,
+               after: Optional[Position] = None,
+               limit: int = PAGE_SIZE) -> Tuple[List[Bookmark], Optional[Position]]:
+    """
+    Fetch up to /limit/ bookmarks matching /params/ in /order/, starting
+    just after /after/ (the position returned with the previous page), or
+    from the beginning if None.
+
+    Each page continues from the last one by comparing against the sort key
+    and ID of its last row (keyset pagination), rather than with OFFSET, so
+    pages deep into the results are as quick to fetch as the first one.
+
+    Return:
+        The bookmarks, and the position of the last one (None if there were
+        none left to fetch).
+    """
+    return _page_of(_page_query(session, params, order, after).limit(limit).all())
+
+
+def _page_query(session, params: SearchParams, order: PageOrder,
+                after: Optional[Position]):
+    if order.key == RANK:
+        expression = fulltext.match_expression(params.filter_text)
+        assert expression is not None, "Can't rank a search with no words to match"
+        ranked = fulltext.ranked_ids(expression)
+        # Joining the ranked matches does the text filtering.
+        query = (replace(params, filter_text="").query(session)
+                 .join(ranked, ranked.c.id == Bookmark.id))
+        key = ranked.c.rank
+    else:
+        query = params.query(session)
+        key = SORT_KEYS[order.key]
+    query = (query
+             .add_columns(key.label('sort_key'))
+             .options(selectinload(Bookmark.tags)))
+    if after is not None:
+        position = tuple_(key, Bookmark.id)
+        if order.descending:
+            query = query.filter(position < tuple_(*after))
+        else:
+            query = query.filter(position > tuple_(*after))
+    if order.descending:
+        query = query.order_by(key.desc(), Bookmark.id.desc())
+    else:
+        query = query.order_by(key, Bookmark.id)
+    return query
+
+
+def _first_page(session, params: SearchParams, order: PageOrder, limit: int) -> Page:
+    "Run find_page()'s query: everything, or the first /limit/ results in /order/."
+    rows = _page_query(session, params, order, None).limit(limit + 1).all()
+    if len(rows) <= limit:
+        marks, _ = _page_of(rows)
+        return Page(marks, len(marks), None, order if order.key == RANK else None)
+    marks, after = _page_of(rows[:limit])
+    return Page(marks, params.count(session), after, order)
+
+
+def _page_of(rows) -> Tuple[List[Bookmark], Optional[Position]]:
+    "Split (bookmark, sort key) rows into the bookmarks and the last position."
+    if not rows:
+        return [], None
+    last_mark, last_key = rows[-1]
+    return [mark for mark, _ in rows], (last_key, last_mark.id)
+
+
+@dataclass(frozen=True)
+class _CachedPage:
+    "A Page as kept in the result cache, by bookmark ID."
+    ids: Tuple[int, ...]
+    total: int
+    after: Optional[Position] = None
+    order: Optional[PageOrder] = None
+
+
+def _load(session, ids: Sequence[int]) -> List[Bookmark]:
+    "Load the bookmarks with primary keys /ids/, in that order, with their tags."
+    id_list = func.json_each(json.dumps(list(ids))).table_valued('value')
+    marks = (session.query(Bookmark)
+             .filter(Bookmark.id.in_(select(id_list.c.value)))
+             .options(selectinload(Bookmark.tags))
+             .all())
+    by_id = {i.id: i for i in marks}
+    return [by_id[i] for i in ids if i in by_id]
+
+
+def _cached_page(session, key) -> Optional[Page]:
+    "Return the Page cached under /key/, or None."
+    cache = result_cache.get(session)
+    entry = None if cache is None else cache.get(session, key)
+    if entry is None:
+        return None
+    return Page(_load(session, entry.ids), entry.total, entry.after, entry.order)
+
+
+def _cache_page(session, key, page: Page, computed_at: int) -> None:
+    cache = result_cache.get(session)
+    if cache is not None:
+        entry = _CachedPage(tuple(i.id for i in page.marks), page.total,
+                            page.after, page.order)
+        cache.put(session, key, entry, computed_at)
+
+
+def _like_pattern(filter_text: str) -> Pattern:
+    """
+    Compile a regex matching what SQLite's LIKE '%filter_text%' matches:
+    % and _ are wildcards, and only ASCII letters are case-insensitive.
+
+    >>> bool(_like_pattern('PYTH').search('Python'))
+    True
+    >>> bool(_like_pattern('É').search('é'))
+    False
+    >>> bool(_like_pattern('a_c%e').search('xxabcdxe'))
+    True
+    """
+    wildcards = {'%': '.*', '_': '.'}
+    regex = ''.join(wildcards.get(c, re.escape(c)) for c in filter_text)
+    return re.compile(regex, re.ASCII | re.IGNORECASE | re.DOTALL)
+
+
+def _uses_like(session, params: SearchParams) -> bool:
+    "Will find_bookmarks() match the filter text of /params/ with LIKE?"
+    return (params.match_mode == MatchMode.Substring
+            or not fulltext.is_available(session)
+            or fulltext.match_expression(params.filter_text) is None)
+
+
+def _narrows_text(session, new: SearchParams, old: SearchParams) -> bool:
+    if new.filter_text == old.filter_text or not old.filter_text:
+        return True
+    if _uses_like(session, old):
+        # Anything containing the new text contains the old text too, even
+        # with wildcards in it -- so long as the new text is also matched
+        # with LIKE, not as words.
+        return old.filter_text in new.filter_text and _uses_like(session, new)
+    # Extending the text typed only extends the last word's prefix or adds
+    # words, each of which must also match.
+    return (new.filter_text.startswith(old.filter_text)
+            and not _uses_like(session, new))
+
+
+def _narrows_tags(new: SearchParams, old: SearchParams) -> bool:
+    if not old.tags or new.tags == old.tags:
+        return True
+    if new.search_mode != old.search_mode:
+        return False
+    if new.search_mode == SearchMode.And:
+        return set(new.tags) >= set(old.tags)
+    return bool(new.tags) and set(new.tags) <= set(old.tags)
+
+
+def _tags_match(mark: Bookmark, tags: Sequence[str], search_mode: SearchMode) -> bool:
+    "Check /mark/ against the tag criteria the way find_bookmarks() does."
+    mark_tags = {i.text for i in mark.tags}
+    if search_mode == SearchMode.And:
+        return ((NOTAGS not in tags or not mark_tags)
+                and all(tag in mark_tags for tag in tags))
+    elif search_mode == SearchMode.Or:
+        return ((NOTAGS in tags and not mark_tags)
+                or any(tag in mark_tags for tag in tags if tag != NOTAGS))
+    else:
+        raise AssertionError(f"in _tags_match(): Search mode {search_mode!r} "
+                             f"unimplemented")
+
+
+class RefiningSearch:
+    """
+    Runs searches, answering each that's narrower than the last one by
+    filtering the last one's results, and others from the result cache if
+    it's enabled. The results are forgotten whenever anything is committed
+    to the database.
+    """
+    def __init__(self) -> None:
+        self._params: Optional[SearchParams] = None
+        self._generation: Optional[int] = None
+        self._results: List[Bookmark] = []
+
+    def invalidate(self) -> None:
+        "Forget the last search, so the next one is run in full."
+        self._params = None
+        self._results = []
+
+    def narrows(self, session, params: SearchParams) -> bool:
+        """
+        Return True if /params/ can only find bookmarks the last search found
+        and the database hasn't changed since, so it can be refined.
+        """
+        old = self._params
+        return (old is not None
+                and self._generation == generation.current(session)
+                and old.match_mode == params.match_mode
+                and (old.include_private or not params.include_private)
+                and _narrows_text(session, params, old)
+                and _narrows_tags(params, old))
+
+    def find(self, session, params: SearchParams) -> List[Bookmark]:
+        "Return the bookmarks matching /params/, as find_bookmarks() would."
+        key = ('find', params)
+        current = generation.current(session)
+        if self.narrows(session, params):
+            results = self._refine(session, params)
+            _cache_page(session, key, Page(results, len(results)), current)
+        else:
+            cached = _cached_page(session, key)
+            if cached is None:
+                results = params.find(session)
+                _cache_page(session, key, Page(results, len(results)), current)
+            else:
+                results = cached.marks
+            self._generation = current
+        self._params = params
+        self._results = results
+        return results
+
+    def find_page(self, session, params: SearchParams, order: PageOrder,
+                  limit: int = COMPLETE_LIMIT) -> Page:
+        """
+        Return all the bookmarks matching /params/ if there are no more than
+        /limit/, or else the first /limit/ of them in /order/ and the
+        position to fetch more from with fetch_page(). Complete results are
+        remembered and refined like those of find() (but only they are: a
+        page can't be refined); refined results are not in any order, so
+        searches ranked by relevance are always run in full.
+        """
+        key = ('page', params, order, limit)
+        current = generation.current(session)
+        if order.key != RANK and self.narrows(session, params):
+            marks = self._refine(session, params)
+            page = Page(marks, len(marks))
+            _cache_page(session, key, page, current)
+        else:
+            cached = _cached_page(session, key)
+            if cached is None:
+                page = _first_page(session, params, order, limit)
+                _cache_page(session, key, page, current)
+            else:
+                page = cached
+            self._generation = current
+
+        if page.after is None:
+            self._params = params
+            self._results = page.marks
+        else:
+            self.invalidate()
+        return page
+
+    def _refine(self, session, params: SearchParams) -> List[Bookmark]:
+        old = self._params
+        assert old is not None
+        results = self._results
+
+        if not params.include_private and old.include_private:
+            results = [i for i in results if not i.private]
+
+        if params.tags != old.tags:
+            results = [i for i in results
+                       if _tags_match(i, params.tags, params.search_mode)]
+
+        if params.filter_text != old.filter_text and params.filter_text:
+            if _uses_like(session, params):
+                pattern = _like_pattern(params.filter_text)
+                results = [i for i in results
+                           if any(pattern.search(text or '')
+                                  for text in (i.name, i.url, i.description))]
+            else:
+                # Rather than emulating the full-text index's tokenizer, ask
+                # the index, but only about the bookmarks we already have.
+                expression = fulltext.match_expression(params.filter_text)
+                assert expression is not None
+                matched = {i for i, in session.execute(fulltext.matching_ids(
+                    expression, among=(i.id for i in results)))}
+                results = [i for i in results if i.id in matched]
+        return results
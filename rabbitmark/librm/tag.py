@@ -4,9 +4,13 @@ tag.py -- RabbitMark tag operations
 
 from typing import Sequence
 
-from sqlalchemy import func
+from sqlalchemy import func, or_
 
 from rabbitmark.definitions import NOTAGS
+from . import bookmark_index
+from . import generation
+from . import result_cache
+from . import tag_counts
 from .models import Tag, Bookmark, mark_tag_assoc
 
 
@@ -14,6 +18,7 @@ def change_tags(session, existing_bookmark: Bookmark, new_tags: Sequence[str]) -
     """
     Replace the tags on /existing_bookmark/ with the list of /new_tags/.
     """
+    bookmark_index.stage(session, existing_bookmark)
     # remove tags that are no longer used
     for tag in existing_bookmark.tags[:]:
         if tag.text not in new_tags:
@@ -37,6 +42,8 @@ def delete_tag(session, tag_name: str) -> None:
     Delete a tag from all bookmarks.
     """
     tag_obj = session.query(Tag).filter(Tag.text == tag_name).one()
+    bookmark_index.stage(session, tag_obj)
+    bookmark_index.stage_op(session, 'delete_tag', tag_name)
     session.delete(tag_obj)
 
 
@@ -50,6 +57,8 @@ def maybe_expunge_tag(session, tag: Tag) -> bool:
         False if the tag is still referenced and was not deleted.
     """
     if not tag.bookmarks:
+        bookmark_index.stage(session, tag)
+        bookmark_index.stage_op(session, 'delete_tag', tag.text)
         session.delete(tag)
         return True
     else:
@@ -67,12 +76,15 @@ def merge_tags(session, from_name: str, into_name: str) -> bool:
     if to_tag is None:
         return rename_tag(session, from_name, into_name)
 
-    bquery = session.query(Bookmark)
-    needs_retag = bquery.filter(Bookmark.tags.any(Tag.text == from_name)).all()
+    # Loaded through the tag, which uses the tag_id index on mark_tag_assoc.
+    needs_retag = list(from_tag.bookmarks)
     for mark in needs_retag:
+        bookmark_index.stage(session, mark)
         mark.tags.remove(from_tag)
         mark.tags.append(to_tag)
 
+    bookmark_index.stage(session, from_tag)
+    bookmark_index.stage_op(session, 'delete_tag', from_name)
     session.delete(from_tag)
     session.flush()
     return True
@@ -92,6 +104,8 @@ def rename_tag(session, current_name: str, new_name: str) -> bool:
         return False
 
     tag_obj = session.query(Tag).filter(Tag.text == current_name).one()
+    bookmark_index.stage(session, tag_obj)
+    bookmark_index.stage_op(session, 'rename_tag', current_name, new_name)
     tag_obj.text = new_name
     return True
 
@@ -115,7 +129,47 @@ def scan_tags_with_counts(session, show_private: bool) -> dict[str, int]:
     Get a dict mapping tag names to their bookmark counts, plus the NOTAGS
     placeholder. When show_private is False, count only non-private bookmarks;
     tags with zero visible bookmarks are excluded.
+
+    The counts come from the result cache when it's enabled and has them,
+    or else from the tag count table (see tag_counts.py); only if that isn't
+    installed are the bookmarks counted.
     """
+    key = ('tag_counts', show_private)
+    cache = result_cache.get(session)
+    cached = None if cache is None else cache.get(session, key)
+    if cached is not None:
+        return dict(cached)
+    current = generation.current(session)
+
+    if tag_counts.is_available(session):
+        result = _read_tag_counts(session, show_private)
+    else:
+        result = _count_tags(session, show_private)
+
+    if cache is not None:
+        cache.put(session, key, dict(result), current)
+    return result
+
+
+def _read_tag_counts(session, show_private: bool) -> dict[str, int]:
+    # pylint: disable=singleton-comparison
+    counts = tag_counts.counts_table.c
+    count = counts.public + counts.private if show_private else counts.public
+    rows = (session.query(counts.tag_id, Tag.text, count)
+            .select_from(tag_counts.counts_table)
+            .outerjoin(Tag, Tag.id == counts.tag_id)
+            .filter(or_(Tag.id != None, counts.tag_id == tag_counts.UNTAGGED_ID))
+            .all())
+    result = {NOTAGS: 0}
+    for tag_id, text, number in rows:
+        if tag_id == tag_counts.UNTAGGED_ID:
+            result[NOTAGS] = number
+        elif number:
+            result[text] = number
+    return result
+
+
+def _count_tags(session, show_private: bool) -> dict[str, int]:
     # pylint: disable=singleton-comparison
     q = (
         session.query(Tag.text, func.count(mark_tag_assoc.c.mark_id))
@@ -132,5 +186,4 @@ def scan_tags_with_counts(session, show_private: bool) -> dict[str, int]:
     if not show_private:
         notags_q = notags_q.filter(Bookmark.private == False)
     result[NOTAGS] = notags_q.scalar()
-
     return result
@@ -0,0 +1,187 @@
+"""
+tag_counts.py - bookmark counts per tag, kept up to date by SQLite triggers
+
+The tag list shows how many bookmarks have each tag, and it's refreshed after
+nearly every change. Counting with a join over every tag assignment gets slow
+in large collections, so the counts are instead stored in a table: for each
+tag, the number of public and of private bookmarks with that tag, plus a row
+with the ID UNTAGGED_ID counting the bookmarks with no tags at all. Triggers
+on the bookmarks and mark_tag_assoc tables adjust the counts as bookmarks are
+added, deleted, tagged, untagged, or made private or public, so reading them
+is a single indexed query and no application code needs to remember to update
+them (and neither does any other program editing the database). Tag
+assignments are expected to be inserted and deleted, as SQLAlchemy does, not
+updated in place.
+"""
+
+from typing import Sequence
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import column, table, text
+
+TABLE = 'tag_counts'
+
+#: the tag_id of the row counting bookmarks without tags
+UNTAGGED_ID = 0
+
+#: lightweight description of TABLE for building queries
+counts_table = table(TABLE, column('tag_id'), column('public'), column('private'))
+
+_CREATE_TABLE = f"""
+    CREATE TABLE {TABLE} (
+        tag_id INTEGER PRIMARY KEY,
+        public INTEGER NOT NULL DEFAULT 0,
+        private INTEGER NOT NULL DEFAULT 0)
+"""
+
+
+def _mark_rows(mark: str) -> str:
+    "WHERE clause for the rows counting the bookmark with ID /mark/."
+    return f"""
+        tag_id IN (SELECT tag_id FROM mark_tag_assoc WHERE mark_id = {mark})
+        OR (tag_id = {UNTAGGED_ID}
+            AND NOT EXISTS (SELECT 1 FROM mark_tag_assoc WHERE mark_id = {mark}))
+    """
+
+
+def _adjust_for_assoc(where: str, sign: str, mark: str) -> str:
+    "Add or subtract (/sign/) the bookmark with ID /mark/ on the rows /where/."
+    return f"""
+        UPDATE {TABLE} SET
+            public = public {sign}
+                (SELECT NOT private FROM bookmarks WHERE id = {mark}),
+            private = private {sign}
+                (SELECT private FROM bookmarks WHERE id = {mark})
+        WHERE {where};
+    """
+
+
+#: the untagged row, if the tag just assigned was the bookmark's first
+_NEWLY_TAGGED = f"""
+    tag_id = {UNTAGGED_ID}
+    AND (SELECT count(*) FROM mark_tag_assoc WHERE mark_id = new.mark_id) = 1
+"""
+
+#: the untagged row, if the tag just removed was the bookmark's last
+_NEWLY_UNTAGGED = f"""
+    tag_id = {UNTAGGED_ID}
+    AND NOT EXISTS (SELECT 1 FROM mark_tag_assoc WHERE mark_id = old.mark_id)
+"""
+
+_TRIGGERS: Sequence[str] = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {TABLE}_tag AFTER INSERT ON mark_tag_assoc
+    WHEN EXISTS (SELECT 1 FROM bookmarks WHERE id = new.mark_id)
+    BEGIN
+        INSERT OR IGNORE INTO {TABLE}(tag_id) VALUES (new.tag_id);
+        {_adjust_for_assoc("tag_id = new.tag_id", "+", "new.mark_id")}
+        {_adjust_for_assoc(_NEWLY_TAGGED, "-", "new.mark_id")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {TABLE}_untag AFTER DELETE ON mark_tag_assoc
+    WHEN EXISTS (SELECT 1 FROM bookmarks WHERE id = old.mark_id)
+    BEGIN
+        {_adjust_for_assoc("tag_id = old.tag_id", "-", "old.mark_id")}
+        {_adjust_for_assoc(_NEWLY_UNTAGGED, "+", "old.mark_id")}
+    END
+    """,
+    # Bookmarks are normally inserted before their tags and deleted after
+    # them, but handle tags already being present, just in case.
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {TABLE}_insert AFTER INSERT ON bookmarks
+    BEGIN
+        INSERT OR IGNORE INTO {TABLE}(tag_id)
+            SELECT tag_id FROM mark_tag_assoc WHERE mark_id = new.id;
+        UPDATE {TABLE} SET
+            public = public + NOT new.private,
+            private = private + new.private
+        WHERE {_mark_rows("new.id")};
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {TABLE}_delete AFTER DELETE ON bookmarks
+    BEGIN
+        UPDATE {TABLE} SET
+            public = public - NOT old.private,
+            private = private - old.private
+        WHERE {_mark_rows("old.id")};
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {TABLE}_private AFTER UPDATE OF private ON bookmarks
+    WHEN old.private IS NOT new.private
+    BEGIN
+        UPDATE {TABLE} SET
+            public = public + (NOT new.private) - (NOT old.private),
+            private = private + new.private - old.private
+        WHERE {_mark_rows("new.id")};
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {TABLE}_tag_delete AFTER DELETE ON tags
+    BEGIN
+        DELETE FROM {TABLE} WHERE tag_id = old.id;
+    END
+    """,
+)
+
+# Every tag's assignments are counted straight from the tag index, and only
+# the (usually few) private bookmarks are joined to their tags, to be taken
+# off the public count. CROSS JOIN keeps SQLite from reordering that join:
+# walking the private bookmarks and looking up each one's tags reads far
+# fewer pages in a large library than looking up the bookmark for every
+# assignment.
+_REBUILD: Sequence[str] = (
+    f"DELETE FROM {TABLE}",
+    f"""
+    INSERT INTO {TABLE}(tag_id, public, private)
+        SELECT every.tag_id, every.n - coalesce(hidden.n, 0), coalesce(hidden.n, 0)
+        FROM (SELECT tag_id, count(*) AS n FROM mark_tag_assoc GROUP BY tag_id)
+            AS every
+        LEFT JOIN (SELECT a.tag_id, count(*) AS n
+                   FROM bookmarks b CROSS JOIN mark_tag_assoc a ON a.mark_id = b.id
+                   WHERE b.private = 1
+                   GROUP BY a.tag_id) AS hidden
+            ON hidden.tag_id = every.tag_id
+    """,
+    f"""
+    INSERT INTO {TABLE}(tag_id, public, private)
+        SELECT {UNTAGGED_ID}, coalesce(sum(NOT private), 0), coalesce(sum(private), 0)
+        FROM bookmarks
+        WHERE NOT EXISTS (SELECT 1 FROM mark_tag_assoc WHERE mark_id = bookmarks.id)
+    """,
+)
+
+
+#: engines install() has set up the table on
+_installed: 'WeakKeyDictionary[object, bool]' = WeakKeyDictionary()
+
+
+def rebuild(conn) -> None:
+    "Recount every tag from scratch, using the SQLAlchemy connection /conn/."
+    for statement in _REBUILD:
+        conn.execute(text(statement))
+
+
+def install(engine) -> None:
+    """
+    Create the tag count table and its triggers on /engine/'s database if
+    they don't exist yet, counting the bookmarks already present.
+    """
+    with engine.begin() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {'name': TABLE}
+        ).first()
+        if exists is None:
+            conn.execute(text(_CREATE_TABLE))
+            rebuild(conn)
+        for trigger in _TRIGGERS:
+            conn.execute(text(trigger))
+    _installed[engine] = True
+
+
+def is_available(session) -> bool:
+    "Return True if the tag count table can be used with /session/."
+    return _installed.get(session.get_bind(), False)
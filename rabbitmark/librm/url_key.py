@@ -0,0 +1,76 @@
+"""
+url_key.py - normalized URLs, for spotting bookmarks of the same page
+
+The same page is often bookmarked under slightly different URLs:
+HTTP://Example.com/page/ and http://example.com/page, or a link shared with
+utm_source=newsletter tacked on. normalize_url() reduces such variants to a
+single key, which is stored alongside each bookmark's URL (Bookmark.url_key,
+set whenever the URL is) and indexed, so finding the bookmarks that probably
+point to the same page as a URL is a single index lookup.
+
+The key is only for comparisons; the URL itself is always kept as entered.
+"""
+
+from typing import Optional
+from urllib.parse import unquote_plus, urlsplit, urlunsplit
+
+#: ports that are implied by the scheme, and so can be left out
+DEFAULT_PORTS = {
+    'http': 80,
+    'https': 443,
+    'ftp': 21,
+}
+
+#: query parameters that only track where a link came from
+TRACKING_PARAMS = frozenset((
+    'fbclid', 'gclid', 'dclid', 'gbraid', 'wbraid', 'msclkid', 'yclid',
+    'mc_cid', 'mc_eid', 'igshid', '_ga', '_gl',
+))
+
+#: prefixes of query parameters that only track where a link came from
+TRACKING_PREFIXES = ('utm_',)
+
+
+def _is_tracking(param: str) -> bool:
+    param = param.lower()
+    return param in TRACKING_PARAMS or param.startswith(TRACKING_PREFIXES)
+
+
+def normalize_url(url: Optional[str]) -> str:
+    """
+    Return the key of /url/ for comparing it with other URLs: the URL with
+    the case of the scheme and host, default ports, trailing slashes on the
+    path, and tracking parameters in the query (see TRACKING_PARAMS) all
+    ignored.
+
+    Something that doesn't parse as a URL is only stripped of whitespace and
+    trailing slashes.
+
+    >>> normalize_url("HTTPS://Example.COM:443/Some/Path/?utm_source=x&id=3")
+    'https://example.com/Some/Path?id=3'
+    >>> normalize_url("https://example.com/")
+    'https://example.com'
+    """
+    url = (url or '').strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url.rstrip('/')
+    if not parts.scheme or not parts.netloc:
+        return url.rstrip('/')
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').rstrip('.')
+    if ':' in host:
+        host = f"[{host}]"  # IPv6 address
+    if port is not None and port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+    userinfo = parts.netloc.rpartition('@')[0]
+    netloc = f"{userinfo}@{host}" if userinfo else host
+
+    path = parts.path.rstrip('/')
+    # The parameters kept are left exactly as they were written.
+    query = '&'.join(i for i in parts.query.split('&')
+                     if i and not _is_tracking(unquote_plus(i.partition('=')[0])))
+    return urlunsplit((scheme, netloc, path, query, parts.fragment))
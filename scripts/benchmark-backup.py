@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+benchmark-backup.py - time saving and restoring snapshots of large libraries
+
+For each size, writes a snapshot of a made-up library of that many
+bookmarks (with TAGS distinct tags, TAGS_PER_BOOKMARK to a bookmark),
+restores it into a new database, and saves the database to a snapshot
+again, timing the restore and the save and checking the second snapshot
+holds the same rows as the first.
+
+Usage: scripts/benchmark-backup.py [SIZE ...]   (default: 10000 100000 1000000)
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# pylint: disable=wrong-import-position
+from rabbitmark.librm import backup, database
+from rabbitmark.librm.url_key import normalize_url
+
+TAGS = 5000
+TAGS_PER_BOOKMARK = 3
+WORDS = ("python", "tutorial", "reference", "notes", "paper", "video", "recipe",
+         "guide", "blog", "docs", "news", "talk", "review", "howto", "archive")
+
+
+def make_snapshot(path: str, size: int) -> None:
+    "Write a snapshot of a made-up library of /size/ bookmarks to /path/."
+    rng = random.Random(size)
+    with open(path, 'wb') as f:
+        writer = backup.SnapshotWriter(f)
+        writer.write(backup.TAGS, ((i, f"tag{i}") for i in range(1, TAGS + 1)))
+
+        def bookmarks():
+            for i in range(1, size + 1):
+                url = f"https://example.com/{rng.choice(WORDS)}/{i}"
+                yield (i, f"{' '.join(rng.sample(WORDS, 3)).title()} {i}", url,
+                       normalize_url(url), ' '.join(rng.choices(WORDS, k=8)),
+                       int(rng.random() < 0.1))
+        writer.write(backup.BOOKMARKS, bookmarks())
+        writer.write(backup.ASSIGNMENTS,
+                     ((i, tag) for i in range(1, size + 1)
+                      for tag in sorted(rng.sample(range(1, TAGS + 1),
+                                                   TAGS_PER_BOOKMARK))))
+        writer.close()
+
+
+def read_all(path: str):
+    "Return every row in the snapshot at /path/, by kind."
+    with open(path, 'rb') as f:
+        reader = backup.SnapshotReader(f)
+        return {kind: [row for rows in reader.read(kind) for row in rows]
+                for kind in backup.SCHEMA}
+
+
+def main(sizes) -> None:
+    print(f"{'bookmarks':>9}  {'file MB':>7}  {'restore s':>9}  {'save s':>6}")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            original = os.path.join(tmpdir, 'original.rms')
+            copy = os.path.join(tmpdir, 'copy.rms')
+            make_snapshot(original, size)
+
+            os.environ['RABBITMARK_DATABASE'] = os.path.join(tmpdir, 'bench.db')
+            session = database.make_Session()()
+            start = time.perf_counter()
+            backup.restore(session, original)
+            restoring = time.perf_counter() - start
+
+            start = time.perf_counter()
+            backup.save(session, copy)
+            saving = time.perf_counter() - start
+            session.close()
+
+            assert read_all(original) == read_all(copy)
+            print(f"{size:>9}  {os.path.getsize(original) / 1e6:>7.1f}  "
+                  f"{restoring:>9.2f}  {saving:>6.2f}")
+
+
+if __name__ == '__main__':
+    main([int(i) for i in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+benchmark-dupes.py - time finding duplicates in large libraries
+
+For each size, makes up a library of that many bookmarks (restoring it from
+a snapshot, which is quickest), a few percent of them planted copies of
+others: the same URL over http or with "www.", or the same article with a
+query string added and a word added to its name. Then times find_duplicates() and
+counts how many of the planted copies it found and how many groups it
+reported that weren't planted.
+
+Usage: scripts/benchmark-dupes.py [SIZE ...]   (default: 10000 100000 400000)
+"""
+
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+from typing import Dict, Set
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# pylint: disable=wrong-import-position
+from rabbitmark.librm import backup, database, dedupe
+from rabbitmark.librm.url_key import normalize_url
+
+#: fraction of bookmarks that are planted copies of each kind
+EXACT_COPIES = 0.01
+NEAR_COPIES = 0.01
+
+
+def _word(rng) -> str:
+    return ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+
+
+def make_library(path: str, size: int):
+    """
+    Write a snapshot of a made-up library of /size/ bookmarks to /path/.
+
+    Return:
+        The (original, copy) pairs of IDs planted.
+    """
+    rng = random.Random(size)
+    vocabulary = [_word(rng) for _ in range(5000)]
+    hosts = [f"{_word(rng)}.example" for _ in range(size // 20 + 1)]
+    marks = []
+    titles = set()
+    planted = []
+
+    def unique(title):
+        # As RabbitMark would name a bookmark added with the same name.
+        number, name = 1, title
+        while name in titles:
+            number += 1
+            name = f"{title} {number}"
+        titles.add(name)
+        return name
+
+    for pk in range(1, size + 1):
+        roll = rng.random()
+        if marks and roll < EXACT_COPIES:
+            original = rng.choice(marks)
+            url = original[2].replace("https://",
+                                      rng.choice(("http://", "https://www.")))
+            marks.append((pk, unique(original[1]), url, original[3]))
+            planted.append((original[0], pk))
+        elif marks and roll < EXACT_COPIES + NEAR_COPIES:
+            original = rng.choice(marks)
+            url = f"{original[2]}?ref={_word(rng)}"
+            name = f"{original[1]} - {rng.choice(vocabulary).title()}"
+            marks.append((pk, unique(name), url, original[3]))
+            planted.append((original[0], pk))
+        else:
+            words = rng.choices(vocabulary, k=rng.randint(3, 7))
+            title = unique(' '.join(words).capitalize())
+            url = f"https://{rng.choice(hosts)}/{'-'.join(words)}"
+            description = ' '.join(rng.choices(vocabulary, k=rng.choice((0, 0, 5, 20))))
+            marks.append((pk, title, url, description))
+
+    with open(path, 'wb') as f:
+        writer = backup.SnapshotWriter(f)
+        writer.write(backup.BOOKMARKS,
+                     ((pk, name, url, normalize_url(url), description, 0)
+                      for pk, name, url, description in marks))
+        writer.close()
+    return planted
+
+
+def main(sizes) -> None:
+    print(f"{'bookmarks':>9}  {'seconds':>7}  {'planted':>7}  {'found':>5}  "
+          f"{'other groups':>12}")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            snapshot = os.path.join(tmpdir, 'library.rms')
+            planted = make_library(snapshot, size)
+            os.environ['RABBITMARK_DATABASE'] = os.path.join(tmpdir, 'bench.db')
+            session = database.make_Session()()
+            backup.restore(session, snapshot)
+
+            start = time.perf_counter()
+            groups = list(dedupe.find_duplicates(session))
+            elapsed = time.perf_counter() - start
+            session.close()
+
+            # The oldest of a group of exact duplicates can be in a group of
+            # near-duplicates as well.
+            groups_of: Dict[int, Set[int]] = {}
+            for n, group in enumerate(groups):
+                for pk in group.ids:
+                    groups_of.setdefault(pk, set()).add(n)
+            found = sum(1 for original, copy in planted
+                        if groups_of.get(original, set()) & groups_of.get(copy, set()))
+            planted_groups = {n for pair in planted for i in pair
+                              for n in groups_of.get(i, ())}
+            print(f"{size:>9}  {elapsed:>7.2f}  {len(planted):>7}  {found:>5}  "
+                  f"{len(groups) - len(planted_groups):>12}")
+
+
+if __name__ == '__main__':
+    main([int(i) for i in sys.argv[1:]] or [10_000, 100_000, 400_000])
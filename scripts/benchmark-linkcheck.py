@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+benchmark-linkcheck.py - time checking many links against a local stub server
+
+Starts a stub web server on HOSTS ports of localhost (each port counting as
+a host), which answers every HEAD request after LATENCY seconds, as a
+distant server might. For each size, makes up a library of that many
+bookmarks spread over the hosts and times checking them with scan() (threads)
+and scan_concurrent() (asyncio), printing the links checked per second and
+the fraction of requests made over a connection already open.
+The threaded scan is skipped for sizes over THREADED_LIMIT, as it would take
+minutes. Both scans send each host no more than a request every
+broken_links.MIN_HOST_INTERVAL seconds, so HOSTS is large enough that this
+isn't what limits them.
+
+Usage: scripts/benchmark-linkcheck.py [SIZE ...]   (default: 1000 10000 50000)
+"""
+
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# pylint: disable=wrong-import-position
+from rabbitmark.librm import backup, broken_links, database
+from rabbitmark.librm.url_key import normalize_url
+
+HOSTS = 500
+LATENCY = 0.1
+THREADED_LIMIT = 2000
+
+
+async def _answer(reader, writer) -> None:
+    "Answer each HEAD request on a connection with 200 OK, after LATENCY seconds."
+    try:
+        while True:
+            request = await reader.readuntil(b'\r\n\r\n')
+            await asyncio.sleep(LATENCY)
+            close = b'connection: close' in request.lower()
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n"
+                         + (b"Connection: close\r\n" if close else b"") + b"\r\n")
+            await writer.drain()
+            if close:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _serve(ports) -> None:
+    "Listen on HOSTS ports, putting the list of them on the queue /ports/."
+    listening = []
+    for _ in range(HOSTS):
+        server = await asyncio.start_server(_answer, '127.0.0.1', 0, backlog=4096)
+        listening.append(server.sockets[0].getsockname()[1])
+    ports.put(listening)
+    await asyncio.Event().wait()
+
+
+def _run_stub_server(ports) -> None:
+    asyncio.run(_serve(ports))
+
+
+def start_stub_server():
+    """
+    Start the stub server in a process of its own, so that it doesn't compete
+    with the checker for the interpreter. Return the ports it listens on.
+    """
+    ports: multiprocessing.Queue = multiprocessing.Queue()
+    multiprocessing.Process(target=_run_stub_server, args=(ports,), daemon=True).start()
+    return ports.get()
+
+
+def make_snapshot(path: str, size: int, ports) -> None:
+    "Write a snapshot of /size/ bookmarks spread over the stub server's /ports/."
+    with open(path, 'wb') as f:
+        writer = backup.SnapshotWriter(f)
+        urls = (f"http://127.0.0.1:{ports[i % len(ports)]}/page/{i}"
+                for i in range(1, size + 1))
+        writer.write(backup.BOOKMARKS,
+                     ((i, f"Page {i}", url, normalize_url(url), "", 0)
+                      for i, url in enumerate(urls, 1)))
+        writer.close()
+
+
+def time_scan(scanner, session):
+    """
+    Return the seconds /scanner/ took to check every link, checking they all
+    passed, and its ConnectionStats.
+    """
+    failures = []
+
+    def callback(_at, _tot, obj):
+        if not obj.successful:
+            failures.append(obj)
+
+    start = time.perf_counter()
+    stats = scanner(session, callback)
+    elapsed = time.perf_counter() - start
+    assert not failures, str(failures[0])
+    return elapsed, stats
+
+
+def main(sizes) -> None:
+    ports = start_stub_server()
+    print(f"{HOSTS} hosts answering after {LATENCY * 1000:.0f} ms")
+    print(f"{'bookmarks':>9}  {'threads/s':>9}  {'reused':>6}  "
+          f"{'asyncio/s':>9}  {'reused':>6}")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            snapshot = os.path.join(tmpdir, 'library.rms')
+            make_snapshot(snapshot, size, ports)
+            os.environ['RABBITMARK_DATABASE'] = os.path.join(tmpdir, 'bench.db')
+            session = database.make_Session()()
+            backup.restore(session, snapshot)
+
+            if size <= THREADED_LIMIT:
+                elapsed, stats = time_scan(broken_links.scan, session)
+                threaded = f"{size / elapsed:>9.0f}  {stats.reuse_rate:>6.0%}"
+            else:
+                threaded = f"{'-':>9}  {'-':>6}"
+            elapsed, stats = time_scan(broken_links.scan_concurrent, session)
+            session.close()
+            print(f"{size:>9}  {threaded}  "
+                  f"{size / elapsed:>9.0f}  {stats.reuse_rate:>6.0%}")
+
+
+if __name__ == '__main__':
+    main([int(i) for i in sys.argv[1:]] or [1000, 10_000, 50_000])
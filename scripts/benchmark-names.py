@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+benchmark-names.py - time giving unique names to many untitled bookmarks
+
+For each size, adds that many bookmarks all named "New Bookmark" to a
+throwaway database in one names_batch(), as importing untitled bookmarks
+does, timing just the choice of names ("New Bookmark", "New Bookmark 2",
+...). Then it times naming a few more without a batch, which reads every
+numbered name so far each time.
+
+Within a batch the cost per name should stay flat as the size grows, so the
+total is linear; outside one it grows with the number of names taken.
+
+Usage: scripts/benchmark-names.py [SIZE ...]   (default: 10000 100000 1000000)
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# pylint: disable=wrong-import-position
+from rabbitmark.librm import bookmark, database
+from rabbitmark.librm.models import Bookmark
+
+NAME = "New Bookmark"
+COMMIT_EVERY = 10_000
+UNBATCHED = 20
+
+
+def add_untitled(session, size: int) -> float:
+    "Add /size/ untitled bookmarks in one batch; return the time spent naming them."
+    naming = 0.0
+    with bookmark.names_batch(session):
+        for i in range(size):
+            start = time.perf_counter()
+            # pylint: disable=protected-access
+            name = bookmark._uniquify_name(session, NAME)
+            naming += time.perf_counter() - start
+            session.add(Bookmark(name=name, url=f"https://example.com/{i}",
+                                 description="", private=False, skip_linkcheck=False))
+            if (i + 1) % COMMIT_EVERY == 0:
+                session.commit()
+        session.commit()
+    return naming
+
+
+def name_unbatched(session) -> float:
+    "Return the average time to name one more untitled bookmark without a batch."
+    start = time.perf_counter()
+    for _ in range(UNBATCHED):
+        # pylint: disable=protected-access
+        bookmark.add_bookmark(session, "https://example.com/", [],
+                              bookmark._uniquify_name(session, NAME))
+    session.rollback()
+    return (time.perf_counter() - start) / UNBATCHED
+
+
+def main(sizes) -> None:
+    print(f"{'rows':>9}  {'batch s':>8}  {'per name us':>11}  {'unbatched ms':>12}")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.environ['RABBITMARK_DATABASE'] = os.path.join(tmpdir, 'bench.db')
+            session = database.make_Session()()
+            naming = add_untitled(session, size)
+            last = session.query(Bookmark.name).order_by(Bookmark.id.desc()).first()[0]
+            assert last == f"{NAME} {size}", last
+            unbatched = name_unbatched(session)
+            print(f"{size:>9}  {naming:>8.2f}  {naming / size * 1e6:>11.1f}  "
+                  f"{unbatched * 1000:>12.1f}")
+            session.close()
+
+
+if __name__ == '__main__':
+    main([int(i) for i in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
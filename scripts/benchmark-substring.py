@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+benchmark-substring.py - compare indexed substring filtering against LIKE
+
+Builds throwaway databases of synthetic bookmarks at several sizes and times
+the substring filter find_bookmarks() uses (which consults the trigram index)
+against the plain LIKE filter it replaces, checking that both match exactly
+the same bookmarks. Only IDs are selected, so the timings compare the filters
+themselves rather than loading Bookmark objects.
+
+Usage: scripts/benchmark-substring.py [SIZE ...]   (default: 10000 100000 1000000)
+"""
+
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from sqlalchemy import or_
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# pylint: disable=wrong-import-position
+from rabbitmark.definitions import MatchMode
+from rabbitmark.librm import bookmark, database
+from rabbitmark.librm.models import Bookmark
+
+WORDS = ("python rust haskell tutorial guide notes paper review history music "
+         "recipe garden physics algebra poetry archive manual library design "
+         "network database compiler kernel theory sketch").split()
+DOMAINS = ("arxiv.org/abs", "en.wikipedia.org/wiki", "github.com", "example.com",
+           "blog.example.net/posts", "docs.python.org/3/library",
+           "news.ycombinator.com")
+QUERIES = ("arxiv.org/abs/23", "xiv.org/abs/2301", "kernel the", "ithub.com/use",
+           "Tutorial", "no such text anywhere")
+REPEATS = 5
+
+
+def fill(engine, size: int) -> None:
+    "Insert /size/ synthetic bookmarks."
+    rng = random.Random(size)
+    rows = []
+    for i in range(size):
+        words = rng.sample(WORDS, 4)
+        domain = rng.choice(DOMAINS)
+        rows.append({
+            'name': f"{' '.join(words[:3]).title()} {i}",
+            'url': f"https://{domain}/{rng.randrange(1000, 2600)}.{i:05d}",
+            'description': ' '.join(rng.choices(WORDS, k=12)),
+            'private': False,
+            'skip_linkcheck': False,
+        })
+        if len(rows) == 10000:
+            engine.execute(Bookmark.__table__.insert(), rows)
+            rows = []
+    if rows:
+        engine.execute(Bookmark.__table__.insert(), rows)
+
+
+def like_ids(session, text: str) -> set:
+    "The filter find_bookmarks() used before the trigram index existed."
+    pattern = '%' + text + '%'
+    return {i for i, in session.query(Bookmark.id).filter(or_(
+        Bookmark.name.like(pattern),
+        Bookmark.url.like(pattern),
+        Bookmark.description.like(pattern)))}
+
+
+def indexed_ids(session, text: str) -> set:
+    "The filter find_bookmarks() uses now."
+    # pylint: disable=protected-access
+    text_filter = bookmark._text_filter(session, text, MatchMode.Substring)
+    return {i for i, in session.query(Bookmark.id).filter(text_filter)}
+
+
+def median_time(func, *args):
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = func(*args)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def main(sizes) -> None:
+    print(f"{'rows':>9}  {'query':<22} {'hits':>6}  {'LIKE ms':>9}  "
+          f"{'indexed ms':>10}  {'speedup':>7}")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.environ['RABBITMARK_DATABASE'] = os.path.join(tmpdir, 'bench.db')
+            Session = database.make_Session()
+            fill(Session.kw['bind'], size)
+            session = Session()
+            for query in QUERIES:
+                like_time, expected = median_time(like_ids, session, query)
+                index_time, found = median_time(indexed_ids, session, query)
+                assert found == expected, f"result mismatch for {query!r}"
+                print(f"{size:>9}  {query:<22} {len(found):>6}  "
+                      f"{like_time * 1000:>9.1f}  {index_time * 1000:>10.1f}  "
+                      f"{like_time / index_time:>6.1f}x")
+            session.close()
+
+
+if __name__ == '__main__':
+    main([int(i) for i in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,64 @@
+Feature: Backing up and restoring the library with snapshots
+  Background:
+    Given an empty RabbitMark database
+      And the following bookmarks
+        | name            | url                                 | description            | tags         |
+        | Python Tutorial | https://docs.python.org/3/tutorial/ | The official tutorial. | python, docs |
+        | Ruby vs Python  | https://example.com/ruby-python     | A comparison.          | ruby, python |
+        | Ruby Docs       | https://ruby-doc.org/               | Reference.             | ruby, docs   |
+        | An arXiv paper  | https://arxiv.org/abs/2301.01234    | Read this later.       |              |
+
+  Scenario: Restoring a snapshot brings back everything, flags included.
+     When the bookmark "Ruby Docs" is made private
+      And the bookmark "An arXiv paper" skips link checks and has a two-line description
+      And we back up the database
+      And we restore the snapshot into an empty database
+     Then the restored database holds the same bookmarks and tags
+      And the tag counts agree with counting the bookmarks
+     When we search for "comparison"
+     Then the results include "Ruby vs Python"
+
+  Scenario: Restoring replaces the bookmarks already there.
+     When we back up the database
+      And the bookmark "Ruby Docs" is deleted
+      And a bookmark named "Newcomer" is added
+      And we restore the snapshot
+     Then the restored database holds the same bookmarks and tags
+      And the tag counts agree with counting the bookmarks
+
+  Scenario: Bookmarks without a URL key are restored without one.
+     When another program clears the URL key of "Ruby Docs"
+      And we back up the database
+      And we restore the snapshot
+     Then the restored database holds the same bookmarks and tags
+      And "Ruby Docs" has no URL key
+
+  Scenario: The CLI won't restore over bookmarks unless told to.
+     When we run the command "backup" with the snapshot
+     Then the command reports "Saved 4 bookmarks and 3 tags to" the snapshot
+     When we run the command "restore" with the snapshot
+     Then the command refuses, saying "The database already has bookmarks"
+     When we run the command "restore --replace" with the snapshot
+     Then the command reports "Restored 4 bookmarks and 3 tags from" the snapshot
+
+  Scenario: A snapshot cut short is rejected without touching the database.
+     When we back up the database
+      And the snapshot is cut short
+      And the bookmark "Ruby Docs" is deleted
+     Then restoring the snapshot fails with "incomplete"
+      And there are 3 bookmarks
+      And the tag counts agree with counting the bookmarks
+
+  Scenario: A snapshot from a newer version is rejected.
+     When we back up the database
+      And the snapshot's format version is increased
+     Then restoring the snapshot fails with "only reads versions up to"
+      And there are 4 bookmarks
+
+  Scenario: Snapshots are written and loaded a block at a time.
+    Given 200 bookmarks tagged "alpha, beta"
+     When we back up the database in blocks of 50 rows
+      And we restore the snapshot into an empty database
+     Then the snapshot has 1 block of tags, 5 of bookmarks, and 9 of assignments
+      And each block was restored with one INSERT
+      And the restored database holds the same bookmarks and tags
@@ -0,0 +1,56 @@
+Feature: The bookmark table model
+  Background:
+    Given an empty RabbitMark database
+      And the following bookmarks
+        | name            | url                                 | description            | tags         |
+        | Python Tutorial | https://docs.python.org/3/tutorial/ | The official tutorial. | python, docs |
+        | Ruby vs Python  | https://example.com/ruby-python     | A comparison.          | ruby, python |
+        | Ruby Docs       | https://ruby-doc.org/               | Reference.             | ruby, docs   |
+        | An arXiv paper  | https://arxiv.org/abs/2301.01234    | Read this later.       |              |
+      And the bookmark table shows every bookmark
+
+  Scenario: Rows are found by primary key after sorting, inserting, and removing.
+     Then every bookmark in the table is found at its row by primary key
+     When the bookmark table is sorted by Tags, descending
+     Then every bookmark in the table is found at its row by primary key
+     Given the following bookmarks
+        | name            | url                                 | description            | tags         |
+        | Beginning Ruby  | https://example.com/beginning-ruby  | A book.                | ruby         |
+        | Zen of Python   | https://peps.python.org/pep-0020/   | Aphorisms.             | python       |
+     When the bookmark table is updated to show every bookmark
+     Then the bookmark table has 6 rows
+      And every bookmark in the table is found at its row by primary key
+     When the bookmark "Ruby vs Python" is deleted from the bookmark table
+     Then the bookmark table has 5 rows
+      And the bookmark "Ruby vs Python" is not found in the bookmark table
+      And every bookmark in the table is found at its row by primary key
+
+  Scenario: Updating the table leaves the list it was given alone.
+     When the bookmark table is updated with every bookmark in reverse order of name
+     Then the bookmark table lists "An arXiv paper, Python Tutorial, Ruby Docs, Ruby vs Python"
+      And the list the bookmark table was given is still in reverse order of name
+
+  Scenario: Updating the table reports only the rows that changed.
+    Given the view has drawn every row of the bookmark table
+     When the bookmark table is updated to show the bookmarks tagged "ruby"
+     Then the bookmark table reported only these changes
+        | change   | first | last |
+        | removed  | 0     | 1    |
+      And the bookmark table lists "Ruby Docs, Ruby vs Python"
+     When the bookmark table is updated to show every bookmark
+     Then the bookmark table reported only these changes
+        | change   | first | last |
+        | inserted | 0     | 1    |
+      And the bookmark table lists "An arXiv paper, Python Tutorial, Ruby Docs, Ruby vs Python"
+    Given the view has drawn every row of the bookmark table
+      And the following bookmarks
+        | name            | url                                 | description            | tags         |
+        | Perl Docs       | https://perldoc.perl.org/           | Reference.             | perl, docs   |
+     When the bookmark "Ruby Docs" is renamed to "Ruby Reference"
+      And the bookmark table is updated to show every bookmark
+     Then the bookmark table reported only these changes
+        | change   | first | last |
+        | inserted | 1     | 1    |
+        | changed  | 3     | 3    |
+      And the bookmark table lists "An arXiv paper, Perl Docs, Python Tutorial, Ruby Reference, Ruby vs Python"
+      And every bookmark in the table is found at its row by primary key
@@ -0,0 +1,43 @@
+Feature: Importing bookmarks in bulk
+  Background:
+    Given an empty RabbitMark database
+      And the following bookmarks
+        | name            | url                                 | description            | tags         |
+        | Python Tutorial | https://docs.python.org/3/tutorial/ | The official tutorial. | python, docs |
+      And the bookmark index is enabled
+
+  Scenario: Bookmarks imported in chunks get unique names and their tags.
+     When we import the CSV file 2 rows at a time
+       """
+       name,url,tags
+       Ruby Docs,https://ruby-doc.org/,"ruby, docs"
+       Python Tutorial,https://example.com/tutorial,"python, python, "
+       Untagged,https://example.com/untagged,
+       Official tutorial,https://docs.python.org/3/tutorial/,python
+       Python Tutorial,https://example.org/,"new, ruby"
+       """
+     Then 4 bookmarks were imported, 1 were duplicates, and 0 was a near-duplicate
+      And progress was reported 3 times, ending at the end of the file
+      And the bookmark "Python Tutorial 2" has the tags "python"
+      And the bookmark "Python Tutorial 3" has the tags "new, ruby"
+      And the bookmark "Untagged" has no tags
+      And the index is current
+      And the index finds the same bookmarks as SQL for every tag search
+      And the tag counts agree with counting the bookmarks
+
+  Scenario: Stopping an import keeps the chunks already imported.
+     When we import the CSV file 2 rows at a time, stopping after the first chunk
+       """
+       name,url,tags
+       Ruby Docs,https://ruby-doc.org/,"ruby, docs"
+       Untagged,https://example.com/untagged,
+       Python Tutorial,https://example.org/,"new, ruby"
+       """
+     Then 2 bookmarks were imported, 0 were duplicates, and 0 was a near-duplicate
+      And there are 3 bookmarks
+      And the index is current
+
+  Scenario: Importing looks up names, URLs and tags once per chunk, not per bookmark.
+     When we import 200 bookmarks tagged "alpha, beta" 100 rows at a time
+     Then 200 bookmarks were imported, 0 were duplicates, and 0 was a near-duplicate
+      And at most 12 queries were executed
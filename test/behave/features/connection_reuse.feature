@@ -0,0 +1,25 @@
+Feature: Reusing connections when checking links
+  Background:
+    Given an empty RabbitMark database
+
+  Scenario: Links to the same host are checked over the same few connections.
+    Given a stub web server that keeps connections open
+      And 60 bookmarks of pages on the stub server
+     When we check the links concurrently, 3 at a time per host and 5 in all
+     Then all 60 links are reported as successful
+      And the stub server was connected to no more than 3 times
+      And the check reports 60 requests, reusing connections for at least 95%
+
+  Scenario: Checking with threads reuses connections too.
+    Given a stub web server that keeps connections open
+      And 60 bookmarks of pages on the stub server
+     When we check the links with threads, keeping the results
+     Then all 60 links are reported as successful
+      And the stub server was connected to no more than 3 times
+      And the check reports 60 requests, reusing connections for at least 95%
+
+  Scenario: A connection the server closed while it sat idle is replaced.
+    Given a stub web server that closes connections without saying so
+      And 30 bookmarks of pages on the stub server
+     When we check the links concurrently, 2 at a time per host and 5 in all
+     Then all 30 links are reported as successful
@@ -0,0 +1,66 @@
+Feature: Finding and merging duplicate bookmarks
+  Background:
+    Given an empty RabbitMark database
+      And the following bookmarks
+        | name                        | url                                              | description  | tags         |
+        | Python Tutorial             | https://docs.python.org/3/tutorial/              | Official.    | python, docs |
+        | The Python Tutorial         | http://www.docs.python.org/3/tutorial            | Bookmarked.  | learning     |
+        | Python tutorial (again)     | https://docs.python.org/3/tutorial/?utm_source=x |              | python       |
+        | Rust Ownership Explained    | https://blog.example.com/rust-ownership          | A long read. | rust         |
+        | Rust Ownership Explained II | https://blog.example.com/rust-ownership?ref=feed |              | reading      |
+        | Ruby Docs                   | https://ruby-doc.org/                            | Reference.   | ruby         |
+        | Go by Example               | https://gobyexample.com/                         | Snippets.    | go           |
+
+  Scenario: Bookmarks with the same URL over http, https, or with "www." are exact duplicates.
+     When we look for duplicates
+     Then there is an exact group of "Python Tutorial", "The Python Tutorial", "Python tutorial (again)"
+
+  Scenario: A copy with a query string and a longer name is a near-duplicate.
+     When we look for duplicates
+     Then there is a similar group of "Rust Ownership Explained", "Rust Ownership Explained II"
+
+  Scenario: Unrelated bookmarks aren't grouped.
+     When we look for duplicates
+     Then there are 2 groups
+      And "Ruby Docs" is in no group
+      And "Go by Example" is in no group
+
+  Scenario: Bookmarks with long descriptions that say the same thing are near-duplicates.
+    Given the following bookmarks
+        | name       | url                          | description                                                                   | tags |
+        | Saved page | https://a.example/p/1        | How to bake sourdough bread at home with a starter, flour, water and some salt | food |
+        | Reposted   | https://mirror.example/x?q=9 | How to bake sourdough bread at home with a starter, flour, water and some salt | food |
+     When we look for duplicates
+     Then there is a similar group of "Saved page", "Reposted"
+
+  Scenario: Merging keeps one bookmark with all of the group's tags.
+     When we merge the duplicates of "Python Tutorial" into it
+     Then there are 5 bookmarks
+      And the bookmark "Python Tutorial" has the tags "docs, learning, python"
+      And the tag counts agree with counting the bookmarks
+
+  Scenario: The CLI lists groups and can merge the exact ones.
+     When we run the command "dupes"
+     Then the output includes "Same URL:"
+      And the output includes "Similar ("
+      And the output ends with "Found 2 groups of duplicates."
+     When we run the command "dupes --merge-exact"
+     Then the output ends with "Merged 2 bookmarks into others with the same URL."
+      And there are 5 bookmarks
+
+  Scenario: Bookmarks without a real URL aren't duplicates of each other.
+    Given the following bookmarks
+        | name              | url     | description | tags  |
+        | Draft about cats  |         |             | draft |
+        | Draft about taxes |         |             | draft |
+        | Note one          | http:// |             | note  |
+        | Note two          | http:// |             | note  |
+     When we run the command "dupes --merge-exact"
+     Then the output ends with "Merged 2 bookmarks into others with the same URL."
+      And there are 9 bookmarks
+      And the bookmark "Draft about cats" exists
+      And the bookmark "Note two" exists
+
+  Scenario: Each group of exact duplicates comes as soon as it has been read.
+     When we take the first group found
+     Then it is an exact group that came before every bookmark had been read
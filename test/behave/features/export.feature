@@ -0,0 +1,32 @@
+Feature: Exporting bookmarks to CSV
+  Background:
+    Given an empty RabbitMark database
+      And the following bookmarks
+        | name            | url                                 | description            | tags         |
+        | Python Tutorial | https://docs.python.org/3/tutorial/ | The official tutorial. | python, docs |
+        | An arXiv paper  | https://arxiv.org/abs/2301.01234    | Read this later.       |              |
+
+  Scenario: Each bookmark is exported with its tags.
+     When we run the command "export" with a file to export to
+     Then the command reports "Exported 2 bookmarks to" the file
+      And the exported CSV is
+        """
+        name,url,description,tags
+        Python Tutorial,https://docs.python.org/3/tutorial/,The official tutorial.,"docs,python"
+        An arXiv paper,https://arxiv.org/abs/2301.01234,Read this later.,
+        """
+
+  Scenario: Bookmarks can be exported to standard output.
+     When we run the command "export -" and capture its output
+     Then the exported CSV is
+        """
+        name,url,description,tags
+        Python Tutorial,https://docs.python.org/3/tutorial/,The official tutorial.,"docs,python"
+        An arXiv paper,https://arxiv.org/abs/2301.01234,Read this later.,
+        """
+
+  Scenario: Exporting reads the bookmarks and their tags in one query.
+    Given 200 bookmarks tagged "alpha, beta"
+     When we export the bookmarks 50 at a time
+     Then 202 bookmarks were exported
+      And at most 1 queries were executed
@@ -0,0 +1,35 @@
+Feature: Filtering bookmarks with the full-text index
+  Background:
+    Given an empty RabbitMark database
+      And the following bookmarks
+        | name            | url                                 | description            | tags         |
+        | Python Tutorial | https://docs.python.org/3/tutorial/ | The official tutorial. | python, docs |
+        | Ruby vs Python  | https://example.com/ruby-python     | A comparison.          | ruby         |
+        | An arXiv paper  | https://arxiv.org/abs/2301.01234    | Read this later.       |              |
+
+  Scenario: Words match as prefixes, in any order and any field.
+     When we search for "tut pyth"
+     Then we get 1 search results
+      And the results include "Python Tutorial"
+
+  Scenario: Words that aren't adjacent still match.
+     When we search for "Python Ruby"
+     Then we get 1 search results
+      And the results include "Ruby vs Python"
+
+  Scenario: Substring mode finds fragments in the middle of words.
+     When we search for the substring "xiv.org/abs/23"
+     Then we get 1 search results
+      And the results include "An arXiv paper"
+
+  Scenario: Renamed bookmarks are found under their new name.
+     When the bookmark "Ruby vs Python" is renamed to "Ruby and Perl"
+      And we search for "perl"
+     Then we get 1 search results
+      And the results include "Ruby and Perl"
+
+  Scenario: Deleted bookmarks are no longer found.
+     When the bookmark "Python Tutorial" is deleted
+      And we search for "python"
+     Then we get 1 search results
+      And the results include "Ruby vs Python"
@@ -0,0 +1,54 @@
+Feature: Importing bookmarks exported from a web browser
+  Background:
+    Given an empty RabbitMark database
+      And the following bookmarks
+        | name            | url                                 | description            | tags         |
+        | Python Tutorial | https://docs.python.org/3/tutorial/ | The official tutorial. | python, docs |
+      And the bookmark index is enabled
+      And the browser bookmark file
+        """
+        <!DOCTYPE NETSCAPE-Bookmark-file-1>
+        <META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">
+        <TITLE>Bookmarks</TITLE>
+        <H1>Bookmarks Menu</H1>
+        <DL><p>
+            <DT><A HREF="place:parent=menu________&amp;queryType=1">Recently Bookmarked</A>
+            <DT><H3 ADD_DATE="1700000000">Programming, etc.</H3>
+            <DL><p>
+                <DT><A HREF="https://ruby-doc.org/" ADD_DATE="1700000000" TAGS="ruby,docs">Ruby Docs</A>
+                <DD>Reference for Ruby &amp; its
+        standard library.
+                <DT><H3>Rust</H3>
+                <DL><p>
+                    <DT><A HREF="https://doc.rust-lang.org/book/" PRIVATE="1">The Book</A>
+                </DL><p>
+                <DT><A HREF="https://example.com/untitled"></A>
+                <DT><A HREF="https://docs.python.org/3/tutorial/">Python Tutorial</A>
+            </DL><p>
+            <DT><H3 PERSONAL_TOOLBAR_FOLDER="true">Bookmarks Toolbar</H3>
+            <DL><p>
+                <DT><A HREF="https://news.ycombinator.com/">Hacker News</A>
+            </DL><p>
+        </DL>
+        """
+
+  Scenario: Bookmarks are tagged with the folders they were in.
+     When we import the browser bookmark file 2 bookmarks at a time, reading 16 characters at a time
+     Then 4 bookmarks were imported, 1 were duplicates, and 0 was a near-duplicate
+      And progress was reported 3 times, ending at the end of the file
+      And the bookmark "Ruby Docs" has the tags "Programming etc., ruby, docs"
+      And the bookmark "The Book" has the tags "Programming etc., Rust"
+      And the bookmark "https://example.com/untitled" has the tags "Programming etc."
+      And the bookmark "Hacker News" has no tags
+      And the bookmark "Ruby Docs" has the description "Reference for Ruby & its\nstandard library."
+      And the bookmark "The Book" is private
+      And the bookmark "Hacker News" is not private
+      And the index is current
+      And the index finds the same bookmarks as SQL for every tag search
+      And the tag counts agree with counting the bookmarks
+
+  Scenario: Stopping an import keeps the chunks already imported.
+     When we import the browser bookmark file 2 bookmarks at a time, stopping after the first chunk
+     Then 2 bookmarks were imported, 0 were duplicates, and 0 was a near-duplicate
+      And there are 3 bookmarks
+      And the index is current
@@ -0,0 +1,39 @@
+Feature: Checking links for rot
+  Background:
+    Given an empty RabbitMark database
+      And a stub web server
+      And the following bookmarks on the stub server
+        | name         | path         |
+        | Fine         | /ok          |
+        | Gone         | /missing     |
+        | Moved        | /moved       |
+        | Going around | /loop        |
+        | Unreachable  | closed port  |
+        | Not the web  | ftp          |
+
+  Scenario: Checking concurrently gives the same results as checking with threads.
+     When we check the links with threads
+      And we check the links concurrently
+     Then both checks give the same results
+      And "Fine" is reported as successful
+      And "Moved" is reported as successful
+      And "Gone" is reported as failing with status 404
+      And "Going around" is reported as failing with "Redirect loop"
+      And "Unreachable" is reported as failing with "Connection error"
+
+  Scenario: Only failures are reported when asked.
+     When we check the links concurrently, reporting only failures
+     Then 4 results are reported, numbered out of 6
+
+  Scenario: No host gets more than its share of requests at once.
+    Given 20 bookmarks of slow pages on the stub server
+      And 20 bookmarks of slow pages on another stub server
+     When we check the links concurrently, 3 at a time per host and 5 in all
+     Then neither stub server had more than 3 requests at once
+      And the stub servers had no more than 5 requests at once between them
+
+  Scenario: A canceled check stops without waiting for slow servers.
+    Given 20 bookmarks of slow pages on the stub server
+     When we check the links concurrently and cancel after the first result
+     Then 1 result is reported
+      And the check took less than a second
@@ -0,0 +1,111 @@
+Feature: Saving the results of checking links
+  Background:
+    Given an empty RabbitMark database
+      And a stub web server
+      And the following bookmarks on the stub server
+        | name         | path         |
+        | Fine         | /ok          |
+        | Also fine    | /ok/1        |
+        | Gone         | /missing     |
+        | Moved        | /moved       |
+        | Unreachable  | closed port  |
+        | Tagged       | /etag        |
+        | Dated        | /dated       |
+
+  Scenario Outline: Every result is saved.
+     When we check the links <how>
+     Then 7 checks are saved
+      And the last check of "Fine" is saved with status 200
+      And the last check of "Gone" is saved with status 404
+      And the last check of "Unreachable" is saved with "Connection error"
+      And the last check of "Moved" is saved as ending up at the path /ok
+      And the last check of "Tagged" is saved with the validators the server sent
+      And the last check of "Dated" is saved with the validators the server sent
+
+    Examples:
+      | how          |
+      | with threads |
+      | concurrently |
+
+  Scenario Outline: Pages that haven't changed are checked with conditional requests.
+     When we check the links <how>
+      And we check the links <how> again
+     Then "Tagged" is reported as successful
+      And "Dated" is reported as successful
+      And the last check of "Tagged" is saved with status 304
+      And the last check of "Dated" is saved with status 304
+      And the last check of "Tagged" is saved with the validators the server sent
+      And the last check of "Dated" is saved with the validators the server sent
+      And the requests for /etag and /dated were conditional
+
+    Examples:
+      | how          |
+      | with threads |
+      | concurrently |
+
+  Scenario Outline: Only links that failed or are due are checked again.
+     When we check the links <how>
+    Given the last check of "Fine" was 40 days ago
+      And the last check of "Also fine" was 5 days ago
+      And the last check of "Tagged" was 40 days ago
+     When we check the links <how>, only those due after 28 days
+     Then only these paths are requested
+        | path     |
+        | /ok      |
+        | /missing |
+        | /etag    |
+      And "Unreachable" is reported as failing with "Connection error"
+      And 7 checks are saved
+
+    Examples:
+      | how          |
+      | with threads |
+      | concurrently |
+
+  Scenario: A link is checked again when its URL changes.
+     When we check the links concurrently
+    Given the URL of "Also fine" is changed to the path /ok/2
+     When we check the links concurrently, only those due after 28 days
+     Then only these paths are requested
+        | path     |
+        | /ok/2    |
+        | /missing |
+
+  Scenario: The age at which links are due can be configured.
+     When we check the links concurrently
+    Given the last check of "Fine" was 3 days ago
+      And the configuration key "linkcheck_max_age_days" is "2"
+     When we check the links concurrently, only those due as configured
+     Then only these paths are requested
+        | path     |
+        | /ok      |
+        | /missing |
+
+  Scenario Outline: The link check window checks only links that are due unless told to check all.
+     When we check the links concurrently
+      And the link check window checks <which>
+     Then the link check window reports <count> links checked
+
+    Examples:
+      | which      | count |
+      | the links  | 2     |
+      | every link | 7     |
+
+  Scenario: The results of deleted bookmarks are dropped.
+     When we check the links concurrently
+      And the bookmark "Gone" is deleted
+      And we check the links concurrently again
+     Then 6 checks are saved
+
+  Scenario: A bookmark's result is deleted along with it.
+     When we check the links concurrently
+      And the bookmark "Gone" is deleted
+     Then 6 checks are saved
+
+  Scenario: Restoring a snapshot drops the saved results.
+     When we check the links concurrently
+      And we back up the database
+      And we restore the snapshot
+     Then 0 checks are saved
+     When we check the links concurrently, only those due after 28 days
+     Then 7 checks are saved
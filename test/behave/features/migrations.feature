@@ -0,0 +1,38 @@
+Feature: Migrating existing databases to add the indexes hot queries need
+  Scenario: A database from before schema versions is brought up to date.
+    Given an empty RabbitMark database
+      And 20 bookmarks tagged "alpha, beta"
+      And the database is taken back to before schema versions
+     When the database is opened again
+     Then the database has the latest schema version
+      And the index "ix_mark_tag_assoc_tag_id" exists
+      And the index "ix_bookmarks_url" exists
+      And the index "ix_bookmarks_private" exists
+      And there are 20 bookmarks
+
+  Scenario: An up-to-date database isn't migrated again.
+    Given an empty RabbitMark database
+     Then the database has the latest schema version
+      And migrating the database applies nothing
+
+  Scenario: A database from a newer version of RabbitMark is left alone.
+    Given an empty RabbitMark database
+      And the database has a schema version from the future
+     When the database is opened again
+     Then the database still has the schema version from the future
+
+  Scenario Outline: Hot queries use the indexes.
+    Given an empty RabbitMark database
+      And 20 bookmarks tagged "alpha, beta"
+      And 20 bookmarks tagged "gamma"
+     When we <operation>
+     Then the query plan uses the index "<index>"
+
+    Examples:
+      | operation                                        | index                    |
+      | check whether a URL is bookmarked                | ix_bookmarks_url         |
+      | list the bookmarks tagged "alpha"                | ix_mark_tag_assoc_tag_id |
+      | find the bookmarks tagged "alpha" or "gamma"     | ix_mark_tag_assoc_tag_id |
+      | find the bookmarks tagged "alpha" and "beta"     | ix_mark_tag_assoc_tag_id |
+      | merge the tag "alpha" into "gamma"               | ix_mark_tag_assoc_tag_id |
+      | fetch the first page of public bookmarks by name | ix_bookmarks_private     |
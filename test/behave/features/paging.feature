@@ -0,0 +1,18 @@
+Feature: Reading large search results a page at a time
+  Background:
+    Given an empty RabbitMark database
+      And 120 bookmarks with assorted tags
+
+  Scenario Outline: Pages continue exactly where the last one ended.
+     When we page through all bookmarks by <key> <direction>, 7 at a time
+     Then each bookmark is seen once, in the same order as sorting them all
+
+    Examples:
+      | key  | direction  |
+      | name | ascending  |
+      | name | descending |
+      | tags | ascending  |
+      | tags | descending |
+
+  Scenario: Searches with too many results to load at once are paged.
+     Then searching for everything returns the first 50 and a count of 120
@@ -0,0 +1,75 @@
+Feature: Checking links politely
+  Background:
+    Given an empty RabbitMark database
+      And a stub web server
+
+  Scenario Outline: Requests to the same host are kept apart.
+    Given 8 bookmarks of pages on the stub server
+     When we check the links <how>, at most one request every 0.05 seconds per host
+     Then all 8 links are reported as successful
+      And no stub server was sent requests less than 0.05 seconds apart
+
+    Examples:
+      | how          |
+      | with threads |
+      | concurrently |
+
+  Scenario Outline: Hosts take turns, so waiting for one doesn't hold up the others.
+    Given 10 bookmarks of pages on the stub server
+      And 10 bookmarks of pages on another stub server
+     When we check the links <how>, at most one request every 0.1 seconds per host
+     Then all 20 links are reported as successful
+      And each stub server was sent its first request before the others were sent their second
+      And the check took less than 1.5 seconds
+
+    Examples:
+      | how          |
+      | with threads |
+      | concurrently |
+
+  Scenario Outline: A link whose server asks us to slow down is checked again later.
+    Given the following bookmarks on the stub server
+        | name      | path   |
+        | Fine      | /ok    |
+        | Slow down | <path> |
+     When we check the links <how>, politely
+     Then "Fine" is reported as successful
+      And "Slow down" is reported as successful
+      And 2 results are reported, numbered out of 2
+      And <path> was requested twice, at least 1 second apart
+
+    Examples:
+      | how          | path         |
+      | with threads | /busy        |
+      | concurrently | /busy        |
+      | with threads | /unavailable |
+      | concurrently | /unavailable |
+      | with threads | /later       |
+      | concurrently | /later       |
+
+  Scenario: A thread checks other hosts while a server that asked us to slow down waits.
+    Given the following bookmarks on the stub server
+        | name      | path  |
+        | Slow down | /busy |
+      And 3 bookmarks of pages on another stub server
+     When we check the links with threads, politely, in a single thread
+     Then all 4 links are reported as successful
+      And the other stub server was sent all its requests before /busy was requested again
+      And /busy was requested twice, at least 1 second apart
+
+  Scenario Outline: A link isn't checked again if its server is down or asks us to wait too long.
+    Given the following bookmarks on the stub server
+        | name | path  |
+        | Down | /down |
+        | Away | /away |
+     When we check the links <how>, politely
+     Then "Down" is reported as failing with status 503
+      And "Away" is reported as failing with status 429
+      And /down was requested once
+      And /away was requested once
+      And the check took less than a second
+
+    Examples:
+      | how          |
+      | with threads |
+      | concurrently |
@@ -0,0 +1,12 @@
+Feature: Search results load their tags in bulk
+  Background:
+    Given an empty RabbitMark database
+      And 200 bookmarks tagged "alpha, beta"
+
+  Scenario: Displaying the tags of every result doesn't query once per bookmark.
+     When we find all bookmarks and display their tags
+     Then at most 2 queries were executed
+
+  Scenario: Sorting results by tags doesn't query once per bookmark.
+     When we find all bookmarks and sort them by tags
+     Then at most 2 queries were executed
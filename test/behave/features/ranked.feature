@@ -0,0 +1,28 @@
+Feature: Ranking filter matches by relevance
+  Background:
+    Given an empty RabbitMark database
+      And the following bookmarks
+        | name             | url                          | description                      | tags |
+        | Assorted Notes   | https://example.com/notes    | Mentions haskell once.           |      |
+        | Haskell Wiki     | https://wiki.haskell.org/    | The community wiki.              |      |
+        | Functional Blogs | https://example.com/haskell  | Various.                         |      |
+        | Zebra Facts      | https://example.com/zebra    | Nothing about programming.       |      |
+
+  Scenario: Matches in the name rank above matches elsewhere.
+     When we run the command "find --ranked -f haskell"
+     Then we get 3 search results
+      And result 1 is named "Haskell Wiki"
+
+  Scenario: Only the requested number of ranked results are listed.
+     When we run the command "find --ranked --limit 1 -f haskell"
+     Then we get 1 search results
+      And result 1 is named "Haskell Wiki"
+
+  Scenario: Without ranking, the results are listed by name.
+     When we run the command "find --limit 2 -f haskell"
+     Then we get 2 search results
+      And result 1 is named "Assorted Notes"
+      And result 2 is named "Functional Blogs"
+
+  Scenario: Later pages of ranked results continue where the first ended.
+     Then paging through the ranked results for "haskell" 1 at a time finds them all once
@@ -0,0 +1,25 @@
+Feature: Narrowing the previous search in memory
+  Background:
+    Given an empty RabbitMark database
+      And the following bookmarks
+        | name            | url                                 | description            | tags         |
+        | Python Tutorial | https://docs.python.org/3/tutorial/ | The official tutorial. | python, docs |
+        | Pythonic Code   | https://example.com/pythonic        | Idioms.                | python       |
+        | Ruby vs Python  | https://example.com/ruby-python     | A comparison.          | ruby         |
+      And we have typed "pyth" into the filter box
+
+  Scenario: Typing more of the filter text refines the previous results.
+     When we type "onic"
+     Then the search was refined without querying the database
+      And the refined results are the same as a fresh search
+
+  Scenario: Selecting another tag refines the previous results.
+     When we select the tag "docs"
+     Then the search was refined without querying the database
+      And the refined results are the same as a fresh search
+
+  Scenario: Committing a change forgets the previous results.
+     When a bookmark named "Python Cookbook" is added
+      And we type "on"
+     Then the search queried the database
+      And the refined results are the same as a fresh search
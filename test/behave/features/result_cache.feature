@@ -0,0 +1,44 @@
+Feature: Caching the results of recent searches
+  Background:
+    Given an empty RabbitMark database
+      And the following bookmarks
+        | name            | url                                 | description            | tags         |
+        | Python Tutorial | https://docs.python.org/3/tutorial/ | The official tutorial. | python, docs |
+        | Ruby vs Python  | https://example.com/ruby-python     | A comparison.          | ruby, python |
+        | Ruby Docs       | https://ruby-doc.org/               | Reference.             | ruby, docs   |
+      And the result cache is enabled with room for 2 results
+
+  Scenario: Repeating a search is answered from the cache.
+     When we search for the tag "ruby"
+      And we search for the tag "docs"
+      And we search for the tag "ruby"
+     Then the cache has had 1 hit and 2 misses
+      And the results are the same as a fresh search
+
+  Scenario: Tag counts are answered from the cache.
+     When we count the tags
+      And we count the tags
+     Then the cache has had 1 hit and 1 miss
+      And the tag counts are the same as a fresh count
+
+  Scenario: The least recently used result is dropped to make room.
+     When we search for the tag "ruby"
+      And we search for the tag "docs"
+      And we search for the tag "python"
+      And we search for the tag "ruby"
+     Then the cache has had 0 hits and 4 misses
+      And the cache has evicted 2 results
+
+  Scenario: Committing a change empties the cache.
+     When we search for the tag "ruby"
+      And the bookmark "Ruby Docs" is renamed to "Ruby Reference"
+      And we search for the tag "ruby"
+     Then the cache has had 0 hits and 2 misses
+      And the results are the same as a fresh search
+
+  Scenario: A change made by another program empties the cache.
+     When we count the tags
+      And another program makes every bookmark private
+      And we count the tags
+     Then the cache has had 0 hits and 2 misses
+      And the tag counts are the same as a fresh count
@@ -0,0 +1,29 @@
+Feature: Indexed substring filtering matches exactly what LIKE matches
+  Scenario Outline: Substring search for "<text>".
+    Given an empty RabbitMark database
+      And the following bookmarks
+        | name                 | url                               | description                 | tags   |
+        | An arXiv paper       | https://arxiv.org/abs/2301.01234  | Read this later.            | papers |
+        | Another arXiv paper  | https://arxiv.org/abs/1912.00001  | 100% worth it.              | papers |
+        | Ärger im Büro        | https://example.de/aerger         | Über den ÄRGER.             | de     |
+        | PYTHON IN CAPS       | https://example.com/shouting      | snake_case all the things   |        |
+        | Quote "marks"        | https://example.com/quotes        | She said "hi".              |        |
+     Then the substring search for "<text>" finds the same bookmarks as LIKE
+
+    Examples:
+      | text             |
+      | arxiv.org/abs/23 |
+      | xiv.org/abs      |
+      | ARXIV            |
+      | python in        |
+      | ärger            |
+      | ÄRGER            |
+      | über             |
+      | 100%             |
+      | snake_c          |
+      | e_c              |
+      | "marks"          |
+      | "hi              |
+      | ab               |
+      | x                |
+      | nothing matches  |
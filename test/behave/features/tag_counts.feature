@@ -0,0 +1,37 @@
+Feature: Counting bookmarks per tag with a table maintained by triggers
+  Background:
+    Given an empty RabbitMark database
+      And the following bookmarks
+        | name            | url                                 | description            | tags         |
+        | Python Tutorial | https://docs.python.org/3/tutorial/ | The official tutorial. | python, docs |
+        | Ruby vs Python  | https://example.com/ruby-python     | A comparison.          | ruby, python |
+        | Ruby Docs       | https://ruby-doc.org/               | Reference.             | ruby, docs   |
+        | An arXiv paper  | https://arxiv.org/abs/2301.01234    | Read this later.       |              |
+
+  Scenario: The table counts the bookmarks added.
+     Then the tag counts agree with counting the bookmarks
+
+  Scenario: The table follows bookmarks being retagged, hidden, and deleted.
+     When the bookmark "Ruby Docs" is made private
+      And the bookmark "An arXiv paper" is tagged "docs, papers"
+      And every tag is removed from the bookmark "Python Tutorial"
+      And the bookmark "Ruby vs Python" is deleted
+     Then the tag counts agree with counting the bookmarks
+
+  Scenario: The table follows tags being renamed, merged, and deleted.
+     When the tag "ruby" is renamed to "rubies"
+      And the tag "docs" is merged into "python"
+      And the tag "rubies" is deleted
+     Then the tag counts agree with counting the bookmarks
+
+  Scenario: The table follows changes made by another program.
+     When another program makes every bookmark private
+     Then the tag counts agree with counting the bookmarks
+
+  Scenario: The table survives many random changes.
+     When 300 random changes are made to the bookmarks
+     Then the tag counts agree with counting the bookmarks
+
+  Scenario: A database created before the table existed is counted.
+     When the tag count table is dropped and reinstalled
+     Then the tag counts agree with counting the bookmarks
@@ -0,0 +1,44 @@
+Feature: Searching by tag with the in-memory bookmark index
+  Background:
+    Given an empty RabbitMark database
+      And the following bookmarks
+        | name            | url                                 | description            | tags         |
+        | Python Tutorial | https://docs.python.org/3/tutorial/ | The official tutorial. | python, docs |
+        | Ruby vs Python  | https://example.com/ruby-python     | A comparison.          | ruby, python |
+        | Ruby Docs       | https://ruby-doc.org/               | Reference.             | ruby, docs   |
+        | An arXiv paper  | https://arxiv.org/abs/2301.01234    | Read this later.       |              |
+      And the bookmark index is enabled
+
+  Scenario: The index agrees with SQL after seeding.
+     Then the index finds the same bookmarks as SQL for every tag search
+
+  Scenario: The index follows bookmarks being added and deleted.
+     Given the following bookmarks
+        | name            | url                                 | description            | tags         |
+        | Untagged Note   | https://example.com/note            | Nothing.               |              |
+     When the bookmark "Ruby vs Python" is deleted
+     Then the index is current
+      And the index finds the same bookmarks as SQL for every tag search
+
+  Scenario: The index follows bookmarks deleted in an earlier flush.
+     Given the following bookmarks
+        | name            | url                                 | description            | tags         |
+        | Gem Guide       | https://guides.rubygems.org/        | Packaging.             | gems, ruby   |
+     When the bookmark "Gem Guide" is deleted and flushed before committing
+     Then the index is current
+      And the index finds the same bookmarks as SQL for every tag search
+
+  Scenario: The index follows tags being renamed, merged, and deleted.
+     When the tag "ruby" is renamed to "rubies"
+      And the tag "docs" is merged into "python"
+      And the tag "rubies" is deleted
+     Then the index is current
+      And the index finds the same bookmarks as SQL for every tag search
+
+  Scenario: Changes the index wasn't told about make it stale until reseeded.
+     When another program makes every bookmark private
+     Then the index is stale
+     When we search by tag for public bookmarks
+     Then no public bookmarks are found
+      And the index is current
+      And the index finds the same bookmarks as SQL for every tag search
@@ -0,0 +1,38 @@
+Feature: Giving bookmarks unique names
+  Background:
+    Given an empty RabbitMark database
+      And the following bookmarks
+        | name     | url                   | description | tags |
+        | Note     | https://example.com/1 |             |      |
+        | Note 2   | https://example.com/2 |             |      |
+        | Note 4   | https://example.com/4 |             |      |
+        | Note 03  | https://example.com/5 |             |      |
+        | Note 3x  | https://example.com/6 |             |      |
+        | Notebook | https://example.com/7 |             |      |
+        | Note 1   | https://example.com/8 |             |      |
+
+  Scenario: Bookmarks with names in use are numbered, filling in gaps.
+     When 3 bookmarks named "Note" are added
+     Then the bookmarks added are named "Note 3, Note 5, Note 6"
+
+  Scenario: Names not in use are left alone.
+     When 2 bookmarks named "Untitled" are added
+     Then the bookmarks added are named "Untitled, Untitled 2"
+
+  Scenario: Naming a batch of bookmarks gives the same names.
+     When 3 bookmarks named "Note" are added in a batch
+     Then the bookmarks added are named "Note 3, Note 5, Note 6"
+
+  Scenario: A batch notices names it gave out that number another name.
+     When bookmarks named "Note, Note 5, Note, Note 3, Note 3" are added in a batch
+     Then the bookmarks added are named "Note 3, Note 5, Note 6, Note 3 2, Note 3 3"
+
+  Scenario: A batch looks up the names in use once per name.
+     When 200 bookmarks named "Note" are added in a batch
+     Then the names in use were looked up in 1 query
+      And the last bookmark added is named "Note 203"
+
+  Scenario: A batch gives out names looked up ahead of time only once.
+     When bookmarks named "Note, Note 3, Fresh, Fresh, Note 3" are added in a batch, looking up the names first
+     Then the bookmarks added are named "Note 3, Note 3 2, Fresh, Fresh 2, Note 3 3"
+      And the names in use were looked up in 3 queries
@@ -0,0 +1,68 @@
+Feature: Finding bookmarks of the same page under slightly different URLs
+  Scenario Outline: Variants of a URL have the same key.
+     Then the URLs "<first>" and "<second>" have the same key
+
+    Examples:
+      | first                         | second                                             |
+      | https://example.com/page      | HTTPS://Example.COM/page/                          |
+      | http://example.com/           | http://example.com:80                              |
+      | https://example.com/a?id=3    | https://example.com:443/a/?utm_source=feed&id=3    |
+      | https://example.com/a         | https://example.com/a?fbclid=abc&UTM_MEDIUM=email  |
+      | example.com/a                 | example.com/a/                                     |
+
+  Scenario Outline: Different pages have different keys.
+     Then the URLs "<first>" and "<second>" have different keys
+
+    Examples:
+      | first                         | second                        |
+      | https://example.com/page      | https://example.com/Page      |
+      | https://example.com/          | http://example.com/           |
+      | https://example.com:8443/     | https://example.com/          |
+      | https://example.com/a?id=3    | https://example.com/a?id=4    |
+      | https://example.com/a?b=1&c=2 | https://example.com/a?c=2&b=1 |
+
+  Scenario: Near-duplicates are found by their normalized URL.
+    Given an empty RabbitMark database
+      And the following bookmarks
+        | name         | url                       | description | tags |
+        | Example page | https://example.com/page  |             |      |
+        | Other page   | https://example.com/other |             |      |
+     Then the near-duplicates of "HTTPS://example.com/page/?utm_source=feed" are "Example page"
+      And the near-duplicates of "https://example.com/page2" are nothing
+      And the URL "https://example.com/page" is bookmarked
+      And the URL "https://example.com/page/" is not bookmarked
+
+  Scenario: Changing a URL changes its key.
+    Given an empty RabbitMark database
+      And the following bookmarks
+        | name         | url                       | description | tags |
+        | Example page | https://example.com/page  |             |      |
+     When the URL of the bookmark "Example page" is changed to "https://example.org/new/"
+     Then the near-duplicates of "https://example.org/new" are "Example page"
+      And the near-duplicates of "https://example.com/page" are nothing
+
+  Scenario: Importing skips bookmarks already present and counts near-duplicates.
+    Given an empty RabbitMark database
+      And the following bookmarks
+        | name         | url                       | description | tags |
+        | Example page | https://example.com/page  |             |      |
+     When we import the CSV file
+       """
+       name,url
+       Exact copy,https://example.com/page
+       Tracked copy,https://example.com/page/?utm_medium=email
+       New page,https://example.net/
+       Copy of new page,https://example.net/
+       """
+     Then 2 bookmarks were imported, 2 were duplicates, and 1 was a near-duplicate
+      And the near-duplicates of "https://example.com/page" are "Example page, Tracked copy"
+
+  Scenario: Migrating a database from before URL keys fills them in.
+    Given an empty RabbitMark database
+      And the following bookmarks
+        | name         | url                       | description | tags |
+        | Example page | https://Example.com/page/ |             |      |
+      And the database is taken back to before URL keys
+     When the database is opened again
+     Then the database has the latest schema version
+      And the near-duplicates of "https://example.com/page" are "Example page"
@@ -0,0 +1,155 @@
+from behave import *
+import os
+import struct
+import tempfile
+
+from sqlalchemy import event, update
+
+import rabbitmark.cli
+from rabbitmark.librm import backup
+from rabbitmark.librm.models import Bookmark
+
+
+def _library(session):
+    "Return everything a snapshot should hold about /session/'s bookmarks."
+    session.expire_all()
+    return sorted(
+        (i.id, i.name, i.url, i.url_key, i.description, i.private, i.skip_linkcheck,
+         tuple(sorted((j.id, j.text) for j in i.tags)))
+        for i in session.query(Bookmark))
+
+
+def _snapshot_path(context):
+    if 'snapshot_path' not in context:
+        tmpdir = tempfile.TemporaryDirectory()
+        context.add_cleanup(tmpdir.cleanup)
+        context.snapshot_path = os.path.join(tmpdir.name, 'library.rms')
+    return context.snapshot_path
+
+
+def _restore(context):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = context.session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        backup.restore(context.session, context.snapshot_path)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    context.statements = statements
+
+
+@when(u'the bookmark "{name}" skips link checks and has a two-line description')
+def step_impl(context, name):
+    mark = context.session.query(Bookmark).filter_by(name=name).one()
+    mark.skip_linkcheck = True
+    mark.description = "First line.\nSecond line, with a \\n and a tab:\t."
+    context.session.commit()
+
+
+@when(u'another program clears the URL key of "{name}"')
+def step_impl(context, name):
+    context.session.execute(update(Bookmark.__table__)
+                            .where(Bookmark.name == name).values(url_key=None))
+    context.session.commit()
+
+
+@when(u'we back up the database')
+def step_impl(context):
+    backup.save(context.session, _snapshot_path(context))
+    context.backed_up = _library(context.session)
+
+
+@when(u'we back up the database in blocks of {size:d} rows')
+def step_impl(context, size):
+    backup.save(context.session, _snapshot_path(context), block_rows=size)
+    context.backed_up = _library(context.session)
+
+
+@when(u'we restore the snapshot')
+def step_impl(context):
+    _restore(context)
+
+
+@when(u'we restore the snapshot into an empty database')
+def step_impl(context):
+    context.session.close()
+    context.execute_steps(u'Given an empty RabbitMark database')
+    _restore(context)
+
+
+@when(u'we run the command "{command}" with the snapshot')
+def step_impl(context, command):
+    if command == 'backup':
+        context.backed_up = _library(context.session)
+    context.result = rabbitmark.cli.call(command.split(' ') + [_snapshot_path(context)])
+
+
+@when(u'the snapshot is cut short')
+def step_impl(context):
+    with open(context.snapshot_path, 'r+b') as f:
+        f.truncate(os.path.getsize(context.snapshot_path) - 10)
+
+
+@when(u"the snapshot's format version is increased")
+def step_impl(context):
+    with open(context.snapshot_path, 'r+b') as f:
+        f.seek(len(backup.MAGIC))
+        f.write(struct.pack('<H', backup.FORMAT_VERSION + 1))
+
+
+@then(u'the command reports "{message}" the snapshot')
+def step_impl(context, message):
+    expected = f"{message} {context.snapshot_path}."
+    assert context.result == expected, context.result
+
+
+@then(u'the command refuses, saying "{message}"')
+def step_impl(context, message):
+    assert context.result.startswith(message), context.result
+
+
+@then(u'restoring the snapshot fails with "{message}"')
+def step_impl(context, message):
+    try:
+        backup.restore(context.session, context.snapshot_path)
+    except backup.SnapshotError as e:
+        assert message in str(e), str(e)
+    else:
+        assert False, "The snapshot was restored."
+
+
+@then(u'the restored database holds the same bookmarks and tags')
+def step_impl(context):
+    actual = _library(context.session)
+    assert actual == context.backed_up, actual
+
+
+@then(u'the snapshot has {tags:d} block of tags, {marks:d} of bookmarks, '
+      u'and {assignments:d} of assignments')
+def step_impl(context, tags, marks, assignments):
+    with open(context.snapshot_path, 'rb') as f:
+        kinds = [i.kind for i in backup.SnapshotReader(f).blocks]
+    actual = [kinds.count(i)
+              for i in (backup.TAGS, backup.BOOKMARKS, backup.ASSIGNMENTS)]
+    assert actual == [tags, marks, assignments], actual
+
+
+@then(u'each block was restored with one INSERT')
+def step_impl(context):
+    with open(context.snapshot_path, 'rb') as f:
+        blocks = len(backup.SnapshotReader(f).blocks)
+    inserts = [i for i in context.statements
+               if i.startswith(("INSERT INTO tags ", "INSERT INTO bookmarks ",
+                                "INSERT INTO mark_tag_assoc "))]
+    assert len(inserts) == blocks, len(inserts)
+
+
+@then(u'"{name}" has no URL key')
+def step_impl(context, name):
+    context.session.expire_all()
+    mark = context.session.query(Bookmark).filter_by(name=name).one()
+    assert mark.url_key is None, mark.url_key
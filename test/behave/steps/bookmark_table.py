@@ -0,0 +1,120 @@
+from behave import *
+
+# pylint: disable=no-name-in-module
+from PyQt5.QtCore import Qt, QCoreApplication
+
+from rabbitmark.gui.bookmark_table import BookmarkTableModel
+from rabbitmark.librm import bookmark
+from rabbitmark.librm.models import Bookmark, Tag
+
+# Qt models don't strictly need an application object, but may misbehave
+# without one.
+app = QCoreApplication.instance() or QCoreApplication([])
+
+
+def _show_every_bookmark(context):
+    context.table_model.updateContents(context.session.query(Bookmark).all())
+
+
+def _watch(model):
+    "Return a list that changes reported by /model/ are appended to."
+    changes = []
+    model.modelReset.connect(lambda: changes.append(('reset', None, None)))
+    model.layoutChanged.connect(lambda: changes.append(('layout', None, None)))
+    model.rowsRemoved.connect(
+        lambda _parent, first, last: changes.append(('removed', first, last)))
+    model.rowsInserted.connect(
+        lambda _parent, first, last: changes.append(('inserted', first, last)))
+    model.dataChanged.connect(
+        lambda top_left, bottom_right, _roles: changes.append(
+            ('changed', top_left.row(), bottom_right.row())))
+    return changes
+
+
+@given(u'the bookmark table shows every bookmark')
+def step_impl(context):
+    context.table_model = BookmarkTableModel(None)
+    _show_every_bookmark(context)
+    context.table_changes = _watch(context.table_model)
+
+
+@given(u'the view has drawn every row of the bookmark table')
+def step_impl(context):
+    model = context.table_model
+    for row in range(model.rowCount()):
+        for col in range(model.columnCount()):
+            model.data(model.index(row, col), Qt.DisplayRole)
+
+
+@when(u'the bookmark table is updated to show the bookmarks tagged "{tag}"')
+def step_impl(context, tag):
+    context.table_model.updateContents(
+        context.session.query(Bookmark).filter(Bookmark.tags.any(Tag.text == tag))
+        .all())
+
+
+@when(u'the bookmark table is updated to show every bookmark')
+def step_impl(context):
+    _show_every_bookmark(context)
+
+
+@when(u'the bookmark table is updated with every bookmark in reverse order of name')
+def step_impl(context):
+    context.given_marks = (context.session.query(Bookmark)
+                           .order_by(Bookmark.name.desc()).all())
+    context.table_model.updateContents(context.given_marks)
+
+
+@when(u'the bookmark table is sorted by {column}, {direction}')
+def step_impl(context, column, direction):
+    order = {'ascending': Qt.AscendingOrder, 'descending': Qt.DescendingOrder}
+    context.table_model.sort(BookmarkTableModel.ModelColumn[column].value,
+                             order[direction])
+
+
+@when(u'the bookmark "{name}" is deleted from the bookmark table')
+def step_impl(context, name):
+    mark = context.session.query(Bookmark).filter_by(name=name).one()
+    index = context.table_model.indexFromPk(mark.id)
+    bookmark.delete_bookmark(context.session, mark)
+    context.session.commit()
+    context.table_model.updateAfterDelete(index)
+
+
+@then(u'the bookmark table has {count:d} rows')
+def step_impl(context, count):
+    assert context.table_model.rowCount() == count, context.table_model.rowCount()
+
+
+@then(u'the bookmark "{name}" is not found in the bookmark table')
+def step_impl(context, name):
+    assert name not in [i.name for i in context.table_model.L]
+
+
+@then(u'every bookmark in the table is found at its row by primary key')
+def step_impl(context):
+    model = context.table_model
+    assert len(model.pkRows) == model.rowCount(), (dict(model.pkRows), model.L)
+    for row, mark in enumerate(model.L):
+        assert model.pkRows[mark.id] == row, (mark.name, model.pkRows[mark.id], row)
+        assert model.indexFromPk(mark.id).row() == row
+
+
+@then(u'the bookmark table reported only these changes')
+def step_impl(context):
+    expected = [(row['change'], int(row['first']), int(row['last']))
+                for row in context.table]
+    assert context.table_changes == expected, context.table_changes
+    context.table_changes.clear()
+
+
+@then(u'the bookmark table lists "{names}"')
+def step_impl(context, names):
+    shown = [i.name for i in context.table_model.L]
+    assert shown == [i.strip() for i in names.split(',')], shown
+
+
+@then(u'the list the bookmark table was given is still in reverse order of name')
+def step_impl(context):
+    names = [i.name for i in context.given_marks]
+    assert names == sorted(names, reverse=True), names
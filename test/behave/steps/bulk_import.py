@@ -0,0 +1,80 @@
+from behave import *
+import csv
+import os
+import tempfile
+
+from sqlalchemy import event
+
+from rabbitmark.librm import interchange
+from rabbitmark.librm.models import Bookmark
+
+
+def _import(context, text, chunk_size, stop_after=None):
+    "Import /text/ as a CSV file, recording progress and the statements executed."
+    progress = []
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = context.session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'import.csv')
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(text)
+            schema = interchange.get_csv_schema(path)
+            mapping = ["URL" if i == "url" else i.capitalize() for i in schema.columns]
+            context.import_result = interchange.import_bookmarks_from_csv(
+                context.session, path, schema.dialect, mapping,
+                progress=lambda *args: progress.append(args),
+                canceled=lambda: stop_after is not None and len(progress) >= stop_after,
+                chunk_size=chunk_size)
+            context.file_size = os.path.getsize(path)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    context.progress = progress
+    context.statements = statements
+
+
+@when(u'we import the CSV file {size:d} rows at a time')
+def step_impl(context, size):
+    _import(context, context.text + '\n', size)
+
+
+@when(u'we import the CSV file {size:d} rows at a time, stopping after the first chunk')
+def step_impl(context, size):
+    _import(context, context.text + '\n', size, stop_after=1)
+
+
+@when(u'we import {count:d} bookmarks tagged "{tags}" {size:d} rows at a time')
+def step_impl(context, count, tags, size):
+    with tempfile.SpooledTemporaryFile(mode='w+', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "url", "tags"])
+        for i in range(count):
+            writer.writerow([f"Bookmark {i}", f"https://example.com/{i}", tags])
+        f.seek(0)
+        _import(context, f.read(), size)
+
+
+@then(u'progress was reported {count:d} times, ending at the end of the file')
+def step_impl(context, count):
+    assert len(context.progress) == count, context.progress
+    at, tot, imported = context.progress[-1]
+    assert at == tot == context.file_size, context.progress
+    assert imported == context.import_result[0], context.progress
+
+
+@then(u'the bookmark "{name}" has the tags "{tags}"')
+def step_impl(context, name, tags):
+    mark = context.session.query(Bookmark).filter_by(name=name).one()
+    actual = sorted(i.text for i in mark.tags)
+    assert actual == sorted(i.strip() for i in tags.split(',')), actual
+
+
+@then(u'the bookmark "{name}" has no tags')
+def step_impl(context, name):
+    mark = context.session.query(Bookmark).filter_by(name=name).one()
+    assert not mark.tags, mark.tags
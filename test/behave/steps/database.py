@@ -0,0 +1,49 @@
+from behave import *
+import os
+import tempfile
+
+from rabbitmark.librm import bookmark
+from rabbitmark.librm import database
+from rabbitmark.librm.models import Bookmark
+
+
+@given(u'an empty RabbitMark database')
+def step_impl(context):
+    tmpdir = tempfile.TemporaryDirectory()
+    old_path = os.environ.get('RABBITMARK_DATABASE')
+    os.environ['RABBITMARK_DATABASE'] = os.path.join(tmpdir.name, 'rabbitmark.db')
+
+    def restore():
+        context.session.close()
+        if old_path is None:
+            del os.environ['RABBITMARK_DATABASE']
+        else:
+            os.environ['RABBITMARK_DATABASE'] = old_path
+        tmpdir.cleanup()
+    context.add_cleanup(restore)
+
+    context.Session = database.make_Session()
+    context.session = context.Session()
+
+
+@given(u'the following bookmarks')
+def step_impl(context):
+    for row in context.table:
+        tags = [i.strip() for i in row['tags'].split(',') if i.strip()]
+        bookmark.add_bookmark(context.session, row['url'], tags,
+                              row['name'], row['description'])
+    context.session.commit()
+
+
+@when(u'the bookmark "{old_name}" is renamed to "{new_name}"')
+def step_impl(context, old_name, new_name):
+    mark = context.session.query(Bookmark).filter_by(name=old_name).one()
+    mark.name = new_name
+    context.session.commit()
+
+
+@when(u'the bookmark "{name}" is deleted')
+def step_impl(context, name):
+    mark = context.session.query(Bookmark).filter_by(name=name).one()
+    bookmark.delete_bookmark(context.session, mark)
+    context.session.commit()
@@ -0,0 +1,79 @@
+from behave import *
+
+from rabbitmark.librm import dedupe
+from rabbitmark.librm.models import Bookmark
+
+
+def _ids(context, names):
+    return tuple(context.session.query(Bookmark).filter_by(name=i.strip('" ')).one().id
+                 for i in names.split(','))
+
+
+@when(u'we look for duplicates')
+def step_impl(context):
+    context.groups = list(dedupe.find_duplicates(context.session))
+
+
+@when(u'we take the first group found')
+def step_impl(context):
+    context.progress = []
+    search = dedupe.find_duplicates(
+        context.session, progress=lambda at, tot: context.progress.append((at, tot)))
+    context.first_group = next(search)
+    search.close()
+
+
+@when(u'we merge the duplicates of "{name}" into it')
+def step_impl(context, name):
+    keep = context.session.query(Bookmark).filter_by(name=name).one()
+    group = next(i for i in dedupe.find_duplicates(context.session) if keep.id in i.ids)
+    others = [context.session.query(Bookmark).get(i) for i in group.ids]
+    dedupe.merge_duplicates(context.session, keep, others)
+    context.session.commit()
+
+
+@then(u'there is an exact group of {names}')
+def step_impl(context, names):
+    group = next((i for i in context.groups if i.ids == _ids(context, names)), None)
+    assert group is not None, context.groups
+    assert group.exact and group.similarity == 1.0, group
+
+
+@then(u'there is a similar group of {names}')
+def step_impl(context, names):
+    group = next((i for i in context.groups if i.ids == _ids(context, names)), None)
+    assert group is not None, context.groups
+    assert not group.exact, group
+    assert dedupe.SIMILARITY_THRESHOLD <= group.similarity <= 1.0, group
+
+
+@then(u'there are {count:d} groups')
+def step_impl(context, count):
+    assert len(context.groups) == count, context.groups
+
+
+@then(u'"{name}" is in no group')
+def step_impl(context, name):
+    pk, = _ids(context, name)
+    assert not any(pk in i.ids for i in context.groups), context.groups
+
+
+@then(u'the output includes "{text}"')
+def step_impl(context, text):
+    assert any(text in i for i in context.result_lines), context.result_lines
+
+
+@then(u'the output ends with "{text}"')
+def step_impl(context, text):
+    assert context.result_lines[-1].endswith(text), context.result_lines
+
+
+@then(u'the bookmark "{name}" exists')
+def step_impl(context, name):
+    assert context.session.query(Bookmark).filter_by(name=name).count() == 1, name
+
+
+@then(u'it is an exact group that came before every bookmark had been read')
+def step_impl(context):
+    assert context.first_group.exact, context.first_group
+    assert not any(at == tot for at, tot in context.progress), context.progress
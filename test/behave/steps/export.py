@@ -0,0 +1,62 @@
+from behave import *
+from contextlib import redirect_stdout
+import io
+import os
+import tempfile
+
+from sqlalchemy import event
+
+import rabbitmark.cli
+from rabbitmark.librm import interchange
+
+
+@when(u'we run the command "export" with a file to export to')
+def step_impl(context):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        context.export_path = os.path.join(tmpdir, 'export.csv')
+        context.result = rabbitmark.cli.call(['export', context.export_path])
+        with open(context.export_path, encoding='utf-8') as f:
+            context.exported = f.read()
+
+
+@when(u'we run the command "export -" and capture its output')
+def step_impl(context):
+    output = io.StringIO()
+    with redirect_stdout(output):
+        context.result = rabbitmark.cli.call(['export', '-'])
+    context.exported = output.getvalue()
+
+
+@when(u'we export the bookmarks {size:d} at a time')
+def step_impl(context, size):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *_args):
+        statements.append(statement)
+
+    session = context.Session()
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        context.export_rows = list(interchange.iter_bookmark_rows(session, size))
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+        session.close()
+    context.statements = statements
+
+
+@then(u'the command reports "{message}" the file')
+def step_impl(context, message):
+    expected = f"{message} {context.export_path}."
+    assert context.result == expected, context.result
+
+
+@then(u'the exported CSV is')
+def step_impl(context):
+    actual = context.exported.splitlines()
+    assert actual == context.text.splitlines(), actual
+
+
+@then(u'{count:d} bookmarks were exported')
+def step_impl(context, count):
+    assert len(context.export_rows) == count, len(context.export_rows)
@@ -1,7 +1,12 @@
 from behave import *
 import re
 
+from sqlalchemy import or_
+
 import rabbitmark.cli
+from rabbitmark.definitions import MatchMode, SearchMode
+from rabbitmark.librm import bookmark
+from rabbitmark.librm.models import Bookmark
 
 @given(u'the RabbitMark test database is configured')
 def step_impl(context):
@@ -25,3 +30,46 @@ def step_impl(context):
 def step_impl(context, name):
     print(context.result_lines[2])
     assert re.match(f'^[\\s0-9]*\\s*{re.escape(name)}', context.result_lines[2])
+
+
+@when(u'we search for "{text}"')
+def step_impl(context, text):
+    result = rabbitmark.cli.call(['find', '-f', text])
+    context.result_lines = result.split('\n')
+
+
+@when(u'we search for the substring "{text}"')
+def step_impl(context, text):
+    result = rabbitmark.cli.call(['find', '--substring', '-f', text])
+    context.result_lines = result.split('\n')
+
+
+@then(u'we get {count:d} search results')
+def step_impl(context, count):
+    assert len(context.result_lines) == count + 2, context.result_lines
+
+
+@then(u'the results include "{name}"')
+def step_impl(context, name):
+    assert any(re.match(f'^[\\s0-9]*\\s*{re.escape(name)}', line)
+               for line in context.result_lines[2:]), context.result_lines
+
+
+@then(u'the substring search for "{text}" finds the same bookmarks as LIKE')
+def step_impl(context, text):
+    session = context.session
+    found = {i.id for i in bookmark.find_bookmarks(
+        session, text, [], True, SearchMode.And, MatchMode.Substring)}
+
+    pattern = '%' + text + '%'
+    expected = {i for i, in session.query(Bookmark.id).filter(or_(
+        Bookmark.name.like(pattern),
+        Bookmark.url.like(pattern),
+        Bookmark.description.like(pattern)))}
+    assert found == expected, (found, expected)
+
+
+@then(u'result {number:d} is named "{name}"')
+def step_impl(context, number, name):
+    line = context.result_lines[number + 1]
+    assert re.match(f'^[\\s0-9]*\\s*{re.escape(name)}', line), line
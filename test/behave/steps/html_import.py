@@ -0,0 +1,64 @@
+from behave import *
+import os
+import tempfile
+
+from rabbitmark.librm import interchange
+from rabbitmark.librm.models import Bookmark
+
+
+def _import(context, chunk_size, read_size=interchange.HTML_READ_SIZE, stop_after=None):
+    "Import the browser bookmark file, recording progress."
+    progress = []
+    old_read_size = interchange.HTML_READ_SIZE
+    interchange.HTML_READ_SIZE = read_size
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'bookmarks.html')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(context.bookmark_file)
+            context.import_result = interchange.import_bookmarks_from_html(
+                context.session, path,
+                progress=lambda *args: progress.append(args),
+                canceled=lambda: stop_after is not None and len(progress) >= stop_after,
+                chunk_size=chunk_size)
+            context.file_size = os.path.getsize(path)
+    finally:
+        interchange.HTML_READ_SIZE = old_read_size
+    context.progress = progress
+
+
+def _mark(context, name):
+    return context.session.query(Bookmark).filter_by(name=name).one()
+
+
+@given(u'the browser bookmark file')
+def step_impl(context):
+    context.bookmark_file = context.text + '\n'
+
+
+@when(u'we import the browser bookmark file {size:d} bookmarks at a time, '
+      u'reading {read_size:d} characters at a time')
+def step_impl(context, size, read_size):
+    _import(context, size, read_size)
+
+
+@when(u'we import the browser bookmark file {size:d} bookmarks at a time, '
+      u'stopping after the first chunk')
+def step_impl(context, size):
+    _import(context, size, stop_after=1)
+
+
+@then(u'the bookmark "{name}" has the description "{description}"')
+def step_impl(context, name, description):
+    actual = _mark(context, name).description
+    assert actual == description.replace('\\n', '\n'), actual
+
+
+@then(u'the bookmark "{name}" is private')
+def step_impl(context, name):
+    assert _mark(context, name).private
+
+
+@then(u'the bookmark "{name}" is not private')
+def step_impl(context, name):
+    assert not _mark(context, name).private
@@ -0,0 +1,534 @@
+from behave import *
+from datetime import timedelta
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import socket
+import threading
+import time
+
+from rabbitmark.gui.link_check_dialog import LinkCheckThread
+from rabbitmark.librm import bookmark
+from rabbitmark.librm import broken_links
+from rabbitmark.librm import config
+from rabbitmark.librm.models import Bookmark, LinkCheckResult
+
+#: seconds a request for a slow page takes to answer
+SLOW_SECONDS = 0.3
+
+#: validators of the stub server's pages that have them
+ETAG = '"v1"'
+LAST_MODIFIED = 'Wed, 21 Oct 2015 07:28:00 GMT'
+
+
+class Concurrency:
+    "The number of requests being answered, and the most there have been at once."
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.most_active = 0
+
+    def count(self, change):
+        with self.lock:
+            self.active += change
+            self.most_active = max(self.most_active, self.active)
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    A web server on localhost that counts how many requests it has at once,
+    and adds them to /shared/ as well.
+    """
+    daemon_threads = True
+
+    def __init__(self, shared):
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.concurrency = Concurrency()
+        self.shared = shared
+        self.connections = 0
+        #: paths requested, and those requested conditionally
+        self.requested = []
+        self.conditional = []
+        #: (path, time.monotonic()) of each request
+        self.request_times = []
+        #: 'close' (HTTP/1.0), 'keep-alive' (HTTP/1.1), or 'drop' (HTTP/1.1,
+        #: but closing each connection after one response anyway)
+        self.mode = 'close'
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def process_request(self, request, client_address):
+        with self.concurrency.lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def count(self, change):
+        self.concurrency.count(change)
+        self.shared.count(change)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def handle(self):
+        if self.server.mode != 'close':
+            self.protocol_version = 'HTTP/1.1'
+        super().handle()
+
+    def do_HEAD(self):
+        self.server.count(1)
+        with self.server.concurrency.lock:
+            first_time = self.path not in self.server.requested
+            self.server.requested.append(self.path)
+            self.server.request_times.append((self.path, time.monotonic()))
+        if 'If-None-Match' in self.headers or 'If-Modified-Since' in self.headers:
+            self.server.conditional.append(self.path)
+        try:
+            if self.path == '/ok' or self.path.startswith('/ok/'):
+                self.send_response(200)
+            elif self.path == '/etag':
+                unchanged = self.headers.get('If-None-Match') == ETAG
+                self.send_response(304 if unchanged else 200)
+                self.send_header('ETag', ETAG)
+            elif self.path == '/dated':
+                # Not sending Last-Modified again with a 304, as servers may not.
+                if self.headers.get('If-Modified-Since') == LAST_MODIFIED:
+                    self.send_response(304)
+                else:
+                    self.send_response(200)
+                    self.send_header('Last-Modified', LAST_MODIFIED)
+            elif self.path == '/moved':
+                self.send_response(301)
+                self.send_header('Location', '/ok')
+            elif self.path == '/loop':
+                self.send_response(302)
+                self.send_header('Location', '/loop')
+            elif self.path == '/busy' and first_time:
+                self.send_response(429)
+                self.send_header('Retry-After', '1')
+            elif self.path == '/unavailable' and first_time:
+                self.send_response(503)
+                self.send_header('Retry-After', '1')
+            elif self.path == '/later' and first_time:
+                self.send_response(503)
+                self.send_header('Retry-After',
+                                 formatdate(time.time() + 2, usegmt=True))
+            elif self.path in ('/busy', '/unavailable', '/later'):
+                self.send_response(200)
+            elif self.path == '/down':
+                self.send_response(503)
+            elif self.path == '/away':
+                self.send_response(429)
+                self.send_header('Retry-After', '3600')
+            elif self.path.startswith('/slow/'):
+                time.sleep(SLOW_SECONDS)
+                self.send_response(200)
+            else:
+                self.send_response(404)
+            self.end_headers()
+            if self.server.mode == 'drop':
+                self.close_connection = True
+        finally:
+            self.server.count(-1)
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_server(context):
+    server = StubServer(context.concurrency)
+    context.add_cleanup(server.server_close)
+    context.add_cleanup(server.shutdown)
+    return server
+
+
+def _closed_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _check(context, scanner, **kwargs):
+    # Only the scenarios about politeness wait between requests to a host;
+    # elsewhere it would just slow them down.
+    kwargs.setdefault('host_interval', 0)
+    results = []
+    start = time.perf_counter()
+    context.stats = scanner(context.session,
+                            lambda at, tot, obj: results.append((at, tot, obj)),
+                            **kwargs)
+    context.elapsed = time.perf_counter() - start
+    return results
+
+
+@given(u'a stub web server')
+def step_impl(context):
+    context.concurrency = Concurrency()
+    context.server = _start_server(context)
+    context.servers = [context.server]
+
+
+@given(u'a stub web server that keeps connections open')
+def step_impl(context):
+    context.execute_steps(u'Given a stub web server')
+    context.server.mode = 'keep-alive'
+
+
+@given(u'a stub web server that closes connections without saying so')
+def step_impl(context):
+    context.execute_steps(u'Given a stub web server')
+    context.server.mode = 'drop'
+
+
+@given(u'{count:d} bookmarks of pages on the stub server')
+def step_impl(context, count):
+    for i in range(count):
+        bookmark.add_bookmark(context.session, f"{context.server.base_url}/ok/{i}", [],
+                              f"Page {i}")
+    context.session.commit()
+
+
+@given(u'the following bookmarks on the stub server')
+def step_impl(context):
+    for row in context.table:
+        if row['path'] == 'closed port':
+            url = f"http://127.0.0.1:{_closed_port()}/"
+        elif row['path'] == 'ftp':
+            url = "ftp://127.0.0.1/file.txt"
+        else:
+            url = context.server.base_url + row['path']
+        bookmark.add_bookmark(context.session, url, [], row['name'])
+    context.session.commit()
+
+
+@given(u'{count:d} bookmarks of slow pages on the stub server')
+def step_impl(context, count):
+    for i in range(count):
+        bookmark.add_bookmark(context.session,
+                              f"{context.server.base_url}/slow/{i}", [], f"Slow {i}")
+    context.session.commit()
+
+
+@given(u'{count:d} bookmarks of pages on another stub server')
+def step_impl(context, count):
+    server = _start_server(context)
+    context.servers.append(server)
+    for i in range(count):
+        bookmark.add_bookmark(context.session, f"{server.base_url}/ok/{i}", [],
+                              f"Other page {i}")
+    context.session.commit()
+
+
+@given(u'{count:d} bookmarks of slow pages on another stub server')
+def step_impl(context, count):
+    server = _start_server(context)
+    context.servers.append(server)
+    for i in range(count):
+        bookmark.add_bookmark(context.session, f"{server.base_url}/slow/{i}", [],
+                              f"Other slow {i}")
+    context.session.commit()
+
+
+@when(u'we check the links with threads')
+def step_impl(context):
+    context.threaded_results = _check(context, broken_links.scan)
+
+
+@when(u'we check the links concurrently')
+def step_impl(context):
+    context.results = _check(context, broken_links.scan_concurrent)
+
+
+@when(u'we check the links {how}, only those due after {days:d} days')
+def step_impl(context, how, days):
+    scanner = (broken_links.scan if how == 'with threads'
+               else broken_links.scan_concurrent)
+    context.server.requested.clear()
+    context.results = _check(context, scanner, max_age=timedelta(days=days))
+
+
+@when(u'we check the links {how} again')
+def step_impl(context, how):
+    scanner = (broken_links.scan if how == 'with threads'
+               else broken_links.scan_concurrent)
+    context.server.requested.clear()
+    context.results = _check(context, scanner)
+
+
+@when(u'we check the links concurrently, only those due as configured')
+def step_impl(context):
+    context.server.requested.clear()
+    context.results = _check(context, broken_links.scan_concurrent,
+                             max_age=broken_links.configured_max_age(context.session))
+
+
+@when(u'we check the links {how}, '
+      u'at most one request every {interval:f} seconds per host')
+def step_impl(context, how, interval):
+    scanner = (broken_links.scan if how == 'with threads'
+               else broken_links.scan_concurrent)
+    context.results = _check(context, scanner, host_interval=interval)
+
+
+@when(u'we check the links {how}, politely')
+def step_impl(context, how):
+    scanner = (broken_links.scan if how == 'with threads'
+               else broken_links.scan_concurrent)
+    context.results = _check(context, scanner,
+                             host_interval=broken_links.MIN_HOST_INTERVAL)
+
+
+@when(u'we check the links with threads, politely, in a single thread')
+def step_impl(context):
+    threads, max_wait = broken_links.THREADS, broken_links.MAX_THREAD_WAIT
+    # Waiting less than the server's Retry-After, so that it's set aside.
+    broken_links.THREADS, broken_links.MAX_THREAD_WAIT = 1, 0.5
+    try:
+        context.results = _check(context, broken_links.scan,
+                                 host_interval=broken_links.MIN_HOST_INTERVAL)
+    finally:
+        broken_links.THREADS, broken_links.MAX_THREAD_WAIT = threads, max_wait
+
+
+@when(u'the link check window checks {which}')
+def step_impl(context, which):
+    # Run in this thread rather than started, so as to wait for it.
+    context.link_check_thread = LinkCheckThread(context.Session,
+                                                check_all=which == 'every link')
+    context.link_check_thread.run()
+    assert context.link_check_thread.exception is None, \
+        context.link_check_thread.exception
+
+
+@when(u'we check the links concurrently, reporting only failures')
+def step_impl(context):
+    context.results = _check(context, broken_links.scan_concurrent, only_failures=True)
+
+
+@when(u'we check the links with threads, keeping the results')
+def step_impl(context):
+    context.results = _check(context, broken_links.scan)
+
+
+@when(u'we check the links concurrently, {per_host:d} at a time per host '
+      u'and {total:d} in all')
+def step_impl(context, per_host, total):
+    context.results = _check(context, broken_links.scan_concurrent,
+                             max_connections=total, max_per_host=per_host)
+
+
+@when(u'we check the links concurrently and cancel after the first result')
+def step_impl(context):
+    context.results = []
+
+    def callback(at, tot, obj):
+        context.results.append((at, tot, obj))
+
+    start = time.perf_counter()
+    broken_links.scan_concurrent(context.session, callback,
+                                 canceled=lambda: bool(context.results))
+    context.elapsed = time.perf_counter() - start
+
+
+def _by_name(results):
+    return {obj.name: (obj.status_code, obj.error_description) for _, _, obj in results}
+
+
+@then(u'both checks give the same results')
+def step_impl(context):
+    threaded = _by_name(context.threaded_results)
+    concurrent = _by_name(context.results)
+    assert threaded == concurrent, (threaded, concurrent)
+    assert [at for at, _, _ in context.results] == list(range(1, len(concurrent) + 1))
+
+
+@then(u'"{name}" is reported as successful')
+def step_impl(context, name):
+    result = next(obj for _, _, obj in context.results if obj.name == name)
+    assert result.successful, str(result)
+
+
+@then(u'"{name}" is reported as failing with status {code:d}')
+def step_impl(context, name, code):
+    result = next(obj for _, _, obj in context.results if obj.name == name)
+    assert not result.successful and result.status_code == code, str(result)
+
+
+@then(u'"{name}" is reported as failing with "{error}"')
+def step_impl(context, name, error):
+    result = next(obj for _, _, obj in context.results if obj.name == name)
+    assert result.status_code is None and result.error_description == error, str(result)
+
+
+@then(u'{count:d} results are reported, numbered out of {total:d}')
+def step_impl(context, count, total):
+    assert len(context.results) == count, context.results
+    assert all(tot == total for _, tot, _ in context.results), context.results
+
+
+@then(u'{count:d} result is reported')
+def step_impl(context, count):
+    assert len(context.results) == count, context.results
+
+
+@then(u'neither stub server had more than {count:d} requests at once')
+def step_impl(context, count):
+    actual = [i.concurrency.most_active for i in context.servers]
+    assert max(actual) == count, actual
+
+
+@then(u'the stub servers had no more than {count:d} requests at once between them')
+def step_impl(context, count):
+    assert context.concurrency.most_active == count, context.concurrency.most_active
+
+
+@then(u'all {count:d} links are reported as successful')
+def step_impl(context, count):
+    assert len(context.results) == count, context.results
+    failures = [str(obj) for _, _, obj in context.results if not obj.successful]
+    assert not failures, failures
+
+
+@then(u'the link check window reports {count:d} links checked')
+def step_impl(context, count):
+    thread = context.link_check_thread
+    checked = thread.link_success_count + thread.link_fail_count
+    assert checked == count, checked
+
+
+@then(u'the stub server was connected to no more than {count:d} times')
+def step_impl(context, count):
+    assert context.server.connections <= count, context.server.connections
+
+
+@then(u'the check reports {requests:d} requests, '
+      u'reusing connections for at least {rate:d}%')
+def step_impl(context, requests, rate):
+    stats = context.stats
+    assert stats.requests == requests, str(stats)
+    assert stats.connections == context.server.connections, \
+        (str(stats), context.server.connections)
+    assert stats.reuse_rate >= rate / 100, str(stats)
+
+
+@then(u'the check took less than a second')
+def step_impl(context):
+    assert context.elapsed < 1, context.elapsed
+
+
+def _result(context, name):
+    mark = context.session.query(Bookmark).filter_by(name=name).one()
+    return context.session.get(LinkCheckResult, mark.id)
+
+
+@given(u'the last check of "{name}" was {days:d} days ago')
+def step_impl(context, name, days):
+    result = _result(context, name)
+    result.checked_at -= timedelta(days=days)
+    context.session.commit()
+
+
+@given(u'the URL of "{name}" is changed to the path {path}')
+def step_impl(context, name, path):
+    mark = context.session.query(Bookmark).filter_by(name=name).one()
+    mark.url = context.server.base_url + path
+    context.session.commit()
+
+
+@given(u'the configuration key "{key}" is "{value}"')
+def step_impl(context, key, value):
+    config.put(context.session, key, value)
+    context.session.commit()
+
+
+@then(u'the last check of "{name}" is saved with status {code:d}')
+def step_impl(context, name, code):
+    result = _result(context, name)
+    assert result is not None and result.status_code == code, result
+    assert result.response_time is not None and result.response_time >= 0, result
+    assert result.checked_at is not None, result
+
+
+@then(u'the last check of "{name}" is saved with "{error}"')
+def step_impl(context, name, error):
+    result = _result(context, name)
+    assert result.status_code is None and result.error_description == error, result
+
+
+@then(u'the last check of "{name}" is saved as ending up at the path {path}')
+def step_impl(context, name, path):
+    result = _result(context, name)
+    assert result.final_url == context.server.base_url + path, result.final_url
+
+
+@then(u'the last check of "{name}" is saved with the validators the server sent')
+def step_impl(context, name):
+    result = _result(context, name)
+    validators = (result.etag, result.last_modified)
+    assert validators in ((ETAG, None), (None, LAST_MODIFIED)), validators
+
+
+@then(u'{count:d} checks are saved')
+def step_impl(context, count):
+    saved = context.session.query(LinkCheckResult).count()
+    assert saved == count, saved
+
+
+@then(u'only these paths are requested')
+def step_impl(context):
+    expected = sorted(row['path'] for row in context.table)
+    requested = sorted(context.server.requested)
+    assert requested == expected, requested
+
+
+@then(u'the requests for {paths} were conditional')
+def step_impl(context, paths):
+    expected = sorted(i.strip() for i in paths.split(' and '))
+    assert sorted(context.server.conditional) == expected, context.server.conditional
+
+
+def _times(server, path=None):
+    return [t for p, t in server.request_times if path is None or p == path]
+
+
+@then(u'no stub server was sent requests less than {interval:f} seconds apart')
+def step_impl(context, interval):
+    for server in context.servers:
+        times = _times(server)
+        gaps = [b - a for a, b in zip(times, times[1:])]
+        # A little leeway for the time between sending and the server noting it
+        assert min(gaps) >= interval - 0.01, gaps
+
+
+@then(u'each stub server was sent its first request '
+      u'before the others were sent their second')
+def step_impl(context):
+    firsts = [_times(server)[0] for server in context.servers]
+    seconds = [_times(server)[1] for server in context.servers]
+    assert max(firsts) < min(seconds), (firsts, seconds)
+
+
+@then(u'the other stub server was sent all its requests before {path} was '
+      u'requested again')
+def step_impl(context, path):
+    others = [t for server in context.servers if server is not context.server
+              for t in _times(server)]
+    again = _times(context.server, path)[1]
+    assert others and max(others) < again, (others, again)
+
+
+@then(u'{path} was requested once')
+def step_impl(context, path):
+    assert len(_times(context.server, path)) == 1, context.server.requested
+
+
+@then(u'{path} was requested twice, at least {seconds:d} second apart')
+def step_impl(context, path, seconds):
+    times = _times(context.server, path)
+    assert len(times) == 2, context.server.requested
+    assert times[1] - times[0] >= seconds - 0.05, times
+
+
+@then(u'the check took less than {seconds:f} seconds')
+def step_impl(context, seconds):
+    assert context.elapsed < seconds, context.elapsed
@@ -0,0 +1,144 @@
+from behave import *
+
+from sqlalchemy import event, text
+
+from rabbitmark.definitions import MatchMode, SearchMode
+from rabbitmark.librm import bookmark
+from rabbitmark.librm import database
+from rabbitmark.librm import migrations
+from rabbitmark.librm import search
+from rabbitmark.librm import tag as tag_ops
+from rabbitmark.librm.models import Bookmark, Tag
+
+FUTURE_VERSION = migrations.SCHEMA_VERSION + 100
+
+
+def _execute(context, statement):
+    with context.session.get_bind().begin() as conn:
+        result = conn.execute(text(statement))
+        return result.all() if result.returns_rows else None
+
+
+def _schema_version(context):
+    return _execute(context, "PRAGMA user_version")[0][0]
+
+
+@given(u'the database is taken back to before schema versions')
+def step_impl(context):
+    context.session.commit()
+    for index in ("ix_mark_tag_assoc_tag_id", "ix_bookmarks_url",
+                  "ix_bookmarks_private"):
+        _execute(context, f"DROP INDEX {index}")
+    _execute(context, "PRAGMA user_version = 0")
+
+
+@given(u'the database has a schema version from the future')
+def step_impl(context):
+    _execute(context, f"PRAGMA user_version = {FUTURE_VERSION}")
+
+
+@when(u'the database is opened again')
+def step_impl(context):
+    context.session.close()
+    context.Session = database.make_Session()
+    context.session = context.Session()
+
+
+@then(u'the database has the latest schema version')
+def step_impl(context):
+    version = _schema_version(context)
+    assert version == migrations.SCHEMA_VERSION, version
+
+
+@then(u'the database still has the schema version from the future')
+def step_impl(context):
+    assert _schema_version(context) == FUTURE_VERSION, _schema_version(context)
+
+
+@then(u'migrating the database applies nothing')
+def step_impl(context):
+    applied = migrations.migrate(context.session.get_bind())
+    assert applied == [], applied
+
+
+@then(u'the index "{index}" exists')
+def step_impl(context, index):
+    rows = _execute(context, f"SELECT 1 FROM sqlite_master "
+                             f"WHERE type = 'index' AND name = '{index}'")
+    assert rows, f"No index {index}"
+
+
+@then(u'there are {count:d} bookmarks')
+def step_impl(context, count):
+    actual = context.session.query(Bookmark).count()
+    assert actual == count, actual
+
+
+def _capture_plans(context, func):
+    """
+    Call /func/ with the test session, recording the query plan of each
+    SELECT statement it executes.
+    """
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, *_args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    context.session.expire_all()
+    engine = context.session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        func(context.session)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    connection = context.session.connection().connection
+    context.plans = [
+        [row[3] for row in connection.execute("EXPLAIN QUERY PLAN " + statement,
+                                              parameters)]
+        for statement, parameters in statements
+    ]
+
+
+@when(u'we check whether a URL is bookmarked')
+def step_impl(context):
+    _capture_plans(context,
+                   lambda session: bookmark.url_exists(session, "https://example.org/"))
+
+
+@when(u'we list the bookmarks tagged "{name}"')
+def step_impl(context, name):
+    _capture_plans(context, lambda session: list(
+        session.query(Tag).filter_by(text=name).one().bookmarks))
+
+
+@when(u'we find the bookmarks tagged "{first}" or "{second}"')
+def step_impl(context, first, second):
+    _capture_plans(context, lambda session: bookmark.find_bookmarks(
+        session, "", [first, second], True, SearchMode.Or))
+
+
+@when(u'we find the bookmarks tagged "{first}" and "{second}"')
+def step_impl(context, first, second):
+    _capture_plans(context, lambda session: bookmark.find_bookmarks(
+        session, "", [first, second], True, SearchMode.And))
+
+
+@when(u'we merge the tag "{from_name}" into "{into_name}"')
+def step_impl(context, from_name, into_name):
+    _capture_plans(context, lambda session: tag_ops.merge_tags(
+        session, from_name, into_name))
+
+
+@when(u'we fetch the first page of public bookmarks by name')
+def step_impl(context):
+    params = search.SearchParams("", (), False, SearchMode.Or, MatchMode.FullText)
+    _capture_plans(context, lambda session: search.fetch_page(
+        session, params, search.PageOrder('name')))
+
+
+@then(u'the query plan uses the index "{index}"')
+def step_impl(context, index):
+    assert any(f"INDEX {index} " in step for plan in context.plans for step in plan), \
+        context.plans
@@ -0,0 +1,55 @@
+from behave import *
+import random
+
+from rabbitmark.definitions import MatchMode, SearchMode
+from rabbitmark.librm import bookmark
+from rabbitmark.librm import search
+
+TAGS = ("alpha", "Beta", "gamma", "delta", "Epsilon")
+
+
+@given(u'{count:d} bookmarks with assorted tags')
+def step_impl(context, count):
+    rng = random.Random(count)
+    for i in range(count):
+        tags = rng.sample(TAGS, rng.randrange(0, 3))
+        # Repeat some names' prefixes, so that ties in one sort key are common.
+        bookmark.add_bookmark(context.session, f"https://example.com/{i}",
+                              tags, f"Bookmark {rng.randrange(10)} {i}")
+    context.session.commit()
+
+
+@when(u'we page through all bookmarks by {key} {direction}, {size:d} at a time')
+def step_impl(context, key, direction, size):
+    params = search.SearchParams("", (), True, SearchMode.Or, MatchMode.FullText)
+    order = search.PageOrder(key, direction == 'descending')
+    context.paged = []
+    after = None
+    while True:
+        marks, after = search.fetch_page(context.session, params, order, after, size)
+        if not marks:
+            break
+        context.paged.extend(marks)
+
+    all_marks = params.find(context.session)
+    if key == 'name':
+        sort_key = lambda i: i.name
+    else:
+        sort_key = lambda i: ', '.join(sorted(t.text for t in i.tags)).lower()
+    context.expected = sorted(all_marks, key=lambda i: (sort_key(i), i.id),
+                              reverse=order.descending)
+
+
+@then(u'each bookmark is seen once, in the same order as sorting them all')
+def step_impl(context):
+    assert [i.id for i in context.paged] == [i.id for i in context.expected]
+
+
+@then(u'searching for everything returns the first {limit:d} and a count of {total:d}')
+def step_impl(context, limit, total):
+    params = search.SearchParams("", (), True, SearchMode.Or, MatchMode.FullText)
+    page = search.RefiningSearch().find_page(
+        context.session, params, search.PageOrder('name'), limit=limit)
+    assert len(page.marks) == limit, len(page.marks)
+    assert page.total == total, page.total
+    assert page.after is not None
@@ -0,0 +1,56 @@
+from behave import *
+
+from sqlalchemy import event
+
+from rabbitmark.definitions import SearchMode
+from rabbitmark.gui.bookmark_table import BookmarkTableModel
+from rabbitmark.librm import bookmark
+
+
+@given(u'{count:d} bookmarks tagged "{tags}"')
+def step_impl(context, count, tags):
+    tag_list = [i.strip() for i in tags.split(',')]
+    for i in range(count):
+        bookmark.add_bookmark(context.session, f"https://example.com/{i}",
+                              tag_list, f"Bookmark {i}")
+    context.session.commit()
+
+
+def _count_queries(context, func):
+    "Call /func/ with a fresh session, counting the SQL statements it executes."
+    session = context.Session()
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        func(session)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+        session.close()
+    context.statements = statements
+
+
+@when(u'we find all bookmarks and display their tags')
+def step_impl(context):
+    def display(session):
+        marks = bookmark.find_bookmarks(session, "", [], True, SearchMode.Or)
+        for mark in marks:
+            BookmarkTableModel.ModelColumn.Tags.data(mark)
+    _count_queries(context, display)
+
+
+@when(u'we find all bookmarks and sort them by tags')
+def step_impl(context):
+    def sort(session):
+        marks = bookmark.find_bookmarks(session, "", [], True, SearchMode.Or)
+        sorted(marks, key=BookmarkTableModel.ModelColumn.Tags.sort_function())
+    _count_queries(context, sort)
+
+
+@then(u'at most {count:d} queries were executed')
+def step_impl(context, count):
+    assert len(context.statements) <= count, context.statements
@@ -0,0 +1,23 @@
+from behave import *
+
+from rabbitmark.definitions import MatchMode, SearchMode
+from rabbitmark.librm import search
+
+
+@then(u'paging through the ranked results for "{text}" {size:d} at a time '
+      u'finds them all once')
+def step_impl(context, text, size):
+    params = search.SearchParams(text, (), True, SearchMode.Or, MatchMode.FullText)
+    assert search.can_rank(context.session, params)
+    order = search.PageOrder(search.RANK)
+    paged = []
+    after = None
+    while True:
+        marks, after = search.fetch_page(context.session, params, order, after, size)
+        if not marks:
+            break
+        paged.extend(marks)
+
+    everything, _ = search.fetch_page(context.session, params, order, limit=None)
+    assert [i.id for i in paged] == [i.id for i in everything], (paged, everything)
+    assert {i.id for i in paged} == {i.id for i in params.find(context.session)}
@@ -0,0 +1,66 @@
+from behave import *
+
+from sqlalchemy import event
+
+from rabbitmark.definitions import MatchMode, SearchMode
+from rabbitmark.librm import bookmark
+from rabbitmark.librm import search
+
+
+def _search(context, text, tags=()):
+    params = search.SearchParams(text, tuple(tags), True, SearchMode.And,
+                                 MatchMode.Substring)
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = context.session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        context.found = {i.name for i in context.searcher.find(context.session, params)}
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    context.statements = statements
+    context.params = params
+
+
+@given(u'we have typed "{text}" into the filter box')
+def step_impl(context, text):
+    context.searcher = search.RefiningSearch()
+    _search(context, text)
+
+
+@when(u'we type "{more}"')
+def step_impl(context, more):
+    _search(context, context.params.filter_text + more, context.params.tags)
+
+
+@when(u'we select the tag "{tag}"')
+def step_impl(context, tag):
+    _search(context, context.params.filter_text, context.params.tags + (tag,))
+
+
+@when(u'a bookmark named "{name}" is added')
+def step_impl(context, name):
+    bookmark.add_bookmark(context.session, "https://example.com/new", [], name)
+    context.session.commit()
+
+
+@then(u'the search was refined without querying the database')
+def step_impl(context):
+    assert not context.statements, context.statements
+
+
+@then(u'the search queried the database')
+def step_impl(context):
+    assert context.statements
+
+
+@then(u'the refined results are the same as a fresh search')
+def step_impl(context):
+    p = context.params
+    expected = {i.name for i in bookmark.find_bookmarks(
+        context.session, p.filter_text, p.tags, p.include_private,
+        p.search_mode, p.match_mode)}
+    assert context.found == expected, (context.found, expected)
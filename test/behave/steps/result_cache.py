@@ -0,0 +1,50 @@
+from behave import *
+
+from rabbitmark.definitions import MatchMode, SearchMode
+from rabbitmark.librm import result_cache
+from rabbitmark.librm import search
+from rabbitmark.librm import tag as tag_ops
+
+
+@given(u'the result cache is enabled with room for {size:d} results')
+def step_impl(context, size):
+    context.cache = result_cache.enable(context.session, size)
+
+
+@when(u'we search for the tag "{tag}"')
+def step_impl(context, tag):
+    # A new searcher each time, so nothing is refined from the last search.
+    context.params = search.SearchParams("", (tag,), False, SearchMode.And,
+                                         MatchMode.FullText)
+    context.found = {i.name for i in
+                     search.RefiningSearch().find(context.session, context.params)}
+
+
+@when(u'we count the tags')
+def step_impl(context):
+    context.counts = tag_ops.scan_tags_with_counts(context.session, False)
+
+
+@then(u'the cache has had {hits:d} {hit_word} and {misses:d} {miss_word}')
+def step_impl(context, hits, hit_word, misses, miss_word):
+    stats = context.cache.stats
+    assert (stats.hits, stats.misses) == (hits, misses), stats
+
+
+@then(u'the cache has evicted {count:d} results')
+def step_impl(context, count):
+    assert context.cache.stats.evictions == count, context.cache.stats
+
+
+@then(u'the results are the same as a fresh search')
+def step_impl(context):
+    context.cache.clear()
+    expected = {i.name for i in context.params.find(context.session)}
+    assert context.found == expected, (context.found, expected)
+
+
+@then(u'the tag counts are the same as a fresh count')
+def step_impl(context):
+    context.cache.clear()
+    expected = tag_ops.scan_tags_with_counts(context.session, False)
+    assert context.counts == expected, (context.counts, expected)
@@ -0,0 +1,84 @@
+from behave import *
+import random
+
+from sqlalchemy import func, text
+
+from rabbitmark.definitions import NOTAGS
+from rabbitmark.librm import bookmark
+from rabbitmark.librm import tag as tag_ops
+from rabbitmark.librm import tag_counts
+from rabbitmark.librm.models import Bookmark, Tag, mark_tag_assoc
+
+TAGS = ("alpha", "beta", "gamma", "delta")
+
+
+def _mark(context, name):
+    return context.session.query(Bookmark).filter_by(name=name).one()
+
+
+@when(u'the bookmark "{name}" is made private')
+def step_impl(context, name):
+    _mark(context, name).private = True
+    context.session.commit()
+
+
+@when(u'the bookmark "{name}" is tagged "{tags}"')
+def step_impl(context, name, tags):
+    new_tags = [i.strip() for i in tags.split(',') if i.strip()]
+    tag_ops.change_tags(context.session, _mark(context, name), new_tags)
+    context.session.commit()
+
+
+@when(u'every tag is removed from the bookmark "{name}"')
+def step_impl(context, name):
+    tag_ops.change_tags(context.session, _mark(context, name), [])
+    context.session.commit()
+
+
+@when(u'{count:d} random changes are made to the bookmarks')
+def step_impl(context, count):
+    rng = random.Random(count)
+    session = context.session
+    for i in range(count):
+        marks = session.query(Bookmark).all()
+        action = rng.randrange(4)
+        if action == 0 or not marks:
+            bookmark.add_bookmark(session, f"https://example.com/{i}",
+                                  rng.sample(TAGS, rng.randrange(3)), f"Random {i}")
+        elif action == 1:
+            bookmark.delete_bookmark(session, rng.choice(marks))
+        elif action == 2:
+            tag_ops.change_tags(session, rng.choice(marks),
+                                rng.sample(TAGS, rng.randrange(3)))
+        else:
+            mark = rng.choice(marks)
+            mark.private = not mark.private
+        session.commit()
+
+
+@when(u'the tag count table is dropped and reinstalled')
+def step_impl(context):
+    engine = context.session.get_bind()
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP TABLE {tag_counts.TABLE}"))
+    tag_counts.install(engine)
+
+
+@then(u'the tag counts agree with counting the bookmarks')
+def step_impl(context):
+    session = context.session
+    session.expire_all()
+    for show_private in (False, True):
+        # pylint: disable=singleton-comparison
+        q = (session.query(Tag.text, func.count(mark_tag_assoc.c.mark_id))
+             .join(mark_tag_assoc, Tag.id == mark_tag_assoc.c.tag_id)
+             .join(Bookmark, Bookmark.id == mark_tag_assoc.c.mark_id))
+        notags_q = session.query(func.count(Bookmark.id)).filter(~Bookmark.tags.any())
+        if not show_private:
+            q = q.filter(Bookmark.private == False)
+            notags_q = notags_q.filter(Bookmark.private == False)
+        expected = dict(q.group_by(Tag.text).all())
+        expected[NOTAGS] = notags_q.scalar()
+
+        found = tag_ops.scan_tags_with_counts(session, show_private)
+        assert found == expected, (show_private, found, expected)
@@ -0,0 +1,94 @@
+from behave import *
+import sqlite3
+
+from rabbitmark.definitions import NOTAGS, SearchMode
+from rabbitmark.librm import bookmark
+from rabbitmark.librm import bookmark_index
+from rabbitmark.librm import tag as tag_ops
+from rabbitmark.librm.models import Bookmark
+
+
+def _tag_list(tags):
+    return [NOTAGS if i.strip() == 'NOTAGS' else i.strip()
+            for i in tags.split(',') if i.strip()]
+
+
+@given(u'the bookmark index is enabled')
+def step_impl(context):
+    context.index = bookmark_index.enable(context.session)
+
+
+@when(u'the bookmark "{name}" is deleted and flushed before committing')
+def step_impl(context, name):
+    mark = context.session.query(Bookmark).filter_by(name=name).one()
+    bookmark.delete_bookmark(context.session, mark)
+    context.session.flush()
+    context.session.commit()
+
+
+@when(u'the tag "{old}" is renamed to "{new}"')
+def step_impl(context, old, new):
+    assert tag_ops.rename_tag(context.session, old, new)
+    context.session.commit()
+
+
+@when(u'the tag "{old}" is merged into "{new}"')
+def step_impl(context, old, new):
+    assert tag_ops.merge_tags(context.session, old, new)
+    context.session.commit()
+
+
+@when(u'the tag "{name}" is deleted')
+def step_impl(context, name):
+    tag_ops.delete_tag(context.session, name)
+    context.session.commit()
+
+
+@when(u'another program makes every bookmark private')
+def step_impl(context):
+    path = context.session.get_bind().url.database
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE bookmarks SET private = 1")
+    conn.close()
+
+
+@when(u'we search by tag for public bookmarks')
+def step_impl(context):
+    context.session.expire_all()
+    context.found = {i.name for i in bookmark.find_bookmarks(
+        context.session, "", ['python'], False, SearchMode.Or)}
+
+
+@then(u'the index is {state}')
+def step_impl(context, state):
+    found = context.index.lookup(context.session, ['python'], True, SearchMode.Or)
+    expected = {'current': True, 'stale': False}[state]
+    assert (found is not None) == expected, found
+
+
+@then(u'the index finds the same bookmarks as SQL for every tag search')
+def step_impl(context):
+    searches = ("python", "docs", "ruby", "NOTAGS", "python, docs",
+                "python, NOTAGS", "python, ruby", "nonexistent")
+    for tags in searches:
+        for mode in SearchMode:
+            for include_private in (True, False):
+                found = context.index.lookup(context.session, _tag_list(tags),
+                                             include_private, mode)
+                assert found is not None, "index went stale"
+
+                # Temporarily disable the index to get the SQL answer.
+                engine = context.session.get_bind()
+                del bookmark_index._indexes[engine]
+                try:
+                    expected = {i.id for i in bookmark.find_bookmarks(
+                        context.session, "", _tag_list(tags), include_private, mode)}
+                finally:
+                    bookmark_index._indexes[engine] = context.index
+                assert set(found) == expected, (tags, mode, include_private,
+                                                set(found), expected)
+
+
+@then(u'no public bookmarks are found')
+def step_impl(context):
+    assert not context.found, context.found
@@ -0,0 +1,67 @@
+from behave import *
+from contextlib import nullcontext
+
+from sqlalchemy import event
+
+from rabbitmark.librm import bookmark
+
+
+def _add(context, names, batch, prefetch=False):
+    lookups = []
+
+    def before_cursor_execute(conn, cursor, statement, *_args):
+        if "substr(bookmarks.name" in statement:
+            lookups.append(statement)
+
+    engine = context.session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        with bookmark.names_batch(context.session) if batch else nullcontext():
+            if prefetch:
+                bookmark.prefetch_names(context.session, names)
+            context.added = [
+                bookmark.add_bookmark(context.session, "https://example.com/new", [],
+                                      name)
+                for name in names]
+        context.session.commit()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    context.name_lookups = lookups
+
+
+@when(u'{count:d} bookmarks named "{name}" are added')
+def step_impl(context, count, name):
+    _add(context, [name] * count, batch=False)
+
+
+@when(u'{count:d} bookmarks named "{name}" are added in a batch')
+def step_impl(context, count, name):
+    _add(context, [name] * count, batch=True)
+
+
+@when(u'bookmarks named "{names}" are added in a batch')
+def step_impl(context, names):
+    _add(context, [i.strip() for i in names.split(',')], batch=True)
+
+
+@when(u'bookmarks named "{names}" are added in a batch, looking up the names first')
+def step_impl(context, names):
+    _add(context, [i.strip() for i in names.split(',')], batch=True, prefetch=True)
+
+
+@then(u'the bookmarks added are named "{names}"')
+def step_impl(context, names):
+    expected = [i.strip() for i in names.split(',')]
+    actual = [i.name for i in context.added]
+    assert actual == expected, actual
+
+
+@then(u'the names in use were looked up in {count:d} query')
+@then(u'the names in use were looked up in {count:d} queries')
+def step_impl(context, count):
+    assert len(context.name_lookups) == count, len(context.name_lookups)
+
+
+@then(u'the last bookmark added is named "{name}"')
+def step_impl(context, name):
+    assert context.added[-1].name == name, context.added[-1].name
@@ -0,0 +1,80 @@
+from behave import *
+import os
+import tempfile
+
+from sqlalchemy import text
+
+from rabbitmark.librm import bookmark
+from rabbitmark.librm import interchange
+from rabbitmark.librm.models import Bookmark
+from rabbitmark.librm.url_key import normalize_url
+
+
+@then(u'the URLs "{first}" and "{second}" have the same key')
+def step_impl(context, first, second):
+    assert normalize_url(first) == normalize_url(second), \
+        (normalize_url(first), normalize_url(second))
+
+
+@then(u'the URLs "{first}" and "{second}" have different keys')
+def step_impl(context, first, second):
+    assert normalize_url(first) != normalize_url(second), normalize_url(first)
+
+
+@then(u'the near-duplicates of "{url}" are "{names}"')
+def step_impl(context, url, names):
+    found = [i.name for i in bookmark.find_near_duplicates(context.session, url)]
+    expected = [i.strip() for i in names.split(',')]
+    assert found == expected, found
+
+
+@then(u'the near-duplicates of "{url}" are nothing')
+def step_impl(context, url):
+    found = [i.name for i in bookmark.find_near_duplicates(context.session, url)]
+    assert not found, found
+
+
+@then(u'the URL "{url}" is bookmarked')
+def step_impl(context, url):
+    assert bookmark.url_exists(context.session, url)
+
+
+@then(u'the URL "{url}" is not bookmarked')
+def step_impl(context, url):
+    assert not bookmark.url_exists(context.session, url)
+
+
+@when(u'the URL of the bookmark "{name}" is changed to "{url}"')
+def step_impl(context, name, url):
+    mark = context.session.query(Bookmark).filter_by(name=name).one()
+    mark.url = url
+    context.session.commit()
+
+
+@when(u'we import the CSV file')
+def step_impl(context):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'import.csv')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(context.text + '\n')
+        schema = interchange.get_csv_schema(path)
+        mapping = [column.capitalize() for column in schema.columns]
+        mapping = ["URL" if i == "Url" else i for i in mapping]
+        context.import_result = interchange.import_bookmarks_from_csv(
+            context.session, path, schema.dialect, mapping)
+    context.session.commit()
+
+
+@then(u'{imported:d} bookmarks were imported, {dupes:d} were duplicates, '
+      u'and {near_dupes:d} was a near-duplicate')
+def step_impl(context, imported, dupes, near_dupes):
+    assert context.import_result == (imported, dupes, near_dupes), context.import_result
+
+
+@given(u'the database is taken back to before URL keys')
+def step_impl(context):
+    context.session.commit()
+    with context.session.get_bind().begin() as conn:
+        conn.execute(text("DROP INDEX ix_bookmarks_url_key"))
+        conn.execute(text("ALTER TABLE bookmarks DROP COLUMN url_key"))
+        conn.execute(text("PRAGMA user_version = 1"))